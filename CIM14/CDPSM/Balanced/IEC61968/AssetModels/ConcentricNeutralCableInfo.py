@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.Balanced.IEC61968.AssetModels.CableInfo import CableInfo
+from CIM14.CDPSM.Balanced.Element import AssociationList, EMPTY
 
 class ConcentricNeutralCableInfo(CableInfo):
     """Concentric neutral cable data.
@@ -56,13 +57,14 @@ class ConcentricNeutralCableInfo(CableInfo):
 
     def setWireType(self, value):
         if self._WireType is not None:
-            filtered = [x for x in self.WireType.ConcentricNeutralCableInfos if x != self]
-            self._WireType._ConcentricNeutralCableInfos = filtered
+            self._WireType._ConcentricNeutralCableInfos.discard(self)
 
         self._WireType = value
         if self._WireType is not None:
-            if self not in self._WireType._ConcentricNeutralCableInfos:
-                self._WireType._ConcentricNeutralCableInfos.append(self)
+            if self._WireType._ConcentricNeutralCableInfos is EMPTY:
+                self._WireType._ConcentricNeutralCableInfos = AssociationList([self])
+            else:
+                self._WireType._ConcentricNeutralCableInfos.add(self)
 
     WireType = property(getWireType, setWireType)
 
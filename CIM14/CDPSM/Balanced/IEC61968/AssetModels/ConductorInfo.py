@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.Balanced.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.CDPSM.Balanced.Element import AssociationList, EMPTY
 
 class ConductorInfo(IdentifiedObject):
     """Conductor data.
@@ -50,11 +51,13 @@ class ConductorInfo(IdentifiedObject):
         #: Usage of this conductor. Values are: "secondary", "other", "distribution", "transmission"
         self.usage = usage
 
-        self._WireArrangements = []
-        self.WireArrangements = [] if WireArrangements is None else WireArrangements
+        self._WireArrangements = EMPTY
+        if WireArrangements is not None:
+            self.WireArrangements = WireArrangements
 
-        self._ConductorSegments = []
-        self.ConductorSegments = [] if ConductorSegments is None else ConductorSegments
+        self._ConductorSegments = EMPTY
+        if ConductorSegments is not None:
+            self.ConductorSegments = ConductorSegments
 
         super(ConductorInfo, self).__init__(*args, **kw_args)
 
@@ -71,6 +74,7 @@ class ConductorInfo(IdentifiedObject):
         return self._WireArrangements
 
     def setWireArrangements(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._WireArrangements:
             x.ConductorInfo = None
         for y in value:
@@ -93,6 +97,7 @@ class ConductorInfo(IdentifiedObject):
         return self._ConductorSegments
 
     def setConductorSegments(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ConductorSegments:
             x.ConductorInfo = None
         for y in value:
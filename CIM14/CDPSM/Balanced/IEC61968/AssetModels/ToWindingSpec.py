@@ -19,9 +19,11 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.Balanced.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.CDPSM.Balanced.Element import AssociationList, EMPTY
 
 class ToWindingSpec(IdentifiedObject):
-    """For short-circuit tests, specifies the winding and tap for all short-circuited windings.  For open-circuit tests, specifies the winding, tap, induced voltage, and induced angle for any non-excited windings that were measured during the test. This won't apply if only the exciting current and no-load losses were measured.
+    """For short-circuit tests, specifies the winding and tap for all short-circuited windings. 
+ For open-circuit tests, specifies the winding, tap, induced voltage, and induced angle for any non-excited windings that were measured during the test. This won't apply if only the exciting current and no-load losses were measured.
     """
 
     def __init__(self, toTapStep=0, voltage=0.0, phaseShift=0.0, OpenCircuitTests=None, ShortCircuitTests=None, ToWinding=None, *args, **kw_args):
@@ -43,11 +45,13 @@ class ToWindingSpec(IdentifiedObject):
         #: (if open-circuit test) Phase shift measured at the open-circuited 'to' winding, with the 'from' winding set to the 'from' winding's rated voltage and all other windings open-circuited.
         self.phaseShift = phaseShift
 
-        self._OpenCircuitTests = []
-        self.OpenCircuitTests = [] if OpenCircuitTests is None else OpenCircuitTests
+        self._OpenCircuitTests = EMPTY
+        if OpenCircuitTests is not None:
+            self.OpenCircuitTests = OpenCircuitTests
 
-        self._ShortCircuitTests = []
-        self.ShortCircuitTests = [] if ShortCircuitTests is None else ShortCircuitTests
+        self._ShortCircuitTests = EMPTY
+        if ShortCircuitTests is not None:
+            self.ShortCircuitTests = ShortCircuitTests
 
         self._ToWinding = None
         self.ToWinding = ToWinding
@@ -67,21 +71,28 @@ class ToWindingSpec(IdentifiedObject):
         return self._OpenCircuitTests
 
     def setOpenCircuitTests(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._OpenCircuitTests:
-            filtered = [q for q in p.MeasuredWindingSpecs if q != self]
-            self._OpenCircuitTests._MeasuredWindingSpecs = filtered
+            p._MeasuredWindingSpecs.discard(self)
         for r in value:
-            if self not in r._MeasuredWindingSpecs:
-                r._MeasuredWindingSpecs.append(self)
+            if r._MeasuredWindingSpecs is EMPTY:
+                r._MeasuredWindingSpecs = AssociationList([self])
+            else:
+                r._MeasuredWindingSpecs.add(self)
         self._OpenCircuitTests = value
 
     OpenCircuitTests = property(getOpenCircuitTests, setOpenCircuitTests)
 
     def addOpenCircuitTests(self, *OpenCircuitTests):
         for obj in OpenCircuitTests:
-            if self not in obj._MeasuredWindingSpecs:
-                obj._MeasuredWindingSpecs.append(self)
-            self._OpenCircuitTests.append(obj)
+            if obj._MeasuredWindingSpecs is EMPTY:
+                obj._MeasuredWindingSpecs = AssociationList([self])
+            else:
+                obj._MeasuredWindingSpecs.add(self)
+            if self._OpenCircuitTests is EMPTY:
+                self._OpenCircuitTests = AssociationList([obj])
+            else:
+                self._OpenCircuitTests.add(obj)
 
     def removeOpenCircuitTests(self, *OpenCircuitTests):
         for obj in OpenCircuitTests:
@@ -95,21 +106,28 @@ class ToWindingSpec(IdentifiedObject):
         return self._ShortCircuitTests
 
     def setShortCircuitTests(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ShortCircuitTests:
-            filtered = [q for q in p.ShortedWindingSpecs if q != self]
-            self._ShortCircuitTests._ShortedWindingSpecs = filtered
+            p._ShortedWindingSpecs.discard(self)
         for r in value:
-            if self not in r._ShortedWindingSpecs:
-                r._ShortedWindingSpecs.append(self)
+            if r._ShortedWindingSpecs is EMPTY:
+                r._ShortedWindingSpecs = AssociationList([self])
+            else:
+                r._ShortedWindingSpecs.add(self)
         self._ShortCircuitTests = value
 
     ShortCircuitTests = property(getShortCircuitTests, setShortCircuitTests)
 
     def addShortCircuitTests(self, *ShortCircuitTests):
         for obj in ShortCircuitTests:
-            if self not in obj._ShortedWindingSpecs:
-                obj._ShortedWindingSpecs.append(self)
-            self._ShortCircuitTests.append(obj)
+            if obj._ShortedWindingSpecs is EMPTY:
+                obj._ShortedWindingSpecs = AssociationList([self])
+            else:
+                obj._ShortedWindingSpecs.add(self)
+            if self._ShortCircuitTests is EMPTY:
+                self._ShortCircuitTests = AssociationList([obj])
+            else:
+                self._ShortCircuitTests.add(obj)
 
     def removeShortCircuitTests(self, *ShortCircuitTests):
         for obj in ShortCircuitTests:
@@ -124,13 +142,14 @@ class ToWindingSpec(IdentifiedObject):
 
     def setToWinding(self, value):
         if self._ToWinding is not None:
-            filtered = [x for x in self.ToWinding.ToWindingSpecs if x != self]
-            self._ToWinding._ToWindingSpecs = filtered
+            self._ToWinding._ToWindingSpecs.discard(self)
 
         self._ToWinding = value
         if self._ToWinding is not None:
-            if self not in self._ToWinding._ToWindingSpecs:
-                self._ToWinding._ToWindingSpecs.append(self)
+            if self._ToWinding._ToWindingSpecs is EMPTY:
+                self._ToWinding._ToWindingSpecs = AssociationList([self])
+            else:
+                self._ToWinding._ToWindingSpecs.add(self)
 
     ToWinding = property(getToWinding, setToWinding)
 
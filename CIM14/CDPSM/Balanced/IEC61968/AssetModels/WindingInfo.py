@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.Balanced.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.CDPSM.Balanced.Element import AssociationList, EMPTY
 
 class WindingInfo(IdentifiedObject):
     """Winding data.
@@ -68,17 +69,20 @@ class WindingInfo(IdentifiedObject):
         #: Apparent power that this winding can carry for a short period of time.
         self.shortTermS = shortTermS
 
-        self._WindingTests = []
-        self.WindingTests = [] if WindingTests is None else WindingTests
+        self._WindingTests = EMPTY
+        if WindingTests is not None:
+            self.WindingTests = WindingTests
 
-        self._ToWindingSpecs = []
-        self.ToWindingSpecs = [] if ToWindingSpecs is None else ToWindingSpecs
+        self._ToWindingSpecs = EMPTY
+        if ToWindingSpecs is not None:
+            self.ToWindingSpecs = ToWindingSpecs
 
         self._TransformerInfo = None
         self.TransformerInfo = TransformerInfo
 
-        self._Windings = []
-        self.Windings = [] if Windings is None else Windings
+        self._Windings = EMPTY
+        if Windings is not None:
+            self.Windings = Windings
 
         super(WindingInfo, self).__init__(*args, **kw_args)
 
@@ -95,6 +99,7 @@ class WindingInfo(IdentifiedObject):
         return self._WindingTests
 
     def setWindingTests(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._WindingTests:
             x.FromWinding = None
         for y in value:
@@ -117,6 +122,7 @@ class WindingInfo(IdentifiedObject):
         return self._ToWindingSpecs
 
     def setToWindingSpecs(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ToWindingSpecs:
             x.ToWinding = None
         for y in value:
@@ -140,13 +146,14 @@ class WindingInfo(IdentifiedObject):
 
     def setTransformerInfo(self, value):
         if self._TransformerInfo is not None:
-            filtered = [x for x in self.TransformerInfo.WindingInfos if x != self]
-            self._TransformerInfo._WindingInfos = filtered
+            self._TransformerInfo._WindingInfos.discard(self)
 
         self._TransformerInfo = value
         if self._TransformerInfo is not None:
-            if self not in self._TransformerInfo._WindingInfos:
-                self._TransformerInfo._WindingInfos.append(self)
+            if self._TransformerInfo._WindingInfos is EMPTY:
+                self._TransformerInfo._WindingInfos = AssociationList([self])
+            else:
+                self._TransformerInfo._WindingInfos.add(self)
 
     TransformerInfo = property(getTransformerInfo, setTransformerInfo)
 
@@ -156,6 +163,7 @@ class WindingInfo(IdentifiedObject):
         return self._Windings
 
     def setWindings(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Windings:
             x.WindingInfo = None
         for y in value:
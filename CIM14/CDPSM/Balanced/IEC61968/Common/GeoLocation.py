@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.Balanced.IEC61968.Common.Location import Location
+from CIM14.CDPSM.Balanced.Element import AssociationList, EMPTY
 
 class GeoLocation(Location):
     """Geographical location.
@@ -29,8 +30,9 @@ class GeoLocation(Location):
 
         @param PowerSystemResources: All power system resources at this geographical location.
         """
-        self._PowerSystemResources = []
-        self.PowerSystemResources = [] if PowerSystemResources is None else PowerSystemResources
+        self._PowerSystemResources = EMPTY
+        if PowerSystemResources is not None:
+            self.PowerSystemResources = PowerSystemResources
 
         super(GeoLocation, self).__init__(*args, **kw_args)
 
@@ -47,6 +49,7 @@ class GeoLocation(Location):
         return self._PowerSystemResources
 
     def setPowerSystemResources(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._PowerSystemResources:
             x.GeoLocation = None
         for y in value:
@@ -19,9 +19,12 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.Balanced.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.CDPSM.Balanced.Element import AssociationList, EMPTY
 
 class Location(IdentifiedObject):
-    """The place, scene, or point of something where someone or something has been, is, and/or will be at a given moment in time. It may be: - Spatial location of an actual or planned structure, or a set of point-oriented structures (as a substation, structure, building, town, etc.) or diagram objects, which may be defined as a point or polygon, or, - Path of an underground or overhead conductor, or a linear diagram object.
+    """The place, scene, or point of something where someone or something has been, is, and/or will be at a given moment in time. It may be:
+ - Spatial location of an actual or planned structure, or a set of point-oriented structures (as a substation, structure, building, town, etc.) or diagram objects, which may be defined as a point or polygon, or,
+ - Path of an underground or overhead conductor, or a linear diagram object.
     """
 
     def __init__(self, PositionPoints=None, *args, **kw_args):
@@ -29,8 +32,9 @@ class Location(IdentifiedObject):
 
         @param PositionPoints: Sequence of position points describing this location.
         """
-        self._PositionPoints = []
-        self.PositionPoints = [] if PositionPoints is None else PositionPoints
+        self._PositionPoints = EMPTY
+        if PositionPoints is not None:
+            self.PositionPoints = PositionPoints
 
         super(Location, self).__init__(*args, **kw_args)
 
@@ -47,6 +51,7 @@ class Location(IdentifiedObject):
         return self._PositionPoints
 
     def setPositionPoints(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._PositionPoints:
             x.Location = None
         for y in value:
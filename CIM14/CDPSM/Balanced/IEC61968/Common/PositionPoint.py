@@ -18,10 +18,12 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from CIM14.CDPSM.Balanced.Element import Element
+from CIM14.CDPSM.Balanced.Element import Element, AssociationList, EMPTY
 
 class PositionPoint(Element):
-    """Set of spatial coordinates that determine a point. A sequence of PositionPoints can be used to describe: - physical location of non-point oriented objects like cables or lines, or - area of an object like a substation, a geographical zone or a diagram object.
+    """Set of spatial coordinates that determine a point. A sequence of PositionPoints can be used to describe:
+ - physical location of non-point oriented objects like cables or lines, or
+ - area of an object like a substation, a geographical zone or a diagram object.
     """
 
     def __init__(self, xPosition='', sequenceNumber=0, yPosition='', Location=None, *args, **kw_args):
@@ -60,13 +62,14 @@ class PositionPoint(Element):
 
     def setLocation(self, value):
         if self._Location is not None:
-            filtered = [x for x in self.Location.PositionPoints if x != self]
-            self._Location._PositionPoints = filtered
+            self._Location._PositionPoints.discard(self)
 
         self._Location = value
         if self._Location is not None:
-            if self not in self._Location._PositionPoints:
-                self._Location._PositionPoints.append(self)
+            if self._Location._PositionPoints is EMPTY:
+                self._Location._PositionPoints = AssociationList([self])
+            else:
+                self._Location._PositionPoints.add(self)
 
     Location = property(getLocation, setLocation)
 
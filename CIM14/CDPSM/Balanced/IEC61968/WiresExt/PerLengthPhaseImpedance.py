@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.Balanced.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.CDPSM.Balanced.Element import AssociationList, EMPTY
 
 class PerLengthPhaseImpedance(IdentifiedObject):
     """Impedance and admittance parameters per unit length for n-wire unbalanced lines, in matrix form.
@@ -34,11 +35,13 @@ class PerLengthPhaseImpedance(IdentifiedObject):
         #: Number of phase, neutral, and other wires retained. Constrains the number of matrix elements and the phase codes that can be used with this matrix.
         self.conductorCount = conductorCount
 
-        self._PhaseImpedanceData = []
-        self.PhaseImpedanceData = [] if PhaseImpedanceData is None else PhaseImpedanceData
+        self._PhaseImpedanceData = EMPTY
+        if PhaseImpedanceData is not None:
+            self.PhaseImpedanceData = PhaseImpedanceData
 
-        self._ConductorSegments = []
-        self.ConductorSegments = [] if ConductorSegments is None else ConductorSegments
+        self._ConductorSegments = EMPTY
+        if ConductorSegments is not None:
+            self.ConductorSegments = ConductorSegments
 
         super(PerLengthPhaseImpedance, self).__init__(*args, **kw_args)
 
@@ -55,6 +58,7 @@ class PerLengthPhaseImpedance(IdentifiedObject):
         return self._PhaseImpedanceData
 
     def setPhaseImpedanceData(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._PhaseImpedanceData:
             x.PhaseImpedance = None
         for y in value:
@@ -77,6 +81,7 @@ class PerLengthPhaseImpedance(IdentifiedObject):
         return self._ConductorSegments
 
     def setConductorSegments(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ConductorSegments:
             x.PhaseImpedance = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.Balanced.IEC61970.Core.Equipment import Equipment
+from CIM14.CDPSM.Balanced.Element import AssociationList, EMPTY
 
 class TransformerBank(Equipment):
     """An assembly of transformers that are connected together. For three-phase transformers, there would be one transformer per bank. For banks of single-phase transformers, there will be more than one transformer per bank, and they need not be identical.
@@ -33,8 +34,9 @@ class TransformerBank(Equipment):
         #: Vector group of the bank for protective relaying, e.g., Dyn1. For unbalanced transformers, this may not be simply determined from the constituent winding connections.
         self.vectorGroup = vectorGroup
 
-        self._Transformers = []
-        self.Transformers = [] if Transformers is None else Transformers
+        self._Transformers = EMPTY
+        if Transformers is not None:
+            self.Transformers = Transformers
 
         super(TransformerBank, self).__init__(*args, **kw_args)
 
@@ -51,6 +53,7 @@ class TransformerBank(Equipment):
         return self._Transformers
 
     def setTransformers(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Transformers:
             x.TransformerBank = None
         for y in value:
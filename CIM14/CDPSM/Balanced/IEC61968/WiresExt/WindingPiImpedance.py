@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.Balanced.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.CDPSM.Balanced.Element import AssociationList, EMPTY
 
 class WindingPiImpedance(IdentifiedObject):
     """Transformer Pi-model impedance that accurately reflects impedance for transformers with 2 or 3 windings. For transformers with 4 or more windings, you must use TransformerInfo.
@@ -61,8 +62,9 @@ class WindingPiImpedance(IdentifiedObject):
         #: Zero sequence magnetizing branch susceptance.
         self.b0 = b0
 
-        self._Windings = []
-        self.Windings = [] if Windings is None else Windings
+        self._Windings = EMPTY
+        if Windings is not None:
+            self.Windings = Windings
 
         super(WindingPiImpedance, self).__init__(*args, **kw_args)
 
@@ -79,6 +81,7 @@ class WindingPiImpedance(IdentifiedObject):
         return self._Windings
 
     def setWindings(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Windings:
             x.PiImpedance = None
         for y in value:
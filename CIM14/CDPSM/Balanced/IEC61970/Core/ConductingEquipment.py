@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.Balanced.IEC61970.Core.Equipment import Equipment
+from CIM14.CDPSM.Balanced.Element import AssociationList, EMPTY
 
 class ConductingEquipment(Equipment):
     """The parts of the power system that are designed to carry current or that are conductively connected therewith. ConductingEquipment is contained within an EquipmentContainer that may be a Substation, or a VoltageLevel or a Bay within a Substation.
@@ -34,8 +35,9 @@ class ConductingEquipment(Equipment):
         #: Describes the phases carried by a conducting equipment. Values are: "ABC", "splitSecondary2N", "ABN", "CN", "ACN", "BC", "AN", "BN", "AB", "splitSecondary1N", "N", "C", "AC", "ABCN", "splitSecondary12N", "A", "B", "BCN"
         self.phases = phases
 
-        self._Terminals = []
-        self.Terminals = [] if Terminals is None else Terminals
+        self._Terminals = EMPTY
+        if Terminals is not None:
+            self.Terminals = Terminals
 
         self._BaseVoltage = None
         self.BaseVoltage = BaseVoltage
@@ -55,6 +57,7 @@ class ConductingEquipment(Equipment):
         return self._Terminals
 
     def setTerminals(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Terminals:
             x.ConductingEquipment = None
         for y in value:
@@ -78,13 +81,14 @@ class ConductingEquipment(Equipment):
 
     def setBaseVoltage(self, value):
         if self._BaseVoltage is not None:
-            filtered = [x for x in self.BaseVoltage.ConductingEquipment if x != self]
-            self._BaseVoltage._ConductingEquipment = filtered
+            self._BaseVoltage._ConductingEquipment.discard(self)
 
         self._BaseVoltage = value
         if self._BaseVoltage is not None:
-            if self not in self._BaseVoltage._ConductingEquipment:
-                self._BaseVoltage._ConductingEquipment.append(self)
+            if self._BaseVoltage._ConductingEquipment is EMPTY:
+                self._BaseVoltage._ConductingEquipment = AssociationList([self])
+            else:
+                self._BaseVoltage._ConductingEquipment.add(self)
 
     BaseVoltage = property(getBaseVoltage, setBaseVoltage)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.Balanced.IEC61970.Core.EquipmentContainer import EquipmentContainer
+from CIM14.CDPSM.Balanced.Element import AssociationList, EMPTY
 
 class Line(EquipmentContainer):
     """A component part of a system extending between adjacent substations or from a substation to an adjacent interconnection point.
@@ -48,13 +49,14 @@ class Line(EquipmentContainer):
 
     def setRegion(self, value):
         if self._Region is not None:
-            filtered = [x for x in self.Region.Lines if x != self]
-            self._Region._Lines = filtered
+            self._Region._Lines.discard(self)
 
         self._Region = value
         if self._Region is not None:
-            if self not in self._Region._Lines:
-                self._Region._Lines.append(self)
+            if self._Region._Lines is EMPTY:
+                self._Region._Lines = AssociationList([self])
+            else:
+                self._Region._Lines.add(self)
 
     Region = property(getRegion, setRegion)
 
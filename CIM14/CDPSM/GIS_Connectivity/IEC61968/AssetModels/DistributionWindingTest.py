@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.GIS_Connectivity.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.CDPSM.GIS_Connectivity.Element import AssociationList, EMPTY
 
 class DistributionWindingTest(IdentifiedObject):
     """Test results for one or more transformer windings. These may include short-circuit or open-circuit (excitation) tests. Short-circuit test results include load losses and leakage impedances. Open-circuit test results may include no-load losses, exciting current, phase shifts, and induced voltage. For three-phase windings, the excitation can be positive sequence (the default) or zero sequence.
@@ -52,13 +53,14 @@ class DistributionWindingTest(IdentifiedObject):
 
     def setFromWinding(self, value):
         if self._FromWinding is not None:
-            filtered = [x for x in self.FromWinding.WindingTests if x != self]
-            self._FromWinding._WindingTests = filtered
+            self._FromWinding._WindingTests.discard(self)
 
         self._FromWinding = value
         if self._FromWinding is not None:
-            if self not in self._FromWinding._WindingTests:
-                self._FromWinding._WindingTests.append(self)
+            if self._FromWinding._WindingTests is EMPTY:
+                self._FromWinding._WindingTests = AssociationList([self])
+            else:
+                self._FromWinding._WindingTests.add(self)
 
     FromWinding = property(getFromWinding, setFromWinding)
 
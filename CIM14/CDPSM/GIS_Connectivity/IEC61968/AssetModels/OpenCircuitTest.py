@@ -19,9 +19,11 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.GIS_Connectivity.IEC61968.AssetModels.DistributionWindingTest import DistributionWindingTest
+from CIM14.CDPSM.GIS_Connectivity.Element import AssociationList, EMPTY
 
 class OpenCircuitTest(DistributionWindingTest):
-    """Open-circuit test results may include no-load losses, exciting current, phase shifts, and induced voltage. For three-phase windings, the excitation can be positive sequence (the default) or zero sequence. For induced voltage and phase shifts, use the associated ToWindingSpec class.
+    """Open-circuit test results may include no-load losses, exciting current, phase shifts, and induced voltage. For three-phase windings, the excitation can be positive sequence (the default) or zero sequence.
+ For induced voltage and phase shifts, use the associated ToWindingSpec class.
     """
 
     def __init__(self, noLoadLossZero=0.0, noLoadLoss=0.0, excitingCurrent=0.0, excitingCurrentZero=0.0, MeasuredWindingSpecs=None, *args, **kw_args):
@@ -45,8 +47,9 @@ class OpenCircuitTest(DistributionWindingTest):
         #: Exciting current measured from a zero-sequence open-circuit (excitation) test.
         self.excitingCurrentZero = excitingCurrentZero
 
-        self._MeasuredWindingSpecs = []
-        self.MeasuredWindingSpecs = [] if MeasuredWindingSpecs is None else MeasuredWindingSpecs
+        self._MeasuredWindingSpecs = EMPTY
+        if MeasuredWindingSpecs is not None:
+            self.MeasuredWindingSpecs = MeasuredWindingSpecs
 
         super(OpenCircuitTest, self).__init__(*args, **kw_args)
 
@@ -63,21 +66,28 @@ class OpenCircuitTest(DistributionWindingTest):
         return self._MeasuredWindingSpecs
 
     def setMeasuredWindingSpecs(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._MeasuredWindingSpecs:
-            filtered = [q for q in p.OpenCircuitTests if q != self]
-            self._MeasuredWindingSpecs._OpenCircuitTests = filtered
+            p._OpenCircuitTests.discard(self)
         for r in value:
-            if self not in r._OpenCircuitTests:
-                r._OpenCircuitTests.append(self)
+            if r._OpenCircuitTests is EMPTY:
+                r._OpenCircuitTests = AssociationList([self])
+            else:
+                r._OpenCircuitTests.add(self)
         self._MeasuredWindingSpecs = value
 
     MeasuredWindingSpecs = property(getMeasuredWindingSpecs, setMeasuredWindingSpecs)
 
     def addMeasuredWindingSpecs(self, *MeasuredWindingSpecs):
         for obj in MeasuredWindingSpecs:
-            if self not in obj._OpenCircuitTests:
-                obj._OpenCircuitTests.append(self)
-            self._MeasuredWindingSpecs.append(obj)
+            if obj._OpenCircuitTests is EMPTY:
+                obj._OpenCircuitTests = AssociationList([self])
+            else:
+                obj._OpenCircuitTests.add(self)
+            if self._MeasuredWindingSpecs is EMPTY:
+                self._MeasuredWindingSpecs = AssociationList([obj])
+            else:
+                self._MeasuredWindingSpecs.add(obj)
 
     def removeMeasuredWindingSpecs(self, *MeasuredWindingSpecs):
         for obj in MeasuredWindingSpecs:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.GIS_Connectivity.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.CDPSM.GIS_Connectivity.Element import AssociationList, EMPTY
 
 class TransformerInfo(IdentifiedObject):
     """Set of transformer data, from an equipment library.
@@ -29,8 +30,9 @@ class TransformerInfo(IdentifiedObject):
 
         @param Transformers: All transformers that can be described with this transformer data.
         """
-        self._Transformers = []
-        self.Transformers = [] if Transformers is None else Transformers
+        self._Transformers = EMPTY
+        if Transformers is not None:
+            self.Transformers = Transformers
 
         super(TransformerInfo, self).__init__(*args, **kw_args)
 
@@ -47,6 +49,7 @@ class TransformerInfo(IdentifiedObject):
         return self._Transformers
 
     def setTransformers(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Transformers:
             x.TransformerInfo = None
         for y in value:
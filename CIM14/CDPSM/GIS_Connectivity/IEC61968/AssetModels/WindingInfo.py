@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.GIS_Connectivity.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.CDPSM.GIS_Connectivity.Element import AssociationList, EMPTY
 
 class WindingInfo(IdentifiedObject):
     """Winding data.
@@ -43,14 +44,17 @@ class WindingInfo(IdentifiedObject):
         #: Kind of connection of this winding. Values are: "I", "Z", "Yn", "Y", "A", "D", "Zn"
         self.connectionKind = connectionKind
 
-        self._WindingTests = []
-        self.WindingTests = [] if WindingTests is None else WindingTests
+        self._WindingTests = EMPTY
+        if WindingTests is not None:
+            self.WindingTests = WindingTests
 
-        self._ToWindingSpecs = []
-        self.ToWindingSpecs = [] if ToWindingSpecs is None else ToWindingSpecs
+        self._ToWindingSpecs = EMPTY
+        if ToWindingSpecs is not None:
+            self.ToWindingSpecs = ToWindingSpecs
 
-        self._Windings = []
-        self.Windings = [] if Windings is None else Windings
+        self._Windings = EMPTY
+        if Windings is not None:
+            self.Windings = Windings
 
         super(WindingInfo, self).__init__(*args, **kw_args)
 
@@ -67,6 +71,7 @@ class WindingInfo(IdentifiedObject):
         return self._WindingTests
 
     def setWindingTests(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._WindingTests:
             x.FromWinding = None
         for y in value:
@@ -89,6 +94,7 @@ class WindingInfo(IdentifiedObject):
         return self._ToWindingSpecs
 
     def setToWindingSpecs(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ToWindingSpecs:
             x.ToWinding = None
         for y in value:
@@ -111,6 +117,7 @@ class WindingInfo(IdentifiedObject):
         return self._Windings
 
     def setWindings(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Windings:
             x.WindingInfo = None
         for y in value:
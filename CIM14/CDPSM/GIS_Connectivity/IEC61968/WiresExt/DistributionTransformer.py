@@ -19,9 +19,13 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.GIS_Connectivity.IEC61970.Core.Equipment import Equipment
+from CIM14.CDPSM.GIS_Connectivity.Element import AssociationList, EMPTY
 
 class DistributionTransformer(Equipment):
-    """An assembly of two or more coupled windings that transform electrical power between voltage levels. Supports both balanced and unbalanced winding connections. This class differs from Wires::PowerTransformer as follows: - it is part of a TransformerBank - it draws parameters exclusively from TransformerInfo and its associated classes.
+    """An assembly of two or more coupled windings that transform electrical power between voltage levels. Supports both balanced and unbalanced winding connections.
+ This class differs from Wires::PowerTransformer as follows:
+ - it is part of a TransformerBank
+ - it draws parameters exclusively from TransformerInfo and its associated classes.
     """
 
     def __init__(self, TransformerInfo=None, Windings=None, TransformerBank=None, *args, **kw_args):
@@ -34,8 +38,9 @@ class DistributionTransformer(Equipment):
         self._TransformerInfo = None
         self.TransformerInfo = TransformerInfo
 
-        self._Windings = []
-        self.Windings = [] if Windings is None else Windings
+        self._Windings = EMPTY
+        if Windings is not None:
+            self.Windings = Windings
 
         self._TransformerBank = None
         self.TransformerBank = TransformerBank
@@ -56,13 +61,14 @@ class DistributionTransformer(Equipment):
 
     def setTransformerInfo(self, value):
         if self._TransformerInfo is not None:
-            filtered = [x for x in self.TransformerInfo.Transformers if x != self]
-            self._TransformerInfo._Transformers = filtered
+            self._TransformerInfo._Transformers.discard(self)
 
         self._TransformerInfo = value
         if self._TransformerInfo is not None:
-            if self not in self._TransformerInfo._Transformers:
-                self._TransformerInfo._Transformers.append(self)
+            if self._TransformerInfo._Transformers is EMPTY:
+                self._TransformerInfo._Transformers = AssociationList([self])
+            else:
+                self._TransformerInfo._Transformers.add(self)
 
     TransformerInfo = property(getTransformerInfo, setTransformerInfo)
 
@@ -72,6 +78,7 @@ class DistributionTransformer(Equipment):
         return self._Windings
 
     def setWindings(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Windings:
             x.Transformer = None
         for y in value:
@@ -95,13 +102,14 @@ class DistributionTransformer(Equipment):
 
     def setTransformerBank(self, value):
         if self._TransformerBank is not None:
-            filtered = [x for x in self.TransformerBank.Transformers if x != self]
-            self._TransformerBank._Transformers = filtered
+            self._TransformerBank._Transformers.discard(self)
 
         self._TransformerBank = value
         if self._TransformerBank is not None:
-            if self not in self._TransformerBank._Transformers:
-                self._TransformerBank._Transformers.append(self)
+            if self._TransformerBank._Transformers is EMPTY:
+                self._TransformerBank._Transformers = AssociationList([self])
+            else:
+                self._TransformerBank._Transformers.add(self)
 
     TransformerBank = property(getTransformerBank, setTransformerBank)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.GIS_Connectivity.IEC61970.Core.Equipment import Equipment
+from CIM14.CDPSM.GIS_Connectivity.Element import AssociationList, EMPTY
 
 class TransformerBank(Equipment):
     """An assembly of transformers that are connected together. For three-phase transformers, there would be one transformer per bank. For banks of single-phase transformers, there will be more than one transformer per bank, and they need not be identical.
@@ -29,8 +30,9 @@ class TransformerBank(Equipment):
 
         @param Transformers: All transformers that belong to this bank.
         """
-        self._Transformers = []
-        self.Transformers = [] if Transformers is None else Transformers
+        self._Transformers = EMPTY
+        if Transformers is not None:
+            self.Transformers = Transformers
 
         super(TransformerBank, self).__init__(*args, **kw_args)
 
@@ -47,6 +49,7 @@ class TransformerBank(Equipment):
         return self._Transformers
 
     def setTransformers(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Transformers:
             x.TransformerBank = None
         for y in value:
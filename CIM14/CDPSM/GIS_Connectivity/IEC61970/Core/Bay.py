@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.GIS_Connectivity.IEC61970.Core.EquipmentContainer import EquipmentContainer
+from CIM14.CDPSM.GIS_Connectivity.Element import AssociationList, EMPTY
 
 class Bay(EquipmentContainer):
     """A collection of power system resources (within a given substation) including conducting equipment, protection relays, measurements, and telemetry.
@@ -48,13 +49,14 @@ class Bay(EquipmentContainer):
 
     def setVoltageLevel(self, value):
         if self._VoltageLevel is not None:
-            filtered = [x for x in self.VoltageLevel.Bays if x != self]
-            self._VoltageLevel._Bays = filtered
+            self._VoltageLevel._Bays.discard(self)
 
         self._VoltageLevel = value
         if self._VoltageLevel is not None:
-            if self not in self._VoltageLevel._Bays:
-                self._VoltageLevel._Bays.append(self)
+            if self._VoltageLevel._Bays is EMPTY:
+                self._VoltageLevel._Bays = AssociationList([self])
+            else:
+                self._VoltageLevel._Bays.add(self)
 
     VoltageLevel = property(getVoltageLevel, setVoltageLevel)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.GIS_Connectivity.IEC61970.Core.PowerSystemResource import PowerSystemResource
+from CIM14.CDPSM.GIS_Connectivity.Element import AssociationList, EMPTY
 
 class Equipment(PowerSystemResource):
     """The parts of a power system that are physical devices, electronic or mechanical
@@ -52,13 +53,14 @@ class Equipment(PowerSystemResource):
 
     def setEquipmentContainer(self, value):
         if self._EquipmentContainer is not None:
-            filtered = [x for x in self.EquipmentContainer.Equipments if x != self]
-            self._EquipmentContainer._Equipments = filtered
+            self._EquipmentContainer._Equipments.discard(self)
 
         self._EquipmentContainer = value
         if self._EquipmentContainer is not None:
-            if self not in self._EquipmentContainer._Equipments:
-                self._EquipmentContainer._Equipments.append(self)
+            if self._EquipmentContainer._Equipments is EMPTY:
+                self._EquipmentContainer._Equipments = AssociationList([self])
+            else:
+                self._EquipmentContainer._Equipments.add(self)
 
     EquipmentContainer = property(getEquipmentContainer, setEquipmentContainer)
 
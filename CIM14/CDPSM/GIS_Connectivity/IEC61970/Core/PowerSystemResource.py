@@ -19,9 +19,11 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.GIS_Connectivity.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.CDPSM.GIS_Connectivity.Element import AssociationList, EMPTY
 
 class PowerSystemResource(IdentifiedObject):
-    """A power system resource can be an item of equipment such as a Switch, an EquipmentContainer containing many individual items of equipment such as a  Substation, or an organisational entity such as Company or SubControlArea.  This provides for the nesting of collections of PowerSystemResources within other PowerSystemResources. For example, a Switch could be a member of a Substation and a Substation could be a member of a division of a Company.
+    """A power system resource can be an item of equipment such as a Switch, an EquipmentContainer containing many individual items of equipment such as a 
+ Substation, or an organisational entity such as Company or SubControlArea.  This provides for the nesting of collections of PowerSystemResources within other PowerSystemResources. For example, a Switch could be a member of a Substation and a Substation could be a member of a division of a Company.
     """
 
     def __init__(self, GeoLocation=None, PSRType=None, *args, **kw_args):
@@ -52,13 +54,14 @@ class PowerSystemResource(IdentifiedObject):
 
     def setGeoLocation(self, value):
         if self._GeoLocation is not None:
-            filtered = [x for x in self.GeoLocation.PowerSystemResources if x != self]
-            self._GeoLocation._PowerSystemResources = filtered
+            self._GeoLocation._PowerSystemResources.discard(self)
 
         self._GeoLocation = value
         if self._GeoLocation is not None:
-            if self not in self._GeoLocation._PowerSystemResources:
-                self._GeoLocation._PowerSystemResources.append(self)
+            if self._GeoLocation._PowerSystemResources is EMPTY:
+                self._GeoLocation._PowerSystemResources = AssociationList([self])
+            else:
+                self._GeoLocation._PowerSystemResources.add(self)
 
     GeoLocation = property(getGeoLocation, setGeoLocation)
 
@@ -69,13 +72,14 @@ class PowerSystemResource(IdentifiedObject):
 
     def setPSRType(self, value):
         if self._PSRType is not None:
-            filtered = [x for x in self.PSRType.PowerSystemResources if x != self]
-            self._PSRType._PowerSystemResources = filtered
+            self._PSRType._PowerSystemResources.discard(self)
 
         self._PSRType = value
         if self._PSRType is not None:
-            if self not in self._PSRType._PowerSystemResources:
-                self._PSRType._PowerSystemResources.append(self)
+            if self._PSRType._PowerSystemResources is EMPTY:
+                self._PSRType._PowerSystemResources = AssociationList([self])
+            else:
+                self._PSRType._PowerSystemResources.add(self)
 
     PSRType = property(getPSRType, setPSRType)
 
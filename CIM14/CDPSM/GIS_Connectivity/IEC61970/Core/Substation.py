@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.GIS_Connectivity.IEC61970.Core.EquipmentContainer import EquipmentContainer
+from CIM14.CDPSM.GIS_Connectivity.Element import AssociationList, EMPTY
 
 class Substation(EquipmentContainer):
     """A collection of equipment for purposes other than generation or utilization, through which electric energy in bulk is passed for the purposes of switching or modifying its characteristics.
@@ -33,8 +34,9 @@ class Substation(EquipmentContainer):
         self._Region = None
         self.Region = Region
 
-        self._VoltageLevels = []
-        self.VoltageLevels = [] if VoltageLevels is None else VoltageLevels
+        self._VoltageLevels = EMPTY
+        if VoltageLevels is not None:
+            self.VoltageLevels = VoltageLevels
 
         super(Substation, self).__init__(*args, **kw_args)
 
@@ -52,13 +54,14 @@ class Substation(EquipmentContainer):
 
     def setRegion(self, value):
         if self._Region is not None:
-            filtered = [x for x in self.Region.Substations if x != self]
-            self._Region._Substations = filtered
+            self._Region._Substations.discard(self)
 
         self._Region = value
         if self._Region is not None:
-            if self not in self._Region._Substations:
-                self._Region._Substations.append(self)
+            if self._Region._Substations is EMPTY:
+                self._Region._Substations = AssociationList([self])
+            else:
+                self._Region._Substations.add(self)
 
     Region = property(getRegion, setRegion)
 
@@ -68,6 +71,7 @@ class Substation(EquipmentContainer):
         return self._VoltageLevels
 
     def setVoltageLevels(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._VoltageLevels:
             x.Substation = None
         for y in value:
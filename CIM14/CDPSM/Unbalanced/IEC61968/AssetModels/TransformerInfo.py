@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.Unbalanced.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.CDPSM.Unbalanced.Element import AssociationList, EMPTY
 
 class TransformerInfo(IdentifiedObject):
     """Set of transformer data, from an equipment library.
@@ -30,11 +31,13 @@ class TransformerInfo(IdentifiedObject):
         @param Transformers: All transformers that can be described with this transformer data.
         @param WindingInfos: Data for all the windings described by this transformer data.
         """
-        self._Transformers = []
-        self.Transformers = [] if Transformers is None else Transformers
+        self._Transformers = EMPTY
+        if Transformers is not None:
+            self.Transformers = Transformers
 
-        self._WindingInfos = []
-        self.WindingInfos = [] if WindingInfos is None else WindingInfos
+        self._WindingInfos = EMPTY
+        if WindingInfos is not None:
+            self.WindingInfos = WindingInfos
 
         super(TransformerInfo, self).__init__(*args, **kw_args)
 
@@ -51,6 +54,7 @@ class TransformerInfo(IdentifiedObject):
         return self._Transformers
 
     def setTransformers(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Transformers:
             x.TransformerInfo = None
         for y in value:
@@ -73,6 +77,7 @@ class TransformerInfo(IdentifiedObject):
         return self._WindingInfos
 
     def setWindingInfos(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._WindingInfos:
             x.TransformerInfo = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.Unbalanced.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.CDPSM.Unbalanced.Element import AssociationList, EMPTY
 
 class WireArrangement(IdentifiedObject):
     """Identification, spacing and configuration of the wires of a Conductor, with reference to their type.
@@ -64,13 +65,14 @@ class WireArrangement(IdentifiedObject):
 
     def setConductorInfo(self, value):
         if self._ConductorInfo is not None:
-            filtered = [x for x in self.ConductorInfo.WireArrangements if x != self]
-            self._ConductorInfo._WireArrangements = filtered
+            self._ConductorInfo._WireArrangements.discard(self)
 
         self._ConductorInfo = value
         if self._ConductorInfo is not None:
-            if self not in self._ConductorInfo._WireArrangements:
-                self._ConductorInfo._WireArrangements.append(self)
+            if self._ConductorInfo._WireArrangements is EMPTY:
+                self._ConductorInfo._WireArrangements = AssociationList([self])
+            else:
+                self._ConductorInfo._WireArrangements.add(self)
 
     ConductorInfo = property(getConductorInfo, setConductorInfo)
 
@@ -81,13 +83,14 @@ class WireArrangement(IdentifiedObject):
 
     def setWireType(self, value):
         if self._WireType is not None:
-            filtered = [x for x in self.WireType.WireArrangements if x != self]
-            self._WireType._WireArrangements = filtered
+            self._WireType._WireArrangements.discard(self)
 
         self._WireType = value
         if self._WireType is not None:
-            if self not in self._WireType._WireArrangements:
-                self._WireType._WireArrangements.append(self)
+            if self._WireType._WireArrangements is EMPTY:
+                self._WireType._WireArrangements = AssociationList([self])
+            else:
+                self._WireType._WireArrangements.add(self)
 
     WireType = property(getWireType, setWireType)
 
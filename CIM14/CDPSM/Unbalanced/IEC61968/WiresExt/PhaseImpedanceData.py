@@ -18,7 +18,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from CIM14.CDPSM.Unbalanced.Element import Element
+from CIM14.CDPSM.Unbalanced.Element import Element, AssociationList, EMPTY
 
 class PhaseImpedanceData(Element):
     """Triplet of resistance, reactance, and susceptance matrix element values.
@@ -64,13 +64,14 @@ class PhaseImpedanceData(Element):
 
     def setPhaseImpedance(self, value):
         if self._PhaseImpedance is not None:
-            filtered = [x for x in self.PhaseImpedance.PhaseImpedanceData if x != self]
-            self._PhaseImpedance._PhaseImpedanceData = filtered
+            self._PhaseImpedance._PhaseImpedanceData.discard(self)
 
         self._PhaseImpedance = value
         if self._PhaseImpedance is not None:
-            if self not in self._PhaseImpedance._PhaseImpedanceData:
-                self._PhaseImpedance._PhaseImpedanceData.append(self)
+            if self._PhaseImpedance._PhaseImpedanceData is EMPTY:
+                self._PhaseImpedance._PhaseImpedanceData = AssociationList([self])
+            else:
+                self._PhaseImpedance._PhaseImpedanceData.add(self)
 
     PhaseImpedance = property(getPhaseImpedance, setPhaseImpedance)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.Unbalanced.IEC61970.Core.EquipmentContainer import EquipmentContainer
+from CIM14.CDPSM.Unbalanced.Element import AssociationList, EMPTY
 
 class VoltageLevel(EquipmentContainer):
     """A collection of equipment at one common system voltage forming a switchgear. The equipment typically consist of breakers, busbars, instrumentation, control, regulation and protection devices as well as assemblies of all these.
@@ -42,8 +43,9 @@ class VoltageLevel(EquipmentContainer):
         self._BaseVoltage = None
         self.BaseVoltage = BaseVoltage
 
-        self._Bays = []
-        self.Bays = [] if Bays is None else Bays
+        self._Bays = EMPTY
+        if Bays is not None:
+            self.Bays = Bays
 
         self._Substation = None
         self.Substation = Substation
@@ -64,13 +66,14 @@ class VoltageLevel(EquipmentContainer):
 
     def setBaseVoltage(self, value):
         if self._BaseVoltage is not None:
-            filtered = [x for x in self.BaseVoltage.VoltageLevel if x != self]
-            self._BaseVoltage._VoltageLevel = filtered
+            self._BaseVoltage._VoltageLevel.discard(self)
 
         self._BaseVoltage = value
         if self._BaseVoltage is not None:
-            if self not in self._BaseVoltage._VoltageLevel:
-                self._BaseVoltage._VoltageLevel.append(self)
+            if self._BaseVoltage._VoltageLevel is EMPTY:
+                self._BaseVoltage._VoltageLevel = AssociationList([self])
+            else:
+                self._BaseVoltage._VoltageLevel.add(self)
 
     BaseVoltage = property(getBaseVoltage, setBaseVoltage)
 
@@ -80,6 +83,7 @@ class VoltageLevel(EquipmentContainer):
         return self._Bays
 
     def setBays(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Bays:
             x.VoltageLevel = None
         for y in value:
@@ -103,13 +107,14 @@ class VoltageLevel(EquipmentContainer):
 
     def setSubstation(self, value):
         if self._Substation is not None:
-            filtered = [x for x in self.Substation.VoltageLevels if x != self]
-            self._Substation._VoltageLevels = filtered
+            self._Substation._VoltageLevels.discard(self)
 
         self._Substation = value
         if self._Substation is not None:
-            if self not in self._Substation._VoltageLevels:
-                self._Substation._VoltageLevels.append(self)
+            if self._Substation._VoltageLevels is EMPTY:
+                self._Substation._VoltageLevels = AssociationList([self])
+            else:
+                self._Substation._VoltageLevels.add(self)
 
     Substation = property(getSubstation, setSubstation)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.Unbalanced.IEC61970.Core.ConductingEquipment import ConductingEquipment
+from CIM14.CDPSM.Unbalanced.Element import AssociationList, EMPTY
 
 class EnergyConsumer(ConductingEquipment):
     """Generic user of energy - a  point of consumption on the power system model
@@ -68,13 +69,14 @@ class EnergyConsumer(ConductingEquipment):
 
     def setLoadResponse(self, value):
         if self._LoadResponse is not None:
-            filtered = [x for x in self.LoadResponse.EnergyConsumer if x != self]
-            self._LoadResponse._EnergyConsumer = filtered
+            self._LoadResponse._EnergyConsumer.discard(self)
 
         self._LoadResponse = value
         if self._LoadResponse is not None:
-            if self not in self._LoadResponse._EnergyConsumer:
-                self._LoadResponse._EnergyConsumer.append(self)
+            if self._LoadResponse._EnergyConsumer is EMPTY:
+                self._LoadResponse._EnergyConsumer = AssociationList([self])
+            else:
+                self._LoadResponse._EnergyConsumer.add(self)
 
     LoadResponse = property(getLoadResponse, setLoadResponse)
 
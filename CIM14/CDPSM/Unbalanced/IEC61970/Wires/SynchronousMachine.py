@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.Unbalanced.IEC61970.Core.ConductingEquipment import ConductingEquipment
+from CIM14.CDPSM.Unbalanced.Element import AssociationList, EMPTY
 
 class SynchronousMachine(ConductingEquipment):
     """An electromechanical device that operates synchronously with the network. It is a single machine operating either as a generator or synchronous condenser or pump.
@@ -68,13 +69,14 @@ class SynchronousMachine(ConductingEquipment):
 
     def setGeneratingUnit(self, value):
         if self._GeneratingUnit is not None:
-            filtered = [x for x in self.GeneratingUnit.SynchronousMachines if x != self]
-            self._GeneratingUnit._SynchronousMachines = filtered
+            self._GeneratingUnit._SynchronousMachines.discard(self)
 
         self._GeneratingUnit = value
         if self._GeneratingUnit is not None:
-            if self not in self._GeneratingUnit._SynchronousMachines:
-                self._GeneratingUnit._SynchronousMachines.append(self)
+            if self._GeneratingUnit._SynchronousMachines is EMPTY:
+                self._GeneratingUnit._SynchronousMachines = AssociationList([self])
+            else:
+                self._GeneratingUnit._SynchronousMachines.add(self)
 
     GeneratingUnit = property(getGeneratingUnit, setGeneratingUnit)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CPSM.Equipment.Core.IdentifiedObject import IdentifiedObject
+from CIM14.CPSM.Equipment.Element import AssociationList, EMPTY
 
 class Curve(IdentifiedObject):
     """A multi-purpose curve or functional relationship between an independent variable (X-axis) and dependent (Y-axis) variables.
@@ -49,8 +50,9 @@ class Curve(IdentifiedObject):
         #: The X-axis units of measure. Values are: "A", "rad", "none", "g", "W/Hz", "V", "m2", "VA", "VArh", "N", "Pa", "VAh", "F", "H", "Hz-1", "W/s", "J", "m", "S", "min", "deg", "J/s", "s", "Wh", "m3", "oC", "V/VAr", "s-1", "h", "W", "ohm", "Hz", "VAr", "kg/J"
         self.xUnit = xUnit
 
-        self._CurveDatas = []
-        self.CurveDatas = [] if CurveDatas is None else CurveDatas
+        self._CurveDatas = EMPTY
+        if CurveDatas is not None:
+            self.CurveDatas = CurveDatas
 
         super(Curve, self).__init__(*args, **kw_args)
 
@@ -67,6 +69,7 @@ class Curve(IdentifiedObject):
         return self._CurveDatas
 
     def setCurveDatas(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._CurveDatas:
             x.Curve = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CPSM.Equipment.Core.PowerSystemResource import PowerSystemResource
+from CIM14.CPSM.Equipment.Element import AssociationList, EMPTY
 
 class Equipment(PowerSystemResource):
     """The parts of a power system that are physical devices, electronic or mechanical
@@ -34,8 +35,9 @@ class Equipment(PowerSystemResource):
         #: The single instance of equipment represents multiple pieces of equipment that have been modeled together as an aggregate.  Examples would be PowerTransformers or SychronousMachines operating in parallel modeled as a single aggregate PowerTransformer or aggregate SynchronousMachine.  This is not to be used to indicate equipment that is part of a group of interdependent equipment produced by a network production program.
         self.aggregate = aggregate
 
-        self._OperationalLimitSet = []
-        self.OperationalLimitSet = [] if OperationalLimitSet is None else OperationalLimitSet
+        self._OperationalLimitSet = EMPTY
+        if OperationalLimitSet is not None:
+            self.OperationalLimitSet = OperationalLimitSet
 
         self._EquipmentContainer = None
         self.EquipmentContainer = EquipmentContainer
@@ -55,6 +57,7 @@ class Equipment(PowerSystemResource):
         return self._OperationalLimitSet
 
     def setOperationalLimitSet(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._OperationalLimitSet:
             x.Equipment = None
         for y in value:
@@ -78,13 +81,14 @@ class Equipment(PowerSystemResource):
 
     def setEquipmentContainer(self, value):
         if self._EquipmentContainer is not None:
-            filtered = [x for x in self.EquipmentContainer.Equipments if x != self]
-            self._EquipmentContainer._Equipments = filtered
+            self._EquipmentContainer._Equipments.discard(self)
 
         self._EquipmentContainer = value
         if self._EquipmentContainer is not None:
-            if self not in self._EquipmentContainer._Equipments:
-                self._EquipmentContainer._Equipments.append(self)
+            if self._EquipmentContainer._Equipments is EMPTY:
+                self._EquipmentContainer._Equipments = AssociationList([self])
+            else:
+                self._EquipmentContainer._Equipments.add(self)
 
     EquipmentContainer = property(getEquipmentContainer, setEquipmentContainer)
 
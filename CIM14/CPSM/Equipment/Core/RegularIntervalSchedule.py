@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CPSM.Equipment.Core.BasicIntervalSchedule import BasicIntervalSchedule
+from CIM14.CPSM.Equipment.Element import AssociationList, EMPTY
 
 class RegularIntervalSchedule(BasicIntervalSchedule):
     """The schedule has TimePoints where the time between them is constant.
@@ -37,8 +38,9 @@ class RegularIntervalSchedule(BasicIntervalSchedule):
         #: The time for the last time point.
         self.endTime = endTime
 
-        self._TimePoints = []
-        self.TimePoints = [] if TimePoints is None else TimePoints
+        self._TimePoints = EMPTY
+        if TimePoints is not None:
+            self.TimePoints = TimePoints
 
         super(RegularIntervalSchedule, self).__init__(*args, **kw_args)
 
@@ -55,6 +57,7 @@ class RegularIntervalSchedule(BasicIntervalSchedule):
         return self._TimePoints
 
     def setTimePoints(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._TimePoints:
             x.IntervalSchedule = None
         for y in value:
@@ -18,7 +18,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from CIM14.CPSM.Equipment.Element import Element
+from CIM14.CPSM.Equipment.Element import Element, AssociationList, EMPTY
 
 class RegularTimePoint(Element):
     """TimePoints for a schedule where the time between the points is constant.-  The RegularTimePoint class is used to represent points for various schedules that derive from the RegularIntervalSchedule class.  The schedules defined in this profile are: ConformLoadSchedule NonConformLoadSchedule RegulationSchedule -  The first SequenceNumber for a schedule is 1.  0 is not an allowed value.  The first time point is defined with SequenceNumber = 1. 
@@ -60,13 +60,14 @@ class RegularTimePoint(Element):
 
     def setIntervalSchedule(self, value):
         if self._IntervalSchedule is not None:
-            filtered = [x for x in self.IntervalSchedule.TimePoints if x != self]
-            self._IntervalSchedule._TimePoints = filtered
+            self._IntervalSchedule._TimePoints.discard(self)
 
         self._IntervalSchedule = value
         if self._IntervalSchedule is not None:
-            if self not in self._IntervalSchedule._TimePoints:
-                self._IntervalSchedule._TimePoints.append(self)
+            if self._IntervalSchedule._TimePoints is EMPTY:
+                self._IntervalSchedule._TimePoints = AssociationList([self])
+            else:
+                self._IntervalSchedule._TimePoints.add(self)
 
     IntervalSchedule = property(getIntervalSchedule, setIntervalSchedule)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CPSM.Equipment.Core.IdentifiedObject import IdentifiedObject
+from CIM14.CPSM.Equipment.Element import AssociationList, EMPTY
 
 class SubGeographicalRegion(IdentifiedObject):
     """A subset of a geographical region of a power system network model.
@@ -34,11 +35,13 @@ class SubGeographicalRegion(IdentifiedObject):
         self._Region = None
         self.Region = Region
 
-        self._Lines = []
-        self.Lines = [] if Lines is None else Lines
+        self._Lines = EMPTY
+        if Lines is not None:
+            self.Lines = Lines
 
-        self._Substations = []
-        self.Substations = [] if Substations is None else Substations
+        self._Substations = EMPTY
+        if Substations is not None:
+            self.Substations = Substations
 
         super(SubGeographicalRegion, self).__init__(*args, **kw_args)
 
@@ -56,13 +59,14 @@ class SubGeographicalRegion(IdentifiedObject):
 
     def setRegion(self, value):
         if self._Region is not None:
-            filtered = [x for x in self.Region.Regions if x != self]
-            self._Region._Regions = filtered
+            self._Region._Regions.discard(self)
 
         self._Region = value
         if self._Region is not None:
-            if self not in self._Region._Regions:
-                self._Region._Regions.append(self)
+            if self._Region._Regions is EMPTY:
+                self._Region._Regions = AssociationList([self])
+            else:
+                self._Region._Regions.add(self)
 
     Region = property(getRegion, setRegion)
 
@@ -72,6 +76,7 @@ class SubGeographicalRegion(IdentifiedObject):
         return self._Lines
 
     def setLines(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Lines:
             x.Region = None
         for y in value:
@@ -94,6 +99,7 @@ class SubGeographicalRegion(IdentifiedObject):
         return self._Substations
 
     def setSubstations(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Substations:
             x.Region = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CPSM.Equipment.Core.IdentifiedObject import IdentifiedObject
+from CIM14.CPSM.Equipment.Element import AssociationList, EMPTY
 
 class Terminal(IdentifiedObject):
     """An electrical connection point to a piece of conducting equipment. Terminals are connected at physical connection points called 'connectivity nodes'.
@@ -40,29 +41,35 @@ class Terminal(IdentifiedObject):
         #: The orientation of the terminal connections for a multiple terminal conducting equipment.  The sequence numbering starts with 1 and additional terminals should follow in increasing order.   The first terminal is the 'starting point' for a two terminal branch.   In the case of class TransformerWinding only one terminal is used so its sequenceNumber must be 1.
         self.sequenceNumber = sequenceNumber
 
-        self._OperationalLimitSet = []
-        self.OperationalLimitSet = [] if OperationalLimitSet is None else OperationalLimitSet
+        self._OperationalLimitSet = EMPTY
+        if OperationalLimitSet is not None:
+            self.OperationalLimitSet = OperationalLimitSet
 
         self._ConductingEquipment = None
         self.ConductingEquipment = ConductingEquipment
 
-        self._HasFirst_MutualCoupling = []
-        self.HasFirst_MutualCoupling = [] if HasFirst_MutualCoupling is None else HasFirst_MutualCoupling
+        self._HasFirst_MutualCoupling = EMPTY
+        if HasFirst_MutualCoupling is not None:
+            self.HasFirst_MutualCoupling = HasFirst_MutualCoupling
 
-        self._Measurements = []
-        self.Measurements = [] if Measurements is None else Measurements
+        self._Measurements = EMPTY
+        if Measurements is not None:
+            self.Measurements = Measurements
 
         self._ConnectivityNode = None
         self.ConnectivityNode = ConnectivityNode
 
-        self._RegulatingControl = []
-        self.RegulatingControl = [] if RegulatingControl is None else RegulatingControl
+        self._RegulatingControl = EMPTY
+        if RegulatingControl is not None:
+            self.RegulatingControl = RegulatingControl
 
-        self._TieFlow = []
-        self.TieFlow = [] if TieFlow is None else TieFlow
+        self._TieFlow = EMPTY
+        if TieFlow is not None:
+            self.TieFlow = TieFlow
 
-        self._HasSecond_MutualCoupling = []
-        self.HasSecond_MutualCoupling = [] if HasSecond_MutualCoupling is None else HasSecond_MutualCoupling
+        self._HasSecond_MutualCoupling = EMPTY
+        if HasSecond_MutualCoupling is not None:
+            self.HasSecond_MutualCoupling = HasSecond_MutualCoupling
 
         super(Terminal, self).__init__(*args, **kw_args)
 
@@ -79,6 +86,7 @@ class Terminal(IdentifiedObject):
         return self._OperationalLimitSet
 
     def setOperationalLimitSet(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._OperationalLimitSet:
             x.Terminal = None
         for y in value:
@@ -102,13 +110,14 @@ class Terminal(IdentifiedObject):
 
     def setConductingEquipment(self, value):
         if self._ConductingEquipment is not None:
-            filtered = [x for x in self.ConductingEquipment.Terminals if x != self]
-            self._ConductingEquipment._Terminals = filtered
+            self._ConductingEquipment._Terminals.discard(self)
 
         self._ConductingEquipment = value
         if self._ConductingEquipment is not None:
-            if self not in self._ConductingEquipment._Terminals:
-                self._ConductingEquipment._Terminals.append(self)
+            if self._ConductingEquipment._Terminals is EMPTY:
+                self._ConductingEquipment._Terminals = AssociationList([self])
+            else:
+                self._ConductingEquipment._Terminals.add(self)
 
     ConductingEquipment = property(getConductingEquipment, setConductingEquipment)
 
@@ -118,6 +127,7 @@ class Terminal(IdentifiedObject):
         return self._HasFirst_MutualCoupling
 
     def setHasFirst_MutualCoupling(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._HasFirst_MutualCoupling:
             x.First_Terminal = None
         for y in value:
@@ -140,6 +150,7 @@ class Terminal(IdentifiedObject):
         return self._Measurements
 
     def setMeasurements(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Measurements:
             x.Terminal = None
         for y in value:
@@ -163,13 +174,14 @@ class Terminal(IdentifiedObject):
 
     def setConnectivityNode(self, value):
         if self._ConnectivityNode is not None:
-            filtered = [x for x in self.ConnectivityNode.Terminals if x != self]
-            self._ConnectivityNode._Terminals = filtered
+            self._ConnectivityNode._Terminals.discard(self)
 
         self._ConnectivityNode = value
         if self._ConnectivityNode is not None:
-            if self not in self._ConnectivityNode._Terminals:
-                self._ConnectivityNode._Terminals.append(self)
+            if self._ConnectivityNode._Terminals is EMPTY:
+                self._ConnectivityNode._Terminals = AssociationList([self])
+            else:
+                self._ConnectivityNode._Terminals.add(self)
 
     ConnectivityNode = property(getConnectivityNode, setConnectivityNode)
 
@@ -179,6 +191,7 @@ class Terminal(IdentifiedObject):
         return self._RegulatingControl
 
     def setRegulatingControl(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._RegulatingControl:
             x.Terminal = None
         for y in value:
@@ -201,6 +214,7 @@ class Terminal(IdentifiedObject):
         return self._TieFlow
 
     def setTieFlow(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._TieFlow:
             x.Terminal = None
         for y in value:
@@ -223,6 +237,7 @@ class Terminal(IdentifiedObject):
         return self._HasSecond_MutualCoupling
 
     def setHasSecond_MutualCoupling(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._HasSecond_MutualCoupling:
             x.Second_Terminal = None
         for y in value:
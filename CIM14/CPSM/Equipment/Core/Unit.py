@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CPSM.Equipment.Core.IdentifiedObject import IdentifiedObject
+from CIM14.CPSM.Equipment.Element import AssociationList, EMPTY
 
 class Unit(IdentifiedObject):
     """Quantity being measured. The Unit.name shall be unique among all specified quantities and describe the quantity. The Unit.aliasName is meant to be used for localization.-  The Unit class is used to define the unit of measure (MW, kV, MVA, etc.) of a Measurement.  A Measurement must be associated with one and only one Unit.  The valid values for Unit.name are defined in Normative String Tables. 
@@ -29,8 +30,9 @@ class Unit(IdentifiedObject):
 
         @param Measurements: The Measurements having the Unit
         """
-        self._Measurements = []
-        self.Measurements = [] if Measurements is None else Measurements
+        self._Measurements = EMPTY
+        if Measurements is not None:
+            self.Measurements = Measurements
 
         super(Unit, self).__init__(*args, **kw_args)
 
@@ -47,6 +49,7 @@ class Unit(IdentifiedObject):
         return self._Measurements
 
     def setMeasurements(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Measurements:
             x.Unit = None
         for y in value:
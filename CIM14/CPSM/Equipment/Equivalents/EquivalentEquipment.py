@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CPSM.Equipment.Core.ConductingEquipment import ConductingEquipment
+from CIM14.CPSM.Equipment.Element import AssociationList, EMPTY
 
 class EquivalentEquipment(ConductingEquipment):
     """The class represents equivalent objects that are the result of a network reduction. The class is the base for equivalent objects of different types.
@@ -48,13 +49,14 @@ class EquivalentEquipment(ConductingEquipment):
 
     def setEquivalentNetwork(self, value):
         if self._EquivalentNetwork is not None:
-            filtered = [x for x in self.EquivalentNetwork.EquivalentEquipments if x != self]
-            self._EquivalentNetwork._EquivalentEquipments = filtered
+            self._EquivalentNetwork._EquivalentEquipments.discard(self)
 
         self._EquivalentNetwork = value
         if self._EquivalentNetwork is not None:
-            if self not in self._EquivalentNetwork._EquivalentEquipments:
-                self._EquivalentNetwork._EquivalentEquipments.append(self)
+            if self._EquivalentNetwork._EquivalentEquipments is EMPTY:
+                self._EquivalentNetwork._EquivalentEquipments = AssociationList([self])
+            else:
+                self._EquivalentNetwork._EquivalentEquipments.add(self)
 
     EquivalentNetwork = property(getEquivalentNetwork, setEquivalentNetwork)
 
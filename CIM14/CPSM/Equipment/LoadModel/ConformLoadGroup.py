@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CPSM.Equipment.LoadModel.LoadGroup import LoadGroup
+from CIM14.CPSM.Equipment.Element import AssociationList, EMPTY
 
 class ConformLoadGroup(LoadGroup):
     """A group of loads conforming to an allocation pattern.
@@ -30,11 +31,13 @@ class ConformLoadGroup(LoadGroup):
         @param EnergyConsumers: Conform loads assigned to this ConformLoadGroup.
         @param ConformLoadSchedules: The ConformLoadSchedules in the ConformLoadGroup.
         """
-        self._EnergyConsumers = []
-        self.EnergyConsumers = [] if EnergyConsumers is None else EnergyConsumers
+        self._EnergyConsumers = EMPTY
+        if EnergyConsumers is not None:
+            self.EnergyConsumers = EnergyConsumers
 
-        self._ConformLoadSchedules = []
-        self.ConformLoadSchedules = [] if ConformLoadSchedules is None else ConformLoadSchedules
+        self._ConformLoadSchedules = EMPTY
+        if ConformLoadSchedules is not None:
+            self.ConformLoadSchedules = ConformLoadSchedules
 
         super(ConformLoadGroup, self).__init__(*args, **kw_args)
 
@@ -51,6 +54,7 @@ class ConformLoadGroup(LoadGroup):
         return self._EnergyConsumers
 
     def setEnergyConsumers(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._EnergyConsumers:
             x.LoadGroup = None
         for y in value:
@@ -73,6 +77,7 @@ class ConformLoadGroup(LoadGroup):
         return self._ConformLoadSchedules
 
     def setConformLoadSchedules(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ConformLoadSchedules:
             x.ConformLoadGroup = None
         for y in value:
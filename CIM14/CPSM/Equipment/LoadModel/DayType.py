@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CPSM.Equipment.Core.IdentifiedObject import IdentifiedObject
+from CIM14.CPSM.Equipment.Element import AssociationList, EMPTY
 
 class DayType(IdentifiedObject):
     """Group of similar days, e.g., Mon/Tue/Wed, Thu/Fri, Sat/Sun, Holiday1, Holiday2-  The name attribute indicates the days of the week that a given DayType represents. -  If the name attribute is “All”, it represents all seven days of the week. -  If the name attribute is “Weekday”, it represents Monday through Friday. -  If the name attribute is “Weekend”, it represents Saturday and Sunday. 
@@ -29,8 +30,9 @@ class DayType(IdentifiedObject):
 
         @param SeasonDayTypeSchedules: Schedules that use this DayType.
         """
-        self._SeasonDayTypeSchedules = []
-        self.SeasonDayTypeSchedules = [] if SeasonDayTypeSchedules is None else SeasonDayTypeSchedules
+        self._SeasonDayTypeSchedules = EMPTY
+        if SeasonDayTypeSchedules is not None:
+            self.SeasonDayTypeSchedules = SeasonDayTypeSchedules
 
         super(DayType, self).__init__(*args, **kw_args)
 
@@ -47,6 +49,7 @@ class DayType(IdentifiedObject):
         return self._SeasonDayTypeSchedules
 
     def setSeasonDayTypeSchedules(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._SeasonDayTypeSchedules:
             x.DayType = None
         for y in value:
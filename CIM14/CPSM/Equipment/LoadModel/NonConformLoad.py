@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CPSM.Equipment.Wires.EnergyConsumer import EnergyConsumer
+from CIM14.CPSM.Equipment.Element import AssociationList, EMPTY
 
 class NonConformLoad(EnergyConsumer):
     """NonConformLoad represent loads that do not follow a daily load change pattern and changes are not correlated with the daily load change pattern.-  [R8.2] is satisfied by navigation to ConnectivityNode and Substation -  The definition of the real and reactive power injections for an EnergyConsumer can be done using different sets of attributes.  In the simplest case, the injections can be defined directly using only the attributes “pfixed” and “qfixed”. -  The injections for a NonConformLoad can be defined as a percentage of the NonConformLoadGroup with the attributes “pfixedPct” and “qfixedPct”.  In this case, the associated NonConformLoadGroup would have to have an associated NonConformLoadSchedule. -  The attributes defining the affect of voltage and frequency on the injection defined by an associated LoadResponseCharacteristic should be supplied, if they are available, but are not required. 
@@ -48,13 +49,14 @@ class NonConformLoad(EnergyConsumer):
 
     def setLoadGroup(self, value):
         if self._LoadGroup is not None:
-            filtered = [x for x in self.LoadGroup.EnergyConsumers if x != self]
-            self._LoadGroup._EnergyConsumers = filtered
+            self._LoadGroup._EnergyConsumers.discard(self)
 
         self._LoadGroup = value
         if self._LoadGroup is not None:
-            if self not in self._LoadGroup._EnergyConsumers:
-                self._LoadGroup._EnergyConsumers.append(self)
+            if self._LoadGroup._EnergyConsumers is EMPTY:
+                self._LoadGroup._EnergyConsumers = AssociationList([self])
+            else:
+                self._LoadGroup._EnergyConsumers.add(self)
 
     LoadGroup = property(getLoadGroup, setLoadGroup)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CPSM.Equipment.LoadModel.LoadGroup import LoadGroup
+from CIM14.CPSM.Equipment.Element import AssociationList, EMPTY
 
 class NonConformLoadGroup(LoadGroup):
     """Loads that do not follow a daily and seasonal load variation pattern.
@@ -30,11 +31,13 @@ class NonConformLoadGroup(LoadGroup):
         @param NonConformLoadSchedules: The NonConformLoadSchedules in the NonConformLoadGroup.
         @param EnergyConsumers: Conform loads assigned to this ConformLoadGroup.
         """
-        self._NonConformLoadSchedules = []
-        self.NonConformLoadSchedules = [] if NonConformLoadSchedules is None else NonConformLoadSchedules
+        self._NonConformLoadSchedules = EMPTY
+        if NonConformLoadSchedules is not None:
+            self.NonConformLoadSchedules = NonConformLoadSchedules
 
-        self._EnergyConsumers = []
-        self.EnergyConsumers = [] if EnergyConsumers is None else EnergyConsumers
+        self._EnergyConsumers = EMPTY
+        if EnergyConsumers is not None:
+            self.EnergyConsumers = EnergyConsumers
 
         super(NonConformLoadGroup, self).__init__(*args, **kw_args)
 
@@ -51,6 +54,7 @@ class NonConformLoadGroup(LoadGroup):
         return self._NonConformLoadSchedules
 
     def setNonConformLoadSchedules(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._NonConformLoadSchedules:
             x.NonConformLoadGroup = None
         for y in value:
@@ -73,6 +77,7 @@ class NonConformLoadGroup(LoadGroup):
         return self._EnergyConsumers
 
     def setEnergyConsumers(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._EnergyConsumers:
             x.LoadGroup = None
         for y in value:
@@ -18,7 +18,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from CIM14.CPSM.Equipment.Element import Element
+from CIM14.CPSM.Equipment.Element import Element, AssociationList, EMPTY
 
 class Season(Element):
     """A specified time period of the year, e.g., Spring, Summer, Fall, Winter-  To specify a relative date as the startDate or endDate for a Season, the year component of the ISO 8601 date format (“YYYY-MM-DD”) can be omitted.  The resulting format would be “MM-DD”.
@@ -41,8 +41,9 @@ class Season(Element):
         #: Name of the Season Values are: "fall", "winter", "spring", "summer"
         self.name = name
 
-        self._SeasonDayTypeSchedules = []
-        self.SeasonDayTypeSchedules = [] if SeasonDayTypeSchedules is None else SeasonDayTypeSchedules
+        self._SeasonDayTypeSchedules = EMPTY
+        if SeasonDayTypeSchedules is not None:
+            self.SeasonDayTypeSchedules = SeasonDayTypeSchedules
 
         super(Season, self).__init__(*args, **kw_args)
 
@@ -59,6 +60,7 @@ class Season(Element):
         return self._SeasonDayTypeSchedules
 
     def setSeasonDayTypeSchedules(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._SeasonDayTypeSchedules:
             x.Season = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CPSM.Equipment.Meas.Measurement import Measurement
+from CIM14.CPSM.Equipment.Element import AssociationList, EMPTY
 
 class Accumulator(Measurement):
     """Accumulator represents a accumulated (counted) Measurement, e.g. an energy value.-  The association to Terminal may not be required depending on how the Measurement is being used.  See section Use of Measurement Class for details. -  The MeasurementType class is used to define the quantity being measured (Voltage, ThreePhaseActivePower, etc.) by a Measurement.  A Measurement must be associated with one and only one measurementType.  The valid values for MeasurementType.name are defined in Normative String Tables. 
@@ -29,8 +30,9 @@ class Accumulator(Measurement):
 
         @param AccumulatorValues: The values connected to this measurement.
         """
-        self._AccumulatorValues = []
-        self.AccumulatorValues = [] if AccumulatorValues is None else AccumulatorValues
+        self._AccumulatorValues = EMPTY
+        if AccumulatorValues is not None:
+            self.AccumulatorValues = AccumulatorValues
 
         super(Accumulator, self).__init__(*args, **kw_args)
 
@@ -47,6 +49,7 @@ class Accumulator(Measurement):
         return self._AccumulatorValues
 
     def setAccumulatorValues(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._AccumulatorValues:
             x.Accumulator = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CPSM.Equipment.Meas.MeasurementValue import MeasurementValue
+from CIM14.CPSM.Equipment.Element import AssociationList, EMPTY
 
 class AccumulatorValue(MeasurementValue):
     """AccumulatorValue represents a accumulated (counted) MeasurementValue.
@@ -48,13 +49,14 @@ class AccumulatorValue(MeasurementValue):
 
     def setAccumulator(self, value):
         if self._Accumulator is not None:
-            filtered = [x for x in self.Accumulator.AccumulatorValues if x != self]
-            self._Accumulator._AccumulatorValues = filtered
+            self._Accumulator._AccumulatorValues.discard(self)
 
         self._Accumulator = value
         if self._Accumulator is not None:
-            if self not in self._Accumulator._AccumulatorValues:
-                self._Accumulator._AccumulatorValues.append(self)
+            if self._Accumulator._AccumulatorValues is EMPTY:
+                self._Accumulator._AccumulatorValues = AssociationList([self])
+            else:
+                self._Accumulator._AccumulatorValues.add(self)
 
     Accumulator = property(getAccumulator, setAccumulator)
 
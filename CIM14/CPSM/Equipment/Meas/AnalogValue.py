@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CPSM.Equipment.Meas.MeasurementValue import MeasurementValue
+from CIM14.CPSM.Equipment.Element import AssociationList, EMPTY
 
 class AnalogValue(MeasurementValue):
     """AnalogValue represents an analog MeasurementValue.
@@ -48,13 +49,14 @@ class AnalogValue(MeasurementValue):
 
     def setAnalog(self, value):
         if self._Analog is not None:
-            filtered = [x for x in self.Analog.AnalogValues if x != self]
-            self._Analog._AnalogValues = filtered
+            self._Analog._AnalogValues.discard(self)
 
         self._Analog = value
         if self._Analog is not None:
-            if self not in self._Analog._AnalogValues:
-                self._Analog._AnalogValues.append(self)
+            if self._Analog._AnalogValues is EMPTY:
+                self._Analog._AnalogValues = AssociationList([self])
+            else:
+                self._Analog._AnalogValues.add(self)
 
     Analog = property(getAnalog, setAnalog)
 
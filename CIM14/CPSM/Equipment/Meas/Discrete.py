@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CPSM.Equipment.Meas.Measurement import Measurement
+from CIM14.CPSM.Equipment.Element import AssociationList, EMPTY
 
 class Discrete(Measurement):
     """Discrete represents a discrete Measurement, i.e. a Measurement reprsenting discrete values, e.g. a Breaker position.-  The association to Terminal may not be required depending on how the Measurement is being used.  See section Use of Measurement Class for details. -  The MeasurementType class is used to define the quantity being measured (Voltage, ThreePhaseActivePower, etc.) by a Measurement.  A Measurement must be associated with one and only one measurementType.  The valid values for the MeasurementType name are defined in Normative String Tables. 
@@ -29,8 +30,9 @@ class Discrete(Measurement):
 
         @param DiscreteValues: The values connected to this measurement.
         """
-        self._DiscreteValues = []
-        self.DiscreteValues = [] if DiscreteValues is None else DiscreteValues
+        self._DiscreteValues = EMPTY
+        if DiscreteValues is not None:
+            self.DiscreteValues = DiscreteValues
 
         super(Discrete, self).__init__(*args, **kw_args)
 
@@ -47,6 +49,7 @@ class Discrete(Measurement):
         return self._DiscreteValues
 
     def setDiscreteValues(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._DiscreteValues:
             x.Discrete = None
         for y in value:
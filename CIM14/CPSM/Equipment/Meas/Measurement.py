@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CPSM.Equipment.Core.IdentifiedObject import IdentifiedObject
+from CIM14.CPSM.Equipment.Element import AssociationList, EMPTY
 
 class Measurement(IdentifiedObject):
     """A Measurement represents any measured, calculated or non-measured non-calculated quantity. Any piece of equipment may contain Measurements, e.g. a substation may have temperature measurements and door open indications, a transformer may have oil temperature and tank pressure measurements, a bay may contain a number of power flow measurements and a Breaker may contain a switch status measurement.  The PSR - Measurement association is intended to capture this use of Measurement and is included in the naming hierarchy based on EquipmentContainer. The naming hierarchy typically has Measurements as leafs, e.g. Substation-VoltageLevel-Bay-Switch-Measurement. Some Measurements represent quantities related to a particular sensor location in the network, e.g. a voltage transformer (PT) at a busbar or a current transformer (CT) at the bar between a breaker and an isolator. The sensing position is not captured in the PSR - Measurement association. Instead it is captured by the Measurement - Terminal association that is used to define the sensing location in the network topology. The location is defined by the connection of the Terminal to ConductingEquipment.  Two possible paths exist: 1) Measurement-Terminal- ConnectivityNode-Terminal-ConductingEquipment 2) Measurement-Terminal-ConductingEquipment Alternative 2 is the only allowed use.  When the sensor location is needed both Measurement-PSR and Measurement-Terminal are used. The Measurement-Terminal association is never used alone.
@@ -60,13 +61,14 @@ class Measurement(IdentifiedObject):
 
     def setUnit(self, value):
         if self._Unit is not None:
-            filtered = [x for x in self.Unit.Measurements if x != self]
-            self._Unit._Measurements = filtered
+            self._Unit._Measurements.discard(self)
 
         self._Unit = value
         if self._Unit is not None:
-            if self not in self._Unit._Measurements:
-                self._Unit._Measurements.append(self)
+            if self._Unit._Measurements is EMPTY:
+                self._Unit._Measurements = AssociationList([self])
+            else:
+                self._Unit._Measurements.add(self)
 
     Unit = property(getUnit, setUnit)
 
@@ -77,13 +79,14 @@ class Measurement(IdentifiedObject):
 
     def setTerminal(self, value):
         if self._Terminal is not None:
-            filtered = [x for x in self.Terminal.Measurements if x != self]
-            self._Terminal._Measurements = filtered
+            self._Terminal._Measurements.discard(self)
 
         self._Terminal = value
         if self._Terminal is not None:
-            if self not in self._Terminal._Measurements:
-                self._Terminal._Measurements.append(self)
+            if self._Terminal._Measurements is EMPTY:
+                self._Terminal._Measurements = AssociationList([self])
+            else:
+                self._Terminal._Measurements.add(self)
 
     Terminal = property(getTerminal, setTerminal)
 
@@ -94,13 +97,14 @@ class Measurement(IdentifiedObject):
 
     def setPowerSystemResource(self, value):
         if self._PowerSystemResource is not None:
-            filtered = [x for x in self.PowerSystemResource.Measurements if x != self]
-            self._PowerSystemResource._Measurements = filtered
+            self._PowerSystemResource._Measurements.discard(self)
 
         self._PowerSystemResource = value
         if self._PowerSystemResource is not None:
-            if self not in self._PowerSystemResource._Measurements:
-                self._PowerSystemResource._Measurements.append(self)
+            if self._PowerSystemResource._Measurements is EMPTY:
+                self._PowerSystemResource._Measurements = AssociationList([self])
+            else:
+                self._PowerSystemResource._Measurements.add(self)
 
     PowerSystemResource = property(getPowerSystemResource, setPowerSystemResource)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CPSM.Equipment.Core.IdentifiedObject import IdentifiedObject
+from CIM14.CPSM.Equipment.Element import AssociationList, EMPTY
 
 class MeasurementValue(IdentifiedObject):
     """The current state for a measurement. A state value is an instance of a measurement from a specific source. Measurements can be associated with many state values, each representing a different source for the measurement.
@@ -48,13 +49,14 @@ class MeasurementValue(IdentifiedObject):
 
     def setMeasurementValueSource(self, value):
         if self._MeasurementValueSource is not None:
-            filtered = [x for x in self.MeasurementValueSource.MeasurementValues if x != self]
-            self._MeasurementValueSource._MeasurementValues = filtered
+            self._MeasurementValueSource._MeasurementValues.discard(self)
 
         self._MeasurementValueSource = value
         if self._MeasurementValueSource is not None:
-            if self not in self._MeasurementValueSource._MeasurementValues:
-                self._MeasurementValueSource._MeasurementValues.append(self)
+            if self._MeasurementValueSource._MeasurementValues is EMPTY:
+                self._MeasurementValueSource._MeasurementValues = AssociationList([self])
+            else:
+                self._MeasurementValueSource._MeasurementValues.add(self)
 
     MeasurementValueSource = property(getMeasurementValueSource, setMeasurementValueSource)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CPSM.Equipment.Core.IdentifiedObject import IdentifiedObject
+from CIM14.CPSM.Equipment.Element import AssociationList, EMPTY
 
 class MeasurementValueSource(IdentifiedObject):
     """MeasurementValueSource describes the alternative sources updating a MeasurementValue. User conventions for how to use the MeasurementValueSource attributes are described in the introduction to IEC 61970-301.
@@ -29,8 +30,9 @@ class MeasurementValueSource(IdentifiedObject):
 
         @param MeasurementValues: The MeasurementValues updated by the source
         """
-        self._MeasurementValues = []
-        self.MeasurementValues = [] if MeasurementValues is None else MeasurementValues
+        self._MeasurementValues = EMPTY
+        if MeasurementValues is not None:
+            self.MeasurementValues = MeasurementValues
 
         super(MeasurementValueSource, self).__init__(*args, **kw_args)
 
@@ -47,6 +49,7 @@ class MeasurementValueSource(IdentifiedObject):
         return self._MeasurementValues
 
     def setMeasurementValues(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._MeasurementValues:
             x.MeasurementValueSource = None
         for y in value:
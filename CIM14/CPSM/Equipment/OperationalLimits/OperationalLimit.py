@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CPSM.Equipment.Core.IdentifiedObject import IdentifiedObject
+from CIM14.CPSM.Equipment.Element import AssociationList, EMPTY
 
 class OperationalLimit(IdentifiedObject):
     """A value associated with a specific kind of limit.
@@ -52,13 +53,14 @@ class OperationalLimit(IdentifiedObject):
 
     def setOperationalLimitSet(self, value):
         if self._OperationalLimitSet is not None:
-            filtered = [x for x in self.OperationalLimitSet.OperationalLimitValue if x != self]
-            self._OperationalLimitSet._OperationalLimitValue = filtered
+            self._OperationalLimitSet._OperationalLimitValue.discard(self)
 
         self._OperationalLimitSet = value
         if self._OperationalLimitSet is not None:
-            if self not in self._OperationalLimitSet._OperationalLimitValue:
-                self._OperationalLimitSet._OperationalLimitValue.append(self)
+            if self._OperationalLimitSet._OperationalLimitValue is EMPTY:
+                self._OperationalLimitSet._OperationalLimitValue = AssociationList([self])
+            else:
+                self._OperationalLimitSet._OperationalLimitValue.add(self)
 
     OperationalLimitSet = property(getOperationalLimitSet, setOperationalLimitSet)
 
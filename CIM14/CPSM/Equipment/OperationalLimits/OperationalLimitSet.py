@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CPSM.Equipment.Core.IdentifiedObject import IdentifiedObject
+from CIM14.CPSM.Equipment.Element import AssociationList, EMPTY
 
 class OperationalLimitSet(IdentifiedObject):
     """A set of limits associated with equipmnet.  Sets of limits might apply to a specific temperature, or season for example. A set of limits may contain may different severities of limit levels that would apply to the same equipment.   The set may contain limits of different types such as apparent power and current limits or high and low voltage limits  that are logically applied together as a set.
@@ -37,8 +38,9 @@ class OperationalLimitSet(IdentifiedObject):
         self._Equipment = None
         self.Equipment = Equipment
 
-        self._OperationalLimitValue = []
-        self.OperationalLimitValue = [] if OperationalLimitValue is None else OperationalLimitValue
+        self._OperationalLimitValue = EMPTY
+        if OperationalLimitValue is not None:
+            self.OperationalLimitValue = OperationalLimitValue
 
         super(OperationalLimitSet, self).__init__(*args, **kw_args)
 
@@ -56,13 +58,14 @@ class OperationalLimitSet(IdentifiedObject):
 
     def setTerminal(self, value):
         if self._Terminal is not None:
-            filtered = [x for x in self.Terminal.OperationalLimitSet if x != self]
-            self._Terminal._OperationalLimitSet = filtered
+            self._Terminal._OperationalLimitSet.discard(self)
 
         self._Terminal = value
         if self._Terminal is not None:
-            if self not in self._Terminal._OperationalLimitSet:
-                self._Terminal._OperationalLimitSet.append(self)
+            if self._Terminal._OperationalLimitSet is EMPTY:
+                self._Terminal._OperationalLimitSet = AssociationList([self])
+            else:
+                self._Terminal._OperationalLimitSet.add(self)
 
     Terminal = property(getTerminal, setTerminal)
 
@@ -73,13 +76,14 @@ class OperationalLimitSet(IdentifiedObject):
 
     def setEquipment(self, value):
         if self._Equipment is not None:
-            filtered = [x for x in self.Equipment.OperationalLimitSet if x != self]
-            self._Equipment._OperationalLimitSet = filtered
+            self._Equipment._OperationalLimitSet.discard(self)
 
         self._Equipment = value
         if self._Equipment is not None:
-            if self not in self._Equipment._OperationalLimitSet:
-                self._Equipment._OperationalLimitSet.append(self)
+            if self._Equipment._OperationalLimitSet is EMPTY:
+                self._Equipment._OperationalLimitSet = AssociationList([self])
+            else:
+                self._Equipment._OperationalLimitSet.add(self)
 
     Equipment = property(getEquipment, setEquipment)
 
@@ -89,6 +93,7 @@ class OperationalLimitSet(IdentifiedObject):
         return self._OperationalLimitValue
 
     def setOperationalLimitValue(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._OperationalLimitValue:
             x.OperationalLimitSet = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CPSM.Equipment.Core.IdentifiedObject import IdentifiedObject
+from CIM14.CPSM.Equipment.Element import AssociationList, EMPTY
 
 class MutualCoupling(IdentifiedObject):
     """This class represents the zero sequence line mutual coupling.
@@ -84,13 +85,14 @@ class MutualCoupling(IdentifiedObject):
 
     def setSecond_Terminal(self, value):
         if self._Second_Terminal is not None:
-            filtered = [x for x in self.Second_Terminal.HasSecond_MutualCoupling if x != self]
-            self._Second_Terminal._HasSecond_MutualCoupling = filtered
+            self._Second_Terminal._HasSecond_MutualCoupling.discard(self)
 
         self._Second_Terminal = value
         if self._Second_Terminal is not None:
-            if self not in self._Second_Terminal._HasSecond_MutualCoupling:
-                self._Second_Terminal._HasSecond_MutualCoupling.append(self)
+            if self._Second_Terminal._HasSecond_MutualCoupling is EMPTY:
+                self._Second_Terminal._HasSecond_MutualCoupling = AssociationList([self])
+            else:
+                self._Second_Terminal._HasSecond_MutualCoupling.add(self)
 
     Second_Terminal = property(getSecond_Terminal, setSecond_Terminal)
 
@@ -101,13 +103,14 @@ class MutualCoupling(IdentifiedObject):
 
     def setFirst_Terminal(self, value):
         if self._First_Terminal is not None:
-            filtered = [x for x in self.First_Terminal.HasFirst_MutualCoupling if x != self]
-            self._First_Terminal._HasFirst_MutualCoupling = filtered
+            self._First_Terminal._HasFirst_MutualCoupling.discard(self)
 
         self._First_Terminal = value
         if self._First_Terminal is not None:
-            if self not in self._First_Terminal._HasFirst_MutualCoupling:
-                self._First_Terminal._HasFirst_MutualCoupling.append(self)
+            if self._First_Terminal._HasFirst_MutualCoupling is EMPTY:
+                self._First_Terminal._HasFirst_MutualCoupling = AssociationList([self])
+            else:
+                self._First_Terminal._HasFirst_MutualCoupling.add(self)
 
     First_Terminal = property(getFirst_Terminal, setFirst_Terminal)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CPSM.Equipment.Core.Curve import Curve
+from CIM14.CPSM.Equipment.Element import AssociationList, EMPTY
 
 class ReactiveCapabilityCurve(Curve):
     """Reactive power rating envelope versus the synchronous machine's active power, in both the generating and motoring modes. For each active power value there is a corresponding high and low reactive power limit  value. Typically there will be a separate curve for each coolant condition, such as hydrogen pressure.  The Y1 axis values represent reactive minimum and the Y2 axis values represent reactive maximum.-  ReactiveCapabilityCurves are not required if the reactive power limits of the SynchronousMachine do not vary with real power output. -  By convention, the Y1 axis values represent reactive minimum and the Y2 axis values represent reactive maximum. -  Because the x value will always be specified in MW and the y values will always be specified in MVAr, the xMultiplier, y1Multiplier, and y2Multiplier attributes do not need to be supplied. 
@@ -29,8 +30,9 @@ class ReactiveCapabilityCurve(Curve):
 
         @param InitiallyUsedBySynchronousMachines: Synchronous machines using this curve as default.
         """
-        self._InitiallyUsedBySynchronousMachines = []
-        self.InitiallyUsedBySynchronousMachines = [] if InitiallyUsedBySynchronousMachines is None else InitiallyUsedBySynchronousMachines
+        self._InitiallyUsedBySynchronousMachines = EMPTY
+        if InitiallyUsedBySynchronousMachines is not None:
+            self.InitiallyUsedBySynchronousMachines = InitiallyUsedBySynchronousMachines
 
         super(ReactiveCapabilityCurve, self).__init__(*args, **kw_args)
 
@@ -47,6 +49,7 @@ class ReactiveCapabilityCurve(Curve):
         return self._InitiallyUsedBySynchronousMachines
 
     def setInitiallyUsedBySynchronousMachines(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._InitiallyUsedBySynchronousMachines:
             x.InitialReactiveCapabilityCurve = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CPSM.Equipment.LoadModel.SeasonDayTypeSchedule import SeasonDayTypeSchedule
+from CIM14.CPSM.Equipment.Element import AssociationList, EMPTY
 
 class RegulationSchedule(SeasonDayTypeSchedule):
     """A pre-established pattern over time for a controlled variable, e.g., busbar voltage.-  By convention, ”value1” represents the target voltage or real power.  “value2” is the deviation. A value1 of 100 and value2 of 1 means regulating to 100KV plus or minus 1KV.  The range would be from 99 KV to 101 KV. Because the regulation values will be specified in either kV for voltage or MW for real power, the value1Multiplier and value2Multiplier attributes do not need to be specified.
@@ -48,13 +49,14 @@ class RegulationSchedule(SeasonDayTypeSchedule):
 
     def setRegulatingControl(self, value):
         if self._RegulatingControl is not None:
-            filtered = [x for x in self.RegulatingControl.RegulationSchedule if x != self]
-            self._RegulatingControl._RegulationSchedule = filtered
+            self._RegulatingControl._RegulationSchedule.discard(self)
 
         self._RegulatingControl = value
         if self._RegulatingControl is not None:
-            if self not in self._RegulatingControl._RegulationSchedule:
-                self._RegulatingControl._RegulationSchedule.append(self)
+            if self._RegulatingControl._RegulationSchedule is EMPTY:
+                self._RegulatingControl._RegulationSchedule = AssociationList([self])
+            else:
+                self._RegulatingControl._RegulationSchedule.add(self)
 
     RegulatingControl = property(getRegulatingControl, setRegulatingControl)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CPSM.Equipment.Core.ConductingEquipment import ConductingEquipment
+from CIM14.CPSM.Equipment.Element import AssociationList, EMPTY
 
 class Switch(ConductingEquipment):
     """A generic device designed to close, or open, or both, one or more electric circuits.-  [R6.2] and [R6.3] are satisfied by navigation to ConnectivityNode and Substation -  [R6.4] is satisfied by the class name. 
@@ -33,8 +34,9 @@ class Switch(ConductingEquipment):
         #: The attribute is used in cases when no Measurement for the status value is present. If the Switch has a status measurment the Discrete.normalValue is expected to match with the Switch.normalOpen.
         self.normalOpen = normalOpen
 
-        self._SwitchSchedules = []
-        self.SwitchSchedules = [] if SwitchSchedules is None else SwitchSchedules
+        self._SwitchSchedules = EMPTY
+        if SwitchSchedules is not None:
+            self.SwitchSchedules = SwitchSchedules
 
         super(Switch, self).__init__(*args, **kw_args)
 
@@ -51,6 +53,7 @@ class Switch(ConductingEquipment):
         return self._SwitchSchedules
 
     def setSwitchSchedules(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._SwitchSchedules:
             x.Switch = None
         for y in value:
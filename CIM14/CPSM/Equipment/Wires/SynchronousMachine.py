@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CPSM.Equipment.Wires.RegulatingCondEq import RegulatingCondEq
+from CIM14.CPSM.Equipment.Element import AssociationList, EMPTY
 
 class SynchronousMachine(RegulatingCondEq):
     """An electromechanical device that operates synchronously with the network. It is a single machine operating either as a generator or synchronous condenser or pump.-  [R7.2] and [R9.3] are satisfied by navigation to ConnectivityNode and Substation. -  If a SynchronousMachine is not associated with a ReactiveCapabilityCurve, then the minQ and maxQ attributes will be used.   -  If a ReactiveCapabilityCurve is supplied, then the minQ and maxQ attributes are not required. -  If a synchronous condenser is being modeled so that there is no capability for real power output, the SynchronousMachine is not required to be associated with a GeneratingUnit.  In this case, the type and operatingMode attributes must both be set to “condenser”. -  Attributes qPercent, r, r0, r2, x, x0, x2, ratedS and referencePriority are not required.  SynchronousMachine.GeneratingUnit is required for this profile - need to change UML to reflect this.
@@ -104,13 +105,14 @@ class SynchronousMachine(RegulatingCondEq):
 
     def setInitialReactiveCapabilityCurve(self, value):
         if self._InitialReactiveCapabilityCurve is not None:
-            filtered = [x for x in self.InitialReactiveCapabilityCurve.InitiallyUsedBySynchronousMachines if x != self]
-            self._InitialReactiveCapabilityCurve._InitiallyUsedBySynchronousMachines = filtered
+            self._InitialReactiveCapabilityCurve._InitiallyUsedBySynchronousMachines.discard(self)
 
         self._InitialReactiveCapabilityCurve = value
         if self._InitialReactiveCapabilityCurve is not None:
-            if self not in self._InitialReactiveCapabilityCurve._InitiallyUsedBySynchronousMachines:
-                self._InitialReactiveCapabilityCurve._InitiallyUsedBySynchronousMachines.append(self)
+            if self._InitialReactiveCapabilityCurve._InitiallyUsedBySynchronousMachines is EMPTY:
+                self._InitialReactiveCapabilityCurve._InitiallyUsedBySynchronousMachines = AssociationList([self])
+            else:
+                self._InitialReactiveCapabilityCurve._InitiallyUsedBySynchronousMachines.add(self)
 
     InitialReactiveCapabilityCurve = property(getInitialReactiveCapabilityCurve, setInitialReactiveCapabilityCurve)
 
@@ -137,13 +139,14 @@ class SynchronousMachine(RegulatingCondEq):
 
     def setGeneratingUnit(self, value):
         if self._GeneratingUnit is not None:
-            filtered = [x for x in self.GeneratingUnit.SynchronousMachines if x != self]
-            self._GeneratingUnit._SynchronousMachines = filtered
+            self._GeneratingUnit._SynchronousMachines.discard(self)
 
         self._GeneratingUnit = value
         if self._GeneratingUnit is not None:
-            if self not in self._GeneratingUnit._SynchronousMachines:
-                self._GeneratingUnit._SynchronousMachines.append(self)
+            if self._GeneratingUnit._SynchronousMachines is EMPTY:
+                self._GeneratingUnit._SynchronousMachines = AssociationList([self])
+            else:
+                self._GeneratingUnit._SynchronousMachines.add(self)
 
     GeneratingUnit = property(getGeneratingUnit, setGeneratingUnit)
 
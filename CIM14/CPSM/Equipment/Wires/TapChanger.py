@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CPSM.Equipment.Core.PowerSystemResource import PowerSystemResource
+from CIM14.CPSM.Equipment.Element import AssociationList, EMPTY
 
 class TapChanger(PowerSystemResource):
     """Mechanism for changing transformer winding tap positions.
@@ -63,8 +64,9 @@ class TapChanger(PowerSystemResource):
         #: Highest possible tap step position, advance from neutral
         self.highStep = highStep
 
-        self._TapSchedules = []
-        self.TapSchedules = [] if TapSchedules is None else TapSchedules
+        self._TapSchedules = EMPTY
+        if TapSchedules is not None:
+            self.TapSchedules = TapSchedules
 
         self._ImpedanceVariationCurve = None
         self.ImpedanceVariationCurve = ImpedanceVariationCurve
@@ -87,6 +89,7 @@ class TapChanger(PowerSystemResource):
         return self._TapSchedules
 
     def setTapSchedules(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._TapSchedules:
             x.TapChanger = None
         for y in value:
@@ -125,13 +128,14 @@ class TapChanger(PowerSystemResource):
 
     def setRegulatingControl(self, value):
         if self._RegulatingControl is not None:
-            filtered = [x for x in self.RegulatingControl.TapChanger if x != self]
-            self._RegulatingControl._TapChanger = filtered
+            self._RegulatingControl._TapChanger.discard(self)
 
         self._RegulatingControl = value
         if self._RegulatingControl is not None:
-            if self not in self._RegulatingControl._TapChanger:
-                self._RegulatingControl._TapChanger.append(self)
+            if self._RegulatingControl._TapChanger is EMPTY:
+                self._RegulatingControl._TapChanger = AssociationList([self])
+            else:
+                self._RegulatingControl._TapChanger.add(self)
 
     RegulatingControl = property(getRegulatingControl, setRegulatingControl)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CPSM.Equipment.Core.ConductingEquipment import ConductingEquipment
+from CIM14.CPSM.Equipment.Element import AssociationList, EMPTY
 
 class TransformerWinding(ConductingEquipment):
     """A winding is associated with each defined terminal of a transformer (or phase shifter).-  [R5.4], [R5.6], and [R5.10] are satisfied by navigation to ConnectivityNode and Substation -  Each TransformerWinging must be contained by a PowerTransformer.  Because a TransformerWinding (or any other object) can not be contained by more than one parent, a TransformerWinding can not have an association to an EquipmentContainer (Substation, VoltageLevel, etc). -  The attributes ratedS, b0, g0, r0, x0, rground, xground, and connectionType are not required. 
@@ -140,13 +141,14 @@ class TransformerWinding(ConductingEquipment):
 
     def setPowerTransformer(self, value):
         if self._PowerTransformer is not None:
-            filtered = [x for x in self.PowerTransformer.TransformerWindings if x != self]
-            self._PowerTransformer._TransformerWindings = filtered
+            self._PowerTransformer._TransformerWindings.discard(self)
 
         self._PowerTransformer = value
         if self._PowerTransformer is not None:
-            if self not in self._PowerTransformer._TransformerWindings:
-                self._PowerTransformer._TransformerWindings.append(self)
+            if self._PowerTransformer._TransformerWindings is EMPTY:
+                self._PowerTransformer._TransformerWindings = AssociationList([self])
+            else:
+                self._PowerTransformer._TransformerWindings.add(self)
 
     PowerTransformer = property(getPowerTransformer, setPowerTransformer)
 
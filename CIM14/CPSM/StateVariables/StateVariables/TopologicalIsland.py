@@ -18,7 +18,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from CIM14.CPSM.StateVariables.Element import Element
+from CIM14.CPSM.StateVariables.Element import Element, AssociationList, EMPTY
 
 class TopologicalIsland(Element):
     """An electrically connected subset of the network. Topological islands can change as the current network state changes (i.e. switch or Terminal.connected status changes).
@@ -33,8 +33,9 @@ class TopologicalIsland(Element):
         self._AngleRef_TopologicalNode = None
         self.AngleRef_TopologicalNode = AngleRef_TopologicalNode
 
-        self._TopologicalNodes = []
-        self.TopologicalNodes = [] if TopologicalNodes is None else TopologicalNodes
+        self._TopologicalNodes = EMPTY
+        if TopologicalNodes is not None:
+            self.TopologicalNodes = TopologicalNodes
 
         super(TopologicalIsland, self).__init__(*args, **kw_args)
 
@@ -67,6 +68,7 @@ class TopologicalIsland(Element):
         return self._TopologicalNodes
 
     def setTopologicalNodes(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._TopologicalNodes:
             x.TopologicalIsland = None
         for y in value:
@@ -18,7 +18,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from CIM14.CPSM.StateVariables.Element import Element
+from CIM14.CPSM.StateVariables.Element import Element, AssociationList, EMPTY
 
 class TopologicalNode(Element):
     """For a detailed substation model a TopologicalNode is a set of connectivity nodes that, in the current network state, are connected together through any type of closed switches, including  jumpers. Topological nodes changes as the current network state changes (i.e., switches, breakers, etc. change state). For a planning model switch statuses are not used to form TopologicalNodes. Instead they are manually created or deleted in a model builder tool. TopologialNodes maintained this way are also called 'busses'.
@@ -64,13 +64,14 @@ class TopologicalNode(Element):
 
     def setTopologicalIsland(self, value):
         if self._TopologicalIsland is not None:
-            filtered = [x for x in self.TopologicalIsland.TopologicalNodes if x != self]
-            self._TopologicalIsland._TopologicalNodes = filtered
+            self._TopologicalIsland._TopologicalNodes.discard(self)
 
         self._TopologicalIsland = value
         if self._TopologicalIsland is not None:
-            if self not in self._TopologicalIsland._TopologicalNodes:
-                self._TopologicalIsland._TopologicalNodes.append(self)
+            if self._TopologicalIsland._TopologicalNodes is EMPTY:
+                self._TopologicalIsland._TopologicalNodes = AssociationList([self])
+            else:
+                self._TopologicalIsland._TopologicalNodes.add(self)
 
     TopologicalIsland = property(getTopologicalIsland, setTopologicalIsland)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CPSM.Topology.Core.IdentifiedObject import IdentifiedObject
+from CIM14.CPSM.Topology.Element import AssociationList, EMPTY
 
 class BaseVoltage(IdentifiedObject):
     """Defines a nominal base voltage which is referenced in the system.
@@ -29,8 +30,9 @@ class BaseVoltage(IdentifiedObject):
 
         @param TopologicalNode: The topological nodes at the base voltage.
         """
-        self._TopologicalNode = []
-        self.TopologicalNode = [] if TopologicalNode is None else TopologicalNode
+        self._TopologicalNode = EMPTY
+        if TopologicalNode is not None:
+            self.TopologicalNode = TopologicalNode
 
         super(BaseVoltage, self).__init__(*args, **kw_args)
 
@@ -47,6 +49,7 @@ class BaseVoltage(IdentifiedObject):
         return self._TopologicalNode
 
     def setTopologicalNode(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._TopologicalNode:
             x.BaseVoltage = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CPSM.Topology.Core.IdentifiedObject import IdentifiedObject
+from CIM14.CPSM.Topology.Element import AssociationList, EMPTY
 
 class ConnectivityNode(IdentifiedObject):
     """Connectivity nodes are points where terminals of conducting equipment are connected together with zero impedance.
@@ -48,13 +49,14 @@ class ConnectivityNode(IdentifiedObject):
 
     def setTopologicalNode(self, value):
         if self._TopologicalNode is not None:
-            filtered = [x for x in self.TopologicalNode.ConnectivityNodes if x != self]
-            self._TopologicalNode._ConnectivityNodes = filtered
+            self._TopologicalNode._ConnectivityNodes.discard(self)
 
         self._TopologicalNode = value
         if self._TopologicalNode is not None:
-            if self not in self._TopologicalNode._ConnectivityNodes:
-                self._TopologicalNode._ConnectivityNodes.append(self)
+            if self._TopologicalNode._ConnectivityNodes is EMPTY:
+                self._TopologicalNode._ConnectivityNodes = AssociationList([self])
+            else:
+                self._TopologicalNode._ConnectivityNodes.add(self)
 
     TopologicalNode = property(getTopologicalNode, setTopologicalNode)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CPSM.Topology.Core.IdentifiedObject import IdentifiedObject
+from CIM14.CPSM.Topology.Element import AssociationList, EMPTY
 
 class TopologicalNode(IdentifiedObject):
     """For a detailed substation model a TopologicalNode is a set of connectivity nodes that, in the current network state, are connected together through any type of closed switches, including  jumpers. Topological nodes changes as the current network state changes (i.e., switches, breakers, etc. change state). For a planning model switch statuses are not used to form TopologicalNodes. Instead they are manually created or deleted in a model builder tool. TopologialNodes maintained this way are also called 'busses'.
@@ -31,14 +32,16 @@ class TopologicalNode(IdentifiedObject):
         @param BaseVoltage: The base voltage of the topologocial node.
         @param Terminal: The terminals associated with the topological node.   This can be used as an alternative to the connectivity node path to terminal, thus making it unneccesary to model connedtivity nodes in some cases.   Note that the if connectivity nodes are in the model, this association would proably not be used.
         """
-        self._ConnectivityNodes = []
-        self.ConnectivityNodes = [] if ConnectivityNodes is None else ConnectivityNodes
+        self._ConnectivityNodes = EMPTY
+        if ConnectivityNodes is not None:
+            self.ConnectivityNodes = ConnectivityNodes
 
         self._BaseVoltage = None
         self.BaseVoltage = BaseVoltage
 
-        self._Terminal = []
-        self.Terminal = [] if Terminal is None else Terminal
+        self._Terminal = EMPTY
+        if Terminal is not None:
+            self.Terminal = Terminal
 
         super(TopologicalNode, self).__init__(*args, **kw_args)
 
@@ -55,6 +58,7 @@ class TopologicalNode(IdentifiedObject):
         return self._ConnectivityNodes
 
     def setConnectivityNodes(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ConnectivityNodes:
             x.TopologicalNode = None
         for y in value:
@@ -78,13 +82,14 @@ class TopologicalNode(IdentifiedObject):
 
     def setBaseVoltage(self, value):
         if self._BaseVoltage is not None:
-            filtered = [x for x in self.BaseVoltage.TopologicalNode if x != self]
-            self._BaseVoltage._TopologicalNode = filtered
+            self._BaseVoltage._TopologicalNode.discard(self)
 
         self._BaseVoltage = value
         if self._BaseVoltage is not None:
-            if self not in self._BaseVoltage._TopologicalNode:
-                self._BaseVoltage._TopologicalNode.append(self)
+            if self._BaseVoltage._TopologicalNode is EMPTY:
+                self._BaseVoltage._TopologicalNode = AssociationList([self])
+            else:
+                self._BaseVoltage._TopologicalNode.add(self)
 
     BaseVoltage = property(getBaseVoltage, setBaseVoltage)
 
@@ -94,6 +99,7 @@ class TopologicalNode(IdentifiedObject):
         return self._Terminal
 
     def setTerminal(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Terminal:
             x.TopologicalNode = None
         for y in value:
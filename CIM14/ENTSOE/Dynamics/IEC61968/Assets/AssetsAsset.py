@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreIdentifiedObject import CoreIdentifiedObject
+from CIM14.ENTSOE.Dynamics.Element import AssociationList, EMPTY
 
 class AssetsAsset(CoreIdentifiedObject):
 
@@ -27,8 +28,9 @@ class AssetsAsset(CoreIdentifiedObject):
 
         @param PowerSystemResources: 
         """
-        self._PowerSystemResources = []
-        self.PowerSystemResources = [] if PowerSystemResources is None else PowerSystemResources
+        self._PowerSystemResources = EMPTY
+        if PowerSystemResources is not None:
+            self.PowerSystemResources = PowerSystemResources
 
         super(AssetsAsset, self).__init__(*args, **kw_args)
 
@@ -45,21 +47,28 @@ class AssetsAsset(CoreIdentifiedObject):
         return self._PowerSystemResources
 
     def setPowerSystemResources(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._PowerSystemResources:
-            filtered = [q for q in p.Assets if q != self]
-            self._PowerSystemResources._Assets = filtered
+            p._Assets.discard(self)
         for r in value:
-            if self not in r._Assets:
-                r._Assets.append(self)
+            if r._Assets is EMPTY:
+                r._Assets = AssociationList([self])
+            else:
+                r._Assets.add(self)
         self._PowerSystemResources = value
 
     PowerSystemResources = property(getPowerSystemResources, setPowerSystemResources)
 
     def addPowerSystemResources(self, *PowerSystemResources):
         for obj in PowerSystemResources:
-            if self not in obj._Assets:
-                obj._Assets.append(self)
-            self._PowerSystemResources.append(obj)
+            if obj._Assets is EMPTY:
+                obj._Assets = AssociationList([self])
+            else:
+                obj._Assets.add(self)
+            if self._PowerSystemResources is EMPTY:
+                self._PowerSystemResources = AssociationList([obj])
+            else:
+                self._PowerSystemResources.add(obj)
 
     def removePowerSystemResources(self, *PowerSystemResources):
         for obj in PowerSystemResources:
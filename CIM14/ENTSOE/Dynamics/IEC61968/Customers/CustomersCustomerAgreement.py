@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreIdentifiedObject import CoreIdentifiedObject
+from CIM14.ENTSOE.Dynamics.Element import AssociationList, EMPTY
 
 class CustomersCustomerAgreement(CoreIdentifiedObject):
 
@@ -27,8 +28,9 @@ class CustomersCustomerAgreement(CoreIdentifiedObject):
 
         @param Equipments: 
         """
-        self._Equipments = []
-        self.Equipments = [] if Equipments is None else Equipments
+        self._Equipments = EMPTY
+        if Equipments is not None:
+            self.Equipments = Equipments
 
         super(CustomersCustomerAgreement, self).__init__(*args, **kw_args)
 
@@ -45,21 +47,28 @@ class CustomersCustomerAgreement(CoreIdentifiedObject):
         return self._Equipments
 
     def setEquipments(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Equipments:
-            filtered = [q for q in p.CustomerAgreements if q != self]
-            self._Equipments._CustomerAgreements = filtered
+            p._CustomerAgreements.discard(self)
         for r in value:
-            if self not in r._CustomerAgreements:
-                r._CustomerAgreements.append(self)
+            if r._CustomerAgreements is EMPTY:
+                r._CustomerAgreements = AssociationList([self])
+            else:
+                r._CustomerAgreements.add(self)
         self._Equipments = value
 
     Equipments = property(getEquipments, setEquipments)
 
     def addEquipments(self, *Equipments):
         for obj in Equipments:
-            if self not in obj._CustomerAgreements:
-                obj._CustomerAgreements.append(self)
-            self._Equipments.append(obj)
+            if obj._CustomerAgreements is EMPTY:
+                obj._CustomerAgreements = AssociationList([self])
+            else:
+                obj._CustomerAgreements.add(self)
+            if self._Equipments is EMPTY:
+                self._Equipments = AssociationList([obj])
+            else:
+                self._Equipments.add(obj)
 
     def removeEquipments(self, *Equipments):
         for obj in Equipments:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreIdentifiedObject import CoreIdentifiedObject
+from CIM14.ENTSOE.Dynamics.Element import AssociationList, EMPTY
 
 class ContingencyContingencyEquipment(CoreIdentifiedObject):
 
@@ -46,13 +47,14 @@ class ContingencyContingencyEquipment(CoreIdentifiedObject):
 
     def setEquipment(self, value):
         if self._Equipment is not None:
-            filtered = [x for x in self.Equipment.ContingencyEquipment if x != self]
-            self._Equipment._ContingencyEquipment = filtered
+            self._Equipment._ContingencyEquipment.discard(self)
 
         self._Equipment = value
         if self._Equipment is not None:
-            if self not in self._Equipment._ContingencyEquipment:
-                self._Equipment._ContingencyEquipment.append(self)
+            if self._Equipment._ContingencyEquipment is EMPTY:
+                self._Equipment._ContingencyEquipment = AssociationList([self])
+            else:
+                self._Equipment._ContingencyEquipment.add(self)
 
     Equipment = property(getEquipment, setEquipment)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreIdentifiedObject import CoreIdentifiedObject
+from CIM14.ENTSOE.Dynamics.Element import AssociationList, EMPTY
 
 class CoreBaseVoltage(CoreIdentifiedObject):
 
@@ -27,8 +28,9 @@ class CoreBaseVoltage(CoreIdentifiedObject):
 
         @param ConductingEquipment: 
         """
-        self._ConductingEquipment = []
-        self.ConductingEquipment = [] if ConductingEquipment is None else ConductingEquipment
+        self._ConductingEquipment = EMPTY
+        if ConductingEquipment is not None:
+            self.ConductingEquipment = ConductingEquipment
 
         super(CoreBaseVoltage, self).__init__(*args, **kw_args)
 
@@ -45,6 +47,7 @@ class CoreBaseVoltage(CoreIdentifiedObject):
         return self._ConductingEquipment
 
     def setConductingEquipment(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ConductingEquipment:
             x.BaseVoltage = None
         for y in value:
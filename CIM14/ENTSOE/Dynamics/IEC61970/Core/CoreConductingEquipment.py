@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreEquipment import CoreEquipment
+from CIM14.ENTSOE.Dynamics.Element import AssociationList, EMPTY
 
 class CoreConductingEquipment(CoreEquipment):
 
@@ -38,14 +39,17 @@ class CoreConductingEquipment(CoreEquipment):
         self._SvStatus = None
         self.SvStatus = SvStatus
 
-        self._ClearanceTags = []
-        self.ClearanceTags = [] if ClearanceTags is None else ClearanceTags
+        self._ClearanceTags = EMPTY
+        if ClearanceTags is not None:
+            self.ClearanceTags = ClearanceTags
 
-        self._Terminals = []
-        self.Terminals = [] if Terminals is None else Terminals
+        self._Terminals = EMPTY
+        if Terminals is not None:
+            self.Terminals = Terminals
 
-        self._ProtectionEquipments = []
-        self.ProtectionEquipments = [] if ProtectionEquipments is None else ProtectionEquipments
+        self._ProtectionEquipments = EMPTY
+        if ProtectionEquipments is not None:
+            self.ProtectionEquipments = ProtectionEquipments
 
         self._BaseVoltage = None
         self.BaseVoltage = BaseVoltage
@@ -79,6 +83,7 @@ class CoreConductingEquipment(CoreEquipment):
         return self._ClearanceTags
 
     def setClearanceTags(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ClearanceTags:
             x.ConductingEquipment = None
         for y in value:
@@ -100,6 +105,7 @@ class CoreConductingEquipment(CoreEquipment):
         return self._Terminals
 
     def setTerminals(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Terminals:
             x.ConductingEquipment = None
         for y in value:
@@ -121,21 +127,28 @@ class CoreConductingEquipment(CoreEquipment):
         return self._ProtectionEquipments
 
     def setProtectionEquipments(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ProtectionEquipments:
-            filtered = [q for q in p.ConductingEquipments if q != self]
-            self._ProtectionEquipments._ConductingEquipments = filtered
+            p._ConductingEquipments.discard(self)
         for r in value:
-            if self not in r._ConductingEquipments:
-                r._ConductingEquipments.append(self)
+            if r._ConductingEquipments is EMPTY:
+                r._ConductingEquipments = AssociationList([self])
+            else:
+                r._ConductingEquipments.add(self)
         self._ProtectionEquipments = value
 
     ProtectionEquipments = property(getProtectionEquipments, setProtectionEquipments)
 
     def addProtectionEquipments(self, *ProtectionEquipments):
         for obj in ProtectionEquipments:
-            if self not in obj._ConductingEquipments:
-                obj._ConductingEquipments.append(self)
-            self._ProtectionEquipments.append(obj)
+            if obj._ConductingEquipments is EMPTY:
+                obj._ConductingEquipments = AssociationList([self])
+            else:
+                obj._ConductingEquipments.add(self)
+            if self._ProtectionEquipments is EMPTY:
+                self._ProtectionEquipments = AssociationList([obj])
+            else:
+                self._ProtectionEquipments.add(obj)
 
     def removeProtectionEquipments(self, *ProtectionEquipments):
         for obj in ProtectionEquipments:
@@ -149,13 +162,14 @@ class CoreConductingEquipment(CoreEquipment):
 
     def setBaseVoltage(self, value):
         if self._BaseVoltage is not None:
-            filtered = [x for x in self.BaseVoltage.ConductingEquipment if x != self]
-            self._BaseVoltage._ConductingEquipment = filtered
+            self._BaseVoltage._ConductingEquipment.discard(self)
 
         self._BaseVoltage = value
         if self._BaseVoltage is not None:
-            if self not in self._BaseVoltage._ConductingEquipment:
-                self._BaseVoltage._ConductingEquipment.append(self)
+            if self._BaseVoltage._ConductingEquipment is EMPTY:
+                self._BaseVoltage._ConductingEquipment = AssociationList([self])
+            else:
+                self._BaseVoltage._ConductingEquipment.add(self)
 
     BaseVoltage = property(getBaseVoltage, setBaseVoltage)
 
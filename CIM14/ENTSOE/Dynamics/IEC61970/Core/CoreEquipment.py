@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CorePowerSystemResource import CorePowerSystemResource
+from CIM14.ENTSOE.Dynamics.Element import AssociationList, EMPTY
 
 class CoreEquipment(CorePowerSystemResource):
 
@@ -38,17 +39,20 @@ class CoreEquipment(CorePowerSystemResource):
 
         self.aggregate = aggregate
 
-        self._ContingencyEquipment = []
-        self.ContingencyEquipment = [] if ContingencyEquipment is None else ContingencyEquipment
+        self._ContingencyEquipment = EMPTY
+        if ContingencyEquipment is not None:
+            self.ContingencyEquipment = ContingencyEquipment
 
         self._EquipmentContainer = None
         self.EquipmentContainer = EquipmentContainer
 
-        self._CustomerAgreements = []
-        self.CustomerAgreements = [] if CustomerAgreements is None else CustomerAgreements
+        self._CustomerAgreements = EMPTY
+        if CustomerAgreements is not None:
+            self.CustomerAgreements = CustomerAgreements
 
-        self._OperationalLimitSet = []
-        self.OperationalLimitSet = [] if OperationalLimitSet is None else OperationalLimitSet
+        self._OperationalLimitSet = EMPTY
+        if OperationalLimitSet is not None:
+            self.OperationalLimitSet = OperationalLimitSet
 
         super(CoreEquipment, self).__init__(*args, **kw_args)
 
@@ -64,6 +68,7 @@ class CoreEquipment(CorePowerSystemResource):
         return self._ContingencyEquipment
 
     def setContingencyEquipment(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ContingencyEquipment:
             x.Equipment = None
         for y in value:
@@ -86,13 +91,14 @@ class CoreEquipment(CorePowerSystemResource):
 
     def setEquipmentContainer(self, value):
         if self._EquipmentContainer is not None:
-            filtered = [x for x in self.EquipmentContainer.Equipments if x != self]
-            self._EquipmentContainer._Equipments = filtered
+            self._EquipmentContainer._Equipments.discard(self)
 
         self._EquipmentContainer = value
         if self._EquipmentContainer is not None:
-            if self not in self._EquipmentContainer._Equipments:
-                self._EquipmentContainer._Equipments.append(self)
+            if self._EquipmentContainer._Equipments is EMPTY:
+                self._EquipmentContainer._Equipments = AssociationList([self])
+            else:
+                self._EquipmentContainer._Equipments.add(self)
 
     EquipmentContainer = property(getEquipmentContainer, setEquipmentContainer)
 
@@ -101,21 +107,28 @@ class CoreEquipment(CorePowerSystemResource):
         return self._CustomerAgreements
 
     def setCustomerAgreements(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._CustomerAgreements:
-            filtered = [q for q in p.Equipments if q != self]
-            self._CustomerAgreements._Equipments = filtered
+            p._Equipments.discard(self)
         for r in value:
-            if self not in r._Equipments:
-                r._Equipments.append(self)
+            if r._Equipments is EMPTY:
+                r._Equipments = AssociationList([self])
+            else:
+                r._Equipments.add(self)
         self._CustomerAgreements = value
 
     CustomerAgreements = property(getCustomerAgreements, setCustomerAgreements)
 
     def addCustomerAgreements(self, *CustomerAgreements):
         for obj in CustomerAgreements:
-            if self not in obj._Equipments:
-                obj._Equipments.append(self)
-            self._CustomerAgreements.append(obj)
+            if obj._Equipments is EMPTY:
+                obj._Equipments = AssociationList([self])
+            else:
+                obj._Equipments.add(self)
+            if self._CustomerAgreements is EMPTY:
+                self._CustomerAgreements = AssociationList([obj])
+            else:
+                self._CustomerAgreements.add(obj)
 
     def removeCustomerAgreements(self, *CustomerAgreements):
         for obj in CustomerAgreements:
@@ -128,6 +141,7 @@ class CoreEquipment(CorePowerSystemResource):
         return self._OperationalLimitSet
 
     def setOperationalLimitSet(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._OperationalLimitSet:
             x.Equipment = None
         for y in value:
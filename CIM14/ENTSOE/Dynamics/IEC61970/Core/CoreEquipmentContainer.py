@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CorePowerSystemResource import CorePowerSystemResource
+from CIM14.ENTSOE.Dynamics.Element import AssociationList, EMPTY
 
 class CoreEquipmentContainer(CorePowerSystemResource):
 
@@ -27,8 +28,9 @@ class CoreEquipmentContainer(CorePowerSystemResource):
 
         @param Equipments: 
         """
-        self._Equipments = []
-        self.Equipments = [] if Equipments is None else Equipments
+        self._Equipments = EMPTY
+        if Equipments is not None:
+            self.Equipments = Equipments
 
         super(CoreEquipmentContainer, self).__init__(*args, **kw_args)
 
@@ -45,6 +47,7 @@ class CoreEquipmentContainer(CorePowerSystemResource):
         return self._Equipments
 
     def setEquipments(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Equipments:
             x.EquipmentContainer = None
         for y in value:
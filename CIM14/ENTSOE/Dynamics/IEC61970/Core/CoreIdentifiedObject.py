@@ -18,7 +18,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from CIM14.ENTSOE.Dynamics.Element import Element
+from CIM14.ENTSOE.Dynamics.Element import Element, AssociationList, EMPTY
 
 class CoreIdentifiedObject(Element):
 
@@ -69,13 +69,14 @@ class CoreIdentifiedObject(Element):
 
     def setModelingAuthoritySet(self, value):
         if self._ModelingAuthoritySet is not None:
-            filtered = [x for x in self.ModelingAuthoritySet.IdentifiedObjects if x != self]
-            self._ModelingAuthoritySet._IdentifiedObjects = filtered
+            self._ModelingAuthoritySet._IdentifiedObjects.discard(self)
 
         self._ModelingAuthoritySet = value
         if self._ModelingAuthoritySet is not None:
-            if self not in self._ModelingAuthoritySet._IdentifiedObjects:
-                self._ModelingAuthoritySet._IdentifiedObjects.append(self)
+            if self._ModelingAuthoritySet._IdentifiedObjects is EMPTY:
+                self._ModelingAuthoritySet._IdentifiedObjects = AssociationList([self])
+            else:
+                self._ModelingAuthoritySet._IdentifiedObjects.add(self)
 
     ModelingAuthoritySet = property(getModelingAuthoritySet, setModelingAuthoritySet)
 
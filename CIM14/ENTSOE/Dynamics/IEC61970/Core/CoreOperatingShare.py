@@ -18,7 +18,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from CIM14.ENTSOE.Dynamics.Element import Element
+from CIM14.ENTSOE.Dynamics.Element import Element, AssociationList, EMPTY
 
 class CoreOperatingShare(Element):
 
@@ -46,13 +46,14 @@ class CoreOperatingShare(Element):
 
     def setPowerSystemResource(self, value):
         if self._PowerSystemResource is not None:
-            filtered = [x for x in self.PowerSystemResource.OperatingShare if x != self]
-            self._PowerSystemResource._OperatingShare = filtered
+            self._PowerSystemResource._OperatingShare.discard(self)
 
         self._PowerSystemResource = value
         if self._PowerSystemResource is not None:
-            if self not in self._PowerSystemResource._OperatingShare:
-                self._PowerSystemResource._OperatingShare.append(self)
+            if self._PowerSystemResource._OperatingShare is EMPTY:
+                self._PowerSystemResource._OperatingShare = AssociationList([self])
+            else:
+                self._PowerSystemResource._OperatingShare.add(self)
 
     PowerSystemResource = property(getPowerSystemResource, setPowerSystemResource)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreIdentifiedObject import CoreIdentifiedObject
+from CIM14.ENTSOE.Dynamics.Element import AssociationList, EMPTY
 
 class CorePsrList(CoreIdentifiedObject):
 
@@ -27,8 +28,9 @@ class CorePsrList(CoreIdentifiedObject):
 
         @param PowerSystemResources: 
         """
-        self._PowerSystemResources = []
-        self.PowerSystemResources = [] if PowerSystemResources is None else PowerSystemResources
+        self._PowerSystemResources = EMPTY
+        if PowerSystemResources is not None:
+            self.PowerSystemResources = PowerSystemResources
 
         super(CorePsrList, self).__init__(*args, **kw_args)
 
@@ -45,21 +47,28 @@ class CorePsrList(CoreIdentifiedObject):
         return self._PowerSystemResources
 
     def setPowerSystemResources(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._PowerSystemResources:
-            filtered = [q for q in p.PsrLists if q != self]
-            self._PowerSystemResources._PsrLists = filtered
+            p._PsrLists.discard(self)
         for r in value:
-            if self not in r._PsrLists:
-                r._PsrLists.append(self)
+            if r._PsrLists is EMPTY:
+                r._PsrLists = AssociationList([self])
+            else:
+                r._PsrLists.add(self)
         self._PowerSystemResources = value
 
     PowerSystemResources = property(getPowerSystemResources, setPowerSystemResources)
 
     def addPowerSystemResources(self, *PowerSystemResources):
         for obj in PowerSystemResources:
-            if self not in obj._PsrLists:
-                obj._PsrLists.append(self)
-            self._PowerSystemResources.append(obj)
+            if obj._PsrLists is EMPTY:
+                obj._PsrLists = AssociationList([self])
+            else:
+                obj._PsrLists.add(self)
+            if self._PowerSystemResources is EMPTY:
+                self._PowerSystemResources = AssociationList([obj])
+            else:
+                self._PowerSystemResources.add(obj)
 
     def removePowerSystemResources(self, *PowerSystemResources):
         for obj in PowerSystemResources:
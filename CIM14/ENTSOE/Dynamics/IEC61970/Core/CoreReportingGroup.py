@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreIdentifiedObject import CoreIdentifiedObject
+from CIM14.ENTSOE.Dynamics.Element import AssociationList, EMPTY
 
 class CoreReportingGroup(CoreIdentifiedObject):
 
@@ -27,8 +28,9 @@ class CoreReportingGroup(CoreIdentifiedObject):
 
         @param PowerSystemResource: 
         """
-        self._PowerSystemResource = []
-        self.PowerSystemResource = [] if PowerSystemResource is None else PowerSystemResource
+        self._PowerSystemResource = EMPTY
+        if PowerSystemResource is not None:
+            self.PowerSystemResource = PowerSystemResource
 
         super(CoreReportingGroup, self).__init__(*args, **kw_args)
 
@@ -45,21 +47,28 @@ class CoreReportingGroup(CoreIdentifiedObject):
         return self._PowerSystemResource
 
     def setPowerSystemResource(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._PowerSystemResource:
-            filtered = [q for q in p.ReportingGroup if q != self]
-            self._PowerSystemResource._ReportingGroup = filtered
+            p._ReportingGroup.discard(self)
         for r in value:
-            if self not in r._ReportingGroup:
-                r._ReportingGroup.append(self)
+            if r._ReportingGroup is EMPTY:
+                r._ReportingGroup = AssociationList([self])
+            else:
+                r._ReportingGroup.add(self)
         self._PowerSystemResource = value
 
     PowerSystemResource = property(getPowerSystemResource, setPowerSystemResource)
 
     def addPowerSystemResource(self, *PowerSystemResource):
         for obj in PowerSystemResource:
-            if self not in obj._ReportingGroup:
-                obj._ReportingGroup.append(self)
-            self._PowerSystemResource.append(obj)
+            if obj._ReportingGroup is EMPTY:
+                obj._ReportingGroup = AssociationList([self])
+            else:
+                obj._ReportingGroup.add(self)
+            if self._PowerSystemResource is EMPTY:
+                self._PowerSystemResource = AssociationList([obj])
+            else:
+                self._PowerSystemResource.add(obj)
 
     def removePowerSystemResource(self, *PowerSystemResource):
         for obj in PowerSystemResource:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreIdentifiedObject import CoreIdentifiedObject
+from CIM14.ENTSOE.Dynamics.Element import AssociationList, EMPTY
 
 class CoreTerminal(CoreIdentifiedObject):
 
@@ -46,13 +47,14 @@ class CoreTerminal(CoreIdentifiedObject):
 
     def setConductingEquipment(self, value):
         if self._ConductingEquipment is not None:
-            filtered = [x for x in self.ConductingEquipment.Terminals if x != self]
-            self._ConductingEquipment._Terminals = filtered
+            self._ConductingEquipment._Terminals.discard(self)
 
         self._ConductingEquipment = value
         if self._ConductingEquipment is not None:
-            if self not in self._ConductingEquipment._Terminals:
-                self._ConductingEquipment._Terminals.append(self)
+            if self._ConductingEquipment._Terminals is EMPTY:
+                self._ConductingEquipment._Terminals = AssociationList([self])
+            else:
+                self._ConductingEquipment._Terminals.add(self)
 
     ConductingEquipment = property(getConductingEquipment, setConductingEquipment)
 
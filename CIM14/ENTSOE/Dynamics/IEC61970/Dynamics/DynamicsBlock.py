@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CorePowerSystemResource import CorePowerSystemResource
+from CIM14.ENTSOE.Dynamics.Element import AssociationList, EMPTY
 
 class DynamicsBlock(CorePowerSystemResource):
 
@@ -39,14 +40,16 @@ class DynamicsBlock(CorePowerSystemResource):
 
         self.positiveFlowIn = positiveFlowIn
 
-        self._BlockParameter = []
-        self.BlockParameter = [] if BlockParameter is None else BlockParameter
+        self._BlockParameter = EMPTY
+        if BlockParameter is not None:
+            self.BlockParameter = BlockParameter
 
         self._PowerSystemResource = None
         self.PowerSystemResource = PowerSystemResource
 
-        self._BlockConnection = []
-        self.BlockConnection = [] if BlockConnection is None else BlockConnection
+        self._BlockConnection = EMPTY
+        if BlockConnection is not None:
+            self.BlockConnection = BlockConnection
 
         self._MemberOf_BlockConnectivity = None
         self.MemberOf_BlockConnectivity = MemberOf_BlockConnectivity
@@ -69,6 +72,7 @@ class DynamicsBlock(CorePowerSystemResource):
         return self._BlockParameter
 
     def setBlockParameter(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._BlockParameter:
             x.MemberOf_Block = None
         for y in value:
@@ -91,13 +95,14 @@ class DynamicsBlock(CorePowerSystemResource):
 
     def setPowerSystemResource(self, value):
         if self._PowerSystemResource is not None:
-            filtered = [x for x in self.PowerSystemResource.Block if x != self]
-            self._PowerSystemResource._Block = filtered
+            self._PowerSystemResource._Block.discard(self)
 
         self._PowerSystemResource = value
         if self._PowerSystemResource is not None:
-            if self not in self._PowerSystemResource._Block:
-                self._PowerSystemResource._Block.append(self)
+            if self._PowerSystemResource._Block is EMPTY:
+                self._PowerSystemResource._Block = AssociationList([self])
+            else:
+                self._PowerSystemResource._Block.add(self)
 
     PowerSystemResource = property(getPowerSystemResource, setPowerSystemResource)
 
@@ -107,6 +112,7 @@ class DynamicsBlock(CorePowerSystemResource):
         return self._BlockConnection
 
     def setBlockConnection(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._BlockConnection:
             x.Block = None
         for y in value:
@@ -129,13 +135,14 @@ class DynamicsBlock(CorePowerSystemResource):
 
     def setMemberOf_BlockConnectivity(self, value):
         if self._MemberOf_BlockConnectivity is not None:
-            filtered = [x for x in self.MemberOf_BlockConnectivity.Block if x != self]
-            self._MemberOf_BlockConnectivity._Block = filtered
+            self._MemberOf_BlockConnectivity._Block.discard(self)
 
         self._MemberOf_BlockConnectivity = value
         if self._MemberOf_BlockConnectivity is not None:
-            if self not in self._MemberOf_BlockConnectivity._Block:
-                self._MemberOf_BlockConnectivity._Block.append(self)
+            if self._MemberOf_BlockConnectivity._Block is EMPTY:
+                self._MemberOf_BlockConnectivity._Block = AssociationList([self])
+            else:
+                self._MemberOf_BlockConnectivity._Block.add(self)
 
     MemberOf_BlockConnectivity = property(getMemberOf_BlockConnectivity, setMemberOf_BlockConnectivity)
 
@@ -145,13 +152,14 @@ class DynamicsBlock(CorePowerSystemResource):
 
     def setMetaBlock(self, value):
         if self._MetaBlock is not None:
-            filtered = [x for x in self.MetaBlock.Block if x != self]
-            self._MetaBlock._Block = filtered
+            self._MetaBlock._Block.discard(self)
 
         self._MetaBlock = value
         if self._MetaBlock is not None:
-            if self not in self._MetaBlock._Block:
-                self._MetaBlock._Block.append(self)
+            if self._MetaBlock._Block is EMPTY:
+                self._MetaBlock._Block = AssociationList([self])
+            else:
+                self._MetaBlock._Block.add(self)
 
     MetaBlock = property(getMetaBlock, setMetaBlock)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreIdentifiedObject import CoreIdentifiedObject
+from CIM14.ENTSOE.Dynamics.Element import AssociationList, EMPTY
 
 class DynamicsBlockConnectivity(CoreIdentifiedObject):
 
@@ -29,11 +30,13 @@ class DynamicsBlockConnectivity(CoreIdentifiedObject):
         @param BlockConnection: 
         @param MetaBlockConnectivity:
         """
-        self._Block = []
-        self.Block = [] if Block is None else Block
+        self._Block = EMPTY
+        if Block is not None:
+            self.Block = Block
 
-        self._BlockConnection = []
-        self.BlockConnection = [] if BlockConnection is None else BlockConnection
+        self._BlockConnection = EMPTY
+        if BlockConnection is not None:
+            self.BlockConnection = BlockConnection
 
         self._MetaBlockConnectivity = None
         self.MetaBlockConnectivity = MetaBlockConnectivity
@@ -53,6 +56,7 @@ class DynamicsBlockConnectivity(CoreIdentifiedObject):
         return self._Block
 
     def setBlock(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Block:
             x.MemberOf_BlockConnectivity = None
         for y in value:
@@ -75,6 +79,7 @@ class DynamicsBlockConnectivity(CoreIdentifiedObject):
         return self._BlockConnection
 
     def setBlockConnection(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._BlockConnection:
             x.MemberOf_BlockConnectivity = None
         for y in value:
@@ -97,13 +102,14 @@ class DynamicsBlockConnectivity(CoreIdentifiedObject):
 
     def setMetaBlockConnectivity(self, value):
         if self._MetaBlockConnectivity is not None:
-            filtered = [x for x in self.MetaBlockConnectivity.BlockConnectivity if x != self]
-            self._MetaBlockConnectivity._BlockConnectivity = filtered
+            self._MetaBlockConnectivity._BlockConnectivity.discard(self)
 
         self._MetaBlockConnectivity = value
         if self._MetaBlockConnectivity is not None:
-            if self not in self._MetaBlockConnectivity._BlockConnectivity:
-                self._MetaBlockConnectivity._BlockConnectivity.append(self)
+            if self._MetaBlockConnectivity._BlockConnectivity is EMPTY:
+                self._MetaBlockConnectivity._BlockConnectivity = AssociationList([self])
+            else:
+                self._MetaBlockConnectivity._BlockConnectivity.add(self)
 
     MetaBlockConnectivity = property(getMetaBlockConnectivity, setMetaBlockConnectivity)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreIdentifiedObject import CoreIdentifiedObject
+from CIM14.ENTSOE.Dynamics.Element import AssociationList, EMPTY
 
 class DynamicsBlockParameter(CoreIdentifiedObject):
 
@@ -57,13 +58,14 @@ class DynamicsBlockParameter(CoreIdentifiedObject):
 
     def setMetaBlockParameter(self, value):
         if self._MetaBlockParameter is not None:
-            filtered = [x for x in self.MetaBlockParameter.BlockParameter if x != self]
-            self._MetaBlockParameter._BlockParameter = filtered
+            self._MetaBlockParameter._BlockParameter.discard(self)
 
         self._MetaBlockParameter = value
         if self._MetaBlockParameter is not None:
-            if self not in self._MetaBlockParameter._BlockParameter:
-                self._MetaBlockParameter._BlockParameter.append(self)
+            if self._MetaBlockParameter._BlockParameter is EMPTY:
+                self._MetaBlockParameter._BlockParameter = AssociationList([self])
+            else:
+                self._MetaBlockParameter._BlockParameter.add(self)
 
     MetaBlockParameter = property(getMetaBlockParameter, setMetaBlockParameter)
 
@@ -73,13 +75,14 @@ class DynamicsBlockParameter(CoreIdentifiedObject):
 
     def setMemberOf_MetaBlockReference(self, value):
         if self._MemberOf_MetaBlockReference is not None:
-            filtered = [x for x in self.MemberOf_MetaBlockReference.BlockParameter if x != self]
-            self._MemberOf_MetaBlockReference._BlockParameter = filtered
+            self._MemberOf_MetaBlockReference._BlockParameter.discard(self)
 
         self._MemberOf_MetaBlockReference = value
         if self._MemberOf_MetaBlockReference is not None:
-            if self not in self._MemberOf_MetaBlockReference._BlockParameter:
-                self._MemberOf_MetaBlockReference._BlockParameter.append(self)
+            if self._MemberOf_MetaBlockReference._BlockParameter is EMPTY:
+                self._MemberOf_MetaBlockReference._BlockParameter = AssociationList([self])
+            else:
+                self._MemberOf_MetaBlockReference._BlockParameter.add(self)
 
     MemberOf_MetaBlockReference = property(getMemberOf_MetaBlockReference, setMemberOf_MetaBlockReference)
 
@@ -89,13 +92,14 @@ class DynamicsBlockParameter(CoreIdentifiedObject):
 
     def setMemberOf_Block(self, value):
         if self._MemberOf_Block is not None:
-            filtered = [x for x in self.MemberOf_Block.BlockParameter if x != self]
-            self._MemberOf_Block._BlockParameter = filtered
+            self._MemberOf_Block._BlockParameter.discard(self)
 
         self._MemberOf_Block = value
         if self._MemberOf_Block is not None:
-            if self not in self._MemberOf_Block._BlockParameter:
-                self._MemberOf_Block._BlockParameter.append(self)
+            if self._MemberOf_Block._BlockParameter is EMPTY:
+                self._MemberOf_Block._BlockParameter = AssociationList([self])
+            else:
+                self._MemberOf_Block._BlockParameter.add(self)
 
     MemberOf_Block = property(getMemberOf_Block, setMemberOf_Block)
 
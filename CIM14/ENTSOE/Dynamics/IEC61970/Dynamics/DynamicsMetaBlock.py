@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreIdentifiedObject import CoreIdentifiedObject
+from CIM14.ENTSOE.Dynamics.Element import AssociationList, EMPTY
 
 class DynamicsMetaBlock(CoreIdentifiedObject):
 
@@ -41,26 +42,33 @@ class DynamicsMetaBlock(CoreIdentifiedObject):
 
         self.proprietary = proprietary
 
-        self._Block = []
-        self.Block = [] if Block is None else Block
+        self._Block = EMPTY
+        if Block is not None:
+            self.Block = Block
 
-        self._MetaBlockSignal = []
-        self.MetaBlockSignal = [] if MetaBlockSignal is None else MetaBlockSignal
+        self._MetaBlockSignal = EMPTY
+        if MetaBlockSignal is not None:
+            self.MetaBlockSignal = MetaBlockSignal
 
-        self._MetaBlockReference = []
-        self.MetaBlockReference = [] if MetaBlockReference is None else MetaBlockReference
+        self._MetaBlockReference = EMPTY
+        if MetaBlockReference is not None:
+            self.MetaBlockReference = MetaBlockReference
 
-        self._MetaBlockParameter = []
-        self.MetaBlockParameter = [] if MetaBlockParameter is None else MetaBlockParameter
+        self._MetaBlockParameter = EMPTY
+        if MetaBlockParameter is not None:
+            self.MetaBlockParameter = MetaBlockParameter
 
-        self._MetaBlockOutput = []
-        self.MetaBlockOutput = [] if MetaBlockOutput is None else MetaBlockOutput
+        self._MetaBlockOutput = EMPTY
+        if MetaBlockOutput is not None:
+            self.MetaBlockOutput = MetaBlockOutput
 
-        self._MetaBlockInput = []
-        self.MetaBlockInput = [] if MetaBlockInput is None else MetaBlockInput
+        self._MetaBlockInput = EMPTY
+        if MetaBlockInput is not None:
+            self.MetaBlockInput = MetaBlockInput
 
-        self._MetaBlockState = []
-        self.MetaBlockState = [] if MetaBlockState is None else MetaBlockState
+        self._MetaBlockState = EMPTY
+        if MetaBlockState is not None:
+            self.MetaBlockState = MetaBlockState
 
         super(DynamicsMetaBlock, self).__init__(*args, **kw_args)
 
@@ -77,6 +85,7 @@ class DynamicsMetaBlock(CoreIdentifiedObject):
         return self._Block
 
     def setBlock(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Block:
             x.MetaBlock = None
         for y in value:
@@ -99,6 +108,7 @@ class DynamicsMetaBlock(CoreIdentifiedObject):
         return self._MetaBlockSignal
 
     def setMetaBlockSignal(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._MetaBlockSignal:
             x.MemberOf_MetaBlock = None
         for y in value:
@@ -121,6 +131,7 @@ class DynamicsMetaBlock(CoreIdentifiedObject):
         return self._MetaBlockReference
 
     def setMetaBlockReference(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._MetaBlockReference:
             x.MemberOf_MetaBlock = None
         for y in value:
@@ -143,6 +154,7 @@ class DynamicsMetaBlock(CoreIdentifiedObject):
         return self._MetaBlockParameter
 
     def setMetaBlockParameter(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._MetaBlockParameter:
             x.MemberOf_MetaBlock = None
         for y in value:
@@ -165,6 +177,7 @@ class DynamicsMetaBlock(CoreIdentifiedObject):
         return self._MetaBlockOutput
 
     def setMetaBlockOutput(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._MetaBlockOutput:
             x.MemberOf_MetaBlock = None
         for y in value:
@@ -187,6 +200,7 @@ class DynamicsMetaBlock(CoreIdentifiedObject):
         return self._MetaBlockInput
 
     def setMetaBlockInput(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._MetaBlockInput:
             x.MemberOf_MetaBlock = None
         for y in value:
@@ -209,6 +223,7 @@ class DynamicsMetaBlock(CoreIdentifiedObject):
         return self._MetaBlockState
 
     def setMetaBlockState(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._MetaBlockState:
             x.MemberOf_MetaBlock = None
         for y in value:
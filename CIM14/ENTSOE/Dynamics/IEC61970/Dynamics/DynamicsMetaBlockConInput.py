@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreIdentifiedObject import CoreIdentifiedObject
+from CIM14.ENTSOE.Dynamics.Element import AssociationList, EMPTY
 
 class DynamicsMetaBlockConInput(CoreIdentifiedObject):
 
@@ -65,13 +66,14 @@ class DynamicsMetaBlockConInput(CoreIdentifiedObject):
 
     def setMemberOf_MetaBlockConnection(self, value):
         if self._MemberOf_MetaBlockConnection is not None:
-            filtered = [x for x in self.MemberOf_MetaBlockConnection.MetaBlockConInput if x != self]
-            self._MemberOf_MetaBlockConnection._MetaBlockConInput = filtered
+            self._MemberOf_MetaBlockConnection._MetaBlockConInput.discard(self)
 
         self._MemberOf_MetaBlockConnection = value
         if self._MemberOf_MetaBlockConnection is not None:
-            if self not in self._MemberOf_MetaBlockConnection._MetaBlockConInput:
-                self._MemberOf_MetaBlockConnection._MetaBlockConInput.append(self)
+            if self._MemberOf_MetaBlockConnection._MetaBlockConInput is EMPTY:
+                self._MemberOf_MetaBlockConnection._MetaBlockConInput = AssociationList([self])
+            else:
+                self._MemberOf_MetaBlockConnection._MetaBlockConInput.add(self)
 
     MemberOf_MetaBlockConnection = property(getMemberOf_MetaBlockConnection, setMemberOf_MetaBlockConnection)
 
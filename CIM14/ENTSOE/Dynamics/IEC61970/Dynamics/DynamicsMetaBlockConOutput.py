@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreIdentifiedObject import CoreIdentifiedObject
+from CIM14.ENTSOE.Dynamics.Element import AssociationList, EMPTY
 
 class DynamicsMetaBlockConOutput(CoreIdentifiedObject):
 
@@ -31,8 +32,9 @@ class DynamicsMetaBlockConOutput(CoreIdentifiedObject):
         self._MemberOf_MetaBlockConnection = None
         self.MemberOf_MetaBlockConnection = MemberOf_MetaBlockConnection
 
-        self._MetaBlockConSignal = []
-        self.MetaBlockConSignal = [] if MetaBlockConSignal is None else MetaBlockConSignal
+        self._MetaBlockConSignal = EMPTY
+        if MetaBlockConSignal is not None:
+            self.MetaBlockConSignal = MetaBlockConSignal
 
         super(DynamicsMetaBlockConOutput, self).__init__(*args, **kw_args)
 
@@ -49,13 +51,14 @@ class DynamicsMetaBlockConOutput(CoreIdentifiedObject):
 
     def setMemberOf_MetaBlockConnection(self, value):
         if self._MemberOf_MetaBlockConnection is not None:
-            filtered = [x for x in self.MemberOf_MetaBlockConnection.MetaBlockConOutput if x != self]
-            self._MemberOf_MetaBlockConnection._MetaBlockConOutput = filtered
+            self._MemberOf_MetaBlockConnection._MetaBlockConOutput.discard(self)
 
         self._MemberOf_MetaBlockConnection = value
         if self._MemberOf_MetaBlockConnection is not None:
-            if self not in self._MemberOf_MetaBlockConnection._MetaBlockConOutput:
-                self._MemberOf_MetaBlockConnection._MetaBlockConOutput.append(self)
+            if self._MemberOf_MetaBlockConnection._MetaBlockConOutput is EMPTY:
+                self._MemberOf_MetaBlockConnection._MetaBlockConOutput = AssociationList([self])
+            else:
+                self._MemberOf_MetaBlockConnection._MetaBlockConOutput.add(self)
 
     MemberOf_MetaBlockConnection = property(getMemberOf_MetaBlockConnection, setMemberOf_MetaBlockConnection)
 
@@ -65,6 +68,7 @@ class DynamicsMetaBlockConOutput(CoreIdentifiedObject):
         return self._MetaBlockConSignal
 
     def setMetaBlockConSignal(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._MetaBlockConSignal:
             x.MetaBlockConOutput = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreIdentifiedObject import CoreIdentifiedObject
+from CIM14.ENTSOE.Dynamics.Element import AssociationList, EMPTY
 
 class DynamicsMetaBlockConSignal(CoreIdentifiedObject):
 
@@ -64,13 +65,14 @@ class DynamicsMetaBlockConSignal(CoreIdentifiedObject):
 
     def setMetaBlockConOutput(self, value):
         if self._MetaBlockConOutput is not None:
-            filtered = [x for x in self.MetaBlockConOutput.MetaBlockConSignal if x != self]
-            self._MetaBlockConOutput._MetaBlockConSignal = filtered
+            self._MetaBlockConOutput._MetaBlockConSignal.discard(self)
 
         self._MetaBlockConOutput = value
         if self._MetaBlockConOutput is not None:
-            if self not in self._MetaBlockConOutput._MetaBlockConSignal:
-                self._MetaBlockConOutput._MetaBlockConSignal.append(self)
+            if self._MetaBlockConOutput._MetaBlockConSignal is EMPTY:
+                self._MetaBlockConOutput._MetaBlockConSignal = AssociationList([self])
+            else:
+                self._MetaBlockConOutput._MetaBlockConSignal.add(self)
 
     MetaBlockConOutput = property(getMetaBlockConOutput, setMetaBlockConOutput)
 
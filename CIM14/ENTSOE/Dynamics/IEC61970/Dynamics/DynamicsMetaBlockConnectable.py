@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreIdentifiedObject import CoreIdentifiedObject
+from CIM14.ENTSOE.Dynamics.Element import AssociationList, EMPTY
 
 class DynamicsMetaBlockConnectable(CoreIdentifiedObject):
 
@@ -34,29 +35,37 @@ class DynamicsMetaBlockConnectable(CoreIdentifiedObject):
         @param StandardControlBlock_MetaBlockOutputReference: 
         @param MetaBlockOutputReference: 
         """
-        self._MetaBlockParameterReference = []
-        self.MetaBlockParameterReference = [] if MetaBlockParameterReference is None else MetaBlockParameterReference
+        self._MetaBlockParameterReference = EMPTY
+        if MetaBlockParameterReference is not None:
+            self.MetaBlockParameterReference = MetaBlockParameterReference
 
-        self._StandardControlBlock_MetaBlockInputReference = []
-        self.StandardControlBlock_MetaBlockInputReference = [] if StandardControlBlock_MetaBlockInputReference is None else StandardControlBlock_MetaBlockInputReference
+        self._StandardControlBlock_MetaBlockInputReference = EMPTY
+        if StandardControlBlock_MetaBlockInputReference is not None:
+            self.StandardControlBlock_MetaBlockInputReference = StandardControlBlock_MetaBlockInputReference
 
-        self._MetaBlockStateReference = []
-        self.MetaBlockStateReference = [] if MetaBlockStateReference is None else MetaBlockStateReference
+        self._MetaBlockStateReference = EMPTY
+        if MetaBlockStateReference is not None:
+            self.MetaBlockStateReference = MetaBlockStateReference
 
-        self._StandardControlBlock_MetaBlockStateReference = []
-        self.StandardControlBlock_MetaBlockStateReference = [] if StandardControlBlock_MetaBlockStateReference is None else StandardControlBlock_MetaBlockStateReference
+        self._StandardControlBlock_MetaBlockStateReference = EMPTY
+        if StandardControlBlock_MetaBlockStateReference is not None:
+            self.StandardControlBlock_MetaBlockStateReference = StandardControlBlock_MetaBlockStateReference
 
-        self._MetaBlockInputReference = []
-        self.MetaBlockInputReference = [] if MetaBlockInputReference is None else MetaBlockInputReference
+        self._MetaBlockInputReference = EMPTY
+        if MetaBlockInputReference is not None:
+            self.MetaBlockInputReference = MetaBlockInputReference
 
-        self._StandardControlBlock_MetaBlockParameterReference = []
-        self.StandardControlBlock_MetaBlockParameterReference = [] if StandardControlBlock_MetaBlockParameterReference is None else StandardControlBlock_MetaBlockParameterReference
+        self._StandardControlBlock_MetaBlockParameterReference = EMPTY
+        if StandardControlBlock_MetaBlockParameterReference is not None:
+            self.StandardControlBlock_MetaBlockParameterReference = StandardControlBlock_MetaBlockParameterReference
 
-        self._StandardControlBlock_MetaBlockOutputReference = []
-        self.StandardControlBlock_MetaBlockOutputReference = [] if StandardControlBlock_MetaBlockOutputReference is None else StandardControlBlock_MetaBlockOutputReference
+        self._StandardControlBlock_MetaBlockOutputReference = EMPTY
+        if StandardControlBlock_MetaBlockOutputReference is not None:
+            self.StandardControlBlock_MetaBlockOutputReference = StandardControlBlock_MetaBlockOutputReference
 
-        self._MetaBlockOutputReference = []
-        self.MetaBlockOutputReference = [] if MetaBlockOutputReference is None else MetaBlockOutputReference
+        self._MetaBlockOutputReference = EMPTY
+        if MetaBlockOutputReference is not None:
+            self.MetaBlockOutputReference = MetaBlockOutputReference
 
         super(DynamicsMetaBlockConnectable, self).__init__(*args, **kw_args)
 
@@ -73,6 +82,7 @@ class DynamicsMetaBlockConnectable(CoreIdentifiedObject):
         return self._MetaBlockParameterReference
 
     def setMetaBlockParameterReference(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._MetaBlockParameterReference:
             x.MetaBlockConnectable = None
         for y in value:
@@ -95,6 +105,7 @@ class DynamicsMetaBlockConnectable(CoreIdentifiedObject):
         return self._StandardControlBlock_MetaBlockInputReference
 
     def setStandardControlBlock_MetaBlockInputReference(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._StandardControlBlock_MetaBlockInputReference:
             x.StandardControlBlock_MetaBlockConnectable = None
         for y in value:
@@ -117,6 +128,7 @@ class DynamicsMetaBlockConnectable(CoreIdentifiedObject):
         return self._MetaBlockStateReference
 
     def setMetaBlockStateReference(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._MetaBlockStateReference:
             x.MetaBlockConnectable = None
         for y in value:
@@ -139,6 +151,7 @@ class DynamicsMetaBlockConnectable(CoreIdentifiedObject):
         return self._StandardControlBlock_MetaBlockStateReference
 
     def setStandardControlBlock_MetaBlockStateReference(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._StandardControlBlock_MetaBlockStateReference:
             x.StandardControlBlock_MetaBlockConnectable = None
         for y in value:
@@ -161,6 +174,7 @@ class DynamicsMetaBlockConnectable(CoreIdentifiedObject):
         return self._MetaBlockInputReference
 
     def setMetaBlockInputReference(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._MetaBlockInputReference:
             x.MetaBlockConnectable = None
         for y in value:
@@ -183,6 +197,7 @@ class DynamicsMetaBlockConnectable(CoreIdentifiedObject):
         return self._StandardControlBlock_MetaBlockParameterReference
 
     def setStandardControlBlock_MetaBlockParameterReference(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._StandardControlBlock_MetaBlockParameterReference:
             x.StandardControlBlock_MetaBlockConnectable = None
         for y in value:
@@ -205,6 +220,7 @@ class DynamicsMetaBlockConnectable(CoreIdentifiedObject):
         return self._StandardControlBlock_MetaBlockOutputReference
 
     def setStandardControlBlock_MetaBlockOutputReference(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._StandardControlBlock_MetaBlockOutputReference:
             x.StandardControlBlock_MetaBlockConnectable = None
         for y in value:
@@ -227,6 +243,7 @@ class DynamicsMetaBlockConnectable(CoreIdentifiedObject):
         return self._MetaBlockOutputReference
 
     def setMetaBlockOutputReference(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._MetaBlockOutputReference:
             x.MetaBlockConnectable = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreIdentifiedObject import CoreIdentifiedObject
+from CIM14.ENTSOE.Dynamics.Element import AssociationList, EMPTY
 
 class DynamicsMetaBlockConnection(CoreIdentifiedObject):
 
@@ -30,17 +31,20 @@ class DynamicsMetaBlockConnection(CoreIdentifiedObject):
         @param BlockConnection: 
         @param MetaBlockConInput: 
         """
-        self._MetaBlockConOutput = []
-        self.MetaBlockConOutput = [] if MetaBlockConOutput is None else MetaBlockConOutput
+        self._MetaBlockConOutput = EMPTY
+        if MetaBlockConOutput is not None:
+            self.MetaBlockConOutput = MetaBlockConOutput
 
         self._MemberOf_MetaBlockConnectivity = None
         self.MemberOf_MetaBlockConnectivity = MemberOf_MetaBlockConnectivity
 
-        self._BlockConnection = []
-        self.BlockConnection = [] if BlockConnection is None else BlockConnection
+        self._BlockConnection = EMPTY
+        if BlockConnection is not None:
+            self.BlockConnection = BlockConnection
 
-        self._MetaBlockConInput = []
-        self.MetaBlockConInput = [] if MetaBlockConInput is None else MetaBlockConInput
+        self._MetaBlockConInput = EMPTY
+        if MetaBlockConInput is not None:
+            self.MetaBlockConInput = MetaBlockConInput
 
         super(DynamicsMetaBlockConnection, self).__init__(*args, **kw_args)
 
@@ -57,6 +61,7 @@ class DynamicsMetaBlockConnection(CoreIdentifiedObject):
         return self._MetaBlockConOutput
 
     def setMetaBlockConOutput(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._MetaBlockConOutput:
             x.MemberOf_MetaBlockConnection = None
         for y in value:
@@ -79,13 +84,14 @@ class DynamicsMetaBlockConnection(CoreIdentifiedObject):
 
     def setMemberOf_MetaBlockConnectivity(self, value):
         if self._MemberOf_MetaBlockConnectivity is not None:
-            filtered = [x for x in self.MemberOf_MetaBlockConnectivity.MetaBlockConnection if x != self]
-            self._MemberOf_MetaBlockConnectivity._MetaBlockConnection = filtered
+            self._MemberOf_MetaBlockConnectivity._MetaBlockConnection.discard(self)
 
         self._MemberOf_MetaBlockConnectivity = value
         if self._MemberOf_MetaBlockConnectivity is not None:
-            if self not in self._MemberOf_MetaBlockConnectivity._MetaBlockConnection:
-                self._MemberOf_MetaBlockConnectivity._MetaBlockConnection.append(self)
+            if self._MemberOf_MetaBlockConnectivity._MetaBlockConnection is EMPTY:
+                self._MemberOf_MetaBlockConnectivity._MetaBlockConnection = AssociationList([self])
+            else:
+                self._MemberOf_MetaBlockConnectivity._MetaBlockConnection.add(self)
 
     MemberOf_MetaBlockConnectivity = property(getMemberOf_MetaBlockConnectivity, setMemberOf_MetaBlockConnectivity)
 
@@ -95,6 +101,7 @@ class DynamicsMetaBlockConnection(CoreIdentifiedObject):
         return self._BlockConnection
 
     def setBlockConnection(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._BlockConnection:
             x.MetaBlockConnection = None
         for y in value:
@@ -117,6 +124,7 @@ class DynamicsMetaBlockConnection(CoreIdentifiedObject):
         return self._MetaBlockConInput
 
     def setMetaBlockConInput(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._MetaBlockConInput:
             x.MemberOf_MetaBlockConnection = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreIdentifiedObject import CoreIdentifiedObject
+from CIM14.ENTSOE.Dynamics.Element import AssociationList, EMPTY
 
 class DynamicsMetaBlockConnectivity(CoreIdentifiedObject):
 
@@ -28,11 +29,13 @@ class DynamicsMetaBlockConnectivity(CoreIdentifiedObject):
         @param BlockConnectivity: 
         @param MetaBlockConnection: 
         """
-        self._BlockConnectivity = []
-        self.BlockConnectivity = [] if BlockConnectivity is None else BlockConnectivity
+        self._BlockConnectivity = EMPTY
+        if BlockConnectivity is not None:
+            self.BlockConnectivity = BlockConnectivity
 
-        self._MetaBlockConnection = []
-        self.MetaBlockConnection = [] if MetaBlockConnection is None else MetaBlockConnection
+        self._MetaBlockConnection = EMPTY
+        if MetaBlockConnection is not None:
+            self.MetaBlockConnection = MetaBlockConnection
 
         super(DynamicsMetaBlockConnectivity, self).__init__(*args, **kw_args)
 
@@ -49,6 +52,7 @@ class DynamicsMetaBlockConnectivity(CoreIdentifiedObject):
         return self._BlockConnectivity
 
     def setBlockConnectivity(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._BlockConnectivity:
             x.MetaBlockConnectivity = None
         for y in value:
@@ -71,6 +75,7 @@ class DynamicsMetaBlockConnectivity(CoreIdentifiedObject):
         return self._MetaBlockConnection
 
     def setMetaBlockConnection(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._MetaBlockConnection:
             x.MemberOf_MetaBlockConnectivity = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Dynamics.DynamicsMetaBlockConnectable import DynamicsMetaBlockConnectable
+from CIM14.ENTSOE.Dynamics.Element import AssociationList, EMPTY
 
 class DynamicsMetaBlockInput(DynamicsMetaBlockConnectable):
 
@@ -45,13 +46,14 @@ class DynamicsMetaBlockInput(DynamicsMetaBlockConnectable):
 
     def setMemberOf_MetaBlock(self, value):
         if self._MemberOf_MetaBlock is not None:
-            filtered = [x for x in self.MemberOf_MetaBlock.MetaBlockInput if x != self]
-            self._MemberOf_MetaBlock._MetaBlockInput = filtered
+            self._MemberOf_MetaBlock._MetaBlockInput.discard(self)
 
         self._MemberOf_MetaBlock = value
         if self._MemberOf_MetaBlock is not None:
-            if self not in self._MemberOf_MetaBlock._MetaBlockInput:
-                self._MemberOf_MetaBlock._MetaBlockInput.append(self)
+            if self._MemberOf_MetaBlock._MetaBlockInput is EMPTY:
+                self._MemberOf_MetaBlock._MetaBlockInput = AssociationList([self])
+            else:
+                self._MemberOf_MetaBlock._MetaBlockInput.add(self)
 
     MemberOf_MetaBlock = property(getMemberOf_MetaBlock, setMemberOf_MetaBlock)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Dynamics.DynamicsMetaBlockConnectable import DynamicsMetaBlockConnectable
+from CIM14.ENTSOE.Dynamics.Element import AssociationList, EMPTY
 
 class DynamicsMetaBlockParameter(DynamicsMetaBlockConnectable):
 
@@ -31,8 +32,9 @@ class DynamicsMetaBlockParameter(DynamicsMetaBlockConnectable):
         self._MemberOf_MetaBlock = None
         self.MemberOf_MetaBlock = MemberOf_MetaBlock
 
-        self._BlockParameter = []
-        self.BlockParameter = [] if BlockParameter is None else BlockParameter
+        self._BlockParameter = EMPTY
+        if BlockParameter is not None:
+            self.BlockParameter = BlockParameter
 
         super(DynamicsMetaBlockParameter, self).__init__(*args, **kw_args)
 
@@ -49,13 +51,14 @@ class DynamicsMetaBlockParameter(DynamicsMetaBlockConnectable):
 
     def setMemberOf_MetaBlock(self, value):
         if self._MemberOf_MetaBlock is not None:
-            filtered = [x for x in self.MemberOf_MetaBlock.MetaBlockParameter if x != self]
-            self._MemberOf_MetaBlock._MetaBlockParameter = filtered
+            self._MemberOf_MetaBlock._MetaBlockParameter.discard(self)
 
         self._MemberOf_MetaBlock = value
         if self._MemberOf_MetaBlock is not None:
-            if self not in self._MemberOf_MetaBlock._MetaBlockParameter:
-                self._MemberOf_MetaBlock._MetaBlockParameter.append(self)
+            if self._MemberOf_MetaBlock._MetaBlockParameter is EMPTY:
+                self._MemberOf_MetaBlock._MetaBlockParameter = AssociationList([self])
+            else:
+                self._MemberOf_MetaBlock._MetaBlockParameter.add(self)
 
     MemberOf_MetaBlock = property(getMemberOf_MetaBlock, setMemberOf_MetaBlock)
 
@@ -65,6 +68,7 @@ class DynamicsMetaBlockParameter(DynamicsMetaBlockConnectable):
         return self._BlockParameter
 
     def setBlockParameter(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._BlockParameter:
             x.MetaBlockParameter = None
         for y in value:
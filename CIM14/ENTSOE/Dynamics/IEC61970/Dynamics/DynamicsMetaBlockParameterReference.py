@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreIdentifiedObject import CoreIdentifiedObject
+from CIM14.ENTSOE.Dynamics.Element import AssociationList, EMPTY
 
 class DynamicsMetaBlockParameterReference(CoreIdentifiedObject):
 
@@ -53,13 +54,14 @@ class DynamicsMetaBlockParameterReference(CoreIdentifiedObject):
 
     def setStandardControlBlock_MetaBlockConnectable(self, value):
         if self._StandardControlBlock_MetaBlockConnectable is not None:
-            filtered = [x for x in self.StandardControlBlock_MetaBlockConnectable.StandardControlBlock_MetaBlockParameterReference if x != self]
-            self._StandardControlBlock_MetaBlockConnectable._StandardControlBlock_MetaBlockParameterReference = filtered
+            self._StandardControlBlock_MetaBlockConnectable._StandardControlBlock_MetaBlockParameterReference.discard(self)
 
         self._StandardControlBlock_MetaBlockConnectable = value
         if self._StandardControlBlock_MetaBlockConnectable is not None:
-            if self not in self._StandardControlBlock_MetaBlockConnectable._StandardControlBlock_MetaBlockParameterReference:
-                self._StandardControlBlock_MetaBlockConnectable._StandardControlBlock_MetaBlockParameterReference.append(self)
+            if self._StandardControlBlock_MetaBlockConnectable._StandardControlBlock_MetaBlockParameterReference is EMPTY:
+                self._StandardControlBlock_MetaBlockConnectable._StandardControlBlock_MetaBlockParameterReference = AssociationList([self])
+            else:
+                self._StandardControlBlock_MetaBlockConnectable._StandardControlBlock_MetaBlockParameterReference.add(self)
 
     StandardControlBlock_MetaBlockConnectable = property(getStandardControlBlock_MetaBlockConnectable, setStandardControlBlock_MetaBlockConnectable)
 
@@ -69,13 +71,14 @@ class DynamicsMetaBlockParameterReference(CoreIdentifiedObject):
 
     def setMetaBlockConnectable(self, value):
         if self._MetaBlockConnectable is not None:
-            filtered = [x for x in self.MetaBlockConnectable.MetaBlockParameterReference if x != self]
-            self._MetaBlockConnectable._MetaBlockParameterReference = filtered
+            self._MetaBlockConnectable._MetaBlockParameterReference.discard(self)
 
         self._MetaBlockConnectable = value
         if self._MetaBlockConnectable is not None:
-            if self not in self._MetaBlockConnectable._MetaBlockParameterReference:
-                self._MetaBlockConnectable._MetaBlockParameterReference.append(self)
+            if self._MetaBlockConnectable._MetaBlockParameterReference is EMPTY:
+                self._MetaBlockConnectable._MetaBlockParameterReference = AssociationList([self])
+            else:
+                self._MetaBlockConnectable._MetaBlockParameterReference.add(self)
 
     MetaBlockConnectable = property(getMetaBlockConnectable, setMetaBlockConnectable)
 
@@ -85,13 +88,14 @@ class DynamicsMetaBlockParameterReference(CoreIdentifiedObject):
 
     def setMemberOf_MetaBlockReference(self, value):
         if self._MemberOf_MetaBlockReference is not None:
-            filtered = [x for x in self.MemberOf_MetaBlockReference.MetaBlockParameterReference if x != self]
-            self._MemberOf_MetaBlockReference._MetaBlockParameterReference = filtered
+            self._MemberOf_MetaBlockReference._MetaBlockParameterReference.discard(self)
 
         self._MemberOf_MetaBlockReference = value
         if self._MemberOf_MetaBlockReference is not None:
-            if self not in self._MemberOf_MetaBlockReference._MetaBlockParameterReference:
-                self._MemberOf_MetaBlockReference._MetaBlockParameterReference.append(self)
+            if self._MemberOf_MetaBlockReference._MetaBlockParameterReference is EMPTY:
+                self._MemberOf_MetaBlockReference._MetaBlockParameterReference = AssociationList([self])
+            else:
+                self._MemberOf_MetaBlockReference._MetaBlockParameterReference.add(self)
 
     MemberOf_MetaBlockReference = property(getMemberOf_MetaBlockReference, setMemberOf_MetaBlockReference)
 
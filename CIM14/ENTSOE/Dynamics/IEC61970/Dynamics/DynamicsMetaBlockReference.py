@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreIdentifiedObject import CoreIdentifiedObject
+from CIM14.ENTSOE.Dynamics.Element import AssociationList, EMPTY
 
 class DynamicsMetaBlockReference(CoreIdentifiedObject):
 
@@ -37,25 +38,30 @@ class DynamicsMetaBlockReference(CoreIdentifiedObject):
 
         self.equationType = equationType
 
-        self._MetaBlockStateReference = []
-        self.MetaBlockStateReference = [] if MetaBlockStateReference is None else MetaBlockStateReference
+        self._MetaBlockStateReference = EMPTY
+        if MetaBlockStateReference is not None:
+            self.MetaBlockStateReference = MetaBlockStateReference
 
         self._MemberOf_MetaBlock = None
         self.MemberOf_MetaBlock = MemberOf_MetaBlock
 
-        self._MetaBlockInputReference = []
-        self.MetaBlockInputReference = [] if MetaBlockInputReference is None else MetaBlockInputReference
+        self._MetaBlockInputReference = EMPTY
+        if MetaBlockInputReference is not None:
+            self.MetaBlockInputReference = MetaBlockInputReference
 
-        self._BlockParameter = []
-        self.BlockParameter = [] if BlockParameter is None else BlockParameter
+        self._BlockParameter = EMPTY
+        if BlockParameter is not None:
+            self.BlockParameter = BlockParameter
 
-        self.MetaBlock = [] if MetaBlock is None else MetaBlock
+        self.MetaBlock = EMPTY if MetaBlock is None else AssociationList(MetaBlock) or EMPTY
 
-        self._MetaBlockOutputReference = []
-        self.MetaBlockOutputReference = [] if MetaBlockOutputReference is None else MetaBlockOutputReference
+        self._MetaBlockOutputReference = EMPTY
+        if MetaBlockOutputReference is not None:
+            self.MetaBlockOutputReference = MetaBlockOutputReference
 
-        self._MetaBlockParameterReference = []
-        self.MetaBlockParameterReference = [] if MetaBlockParameterReference is None else MetaBlockParameterReference
+        self._MetaBlockParameterReference = EMPTY
+        if MetaBlockParameterReference is not None:
+            self.MetaBlockParameterReference = MetaBlockParameterReference
 
         super(DynamicsMetaBlockReference, self).__init__(*args, **kw_args)
 
@@ -72,6 +78,7 @@ class DynamicsMetaBlockReference(CoreIdentifiedObject):
         return self._MetaBlockStateReference
 
     def setMetaBlockStateReference(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._MetaBlockStateReference:
             x.MemberOf_MetaBlockReference = None
         for y in value:
@@ -94,13 +101,14 @@ class DynamicsMetaBlockReference(CoreIdentifiedObject):
 
     def setMemberOf_MetaBlock(self, value):
         if self._MemberOf_MetaBlock is not None:
-            filtered = [x for x in self.MemberOf_MetaBlock.MetaBlockReference if x != self]
-            self._MemberOf_MetaBlock._MetaBlockReference = filtered
+            self._MemberOf_MetaBlock._MetaBlockReference.discard(self)
 
         self._MemberOf_MetaBlock = value
         if self._MemberOf_MetaBlock is not None:
-            if self not in self._MemberOf_MetaBlock._MetaBlockReference:
-                self._MemberOf_MetaBlock._MetaBlockReference.append(self)
+            if self._MemberOf_MetaBlock._MetaBlockReference is EMPTY:
+                self._MemberOf_MetaBlock._MetaBlockReference = AssociationList([self])
+            else:
+                self._MemberOf_MetaBlock._MetaBlockReference.add(self)
 
     MemberOf_MetaBlock = property(getMemberOf_MetaBlock, setMemberOf_MetaBlock)
 
@@ -110,6 +118,7 @@ class DynamicsMetaBlockReference(CoreIdentifiedObject):
         return self._MetaBlockInputReference
 
     def setMetaBlockInputReference(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._MetaBlockInputReference:
             x.MemberOf_MetaBlockReference = None
         for y in value:
@@ -132,6 +141,7 @@ class DynamicsMetaBlockReference(CoreIdentifiedObject):
         return self._BlockParameter
 
     def setBlockParameter(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._BlockParameter:
             x.MemberOf_MetaBlockReference = None
         for y in value:
@@ -150,7 +160,10 @@ class DynamicsMetaBlockReference(CoreIdentifiedObject):
 
     def add_MetaBlock(self, *MetaBlock):
         for obj in MetaBlock:
-            self.MetaBlock.append(obj)
+            if self.MetaBlock is EMPTY:
+                self.MetaBlock = AssociationList([obj])
+            else:
+                self.MetaBlock.add(obj)
 
     def remove_MetaBlock(self, *MetaBlock):
         for obj in MetaBlock:
@@ -162,6 +175,7 @@ class DynamicsMetaBlockReference(CoreIdentifiedObject):
         return self._MetaBlockOutputReference
 
     def setMetaBlockOutputReference(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._MetaBlockOutputReference:
             x.MemberOf_MetaBlockReference = None
         for y in value:
@@ -184,6 +198,7 @@ class DynamicsMetaBlockReference(CoreIdentifiedObject):
         return self._MetaBlockParameterReference
 
     def setMetaBlockParameterReference(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._MetaBlockParameterReference:
             x.MemberOf_MetaBlockReference = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreIdentifiedObject import CoreIdentifiedObject
+from CIM14.ENTSOE.Dynamics.Element import AssociationList, EMPTY
 
 class DynamicsMetaBlockSignal(CoreIdentifiedObject):
 
@@ -53,13 +54,14 @@ class DynamicsMetaBlockSignal(CoreIdentifiedObject):
 
     def setTo(self, value):
         if self._To is not None:
-            filtered = [x for x in self.To.MetaBlockSignal if x != self]
-            self._To._MetaBlockSignal = filtered
+            self._To._MetaBlockSignal.discard(self)
 
         self._To = value
         if self._To is not None:
-            if self not in self._To._MetaBlockSignal:
-                self._To._MetaBlockSignal.append(self)
+            if self._To._MetaBlockSignal is EMPTY:
+                self._To._MetaBlockSignal = AssociationList([self])
+            else:
+                self._To._MetaBlockSignal.add(self)
 
     To = property(getTo, setTo)
 
@@ -84,13 +86,14 @@ class DynamicsMetaBlockSignal(CoreIdentifiedObject):
 
     def setMemberOf_MetaBlock(self, value):
         if self._MemberOf_MetaBlock is not None:
-            filtered = [x for x in self.MemberOf_MetaBlock.MetaBlockSignal if x != self]
-            self._MemberOf_MetaBlock._MetaBlockSignal = filtered
+            self._MemberOf_MetaBlock._MetaBlockSignal.discard(self)
 
         self._MemberOf_MetaBlock = value
         if self._MemberOf_MetaBlock is not None:
-            if self not in self._MemberOf_MetaBlock._MetaBlockSignal:
-                self._MemberOf_MetaBlock._MetaBlockSignal.append(self)
+            if self._MemberOf_MetaBlock._MetaBlockSignal is EMPTY:
+                self._MemberOf_MetaBlock._MetaBlockSignal = AssociationList([self])
+            else:
+                self._MemberOf_MetaBlock._MetaBlockSignal.add(self)
 
     MemberOf_MetaBlock = property(getMemberOf_MetaBlock, setMemberOf_MetaBlock)
 
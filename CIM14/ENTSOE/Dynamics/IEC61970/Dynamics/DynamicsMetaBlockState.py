@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Dynamics.DynamicsMetaBlockConnectable import DynamicsMetaBlockConnectable
+from CIM14.ENTSOE.Dynamics.Element import AssociationList, EMPTY
 
 class DynamicsMetaBlockState(DynamicsMetaBlockConnectable):
 
@@ -45,13 +46,14 @@ class DynamicsMetaBlockState(DynamicsMetaBlockConnectable):
 
     def setMemberOf_MetaBlock(self, value):
         if self._MemberOf_MetaBlock is not None:
-            filtered = [x for x in self.MemberOf_MetaBlock.MetaBlockState if x != self]
-            self._MemberOf_MetaBlock._MetaBlockState = filtered
+            self._MemberOf_MetaBlock._MetaBlockState.discard(self)
 
         self._MemberOf_MetaBlock = value
         if self._MemberOf_MetaBlock is not None:
-            if self not in self._MemberOf_MetaBlock._MetaBlockState:
-                self._MemberOf_MetaBlock._MetaBlockState.append(self)
+            if self._MemberOf_MetaBlock._MetaBlockState is EMPTY:
+                self._MemberOf_MetaBlock._MetaBlockState = AssociationList([self])
+            else:
+                self._MemberOf_MetaBlock._MetaBlockState.add(self)
 
     MemberOf_MetaBlock = property(getMemberOf_MetaBlock, setMemberOf_MetaBlock)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreIdentifiedObject import CoreIdentifiedObject
+from CIM14.ENTSOE.Dynamics.Element import AssociationList, EMPTY
 
 class DynamicsMetaBlockStateReference(CoreIdentifiedObject):
 
@@ -57,13 +58,14 @@ class DynamicsMetaBlockStateReference(CoreIdentifiedObject):
 
     def setMetaBlockConnectable(self, value):
         if self._MetaBlockConnectable is not None:
-            filtered = [x for x in self.MetaBlockConnectable.MetaBlockStateReference if x != self]
-            self._MetaBlockConnectable._MetaBlockStateReference = filtered
+            self._MetaBlockConnectable._MetaBlockStateReference.discard(self)
 
         self._MetaBlockConnectable = value
         if self._MetaBlockConnectable is not None:
-            if self not in self._MetaBlockConnectable._MetaBlockStateReference:
-                self._MetaBlockConnectable._MetaBlockStateReference.append(self)
+            if self._MetaBlockConnectable._MetaBlockStateReference is EMPTY:
+                self._MetaBlockConnectable._MetaBlockStateReference = AssociationList([self])
+            else:
+                self._MetaBlockConnectable._MetaBlockStateReference.add(self)
 
     MetaBlockConnectable = property(getMetaBlockConnectable, setMetaBlockConnectable)
 
@@ -73,13 +75,14 @@ class DynamicsMetaBlockStateReference(CoreIdentifiedObject):
 
     def setStandardControlBlock_MetaBlockConnectable(self, value):
         if self._StandardControlBlock_MetaBlockConnectable is not None:
-            filtered = [x for x in self.StandardControlBlock_MetaBlockConnectable.StandardControlBlock_MetaBlockStateReference if x != self]
-            self._StandardControlBlock_MetaBlockConnectable._StandardControlBlock_MetaBlockStateReference = filtered
+            self._StandardControlBlock_MetaBlockConnectable._StandardControlBlock_MetaBlockStateReference.discard(self)
 
         self._StandardControlBlock_MetaBlockConnectable = value
         if self._StandardControlBlock_MetaBlockConnectable is not None:
-            if self not in self._StandardControlBlock_MetaBlockConnectable._StandardControlBlock_MetaBlockStateReference:
-                self._StandardControlBlock_MetaBlockConnectable._StandardControlBlock_MetaBlockStateReference.append(self)
+            if self._StandardControlBlock_MetaBlockConnectable._StandardControlBlock_MetaBlockStateReference is EMPTY:
+                self._StandardControlBlock_MetaBlockConnectable._StandardControlBlock_MetaBlockStateReference = AssociationList([self])
+            else:
+                self._StandardControlBlock_MetaBlockConnectable._StandardControlBlock_MetaBlockStateReference.add(self)
 
     StandardControlBlock_MetaBlockConnectable = property(getStandardControlBlock_MetaBlockConnectable, setStandardControlBlock_MetaBlockConnectable)
 
@@ -89,13 +92,14 @@ class DynamicsMetaBlockStateReference(CoreIdentifiedObject):
 
     def setMemberOf_MetaBlockReference(self, value):
         if self._MemberOf_MetaBlockReference is not None:
-            filtered = [x for x in self.MemberOf_MetaBlockReference.MetaBlockStateReference if x != self]
-            self._MemberOf_MetaBlockReference._MetaBlockStateReference = filtered
+            self._MemberOf_MetaBlockReference._MetaBlockStateReference.discard(self)
 
         self._MemberOf_MetaBlockReference = value
         if self._MemberOf_MetaBlockReference is not None:
-            if self not in self._MemberOf_MetaBlockReference._MetaBlockStateReference:
-                self._MemberOf_MetaBlockReference._MetaBlockStateReference.append(self)
+            if self._MemberOf_MetaBlockReference._MetaBlockStateReference is EMPTY:
+                self._MemberOf_MetaBlockReference._MetaBlockStateReference = AssociationList([self])
+            else:
+                self._MemberOf_MetaBlockReference._MetaBlockStateReference.add(self)
 
     MemberOf_MetaBlockReference = property(getMemberOf_MetaBlockReference, setMemberOf_MetaBlockReference)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreIdentifiedObject import CoreIdentifiedObject
+from CIM14.ENTSOE.Dynamics.Element import AssociationList, EMPTY
 
 class InfCoreModelingAuthoritySet(CoreIdentifiedObject):
 
@@ -27,8 +28,9 @@ class InfCoreModelingAuthoritySet(CoreIdentifiedObject):
 
         @param IdentifiedObjects: 
         """
-        self._IdentifiedObjects = []
-        self.IdentifiedObjects = [] if IdentifiedObjects is None else IdentifiedObjects
+        self._IdentifiedObjects = EMPTY
+        if IdentifiedObjects is not None:
+            self.IdentifiedObjects = IdentifiedObjects
 
         super(InfCoreModelingAuthoritySet, self).__init__(*args, **kw_args)
 
@@ -45,6 +47,7 @@ class InfCoreModelingAuthoritySet(CoreIdentifiedObject):
         return self._IdentifiedObjects
 
     def setIdentifiedObjects(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._IdentifiedObjects:
             x.ModelingAuthoritySet = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreIdentifiedObject import CoreIdentifiedObject
+from CIM14.ENTSOE.Dynamics.Element import AssociationList, EMPTY
 
 class MeasControl(CoreIdentifiedObject):
 
@@ -46,13 +47,14 @@ class MeasControl(CoreIdentifiedObject):
 
     def setRegulatingCondEq(self, value):
         if self._RegulatingCondEq is not None:
-            filtered = [x for x in self.RegulatingCondEq.Controls if x != self]
-            self._RegulatingCondEq._Controls = filtered
+            self._RegulatingCondEq._Controls.discard(self)
 
         self._RegulatingCondEq = value
         if self._RegulatingCondEq is not None:
-            if self not in self._RegulatingCondEq._Controls:
-                self._RegulatingCondEq._Controls.append(self)
+            if self._RegulatingCondEq._Controls is EMPTY:
+                self._RegulatingCondEq._Controls = AssociationList([self])
+            else:
+                self._RegulatingCondEq._Controls.add(self)
 
     RegulatingCondEq = property(getRegulatingCondEq, setRegulatingCondEq)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreIdentifiedObject import CoreIdentifiedObject
+from CIM14.ENTSOE.Dynamics.Element import AssociationList, EMPTY
 
 class MeasMeasurement(CoreIdentifiedObject):
 
@@ -46,13 +47,14 @@ class MeasMeasurement(CoreIdentifiedObject):
 
     def setPowerSystemResource(self, value):
         if self._PowerSystemResource is not None:
-            filtered = [x for x in self.PowerSystemResource.Measurements if x != self]
-            self._PowerSystemResource._Measurements = filtered
+            self._PowerSystemResource._Measurements.discard(self)
 
         self._PowerSystemResource = value
         if self._PowerSystemResource is not None:
-            if self not in self._PowerSystemResource._Measurements:
-                self._PowerSystemResource._Measurements.append(self)
+            if self._PowerSystemResource._Measurements is EMPTY:
+                self._PowerSystemResource._Measurements = AssociationList([self])
+            else:
+                self._PowerSystemResource._Measurements.add(self)
 
     PowerSystemResource = property(getPowerSystemResource, setPowerSystemResource)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreIdentifiedObject import CoreIdentifiedObject
+from CIM14.ENTSOE.Dynamics.Element import AssociationList, EMPTY
 
 class OperationalLimitsOperationalLimitSet(CoreIdentifiedObject):
 
@@ -46,13 +47,14 @@ class OperationalLimitsOperationalLimitSet(CoreIdentifiedObject):
 
     def setEquipment(self, value):
         if self._Equipment is not None:
-            filtered = [x for x in self.Equipment.OperationalLimitSet if x != self]
-            self._Equipment._OperationalLimitSet = filtered
+            self._Equipment._OperationalLimitSet.discard(self)
 
         self._Equipment = value
         if self._Equipment is not None:
-            if self not in self._Equipment._OperationalLimitSet:
-                self._Equipment._OperationalLimitSet.append(self)
+            if self._Equipment._OperationalLimitSet is EMPTY:
+                self._Equipment._OperationalLimitSet = AssociationList([self])
+            else:
+                self._Equipment._OperationalLimitSet.add(self)
 
     Equipment = property(getEquipment, setEquipment)
 
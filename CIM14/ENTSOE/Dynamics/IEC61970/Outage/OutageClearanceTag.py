@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreIdentifiedObject import CoreIdentifiedObject
+from CIM14.ENTSOE.Dynamics.Element import AssociationList, EMPTY
 
 class OutageClearanceTag(CoreIdentifiedObject):
 
@@ -46,13 +47,14 @@ class OutageClearanceTag(CoreIdentifiedObject):
 
     def setConductingEquipment(self, value):
         if self._ConductingEquipment is not None:
-            filtered = [x for x in self.ConductingEquipment.ClearanceTags if x != self]
-            self._ConductingEquipment._ClearanceTags = filtered
+            self._ConductingEquipment._ClearanceTags.discard(self)
 
         self._ConductingEquipment = value
         if self._ConductingEquipment is not None:
-            if self not in self._ConductingEquipment._ClearanceTags:
-                self._ConductingEquipment._ClearanceTags.append(self)
+            if self._ConductingEquipment._ClearanceTags is EMPTY:
+                self._ConductingEquipment._ClearanceTags = AssociationList([self])
+            else:
+                self._ConductingEquipment._ClearanceTags.add(self)
 
     ConductingEquipment = property(getConductingEquipment, setConductingEquipment)
 
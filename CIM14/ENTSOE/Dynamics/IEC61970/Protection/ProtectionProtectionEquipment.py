@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreEquipment import CoreEquipment
+from CIM14.ENTSOE.Dynamics.Element import AssociationList, EMPTY
 
 class ProtectionProtectionEquipment(CoreEquipment):
 
@@ -27,8 +28,9 @@ class ProtectionProtectionEquipment(CoreEquipment):
 
         @param ConductingEquipments: 
         """
-        self._ConductingEquipments = []
-        self.ConductingEquipments = [] if ConductingEquipments is None else ConductingEquipments
+        self._ConductingEquipments = EMPTY
+        if ConductingEquipments is not None:
+            self.ConductingEquipments = ConductingEquipments
 
         super(ProtectionProtectionEquipment, self).__init__(*args, **kw_args)
 
@@ -45,21 +47,28 @@ class ProtectionProtectionEquipment(CoreEquipment):
         return self._ConductingEquipments
 
     def setConductingEquipments(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ConductingEquipments:
-            filtered = [q for q in p.ProtectionEquipments if q != self]
-            self._ConductingEquipments._ProtectionEquipments = filtered
+            p._ProtectionEquipments.discard(self)
         for r in value:
-            if self not in r._ProtectionEquipments:
-                r._ProtectionEquipments.append(self)
+            if r._ProtectionEquipments is EMPTY:
+                r._ProtectionEquipments = AssociationList([self])
+            else:
+                r._ProtectionEquipments.add(self)
         self._ConductingEquipments = value
 
     ConductingEquipments = property(getConductingEquipments, setConductingEquipments)
 
     def addConductingEquipments(self, *ConductingEquipments):
         for obj in ConductingEquipments:
-            if self not in obj._ProtectionEquipments:
-                obj._ProtectionEquipments.append(self)
-            self._ConductingEquipments.append(obj)
+            if obj._ProtectionEquipments is EMPTY:
+                obj._ProtectionEquipments = AssociationList([self])
+            else:
+                obj._ProtectionEquipments.add(self)
+            if self._ConductingEquipments is EMPTY:
+                self._ConductingEquipments = AssociationList([obj])
+            else:
+                self._ConductingEquipments.add(obj)
 
     def removeConductingEquipments(self, *ConductingEquipments):
         for obj in ConductingEquipments:
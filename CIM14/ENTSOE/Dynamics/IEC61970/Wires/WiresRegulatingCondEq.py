@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreConductingEquipment import CoreConductingEquipment
+from CIM14.ENTSOE.Dynamics.Element import AssociationList, EMPTY
 
 class WiresRegulatingCondEq(CoreConductingEquipment):
 
@@ -28,8 +29,9 @@ class WiresRegulatingCondEq(CoreConductingEquipment):
         @param Controls:
         @param RegulatingControl:
         """
-        self._Controls = []
-        self.Controls = [] if Controls is None else Controls
+        self._Controls = EMPTY
+        if Controls is not None:
+            self.Controls = Controls
 
         self._RegulatingControl = None
         self.RegulatingControl = RegulatingControl
@@ -48,6 +50,7 @@ class WiresRegulatingCondEq(CoreConductingEquipment):
         return self._Controls
 
     def setControls(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Controls:
             x.RegulatingCondEq = None
         for y in value:
@@ -70,13 +73,14 @@ class WiresRegulatingCondEq(CoreConductingEquipment):
 
     def setRegulatingControl(self, value):
         if self._RegulatingControl is not None:
-            filtered = [x for x in self.RegulatingControl.RegulatingCondEq if x != self]
-            self._RegulatingControl._RegulatingCondEq = filtered
+            self._RegulatingControl._RegulatingCondEq.discard(self)
 
         self._RegulatingControl = value
         if self._RegulatingControl is not None:
-            if self not in self._RegulatingControl._RegulatingCondEq:
-                self._RegulatingControl._RegulatingCondEq.append(self)
+            if self._RegulatingControl._RegulatingCondEq is EMPTY:
+                self._RegulatingControl._RegulatingCondEq = AssociationList([self])
+            else:
+                self._RegulatingControl._RegulatingCondEq.add(self)
 
     RegulatingControl = property(getRegulatingControl, setRegulatingControl)
 
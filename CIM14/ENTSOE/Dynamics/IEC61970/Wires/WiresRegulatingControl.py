@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CorePowerSystemResource import CorePowerSystemResource
+from CIM14.ENTSOE.Dynamics.Element import AssociationList, EMPTY
 
 class WiresRegulatingControl(CorePowerSystemResource):
 
@@ -27,8 +28,9 @@ class WiresRegulatingControl(CorePowerSystemResource):
 
         @param RegulatingCondEq: 
         """
-        self._RegulatingCondEq = []
-        self.RegulatingCondEq = [] if RegulatingCondEq is None else RegulatingCondEq
+        self._RegulatingCondEq = EMPTY
+        if RegulatingCondEq is not None:
+            self.RegulatingCondEq = RegulatingCondEq
 
         super(WiresRegulatingControl, self).__init__(*args, **kw_args)
 
@@ -45,6 +47,7 @@ class WiresRegulatingControl(CorePowerSystemResource):
         return self._RegulatingCondEq
 
     def setRegulatingCondEq(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._RegulatingCondEq:
             x.RegulatingControl = None
         for y in value:
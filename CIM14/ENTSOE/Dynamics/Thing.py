@@ -18,7 +18,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from CIM14.ENTSOE.Dynamics.Element import Element
+from CIM14.ENTSOE.Dynamics.Element import Element, AssociationList, EMPTY
 
 class Thing(Element):
 
@@ -43,37 +43,37 @@ class Thing(Element):
         @param OutageStepRoles:
         @param NetworkDataSets:
         """
-        self.ScheduleSteps = [] if ScheduleSteps is None else ScheduleSteps
+        self.ScheduleSteps = EMPTY if ScheduleSteps is None else AssociationList(ScheduleSteps) or EMPTY
 
-        self.synchronousGeneratorType = [] if synchronousGeneratorType is None else synchronousGeneratorType
+        self.synchronousGeneratorType = EMPTY if synchronousGeneratorType is None else AssociationList(synchronousGeneratorType) or EMPTY
 
-        self.tpqo = [] if tpqo is None else tpqo
+        self.tpqo = EMPTY if tpqo is None else AssociationList(tpqo) or EMPTY
 
-        self.ElectricalAssets = [] if ElectricalAssets is None else ElectricalAssets
+        self.ElectricalAssets = EMPTY if ElectricalAssets is None else AssociationList(ElectricalAssets) or EMPTY
 
-        self.SafetyDocuments = [] if SafetyDocuments is None else SafetyDocuments
+        self.SafetyDocuments = EMPTY if SafetyDocuments is None else AssociationList(SafetyDocuments) or EMPTY
 
-        self.ratedS = [] if ratedS is None else ratedS
+        self.ratedS = EMPTY if ratedS is None else AssociationList(ratedS) or EMPTY
 
-        self.tppdo = [] if tppdo is None else tppdo
+        self.tppdo = EMPTY if tppdo is None else AssociationList(tppdo) or EMPTY
 
-        self.tpdo = [] if tpdo is None else tpdo
+        self.tpdo = EMPTY if tpdo is None else AssociationList(tpdo) or EMPTY
 
-        self.ChangeItems = [] if ChangeItems is None else ChangeItems
+        self.ChangeItems = EMPTY if ChangeItems is None else AssociationList(ChangeItems) or EMPTY
 
-        self.ErpOrganisationRoles = [] if ErpOrganisationRoles is None else ErpOrganisationRoles
+        self.ErpOrganisationRoles = EMPTY if ErpOrganisationRoles is None else AssociationList(ErpOrganisationRoles) or EMPTY
 
-        self.CircuitSections = [] if CircuitSections is None else CircuitSections
+        self.CircuitSections = EMPTY if CircuitSections is None else AssociationList(CircuitSections) or EMPTY
 
-        self.tppqo = [] if tppqo is None else tppqo
+        self.tppqo = EMPTY if tppqo is None else AssociationList(tppqo) or EMPTY
 
-        self.DocumentRoles = [] if DocumentRoles is None else DocumentRoles
+        self.DocumentRoles = EMPTY if DocumentRoles is None else AssociationList(DocumentRoles) or EMPTY
 
-        self.PSREvent = [] if PSREvent is None else PSREvent
+        self.PSREvent = EMPTY if PSREvent is None else AssociationList(PSREvent) or EMPTY
 
-        self.OutageStepRoles = [] if OutageStepRoles is None else OutageStepRoles
+        self.OutageStepRoles = EMPTY if OutageStepRoles is None else AssociationList(OutageStepRoles) or EMPTY
 
-        self.NetworkDataSets = [] if NetworkDataSets is None else NetworkDataSets
+        self.NetworkDataSets = EMPTY if NetworkDataSets is None else AssociationList(NetworkDataSets) or EMPTY
 
         super(Thing, self).__init__(*args, **kw_args)
 
@@ -86,7 +86,10 @@ class Thing(Element):
 
     def add_ScheduleSteps(self, *ScheduleSteps):
         for obj in ScheduleSteps:
-            self.ScheduleSteps.append(obj)
+            if self.ScheduleSteps is EMPTY:
+                self.ScheduleSteps = AssociationList([obj])
+            else:
+                self.ScheduleSteps.add(obj)
 
     def remove_ScheduleSteps(self, *ScheduleSteps):
         for obj in ScheduleSteps:
@@ -94,7 +97,10 @@ class Thing(Element):
 
     def add_synchronousGeneratorType(self, *synchronousGeneratorType):
         for obj in synchronousGeneratorType:
-            self.synchronousGeneratorType.append(obj)
+            if self.synchronousGeneratorType is EMPTY:
+                self.synchronousGeneratorType = AssociationList([obj])
+            else:
+                self.synchronousGeneratorType.add(obj)
 
     def remove_synchronousGeneratorType(self, *synchronousGeneratorType):
         for obj in synchronousGeneratorType:
@@ -102,7 +108,10 @@ class Thing(Element):
 
     def add_tpqo(self, *tpqo):
         for obj in tpqo:
-            self.tpqo.append(obj)
+            if self.tpqo is EMPTY:
+                self.tpqo = AssociationList([obj])
+            else:
+                self.tpqo.add(obj)
 
     def remove_tpqo(self, *tpqo):
         for obj in tpqo:
@@ -110,7 +119,10 @@ class Thing(Element):
 
     def add_ElectricalAssets(self, *ElectricalAssets):
         for obj in ElectricalAssets:
-            self.ElectricalAssets.append(obj)
+            if self.ElectricalAssets is EMPTY:
+                self.ElectricalAssets = AssociationList([obj])
+            else:
+                self.ElectricalAssets.add(obj)
 
     def remove_ElectricalAssets(self, *ElectricalAssets):
         for obj in ElectricalAssets:
@@ -118,7 +130,10 @@ class Thing(Element):
 
     def add_SafetyDocuments(self, *SafetyDocuments):
         for obj in SafetyDocuments:
-            self.SafetyDocuments.append(obj)
+            if self.SafetyDocuments is EMPTY:
+                self.SafetyDocuments = AssociationList([obj])
+            else:
+                self.SafetyDocuments.add(obj)
 
     def remove_SafetyDocuments(self, *SafetyDocuments):
         for obj in SafetyDocuments:
@@ -126,7 +141,10 @@ class Thing(Element):
 
     def add_ratedS(self, *ratedS):
         for obj in ratedS:
-            self.ratedS.append(obj)
+            if self.ratedS is EMPTY:
+                self.ratedS = AssociationList([obj])
+            else:
+                self.ratedS.add(obj)
 
     def remove_ratedS(self, *ratedS):
         for obj in ratedS:
@@ -134,7 +152,10 @@ class Thing(Element):
 
     def add_tppdo(self, *tppdo):
         for obj in tppdo:
-            self.tppdo.append(obj)
+            if self.tppdo is EMPTY:
+                self.tppdo = AssociationList([obj])
+            else:
+                self.tppdo.add(obj)
 
     def remove_tppdo(self, *tppdo):
         for obj in tppdo:
@@ -142,7 +163,10 @@ class Thing(Element):
 
     def add_tpdo(self, *tpdo):
         for obj in tpdo:
-            self.tpdo.append(obj)
+            if self.tpdo is EMPTY:
+                self.tpdo = AssociationList([obj])
+            else:
+                self.tpdo.add(obj)
 
     def remove_tpdo(self, *tpdo):
         for obj in tpdo:
@@ -150,7 +174,10 @@ class Thing(Element):
 
     def add_ChangeItems(self, *ChangeItems):
         for obj in ChangeItems:
-            self.ChangeItems.append(obj)
+            if self.ChangeItems is EMPTY:
+                self.ChangeItems = AssociationList([obj])
+            else:
+                self.ChangeItems.add(obj)
 
     def remove_ChangeItems(self, *ChangeItems):
         for obj in ChangeItems:
@@ -158,7 +185,10 @@ class Thing(Element):
 
     def add_ErpOrganisationRoles(self, *ErpOrganisationRoles):
         for obj in ErpOrganisationRoles:
-            self.ErpOrganisationRoles.append(obj)
+            if self.ErpOrganisationRoles is EMPTY:
+                self.ErpOrganisationRoles = AssociationList([obj])
+            else:
+                self.ErpOrganisationRoles.add(obj)
 
     def remove_ErpOrganisationRoles(self, *ErpOrganisationRoles):
         for obj in ErpOrganisationRoles:
@@ -166,7 +196,10 @@ class Thing(Element):
 
     def add_CircuitSections(self, *CircuitSections):
         for obj in CircuitSections:
-            self.CircuitSections.append(obj)
+            if self.CircuitSections is EMPTY:
+                self.CircuitSections = AssociationList([obj])
+            else:
+                self.CircuitSections.add(obj)
 
     def remove_CircuitSections(self, *CircuitSections):
         for obj in CircuitSections:
@@ -174,7 +207,10 @@ class Thing(Element):
 
     def add_tppqo(self, *tppqo):
         for obj in tppqo:
-            self.tppqo.append(obj)
+            if self.tppqo is EMPTY:
+                self.tppqo = AssociationList([obj])
+            else:
+                self.tppqo.add(obj)
 
     def remove_tppqo(self, *tppqo):
         for obj in tppqo:
@@ -182,7 +218,10 @@ class Thing(Element):
 
     def add_DocumentRoles(self, *DocumentRoles):
         for obj in DocumentRoles:
-            self.DocumentRoles.append(obj)
+            if self.DocumentRoles is EMPTY:
+                self.DocumentRoles = AssociationList([obj])
+            else:
+                self.DocumentRoles.add(obj)
 
     def remove_DocumentRoles(self, *DocumentRoles):
         for obj in DocumentRoles:
@@ -190,7 +229,10 @@ class Thing(Element):
 
     def add_PSREvent(self, *PSREvent):
         for obj in PSREvent:
-            self.PSREvent.append(obj)
+            if self.PSREvent is EMPTY:
+                self.PSREvent = AssociationList([obj])
+            else:
+                self.PSREvent.add(obj)
 
     def remove_PSREvent(self, *PSREvent):
         for obj in PSREvent:
@@ -198,7 +240,10 @@ class Thing(Element):
 
     def add_OutageStepRoles(self, *OutageStepRoles):
         for obj in OutageStepRoles:
-            self.OutageStepRoles.append(obj)
+            if self.OutageStepRoles is EMPTY:
+                self.OutageStepRoles = AssociationList([obj])
+            else:
+                self.OutageStepRoles.add(obj)
 
     def remove_OutageStepRoles(self, *OutageStepRoles):
         for obj in OutageStepRoles:
@@ -206,7 +251,10 @@ class Thing(Element):
 
     def add_NetworkDataSets(self, *NetworkDataSets):
         for obj in NetworkDataSets:
-            self.NetworkDataSets.append(obj)
+            if self.NetworkDataSets is EMPTY:
+                self.NetworkDataSets = AssociationList([obj])
+            else:
+                self.NetworkDataSets.add(obj)
 
     def remove_NetworkDataSets(self, *NetworkDataSets):
         for obj in NetworkDataSets:
@@ -18,7 +18,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from CIM14.ENTSOE.Equipment.Element import Element
+from CIM14.ENTSOE.Equipment.Element import Element, AssociationList, EMPTY
 
 class ControlAreaGeneratingUnit(Element):
     """A control area generating unit. This class is needed so that alternate control area definitions may include the same generating unit.   Note only one instance within a control area should reference a specific generating unit.
@@ -52,13 +52,14 @@ class ControlAreaGeneratingUnit(Element):
 
     def setControlArea(self, value):
         if self._ControlArea is not None:
-            filtered = [x for x in self.ControlArea.ControlAreaGeneratingUnit if x != self]
-            self._ControlArea._ControlAreaGeneratingUnit = filtered
+            self._ControlArea._ControlAreaGeneratingUnit.discard(self)
 
         self._ControlArea = value
         if self._ControlArea is not None:
-            if self not in self._ControlArea._ControlAreaGeneratingUnit:
-                self._ControlArea._ControlAreaGeneratingUnit.append(self)
+            if self._ControlArea._ControlAreaGeneratingUnit is EMPTY:
+                self._ControlArea._ControlAreaGeneratingUnit = AssociationList([self])
+            else:
+                self._ControlArea._ControlAreaGeneratingUnit.add(self)
 
     ControlArea = property(getControlArea, setControlArea)
 
@@ -69,13 +70,14 @@ class ControlAreaGeneratingUnit(Element):
 
     def setGeneratingUnit(self, value):
         if self._GeneratingUnit is not None:
-            filtered = [x for x in self.GeneratingUnit.ControlAreaGeneratingUnit if x != self]
-            self._GeneratingUnit._ControlAreaGeneratingUnit = filtered
+            self._GeneratingUnit._ControlAreaGeneratingUnit.discard(self)
 
         self._GeneratingUnit = value
         if self._GeneratingUnit is not None:
-            if self not in self._GeneratingUnit._ControlAreaGeneratingUnit:
-                self._GeneratingUnit._ControlAreaGeneratingUnit.append(self)
+            if self._GeneratingUnit._ControlAreaGeneratingUnit is EMPTY:
+                self._GeneratingUnit._ControlAreaGeneratingUnit = AssociationList([self])
+            else:
+                self._GeneratingUnit._ControlAreaGeneratingUnit.add(self)
 
     GeneratingUnit = property(getGeneratingUnit, setGeneratingUnit)
 
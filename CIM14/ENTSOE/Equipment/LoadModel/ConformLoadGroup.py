@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Equipment.LoadModel.LoadGroup import LoadGroup
+from CIM14.ENTSOE.Equipment.Element import AssociationList, EMPTY
 
 class ConformLoadGroup(LoadGroup):
     """A group of loads conforming to an allocation pattern.
@@ -29,8 +30,9 @@ class ConformLoadGroup(LoadGroup):
 
         @param EnergyConsumers: Conform loads assigned to this ConformLoadGroup.
         """
-        self._EnergyConsumers = []
-        self.EnergyConsumers = [] if EnergyConsumers is None else EnergyConsumers
+        self._EnergyConsumers = EMPTY
+        if EnergyConsumers is not None:
+            self.EnergyConsumers = EnergyConsumers
 
         super(ConformLoadGroup, self).__init__(*args, **kw_args)
 
@@ -47,6 +49,7 @@ class ConformLoadGroup(LoadGroup):
         return self._EnergyConsumers
 
     def setEnergyConsumers(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._EnergyConsumers:
             x.LoadGroup = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Equipment.LoadModel.LoadGroup import LoadGroup
+from CIM14.ENTSOE.Equipment.Element import AssociationList, EMPTY
 
 class NonConformLoadGroup(LoadGroup):
     """Loads that do not follow a daily and seasonal load variation pattern.
@@ -29,8 +30,9 @@ class NonConformLoadGroup(LoadGroup):
 
         @param EnergyConsumers: Conform loads assigned to this ConformLoadGroup.
         """
-        self._EnergyConsumers = []
-        self.EnergyConsumers = [] if EnergyConsumers is None else EnergyConsumers
+        self._EnergyConsumers = EMPTY
+        if EnergyConsumers is not None:
+            self.EnergyConsumers = EnergyConsumers
 
         super(NonConformLoadGroup, self).__init__(*args, **kw_args)
 
@@ -47,6 +49,7 @@ class NonConformLoadGroup(LoadGroup):
         return self._EnergyConsumers
 
     def setEnergyConsumers(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._EnergyConsumers:
             x.LoadGroup = None
         for y in value:
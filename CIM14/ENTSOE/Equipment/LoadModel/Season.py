@@ -18,7 +18,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from CIM14.ENTSOE.Equipment.Element import Element
+from CIM14.ENTSOE.Equipment.Element import Element, AssociationList, EMPTY
 
 class Season(Element):
     """A specified time period of the year, e.g., Spring, Summer, Fall, Winter
@@ -29,8 +29,9 @@ class Season(Element):
 
         @param SeasonDayTypeSchedules: Schedules that use this Season.
         """
-        self._SeasonDayTypeSchedules = []
-        self.SeasonDayTypeSchedules = [] if SeasonDayTypeSchedules is None else SeasonDayTypeSchedules
+        self._SeasonDayTypeSchedules = EMPTY
+        if SeasonDayTypeSchedules is not None:
+            self.SeasonDayTypeSchedules = SeasonDayTypeSchedules
 
         super(Season, self).__init__(*args, **kw_args)
 
@@ -47,6 +48,7 @@ class Season(Element):
         return self._SeasonDayTypeSchedules
 
     def setSeasonDayTypeSchedules(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._SeasonDayTypeSchedules:
             x.Season = None
         for y in value:
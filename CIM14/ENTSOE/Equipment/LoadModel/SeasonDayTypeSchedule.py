@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Equipment.Core.RegularIntervalSchedule import RegularIntervalSchedule
+from CIM14.ENTSOE.Equipment.Element import AssociationList, EMPTY
 
 class SeasonDayTypeSchedule(RegularIntervalSchedule):
     """The schedule specialize RegularIntervalSchedule with type curve data for a specific type of day and season. This means that curves of this type cover a 24 hour period.
@@ -52,13 +53,14 @@ class SeasonDayTypeSchedule(RegularIntervalSchedule):
 
     def setDayType(self, value):
         if self._DayType is not None:
-            filtered = [x for x in self.DayType.SeasonDayTypeSchedules if x != self]
-            self._DayType._SeasonDayTypeSchedules = filtered
+            self._DayType._SeasonDayTypeSchedules.discard(self)
 
         self._DayType = value
         if self._DayType is not None:
-            if self not in self._DayType._SeasonDayTypeSchedules:
-                self._DayType._SeasonDayTypeSchedules.append(self)
+            if self._DayType._SeasonDayTypeSchedules is EMPTY:
+                self._DayType._SeasonDayTypeSchedules = AssociationList([self])
+            else:
+                self._DayType._SeasonDayTypeSchedules.add(self)
 
     DayType = property(getDayType, setDayType)
 
@@ -69,13 +71,14 @@ class SeasonDayTypeSchedule(RegularIntervalSchedule):
 
     def setSeason(self, value):
         if self._Season is not None:
-            filtered = [x for x in self.Season.SeasonDayTypeSchedules if x != self]
-            self._Season._SeasonDayTypeSchedules = filtered
+            self._Season._SeasonDayTypeSchedules.discard(self)
 
         self._Season = value
         if self._Season is not None:
-            if self not in self._Season._SeasonDayTypeSchedules:
-                self._Season._SeasonDayTypeSchedules.append(self)
+            if self._Season._SeasonDayTypeSchedules is EMPTY:
+                self._Season._SeasonDayTypeSchedules = AssociationList([self])
+            else:
+                self._Season._SeasonDayTypeSchedules.add(self)
 
     Season = property(getSeason, setSeason)
 
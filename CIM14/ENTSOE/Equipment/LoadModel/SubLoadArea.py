@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Equipment.LoadModel.EnergyArea import EnergyArea
+from CIM14.ENTSOE.Equipment.Element import AssociationList, EMPTY
 
 class SubLoadArea(EnergyArea):
     """The class is the second level in a hierarchical structure for grouping of loads for the purpose of load flow load scaling.
@@ -29,8 +30,9 @@ class SubLoadArea(EnergyArea):
 
         @param LoadGroups: The Loadgroups in the SubLoadArea.
         """
-        self._LoadGroups = []
-        self.LoadGroups = [] if LoadGroups is None else LoadGroups
+        self._LoadGroups = EMPTY
+        if LoadGroups is not None:
+            self.LoadGroups = LoadGroups
 
         super(SubLoadArea, self).__init__(*args, **kw_args)
 
@@ -47,6 +49,7 @@ class SubLoadArea(EnergyArea):
         return self._LoadGroups
 
     def setLoadGroups(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._LoadGroups:
             x.SubLoadArea = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Equipment.Core.IdentifiedObject import IdentifiedObject
+from CIM14.ENTSOE.Equipment.Element import AssociationList, EMPTY
 
 class OperationalLimitType(IdentifiedObject):
     """A type of limit.  The meaning of a specific limit is described in this class.
@@ -37,8 +38,9 @@ class OperationalLimitType(IdentifiedObject):
         #: The nominal acceptable duration of the limit.  Limits are commonly expressed in terms of the a time limit for which the limit is normally acceptable.   The actual acceptable duration of a specific limit may depend on other local factors such as temperature or wind speed.
         self.acceptableDuration = acceptableDuration
 
-        self._OperationalLimit = []
-        self.OperationalLimit = [] if OperationalLimit is None else OperationalLimit
+        self._OperationalLimit = EMPTY
+        if OperationalLimit is not None:
+            self.OperationalLimit = OperationalLimit
 
         super(OperationalLimitType, self).__init__(*args, **kw_args)
 
@@ -55,6 +57,7 @@ class OperationalLimitType(IdentifiedObject):
         return self._OperationalLimit
 
     def setOperationalLimit(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._OperationalLimit:
             x.OperationalLimitType = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Equipment.Core.ConductingEquipment import ConductingEquipment
+from CIM14.ENTSOE.Equipment.Element import AssociationList, EMPTY
 
 class EnergyConsumer(ConductingEquipment):
     """Generic user of energy - a  point of consumption on the power system model-  [R8.2] is satisfied by navigation to ConnectivityNode and Substation -  The definition of the real and reactive power injections for an EnergyConsumer can be done using different sets of attributes.  In the simplest case, the injections can be defined directly using only the attributes “pfixed” and “qfixed”. -  To specify conforming and nonconforming loads, the classes ConformLoad, NonConformLoad, or their subtypes should be used. -  The attributes defining the affect of voltage and frequency on the injection defined by an associated LoadResponseCharacteristic should be supplied, if they are available, but are not required. 
@@ -64,13 +65,14 @@ class EnergyConsumer(ConductingEquipment):
 
     def setLoadResponse(self, value):
         if self._LoadResponse is not None:
-            filtered = [x for x in self.LoadResponse.EnergyConsumer if x != self]
-            self._LoadResponse._EnergyConsumer = filtered
+            self._LoadResponse._EnergyConsumer.discard(self)
 
         self._LoadResponse = value
         if self._LoadResponse is not None:
-            if self not in self._LoadResponse._EnergyConsumer:
-                self._LoadResponse._EnergyConsumer.append(self)
+            if self._LoadResponse._EnergyConsumer is EMPTY:
+                self._LoadResponse._EnergyConsumer = AssociationList([self])
+            else:
+                self._LoadResponse._EnergyConsumer.add(self)
 
     LoadResponse = property(getLoadResponse, setLoadResponse)
 
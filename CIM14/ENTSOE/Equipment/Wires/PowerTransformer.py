@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Equipment.Core.Equipment import Equipment
+from CIM14.ENTSOE.Equipment.Element import AssociationList, EMPTY
 
 class PowerTransformer(Equipment):
     """An electrical device consisting of  two or more coupled windings, with or without a magnetic core, for introducing mutual coupling between electric circuits. Transformers can be used to control voltage and phase shift (active power flow).A PowerTransformer can be either two winding or three winding. -  A two winding transformer has two TransformerWindings -  A three winding transformer has three TransformerWindings 
@@ -29,8 +30,9 @@ class PowerTransformer(Equipment):
 
         @param TransformerWindings: A transformer has windings
         """
-        self._TransformerWindings = []
-        self.TransformerWindings = [] if TransformerWindings is None else TransformerWindings
+        self._TransformerWindings = EMPTY
+        if TransformerWindings is not None:
+            self.TransformerWindings = TransformerWindings
 
         super(PowerTransformer, self).__init__(*args, **kw_args)
 
@@ -47,6 +49,7 @@ class PowerTransformer(Equipment):
         return self._TransformerWindings
 
     def setTransformerWindings(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._TransformerWindings:
             x.PowerTransformer = None
         for y in value:
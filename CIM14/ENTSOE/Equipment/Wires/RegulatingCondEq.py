@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Equipment.Core.ConductingEquipment import ConductingEquipment
+from CIM14.ENTSOE.Equipment.Element import AssociationList, EMPTY
 
 class RegulatingCondEq(ConductingEquipment):
     """A type of conducting equipment that can regulate a quanity (i.e. voltage or flow) at a specific point in the network. 
@@ -48,13 +49,14 @@ class RegulatingCondEq(ConductingEquipment):
 
     def setRegulatingControl(self, value):
         if self._RegulatingControl is not None:
-            filtered = [x for x in self.RegulatingControl.RegulatingCondEq if x != self]
-            self._RegulatingControl._RegulatingCondEq = filtered
+            self._RegulatingControl._RegulatingCondEq.discard(self)
 
         self._RegulatingControl = value
         if self._RegulatingControl is not None:
-            if self not in self._RegulatingControl._RegulatingCondEq:
-                self._RegulatingControl._RegulatingCondEq.append(self)
+            if self._RegulatingControl._RegulatingCondEq is EMPTY:
+                self._RegulatingControl._RegulatingCondEq = AssociationList([self])
+            else:
+                self._RegulatingControl._RegulatingCondEq.add(self)
 
     RegulatingControl = property(getRegulatingControl, setRegulatingControl)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Equipment.Core.PowerSystemResource import PowerSystemResource
+from CIM14.ENTSOE.Equipment.Element import AssociationList, EMPTY
 
 class TapChanger(PowerSystemResource):
     """Mechanism for changing transformer winding tap positions.
@@ -79,13 +80,14 @@ class TapChanger(PowerSystemResource):
 
     def setRegulatingControl(self, value):
         if self._RegulatingControl is not None:
-            filtered = [x for x in self.RegulatingControl.TapChanger if x != self]
-            self._RegulatingControl._TapChanger = filtered
+            self._RegulatingControl._TapChanger.discard(self)
 
         self._RegulatingControl = value
         if self._RegulatingControl is not None:
-            if self not in self._RegulatingControl._TapChanger:
-                self._RegulatingControl._TapChanger.append(self)
+            if self._RegulatingControl._TapChanger is EMPTY:
+                self._RegulatingControl._TapChanger = AssociationList([self])
+            else:
+                self._RegulatingControl._TapChanger.add(self)
 
     RegulatingControl = property(getRegulatingControl, setRegulatingControl)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Topology.Core.IdentifiedObject import IdentifiedObject
+from CIM14.ENTSOE.Topology.Element import AssociationList, EMPTY
 
 class ConnectivityNodeContainer(IdentifiedObject):
     """A base class for all objects that may contain ConnectivityNodes or TopologicalNodes.
@@ -29,8 +30,9 @@ class ConnectivityNodeContainer(IdentifiedObject):
 
         @param TopologicalNode: The topological nodes which belong to this connectivity node container.
         """
-        self._TopologicalNode = []
-        self.TopologicalNode = [] if TopologicalNode is None else TopologicalNode
+        self._TopologicalNode = EMPTY
+        if TopologicalNode is not None:
+            self.TopologicalNode = TopologicalNode
 
         super(ConnectivityNodeContainer, self).__init__(*args, **kw_args)
 
@@ -47,6 +49,7 @@ class ConnectivityNodeContainer(IdentifiedObject):
         return self._TopologicalNode
 
     def setTopologicalNode(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._TopologicalNode:
             x.ConnectivityNodeContainer = None
         for y in value:
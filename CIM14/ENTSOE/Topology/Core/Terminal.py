@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Topology.Core.IdentifiedObject import IdentifiedObject
+from CIM14.ENTSOE.Topology.Element import AssociationList, EMPTY
 
 class Terminal(IdentifiedObject):
     """An electrical connection point to a piece of conducting equipment. Terminals are connected at physical connection points called 'connectivity nodes'.
@@ -52,13 +53,14 @@ class Terminal(IdentifiedObject):
 
     def setTopologicalNode(self, value):
         if self._TopologicalNode is not None:
-            filtered = [x for x in self.TopologicalNode.Terminal if x != self]
-            self._TopologicalNode._Terminal = filtered
+            self._TopologicalNode._Terminal.discard(self)
 
         self._TopologicalNode = value
         if self._TopologicalNode is not None:
-            if self not in self._TopologicalNode._Terminal:
-                self._TopologicalNode._Terminal.append(self)
+            if self._TopologicalNode._Terminal is EMPTY:
+                self._TopologicalNode._Terminal = AssociationList([self])
+            else:
+                self._TopologicalNode._Terminal.add(self)
 
     TopologicalNode = property(getTopologicalNode, setTopologicalNode)
 
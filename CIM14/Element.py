@@ -19,6 +19,8 @@
 # IN THE SOFTWARE.
 
 
+from PyCIM.Association import AssociationList, EmptyList, EMPTY
+
 class Element(object):
 
     def __init__(self, UUID=''):
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61968.AssetModels.AssetModel import AssetModel
+from CIM14.Element import AssociationList, EMPTY
 
 class EndDeviceModel(AssetModel):
     """Documentation for particular end device product model made by a manufacturer.
@@ -29,8 +30,9 @@ class EndDeviceModel(AssetModel):
 
         @param EndDeviceAssets: All end device assets being of this model.
         """
-        self._EndDeviceAssets = []
-        self.EndDeviceAssets = [] if EndDeviceAssets is None else EndDeviceAssets
+        self._EndDeviceAssets = EMPTY
+        if EndDeviceAssets is not None:
+            self.EndDeviceAssets = EndDeviceAssets
 
         super(EndDeviceModel, self).__init__(*args, **kw_args)
 
@@ -47,6 +49,7 @@ class EndDeviceModel(AssetModel):
         return self._EndDeviceAssets
 
     def setEndDeviceAssets(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._EndDeviceAssets:
             x.EndDeviceModel = None
         for y in value:
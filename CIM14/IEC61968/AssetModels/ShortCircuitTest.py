@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61968.AssetModels.DistributionWindingTest import DistributionWindingTest
+from CIM14.Element import AssociationList, EMPTY
 
 class ShortCircuitTest(DistributionWindingTest):
     """Short-circuit test results include load losses and leakage impedances. For three-phase windings, the excitation can be positive sequence (the default) or zero sequence. There must be at least one short-circuited ('to') winding.
@@ -45,8 +46,9 @@ class ShortCircuitTest(DistributionWindingTest):
         #: Load losses from a positive-sequence or single-phase short-circuit test.
         self.loadLoss = loadLoss
 
-        self._ShortedWindingSpecs = []
-        self.ShortedWindingSpecs = [] if ShortedWindingSpecs is None else ShortedWindingSpecs
+        self._ShortedWindingSpecs = EMPTY
+        if ShortedWindingSpecs is not None:
+            self.ShortedWindingSpecs = ShortedWindingSpecs
 
         super(ShortCircuitTest, self).__init__(*args, **kw_args)
 
@@ -63,21 +65,28 @@ class ShortCircuitTest(DistributionWindingTest):
         return self._ShortedWindingSpecs
 
     def setShortedWindingSpecs(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ShortedWindingSpecs:
-            filtered = [q for q in p.ShortCircuitTests if q != self]
-            self._ShortedWindingSpecs._ShortCircuitTests = filtered
+            p._ShortCircuitTests.discard(self)
         for r in value:
-            if self not in r._ShortCircuitTests:
-                r._ShortCircuitTests.append(self)
+            if r._ShortCircuitTests is EMPTY:
+                r._ShortCircuitTests = AssociationList([self])
+            else:
+                r._ShortCircuitTests.add(self)
         self._ShortedWindingSpecs = value
 
     ShortedWindingSpecs = property(getShortedWindingSpecs, setShortedWindingSpecs)
 
     def addShortedWindingSpecs(self, *ShortedWindingSpecs):
         for obj in ShortedWindingSpecs:
-            if self not in obj._ShortCircuitTests:
-                obj._ShortCircuitTests.append(self)
-            self._ShortedWindingSpecs.append(obj)
+            if obj._ShortCircuitTests is EMPTY:
+                obj._ShortCircuitTests = AssociationList([self])
+            else:
+                obj._ShortCircuitTests.add(self)
+            if self._ShortedWindingSpecs is EMPTY:
+                self._ShortedWindingSpecs = AssociationList([obj])
+            else:
+                self._ShortedWindingSpecs.add(obj)
 
     def removeShortedWindingSpecs(self, *ShortedWindingSpecs):
         for obj in ShortedWindingSpecs:
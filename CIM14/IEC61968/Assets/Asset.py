@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import AssociationList, EMPTY
 
 class Asset(IdentifiedObject):
     """Tangible resource of the utility, including power system equipment, cabinets, buildings, etc. For electrical network equipment, the role of the asset is defined through PowerSystemResource and its subclasses, defined mainly in the Wires model (refer to IEC61970-301 and model package IEC61970::Wires). Asset description places emphasis on the physical characteristics of the equipment fulfilling that role.
@@ -87,33 +88,39 @@ class Asset(IdentifiedObject):
         #: Condition of asset in inventory or at time of installation. Examples include new, rebuilt, overhaul required, other. Refer to inspection data for information on the most current condition of the asset.
         self.initialCondition = initialCondition
 
-        self._PowerSystemResources = []
-        self.PowerSystemResources = [] if PowerSystemResources is None else PowerSystemResources
+        self._PowerSystemResources = EMPTY
+        if PowerSystemResources is not None:
+            self.PowerSystemResources = PowerSystemResources
 
-        self._Properties = []
-        self.Properties = [] if Properties is None else Properties
+        self._Properties = EMPTY
+        if Properties is not None:
+            self.Properties = Properties
 
         self.acceptanceTest = acceptanceTest
 
-        self._ActivityRecords = []
-        self.ActivityRecords = [] if ActivityRecords is None else ActivityRecords
+        self._ActivityRecords = EMPTY
+        if ActivityRecords is not None:
+            self.ActivityRecords = ActivityRecords
 
         self._Location = None
         self.Location = Location
 
-        self._AssetFunctions = []
-        self.AssetFunctions = [] if AssetFunctions is None else AssetFunctions
+        self._AssetFunctions = EMPTY
+        if AssetFunctions is not None:
+            self.AssetFunctions = AssetFunctions
 
-        self._Measurements = []
-        self.Measurements = [] if Measurements is None else Measurements
+        self._Measurements = EMPTY
+        if Measurements is not None:
+            self.Measurements = Measurements
 
         self._AssetContainer = None
         self.AssetContainer = AssetContainer
 
         self.status = status
 
-        self._Ratings = []
-        self.Ratings = [] if Ratings is None else Ratings
+        self._Ratings = EMPTY
+        if Ratings is not None:
+            self.Ratings = Ratings
 
         self.electronicAddress = electronicAddress
 
@@ -132,21 +139,28 @@ class Asset(IdentifiedObject):
         return self._PowerSystemResources
 
     def setPowerSystemResources(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._PowerSystemResources:
-            filtered = [q for q in p.Assets if q != self]
-            self._PowerSystemResources._Assets = filtered
+            p._Assets.discard(self)
         for r in value:
-            if self not in r._Assets:
-                r._Assets.append(self)
+            if r._Assets is EMPTY:
+                r._Assets = AssociationList([self])
+            else:
+                r._Assets.add(self)
         self._PowerSystemResources = value
 
     PowerSystemResources = property(getPowerSystemResources, setPowerSystemResources)
 
     def addPowerSystemResources(self, *PowerSystemResources):
         for obj in PowerSystemResources:
-            if self not in obj._Assets:
-                obj._Assets.append(self)
-            self._PowerSystemResources.append(obj)
+            if obj._Assets is EMPTY:
+                obj._Assets = AssociationList([self])
+            else:
+                obj._Assets.add(self)
+            if self._PowerSystemResources is EMPTY:
+                self._PowerSystemResources = AssociationList([obj])
+            else:
+                self._PowerSystemResources.add(obj)
 
     def removePowerSystemResources(self, *PowerSystemResources):
         for obj in PowerSystemResources:
@@ -160,21 +174,28 @@ class Asset(IdentifiedObject):
         return self._Properties
 
     def setProperties(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Properties:
-            filtered = [q for q in p.PropertyAssets if q != self]
-            self._Properties._PropertyAssets = filtered
+            p._PropertyAssets.discard(self)
         for r in value:
-            if self not in r._PropertyAssets:
-                r._PropertyAssets.append(self)
+            if r._PropertyAssets is EMPTY:
+                r._PropertyAssets = AssociationList([self])
+            else:
+                r._PropertyAssets.add(self)
         self._Properties = value
 
     Properties = property(getProperties, setProperties)
 
     def addProperties(self, *Properties):
         for obj in Properties:
-            if self not in obj._PropertyAssets:
-                obj._PropertyAssets.append(self)
-            self._Properties.append(obj)
+            if obj._PropertyAssets is EMPTY:
+                obj._PropertyAssets = AssociationList([self])
+            else:
+                obj._PropertyAssets.add(self)
+            if self._Properties is EMPTY:
+                self._Properties = AssociationList([obj])
+            else:
+                self._Properties.add(obj)
 
     def removeProperties(self, *Properties):
         for obj in Properties:
@@ -191,21 +212,28 @@ class Asset(IdentifiedObject):
         return self._ActivityRecords
 
     def setActivityRecords(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ActivityRecords:
-            filtered = [q for q in p.Assets if q != self]
-            self._ActivityRecords._Assets = filtered
+            p._Assets.discard(self)
         for r in value:
-            if self not in r._Assets:
-                r._Assets.append(self)
+            if r._Assets is EMPTY:
+                r._Assets = AssociationList([self])
+            else:
+                r._Assets.add(self)
         self._ActivityRecords = value
 
     ActivityRecords = property(getActivityRecords, setActivityRecords)
 
     def addActivityRecords(self, *ActivityRecords):
         for obj in ActivityRecords:
-            if self not in obj._Assets:
-                obj._Assets.append(self)
-            self._ActivityRecords.append(obj)
+            if obj._Assets is EMPTY:
+                obj._Assets = AssociationList([self])
+            else:
+                obj._Assets.add(self)
+            if self._ActivityRecords is EMPTY:
+                self._ActivityRecords = AssociationList([obj])
+            else:
+                self._ActivityRecords.add(obj)
 
     def removeActivityRecords(self, *ActivityRecords):
         for obj in ActivityRecords:
@@ -220,13 +248,14 @@ class Asset(IdentifiedObject):
 
     def setLocation(self, value):
         if self._Location is not None:
-            filtered = [x for x in self.Location.Assets if x != self]
-            self._Location._Assets = filtered
+            self._Location._Assets.discard(self)
 
         self._Location = value
         if self._Location is not None:
-            if self not in self._Location._Assets:
-                self._Location._Assets.append(self)
+            if self._Location._Assets is EMPTY:
+                self._Location._Assets = AssociationList([self])
+            else:
+                self._Location._Assets.add(self)
 
     Location = property(getLocation, setLocation)
 
@@ -235,6 +264,7 @@ class Asset(IdentifiedObject):
         return self._AssetFunctions
 
     def setAssetFunctions(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._AssetFunctions:
             x.Asset = None
         for y in value:
@@ -256,6 +286,7 @@ class Asset(IdentifiedObject):
         return self._Measurements
 
     def setMeasurements(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Measurements:
             x.Asset = None
         for y in value:
@@ -278,13 +309,14 @@ class Asset(IdentifiedObject):
 
     def setAssetContainer(self, value):
         if self._AssetContainer is not None:
-            filtered = [x for x in self.AssetContainer.Assets if x != self]
-            self._AssetContainer._Assets = filtered
+            self._AssetContainer._Assets.discard(self)
 
         self._AssetContainer = value
         if self._AssetContainer is not None:
-            if self not in self._AssetContainer._Assets:
-                self._AssetContainer._Assets.append(self)
+            if self._AssetContainer._Assets is EMPTY:
+                self._AssetContainer._Assets = AssociationList([self])
+            else:
+                self._AssetContainer._Assets.add(self)
 
     AssetContainer = property(getAssetContainer, setAssetContainer)
 
@@ -297,21 +329,28 @@ class Asset(IdentifiedObject):
         return self._Ratings
 
     def setRatings(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Ratings:
-            filtered = [q for q in p.RatingAssets if q != self]
-            self._Ratings._RatingAssets = filtered
+            p._RatingAssets.discard(self)
         for r in value:
-            if self not in r._RatingAssets:
-                r._RatingAssets.append(self)
+            if r._RatingAssets is EMPTY:
+                r._RatingAssets = AssociationList([self])
+            else:
+                r._RatingAssets.add(self)
         self._Ratings = value
 
     Ratings = property(getRatings, setRatings)
 
     def addRatings(self, *Ratings):
         for obj in Ratings:
-            if self not in obj._RatingAssets:
-                obj._RatingAssets.append(self)
-            self._Ratings.append(obj)
+            if obj._RatingAssets is EMPTY:
+                obj._RatingAssets = AssociationList([self])
+            else:
+                obj._RatingAssets.add(self)
+            if self._Ratings is EMPTY:
+                self._Ratings = AssociationList([obj])
+            else:
+                self._Ratings.add(obj)
 
     def removeRatings(self, *Ratings):
         for obj in Ratings:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61968.Assets.Asset import Asset
+from CIM14.Element import AssociationList, EMPTY
 
 class AssetContainer(Asset):
     """Asset that is aggregation of other assets such as conductors, transformers, switchgear, land, fences, buildings, equipment, vehicles, etc.
@@ -30,11 +31,13 @@ class AssetContainer(Asset):
         @param Seals: All seals applied to this asset container.
         @param Assets:
         """
-        self._Seals = []
-        self.Seals = [] if Seals is None else Seals
+        self._Seals = EMPTY
+        if Seals is not None:
+            self.Seals = Seals
 
-        self._Assets = []
-        self.Assets = [] if Assets is None else Assets
+        self._Assets = EMPTY
+        if Assets is not None:
+            self.Assets = Assets
 
         super(AssetContainer, self).__init__(*args, **kw_args)
 
@@ -51,6 +54,7 @@ class AssetContainer(Asset):
         return self._Seals
 
     def setSeals(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Seals:
             x.AssetContainer = None
         for y in value:
@@ -72,6 +76,7 @@ class AssetContainer(Asset):
         return self._Assets
 
     def setAssets(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Assets:
             x.AssetContainer = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import AssociationList, EMPTY
 
 class AssetFunction(IdentifiedObject):
     """Function performed by an asset.
@@ -67,13 +68,14 @@ class AssetFunction(IdentifiedObject):
 
     def setAsset(self, value):
         if self._Asset is not None:
-            filtered = [x for x in self.Asset.AssetFunctions if x != self]
-            self._Asset._AssetFunctions = filtered
+            self._Asset._AssetFunctions.discard(self)
 
         self._Asset = value
         if self._Asset is not None:
-            if self not in self._Asset._AssetFunctions:
-                self._Asset._AssetFunctions.append(self)
+            if self._Asset._AssetFunctions is EMPTY:
+                self._Asset._AssetFunctions = AssociationList([self])
+            else:
+                self._Asset._AssetFunctions.add(self)
 
     Asset = property(getAsset, setAsset)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import AssociationList, EMPTY
 
 class Seal(IdentifiedObject):
     """Physically controls access to AssetContainers.
@@ -64,13 +65,14 @@ class Seal(IdentifiedObject):
 
     def setAssetContainer(self, value):
         if self._AssetContainer is not None:
-            filtered = [x for x in self.AssetContainer.Seals if x != self]
-            self._AssetContainer._Seals = filtered
+            self._AssetContainer._Seals.discard(self)
 
         self._AssetContainer = value
         if self._AssetContainer is not None:
-            if self not in self._AssetContainer._Seals:
-                self._AssetContainer._Seals.append(self)
+            if self._AssetContainer._Seals is EMPTY:
+                self._AssetContainer._Seals = AssociationList([self])
+            else:
+                self._AssetContainer._Seals.add(self)
 
     AssetContainer = property(getAssetContainer, setAssetContainer)
 
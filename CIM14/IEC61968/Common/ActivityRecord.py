@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import AssociationList, EMPTY
 
 class ActivityRecord(IdentifiedObject):
     """Records activity for an entity at a point in time; activity may be for an event that has already occurred or for a planned activity.
@@ -47,11 +48,13 @@ class ActivityRecord(IdentifiedObject):
         #: Category of event resulting in this activity record.
         self.category = category
 
-        self._Documents = []
-        self.Documents = [] if Documents is None else Documents
+        self._Documents = EMPTY
+        if Documents is not None:
+            self.Documents = Documents
 
-        self._Assets = []
-        self.Assets = [] if Assets is None else Assets
+        self._Assets = EMPTY
+        if Assets is not None:
+            self.Assets = Assets
 
         self.status = status
 
@@ -70,21 +73,28 @@ class ActivityRecord(IdentifiedObject):
         return self._Documents
 
     def setDocuments(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Documents:
-            filtered = [q for q in p.ActivityRecords if q != self]
-            self._Documents._ActivityRecords = filtered
+            p._ActivityRecords.discard(self)
         for r in value:
-            if self not in r._ActivityRecords:
-                r._ActivityRecords.append(self)
+            if r._ActivityRecords is EMPTY:
+                r._ActivityRecords = AssociationList([self])
+            else:
+                r._ActivityRecords.add(self)
         self._Documents = value
 
     Documents = property(getDocuments, setDocuments)
 
     def addDocuments(self, *Documents):
         for obj in Documents:
-            if self not in obj._ActivityRecords:
-                obj._ActivityRecords.append(self)
-            self._Documents.append(obj)
+            if obj._ActivityRecords is EMPTY:
+                obj._ActivityRecords = AssociationList([self])
+            else:
+                obj._ActivityRecords.add(self)
+            if self._Documents is EMPTY:
+                self._Documents = AssociationList([obj])
+            else:
+                self._Documents.add(obj)
 
     def removeDocuments(self, *Documents):
         for obj in Documents:
@@ -98,21 +108,28 @@ class ActivityRecord(IdentifiedObject):
         return self._Assets
 
     def setAssets(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Assets:
-            filtered = [q for q in p.ActivityRecords if q != self]
-            self._Assets._ActivityRecords = filtered
+            p._ActivityRecords.discard(self)
         for r in value:
-            if self not in r._ActivityRecords:
-                r._ActivityRecords.append(self)
+            if r._ActivityRecords is EMPTY:
+                r._ActivityRecords = AssociationList([self])
+            else:
+                r._ActivityRecords.add(self)
         self._Assets = value
 
     Assets = property(getAssets, setAssets)
 
     def addAssets(self, *Assets):
         for obj in Assets:
-            if self not in obj._ActivityRecords:
-                obj._ActivityRecords.append(self)
-            self._Assets.append(obj)
+            if obj._ActivityRecords is EMPTY:
+                obj._ActivityRecords = AssociationList([self])
+            else:
+                obj._ActivityRecords.add(self)
+            if self._Assets is EMPTY:
+                self._Assets = AssociationList([obj])
+            else:
+                self._Assets.add(obj)
 
     def removeAssets(self, *Assets):
         for obj in Assets:
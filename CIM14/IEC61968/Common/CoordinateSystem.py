@@ -18,7 +18,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from CIM14.Element import Element
+from CIM14.Element import Element, AssociationList, EMPTY
 
 class CoordinateSystem(Element):
     """Coordinate reference system.
@@ -37,8 +37,9 @@ class CoordinateSystem(Element):
         self._Location = None
         self.Location = Location
 
-        self._PositionPoints = []
-        self.PositionPoints = [] if PositionPoints is None else PositionPoints
+        self._PositionPoints = EMPTY
+        if PositionPoints is not None:
+            self.PositionPoints = PositionPoints
 
         super(CoordinateSystem, self).__init__(*args, **kw_args)
 
@@ -56,13 +57,14 @@ class CoordinateSystem(Element):
 
     def setLocation(self, value):
         if self._Location is not None:
-            filtered = [x for x in self.Location.CoordinateSystems if x != self]
-            self._Location._CoordinateSystems = filtered
+            self._Location._CoordinateSystems.discard(self)
 
         self._Location = value
         if self._Location is not None:
-            if self not in self._Location._CoordinateSystems:
-                self._Location._CoordinateSystems.append(self)
+            if self._Location._CoordinateSystems is EMPTY:
+                self._Location._CoordinateSystems = AssociationList([self])
+            else:
+                self._Location._CoordinateSystems.add(self)
 
     Location = property(getLocation, setLocation)
 
@@ -72,6 +74,7 @@ class CoordinateSystem(Element):
         return self._PositionPoints
 
     def setPositionPoints(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._PositionPoints:
             x.CoordinateSystem = None
         for y in value:
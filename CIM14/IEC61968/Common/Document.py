@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import AssociationList, EMPTY
 
 class Document(IdentifiedObject):
     """Parent class for different groupings of information collected and managed as a part of a business process. It will frequently contain references to other objects, such as assets, people and power system resources.
@@ -61,13 +62,15 @@ class Document(IdentifiedObject):
 
         self.status = status
 
-        self._ActivityRecords = []
-        self.ActivityRecords = [] if ActivityRecords is None else ActivityRecords
+        self._ActivityRecords = EMPTY
+        if ActivityRecords is not None:
+            self.ActivityRecords = ActivityRecords
 
         self.docStatus = docStatus
 
-        self._Measurements = []
-        self.Measurements = [] if Measurements is None else Measurements
+        self._Measurements = EMPTY
+        if Measurements is not None:
+            self.Measurements = Measurements
 
         super(Document, self).__init__(*args, **kw_args)
 
@@ -90,21 +93,28 @@ class Document(IdentifiedObject):
         return self._ActivityRecords
 
     def setActivityRecords(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ActivityRecords:
-            filtered = [q for q in p.Documents if q != self]
-            self._ActivityRecords._Documents = filtered
+            p._Documents.discard(self)
         for r in value:
-            if self not in r._Documents:
-                r._Documents.append(self)
+            if r._Documents is EMPTY:
+                r._Documents = AssociationList([self])
+            else:
+                r._Documents.add(self)
         self._ActivityRecords = value
 
     ActivityRecords = property(getActivityRecords, setActivityRecords)
 
     def addActivityRecords(self, *ActivityRecords):
         for obj in ActivityRecords:
-            if self not in obj._Documents:
-                obj._Documents.append(self)
-            self._ActivityRecords.append(obj)
+            if obj._Documents is EMPTY:
+                obj._Documents = AssociationList([self])
+            else:
+                obj._Documents.add(self)
+            if self._ActivityRecords is EMPTY:
+                self._ActivityRecords = AssociationList([obj])
+            else:
+                self._ActivityRecords.add(obj)
 
     def removeActivityRecords(self, *ActivityRecords):
         for obj in ActivityRecords:
@@ -121,21 +131,28 @@ class Document(IdentifiedObject):
         return self._Measurements
 
     def setMeasurements(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Measurements:
-            filtered = [q for q in p.Documents if q != self]
-            self._Measurements._Documents = filtered
+            p._Documents.discard(self)
         for r in value:
-            if self not in r._Documents:
-                r._Documents.append(self)
+            if r._Documents is EMPTY:
+                r._Documents = AssociationList([self])
+            else:
+                r._Documents.add(self)
         self._Measurements = value
 
     Measurements = property(getMeasurements, setMeasurements)
 
     def addMeasurements(self, *Measurements):
         for obj in Measurements:
-            if self not in obj._Documents:
-                obj._Documents.append(self)
-            self._Measurements.append(obj)
+            if obj._Documents is EMPTY:
+                obj._Documents = AssociationList([self])
+            else:
+                obj._Documents.add(self)
+            if self._Measurements is EMPTY:
+                self._Measurements = AssociationList([obj])
+            else:
+                self._Measurements.add(obj)
 
     def removeMeasurements(self, *Measurements):
         for obj in Measurements:
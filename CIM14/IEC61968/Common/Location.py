@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import AssociationList, EMPTY
 
 class Location(IdentifiedObject):
     """The place, scene, or point of something where someone or something has been, is, and/or will be at a given moment in time. It is defined with one or more postition points (coordinates) in a given coordinate system.
@@ -55,22 +56,27 @@ class Location(IdentifiedObject):
         #: Category by utility's corporate standards and practices, relative to the location itself (e.g., geographical, functional accounting, etc., not a given property that happens to exist at that location).
         self.category = category
 
-        self._PositionPoints = []
-        self.PositionPoints = [] if PositionPoints is None else PositionPoints
+        self._PositionPoints = EMPTY
+        if PositionPoints is not None:
+            self.PositionPoints = PositionPoints
 
-        self._PowerSystemResources = []
-        self.PowerSystemResources = [] if PowerSystemResources is None else PowerSystemResources
+        self._PowerSystemResources = EMPTY
+        if PowerSystemResources is not None:
+            self.PowerSystemResources = PowerSystemResources
 
-        self._CoordinateSystems = []
-        self.CoordinateSystems = [] if CoordinateSystems is None else CoordinateSystems
+        self._CoordinateSystems = EMPTY
+        if CoordinateSystems is not None:
+            self.CoordinateSystems = CoordinateSystems
 
-        self._Measurements = []
-        self.Measurements = [] if Measurements is None else Measurements
+        self._Measurements = EMPTY
+        if Measurements is not None:
+            self.Measurements = Measurements
 
         self.secondaryAddress = secondaryAddress
 
-        self._Assets = []
-        self.Assets = [] if Assets is None else Assets
+        self._Assets = EMPTY
+        if Assets is not None:
+            self.Assets = Assets
 
         self.phone2 = phone2
 
@@ -97,6 +103,7 @@ class Location(IdentifiedObject):
         return self._PositionPoints
 
     def setPositionPoints(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._PositionPoints:
             x.Location = None
         for y in value:
@@ -119,6 +126,7 @@ class Location(IdentifiedObject):
         return self._PowerSystemResources
 
     def setPowerSystemResources(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._PowerSystemResources:
             x.Location = None
         for y in value:
@@ -141,6 +149,7 @@ class Location(IdentifiedObject):
         return self._CoordinateSystems
 
     def setCoordinateSystems(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._CoordinateSystems:
             x.Location = None
         for y in value:
@@ -162,21 +171,28 @@ class Location(IdentifiedObject):
         return self._Measurements
 
     def setMeasurements(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Measurements:
-            filtered = [q for q in p.Locations if q != self]
-            self._Measurements._Locations = filtered
+            p._Locations.discard(self)
         for r in value:
-            if self not in r._Locations:
-                r._Locations.append(self)
+            if r._Locations is EMPTY:
+                r._Locations = AssociationList([self])
+            else:
+                r._Locations.add(self)
         self._Measurements = value
 
     Measurements = property(getMeasurements, setMeasurements)
 
     def addMeasurements(self, *Measurements):
         for obj in Measurements:
-            if self not in obj._Locations:
-                obj._Locations.append(self)
-            self._Measurements.append(obj)
+            if obj._Locations is EMPTY:
+                obj._Locations = AssociationList([self])
+            else:
+                obj._Locations.add(self)
+            if self._Measurements is EMPTY:
+                self._Measurements = AssociationList([obj])
+            else:
+                self._Measurements.add(obj)
 
     def removeMeasurements(self, *Measurements):
         for obj in Measurements:
@@ -193,6 +209,7 @@ class Location(IdentifiedObject):
         return self._Assets
 
     def setAssets(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Assets:
             x.Location = None
         for y in value:
@@ -18,7 +18,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from CIM14.Element import Element
+from CIM14.Element import Element, AssociationList, EMPTY
 
 class PositionPoint(Element):
     """Set of spatial coordinates that determine a point. Use a single position point instance to desribe a point-oriented location. Use a sequence of position points to describe a line-oriented object (physical location of non-point oriented objects like cables or lines), or area of an object (like a substation or a geographical zone - in this case, have first and last position point with the same values).
@@ -68,13 +68,14 @@ class PositionPoint(Element):
 
     def setLocation(self, value):
         if self._Location is not None:
-            filtered = [x for x in self.Location.PositionPoints if x != self]
-            self._Location._PositionPoints = filtered
+            self._Location._PositionPoints.discard(self)
 
         self._Location = value
         if self._Location is not None:
-            if self not in self._Location._PositionPoints:
-                self._Location._PositionPoints.append(self)
+            if self._Location._PositionPoints is EMPTY:
+                self._Location._PositionPoints = AssociationList([self])
+            else:
+                self._Location._PositionPoints.add(self)
 
     Location = property(getLocation, setLocation)
 
@@ -85,13 +86,14 @@ class PositionPoint(Element):
 
     def setCoordinateSystem(self, value):
         if self._CoordinateSystem is not None:
-            filtered = [x for x in self.CoordinateSystem.PositionPoints if x != self]
-            self._CoordinateSystem._PositionPoints = filtered
+            self._CoordinateSystem._PositionPoints.discard(self)
 
         self._CoordinateSystem = value
         if self._CoordinateSystem is not None:
-            if self not in self._CoordinateSystem._PositionPoints:
-                self._CoordinateSystem._PositionPoints.append(self)
+            if self._CoordinateSystem._PositionPoints is EMPTY:
+                self._CoordinateSystem._PositionPoints = AssociationList([self])
+            else:
+                self._CoordinateSystem._PositionPoints.add(self)
 
     CoordinateSystem = property(getCoordinateSystem, setCoordinateSystem)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import AssociationList, EMPTY
 
 class TimePoint(IdentifiedObject):
     """A point in time within a sequence of points in time relative to a TimeSchedule.
@@ -66,13 +67,14 @@ class TimePoint(IdentifiedObject):
 
     def setTimeSchedule(self, value):
         if self._TimeSchedule is not None:
-            filtered = [x for x in self.TimeSchedule.TimePoints if x != self]
-            self._TimeSchedule._TimePoints = filtered
+            self._TimeSchedule._TimePoints.discard(self)
 
         self._TimeSchedule = value
         if self._TimeSchedule is not None:
-            if self not in self._TimeSchedule._TimePoints:
-                self._TimeSchedule._TimePoints.append(self)
+            if self._TimeSchedule._TimePoints is EMPTY:
+                self._TimeSchedule._TimePoints = AssociationList([self])
+            else:
+                self._TimeSchedule._TimePoints.add(self)
 
     TimeSchedule = property(getTimeSchedule, setTimeSchedule)
 
@@ -18,7 +18,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from CIM14.Element import Element
+from CIM14.Element import Element, AssociationList, EMPTY
 
 class UserAttribute(Element):
     """Generic name-value pair class, with optional sequence number and units for value; can be used to model parts of information exchange when concrete types are not known in advance.
@@ -43,14 +43,16 @@ class UserAttribute(Element):
         #: Name of an attribute.
         self.name = name
 
-        self._PropertyAssets = []
-        self.PropertyAssets = [] if PropertyAssets is None else PropertyAssets
+        self._PropertyAssets = EMPTY
+        if PropertyAssets is not None:
+            self.PropertyAssets = PropertyAssets
 
         self._Transaction = None
         self.Transaction = Transaction
 
-        self._RatingAssets = []
-        self.RatingAssets = [] if RatingAssets is None else RatingAssets
+        self._RatingAssets = EMPTY
+        if RatingAssets is not None:
+            self.RatingAssets = RatingAssets
 
         super(UserAttribute, self).__init__(*args, **kw_args)
 
@@ -66,21 +68,28 @@ class UserAttribute(Element):
         return self._PropertyAssets
 
     def setPropertyAssets(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._PropertyAssets:
-            filtered = [q for q in p.Properties if q != self]
-            self._PropertyAssets._Properties = filtered
+            p._Properties.discard(self)
         for r in value:
-            if self not in r._Properties:
-                r._Properties.append(self)
+            if r._Properties is EMPTY:
+                r._Properties = AssociationList([self])
+            else:
+                r._Properties.add(self)
         self._PropertyAssets = value
 
     PropertyAssets = property(getPropertyAssets, setPropertyAssets)
 
     def addPropertyAssets(self, *PropertyAssets):
         for obj in PropertyAssets:
-            if self not in obj._Properties:
-                obj._Properties.append(self)
-            self._PropertyAssets.append(obj)
+            if obj._Properties is EMPTY:
+                obj._Properties = AssociationList([self])
+            else:
+                obj._Properties.add(self)
+            if self._PropertyAssets is EMPTY:
+                self._PropertyAssets = AssociationList([obj])
+            else:
+                self._PropertyAssets.add(obj)
 
     def removePropertyAssets(self, *PropertyAssets):
         for obj in PropertyAssets:
@@ -95,13 +104,14 @@ class UserAttribute(Element):
 
     def setTransaction(self, value):
         if self._Transaction is not None:
-            filtered = [x for x in self.Transaction.UserAttributes if x != self]
-            self._Transaction._UserAttributes = filtered
+            self._Transaction._UserAttributes.discard(self)
 
         self._Transaction = value
         if self._Transaction is not None:
-            if self not in self._Transaction._UserAttributes:
-                self._Transaction._UserAttributes.append(self)
+            if self._Transaction._UserAttributes is EMPTY:
+                self._Transaction._UserAttributes = AssociationList([self])
+            else:
+                self._Transaction._UserAttributes.add(self)
 
     Transaction = property(getTransaction, setTransaction)
 
@@ -110,21 +120,28 @@ class UserAttribute(Element):
         return self._RatingAssets
 
     def setRatingAssets(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._RatingAssets:
-            filtered = [q for q in p.Ratings if q != self]
-            self._RatingAssets._Ratings = filtered
+            p._Ratings.discard(self)
         for r in value:
-            if self not in r._Ratings:
-                r._Ratings.append(self)
+            if r._Ratings is EMPTY:
+                r._Ratings = AssociationList([self])
+            else:
+                r._Ratings.add(self)
         self._RatingAssets = value
 
     RatingAssets = property(getRatingAssets, setRatingAssets)
 
     def addRatingAssets(self, *RatingAssets):
         for obj in RatingAssets:
-            if self not in obj._Ratings:
-                obj._Ratings.append(self)
-            self._RatingAssets.append(obj)
+            if obj._Ratings is EMPTY:
+                obj._Ratings = AssociationList([self])
+            else:
+                obj._Ratings.add(self)
+            if self._RatingAssets is EMPTY:
+                self._RatingAssets = AssociationList([obj])
+            else:
+                self._RatingAssets.add(obj)
 
     def removeRatingAssets(self, *RatingAssets):
         for obj in RatingAssets:
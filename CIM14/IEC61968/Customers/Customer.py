@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61968.Common.Organisation import Organisation
+from CIM14.Element import AssociationList, EMPTY
 
 class Customer(Organisation):
     """Organisation receiving services from ServiceSupplier.
@@ -50,14 +51,17 @@ class Customer(Organisation):
 
         self.status = status
 
-        self._Works = []
-        self.Works = [] if Works is None else Works
+        self._Works = EMPTY
+        if Works is not None:
+            self.Works = Works
 
-        self._CustomerAgreements = []
-        self.CustomerAgreements = [] if CustomerAgreements is None else CustomerAgreements
+        self._CustomerAgreements = EMPTY
+        if CustomerAgreements is not None:
+            self.CustomerAgreements = CustomerAgreements
 
-        self._EndDeviceAssets = []
-        self.EndDeviceAssets = [] if EndDeviceAssets is None else EndDeviceAssets
+        self._EndDeviceAssets = EMPTY
+        if EndDeviceAssets is not None:
+            self.EndDeviceAssets = EndDeviceAssets
 
         super(Customer, self).__init__(*args, **kw_args)
 
@@ -77,21 +81,28 @@ class Customer(Organisation):
         return self._Works
 
     def setWorks(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Works:
-            filtered = [q for q in p.Customers if q != self]
-            self._Works._Customers = filtered
+            p._Customers.discard(self)
         for r in value:
-            if self not in r._Customers:
-                r._Customers.append(self)
+            if r._Customers is EMPTY:
+                r._Customers = AssociationList([self])
+            else:
+                r._Customers.add(self)
         self._Works = value
 
     Works = property(getWorks, setWorks)
 
     def addWorks(self, *Works):
         for obj in Works:
-            if self not in obj._Customers:
-                obj._Customers.append(self)
-            self._Works.append(obj)
+            if obj._Customers is EMPTY:
+                obj._Customers = AssociationList([self])
+            else:
+                obj._Customers.add(self)
+            if self._Works is EMPTY:
+                self._Works = AssociationList([obj])
+            else:
+                self._Works.add(obj)
 
     def removeWorks(self, *Works):
         for obj in Works:
@@ -105,6 +116,7 @@ class Customer(Organisation):
         return self._CustomerAgreements
 
     def setCustomerAgreements(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._CustomerAgreements:
             x.Customer = None
         for y in value:
@@ -127,6 +139,7 @@ class Customer(Organisation):
         return self._EndDeviceAssets
 
     def setEndDeviceAssets(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._EndDeviceAssets:
             x.Customer = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61968.Common.Document import Document
+from CIM14.Element import AssociationList, EMPTY
 
 class CustomerAccount(Document):
     """Assignment of a group of products and services purchased by the Customer through a CustomerAgreement, used as a mechanism for customer billing and payment. It contains common information from the various types of CustomerAgreements to create billings (invoices) for a Customer and receive payment.
@@ -30,11 +31,13 @@ class CustomerAccount(Document):
         @param PaymentTransactions: All payment transactions for this customer account.
         @param CustomerAgreements: All agreements for this customer account.
         """
-        self._PaymentTransactions = []
-        self.PaymentTransactions = [] if PaymentTransactions is None else PaymentTransactions
+        self._PaymentTransactions = EMPTY
+        if PaymentTransactions is not None:
+            self.PaymentTransactions = PaymentTransactions
 
-        self._CustomerAgreements = []
-        self.CustomerAgreements = [] if CustomerAgreements is None else CustomerAgreements
+        self._CustomerAgreements = EMPTY
+        if CustomerAgreements is not None:
+            self.CustomerAgreements = CustomerAgreements
 
         super(CustomerAccount, self).__init__(*args, **kw_args)
 
@@ -51,6 +54,7 @@ class CustomerAccount(Document):
         return self._PaymentTransactions
 
     def setPaymentTransactions(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._PaymentTransactions:
             x.CustomerAccount = None
         for y in value:
@@ -73,6 +77,7 @@ class CustomerAccount(Document):
         return self._CustomerAgreements
 
     def setCustomerAgreements(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._CustomerAgreements:
             x.CustomerAccount = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61968.Common.Agreement import Agreement
+from CIM14.Element import AssociationList, EMPTY
 
 class CustomerAgreement(Agreement):
     """Agreement between the Customer and the ServiceSupplier to pay for service at a specific ServiceLocation. It records certain billing information about the type of service provided at the ServiceLocation and is used during charge creation to determine the type of service.
@@ -58,35 +59,42 @@ class CustomerAgreement(Agreement):
         self._ServiceSupplier = None
         self.ServiceSupplier = ServiceSupplier
 
-        self._PricingStructures = []
-        self.PricingStructures = [] if PricingStructures is None else PricingStructures
+        self._PricingStructures = EMPTY
+        if PricingStructures is not None:
+            self.PricingStructures = PricingStructures
 
-        self._ServiceLocations = []
-        self.ServiceLocations = [] if ServiceLocations is None else ServiceLocations
+        self._ServiceLocations = EMPTY
+        if ServiceLocations is not None:
+            self.ServiceLocations = ServiceLocations
 
         self._ServiceCategory = None
         self.ServiceCategory = ServiceCategory
 
-        self._MeterReadings = []
-        self.MeterReadings = [] if MeterReadings is None else MeterReadings
+        self._MeterReadings = EMPTY
+        if MeterReadings is not None:
+            self.MeterReadings = MeterReadings
 
         self._CustomerAccount = None
         self.CustomerAccount = CustomerAccount
 
-        self._AuxiliaryAgreements = []
-        self.AuxiliaryAgreements = [] if AuxiliaryAgreements is None else AuxiliaryAgreements
+        self._AuxiliaryAgreements = EMPTY
+        if AuxiliaryAgreements is not None:
+            self.AuxiliaryAgreements = AuxiliaryAgreements
 
-        self._EndDeviceControls = []
-        self.EndDeviceControls = [] if EndDeviceControls is None else EndDeviceControls
+        self._EndDeviceControls = EMPTY
+        if EndDeviceControls is not None:
+            self.EndDeviceControls = EndDeviceControls
 
         self._Customer = None
         self.Customer = Customer
 
-        self._ServiceDeliveryPoints = []
-        self.ServiceDeliveryPoints = [] if ServiceDeliveryPoints is None else ServiceDeliveryPoints
+        self._ServiceDeliveryPoints = EMPTY
+        if ServiceDeliveryPoints is not None:
+            self.ServiceDeliveryPoints = ServiceDeliveryPoints
 
-        self._Equipments = []
-        self.Equipments = [] if Equipments is None else Equipments
+        self._Equipments = EMPTY
+        if Equipments is not None:
+            self.Equipments = Equipments
 
         super(CustomerAgreement, self).__init__(*args, **kw_args)
 
@@ -104,13 +112,14 @@ class CustomerAgreement(Agreement):
 
     def setDemandResponseProgram(self, value):
         if self._DemandResponseProgram is not None:
-            filtered = [x for x in self.DemandResponseProgram.CustomerAgreements if x != self]
-            self._DemandResponseProgram._CustomerAgreements = filtered
+            self._DemandResponseProgram._CustomerAgreements.discard(self)
 
         self._DemandResponseProgram = value
         if self._DemandResponseProgram is not None:
-            if self not in self._DemandResponseProgram._CustomerAgreements:
-                self._DemandResponseProgram._CustomerAgreements.append(self)
+            if self._DemandResponseProgram._CustomerAgreements is EMPTY:
+                self._DemandResponseProgram._CustomerAgreements = AssociationList([self])
+            else:
+                self._DemandResponseProgram._CustomerAgreements.add(self)
 
     DemandResponseProgram = property(getDemandResponseProgram, setDemandResponseProgram)
 
@@ -121,13 +130,14 @@ class CustomerAgreement(Agreement):
 
     def setServiceSupplier(self, value):
         if self._ServiceSupplier is not None:
-            filtered = [x for x in self.ServiceSupplier.CustomerAgreements if x != self]
-            self._ServiceSupplier._CustomerAgreements = filtered
+            self._ServiceSupplier._CustomerAgreements.discard(self)
 
         self._ServiceSupplier = value
         if self._ServiceSupplier is not None:
-            if self not in self._ServiceSupplier._CustomerAgreements:
-                self._ServiceSupplier._CustomerAgreements.append(self)
+            if self._ServiceSupplier._CustomerAgreements is EMPTY:
+                self._ServiceSupplier._CustomerAgreements = AssociationList([self])
+            else:
+                self._ServiceSupplier._CustomerAgreements.add(self)
 
     ServiceSupplier = property(getServiceSupplier, setServiceSupplier)
 
@@ -137,21 +147,28 @@ class CustomerAgreement(Agreement):
         return self._PricingStructures
 
     def setPricingStructures(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._PricingStructures:
-            filtered = [q for q in p.CustomerAgreements if q != self]
-            self._PricingStructures._CustomerAgreements = filtered
+            p._CustomerAgreements.discard(self)
         for r in value:
-            if self not in r._CustomerAgreements:
-                r._CustomerAgreements.append(self)
+            if r._CustomerAgreements is EMPTY:
+                r._CustomerAgreements = AssociationList([self])
+            else:
+                r._CustomerAgreements.add(self)
         self._PricingStructures = value
 
     PricingStructures = property(getPricingStructures, setPricingStructures)
 
     def addPricingStructures(self, *PricingStructures):
         for obj in PricingStructures:
-            if self not in obj._CustomerAgreements:
-                obj._CustomerAgreements.append(self)
-            self._PricingStructures.append(obj)
+            if obj._CustomerAgreements is EMPTY:
+                obj._CustomerAgreements = AssociationList([self])
+            else:
+                obj._CustomerAgreements.add(self)
+            if self._PricingStructures is EMPTY:
+                self._PricingStructures = AssociationList([obj])
+            else:
+                self._PricingStructures.add(obj)
 
     def removePricingStructures(self, *PricingStructures):
         for obj in PricingStructures:
@@ -165,21 +182,28 @@ class CustomerAgreement(Agreement):
         return self._ServiceLocations
 
     def setServiceLocations(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ServiceLocations:
-            filtered = [q for q in p.CustomerAgreements if q != self]
-            self._ServiceLocations._CustomerAgreements = filtered
+            p._CustomerAgreements.discard(self)
         for r in value:
-            if self not in r._CustomerAgreements:
-                r._CustomerAgreements.append(self)
+            if r._CustomerAgreements is EMPTY:
+                r._CustomerAgreements = AssociationList([self])
+            else:
+                r._CustomerAgreements.add(self)
         self._ServiceLocations = value
 
     ServiceLocations = property(getServiceLocations, setServiceLocations)
 
     def addServiceLocations(self, *ServiceLocations):
         for obj in ServiceLocations:
-            if self not in obj._CustomerAgreements:
-                obj._CustomerAgreements.append(self)
-            self._ServiceLocations.append(obj)
+            if obj._CustomerAgreements is EMPTY:
+                obj._CustomerAgreements = AssociationList([self])
+            else:
+                obj._CustomerAgreements.add(self)
+            if self._ServiceLocations is EMPTY:
+                self._ServiceLocations = AssociationList([obj])
+            else:
+                self._ServiceLocations.add(obj)
 
     def removeServiceLocations(self, *ServiceLocations):
         for obj in ServiceLocations:
@@ -193,13 +217,14 @@ class CustomerAgreement(Agreement):
 
     def setServiceCategory(self, value):
         if self._ServiceCategory is not None:
-            filtered = [x for x in self.ServiceCategory.CustomerAgreements if x != self]
-            self._ServiceCategory._CustomerAgreements = filtered
+            self._ServiceCategory._CustomerAgreements.discard(self)
 
         self._ServiceCategory = value
         if self._ServiceCategory is not None:
-            if self not in self._ServiceCategory._CustomerAgreements:
-                self._ServiceCategory._CustomerAgreements.append(self)
+            if self._ServiceCategory._CustomerAgreements is EMPTY:
+                self._ServiceCategory._CustomerAgreements = AssociationList([self])
+            else:
+                self._ServiceCategory._CustomerAgreements.add(self)
 
     ServiceCategory = property(getServiceCategory, setServiceCategory)
 
@@ -209,6 +234,7 @@ class CustomerAgreement(Agreement):
         return self._MeterReadings
 
     def setMeterReadings(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._MeterReadings:
             x.CustomerAgreement = None
         for y in value:
@@ -232,13 +258,14 @@ class CustomerAgreement(Agreement):
 
     def setCustomerAccount(self, value):
         if self._CustomerAccount is not None:
-            filtered = [x for x in self.CustomerAccount.CustomerAgreements if x != self]
-            self._CustomerAccount._CustomerAgreements = filtered
+            self._CustomerAccount._CustomerAgreements.discard(self)
 
         self._CustomerAccount = value
         if self._CustomerAccount is not None:
-            if self not in self._CustomerAccount._CustomerAgreements:
-                self._CustomerAccount._CustomerAgreements.append(self)
+            if self._CustomerAccount._CustomerAgreements is EMPTY:
+                self._CustomerAccount._CustomerAgreements = AssociationList([self])
+            else:
+                self._CustomerAccount._CustomerAgreements.add(self)
 
     CustomerAccount = property(getCustomerAccount, setCustomerAccount)
 
@@ -248,6 +275,7 @@ class CustomerAgreement(Agreement):
         return self._AuxiliaryAgreements
 
     def setAuxiliaryAgreements(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._AuxiliaryAgreements:
             x.CustomerAgreement = None
         for y in value:
@@ -270,6 +298,7 @@ class CustomerAgreement(Agreement):
         return self._EndDeviceControls
 
     def setEndDeviceControls(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._EndDeviceControls:
             x.CustomerAgreement = None
         for y in value:
@@ -293,13 +322,14 @@ class CustomerAgreement(Agreement):
 
     def setCustomer(self, value):
         if self._Customer is not None:
-            filtered = [x for x in self.Customer.CustomerAgreements if x != self]
-            self._Customer._CustomerAgreements = filtered
+            self._Customer._CustomerAgreements.discard(self)
 
         self._Customer = value
         if self._Customer is not None:
-            if self not in self._Customer._CustomerAgreements:
-                self._Customer._CustomerAgreements.append(self)
+            if self._Customer._CustomerAgreements is EMPTY:
+                self._Customer._CustomerAgreements = AssociationList([self])
+            else:
+                self._Customer._CustomerAgreements.add(self)
 
     Customer = property(getCustomer, setCustomer)
 
@@ -309,6 +339,7 @@ class CustomerAgreement(Agreement):
         return self._ServiceDeliveryPoints
 
     def setServiceDeliveryPoints(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ServiceDeliveryPoints:
             x.CustomerAgreement = None
         for y in value:
@@ -330,21 +361,28 @@ class CustomerAgreement(Agreement):
         return self._Equipments
 
     def setEquipments(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Equipments:
-            filtered = [q for q in p.CustomerAgreements if q != self]
-            self._Equipments._CustomerAgreements = filtered
+            p._CustomerAgreements.discard(self)
         for r in value:
-            if self not in r._CustomerAgreements:
-                r._CustomerAgreements.append(self)
+            if r._CustomerAgreements is EMPTY:
+                r._CustomerAgreements = AssociationList([self])
+            else:
+                r._CustomerAgreements.add(self)
         self._Equipments = value
 
     Equipments = property(getEquipments, setEquipments)
 
     def addEquipments(self, *Equipments):
         for obj in Equipments:
-            if self not in obj._CustomerAgreements:
-                obj._CustomerAgreements.append(self)
-            self._Equipments.append(obj)
+            if obj._CustomerAgreements is EMPTY:
+                obj._CustomerAgreements = AssociationList([self])
+            else:
+                obj._CustomerAgreements.add(self)
+            if self._Equipments is EMPTY:
+                self._Equipments = AssociationList([obj])
+            else:
+                self._Equipments.add(obj)
 
     def removeEquipments(self, *Equipments):
         for obj in Equipments:
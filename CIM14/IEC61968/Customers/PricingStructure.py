@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61968.Common.Document import Document
+from CIM14.Element import AssociationList, EMPTY
 
 class PricingStructure(Document):
     """Grouping of pricing components and prices used in the creation of customer charges and the eligibility criteria under which these terms may be offered to a customer. The reasons for grouping include state, customer classification, site characteristics, classification (i.e. fee price structure, deposit price structure, electric service price structure, etc.) and accounting requirements.
@@ -57,20 +58,24 @@ class PricingStructure(Document):
         #: Absolute maximum valid non-demand usage quantity used in validating a customer's billed non-demand usage.
         self.dailyCeilingUsage = dailyCeilingUsage
 
-        self._Transactions = []
-        self.Transactions = [] if Transactions is None else Transactions
+        self._Transactions = EMPTY
+        if Transactions is not None:
+            self.Transactions = Transactions
 
-        self._ServiceDeliveryPoints = []
-        self.ServiceDeliveryPoints = [] if ServiceDeliveryPoints is None else ServiceDeliveryPoints
+        self._ServiceDeliveryPoints = EMPTY
+        if ServiceDeliveryPoints is not None:
+            self.ServiceDeliveryPoints = ServiceDeliveryPoints
 
-        self._CustomerAgreements = []
-        self.CustomerAgreements = [] if CustomerAgreements is None else CustomerAgreements
+        self._CustomerAgreements = EMPTY
+        if CustomerAgreements is not None:
+            self.CustomerAgreements = CustomerAgreements
 
         self._ServiceCategory = None
         self.ServiceCategory = ServiceCategory
 
-        self._Tariffs = []
-        self.Tariffs = [] if Tariffs is None else Tariffs
+        self._Tariffs = EMPTY
+        if Tariffs is not None:
+            self.Tariffs = Tariffs
 
         super(PricingStructure, self).__init__(*args, **kw_args)
 
@@ -87,6 +92,7 @@ class PricingStructure(Document):
         return self._Transactions
 
     def setTransactions(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Transactions:
             x.PricingStructure = None
         for y in value:
@@ -109,21 +115,28 @@ class PricingStructure(Document):
         return self._ServiceDeliveryPoints
 
     def setServiceDeliveryPoints(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ServiceDeliveryPoints:
-            filtered = [q for q in p.PricingStructures if q != self]
-            self._ServiceDeliveryPoints._PricingStructures = filtered
+            p._PricingStructures.discard(self)
         for r in value:
-            if self not in r._PricingStructures:
-                r._PricingStructures.append(self)
+            if r._PricingStructures is EMPTY:
+                r._PricingStructures = AssociationList([self])
+            else:
+                r._PricingStructures.add(self)
         self._ServiceDeliveryPoints = value
 
     ServiceDeliveryPoints = property(getServiceDeliveryPoints, setServiceDeliveryPoints)
 
     def addServiceDeliveryPoints(self, *ServiceDeliveryPoints):
         for obj in ServiceDeliveryPoints:
-            if self not in obj._PricingStructures:
-                obj._PricingStructures.append(self)
-            self._ServiceDeliveryPoints.append(obj)
+            if obj._PricingStructures is EMPTY:
+                obj._PricingStructures = AssociationList([self])
+            else:
+                obj._PricingStructures.add(self)
+            if self._ServiceDeliveryPoints is EMPTY:
+                self._ServiceDeliveryPoints = AssociationList([obj])
+            else:
+                self._ServiceDeliveryPoints.add(obj)
 
     def removeServiceDeliveryPoints(self, *ServiceDeliveryPoints):
         for obj in ServiceDeliveryPoints:
@@ -137,21 +150,28 @@ class PricingStructure(Document):
         return self._CustomerAgreements
 
     def setCustomerAgreements(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._CustomerAgreements:
-            filtered = [q for q in p.PricingStructures if q != self]
-            self._CustomerAgreements._PricingStructures = filtered
+            p._PricingStructures.discard(self)
         for r in value:
-            if self not in r._PricingStructures:
-                r._PricingStructures.append(self)
+            if r._PricingStructures is EMPTY:
+                r._PricingStructures = AssociationList([self])
+            else:
+                r._PricingStructures.add(self)
         self._CustomerAgreements = value
 
     CustomerAgreements = property(getCustomerAgreements, setCustomerAgreements)
 
     def addCustomerAgreements(self, *CustomerAgreements):
         for obj in CustomerAgreements:
-            if self not in obj._PricingStructures:
-                obj._PricingStructures.append(self)
-            self._CustomerAgreements.append(obj)
+            if obj._PricingStructures is EMPTY:
+                obj._PricingStructures = AssociationList([self])
+            else:
+                obj._PricingStructures.add(self)
+            if self._CustomerAgreements is EMPTY:
+                self._CustomerAgreements = AssociationList([obj])
+            else:
+                self._CustomerAgreements.add(obj)
 
     def removeCustomerAgreements(self, *CustomerAgreements):
         for obj in CustomerAgreements:
@@ -166,13 +186,14 @@ class PricingStructure(Document):
 
     def setServiceCategory(self, value):
         if self._ServiceCategory is not None:
-            filtered = [x for x in self.ServiceCategory.PricingStructures if x != self]
-            self._ServiceCategory._PricingStructures = filtered
+            self._ServiceCategory._PricingStructures.discard(self)
 
         self._ServiceCategory = value
         if self._ServiceCategory is not None:
-            if self not in self._ServiceCategory._PricingStructures:
-                self._ServiceCategory._PricingStructures.append(self)
+            if self._ServiceCategory._PricingStructures is EMPTY:
+                self._ServiceCategory._PricingStructures = AssociationList([self])
+            else:
+                self._ServiceCategory._PricingStructures.add(self)
 
     ServiceCategory = property(getServiceCategory, setServiceCategory)
 
@@ -182,21 +203,28 @@ class PricingStructure(Document):
         return self._Tariffs
 
     def setTariffs(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Tariffs:
-            filtered = [q for q in p.PricingStructures if q != self]
-            self._Tariffs._PricingStructures = filtered
+            p._PricingStructures.discard(self)
         for r in value:
-            if self not in r._PricingStructures:
-                r._PricingStructures.append(self)
+            if r._PricingStructures is EMPTY:
+                r._PricingStructures = AssociationList([self])
+            else:
+                r._PricingStructures.add(self)
         self._Tariffs = value
 
     Tariffs = property(getTariffs, setTariffs)
 
     def addTariffs(self, *Tariffs):
         for obj in Tariffs:
-            if self not in obj._PricingStructures:
-                obj._PricingStructures.append(self)
-            self._Tariffs.append(obj)
+            if obj._PricingStructures is EMPTY:
+                obj._PricingStructures = AssociationList([self])
+            else:
+                obj._PricingStructures.add(self)
+            if self._Tariffs is EMPTY:
+                self._Tariffs = AssociationList([obj])
+            else:
+                self._Tariffs.add(obj)
 
     def removeTariffs(self, *Tariffs):
         for obj in Tariffs:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import AssociationList, EMPTY
 
 class ServiceCategory(IdentifiedObject):
     """Category of service provided to the customer.
@@ -35,14 +36,17 @@ class ServiceCategory(IdentifiedObject):
         #: Kind of service. Values are: "water", "time", "electricity", "heat", "rates", "gas", "internet", "refuse", "other", "tvLicence", "sewerage"
         self.kind = kind
 
-        self._CustomerAgreements = []
-        self.CustomerAgreements = [] if CustomerAgreements is None else CustomerAgreements
+        self._CustomerAgreements = EMPTY
+        if CustomerAgreements is not None:
+            self.CustomerAgreements = CustomerAgreements
 
-        self._PricingStructures = []
-        self.PricingStructures = [] if PricingStructures is None else PricingStructures
+        self._PricingStructures = EMPTY
+        if PricingStructures is not None:
+            self.PricingStructures = PricingStructures
 
-        self._ServiceDeliveryPoints = []
-        self.ServiceDeliveryPoints = [] if ServiceDeliveryPoints is None else ServiceDeliveryPoints
+        self._ServiceDeliveryPoints = EMPTY
+        if ServiceDeliveryPoints is not None:
+            self.ServiceDeliveryPoints = ServiceDeliveryPoints
 
         super(ServiceCategory, self).__init__(*args, **kw_args)
 
@@ -58,6 +62,7 @@ class ServiceCategory(IdentifiedObject):
         return self._CustomerAgreements
 
     def setCustomerAgreements(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._CustomerAgreements:
             x.ServiceCategory = None
         for y in value:
@@ -80,6 +85,7 @@ class ServiceCategory(IdentifiedObject):
         return self._PricingStructures
 
     def setPricingStructures(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._PricingStructures:
             x.ServiceCategory = None
         for y in value:
@@ -102,6 +108,7 @@ class ServiceCategory(IdentifiedObject):
         return self._ServiceDeliveryPoints
 
     def setServiceDeliveryPoints(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ServiceDeliveryPoints:
             x.ServiceCategory = None
         for y in value:
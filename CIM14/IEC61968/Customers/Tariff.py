@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61968.Common.Document import Document
+from CIM14.Element import AssociationList, EMPTY
 
 class Tariff(Document):
     """Document, approved by the responsible regulatory agency, listing the terms and conditions, including a schedule of prices, under which utility services will be provided. It has a unique number within the state or province. For Rate Schedules it is frequently allocated by the affiliated Public Utilities Commission.
@@ -38,11 +39,13 @@ class Tariff(Document):
         #: (if tariff became inactive) Date tariff was terminated.
         self.endDate = endDate
 
-        self._TariffProfiles = []
-        self.TariffProfiles = [] if TariffProfiles is None else TariffProfiles
+        self._TariffProfiles = EMPTY
+        if TariffProfiles is not None:
+            self.TariffProfiles = TariffProfiles
 
-        self._PricingStructures = []
-        self.PricingStructures = [] if PricingStructures is None else PricingStructures
+        self._PricingStructures = EMPTY
+        if PricingStructures is not None:
+            self.PricingStructures = PricingStructures
 
         super(Tariff, self).__init__(*args, **kw_args)
 
@@ -59,21 +62,28 @@ class Tariff(Document):
         return self._TariffProfiles
 
     def setTariffProfiles(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._TariffProfiles:
-            filtered = [q for q in p.Tariffs if q != self]
-            self._TariffProfiles._Tariffs = filtered
+            p._Tariffs.discard(self)
         for r in value:
-            if self not in r._Tariffs:
-                r._Tariffs.append(self)
+            if r._Tariffs is EMPTY:
+                r._Tariffs = AssociationList([self])
+            else:
+                r._Tariffs.add(self)
         self._TariffProfiles = value
 
     TariffProfiles = property(getTariffProfiles, setTariffProfiles)
 
     def addTariffProfiles(self, *TariffProfiles):
         for obj in TariffProfiles:
-            if self not in obj._Tariffs:
-                obj._Tariffs.append(self)
-            self._TariffProfiles.append(obj)
+            if obj._Tariffs is EMPTY:
+                obj._Tariffs = AssociationList([self])
+            else:
+                obj._Tariffs.add(self)
+            if self._TariffProfiles is EMPTY:
+                self._TariffProfiles = AssociationList([obj])
+            else:
+                self._TariffProfiles.add(obj)
 
     def removeTariffProfiles(self, *TariffProfiles):
         for obj in TariffProfiles:
@@ -87,21 +97,28 @@ class Tariff(Document):
         return self._PricingStructures
 
     def setPricingStructures(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._PricingStructures:
-            filtered = [q for q in p.Tariffs if q != self]
-            self._PricingStructures._Tariffs = filtered
+            p._Tariffs.discard(self)
         for r in value:
-            if self not in r._Tariffs:
-                r._Tariffs.append(self)
+            if r._Tariffs is EMPTY:
+                r._Tariffs = AssociationList([self])
+            else:
+                r._Tariffs.add(self)
         self._PricingStructures = value
 
     PricingStructures = property(getPricingStructures, setPricingStructures)
 
     def addPricingStructures(self, *PricingStructures):
         for obj in PricingStructures:
-            if self not in obj._Tariffs:
-                obj._Tariffs.append(self)
-            self._PricingStructures.append(obj)
+            if obj._Tariffs is EMPTY:
+                obj._Tariffs = AssociationList([self])
+            else:
+                obj._Tariffs.add(self)
+            if self._PricingStructures is EMPTY:
+                self._PricingStructures = AssociationList([obj])
+            else:
+                self._PricingStructures.add(obj)
 
     def removePricingStructures(self, *PricingStructures):
         for obj in PricingStructures:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61968.Assets.AssetFunction import AssetFunction
+from CIM14.Element import AssociationList, EMPTY
 
 class DeviceFunction(AssetFunction):
     """Function performed by a device such as a meter, communication equipment, controllers, etc.
@@ -38,11 +39,13 @@ class DeviceFunction(AssetFunction):
         self._EndDeviceAsset = None
         self.EndDeviceAsset = EndDeviceAsset
 
-        self._Registers = []
-        self.Registers = [] if Registers is None else Registers
+        self._Registers = EMPTY
+        if Registers is not None:
+            self.Registers = Registers
 
-        self._EndDeviceEvents = []
-        self.EndDeviceEvents = [] if EndDeviceEvents is None else EndDeviceEvents
+        self._EndDeviceEvents = EMPTY
+        if EndDeviceEvents is not None:
+            self.EndDeviceEvents = EndDeviceEvents
 
         super(DeviceFunction, self).__init__(*args, **kw_args)
 
@@ -60,13 +63,14 @@ class DeviceFunction(AssetFunction):
 
     def setEndDeviceAsset(self, value):
         if self._EndDeviceAsset is not None:
-            filtered = [x for x in self.EndDeviceAsset.DeviceFunctions if x != self]
-            self._EndDeviceAsset._DeviceFunctions = filtered
+            self._EndDeviceAsset._DeviceFunctions.discard(self)
 
         self._EndDeviceAsset = value
         if self._EndDeviceAsset is not None:
-            if self not in self._EndDeviceAsset._DeviceFunctions:
-                self._EndDeviceAsset._DeviceFunctions.append(self)
+            if self._EndDeviceAsset._DeviceFunctions is EMPTY:
+                self._EndDeviceAsset._DeviceFunctions = AssociationList([self])
+            else:
+                self._EndDeviceAsset._DeviceFunctions.add(self)
 
     EndDeviceAsset = property(getEndDeviceAsset, setEndDeviceAsset)
 
@@ -76,6 +80,7 @@ class DeviceFunction(AssetFunction):
         return self._Registers
 
     def setRegisters(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Registers:
             x.DeviceFunction = None
         for y in value:
@@ -98,6 +103,7 @@ class DeviceFunction(AssetFunction):
         return self._EndDeviceEvents
 
     def setEndDeviceEvents(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._EndDeviceEvents:
             x.DeviceFunction = None
         for y in value:
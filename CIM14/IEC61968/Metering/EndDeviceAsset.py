@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61968.Assets.AssetContainer import AssetContainer
+from CIM14.Element import AssociationList, EMPTY
 
 class EndDeviceAsset(AssetContainer):
     """AssetContainer that performs one or more end device functions. One type of EndDeviceAsset is a MeterAsset which can perform metering, load management, connect/disconnect, accounting functions, etc. Some EndDeviceAssets, such as ones monitoring and controlling air conditioner, refrigerator, pool pumps may be connected to a MeterAsset. All EndDeviceAssets may have communication capability defined by the associated ComFunction(s). An EndDeviceAsset may be owned by a consumer, a service provider, utility or otherwise. There may be a related end device function that identifies a sensor or control point within a metering application or communications systems (e.g., water, gas, electricity). Some devices may use an optical port that conforms to the ANSI C12.18 standard for communications.
@@ -92,8 +93,9 @@ class EndDeviceAsset(AssetContainer):
         #: True if this end device asset is capable of supporting load control functions through either the meter or the AMR option. To determine whether this functionality is installed and enabled, check the 'DeviceFunction.disabled' attribute of the respective function contained by this end device asset.
         self.loadControl = loadControl
 
-        self._EndDeviceGroups = []
-        self.EndDeviceGroups = [] if EndDeviceGroups is None else EndDeviceGroups
+        self._EndDeviceGroups = EMPTY
+        if EndDeviceGroups is not None:
+            self.EndDeviceGroups = EndDeviceGroups
 
         self._ServiceLocation = None
         self.ServiceLocation = ServiceLocation
@@ -101,17 +103,20 @@ class EndDeviceAsset(AssetContainer):
         self._EndDeviceModel = None
         self.EndDeviceModel = EndDeviceModel
 
-        self._DeviceFunctions = []
-        self.DeviceFunctions = [] if DeviceFunctions is None else DeviceFunctions
+        self._DeviceFunctions = EMPTY
+        if DeviceFunctions is not None:
+            self.DeviceFunctions = DeviceFunctions
 
         self._ServiceDeliveryPoint = None
         self.ServiceDeliveryPoint = ServiceDeliveryPoint
 
-        self._Readings = []
-        self.Readings = [] if Readings is None else Readings
+        self._Readings = EMPTY
+        if Readings is not None:
+            self.Readings = Readings
 
-        self._EndDeviceControls = []
-        self.EndDeviceControls = [] if EndDeviceControls is None else EndDeviceControls
+        self._EndDeviceControls = EMPTY
+        if EndDeviceControls is not None:
+            self.EndDeviceControls = EndDeviceControls
 
         self._Customer = None
         self.Customer = Customer
@@ -131,21 +136,28 @@ class EndDeviceAsset(AssetContainer):
         return self._EndDeviceGroups
 
     def setEndDeviceGroups(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._EndDeviceGroups:
-            filtered = [q for q in p.EndDeviceAssets if q != self]
-            self._EndDeviceGroups._EndDeviceAssets = filtered
+            p._EndDeviceAssets.discard(self)
         for r in value:
-            if self not in r._EndDeviceAssets:
-                r._EndDeviceAssets.append(self)
+            if r._EndDeviceAssets is EMPTY:
+                r._EndDeviceAssets = AssociationList([self])
+            else:
+                r._EndDeviceAssets.add(self)
         self._EndDeviceGroups = value
 
     EndDeviceGroups = property(getEndDeviceGroups, setEndDeviceGroups)
 
     def addEndDeviceGroups(self, *EndDeviceGroups):
         for obj in EndDeviceGroups:
-            if self not in obj._EndDeviceAssets:
-                obj._EndDeviceAssets.append(self)
-            self._EndDeviceGroups.append(obj)
+            if obj._EndDeviceAssets is EMPTY:
+                obj._EndDeviceAssets = AssociationList([self])
+            else:
+                obj._EndDeviceAssets.add(self)
+            if self._EndDeviceGroups is EMPTY:
+                self._EndDeviceGroups = AssociationList([obj])
+            else:
+                self._EndDeviceGroups.add(obj)
 
     def removeEndDeviceGroups(self, *EndDeviceGroups):
         for obj in EndDeviceGroups:
@@ -160,13 +172,14 @@ class EndDeviceAsset(AssetContainer):
 
     def setServiceLocation(self, value):
         if self._ServiceLocation is not None:
-            filtered = [x for x in self.ServiceLocation.EndDeviceAssets if x != self]
-            self._ServiceLocation._EndDeviceAssets = filtered
+            self._ServiceLocation._EndDeviceAssets.discard(self)
 
         self._ServiceLocation = value
         if self._ServiceLocation is not None:
-            if self not in self._ServiceLocation._EndDeviceAssets:
-                self._ServiceLocation._EndDeviceAssets.append(self)
+            if self._ServiceLocation._EndDeviceAssets is EMPTY:
+                self._ServiceLocation._EndDeviceAssets = AssociationList([self])
+            else:
+                self._ServiceLocation._EndDeviceAssets.add(self)
 
     ServiceLocation = property(getServiceLocation, setServiceLocation)
 
@@ -177,13 +190,14 @@ class EndDeviceAsset(AssetContainer):
 
     def setEndDeviceModel(self, value):
         if self._EndDeviceModel is not None:
-            filtered = [x for x in self.EndDeviceModel.EndDeviceAssets if x != self]
-            self._EndDeviceModel._EndDeviceAssets = filtered
+            self._EndDeviceModel._EndDeviceAssets.discard(self)
 
         self._EndDeviceModel = value
         if self._EndDeviceModel is not None:
-            if self not in self._EndDeviceModel._EndDeviceAssets:
-                self._EndDeviceModel._EndDeviceAssets.append(self)
+            if self._EndDeviceModel._EndDeviceAssets is EMPTY:
+                self._EndDeviceModel._EndDeviceAssets = AssociationList([self])
+            else:
+                self._EndDeviceModel._EndDeviceAssets.add(self)
 
     EndDeviceModel = property(getEndDeviceModel, setEndDeviceModel)
 
@@ -193,6 +207,7 @@ class EndDeviceAsset(AssetContainer):
         return self._DeviceFunctions
 
     def setDeviceFunctions(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._DeviceFunctions:
             x.EndDeviceAsset = None
         for y in value:
@@ -216,13 +231,14 @@ class EndDeviceAsset(AssetContainer):
 
     def setServiceDeliveryPoint(self, value):
         if self._ServiceDeliveryPoint is not None:
-            filtered = [x for x in self.ServiceDeliveryPoint.EndDeviceAssets if x != self]
-            self._ServiceDeliveryPoint._EndDeviceAssets = filtered
+            self._ServiceDeliveryPoint._EndDeviceAssets.discard(self)
 
         self._ServiceDeliveryPoint = value
         if self._ServiceDeliveryPoint is not None:
-            if self not in self._ServiceDeliveryPoint._EndDeviceAssets:
-                self._ServiceDeliveryPoint._EndDeviceAssets.append(self)
+            if self._ServiceDeliveryPoint._EndDeviceAssets is EMPTY:
+                self._ServiceDeliveryPoint._EndDeviceAssets = AssociationList([self])
+            else:
+                self._ServiceDeliveryPoint._EndDeviceAssets.add(self)
 
     ServiceDeliveryPoint = property(getServiceDeliveryPoint, setServiceDeliveryPoint)
 
@@ -231,6 +247,7 @@ class EndDeviceAsset(AssetContainer):
         return self._Readings
 
     def setReadings(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Readings:
             x.EndDeviceAsset = None
         for y in value:
@@ -253,6 +270,7 @@ class EndDeviceAsset(AssetContainer):
         return self._EndDeviceControls
 
     def setEndDeviceControls(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._EndDeviceControls:
             x.EndDeviceAsset = None
         for y in value:
@@ -276,13 +294,14 @@ class EndDeviceAsset(AssetContainer):
 
     def setCustomer(self, value):
         if self._Customer is not None:
-            filtered = [x for x in self.Customer.EndDeviceAssets if x != self]
-            self._Customer._EndDeviceAssets = filtered
+            self._Customer._EndDeviceAssets.discard(self)
 
         self._Customer = value
         if self._Customer is not None:
-            if self not in self._Customer._EndDeviceAssets:
-                self._Customer._EndDeviceAssets.append(self)
+            if self._Customer._EndDeviceAssets is EMPTY:
+                self._Customer._EndDeviceAssets = AssociationList([self])
+            else:
+                self._Customer._EndDeviceAssets.add(self)
 
     Customer = property(getCustomer, setCustomer)
 
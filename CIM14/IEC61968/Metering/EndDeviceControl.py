@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import AssociationList, EMPTY
 
 class EndDeviceControl(IdentifiedObject):
     """Instructs an EndDeviceAsset (or EndDeviceGroup) to perform a specified action.
@@ -79,13 +80,14 @@ class EndDeviceControl(IdentifiedObject):
 
     def setEndDeviceGroup(self, value):
         if self._EndDeviceGroup is not None:
-            filtered = [x for x in self.EndDeviceGroup.EndDeviceControls if x != self]
-            self._EndDeviceGroup._EndDeviceControls = filtered
+            self._EndDeviceGroup._EndDeviceControls.discard(self)
 
         self._EndDeviceGroup = value
         if self._EndDeviceGroup is not None:
-            if self not in self._EndDeviceGroup._EndDeviceControls:
-                self._EndDeviceGroup._EndDeviceControls.append(self)
+            if self._EndDeviceGroup._EndDeviceControls is EMPTY:
+                self._EndDeviceGroup._EndDeviceControls = AssociationList([self])
+            else:
+                self._EndDeviceGroup._EndDeviceControls.add(self)
 
     EndDeviceGroup = property(getEndDeviceGroup, setEndDeviceGroup)
 
@@ -96,13 +98,14 @@ class EndDeviceControl(IdentifiedObject):
 
     def setDemandResponseProgram(self, value):
         if self._DemandResponseProgram is not None:
-            filtered = [x for x in self.DemandResponseProgram.EndDeviceControls if x != self]
-            self._DemandResponseProgram._EndDeviceControls = filtered
+            self._DemandResponseProgram._EndDeviceControls.discard(self)
 
         self._DemandResponseProgram = value
         if self._DemandResponseProgram is not None:
-            if self not in self._DemandResponseProgram._EndDeviceControls:
-                self._DemandResponseProgram._EndDeviceControls.append(self)
+            if self._DemandResponseProgram._EndDeviceControls is EMPTY:
+                self._DemandResponseProgram._EndDeviceControls = AssociationList([self])
+            else:
+                self._DemandResponseProgram._EndDeviceControls.add(self)
 
     DemandResponseProgram = property(getDemandResponseProgram, setDemandResponseProgram)
 
@@ -113,13 +116,14 @@ class EndDeviceControl(IdentifiedObject):
 
     def setCustomerAgreement(self, value):
         if self._CustomerAgreement is not None:
-            filtered = [x for x in self.CustomerAgreement.EndDeviceControls if x != self]
-            self._CustomerAgreement._EndDeviceControls = filtered
+            self._CustomerAgreement._EndDeviceControls.discard(self)
 
         self._CustomerAgreement = value
         if self._CustomerAgreement is not None:
-            if self not in self._CustomerAgreement._EndDeviceControls:
-                self._CustomerAgreement._EndDeviceControls.append(self)
+            if self._CustomerAgreement._EndDeviceControls is EMPTY:
+                self._CustomerAgreement._EndDeviceControls = AssociationList([self])
+            else:
+                self._CustomerAgreement._EndDeviceControls.add(self)
 
     CustomerAgreement = property(getCustomerAgreement, setCustomerAgreement)
 
@@ -130,13 +134,14 @@ class EndDeviceControl(IdentifiedObject):
 
     def setEndDeviceAsset(self, value):
         if self._EndDeviceAsset is not None:
-            filtered = [x for x in self.EndDeviceAsset.EndDeviceControls if x != self]
-            self._EndDeviceAsset._EndDeviceControls = filtered
+            self._EndDeviceAsset._EndDeviceControls.discard(self)
 
         self._EndDeviceAsset = value
         if self._EndDeviceAsset is not None:
-            if self not in self._EndDeviceAsset._EndDeviceControls:
-                self._EndDeviceAsset._EndDeviceControls.append(self)
+            if self._EndDeviceAsset._EndDeviceControls is EMPTY:
+                self._EndDeviceAsset._EndDeviceControls = AssociationList([self])
+            else:
+                self._EndDeviceAsset._EndDeviceControls.add(self)
 
     EndDeviceAsset = property(getEndDeviceAsset, setEndDeviceAsset)
 
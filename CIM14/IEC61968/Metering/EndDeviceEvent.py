@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61968.Common.ActivityRecord import ActivityRecord
+from CIM14.Element import AssociationList, EMPTY
 
 class EndDeviceEvent(ActivityRecord):
     """Event detected by a DeviceFunction associated with EndDeviceAsset.
@@ -56,13 +57,14 @@ class EndDeviceEvent(ActivityRecord):
 
     def setMeterReading(self, value):
         if self._MeterReading is not None:
-            filtered = [x for x in self.MeterReading.EndDeviceEvents if x != self]
-            self._MeterReading._EndDeviceEvents = filtered
+            self._MeterReading._EndDeviceEvents.discard(self)
 
         self._MeterReading = value
         if self._MeterReading is not None:
-            if self not in self._MeterReading._EndDeviceEvents:
-                self._MeterReading._EndDeviceEvents.append(self)
+            if self._MeterReading._EndDeviceEvents is EMPTY:
+                self._MeterReading._EndDeviceEvents = AssociationList([self])
+            else:
+                self._MeterReading._EndDeviceEvents.add(self)
 
     MeterReading = property(getMeterReading, setMeterReading)
 
@@ -73,13 +75,14 @@ class EndDeviceEvent(ActivityRecord):
 
     def setDeviceFunction(self, value):
         if self._DeviceFunction is not None:
-            filtered = [x for x in self.DeviceFunction.EndDeviceEvents if x != self]
-            self._DeviceFunction._EndDeviceEvents = filtered
+            self._DeviceFunction._EndDeviceEvents.discard(self)
 
         self._DeviceFunction = value
         if self._DeviceFunction is not None:
-            if self not in self._DeviceFunction._EndDeviceEvents:
-                self._DeviceFunction._EndDeviceEvents.append(self)
+            if self._DeviceFunction._EndDeviceEvents is EMPTY:
+                self._DeviceFunction._EndDeviceEvents = AssociationList([self])
+            else:
+                self._DeviceFunction._EndDeviceEvents.add(self)
 
     DeviceFunction = property(getDeviceFunction, setDeviceFunction)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import AssociationList, EMPTY
 
 class EndDeviceGroup(IdentifiedObject):
     """Abstraction for management of group communications within a two-way AMR system or the data for a group of related meters. Commands can be issued to all of the meters that belong to a meter group using a defined group address and the underlying AMR communication infrastructure.
@@ -35,11 +36,13 @@ class EndDeviceGroup(IdentifiedObject):
         #: Address of this end device group.
         self.groupAddress = groupAddress
 
-        self._EndDeviceAssets = []
-        self.EndDeviceAssets = [] if EndDeviceAssets is None else EndDeviceAssets
+        self._EndDeviceAssets = EMPTY
+        if EndDeviceAssets is not None:
+            self.EndDeviceAssets = EndDeviceAssets
 
-        self._EndDeviceControls = []
-        self.EndDeviceControls = [] if EndDeviceControls is None else EndDeviceControls
+        self._EndDeviceControls = EMPTY
+        if EndDeviceControls is not None:
+            self.EndDeviceControls = EndDeviceControls
 
         self._DemandResponseProgram = None
         self.DemandResponseProgram = DemandResponseProgram
@@ -59,21 +62,28 @@ class EndDeviceGroup(IdentifiedObject):
         return self._EndDeviceAssets
 
     def setEndDeviceAssets(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._EndDeviceAssets:
-            filtered = [q for q in p.EndDeviceGroups if q != self]
-            self._EndDeviceAssets._EndDeviceGroups = filtered
+            p._EndDeviceGroups.discard(self)
         for r in value:
-            if self not in r._EndDeviceGroups:
-                r._EndDeviceGroups.append(self)
+            if r._EndDeviceGroups is EMPTY:
+                r._EndDeviceGroups = AssociationList([self])
+            else:
+                r._EndDeviceGroups.add(self)
         self._EndDeviceAssets = value
 
     EndDeviceAssets = property(getEndDeviceAssets, setEndDeviceAssets)
 
     def addEndDeviceAssets(self, *EndDeviceAssets):
         for obj in EndDeviceAssets:
-            if self not in obj._EndDeviceGroups:
-                obj._EndDeviceGroups.append(self)
-            self._EndDeviceAssets.append(obj)
+            if obj._EndDeviceGroups is EMPTY:
+                obj._EndDeviceGroups = AssociationList([self])
+            else:
+                obj._EndDeviceGroups.add(self)
+            if self._EndDeviceAssets is EMPTY:
+                self._EndDeviceAssets = AssociationList([obj])
+            else:
+                self._EndDeviceAssets.add(obj)
 
     def removeEndDeviceAssets(self, *EndDeviceAssets):
         for obj in EndDeviceAssets:
@@ -87,6 +97,7 @@ class EndDeviceGroup(IdentifiedObject):
         return self._EndDeviceControls
 
     def setEndDeviceControls(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._EndDeviceControls:
             x.EndDeviceGroup = None
         for y in value:
@@ -110,13 +121,14 @@ class EndDeviceGroup(IdentifiedObject):
 
     def setDemandResponseProgram(self, value):
         if self._DemandResponseProgram is not None:
-            filtered = [x for x in self.DemandResponseProgram.EndDeviceGroups if x != self]
-            self._DemandResponseProgram._EndDeviceGroups = filtered
+            self._DemandResponseProgram._EndDeviceGroups.discard(self)
 
         self._DemandResponseProgram = value
         if self._DemandResponseProgram is not None:
-            if self not in self._DemandResponseProgram._EndDeviceGroups:
-                self._DemandResponseProgram._EndDeviceGroups.append(self)
+            if self._DemandResponseProgram._EndDeviceGroups is EMPTY:
+                self._DemandResponseProgram._EndDeviceGroups = AssociationList([self])
+            else:
+                self._DemandResponseProgram._EndDeviceGroups.add(self)
 
     DemandResponseProgram = property(getDemandResponseProgram, setDemandResponseProgram)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Meas.MeasurementValue import MeasurementValue
+from CIM14.Element import AssociationList, EMPTY
 
 class IntervalReading(MeasurementValue):
     """Data captured at regular intervals of time. Interval data could be captured as incremental data, absolute data, or relative data. The source for the data is usually a tariff quantity or an engineering quantity. Data is typically captured in time-tagged, uniform, fixed-length intervals of 5 min, 10 min, 15 min, 30 min, or 60 min. Note: Interval Data is sometimes also called 'Interval Data Readings' (IDR).
@@ -34,11 +35,13 @@ class IntervalReading(MeasurementValue):
         #: Value of this interval reading.
         self.value = value
 
-        self._ReadingQualities = []
-        self.ReadingQualities = [] if ReadingQualities is None else ReadingQualities
+        self._ReadingQualities = EMPTY
+        if ReadingQualities is not None:
+            self.ReadingQualities = ReadingQualities
 
-        self._IntervalBlocks = []
-        self.IntervalBlocks = [] if IntervalBlocks is None else IntervalBlocks
+        self._IntervalBlocks = EMPTY
+        if IntervalBlocks is not None:
+            self.IntervalBlocks = IntervalBlocks
 
         super(IntervalReading, self).__init__(*args, **kw_args)
 
@@ -55,6 +58,7 @@ class IntervalReading(MeasurementValue):
         return self._ReadingQualities
 
     def setReadingQualities(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ReadingQualities:
             x.IntervalReading = None
         for y in value:
@@ -77,21 +81,28 @@ class IntervalReading(MeasurementValue):
         return self._IntervalBlocks
 
     def setIntervalBlocks(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._IntervalBlocks:
-            filtered = [q for q in p.IntervalReadings if q != self]
-            self._IntervalBlocks._IntervalReadings = filtered
+            p._IntervalReadings.discard(self)
         for r in value:
-            if self not in r._IntervalReadings:
-                r._IntervalReadings.append(self)
+            if r._IntervalReadings is EMPTY:
+                r._IntervalReadings = AssociationList([self])
+            else:
+                r._IntervalReadings.add(self)
         self._IntervalBlocks = value
 
     IntervalBlocks = property(getIntervalBlocks, setIntervalBlocks)
 
     def addIntervalBlocks(self, *IntervalBlocks):
         for obj in IntervalBlocks:
-            if self not in obj._IntervalReadings:
-                obj._IntervalReadings.append(self)
-            self._IntervalBlocks.append(obj)
+            if obj._IntervalReadings is EMPTY:
+                obj._IntervalReadings = AssociationList([self])
+            else:
+                obj._IntervalReadings.add(self)
+            if self._IntervalBlocks is EMPTY:
+                self._IntervalBlocks = AssociationList([obj])
+            else:
+                self._IntervalBlocks.add(obj)
 
     def removeIntervalBlocks(self, *IntervalBlocks):
         for obj in IntervalBlocks:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61968.Metering.EndDeviceAsset import EndDeviceAsset
+from CIM14.Element import AssociationList, EMPTY
 
 class MeterAsset(EndDeviceAsset):
     """Physical asset that performs the metering role of the ServiceDeliveryPoint. Used for measuring consumption and detection of events.
@@ -44,17 +45,21 @@ class MeterAsset(EndDeviceAsset):
         #: Meter form designation per ANSI C12.10 or other applicable standard. An alphanumeric designation denoting the circuit arrangement for which the meter is applicable and its specific terminal arrangement.
         self.formNumber = formNumber
 
-        self._MeterReplacementWorks = []
-        self.MeterReplacementWorks = [] if MeterReplacementWorks is None else MeterReplacementWorks
+        self._MeterReplacementWorks = EMPTY
+        if MeterReplacementWorks is not None:
+            self.MeterReplacementWorks = MeterReplacementWorks
 
-        self._MeterServiceWorks = []
-        self.MeterServiceWorks = [] if MeterServiceWorks is None else MeterServiceWorks
+        self._MeterServiceWorks = EMPTY
+        if MeterServiceWorks is not None:
+            self.MeterServiceWorks = MeterServiceWorks
 
-        self._MeterReadings = []
-        self.MeterReadings = [] if MeterReadings is None else MeterReadings
+        self._MeterReadings = EMPTY
+        if MeterReadings is not None:
+            self.MeterReadings = MeterReadings
 
-        self._VendingTransactions = []
-        self.VendingTransactions = [] if VendingTransactions is None else VendingTransactions
+        self._VendingTransactions = EMPTY
+        if VendingTransactions is not None:
+            self.VendingTransactions = VendingTransactions
 
         super(MeterAsset, self).__init__(*args, **kw_args)
 
@@ -71,6 +76,7 @@ class MeterAsset(EndDeviceAsset):
         return self._MeterReplacementWorks
 
     def setMeterReplacementWorks(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._MeterReplacementWorks:
             x.OldMeterAsset = None
         for y in value:
@@ -93,6 +99,7 @@ class MeterAsset(EndDeviceAsset):
         return self._MeterServiceWorks
 
     def setMeterServiceWorks(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._MeterServiceWorks:
             x.MeterAsset = None
         for y in value:
@@ -115,6 +122,7 @@ class MeterAsset(EndDeviceAsset):
         return self._MeterReadings
 
     def setMeterReadings(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._MeterReadings:
             x.MeterAsset = None
         for y in value:
@@ -137,6 +145,7 @@ class MeterAsset(EndDeviceAsset):
         return self._VendingTransactions
 
     def setVendingTransactions(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._VendingTransactions:
             x.MeterAsset = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import AssociationList, EMPTY
 
 class MeterReading(IdentifiedObject):
     """Set of values obtained from the meter.
@@ -35,8 +36,9 @@ class MeterReading(IdentifiedObject):
         @param ServiceDeliveryPoint: Service delivery point from which this meter reading (set of values) has been obtained.
         @param valuesInterval: Date and time interval of the data items contained within this meter reading.
         """
-        self._IntervalBlocks = []
-        self.IntervalBlocks = [] if IntervalBlocks is None else IntervalBlocks
+        self._IntervalBlocks = EMPTY
+        if IntervalBlocks is not None:
+            self.IntervalBlocks = IntervalBlocks
 
         self._CustomerAgreement = None
         self.CustomerAgreement = CustomerAgreement
@@ -44,11 +46,13 @@ class MeterReading(IdentifiedObject):
         self._MeterAsset = None
         self.MeterAsset = MeterAsset
 
-        self._EndDeviceEvents = []
-        self.EndDeviceEvents = [] if EndDeviceEvents is None else EndDeviceEvents
+        self._EndDeviceEvents = EMPTY
+        if EndDeviceEvents is not None:
+            self.EndDeviceEvents = EndDeviceEvents
 
-        self._Readings = []
-        self.Readings = [] if Readings is None else Readings
+        self._Readings = EMPTY
+        if Readings is not None:
+            self.Readings = Readings
 
         self._ServiceDeliveryPoint = None
         self.ServiceDeliveryPoint = ServiceDeliveryPoint
@@ -70,6 +74,7 @@ class MeterReading(IdentifiedObject):
         return self._IntervalBlocks
 
     def setIntervalBlocks(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._IntervalBlocks:
             x.MeterReading = None
         for y in value:
@@ -93,13 +98,14 @@ class MeterReading(IdentifiedObject):
 
     def setCustomerAgreement(self, value):
         if self._CustomerAgreement is not None:
-            filtered = [x for x in self.CustomerAgreement.MeterReadings if x != self]
-            self._CustomerAgreement._MeterReadings = filtered
+            self._CustomerAgreement._MeterReadings.discard(self)
 
         self._CustomerAgreement = value
         if self._CustomerAgreement is not None:
-            if self not in self._CustomerAgreement._MeterReadings:
-                self._CustomerAgreement._MeterReadings.append(self)
+            if self._CustomerAgreement._MeterReadings is EMPTY:
+                self._CustomerAgreement._MeterReadings = AssociationList([self])
+            else:
+                self._CustomerAgreement._MeterReadings.add(self)
 
     CustomerAgreement = property(getCustomerAgreement, setCustomerAgreement)
 
@@ -110,13 +116,14 @@ class MeterReading(IdentifiedObject):
 
     def setMeterAsset(self, value):
         if self._MeterAsset is not None:
-            filtered = [x for x in self.MeterAsset.MeterReadings if x != self]
-            self._MeterAsset._MeterReadings = filtered
+            self._MeterAsset._MeterReadings.discard(self)
 
         self._MeterAsset = value
         if self._MeterAsset is not None:
-            if self not in self._MeterAsset._MeterReadings:
-                self._MeterAsset._MeterReadings.append(self)
+            if self._MeterAsset._MeterReadings is EMPTY:
+                self._MeterAsset._MeterReadings = AssociationList([self])
+            else:
+                self._MeterAsset._MeterReadings.add(self)
 
     MeterAsset = property(getMeterAsset, setMeterAsset)
 
@@ -126,6 +133,7 @@ class MeterReading(IdentifiedObject):
         return self._EndDeviceEvents
 
     def setEndDeviceEvents(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._EndDeviceEvents:
             x.MeterReading = None
         for y in value:
@@ -148,21 +156,28 @@ class MeterReading(IdentifiedObject):
         return self._Readings
 
     def setReadings(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Readings:
-            filtered = [q for q in p.MeterReadings if q != self]
-            self._Readings._MeterReadings = filtered
+            p._MeterReadings.discard(self)
         for r in value:
-            if self not in r._MeterReadings:
-                r._MeterReadings.append(self)
+            if r._MeterReadings is EMPTY:
+                r._MeterReadings = AssociationList([self])
+            else:
+                r._MeterReadings.add(self)
         self._Readings = value
 
     Readings = property(getReadings, setReadings)
 
     def addReadings(self, *Readings):
         for obj in Readings:
-            if self not in obj._MeterReadings:
-                obj._MeterReadings.append(self)
-            self._Readings.append(obj)
+            if obj._MeterReadings is EMPTY:
+                obj._MeterReadings = AssociationList([self])
+            else:
+                obj._MeterReadings.add(self)
+            if self._Readings is EMPTY:
+                self._Readings = AssociationList([obj])
+            else:
+                self._Readings.add(obj)
 
     def removeReadings(self, *Readings):
         for obj in Readings:
@@ -177,13 +192,14 @@ class MeterReading(IdentifiedObject):
 
     def setServiceDeliveryPoint(self, value):
         if self._ServiceDeliveryPoint is not None:
-            filtered = [x for x in self.ServiceDeliveryPoint.MeterReadings if x != self]
-            self._ServiceDeliveryPoint._MeterReadings = filtered
+            self._ServiceDeliveryPoint._MeterReadings.discard(self)
 
         self._ServiceDeliveryPoint = value
         if self._ServiceDeliveryPoint is not None:
-            if self not in self._ServiceDeliveryPoint._MeterReadings:
-                self._ServiceDeliveryPoint._MeterReadings.append(self)
+            if self._ServiceDeliveryPoint._MeterReadings is EMPTY:
+                self._ServiceDeliveryPoint._MeterReadings = AssociationList([self])
+            else:
+                self._ServiceDeliveryPoint._MeterReadings.add(self)
 
     ServiceDeliveryPoint = property(getServiceDeliveryPoint, setServiceDeliveryPoint)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61968.Work.Work import Work
+from CIM14.Element import AssociationList, EMPTY
 
 class MeterServiceWork(Work):
     """Work involving meters.
@@ -52,13 +53,14 @@ class MeterServiceWork(Work):
 
     def setOldMeterAsset(self, value):
         if self._OldMeterAsset is not None:
-            filtered = [x for x in self.OldMeterAsset.MeterReplacementWorks if x != self]
-            self._OldMeterAsset._MeterReplacementWorks = filtered
+            self._OldMeterAsset._MeterReplacementWorks.discard(self)
 
         self._OldMeterAsset = value
         if self._OldMeterAsset is not None:
-            if self not in self._OldMeterAsset._MeterReplacementWorks:
-                self._OldMeterAsset._MeterReplacementWorks.append(self)
+            if self._OldMeterAsset._MeterReplacementWorks is EMPTY:
+                self._OldMeterAsset._MeterReplacementWorks = AssociationList([self])
+            else:
+                self._OldMeterAsset._MeterReplacementWorks.add(self)
 
     OldMeterAsset = property(getOldMeterAsset, setOldMeterAsset)
 
@@ -69,13 +71,14 @@ class MeterServiceWork(Work):
 
     def setMeterAsset(self, value):
         if self._MeterAsset is not None:
-            filtered = [x for x in self.MeterAsset.MeterServiceWorks if x != self]
-            self._MeterAsset._MeterServiceWorks = filtered
+            self._MeterAsset._MeterServiceWorks.discard(self)
 
         self._MeterAsset = value
         if self._MeterAsset is not None:
-            if self not in self._MeterAsset._MeterServiceWorks:
-                self._MeterAsset._MeterServiceWorks.append(self)
+            if self._MeterAsset._MeterServiceWorks is EMPTY:
+                self._MeterAsset._MeterServiceWorks = AssociationList([self])
+            else:
+                self._MeterAsset._MeterServiceWorks.add(self)
 
     MeterAsset = property(getMeterAsset, setMeterAsset)
 
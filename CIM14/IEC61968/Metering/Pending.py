@@ -18,7 +18,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from CIM14.Element import Element
+from CIM14.Element import Element, AssociationList, EMPTY
 
 class Pending(Element):
     """When present, a scalar conversion that is associated with IntervalBlock and which needs to be applied to every contained IntervalReading value. This conversion results in a new associated ReadingType, reflecting the true dimensions of interval reading values after the conversion.
@@ -50,8 +50,9 @@ class Pending(Element):
         #: (if applicable) Offset to be added as well as multiplication using scalars.
         self.offset = offset
 
-        self._IntervalBlocks = []
-        self.IntervalBlocks = [] if IntervalBlocks is None else IntervalBlocks
+        self._IntervalBlocks = EMPTY
+        if IntervalBlocks is not None:
+            self.IntervalBlocks = IntervalBlocks
 
         self._ReadingType = None
         self.ReadingType = ReadingType
@@ -71,6 +72,7 @@ class Pending(Element):
         return self._IntervalBlocks
 
     def setIntervalBlocks(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._IntervalBlocks:
             x.Pending = None
         for y in value:
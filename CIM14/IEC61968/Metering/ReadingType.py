@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import AssociationList, EMPTY
 
 class ReadingType(IdentifiedObject):
     """Type of data conveyed by a specific Reading.
@@ -65,13 +66,15 @@ class ReadingType(IdentifiedObject):
         #: (if incremental reading value) Length of increment interval.
         self.intervalLength = intervalLength
 
-        self._Readings = []
-        self.Readings = [] if Readings is None else Readings
+        self._Readings = EMPTY
+        if Readings is not None:
+            self.Readings = Readings
 
         self.dynamicConfiguration = dynamicConfiguration
 
-        self._IntervalBlocks = []
-        self.IntervalBlocks = [] if IntervalBlocks is None else IntervalBlocks
+        self._IntervalBlocks = EMPTY
+        if IntervalBlocks is not None:
+            self.IntervalBlocks = IntervalBlocks
 
         self._Pending = None
         self.Pending = Pending
@@ -94,6 +97,7 @@ class ReadingType(IdentifiedObject):
         return self._Readings
 
     def setReadings(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Readings:
             x.ReadingType = None
         for y in value:
@@ -119,6 +123,7 @@ class ReadingType(IdentifiedObject):
         return self._IntervalBlocks
 
     def setIntervalBlocks(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._IntervalBlocks:
             x.ReadingType = None
         for y in value:
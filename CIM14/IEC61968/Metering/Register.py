@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import AssociationList, EMPTY
 
 class Register(IdentifiedObject):
     """Display for quantity that is metered on an end device such as a meter.
@@ -76,13 +77,14 @@ class Register(IdentifiedObject):
 
     def setDeviceFunction(self, value):
         if self._DeviceFunction is not None:
-            filtered = [x for x in self.DeviceFunction.Registers if x != self]
-            self._DeviceFunction._Registers = filtered
+            self._DeviceFunction._Registers.discard(self)
 
         self._DeviceFunction = value
         if self._DeviceFunction is not None:
-            if self not in self._DeviceFunction._Registers:
-                self._DeviceFunction._Registers.append(self)
+            if self._DeviceFunction._Registers is EMPTY:
+                self._DeviceFunction._Registers = AssociationList([self])
+            else:
+                self._DeviceFunction._Registers.add(self)
 
     DeviceFunction = property(getDeviceFunction, setDeviceFunction)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61968.Common.Location import Location
+from CIM14.Element import AssociationList, EMPTY
 
 class SDPLocation(Location):
     """Location of an individual service delivery point. For residential or most businesses, it is typically the location of a meter on the customer's premises. For transmission, it is the point(s) of interconnection on the transmission provider's transmission system where capacity and/or energy transmitted by the transmission provider is made available to the receiving party. The point(s) of delivery is specified in the Service Agreement.
@@ -45,8 +46,9 @@ class SDPLocation(Location):
         #: Method for the service person to access this service delivery point location. For example, a description of where to obtain a key if the facility is unmanned and secured.
         self.accessMethod = accessMethod
 
-        self._ServiceDeliveryPoints = []
-        self.ServiceDeliveryPoints = [] if ServiceDeliveryPoints is None else ServiceDeliveryPoints
+        self._ServiceDeliveryPoints = EMPTY
+        if ServiceDeliveryPoints is not None:
+            self.ServiceDeliveryPoints = ServiceDeliveryPoints
 
         super(SDPLocation, self).__init__(*args, **kw_args)
 
@@ -63,21 +65,28 @@ class SDPLocation(Location):
         return self._ServiceDeliveryPoints
 
     def setServiceDeliveryPoints(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ServiceDeliveryPoints:
-            filtered = [q for q in p.SDPLocations if q != self]
-            self._ServiceDeliveryPoints._SDPLocations = filtered
+            p._SDPLocations.discard(self)
         for r in value:
-            if self not in r._SDPLocations:
-                r._SDPLocations.append(self)
+            if r._SDPLocations is EMPTY:
+                r._SDPLocations = AssociationList([self])
+            else:
+                r._SDPLocations.add(self)
         self._ServiceDeliveryPoints = value
 
     ServiceDeliveryPoints = property(getServiceDeliveryPoints, setServiceDeliveryPoints)
 
     def addServiceDeliveryPoints(self, *ServiceDeliveryPoints):
         for obj in ServiceDeliveryPoints:
-            if self not in obj._SDPLocations:
-                obj._SDPLocations.append(self)
-            self._ServiceDeliveryPoints.append(obj)
+            if obj._SDPLocations is EMPTY:
+                obj._SDPLocations = AssociationList([self])
+            else:
+                obj._SDPLocations.add(self)
+            if self._ServiceDeliveryPoints is EMPTY:
+                self._ServiceDeliveryPoints = AssociationList([obj])
+            else:
+                self._ServiceDeliveryPoints.add(obj)
 
     def removeServiceDeliveryPoints(self, *ServiceDeliveryPoints):
         for obj in ServiceDeliveryPoints:
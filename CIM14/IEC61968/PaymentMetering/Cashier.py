@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import AssociationList, EMPTY
 
 class Cashier(IdentifiedObject):
     """The operator of the point of sale for the duration of CashierShift. Cashier is under the exclusive management control of Vendor.
@@ -31,8 +32,9 @@ class Cashier(IdentifiedObject):
         @param electronicAddress: Electronic address.
         @param Vendor: Vendor that manages this Cachier.
         """
-        self._CashierShifts = []
-        self.CashierShifts = [] if CashierShifts is None else CashierShifts
+        self._CashierShifts = EMPTY
+        if CashierShifts is not None:
+            self.CashierShifts = CashierShifts
 
         self.electronicAddress = electronicAddress
 
@@ -54,6 +56,7 @@ class Cashier(IdentifiedObject):
         return self._CashierShifts
 
     def setCashierShifts(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._CashierShifts:
             x.Cashier = None
         for y in value:
@@ -80,13 +83,14 @@ class Cashier(IdentifiedObject):
 
     def setVendor(self, value):
         if self._Vendor is not None:
-            filtered = [x for x in self.Vendor.Cashiers if x != self]
-            self._Vendor._Cashiers = filtered
+            self._Vendor._Cashiers.discard(self)
 
         self._Vendor = value
         if self._Vendor is not None:
-            if self not in self._Vendor._Cashiers:
-                self._Vendor._Cashiers.append(self)
+            if self._Vendor._Cashiers is EMPTY:
+                self._Vendor._Cashiers = AssociationList([self])
+            else:
+                self._Vendor._Cashiers.add(self)
 
     Vendor = property(getVendor, setVendor)
 
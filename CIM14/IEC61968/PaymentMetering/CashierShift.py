@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61968.PaymentMetering.Shift import Shift
+from CIM14.Element import AssociationList, EMPTY
 
 class CashierShift(Shift):
     """The operating shift for a cashier, during which he may transact against the CashierShift, subject to VendorShift being open.
@@ -36,11 +37,13 @@ class CashierShift(Shift):
         #: The amount of cash that the cashier brings with him to start his shift and that he will take away at the end of his shift; i.e. the cash float does not get banked.
         self.cashFloat = cashFloat
 
-        self._Receipts = []
-        self.Receipts = [] if Receipts is None else Receipts
+        self._Receipts = EMPTY
+        if Receipts is not None:
+            self.Receipts = Receipts
 
-        self._Transactions = []
-        self.Transactions = [] if Transactions is None else Transactions
+        self._Transactions = EMPTY
+        if Transactions is not None:
+            self.Transactions = Transactions
 
         self._Cashier = None
         self.Cashier = Cashier
@@ -63,6 +66,7 @@ class CashierShift(Shift):
         return self._Receipts
 
     def setReceipts(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Receipts:
             x.CashierShift = None
         for y in value:
@@ -84,6 +88,7 @@ class CashierShift(Shift):
         return self._Transactions
 
     def setTransactions(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Transactions:
             x.CashierShift = None
         for y in value:
@@ -107,13 +112,14 @@ class CashierShift(Shift):
 
     def setCashier(self, value):
         if self._Cashier is not None:
-            filtered = [x for x in self.Cashier.CashierShifts if x != self]
-            self._Cashier._CashierShifts = filtered
+            self._Cashier._CashierShifts.discard(self)
 
         self._Cashier = value
         if self._Cashier is not None:
-            if self not in self._Cashier._CashierShifts:
-                self._Cashier._CashierShifts.append(self)
+            if self._Cashier._CashierShifts is EMPTY:
+                self._Cashier._CashierShifts = AssociationList([self])
+            else:
+                self._Cashier._CashierShifts.add(self)
 
     Cashier = property(getCashier, setCashier)
 
@@ -124,13 +130,14 @@ class CashierShift(Shift):
 
     def setPointOfSale(self, value):
         if self._PointOfSale is not None:
-            filtered = [x for x in self.PointOfSale.CashierShifts if x != self]
-            self._PointOfSale._CashierShifts = filtered
+            self._PointOfSale._CashierShifts.discard(self)
 
         self._PointOfSale = value
         if self._PointOfSale is not None:
-            if self not in self._PointOfSale._CashierShifts:
-                self._PointOfSale._CashierShifts.append(self)
+            if self._PointOfSale._CashierShifts is EMPTY:
+                self._PointOfSale._CashierShifts = AssociationList([self])
+            else:
+                self._PointOfSale._CashierShifts.add(self)
 
     PointOfSale = property(getPointOfSale, setPointOfSale)
 
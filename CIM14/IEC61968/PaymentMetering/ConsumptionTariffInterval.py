@@ -18,7 +18,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from CIM14.Element import Element
+from CIM14.Element import Element, AssociationList, EMPTY
 
 class ConsumptionTariffInterval(Element):
     """One of a sequence of intervals defined in terms of consumption quantity of a service such as electricity, water, gas, etc. It is typically used in association with TariffProfile to define the steps or blocks in a step tariff structure, where startValue simultaneously defines the entry value of this step and the closing value of the previous step. Where consumption is &gt;= startValue it falls within this interval and where consumption is &lt; startValue it falls within the previous interval.
@@ -38,11 +38,13 @@ class ConsumptionTariffInterval(Element):
         #: The lowest level of consumption that defines the starting point of this interval. The interval extends to the start of the next interval or until it is reset to the start of the first interval by TariffProfile.tariffCycle.
         self.startValue = startValue
 
-        self._TariffProfiles = []
-        self.TariffProfiles = [] if TariffProfiles is None else TariffProfiles
+        self._TariffProfiles = EMPTY
+        if TariffProfiles is not None:
+            self.TariffProfiles = TariffProfiles
 
-        self._Charges = []
-        self.Charges = [] if Charges is None else Charges
+        self._Charges = EMPTY
+        if Charges is not None:
+            self.Charges = Charges
 
         super(ConsumptionTariffInterval, self).__init__(*args, **kw_args)
 
@@ -59,21 +61,28 @@ class ConsumptionTariffInterval(Element):
         return self._TariffProfiles
 
     def setTariffProfiles(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._TariffProfiles:
-            filtered = [q for q in p.ConsumptionTariffIntervals if q != self]
-            self._TariffProfiles._ConsumptionTariffIntervals = filtered
+            p._ConsumptionTariffIntervals.discard(self)
         for r in value:
-            if self not in r._ConsumptionTariffIntervals:
-                r._ConsumptionTariffIntervals.append(self)
+            if r._ConsumptionTariffIntervals is EMPTY:
+                r._ConsumptionTariffIntervals = AssociationList([self])
+            else:
+                r._ConsumptionTariffIntervals.add(self)
         self._TariffProfiles = value
 
     TariffProfiles = property(getTariffProfiles, setTariffProfiles)
 
     def addTariffProfiles(self, *TariffProfiles):
         for obj in TariffProfiles:
-            if self not in obj._ConsumptionTariffIntervals:
-                obj._ConsumptionTariffIntervals.append(self)
-            self._TariffProfiles.append(obj)
+            if obj._ConsumptionTariffIntervals is EMPTY:
+                obj._ConsumptionTariffIntervals = AssociationList([self])
+            else:
+                obj._ConsumptionTariffIntervals.add(self)
+            if self._TariffProfiles is EMPTY:
+                self._TariffProfiles = AssociationList([obj])
+            else:
+                self._TariffProfiles.add(obj)
 
     def removeTariffProfiles(self, *TariffProfiles):
         for obj in TariffProfiles:
@@ -87,21 +96,28 @@ class ConsumptionTariffInterval(Element):
         return self._Charges
 
     def setCharges(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Charges:
-            filtered = [q for q in p.ConsumptionTariffIntervals if q != self]
-            self._Charges._ConsumptionTariffIntervals = filtered
+            p._ConsumptionTariffIntervals.discard(self)
         for r in value:
-            if self not in r._ConsumptionTariffIntervals:
-                r._ConsumptionTariffIntervals.append(self)
+            if r._ConsumptionTariffIntervals is EMPTY:
+                r._ConsumptionTariffIntervals = AssociationList([self])
+            else:
+                r._ConsumptionTariffIntervals.add(self)
         self._Charges = value
 
     Charges = property(getCharges, setCharges)
 
     def addCharges(self, *Charges):
         for obj in Charges:
-            if self not in obj._ConsumptionTariffIntervals:
-                obj._ConsumptionTariffIntervals.append(self)
-            self._Charges.append(obj)
+            if obj._ConsumptionTariffIntervals is EMPTY:
+                obj._ConsumptionTariffIntervals = AssociationList([self])
+            else:
+                obj._ConsumptionTariffIntervals.add(self)
+            if self._Charges is EMPTY:
+                self._Charges = AssociationList([obj])
+            else:
+                self._Charges.add(obj)
 
     def removeCharges(self, *Charges):
         for obj in Charges:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61968.Common.Document import Document
+from CIM14.Element import AssociationList, EMPTY
 
 class MerchantAccount(Document):
     """The operating account controlled by MerchantAgreement, against which Vendor may vend tokens or receipt payments. Transactions via VendorShift debit the account and bank deposits via BankStatement credit the account.
@@ -40,17 +41,20 @@ class MerchantAccount(Document):
         #: The current operating balance of this account.
         self.currentBalance = currentBalance
 
-        self._VendorShifts = []
-        self.VendorShifts = [] if VendorShifts is None else VendorShifts
+        self._VendorShifts = EMPTY
+        if VendorShifts is not None:
+            self.VendorShifts = VendorShifts
 
         self._MerchantAgreement = None
         self.MerchantAgreement = MerchantAgreement
 
-        self._Vendors = []
-        self.Vendors = [] if Vendors is None else Vendors
+        self._Vendors = EMPTY
+        if Vendors is not None:
+            self.Vendors = Vendors
 
-        self._Transactors = []
-        self.Transactors = [] if Transactors is None else Transactors
+        self._Transactors = EMPTY
+        if Transactors is not None:
+            self.Transactors = Transactors
 
         super(MerchantAccount, self).__init__(*args, **kw_args)
 
@@ -67,6 +71,7 @@ class MerchantAccount(Document):
         return self._VendorShifts
 
     def setVendorShifts(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._VendorShifts:
             x.MerchantAccount = None
         for y in value:
@@ -90,13 +95,14 @@ class MerchantAccount(Document):
 
     def setMerchantAgreement(self, value):
         if self._MerchantAgreement is not None:
-            filtered = [x for x in self.MerchantAgreement.MerchantAccounts if x != self]
-            self._MerchantAgreement._MerchantAccounts = filtered
+            self._MerchantAgreement._MerchantAccounts.discard(self)
 
         self._MerchantAgreement = value
         if self._MerchantAgreement is not None:
-            if self not in self._MerchantAgreement._MerchantAccounts:
-                self._MerchantAgreement._MerchantAccounts.append(self)
+            if self._MerchantAgreement._MerchantAccounts is EMPTY:
+                self._MerchantAgreement._MerchantAccounts = AssociationList([self])
+            else:
+                self._MerchantAgreement._MerchantAccounts.add(self)
 
     MerchantAgreement = property(getMerchantAgreement, setMerchantAgreement)
 
@@ -106,6 +112,7 @@ class MerchantAccount(Document):
         return self._Vendors
 
     def setVendors(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Vendors:
             x.MerchantAccount = None
         for y in value:
@@ -128,21 +135,28 @@ class MerchantAccount(Document):
         return self._Transactors
 
     def setTransactors(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Transactors:
-            filtered = [q for q in p.MerchantAccounts if q != self]
-            self._Transactors._MerchantAccounts = filtered
+            p._MerchantAccounts.discard(self)
         for r in value:
-            if self not in r._MerchantAccounts:
-                r._MerchantAccounts.append(self)
+            if r._MerchantAccounts is EMPTY:
+                r._MerchantAccounts = AssociationList([self])
+            else:
+                r._MerchantAccounts.add(self)
         self._Transactors = value
 
     Transactors = property(getTransactors, setTransactors)
 
     def addTransactors(self, *Transactors):
         for obj in Transactors:
-            if self not in obj._MerchantAccounts:
-                obj._MerchantAccounts.append(self)
-            self._Transactors.append(obj)
+            if obj._MerchantAccounts is EMPTY:
+                obj._MerchantAccounts = AssociationList([self])
+            else:
+                obj._MerchantAccounts.add(self)
+            if self._Transactors is EMPTY:
+                self._Transactors = AssociationList([obj])
+            else:
+                self._Transactors.add(obj)
 
     def removeTransactors(self, *Transactors):
         for obj in Transactors:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61968.Common.Agreement import Agreement
+from CIM14.Element import AssociationList, EMPTY
 
 class MerchantAgreement(Agreement):
     """A formal controlling contractual agreement between Supplier and Merchant, in terms of which Merchant is authorised to vend tokens and receipt payments on behalf of Supplier. Merchant is accountable to Supplier for revenue collected at PointOfSale.
@@ -29,8 +30,9 @@ class MerchantAgreement(Agreement):
 
         @param MerchantAccounts: All merchant accounts instantiated as a result of this merchant agreement.
         """
-        self._MerchantAccounts = []
-        self.MerchantAccounts = [] if MerchantAccounts is None else MerchantAccounts
+        self._MerchantAccounts = EMPTY
+        if MerchantAccounts is not None:
+            self.MerchantAccounts = MerchantAccounts
 
         super(MerchantAgreement, self).__init__(*args, **kw_args)
 
@@ -47,6 +49,7 @@ class MerchantAgreement(Agreement):
         return self._MerchantAccounts
 
     def setMerchantAccounts(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._MerchantAccounts:
             x.MerchantAgreement = None
         for y in value:
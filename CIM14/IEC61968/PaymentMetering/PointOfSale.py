@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import AssociationList, EMPTY
 
 class PointOfSale(IdentifiedObject):
     """Logical point where transactions take place with operational interaction between Cashier and the payment system; in certain cases PointOfSale interacts directly with the end customer, in which case Cashier might not be a real person: for example a self-service kiosk or over the internet.
@@ -37,8 +38,9 @@ class PointOfSale(IdentifiedObject):
         self._Vendor = None
         self.Vendor = Vendor
 
-        self._CashierShifts = []
-        self.CashierShifts = [] if CashierShifts is None else CashierShifts
+        self._CashierShifts = EMPTY
+        if CashierShifts is not None:
+            self.CashierShifts = CashierShifts
 
         super(PointOfSale, self).__init__(*args, **kw_args)
 
@@ -56,13 +58,14 @@ class PointOfSale(IdentifiedObject):
 
     def setVendor(self, value):
         if self._Vendor is not None:
-            filtered = [x for x in self.Vendor.PointOfSales if x != self]
-            self._Vendor._PointOfSales = filtered
+            self._Vendor._PointOfSales.discard(self)
 
         self._Vendor = value
         if self._Vendor is not None:
-            if self not in self._Vendor._PointOfSales:
-                self._Vendor._PointOfSales.append(self)
+            if self._Vendor._PointOfSales is EMPTY:
+                self._Vendor._PointOfSales = AssociationList([self])
+            else:
+                self._Vendor._PointOfSales.add(self)
 
     Vendor = property(getVendor, setVendor)
 
@@ -72,6 +75,7 @@ class PointOfSale(IdentifiedObject):
         return self._CashierShifts
 
     def setCashierShifts(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._CashierShifts:
             x.PointOfSale = None
         for y in value:
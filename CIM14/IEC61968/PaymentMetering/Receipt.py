@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import AssociationList, EMPTY
 
 class Receipt(IdentifiedObject):
     """Record of total receipted payment from customer.
@@ -40,14 +41,16 @@ class Receipt(IdentifiedObject):
         self._CashierShift = None
         self.CashierShift = CashierShift
 
-        self._Tenders = []
-        self.Tenders = [] if Tenders is None else Tenders
+        self._Tenders = EMPTY
+        if Tenders is not None:
+            self.Tenders = Tenders
 
         self._VendorShift = None
         self.VendorShift = VendorShift
 
-        self._Transactions = []
-        self.Transactions = [] if Transactions is None else Transactions
+        self._Transactions = EMPTY
+        if Transactions is not None:
+            self.Transactions = Transactions
 
         self.line = line
 
@@ -67,13 +70,14 @@ class Receipt(IdentifiedObject):
 
     def setCashierShift(self, value):
         if self._CashierShift is not None:
-            filtered = [x for x in self.CashierShift.Receipts if x != self]
-            self._CashierShift._Receipts = filtered
+            self._CashierShift._Receipts.discard(self)
 
         self._CashierShift = value
         if self._CashierShift is not None:
-            if self not in self._CashierShift._Receipts:
-                self._CashierShift._Receipts.append(self)
+            if self._CashierShift._Receipts is EMPTY:
+                self._CashierShift._Receipts = AssociationList([self])
+            else:
+                self._CashierShift._Receipts.add(self)
 
     CashierShift = property(getCashierShift, setCashierShift)
 
@@ -83,6 +87,7 @@ class Receipt(IdentifiedObject):
         return self._Tenders
 
     def setTenders(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Tenders:
             x.Receipt = None
         for y in value:
@@ -106,13 +111,14 @@ class Receipt(IdentifiedObject):
 
     def setVendorShift(self, value):
         if self._VendorShift is not None:
-            filtered = [x for x in self.VendorShift.Receipts if x != self]
-            self._VendorShift._Receipts = filtered
+            self._VendorShift._Receipts.discard(self)
 
         self._VendorShift = value
         if self._VendorShift is not None:
-            if self not in self._VendorShift._Receipts:
-                self._VendorShift._Receipts.append(self)
+            if self._VendorShift._Receipts is EMPTY:
+                self._VendorShift._Receipts = AssociationList([self])
+            else:
+                self._VendorShift._Receipts.add(self)
 
     VendorShift = property(getVendorShift, setVendorShift)
 
@@ -122,6 +128,7 @@ class Receipt(IdentifiedObject):
         return self._Transactions
 
     def setTransactions(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Transactions:
             x.Receipt = None
         for y in value:
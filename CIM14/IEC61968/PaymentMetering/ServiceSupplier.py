@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61968.Common.Organisation import Organisation
+from CIM14.Element import AssociationList, EMPTY
 
 class ServiceSupplier(Organisation):
     """Organisation that provides services to Customers.
@@ -38,11 +39,13 @@ class ServiceSupplier(Organisation):
         #: Unique transaction reference prefix number issued to an entity by the International Standards Organisation for the purpose of tagging onto electronic financial transactions, as defined in ISO/IEC 7812-1 and ISO/IEC 7812-2.
         self.issuerIdentificationNumber = issuerIdentificationNumber
 
-        self._CustomerAgreements = []
-        self.CustomerAgreements = [] if CustomerAgreements is None else CustomerAgreements
+        self._CustomerAgreements = EMPTY
+        if CustomerAgreements is not None:
+            self.CustomerAgreements = CustomerAgreements
 
-        self._ServiceDeliveryPoints = []
-        self.ServiceDeliveryPoints = [] if ServiceDeliveryPoints is None else ServiceDeliveryPoints
+        self._ServiceDeliveryPoints = EMPTY
+        if ServiceDeliveryPoints is not None:
+            self.ServiceDeliveryPoints = ServiceDeliveryPoints
 
         super(ServiceSupplier, self).__init__(*args, **kw_args)
 
@@ -59,6 +62,7 @@ class ServiceSupplier(Organisation):
         return self._CustomerAgreements
 
     def setCustomerAgreements(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._CustomerAgreements:
             x.ServiceSupplier = None
         for y in value:
@@ -81,6 +85,7 @@ class ServiceSupplier(Organisation):
         return self._ServiceDeliveryPoints
 
     def setServiceDeliveryPoints(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ServiceDeliveryPoints:
             x.ServiceSupplier = None
         for y in value:
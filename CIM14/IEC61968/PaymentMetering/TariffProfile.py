@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61968.Common.Document import Document
+from CIM14.Element import AssociationList, EMPTY
 
 class TariffProfile(Document):
     """A schedule of charges; structure associated with Tariff that allows the definition of complex tarif structures such as step and time of use when used in conjunction with TimeTariffInterval and Charge. Inherited 'status.value' is defined in the context of the utility's business rules, for example: active, inactive, etc.
@@ -35,14 +36,17 @@ class TariffProfile(Document):
         #: The frequency at which the tariff charge schedule is repeated Examples are: once off on a specified date and time; hourly; daily; weekly; monthly; 3-monthly; 6-monthly; 12-monthly; etc. At the end of each cycle, the business rules are reset to start from the beginning again.
         self.tariffCycle = tariffCycle
 
-        self._ConsumptionTariffIntervals = []
-        self.ConsumptionTariffIntervals = [] if ConsumptionTariffIntervals is None else ConsumptionTariffIntervals
+        self._ConsumptionTariffIntervals = EMPTY
+        if ConsumptionTariffIntervals is not None:
+            self.ConsumptionTariffIntervals = ConsumptionTariffIntervals
 
-        self._TimeTariffIntervals = []
-        self.TimeTariffIntervals = [] if TimeTariffIntervals is None else TimeTariffIntervals
+        self._TimeTariffIntervals = EMPTY
+        if TimeTariffIntervals is not None:
+            self.TimeTariffIntervals = TimeTariffIntervals
 
-        self._Tariffs = []
-        self.Tariffs = [] if Tariffs is None else Tariffs
+        self._Tariffs = EMPTY
+        if Tariffs is not None:
+            self.Tariffs = Tariffs
 
         super(TariffProfile, self).__init__(*args, **kw_args)
 
@@ -59,21 +63,28 @@ class TariffProfile(Document):
         return self._ConsumptionTariffIntervals
 
     def setConsumptionTariffIntervals(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ConsumptionTariffIntervals:
-            filtered = [q for q in p.TariffProfiles if q != self]
-            self._ConsumptionTariffIntervals._TariffProfiles = filtered
+            p._TariffProfiles.discard(self)
         for r in value:
-            if self not in r._TariffProfiles:
-                r._TariffProfiles.append(self)
+            if r._TariffProfiles is EMPTY:
+                r._TariffProfiles = AssociationList([self])
+            else:
+                r._TariffProfiles.add(self)
         self._ConsumptionTariffIntervals = value
 
     ConsumptionTariffIntervals = property(getConsumptionTariffIntervals, setConsumptionTariffIntervals)
 
     def addConsumptionTariffIntervals(self, *ConsumptionTariffIntervals):
         for obj in ConsumptionTariffIntervals:
-            if self not in obj._TariffProfiles:
-                obj._TariffProfiles.append(self)
-            self._ConsumptionTariffIntervals.append(obj)
+            if obj._TariffProfiles is EMPTY:
+                obj._TariffProfiles = AssociationList([self])
+            else:
+                obj._TariffProfiles.add(self)
+            if self._ConsumptionTariffIntervals is EMPTY:
+                self._ConsumptionTariffIntervals = AssociationList([obj])
+            else:
+                self._ConsumptionTariffIntervals.add(obj)
 
     def removeConsumptionTariffIntervals(self, *ConsumptionTariffIntervals):
         for obj in ConsumptionTariffIntervals:
@@ -87,21 +98,28 @@ class TariffProfile(Document):
         return self._TimeTariffIntervals
 
     def setTimeTariffIntervals(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._TimeTariffIntervals:
-            filtered = [q for q in p.TariffProfiles if q != self]
-            self._TimeTariffIntervals._TariffProfiles = filtered
+            p._TariffProfiles.discard(self)
         for r in value:
-            if self not in r._TariffProfiles:
-                r._TariffProfiles.append(self)
+            if r._TariffProfiles is EMPTY:
+                r._TariffProfiles = AssociationList([self])
+            else:
+                r._TariffProfiles.add(self)
         self._TimeTariffIntervals = value
 
     TimeTariffIntervals = property(getTimeTariffIntervals, setTimeTariffIntervals)
 
     def addTimeTariffIntervals(self, *TimeTariffIntervals):
         for obj in TimeTariffIntervals:
-            if self not in obj._TariffProfiles:
-                obj._TariffProfiles.append(self)
-            self._TimeTariffIntervals.append(obj)
+            if obj._TariffProfiles is EMPTY:
+                obj._TariffProfiles = AssociationList([self])
+            else:
+                obj._TariffProfiles.add(self)
+            if self._TimeTariffIntervals is EMPTY:
+                self._TimeTariffIntervals = AssociationList([obj])
+            else:
+                self._TimeTariffIntervals.add(obj)
 
     def removeTimeTariffIntervals(self, *TimeTariffIntervals):
         for obj in TimeTariffIntervals:
@@ -115,21 +133,28 @@ class TariffProfile(Document):
         return self._Tariffs
 
     def setTariffs(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Tariffs:
-            filtered = [q for q in p.TariffProfiles if q != self]
-            self._Tariffs._TariffProfiles = filtered
+            p._TariffProfiles.discard(self)
         for r in value:
-            if self not in r._TariffProfiles:
-                r._TariffProfiles.append(self)
+            if r._TariffProfiles is EMPTY:
+                r._TariffProfiles = AssociationList([self])
+            else:
+                r._TariffProfiles.add(self)
         self._Tariffs = value
 
     Tariffs = property(getTariffs, setTariffs)
 
     def addTariffs(self, *Tariffs):
         for obj in Tariffs:
-            if self not in obj._TariffProfiles:
-                obj._TariffProfiles.append(self)
-            self._Tariffs.append(obj)
+            if obj._TariffProfiles is EMPTY:
+                obj._TariffProfiles = AssociationList([self])
+            else:
+                obj._TariffProfiles.add(self)
+            if self._Tariffs is EMPTY:
+                self._Tariffs = AssociationList([obj])
+            else:
+                self._Tariffs.add(obj)
 
     def removeTariffs(self, *Tariffs):
         for obj in Tariffs:
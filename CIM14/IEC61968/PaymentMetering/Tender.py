@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import AssociationList, EMPTY
 
 class Tender(IdentifiedObject):
     """Tender is what is 'offered' by the customer towards making a payment and is often more than the required payment (hence the need for 'change'). The payment is thus that part of the Tender that goes towards settlement of a particular transaction. Tender is modelled as an aggregation of Cheque and Card. Both these tender types can exist in a single tender bid thus 'accountHolderName' must exist separately in each of Cheque and Card as each could have a different account holder name.
@@ -84,13 +85,14 @@ class Tender(IdentifiedObject):
 
     def setReceipt(self, value):
         if self._Receipt is not None:
-            filtered = [x for x in self.Receipt.Tenders if x != self]
-            self._Receipt._Tenders = filtered
+            self._Receipt._Tenders.discard(self)
 
         self._Receipt = value
         if self._Receipt is not None:
-            if self not in self._Receipt._Tenders:
-                self._Receipt._Tenders.append(self)
+            if self._Receipt._Tenders is EMPTY:
+                self._Receipt._Tenders = AssociationList([self])
+            else:
+                self._Receipt._Tenders.add(self)
 
     Receipt = property(getReceipt, setReceipt)
 
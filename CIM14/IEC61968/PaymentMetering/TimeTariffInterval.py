@@ -18,7 +18,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from CIM14.Element import Element
+from CIM14.Element import Element, AssociationList, EMPTY
 
 class TimeTariffInterval(Element):
     """One of a sequence of time intervals defined in terms of real time. It is typically used in association with TariffProfile to define the intervals in a time of use tariff structure, where startDateTime simultaneously determines the starting point of this interval and the ending point of the previous interval.
@@ -38,11 +38,13 @@ class TimeTariffInterval(Element):
         #: A real time marker that defines the starting time (typically it is the time of day) for this interval. The interval extends to the start of the next interval or until it is reset to the start of the first interval by TariffProfile.tariffCycle.
         self.startDateTime = startDateTime
 
-        self._TariffProfiles = []
-        self.TariffProfiles = [] if TariffProfiles is None else TariffProfiles
+        self._TariffProfiles = EMPTY
+        if TariffProfiles is not None:
+            self.TariffProfiles = TariffProfiles
 
-        self._Charges = []
-        self.Charges = [] if Charges is None else Charges
+        self._Charges = EMPTY
+        if Charges is not None:
+            self.Charges = Charges
 
         super(TimeTariffInterval, self).__init__(*args, **kw_args)
 
@@ -59,21 +61,28 @@ class TimeTariffInterval(Element):
         return self._TariffProfiles
 
     def setTariffProfiles(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._TariffProfiles:
-            filtered = [q for q in p.TimeTariffIntervals if q != self]
-            self._TariffProfiles._TimeTariffIntervals = filtered
+            p._TimeTariffIntervals.discard(self)
         for r in value:
-            if self not in r._TimeTariffIntervals:
-                r._TimeTariffIntervals.append(self)
+            if r._TimeTariffIntervals is EMPTY:
+                r._TimeTariffIntervals = AssociationList([self])
+            else:
+                r._TimeTariffIntervals.add(self)
         self._TariffProfiles = value
 
     TariffProfiles = property(getTariffProfiles, setTariffProfiles)
 
     def addTariffProfiles(self, *TariffProfiles):
         for obj in TariffProfiles:
-            if self not in obj._TimeTariffIntervals:
-                obj._TimeTariffIntervals.append(self)
-            self._TariffProfiles.append(obj)
+            if obj._TimeTariffIntervals is EMPTY:
+                obj._TimeTariffIntervals = AssociationList([self])
+            else:
+                obj._TimeTariffIntervals.add(self)
+            if self._TariffProfiles is EMPTY:
+                self._TariffProfiles = AssociationList([obj])
+            else:
+                self._TariffProfiles.add(obj)
 
     def removeTariffProfiles(self, *TariffProfiles):
         for obj in TariffProfiles:
@@ -87,21 +96,28 @@ class TimeTariffInterval(Element):
         return self._Charges
 
     def setCharges(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Charges:
-            filtered = [q for q in p.TimeTariffIntervals if q != self]
-            self._Charges._TimeTariffIntervals = filtered
+            p._TimeTariffIntervals.discard(self)
         for r in value:
-            if self not in r._TimeTariffIntervals:
-                r._TimeTariffIntervals.append(self)
+            if r._TimeTariffIntervals is EMPTY:
+                r._TimeTariffIntervals = AssociationList([self])
+            else:
+                r._TimeTariffIntervals.add(self)
         self._Charges = value
 
     Charges = property(getCharges, setCharges)
 
     def addCharges(self, *Charges):
         for obj in Charges:
-            if self not in obj._TimeTariffIntervals:
-                obj._TimeTariffIntervals.append(self)
-            self._Charges.append(obj)
+            if obj._TimeTariffIntervals is EMPTY:
+                obj._TimeTariffIntervals = AssociationList([self])
+            else:
+                obj._TimeTariffIntervals.add(self)
+            if self._Charges is EMPTY:
+                self._Charges = AssociationList([obj])
+            else:
+                self._Charges.add(obj)
 
     def removeCharges(self, *Charges):
         for obj in Charges:
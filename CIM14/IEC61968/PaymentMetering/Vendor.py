@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import AssociationList, EMPTY
 
 class Vendor(IdentifiedObject):
     """The entity that owns PointOfSale and contracts with Cashier to receipt payments and vend tokens using the payment system. Vendor has a private contract with and is managed by Merchant who is a type of Organisation. Vendor is accountable to Merchant for revenue collected, who is in turn accountable to Supplier.
@@ -32,17 +33,20 @@ class Vendor(IdentifiedObject):
         @param Cashiers: All Cachiers managed by this Vendor.
         @param VendorShifts: All vendor shifts opened and owned by this vendor.
         """
-        self._PointOfSales = []
-        self.PointOfSales = [] if PointOfSales is None else PointOfSales
+        self._PointOfSales = EMPTY
+        if PointOfSales is not None:
+            self.PointOfSales = PointOfSales
 
         self._MerchantAccount = None
         self.MerchantAccount = MerchantAccount
 
-        self._Cashiers = []
-        self.Cashiers = [] if Cashiers is None else Cashiers
+        self._Cashiers = EMPTY
+        if Cashiers is not None:
+            self.Cashiers = Cashiers
 
-        self._VendorShifts = []
-        self.VendorShifts = [] if VendorShifts is None else VendorShifts
+        self._VendorShifts = EMPTY
+        if VendorShifts is not None:
+            self.VendorShifts = VendorShifts
 
         super(Vendor, self).__init__(*args, **kw_args)
 
@@ -59,6 +63,7 @@ class Vendor(IdentifiedObject):
         return self._PointOfSales
 
     def setPointOfSales(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._PointOfSales:
             x.Vendor = None
         for y in value:
@@ -82,13 +87,14 @@ class Vendor(IdentifiedObject):
 
     def setMerchantAccount(self, value):
         if self._MerchantAccount is not None:
-            filtered = [x for x in self.MerchantAccount.Vendors if x != self]
-            self._MerchantAccount._Vendors = filtered
+            self._MerchantAccount._Vendors.discard(self)
 
         self._MerchantAccount = value
         if self._MerchantAccount is not None:
-            if self not in self._MerchantAccount._Vendors:
-                self._MerchantAccount._Vendors.append(self)
+            if self._MerchantAccount._Vendors is EMPTY:
+                self._MerchantAccount._Vendors = AssociationList([self])
+            else:
+                self._MerchantAccount._Vendors.add(self)
 
     MerchantAccount = property(getMerchantAccount, setMerchantAccount)
 
@@ -98,6 +104,7 @@ class Vendor(IdentifiedObject):
         return self._Cashiers
 
     def setCashiers(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Cashiers:
             x.Vendor = None
         for y in value:
@@ -120,6 +127,7 @@ class Vendor(IdentifiedObject):
         return self._VendorShifts
 
     def setVendorShifts(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._VendorShifts:
             x.Vendor = None
         for y in value:
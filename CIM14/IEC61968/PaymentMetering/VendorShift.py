@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61968.PaymentMetering.Shift import Shift
+from CIM14.Element import AssociationList, EMPTY
 
 class VendorShift(Shift):
     """The operating shift for a vendor during which he may transact against the merchant's account. It aggregates transactions and receipts during the shift and periodically debits a merchant account. The totals in VendorShift should always = sum of totals aggregated in all cashier shifts that were open under the particular vendor shift.
@@ -43,11 +44,13 @@ class VendorShift(Shift):
         self._MerchantAccount = None
         self.MerchantAccount = MerchantAccount
 
-        self._Transactions = []
-        self.Transactions = [] if Transactions is None else Transactions
+        self._Transactions = EMPTY
+        if Transactions is not None:
+            self.Transactions = Transactions
 
-        self._Receipts = []
-        self.Receipts = [] if Receipts is None else Receipts
+        self._Receipts = EMPTY
+        if Receipts is not None:
+            self.Receipts = Receipts
 
         self._Vendor = None
         self.Vendor = Vendor
@@ -68,13 +71,14 @@ class VendorShift(Shift):
 
     def setMerchantAccount(self, value):
         if self._MerchantAccount is not None:
-            filtered = [x for x in self.MerchantAccount.VendorShifts if x != self]
-            self._MerchantAccount._VendorShifts = filtered
+            self._MerchantAccount._VendorShifts.discard(self)
 
         self._MerchantAccount = value
         if self._MerchantAccount is not None:
-            if self not in self._MerchantAccount._VendorShifts:
-                self._MerchantAccount._VendorShifts.append(self)
+            if self._MerchantAccount._VendorShifts is EMPTY:
+                self._MerchantAccount._VendorShifts = AssociationList([self])
+            else:
+                self._MerchantAccount._VendorShifts.add(self)
 
     MerchantAccount = property(getMerchantAccount, setMerchantAccount)
 
@@ -83,6 +87,7 @@ class VendorShift(Shift):
         return self._Transactions
 
     def setTransactions(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Transactions:
             x.VendorShift = None
         for y in value:
@@ -104,6 +109,7 @@ class VendorShift(Shift):
         return self._Receipts
 
     def setReceipts(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Receipts:
             x.VendorShift = None
         for y in value:
@@ -127,13 +133,14 @@ class VendorShift(Shift):
 
     def setVendor(self, value):
         if self._Vendor is not None:
-            filtered = [x for x in self.Vendor.VendorShifts if x != self]
-            self._Vendor._VendorShifts = filtered
+            self._Vendor._VendorShifts.discard(self)
 
         self._Vendor = value
         if self._Vendor is not None:
-            if self not in self._Vendor._VendorShifts:
-                self._Vendor._VendorShifts.append(self)
+            if self._Vendor._VendorShifts is EMPTY:
+                self._Vendor._VendorShifts = AssociationList([self])
+            else:
+                self._Vendor._VendorShifts.add(self)
 
     Vendor = property(getVendor, setVendor)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.Equipment import Equipment
+from CIM14.Element import AssociationList, EMPTY
 
 class DistributionTransformer(Equipment):
     """An assembly of two or more coupled windings that transform electrical power between voltage levels. Supports both balanced and unbalanced winding connections. This class differs from Wires::PowerTransformer as follows: - it is part of a TransformerBank - it draws parameters exclusively from TransformerInfo and its associated classes.
@@ -32,11 +33,13 @@ class DistributionTransformer(Equipment):
         @param TransformerBank: Bank this transformer belongs to.
         @param TransformerInfo: Transformer data.
         """
-        self._Windings = []
-        self.Windings = [] if Windings is None else Windings
+        self._Windings = EMPTY
+        if Windings is not None:
+            self.Windings = Windings
 
-        self._ServiceDeliveryPoints = []
-        self.ServiceDeliveryPoints = [] if ServiceDeliveryPoints is None else ServiceDeliveryPoints
+        self._ServiceDeliveryPoints = EMPTY
+        if ServiceDeliveryPoints is not None:
+            self.ServiceDeliveryPoints = ServiceDeliveryPoints
 
         self._TransformerBank = None
         self.TransformerBank = TransformerBank
@@ -59,6 +62,7 @@ class DistributionTransformer(Equipment):
         return self._Windings
 
     def setWindings(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Windings:
             x.Transformer = None
         for y in value:
@@ -81,6 +85,7 @@ class DistributionTransformer(Equipment):
         return self._ServiceDeliveryPoints
 
     def setServiceDeliveryPoints(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ServiceDeliveryPoints:
             x.Transformer = None
         for y in value:
@@ -104,13 +109,14 @@ class DistributionTransformer(Equipment):
 
     def setTransformerBank(self, value):
         if self._TransformerBank is not None:
-            filtered = [x for x in self.TransformerBank.Transformers if x != self]
-            self._TransformerBank._Transformers = filtered
+            self._TransformerBank._Transformers.discard(self)
 
         self._TransformerBank = value
         if self._TransformerBank is not None:
-            if self not in self._TransformerBank._Transformers:
-                self._TransformerBank._Transformers.append(self)
+            if self._TransformerBank._Transformers is EMPTY:
+                self._TransformerBank._Transformers = AssociationList([self])
+            else:
+                self._TransformerBank._Transformers.add(self)
 
     TransformerBank = property(getTransformerBank, setTransformerBank)
 
@@ -121,13 +127,14 @@ class DistributionTransformer(Equipment):
 
     def setTransformerInfo(self, value):
         if self._TransformerInfo is not None:
-            filtered = [x for x in self.TransformerInfo.Transformers if x != self]
-            self._TransformerInfo._Transformers = filtered
+            self._TransformerInfo._Transformers.discard(self)
 
         self._TransformerInfo = value
         if self._TransformerInfo is not None:
-            if self not in self._TransformerInfo._Transformers:
-                self._TransformerInfo._Transformers.append(self)
+            if self._TransformerInfo._Transformers is EMPTY:
+                self._TransformerInfo._Transformers = AssociationList([self])
+            else:
+                self._TransformerInfo._Transformers.add(self)
 
     TransformerInfo = property(getTransformerInfo, setTransformerInfo)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.ConductingEquipment import ConductingEquipment
+from CIM14.Element import AssociationList, EMPTY
 
 class DistributionTransformerWinding(ConductingEquipment):
     """Conducting connection point of a distribution / unbalanced transformer winding instance. This class differs from Wires::TransformerWinding as follows: - the eight Pi model attributes are moved into separate class, that can be optionally referred to from several winding instances. - the three grounding attributes can differ per winding instance, even for windings that use the same TransformerInfo, so they are kept on DistributionTransformerWinding. - 'windingType' attribute is replaced by 'sequenceNumber' attribute on WindingInfo class. - all the other attributes come from the WindingInfo (and its relationships). TransformerInfo is associated to the DistributionTransformer as referenceable data, so it can be defined once and referred to from instances, instead of being specified with each instance.
@@ -76,13 +77,14 @@ class DistributionTransformerWinding(ConductingEquipment):
 
     def setTransformer(self, value):
         if self._Transformer is not None:
-            filtered = [x for x in self.Transformer.Windings if x != self]
-            self._Transformer._Windings = filtered
+            self._Transformer._Windings.discard(self)
 
         self._Transformer = value
         if self._Transformer is not None:
-            if self not in self._Transformer._Windings:
-                self._Transformer._Windings.append(self)
+            if self._Transformer._Windings is EMPTY:
+                self._Transformer._Windings = AssociationList([self])
+            else:
+                self._Transformer._Windings.add(self)
 
     Transformer = property(getTransformer, setTransformer)
 
@@ -93,13 +95,14 @@ class DistributionTransformerWinding(ConductingEquipment):
 
     def setWindingInfo(self, value):
         if self._WindingInfo is not None:
-            filtered = [x for x in self.WindingInfo.Windings if x != self]
-            self._WindingInfo._Windings = filtered
+            self._WindingInfo._Windings.discard(self)
 
         self._WindingInfo = value
         if self._WindingInfo is not None:
-            if self not in self._WindingInfo._Windings:
-                self._WindingInfo._Windings.append(self)
+            if self._WindingInfo._Windings is EMPTY:
+                self._WindingInfo._Windings = AssociationList([self])
+            else:
+                self._WindingInfo._Windings.add(self)
 
     WindingInfo = property(getWindingInfo, setWindingInfo)
 
@@ -126,13 +129,14 @@ class DistributionTransformerWinding(ConductingEquipment):
 
     def setPiImpedance(self, value):
         if self._PiImpedance is not None:
-            filtered = [x for x in self.PiImpedance.Windings if x != self]
-            self._PiImpedance._Windings = filtered
+            self._PiImpedance._Windings.discard(self)
 
         self._PiImpedance = value
         if self._PiImpedance is not None:
-            if self not in self._PiImpedance._Windings:
-                self._PiImpedance._Windings.append(self)
+            if self._PiImpedance._Windings is EMPTY:
+                self._PiImpedance._Windings = AssociationList([self])
+            else:
+                self._PiImpedance._Windings.add(self)
 
     PiImpedance = property(getPiImpedance, setPiImpedance)
 
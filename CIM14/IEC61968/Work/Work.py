@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61968.Common.Document import Document
+from CIM14.Element import AssociationList, EMPTY
 
 class Work(Document):
     """Document used to request, initiate, track and record work. This is synonymous with Work Breakdown Structure (WBS), which is traversed through the (currently informative) recursive association of Work. Note that the work name is equal to the WBS name, which is given in the inherited 'name' attribute.
@@ -41,8 +42,9 @@ class Work(Document):
         #: Date and time work was requested.
         self.requestDateTime = requestDateTime
 
-        self._Customers = []
-        self.Customers = [] if Customers is None else Customers
+        self._Customers = EMPTY
+        if Customers is not None:
+            self.Customers = Customers
 
         super(Work, self).__init__(*args, **kw_args)
 
@@ -59,21 +61,28 @@ class Work(Document):
         return self._Customers
 
     def setCustomers(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Customers:
-            filtered = [q for q in p.Works if q != self]
-            self._Customers._Works = filtered
+            p._Works.discard(self)
         for r in value:
-            if self not in r._Works:
-                r._Works.append(self)
+            if r._Works is EMPTY:
+                r._Works = AssociationList([self])
+            else:
+                r._Works.add(self)
         self._Customers = value
 
     Customers = property(getCustomers, setCustomers)
 
     def addCustomers(self, *Customers):
         for obj in Customers:
-            if self not in obj._Works:
-                obj._Works.append(self)
-            self._Customers.append(obj)
+            if obj._Works is EMPTY:
+                obj._Works = AssociationList([self])
+            else:
+                obj._Works.add(self)
+            if self._Customers is EMPTY:
+                self._Customers = AssociationList([obj])
+            else:
+                self._Customers.add(obj)
 
     def removeCustomers(self, *Customers):
         for obj in Customers:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Contingency.ContingencyElement import ContingencyElement
+from CIM14.Element import AssociationList, EMPTY
 
 class ContingencyEquipment(ContingencyElement):
     """A equipment to which the in service status is to change such as a power transformer or AC line segment.
@@ -52,13 +53,14 @@ class ContingencyEquipment(ContingencyElement):
 
     def setEquipment(self, value):
         if self._Equipment is not None:
-            filtered = [x for x in self.Equipment.ContingencyEquipment if x != self]
-            self._Equipment._ContingencyEquipment = filtered
+            self._Equipment._ContingencyEquipment.discard(self)
 
         self._Equipment = value
         if self._Equipment is not None:
-            if self not in self._Equipment._ContingencyEquipment:
-                self._Equipment._ContingencyEquipment.append(self)
+            if self._Equipment._ContingencyEquipment is EMPTY:
+                self._Equipment._ContingencyEquipment = AssociationList([self])
+            else:
+                self._Equipment._ContingencyEquipment.add(self)
 
     Equipment = property(getEquipment, setEquipment)
 
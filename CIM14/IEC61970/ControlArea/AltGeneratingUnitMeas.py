@@ -18,7 +18,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from CIM14.Element import Element
+from CIM14.Element import Element, AssociationList, EMPTY
 
 class AltGeneratingUnitMeas(Element):
     """A prioritized measurement to be used for the generating unit in the control area specificaiton.
@@ -56,13 +56,14 @@ class AltGeneratingUnitMeas(Element):
 
     def setControlAreaGeneratingUnit(self, value):
         if self._ControlAreaGeneratingUnit is not None:
-            filtered = [x for x in self.ControlAreaGeneratingUnit.AltGeneratingUnitMeas if x != self]
-            self._ControlAreaGeneratingUnit._AltGeneratingUnitMeas = filtered
+            self._ControlAreaGeneratingUnit._AltGeneratingUnitMeas.discard(self)
 
         self._ControlAreaGeneratingUnit = value
         if self._ControlAreaGeneratingUnit is not None:
-            if self not in self._ControlAreaGeneratingUnit._AltGeneratingUnitMeas:
-                self._ControlAreaGeneratingUnit._AltGeneratingUnitMeas.append(self)
+            if self._ControlAreaGeneratingUnit._AltGeneratingUnitMeas is EMPTY:
+                self._ControlAreaGeneratingUnit._AltGeneratingUnitMeas = AssociationList([self])
+            else:
+                self._ControlAreaGeneratingUnit._AltGeneratingUnitMeas.add(self)
 
     ControlAreaGeneratingUnit = property(getControlAreaGeneratingUnit, setControlAreaGeneratingUnit)
 
@@ -73,13 +74,14 @@ class AltGeneratingUnitMeas(Element):
 
     def setAnalogValue(self, value):
         if self._AnalogValue is not None:
-            filtered = [x for x in self.AnalogValue.AltGeneratingUnit if x != self]
-            self._AnalogValue._AltGeneratingUnit = filtered
+            self._AnalogValue._AltGeneratingUnit.discard(self)
 
         self._AnalogValue = value
         if self._AnalogValue is not None:
-            if self not in self._AnalogValue._AltGeneratingUnit:
-                self._AnalogValue._AltGeneratingUnit.append(self)
+            if self._AnalogValue._AltGeneratingUnit is EMPTY:
+                self._AnalogValue._AltGeneratingUnit = AssociationList([self])
+            else:
+                self._AnalogValue._AltGeneratingUnit.add(self)
 
     AnalogValue = property(getAnalogValue, setAnalogValue)
 
@@ -18,7 +18,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from CIM14.Element import Element
+from CIM14.Element import Element, AssociationList, EMPTY
 
 class AltTieMeas(Element):
     """A prioritized measurement to be used for the tie flow as part of the control area specification.
@@ -56,13 +56,14 @@ class AltTieMeas(Element):
 
     def setAnalogValue(self, value):
         if self._AnalogValue is not None:
-            filtered = [x for x in self.AnalogValue.AltTieMeas if x != self]
-            self._AnalogValue._AltTieMeas = filtered
+            self._AnalogValue._AltTieMeas.discard(self)
 
         self._AnalogValue = value
         if self._AnalogValue is not None:
-            if self not in self._AnalogValue._AltTieMeas:
-                self._AnalogValue._AltTieMeas.append(self)
+            if self._AnalogValue._AltTieMeas is EMPTY:
+                self._AnalogValue._AltTieMeas = AssociationList([self])
+            else:
+                self._AnalogValue._AltTieMeas.add(self)
 
     AnalogValue = property(getAnalogValue, setAnalogValue)
 
@@ -73,13 +74,14 @@ class AltTieMeas(Element):
 
     def setTieFlow(self, value):
         if self._TieFlow is not None:
-            filtered = [x for x in self.TieFlow.AltTieMeas if x != self]
-            self._TieFlow._AltTieMeas = filtered
+            self._TieFlow._AltTieMeas.discard(self)
 
         self._TieFlow = value
         if self._TieFlow is not None:
-            if self not in self._TieFlow._AltTieMeas:
-                self._TieFlow._AltTieMeas.append(self)
+            if self._TieFlow._AltTieMeas is EMPTY:
+                self._TieFlow._AltTieMeas = AssociationList([self])
+            else:
+                self._TieFlow._AltTieMeas.add(self)
 
     TieFlow = property(getTieFlow, setTieFlow)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.PowerSystemResource import PowerSystemResource
+from CIM14.Element import AssociationList, EMPTY
 
 class ControlArea(PowerSystemResource):
     """A <b>control area </b>is a grouping of <b>generating units</b> and/or loads and a cutset of tie lines (as <b>terminals</b>) which may be used for a variety of purposes including automatic generation control, powerflow solution area interchange control specification, and input to load forecasting.   Note that any number of overlapping control area specifications can be superimposed on the physical model.
@@ -43,14 +44,16 @@ class ControlArea(PowerSystemResource):
         #: Active power net interchange tolerance
         self.pTolerance = pTolerance
 
-        self._TieFlow = []
-        self.TieFlow = [] if TieFlow is None else TieFlow
+        self._TieFlow = EMPTY
+        if TieFlow is not None:
+            self.TieFlow = TieFlow
 
         self._EnergyArea = None
         self.EnergyArea = EnergyArea
 
-        self._ControlAreaGeneratingUnit = []
-        self.ControlAreaGeneratingUnit = [] if ControlAreaGeneratingUnit is None else ControlAreaGeneratingUnit
+        self._ControlAreaGeneratingUnit = EMPTY
+        if ControlAreaGeneratingUnit is not None:
+            self.ControlAreaGeneratingUnit = ControlAreaGeneratingUnit
 
         super(ControlArea, self).__init__(*args, **kw_args)
 
@@ -67,6 +70,7 @@ class ControlArea(PowerSystemResource):
         return self._TieFlow
 
     def setTieFlow(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._TieFlow:
             x.ControlArea = None
         for y in value:
@@ -105,6 +109,7 @@ class ControlArea(PowerSystemResource):
         return self._ControlAreaGeneratingUnit
 
     def setControlAreaGeneratingUnit(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ControlAreaGeneratingUnit:
             x.ControlArea = None
         for y in value:
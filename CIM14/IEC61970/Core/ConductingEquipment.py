@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.Equipment import Equipment
+from CIM14.Element import AssociationList, EMPTY
 
 class ConductingEquipment(Equipment):
     """The parts of the power system that are designed to carry current or that are conductively connected therewith. ConductingEquipment is contained within an EquipmentContainer that may be a Substation, or a VoltageLevel or a Bay within a Substation.
@@ -37,20 +38,23 @@ class ConductingEquipment(Equipment):
         #: Describes the phases carried by a conducting equipment. Values are: "A", "AC", "AN", "ABCN", "B", "C", "BN", "CN", "splitSecondary12N", "ABC", "splitSecondary2N", "N", "ABN", "BC", "BCN", "AB", "splitSecondary1N", "ACN"
         self.phases = phases
 
-        self._ClearanceTags = []
-        self.ClearanceTags = [] if ClearanceTags is None else ClearanceTags
+        self._ClearanceTags = EMPTY
+        if ClearanceTags is not None:
+            self.ClearanceTags = ClearanceTags
 
         self._SvStatus = None
         self.SvStatus = SvStatus
 
-        self._Terminals = []
-        self.Terminals = [] if Terminals is None else Terminals
+        self._Terminals = EMPTY
+        if Terminals is not None:
+            self.Terminals = Terminals
 
         self._BaseVoltage = None
         self.BaseVoltage = BaseVoltage
 
-        self._ProtectionEquipments = []
-        self.ProtectionEquipments = [] if ProtectionEquipments is None else ProtectionEquipments
+        self._ProtectionEquipments = EMPTY
+        if ProtectionEquipments is not None:
+            self.ProtectionEquipments = ProtectionEquipments
 
         super(ConductingEquipment, self).__init__(*args, **kw_args)
 
@@ -67,6 +71,7 @@ class ConductingEquipment(Equipment):
         return self._ClearanceTags
 
     def setClearanceTags(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ClearanceTags:
             x.ConductingEquipment = None
         for y in value:
@@ -105,6 +110,7 @@ class ConductingEquipment(Equipment):
         return self._Terminals
 
     def setTerminals(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Terminals:
             x.ConductingEquipment = None
         for y in value:
@@ -128,13 +134,14 @@ class ConductingEquipment(Equipment):
 
     def setBaseVoltage(self, value):
         if self._BaseVoltage is not None:
-            filtered = [x for x in self.BaseVoltage.ConductingEquipment if x != self]
-            self._BaseVoltage._ConductingEquipment = filtered
+            self._BaseVoltage._ConductingEquipment.discard(self)
 
         self._BaseVoltage = value
         if self._BaseVoltage is not None:
-            if self not in self._BaseVoltage._ConductingEquipment:
-                self._BaseVoltage._ConductingEquipment.append(self)
+            if self._BaseVoltage._ConductingEquipment is EMPTY:
+                self._BaseVoltage._ConductingEquipment = AssociationList([self])
+            else:
+                self._BaseVoltage._ConductingEquipment.add(self)
 
     BaseVoltage = property(getBaseVoltage, setBaseVoltage)
 
@@ -144,21 +151,28 @@ class ConductingEquipment(Equipment):
         return self._ProtectionEquipments
 
     def setProtectionEquipments(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ProtectionEquipments:
-            filtered = [q for q in p.ConductingEquipments if q != self]
-            self._ProtectionEquipments._ConductingEquipments = filtered
+            p._ConductingEquipments.discard(self)
         for r in value:
-            if self not in r._ConductingEquipments:
-                r._ConductingEquipments.append(self)
+            if r._ConductingEquipments is EMPTY:
+                r._ConductingEquipments = AssociationList([self])
+            else:
+                r._ConductingEquipments.add(self)
         self._ProtectionEquipments = value
 
     ProtectionEquipments = property(getProtectionEquipments, setProtectionEquipments)
 
     def addProtectionEquipments(self, *ProtectionEquipments):
         for obj in ProtectionEquipments:
-            if self not in obj._ConductingEquipments:
-                obj._ConductingEquipments.append(self)
-            self._ProtectionEquipments.append(obj)
+            if obj._ConductingEquipments is EMPTY:
+                obj._ConductingEquipments = AssociationList([self])
+            else:
+                obj._ConductingEquipments.add(self)
+            if self._ProtectionEquipments is EMPTY:
+                self._ProtectionEquipments = AssociationList([obj])
+            else:
+                self._ProtectionEquipments.add(obj)
 
     def removeProtectionEquipments(self, *ProtectionEquipments):
         for obj in ProtectionEquipments:
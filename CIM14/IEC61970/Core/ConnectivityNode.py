@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import AssociationList, EMPTY
 
 class ConnectivityNode(IdentifiedObject):
     """Connectivity nodes are points where terminals of conducting equipment are connected together with zero impedance.
@@ -41,8 +42,9 @@ class ConnectivityNode(IdentifiedObject):
         self._ConnectivityNodeContainer = None
         self.ConnectivityNodeContainer = ConnectivityNodeContainer
 
-        self._Terminals = []
-        self.Terminals = [] if Terminals is None else Terminals
+        self._Terminals = EMPTY
+        if Terminals is not None:
+            self.Terminals = Terminals
 
         super(ConnectivityNode, self).__init__(*args, **kw_args)
 
@@ -60,13 +62,14 @@ class ConnectivityNode(IdentifiedObject):
 
     def setTopologicalNode(self, value):
         if self._TopologicalNode is not None:
-            filtered = [x for x in self.TopologicalNode.ConnectivityNodes if x != self]
-            self._TopologicalNode._ConnectivityNodes = filtered
+            self._TopologicalNode._ConnectivityNodes.discard(self)
 
         self._TopologicalNode = value
         if self._TopologicalNode is not None:
-            if self not in self._TopologicalNode._ConnectivityNodes:
-                self._TopologicalNode._ConnectivityNodes.append(self)
+            if self._TopologicalNode._ConnectivityNodes is EMPTY:
+                self._TopologicalNode._ConnectivityNodes = AssociationList([self])
+            else:
+                self._TopologicalNode._ConnectivityNodes.add(self)
 
     TopologicalNode = property(getTopologicalNode, setTopologicalNode)
 
@@ -77,13 +80,14 @@ class ConnectivityNode(IdentifiedObject):
 
     def setBusNameMarker(self, value):
         if self._BusNameMarker is not None:
-            filtered = [x for x in self.BusNameMarker.ConnectivityNode if x != self]
-            self._BusNameMarker._ConnectivityNode = filtered
+            self._BusNameMarker._ConnectivityNode.discard(self)
 
         self._BusNameMarker = value
         if self._BusNameMarker is not None:
-            if self not in self._BusNameMarker._ConnectivityNode:
-                self._BusNameMarker._ConnectivityNode.append(self)
+            if self._BusNameMarker._ConnectivityNode is EMPTY:
+                self._BusNameMarker._ConnectivityNode = AssociationList([self])
+            else:
+                self._BusNameMarker._ConnectivityNode.add(self)
 
     BusNameMarker = property(getBusNameMarker, setBusNameMarker)
 
@@ -94,13 +98,14 @@ class ConnectivityNode(IdentifiedObject):
 
     def setConnectivityNodeContainer(self, value):
         if self._ConnectivityNodeContainer is not None:
-            filtered = [x for x in self.ConnectivityNodeContainer.ConnectivityNodes if x != self]
-            self._ConnectivityNodeContainer._ConnectivityNodes = filtered
+            self._ConnectivityNodeContainer._ConnectivityNodes.discard(self)
 
         self._ConnectivityNodeContainer = value
         if self._ConnectivityNodeContainer is not None:
-            if self not in self._ConnectivityNodeContainer._ConnectivityNodes:
-                self._ConnectivityNodeContainer._ConnectivityNodes.append(self)
+            if self._ConnectivityNodeContainer._ConnectivityNodes is EMPTY:
+                self._ConnectivityNodeContainer._ConnectivityNodes = AssociationList([self])
+            else:
+                self._ConnectivityNodeContainer._ConnectivityNodes.add(self)
 
     ConnectivityNodeContainer = property(getConnectivityNodeContainer, setConnectivityNodeContainer)
 
@@ -110,6 +115,7 @@ class ConnectivityNode(IdentifiedObject):
         return self._Terminals
 
     def setTerminals(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Terminals:
             x.ConnectivityNode = None
         for y in value:
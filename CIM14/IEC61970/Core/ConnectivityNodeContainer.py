@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.PowerSystemResource import PowerSystemResource
+from CIM14.Element import AssociationList, EMPTY
 
 class ConnectivityNodeContainer(PowerSystemResource):
     """A base class for all objects that may contain ConnectivityNodes or TopologicalNodes.
@@ -30,11 +31,13 @@ class ConnectivityNodeContainer(PowerSystemResource):
         @param ConnectivityNodes: Connectivity nodes contained by this container.
         @param TopologicalNode: The topological nodes which belong to this connectivity node container.
         """
-        self._ConnectivityNodes = []
-        self.ConnectivityNodes = [] if ConnectivityNodes is None else ConnectivityNodes
+        self._ConnectivityNodes = EMPTY
+        if ConnectivityNodes is not None:
+            self.ConnectivityNodes = ConnectivityNodes
 
-        self._TopologicalNode = []
-        self.TopologicalNode = [] if TopologicalNode is None else TopologicalNode
+        self._TopologicalNode = EMPTY
+        if TopologicalNode is not None:
+            self.TopologicalNode = TopologicalNode
 
         super(ConnectivityNodeContainer, self).__init__(*args, **kw_args)
 
@@ -51,6 +54,7 @@ class ConnectivityNodeContainer(PowerSystemResource):
         return self._ConnectivityNodes
 
     def setConnectivityNodes(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ConnectivityNodes:
             x.ConnectivityNodeContainer = None
         for y in value:
@@ -73,6 +77,7 @@ class ConnectivityNodeContainer(PowerSystemResource):
         return self._TopologicalNode
 
     def setTopologicalNode(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._TopologicalNode:
             x.ConnectivityNodeContainer = None
         for y in value:
@@ -18,7 +18,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from CIM14.Element import Element
+from CIM14.Element import Element, AssociationList, EMPTY
 
 class CurveData(Element):
     """Multi-purpose data points for defining a curve.
@@ -64,13 +64,14 @@ class CurveData(Element):
 
     def setCurve(self, value):
         if self._Curve is not None:
-            filtered = [x for x in self.Curve.CurveDatas if x != self]
-            self._Curve._CurveDatas = filtered
+            self._Curve._CurveDatas.discard(self)
 
         self._Curve = value
         if self._Curve is not None:
-            if self not in self._Curve._CurveDatas:
-                self._Curve._CurveDatas.append(self)
+            if self._Curve._CurveDatas is EMPTY:
+                self._Curve._CurveDatas = AssociationList([self])
+            else:
+                self._Curve._CurveDatas.add(self)
 
     Curve = property(getCurve, setCurve)
 
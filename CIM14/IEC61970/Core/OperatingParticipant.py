@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import AssociationList, EMPTY
 
 class OperatingParticipant(IdentifiedObject):
     """An operator of multiple PowerSystemResource objects. Note multple OperatingParticipants may operate the same PowerSystemResource object.   This can be used for modeling jointly owned units where each owner operates as a contractual share.
@@ -29,8 +30,9 @@ class OperatingParticipant(IdentifiedObject):
 
         @param OperatingShare: The operating shares of an operating participant.   An operating participant can be reused for any number of PSR's.
         """
-        self._OperatingShare = []
-        self.OperatingShare = [] if OperatingShare is None else OperatingShare
+        self._OperatingShare = EMPTY
+        if OperatingShare is not None:
+            self.OperatingShare = OperatingShare
 
         super(OperatingParticipant, self).__init__(*args, **kw_args)
 
@@ -47,6 +49,7 @@ class OperatingParticipant(IdentifiedObject):
         return self._OperatingShare
 
     def setOperatingShare(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._OperatingShare:
             x.OperatingParticipant = None
         for y in value:
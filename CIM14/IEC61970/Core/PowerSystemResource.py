@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import AssociationList, EMPTY
 
 class PowerSystemResource(IdentifiedObject):
     """A power system resource can be an item of equipment such as a Switch, an EquipmentContainer containing many individual items of equipment such as a  Substation, or an organisational entity such as Company or SubControlArea.  This provides for the nesting of collections of PowerSystemResources within other PowerSystemResources. For example, a Switch could be a member of a Substation and a Substation could be a member of a division of a Company.
@@ -40,26 +41,32 @@ class PowerSystemResource(IdentifiedObject):
         self._Location = None
         self.Location = Location
 
-        self._Assets = []
-        self.Assets = [] if Assets is None else Assets
+        self._Assets = EMPTY
+        if Assets is not None:
+            self.Assets = Assets
 
-        self._PsrLists = []
-        self.PsrLists = [] if PsrLists is None else PsrLists
+        self._PsrLists = EMPTY
+        if PsrLists is not None:
+            self.PsrLists = PsrLists
 
-        self._Measurements = []
-        self.Measurements = [] if Measurements is None else Measurements
+        self._Measurements = EMPTY
+        if Measurements is not None:
+            self.Measurements = Measurements
 
-        self._OperatingShare = []
-        self.OperatingShare = [] if OperatingShare is None else OperatingShare
+        self._OperatingShare = EMPTY
+        if OperatingShare is not None:
+            self.OperatingShare = OperatingShare
 
         self._OutageSchedule = None
         self.OutageSchedule = OutageSchedule
 
-        self._ReportingGroup = []
-        self.ReportingGroup = [] if ReportingGroup is None else ReportingGroup
+        self._ReportingGroup = EMPTY
+        if ReportingGroup is not None:
+            self.ReportingGroup = ReportingGroup
 
-        self._Block = []
-        self.Block = [] if Block is None else Block
+        self._Block = EMPTY
+        if Block is not None:
+            self.Block = Block
 
         self._PSRType = None
         self.PSRType = PSRType
@@ -80,13 +87,14 @@ class PowerSystemResource(IdentifiedObject):
 
     def setLocation(self, value):
         if self._Location is not None:
-            filtered = [x for x in self.Location.PowerSystemResources if x != self]
-            self._Location._PowerSystemResources = filtered
+            self._Location._PowerSystemResources.discard(self)
 
         self._Location = value
         if self._Location is not None:
-            if self not in self._Location._PowerSystemResources:
-                self._Location._PowerSystemResources.append(self)
+            if self._Location._PowerSystemResources is EMPTY:
+                self._Location._PowerSystemResources = AssociationList([self])
+            else:
+                self._Location._PowerSystemResources.add(self)
 
     Location = property(getLocation, setLocation)
 
@@ -96,21 +104,28 @@ class PowerSystemResource(IdentifiedObject):
         return self._Assets
 
     def setAssets(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Assets:
-            filtered = [q for q in p.PowerSystemResources if q != self]
-            self._Assets._PowerSystemResources = filtered
+            p._PowerSystemResources.discard(self)
         for r in value:
-            if self not in r._PowerSystemResources:
-                r._PowerSystemResources.append(self)
+            if r._PowerSystemResources is EMPTY:
+                r._PowerSystemResources = AssociationList([self])
+            else:
+                r._PowerSystemResources.add(self)
         self._Assets = value
 
     Assets = property(getAssets, setAssets)
 
     def addAssets(self, *Assets):
         for obj in Assets:
-            if self not in obj._PowerSystemResources:
-                obj._PowerSystemResources.append(self)
-            self._Assets.append(obj)
+            if obj._PowerSystemResources is EMPTY:
+                obj._PowerSystemResources = AssociationList([self])
+            else:
+                obj._PowerSystemResources.add(self)
+            if self._Assets is EMPTY:
+                self._Assets = AssociationList([obj])
+            else:
+                self._Assets.add(obj)
 
     def removeAssets(self, *Assets):
         for obj in Assets:
@@ -123,21 +138,28 @@ class PowerSystemResource(IdentifiedObject):
         return self._PsrLists
 
     def setPsrLists(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._PsrLists:
-            filtered = [q for q in p.PowerSystemResources if q != self]
-            self._PsrLists._PowerSystemResources = filtered
+            p._PowerSystemResources.discard(self)
         for r in value:
-            if self not in r._PowerSystemResources:
-                r._PowerSystemResources.append(self)
+            if r._PowerSystemResources is EMPTY:
+                r._PowerSystemResources = AssociationList([self])
+            else:
+                r._PowerSystemResources.add(self)
         self._PsrLists = value
 
     PsrLists = property(getPsrLists, setPsrLists)
 
     def addPsrLists(self, *PsrLists):
         for obj in PsrLists:
-            if self not in obj._PowerSystemResources:
-                obj._PowerSystemResources.append(self)
-            self._PsrLists.append(obj)
+            if obj._PowerSystemResources is EMPTY:
+                obj._PowerSystemResources = AssociationList([self])
+            else:
+                obj._PowerSystemResources.add(self)
+            if self._PsrLists is EMPTY:
+                self._PsrLists = AssociationList([obj])
+            else:
+                self._PsrLists.add(obj)
 
     def removePsrLists(self, *PsrLists):
         for obj in PsrLists:
@@ -151,6 +173,7 @@ class PowerSystemResource(IdentifiedObject):
         return self._Measurements
 
     def setMeasurements(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Measurements:
             x.PowerSystemResource = None
         for y in value:
@@ -173,6 +196,7 @@ class PowerSystemResource(IdentifiedObject):
         return self._OperatingShare
 
     def setOperatingShare(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._OperatingShare:
             x.PowerSystemResource = None
         for y in value:
@@ -211,21 +235,28 @@ class PowerSystemResource(IdentifiedObject):
         return self._ReportingGroup
 
     def setReportingGroup(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ReportingGroup:
-            filtered = [q for q in p.PowerSystemResource if q != self]
-            self._ReportingGroup._PowerSystemResource = filtered
+            p._PowerSystemResource.discard(self)
         for r in value:
-            if self not in r._PowerSystemResource:
-                r._PowerSystemResource.append(self)
+            if r._PowerSystemResource is EMPTY:
+                r._PowerSystemResource = AssociationList([self])
+            else:
+                r._PowerSystemResource.add(self)
         self._ReportingGroup = value
 
     ReportingGroup = property(getReportingGroup, setReportingGroup)
 
     def addReportingGroup(self, *ReportingGroup):
         for obj in ReportingGroup:
-            if self not in obj._PowerSystemResource:
-                obj._PowerSystemResource.append(self)
-            self._ReportingGroup.append(obj)
+            if obj._PowerSystemResource is EMPTY:
+                obj._PowerSystemResource = AssociationList([self])
+            else:
+                obj._PowerSystemResource.add(self)
+            if self._ReportingGroup is EMPTY:
+                self._ReportingGroup = AssociationList([obj])
+            else:
+                self._ReportingGroup.add(obj)
 
     def removeReportingGroup(self, *ReportingGroup):
         for obj in ReportingGroup:
@@ -239,6 +270,7 @@ class PowerSystemResource(IdentifiedObject):
         return self._Block
 
     def setBlock(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Block:
             x.PowerSystemResource = None
         for y in value:
@@ -262,13 +294,14 @@ class PowerSystemResource(IdentifiedObject):
 
     def setPSRType(self, value):
         if self._PSRType is not None:
-            filtered = [x for x in self.PSRType.PowerSystemResources if x != self]
-            self._PSRType._PowerSystemResources = filtered
+            self._PSRType._PowerSystemResources.discard(self)
 
         self._PSRType = value
         if self._PSRType is not None:
-            if self not in self._PSRType._PowerSystemResources:
-                self._PSRType._PowerSystemResources.append(self)
+            if self._PSRType._PowerSystemResources is EMPTY:
+                self._PSRType._PowerSystemResources = AssociationList([self])
+            else:
+                self._PSRType._PowerSystemResources.add(self)
 
     PSRType = property(getPSRType, setPSRType)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import AssociationList, EMPTY
 
 class ReportingGroup(IdentifiedObject):
     """A reporting group is used for various ad-hoc groupings used for reporting.
@@ -35,14 +36,17 @@ class ReportingGroup(IdentifiedObject):
         self._ReportingSuperGroup = None
         self.ReportingSuperGroup = ReportingSuperGroup
 
-        self._TopologicalNode = []
-        self.TopologicalNode = [] if TopologicalNode is None else TopologicalNode
+        self._TopologicalNode = EMPTY
+        if TopologicalNode is not None:
+            self.TopologicalNode = TopologicalNode
 
-        self._BusNameMarker = []
-        self.BusNameMarker = [] if BusNameMarker is None else BusNameMarker
+        self._BusNameMarker = EMPTY
+        if BusNameMarker is not None:
+            self.BusNameMarker = BusNameMarker
 
-        self._PowerSystemResource = []
-        self.PowerSystemResource = [] if PowerSystemResource is None else PowerSystemResource
+        self._PowerSystemResource = EMPTY
+        if PowerSystemResource is not None:
+            self.PowerSystemResource = PowerSystemResource
 
         super(ReportingGroup, self).__init__(*args, **kw_args)
 
@@ -60,13 +64,14 @@ class ReportingGroup(IdentifiedObject):
 
     def setReportingSuperGroup(self, value):
         if self._ReportingSuperGroup is not None:
-            filtered = [x for x in self.ReportingSuperGroup.ReportingGroup if x != self]
-            self._ReportingSuperGroup._ReportingGroup = filtered
+            self._ReportingSuperGroup._ReportingGroup.discard(self)
 
         self._ReportingSuperGroup = value
         if self._ReportingSuperGroup is not None:
-            if self not in self._ReportingSuperGroup._ReportingGroup:
-                self._ReportingSuperGroup._ReportingGroup.append(self)
+            if self._ReportingSuperGroup._ReportingGroup is EMPTY:
+                self._ReportingSuperGroup._ReportingGroup = AssociationList([self])
+            else:
+                self._ReportingSuperGroup._ReportingGroup.add(self)
 
     ReportingSuperGroup = property(getReportingSuperGroup, setReportingSuperGroup)
 
@@ -76,6 +81,7 @@ class ReportingGroup(IdentifiedObject):
         return self._TopologicalNode
 
     def setTopologicalNode(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._TopologicalNode:
             x.ReportingGroup = None
         for y in value:
@@ -98,6 +104,7 @@ class ReportingGroup(IdentifiedObject):
         return self._BusNameMarker
 
     def setBusNameMarker(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._BusNameMarker:
             x.ReportingGroup = None
         for y in value:
@@ -120,21 +127,28 @@ class ReportingGroup(IdentifiedObject):
         return self._PowerSystemResource
 
     def setPowerSystemResource(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._PowerSystemResource:
-            filtered = [q for q in p.ReportingGroup if q != self]
-            self._PowerSystemResource._ReportingGroup = filtered
+            p._ReportingGroup.discard(self)
         for r in value:
-            if self not in r._ReportingGroup:
-                r._ReportingGroup.append(self)
+            if r._ReportingGroup is EMPTY:
+                r._ReportingGroup = AssociationList([self])
+            else:
+                r._ReportingGroup.add(self)
         self._PowerSystemResource = value
 
     PowerSystemResource = property(getPowerSystemResource, setPowerSystemResource)
 
     def addPowerSystemResource(self, *PowerSystemResource):
         for obj in PowerSystemResource:
-            if self not in obj._ReportingGroup:
-                obj._ReportingGroup.append(self)
-            self._PowerSystemResource.append(obj)
+            if obj._ReportingGroup is EMPTY:
+                obj._ReportingGroup = AssociationList([self])
+            else:
+                obj._ReportingGroup.add(self)
+            if self._PowerSystemResource is EMPTY:
+                self._PowerSystemResource = AssociationList([obj])
+            else:
+                self._PowerSystemResource.add(obj)
 
     def removePowerSystemResource(self, *PowerSystemResource):
         for obj in PowerSystemResource:
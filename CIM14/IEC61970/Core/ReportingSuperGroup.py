@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import AssociationList, EMPTY
 
 class ReportingSuperGroup(IdentifiedObject):
     """A reporting super group, groups reporting groups for a higher level report.
@@ -29,8 +30,9 @@ class ReportingSuperGroup(IdentifiedObject):
 
         @param ReportingGroup: Reporting groups that are grouped under this group group.
         """
-        self._ReportingGroup = []
-        self.ReportingGroup = [] if ReportingGroup is None else ReportingGroup
+        self._ReportingGroup = EMPTY
+        if ReportingGroup is not None:
+            self.ReportingGroup = ReportingGroup
 
         super(ReportingSuperGroup, self).__init__(*args, **kw_args)
 
@@ -47,6 +49,7 @@ class ReportingSuperGroup(IdentifiedObject):
         return self._ReportingGroup
 
     def setReportingGroup(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ReportingGroup:
             x.ReportingSuperGroup = None
         for y in value:
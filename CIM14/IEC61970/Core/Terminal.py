@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import AssociationList, EMPTY
 
 class Terminal(IdentifiedObject):
     """An electrical connection point to a piece of conducting equipment. Terminals are connected at physical connection points called 'connectivity nodes'.
@@ -51,29 +52,36 @@ class Terminal(IdentifiedObject):
         self._TopologicalNode = None
         self.TopologicalNode = TopologicalNode
 
-        self._Block = []
-        self.Block = [] if Block is None else Block
+        self._Block = EMPTY
+        if Block is not None:
+            self.Block = Block
 
-        self._OperationalLimitSet = []
-        self.OperationalLimitSet = [] if OperationalLimitSet is None else OperationalLimitSet
+        self._OperationalLimitSet = EMPTY
+        if OperationalLimitSet is not None:
+            self.OperationalLimitSet = OperationalLimitSet
 
-        self._HasSecond_MutualCoupling = []
-        self.HasSecond_MutualCoupling = [] if HasSecond_MutualCoupling is None else HasSecond_MutualCoupling
+        self._HasSecond_MutualCoupling = EMPTY
+        if HasSecond_MutualCoupling is not None:
+            self.HasSecond_MutualCoupling = HasSecond_MutualCoupling
 
-        self._RegulatingControl = []
-        self.RegulatingControl = [] if RegulatingControl is None else RegulatingControl
+        self._RegulatingControl = EMPTY
+        if RegulatingControl is not None:
+            self.RegulatingControl = RegulatingControl
 
-        self._Measurements = []
-        self.Measurements = [] if Measurements is None else Measurements
+        self._Measurements = EMPTY
+        if Measurements is not None:
+            self.Measurements = Measurements
 
-        self._BranchGroupTerminal = []
-        self.BranchGroupTerminal = [] if BranchGroupTerminal is None else BranchGroupTerminal
+        self._BranchGroupTerminal = EMPTY
+        if BranchGroupTerminal is not None:
+            self.BranchGroupTerminal = BranchGroupTerminal
 
         self._ConductingEquipment = None
         self.ConductingEquipment = ConductingEquipment
 
-        self._HasFirst_MutualCoupling = []
-        self.HasFirst_MutualCoupling = [] if HasFirst_MutualCoupling is None else HasFirst_MutualCoupling
+        self._HasFirst_MutualCoupling = EMPTY
+        if HasFirst_MutualCoupling is not None:
+            self.HasFirst_MutualCoupling = HasFirst_MutualCoupling
 
         self._SvPowerFlow = None
         self.SvPowerFlow = SvPowerFlow
@@ -81,8 +89,9 @@ class Terminal(IdentifiedObject):
         self._ConnectivityNode = None
         self.ConnectivityNode = ConnectivityNode
 
-        self._TieFlow = []
-        self.TieFlow = [] if TieFlow is None else TieFlow
+        self._TieFlow = EMPTY
+        if TieFlow is not None:
+            self.TieFlow = TieFlow
 
         super(Terminal, self).__init__(*args, **kw_args)
 
@@ -100,13 +109,14 @@ class Terminal(IdentifiedObject):
 
     def setTopologicalNode(self, value):
         if self._TopologicalNode is not None:
-            filtered = [x for x in self.TopologicalNode.Terminal if x != self]
-            self._TopologicalNode._Terminal = filtered
+            self._TopologicalNode._Terminal.discard(self)
 
         self._TopologicalNode = value
         if self._TopologicalNode is not None:
-            if self not in self._TopologicalNode._Terminal:
-                self._TopologicalNode._Terminal.append(self)
+            if self._TopologicalNode._Terminal is EMPTY:
+                self._TopologicalNode._Terminal = AssociationList([self])
+            else:
+                self._TopologicalNode._Terminal.add(self)
 
     TopologicalNode = property(getTopologicalNode, setTopologicalNode)
 
@@ -116,6 +126,7 @@ class Terminal(IdentifiedObject):
         return self._Block
 
     def setBlock(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Block:
             x.Terminal = None
         for y in value:
@@ -138,6 +149,7 @@ class Terminal(IdentifiedObject):
         return self._OperationalLimitSet
 
     def setOperationalLimitSet(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._OperationalLimitSet:
             x.Terminal = None
         for y in value:
@@ -160,6 +172,7 @@ class Terminal(IdentifiedObject):
         return self._HasSecond_MutualCoupling
 
     def setHasSecond_MutualCoupling(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._HasSecond_MutualCoupling:
             x.Second_Terminal = None
         for y in value:
@@ -182,6 +195,7 @@ class Terminal(IdentifiedObject):
         return self._RegulatingControl
 
     def setRegulatingControl(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._RegulatingControl:
             x.Terminal = None
         for y in value:
@@ -204,6 +218,7 @@ class Terminal(IdentifiedObject):
         return self._Measurements
 
     def setMeasurements(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Measurements:
             x.Terminal = None
         for y in value:
@@ -226,6 +241,7 @@ class Terminal(IdentifiedObject):
         return self._BranchGroupTerminal
 
     def setBranchGroupTerminal(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._BranchGroupTerminal:
             x.Terminal = None
         for y in value:
@@ -249,13 +265,14 @@ class Terminal(IdentifiedObject):
 
     def setConductingEquipment(self, value):
         if self._ConductingEquipment is not None:
-            filtered = [x for x in self.ConductingEquipment.Terminals if x != self]
-            self._ConductingEquipment._Terminals = filtered
+            self._ConductingEquipment._Terminals.discard(self)
 
         self._ConductingEquipment = value
         if self._ConductingEquipment is not None:
-            if self not in self._ConductingEquipment._Terminals:
-                self._ConductingEquipment._Terminals.append(self)
+            if self._ConductingEquipment._Terminals is EMPTY:
+                self._ConductingEquipment._Terminals = AssociationList([self])
+            else:
+                self._ConductingEquipment._Terminals.add(self)
 
     ConductingEquipment = property(getConductingEquipment, setConductingEquipment)
 
@@ -265,6 +282,7 @@ class Terminal(IdentifiedObject):
         return self._HasFirst_MutualCoupling
 
     def setHasFirst_MutualCoupling(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._HasFirst_MutualCoupling:
             x.First_Terminal = None
         for y in value:
@@ -304,13 +322,14 @@ class Terminal(IdentifiedObject):
 
     def setConnectivityNode(self, value):
         if self._ConnectivityNode is not None:
-            filtered = [x for x in self.ConnectivityNode.Terminals if x != self]
-            self._ConnectivityNode._Terminals = filtered
+            self._ConnectivityNode._Terminals.discard(self)
 
         self._ConnectivityNode = value
         if self._ConnectivityNode is not None:
-            if self not in self._ConnectivityNode._Terminals:
-                self._ConnectivityNode._Terminals.append(self)
+            if self._ConnectivityNode._Terminals is EMPTY:
+                self._ConnectivityNode._Terminals = AssociationList([self])
+            else:
+                self._ConnectivityNode._Terminals.add(self)
 
     ConnectivityNode = property(getConnectivityNode, setConnectivityNode)
 
@@ -320,6 +339,7 @@ class Terminal(IdentifiedObject):
         return self._TieFlow
 
     def setTieFlow(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._TieFlow:
             x.Terminal = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import AssociationList, EMPTY
 
 class Unit(IdentifiedObject):
     """Quantity being measured. The Unit.name shall be unique among all specified quantities and describe the quantity. The Unit.aliasName is meant to be used for localization.
@@ -33,20 +34,25 @@ class Unit(IdentifiedObject):
         @param MetaBlockConInput:
         @param ProtectionEquipments: The Protection Equipments having the Unit.
         """
-        self._Controls = []
-        self.Controls = [] if Controls is None else Controls
+        self._Controls = EMPTY
+        if Controls is not None:
+            self.Controls = Controls
 
-        self._Measurements = []
-        self.Measurements = [] if Measurements is None else Measurements
+        self._Measurements = EMPTY
+        if Measurements is not None:
+            self.Measurements = Measurements
 
-        self._MetaBlockConOutput = []
-        self.MetaBlockConOutput = [] if MetaBlockConOutput is None else MetaBlockConOutput
+        self._MetaBlockConOutput = EMPTY
+        if MetaBlockConOutput is not None:
+            self.MetaBlockConOutput = MetaBlockConOutput
 
-        self._MetaBlockConInput = []
-        self.MetaBlockConInput = [] if MetaBlockConInput is None else MetaBlockConInput
+        self._MetaBlockConInput = EMPTY
+        if MetaBlockConInput is not None:
+            self.MetaBlockConInput = MetaBlockConInput
 
-        self._ProtectionEquipments = []
-        self.ProtectionEquipments = [] if ProtectionEquipments is None else ProtectionEquipments
+        self._ProtectionEquipments = EMPTY
+        if ProtectionEquipments is not None:
+            self.ProtectionEquipments = ProtectionEquipments
 
         super(Unit, self).__init__(*args, **kw_args)
 
@@ -63,6 +69,7 @@ class Unit(IdentifiedObject):
         return self._Controls
 
     def setControls(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Controls:
             x.Unit = None
         for y in value:
@@ -85,6 +92,7 @@ class Unit(IdentifiedObject):
         return self._Measurements
 
     def setMeasurements(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Measurements:
             x.Unit = None
         for y in value:
@@ -106,6 +114,7 @@ class Unit(IdentifiedObject):
         return self._MetaBlockConOutput
 
     def setMetaBlockConOutput(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._MetaBlockConOutput:
             x.Unit = None
         for y in value:
@@ -127,6 +136,7 @@ class Unit(IdentifiedObject):
         return self._MetaBlockConInput
 
     def setMetaBlockConInput(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._MetaBlockConInput:
             x.Unit = None
         for y in value:
@@ -149,6 +159,7 @@ class Unit(IdentifiedObject):
         return self._ProtectionEquipments
 
     def setProtectionEquipments(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ProtectionEquipments:
             x.Unit = None
         for y in value:
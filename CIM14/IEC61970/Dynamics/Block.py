@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.PowerSystemResource import PowerSystemResource
+from CIM14.Element import AssociationList, EMPTY
 
 class Block(PowerSystemResource):
     """A specific usage of a dynamics block, supplied with parameters and any linkages to the power system static model that are required.     Sometimes a block is used to simply specify a location of input or output from dyanmics equations to the static model.
@@ -52,11 +53,13 @@ class Block(PowerSystemResource):
         self._MemberOf_BlockConnectivity = None
         self.MemberOf_BlockConnectivity = MemberOf_BlockConnectivity
 
-        self._blockUsageInputReference0 = []
-        self.blockUsageInputReference0 = [] if blockUsageInputReference0 is None else blockUsageInputReference0
+        self._blockUsageInputReference0 = EMPTY
+        if blockUsageInputReference0 is not None:
+            self.blockUsageInputReference0 = blockUsageInputReference0
 
-        self._BlockUsageOutputReference = []
-        self.BlockUsageOutputReference = [] if BlockUsageOutputReference is None else BlockUsageOutputReference
+        self._BlockUsageOutputReference = EMPTY
+        if BlockUsageOutputReference is not None:
+            self.BlockUsageOutputReference = BlockUsageOutputReference
 
         self._PowerSystemResource = None
         self.PowerSystemResource = PowerSystemResource
@@ -64,17 +67,20 @@ class Block(PowerSystemResource):
         self._slotReference0 = None
         self.slotReference0 = slotReference0
 
-        self._tieToMeasurement0 = []
-        self.tieToMeasurement0 = [] if tieToMeasurement0 is None else tieToMeasurement0
+        self._tieToMeasurement0 = EMPTY
+        if tieToMeasurement0 is not None:
+            self.tieToMeasurement0 = tieToMeasurement0
 
         self._MetaBlock = None
         self.MetaBlock = MetaBlock
 
-        self._BlockConnection = []
-        self.BlockConnection = [] if BlockConnection is None else BlockConnection
+        self._BlockConnection = EMPTY
+        if BlockConnection is not None:
+            self.BlockConnection = BlockConnection
 
-        self._BlockParameter = []
-        self.BlockParameter = [] if BlockParameter is None else BlockParameter
+        self._BlockParameter = EMPTY
+        if BlockParameter is not None:
+            self.BlockParameter = BlockParameter
 
         super(Block, self).__init__(*args, **kw_args)
 
@@ -92,13 +98,14 @@ class Block(PowerSystemResource):
 
     def setTerminal(self, value):
         if self._Terminal is not None:
-            filtered = [x for x in self.Terminal.Block if x != self]
-            self._Terminal._Block = filtered
+            self._Terminal._Block.discard(self)
 
         self._Terminal = value
         if self._Terminal is not None:
-            if self not in self._Terminal._Block:
-                self._Terminal._Block.append(self)
+            if self._Terminal._Block is EMPTY:
+                self._Terminal._Block = AssociationList([self])
+            else:
+                self._Terminal._Block.add(self)
 
     Terminal = property(getTerminal, setTerminal)
 
@@ -108,13 +115,14 @@ class Block(PowerSystemResource):
 
     def setMemberOf_BlockConnectivity(self, value):
         if self._MemberOf_BlockConnectivity is not None:
-            filtered = [x for x in self.MemberOf_BlockConnectivity.Block if x != self]
-            self._MemberOf_BlockConnectivity._Block = filtered
+            self._MemberOf_BlockConnectivity._Block.discard(self)
 
         self._MemberOf_BlockConnectivity = value
         if self._MemberOf_BlockConnectivity is not None:
-            if self not in self._MemberOf_BlockConnectivity._Block:
-                self._MemberOf_BlockConnectivity._Block.append(self)
+            if self._MemberOf_BlockConnectivity._Block is EMPTY:
+                self._MemberOf_BlockConnectivity._Block = AssociationList([self])
+            else:
+                self._MemberOf_BlockConnectivity._Block.add(self)
 
     MemberOf_BlockConnectivity = property(getMemberOf_BlockConnectivity, setMemberOf_BlockConnectivity)
 
@@ -123,6 +131,7 @@ class Block(PowerSystemResource):
         return self._blockUsageInputReference0
 
     def setblockUsageInputReference0(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._blockUsageInputReference0:
             x.block0 = None
         for y in value:
@@ -144,6 +153,7 @@ class Block(PowerSystemResource):
         return self._BlockUsageOutputReference
 
     def setBlockUsageOutputReference(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._BlockUsageOutputReference:
             x.block0 = None
         for y in value:
@@ -167,13 +177,14 @@ class Block(PowerSystemResource):
 
     def setPowerSystemResource(self, value):
         if self._PowerSystemResource is not None:
-            filtered = [x for x in self.PowerSystemResource.Block if x != self]
-            self._PowerSystemResource._Block = filtered
+            self._PowerSystemResource._Block.discard(self)
 
         self._PowerSystemResource = value
         if self._PowerSystemResource is not None:
-            if self not in self._PowerSystemResource._Block:
-                self._PowerSystemResource._Block.append(self)
+            if self._PowerSystemResource._Block is EMPTY:
+                self._PowerSystemResource._Block = AssociationList([self])
+            else:
+                self._PowerSystemResource._Block.add(self)
 
     PowerSystemResource = property(getPowerSystemResource, setPowerSystemResource)
 
@@ -183,13 +194,14 @@ class Block(PowerSystemResource):
 
     def setslotReference0(self, value):
         if self._slotReference0 is not None:
-            filtered = [x for x in self.slotReference0.block0 if x != self]
-            self._slotReference0._block0 = filtered
+            self._slotReference0._block0.discard(self)
 
         self._slotReference0 = value
         if self._slotReference0 is not None:
-            if self not in self._slotReference0._block0:
-                self._slotReference0._block0.append(self)
+            if self._slotReference0._block0 is EMPTY:
+                self._slotReference0._block0 = AssociationList([self])
+            else:
+                self._slotReference0._block0.add(self)
 
     slotReference0 = property(getslotReference0, setslotReference0)
 
@@ -198,6 +210,7 @@ class Block(PowerSystemResource):
         return self._tieToMeasurement0
 
     def settieToMeasurement0(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._tieToMeasurement0:
             x.block0 = None
         for y in value:
@@ -220,13 +233,14 @@ class Block(PowerSystemResource):
 
     def setMetaBlock(self, value):
         if self._MetaBlock is not None:
-            filtered = [x for x in self.MetaBlock.Block if x != self]
-            self._MetaBlock._Block = filtered
+            self._MetaBlock._Block.discard(self)
 
         self._MetaBlock = value
         if self._MetaBlock is not None:
-            if self not in self._MetaBlock._Block:
-                self._MetaBlock._Block.append(self)
+            if self._MetaBlock._Block is EMPTY:
+                self._MetaBlock._Block = AssociationList([self])
+            else:
+                self._MetaBlock._Block.add(self)
 
     MetaBlock = property(getMetaBlock, setMetaBlock)
 
@@ -235,6 +249,7 @@ class Block(PowerSystemResource):
         return self._BlockConnection
 
     def setBlockConnection(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._BlockConnection:
             x.Block = None
         for y in value:
@@ -256,6 +271,7 @@ class Block(PowerSystemResource):
         return self._BlockParameter
 
     def setBlockParameter(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._BlockParameter:
             x.MemberOf_Block = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import AssociationList, EMPTY
 
 class BlockConnection(IdentifiedObject):
     """A meta-dyanamics model connectivity specification.
@@ -55,13 +56,14 @@ class BlockConnection(IdentifiedObject):
 
     def setMetaBlockConnection(self, value):
         if self._MetaBlockConnection is not None:
-            filtered = [x for x in self.MetaBlockConnection.BlockConnection if x != self]
-            self._MetaBlockConnection._BlockConnection = filtered
+            self._MetaBlockConnection._BlockConnection.discard(self)
 
         self._MetaBlockConnection = value
         if self._MetaBlockConnection is not None:
-            if self not in self._MetaBlockConnection._BlockConnection:
-                self._MetaBlockConnection._BlockConnection.append(self)
+            if self._MetaBlockConnection._BlockConnection is EMPTY:
+                self._MetaBlockConnection._BlockConnection = AssociationList([self])
+            else:
+                self._MetaBlockConnection._BlockConnection.add(self)
 
     MetaBlockConnection = property(getMetaBlockConnection, setMetaBlockConnection)
 
@@ -71,13 +73,14 @@ class BlockConnection(IdentifiedObject):
 
     def setMemberOf_BlockConnectivity(self, value):
         if self._MemberOf_BlockConnectivity is not None:
-            filtered = [x for x in self.MemberOf_BlockConnectivity.BlockConnection if x != self]
-            self._MemberOf_BlockConnectivity._BlockConnection = filtered
+            self._MemberOf_BlockConnectivity._BlockConnection.discard(self)
 
         self._MemberOf_BlockConnectivity = value
         if self._MemberOf_BlockConnectivity is not None:
-            if self not in self._MemberOf_BlockConnectivity._BlockConnection:
-                self._MemberOf_BlockConnectivity._BlockConnection.append(self)
+            if self._MemberOf_BlockConnectivity._BlockConnection is EMPTY:
+                self._MemberOf_BlockConnectivity._BlockConnection = AssociationList([self])
+            else:
+                self._MemberOf_BlockConnectivity._BlockConnection.add(self)
 
     MemberOf_BlockConnectivity = property(getMemberOf_BlockConnectivity, setMemberOf_BlockConnectivity)
 
@@ -87,13 +90,14 @@ class BlockConnection(IdentifiedObject):
 
     def setBlock(self, value):
         if self._Block is not None:
-            filtered = [x for x in self.Block.BlockConnection if x != self]
-            self._Block._BlockConnection = filtered
+            self._Block._BlockConnection.discard(self)
 
         self._Block = value
         if self._Block is not None:
-            if self not in self._Block._BlockConnection:
-                self._Block._BlockConnection.append(self)
+            if self._Block._BlockConnection is EMPTY:
+                self._Block._BlockConnection = AssociationList([self])
+            else:
+                self._Block._BlockConnection.add(self)
 
     Block = property(getBlock, setBlock)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import AssociationList, EMPTY
 
 class BlockConnectivity(IdentifiedObject):
     """A instance definition of connectivity of BlockUsage objects as defined in a a BlockConnection within the dyanmics-meta-model.
@@ -34,11 +35,13 @@ class BlockConnectivity(IdentifiedObject):
         self._MetaBlockConnectivity = None
         self.MetaBlockConnectivity = MetaBlockConnectivity
 
-        self._Block = []
-        self.Block = [] if Block is None else Block
+        self._Block = EMPTY
+        if Block is not None:
+            self.Block = Block
 
-        self._BlockConnection = []
-        self.BlockConnection = [] if BlockConnection is None else BlockConnection
+        self._BlockConnection = EMPTY
+        if BlockConnection is not None:
+            self.BlockConnection = BlockConnection
 
         super(BlockConnectivity, self).__init__(*args, **kw_args)
 
@@ -55,13 +58,14 @@ class BlockConnectivity(IdentifiedObject):
 
     def setMetaBlockConnectivity(self, value):
         if self._MetaBlockConnectivity is not None:
-            filtered = [x for x in self.MetaBlockConnectivity.BlockConnectivity if x != self]
-            self._MetaBlockConnectivity._BlockConnectivity = filtered
+            self._MetaBlockConnectivity._BlockConnectivity.discard(self)
 
         self._MetaBlockConnectivity = value
         if self._MetaBlockConnectivity is not None:
-            if self not in self._MetaBlockConnectivity._BlockConnectivity:
-                self._MetaBlockConnectivity._BlockConnectivity.append(self)
+            if self._MetaBlockConnectivity._BlockConnectivity is EMPTY:
+                self._MetaBlockConnectivity._BlockConnectivity = AssociationList([self])
+            else:
+                self._MetaBlockConnectivity._BlockConnectivity.add(self)
 
     MetaBlockConnectivity = property(getMetaBlockConnectivity, setMetaBlockConnectivity)
 
@@ -70,6 +74,7 @@ class BlockConnectivity(IdentifiedObject):
         return self._Block
 
     def setBlock(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Block:
             x.MemberOf_BlockConnectivity = None
         for y in value:
@@ -91,6 +96,7 @@ class BlockConnectivity(IdentifiedObject):
         return self._BlockConnection
 
     def setBlockConnection(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._BlockConnection:
             x.MemberOf_BlockConnectivity = None
         for y in value:
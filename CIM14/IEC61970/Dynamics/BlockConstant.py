@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Dynamics.MetaBlockConnectable import MetaBlockConnectable
+from CIM14.Element import AssociationList, EMPTY
 
 class BlockConstant(MetaBlockConnectable):
     """Used as a constant in the internal definition of a block.   This is meta dynamics model, so you need not specify this paramter in each usage of the block as a normal instance parameter.
@@ -51,13 +52,14 @@ class BlockConstant(MetaBlockConnectable):
 
     def setmetaBlock0(self, value):
         if self._metaBlock0 is not None:
-            filtered = [x for x in self.metaBlock0.blockConstant0 if x != self]
-            self._metaBlock0._blockConstant0 = filtered
+            self._metaBlock0._blockConstant0.discard(self)
 
         self._metaBlock0 = value
         if self._metaBlock0 is not None:
-            if self not in self._metaBlock0._blockConstant0:
-                self._metaBlock0._blockConstant0.append(self)
+            if self._metaBlock0._blockConstant0 is EMPTY:
+                self._metaBlock0._blockConstant0 = AssociationList([self])
+            else:
+                self._metaBlock0._blockConstant0.add(self)
 
     metaBlock0 = property(getmetaBlock0, setmetaBlock0)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import AssociationList, EMPTY
 
 class BlockInputReference(IdentifiedObject):
     """Used at the meta dynamics level. This is how the internal definiton of a block references the input of another block.
@@ -55,13 +56,14 @@ class BlockInputReference(IdentifiedObject):
 
     def setmetaBlockReference0(self, value):
         if self._metaBlockReference0 is not None:
-            filtered = [x for x in self.metaBlockReference0.blockInputReference0 if x != self]
-            self._metaBlockReference0._blockInputReference0 = filtered
+            self._metaBlockReference0._blockInputReference0.discard(self)
 
         self._metaBlockReference0 = value
         if self._metaBlockReference0 is not None:
-            if self not in self._metaBlockReference0._blockInputReference0:
-                self._metaBlockReference0._blockInputReference0.append(self)
+            if self._metaBlockReference0._blockInputReference0 is EMPTY:
+                self._metaBlockReference0._blockInputReference0 = AssociationList([self])
+            else:
+                self._metaBlockReference0._blockInputReference0.add(self)
 
     metaBlockReference0 = property(getmetaBlockReference0, setmetaBlockReference0)
 
@@ -72,13 +74,14 @@ class BlockInputReference(IdentifiedObject):
 
     def setmetaBlockInput0(self, value):
         if self._metaBlockInput0 is not None:
-            filtered = [x for x in self.metaBlockInput0.blockInputReference0 if x != self]
-            self._metaBlockInput0._blockInputReference0 = filtered
+            self._metaBlockInput0._blockInputReference0.discard(self)
 
         self._metaBlockInput0 = value
         if self._metaBlockInput0 is not None:
-            if self not in self._metaBlockInput0._blockInputReference0:
-                self._metaBlockInput0._blockInputReference0.append(self)
+            if self._metaBlockInput0._blockInputReference0 is EMPTY:
+                self._metaBlockInput0._blockInputReference0 = AssociationList([self])
+            else:
+                self._metaBlockInput0._blockInputReference0.add(self)
 
     metaBlockInput0 = property(getmetaBlockInput0, setmetaBlockInput0)
 
@@ -89,13 +92,14 @@ class BlockInputReference(IdentifiedObject):
 
     def setBlockConnectable(self, value):
         if self._BlockConnectable is not None:
-            filtered = [x for x in self.BlockConnectable.BlockInputReference if x != self]
-            self._BlockConnectable._BlockInputReference = filtered
+            self._BlockConnectable._BlockInputReference.discard(self)
 
         self._BlockConnectable = value
         if self._BlockConnectable is not None:
-            if self not in self._BlockConnectable._BlockInputReference:
-                self._BlockConnectable._BlockInputReference.append(self)
+            if self._BlockConnectable._BlockInputReference is EMPTY:
+                self._BlockConnectable._BlockInputReference = AssociationList([self])
+            else:
+                self._BlockConnectable._BlockInputReference.add(self)
 
     BlockConnectable = property(getBlockConnectable, setBlockConnectable)
 
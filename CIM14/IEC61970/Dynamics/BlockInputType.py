@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import AssociationList, EMPTY
 
 class BlockInputType(IdentifiedObject):
 
@@ -28,11 +29,13 @@ class BlockInputType(IdentifiedObject):
         @param slotInput0:
         @param metaBlockInput0:
         """
-        self._slotInput0 = []
-        self.slotInput0 = [] if slotInput0 is None else slotInput0
+        self._slotInput0 = EMPTY
+        if slotInput0 is not None:
+            self.slotInput0 = slotInput0
 
-        self._metaBlockInput0 = []
-        self.metaBlockInput0 = [] if metaBlockInput0 is None else metaBlockInput0
+        self._metaBlockInput0 = EMPTY
+        if metaBlockInput0 is not None:
+            self.metaBlockInput0 = metaBlockInput0
 
         super(BlockInputType, self).__init__(*args, **kw_args)
 
@@ -48,6 +51,7 @@ class BlockInputType(IdentifiedObject):
         return self._slotInput0
 
     def setslotInput0(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._slotInput0:
             x.blockInputType0 = None
         for y in value:
@@ -69,6 +73,7 @@ class BlockInputType(IdentifiedObject):
         return self._metaBlockInput0
 
     def setmetaBlockInput0(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._metaBlockInput0:
             x.blockInputType0 = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Dynamics.MetaBlockConnectable import MetaBlockConnectable
+from CIM14.Element import AssociationList, EMPTY
 
 class BlockOutputReference(MetaBlockConnectable):
     """References output from another block at the meta dynamics level. The other block must be a BlockReference in containing block.
@@ -33,8 +34,9 @@ class BlockOutputReference(MetaBlockConnectable):
         self._metaBlockOutput0 = None
         self.metaBlockOutput0 = metaBlockOutput0
 
-        self._metaBlockReference0 = []
-        self.metaBlockReference0 = [] if metaBlockReference0 is None else metaBlockReference0
+        self._metaBlockReference0 = EMPTY
+        if metaBlockReference0 is not None:
+            self.metaBlockReference0 = metaBlockReference0
 
         super(BlockOutputReference, self).__init__(*args, **kw_args)
 
@@ -51,13 +53,14 @@ class BlockOutputReference(MetaBlockConnectable):
 
     def setmetaBlockOutput0(self, value):
         if self._metaBlockOutput0 is not None:
-            filtered = [x for x in self.metaBlockOutput0.BlockOutputReference if x != self]
-            self._metaBlockOutput0._BlockOutputReference = filtered
+            self._metaBlockOutput0._BlockOutputReference.discard(self)
 
         self._metaBlockOutput0 = value
         if self._metaBlockOutput0 is not None:
-            if self not in self._metaBlockOutput0._BlockOutputReference:
-                self._metaBlockOutput0._BlockOutputReference.append(self)
+            if self._metaBlockOutput0._BlockOutputReference is EMPTY:
+                self._metaBlockOutput0._BlockOutputReference = AssociationList([self])
+            else:
+                self._metaBlockOutput0._BlockOutputReference.add(self)
 
     metaBlockOutput0 = property(getmetaBlockOutput0, setmetaBlockOutput0)
 
@@ -66,21 +69,28 @@ class BlockOutputReference(MetaBlockConnectable):
         return self._metaBlockReference0
 
     def setmetaBlockReference0(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._metaBlockReference0:
-            filtered = [q for q in p.blockOutputReference0 if q != self]
-            self._metaBlockReference0._blockOutputReference0 = filtered
+            p._blockOutputReference0.discard(self)
         for r in value:
-            if self not in r._blockOutputReference0:
-                r._blockOutputReference0.append(self)
+            if r._blockOutputReference0 is EMPTY:
+                r._blockOutputReference0 = AssociationList([self])
+            else:
+                r._blockOutputReference0.add(self)
         self._metaBlockReference0 = value
 
     metaBlockReference0 = property(getmetaBlockReference0, setmetaBlockReference0)
 
     def addmetaBlockReference0(self, *metaBlockReference0):
         for obj in metaBlockReference0:
-            if self not in obj._blockOutputReference0:
-                obj._blockOutputReference0.append(self)
-            self._metaBlockReference0.append(obj)
+            if obj._blockOutputReference0 is EMPTY:
+                obj._blockOutputReference0 = AssociationList([self])
+            else:
+                obj._blockOutputReference0.add(self)
+            if self._metaBlockReference0 is EMPTY:
+                self._metaBlockReference0 = AssociationList([obj])
+            else:
+                self._metaBlockReference0.add(obj)
 
     def removemetaBlockReference0(self, *metaBlockReference0):
         for obj in metaBlockReference0:
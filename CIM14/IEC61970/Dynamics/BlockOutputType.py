@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import AssociationList, EMPTY
 
 class BlockOutputType(IdentifiedObject):
 
@@ -28,11 +29,13 @@ class BlockOutputType(IdentifiedObject):
         @param metaBlockOutput0:
         @param slotOutput0:
         """
-        self._metaBlockOutput0 = []
-        self.metaBlockOutput0 = [] if metaBlockOutput0 is None else metaBlockOutput0
+        self._metaBlockOutput0 = EMPTY
+        if metaBlockOutput0 is not None:
+            self.metaBlockOutput0 = metaBlockOutput0
 
-        self._slotOutput0 = []
-        self.slotOutput0 = [] if slotOutput0 is None else slotOutput0
+        self._slotOutput0 = EMPTY
+        if slotOutput0 is not None:
+            self.slotOutput0 = slotOutput0
 
         super(BlockOutputType, self).__init__(*args, **kw_args)
 
@@ -48,6 +51,7 @@ class BlockOutputType(IdentifiedObject):
         return self._metaBlockOutput0
 
     def setmetaBlockOutput0(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._metaBlockOutput0:
             x.blockOutputType0 = None
         for y in value:
@@ -69,6 +73,7 @@ class BlockOutputType(IdentifiedObject):
         return self._slotOutput0
 
     def setslotOutput0(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._slotOutput0:
             x.blockOutputType0 = None
         for y in value:
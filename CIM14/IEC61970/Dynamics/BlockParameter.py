@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import AssociationList, EMPTY
 
 class BlockParameter(IdentifiedObject):
     """Specification of a paramter for use in a dynamic block. This is a paramters like a time constant that could be unique for each instance of, for example, an exciter in the model.
@@ -63,13 +64,14 @@ class BlockParameter(IdentifiedObject):
 
     def setMetaBlockParameter(self, value):
         if self._MetaBlockParameter is not None:
-            filtered = [x for x in self.MetaBlockParameter.BlockParameter if x != self]
-            self._MetaBlockParameter._BlockParameter = filtered
+            self._MetaBlockParameter._BlockParameter.discard(self)
 
         self._MetaBlockParameter = value
         if self._MetaBlockParameter is not None:
-            if self not in self._MetaBlockParameter._BlockParameter:
-                self._MetaBlockParameter._BlockParameter.append(self)
+            if self._MetaBlockParameter._BlockParameter is EMPTY:
+                self._MetaBlockParameter._BlockParameter = AssociationList([self])
+            else:
+                self._MetaBlockParameter._BlockParameter.add(self)
 
     MetaBlockParameter = property(getMetaBlockParameter, setMetaBlockParameter)
 
@@ -79,13 +81,14 @@ class BlockParameter(IdentifiedObject):
 
     def setMemberOf_MetaBlockReference(self, value):
         if self._MemberOf_MetaBlockReference is not None:
-            filtered = [x for x in self.MemberOf_MetaBlockReference.BlockParameter if x != self]
-            self._MemberOf_MetaBlockReference._BlockParameter = filtered
+            self._MemberOf_MetaBlockReference._BlockParameter.discard(self)
 
         self._MemberOf_MetaBlockReference = value
         if self._MemberOf_MetaBlockReference is not None:
-            if self not in self._MemberOf_MetaBlockReference._BlockParameter:
-                self._MemberOf_MetaBlockReference._BlockParameter.append(self)
+            if self._MemberOf_MetaBlockReference._BlockParameter is EMPTY:
+                self._MemberOf_MetaBlockReference._BlockParameter = AssociationList([self])
+            else:
+                self._MemberOf_MetaBlockReference._BlockParameter.add(self)
 
     MemberOf_MetaBlockReference = property(getMemberOf_MetaBlockReference, setMemberOf_MetaBlockReference)
 
@@ -95,13 +98,14 @@ class BlockParameter(IdentifiedObject):
 
     def setUserBlockParameter(self, value):
         if self._UserBlockParameter is not None:
-            filtered = [x for x in self.UserBlockParameter.BlockUsageParameter if x != self]
-            self._UserBlockParameter._BlockUsageParameter = filtered
+            self._UserBlockParameter._BlockUsageParameter.discard(self)
 
         self._UserBlockParameter = value
         if self._UserBlockParameter is not None:
-            if self not in self._UserBlockParameter._BlockUsageParameter:
-                self._UserBlockParameter._BlockUsageParameter.append(self)
+            if self._UserBlockParameter._BlockUsageParameter is EMPTY:
+                self._UserBlockParameter._BlockUsageParameter = AssociationList([self])
+            else:
+                self._UserBlockParameter._BlockUsageParameter.add(self)
 
     UserBlockParameter = property(getUserBlockParameter, setUserBlockParameter)
 
@@ -111,13 +115,14 @@ class BlockParameter(IdentifiedObject):
 
     def setMemberOf_Block(self, value):
         if self._MemberOf_Block is not None:
-            filtered = [x for x in self.MemberOf_Block.BlockParameter if x != self]
-            self._MemberOf_Block._BlockParameter = filtered
+            self._MemberOf_Block._BlockParameter.discard(self)
 
         self._MemberOf_Block = value
         if self._MemberOf_Block is not None:
-            if self not in self._MemberOf_Block._BlockParameter:
-                self._MemberOf_Block._BlockParameter.append(self)
+            if self._MemberOf_Block._BlockParameter is EMPTY:
+                self._MemberOf_Block._BlockParameter = AssociationList([self])
+            else:
+                self._MemberOf_Block._BlockParameter.add(self)
 
     MemberOf_Block = property(getMemberOf_Block, setMemberOf_Block)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import AssociationList, EMPTY
 
 class BlockUsageInputReference(IdentifiedObject):
     """Used at instance level to tie the input of a referenced block to the output of another referenced block. Note that typically an input is only tied to an output of another block at the same PowerSystemResource, but there is no restriction to do so.
@@ -55,13 +56,14 @@ class BlockUsageInputReference(IdentifiedObject):
 
     def setblock0(self, value):
         if self._block0 is not None:
-            filtered = [x for x in self.block0.blockUsageInputReference0 if x != self]
-            self._block0._blockUsageInputReference0 = filtered
+            self._block0._blockUsageInputReference0.discard(self)
 
         self._block0 = value
         if self._block0 is not None:
-            if self not in self._block0._blockUsageInputReference0:
-                self._block0._blockUsageInputReference0.append(self)
+            if self._block0._blockUsageInputReference0 is EMPTY:
+                self._block0._blockUsageInputReference0 = AssociationList([self])
+            else:
+                self._block0._blockUsageInputReference0.add(self)
 
     block0 = property(getblock0, setblock0)
 
@@ -72,13 +74,14 @@ class BlockUsageInputReference(IdentifiedObject):
 
     def setBlockUsageOutputReference(self, value):
         if self._BlockUsageOutputReference is not None:
-            filtered = [x for x in self.BlockUsageOutputReference.BlockUsageInputReference if x != self]
-            self._BlockUsageOutputReference._BlockUsageInputReference = filtered
+            self._BlockUsageOutputReference._BlockUsageInputReference.discard(self)
 
         self._BlockUsageOutputReference = value
         if self._BlockUsageOutputReference is not None:
-            if self not in self._BlockUsageOutputReference._BlockUsageInputReference:
-                self._BlockUsageOutputReference._BlockUsageInputReference.append(self)
+            if self._BlockUsageOutputReference._BlockUsageInputReference is EMPTY:
+                self._BlockUsageOutputReference._BlockUsageInputReference = AssociationList([self])
+            else:
+                self._BlockUsageOutputReference._BlockUsageInputReference.add(self)
 
     BlockUsageOutputReference = property(getBlockUsageOutputReference, setBlockUsageOutputReference)
 
@@ -88,13 +91,14 @@ class BlockUsageInputReference(IdentifiedObject):
 
     def setmetaBlockInput0(self, value):
         if self._metaBlockInput0 is not None:
-            filtered = [x for x in self.metaBlockInput0.blockUsageInputReference0 if x != self]
-            self._metaBlockInput0._blockUsageInputReference0 = filtered
+            self._metaBlockInput0._blockUsageInputReference0.discard(self)
 
         self._metaBlockInput0 = value
         if self._metaBlockInput0 is not None:
-            if self not in self._metaBlockInput0._blockUsageInputReference0:
-                self._metaBlockInput0._blockUsageInputReference0.append(self)
+            if self._metaBlockInput0._blockUsageInputReference0 is EMPTY:
+                self._metaBlockInput0._blockUsageInputReference0 = AssociationList([self])
+            else:
+                self._metaBlockInput0._blockUsageInputReference0.add(self)
 
     metaBlockInput0 = property(getmetaBlockInput0, setmetaBlockInput0)
 
@@ -18,7 +18,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from CIM14.Element import Element
+from CIM14.Element import Element, AssociationList, EMPTY
 
 class CompositeModel(Element):
 
@@ -27,8 +27,9 @@ class CompositeModel(Element):
 
         @param slotReference0:
         """
-        self._slotReference0 = []
-        self.slotReference0 = [] if slotReference0 is None else slotReference0
+        self._slotReference0 = EMPTY
+        if slotReference0 is not None:
+            self.slotReference0 = slotReference0
 
         super(CompositeModel, self).__init__(*args, **kw_args)
 
@@ -44,21 +45,28 @@ class CompositeModel(Element):
         return self._slotReference0
 
     def setslotReference0(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._slotReference0:
-            filtered = [q for q in p.compositeModel0 if q != self]
-            self._slotReference0._compositeModel0 = filtered
+            p._compositeModel0.discard(self)
         for r in value:
-            if self not in r._compositeModel0:
-                r._compositeModel0.append(self)
+            if r._compositeModel0 is EMPTY:
+                r._compositeModel0 = AssociationList([self])
+            else:
+                r._compositeModel0.add(self)
         self._slotReference0 = value
 
     slotReference0 = property(getslotReference0, setslotReference0)
 
     def addslotReference0(self, *slotReference0):
         for obj in slotReference0:
-            if self not in obj._compositeModel0:
-                obj._compositeModel0.append(self)
-            self._slotReference0.append(obj)
+            if obj._compositeModel0 is EMPTY:
+                obj._compositeModel0 = AssociationList([self])
+            else:
+                obj._compositeModel0.add(self)
+            if self._slotReference0 is EMPTY:
+                self._slotReference0 = AssociationList([obj])
+            else:
+                self._slotReference0.add(obj)
 
     def removeslotReference0(self, *slotReference0):
         for obj in slotReference0:
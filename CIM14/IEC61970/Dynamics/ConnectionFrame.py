@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import AssociationList, EMPTY
 
 class ConnectionFrame(IdentifiedObject):
 
@@ -28,11 +29,13 @@ class ConnectionFrame(IdentifiedObject):
         @param slotConnection0:
         @param slot0:
         """
-        self._slotConnection0 = []
-        self.slotConnection0 = [] if slotConnection0 is None else slotConnection0
+        self._slotConnection0 = EMPTY
+        if slotConnection0 is not None:
+            self.slotConnection0 = slotConnection0
 
-        self._slot0 = []
-        self.slot0 = [] if slot0 is None else slot0
+        self._slot0 = EMPTY
+        if slot0 is not None:
+            self.slot0 = slot0
 
         super(ConnectionFrame, self).__init__(*args, **kw_args)
 
@@ -48,6 +51,7 @@ class ConnectionFrame(IdentifiedObject):
         return self._slotConnection0
 
     def setslotConnection0(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._slotConnection0:
             x.connectionFrame0 = None
         for y in value:
@@ -69,6 +73,7 @@ class ConnectionFrame(IdentifiedObject):
         return self._slot0
 
     def setslot0(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._slot0:
             x.connectionFrame0 = None
         for y in value:
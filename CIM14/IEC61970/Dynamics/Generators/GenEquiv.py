@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Dynamics.RotatingMachine import RotatingMachine
+from CIM14.Element import AssociationList, EMPTY
 
 class GenEquiv(RotatingMachine):
     """An equivalent representation of a synchronous generator as a constant internal voltage behind an impedance Ra plus Xp.
@@ -33,8 +34,9 @@ class GenEquiv(RotatingMachine):
         #: Equivalent reactance, also known as Xp.
         self.xp = xp
 
-        self._synchronousMachine0 = []
-        self.synchronousMachine0 = [] if synchronousMachine0 is None else synchronousMachine0
+        self._synchronousMachine0 = EMPTY
+        if synchronousMachine0 is not None:
+            self.synchronousMachine0 = synchronousMachine0
 
         super(GenEquiv, self).__init__(*args, **kw_args)
 
@@ -50,21 +52,28 @@ class GenEquiv(RotatingMachine):
         return self._synchronousMachine0
 
     def setsynchronousMachine0(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._synchronousMachine0:
-            filtered = [q for q in p.genEquiv0 if q != self]
-            self._synchronousMachine0._genEquiv0 = filtered
+            p._genEquiv0.discard(self)
         for r in value:
-            if self not in r._genEquiv0:
-                r._genEquiv0.append(self)
+            if r._genEquiv0 is EMPTY:
+                r._genEquiv0 = AssociationList([self])
+            else:
+                r._genEquiv0.add(self)
         self._synchronousMachine0 = value
 
     synchronousMachine0 = property(getsynchronousMachine0, setsynchronousMachine0)
 
     def addsynchronousMachine0(self, *synchronousMachine0):
         for obj in synchronousMachine0:
-            if self not in obj._genEquiv0:
-                obj._genEquiv0.append(self)
-            self._synchronousMachine0.append(obj)
+            if obj._genEquiv0 is EMPTY:
+                obj._genEquiv0 = AssociationList([self])
+            else:
+                obj._genEquiv0.add(self)
+            if self._synchronousMachine0 is EMPTY:
+                self._synchronousMachine0 = AssociationList([obj])
+            else:
+                self._synchronousMachine0.add(obj)
 
     def removesynchronousMachine0(self, *synchronousMachine0):
         for obj in synchronousMachine0:
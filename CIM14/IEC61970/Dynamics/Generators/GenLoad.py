@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Wires.RegulatingCondEq import RegulatingCondEq
+from CIM14.Element import AssociationList, EMPTY
 
 class GenLoad(RegulatingCondEq):
     """Representation of a small generator as a negative load rather than a dynamic generator model. This practice is also referred to as 'netting' the generation with the load, i.e. taking the net value of load minus generation as the new load value.  For dynamic modeling purposes, each generator that does not have a dynamic load model must have a genLoad record.
@@ -29,8 +30,9 @@ class GenLoad(RegulatingCondEq):
 
         @param synchronousMachine0:
         """
-        self._synchronousMachine0 = []
-        self.synchronousMachine0 = [] if synchronousMachine0 is None else synchronousMachine0
+        self._synchronousMachine0 = EMPTY
+        if synchronousMachine0 is not None:
+            self.synchronousMachine0 = synchronousMachine0
 
         super(GenLoad, self).__init__(*args, **kw_args)
 
@@ -46,21 +48,28 @@ class GenLoad(RegulatingCondEq):
         return self._synchronousMachine0
 
     def setsynchronousMachine0(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._synchronousMachine0:
-            filtered = [q for q in p.genLoad0 if q != self]
-            self._synchronousMachine0._genLoad0 = filtered
+            p._genLoad0.discard(self)
         for r in value:
-            if self not in r._genLoad0:
-                r._genLoad0.append(self)
+            if r._genLoad0 is EMPTY:
+                r._genLoad0 = AssociationList([self])
+            else:
+                r._genLoad0.add(self)
         self._synchronousMachine0 = value
 
     synchronousMachine0 = property(getsynchronousMachine0, setsynchronousMachine0)
 
     def addsynchronousMachine0(self, *synchronousMachine0):
         for obj in synchronousMachine0:
-            if self not in obj._genLoad0:
-                obj._genLoad0.append(self)
-            self._synchronousMachine0.append(obj)
+            if obj._genLoad0 is EMPTY:
+                obj._genLoad0 = AssociationList([self])
+            else:
+                obj._genLoad0.add(self)
+            if self._synchronousMachine0 is EMPTY:
+                self._synchronousMachine0 = AssociationList([obj])
+            else:
+                self._synchronousMachine0.add(obj)
 
     def removesynchronousMachine0(self, *synchronousMachine0):
         for obj in synchronousMachine0:
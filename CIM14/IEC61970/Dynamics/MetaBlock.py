@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import AssociationList, EMPTY
 
 class MetaBlock(IdentifiedObject):
     """A block is a meta-data representation of a control block.   It has an external interface and an optinal internal interface. Blocks internals can be ommitted if the block is well understood by both exchange parties.    When well understood by both partice the block can be treated as a primitive block.   All dynamic models must be defined to the level of primtive blocks in order for the model to be consumed and used for dynamic simulation. Examples of primitive blocks include a well known IEEE exciter model, a summation block, or an integrator block.
@@ -53,32 +54,40 @@ class MetaBlock(IdentifiedObject):
         #: Iindicates this type is treated as a primitive type and therefore the internal block model can be ignored and is not typically defined in the model. Primitive blocks include such basic things as summation and standard IEEEexciter models. The exchange parties must agree on the meaning of primitive blocks according to their identification.
         self.primitive = primitive
 
-        self._MetaBlockReference = []
-        self.MetaBlockReference = [] if MetaBlockReference is None else MetaBlockReference
+        self._MetaBlockReference = EMPTY
+        if MetaBlockReference is not None:
+            self.MetaBlockReference = MetaBlockReference
 
-        self._MetaBlockOutput = []
-        self.MetaBlockOutput = [] if MetaBlockOutput is None else MetaBlockOutput
+        self._MetaBlockOutput = EMPTY
+        if MetaBlockOutput is not None:
+            self.MetaBlockOutput = MetaBlockOutput
 
-        self._MetaBlockState = []
-        self.MetaBlockState = [] if MetaBlockState is None else MetaBlockState
+        self._MetaBlockState = EMPTY
+        if MetaBlockState is not None:
+            self.MetaBlockState = MetaBlockState
 
-        self._MetaBlockSignal = []
-        self.MetaBlockSignal = [] if MetaBlockSignal is None else MetaBlockSignal
+        self._MetaBlockSignal = EMPTY
+        if MetaBlockSignal is not None:
+            self.MetaBlockSignal = MetaBlockSignal
 
         self._blockType0 = None
         self.blockType0 = blockType0
 
-        self._MetaBlockInput = []
-        self.MetaBlockInput = [] if MetaBlockInput is None else MetaBlockInput
+        self._MetaBlockInput = EMPTY
+        if MetaBlockInput is not None:
+            self.MetaBlockInput = MetaBlockInput
 
-        self._blockConstant0 = []
-        self.blockConstant0 = [] if blockConstant0 is None else blockConstant0
+        self._blockConstant0 = EMPTY
+        if blockConstant0 is not None:
+            self.blockConstant0 = blockConstant0
 
-        self._Block = []
-        self.Block = [] if Block is None else Block
+        self._Block = EMPTY
+        if Block is not None:
+            self.Block = Block
 
-        self._MetaBlockParameter = []
-        self.MetaBlockParameter = [] if MetaBlockParameter is None else MetaBlockParameter
+        self._MetaBlockParameter = EMPTY
+        if MetaBlockParameter is not None:
+            self.MetaBlockParameter = MetaBlockParameter
 
         super(MetaBlock, self).__init__(*args, **kw_args)
 
@@ -94,6 +103,7 @@ class MetaBlock(IdentifiedObject):
         return self._MetaBlockReference
 
     def setMetaBlockReference(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._MetaBlockReference:
             x.MemberOf_MetaBlock = None
         for y in value:
@@ -116,6 +126,7 @@ class MetaBlock(IdentifiedObject):
         return self._MetaBlockOutput
 
     def setMetaBlockOutput(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._MetaBlockOutput:
             x.MemberOf_MetaBlock = None
         for y in value:
@@ -137,6 +148,7 @@ class MetaBlock(IdentifiedObject):
         return self._MetaBlockState
 
     def setMetaBlockState(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._MetaBlockState:
             x.MemberOf_MetaBlock = None
         for y in value:
@@ -158,6 +170,7 @@ class MetaBlock(IdentifiedObject):
         return self._MetaBlockSignal
 
     def setMetaBlockSignal(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._MetaBlockSignal:
             x.MemberOf_MetaBlock = None
         for y in value:
@@ -180,13 +193,14 @@ class MetaBlock(IdentifiedObject):
 
     def setblockType0(self, value):
         if self._blockType0 is not None:
-            filtered = [x for x in self.blockType0.metaBlock0 if x != self]
-            self._blockType0._metaBlock0 = filtered
+            self._blockType0._metaBlock0.discard(self)
 
         self._blockType0 = value
         if self._blockType0 is not None:
-            if self not in self._blockType0._metaBlock0:
-                self._blockType0._metaBlock0.append(self)
+            if self._blockType0._metaBlock0 is EMPTY:
+                self._blockType0._metaBlock0 = AssociationList([self])
+            else:
+                self._blockType0._metaBlock0.add(self)
 
     blockType0 = property(getblockType0, setblockType0)
 
@@ -196,6 +210,7 @@ class MetaBlock(IdentifiedObject):
         return self._MetaBlockInput
 
     def setMetaBlockInput(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._MetaBlockInput:
             x.MemberOf_MetaBlock = None
         for y in value:
@@ -217,6 +232,7 @@ class MetaBlock(IdentifiedObject):
         return self._blockConstant0
 
     def setblockConstant0(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._blockConstant0:
             x.metaBlock0 = None
         for y in value:
@@ -238,6 +254,7 @@ class MetaBlock(IdentifiedObject):
         return self._Block
 
     def setBlock(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Block:
             x.MetaBlock = None
         for y in value:
@@ -260,6 +277,7 @@ class MetaBlock(IdentifiedObject):
         return self._MetaBlockParameter
 
     def setMetaBlockParameter(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._MetaBlockParameter:
             x.MemberOf_MetaBlock = None
         for y in value:
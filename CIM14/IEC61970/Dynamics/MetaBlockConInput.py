@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import AssociationList, EMPTY
 
 class MetaBlockConInput(IdentifiedObject):
     """If model the association to MeasurementType, the it means take the input from the associated PSR or Terminal in the static model.
@@ -70,13 +71,14 @@ class MetaBlockConInput(IdentifiedObject):
 
     def setMemberOf_MetaBlockConnection(self, value):
         if self._MemberOf_MetaBlockConnection is not None:
-            filtered = [x for x in self.MemberOf_MetaBlockConnection.MetaBlockConInput if x != self]
-            self._MemberOf_MetaBlockConnection._MetaBlockConInput = filtered
+            self._MemberOf_MetaBlockConnection._MetaBlockConInput.discard(self)
 
         self._MemberOf_MetaBlockConnection = value
         if self._MemberOf_MetaBlockConnection is not None:
-            if self not in self._MemberOf_MetaBlockConnection._MetaBlockConInput:
-                self._MemberOf_MetaBlockConnection._MetaBlockConInput.append(self)
+            if self._MemberOf_MetaBlockConnection._MetaBlockConInput is EMPTY:
+                self._MemberOf_MetaBlockConnection._MetaBlockConInput = AssociationList([self])
+            else:
+                self._MemberOf_MetaBlockConnection._MetaBlockConInput.add(self)
 
     MemberOf_MetaBlockConnection = property(getMemberOf_MetaBlockConnection, setMemberOf_MetaBlockConnection)
 
@@ -86,13 +88,14 @@ class MetaBlockConInput(IdentifiedObject):
 
     def setUnit(self, value):
         if self._Unit is not None:
-            filtered = [x for x in self.Unit.MetaBlockConInput if x != self]
-            self._Unit._MetaBlockConInput = filtered
+            self._Unit._MetaBlockConInput.discard(self)
 
         self._Unit = value
         if self._Unit is not None:
-            if self not in self._Unit._MetaBlockConInput:
-                self._Unit._MetaBlockConInput.append(self)
+            if self._Unit._MetaBlockConInput is EMPTY:
+                self._Unit._MetaBlockConInput = AssociationList([self])
+            else:
+                self._Unit._MetaBlockConInput.add(self)
 
     Unit = property(getUnit, setUnit)
 
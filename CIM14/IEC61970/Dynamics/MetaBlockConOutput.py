@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import AssociationList, EMPTY
 
 class MetaBlockConOutput(IdentifiedObject):
     """If model uses MeasurementType association, it means the output is pushed back to the steady state model (if reasonable).
@@ -31,8 +32,9 @@ class MetaBlockConOutput(IdentifiedObject):
         @param MemberOf_MetaBlockConnection:
         @param Unit:
         """
-        self._MetaBlockConSignal = []
-        self.MetaBlockConSignal = [] if MetaBlockConSignal is None else MetaBlockConSignal
+        self._MetaBlockConSignal = EMPTY
+        if MetaBlockConSignal is not None:
+            self.MetaBlockConSignal = MetaBlockConSignal
 
         self._MemberOf_MetaBlockConnection = None
         self.MemberOf_MetaBlockConnection = MemberOf_MetaBlockConnection
@@ -54,6 +56,7 @@ class MetaBlockConOutput(IdentifiedObject):
         return self._MetaBlockConSignal
 
     def setMetaBlockConSignal(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._MetaBlockConSignal:
             x.MetaBlockConOutput = None
         for y in value:
@@ -76,13 +79,14 @@ class MetaBlockConOutput(IdentifiedObject):
 
     def setMemberOf_MetaBlockConnection(self, value):
         if self._MemberOf_MetaBlockConnection is not None:
-            filtered = [x for x in self.MemberOf_MetaBlockConnection.MetaBlockConOutput if x != self]
-            self._MemberOf_MetaBlockConnection._MetaBlockConOutput = filtered
+            self._MemberOf_MetaBlockConnection._MetaBlockConOutput.discard(self)
 
         self._MemberOf_MetaBlockConnection = value
         if self._MemberOf_MetaBlockConnection is not None:
-            if self not in self._MemberOf_MetaBlockConnection._MetaBlockConOutput:
-                self._MemberOf_MetaBlockConnection._MetaBlockConOutput.append(self)
+            if self._MemberOf_MetaBlockConnection._MetaBlockConOutput is EMPTY:
+                self._MemberOf_MetaBlockConnection._MetaBlockConOutput = AssociationList([self])
+            else:
+                self._MemberOf_MetaBlockConnection._MetaBlockConOutput.add(self)
 
     MemberOf_MetaBlockConnection = property(getMemberOf_MetaBlockConnection, setMemberOf_MetaBlockConnection)
 
@@ -92,13 +96,14 @@ class MetaBlockConOutput(IdentifiedObject):
 
     def setUnit(self, value):
         if self._Unit is not None:
-            filtered = [x for x in self.Unit.MetaBlockConOutput if x != self]
-            self._Unit._MetaBlockConOutput = filtered
+            self._Unit._MetaBlockConOutput.discard(self)
 
         self._Unit = value
         if self._Unit is not None:
-            if self not in self._Unit._MetaBlockConOutput:
-                self._Unit._MetaBlockConOutput.append(self)
+            if self._Unit._MetaBlockConOutput is EMPTY:
+                self._Unit._MetaBlockConOutput = AssociationList([self])
+            else:
+                self._Unit._MetaBlockConOutput.add(self)
 
     Unit = property(getUnit, setUnit)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import AssociationList, EMPTY
 
 class MetaBlockConSignal(IdentifiedObject):
 
@@ -72,13 +73,14 @@ class MetaBlockConSignal(IdentifiedObject):
 
     def setMemberOf_MetaBlockConnectivity(self, value):
         if self._MemberOf_MetaBlockConnectivity is not None:
-            filtered = [x for x in self.MemberOf_MetaBlockConnectivity.MetaBlockConSignal if x != self]
-            self._MemberOf_MetaBlockConnectivity._MetaBlockConSignal = filtered
+            self._MemberOf_MetaBlockConnectivity._MetaBlockConSignal.discard(self)
 
         self._MemberOf_MetaBlockConnectivity = value
         if self._MemberOf_MetaBlockConnectivity is not None:
-            if self not in self._MemberOf_MetaBlockConnectivity._MetaBlockConSignal:
-                self._MemberOf_MetaBlockConnectivity._MetaBlockConSignal.append(self)
+            if self._MemberOf_MetaBlockConnectivity._MetaBlockConSignal is EMPTY:
+                self._MemberOf_MetaBlockConnectivity._MetaBlockConSignal = AssociationList([self])
+            else:
+                self._MemberOf_MetaBlockConnectivity._MetaBlockConSignal.add(self)
 
     MemberOf_MetaBlockConnectivity = property(getMemberOf_MetaBlockConnectivity, setMemberOf_MetaBlockConnectivity)
 
@@ -88,13 +90,14 @@ class MetaBlockConSignal(IdentifiedObject):
 
     def setMetaBlockConOutput(self, value):
         if self._MetaBlockConOutput is not None:
-            filtered = [x for x in self.MetaBlockConOutput.MetaBlockConSignal if x != self]
-            self._MetaBlockConOutput._MetaBlockConSignal = filtered
+            self._MetaBlockConOutput._MetaBlockConSignal.discard(self)
 
         self._MetaBlockConOutput = value
         if self._MetaBlockConOutput is not None:
-            if self not in self._MetaBlockConOutput._MetaBlockConSignal:
-                self._MetaBlockConOutput._MetaBlockConSignal.append(self)
+            if self._MetaBlockConOutput._MetaBlockConSignal is EMPTY:
+                self._MetaBlockConOutput._MetaBlockConSignal = AssociationList([self])
+            else:
+                self._MetaBlockConOutput._MetaBlockConSignal.add(self)
 
     MetaBlockConOutput = property(getMetaBlockConOutput, setMetaBlockConOutput)
 
@@ -104,13 +107,14 @@ class MetaBlockConSignal(IdentifiedObject):
 
     def setmetaBlockConnectivity0(self, value):
         if self._metaBlockConnectivity0 is not None:
-            filtered = [x for x in self.metaBlockConnectivity0.metaBlockConSignal0 if x != self]
-            self._metaBlockConnectivity0._metaBlockConSignal0 = filtered
+            self._metaBlockConnectivity0._metaBlockConSignal0.discard(self)
 
         self._metaBlockConnectivity0 = value
         if self._metaBlockConnectivity0 is not None:
-            if self not in self._metaBlockConnectivity0._metaBlockConSignal0:
-                self._metaBlockConnectivity0._metaBlockConSignal0.append(self)
+            if self._metaBlockConnectivity0._metaBlockConSignal0 is EMPTY:
+                self._metaBlockConnectivity0._metaBlockConSignal0 = AssociationList([self])
+            else:
+                self._metaBlockConnectivity0._metaBlockConSignal0.add(self)
 
     metaBlockConnectivity0 = property(getmetaBlockConnectivity0, setmetaBlockConnectivity0)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import AssociationList, EMPTY
 
 class MetaBlockConnectable(IdentifiedObject):
     """This is a source connection for a block input at the dynamics meta-data level.   The subtypes represent different ways to obtain the numbers.  Note that a block output is NOT derived from this class since block outputs can only be computed from references to other blocks via the BlockOutputReference class.
@@ -37,32 +38,41 @@ class MetaBlockConnectable(IdentifiedObject):
         @param StandardControlBlock_MetaBlockOutputReference:
         @param MetaBlockInputReference:
         """
-        self._StandardControlBlock_MetaBlockStateReference = []
-        self.StandardControlBlock_MetaBlockStateReference = [] if StandardControlBlock_MetaBlockStateReference is None else StandardControlBlock_MetaBlockStateReference
+        self._StandardControlBlock_MetaBlockStateReference = EMPTY
+        if StandardControlBlock_MetaBlockStateReference is not None:
+            self.StandardControlBlock_MetaBlockStateReference = StandardControlBlock_MetaBlockStateReference
 
-        self._MetaBlockOutputReference = []
-        self.MetaBlockOutputReference = [] if MetaBlockOutputReference is None else MetaBlockOutputReference
+        self._MetaBlockOutputReference = EMPTY
+        if MetaBlockOutputReference is not None:
+            self.MetaBlockOutputReference = MetaBlockOutputReference
 
-        self._MetaBlockStateReference = []
-        self.MetaBlockStateReference = [] if MetaBlockStateReference is None else MetaBlockStateReference
+        self._MetaBlockStateReference = EMPTY
+        if MetaBlockStateReference is not None:
+            self.MetaBlockStateReference = MetaBlockStateReference
 
-        self._BlockInputReference = []
-        self.BlockInputReference = [] if BlockInputReference is None else BlockInputReference
+        self._BlockInputReference = EMPTY
+        if BlockInputReference is not None:
+            self.BlockInputReference = BlockInputReference
 
-        self._StandardControlBlock_MetaBlockInputReference = []
-        self.StandardControlBlock_MetaBlockInputReference = [] if StandardControlBlock_MetaBlockInputReference is None else StandardControlBlock_MetaBlockInputReference
+        self._StandardControlBlock_MetaBlockInputReference = EMPTY
+        if StandardControlBlock_MetaBlockInputReference is not None:
+            self.StandardControlBlock_MetaBlockInputReference = StandardControlBlock_MetaBlockInputReference
 
-        self._StandardControlBlock_MetaBlockParameterReference = []
-        self.StandardControlBlock_MetaBlockParameterReference = [] if StandardControlBlock_MetaBlockParameterReference is None else StandardControlBlock_MetaBlockParameterReference
+        self._StandardControlBlock_MetaBlockParameterReference = EMPTY
+        if StandardControlBlock_MetaBlockParameterReference is not None:
+            self.StandardControlBlock_MetaBlockParameterReference = StandardControlBlock_MetaBlockParameterReference
 
-        self._MetaBlockParameterReference = []
-        self.MetaBlockParameterReference = [] if MetaBlockParameterReference is None else MetaBlockParameterReference
+        self._MetaBlockParameterReference = EMPTY
+        if MetaBlockParameterReference is not None:
+            self.MetaBlockParameterReference = MetaBlockParameterReference
 
-        self._StandardControlBlock_MetaBlockOutputReference = []
-        self.StandardControlBlock_MetaBlockOutputReference = [] if StandardControlBlock_MetaBlockOutputReference is None else StandardControlBlock_MetaBlockOutputReference
+        self._StandardControlBlock_MetaBlockOutputReference = EMPTY
+        if StandardControlBlock_MetaBlockOutputReference is not None:
+            self.StandardControlBlock_MetaBlockOutputReference = StandardControlBlock_MetaBlockOutputReference
 
-        self._MetaBlockInputReference = []
-        self.MetaBlockInputReference = [] if MetaBlockInputReference is None else MetaBlockInputReference
+        self._MetaBlockInputReference = EMPTY
+        if MetaBlockInputReference is not None:
+            self.MetaBlockInputReference = MetaBlockInputReference
 
         super(MetaBlockConnectable, self).__init__(*args, **kw_args)
 
@@ -78,6 +88,7 @@ class MetaBlockConnectable(IdentifiedObject):
         return self._StandardControlBlock_MetaBlockStateReference
 
     def setStandardControlBlock_MetaBlockStateReference(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._StandardControlBlock_MetaBlockStateReference:
             x.StandardControlBlock_MetaBlockConnectable = None
         for y in value:
@@ -99,6 +110,7 @@ class MetaBlockConnectable(IdentifiedObject):
         return self._MetaBlockOutputReference
 
     def setMetaBlockOutputReference(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._MetaBlockOutputReference:
             x.MetaBlockConnectable = None
         for y in value:
@@ -120,6 +132,7 @@ class MetaBlockConnectable(IdentifiedObject):
         return self._MetaBlockStateReference
 
     def setMetaBlockStateReference(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._MetaBlockStateReference:
             x.MetaBlockConnectable = None
         for y in value:
@@ -142,6 +155,7 @@ class MetaBlockConnectable(IdentifiedObject):
         return self._BlockInputReference
 
     def setBlockInputReference(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._BlockInputReference:
             x.BlockConnectable = None
         for y in value:
@@ -163,6 +177,7 @@ class MetaBlockConnectable(IdentifiedObject):
         return self._StandardControlBlock_MetaBlockInputReference
 
     def setStandardControlBlock_MetaBlockInputReference(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._StandardControlBlock_MetaBlockInputReference:
             x.StandardControlBlock_MetaBlockConnectable = None
         for y in value:
@@ -184,6 +199,7 @@ class MetaBlockConnectable(IdentifiedObject):
         return self._StandardControlBlock_MetaBlockParameterReference
 
     def setStandardControlBlock_MetaBlockParameterReference(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._StandardControlBlock_MetaBlockParameterReference:
             x.StandardControlBlock_MetaBlockConnectable = None
         for y in value:
@@ -205,6 +221,7 @@ class MetaBlockConnectable(IdentifiedObject):
         return self._MetaBlockParameterReference
 
     def setMetaBlockParameterReference(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._MetaBlockParameterReference:
             x.MetaBlockConnectable = None
         for y in value:
@@ -226,6 +243,7 @@ class MetaBlockConnectable(IdentifiedObject):
         return self._StandardControlBlock_MetaBlockOutputReference
 
     def setStandardControlBlock_MetaBlockOutputReference(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._StandardControlBlock_MetaBlockOutputReference:
             x.StandardControlBlock_MetaBlockConnectable = None
         for y in value:
@@ -247,6 +265,7 @@ class MetaBlockConnectable(IdentifiedObject):
         return self._MetaBlockInputReference
 
     def setMetaBlockInputReference(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._MetaBlockInputReference:
             x.MetaBlockConnectable = None
         for y in value:
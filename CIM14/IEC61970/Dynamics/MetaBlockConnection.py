@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import AssociationList, EMPTY
 
 class MetaBlockConnection(IdentifiedObject):
 
@@ -35,17 +36,20 @@ class MetaBlockConnection(IdentifiedObject):
         #: Used for standard connection situations where multiple blocks of same class or same MetaBlock::blockkind have to be connected. The slotnames used are defined in the Reference Manual for Exchanging Standard Power System Dynamic Models. Application: Cross-compound or Combined Cycle connections.
         self.slotname = slotname
 
-        self._MetaBlockConOutput = []
-        self.MetaBlockConOutput = [] if MetaBlockConOutput is None else MetaBlockConOutput
+        self._MetaBlockConOutput = EMPTY
+        if MetaBlockConOutput is not None:
+            self.MetaBlockConOutput = MetaBlockConOutput
 
-        self._MetaBlockConInput = []
-        self.MetaBlockConInput = [] if MetaBlockConInput is None else MetaBlockConInput
+        self._MetaBlockConInput = EMPTY
+        if MetaBlockConInput is not None:
+            self.MetaBlockConInput = MetaBlockConInput
 
         self._metaBlockConnectivity0 = None
         self.metaBlockConnectivity0 = metaBlockConnectivity0
 
-        self._BlockConnection = []
-        self.BlockConnection = [] if BlockConnection is None else BlockConnection
+        self._BlockConnection = EMPTY
+        if BlockConnection is not None:
+            self.BlockConnection = BlockConnection
 
         self._MemberOf_MetaBlockConnectivity = None
         self.MemberOf_MetaBlockConnectivity = MemberOf_MetaBlockConnectivity
@@ -64,6 +68,7 @@ class MetaBlockConnection(IdentifiedObject):
         return self._MetaBlockConOutput
 
     def setMetaBlockConOutput(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._MetaBlockConOutput:
             x.MemberOf_MetaBlockConnection = None
         for y in value:
@@ -85,6 +90,7 @@ class MetaBlockConnection(IdentifiedObject):
         return self._MetaBlockConInput
 
     def setMetaBlockConInput(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._MetaBlockConInput:
             x.MemberOf_MetaBlockConnection = None
         for y in value:
@@ -107,13 +113,14 @@ class MetaBlockConnection(IdentifiedObject):
 
     def setmetaBlockConnectivity0(self, value):
         if self._metaBlockConnectivity0 is not None:
-            filtered = [x for x in self.metaBlockConnectivity0.metaBlockConnection0 if x != self]
-            self._metaBlockConnectivity0._metaBlockConnection0 = filtered
+            self._metaBlockConnectivity0._metaBlockConnection0.discard(self)
 
         self._metaBlockConnectivity0 = value
         if self._metaBlockConnectivity0 is not None:
-            if self not in self._metaBlockConnectivity0._metaBlockConnection0:
-                self._metaBlockConnectivity0._metaBlockConnection0.append(self)
+            if self._metaBlockConnectivity0._metaBlockConnection0 is EMPTY:
+                self._metaBlockConnectivity0._metaBlockConnection0 = AssociationList([self])
+            else:
+                self._metaBlockConnectivity0._metaBlockConnection0.add(self)
 
     metaBlockConnectivity0 = property(getmetaBlockConnectivity0, setmetaBlockConnectivity0)
 
@@ -122,6 +129,7 @@ class MetaBlockConnection(IdentifiedObject):
         return self._BlockConnection
 
     def setBlockConnection(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._BlockConnection:
             x.MetaBlockConnection = None
         for y in value:
@@ -144,13 +152,14 @@ class MetaBlockConnection(IdentifiedObject):
 
     def setMemberOf_MetaBlockConnectivity(self, value):
         if self._MemberOf_MetaBlockConnectivity is not None:
-            filtered = [x for x in self.MemberOf_MetaBlockConnectivity.MetaBlockConnection if x != self]
-            self._MemberOf_MetaBlockConnectivity._MetaBlockConnection = filtered
+            self._MemberOf_MetaBlockConnectivity._MetaBlockConnection.discard(self)
 
         self._MemberOf_MetaBlockConnectivity = value
         if self._MemberOf_MetaBlockConnectivity is not None:
-            if self not in self._MemberOf_MetaBlockConnectivity._MetaBlockConnection:
-                self._MemberOf_MetaBlockConnectivity._MetaBlockConnection.append(self)
+            if self._MemberOf_MetaBlockConnectivity._MetaBlockConnection is EMPTY:
+                self._MemberOf_MetaBlockConnectivity._MetaBlockConnection = AssociationList([self])
+            else:
+                self._MemberOf_MetaBlockConnectivity._MetaBlockConnection.add(self)
 
     MemberOf_MetaBlockConnectivity = property(getMemberOf_MetaBlockConnectivity, setMemberOf_MetaBlockConnectivity)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import AssociationList, EMPTY
 
 class MetaBlockConnectivity(IdentifiedObject):
 
@@ -31,20 +32,25 @@ class MetaBlockConnectivity(IdentifiedObject):
         @param metaBlockConSignal0:
         @param MetaBlockConnection:
         """
-        self._BlockConnectivity = []
-        self.BlockConnectivity = [] if BlockConnectivity is None else BlockConnectivity
+        self._BlockConnectivity = EMPTY
+        if BlockConnectivity is not None:
+            self.BlockConnectivity = BlockConnectivity
 
-        self._MetaBlockConSignal = []
-        self.MetaBlockConSignal = [] if MetaBlockConSignal is None else MetaBlockConSignal
+        self._MetaBlockConSignal = EMPTY
+        if MetaBlockConSignal is not None:
+            self.MetaBlockConSignal = MetaBlockConSignal
 
-        self._metaBlockConnection0 = []
-        self.metaBlockConnection0 = [] if metaBlockConnection0 is None else metaBlockConnection0
+        self._metaBlockConnection0 = EMPTY
+        if metaBlockConnection0 is not None:
+            self.metaBlockConnection0 = metaBlockConnection0
 
-        self._metaBlockConSignal0 = []
-        self.metaBlockConSignal0 = [] if metaBlockConSignal0 is None else metaBlockConSignal0
+        self._metaBlockConSignal0 = EMPTY
+        if metaBlockConSignal0 is not None:
+            self.metaBlockConSignal0 = metaBlockConSignal0
 
-        self._MetaBlockConnection = []
-        self.MetaBlockConnection = [] if MetaBlockConnection is None else MetaBlockConnection
+        self._MetaBlockConnection = EMPTY
+        if MetaBlockConnection is not None:
+            self.MetaBlockConnection = MetaBlockConnection
 
         super(MetaBlockConnectivity, self).__init__(*args, **kw_args)
 
@@ -60,6 +66,7 @@ class MetaBlockConnectivity(IdentifiedObject):
         return self._BlockConnectivity
 
     def setBlockConnectivity(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._BlockConnectivity:
             x.MetaBlockConnectivity = None
         for y in value:
@@ -81,6 +88,7 @@ class MetaBlockConnectivity(IdentifiedObject):
         return self._MetaBlockConSignal
 
     def setMetaBlockConSignal(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._MetaBlockConSignal:
             x.MemberOf_MetaBlockConnectivity = None
         for y in value:
@@ -102,6 +110,7 @@ class MetaBlockConnectivity(IdentifiedObject):
         return self._metaBlockConnection0
 
     def setmetaBlockConnection0(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._metaBlockConnection0:
             x.metaBlockConnectivity0 = None
         for y in value:
@@ -123,6 +132,7 @@ class MetaBlockConnectivity(IdentifiedObject):
         return self._metaBlockConSignal0
 
     def setmetaBlockConSignal0(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._metaBlockConSignal0:
             x.metaBlockConnectivity0 = None
         for y in value:
@@ -144,6 +154,7 @@ class MetaBlockConnectivity(IdentifiedObject):
         return self._MetaBlockConnection
 
     def setMetaBlockConnection(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._MetaBlockConnection:
             x.MemberOf_MetaBlockConnectivity = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import AssociationList, EMPTY
 
 class MetaBlockInputReference(IdentifiedObject):
 
@@ -61,13 +62,14 @@ class MetaBlockInputReference(IdentifiedObject):
 
     def setStandardControlBlock_MetaBlockConnectable(self, value):
         if self._StandardControlBlock_MetaBlockConnectable is not None:
-            filtered = [x for x in self.StandardControlBlock_MetaBlockConnectable.StandardControlBlock_MetaBlockInputReference if x != self]
-            self._StandardControlBlock_MetaBlockConnectable._StandardControlBlock_MetaBlockInputReference = filtered
+            self._StandardControlBlock_MetaBlockConnectable._StandardControlBlock_MetaBlockInputReference.discard(self)
 
         self._StandardControlBlock_MetaBlockConnectable = value
         if self._StandardControlBlock_MetaBlockConnectable is not None:
-            if self not in self._StandardControlBlock_MetaBlockConnectable._StandardControlBlock_MetaBlockInputReference:
-                self._StandardControlBlock_MetaBlockConnectable._StandardControlBlock_MetaBlockInputReference.append(self)
+            if self._StandardControlBlock_MetaBlockConnectable._StandardControlBlock_MetaBlockInputReference is EMPTY:
+                self._StandardControlBlock_MetaBlockConnectable._StandardControlBlock_MetaBlockInputReference = AssociationList([self])
+            else:
+                self._StandardControlBlock_MetaBlockConnectable._StandardControlBlock_MetaBlockInputReference.add(self)
 
     StandardControlBlock_MetaBlockConnectable = property(getStandardControlBlock_MetaBlockConnectable, setStandardControlBlock_MetaBlockConnectable)
 
@@ -77,13 +79,14 @@ class MetaBlockInputReference(IdentifiedObject):
 
     def setMemberOf_MetaBlockReference(self, value):
         if self._MemberOf_MetaBlockReference is not None:
-            filtered = [x for x in self.MemberOf_MetaBlockReference.MetaBlockInputReference if x != self]
-            self._MemberOf_MetaBlockReference._MetaBlockInputReference = filtered
+            self._MemberOf_MetaBlockReference._MetaBlockInputReference.discard(self)
 
         self._MemberOf_MetaBlockReference = value
         if self._MemberOf_MetaBlockReference is not None:
-            if self not in self._MemberOf_MetaBlockReference._MetaBlockInputReference:
-                self._MemberOf_MetaBlockReference._MetaBlockInputReference.append(self)
+            if self._MemberOf_MetaBlockReference._MetaBlockInputReference is EMPTY:
+                self._MemberOf_MetaBlockReference._MetaBlockInputReference = AssociationList([self])
+            else:
+                self._MemberOf_MetaBlockReference._MetaBlockInputReference.add(self)
 
     MemberOf_MetaBlockReference = property(getMemberOf_MetaBlockReference, setMemberOf_MetaBlockReference)
 
@@ -108,13 +111,14 @@ class MetaBlockInputReference(IdentifiedObject):
 
     def setMetaBlockConnectable(self, value):
         if self._MetaBlockConnectable is not None:
-            filtered = [x for x in self.MetaBlockConnectable.MetaBlockInputReference if x != self]
-            self._MetaBlockConnectable._MetaBlockInputReference = filtered
+            self._MetaBlockConnectable._MetaBlockInputReference.discard(self)
 
         self._MetaBlockConnectable = value
         if self._MetaBlockConnectable is not None:
-            if self not in self._MetaBlockConnectable._MetaBlockInputReference:
-                self._MetaBlockConnectable._MetaBlockInputReference.append(self)
+            if self._MetaBlockConnectable._MetaBlockInputReference is EMPTY:
+                self._MetaBlockConnectable._MetaBlockInputReference = AssociationList([self])
+            else:
+                self._MetaBlockConnectable._MetaBlockInputReference.add(self)
 
     MetaBlockConnectable = property(getMetaBlockConnectable, setMetaBlockConnectable)
 
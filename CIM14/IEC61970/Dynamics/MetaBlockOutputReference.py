@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import AssociationList, EMPTY
 
 class MetaBlockOutputReference(IdentifiedObject):
 
@@ -36,8 +37,9 @@ class MetaBlockOutputReference(IdentifiedObject):
         self._MemberOf_MetaBlockReference = None
         self.MemberOf_MetaBlockReference = MemberOf_MetaBlockReference
 
-        self._MetaBlockSignal = []
-        self.MetaBlockSignal = [] if MetaBlockSignal is None else MetaBlockSignal
+        self._MetaBlockSignal = EMPTY
+        if MetaBlockSignal is not None:
+            self.MetaBlockSignal = MetaBlockSignal
 
         self._StandardControlBlock_MetaBlockConnectable = None
         self.StandardControlBlock_MetaBlockConnectable = StandardControlBlock_MetaBlockConnectable
@@ -57,13 +59,14 @@ class MetaBlockOutputReference(IdentifiedObject):
 
     def setMetaBlockConnectable(self, value):
         if self._MetaBlockConnectable is not None:
-            filtered = [x for x in self.MetaBlockConnectable.MetaBlockOutputReference if x != self]
-            self._MetaBlockConnectable._MetaBlockOutputReference = filtered
+            self._MetaBlockConnectable._MetaBlockOutputReference.discard(self)
 
         self._MetaBlockConnectable = value
         if self._MetaBlockConnectable is not None:
-            if self not in self._MetaBlockConnectable._MetaBlockOutputReference:
-                self._MetaBlockConnectable._MetaBlockOutputReference.append(self)
+            if self._MetaBlockConnectable._MetaBlockOutputReference is EMPTY:
+                self._MetaBlockConnectable._MetaBlockOutputReference = AssociationList([self])
+            else:
+                self._MetaBlockConnectable._MetaBlockOutputReference.add(self)
 
     MetaBlockConnectable = property(getMetaBlockConnectable, setMetaBlockConnectable)
 
@@ -73,13 +76,14 @@ class MetaBlockOutputReference(IdentifiedObject):
 
     def setMemberOf_MetaBlockReference(self, value):
         if self._MemberOf_MetaBlockReference is not None:
-            filtered = [x for x in self.MemberOf_MetaBlockReference.MetaBlockOutputReference if x != self]
-            self._MemberOf_MetaBlockReference._MetaBlockOutputReference = filtered
+            self._MemberOf_MetaBlockReference._MetaBlockOutputReference.discard(self)
 
         self._MemberOf_MetaBlockReference = value
         if self._MemberOf_MetaBlockReference is not None:
-            if self not in self._MemberOf_MetaBlockReference._MetaBlockOutputReference:
-                self._MemberOf_MetaBlockReference._MetaBlockOutputReference.append(self)
+            if self._MemberOf_MetaBlockReference._MetaBlockOutputReference is EMPTY:
+                self._MemberOf_MetaBlockReference._MetaBlockOutputReference = AssociationList([self])
+            else:
+                self._MemberOf_MetaBlockReference._MetaBlockOutputReference.add(self)
 
     MemberOf_MetaBlockReference = property(getMemberOf_MetaBlockReference, setMemberOf_MetaBlockReference)
 
@@ -88,6 +92,7 @@ class MetaBlockOutputReference(IdentifiedObject):
         return self._MetaBlockSignal
 
     def setMetaBlockSignal(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._MetaBlockSignal:
             x.To = None
         for y in value:
@@ -110,13 +115,14 @@ class MetaBlockOutputReference(IdentifiedObject):
 
     def setStandardControlBlock_MetaBlockConnectable(self, value):
         if self._StandardControlBlock_MetaBlockConnectable is not None:
-            filtered = [x for x in self.StandardControlBlock_MetaBlockConnectable.StandardControlBlock_MetaBlockOutputReference if x != self]
-            self._StandardControlBlock_MetaBlockConnectable._StandardControlBlock_MetaBlockOutputReference = filtered
+            self._StandardControlBlock_MetaBlockConnectable._StandardControlBlock_MetaBlockOutputReference.discard(self)
 
         self._StandardControlBlock_MetaBlockConnectable = value
         if self._StandardControlBlock_MetaBlockConnectable is not None:
-            if self not in self._StandardControlBlock_MetaBlockConnectable._StandardControlBlock_MetaBlockOutputReference:
-                self._StandardControlBlock_MetaBlockConnectable._StandardControlBlock_MetaBlockOutputReference.append(self)
+            if self._StandardControlBlock_MetaBlockConnectable._StandardControlBlock_MetaBlockOutputReference is EMPTY:
+                self._StandardControlBlock_MetaBlockConnectable._StandardControlBlock_MetaBlockOutputReference = AssociationList([self])
+            else:
+                self._StandardControlBlock_MetaBlockConnectable._StandardControlBlock_MetaBlockOutputReference.add(self)
 
     StandardControlBlock_MetaBlockConnectable = property(getStandardControlBlock_MetaBlockConnectable, setStandardControlBlock_MetaBlockConnectable)
 
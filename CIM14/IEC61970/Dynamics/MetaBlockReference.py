@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import AssociationList, EMPTY
 
 class MetaBlockReference(IdentifiedObject):
     """References a control block at the internal meta dynamics model level.    These references are contained in other blocks and reference the single instance of the meta model that defines a particular block definition. One would not expect to see bock references contained within a primitive block.
@@ -41,31 +42,38 @@ class MetaBlockReference(IdentifiedObject):
         #: should be enum, initial conditions vs. simulation equations
         self.equationType = equationType
 
-        self._blockInputReference0 = []
-        self.blockInputReference0 = [] if blockInputReference0 is None else blockInputReference0
+        self._blockInputReference0 = EMPTY
+        if blockInputReference0 is not None:
+            self.blockInputReference0 = blockInputReference0
 
         self._MemberOf_MetaBlock = None
         self.MemberOf_MetaBlock = MemberOf_MetaBlock
 
         self.MetaBlock = MetaBlock
 
-        self._blockOutputReference0 = []
-        self.blockOutputReference0 = [] if blockOutputReference0 is None else blockOutputReference0
+        self._blockOutputReference0 = EMPTY
+        if blockOutputReference0 is not None:
+            self.blockOutputReference0 = blockOutputReference0
 
-        self._MetaBlockStateReference = []
-        self.MetaBlockStateReference = [] if MetaBlockStateReference is None else MetaBlockStateReference
+        self._MetaBlockStateReference = EMPTY
+        if MetaBlockStateReference is not None:
+            self.MetaBlockStateReference = MetaBlockStateReference
 
-        self._MetaBlockInputReference = []
-        self.MetaBlockInputReference = [] if MetaBlockInputReference is None else MetaBlockInputReference
+        self._MetaBlockInputReference = EMPTY
+        if MetaBlockInputReference is not None:
+            self.MetaBlockInputReference = MetaBlockInputReference
 
-        self._MetaBlockOutputReference = []
-        self.MetaBlockOutputReference = [] if MetaBlockOutputReference is None else MetaBlockOutputReference
+        self._MetaBlockOutputReference = EMPTY
+        if MetaBlockOutputReference is not None:
+            self.MetaBlockOutputReference = MetaBlockOutputReference
 
-        self._BlockParameter = []
-        self.BlockParameter = [] if BlockParameter is None else BlockParameter
+        self._BlockParameter = EMPTY
+        if BlockParameter is not None:
+            self.BlockParameter = BlockParameter
 
-        self._MetaBlockParameterReference = []
-        self.MetaBlockParameterReference = [] if MetaBlockParameterReference is None else MetaBlockParameterReference
+        self._MetaBlockParameterReference = EMPTY
+        if MetaBlockParameterReference is not None:
+            self.MetaBlockParameterReference = MetaBlockParameterReference
 
         super(MetaBlockReference, self).__init__(*args, **kw_args)
 
@@ -81,6 +89,7 @@ class MetaBlockReference(IdentifiedObject):
         return self._blockInputReference0
 
     def setblockInputReference0(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._blockInputReference0:
             x.metaBlockReference0 = None
         for y in value:
@@ -103,13 +112,14 @@ class MetaBlockReference(IdentifiedObject):
 
     def setMemberOf_MetaBlock(self, value):
         if self._MemberOf_MetaBlock is not None:
-            filtered = [x for x in self.MemberOf_MetaBlock.MetaBlockReference if x != self]
-            self._MemberOf_MetaBlock._MetaBlockReference = filtered
+            self._MemberOf_MetaBlock._MetaBlockReference.discard(self)
 
         self._MemberOf_MetaBlock = value
         if self._MemberOf_MetaBlock is not None:
-            if self not in self._MemberOf_MetaBlock._MetaBlockReference:
-                self._MemberOf_MetaBlock._MetaBlockReference.append(self)
+            if self._MemberOf_MetaBlock._MetaBlockReference is EMPTY:
+                self._MemberOf_MetaBlock._MetaBlockReference = AssociationList([self])
+            else:
+                self._MemberOf_MetaBlock._MetaBlockReference.add(self)
 
     MemberOf_MetaBlock = property(getMemberOf_MetaBlock, setMemberOf_MetaBlock)
 
@@ -120,21 +130,28 @@ class MetaBlockReference(IdentifiedObject):
         return self._blockOutputReference0
 
     def setblockOutputReference0(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._blockOutputReference0:
-            filtered = [q for q in p.metaBlockReference0 if q != self]
-            self._blockOutputReference0._metaBlockReference0 = filtered
+            p._metaBlockReference0.discard(self)
         for r in value:
-            if self not in r._metaBlockReference0:
-                r._metaBlockReference0.append(self)
+            if r._metaBlockReference0 is EMPTY:
+                r._metaBlockReference0 = AssociationList([self])
+            else:
+                r._metaBlockReference0.add(self)
         self._blockOutputReference0 = value
 
     blockOutputReference0 = property(getblockOutputReference0, setblockOutputReference0)
 
     def addblockOutputReference0(self, *blockOutputReference0):
         for obj in blockOutputReference0:
-            if self not in obj._metaBlockReference0:
-                obj._metaBlockReference0.append(self)
-            self._blockOutputReference0.append(obj)
+            if obj._metaBlockReference0 is EMPTY:
+                obj._metaBlockReference0 = AssociationList([self])
+            else:
+                obj._metaBlockReference0.add(self)
+            if self._blockOutputReference0 is EMPTY:
+                self._blockOutputReference0 = AssociationList([obj])
+            else:
+                self._blockOutputReference0.add(obj)
 
     def removeblockOutputReference0(self, *blockOutputReference0):
         for obj in blockOutputReference0:
@@ -147,6 +164,7 @@ class MetaBlockReference(IdentifiedObject):
         return self._MetaBlockStateReference
 
     def setMetaBlockStateReference(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._MetaBlockStateReference:
             x.MemberOf_MetaBlockReference = None
         for y in value:
@@ -168,6 +186,7 @@ class MetaBlockReference(IdentifiedObject):
         return self._MetaBlockInputReference
 
     def setMetaBlockInputReference(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._MetaBlockInputReference:
             x.MemberOf_MetaBlockReference = None
         for y in value:
@@ -189,6 +208,7 @@ class MetaBlockReference(IdentifiedObject):
         return self._MetaBlockOutputReference
 
     def setMetaBlockOutputReference(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._MetaBlockOutputReference:
             x.MemberOf_MetaBlockReference = None
         for y in value:
@@ -210,6 +230,7 @@ class MetaBlockReference(IdentifiedObject):
         return self._BlockParameter
 
     def setBlockParameter(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._BlockParameter:
             x.MemberOf_MetaBlockReference = None
         for y in value:
@@ -231,6 +252,7 @@ class MetaBlockReference(IdentifiedObject):
         return self._MetaBlockParameterReference
 
     def setMetaBlockParameterReference(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._MetaBlockParameterReference:
             x.MemberOf_MetaBlockReference = None
         for y in value:
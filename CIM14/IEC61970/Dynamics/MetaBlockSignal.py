@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import AssociationList, EMPTY
 
 class MetaBlockSignal(IdentifiedObject):
 
@@ -31,11 +32,13 @@ class MetaBlockSignal(IdentifiedObject):
         @param From:
         @param To:
         """
-        self._metaBlockSignal1 = []
-        self.metaBlockSignal1 = [] if metaBlockSignal1 is None else metaBlockSignal1
+        self._metaBlockSignal1 = EMPTY
+        if metaBlockSignal1 is not None:
+            self.metaBlockSignal1 = metaBlockSignal1
 
-        self._metaBlockSignal = []
-        self.metaBlockSignal = [] if metaBlockSignal is None else metaBlockSignal
+        self._metaBlockSignal = EMPTY
+        if metaBlockSignal is not None:
+            self.metaBlockSignal = metaBlockSignal
 
         self._MemberOf_MetaBlock = None
         self.MemberOf_MetaBlock = MemberOf_MetaBlock
@@ -60,21 +63,28 @@ class MetaBlockSignal(IdentifiedObject):
         return self._metaBlockSignal1
 
     def setmetaBlockSignal1(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._metaBlockSignal1:
-            filtered = [q for q in p.metaBlockSignal if q != self]
-            self._metaBlockSignal1._metaBlockSignal = filtered
+            p._metaBlockSignal.discard(self)
         for r in value:
-            if self not in r._metaBlockSignal:
-                r._metaBlockSignal.append(self)
+            if r._metaBlockSignal is EMPTY:
+                r._metaBlockSignal = AssociationList([self])
+            else:
+                r._metaBlockSignal.add(self)
         self._metaBlockSignal1 = value
 
     metaBlockSignal1 = property(getmetaBlockSignal1, setmetaBlockSignal1)
 
     def addmetaBlockSignal1(self, *metaBlockSignal1):
         for obj in metaBlockSignal1:
-            if self not in obj._metaBlockSignal:
-                obj._metaBlockSignal.append(self)
-            self._metaBlockSignal1.append(obj)
+            if obj._metaBlockSignal is EMPTY:
+                obj._metaBlockSignal = AssociationList([self])
+            else:
+                obj._metaBlockSignal.add(self)
+            if self._metaBlockSignal1 is EMPTY:
+                self._metaBlockSignal1 = AssociationList([obj])
+            else:
+                self._metaBlockSignal1.add(obj)
 
     def removemetaBlockSignal1(self, *metaBlockSignal1):
         for obj in metaBlockSignal1:
@@ -87,21 +97,28 @@ class MetaBlockSignal(IdentifiedObject):
         return self._metaBlockSignal
 
     def setmetaBlockSignal(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._metaBlockSignal:
-            filtered = [q for q in p.metaBlockSignal1 if q != self]
-            self._metaBlockSignal._metaBlockSignal1 = filtered
+            p._metaBlockSignal1.discard(self)
         for r in value:
-            if self not in r._metaBlockSignal1:
-                r._metaBlockSignal1.append(self)
+            if r._metaBlockSignal1 is EMPTY:
+                r._metaBlockSignal1 = AssociationList([self])
+            else:
+                r._metaBlockSignal1.add(self)
         self._metaBlockSignal = value
 
     metaBlockSignal = property(getmetaBlockSignal, setmetaBlockSignal)
 
     def addmetaBlockSignal(self, *metaBlockSignal):
         for obj in metaBlockSignal:
-            if self not in obj._metaBlockSignal1:
-                obj._metaBlockSignal1.append(self)
-            self._metaBlockSignal.append(obj)
+            if obj._metaBlockSignal1 is EMPTY:
+                obj._metaBlockSignal1 = AssociationList([self])
+            else:
+                obj._metaBlockSignal1.add(self)
+            if self._metaBlockSignal is EMPTY:
+                self._metaBlockSignal = AssociationList([obj])
+            else:
+                self._metaBlockSignal.add(obj)
 
     def removemetaBlockSignal(self, *metaBlockSignal):
         for obj in metaBlockSignal:
@@ -115,13 +132,14 @@ class MetaBlockSignal(IdentifiedObject):
 
     def setMemberOf_MetaBlock(self, value):
         if self._MemberOf_MetaBlock is not None:
-            filtered = [x for x in self.MemberOf_MetaBlock.MetaBlockSignal if x != self]
-            self._MemberOf_MetaBlock._MetaBlockSignal = filtered
+            self._MemberOf_MetaBlock._MetaBlockSignal.discard(self)
 
         self._MemberOf_MetaBlock = value
         if self._MemberOf_MetaBlock is not None:
-            if self not in self._MemberOf_MetaBlock._MetaBlockSignal:
-                self._MemberOf_MetaBlock._MetaBlockSignal.append(self)
+            if self._MemberOf_MetaBlock._MetaBlockSignal is EMPTY:
+                self._MemberOf_MetaBlock._MetaBlockSignal = AssociationList([self])
+            else:
+                self._MemberOf_MetaBlock._MetaBlockSignal.add(self)
 
     MemberOf_MetaBlock = property(getMemberOf_MetaBlock, setMemberOf_MetaBlock)
 
@@ -146,13 +164,14 @@ class MetaBlockSignal(IdentifiedObject):
 
     def setTo(self, value):
         if self._To is not None:
-            filtered = [x for x in self.To.MetaBlockSignal if x != self]
-            self._To._MetaBlockSignal = filtered
+            self._To._MetaBlockSignal.discard(self)
 
         self._To = value
         if self._To is not None:
-            if self not in self._To._MetaBlockSignal:
-                self._To._MetaBlockSignal.append(self)
+            if self._To._MetaBlockSignal is EMPTY:
+                self._To._MetaBlockSignal = AssociationList([self])
+            else:
+                self._To._MetaBlockSignal.add(self)
 
     To = property(getTo, setTo)
 
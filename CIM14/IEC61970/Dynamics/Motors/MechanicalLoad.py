@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.PowerSystemResource import PowerSystemResource
+from CIM14.Element import AssociationList, EMPTY
 
 class MechanicalLoad(PowerSystemResource):
     """A mechanical load represents the variation in a motor's shaft torque or power as a function of shaft speed.
@@ -29,8 +30,9 @@ class MechanicalLoad(PowerSystemResource):
 
         @param rotatingMachine0:
         """
-        self._rotatingMachine0 = []
-        self.rotatingMachine0 = [] if rotatingMachine0 is None else rotatingMachine0
+        self._rotatingMachine0 = EMPTY
+        if rotatingMachine0 is not None:
+            self.rotatingMachine0 = rotatingMachine0
 
         super(MechanicalLoad, self).__init__(*args, **kw_args)
 
@@ -46,21 +48,28 @@ class MechanicalLoad(PowerSystemResource):
         return self._rotatingMachine0
 
     def setrotatingMachine0(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._rotatingMachine0:
-            filtered = [q for q in p.mechanicalLoad0 if q != self]
-            self._rotatingMachine0._mechanicalLoad0 = filtered
+            p._mechanicalLoad0.discard(self)
         for r in value:
-            if self not in r._mechanicalLoad0:
-                r._mechanicalLoad0.append(self)
+            if r._mechanicalLoad0 is EMPTY:
+                r._mechanicalLoad0 = AssociationList([self])
+            else:
+                r._mechanicalLoad0.add(self)
         self._rotatingMachine0 = value
 
     rotatingMachine0 = property(getrotatingMachine0, setrotatingMachine0)
 
     def addrotatingMachine0(self, *rotatingMachine0):
         for obj in rotatingMachine0:
-            if self not in obj._mechanicalLoad0:
-                obj._mechanicalLoad0.append(self)
-            self._rotatingMachine0.append(obj)
+            if obj._mechanicalLoad0 is EMPTY:
+                obj._mechanicalLoad0 = AssociationList([self])
+            else:
+                obj._mechanicalLoad0.add(self)
+            if self._rotatingMachine0 is EMPTY:
+                self._rotatingMachine0 = AssociationList([obj])
+            else:
+                self._rotatingMachine0.add(obj)
 
     def removerotatingMachine0(self, *rotatingMachine0):
         for obj in rotatingMachine0:
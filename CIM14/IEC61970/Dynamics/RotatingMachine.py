@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Wires.RegulatingCondEq import RegulatingCondEq
+from CIM14.Element import AssociationList, EMPTY
 
 class RotatingMachine(RegulatingCondEq):
     """A rotating machine which may be used as a generator or motor.
@@ -61,8 +62,9 @@ class RotatingMachine(RegulatingCondEq):
         #: Stator leakage reactance (&gt; 0.)
         self.xls = xls
 
-        self._mechanicalLoad0 = []
-        self.mechanicalLoad0 = [] if mechanicalLoad0 is None else mechanicalLoad0
+        self._mechanicalLoad0 = EMPTY
+        if mechanicalLoad0 is not None:
+            self.mechanicalLoad0 = mechanicalLoad0
 
         super(RotatingMachine, self).__init__(*args, **kw_args)
 
@@ -78,21 +80,28 @@ class RotatingMachine(RegulatingCondEq):
         return self._mechanicalLoad0
 
     def setmechanicalLoad0(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._mechanicalLoad0:
-            filtered = [q for q in p.rotatingMachine0 if q != self]
-            self._mechanicalLoad0._rotatingMachine0 = filtered
+            p._rotatingMachine0.discard(self)
         for r in value:
-            if self not in r._rotatingMachine0:
-                r._rotatingMachine0.append(self)
+            if r._rotatingMachine0 is EMPTY:
+                r._rotatingMachine0 = AssociationList([self])
+            else:
+                r._rotatingMachine0.add(self)
         self._mechanicalLoad0 = value
 
     mechanicalLoad0 = property(getmechanicalLoad0, setmechanicalLoad0)
 
     def addmechanicalLoad0(self, *mechanicalLoad0):
         for obj in mechanicalLoad0:
-            if self not in obj._rotatingMachine0:
-                obj._rotatingMachine0.append(self)
-            self._mechanicalLoad0.append(obj)
+            if obj._rotatingMachine0 is EMPTY:
+                obj._rotatingMachine0 = AssociationList([self])
+            else:
+                obj._rotatingMachine0.add(self)
+            if self._mechanicalLoad0 is EMPTY:
+                self._mechanicalLoad0 = AssociationList([obj])
+            else:
+                self._mechanicalLoad0.add(obj)
 
     def removemechanicalLoad0(self, *mechanicalLoad0):
         for obj in mechanicalLoad0:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import AssociationList, EMPTY
 
 class Slot(IdentifiedObject):
 
@@ -34,17 +35,20 @@ class Slot(IdentifiedObject):
         self._blockType0 = None
         self.blockType0 = blockType0
 
-        self._slotReference0 = []
-        self.slotReference0 = [] if slotReference0 is None else slotReference0
+        self._slotReference0 = EMPTY
+        if slotReference0 is not None:
+            self.slotReference0 = slotReference0
 
-        self._slotOutput0 = []
-        self.slotOutput0 = [] if slotOutput0 is None else slotOutput0
+        self._slotOutput0 = EMPTY
+        if slotOutput0 is not None:
+            self.slotOutput0 = slotOutput0
 
         self._connectionFrame0 = None
         self.connectionFrame0 = connectionFrame0
 
-        self._slotInput0 = []
-        self.slotInput0 = [] if slotInput0 is None else slotInput0
+        self._slotInput0 = EMPTY
+        if slotInput0 is not None:
+            self.slotInput0 = slotInput0
 
         super(Slot, self).__init__(*args, **kw_args)
 
@@ -61,13 +65,14 @@ class Slot(IdentifiedObject):
 
     def setblockType0(self, value):
         if self._blockType0 is not None:
-            filtered = [x for x in self.blockType0.slot0 if x != self]
-            self._blockType0._slot0 = filtered
+            self._blockType0._slot0.discard(self)
 
         self._blockType0 = value
         if self._blockType0 is not None:
-            if self not in self._blockType0._slot0:
-                self._blockType0._slot0.append(self)
+            if self._blockType0._slot0 is EMPTY:
+                self._blockType0._slot0 = AssociationList([self])
+            else:
+                self._blockType0._slot0.add(self)
 
     blockType0 = property(getblockType0, setblockType0)
 
@@ -76,6 +81,7 @@ class Slot(IdentifiedObject):
         return self._slotReference0
 
     def setslotReference0(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._slotReference0:
             x.slot0 = None
         for y in value:
@@ -97,6 +103,7 @@ class Slot(IdentifiedObject):
         return self._slotOutput0
 
     def setslotOutput0(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._slotOutput0:
             x.slot0 = None
         for y in value:
@@ -119,13 +126,14 @@ class Slot(IdentifiedObject):
 
     def setconnectionFrame0(self, value):
         if self._connectionFrame0 is not None:
-            filtered = [x for x in self.connectionFrame0.slot0 if x != self]
-            self._connectionFrame0._slot0 = filtered
+            self._connectionFrame0._slot0.discard(self)
 
         self._connectionFrame0 = value
         if self._connectionFrame0 is not None:
-            if self not in self._connectionFrame0._slot0:
-                self._connectionFrame0._slot0.append(self)
+            if self._connectionFrame0._slot0 is EMPTY:
+                self._connectionFrame0._slot0 = AssociationList([self])
+            else:
+                self._connectionFrame0._slot0.add(self)
 
     connectionFrame0 = property(getconnectionFrame0, setconnectionFrame0)
 
@@ -134,6 +142,7 @@ class Slot(IdentifiedObject):
         return self._slotInput0
 
     def setslotInput0(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._slotInput0:
             x.slot0 = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import AssociationList, EMPTY
 
 class SlotConnection(IdentifiedObject):
     """Standard connectivity if not specified at the instance level..
@@ -55,13 +56,14 @@ class SlotConnection(IdentifiedObject):
 
     def setconnectionFrame0(self, value):
         if self._connectionFrame0 is not None:
-            filtered = [x for x in self.connectionFrame0.slotConnection0 if x != self]
-            self._connectionFrame0._slotConnection0 = filtered
+            self._connectionFrame0._slotConnection0.discard(self)
 
         self._connectionFrame0 = value
         if self._connectionFrame0 is not None:
-            if self not in self._connectionFrame0._slotConnection0:
-                self._connectionFrame0._slotConnection0.append(self)
+            if self._connectionFrame0._slotConnection0 is EMPTY:
+                self._connectionFrame0._slotConnection0 = AssociationList([self])
+            else:
+                self._connectionFrame0._slotConnection0.add(self)
 
     connectionFrame0 = property(getconnectionFrame0, setconnectionFrame0)
 
@@ -86,13 +88,14 @@ class SlotConnection(IdentifiedObject):
 
     def setslotOutput0(self, value):
         if self._slotOutput0 is not None:
-            filtered = [x for x in self.slotOutput0.slotConnection0 if x != self]
-            self._slotOutput0._slotConnection0 = filtered
+            self._slotOutput0._slotConnection0.discard(self)
 
         self._slotOutput0 = value
         if self._slotOutput0 is not None:
-            if self not in self._slotOutput0._slotConnection0:
-                self._slotOutput0._slotConnection0.append(self)
+            if self._slotOutput0._slotConnection0 is EMPTY:
+                self._slotOutput0._slotConnection0 = AssociationList([self])
+            else:
+                self._slotOutput0._slotConnection0.add(self)
 
     slotOutput0 = property(getslotOutput0, setslotOutput0)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import AssociationList, EMPTY
 
 class SlotInput(IdentifiedObject):
 
@@ -53,13 +54,14 @@ class SlotInput(IdentifiedObject):
 
     def setblockInputType0(self, value):
         if self._blockInputType0 is not None:
-            filtered = [x for x in self.blockInputType0.slotInput0 if x != self]
-            self._blockInputType0._slotInput0 = filtered
+            self._blockInputType0._slotInput0.discard(self)
 
         self._blockInputType0 = value
         if self._blockInputType0 is not None:
-            if self not in self._blockInputType0._slotInput0:
-                self._blockInputType0._slotInput0.append(self)
+            if self._blockInputType0._slotInput0 is EMPTY:
+                self._blockInputType0._slotInput0 = AssociationList([self])
+            else:
+                self._blockInputType0._slotInput0.add(self)
 
     blockInputType0 = property(getblockInputType0, setblockInputType0)
 
@@ -84,13 +86,14 @@ class SlotInput(IdentifiedObject):
 
     def setslot0(self, value):
         if self._slot0 is not None:
-            filtered = [x for x in self.slot0.slotInput0 if x != self]
-            self._slot0._slotInput0 = filtered
+            self._slot0._slotInput0.discard(self)
 
         self._slot0 = value
         if self._slot0 is not None:
-            if self not in self._slot0._slotInput0:
-                self._slot0._slotInput0.append(self)
+            if self._slot0._slotInput0 is EMPTY:
+                self._slot0._slotInput0 = AssociationList([self])
+            else:
+                self._slot0._slotInput0.add(self)
 
     slot0 = property(getslot0, setslot0)
 
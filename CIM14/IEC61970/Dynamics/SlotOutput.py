@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import AssociationList, EMPTY
 
 class SlotOutput(IdentifiedObject):
 
@@ -32,8 +33,9 @@ class SlotOutput(IdentifiedObject):
         self._slot0 = None
         self.slot0 = slot0
 
-        self._slotConnection0 = []
-        self.slotConnection0 = [] if slotConnection0 is None else slotConnection0
+        self._slotConnection0 = EMPTY
+        if slotConnection0 is not None:
+            self.slotConnection0 = slotConnection0
 
         self._blockOutputType0 = None
         self.blockOutputType0 = blockOutputType0
@@ -53,13 +55,14 @@ class SlotOutput(IdentifiedObject):
 
     def setslot0(self, value):
         if self._slot0 is not None:
-            filtered = [x for x in self.slot0.slotOutput0 if x != self]
-            self._slot0._slotOutput0 = filtered
+            self._slot0._slotOutput0.discard(self)
 
         self._slot0 = value
         if self._slot0 is not None:
-            if self not in self._slot0._slotOutput0:
-                self._slot0._slotOutput0.append(self)
+            if self._slot0._slotOutput0 is EMPTY:
+                self._slot0._slotOutput0 = AssociationList([self])
+            else:
+                self._slot0._slotOutput0.add(self)
 
     slot0 = property(getslot0, setslot0)
 
@@ -68,6 +71,7 @@ class SlotOutput(IdentifiedObject):
         return self._slotConnection0
 
     def setslotConnection0(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._slotConnection0:
             x.slotOutput0 = None
         for y in value:
@@ -90,13 +94,14 @@ class SlotOutput(IdentifiedObject):
 
     def setblockOutputType0(self, value):
         if self._blockOutputType0 is not None:
-            filtered = [x for x in self.blockOutputType0.slotOutput0 if x != self]
-            self._blockOutputType0._slotOutput0 = filtered
+            self._blockOutputType0._slotOutput0.discard(self)
 
         self._blockOutputType0 = value
         if self._blockOutputType0 is not None:
-            if self not in self._blockOutputType0._slotOutput0:
-                self._blockOutputType0._slotOutput0.append(self)
+            if self._blockOutputType0._slotOutput0 is EMPTY:
+                self._blockOutputType0._slotOutput0 = AssociationList([self])
+            else:
+                self._blockOutputType0._slotOutput0.add(self)
 
     blockOutputType0 = property(getblockOutputType0, setblockOutputType0)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import AssociationList, EMPTY
 
 class SlotReference(IdentifiedObject):
     """The specific role the block usage is playing in a connection frame. This allows connections to be established at the meta dynamics level and not at the instance level.
@@ -34,11 +35,13 @@ class SlotReference(IdentifiedObject):
         self._slot0 = None
         self.slot0 = slot0
 
-        self._block0 = []
-        self.block0 = [] if block0 is None else block0
+        self._block0 = EMPTY
+        if block0 is not None:
+            self.block0 = block0
 
-        self._compositeModel0 = []
-        self.compositeModel0 = [] if compositeModel0 is None else compositeModel0
+        self._compositeModel0 = EMPTY
+        if compositeModel0 is not None:
+            self.compositeModel0 = compositeModel0
 
         super(SlotReference, self).__init__(*args, **kw_args)
 
@@ -55,13 +58,14 @@ class SlotReference(IdentifiedObject):
 
     def setslot0(self, value):
         if self._slot0 is not None:
-            filtered = [x for x in self.slot0.slotReference0 if x != self]
-            self._slot0._slotReference0 = filtered
+            self._slot0._slotReference0.discard(self)
 
         self._slot0 = value
         if self._slot0 is not None:
-            if self not in self._slot0._slotReference0:
-                self._slot0._slotReference0.append(self)
+            if self._slot0._slotReference0 is EMPTY:
+                self._slot0._slotReference0 = AssociationList([self])
+            else:
+                self._slot0._slotReference0.add(self)
 
     slot0 = property(getslot0, setslot0)
 
@@ -70,6 +74,7 @@ class SlotReference(IdentifiedObject):
         return self._block0
 
     def setblock0(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._block0:
             x.slotReference0 = None
         for y in value:
@@ -91,21 +96,28 @@ class SlotReference(IdentifiedObject):
         return self._compositeModel0
 
     def setcompositeModel0(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._compositeModel0:
-            filtered = [q for q in p.slotReference0 if q != self]
-            self._compositeModel0._slotReference0 = filtered
+            p._slotReference0.discard(self)
         for r in value:
-            if self not in r._slotReference0:
-                r._slotReference0.append(self)
+            if r._slotReference0 is EMPTY:
+                r._slotReference0 = AssociationList([self])
+            else:
+                r._slotReference0.add(self)
         self._compositeModel0 = value
 
     compositeModel0 = property(getcompositeModel0, setcompositeModel0)
 
     def addcompositeModel0(self, *compositeModel0):
         for obj in compositeModel0:
-            if self not in obj._slotReference0:
-                obj._slotReference0.append(self)
-            self._compositeModel0.append(obj)
+            if obj._slotReference0 is EMPTY:
+                obj._slotReference0 = AssociationList([self])
+            else:
+                obj._slotReference0.add(self)
+            if self._compositeModel0 is EMPTY:
+                self._compositeModel0 = AssociationList([obj])
+            else:
+                self._compositeModel0.add(obj)
 
     def removecompositeModel0(self, *compositeModel0):
         for obj in compositeModel0:
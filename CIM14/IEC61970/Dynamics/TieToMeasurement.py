@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import AssociationList, EMPTY
 
 class TieToMeasurement(IdentifiedObject):
     """Ties a block input to a specific state variable measurment.  Thus giving a unit type, a location in the network (typically a terminal).   A specific value is not given, just enough information to obtain the value from the model during a solution. This has nothing to do with SCADA.
@@ -55,13 +56,14 @@ class TieToMeasurement(IdentifiedObject):
 
     def setmeasurement0(self, value):
         if self._measurement0 is not None:
-            filtered = [x for x in self.measurement0.tieToMeasurement0 if x != self]
-            self._measurement0._tieToMeasurement0 = filtered
+            self._measurement0._tieToMeasurement0.discard(self)
 
         self._measurement0 = value
         if self._measurement0 is not None:
-            if self not in self._measurement0._tieToMeasurement0:
-                self._measurement0._tieToMeasurement0.append(self)
+            if self._measurement0._tieToMeasurement0 is EMPTY:
+                self._measurement0._tieToMeasurement0 = AssociationList([self])
+            else:
+                self._measurement0._tieToMeasurement0.add(self)
 
     measurement0 = property(getmeasurement0, setmeasurement0)
 
@@ -71,13 +73,14 @@ class TieToMeasurement(IdentifiedObject):
 
     def setblock0(self, value):
         if self._block0 is not None:
-            filtered = [x for x in self.block0.tieToMeasurement0 if x != self]
-            self._block0._tieToMeasurement0 = filtered
+            self._block0._tieToMeasurement0.discard(self)
 
         self._block0 = value
         if self._block0 is not None:
-            if self not in self._block0._tieToMeasurement0:
-                self._block0._tieToMeasurement0.append(self)
+            if self._block0._tieToMeasurement0 is EMPTY:
+                self._block0._tieToMeasurement0 = AssociationList([self])
+            else:
+                self._block0._tieToMeasurement0.add(self)
 
     block0 = property(getblock0, setblock0)
 
@@ -88,13 +91,14 @@ class TieToMeasurement(IdentifiedObject):
 
     def setmetaBlockInput0(self, value):
         if self._metaBlockInput0 is not None:
-            filtered = [x for x in self.metaBlockInput0.tieToMeasurement0 if x != self]
-            self._metaBlockInput0._tieToMeasurement0 = filtered
+            self._metaBlockInput0._tieToMeasurement0.discard(self)
 
         self._metaBlockInput0 = value
         if self._metaBlockInput0 is not None:
-            if self not in self._metaBlockInput0._tieToMeasurement0:
-                self._metaBlockInput0._tieToMeasurement0.append(self)
+            if self._metaBlockInput0._tieToMeasurement0 is EMPTY:
+                self._metaBlockInput0._tieToMeasurement0 = AssociationList([self])
+            else:
+                self._metaBlockInput0._tieToMeasurement0.add(self)
 
     metaBlockInput0 = property(getmetaBlockInput0, setmetaBlockInput0)
 
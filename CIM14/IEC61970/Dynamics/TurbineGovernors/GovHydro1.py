@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Dynamics.TurbineGovernors.TurbineGovernor import TurbineGovernor
+from CIM14.Element import AssociationList, EMPTY
 
 class GovHydro1(TurbineGovernor):
     """Hydro turbine-governor model.
@@ -85,8 +86,9 @@ class GovHydro1(TurbineGovernor):
         self._HydroTurbine = None
         self.HydroTurbine = HydroTurbine
 
-        self._synchronousMachine0 = []
-        self.synchronousMachine0 = [] if synchronousMachine0 is None else synchronousMachine0
+        self._synchronousMachine0 = EMPTY
+        if synchronousMachine0 is not None:
+            self.synchronousMachine0 = synchronousMachine0
 
         super(GovHydro1, self).__init__(*args, **kw_args)
 
@@ -117,21 +119,28 @@ class GovHydro1(TurbineGovernor):
         return self._synchronousMachine0
 
     def setsynchronousMachine0(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._synchronousMachine0:
-            filtered = [q for q in p.govHydro10 if q != self]
-            self._synchronousMachine0._govHydro10 = filtered
+            p._govHydro10.discard(self)
         for r in value:
-            if self not in r._govHydro10:
-                r._govHydro10.append(self)
+            if r._govHydro10 is EMPTY:
+                r._govHydro10 = AssociationList([self])
+            else:
+                r._govHydro10.add(self)
         self._synchronousMachine0 = value
 
     synchronousMachine0 = property(getsynchronousMachine0, setsynchronousMachine0)
 
     def addsynchronousMachine0(self, *synchronousMachine0):
         for obj in synchronousMachine0:
-            if self not in obj._govHydro10:
-                obj._govHydro10.append(self)
-            self._synchronousMachine0.append(obj)
+            if obj._govHydro10 is EMPTY:
+                obj._govHydro10 = AssociationList([self])
+            else:
+                obj._govHydro10.add(self)
+            if self._synchronousMachine0 is EMPTY:
+                self._synchronousMachine0 = AssociationList([obj])
+            else:
+                self._synchronousMachine0.add(obj)
 
     def removesynchronousMachine0(self, *synchronousMachine0):
         for obj in synchronousMachine0:
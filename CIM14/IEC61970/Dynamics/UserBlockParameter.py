@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Dynamics.MetaBlockParameter import MetaBlockParameter
+from CIM14.Element import AssociationList, EMPTY
 
 class UserBlockParameter(MetaBlockParameter):
     """Concrete class intended to obtain a parameter value from a user of the block  in the parameter list at the instance level.
@@ -29,8 +30,9 @@ class UserBlockParameter(MetaBlockParameter):
 
         @param BlockUsageParameter:
         """
-        self._BlockUsageParameter = []
-        self.BlockUsageParameter = [] if BlockUsageParameter is None else BlockUsageParameter
+        self._BlockUsageParameter = EMPTY
+        if BlockUsageParameter is not None:
+            self.BlockUsageParameter = BlockUsageParameter
 
         super(UserBlockParameter, self).__init__(*args, **kw_args)
 
@@ -46,6 +48,7 @@ class UserBlockParameter(MetaBlockParameter):
         return self._BlockUsageParameter
 
     def setBlockUsageParameter(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._BlockUsageParameter:
             x.UserBlockParameter = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Generation.GenerationDynamics.PrimeMover import PrimeMover
+from CIM14.Element import AssociationList, EMPTY
 
 class CombustionTurbine(PrimeMover):
     """A prime mover that is typically fueled by gas or light oil
@@ -88,13 +89,14 @@ class CombustionTurbine(PrimeMover):
 
     def setHeatRecoveryBoiler(self, value):
         if self._HeatRecoveryBoiler is not None:
-            filtered = [x for x in self.HeatRecoveryBoiler.CombustionTurbines if x != self]
-            self._HeatRecoveryBoiler._CombustionTurbines = filtered
+            self._HeatRecoveryBoiler._CombustionTurbines.discard(self)
 
         self._HeatRecoveryBoiler = value
         if self._HeatRecoveryBoiler is not None:
-            if self not in self._HeatRecoveryBoiler._CombustionTurbines:
-                self._HeatRecoveryBoiler._CombustionTurbines.append(self)
+            if self._HeatRecoveryBoiler._CombustionTurbines is EMPTY:
+                self._HeatRecoveryBoiler._CombustionTurbines = AssociationList([self])
+            else:
+                self._HeatRecoveryBoiler._CombustionTurbines.add(self)
 
     HeatRecoveryBoiler = property(getHeatRecoveryBoiler, setHeatRecoveryBoiler)
 
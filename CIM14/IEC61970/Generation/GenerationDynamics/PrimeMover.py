@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.PowerSystemResource import PowerSystemResource
+from CIM14.Element import AssociationList, EMPTY
 
 class PrimeMover(PowerSystemResource):
     """The machine used to develop mechanical energy used to drive a generator.
@@ -33,8 +34,9 @@ class PrimeMover(PowerSystemResource):
         #: Rating of prime mover
         self.primeMoverRating = primeMoverRating
 
-        self._SynchronousMachines = []
-        self.SynchronousMachines = [] if SynchronousMachines is None else SynchronousMachines
+        self._SynchronousMachines = EMPTY
+        if SynchronousMachines is not None:
+            self.SynchronousMachines = SynchronousMachines
 
         super(PrimeMover, self).__init__(*args, **kw_args)
 
@@ -51,21 +53,28 @@ class PrimeMover(PowerSystemResource):
         return self._SynchronousMachines
 
     def setSynchronousMachines(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._SynchronousMachines:
-            filtered = [q for q in p.PrimeMovers if q != self]
-            self._SynchronousMachines._PrimeMovers = filtered
+            p._PrimeMovers.discard(self)
         for r in value:
-            if self not in r._PrimeMovers:
-                r._PrimeMovers.append(self)
+            if r._PrimeMovers is EMPTY:
+                r._PrimeMovers = AssociationList([self])
+            else:
+                r._PrimeMovers.add(self)
         self._SynchronousMachines = value
 
     SynchronousMachines = property(getSynchronousMachines, setSynchronousMachines)
 
     def addSynchronousMachines(self, *SynchronousMachines):
         for obj in SynchronousMachines:
-            if self not in obj._PrimeMovers:
-                obj._PrimeMovers.append(self)
-            self._SynchronousMachines.append(obj)
+            if obj._PrimeMovers is EMPTY:
+                obj._PrimeMovers = AssociationList([self])
+            else:
+                obj._PrimeMovers.add(self)
+            if self._SynchronousMachines is EMPTY:
+                self._SynchronousMachines = AssociationList([obj])
+            else:
+                self._SynchronousMachines.add(obj)
 
     def removeSynchronousMachines(self, *SynchronousMachines):
         for obj in SynchronousMachines:
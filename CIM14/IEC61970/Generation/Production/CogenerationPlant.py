@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.PowerSystemResource import PowerSystemResource
+from CIM14.Element import AssociationList, EMPTY
 
 class CogenerationPlant(PowerSystemResource):
     """A set of thermal generating units for the production of electrical energy and process steam (usually from the output of the steam turbines). The steam sendout is typically used for industrial purposes or for municipal heating and cooling.
@@ -50,8 +51,9 @@ class CogenerationPlant(PowerSystemResource):
         #: The high pressure steam rating
         self.cogenHPSteamRating = cogenHPSteamRating
 
-        self._ThermalGeneratingUnits = []
-        self.ThermalGeneratingUnits = [] if ThermalGeneratingUnits is None else ThermalGeneratingUnits
+        self._ThermalGeneratingUnits = EMPTY
+        if ThermalGeneratingUnits is not None:
+            self.ThermalGeneratingUnits = ThermalGeneratingUnits
 
         self._SteamSendoutSchedule = None
         self.SteamSendoutSchedule = SteamSendoutSchedule
@@ -71,6 +73,7 @@ class CogenerationPlant(PowerSystemResource):
         return self._ThermalGeneratingUnits
 
     def setThermalGeneratingUnits(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ThermalGeneratingUnits:
             x.CogenerationPlant = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.PowerSystemResource import PowerSystemResource
+from CIM14.Element import AssociationList, EMPTY
 
 class CombinedCyclePlant(PowerSystemResource):
     """A set of combustion turbines and steam turbines where the exhaust heat from the combustion turbines is recovered to make steam for the steam turbines, resulting in greater overall plant efficiency
@@ -33,8 +34,9 @@ class CombinedCyclePlant(PowerSystemResource):
         #: The combined cycle plant's active power output rating
         self.combCyclePlantRating = combCyclePlantRating
 
-        self._ThermalGeneratingUnits = []
-        self.ThermalGeneratingUnits = [] if ThermalGeneratingUnits is None else ThermalGeneratingUnits
+        self._ThermalGeneratingUnits = EMPTY
+        if ThermalGeneratingUnits is not None:
+            self.ThermalGeneratingUnits = ThermalGeneratingUnits
 
         super(CombinedCyclePlant, self).__init__(*args, **kw_args)
 
@@ -51,6 +53,7 @@ class CombinedCyclePlant(PowerSystemResource):
         return self._ThermalGeneratingUnits
 
     def setThermalGeneratingUnits(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ThermalGeneratingUnits:
             x.CombinedCyclePlant = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import AssociationList, EMPTY
 
 class FossilFuel(IdentifiedObject):
     """The fossil fuel consumed by the non-nuclear thermal generating units, e.g., coal, oil, gas
@@ -70,8 +71,9 @@ class FossilFuel(IdentifiedObject):
         #: The active power output level of the unit at which the given type of fuel is switched on. This fuel (e.g., oil) is sometimes used to supplement the base fuel (e.g., coal) at high active power output levels.
         self.highBreakpointP = highBreakpointP
 
-        self._FuelAllocationSchedules = []
-        self.FuelAllocationSchedules = [] if FuelAllocationSchedules is None else FuelAllocationSchedules
+        self._FuelAllocationSchedules = EMPTY
+        if FuelAllocationSchedules is not None:
+            self.FuelAllocationSchedules = FuelAllocationSchedules
 
         self._ThermalGeneratingUnit = None
         self.ThermalGeneratingUnit = ThermalGeneratingUnit
@@ -91,6 +93,7 @@ class FossilFuel(IdentifiedObject):
         return self._FuelAllocationSchedules
 
     def setFuelAllocationSchedules(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._FuelAllocationSchedules:
             x.FossilFuel = None
         for y in value:
@@ -114,13 +117,14 @@ class FossilFuel(IdentifiedObject):
 
     def setThermalGeneratingUnit(self, value):
         if self._ThermalGeneratingUnit is not None:
-            filtered = [x for x in self.ThermalGeneratingUnit.FossilFuels if x != self]
-            self._ThermalGeneratingUnit._FossilFuels = filtered
+            self._ThermalGeneratingUnit._FossilFuels.discard(self)
 
         self._ThermalGeneratingUnit = value
         if self._ThermalGeneratingUnit is not None:
-            if self not in self._ThermalGeneratingUnit._FossilFuels:
-                self._ThermalGeneratingUnit._FossilFuels.append(self)
+            if self._ThermalGeneratingUnit._FossilFuels is EMPTY:
+                self._ThermalGeneratingUnit._FossilFuels = AssociationList([self])
+            else:
+                self._ThermalGeneratingUnit._FossilFuels.add(self)
 
     ThermalGeneratingUnit = property(getThermalGeneratingUnit, setThermalGeneratingUnit)
 
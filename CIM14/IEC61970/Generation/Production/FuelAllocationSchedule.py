@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.Curve import Curve
+from CIM14.Element import AssociationList, EMPTY
 
 class FuelAllocationSchedule(Curve):
     """The amount of fuel of a given type which is allocated for consumption over a specified period of time
@@ -72,13 +73,14 @@ class FuelAllocationSchedule(Curve):
 
     def setFossilFuel(self, value):
         if self._FossilFuel is not None:
-            filtered = [x for x in self.FossilFuel.FuelAllocationSchedules if x != self]
-            self._FossilFuel._FuelAllocationSchedules = filtered
+            self._FossilFuel._FuelAllocationSchedules.discard(self)
 
         self._FossilFuel = value
         if self._FossilFuel is not None:
-            if self not in self._FossilFuel._FuelAllocationSchedules:
-                self._FossilFuel._FuelAllocationSchedules.append(self)
+            if self._FossilFuel._FuelAllocationSchedules is EMPTY:
+                self._FossilFuel._FuelAllocationSchedules = AssociationList([self])
+            else:
+                self._FossilFuel._FuelAllocationSchedules.add(self)
 
     FossilFuel = property(getFossilFuel, setFossilFuel)
 
@@ -89,13 +91,14 @@ class FuelAllocationSchedule(Curve):
 
     def setThermalGeneratingUnit(self, value):
         if self._ThermalGeneratingUnit is not None:
-            filtered = [x for x in self.ThermalGeneratingUnit.FuelAllocationSchedules if x != self]
-            self._ThermalGeneratingUnit._FuelAllocationSchedules = filtered
+            self._ThermalGeneratingUnit._FuelAllocationSchedules.discard(self)
 
         self._ThermalGeneratingUnit = value
         if self._ThermalGeneratingUnit is not None:
-            if self not in self._ThermalGeneratingUnit._FuelAllocationSchedules:
-                self._ThermalGeneratingUnit._FuelAllocationSchedules.append(self)
+            if self._ThermalGeneratingUnit._FuelAllocationSchedules is EMPTY:
+                self._ThermalGeneratingUnit._FuelAllocationSchedules = AssociationList([self])
+            else:
+                self._ThermalGeneratingUnit._FuelAllocationSchedules.add(self)
 
     ThermalGeneratingUnit = property(getThermalGeneratingUnit, setThermalGeneratingUnit)
 
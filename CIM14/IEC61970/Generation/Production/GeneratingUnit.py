@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.Equipment import Equipment
+from CIM14.Element import AssociationList, EMPTY
 
 class GeneratingUnit(Equipment):
     """A single or set of synchronous machines for converting mechanical power into alternating-current power. For example, individual machines within a set may be defined for scheduling purposes while a single control signal is derived for the set. In this case there would be a GeneratingUnit for each member of the set and an additional GeneratingUnit corresponding to the set.
@@ -205,20 +206,24 @@ class GeneratingUnit(Equipment):
         #: Pulse high limit which is the largest control pulse that the unit can respond to
         self.controlPulseHigh = controlPulseHigh
 
-        self._SynchronousMachines = []
-        self.SynchronousMachines = [] if SynchronousMachines is None else SynchronousMachines
+        self._SynchronousMachines = EMPTY
+        if SynchronousMachines is not None:
+            self.SynchronousMachines = SynchronousMachines
 
-        self._GrossToNetActivePowerCurves = []
-        self.GrossToNetActivePowerCurves = [] if GrossToNetActivePowerCurves is None else GrossToNetActivePowerCurves
+        self._GrossToNetActivePowerCurves = EMPTY
+        if GrossToNetActivePowerCurves is not None:
+            self.GrossToNetActivePowerCurves = GrossToNetActivePowerCurves
 
-        self._GenUnitOpCostCurves = []
-        self.GenUnitOpCostCurves = [] if GenUnitOpCostCurves is None else GenUnitOpCostCurves
+        self._GenUnitOpCostCurves = EMPTY
+        if GenUnitOpCostCurves is not None:
+            self.GenUnitOpCostCurves = GenUnitOpCostCurves
 
         self._GenUnitOpSchedule = None
         self.GenUnitOpSchedule = GenUnitOpSchedule
 
-        self._ControlAreaGeneratingUnit = []
-        self.ControlAreaGeneratingUnit = [] if ControlAreaGeneratingUnit is None else ControlAreaGeneratingUnit
+        self._ControlAreaGeneratingUnit = EMPTY
+        if ControlAreaGeneratingUnit is not None:
+            self.ControlAreaGeneratingUnit = ControlAreaGeneratingUnit
 
         super(GeneratingUnit, self).__init__(*args, **kw_args)
 
@@ -235,6 +240,7 @@ class GeneratingUnit(Equipment):
         return self._SynchronousMachines
 
     def setSynchronousMachines(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._SynchronousMachines:
             x.GeneratingUnit = None
         for y in value:
@@ -257,6 +263,7 @@ class GeneratingUnit(Equipment):
         return self._GrossToNetActivePowerCurves
 
     def setGrossToNetActivePowerCurves(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._GrossToNetActivePowerCurves:
             x.GeneratingUnit = None
         for y in value:
@@ -279,6 +286,7 @@ class GeneratingUnit(Equipment):
         return self._GenUnitOpCostCurves
 
     def setGenUnitOpCostCurves(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._GenUnitOpCostCurves:
             x.GeneratingUnit = None
         for y in value:
@@ -317,6 +325,7 @@ class GeneratingUnit(Equipment):
         return self._ControlAreaGeneratingUnit
 
     def setControlAreaGeneratingUnit(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ControlAreaGeneratingUnit:
             x.GeneratingUnit = None
         for y in value:
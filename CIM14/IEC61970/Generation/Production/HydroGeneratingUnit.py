@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Generation.Production.GeneratingUnit import GeneratingUnit
+from CIM14.Element import AssociationList, EMPTY
 
 class HydroGeneratingUnit(GeneratingUnit):
     """A generating unit whose prime mover is a hydraulic turbine (e.g., Francis, Pelton, Kaplan)
@@ -46,11 +47,13 @@ class HydroGeneratingUnit(GeneratingUnit):
         self._PenstockLossCurve = None
         self.PenstockLossCurve = PenstockLossCurve
 
-        self._HydroGeneratingEfficiencyCurves = []
-        self.HydroGeneratingEfficiencyCurves = [] if HydroGeneratingEfficiencyCurves is None else HydroGeneratingEfficiencyCurves
+        self._HydroGeneratingEfficiencyCurves = EMPTY
+        if HydroGeneratingEfficiencyCurves is not None:
+            self.HydroGeneratingEfficiencyCurves = HydroGeneratingEfficiencyCurves
 
-        self._TailbayLossCurve = []
-        self.TailbayLossCurve = [] if TailbayLossCurve is None else TailbayLossCurve
+        self._TailbayLossCurve = EMPTY
+        if TailbayLossCurve is not None:
+            self.TailbayLossCurve = TailbayLossCurve
 
         super(HydroGeneratingUnit, self).__init__(*args, **kw_args)
 
@@ -68,13 +71,14 @@ class HydroGeneratingUnit(GeneratingUnit):
 
     def setHydroPowerPlant(self, value):
         if self._HydroPowerPlant is not None:
-            filtered = [x for x in self.HydroPowerPlant.HydroGeneratingUnits if x != self]
-            self._HydroPowerPlant._HydroGeneratingUnits = filtered
+            self._HydroPowerPlant._HydroGeneratingUnits.discard(self)
 
         self._HydroPowerPlant = value
         if self._HydroPowerPlant is not None:
-            if self not in self._HydroPowerPlant._HydroGeneratingUnits:
-                self._HydroPowerPlant._HydroGeneratingUnits.append(self)
+            if self._HydroPowerPlant._HydroGeneratingUnits is EMPTY:
+                self._HydroPowerPlant._HydroGeneratingUnits = AssociationList([self])
+            else:
+                self._HydroPowerPlant._HydroGeneratingUnits.add(self)
 
     HydroPowerPlant = property(getHydroPowerPlant, setHydroPowerPlant)
 
@@ -100,6 +104,7 @@ class HydroGeneratingUnit(GeneratingUnit):
         return self._HydroGeneratingEfficiencyCurves
 
     def setHydroGeneratingEfficiencyCurves(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._HydroGeneratingEfficiencyCurves:
             x.HydroGeneratingUnit = None
         for y in value:
@@ -122,6 +127,7 @@ class HydroGeneratingUnit(GeneratingUnit):
         return self._TailbayLossCurve
 
     def setTailbayLossCurve(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._TailbayLossCurve:
             x.HydroGeneratingUnit = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.PowerSystemResource import PowerSystemResource
+from CIM14.Element import AssociationList, EMPTY
 
 class HydroPowerPlant(PowerSystemResource):
     """A hydro power station which can generate or pump. When generating, the generator turbines receive there water from an upper reservoir. When pumping, the pumps receive their water from a lower reservoir.
@@ -68,11 +69,13 @@ class HydroPowerPlant(PowerSystemResource):
         #: The hydro plant's generating rating active power for rated head conditions
         self.genRatedP = genRatedP
 
-        self._HydroGeneratingUnits = []
-        self.HydroGeneratingUnits = [] if HydroGeneratingUnits is None else HydroGeneratingUnits
+        self._HydroGeneratingUnits = EMPTY
+        if HydroGeneratingUnits is not None:
+            self.HydroGeneratingUnits = HydroGeneratingUnits
 
-        self._HydroPumps = []
-        self.HydroPumps = [] if HydroPumps is None else HydroPumps
+        self._HydroPumps = EMPTY
+        if HydroPumps is not None:
+            self.HydroPumps = HydroPumps
 
         self._Reservoir = None
         self.Reservoir = Reservoir
@@ -95,6 +98,7 @@ class HydroPowerPlant(PowerSystemResource):
         return self._HydroGeneratingUnits
 
     def setHydroGeneratingUnits(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._HydroGeneratingUnits:
             x.HydroPowerPlant = None
         for y in value:
@@ -117,6 +121,7 @@ class HydroPowerPlant(PowerSystemResource):
         return self._HydroPumps
 
     def setHydroPumps(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._HydroPumps:
             x.HydroPowerPlant = None
         for y in value:
@@ -140,13 +145,14 @@ class HydroPowerPlant(PowerSystemResource):
 
     def setReservoir(self, value):
         if self._Reservoir is not None:
-            filtered = [x for x in self.Reservoir.HydroPowerPlants if x != self]
-            self._Reservoir._HydroPowerPlants = filtered
+            self._Reservoir._HydroPowerPlants.discard(self)
 
         self._Reservoir = value
         if self._Reservoir is not None:
-            if self not in self._Reservoir._HydroPowerPlants:
-                self._Reservoir._HydroPowerPlants.append(self)
+            if self._Reservoir._HydroPowerPlants is EMPTY:
+                self._Reservoir._HydroPowerPlants = AssociationList([self])
+            else:
+                self._Reservoir._HydroPowerPlants.add(self)
 
     Reservoir = property(getReservoir, setReservoir)
 
@@ -157,13 +163,14 @@ class HydroPowerPlant(PowerSystemResource):
 
     def setGenSourcePumpDischargeReservoir(self, value):
         if self._GenSourcePumpDischargeReservoir is not None:
-            filtered = [x for x in self.GenSourcePumpDischargeReservoir.UpstreamFromHydroPowerPlants if x != self]
-            self._GenSourcePumpDischargeReservoir._UpstreamFromHydroPowerPlants = filtered
+            self._GenSourcePumpDischargeReservoir._UpstreamFromHydroPowerPlants.discard(self)
 
         self._GenSourcePumpDischargeReservoir = value
         if self._GenSourcePumpDischargeReservoir is not None:
-            if self not in self._GenSourcePumpDischargeReservoir._UpstreamFromHydroPowerPlants:
-                self._GenSourcePumpDischargeReservoir._UpstreamFromHydroPowerPlants.append(self)
+            if self._GenSourcePumpDischargeReservoir._UpstreamFromHydroPowerPlants is EMPTY:
+                self._GenSourcePumpDischargeReservoir._UpstreamFromHydroPowerPlants = AssociationList([self])
+            else:
+                self._GenSourcePumpDischargeReservoir._UpstreamFromHydroPowerPlants.add(self)
 
     GenSourcePumpDischargeReservoir = property(getGenSourcePumpDischargeReservoir, setGenSourcePumpDischargeReservoir)
 
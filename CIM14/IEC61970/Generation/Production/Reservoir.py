@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.PowerSystemResource import PowerSystemResource
+from CIM14.Element import AssociationList, EMPTY
 
 class Reservoir(PowerSystemResource):
     """A water storage facility within a hydro system, including: ponds, lakes, lagoons, and rivers. The storage is usually behind some type of dam.
@@ -79,26 +80,31 @@ class Reservoir(PowerSystemResource):
         #: Storage volume between the full supply level and the normal minimum operating level
         self.activeStorageCapacity = activeStorageCapacity
 
-        self._LevelVsVolumeCurves = []
-        self.LevelVsVolumeCurves = [] if LevelVsVolumeCurves is None else LevelVsVolumeCurves
+        self._LevelVsVolumeCurves = EMPTY
+        if LevelVsVolumeCurves is not None:
+            self.LevelVsVolumeCurves = LevelVsVolumeCurves
 
-        self._InflowForecasts = []
-        self.InflowForecasts = [] if InflowForecasts is None else InflowForecasts
+        self._InflowForecasts = EMPTY
+        if InflowForecasts is not None:
+            self.InflowForecasts = InflowForecasts
 
         self._TargetLevelSchedule = None
         self.TargetLevelSchedule = TargetLevelSchedule
 
-        self._HydroPowerPlants = []
-        self.HydroPowerPlants = [] if HydroPowerPlants is None else HydroPowerPlants
+        self._HydroPowerPlants = EMPTY
+        if HydroPowerPlants is not None:
+            self.HydroPowerPlants = HydroPowerPlants
 
-        self._UpstreamFromHydroPowerPlants = []
-        self.UpstreamFromHydroPowerPlants = [] if UpstreamFromHydroPowerPlants is None else UpstreamFromHydroPowerPlants
+        self._UpstreamFromHydroPowerPlants = EMPTY
+        if UpstreamFromHydroPowerPlants is not None:
+            self.UpstreamFromHydroPowerPlants = UpstreamFromHydroPowerPlants
 
         self._SpillsFromReservoir = None
         self.SpillsFromReservoir = SpillsFromReservoir
 
-        self._SpillsIntoReservoirs = []
-        self.SpillsIntoReservoirs = [] if SpillsIntoReservoirs is None else SpillsIntoReservoirs
+        self._SpillsIntoReservoirs = EMPTY
+        if SpillsIntoReservoirs is not None:
+            self.SpillsIntoReservoirs = SpillsIntoReservoirs
 
         super(Reservoir, self).__init__(*args, **kw_args)
 
@@ -115,6 +121,7 @@ class Reservoir(PowerSystemResource):
         return self._LevelVsVolumeCurves
 
     def setLevelVsVolumeCurves(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._LevelVsVolumeCurves:
             x.Reservoir = None
         for y in value:
@@ -137,6 +144,7 @@ class Reservoir(PowerSystemResource):
         return self._InflowForecasts
 
     def setInflowForecasts(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._InflowForecasts:
             x.Reservoir = None
         for y in value:
@@ -175,6 +183,7 @@ class Reservoir(PowerSystemResource):
         return self._HydroPowerPlants
 
     def setHydroPowerPlants(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._HydroPowerPlants:
             x.Reservoir = None
         for y in value:
@@ -197,6 +206,7 @@ class Reservoir(PowerSystemResource):
         return self._UpstreamFromHydroPowerPlants
 
     def setUpstreamFromHydroPowerPlants(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._UpstreamFromHydroPowerPlants:
             x.GenSourcePumpDischargeReservoir = None
         for y in value:
@@ -220,13 +230,14 @@ class Reservoir(PowerSystemResource):
 
     def setSpillsFromReservoir(self, value):
         if self._SpillsFromReservoir is not None:
-            filtered = [x for x in self.SpillsFromReservoir.SpillsIntoReservoirs if x != self]
-            self._SpillsFromReservoir._SpillsIntoReservoirs = filtered
+            self._SpillsFromReservoir._SpillsIntoReservoirs.discard(self)
 
         self._SpillsFromReservoir = value
         if self._SpillsFromReservoir is not None:
-            if self not in self._SpillsFromReservoir._SpillsIntoReservoirs:
-                self._SpillsFromReservoir._SpillsIntoReservoirs.append(self)
+            if self._SpillsFromReservoir._SpillsIntoReservoirs is EMPTY:
+                self._SpillsFromReservoir._SpillsIntoReservoirs = AssociationList([self])
+            else:
+                self._SpillsFromReservoir._SpillsIntoReservoirs.add(self)
 
     SpillsFromReservoir = property(getSpillsFromReservoir, setSpillsFromReservoir)
 
@@ -236,6 +247,7 @@ class Reservoir(PowerSystemResource):
         return self._SpillsIntoReservoirs
 
     def setSpillsIntoReservoirs(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._SpillsIntoReservoirs:
             x.SpillsFromReservoir = None
         for y in value:
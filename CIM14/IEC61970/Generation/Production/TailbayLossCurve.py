@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.Curve import Curve
+from CIM14.Element import AssociationList, EMPTY
 
 class TailbayLossCurve(Curve):
     """Relationship between tailbay head loss hight (y-axis) and the total discharge into the power station's tailbay volume per time unit (x-axis) . There could be more than one curve depending on the level of the tailbay reservoir or river level
@@ -48,13 +49,14 @@ class TailbayLossCurve(Curve):
 
     def setHydroGeneratingUnit(self, value):
         if self._HydroGeneratingUnit is not None:
-            filtered = [x for x in self.HydroGeneratingUnit.TailbayLossCurve if x != self]
-            self._HydroGeneratingUnit._TailbayLossCurve = filtered
+            self._HydroGeneratingUnit._TailbayLossCurve.discard(self)
 
         self._HydroGeneratingUnit = value
         if self._HydroGeneratingUnit is not None:
-            if self not in self._HydroGeneratingUnit._TailbayLossCurve:
-                self._HydroGeneratingUnit._TailbayLossCurve.append(self)
+            if self._HydroGeneratingUnit._TailbayLossCurve is EMPTY:
+                self._HydroGeneratingUnit._TailbayLossCurve = AssociationList([self])
+            else:
+                self._HydroGeneratingUnit._TailbayLossCurve.add(self)
 
     HydroGeneratingUnit = property(getHydroGeneratingUnit, setHydroGeneratingUnit)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Generation.Production.GeneratingUnit import GeneratingUnit
+from CIM14.Element import AssociationList, EMPTY
 
 class ThermalGeneratingUnit(GeneratingUnit):
     """A generating unit whose prime mover could be a steam turbine, combustion turbine, or diesel engine.
@@ -47,8 +48,9 @@ class ThermalGeneratingUnit(GeneratingUnit):
         self._StartupModel = None
         self.StartupModel = StartupModel
 
-        self._EmmissionAccounts = []
-        self.EmmissionAccounts = [] if EmmissionAccounts is None else EmmissionAccounts
+        self._EmmissionAccounts = EMPTY
+        if EmmissionAccounts is not None:
+            self.EmmissionAccounts = EmmissionAccounts
 
         self._CombinedCyclePlant = None
         self.CombinedCyclePlant = CombinedCyclePlant
@@ -56,8 +58,9 @@ class ThermalGeneratingUnit(GeneratingUnit):
         self._CogenerationPlant = None
         self.CogenerationPlant = CogenerationPlant
 
-        self._EmissionCurves = []
-        self.EmissionCurves = [] if EmissionCurves is None else EmissionCurves
+        self._EmissionCurves = EMPTY
+        if EmissionCurves is not None:
+            self.EmissionCurves = EmissionCurves
 
         self._HeatRateCurve = None
         self.HeatRateCurve = HeatRateCurve
@@ -68,11 +71,13 @@ class ThermalGeneratingUnit(GeneratingUnit):
         self._IncrementalHeatRateCurve = None
         self.IncrementalHeatRateCurve = IncrementalHeatRateCurve
 
-        self._FuelAllocationSchedules = []
-        self.FuelAllocationSchedules = [] if FuelAllocationSchedules is None else FuelAllocationSchedules
+        self._FuelAllocationSchedules = EMPTY
+        if FuelAllocationSchedules is not None:
+            self.FuelAllocationSchedules = FuelAllocationSchedules
 
-        self._FossilFuels = []
-        self.FossilFuels = [] if FossilFuels is None else FossilFuels
+        self._FossilFuels = EMPTY
+        if FossilFuels is not None:
+            self.FossilFuels = FossilFuels
 
         self._HeatInputCurve = None
         self.HeatInputCurve = HeatInputCurve
@@ -111,6 +116,7 @@ class ThermalGeneratingUnit(GeneratingUnit):
         return self._EmmissionAccounts
 
     def setEmmissionAccounts(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._EmmissionAccounts:
             x.ThermalGeneratingUnit = None
         for y in value:
@@ -134,13 +140,14 @@ class ThermalGeneratingUnit(GeneratingUnit):
 
     def setCombinedCyclePlant(self, value):
         if self._CombinedCyclePlant is not None:
-            filtered = [x for x in self.CombinedCyclePlant.ThermalGeneratingUnits if x != self]
-            self._CombinedCyclePlant._ThermalGeneratingUnits = filtered
+            self._CombinedCyclePlant._ThermalGeneratingUnits.discard(self)
 
         self._CombinedCyclePlant = value
         if self._CombinedCyclePlant is not None:
-            if self not in self._CombinedCyclePlant._ThermalGeneratingUnits:
-                self._CombinedCyclePlant._ThermalGeneratingUnits.append(self)
+            if self._CombinedCyclePlant._ThermalGeneratingUnits is EMPTY:
+                self._CombinedCyclePlant._ThermalGeneratingUnits = AssociationList([self])
+            else:
+                self._CombinedCyclePlant._ThermalGeneratingUnits.add(self)
 
     CombinedCyclePlant = property(getCombinedCyclePlant, setCombinedCyclePlant)
 
@@ -151,13 +158,14 @@ class ThermalGeneratingUnit(GeneratingUnit):
 
     def setCogenerationPlant(self, value):
         if self._CogenerationPlant is not None:
-            filtered = [x for x in self.CogenerationPlant.ThermalGeneratingUnits if x != self]
-            self._CogenerationPlant._ThermalGeneratingUnits = filtered
+            self._CogenerationPlant._ThermalGeneratingUnits.discard(self)
 
         self._CogenerationPlant = value
         if self._CogenerationPlant is not None:
-            if self not in self._CogenerationPlant._ThermalGeneratingUnits:
-                self._CogenerationPlant._ThermalGeneratingUnits.append(self)
+            if self._CogenerationPlant._ThermalGeneratingUnits is EMPTY:
+                self._CogenerationPlant._ThermalGeneratingUnits = AssociationList([self])
+            else:
+                self._CogenerationPlant._ThermalGeneratingUnits.add(self)
 
     CogenerationPlant = property(getCogenerationPlant, setCogenerationPlant)
 
@@ -167,6 +175,7 @@ class ThermalGeneratingUnit(GeneratingUnit):
         return self._EmissionCurves
 
     def setEmissionCurves(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._EmissionCurves:
             x.ThermalGeneratingUnit = None
         for y in value:
@@ -237,6 +246,7 @@ class ThermalGeneratingUnit(GeneratingUnit):
         return self._FuelAllocationSchedules
 
     def setFuelAllocationSchedules(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._FuelAllocationSchedules:
             x.ThermalGeneratingUnit = None
         for y in value:
@@ -259,6 +269,7 @@ class ThermalGeneratingUnit(GeneratingUnit):
         return self._FossilFuels
 
     def setFossilFuels(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._FossilFuels:
             x.ThermalGeneratingUnit = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import AssociationList, EMPTY
 
 class ModelingAuthority(IdentifiedObject):
     """A Modeling Authority is an entity responsible for supplying and maintaining the data defining a specific set of objects in a network model.
@@ -29,8 +30,9 @@ class ModelingAuthority(IdentifiedObject):
 
         @param ModelingAuthoritySets: A Modeling Authority set supplies and maintains the data for the objects in a Modeling Authority Set.
         """
-        self._ModelingAuthoritySets = []
-        self.ModelingAuthoritySets = [] if ModelingAuthoritySets is None else ModelingAuthoritySets
+        self._ModelingAuthoritySets = EMPTY
+        if ModelingAuthoritySets is not None:
+            self.ModelingAuthoritySets = ModelingAuthoritySets
 
         super(ModelingAuthority, self).__init__(*args, **kw_args)
 
@@ -47,6 +49,7 @@ class ModelingAuthority(IdentifiedObject):
         return self._ModelingAuthoritySets
 
     def setModelingAuthoritySets(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ModelingAuthoritySets:
             x.ModelingAuthority = None
         for y in value:
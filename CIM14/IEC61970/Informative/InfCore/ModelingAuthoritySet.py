@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import AssociationList, EMPTY
 
 class ModelingAuthoritySet(IdentifiedObject):
     """A Modeling Authority Set is a group of objects in a network model where the data is supplied and maintained by the same Modeling Authority.
@@ -33,8 +34,9 @@ class ModelingAuthoritySet(IdentifiedObject):
         self._ModelingAuthority = None
         self.ModelingAuthority = ModelingAuthority
 
-        self._IdentifiedObjects = []
-        self.IdentifiedObjects = [] if IdentifiedObjects is None else IdentifiedObjects
+        self._IdentifiedObjects = EMPTY
+        if IdentifiedObjects is not None:
+            self.IdentifiedObjects = IdentifiedObjects
 
         super(ModelingAuthoritySet, self).__init__(*args, **kw_args)
 
@@ -52,13 +54,14 @@ class ModelingAuthoritySet(IdentifiedObject):
 
     def setModelingAuthority(self, value):
         if self._ModelingAuthority is not None:
-            filtered = [x for x in self.ModelingAuthority.ModelingAuthoritySets if x != self]
-            self._ModelingAuthority._ModelingAuthoritySets = filtered
+            self._ModelingAuthority._ModelingAuthoritySets.discard(self)
 
         self._ModelingAuthority = value
         if self._ModelingAuthority is not None:
-            if self not in self._ModelingAuthority._ModelingAuthoritySets:
-                self._ModelingAuthority._ModelingAuthoritySets.append(self)
+            if self._ModelingAuthority._ModelingAuthoritySets is EMPTY:
+                self._ModelingAuthority._ModelingAuthoritySets = AssociationList([self])
+            else:
+                self._ModelingAuthority._ModelingAuthoritySets.add(self)
 
     ModelingAuthority = property(getModelingAuthority, setModelingAuthority)
 
@@ -68,6 +71,7 @@ class ModelingAuthoritySet(IdentifiedObject):
         return self._IdentifiedObjects
 
     def setIdentifiedObjects(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._IdentifiedObjects:
             x.ModelingAuthoritySet = None
         for y in value:
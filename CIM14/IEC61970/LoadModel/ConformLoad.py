@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Wires.EnergyConsumer import EnergyConsumer
+from CIM14.Element import AssociationList, EMPTY
 
 class ConformLoad(EnergyConsumer):
     """ConformLoad represent loads that follow a daily load change pattern where the pattern can be used to scale the load with a system load.
@@ -48,13 +49,14 @@ class ConformLoad(EnergyConsumer):
 
     def setLoadGroup(self, value):
         if self._LoadGroup is not None:
-            filtered = [x for x in self.LoadGroup.EnergyConsumers if x != self]
-            self._LoadGroup._EnergyConsumers = filtered
+            self._LoadGroup._EnergyConsumers.discard(self)
 
         self._LoadGroup = value
         if self._LoadGroup is not None:
-            if self not in self._LoadGroup._EnergyConsumers:
-                self._LoadGroup._EnergyConsumers.append(self)
+            if self._LoadGroup._EnergyConsumers is EMPTY:
+                self._LoadGroup._EnergyConsumers = AssociationList([self])
+            else:
+                self._LoadGroup._EnergyConsumers.add(self)
 
     LoadGroup = property(getLoadGroup, setLoadGroup)
 
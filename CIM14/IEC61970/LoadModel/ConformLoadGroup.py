@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.LoadModel.LoadGroup import LoadGroup
+from CIM14.Element import AssociationList, EMPTY
 
 class ConformLoadGroup(LoadGroup):
     """A group of loads conforming to an allocation pattern.
@@ -30,11 +31,13 @@ class ConformLoadGroup(LoadGroup):
         @param ConformLoadSchedules: The ConformLoadSchedules in the ConformLoadGroup.
         @param EnergyConsumers: Conform loads assigned to this ConformLoadGroup.
         """
-        self._ConformLoadSchedules = []
-        self.ConformLoadSchedules = [] if ConformLoadSchedules is None else ConformLoadSchedules
+        self._ConformLoadSchedules = EMPTY
+        if ConformLoadSchedules is not None:
+            self.ConformLoadSchedules = ConformLoadSchedules
 
-        self._EnergyConsumers = []
-        self.EnergyConsumers = [] if EnergyConsumers is None else EnergyConsumers
+        self._EnergyConsumers = EMPTY
+        if EnergyConsumers is not None:
+            self.EnergyConsumers = EnergyConsumers
 
         super(ConformLoadGroup, self).__init__(*args, **kw_args)
 
@@ -51,6 +54,7 @@ class ConformLoadGroup(LoadGroup):
         return self._ConformLoadSchedules
 
     def setConformLoadSchedules(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ConformLoadSchedules:
             x.ConformLoadGroup = None
         for y in value:
@@ -73,6 +77,7 @@ class ConformLoadGroup(LoadGroup):
         return self._EnergyConsumers
 
     def setEnergyConsumers(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._EnergyConsumers:
             x.LoadGroup = None
         for y in value:
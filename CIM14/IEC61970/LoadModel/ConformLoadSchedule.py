@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.LoadModel.SeasonDayTypeSchedule import SeasonDayTypeSchedule
+from CIM14.Element import AssociationList, EMPTY
 
 class ConformLoadSchedule(SeasonDayTypeSchedule):
     """A curve of load  versus time (X-axis) showing the active power values (Y1-axis) and reactive power (Y2-axis) for each unit of the period covered. This curve represents a typical pattern of load over the time period for a given day type and season.
@@ -48,13 +49,14 @@ class ConformLoadSchedule(SeasonDayTypeSchedule):
 
     def setConformLoadGroup(self, value):
         if self._ConformLoadGroup is not None:
-            filtered = [x for x in self.ConformLoadGroup.ConformLoadSchedules if x != self]
-            self._ConformLoadGroup._ConformLoadSchedules = filtered
+            self._ConformLoadGroup._ConformLoadSchedules.discard(self)
 
         self._ConformLoadGroup = value
         if self._ConformLoadGroup is not None:
-            if self not in self._ConformLoadGroup._ConformLoadSchedules:
-                self._ConformLoadGroup._ConformLoadSchedules.append(self)
+            if self._ConformLoadGroup._ConformLoadSchedules is EMPTY:
+                self._ConformLoadGroup._ConformLoadSchedules = AssociationList([self])
+            else:
+                self._ConformLoadGroup._ConformLoadSchedules.add(self)
 
     ConformLoadGroup = property(getConformLoadGroup, setConformLoadGroup)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.LoadModel.EnergyArea import EnergyArea
+from CIM14.Element import AssociationList, EMPTY
 
 class LoadArea(EnergyArea):
     """The class is the root or first level in a hierarchical structure for grouping of loads for the purpose of load flow load scaling.
@@ -29,8 +30,9 @@ class LoadArea(EnergyArea):
 
         @param SubLoadAreas: The SubLoadAreas in the LoadArea.
         """
-        self._SubLoadAreas = []
-        self.SubLoadAreas = [] if SubLoadAreas is None else SubLoadAreas
+        self._SubLoadAreas = EMPTY
+        if SubLoadAreas is not None:
+            self.SubLoadAreas = SubLoadAreas
 
         super(LoadArea, self).__init__(*args, **kw_args)
 
@@ -47,6 +49,7 @@ class LoadArea(EnergyArea):
         return self._SubLoadAreas
 
     def setSubLoadAreas(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._SubLoadAreas:
             x.LoadArea = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.LoadModel.EnergyArea import EnergyArea
+from CIM14.Element import AssociationList, EMPTY
 
 class SubLoadArea(EnergyArea):
     """The class is the second level in a hierarchical structure for grouping of loads for the purpose of load flow load scaling.
@@ -30,8 +31,9 @@ class SubLoadArea(EnergyArea):
         @param LoadGroups: The Loadgroups in the SubLoadArea.
         @param LoadArea: The LoadArea where the SubLoadArea belongs.
         """
-        self._LoadGroups = []
-        self.LoadGroups = [] if LoadGroups is None else LoadGroups
+        self._LoadGroups = EMPTY
+        if LoadGroups is not None:
+            self.LoadGroups = LoadGroups
 
         self._LoadArea = None
         self.LoadArea = LoadArea
@@ -51,6 +53,7 @@ class SubLoadArea(EnergyArea):
         return self._LoadGroups
 
     def setLoadGroups(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._LoadGroups:
             x.SubLoadArea = None
         for y in value:
@@ -74,13 +77,14 @@ class SubLoadArea(EnergyArea):
 
     def setLoadArea(self, value):
         if self._LoadArea is not None:
-            filtered = [x for x in self.LoadArea.SubLoadAreas if x != self]
-            self._LoadArea._SubLoadAreas = filtered
+            self._LoadArea._SubLoadAreas.discard(self)
 
         self._LoadArea = value
         if self._LoadArea is not None:
-            if self not in self._LoadArea._SubLoadAreas:
-                self._LoadArea._SubLoadAreas.append(self)
+            if self._LoadArea._SubLoadAreas is EMPTY:
+                self._LoadArea._SubLoadAreas = AssociationList([self])
+            else:
+                self._LoadArea._SubLoadAreas.add(self)
 
     LoadArea = property(getLoadArea, setLoadArea)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Meas.Measurement import Measurement
+from CIM14.Element import AssociationList, EMPTY
 
 class Accumulator(Measurement):
     """Accumulator represents a accumulated (counted) Measurement, e.g. an energy value.
@@ -34,11 +35,13 @@ class Accumulator(Measurement):
         #: Normal value range maximum for any of the MeasurementValue.values. Used for scaling, e.g. in bar graphs or of telemetered raw values.
         self.maxValue = maxValue
 
-        self._LimitSets = []
-        self.LimitSets = [] if LimitSets is None else LimitSets
+        self._LimitSets = EMPTY
+        if LimitSets is not None:
+            self.LimitSets = LimitSets
 
-        self._AccumulatorValues = []
-        self.AccumulatorValues = [] if AccumulatorValues is None else AccumulatorValues
+        self._AccumulatorValues = EMPTY
+        if AccumulatorValues is not None:
+            self.AccumulatorValues = AccumulatorValues
 
         super(Accumulator, self).__init__(*args, **kw_args)
 
@@ -55,21 +58,28 @@ class Accumulator(Measurement):
         return self._LimitSets
 
     def setLimitSets(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._LimitSets:
-            filtered = [q for q in p.Measurements if q != self]
-            self._LimitSets._Measurements = filtered
+            p._Measurements.discard(self)
         for r in value:
-            if self not in r._Measurements:
-                r._Measurements.append(self)
+            if r._Measurements is EMPTY:
+                r._Measurements = AssociationList([self])
+            else:
+                r._Measurements.add(self)
         self._LimitSets = value
 
     LimitSets = property(getLimitSets, setLimitSets)
 
     def addLimitSets(self, *LimitSets):
         for obj in LimitSets:
-            if self not in obj._Measurements:
-                obj._Measurements.append(self)
-            self._LimitSets.append(obj)
+            if obj._Measurements is EMPTY:
+                obj._Measurements = AssociationList([self])
+            else:
+                obj._Measurements.add(self)
+            if self._LimitSets is EMPTY:
+                self._LimitSets = AssociationList([obj])
+            else:
+                self._LimitSets.add(obj)
 
     def removeLimitSets(self, *LimitSets):
         for obj in LimitSets:
@@ -83,6 +93,7 @@ class Accumulator(Measurement):
         return self._AccumulatorValues
 
     def setAccumulatorValues(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._AccumulatorValues:
             x.Accumulator = None
         for y in value:
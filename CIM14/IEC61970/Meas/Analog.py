@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Meas.Measurement import Measurement
+from CIM14.Element import AssociationList, EMPTY
 
 class Analog(Measurement):
     """Analog represents an analog Measurement.
@@ -47,14 +48,16 @@ class Analog(Measurement):
         #: Normal measurement value, e.g., used for percentage calculations.
         self.normalValue = normalValue
 
-        self._LimitSets = []
-        self.LimitSets = [] if LimitSets is None else LimitSets
+        self._LimitSets = EMPTY
+        if LimitSets is not None:
+            self.LimitSets = LimitSets
 
         self._SetPoint = None
         self.SetPoint = SetPoint
 
-        self._AnalogValues = []
-        self.AnalogValues = [] if AnalogValues is None else AnalogValues
+        self._AnalogValues = EMPTY
+        if AnalogValues is not None:
+            self.AnalogValues = AnalogValues
 
         super(Analog, self).__init__(*args, **kw_args)
 
@@ -71,21 +74,28 @@ class Analog(Measurement):
         return self._LimitSets
 
     def setLimitSets(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._LimitSets:
-            filtered = [q for q in p.Measurements if q != self]
-            self._LimitSets._Measurements = filtered
+            p._Measurements.discard(self)
         for r in value:
-            if self not in r._Measurements:
-                r._Measurements.append(self)
+            if r._Measurements is EMPTY:
+                r._Measurements = AssociationList([self])
+            else:
+                r._Measurements.add(self)
         self._LimitSets = value
 
     LimitSets = property(getLimitSets, setLimitSets)
 
     def addLimitSets(self, *LimitSets):
         for obj in LimitSets:
-            if self not in obj._Measurements:
-                obj._Measurements.append(self)
-            self._LimitSets.append(obj)
+            if obj._Measurements is EMPTY:
+                obj._Measurements = AssociationList([self])
+            else:
+                obj._Measurements.add(self)
+            if self._LimitSets is EMPTY:
+                self._LimitSets = AssociationList([obj])
+            else:
+                self._LimitSets.add(obj)
 
     def removeLimitSets(self, *LimitSets):
         for obj in LimitSets:
@@ -115,6 +125,7 @@ class Analog(Measurement):
         return self._AnalogValues
 
     def setAnalogValues(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._AnalogValues:
             x.Analog = None
         for y in value:
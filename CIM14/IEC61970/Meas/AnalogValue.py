@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Meas.MeasurementValue import MeasurementValue
+from CIM14.Element import AssociationList, EMPTY
 
 class AnalogValue(MeasurementValue):
     """AnalogValue represents an analog MeasurementValue.
@@ -35,14 +36,16 @@ class AnalogValue(MeasurementValue):
         #: The value to supervise.
         self.value = value
 
-        self._AltTieMeas = []
-        self.AltTieMeas = [] if AltTieMeas is None else AltTieMeas
+        self._AltTieMeas = EMPTY
+        if AltTieMeas is not None:
+            self.AltTieMeas = AltTieMeas
 
         self._Analog = None
         self.Analog = Analog
 
-        self._AltGeneratingUnit = []
-        self.AltGeneratingUnit = [] if AltGeneratingUnit is None else AltGeneratingUnit
+        self._AltGeneratingUnit = EMPTY
+        if AltGeneratingUnit is not None:
+            self.AltGeneratingUnit = AltGeneratingUnit
 
         super(AnalogValue, self).__init__(*args, **kw_args)
 
@@ -59,6 +62,7 @@ class AnalogValue(MeasurementValue):
         return self._AltTieMeas
 
     def setAltTieMeas(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._AltTieMeas:
             x.AnalogValue = None
         for y in value:
@@ -82,13 +86,14 @@ class AnalogValue(MeasurementValue):
 
     def setAnalog(self, value):
         if self._Analog is not None:
-            filtered = [x for x in self.Analog.AnalogValues if x != self]
-            self._Analog._AnalogValues = filtered
+            self._Analog._AnalogValues.discard(self)
 
         self._Analog = value
         if self._Analog is not None:
-            if self not in self._Analog._AnalogValues:
-                self._Analog._AnalogValues.append(self)
+            if self._Analog._AnalogValues is EMPTY:
+                self._Analog._AnalogValues = AssociationList([self])
+            else:
+                self._Analog._AnalogValues.add(self)
 
     Analog = property(getAnalog, setAnalog)
 
@@ -98,6 +103,7 @@ class AnalogValue(MeasurementValue):
         return self._AltGeneratingUnit
 
     def setAltGeneratingUnit(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._AltGeneratingUnit:
             x.AnalogValue = None
         for y in value:
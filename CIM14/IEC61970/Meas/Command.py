@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Meas.Control import Control
+from CIM14.Element import AssociationList, EMPTY
 
 class Command(Control):
     """A Command is a discrete control used for supervisory control.
@@ -60,13 +61,14 @@ class Command(Control):
 
     def setValueAliasSet(self, value):
         if self._ValueAliasSet is not None:
-            filtered = [x for x in self.ValueAliasSet.Commands if x != self]
-            self._ValueAliasSet._Commands = filtered
+            self._ValueAliasSet._Commands.discard(self)
 
         self._ValueAliasSet = value
         if self._ValueAliasSet is not None:
-            if self not in self._ValueAliasSet._Commands:
-                self._ValueAliasSet._Commands.append(self)
+            if self._ValueAliasSet._Commands is EMPTY:
+                self._ValueAliasSet._Commands = AssociationList([self])
+            else:
+                self._ValueAliasSet._Commands.add(self)
 
     ValueAliasSet = property(getValueAliasSet, setValueAliasSet)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import AssociationList, EMPTY
 
 class Control(IdentifiedObject):
     """Control is used for supervisory/device control. It represents control outputs that are used to change the state in a process, e.g. close or open breaker, a set point value or a raise lower command.
@@ -68,13 +69,14 @@ class Control(IdentifiedObject):
 
     def setUnit(self, value):
         if self._Unit is not None:
-            filtered = [x for x in self.Unit.Controls if x != self]
-            self._Unit._Controls = filtered
+            self._Unit._Controls.discard(self)
 
         self._Unit = value
         if self._Unit is not None:
-            if self not in self._Unit._Controls:
-                self._Unit._Controls.append(self)
+            if self._Unit._Controls is EMPTY:
+                self._Unit._Controls = AssociationList([self])
+            else:
+                self._Unit._Controls.add(self)
 
     Unit = property(getUnit, setUnit)
 
@@ -85,13 +87,14 @@ class Control(IdentifiedObject):
 
     def setRegulatingCondEq(self, value):
         if self._RegulatingCondEq is not None:
-            filtered = [x for x in self.RegulatingCondEq.Controls if x != self]
-            self._RegulatingCondEq._Controls = filtered
+            self._RegulatingCondEq._Controls.discard(self)
 
         self._RegulatingCondEq = value
         if self._RegulatingCondEq is not None:
-            if self not in self._RegulatingCondEq._Controls:
-                self._RegulatingCondEq._Controls.append(self)
+            if self._RegulatingCondEq._Controls is EMPTY:
+                self._RegulatingCondEq._Controls = AssociationList([self])
+            else:
+                self._RegulatingCondEq._Controls.add(self)
 
     RegulatingCondEq = property(getRegulatingCondEq, setRegulatingCondEq)
 
@@ -102,13 +105,14 @@ class Control(IdentifiedObject):
 
     def setControlType(self, value):
         if self._ControlType is not None:
-            filtered = [x for x in self.ControlType.Controls if x != self]
-            self._ControlType._Controls = filtered
+            self._ControlType._Controls.discard(self)
 
         self._ControlType = value
         if self._ControlType is not None:
-            if self not in self._ControlType._Controls:
-                self._ControlType._Controls.append(self)
+            if self._ControlType._Controls is EMPTY:
+                self._ControlType._Controls = AssociationList([self])
+            else:
+                self._ControlType._Controls.add(self)
 
     ControlType = property(getControlType, setControlType)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import AssociationList, EMPTY
 
 class ControlType(IdentifiedObject):
     """Specifies the type of Control, e.g. BreakerOn/Off, GeneratorVoltageSetPoint, TieLineFlow etc. The ControlType.name shall be unique among all specified types and describe the type. The ControlType.aliasName is meant to be used for localization.
@@ -29,8 +30,9 @@ class ControlType(IdentifiedObject):
 
         @param Controls: The Controls having the ControlType
         """
-        self._Controls = []
-        self.Controls = [] if Controls is None else Controls
+        self._Controls = EMPTY
+        if Controls is not None:
+            self.Controls = Controls
 
         super(ControlType, self).__init__(*args, **kw_args)
 
@@ -47,6 +49,7 @@ class ControlType(IdentifiedObject):
         return self._Controls
 
     def setControls(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Controls:
             x.ControlType = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Meas.Measurement import Measurement
+from CIM14.Element import AssociationList, EMPTY
 
 class StringMeasurement(Measurement):
     """StringMeasurement represents a measurement with values of type string.
@@ -29,8 +30,9 @@ class StringMeasurement(Measurement):
 
         @param StringMeasurementValues: The values connected to this measurement.
         """
-        self._StringMeasurementValues = []
-        self.StringMeasurementValues = [] if StringMeasurementValues is None else StringMeasurementValues
+        self._StringMeasurementValues = EMPTY
+        if StringMeasurementValues is not None:
+            self.StringMeasurementValues = StringMeasurementValues
 
         super(StringMeasurement, self).__init__(*args, **kw_args)
 
@@ -47,6 +49,7 @@ class StringMeasurement(Measurement):
         return self._StringMeasurementValues
 
     def setStringMeasurementValues(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._StringMeasurementValues:
             x.StringMeasurement = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import AssociationList, EMPTY
 
 class BranchGroup(IdentifiedObject):
     """A group of branch terminals whose directed flow summation is to be monitored. Abranch group need not form a cutset of the network.
@@ -53,8 +54,9 @@ class BranchGroup(IdentifiedObject):
         #: Monitor the reactive power flow.
         self.monitorReactivePower = monitorReactivePower
 
-        self._BranchGroupTerminal = []
-        self.BranchGroupTerminal = [] if BranchGroupTerminal is None else BranchGroupTerminal
+        self._BranchGroupTerminal = EMPTY
+        if BranchGroupTerminal is not None:
+            self.BranchGroupTerminal = BranchGroupTerminal
 
         super(BranchGroup, self).__init__(*args, **kw_args)
 
@@ -71,6 +73,7 @@ class BranchGroup(IdentifiedObject):
         return self._BranchGroupTerminal
 
     def setBranchGroupTerminal(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._BranchGroupTerminal:
             x.BranchGroup = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import AssociationList, EMPTY
 
 class ClearanceTagType(IdentifiedObject):
     """Type of ClearanceTag. Could indicate the type of work to be performed and/or the type of supervisory control.
@@ -29,8 +30,9 @@ class ClearanceTagType(IdentifiedObject):
 
         @param ClearanceTags: The ClearanceTags currently being defined for this type.
         """
-        self._ClearanceTags = []
-        self.ClearanceTags = [] if ClearanceTags is None else ClearanceTags
+        self._ClearanceTags = EMPTY
+        if ClearanceTags is not None:
+            self.ClearanceTags = ClearanceTags
 
         super(ClearanceTagType, self).__init__(*args, **kw_args)
 
@@ -47,6 +49,7 @@ class ClearanceTagType(IdentifiedObject):
         return self._ClearanceTags
 
     def setClearanceTags(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ClearanceTags:
             x.ClearanceTagType = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.Equipment import Equipment
+from CIM14.Element import AssociationList, EMPTY
 
 class ProtectionEquipment(Equipment):
     """An electrical device designed to respond to input conditions in a prescribed manner and after specified conditions are met to cause contact operation or similar abrupt change in associated electric control circuits, or simply to display the detected condition. Protection equipment are associated with conducting equipment and usually operate circuit breakers.
@@ -47,13 +48,14 @@ class ProtectionEquipment(Equipment):
         #: The time delay from detection of abnormal conditions to relay operation.
         self.relayDelayTime = relayDelayTime
 
-        self.ProtectedSwitches = [] if ProtectedSwitches is None else ProtectedSwitches
+        self.ProtectedSwitches = EMPTY if ProtectedSwitches is None else AssociationList(ProtectedSwitches) or EMPTY
 
         self._Unit = None
         self.Unit = Unit
 
-        self._ConductingEquipments = []
-        self.ConductingEquipments = [] if ConductingEquipments is None else ConductingEquipments
+        self._ConductingEquipments = EMPTY
+        if ConductingEquipments is not None:
+            self.ConductingEquipments = ConductingEquipments
 
         super(ProtectionEquipment, self).__init__(*args, **kw_args)
 
@@ -66,7 +68,10 @@ class ProtectionEquipment(Equipment):
 
     def add_ProtectedSwitches(self, *ProtectedSwitches):
         for obj in ProtectedSwitches:
-            self.ProtectedSwitches.append(obj)
+            if self.ProtectedSwitches is EMPTY:
+                self.ProtectedSwitches = AssociationList([obj])
+            else:
+                self.ProtectedSwitches.add(obj)
 
     def remove_ProtectedSwitches(self, *ProtectedSwitches):
         for obj in ProtectedSwitches:
@@ -79,13 +84,14 @@ class ProtectionEquipment(Equipment):
 
     def setUnit(self, value):
         if self._Unit is not None:
-            filtered = [x for x in self.Unit.ProtectionEquipments if x != self]
-            self._Unit._ProtectionEquipments = filtered
+            self._Unit._ProtectionEquipments.discard(self)
 
         self._Unit = value
         if self._Unit is not None:
-            if self not in self._Unit._ProtectionEquipments:
-                self._Unit._ProtectionEquipments.append(self)
+            if self._Unit._ProtectionEquipments is EMPTY:
+                self._Unit._ProtectionEquipments = AssociationList([self])
+            else:
+                self._Unit._ProtectionEquipments.add(self)
 
     Unit = property(getUnit, setUnit)
 
@@ -95,21 +101,28 @@ class ProtectionEquipment(Equipment):
         return self._ConductingEquipments
 
     def setConductingEquipments(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ConductingEquipments:
-            filtered = [q for q in p.ProtectionEquipments if q != self]
-            self._ConductingEquipments._ProtectionEquipments = filtered
+            p._ProtectionEquipments.discard(self)
         for r in value:
-            if self not in r._ProtectionEquipments:
-                r._ProtectionEquipments.append(self)
+            if r._ProtectionEquipments is EMPTY:
+                r._ProtectionEquipments = AssociationList([self])
+            else:
+                r._ProtectionEquipments.add(self)
         self._ConductingEquipments = value
 
     ConductingEquipments = property(getConductingEquipments, setConductingEquipments)
 
     def addConductingEquipments(self, *ConductingEquipments):
         for obj in ConductingEquipments:
-            if self not in obj._ProtectionEquipments:
-                obj._ProtectionEquipments.append(self)
-            self._ConductingEquipments.append(obj)
+            if obj._ProtectionEquipments is EMPTY:
+                obj._ProtectionEquipments = AssociationList([self])
+            else:
+                obj._ProtectionEquipments.add(self)
+            if self._ConductingEquipments is EMPTY:
+                self._ConductingEquipments = AssociationList([obj])
+            else:
+                self._ConductingEquipments.add(obj)
 
     def removeConductingEquipments(self, *ConductingEquipments):
         for obj in ConductingEquipments:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import AssociationList, EMPTY
 
 class RecloseSequence(IdentifiedObject):
     """A reclose sequence (open and close) is defined for each possible reclosure of a breaker.
@@ -56,13 +57,14 @@ class RecloseSequence(IdentifiedObject):
 
     def setProtectedSwitch(self, value):
         if self._ProtectedSwitch is not None:
-            filtered = [x for x in self.ProtectedSwitch.RecloseSequences if x != self]
-            self._ProtectedSwitch._RecloseSequences = filtered
+            self._ProtectedSwitch._RecloseSequences.discard(self)
 
         self._ProtectedSwitch = value
         if self._ProtectedSwitch is not None:
-            if self not in self._ProtectedSwitch._RecloseSequences:
-                self._ProtectedSwitch._RecloseSequences.append(self)
+            if self._ProtectedSwitch._RecloseSequences is EMPTY:
+                self._ProtectedSwitch._RecloseSequences = AssociationList([self])
+            else:
+                self._ProtectedSwitch._RecloseSequences.add(self)
 
     ProtectedSwitch = property(getProtectedSwitch, setProtectedSwitch)
 
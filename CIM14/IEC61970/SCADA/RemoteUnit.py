@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.PowerSystemResource import PowerSystemResource
+from CIM14.Element import AssociationList, EMPTY
 
 class RemoteUnit(PowerSystemResource):
     """A remote unit can be a RTU, IED, substation control system, control center etc. The communication with the remote unit can be through various standard protocols (e.g. IEC 61870, IEC 61850) or non standard protocols (e.g. DNP, RP570 etc.). A remote unit contain remote data points that might be telemetered, collected or calculated. The RemoteUnit class inherit PowerSystemResource. The intention is to allow RemotUnits to have Measurements. These Measurements can be used to model unit status as operational, out of service, unit failure etc.
@@ -34,11 +35,13 @@ class RemoteUnit(PowerSystemResource):
         #: Type of remote unit. Values are: "IED", "ControlCenter", "RTU", "SubstationControlSystem"
         self.remoteUnitType = remoteUnitType
 
-        self._CommunicationLinks = []
-        self.CommunicationLinks = [] if CommunicationLinks is None else CommunicationLinks
+        self._CommunicationLinks = EMPTY
+        if CommunicationLinks is not None:
+            self.CommunicationLinks = CommunicationLinks
 
-        self._RemotePoints = []
-        self.RemotePoints = [] if RemotePoints is None else RemotePoints
+        self._RemotePoints = EMPTY
+        if RemotePoints is not None:
+            self.RemotePoints = RemotePoints
 
         super(RemoteUnit, self).__init__(*args, **kw_args)
 
@@ -55,21 +58,28 @@ class RemoteUnit(PowerSystemResource):
         return self._CommunicationLinks
 
     def setCommunicationLinks(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._CommunicationLinks:
-            filtered = [q for q in p.RemoteUnits if q != self]
-            self._CommunicationLinks._RemoteUnits = filtered
+            p._RemoteUnits.discard(self)
         for r in value:
-            if self not in r._RemoteUnits:
-                r._RemoteUnits.append(self)
+            if r._RemoteUnits is EMPTY:
+                r._RemoteUnits = AssociationList([self])
+            else:
+                r._RemoteUnits.add(self)
         self._CommunicationLinks = value
 
     CommunicationLinks = property(getCommunicationLinks, setCommunicationLinks)
 
     def addCommunicationLinks(self, *CommunicationLinks):
         for obj in CommunicationLinks:
-            if self not in obj._RemoteUnits:
-                obj._RemoteUnits.append(self)
-            self._CommunicationLinks.append(obj)
+            if obj._RemoteUnits is EMPTY:
+                obj._RemoteUnits = AssociationList([self])
+            else:
+                obj._RemoteUnits.add(self)
+            if self._CommunicationLinks is EMPTY:
+                self._CommunicationLinks = AssociationList([obj])
+            else:
+                self._CommunicationLinks.add(obj)
 
     def removeCommunicationLinks(self, *CommunicationLinks):
         for obj in CommunicationLinks:
@@ -83,6 +93,7 @@ class RemoteUnit(PowerSystemResource):
         return self._RemotePoints
 
     def setRemotePoints(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._RemotePoints:
             x.RemoteUnit = None
         for y in value:
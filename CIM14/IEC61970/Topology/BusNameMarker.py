@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import AssociationList, EMPTY
 
 class BusNameMarker(IdentifiedObject):
     """Used to apply user standard names to topology buses. Typically used for 'bus/branch' case generation. Associated with one or more ConnectivityNodes that are normally a part of the bus name.    The associated ConnectivityNodes are to be connected by non-retained switches. For a ring bus station configuration, all busbar connectivity nodes in the ring are typically associated.   For a breaker and a half scheme, both busbars would be associated.  For a ring bus, all busbars would be associated.  For a 'straight' busbar configuration, only the main connectivity node at the busbar would be associated.
@@ -33,8 +34,9 @@ class BusNameMarker(IdentifiedObject):
         self._ReportingGroup = None
         self.ReportingGroup = ReportingGroup
 
-        self._ConnectivityNode = []
-        self.ConnectivityNode = [] if ConnectivityNode is None else ConnectivityNode
+        self._ConnectivityNode = EMPTY
+        if ConnectivityNode is not None:
+            self.ConnectivityNode = ConnectivityNode
 
         super(BusNameMarker, self).__init__(*args, **kw_args)
 
@@ -52,13 +54,14 @@ class BusNameMarker(IdentifiedObject):
 
     def setReportingGroup(self, value):
         if self._ReportingGroup is not None:
-            filtered = [x for x in self.ReportingGroup.BusNameMarker if x != self]
-            self._ReportingGroup._BusNameMarker = filtered
+            self._ReportingGroup._BusNameMarker.discard(self)
 
         self._ReportingGroup = value
         if self._ReportingGroup is not None:
-            if self not in self._ReportingGroup._BusNameMarker:
-                self._ReportingGroup._BusNameMarker.append(self)
+            if self._ReportingGroup._BusNameMarker is EMPTY:
+                self._ReportingGroup._BusNameMarker = AssociationList([self])
+            else:
+                self._ReportingGroup._BusNameMarker.add(self)
 
     ReportingGroup = property(getReportingGroup, setReportingGroup)
 
@@ -68,6 +71,7 @@ class BusNameMarker(IdentifiedObject):
         return self._ConnectivityNode
 
     def setConnectivityNode(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ConnectivityNode:
             x.BusNameMarker = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.ConductingEquipment import ConductingEquipment
+from CIM14.Element import AssociationList, EMPTY
 
 class EnergyConsumer(ConductingEquipment):
     """Generic user of energy - a  point of consumption on the power system model
@@ -52,14 +53,16 @@ class EnergyConsumer(ConductingEquipment):
         #: Reactive power of the load that is a fixed quantity.
         self.qfixed = qfixed
 
-        self._aggregateLoad0 = []
-        self.aggregateLoad0 = [] if aggregateLoad0 is None else aggregateLoad0
+        self._aggregateLoad0 = EMPTY
+        if aggregateLoad0 is not None:
+            self.aggregateLoad0 = aggregateLoad0
 
         self._PowerCutZone = None
         self.PowerCutZone = PowerCutZone
 
-        self._ServiceDeliveryPoints = []
-        self.ServiceDeliveryPoints = [] if ServiceDeliveryPoints is None else ServiceDeliveryPoints
+        self._ServiceDeliveryPoints = EMPTY
+        if ServiceDeliveryPoints is not None:
+            self.ServiceDeliveryPoints = ServiceDeliveryPoints
 
         self._LoadResponse = None
         self.LoadResponse = LoadResponse
@@ -78,21 +81,28 @@ class EnergyConsumer(ConductingEquipment):
         return self._aggregateLoad0
 
     def setaggregateLoad0(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._aggregateLoad0:
-            filtered = [q for q in p.energyConsumer0 if q != self]
-            self._aggregateLoad0._energyConsumer0 = filtered
+            p._energyConsumer0.discard(self)
         for r in value:
-            if self not in r._energyConsumer0:
-                r._energyConsumer0.append(self)
+            if r._energyConsumer0 is EMPTY:
+                r._energyConsumer0 = AssociationList([self])
+            else:
+                r._energyConsumer0.add(self)
         self._aggregateLoad0 = value
 
     aggregateLoad0 = property(getaggregateLoad0, setaggregateLoad0)
 
     def addaggregateLoad0(self, *aggregateLoad0):
         for obj in aggregateLoad0:
-            if self not in obj._energyConsumer0:
-                obj._energyConsumer0.append(self)
-            self._aggregateLoad0.append(obj)
+            if obj._energyConsumer0 is EMPTY:
+                obj._energyConsumer0 = AssociationList([self])
+            else:
+                obj._energyConsumer0.add(self)
+            if self._aggregateLoad0 is EMPTY:
+                self._aggregateLoad0 = AssociationList([obj])
+            else:
+                self._aggregateLoad0.add(obj)
 
     def removeaggregateLoad0(self, *aggregateLoad0):
         for obj in aggregateLoad0:
@@ -107,13 +117,14 @@ class EnergyConsumer(ConductingEquipment):
 
     def setPowerCutZone(self, value):
         if self._PowerCutZone is not None:
-            filtered = [x for x in self.PowerCutZone.EnergyConsumers if x != self]
-            self._PowerCutZone._EnergyConsumers = filtered
+            self._PowerCutZone._EnergyConsumers.discard(self)
 
         self._PowerCutZone = value
         if self._PowerCutZone is not None:
-            if self not in self._PowerCutZone._EnergyConsumers:
-                self._PowerCutZone._EnergyConsumers.append(self)
+            if self._PowerCutZone._EnergyConsumers is EMPTY:
+                self._PowerCutZone._EnergyConsumers = AssociationList([self])
+            else:
+                self._PowerCutZone._EnergyConsumers.add(self)
 
     PowerCutZone = property(getPowerCutZone, setPowerCutZone)
 
@@ -122,6 +133,7 @@ class EnergyConsumer(ConductingEquipment):
         return self._ServiceDeliveryPoints
 
     def setServiceDeliveryPoints(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ServiceDeliveryPoints:
             x.EnergyConsumer = None
         for y in value:
@@ -145,13 +157,14 @@ class EnergyConsumer(ConductingEquipment):
 
     def setLoadResponse(self, value):
         if self._LoadResponse is not None:
-            filtered = [x for x in self.LoadResponse.EnergyConsumer if x != self]
-            self._LoadResponse._EnergyConsumer = filtered
+            self._LoadResponse._EnergyConsumer.discard(self)
 
         self._LoadResponse = value
         if self._LoadResponse is not None:
-            if self not in self._LoadResponse._EnergyConsumer:
-                self._LoadResponse._EnergyConsumer.append(self)
+            if self._LoadResponse._EnergyConsumer is EMPTY:
+                self._LoadResponse._EnergyConsumer = AssociationList([self])
+            else:
+                self._LoadResponse._EnergyConsumer.add(self)
 
     LoadResponse = property(getLoadResponse, setLoadResponse)
 
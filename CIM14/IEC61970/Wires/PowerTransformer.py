@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.Equipment import Equipment
+from CIM14.Element import AssociationList, EMPTY
 
 class PowerTransformer(Equipment):
     """An electrical device consisting of  two or more coupled windings, with or without a magnetic core, for introducing mutual coupling between electric circuits. Transformers can be used to control voltage and phase shift (active power flow).
@@ -42,8 +43,9 @@ class PowerTransformer(Equipment):
         #: Core shunt magnetizing susceptance in the saturation region.
         self.bmagSat = bmagSat
 
-        self._TransformerWindings = []
-        self.TransformerWindings = [] if TransformerWindings is None else TransformerWindings
+        self._TransformerWindings = EMPTY
+        if TransformerWindings is not None:
+            self.TransformerWindings = TransformerWindings
 
         self._HeatExchanger = None
         self.HeatExchanger = HeatExchanger
@@ -63,6 +65,7 @@ class PowerTransformer(Equipment):
         return self._TransformerWindings
 
     def setTransformerWindings(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._TransformerWindings:
             x.PowerTransformer = None
         for y in value:
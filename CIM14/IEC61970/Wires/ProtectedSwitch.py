@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Wires.Switch import Switch
+from CIM14.Element import AssociationList, EMPTY
 
 class ProtectedSwitch(Switch):
     """A ProtectedSwitch is a switching device that can be operated by ProtectionEquipment.
@@ -29,8 +30,9 @@ class ProtectedSwitch(Switch):
 
         @param RecloseSequences: A breaker may have zero or more automatic reclosures after a trip occurs.
         """
-        self._RecloseSequences = []
-        self.RecloseSequences = [] if RecloseSequences is None else RecloseSequences
+        self._RecloseSequences = EMPTY
+        if RecloseSequences is not None:
+            self.RecloseSequences = RecloseSequences
 
         super(ProtectedSwitch, self).__init__(*args, **kw_args)
 
@@ -47,6 +49,7 @@ class ProtectedSwitch(Switch):
         return self._RecloseSequences
 
     def setRecloseSequences(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._RecloseSequences:
             x.ProtectedSwitch = None
         for y in value:
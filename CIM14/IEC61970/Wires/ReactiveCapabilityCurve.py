@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.Curve import Curve
+from CIM14.Element import AssociationList, EMPTY
 
 class ReactiveCapabilityCurve(Curve):
     """Reactive power rating envelope versus the synchronous machine's active power, in both the generating and motoring modes. For each active power value there is a corresponding high and low reactive power limit  value. Typically there will be a separate curve for each coolant condition, such as hydrogen pressure.  The Y1 axis values represent reactive minimum and the Y2 axis values represent reactive maximum.
@@ -38,11 +39,13 @@ class ReactiveCapabilityCurve(Curve):
         #: The hydrogen coolant pressure
         self.hydrogenPressure = hydrogenPressure
 
-        self._InitiallyUsedBySynchronousMachines = []
-        self.InitiallyUsedBySynchronousMachines = [] if InitiallyUsedBySynchronousMachines is None else InitiallyUsedBySynchronousMachines
+        self._InitiallyUsedBySynchronousMachines = EMPTY
+        if InitiallyUsedBySynchronousMachines is not None:
+            self.InitiallyUsedBySynchronousMachines = InitiallyUsedBySynchronousMachines
 
-        self._SynchronousMachines = []
-        self.SynchronousMachines = [] if SynchronousMachines is None else SynchronousMachines
+        self._SynchronousMachines = EMPTY
+        if SynchronousMachines is not None:
+            self.SynchronousMachines = SynchronousMachines
 
         super(ReactiveCapabilityCurve, self).__init__(*args, **kw_args)
 
@@ -59,6 +62,7 @@ class ReactiveCapabilityCurve(Curve):
         return self._InitiallyUsedBySynchronousMachines
 
     def setInitiallyUsedBySynchronousMachines(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._InitiallyUsedBySynchronousMachines:
             x.InitialReactiveCapabilityCurve = None
         for y in value:
@@ -81,21 +85,28 @@ class ReactiveCapabilityCurve(Curve):
         return self._SynchronousMachines
 
     def setSynchronousMachines(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._SynchronousMachines:
-            filtered = [q for q in p.ReactiveCapabilityCurves if q != self]
-            self._SynchronousMachines._ReactiveCapabilityCurves = filtered
+            p._ReactiveCapabilityCurves.discard(self)
         for r in value:
-            if self not in r._ReactiveCapabilityCurves:
-                r._ReactiveCapabilityCurves.append(self)
+            if r._ReactiveCapabilityCurves is EMPTY:
+                r._ReactiveCapabilityCurves = AssociationList([self])
+            else:
+                r._ReactiveCapabilityCurves.add(self)
         self._SynchronousMachines = value
 
     SynchronousMachines = property(getSynchronousMachines, setSynchronousMachines)
 
     def addSynchronousMachines(self, *SynchronousMachines):
         for obj in SynchronousMachines:
-            if self not in obj._ReactiveCapabilityCurves:
-                obj._ReactiveCapabilityCurves.append(self)
-            self._SynchronousMachines.append(obj)
+            if obj._ReactiveCapabilityCurves is EMPTY:
+                obj._ReactiveCapabilityCurves = AssociationList([self])
+            else:
+                obj._ReactiveCapabilityCurves.add(self)
+            if self._SynchronousMachines is EMPTY:
+                self._SynchronousMachines = AssociationList([obj])
+            else:
+                self._SynchronousMachines.add(obj)
 
     def removeSynchronousMachines(self, *SynchronousMachines):
         for obj in SynchronousMachines:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.ConductingEquipment import ConductingEquipment
+from CIM14.Element import AssociationList, EMPTY
 
 class RegulatingCondEq(ConductingEquipment):
     """A type of conducting equipment that can regulate a quanity (i.e. voltage or flow) at a specific point in the network.
@@ -30,8 +31,9 @@ class RegulatingCondEq(ConductingEquipment):
         @param Controls: The controller outputs used to actually govern a regulating device, e.g. the magnetization of a synchronous machine or capacitor bank breaker actuator.
         @param RegulatingControl: The regulating control scheme in which this equipment participates.
         """
-        self._Controls = []
-        self.Controls = [] if Controls is None else Controls
+        self._Controls = EMPTY
+        if Controls is not None:
+            self.Controls = Controls
 
         self._RegulatingControl = None
         self.RegulatingControl = RegulatingControl
@@ -51,6 +53,7 @@ class RegulatingCondEq(ConductingEquipment):
         return self._Controls
 
     def setControls(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Controls:
             x.RegulatingCondEq = None
         for y in value:
@@ -74,13 +77,14 @@ class RegulatingCondEq(ConductingEquipment):
 
     def setRegulatingControl(self, value):
         if self._RegulatingControl is not None:
-            filtered = [x for x in self.RegulatingControl.RegulatingCondEq if x != self]
-            self._RegulatingControl._RegulatingCondEq = filtered
+            self._RegulatingControl._RegulatingCondEq.discard(self)
 
         self._RegulatingControl = value
         if self._RegulatingControl is not None:
-            if self not in self._RegulatingControl._RegulatingCondEq:
-                self._RegulatingControl._RegulatingCondEq.append(self)
+            if self._RegulatingControl._RegulatingCondEq is EMPTY:
+                self._RegulatingControl._RegulatingCondEq = AssociationList([self])
+            else:
+                self._RegulatingControl._RegulatingCondEq.add(self)
 
     RegulatingControl = property(getRegulatingControl, setRegulatingControl)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.PowerSystemResource import PowerSystemResource
+from CIM14.Element import AssociationList, EMPTY
 
 class RegulatingControl(PowerSystemResource):
     """Specifies a set of equipment that works together to control a power system quantity such as voltage or flow.
@@ -48,17 +49,20 @@ class RegulatingControl(PowerSystemResource):
         #: The target value specified for case input.   This value can be used for the target value wihout the use of schedules. The value has the units appropriate to the mode attribute.
         self.targetValue = targetValue
 
-        self._RegulationSchedule = []
-        self.RegulationSchedule = [] if RegulationSchedule is None else RegulationSchedule
+        self._RegulationSchedule = EMPTY
+        if RegulationSchedule is not None:
+            self.RegulationSchedule = RegulationSchedule
 
         self._Terminal = None
         self.Terminal = Terminal
 
-        self._TapChanger = []
-        self.TapChanger = [] if TapChanger is None else TapChanger
+        self._TapChanger = EMPTY
+        if TapChanger is not None:
+            self.TapChanger = TapChanger
 
-        self._RegulatingCondEq = []
-        self.RegulatingCondEq = [] if RegulatingCondEq is None else RegulatingCondEq
+        self._RegulatingCondEq = EMPTY
+        if RegulatingCondEq is not None:
+            self.RegulatingCondEq = RegulatingCondEq
 
         super(RegulatingControl, self).__init__(*args, **kw_args)
 
@@ -75,6 +79,7 @@ class RegulatingControl(PowerSystemResource):
         return self._RegulationSchedule
 
     def setRegulationSchedule(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._RegulationSchedule:
             x.RegulatingControl = None
         for y in value:
@@ -98,13 +103,14 @@ class RegulatingControl(PowerSystemResource):
 
     def setTerminal(self, value):
         if self._Terminal is not None:
-            filtered = [x for x in self.Terminal.RegulatingControl if x != self]
-            self._Terminal._RegulatingControl = filtered
+            self._Terminal._RegulatingControl.discard(self)
 
         self._Terminal = value
         if self._Terminal is not None:
-            if self not in self._Terminal._RegulatingControl:
-                self._Terminal._RegulatingControl.append(self)
+            if self._Terminal._RegulatingControl is EMPTY:
+                self._Terminal._RegulatingControl = AssociationList([self])
+            else:
+                self._Terminal._RegulatingControl.add(self)
 
     Terminal = property(getTerminal, setTerminal)
 
@@ -114,6 +120,7 @@ class RegulatingControl(PowerSystemResource):
         return self._TapChanger
 
     def setTapChanger(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._TapChanger:
             x.RegulatingControl = None
         for y in value:
@@ -136,6 +143,7 @@ class RegulatingControl(PowerSystemResource):
         return self._RegulatingCondEq
 
     def setRegulatingCondEq(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._RegulatingCondEq:
             x.RegulatingControl = None
         for y in value:
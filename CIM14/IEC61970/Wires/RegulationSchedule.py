@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.LoadModel.SeasonDayTypeSchedule import SeasonDayTypeSchedule
+from CIM14.Element import AssociationList, EMPTY
 
 class RegulationSchedule(SeasonDayTypeSchedule):
     """A pre-established pattern over time for a controlled variable, e.g., busbar voltage.
@@ -45,8 +46,9 @@ class RegulationSchedule(SeasonDayTypeSchedule):
         self._RegulatingControl = None
         self.RegulatingControl = RegulatingControl
 
-        self._VoltageControlZones = []
-        self.VoltageControlZones = [] if VoltageControlZones is None else VoltageControlZones
+        self._VoltageControlZones = EMPTY
+        if VoltageControlZones is not None:
+            self.VoltageControlZones = VoltageControlZones
 
         super(RegulationSchedule, self).__init__(*args, **kw_args)
 
@@ -64,13 +66,14 @@ class RegulationSchedule(SeasonDayTypeSchedule):
 
     def setRegulatingControl(self, value):
         if self._RegulatingControl is not None:
-            filtered = [x for x in self.RegulatingControl.RegulationSchedule if x != self]
-            self._RegulatingControl._RegulationSchedule = filtered
+            self._RegulatingControl._RegulationSchedule.discard(self)
 
         self._RegulatingControl = value
         if self._RegulatingControl is not None:
-            if self not in self._RegulatingControl._RegulationSchedule:
-                self._RegulatingControl._RegulationSchedule.append(self)
+            if self._RegulatingControl._RegulationSchedule is EMPTY:
+                self._RegulatingControl._RegulationSchedule = AssociationList([self])
+            else:
+                self._RegulatingControl._RegulationSchedule.add(self)
 
     RegulatingControl = property(getRegulatingControl, setRegulatingControl)
 
@@ -80,6 +83,7 @@ class RegulationSchedule(SeasonDayTypeSchedule):
         return self._VoltageControlZones
 
     def setVoltageControlZones(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._VoltageControlZones:
             x.RegulationSchedule = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.ConductingEquipment import ConductingEquipment
+from CIM14.Element import AssociationList, EMPTY
 
 class Switch(ConductingEquipment):
     """A generic device designed to close, or open, or both, one or more electric circuits.
@@ -48,17 +49,20 @@ class Switch(ConductingEquipment):
         #: The attribute is used in cases when no Measurement for the status value is present. If the Switch has a status measurment the Discrete.normalValue is expected to match with the Switch.normalOpen.
         self.normalOpen = normalOpen
 
-        self._SwitchingOperations = []
-        self.SwitchingOperations = [] if SwitchingOperations is None else SwitchingOperations
+        self._SwitchingOperations = EMPTY
+        if SwitchingOperations is not None:
+            self.SwitchingOperations = SwitchingOperations
 
         self._CompositeSwitch = None
         self.CompositeSwitch = CompositeSwitch
 
-        self._ConnectDisconnectFunctions = []
-        self.ConnectDisconnectFunctions = [] if ConnectDisconnectFunctions is None else ConnectDisconnectFunctions
+        self._ConnectDisconnectFunctions = EMPTY
+        if ConnectDisconnectFunctions is not None:
+            self.ConnectDisconnectFunctions = ConnectDisconnectFunctions
 
-        self._SwitchSchedules = []
-        self.SwitchSchedules = [] if SwitchSchedules is None else SwitchSchedules
+        self._SwitchSchedules = EMPTY
+        if SwitchSchedules is not None:
+            self.SwitchSchedules = SwitchSchedules
 
         super(Switch, self).__init__(*args, **kw_args)
 
@@ -75,21 +79,28 @@ class Switch(ConductingEquipment):
         return self._SwitchingOperations
 
     def setSwitchingOperations(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._SwitchingOperations:
-            filtered = [q for q in p.Switches if q != self]
-            self._SwitchingOperations._Switches = filtered
+            p._Switches.discard(self)
         for r in value:
-            if self not in r._Switches:
-                r._Switches.append(self)
+            if r._Switches is EMPTY:
+                r._Switches = AssociationList([self])
+            else:
+                r._Switches.add(self)
         self._SwitchingOperations = value
 
     SwitchingOperations = property(getSwitchingOperations, setSwitchingOperations)
 
     def addSwitchingOperations(self, *SwitchingOperations):
         for obj in SwitchingOperations:
-            if self not in obj._Switches:
-                obj._Switches.append(self)
-            self._SwitchingOperations.append(obj)
+            if obj._Switches is EMPTY:
+                obj._Switches = AssociationList([self])
+            else:
+                obj._Switches.add(self)
+            if self._SwitchingOperations is EMPTY:
+                self._SwitchingOperations = AssociationList([obj])
+            else:
+                self._SwitchingOperations.add(obj)
 
     def removeSwitchingOperations(self, *SwitchingOperations):
         for obj in SwitchingOperations:
@@ -104,13 +115,14 @@ class Switch(ConductingEquipment):
 
     def setCompositeSwitch(self, value):
         if self._CompositeSwitch is not None:
-            filtered = [x for x in self.CompositeSwitch.Switches if x != self]
-            self._CompositeSwitch._Switches = filtered
+            self._CompositeSwitch._Switches.discard(self)
 
         self._CompositeSwitch = value
         if self._CompositeSwitch is not None:
-            if self not in self._CompositeSwitch._Switches:
-                self._CompositeSwitch._Switches.append(self)
+            if self._CompositeSwitch._Switches is EMPTY:
+                self._CompositeSwitch._Switches = AssociationList([self])
+            else:
+                self._CompositeSwitch._Switches.add(self)
 
     CompositeSwitch = property(getCompositeSwitch, setCompositeSwitch)
 
@@ -119,21 +131,28 @@ class Switch(ConductingEquipment):
         return self._ConnectDisconnectFunctions
 
     def setConnectDisconnectFunctions(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ConnectDisconnectFunctions:
-            filtered = [q for q in p.Switches if q != self]
-            self._ConnectDisconnectFunctions._Switches = filtered
+            p._Switches.discard(self)
         for r in value:
-            if self not in r._Switches:
-                r._Switches.append(self)
+            if r._Switches is EMPTY:
+                r._Switches = AssociationList([self])
+            else:
+                r._Switches.add(self)
         self._ConnectDisconnectFunctions = value
 
     ConnectDisconnectFunctions = property(getConnectDisconnectFunctions, setConnectDisconnectFunctions)
 
     def addConnectDisconnectFunctions(self, *ConnectDisconnectFunctions):
         for obj in ConnectDisconnectFunctions:
-            if self not in obj._Switches:
-                obj._Switches.append(self)
-            self._ConnectDisconnectFunctions.append(obj)
+            if obj._Switches is EMPTY:
+                obj._Switches = AssociationList([self])
+            else:
+                obj._Switches.add(self)
+            if self._ConnectDisconnectFunctions is EMPTY:
+                self._ConnectDisconnectFunctions = AssociationList([obj])
+            else:
+                self._ConnectDisconnectFunctions.add(obj)
 
     def removeConnectDisconnectFunctions(self, *ConnectDisconnectFunctions):
         for obj in ConnectDisconnectFunctions:
@@ -147,6 +166,7 @@ class Switch(ConductingEquipment):
         return self._SwitchSchedules
 
     def setSwitchSchedules(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._SwitchSchedules:
             x.Switch = None
         for y in value:
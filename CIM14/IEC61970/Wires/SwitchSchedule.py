@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.LoadModel.SeasonDayTypeSchedule import SeasonDayTypeSchedule
+from CIM14.Element import AssociationList, EMPTY
 
 class SwitchSchedule(SeasonDayTypeSchedule):
     """A schedule of switch positions.  If RegularTimePoint.value1 is 0, the switch is open.  If 1, the switch is closed.
@@ -48,13 +49,14 @@ class SwitchSchedule(SeasonDayTypeSchedule):
 
     def setSwitch(self, value):
         if self._Switch is not None:
-            filtered = [x for x in self.Switch.SwitchSchedules if x != self]
-            self._Switch._SwitchSchedules = filtered
+            self._Switch._SwitchSchedules.discard(self)
 
         self._Switch = value
         if self._Switch is not None:
-            if self not in self._Switch._SwitchSchedules:
-                self._Switch._SwitchSchedules.append(self)
+            if self._Switch._SwitchSchedules is EMPTY:
+                self._Switch._SwitchSchedules = AssociationList([self])
+            else:
+                self._Switch._SwitchSchedules.add(self)
 
     Switch = property(getSwitch, setSwitch)
 
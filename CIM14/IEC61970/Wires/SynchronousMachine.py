@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Dynamics.RotatingMachine import RotatingMachine
+from CIM14.Element import AssociationList, EMPTY
 
 class SynchronousMachine(RotatingMachine):
     """An electromechanical device that operates synchronously with the network. It is a single machine operating either as a generator or synchronous condenser or pump.
@@ -152,8 +153,9 @@ class SynchronousMachine(RotatingMachine):
         #: Direct-axis subtransient reactance, also known as X'd.
         self.xDirectSubtrans = xDirectSubtrans
 
-        self._genLoad0 = []
-        self.genLoad0 = [] if genLoad0 is None else genLoad0
+        self._genLoad0 = EMPTY
+        if genLoad0 is not None:
+            self.genLoad0 = genLoad0
 
         self._HydroPump = None
         self.HydroPump = HydroPump
@@ -161,20 +163,24 @@ class SynchronousMachine(RotatingMachine):
         self._GeneratingUnit = None
         self.GeneratingUnit = GeneratingUnit
 
-        self._govHydro10 = []
-        self.govHydro10 = [] if govHydro10 is None else govHydro10
+        self._govHydro10 = EMPTY
+        if govHydro10 is not None:
+            self.govHydro10 = govHydro10
 
-        self._PrimeMovers = []
-        self.PrimeMovers = [] if PrimeMovers is None else PrimeMovers
+        self._PrimeMovers = EMPTY
+        if PrimeMovers is not None:
+            self.PrimeMovers = PrimeMovers
 
         self._InitialReactiveCapabilityCurve = None
         self.InitialReactiveCapabilityCurve = InitialReactiveCapabilityCurve
 
-        self._genEquiv0 = []
-        self.genEquiv0 = [] if genEquiv0 is None else genEquiv0
+        self._genEquiv0 = EMPTY
+        if genEquiv0 is not None:
+            self.genEquiv0 = genEquiv0
 
-        self._ReactiveCapabilityCurves = []
-        self.ReactiveCapabilityCurves = [] if ReactiveCapabilityCurves is None else ReactiveCapabilityCurves
+        self._ReactiveCapabilityCurves = EMPTY
+        if ReactiveCapabilityCurves is not None:
+            self.ReactiveCapabilityCurves = ReactiveCapabilityCurves
 
         super(SynchronousMachine, self).__init__(*args, **kw_args)
 
@@ -190,21 +196,28 @@ class SynchronousMachine(RotatingMachine):
         return self._genLoad0
 
     def setgenLoad0(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._genLoad0:
-            filtered = [q for q in p.synchronousMachine0 if q != self]
-            self._genLoad0._synchronousMachine0 = filtered
+            p._synchronousMachine0.discard(self)
         for r in value:
-            if self not in r._synchronousMachine0:
-                r._synchronousMachine0.append(self)
+            if r._synchronousMachine0 is EMPTY:
+                r._synchronousMachine0 = AssociationList([self])
+            else:
+                r._synchronousMachine0.add(self)
         self._genLoad0 = value
 
     genLoad0 = property(getgenLoad0, setgenLoad0)
 
     def addgenLoad0(self, *genLoad0):
         for obj in genLoad0:
-            if self not in obj._synchronousMachine0:
-                obj._synchronousMachine0.append(self)
-            self._genLoad0.append(obj)
+            if obj._synchronousMachine0 is EMPTY:
+                obj._synchronousMachine0 = AssociationList([self])
+            else:
+                obj._synchronousMachine0.add(self)
+            if self._genLoad0 is EMPTY:
+                self._genLoad0 = AssociationList([obj])
+            else:
+                self._genLoad0.add(obj)
 
     def removegenLoad0(self, *genLoad0):
         for obj in genLoad0:
@@ -235,13 +248,14 @@ class SynchronousMachine(RotatingMachine):
 
     def setGeneratingUnit(self, value):
         if self._GeneratingUnit is not None:
-            filtered = [x for x in self.GeneratingUnit.SynchronousMachines if x != self]
-            self._GeneratingUnit._SynchronousMachines = filtered
+            self._GeneratingUnit._SynchronousMachines.discard(self)
 
         self._GeneratingUnit = value
         if self._GeneratingUnit is not None:
-            if self not in self._GeneratingUnit._SynchronousMachines:
-                self._GeneratingUnit._SynchronousMachines.append(self)
+            if self._GeneratingUnit._SynchronousMachines is EMPTY:
+                self._GeneratingUnit._SynchronousMachines = AssociationList([self])
+            else:
+                self._GeneratingUnit._SynchronousMachines.add(self)
 
     GeneratingUnit = property(getGeneratingUnit, setGeneratingUnit)
 
@@ -250,21 +264,28 @@ class SynchronousMachine(RotatingMachine):
         return self._govHydro10
 
     def setgovHydro10(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._govHydro10:
-            filtered = [q for q in p.synchronousMachine0 if q != self]
-            self._govHydro10._synchronousMachine0 = filtered
+            p._synchronousMachine0.discard(self)
         for r in value:
-            if self not in r._synchronousMachine0:
-                r._synchronousMachine0.append(self)
+            if r._synchronousMachine0 is EMPTY:
+                r._synchronousMachine0 = AssociationList([self])
+            else:
+                r._synchronousMachine0.add(self)
         self._govHydro10 = value
 
     govHydro10 = property(getgovHydro10, setgovHydro10)
 
     def addgovHydro10(self, *govHydro10):
         for obj in govHydro10:
-            if self not in obj._synchronousMachine0:
-                obj._synchronousMachine0.append(self)
-            self._govHydro10.append(obj)
+            if obj._synchronousMachine0 is EMPTY:
+                obj._synchronousMachine0 = AssociationList([self])
+            else:
+                obj._synchronousMachine0.add(self)
+            if self._govHydro10 is EMPTY:
+                self._govHydro10 = AssociationList([obj])
+            else:
+                self._govHydro10.add(obj)
 
     def removegovHydro10(self, *govHydro10):
         for obj in govHydro10:
@@ -278,21 +299,28 @@ class SynchronousMachine(RotatingMachine):
         return self._PrimeMovers
 
     def setPrimeMovers(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._PrimeMovers:
-            filtered = [q for q in p.SynchronousMachines if q != self]
-            self._PrimeMovers._SynchronousMachines = filtered
+            p._SynchronousMachines.discard(self)
         for r in value:
-            if self not in r._SynchronousMachines:
-                r._SynchronousMachines.append(self)
+            if r._SynchronousMachines is EMPTY:
+                r._SynchronousMachines = AssociationList([self])
+            else:
+                r._SynchronousMachines.add(self)
         self._PrimeMovers = value
 
     PrimeMovers = property(getPrimeMovers, setPrimeMovers)
 
     def addPrimeMovers(self, *PrimeMovers):
         for obj in PrimeMovers:
-            if self not in obj._SynchronousMachines:
-                obj._SynchronousMachines.append(self)
-            self._PrimeMovers.append(obj)
+            if obj._SynchronousMachines is EMPTY:
+                obj._SynchronousMachines = AssociationList([self])
+            else:
+                obj._SynchronousMachines.add(self)
+            if self._PrimeMovers is EMPTY:
+                self._PrimeMovers = AssociationList([obj])
+            else:
+                self._PrimeMovers.add(obj)
 
     def removePrimeMovers(self, *PrimeMovers):
         for obj in PrimeMovers:
@@ -307,13 +335,14 @@ class SynchronousMachine(RotatingMachine):
 
     def setInitialReactiveCapabilityCurve(self, value):
         if self._InitialReactiveCapabilityCurve is not None:
-            filtered = [x for x in self.InitialReactiveCapabilityCurve.InitiallyUsedBySynchronousMachines if x != self]
-            self._InitialReactiveCapabilityCurve._InitiallyUsedBySynchronousMachines = filtered
+            self._InitialReactiveCapabilityCurve._InitiallyUsedBySynchronousMachines.discard(self)
 
         self._InitialReactiveCapabilityCurve = value
         if self._InitialReactiveCapabilityCurve is not None:
-            if self not in self._InitialReactiveCapabilityCurve._InitiallyUsedBySynchronousMachines:
-                self._InitialReactiveCapabilityCurve._InitiallyUsedBySynchronousMachines.append(self)
+            if self._InitialReactiveCapabilityCurve._InitiallyUsedBySynchronousMachines is EMPTY:
+                self._InitialReactiveCapabilityCurve._InitiallyUsedBySynchronousMachines = AssociationList([self])
+            else:
+                self._InitialReactiveCapabilityCurve._InitiallyUsedBySynchronousMachines.add(self)
 
     InitialReactiveCapabilityCurve = property(getInitialReactiveCapabilityCurve, setInitialReactiveCapabilityCurve)
 
@@ -322,21 +351,28 @@ class SynchronousMachine(RotatingMachine):
         return self._genEquiv0
 
     def setgenEquiv0(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._genEquiv0:
-            filtered = [q for q in p.synchronousMachine0 if q != self]
-            self._genEquiv0._synchronousMachine0 = filtered
+            p._synchronousMachine0.discard(self)
         for r in value:
-            if self not in r._synchronousMachine0:
-                r._synchronousMachine0.append(self)
+            if r._synchronousMachine0 is EMPTY:
+                r._synchronousMachine0 = AssociationList([self])
+            else:
+                r._synchronousMachine0.add(self)
         self._genEquiv0 = value
 
     genEquiv0 = property(getgenEquiv0, setgenEquiv0)
 
     def addgenEquiv0(self, *genEquiv0):
         for obj in genEquiv0:
-            if self not in obj._synchronousMachine0:
-                obj._synchronousMachine0.append(self)
-            self._genEquiv0.append(obj)
+            if obj._synchronousMachine0 is EMPTY:
+                obj._synchronousMachine0 = AssociationList([self])
+            else:
+                obj._synchronousMachine0.add(self)
+            if self._genEquiv0 is EMPTY:
+                self._genEquiv0 = AssociationList([obj])
+            else:
+                self._genEquiv0.add(obj)
 
     def removegenEquiv0(self, *genEquiv0):
         for obj in genEquiv0:
@@ -350,21 +386,28 @@ class SynchronousMachine(RotatingMachine):
         return self._ReactiveCapabilityCurves
 
     def setReactiveCapabilityCurves(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ReactiveCapabilityCurves:
-            filtered = [q for q in p.SynchronousMachines if q != self]
-            self._ReactiveCapabilityCurves._SynchronousMachines = filtered
+            p._SynchronousMachines.discard(self)
         for r in value:
-            if self not in r._SynchronousMachines:
-                r._SynchronousMachines.append(self)
+            if r._SynchronousMachines is EMPTY:
+                r._SynchronousMachines = AssociationList([self])
+            else:
+                r._SynchronousMachines.add(self)
         self._ReactiveCapabilityCurves = value
 
     ReactiveCapabilityCurves = property(getReactiveCapabilityCurves, setReactiveCapabilityCurves)
 
     def addReactiveCapabilityCurves(self, *ReactiveCapabilityCurves):
         for obj in ReactiveCapabilityCurves:
-            if self not in obj._SynchronousMachines:
-                obj._SynchronousMachines.append(self)
-            self._ReactiveCapabilityCurves.append(obj)
+            if obj._SynchronousMachines is EMPTY:
+                obj._SynchronousMachines = AssociationList([self])
+            else:
+                obj._SynchronousMachines.add(self)
+            if self._ReactiveCapabilityCurves is EMPTY:
+                self._ReactiveCapabilityCurves = AssociationList([obj])
+            else:
+                self._ReactiveCapabilityCurves.add(obj)
 
     def removeReactiveCapabilityCurves(self, *ReactiveCapabilityCurves):
         for obj in ReactiveCapabilityCurves:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.PowerSystemResource import PowerSystemResource
+from CIM14.Element import AssociationList, EMPTY
 
 class TapChanger(PowerSystemResource):
     """Mechanism for changing transformer winding tap positions.
@@ -78,8 +79,9 @@ class TapChanger(PowerSystemResource):
         self._ImpedanceVariationCurve = None
         self.ImpedanceVariationCurve = ImpedanceVariationCurve
 
-        self._TapSchedules = []
-        self.TapSchedules = [] if TapSchedules is None else TapSchedules
+        self._TapSchedules = EMPTY
+        if TapSchedules is not None:
+            self.TapSchedules = TapSchedules
 
         self._RegulatingControl = None
         self.RegulatingControl = RegulatingControl
@@ -131,6 +133,7 @@ class TapChanger(PowerSystemResource):
         return self._TapSchedules
 
     def setTapSchedules(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._TapSchedules:
             x.TapChanger = None
         for y in value:
@@ -153,13 +156,14 @@ class TapChanger(PowerSystemResource):
 
     def setRegulatingControl(self, value):
         if self._RegulatingControl is not None:
-            filtered = [x for x in self.RegulatingControl.TapChanger if x != self]
-            self._RegulatingControl._TapChanger = filtered
+            self._RegulatingControl._TapChanger.discard(self)
 
         self._RegulatingControl = value
         if self._RegulatingControl is not None:
-            if self not in self._RegulatingControl._TapChanger:
-                self._RegulatingControl._TapChanger.append(self)
+            if self._RegulatingControl._TapChanger is EMPTY:
+                self._RegulatingControl._TapChanger = AssociationList([self])
+            else:
+                self._RegulatingControl._TapChanger.add(self)
 
     RegulatingControl = property(getRegulatingControl, setRegulatingControl)
 
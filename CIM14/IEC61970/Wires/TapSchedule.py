@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.LoadModel.SeasonDayTypeSchedule import SeasonDayTypeSchedule
+from CIM14.Element import AssociationList, EMPTY
 
 class TapSchedule(SeasonDayTypeSchedule):
     """A pre-established pattern over time for a tap step.
@@ -60,13 +61,14 @@ class TapSchedule(SeasonDayTypeSchedule):
 
     def setTapChanger(self, value):
         if self._TapChanger is not None:
-            filtered = [x for x in self.TapChanger.TapSchedules if x != self]
-            self._TapChanger._TapSchedules = filtered
+            self._TapChanger._TapSchedules.discard(self)
 
         self._TapChanger = value
         if self._TapChanger is not None:
-            if self not in self._TapChanger._TapSchedules:
-                self._TapChanger._TapSchedules.append(self)
+            if self._TapChanger._TapSchedules is EMPTY:
+                self._TapChanger._TapSchedules = AssociationList([self])
+            else:
+                self._TapChanger._TapSchedules.add(self)
 
     TapChanger = property(getTapChanger, setTapChanger)
 
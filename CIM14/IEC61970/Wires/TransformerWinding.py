@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.ConductingEquipment import ConductingEquipment
+from CIM14.Element import AssociationList, EMPTY
 
 class TransformerWinding(ConductingEquipment):
     """A winding is associated with each defined terminal of a transformer (or phase shifter).
@@ -105,11 +106,13 @@ class TransformerWinding(ConductingEquipment):
         #: Ground reactance path through connected grounding transformer.
         self.xground = xground
 
-        self._From_WindingTest = []
-        self.From_WindingTest = [] if From_WindingTest is None else From_WindingTest
+        self._From_WindingTest = EMPTY
+        if From_WindingTest is not None:
+            self.From_WindingTest = From_WindingTest
 
-        self._To_WindingTest = []
-        self.To_WindingTest = [] if To_WindingTest is None else To_WindingTest
+        self._To_WindingTest = EMPTY
+        if To_WindingTest is not None:
+            self.To_WindingTest = To_WindingTest
 
         self._RatioTapChanger = None
         self.RatioTapChanger = RatioTapChanger
@@ -135,6 +138,7 @@ class TransformerWinding(ConductingEquipment):
         return self._From_WindingTest
 
     def setFrom_WindingTest(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._From_WindingTest:
             x.From_TransformerWinding = None
         for y in value:
@@ -157,6 +161,7 @@ class TransformerWinding(ConductingEquipment):
         return self._To_WindingTest
 
     def setTo_WindingTest(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._To_WindingTest:
             x.To_TransformerWinding = None
         for y in value:
@@ -196,13 +201,14 @@ class TransformerWinding(ConductingEquipment):
 
     def setPowerTransformer(self, value):
         if self._PowerTransformer is not None:
-            filtered = [x for x in self.PowerTransformer.TransformerWindings if x != self]
-            self._PowerTransformer._TransformerWindings = filtered
+            self._PowerTransformer._TransformerWindings.discard(self)
 
         self._PowerTransformer = value
         if self._PowerTransformer is not None:
-            if self not in self._PowerTransformer._TransformerWindings:
-                self._PowerTransformer._TransformerWindings.append(self)
+            if self._PowerTransformer._TransformerWindings is EMPTY:
+                self._PowerTransformer._TransformerWindings = AssociationList([self])
+            else:
+                self._PowerTransformer._TransformerWindings.add(self)
 
     PowerTransformer = property(getPowerTransformer, setPowerTransformer)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.PowerSystemResource import PowerSystemResource
+from CIM14.Element import AssociationList, EMPTY
 
 class VoltageControlZone(PowerSystemResource):
     """An area of the power system network which is defined for secondary voltage control purposes. A voltage control zone consists of a collection of substations with a designated bus bar section whose voltage will be controlled.
@@ -52,13 +53,14 @@ class VoltageControlZone(PowerSystemResource):
 
     def setRegulationSchedule(self, value):
         if self._RegulationSchedule is not None:
-            filtered = [x for x in self.RegulationSchedule.VoltageControlZones if x != self]
-            self._RegulationSchedule._VoltageControlZones = filtered
+            self._RegulationSchedule._VoltageControlZones.discard(self)
 
         self._RegulationSchedule = value
         if self._RegulationSchedule is not None:
-            if self not in self._RegulationSchedule._VoltageControlZones:
-                self._RegulationSchedule._VoltageControlZones.append(self)
+            if self._RegulationSchedule._VoltageControlZones is EMPTY:
+                self._RegulationSchedule._VoltageControlZones = AssociationList([self])
+            else:
+                self._RegulationSchedule._VoltageControlZones.add(self)
 
     RegulationSchedule = property(getRegulationSchedule, setRegulationSchedule)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import AssociationList, EMPTY
 
 class WindingTest(IdentifiedObject):
     """Physical winding test data for the winding/tap pairs of a transformer (or phase shifter). This test data can be used to derive other attributes of specific transformer or phase shifter models.
@@ -84,13 +85,14 @@ class WindingTest(IdentifiedObject):
 
     def setFrom_TransformerWinding(self, value):
         if self._From_TransformerWinding is not None:
-            filtered = [x for x in self.From_TransformerWinding.From_WindingTest if x != self]
-            self._From_TransformerWinding._From_WindingTest = filtered
+            self._From_TransformerWinding._From_WindingTest.discard(self)
 
         self._From_TransformerWinding = value
         if self._From_TransformerWinding is not None:
-            if self not in self._From_TransformerWinding._From_WindingTest:
-                self._From_TransformerWinding._From_WindingTest.append(self)
+            if self._From_TransformerWinding._From_WindingTest is EMPTY:
+                self._From_TransformerWinding._From_WindingTest = AssociationList([self])
+            else:
+                self._From_TransformerWinding._From_WindingTest.add(self)
 
     From_TransformerWinding = property(getFrom_TransformerWinding, setFrom_TransformerWinding)
 
@@ -101,13 +103,14 @@ class WindingTest(IdentifiedObject):
 
     def setTo_TransformerWinding(self, value):
         if self._To_TransformerWinding is not None:
-            filtered = [x for x in self.To_TransformerWinding.To_WindingTest if x != self]
-            self._To_TransformerWinding._To_WindingTest = filtered
+            self._To_TransformerWinding._To_WindingTest.discard(self)
 
         self._To_TransformerWinding = value
         if self._To_TransformerWinding is not None:
-            if self not in self._To_TransformerWinding._To_WindingTest:
-                self._To_TransformerWinding._To_WindingTest.append(self)
+            if self._To_TransformerWinding._To_WindingTest is EMPTY:
+                self._To_TransformerWinding._To_WindingTest = AssociationList([self])
+            else:
+                self._To_TransformerWinding._To_WindingTest.add(self)
 
     To_TransformerWinding = property(getTo_TransformerWinding, setTo_TransformerWinding)
 
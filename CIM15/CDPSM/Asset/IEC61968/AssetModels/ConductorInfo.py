@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.CDPSM.Asset.IEC61968.Assets.AssetInfo import AssetInfo
+from CIM15.CDPSM.Asset.Element import AssociationList, EMPTY
 
 class ConductorInfo(AssetInfo):
     """Conductor data.
@@ -50,11 +51,13 @@ class ConductorInfo(AssetInfo):
         #: Number of phases (including neutral) to be retained. Any wires beyond this number should be reduced into the earth return.
         self.phaseCount = phaseCount
 
-        self._WireArrangements = []
-        self.WireArrangements = [] if WireArrangements is None else WireArrangements
+        self._WireArrangements = EMPTY
+        if WireArrangements is not None:
+            self.WireArrangements = WireArrangements
 
-        self._LineSegments = []
-        self.LineSegments = [] if LineSegments is None else LineSegments
+        self._LineSegments = EMPTY
+        if LineSegments is not None:
+            self.LineSegments = LineSegments
 
         super(ConductorInfo, self).__init__(*args, **kw_args)
 
@@ -71,6 +74,7 @@ class ConductorInfo(AssetInfo):
         return self._WireArrangements
 
     def setWireArrangements(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._WireArrangements:
             x.ConductorInfo = None
         for y in value:
@@ -93,6 +97,7 @@ class ConductorInfo(AssetInfo):
         return self._LineSegments
 
     def setLineSegments(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._LineSegments:
             x.ConductorInfo = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.CDPSM.Asset.IEC61968.Assets.AssetInfo import AssetInfo
+from CIM15.CDPSM.Asset.Element import AssociationList, EMPTY
 
 class PowerTransformerInfo(AssetInfo):
     """Set of power transformer data, from an equipment library.
@@ -29,8 +30,9 @@ class PowerTransformerInfo(AssetInfo):
 
         @param TransformerTankInfo: Data for all the tanks described by this power transformer data.
         """
-        self._TransformerTankInfo = []
-        self.TransformerTankInfo = [] if TransformerTankInfo is None else TransformerTankInfo
+        self._TransformerTankInfo = EMPTY
+        if TransformerTankInfo is not None:
+            self.TransformerTankInfo = TransformerTankInfo
 
         super(PowerTransformerInfo, self).__init__(*args, **kw_args)
 
@@ -47,6 +49,7 @@ class PowerTransformerInfo(AssetInfo):
         return self._TransformerTankInfo
 
     def setTransformerTankInfo(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._TransformerTankInfo:
             x.PowerTransformerInfo = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.CDPSM.Asset.IEC61968.Assets.AssetInfo import AssetInfo
+from CIM15.CDPSM.Asset.Element import AssociationList, EMPTY
 
 class TransformerEndInfo(AssetInfo):
     """Transformer end data.
@@ -69,8 +70,9 @@ class TransformerEndInfo(AssetInfo):
         self._TransformerTankInfo = None
         self.TransformerTankInfo = TransformerTankInfo
 
-        self._TransformerEnd = []
-        self.TransformerEnd = [] if TransformerEnd is None else TransformerEnd
+        self._TransformerEnd = EMPTY
+        if TransformerEnd is not None:
+            self.TransformerEnd = TransformerEnd
 
         super(TransformerEndInfo, self).__init__(*args, **kw_args)
 
@@ -88,13 +90,14 @@ class TransformerEndInfo(AssetInfo):
 
     def setTransformerTankInfo(self, value):
         if self._TransformerTankInfo is not None:
-            filtered = [x for x in self.TransformerTankInfo.TransformerEndInfos if x != self]
-            self._TransformerTankInfo._TransformerEndInfos = filtered
+            self._TransformerTankInfo._TransformerEndInfos.discard(self)
 
         self._TransformerTankInfo = value
         if self._TransformerTankInfo is not None:
-            if self not in self._TransformerTankInfo._TransformerEndInfos:
-                self._TransformerTankInfo._TransformerEndInfos.append(self)
+            if self._TransformerTankInfo._TransformerEndInfos is EMPTY:
+                self._TransformerTankInfo._TransformerEndInfos = AssociationList([self])
+            else:
+                self._TransformerTankInfo._TransformerEndInfos.add(self)
 
     TransformerTankInfo = property(getTransformerTankInfo, setTransformerTankInfo)
 
@@ -104,6 +107,7 @@ class TransformerEndInfo(AssetInfo):
         return self._TransformerEnd
 
     def setTransformerEnd(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._TransformerEnd:
             x.TransformerEndInfo = None
         for y in value:
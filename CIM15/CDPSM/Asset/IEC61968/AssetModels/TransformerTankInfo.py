@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.CDPSM.Asset.IEC61968.Assets.AssetInfo import AssetInfo
+from CIM15.CDPSM.Asset.Element import AssociationList, EMPTY
 
 class TransformerTankInfo(AssetInfo):
     """Set of transformer tank data, from an equipment library.
@@ -34,11 +35,13 @@ class TransformerTankInfo(AssetInfo):
         self._PowerTransformerInfo = None
         self.PowerTransformerInfo = PowerTransformerInfo
 
-        self._TransformerEndInfos = []
-        self.TransformerEndInfos = [] if TransformerEndInfos is None else TransformerEndInfos
+        self._TransformerEndInfos = EMPTY
+        if TransformerEndInfos is not None:
+            self.TransformerEndInfos = TransformerEndInfos
 
-        self._TransformerTanks = []
-        self.TransformerTanks = [] if TransformerTanks is None else TransformerTanks
+        self._TransformerTanks = EMPTY
+        if TransformerTanks is not None:
+            self.TransformerTanks = TransformerTanks
 
         super(TransformerTankInfo, self).__init__(*args, **kw_args)
 
@@ -56,13 +59,14 @@ class TransformerTankInfo(AssetInfo):
 
     def setPowerTransformerInfo(self, value):
         if self._PowerTransformerInfo is not None:
-            filtered = [x for x in self.PowerTransformerInfo.TransformerTankInfo if x != self]
-            self._PowerTransformerInfo._TransformerTankInfo = filtered
+            self._PowerTransformerInfo._TransformerTankInfo.discard(self)
 
         self._PowerTransformerInfo = value
         if self._PowerTransformerInfo is not None:
-            if self not in self._PowerTransformerInfo._TransformerTankInfo:
-                self._PowerTransformerInfo._TransformerTankInfo.append(self)
+            if self._PowerTransformerInfo._TransformerTankInfo is EMPTY:
+                self._PowerTransformerInfo._TransformerTankInfo = AssociationList([self])
+            else:
+                self._PowerTransformerInfo._TransformerTankInfo.add(self)
 
     PowerTransformerInfo = property(getPowerTransformerInfo, setPowerTransformerInfo)
 
@@ -72,6 +76,7 @@ class TransformerTankInfo(AssetInfo):
         return self._TransformerEndInfos
 
     def setTransformerEndInfos(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._TransformerEndInfos:
             x.TransformerTankInfo = None
         for y in value:
@@ -94,6 +99,7 @@ class TransformerTankInfo(AssetInfo):
         return self._TransformerTanks
 
     def setTransformerTanks(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._TransformerTanks:
             x.TransformerTankInfo = None
         for y in value:
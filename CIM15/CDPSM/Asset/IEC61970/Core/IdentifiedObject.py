@@ -18,7 +18,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from CIM15.CDPSM.Asset.Element import Element
+from CIM15.CDPSM.Asset.Element import Element, AssociationList, EMPTY
 
 class IdentifiedObject(Element):
     """This is a root class to provide common identification for all classes needing identification and naming attributes
@@ -37,8 +37,9 @@ class IdentifiedObject(Element):
         #: The aliasName is free text human readable name of the object alternative to IdentifiedObject.name. It may be non unique and may not correlate to a naming hierarchy. The attribute aliasName is put back because of backwards compatibility between CIM relases. It is however recommended to replace aliasName with the Name class as aliasName is planned for retirement at a future time. This was decided at a joint WG13/14 meeting in Minneapolis 2010-10-06.
         self.aliasName = aliasName
 
-        self._Names = []
-        self.Names = [] if Names is None else Names
+        self._Names = EMPTY
+        if Names is not None:
+            self.Names = Names
 
         super(IdentifiedObject, self).__init__(*args, **kw_args)
 
@@ -55,6 +56,7 @@ class IdentifiedObject(Element):
         return self._Names
 
     def setNames(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Names:
             x.IdentifiedObject = None
         for y in value:
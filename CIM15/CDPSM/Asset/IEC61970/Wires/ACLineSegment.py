@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.CDPSM.Asset.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.CDPSM.Asset.Element import AssociationList, EMPTY
 
 class ACLineSegment(IdentifiedObject):
     """A wire or combination of wires, with consistent electrical characteristics, building a single electrical system, used to carry alternating current between points in the power system. For symmetrical, transposed 3ph lines, it is sufficient to use ACLineSegment attributes, which describe sequence impedances and admittances for the entire length of the segment. If per lenght impedance data is available from a library of standard types, impedances and admittances can be calculated in one of the following ways: - calculate electrical parameters from asset data, using associated ConductorInfo, with values then multiplied by Conductor.length to produce a matrix model. - calculate unbalanced electrical parameters from associated PerLengthPhaseImpedance, then multiplied by Conductor.length to produce a matrix model. - calculate transposed electrical parameters from associated PerLengthSequenceImpedance, then multiplied by Conductor.length to produce a sequence model.
@@ -56,13 +57,14 @@ class ACLineSegment(IdentifiedObject):
 
     def setSequenceImpedance(self, value):
         if self._SequenceImpedance is not None:
-            filtered = [x for x in self.SequenceImpedance.LineSegments if x != self]
-            self._SequenceImpedance._LineSegments = filtered
+            self._SequenceImpedance._LineSegments.discard(self)
 
         self._SequenceImpedance = value
         if self._SequenceImpedance is not None:
-            if self not in self._SequenceImpedance._LineSegments:
-                self._SequenceImpedance._LineSegments.append(self)
+            if self._SequenceImpedance._LineSegments is EMPTY:
+                self._SequenceImpedance._LineSegments = AssociationList([self])
+            else:
+                self._SequenceImpedance._LineSegments.add(self)
 
     SequenceImpedance = property(getSequenceImpedance, setSequenceImpedance)
 
@@ -73,13 +75,14 @@ class ACLineSegment(IdentifiedObject):
 
     def setConductorInfo(self, value):
         if self._ConductorInfo is not None:
-            filtered = [x for x in self.ConductorInfo.LineSegments if x != self]
-            self._ConductorInfo._LineSegments = filtered
+            self._ConductorInfo._LineSegments.discard(self)
 
         self._ConductorInfo = value
         if self._ConductorInfo is not None:
-            if self not in self._ConductorInfo._LineSegments:
-                self._ConductorInfo._LineSegments.append(self)
+            if self._ConductorInfo._LineSegments is EMPTY:
+                self._ConductorInfo._LineSegments = AssociationList([self])
+            else:
+                self._ConductorInfo._LineSegments.add(self)
 
     ConductorInfo = property(getConductorInfo, setConductorInfo)
 
@@ -90,13 +93,14 @@ class ACLineSegment(IdentifiedObject):
 
     def setPhaseImpedance(self, value):
         if self._PhaseImpedance is not None:
-            filtered = [x for x in self.PhaseImpedance.LineSegments if x != self]
-            self._PhaseImpedance._LineSegments = filtered
+            self._PhaseImpedance._LineSegments.discard(self)
 
         self._PhaseImpedance = value
         if self._PhaseImpedance is not None:
-            if self not in self._PhaseImpedance._LineSegments:
-                self._PhaseImpedance._LineSegments.append(self)
+            if self._PhaseImpedance._LineSegments is EMPTY:
+                self._PhaseImpedance._LineSegments = AssociationList([self])
+            else:
+                self._PhaseImpedance._LineSegments.add(self)
 
     PhaseImpedance = property(getPhaseImpedance, setPhaseImpedance)
 
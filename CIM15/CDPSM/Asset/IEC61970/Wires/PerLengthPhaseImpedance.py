@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.CDPSM.Asset.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.CDPSM.Asset.Element import AssociationList, EMPTY
 
 class PerLengthPhaseImpedance(IdentifiedObject):
     """Impedance and admittance parameters per unit length for n-wire unbalanced lines, in matrix form.
@@ -29,8 +30,9 @@ class PerLengthPhaseImpedance(IdentifiedObject):
 
         @param LineSegments: All line segments described by this phase impedance.
         """
-        self._LineSegments = []
-        self.LineSegments = [] if LineSegments is None else LineSegments
+        self._LineSegments = EMPTY
+        if LineSegments is not None:
+            self.LineSegments = LineSegments
 
         super(PerLengthPhaseImpedance, self).__init__(*args, **kw_args)
 
@@ -47,6 +49,7 @@ class PerLengthPhaseImpedance(IdentifiedObject):
         return self._LineSegments
 
     def setLineSegments(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._LineSegments:
             x.PhaseImpedance = None
         for y in value:
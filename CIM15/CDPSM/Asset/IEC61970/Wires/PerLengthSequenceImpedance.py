@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.CDPSM.Asset.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.CDPSM.Asset.Element import AssociationList, EMPTY
 
 class PerLengthSequenceImpedance(IdentifiedObject):
     """Sequence impedance and admittance parameters per unit length, for transposed lines of 1, 2, or 3 phases. For 1-phase lines, define x=x0=xself. For 2-phase lines, define x=xs-xm and x0=xs+xm.
@@ -29,8 +30,9 @@ class PerLengthSequenceImpedance(IdentifiedObject):
 
         @param LineSegments: All line segments described by this sequence impedance.
         """
-        self._LineSegments = []
-        self.LineSegments = [] if LineSegments is None else LineSegments
+        self._LineSegments = EMPTY
+        if LineSegments is not None:
+            self.LineSegments = LineSegments
 
         super(PerLengthSequenceImpedance, self).__init__(*args, **kw_args)
 
@@ -47,6 +49,7 @@ class PerLengthSequenceImpedance(IdentifiedObject):
         return self._LineSegments
 
     def setLineSegments(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._LineSegments:
             x.SequenceImpedance = None
         for y in value:
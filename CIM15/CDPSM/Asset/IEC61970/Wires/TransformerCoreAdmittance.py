@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.CDPSM.Asset.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.CDPSM.Asset.Element import AssociationList, EMPTY
 
 class TransformerCoreAdmittance(IdentifiedObject):
 
@@ -27,8 +28,9 @@ class TransformerCoreAdmittance(IdentifiedObject):
 
         @param TransformerEnd: All transformer ends having this core admittance.
         """
-        self._TransformerEnd = []
-        self.TransformerEnd = [] if TransformerEnd is None else TransformerEnd
+        self._TransformerEnd = EMPTY
+        if TransformerEnd is not None:
+            self.TransformerEnd = TransformerEnd
 
         super(TransformerCoreAdmittance, self).__init__(*args, **kw_args)
 
@@ -45,6 +47,7 @@ class TransformerCoreAdmittance(IdentifiedObject):
         return self._TransformerEnd
 
     def setTransformerEnd(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._TransformerEnd:
             x.CoreAdmittance = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.CDPSM.Asset.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.CDPSM.Asset.Element import AssociationList, EMPTY
 
 class TransformerEnd(IdentifiedObject):
     """TransformerEnd is a conducting connection point of a power transformer. It corresponds to a physical transformer winding terminal.  In earlier CIM versions, the TransformerWinding class served a similar purpose. This successor TransformerEnd class is more flexible and has important differences with TransformerWinding.
@@ -56,13 +57,14 @@ class TransformerEnd(IdentifiedObject):
 
     def setCoreAdmittance(self, value):
         if self._CoreAdmittance is not None:
-            filtered = [x for x in self.CoreAdmittance.TransformerEnd if x != self]
-            self._CoreAdmittance._TransformerEnd = filtered
+            self._CoreAdmittance._TransformerEnd.discard(self)
 
         self._CoreAdmittance = value
         if self._CoreAdmittance is not None:
-            if self not in self._CoreAdmittance._TransformerEnd:
-                self._CoreAdmittance._TransformerEnd.append(self)
+            if self._CoreAdmittance._TransformerEnd is EMPTY:
+                self._CoreAdmittance._TransformerEnd = AssociationList([self])
+            else:
+                self._CoreAdmittance._TransformerEnd.add(self)
 
     CoreAdmittance = property(getCoreAdmittance, setCoreAdmittance)
 
@@ -73,13 +75,14 @@ class TransformerEnd(IdentifiedObject):
 
     def setTransformerEndInfo(self, value):
         if self._TransformerEndInfo is not None:
-            filtered = [x for x in self.TransformerEndInfo.TransformerEnd if x != self]
-            self._TransformerEndInfo._TransformerEnd = filtered
+            self._TransformerEndInfo._TransformerEnd.discard(self)
 
         self._TransformerEndInfo = value
         if self._TransformerEndInfo is not None:
-            if self not in self._TransformerEndInfo._TransformerEnd:
-                self._TransformerEndInfo._TransformerEnd.append(self)
+            if self._TransformerEndInfo._TransformerEnd is EMPTY:
+                self._TransformerEndInfo._TransformerEnd = AssociationList([self])
+            else:
+                self._TransformerEndInfo._TransformerEnd.add(self)
 
     TransformerEndInfo = property(getTransformerEndInfo, setTransformerEndInfo)
 
@@ -90,13 +93,14 @@ class TransformerEnd(IdentifiedObject):
 
     def setStarImpedance(self, value):
         if self._StarImpedance is not None:
-            filtered = [x for x in self.StarImpedance.TransformerEnd if x != self]
-            self._StarImpedance._TransformerEnd = filtered
+            self._StarImpedance._TransformerEnd.discard(self)
 
         self._StarImpedance = value
         if self._StarImpedance is not None:
-            if self not in self._StarImpedance._TransformerEnd:
-                self._StarImpedance._TransformerEnd.append(self)
+            if self._StarImpedance._TransformerEnd is EMPTY:
+                self._StarImpedance._TransformerEnd = AssociationList([self])
+            else:
+                self._StarImpedance._TransformerEnd.add(self)
 
     StarImpedance = property(getStarImpedance, setStarImpedance)
 
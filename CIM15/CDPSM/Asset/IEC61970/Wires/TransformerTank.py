@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.CDPSM.Asset.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.CDPSM.Asset.Element import AssociationList, EMPTY
 
 class TransformerTank(IdentifiedObject):
     """An assembly of two or more coupled windings that transform electrical power between voltage levels. These windings are bound on a common core and place in the same tank. Transformer tank can be used to model both single-phase and 3-phase transformers.
@@ -48,13 +49,14 @@ class TransformerTank(IdentifiedObject):
 
     def setTransformerTankInfo(self, value):
         if self._TransformerTankInfo is not None:
-            filtered = [x for x in self.TransformerTankInfo.TransformerTanks if x != self]
-            self._TransformerTankInfo._TransformerTanks = filtered
+            self._TransformerTankInfo._TransformerTanks.discard(self)
 
         self._TransformerTankInfo = value
         if self._TransformerTankInfo is not None:
-            if self not in self._TransformerTankInfo._TransformerTanks:
-                self._TransformerTankInfo._TransformerTanks.append(self)
+            if self._TransformerTankInfo._TransformerTanks is EMPTY:
+                self._TransformerTankInfo._TransformerTanks = AssociationList([self])
+            else:
+                self._TransformerTankInfo._TransformerTanks.add(self)
 
     TransformerTankInfo = property(getTransformerTankInfo, setTransformerTankInfo)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.CDPSM.Balanced.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.CDPSM.Balanced.Element import AssociationList, EMPTY
 
 class TransformerCoreAdmittance(IdentifiedObject):
 
@@ -43,8 +44,9 @@ class TransformerCoreAdmittance(IdentifiedObject):
         #: Zero sequence magnetizing branch susceptance.
         self.b0 = b0
 
-        self._TransformerEnd = []
-        self.TransformerEnd = [] if TransformerEnd is None else TransformerEnd
+        self._TransformerEnd = EMPTY
+        if TransformerEnd is not None:
+            self.TransformerEnd = TransformerEnd
 
         super(TransformerCoreAdmittance, self).__init__(*args, **kw_args)
 
@@ -61,6 +63,7 @@ class TransformerCoreAdmittance(IdentifiedObject):
         return self._TransformerEnd
 
     def setTransformerEnd(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._TransformerEnd:
             x.CoreAdmittance = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.CDPSM.Balanced.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.CDPSM.Balanced.Element import AssociationList, EMPTY
 
 class TransformerEnd(IdentifiedObject):
     """TransformerEnd is a conducting connection point of a power transformer. It corresponds to a physical transformer winding terminal.  In earlier CIM versions, the TransformerWinding class served a similar purpose. This successor TransformerEnd class is more flexible and has important differences with TransformerWinding.
@@ -32,11 +33,13 @@ class TransformerEnd(IdentifiedObject):
         @param CoreAdmittance: Core admittance of this transformer end, representing magnetising current and core losses. The full values of the transformer should be supplied for one transformer end only.
         @param StarImpedance: (accurate for 2- or 3-winding transformers only) Pi-model impedances of this transformer end. By convention, for a two winding transformer, the full values of the transformer should be entered on the high voltage end (endNumber=1).
         """
-        self._FromMeshImpedance = []
-        self.FromMeshImpedance = [] if FromMeshImpedance is None else FromMeshImpedance
+        self._FromMeshImpedance = EMPTY
+        if FromMeshImpedance is not None:
+            self.FromMeshImpedance = FromMeshImpedance
 
-        self._ToMeshImpedance = []
-        self.ToMeshImpedance = [] if ToMeshImpedance is None else ToMeshImpedance
+        self._ToMeshImpedance = EMPTY
+        if ToMeshImpedance is not None:
+            self.ToMeshImpedance = ToMeshImpedance
 
         self._CoreAdmittance = None
         self.CoreAdmittance = CoreAdmittance
@@ -59,6 +62,7 @@ class TransformerEnd(IdentifiedObject):
         return self._FromMeshImpedance
 
     def setFromMeshImpedance(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._FromMeshImpedance:
             x.FromTransformerEnd = None
         for y in value:
@@ -81,21 +85,28 @@ class TransformerEnd(IdentifiedObject):
         return self._ToMeshImpedance
 
     def setToMeshImpedance(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ToMeshImpedance:
-            filtered = [q for q in p.ToTransformerEnd if q != self]
-            self._ToMeshImpedance._ToTransformerEnd = filtered
+            p._ToTransformerEnd.discard(self)
         for r in value:
-            if self not in r._ToTransformerEnd:
-                r._ToTransformerEnd.append(self)
+            if r._ToTransformerEnd is EMPTY:
+                r._ToTransformerEnd = AssociationList([self])
+            else:
+                r._ToTransformerEnd.add(self)
         self._ToMeshImpedance = value
 
     ToMeshImpedance = property(getToMeshImpedance, setToMeshImpedance)
 
     def addToMeshImpedance(self, *ToMeshImpedance):
         for obj in ToMeshImpedance:
-            if self not in obj._ToTransformerEnd:
-                obj._ToTransformerEnd.append(self)
-            self._ToMeshImpedance.append(obj)
+            if obj._ToTransformerEnd is EMPTY:
+                obj._ToTransformerEnd = AssociationList([self])
+            else:
+                obj._ToTransformerEnd.add(self)
+            if self._ToMeshImpedance is EMPTY:
+                self._ToMeshImpedance = AssociationList([obj])
+            else:
+                self._ToMeshImpedance.add(obj)
 
     def removeToMeshImpedance(self, *ToMeshImpedance):
         for obj in ToMeshImpedance:
@@ -110,13 +121,14 @@ class TransformerEnd(IdentifiedObject):
 
     def setCoreAdmittance(self, value):
         if self._CoreAdmittance is not None:
-            filtered = [x for x in self.CoreAdmittance.TransformerEnd if x != self]
-            self._CoreAdmittance._TransformerEnd = filtered
+            self._CoreAdmittance._TransformerEnd.discard(self)
 
         self._CoreAdmittance = value
         if self._CoreAdmittance is not None:
-            if self not in self._CoreAdmittance._TransformerEnd:
-                self._CoreAdmittance._TransformerEnd.append(self)
+            if self._CoreAdmittance._TransformerEnd is EMPTY:
+                self._CoreAdmittance._TransformerEnd = AssociationList([self])
+            else:
+                self._CoreAdmittance._TransformerEnd.add(self)
 
     CoreAdmittance = property(getCoreAdmittance, setCoreAdmittance)
 
@@ -127,13 +139,14 @@ class TransformerEnd(IdentifiedObject):
 
     def setStarImpedance(self, value):
         if self._StarImpedance is not None:
-            filtered = [x for x in self.StarImpedance.TransformerEnd if x != self]
-            self._StarImpedance._TransformerEnd = filtered
+            self._StarImpedance._TransformerEnd.discard(self)
 
         self._StarImpedance = value
         if self._StarImpedance is not None:
-            if self not in self._StarImpedance._TransformerEnd:
-                self._StarImpedance._TransformerEnd.append(self)
+            if self._StarImpedance._TransformerEnd is EMPTY:
+                self._StarImpedance._TransformerEnd = AssociationList([self])
+            else:
+                self._StarImpedance._TransformerEnd.add(self)
 
     StarImpedance = property(getStarImpedance, setStarImpedance)
 
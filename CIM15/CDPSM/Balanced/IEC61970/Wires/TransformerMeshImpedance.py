@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.CDPSM.Balanced.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.CDPSM.Balanced.Element import AssociationList, EMPTY
 
 class TransformerMeshImpedance(IdentifiedObject):
     """Transformer mesh impedance (Delta-model) between transformer ends. The typical case is that TransformerMeshImpedance describe the impedance between two TransformerEnds pare wise, i.e. the cardinalities at both TranformerEnd associations are 1. But in cases where two or more TransformerEnds are operated connected together the cardinality at the ToTransfomerEnd role is larger than 1.
@@ -49,8 +50,9 @@ class TransformerMeshImpedance(IdentifiedObject):
         self._FromTransformerEnd = None
         self.FromTransformerEnd = FromTransformerEnd
 
-        self._ToTransformerEnd = []
-        self.ToTransformerEnd = [] if ToTransformerEnd is None else ToTransformerEnd
+        self._ToTransformerEnd = EMPTY
+        if ToTransformerEnd is not None:
+            self.ToTransformerEnd = ToTransformerEnd
 
         super(TransformerMeshImpedance, self).__init__(*args, **kw_args)
 
@@ -68,13 +70,14 @@ class TransformerMeshImpedance(IdentifiedObject):
 
     def setFromTransformerEnd(self, value):
         if self._FromTransformerEnd is not None:
-            filtered = [x for x in self.FromTransformerEnd.FromMeshImpedance if x != self]
-            self._FromTransformerEnd._FromMeshImpedance = filtered
+            self._FromTransformerEnd._FromMeshImpedance.discard(self)
 
         self._FromTransformerEnd = value
         if self._FromTransformerEnd is not None:
-            if self not in self._FromTransformerEnd._FromMeshImpedance:
-                self._FromTransformerEnd._FromMeshImpedance.append(self)
+            if self._FromTransformerEnd._FromMeshImpedance is EMPTY:
+                self._FromTransformerEnd._FromMeshImpedance = AssociationList([self])
+            else:
+                self._FromTransformerEnd._FromMeshImpedance.add(self)
 
     FromTransformerEnd = property(getFromTransformerEnd, setFromTransformerEnd)
 
@@ -84,21 +87,28 @@ class TransformerMeshImpedance(IdentifiedObject):
         return self._ToTransformerEnd
 
     def setToTransformerEnd(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ToTransformerEnd:
-            filtered = [q for q in p.ToMeshImpedance if q != self]
-            self._ToTransformerEnd._ToMeshImpedance = filtered
+            p._ToMeshImpedance.discard(self)
         for r in value:
-            if self not in r._ToMeshImpedance:
-                r._ToMeshImpedance.append(self)
+            if r._ToMeshImpedance is EMPTY:
+                r._ToMeshImpedance = AssociationList([self])
+            else:
+                r._ToMeshImpedance.add(self)
         self._ToTransformerEnd = value
 
     ToTransformerEnd = property(getToTransformerEnd, setToTransformerEnd)
 
     def addToTransformerEnd(self, *ToTransformerEnd):
         for obj in ToTransformerEnd:
-            if self not in obj._ToMeshImpedance:
-                obj._ToMeshImpedance.append(self)
-            self._ToTransformerEnd.append(obj)
+            if obj._ToMeshImpedance is EMPTY:
+                obj._ToMeshImpedance = AssociationList([self])
+            else:
+                obj._ToMeshImpedance.add(self)
+            if self._ToTransformerEnd is EMPTY:
+                self._ToTransformerEnd = AssociationList([obj])
+            else:
+                self._ToTransformerEnd.add(obj)
 
     def removeToTransformerEnd(self, *ToTransformerEnd):
         for obj in ToTransformerEnd:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.CDPSM.Balanced.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.CDPSM.Balanced.Element import AssociationList, EMPTY
 
 class TransformerStarImpedance(IdentifiedObject):
     """Transformer star impedance (Pi-model) that accurately reflects impedance for transformers with 2 or 3 windings. For transformers with 4 or more windings, you must use TransformerTank model and related classes. For transmission networks use PowerTransformerEnd impedances (r, r0, x, x0, b, b0, g and g0).
@@ -45,8 +46,9 @@ class TransformerStarImpedance(IdentifiedObject):
         #: Resistance of the transformer end.
         self.r = r
 
-        self._TransformerEnd = []
-        self.TransformerEnd = [] if TransformerEnd is None else TransformerEnd
+        self._TransformerEnd = EMPTY
+        if TransformerEnd is not None:
+            self.TransformerEnd = TransformerEnd
 
         super(TransformerStarImpedance, self).__init__(*args, **kw_args)
 
@@ -63,6 +65,7 @@ class TransformerStarImpedance(IdentifiedObject):
         return self._TransformerEnd
 
     def setTransformerEnd(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._TransformerEnd:
             x.StarImpedance = None
         for y in value:
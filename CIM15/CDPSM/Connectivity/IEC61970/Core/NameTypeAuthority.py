@@ -18,7 +18,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from CIM15.CDPSM.Connectivity.Element import Element
+from CIM15.CDPSM.Connectivity.Element import Element, AssociationList, EMPTY
 
 class NameTypeAuthority(Element):
     """Authority responsible for creation and management of names of a given type; typically an organization or an enterprise system.
@@ -37,8 +37,9 @@ class NameTypeAuthority(Element):
         #: Description of the name type authority.
         self.description = description
 
-        self._NameTypes = []
-        self.NameTypes = [] if NameTypes is None else NameTypes
+        self._NameTypes = EMPTY
+        if NameTypes is not None:
+            self.NameTypes = NameTypes
 
         super(NameTypeAuthority, self).__init__(*args, **kw_args)
 
@@ -55,6 +56,7 @@ class NameTypeAuthority(Element):
         return self._NameTypes
 
     def setNameTypes(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._NameTypes:
             x.NameTypeAuthority = None
         for y in value:
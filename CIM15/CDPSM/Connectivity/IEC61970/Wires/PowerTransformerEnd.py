@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.CDPSM.Connectivity.IEC61970.Wires.TransformerEnd import TransformerEnd
+from CIM15.CDPSM.Connectivity.Element import AssociationList, EMPTY
 
 class PowerTransformerEnd(TransformerEnd):
     """A PowerTransformerEnd is associated with each Terminal of a PowerTransformer. The impdedance values r, r0, x, and x0 of a PowerTransformerEnd represents a star equivalentas follows 1) for a two Terminal PowerTransformer the high voltage PowerTransformerEnd has non zero values on r, r0, x, and x0 while the low voltage PowerTransformerEnd has zero values for r, r0, x, and x0. 2) for a three Terminal PowerTransformer the three PowerTransformerEnds represents a star equivalent with each leg in the star represented by r, r0, x, and x0 values. 3) for a PowerTransformer with more than three Terminals the PowerTransformerEnd impedance values cannot be used. Instead use the TransformerMeshImpedance or split the transformer into multiple PowerTransformers.
@@ -47,13 +48,14 @@ class PowerTransformerEnd(TransformerEnd):
 
     def setPowerTransformer(self, value):
         if self._PowerTransformer is not None:
-            filtered = [x for x in self.PowerTransformer.PowerTransformerEnd if x != self]
-            self._PowerTransformer._PowerTransformerEnd = filtered
+            self._PowerTransformer._PowerTransformerEnd.discard(self)
 
         self._PowerTransformer = value
         if self._PowerTransformer is not None:
-            if self not in self._PowerTransformer._PowerTransformerEnd:
-                self._PowerTransformer._PowerTransformerEnd.append(self)
+            if self._PowerTransformer._PowerTransformerEnd is EMPTY:
+                self._PowerTransformer._PowerTransformerEnd = AssociationList([self])
+            else:
+                self._PowerTransformer._PowerTransformerEnd.add(self)
 
     PowerTransformer = property(getPowerTransformer, setPowerTransformer)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.CDPSM.Connectivity.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.CDPSM.Connectivity.Element import AssociationList, EMPTY
 
 class TransformerEnd(IdentifiedObject):
     """TransformerEnd is a conducting connection point of a power transformer. It corresponds to a physical transformer winding terminal.  In earlier CIM versions, the TransformerWinding class served a similar purpose. This successor TransformerEnd class is more flexible and has important differences with TransformerWinding.
@@ -48,13 +49,14 @@ class TransformerEnd(IdentifiedObject):
 
     def setTerminal(self, value):
         if self._Terminal is not None:
-            filtered = [x for x in self.Terminal.TransformerEnd if x != self]
-            self._Terminal._TransformerEnd = filtered
+            self._Terminal._TransformerEnd.discard(self)
 
         self._Terminal = value
         if self._Terminal is not None:
-            if self not in self._Terminal._TransformerEnd:
-                self._Terminal._TransformerEnd.append(self)
+            if self._Terminal._TransformerEnd is EMPTY:
+                self._Terminal._TransformerEnd = AssociationList([self])
+            else:
+                self._Terminal._TransformerEnd.add(self)
 
     Terminal = property(getTerminal, setTerminal)
 
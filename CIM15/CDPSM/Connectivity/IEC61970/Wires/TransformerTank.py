@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.CDPSM.Connectivity.IEC61970.Core.Equipment import Equipment
+from CIM15.CDPSM.Connectivity.Element import AssociationList, EMPTY
 
 class TransformerTank(Equipment):
     """An assembly of two or more coupled windings that transform electrical power between voltage levels. These windings are bound on a common core and place in the same tank. Transformer tank can be used to model both single-phase and 3-phase transformers.
@@ -33,8 +34,9 @@ class TransformerTank(Equipment):
         self._PowerTransformer = None
         self.PowerTransformer = PowerTransformer
 
-        self._TransformerTankEnds = []
-        self.TransformerTankEnds = [] if TransformerTankEnds is None else TransformerTankEnds
+        self._TransformerTankEnds = EMPTY
+        if TransformerTankEnds is not None:
+            self.TransformerTankEnds = TransformerTankEnds
 
         super(TransformerTank, self).__init__(*args, **kw_args)
 
@@ -52,13 +54,14 @@ class TransformerTank(Equipment):
 
     def setPowerTransformer(self, value):
         if self._PowerTransformer is not None:
-            filtered = [x for x in self.PowerTransformer.TransformerTanks if x != self]
-            self._PowerTransformer._TransformerTanks = filtered
+            self._PowerTransformer._TransformerTanks.discard(self)
 
         self._PowerTransformer = value
         if self._PowerTransformer is not None:
-            if self not in self._PowerTransformer._TransformerTanks:
-                self._PowerTransformer._TransformerTanks.append(self)
+            if self._PowerTransformer._TransformerTanks is EMPTY:
+                self._PowerTransformer._TransformerTanks = AssociationList([self])
+            else:
+                self._PowerTransformer._TransformerTanks.add(self)
 
     PowerTransformer = property(getPowerTransformer, setPowerTransformer)
 
@@ -68,6 +71,7 @@ class TransformerTank(Equipment):
         return self._TransformerTankEnds
 
     def setTransformerTankEnds(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._TransformerTankEnds:
             x.TransformerTank = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.CDPSM.Connectivity.IEC61970.Wires.TransformerEnd import TransformerEnd
+from CIM15.CDPSM.Connectivity.Element import AssociationList, EMPTY
 
 class TransformerTankEnd(TransformerEnd):
     """Transformer tank end represents an individual winding for unbalanced models or for transformer tanks connected into a bank (and bank is modelled with the PowerTransformer).
@@ -52,13 +53,14 @@ class TransformerTankEnd(TransformerEnd):
 
     def setTransformerTank(self, value):
         if self._TransformerTank is not None:
-            filtered = [x for x in self.TransformerTank.TransformerTankEnds if x != self]
-            self._TransformerTank._TransformerTankEnds = filtered
+            self._TransformerTank._TransformerTankEnds.discard(self)
 
         self._TransformerTank = value
         if self._TransformerTank is not None:
-            if self not in self._TransformerTank._TransformerTankEnds:
-                self._TransformerTank._TransformerTankEnds.append(self)
+            if self._TransformerTank._TransformerTankEnds is EMPTY:
+                self._TransformerTank._TransformerTankEnds = AssociationList([self])
+            else:
+                self._TransformerTank._TransformerTankEnds.add(self)
 
     TransformerTank = property(getTransformerTank, setTransformerTank)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.CDPSM.Geographical.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.CDPSM.Geographical.Element import AssociationList, EMPTY
 
 class CoordinateSystem(IdentifiedObject):
     """Coordinate reference system.
@@ -33,8 +34,9 @@ class CoordinateSystem(IdentifiedObject):
         #: A Uniform Resource Name (URN) for the coordinate reference system (crs) used to define 'Location.PositionPoints'. An example would be the European Petroleum Survey Group (EPSG) code for a coordinate reference system, defined in URN under the Open Geospatial Consortium (OGC) namespace as: urn:ogc :def:uom:EPSG::XXXX, where XXXX is an EPSG code (a full list of codes can be found at the EPSG Registry website http://www.epsg-registry.org/). To define the coordinate system as being WGS84 (latitude, longitude) using an EPSG OGC, this attribute would be urn:ogc:def:uom:EPSG::4236. A profile should limit this code to a set of allowed URNs agreed to by all sending and receiving parties.
         self.crsUrn = crsUrn
 
-        self._Location = []
-        self.Location = [] if Location is None else Location
+        self._Location = EMPTY
+        if Location is not None:
+            self.Location = Location
 
         super(CoordinateSystem, self).__init__(*args, **kw_args)
 
@@ -51,6 +53,7 @@ class CoordinateSystem(IdentifiedObject):
         return self._Location
 
     def setLocation(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Location:
             x.CoordinateSystem = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.CDPSM.Geographical.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.CDPSM.Geographical.Element import AssociationList, EMPTY
 
 class Location(IdentifiedObject):
     """The place, scene, or point of something where someone or something has been, is, and/or will be at a given moment in time. It can be defined with one or more postition points (coordinates) in a given coordinate system.
@@ -31,11 +32,13 @@ class Location(IdentifiedObject):
         @param PositionPoints: Sequence of position points describing this location, expressed in coordinate system 'Location.CoordinateSystem'.
         @param CoordinateSystem: Coordinate system used to describe position points of this location.
         """
-        self._PowerSystemResources = []
-        self.PowerSystemResources = [] if PowerSystemResources is None else PowerSystemResources
+        self._PowerSystemResources = EMPTY
+        if PowerSystemResources is not None:
+            self.PowerSystemResources = PowerSystemResources
 
-        self._PositionPoints = []
-        self.PositionPoints = [] if PositionPoints is None else PositionPoints
+        self._PositionPoints = EMPTY
+        if PositionPoints is not None:
+            self.PositionPoints = PositionPoints
 
         self._CoordinateSystem = None
         self.CoordinateSystem = CoordinateSystem
@@ -55,6 +58,7 @@ class Location(IdentifiedObject):
         return self._PowerSystemResources
 
     def setPowerSystemResources(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._PowerSystemResources:
             x.Location = None
         for y in value:
@@ -77,6 +81,7 @@ class Location(IdentifiedObject):
         return self._PositionPoints
 
     def setPositionPoints(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._PositionPoints:
             x.Location = None
         for y in value:
@@ -100,13 +105,14 @@ class Location(IdentifiedObject):
 
     def setCoordinateSystem(self, value):
         if self._CoordinateSystem is not None:
-            filtered = [x for x in self.CoordinateSystem.Location if x != self]
-            self._CoordinateSystem._Location = filtered
+            self._CoordinateSystem._Location.discard(self)
 
         self._CoordinateSystem = value
         if self._CoordinateSystem is not None:
-            if self not in self._CoordinateSystem._Location:
-                self._CoordinateSystem._Location.append(self)
+            if self._CoordinateSystem._Location is EMPTY:
+                self._CoordinateSystem._Location = AssociationList([self])
+            else:
+                self._CoordinateSystem._Location.add(self)
 
     CoordinateSystem = property(getCoordinateSystem, setCoordinateSystem)
 
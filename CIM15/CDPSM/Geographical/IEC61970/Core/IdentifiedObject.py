@@ -18,7 +18,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from CIM15.CDPSM.Geographical.Element import Element
+from CIM15.CDPSM.Geographical.Element import Element, AssociationList, EMPTY
 
 class IdentifiedObject(Element):
     """This is a root class to provide common identification for all classes needing identification and naming attributes
@@ -37,8 +37,9 @@ class IdentifiedObject(Element):
         #: The name is any free human readable and possibly non unique text naming the object.
         self.name = name
 
-        self._Names = []
-        self.Names = [] if Names is None else Names
+        self._Names = EMPTY
+        if Names is not None:
+            self.Names = Names
 
         super(IdentifiedObject, self).__init__(*args, **kw_args)
 
@@ -55,6 +56,7 @@ class IdentifiedObject(Element):
         return self._Names
 
     def setNames(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Names:
             x.IdentifiedObject = None
         for y in value:
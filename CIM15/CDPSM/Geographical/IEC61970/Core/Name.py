@@ -18,7 +18,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from CIM15.CDPSM.Geographical.Element import Element
+from CIM15.CDPSM.Geographical.Element import Element, AssociationList, EMPTY
 
 class Name(Element):
     """The Name class provides the means to define any number of human readable  names for an object. A name is <b>not</b> to be used for defining inter-object relationships. For inter-object relationships instead use the object identification 'mRID'.
@@ -56,13 +56,14 @@ class Name(Element):
 
     def setNameType(self, value):
         if self._NameType is not None:
-            filtered = [x for x in self.NameType.Names if x != self]
-            self._NameType._Names = filtered
+            self._NameType._Names.discard(self)
 
         self._NameType = value
         if self._NameType is not None:
-            if self not in self._NameType._Names:
-                self._NameType._Names.append(self)
+            if self._NameType._Names is EMPTY:
+                self._NameType._Names = AssociationList([self])
+            else:
+                self._NameType._Names.add(self)
 
     NameType = property(getNameType, setNameType)
 
@@ -73,13 +74,14 @@ class Name(Element):
 
     def setIdentifiedObject(self, value):
         if self._IdentifiedObject is not None:
-            filtered = [x for x in self.IdentifiedObject.Names if x != self]
-            self._IdentifiedObject._Names = filtered
+            self._IdentifiedObject._Names.discard(self)
 
         self._IdentifiedObject = value
         if self._IdentifiedObject is not None:
-            if self not in self._IdentifiedObject._Names:
-                self._IdentifiedObject._Names.append(self)
+            if self._IdentifiedObject._Names is EMPTY:
+                self._IdentifiedObject._Names = AssociationList([self])
+            else:
+                self._IdentifiedObject._Names.add(self)
 
     IdentifiedObject = property(getIdentifiedObject, setIdentifiedObject)
 
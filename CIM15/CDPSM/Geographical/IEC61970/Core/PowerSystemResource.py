@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.CDPSM.Geographical.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.CDPSM.Geographical.Element import AssociationList, EMPTY
 
 class PowerSystemResource(IdentifiedObject):
     """A power system resource can be an item of equipment such as a Switch, an EquipmentContainer containing many individual items of equipment such as a  Substation, or an organisational entity such as Company or SubControlArea.  This provides for the nesting of collections of PowerSystemResources within other PowerSystemResources. For example, a Switch could be a member of a Substation and a Substation could be a member of a division of a Company.
@@ -48,13 +49,14 @@ class PowerSystemResource(IdentifiedObject):
 
     def setLocation(self, value):
         if self._Location is not None:
-            filtered = [x for x in self.Location.PowerSystemResources if x != self]
-            self._Location._PowerSystemResources = filtered
+            self._Location._PowerSystemResources.discard(self)
 
         self._Location = value
         if self._Location is not None:
-            if self not in self._Location._PowerSystemResources:
-                self._Location._PowerSystemResources.append(self)
+            if self._Location._PowerSystemResources is EMPTY:
+                self._Location._PowerSystemResources = AssociationList([self])
+            else:
+                self._Location._PowerSystemResources.add(self)
 
     Location = property(getLocation, setLocation)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.AssetModels.ConductorInfo import ConductorInfo
+from CIM15.Element import AssociationList, EMPTY
 
 class CableInfo(ConductorInfo):
     """Cable data.Cable data.
@@ -87,13 +88,14 @@ class CableInfo(ConductorInfo):
 
     def setDuctBankInfo(self, value):
         if self._DuctBankInfo is not None:
-            filtered = [x for x in self.DuctBankInfo.CableInfos if x != self]
-            self._DuctBankInfo._CableInfos = filtered
+            self._DuctBankInfo._CableInfos.discard(self)
 
         self._DuctBankInfo = value
         if self._DuctBankInfo is not None:
-            if self not in self._DuctBankInfo._CableInfos:
-                self._DuctBankInfo._CableInfos.append(self)
+            if self._DuctBankInfo._CableInfos is EMPTY:
+                self._DuctBankInfo._CableInfos = AssociationList([self])
+            else:
+                self._DuctBankInfo._CableInfos.add(self)
 
     DuctBankInfo = property(getDuctBankInfo, setDuctBankInfo)
 
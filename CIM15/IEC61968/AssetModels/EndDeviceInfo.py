@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.AssetInfo import AssetInfo
+from CIM15.Element import AssociationList, EMPTY
 
 class EndDeviceInfo(AssetInfo):
     """End device data.End device data.
@@ -41,8 +42,9 @@ class EndDeviceInfo(AssetInfo):
         #: Rated voltage.
         self.ratedVoltage = ratedVoltage
 
-        self._EndDevices = []
-        self.EndDevices = [] if EndDevices is None else EndDevices
+        self._EndDevices = EMPTY
+        if EndDevices is not None:
+            self.EndDevices = EndDevices
 
         super(EndDeviceInfo, self).__init__(*args, **kw_args)
 
@@ -59,6 +61,7 @@ class EndDeviceInfo(AssetInfo):
         return self._EndDevices
 
     def setEndDevices(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._EndDevices:
             x.EndDeviceInfo = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.AssetModels.TransformerTest import TransformerTest
+from CIM15.Element import AssociationList, EMPTY
 
 class NoLoadTest(TransformerTest):
     """No-load test results determine core admittance parameters. They include exciting current and core loss measurements from applying voltage to one winding.  The excitation may be positive sequence or zero  sequence.  The test may be repeated at different voltages to measure saturation.No-load test results determine core admittance parameters. They include exciting current and core loss measurements from applying voltage to one winding.  The excitation may be positive sequence or zero  sequence.  The test may be repeated at different voltages to measure saturation.
@@ -68,13 +69,14 @@ class NoLoadTest(TransformerTest):
 
     def setEnergisedEnd(self, value):
         if self._EnergisedEnd is not None:
-            filtered = [x for x in self.EnergisedEnd.EnergisedEndNoLoadTest if x != self]
-            self._EnergisedEnd._EnergisedEndNoLoadTest = filtered
+            self._EnergisedEnd._EnergisedEndNoLoadTest.discard(self)
 
         self._EnergisedEnd = value
         if self._EnergisedEnd is not None:
-            if self not in self._EnergisedEnd._EnergisedEndNoLoadTest:
-                self._EnergisedEnd._EnergisedEndNoLoadTest.append(self)
+            if self._EnergisedEnd._EnergisedEndNoLoadTest is EMPTY:
+                self._EnergisedEnd._EnergisedEndNoLoadTest = AssociationList([self])
+            else:
+                self._EnergisedEnd._EnergisedEndNoLoadTest.add(self)
 
     EnergisedEnd = property(getEnergisedEnd, setEnergisedEnd)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.AssetModels.TransformerTest import TransformerTest
+from CIM15.Element import AssociationList, EMPTY
 
 class OpenCircuitTest(TransformerTest):
     """Open-circuit test results verify winding turn ratios and phase shifts. They include induced voltage and phase shift measurements on open-circuit windings, with voltage applied to the energised end.  For three-phase windings, the excitation can be positive sequence (the default) or zero sequence.Open-circuit test results verify winding turn ratios and phase shifts. They include induced voltage and phase shift measurements on open-circuit windings, with voltage applied to the energised end.  For three-phase windings, the excitation can be positive sequence (the default) or zero sequence.
@@ -72,13 +73,14 @@ class OpenCircuitTest(TransformerTest):
 
     def setOpenEnd(self, value):
         if self._OpenEnd is not None:
-            filtered = [x for x in self.OpenEnd.OpenEndOpenCircuitTests if x != self]
-            self._OpenEnd._OpenEndOpenCircuitTests = filtered
+            self._OpenEnd._OpenEndOpenCircuitTests.discard(self)
 
         self._OpenEnd = value
         if self._OpenEnd is not None:
-            if self not in self._OpenEnd._OpenEndOpenCircuitTests:
-                self._OpenEnd._OpenEndOpenCircuitTests.append(self)
+            if self._OpenEnd._OpenEndOpenCircuitTests is EMPTY:
+                self._OpenEnd._OpenEndOpenCircuitTests = AssociationList([self])
+            else:
+                self._OpenEnd._OpenEndOpenCircuitTests.add(self)
 
     OpenEnd = property(getOpenEnd, setOpenEnd)
 
@@ -89,13 +91,14 @@ class OpenCircuitTest(TransformerTest):
 
     def setEnergisedEnd(self, value):
         if self._EnergisedEnd is not None:
-            filtered = [x for x in self.EnergisedEnd.EnergisedEndOpenCircuitTests if x != self]
-            self._EnergisedEnd._EnergisedEndOpenCircuitTests = filtered
+            self._EnergisedEnd._EnergisedEndOpenCircuitTests.discard(self)
 
         self._EnergisedEnd = value
         if self._EnergisedEnd is not None:
-            if self not in self._EnergisedEnd._EnergisedEndOpenCircuitTests:
-                self._EnergisedEnd._EnergisedEndOpenCircuitTests.append(self)
+            if self._EnergisedEnd._EnergisedEndOpenCircuitTests is EMPTY:
+                self._EnergisedEnd._EnergisedEndOpenCircuitTests = AssociationList([self])
+            else:
+                self._EnergisedEnd._EnergisedEndOpenCircuitTests.add(self)
 
     EnergisedEnd = property(getEnergisedEnd, setEnergisedEnd)
 
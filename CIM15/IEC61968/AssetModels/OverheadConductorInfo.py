@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.AssetModels.ConductorInfo import ConductorInfo
+from CIM15.Element import AssociationList, EMPTY
 
 class OverheadConductorInfo(ConductorInfo):
     """Overhead conductor data.Overhead conductor data.
@@ -59,13 +60,14 @@ class OverheadConductorInfo(ConductorInfo):
 
     def setMountingPoint(self, value):
         if self._MountingPoint is not None:
-            filtered = [x for x in self.MountingPoint.OverheadConductors if x != self]
-            self._MountingPoint._OverheadConductors = filtered
+            self._MountingPoint._OverheadConductors.discard(self)
 
         self._MountingPoint = value
         if self._MountingPoint is not None:
-            if self not in self._MountingPoint._OverheadConductors:
-                self._MountingPoint._OverheadConductors.append(self)
+            if self._MountingPoint._OverheadConductors is EMPTY:
+                self._MountingPoint._OverheadConductors = AssociationList([self])
+            else:
+                self._MountingPoint._OverheadConductors.add(self)
 
     MountingPoint = property(getMountingPoint, setMountingPoint)
 
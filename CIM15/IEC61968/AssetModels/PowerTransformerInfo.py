@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.AssetInfo import AssetInfo
+from CIM15.Element import AssociationList, EMPTY
 
 class PowerTransformerInfo(AssetInfo):
     """Set of power transformer data, from an equipment library.Set of power transformer data, from an equipment library.
@@ -30,11 +31,13 @@ class PowerTransformerInfo(AssetInfo):
         @param TransformerTankInfo: Data for all the tanks described by this power transformer data.
         @param PowerTransformers: All power transformers that can be described with this power transformer data.
         """
-        self._TransformerTankInfo = []
-        self.TransformerTankInfo = [] if TransformerTankInfo is None else TransformerTankInfo
+        self._TransformerTankInfo = EMPTY
+        if TransformerTankInfo is not None:
+            self.TransformerTankInfo = TransformerTankInfo
 
-        self._PowerTransformers = []
-        self.PowerTransformers = [] if PowerTransformers is None else PowerTransformers
+        self._PowerTransformers = EMPTY
+        if PowerTransformers is not None:
+            self.PowerTransformers = PowerTransformers
 
         super(PowerTransformerInfo, self).__init__(*args, **kw_args)
 
@@ -51,6 +54,7 @@ class PowerTransformerInfo(AssetInfo):
         return self._TransformerTankInfo
 
     def setTransformerTankInfo(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._TransformerTankInfo:
             x.PowerTransformerInfo = None
         for y in value:
@@ -73,6 +77,7 @@ class PowerTransformerInfo(AssetInfo):
         return self._PowerTransformers
 
     def setPowerTransformers(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._PowerTransformers:
             x.PowerTransformerInfo = None
         for y in value:
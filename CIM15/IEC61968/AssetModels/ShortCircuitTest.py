@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.AssetModels.TransformerTest import TransformerTest
+from CIM15.Element import AssociationList, EMPTY
 
 class ShortCircuitTest(TransformerTest):
     """Short-circuit test results determine mesh impedance parameters. They include load losses and leakage impedances.  For three-phase windings, the excitation can be positive sequence (the default) or zero sequence. There must be at least one grounded winding.Short-circuit test results determine mesh impedance parameters. They include load losses and leakage impedances.  For three-phase windings, the excitation can be positive sequence (the default) or zero sequence. There must be at least one grounded winding.
@@ -54,8 +55,9 @@ class ShortCircuitTest(TransformerTest):
         #: Tap step number for the energised end of the test pair.
         self.energisedEndStep = energisedEndStep
 
-        self._GroundedEnds = []
-        self.GroundedEnds = [] if GroundedEnds is None else GroundedEnds
+        self._GroundedEnds = EMPTY
+        if GroundedEnds is not None:
+            self.GroundedEnds = GroundedEnds
 
         self._EnergisedEnd = None
         self.EnergisedEnd = EnergisedEnd
@@ -75,21 +77,28 @@ class ShortCircuitTest(TransformerTest):
         return self._GroundedEnds
 
     def setGroundedEnds(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._GroundedEnds:
-            filtered = [q for q in p.GroundedEndShortCircuitTests if q != self]
-            self._GroundedEnds._GroundedEndShortCircuitTests = filtered
+            p._GroundedEndShortCircuitTests.discard(self)
         for r in value:
-            if self not in r._GroundedEndShortCircuitTests:
-                r._GroundedEndShortCircuitTests.append(self)
+            if r._GroundedEndShortCircuitTests is EMPTY:
+                r._GroundedEndShortCircuitTests = AssociationList([self])
+            else:
+                r._GroundedEndShortCircuitTests.add(self)
         self._GroundedEnds = value
 
     GroundedEnds = property(getGroundedEnds, setGroundedEnds)
 
     def addGroundedEnds(self, *GroundedEnds):
         for obj in GroundedEnds:
-            if self not in obj._GroundedEndShortCircuitTests:
-                obj._GroundedEndShortCircuitTests.append(self)
-            self._GroundedEnds.append(obj)
+            if obj._GroundedEndShortCircuitTests is EMPTY:
+                obj._GroundedEndShortCircuitTests = AssociationList([self])
+            else:
+                obj._GroundedEndShortCircuitTests.add(self)
+            if self._GroundedEnds is EMPTY:
+                self._GroundedEnds = AssociationList([obj])
+            else:
+                self._GroundedEnds.add(obj)
 
     def removeGroundedEnds(self, *GroundedEnds):
         for obj in GroundedEnds:
@@ -104,13 +113,14 @@ class ShortCircuitTest(TransformerTest):
 
     def setEnergisedEnd(self, value):
         if self._EnergisedEnd is not None:
-            filtered = [x for x in self.EnergisedEnd.EnergisedEndShortCircuitTests if x != self]
-            self._EnergisedEnd._EnergisedEndShortCircuitTests = filtered
+            self._EnergisedEnd._EnergisedEndShortCircuitTests.discard(self)
 
         self._EnergisedEnd = value
         if self._EnergisedEnd is not None:
-            if self not in self._EnergisedEnd._EnergisedEndShortCircuitTests:
-                self._EnergisedEnd._EnergisedEndShortCircuitTests.append(self)
+            if self._EnergisedEnd._EnergisedEndShortCircuitTests is EMPTY:
+                self._EnergisedEnd._EnergisedEndShortCircuitTests = AssociationList([self])
+            else:
+                self._EnergisedEnd._EnergisedEndShortCircuitTests.add(self)
 
     EnergisedEnd = property(getEnergisedEnd, setEnergisedEnd)
 
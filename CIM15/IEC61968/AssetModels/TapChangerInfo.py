@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.AssetInfo import AssetInfo
+from CIM15.Element import AssociationList, EMPTY
 
 class TapChangerInfo(AssetInfo):
     """Tap changer data.Tap changer data.
@@ -89,8 +90,9 @@ class TapChangerInfo(AssetInfo):
         #: Basic Insulation Level (BIL) expressed as the impulse crest voltage of a nominal wave, typically 1.2 X 50 microsecond. This is a measure of the ability of the insulation to withstand very high voltage surges.
         self.bil = bil
 
-        self._TapChangers = []
-        self.TapChangers = [] if TapChangers is None else TapChangers
+        self._TapChangers = EMPTY
+        if TapChangers is not None:
+            self.TapChangers = TapChangers
 
         super(TapChangerInfo, self).__init__(*args, **kw_args)
 
@@ -107,6 +109,7 @@ class TapChangerInfo(AssetInfo):
         return self._TapChangers
 
     def setTapChangers(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._TapChangers:
             x.TapChangerInfo = None
         for y in value:
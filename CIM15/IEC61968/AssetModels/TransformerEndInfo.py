@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.AssetInfo import AssetInfo
+from CIM15.Element import AssociationList, EMPTY
 
 class TransformerEndInfo(AssetInfo):
     """Transformer end data.Transformer end data.
@@ -74,32 +75,40 @@ class TransformerEndInfo(AssetInfo):
         #: Winding phase angle where 360 degrees are represented with clock hours, so the valid values are {0, ..., 11}. For example, to express winding code 'Dyn11', set attributes as follows: 'connectionKind' = Yn and 'phaseAngleClock' = 11.
         self.phaseAngleClock = phaseAngleClock
 
-        self._FromMeshImpedance = []
-        self.FromMeshImpedance = [] if FromMeshImpedance is None else FromMeshImpedance
+        self._FromMeshImpedance = EMPTY
+        if FromMeshImpedance is not None:
+            self.FromMeshImpedance = FromMeshImpedance
 
-        self._EnergisedEndNoLoadTest = []
-        self.EnergisedEndNoLoadTest = [] if EnergisedEndNoLoadTest is None else EnergisedEndNoLoadTest
+        self._EnergisedEndNoLoadTest = EMPTY
+        if EnergisedEndNoLoadTest is not None:
+            self.EnergisedEndNoLoadTest = EnergisedEndNoLoadTest
 
-        self._OpenEndOpenCircuitTests = []
-        self.OpenEndOpenCircuitTests = [] if OpenEndOpenCircuitTests is None else OpenEndOpenCircuitTests
+        self._OpenEndOpenCircuitTests = EMPTY
+        if OpenEndOpenCircuitTests is not None:
+            self.OpenEndOpenCircuitTests = OpenEndOpenCircuitTests
 
-        self._ToMeshImpedance = []
-        self.ToMeshImpedance = [] if ToMeshImpedance is None else ToMeshImpedance
+        self._ToMeshImpedance = EMPTY
+        if ToMeshImpedance is not None:
+            self.ToMeshImpedance = ToMeshImpedance
 
-        self._TransformerEnd = []
-        self.TransformerEnd = [] if TransformerEnd is None else TransformerEnd
+        self._TransformerEnd = EMPTY
+        if TransformerEnd is not None:
+            self.TransformerEnd = TransformerEnd
 
         self._TransformerTankInfo = None
         self.TransformerTankInfo = TransformerTankInfo
 
-        self._EnergisedEndOpenCircuitTests = []
-        self.EnergisedEndOpenCircuitTests = [] if EnergisedEndOpenCircuitTests is None else EnergisedEndOpenCircuitTests
+        self._EnergisedEndOpenCircuitTests = EMPTY
+        if EnergisedEndOpenCircuitTests is not None:
+            self.EnergisedEndOpenCircuitTests = EnergisedEndOpenCircuitTests
 
-        self._GroundedEndShortCircuitTests = []
-        self.GroundedEndShortCircuitTests = [] if GroundedEndShortCircuitTests is None else GroundedEndShortCircuitTests
+        self._GroundedEndShortCircuitTests = EMPTY
+        if GroundedEndShortCircuitTests is not None:
+            self.GroundedEndShortCircuitTests = GroundedEndShortCircuitTests
 
-        self._EnergisedEndShortCircuitTests = []
-        self.EnergisedEndShortCircuitTests = [] if EnergisedEndShortCircuitTests is None else EnergisedEndShortCircuitTests
+        self._EnergisedEndShortCircuitTests = EMPTY
+        if EnergisedEndShortCircuitTests is not None:
+            self.EnergisedEndShortCircuitTests = EnergisedEndShortCircuitTests
 
         self._CoreAdmittance = None
         self.CoreAdmittance = CoreAdmittance
@@ -119,6 +128,7 @@ class TransformerEndInfo(AssetInfo):
         return self._FromMeshImpedance
 
     def setFromMeshImpedance(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._FromMeshImpedance:
             x.FromTransformerEndInfo = None
         for y in value:
@@ -141,6 +151,7 @@ class TransformerEndInfo(AssetInfo):
         return self._EnergisedEndNoLoadTest
 
     def setEnergisedEndNoLoadTest(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._EnergisedEndNoLoadTest:
             x.EnergisedEnd = None
         for y in value:
@@ -163,6 +174,7 @@ class TransformerEndInfo(AssetInfo):
         return self._OpenEndOpenCircuitTests
 
     def setOpenEndOpenCircuitTests(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._OpenEndOpenCircuitTests:
             x.OpenEnd = None
         for y in value:
@@ -185,21 +197,28 @@ class TransformerEndInfo(AssetInfo):
         return self._ToMeshImpedance
 
     def setToMeshImpedance(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ToMeshImpedance:
-            filtered = [q for q in p.ToTransformerEndInfo if q != self]
-            self._ToMeshImpedance._ToTransformerEndInfo = filtered
+            p._ToTransformerEndInfo.discard(self)
         for r in value:
-            if self not in r._ToTransformerEndInfo:
-                r._ToTransformerEndInfo.append(self)
+            if r._ToTransformerEndInfo is EMPTY:
+                r._ToTransformerEndInfo = AssociationList([self])
+            else:
+                r._ToTransformerEndInfo.add(self)
         self._ToMeshImpedance = value
 
     ToMeshImpedance = property(getToMeshImpedance, setToMeshImpedance)
 
     def addToMeshImpedance(self, *ToMeshImpedance):
         for obj in ToMeshImpedance:
-            if self not in obj._ToTransformerEndInfo:
-                obj._ToTransformerEndInfo.append(self)
-            self._ToMeshImpedance.append(obj)
+            if obj._ToTransformerEndInfo is EMPTY:
+                obj._ToTransformerEndInfo = AssociationList([self])
+            else:
+                obj._ToTransformerEndInfo.add(self)
+            if self._ToMeshImpedance is EMPTY:
+                self._ToMeshImpedance = AssociationList([obj])
+            else:
+                self._ToMeshImpedance.add(obj)
 
     def removeToMeshImpedance(self, *ToMeshImpedance):
         for obj in ToMeshImpedance:
@@ -213,6 +232,7 @@ class TransformerEndInfo(AssetInfo):
         return self._TransformerEnd
 
     def setTransformerEnd(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._TransformerEnd:
             x.TransformerEndInfo = None
         for y in value:
@@ -236,13 +256,14 @@ class TransformerEndInfo(AssetInfo):
 
     def setTransformerTankInfo(self, value):
         if self._TransformerTankInfo is not None:
-            filtered = [x for x in self.TransformerTankInfo.TransformerEndInfos if x != self]
-            self._TransformerTankInfo._TransformerEndInfos = filtered
+            self._TransformerTankInfo._TransformerEndInfos.discard(self)
 
         self._TransformerTankInfo = value
         if self._TransformerTankInfo is not None:
-            if self not in self._TransformerTankInfo._TransformerEndInfos:
-                self._TransformerTankInfo._TransformerEndInfos.append(self)
+            if self._TransformerTankInfo._TransformerEndInfos is EMPTY:
+                self._TransformerTankInfo._TransformerEndInfos = AssociationList([self])
+            else:
+                self._TransformerTankInfo._TransformerEndInfos.add(self)
 
     TransformerTankInfo = property(getTransformerTankInfo, setTransformerTankInfo)
 
@@ -252,6 +273,7 @@ class TransformerEndInfo(AssetInfo):
         return self._EnergisedEndOpenCircuitTests
 
     def setEnergisedEndOpenCircuitTests(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._EnergisedEndOpenCircuitTests:
             x.EnergisedEnd = None
         for y in value:
@@ -274,21 +296,28 @@ class TransformerEndInfo(AssetInfo):
         return self._GroundedEndShortCircuitTests
 
     def setGroundedEndShortCircuitTests(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._GroundedEndShortCircuitTests:
-            filtered = [q for q in p.GroundedEnds if q != self]
-            self._GroundedEndShortCircuitTests._GroundedEnds = filtered
+            p._GroundedEnds.discard(self)
         for r in value:
-            if self not in r._GroundedEnds:
-                r._GroundedEnds.append(self)
+            if r._GroundedEnds is EMPTY:
+                r._GroundedEnds = AssociationList([self])
+            else:
+                r._GroundedEnds.add(self)
         self._GroundedEndShortCircuitTests = value
 
     GroundedEndShortCircuitTests = property(getGroundedEndShortCircuitTests, setGroundedEndShortCircuitTests)
 
     def addGroundedEndShortCircuitTests(self, *GroundedEndShortCircuitTests):
         for obj in GroundedEndShortCircuitTests:
-            if self not in obj._GroundedEnds:
-                obj._GroundedEnds.append(self)
-            self._GroundedEndShortCircuitTests.append(obj)
+            if obj._GroundedEnds is EMPTY:
+                obj._GroundedEnds = AssociationList([self])
+            else:
+                obj._GroundedEnds.add(self)
+            if self._GroundedEndShortCircuitTests is EMPTY:
+                self._GroundedEndShortCircuitTests = AssociationList([obj])
+            else:
+                self._GroundedEndShortCircuitTests.add(obj)
 
     def removeGroundedEndShortCircuitTests(self, *GroundedEndShortCircuitTests):
         for obj in GroundedEndShortCircuitTests:
@@ -302,6 +331,7 @@ class TransformerEndInfo(AssetInfo):
         return self._EnergisedEndShortCircuitTests
 
     def setEnergisedEndShortCircuitTests(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._EnergisedEndShortCircuitTests:
             x.EnergisedEnd = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.AssetInfo import AssetInfo
+from CIM15.Element import AssociationList, EMPTY
 
 class TransformerTankInfo(AssetInfo):
     """Set of transformer tank data, from an equipment library.Set of transformer tank data, from an equipment library.
@@ -33,20 +34,24 @@ class TransformerTankInfo(AssetInfo):
         @param TransformerAssetModels:
         @param TransformerTanks: All transformer tanks that can be described with this transformer tank data.
         """
-        self._TransformerAssets = []
-        self.TransformerAssets = [] if TransformerAssets is None else TransformerAssets
+        self._TransformerAssets = EMPTY
+        if TransformerAssets is not None:
+            self.TransformerAssets = TransformerAssets
 
-        self._TransformerEndInfos = []
-        self.TransformerEndInfos = [] if TransformerEndInfos is None else TransformerEndInfos
+        self._TransformerEndInfos = EMPTY
+        if TransformerEndInfos is not None:
+            self.TransformerEndInfos = TransformerEndInfos
 
         self._PowerTransformerInfo = None
         self.PowerTransformerInfo = PowerTransformerInfo
 
-        self._TransformerAssetModels = []
-        self.TransformerAssetModels = [] if TransformerAssetModels is None else TransformerAssetModels
+        self._TransformerAssetModels = EMPTY
+        if TransformerAssetModels is not None:
+            self.TransformerAssetModels = TransformerAssetModels
 
-        self._TransformerTanks = []
-        self.TransformerTanks = [] if TransformerTanks is None else TransformerTanks
+        self._TransformerTanks = EMPTY
+        if TransformerTanks is not None:
+            self.TransformerTanks = TransformerTanks
 
         super(TransformerTankInfo, self).__init__(*args, **kw_args)
 
@@ -62,6 +67,7 @@ class TransformerTankInfo(AssetInfo):
         return self._TransformerAssets
 
     def setTransformerAssets(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._TransformerAssets:
             x.TransformerInfo = None
         for y in value:
@@ -84,6 +90,7 @@ class TransformerTankInfo(AssetInfo):
         return self._TransformerEndInfos
 
     def setTransformerEndInfos(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._TransformerEndInfos:
             x.TransformerTankInfo = None
         for y in value:
@@ -107,13 +114,14 @@ class TransformerTankInfo(AssetInfo):
 
     def setPowerTransformerInfo(self, value):
         if self._PowerTransformerInfo is not None:
-            filtered = [x for x in self.PowerTransformerInfo.TransformerTankInfo if x != self]
-            self._PowerTransformerInfo._TransformerTankInfo = filtered
+            self._PowerTransformerInfo._TransformerTankInfo.discard(self)
 
         self._PowerTransformerInfo = value
         if self._PowerTransformerInfo is not None:
-            if self not in self._PowerTransformerInfo._TransformerTankInfo:
-                self._PowerTransformerInfo._TransformerTankInfo.append(self)
+            if self._PowerTransformerInfo._TransformerTankInfo is EMPTY:
+                self._PowerTransformerInfo._TransformerTankInfo = AssociationList([self])
+            else:
+                self._PowerTransformerInfo._TransformerTankInfo.add(self)
 
     PowerTransformerInfo = property(getPowerTransformerInfo, setPowerTransformerInfo)
 
@@ -122,6 +130,7 @@ class TransformerTankInfo(AssetInfo):
         return self._TransformerAssetModels
 
     def setTransformerAssetModels(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._TransformerAssetModels:
             x.TransformerInfo = None
         for y in value:
@@ -144,6 +153,7 @@ class TransformerTankInfo(AssetInfo):
         return self._TransformerTanks
 
     def setTransformerTanks(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._TransformerTanks:
             x.TransformerTankInfo = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class Asset(IdentifiedObject):
     """Tangible resource of the utility, including power system equipment, cabinets, buildings, etc. For electrical network equipment, the role of the asset is defined through PowerSystemResource and its subclasses, defined mainly in the Wires model (refer to IEC61970-301 and model package IEC61970::Wires). Asset description places emphasis on the physical characteristics of the equipment fulfilling that role.Tangible resource of the utility, including power system equipment, cabinets, buildings, etc. For electrical network equipment, the role of the asset is defined through PowerSystemResource and its subclasses, defined mainly in the Wires model (refer to IEC61970-301 and model package IEC61970::Wires). Asset description places emphasis on the physical characteristics of the equipment fulfilling that role.
@@ -102,28 +103,35 @@ class Asset(IdentifiedObject):
         #: Lot number for this asset. Even for the same model and version number, many assets are manufactured in lots.
         self.lotNumber = lotNumber
 
-        self._DocumentRoles = []
-        self.DocumentRoles = [] if DocumentRoles is None else DocumentRoles
+        self._DocumentRoles = EMPTY
+        if DocumentRoles is not None:
+            self.DocumentRoles = DocumentRoles
 
-        self._Mediums = []
-        self.Mediums = [] if Mediums is None else Mediums
+        self._Mediums = EMPTY
+        if Mediums is not None:
+            self.Mediums = Mediums
 
-        self._ErpRecDeliveryItems = []
-        self.ErpRecDeliveryItems = [] if ErpRecDeliveryItems is None else ErpRecDeliveryItems
+        self._ErpRecDeliveryItems = EMPTY
+        if ErpRecDeliveryItems is not None:
+            self.ErpRecDeliveryItems = ErpRecDeliveryItems
 
-        self._Ratings = []
-        self.Ratings = [] if Ratings is None else Ratings
+        self._Ratings = EMPTY
+        if Ratings is not None:
+            self.Ratings = Ratings
 
-        self._ToAssetRoles = []
-        self.ToAssetRoles = [] if ToAssetRoles is None else ToAssetRoles
+        self._ToAssetRoles = EMPTY
+        if ToAssetRoles is not None:
+            self.ToAssetRoles = ToAssetRoles
 
         self.electronicAddress = electronicAddress
 
-        self._FromAssetRoles = []
-        self.FromAssetRoles = [] if FromAssetRoles is None else FromAssetRoles
+        self._FromAssetRoles = EMPTY
+        if FromAssetRoles is not None:
+            self.FromAssetRoles = FromAssetRoles
 
-        self._AssetFunctions = []
-        self.AssetFunctions = [] if AssetFunctions is None else AssetFunctions
+        self._AssetFunctions = EMPTY
+        if AssetFunctions is not None:
+            self.AssetFunctions = AssetFunctions
 
         self._ErpItemMaster = None
         self.ErpItemMaster = ErpItemMaster
@@ -131,8 +139,9 @@ class Asset(IdentifiedObject):
         self._ErpInventory = None
         self.ErpInventory = ErpInventory
 
-        self._ReliabilityInfos = []
-        self.ReliabilityInfos = [] if ReliabilityInfos is None else ReliabilityInfos
+        self._ReliabilityInfos = EMPTY
+        if ReliabilityInfos is not None:
+            self.ReliabilityInfos = ReliabilityInfos
 
         self._AssetInfo = None
         self.AssetInfo = AssetInfo
@@ -142,40 +151,48 @@ class Asset(IdentifiedObject):
 
         self.acceptanceTest = acceptanceTest
 
-        self._ErpOrganisationRoles = []
-        self.ErpOrganisationRoles = [] if ErpOrganisationRoles is None else ErpOrganisationRoles
+        self._ErpOrganisationRoles = EMPTY
+        if ErpOrganisationRoles is not None:
+            self.ErpOrganisationRoles = ErpOrganisationRoles
 
-        self._ScheduledEvents = []
-        self.ScheduledEvents = [] if ScheduledEvents is None else ScheduledEvents
+        self._ScheduledEvents = EMPTY
+        if ScheduledEvents is not None:
+            self.ScheduledEvents = ScheduledEvents
 
         self._AssetContainer = None
         self.AssetContainer = AssetContainer
 
-        self._AssetPropertyCurves = []
-        self.AssetPropertyCurves = [] if AssetPropertyCurves is None else AssetPropertyCurves
+        self._AssetPropertyCurves = EMPTY
+        if AssetPropertyCurves is not None:
+            self.AssetPropertyCurves = AssetPropertyCurves
 
-        self._ChangeItems = []
-        self.ChangeItems = [] if ChangeItems is None else ChangeItems
+        self._ChangeItems = EMPTY
+        if ChangeItems is not None:
+            self.ChangeItems = ChangeItems
 
-        self._ActivityRecords = []
-        self.ActivityRecords = [] if ActivityRecords is None else ActivityRecords
+        self._ActivityRecords = EMPTY
+        if ActivityRecords is not None:
+            self.ActivityRecords = ActivityRecords
 
         self._Location = None
         self.Location = Location
 
         self.status = status
 
-        self._PowerSystemResources = []
-        self.PowerSystemResources = [] if PowerSystemResources is None else PowerSystemResources
+        self._PowerSystemResources = EMPTY
+        if PowerSystemResources is not None:
+            self.PowerSystemResources = PowerSystemResources
 
         self._FinancialInfo = None
         self.FinancialInfo = FinancialInfo
 
-        self._Properties = []
-        self.Properties = [] if Properties is None else Properties
+        self._Properties = EMPTY
+        if Properties is not None:
+            self.Properties = Properties
 
-        self._Measurements = []
-        self.Measurements = [] if Measurements is None else Measurements
+        self._Measurements = EMPTY
+        if Measurements is not None:
+            self.Measurements = Measurements
 
         super(Asset, self).__init__(*args, **kw_args)
 
@@ -191,6 +208,7 @@ class Asset(IdentifiedObject):
         return self._DocumentRoles
 
     def setDocumentRoles(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._DocumentRoles:
             x.Asset = None
         for y in value:
@@ -212,21 +230,28 @@ class Asset(IdentifiedObject):
         return self._Mediums
 
     def setMediums(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Mediums:
-            filtered = [q for q in p.Assets if q != self]
-            self._Mediums._Assets = filtered
+            p._Assets.discard(self)
         for r in value:
-            if self not in r._Assets:
-                r._Assets.append(self)
+            if r._Assets is EMPTY:
+                r._Assets = AssociationList([self])
+            else:
+                r._Assets.add(self)
         self._Mediums = value
 
     Mediums = property(getMediums, setMediums)
 
     def addMediums(self, *Mediums):
         for obj in Mediums:
-            if self not in obj._Assets:
-                obj._Assets.append(self)
-            self._Mediums.append(obj)
+            if obj._Assets is EMPTY:
+                obj._Assets = AssociationList([self])
+            else:
+                obj._Assets.add(self)
+            if self._Mediums is EMPTY:
+                self._Mediums = AssociationList([obj])
+            else:
+                self._Mediums.add(obj)
 
     def removeMediums(self, *Mediums):
         for obj in Mediums:
@@ -239,21 +264,28 @@ class Asset(IdentifiedObject):
         return self._ErpRecDeliveryItems
 
     def setErpRecDeliveryItems(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ErpRecDeliveryItems:
-            filtered = [q for q in p.Assets if q != self]
-            self._ErpRecDeliveryItems._Assets = filtered
+            p._Assets.discard(self)
         for r in value:
-            if self not in r._Assets:
-                r._Assets.append(self)
+            if r._Assets is EMPTY:
+                r._Assets = AssociationList([self])
+            else:
+                r._Assets.add(self)
         self._ErpRecDeliveryItems = value
 
     ErpRecDeliveryItems = property(getErpRecDeliveryItems, setErpRecDeliveryItems)
 
     def addErpRecDeliveryItems(self, *ErpRecDeliveryItems):
         for obj in ErpRecDeliveryItems:
-            if self not in obj._Assets:
-                obj._Assets.append(self)
-            self._ErpRecDeliveryItems.append(obj)
+            if obj._Assets is EMPTY:
+                obj._Assets = AssociationList([self])
+            else:
+                obj._Assets.add(self)
+            if self._ErpRecDeliveryItems is EMPTY:
+                self._ErpRecDeliveryItems = AssociationList([obj])
+            else:
+                self._ErpRecDeliveryItems.add(obj)
 
     def removeErpRecDeliveryItems(self, *ErpRecDeliveryItems):
         for obj in ErpRecDeliveryItems:
@@ -267,21 +299,28 @@ class Asset(IdentifiedObject):
         return self._Ratings
 
     def setRatings(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Ratings:
-            filtered = [q for q in p.RatingAssets if q != self]
-            self._Ratings._RatingAssets = filtered
+            p._RatingAssets.discard(self)
         for r in value:
-            if self not in r._RatingAssets:
-                r._RatingAssets.append(self)
+            if r._RatingAssets is EMPTY:
+                r._RatingAssets = AssociationList([self])
+            else:
+                r._RatingAssets.add(self)
         self._Ratings = value
 
     Ratings = property(getRatings, setRatings)
 
     def addRatings(self, *Ratings):
         for obj in Ratings:
-            if self not in obj._RatingAssets:
-                obj._RatingAssets.append(self)
-            self._Ratings.append(obj)
+            if obj._RatingAssets is EMPTY:
+                obj._RatingAssets = AssociationList([self])
+            else:
+                obj._RatingAssets.add(self)
+            if self._Ratings is EMPTY:
+                self._Ratings = AssociationList([obj])
+            else:
+                self._Ratings.add(obj)
 
     def removeRatings(self, *Ratings):
         for obj in Ratings:
@@ -294,6 +333,7 @@ class Asset(IdentifiedObject):
         return self._ToAssetRoles
 
     def setToAssetRoles(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ToAssetRoles:
             x.FromAsset = None
         for y in value:
@@ -318,6 +358,7 @@ class Asset(IdentifiedObject):
         return self._FromAssetRoles
 
     def setFromAssetRoles(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._FromAssetRoles:
             x.ToAsset = None
         for y in value:
@@ -339,6 +380,7 @@ class Asset(IdentifiedObject):
         return self._AssetFunctions
 
     def setAssetFunctions(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._AssetFunctions:
             x.Asset = None
         for y in value:
@@ -390,21 +432,28 @@ class Asset(IdentifiedObject):
         return self._ReliabilityInfos
 
     def setReliabilityInfos(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ReliabilityInfos:
-            filtered = [q for q in p.Assets if q != self]
-            self._ReliabilityInfos._Assets = filtered
+            p._Assets.discard(self)
         for r in value:
-            if self not in r._Assets:
-                r._Assets.append(self)
+            if r._Assets is EMPTY:
+                r._Assets = AssociationList([self])
+            else:
+                r._Assets.add(self)
         self._ReliabilityInfos = value
 
     ReliabilityInfos = property(getReliabilityInfos, setReliabilityInfos)
 
     def addReliabilityInfos(self, *ReliabilityInfos):
         for obj in ReliabilityInfos:
-            if self not in obj._Assets:
-                obj._Assets.append(self)
-            self._ReliabilityInfos.append(obj)
+            if obj._Assets is EMPTY:
+                obj._Assets = AssociationList([self])
+            else:
+                obj._Assets.add(self)
+            if self._ReliabilityInfos is EMPTY:
+                self._ReliabilityInfos = AssociationList([obj])
+            else:
+                self._ReliabilityInfos.add(obj)
 
     def removeReliabilityInfos(self, *ReliabilityInfos):
         for obj in ReliabilityInfos:
@@ -434,13 +483,14 @@ class Asset(IdentifiedObject):
 
     def setWorkTask(self, value):
         if self._WorkTask is not None:
-            filtered = [x for x in self.WorkTask.Assets if x != self]
-            self._WorkTask._Assets = filtered
+            self._WorkTask._Assets.discard(self)
 
         self._WorkTask = value
         if self._WorkTask is not None:
-            if self not in self._WorkTask._Assets:
-                self._WorkTask._Assets.append(self)
+            if self._WorkTask._Assets is EMPTY:
+                self._WorkTask._Assets = AssociationList([self])
+            else:
+                self._WorkTask._Assets.add(self)
 
     WorkTask = property(getWorkTask, setWorkTask)
 
@@ -452,6 +502,7 @@ class Asset(IdentifiedObject):
         return self._ErpOrganisationRoles
 
     def setErpOrganisationRoles(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ErpOrganisationRoles:
             x.Asset = None
         for y in value:
@@ -473,21 +524,28 @@ class Asset(IdentifiedObject):
         return self._ScheduledEvents
 
     def setScheduledEvents(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ScheduledEvents:
-            filtered = [q for q in p.Assets if q != self]
-            self._ScheduledEvents._Assets = filtered
+            p._Assets.discard(self)
         for r in value:
-            if self not in r._Assets:
-                r._Assets.append(self)
+            if r._Assets is EMPTY:
+                r._Assets = AssociationList([self])
+            else:
+                r._Assets.add(self)
         self._ScheduledEvents = value
 
     ScheduledEvents = property(getScheduledEvents, setScheduledEvents)
 
     def addScheduledEvents(self, *ScheduledEvents):
         for obj in ScheduledEvents:
-            if self not in obj._Assets:
-                obj._Assets.append(self)
-            self._ScheduledEvents.append(obj)
+            if obj._Assets is EMPTY:
+                obj._Assets = AssociationList([self])
+            else:
+                obj._Assets.add(self)
+            if self._ScheduledEvents is EMPTY:
+                self._ScheduledEvents = AssociationList([obj])
+            else:
+                self._ScheduledEvents.add(obj)
 
     def removeScheduledEvents(self, *ScheduledEvents):
         for obj in ScheduledEvents:
@@ -501,13 +559,14 @@ class Asset(IdentifiedObject):
 
     def setAssetContainer(self, value):
         if self._AssetContainer is not None:
-            filtered = [x for x in self.AssetContainer.Assets if x != self]
-            self._AssetContainer._Assets = filtered
+            self._AssetContainer._Assets.discard(self)
 
         self._AssetContainer = value
         if self._AssetContainer is not None:
-            if self not in self._AssetContainer._Assets:
-                self._AssetContainer._Assets.append(self)
+            if self._AssetContainer._Assets is EMPTY:
+                self._AssetContainer._Assets = AssociationList([self])
+            else:
+                self._AssetContainer._Assets.add(self)
 
     AssetContainer = property(getAssetContainer, setAssetContainer)
 
@@ -516,21 +575,28 @@ class Asset(IdentifiedObject):
         return self._AssetPropertyCurves
 
     def setAssetPropertyCurves(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._AssetPropertyCurves:
-            filtered = [q for q in p.Assets if q != self]
-            self._AssetPropertyCurves._Assets = filtered
+            p._Assets.discard(self)
         for r in value:
-            if self not in r._Assets:
-                r._Assets.append(self)
+            if r._Assets is EMPTY:
+                r._Assets = AssociationList([self])
+            else:
+                r._Assets.add(self)
         self._AssetPropertyCurves = value
 
     AssetPropertyCurves = property(getAssetPropertyCurves, setAssetPropertyCurves)
 
     def addAssetPropertyCurves(self, *AssetPropertyCurves):
         for obj in AssetPropertyCurves:
-            if self not in obj._Assets:
-                obj._Assets.append(self)
-            self._AssetPropertyCurves.append(obj)
+            if obj._Assets is EMPTY:
+                obj._Assets = AssociationList([self])
+            else:
+                obj._Assets.add(self)
+            if self._AssetPropertyCurves is EMPTY:
+                self._AssetPropertyCurves = AssociationList([obj])
+            else:
+                self._AssetPropertyCurves.add(obj)
 
     def removeAssetPropertyCurves(self, *AssetPropertyCurves):
         for obj in AssetPropertyCurves:
@@ -543,6 +609,7 @@ class Asset(IdentifiedObject):
         return self._ChangeItems
 
     def setChangeItems(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ChangeItems:
             x.Asset = None
         for y in value:
@@ -565,21 +632,28 @@ class Asset(IdentifiedObject):
         return self._ActivityRecords
 
     def setActivityRecords(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ActivityRecords:
-            filtered = [q for q in p.Assets if q != self]
-            self._ActivityRecords._Assets = filtered
+            p._Assets.discard(self)
         for r in value:
-            if self not in r._Assets:
-                r._Assets.append(self)
+            if r._Assets is EMPTY:
+                r._Assets = AssociationList([self])
+            else:
+                r._Assets.add(self)
         self._ActivityRecords = value
 
     ActivityRecords = property(getActivityRecords, setActivityRecords)
 
     def addActivityRecords(self, *ActivityRecords):
         for obj in ActivityRecords:
-            if self not in obj._Assets:
-                obj._Assets.append(self)
-            self._ActivityRecords.append(obj)
+            if obj._Assets is EMPTY:
+                obj._Assets = AssociationList([self])
+            else:
+                obj._Assets.add(self)
+            if self._ActivityRecords is EMPTY:
+                self._ActivityRecords = AssociationList([obj])
+            else:
+                self._ActivityRecords.add(obj)
 
     def removeActivityRecords(self, *ActivityRecords):
         for obj in ActivityRecords:
@@ -594,13 +668,14 @@ class Asset(IdentifiedObject):
 
     def setLocation(self, value):
         if self._Location is not None:
-            filtered = [x for x in self.Location.Assets if x != self]
-            self._Location._Assets = filtered
+            self._Location._Assets.discard(self)
 
         self._Location = value
         if self._Location is not None:
-            if self not in self._Location._Assets:
-                self._Location._Assets.append(self)
+            if self._Location._Assets is EMPTY:
+                self._Location._Assets = AssociationList([self])
+            else:
+                self._Location._Assets.add(self)
 
     Location = property(getLocation, setLocation)
 
@@ -613,21 +688,28 @@ class Asset(IdentifiedObject):
         return self._PowerSystemResources
 
     def setPowerSystemResources(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._PowerSystemResources:
-            filtered = [q for q in p.Assets if q != self]
-            self._PowerSystemResources._Assets = filtered
+            p._Assets.discard(self)
         for r in value:
-            if self not in r._Assets:
-                r._Assets.append(self)
+            if r._Assets is EMPTY:
+                r._Assets = AssociationList([self])
+            else:
+                r._Assets.add(self)
         self._PowerSystemResources = value
 
     PowerSystemResources = property(getPowerSystemResources, setPowerSystemResources)
 
     def addPowerSystemResources(self, *PowerSystemResources):
         for obj in PowerSystemResources:
-            if self not in obj._Assets:
-                obj._Assets.append(self)
-            self._PowerSystemResources.append(obj)
+            if obj._Assets is EMPTY:
+                obj._Assets = AssociationList([self])
+            else:
+                obj._Assets.add(self)
+            if self._PowerSystemResources is EMPTY:
+                self._PowerSystemResources = AssociationList([obj])
+            else:
+                self._PowerSystemResources.add(obj)
 
     def removePowerSystemResources(self, *PowerSystemResources):
         for obj in PowerSystemResources:
@@ -656,21 +738,28 @@ class Asset(IdentifiedObject):
         return self._Properties
 
     def setProperties(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Properties:
-            filtered = [q for q in p.PropertyAssets if q != self]
-            self._Properties._PropertyAssets = filtered
+            p._PropertyAssets.discard(self)
         for r in value:
-            if self not in r._PropertyAssets:
-                r._PropertyAssets.append(self)
+            if r._PropertyAssets is EMPTY:
+                r._PropertyAssets = AssociationList([self])
+            else:
+                r._PropertyAssets.add(self)
         self._Properties = value
 
     Properties = property(getProperties, setProperties)
 
     def addProperties(self, *Properties):
         for obj in Properties:
-            if self not in obj._PropertyAssets:
-                obj._PropertyAssets.append(self)
-            self._Properties.append(obj)
+            if obj._PropertyAssets is EMPTY:
+                obj._PropertyAssets = AssociationList([self])
+            else:
+                obj._PropertyAssets.add(self)
+            if self._Properties is EMPTY:
+                self._Properties = AssociationList([obj])
+            else:
+                self._Properties.add(obj)
 
     def removeProperties(self, *Properties):
         for obj in Properties:
@@ -683,6 +772,7 @@ class Asset(IdentifiedObject):
         return self._Measurements
 
     def setMeasurements(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Measurements:
             x.Asset = None
         for y in value:
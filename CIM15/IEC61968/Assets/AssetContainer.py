@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.Asset import Asset
+from CIM15.Element import AssociationList, EMPTY
 
 class AssetContainer(Asset):
     """Asset that is aggregation of other assets such as conductors, transformers, switchgear, land, fences, buildings, equipment, vehicles, etc.Asset that is aggregation of other assets such as conductors, transformers, switchgear, land, fences, buildings, equipment, vehicles, etc.
@@ -31,14 +32,17 @@ class AssetContainer(Asset):
         @param Assets:
         @param LandProperties:
         """
-        self._Seals = []
-        self.Seals = [] if Seals is None else Seals
+        self._Seals = EMPTY
+        if Seals is not None:
+            self.Seals = Seals
 
-        self._Assets = []
-        self.Assets = [] if Assets is None else Assets
+        self._Assets = EMPTY
+        if Assets is not None:
+            self.Assets = Assets
 
-        self._LandProperties = []
-        self.LandProperties = [] if LandProperties is None else LandProperties
+        self._LandProperties = EMPTY
+        if LandProperties is not None:
+            self.LandProperties = LandProperties
 
         super(AssetContainer, self).__init__(*args, **kw_args)
 
@@ -55,6 +59,7 @@ class AssetContainer(Asset):
         return self._Seals
 
     def setSeals(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Seals:
             x.AssetContainer = None
         for y in value:
@@ -76,6 +81,7 @@ class AssetContainer(Asset):
         return self._Assets
 
     def setAssets(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Assets:
             x.AssetContainer = None
         for y in value:
@@ -97,21 +103,28 @@ class AssetContainer(Asset):
         return self._LandProperties
 
     def setLandProperties(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._LandProperties:
-            filtered = [q for q in p.AssetContainers if q != self]
-            self._LandProperties._AssetContainers = filtered
+            p._AssetContainers.discard(self)
         for r in value:
-            if self not in r._AssetContainers:
-                r._AssetContainers.append(self)
+            if r._AssetContainers is EMPTY:
+                r._AssetContainers = AssociationList([self])
+            else:
+                r._AssetContainers.add(self)
         self._LandProperties = value
 
     LandProperties = property(getLandProperties, setLandProperties)
 
     def addLandProperties(self, *LandProperties):
         for obj in LandProperties:
-            if self not in obj._AssetContainers:
-                obj._AssetContainers.append(self)
-            self._LandProperties.append(obj)
+            if obj._AssetContainers is EMPTY:
+                obj._AssetContainers = AssociationList([self])
+            else:
+                obj._AssetContainers.add(self)
+            if self._LandProperties is EMPTY:
+                self._LandProperties = AssociationList([obj])
+            else:
+                self._LandProperties.add(obj)
 
     def removeLandProperties(self, *LandProperties):
         for obj in LandProperties:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class AssetInfo(IdentifiedObject):
     """Set of attributes of an asset, representing typical data-sheet information of a physical device, that can be instantiated and shared in different data exchange contexts: - as attributes of an asset instance (installed or in stock) - as attributes of an asset model (product by a manufacturer) - as attributes of a type asset (generic type of an asset as used in designs/extension planning).Set of attributes of an asset, representing typical data-sheet information of a physical device, that can be instantiated and shared in different data exchange contexts: - as attributes of an asset instance (installed or in stock) - as attributes of an asset model (product by a manufacturer) - as attributes of a type asset (generic type of an asset as used in designs/extension planning).
@@ -71,13 +72,14 @@ class AssetInfo(IdentifiedObject):
 
     def setDimensionsInfo(self, value):
         if self._DimensionsInfo is not None:
-            filtered = [x for x in self.DimensionsInfo.AssetInfos if x != self]
-            self._DimensionsInfo._AssetInfos = filtered
+            self._DimensionsInfo._AssetInfos.discard(self)
 
         self._DimensionsInfo = value
         if self._DimensionsInfo is not None:
-            if self not in self._DimensionsInfo._AssetInfos:
-                self._DimensionsInfo._AssetInfos.append(self)
+            if self._DimensionsInfo._AssetInfos is EMPTY:
+                self._DimensionsInfo._AssetInfos = AssociationList([self])
+            else:
+                self._DimensionsInfo._AssetInfos.add(self)
 
     DimensionsInfo = property(getDimensionsInfo, setDimensionsInfo)
 
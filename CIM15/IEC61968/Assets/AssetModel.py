@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class AssetModel(IdentifiedObject):
     """Model of an asset, either a product of a specific manufacturer or a generic asset model or material item. Data-sheet characteristics are available through the associated AssetInfo subclass and can be shared with asset or power system resource instances.Model of an asset, either a product of a specific manufacturer or a generic asset model or material item. Data-sheet characteristics are available through the associated AssetInfo subclass and can be shared with asset or power system resource instances.
@@ -33,8 +34,9 @@ class AssetModel(IdentifiedObject):
         self._AssetInfo = None
         self.AssetInfo = AssetInfo
 
-        self._ErpInventoryCounts = []
-        self.ErpInventoryCounts = [] if ErpInventoryCounts is None else ErpInventoryCounts
+        self._ErpInventoryCounts = EMPTY
+        if ErpInventoryCounts is not None:
+            self.ErpInventoryCounts = ErpInventoryCounts
 
         super(AssetModel, self).__init__(*args, **kw_args)
 
@@ -66,6 +68,7 @@ class AssetModel(IdentifiedObject):
         return self._ErpInventoryCounts
 
     def setErpInventoryCounts(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ErpInventoryCounts:
             x.AssetModel = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.AssetModel import AssetModel
+from CIM15.Element import AssociationList, EMPTY
 
 class ProductAssetModel(AssetModel):
     """Asset model by a specific manufacturer.Asset model by a specific manufacturer.
@@ -53,8 +54,9 @@ class ProductAssetModel(AssetModel):
         self._GenericAssetModelOrMaterial = None
         self.GenericAssetModelOrMaterial = GenericAssetModelOrMaterial
 
-        self._AssetModelCatalogueItems = []
-        self.AssetModelCatalogueItems = [] if AssetModelCatalogueItems is None else AssetModelCatalogueItems
+        self._AssetModelCatalogueItems = EMPTY
+        if AssetModelCatalogueItems is not None:
+            self.AssetModelCatalogueItems = AssetModelCatalogueItems
 
         super(ProductAssetModel, self).__init__(*args, **kw_args)
 
@@ -72,13 +74,14 @@ class ProductAssetModel(AssetModel):
 
     def setGenericAssetModelOrMaterial(self, value):
         if self._GenericAssetModelOrMaterial is not None:
-            filtered = [x for x in self.GenericAssetModelOrMaterial.ProductAssetModels if x != self]
-            self._GenericAssetModelOrMaterial._ProductAssetModels = filtered
+            self._GenericAssetModelOrMaterial._ProductAssetModels.discard(self)
 
         self._GenericAssetModelOrMaterial = value
         if self._GenericAssetModelOrMaterial is not None:
-            if self not in self._GenericAssetModelOrMaterial._ProductAssetModels:
-                self._GenericAssetModelOrMaterial._ProductAssetModels.append(self)
+            if self._GenericAssetModelOrMaterial._ProductAssetModels is EMPTY:
+                self._GenericAssetModelOrMaterial._ProductAssetModels = AssociationList([self])
+            else:
+                self._GenericAssetModelOrMaterial._ProductAssetModels.add(self)
 
     GenericAssetModelOrMaterial = property(getGenericAssetModelOrMaterial, setGenericAssetModelOrMaterial)
 
@@ -87,6 +90,7 @@ class ProductAssetModel(AssetModel):
         return self._AssetModelCatalogueItems
 
     def setAssetModelCatalogueItems(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._AssetModelCatalogueItems:
             x.AssetModel = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class ActivityRecord(IdentifiedObject):
     """Records activity for an entity at a point in time; activity may be for an event that has already occurred or for a planned activity.Records activity for an entity at a point in time; activity may be for an event that has already occurred or for a planned activity.
@@ -50,17 +51,21 @@ class ActivityRecord(IdentifiedObject):
         #: Category of event resulting in this activity record.
         self.category = category
 
-        self._ErpPersons = []
-        self.ErpPersons = [] if ErpPersons is None else ErpPersons
+        self._ErpPersons = EMPTY
+        if ErpPersons is not None:
+            self.ErpPersons = ErpPersons
 
-        self._Organisations = []
-        self.Organisations = [] if Organisations is None else Organisations
+        self._Organisations = EMPTY
+        if Organisations is not None:
+            self.Organisations = Organisations
 
-        self._Documents = []
-        self.Documents = [] if Documents is None else Documents
+        self._Documents = EMPTY
+        if Documents is not None:
+            self.Documents = Documents
 
-        self._Assets = []
-        self.Assets = [] if Assets is None else Assets
+        self._Assets = EMPTY
+        if Assets is not None:
+            self.Assets = Assets
 
         self.status = status
 
@@ -81,21 +86,28 @@ class ActivityRecord(IdentifiedObject):
         return self._ErpPersons
 
     def setErpPersons(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ErpPersons:
-            filtered = [q for q in p.ActivityRecords if q != self]
-            self._ErpPersons._ActivityRecords = filtered
+            p._ActivityRecords.discard(self)
         for r in value:
-            if self not in r._ActivityRecords:
-                r._ActivityRecords.append(self)
+            if r._ActivityRecords is EMPTY:
+                r._ActivityRecords = AssociationList([self])
+            else:
+                r._ActivityRecords.add(self)
         self._ErpPersons = value
 
     ErpPersons = property(getErpPersons, setErpPersons)
 
     def addErpPersons(self, *ErpPersons):
         for obj in ErpPersons:
-            if self not in obj._ActivityRecords:
-                obj._ActivityRecords.append(self)
-            self._ErpPersons.append(obj)
+            if obj._ActivityRecords is EMPTY:
+                obj._ActivityRecords = AssociationList([self])
+            else:
+                obj._ActivityRecords.add(self)
+            if self._ErpPersons is EMPTY:
+                self._ErpPersons = AssociationList([obj])
+            else:
+                self._ErpPersons.add(obj)
 
     def removeErpPersons(self, *ErpPersons):
         for obj in ErpPersons:
@@ -108,21 +120,28 @@ class ActivityRecord(IdentifiedObject):
         return self._Organisations
 
     def setOrganisations(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Organisations:
-            filtered = [q for q in p.ActivityRecords if q != self]
-            self._Organisations._ActivityRecords = filtered
+            p._ActivityRecords.discard(self)
         for r in value:
-            if self not in r._ActivityRecords:
-                r._ActivityRecords.append(self)
+            if r._ActivityRecords is EMPTY:
+                r._ActivityRecords = AssociationList([self])
+            else:
+                r._ActivityRecords.add(self)
         self._Organisations = value
 
     Organisations = property(getOrganisations, setOrganisations)
 
     def addOrganisations(self, *Organisations):
         for obj in Organisations:
-            if self not in obj._ActivityRecords:
-                obj._ActivityRecords.append(self)
-            self._Organisations.append(obj)
+            if obj._ActivityRecords is EMPTY:
+                obj._ActivityRecords = AssociationList([self])
+            else:
+                obj._ActivityRecords.add(self)
+            if self._Organisations is EMPTY:
+                self._Organisations = AssociationList([obj])
+            else:
+                self._Organisations.add(obj)
 
     def removeOrganisations(self, *Organisations):
         for obj in Organisations:
@@ -136,21 +155,28 @@ class ActivityRecord(IdentifiedObject):
         return self._Documents
 
     def setDocuments(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Documents:
-            filtered = [q for q in p.ActivityRecords if q != self]
-            self._Documents._ActivityRecords = filtered
+            p._ActivityRecords.discard(self)
         for r in value:
-            if self not in r._ActivityRecords:
-                r._ActivityRecords.append(self)
+            if r._ActivityRecords is EMPTY:
+                r._ActivityRecords = AssociationList([self])
+            else:
+                r._ActivityRecords.add(self)
         self._Documents = value
 
     Documents = property(getDocuments, setDocuments)
 
     def addDocuments(self, *Documents):
         for obj in Documents:
-            if self not in obj._ActivityRecords:
-                obj._ActivityRecords.append(self)
-            self._Documents.append(obj)
+            if obj._ActivityRecords is EMPTY:
+                obj._ActivityRecords = AssociationList([self])
+            else:
+                obj._ActivityRecords.add(self)
+            if self._Documents is EMPTY:
+                self._Documents = AssociationList([obj])
+            else:
+                self._Documents.add(obj)
 
     def removeDocuments(self, *Documents):
         for obj in Documents:
@@ -164,21 +190,28 @@ class ActivityRecord(IdentifiedObject):
         return self._Assets
 
     def setAssets(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Assets:
-            filtered = [q for q in p.ActivityRecords if q != self]
-            self._Assets._ActivityRecords = filtered
+            p._ActivityRecords.discard(self)
         for r in value:
-            if self not in r._ActivityRecords:
-                r._ActivityRecords.append(self)
+            if r._ActivityRecords is EMPTY:
+                r._ActivityRecords = AssociationList([self])
+            else:
+                r._ActivityRecords.add(self)
         self._Assets = value
 
     Assets = property(getAssets, setAssets)
 
     def addAssets(self, *Assets):
         for obj in Assets:
-            if self not in obj._ActivityRecords:
-                obj._ActivityRecords.append(self)
-            self._Assets.append(obj)
+            if obj._ActivityRecords is EMPTY:
+                obj._ActivityRecords = AssociationList([self])
+            else:
+                obj._ActivityRecords.add(self)
+            if self._Assets is EMPTY:
+                self._Assets = AssociationList([obj])
+            else:
+                self._Assets.add(obj)
 
     def removeAssets(self, *Assets):
         for obj in Assets:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class CoordinateSystem(IdentifiedObject):
     """Coordinate reference system.Coordinate reference system.
@@ -35,14 +36,17 @@ class CoordinateSystem(IdentifiedObject):
         #: A Uniform Resource Name (URN) for the coordinate reference system (crs) used to define 'Location.PositionPoints'. An example would be the European Petroleum Survey Group (EPSG) code for a coordinate reference system, defined in URN under the Open Geospatial Consortium (OGC) namespace as: urn:ogc :def:uom:EPSG::XXXX, where XXXX is an EPSG code (a full list of codes can be found at the EPSG Registry website http://www.epsg-registry.org/). To define the coordinate system as being WGS84 (latitude, longitude) using an EPSG OGC, this attribute would be urn:ogc:def:uom:EPSG::4236. A profile should limit this code to a set of allowed URNs agreed to by all sending and receiving parties.
         self.crsUrn = crsUrn
 
-        self._Diagrams = []
-        self.Diagrams = [] if Diagrams is None else Diagrams
+        self._Diagrams = EMPTY
+        if Diagrams is not None:
+            self.Diagrams = Diagrams
 
-        self._Location = []
-        self.Location = [] if Location is None else Location
+        self._Location = EMPTY
+        if Location is not None:
+            self.Location = Location
 
-        self._GmlDiagramObjects = []
-        self.GmlDiagramObjects = [] if GmlDiagramObjects is None else GmlDiagramObjects
+        self._GmlDiagramObjects = EMPTY
+        if GmlDiagramObjects is not None:
+            self.GmlDiagramObjects = GmlDiagramObjects
 
         super(CoordinateSystem, self).__init__(*args, **kw_args)
 
@@ -58,6 +62,7 @@ class CoordinateSystem(IdentifiedObject):
         return self._Diagrams
 
     def setDiagrams(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Diagrams:
             x.CoordinateSystem = None
         for y in value:
@@ -80,6 +85,7 @@ class CoordinateSystem(IdentifiedObject):
         return self._Location
 
     def setLocation(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Location:
             x.CoordinateSystem = None
         for y in value:
@@ -101,21 +107,28 @@ class CoordinateSystem(IdentifiedObject):
         return self._GmlDiagramObjects
 
     def setGmlDiagramObjects(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._GmlDiagramObjects:
-            filtered = [q for q in p.CoordinateSystems if q != self]
-            self._GmlDiagramObjects._CoordinateSystems = filtered
+            p._CoordinateSystems.discard(self)
         for r in value:
-            if self not in r._CoordinateSystems:
-                r._CoordinateSystems.append(self)
+            if r._CoordinateSystems is EMPTY:
+                r._CoordinateSystems = AssociationList([self])
+            else:
+                r._CoordinateSystems.add(self)
         self._GmlDiagramObjects = value
 
     GmlDiagramObjects = property(getGmlDiagramObjects, setGmlDiagramObjects)
 
     def addGmlDiagramObjects(self, *GmlDiagramObjects):
         for obj in GmlDiagramObjects:
-            if self not in obj._CoordinateSystems:
-                obj._CoordinateSystems.append(self)
-            self._GmlDiagramObjects.append(obj)
+            if obj._CoordinateSystems is EMPTY:
+                obj._CoordinateSystems = AssociationList([self])
+            else:
+                obj._CoordinateSystems.add(self)
+            if self._GmlDiagramObjects is EMPTY:
+                self._GmlDiagramObjects = AssociationList([obj])
+            else:
+                self._GmlDiagramObjects.add(obj)
 
     def removeGmlDiagramObjects(self, *GmlDiagramObjects):
         for obj in GmlDiagramObjects:
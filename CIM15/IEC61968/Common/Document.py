@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class Document(IdentifiedObject):
     """Parent class for different groupings of information collected and managed as a part of a business process. It will frequently contain references to other objects, such as assets, people and power system resources.Parent class for different groupings of information collected and managed as a part of a business process. It will frequently contain references to other objects, such as assets, people and power system resources.
@@ -68,50 +69,63 @@ class Document(IdentifiedObject):
         #: Utility-specific categorisation of this document, according to their corporate standards, practices, and existing IT systems (e.g., for management of assets, maintenance, work, outage, customers, etc.).
         self.category = category
 
-        self._ChangeItems = []
-        self.ChangeItems = [] if ChangeItems is None else ChangeItems
+        self._ChangeItems = EMPTY
+        if ChangeItems is not None:
+            self.ChangeItems = ChangeItems
 
-        self._ToDocumentRoles = []
-        self.ToDocumentRoles = [] if ToDocumentRoles is None else ToDocumentRoles
+        self._ToDocumentRoles = EMPTY
+        if ToDocumentRoles is not None:
+            self.ToDocumentRoles = ToDocumentRoles
 
         self.electronicAddress = electronicAddress
 
-        self._NetworkDataSets = []
-        self.NetworkDataSets = [] if NetworkDataSets is None else NetworkDataSets
+        self._NetworkDataSets = EMPTY
+        if NetworkDataSets is not None:
+            self.NetworkDataSets = NetworkDataSets
 
-        self._FromDocumentRoles = []
-        self.FromDocumentRoles = [] if FromDocumentRoles is None else FromDocumentRoles
+        self._FromDocumentRoles = EMPTY
+        if FromDocumentRoles is not None:
+            self.FromDocumentRoles = FromDocumentRoles
 
-        self._ScheduleParameterInfos = []
-        self.ScheduleParameterInfos = [] if ScheduleParameterInfos is None else ScheduleParameterInfos
+        self._ScheduleParameterInfos = EMPTY
+        if ScheduleParameterInfos is not None:
+            self.ScheduleParameterInfos = ScheduleParameterInfos
 
-        self._ErpOrganisationRoles = []
-        self.ErpOrganisationRoles = [] if ErpOrganisationRoles is None else ErpOrganisationRoles
+        self._ErpOrganisationRoles = EMPTY
+        if ErpOrganisationRoles is not None:
+            self.ErpOrganisationRoles = ErpOrganisationRoles
 
-        self._Measurements = []
-        self.Measurements = [] if Measurements is None else Measurements
+        self._Measurements = EMPTY
+        if Measurements is not None:
+            self.Measurements = Measurements
 
-        self._ActivityRecords = []
-        self.ActivityRecords = [] if ActivityRecords is None else ActivityRecords
+        self._ActivityRecords = EMPTY
+        if ActivityRecords is not None:
+            self.ActivityRecords = ActivityRecords
 
-        self._ChangeSets = []
-        self.ChangeSets = [] if ChangeSets is None else ChangeSets
+        self._ChangeSets = EMPTY
+        if ChangeSets is not None:
+            self.ChangeSets = ChangeSets
 
-        self._ErpPersonRoles = []
-        self.ErpPersonRoles = [] if ErpPersonRoles is None else ErpPersonRoles
+        self._ErpPersonRoles = EMPTY
+        if ErpPersonRoles is not None:
+            self.ErpPersonRoles = ErpPersonRoles
 
-        self._ScheduledEvents = []
-        self.ScheduledEvents = [] if ScheduledEvents is None else ScheduledEvents
+        self._ScheduledEvents = EMPTY
+        if ScheduledEvents is not None:
+            self.ScheduledEvents = ScheduledEvents
 
         self.docStatus = docStatus
 
-        self._AssetRoles = []
-        self.AssetRoles = [] if AssetRoles is None else AssetRoles
+        self._AssetRoles = EMPTY
+        if AssetRoles is not None:
+            self.AssetRoles = AssetRoles
 
         self.status = status
 
-        self._PowerSystemResourceRoles = []
-        self.PowerSystemResourceRoles = [] if PowerSystemResourceRoles is None else PowerSystemResourceRoles
+        self._PowerSystemResourceRoles = EMPTY
+        if PowerSystemResourceRoles is not None:
+            self.PowerSystemResourceRoles = PowerSystemResourceRoles
 
         super(Document, self).__init__(*args, **kw_args)
 
@@ -127,6 +141,7 @@ class Document(IdentifiedObject):
         return self._ChangeItems
 
     def setChangeItems(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ChangeItems:
             x.Document = None
         for y in value:
@@ -148,6 +163,7 @@ class Document(IdentifiedObject):
         return self._ToDocumentRoles
 
     def setToDocumentRoles(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ToDocumentRoles:
             x.FromDocument = None
         for y in value:
@@ -172,21 +188,28 @@ class Document(IdentifiedObject):
         return self._NetworkDataSets
 
     def setNetworkDataSets(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._NetworkDataSets:
-            filtered = [q for q in p.Documents if q != self]
-            self._NetworkDataSets._Documents = filtered
+            p._Documents.discard(self)
         for r in value:
-            if self not in r._Documents:
-                r._Documents.append(self)
+            if r._Documents is EMPTY:
+                r._Documents = AssociationList([self])
+            else:
+                r._Documents.add(self)
         self._NetworkDataSets = value
 
     NetworkDataSets = property(getNetworkDataSets, setNetworkDataSets)
 
     def addNetworkDataSets(self, *NetworkDataSets):
         for obj in NetworkDataSets:
-            if self not in obj._Documents:
-                obj._Documents.append(self)
-            self._NetworkDataSets.append(obj)
+            if obj._Documents is EMPTY:
+                obj._Documents = AssociationList([self])
+            else:
+                obj._Documents.add(self)
+            if self._NetworkDataSets is EMPTY:
+                self._NetworkDataSets = AssociationList([obj])
+            else:
+                self._NetworkDataSets.add(obj)
 
     def removeNetworkDataSets(self, *NetworkDataSets):
         for obj in NetworkDataSets:
@@ -199,6 +222,7 @@ class Document(IdentifiedObject):
         return self._FromDocumentRoles
 
     def setFromDocumentRoles(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._FromDocumentRoles:
             x.ToDocument = None
         for y in value:
@@ -220,21 +244,28 @@ class Document(IdentifiedObject):
         return self._ScheduleParameterInfos
 
     def setScheduleParameterInfos(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ScheduleParameterInfos:
-            filtered = [q for q in p.Documents if q != self]
-            self._ScheduleParameterInfos._Documents = filtered
+            p._Documents.discard(self)
         for r in value:
-            if self not in r._Documents:
-                r._Documents.append(self)
+            if r._Documents is EMPTY:
+                r._Documents = AssociationList([self])
+            else:
+                r._Documents.add(self)
         self._ScheduleParameterInfos = value
 
     ScheduleParameterInfos = property(getScheduleParameterInfos, setScheduleParameterInfos)
 
     def addScheduleParameterInfos(self, *ScheduleParameterInfos):
         for obj in ScheduleParameterInfos:
-            if self not in obj._Documents:
-                obj._Documents.append(self)
-            self._ScheduleParameterInfos.append(obj)
+            if obj._Documents is EMPTY:
+                obj._Documents = AssociationList([self])
+            else:
+                obj._Documents.add(self)
+            if self._ScheduleParameterInfos is EMPTY:
+                self._ScheduleParameterInfos = AssociationList([obj])
+            else:
+                self._ScheduleParameterInfos.add(obj)
 
     def removeScheduleParameterInfos(self, *ScheduleParameterInfos):
         for obj in ScheduleParameterInfos:
@@ -247,6 +278,7 @@ class Document(IdentifiedObject):
         return self._ErpOrganisationRoles
 
     def setErpOrganisationRoles(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ErpOrganisationRoles:
             x.Document = None
         for y in value:
@@ -269,21 +301,28 @@ class Document(IdentifiedObject):
         return self._Measurements
 
     def setMeasurements(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Measurements:
-            filtered = [q for q in p.Documents if q != self]
-            self._Measurements._Documents = filtered
+            p._Documents.discard(self)
         for r in value:
-            if self not in r._Documents:
-                r._Documents.append(self)
+            if r._Documents is EMPTY:
+                r._Documents = AssociationList([self])
+            else:
+                r._Documents.add(self)
         self._Measurements = value
 
     Measurements = property(getMeasurements, setMeasurements)
 
     def addMeasurements(self, *Measurements):
         for obj in Measurements:
-            if self not in obj._Documents:
-                obj._Documents.append(self)
-            self._Measurements.append(obj)
+            if obj._Documents is EMPTY:
+                obj._Documents = AssociationList([self])
+            else:
+                obj._Documents.add(self)
+            if self._Measurements is EMPTY:
+                self._Measurements = AssociationList([obj])
+            else:
+                self._Measurements.add(obj)
 
     def removeMeasurements(self, *Measurements):
         for obj in Measurements:
@@ -297,21 +336,28 @@ class Document(IdentifiedObject):
         return self._ActivityRecords
 
     def setActivityRecords(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ActivityRecords:
-            filtered = [q for q in p.Documents if q != self]
-            self._ActivityRecords._Documents = filtered
+            p._Documents.discard(self)
         for r in value:
-            if self not in r._Documents:
-                r._Documents.append(self)
+            if r._Documents is EMPTY:
+                r._Documents = AssociationList([self])
+            else:
+                r._Documents.add(self)
         self._ActivityRecords = value
 
     ActivityRecords = property(getActivityRecords, setActivityRecords)
 
     def addActivityRecords(self, *ActivityRecords):
         for obj in ActivityRecords:
-            if self not in obj._Documents:
-                obj._Documents.append(self)
-            self._ActivityRecords.append(obj)
+            if obj._Documents is EMPTY:
+                obj._Documents = AssociationList([self])
+            else:
+                obj._Documents.add(self)
+            if self._ActivityRecords is EMPTY:
+                self._ActivityRecords = AssociationList([obj])
+            else:
+                self._ActivityRecords.add(obj)
 
     def removeActivityRecords(self, *ActivityRecords):
         for obj in ActivityRecords:
@@ -324,21 +370,28 @@ class Document(IdentifiedObject):
         return self._ChangeSets
 
     def setChangeSets(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ChangeSets:
-            filtered = [q for q in p.Documents if q != self]
-            self._ChangeSets._Documents = filtered
+            p._Documents.discard(self)
         for r in value:
-            if self not in r._Documents:
-                r._Documents.append(self)
+            if r._Documents is EMPTY:
+                r._Documents = AssociationList([self])
+            else:
+                r._Documents.add(self)
         self._ChangeSets = value
 
     ChangeSets = property(getChangeSets, setChangeSets)
 
     def addChangeSets(self, *ChangeSets):
         for obj in ChangeSets:
-            if self not in obj._Documents:
-                obj._Documents.append(self)
-            self._ChangeSets.append(obj)
+            if obj._Documents is EMPTY:
+                obj._Documents = AssociationList([self])
+            else:
+                obj._Documents.add(self)
+            if self._ChangeSets is EMPTY:
+                self._ChangeSets = AssociationList([obj])
+            else:
+                self._ChangeSets.add(obj)
 
     def removeChangeSets(self, *ChangeSets):
         for obj in ChangeSets:
@@ -351,6 +404,7 @@ class Document(IdentifiedObject):
         return self._ErpPersonRoles
 
     def setErpPersonRoles(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ErpPersonRoles:
             x.Document = None
         for y in value:
@@ -372,6 +426,7 @@ class Document(IdentifiedObject):
         return self._ScheduledEvents
 
     def setScheduledEvents(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ScheduledEvents:
             x.Document = None
         for y in value:
@@ -396,6 +451,7 @@ class Document(IdentifiedObject):
         return self._AssetRoles
 
     def setAssetRoles(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._AssetRoles:
             x.Document = None
         for y in value:
@@ -420,6 +476,7 @@ class Document(IdentifiedObject):
         return self._PowerSystemResourceRoles
 
     def setPowerSystemResourceRoles(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._PowerSystemResourceRoles:
             x.Document = None
         for y in value:
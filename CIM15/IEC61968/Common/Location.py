@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class Location(IdentifiedObject):
     """The place, scene, or point of something where someone or something has been, is, and/or will be at a given moment in time. It can be defined with one or more postition points (coordinates) in a given coordinate system.The place, scene, or point of something where someone or something has been, is, and/or will be at a given moment in time. It can be defined with one or more postition points (coordinates) in a given coordinate system.
@@ -70,53 +71,65 @@ class Location(IdentifiedObject):
 
         self.phone2 = phone2
 
-        self._PowerSystemResources = []
-        self.PowerSystemResources = [] if PowerSystemResources is None else PowerSystemResources
+        self._PowerSystemResources = EMPTY
+        if PowerSystemResources is not None:
+            self.PowerSystemResources = PowerSystemResources
 
         self.secondaryAddress = secondaryAddress
 
-        self._ChangeItems = []
-        self.ChangeItems = [] if ChangeItems is None else ChangeItems
+        self._ChangeItems = EMPTY
+        if ChangeItems is not None:
+            self.ChangeItems = ChangeItems
 
-        self._RedLines = []
-        self.RedLines = [] if RedLines is None else RedLines
+        self._RedLines = EMPTY
+        if RedLines is not None:
+            self.RedLines = RedLines
 
         self._DimensionsInfo = None
         self.DimensionsInfo = DimensionsInfo
 
-        self._LandProperties = []
-        self.LandProperties = [] if LandProperties is None else LandProperties
+        self._LandProperties = EMPTY
+        if LandProperties is not None:
+            self.LandProperties = LandProperties
 
-        self._Assets = []
-        self.Assets = [] if Assets is None else Assets
+        self._Assets = EMPTY
+        if Assets is not None:
+            self.Assets = Assets
 
-        self._Hazards = []
-        self.Hazards = [] if Hazards is None else Hazards
+        self._Hazards = EMPTY
+        if Hazards is not None:
+            self.Hazards = Hazards
 
         self.status = status
 
-        self._Crews = []
-        self.Crews = [] if Crews is None else Crews
+        self._Crews = EMPTY
+        if Crews is not None:
+            self.Crews = Crews
 
-        self._PositionPoints = []
-        self.PositionPoints = [] if PositionPoints is None else PositionPoints
+        self._PositionPoints = EMPTY
+        if PositionPoints is not None:
+            self.PositionPoints = PositionPoints
 
         self.electronicAddress = electronicAddress
 
-        self._Directions = []
-        self.Directions = [] if Directions is None else Directions
+        self._Directions = EMPTY
+        if Directions is not None:
+            self.Directions = Directions
 
-        self._Measurements = []
-        self.Measurements = [] if Measurements is None else Measurements
+        self._Measurements = EMPTY
+        if Measurements is not None:
+            self.Measurements = Measurements
 
-        self._Routes = []
-        self.Routes = [] if Routes is None else Routes
+        self._Routes = EMPTY
+        if Routes is not None:
+            self.Routes = Routes
 
         self._CoordinateSystem = None
         self.CoordinateSystem = CoordinateSystem
 
-        self._ErpOrganisations = []
-        self.ErpOrganisations = [] if ErpOrganisations is None else ErpOrganisations
+        self._ErpOrganisations = EMPTY
+        if ErpOrganisations is not None:
+            self.ErpOrganisations = ErpOrganisations
 
         super(Location, self).__init__(*args, **kw_args)
 
@@ -142,6 +155,7 @@ class Location(IdentifiedObject):
         return self._PowerSystemResources
 
     def setPowerSystemResources(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._PowerSystemResources:
             x.Location = None
         for y in value:
@@ -166,6 +180,7 @@ class Location(IdentifiedObject):
         return self._ChangeItems
 
     def setChangeItems(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ChangeItems:
             x.Location = None
         for y in value:
@@ -187,21 +202,28 @@ class Location(IdentifiedObject):
         return self._RedLines
 
     def setRedLines(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._RedLines:
-            filtered = [q for q in p.Locations if q != self]
-            self._RedLines._Locations = filtered
+            p._Locations.discard(self)
         for r in value:
-            if self not in r._Locations:
-                r._Locations.append(self)
+            if r._Locations is EMPTY:
+                r._Locations = AssociationList([self])
+            else:
+                r._Locations.add(self)
         self._RedLines = value
 
     RedLines = property(getRedLines, setRedLines)
 
     def addRedLines(self, *RedLines):
         for obj in RedLines:
-            if self not in obj._Locations:
-                obj._Locations.append(self)
-            self._RedLines.append(obj)
+            if obj._Locations is EMPTY:
+                obj._Locations = AssociationList([self])
+            else:
+                obj._Locations.add(self)
+            if self._RedLines is EMPTY:
+                self._RedLines = AssociationList([obj])
+            else:
+                self._RedLines.add(obj)
 
     def removeRedLines(self, *RedLines):
         for obj in RedLines:
@@ -215,13 +237,14 @@ class Location(IdentifiedObject):
 
     def setDimensionsInfo(self, value):
         if self._DimensionsInfo is not None:
-            filtered = [x for x in self.DimensionsInfo.Locations if x != self]
-            self._DimensionsInfo._Locations = filtered
+            self._DimensionsInfo._Locations.discard(self)
 
         self._DimensionsInfo = value
         if self._DimensionsInfo is not None:
-            if self not in self._DimensionsInfo._Locations:
-                self._DimensionsInfo._Locations.append(self)
+            if self._DimensionsInfo._Locations is EMPTY:
+                self._DimensionsInfo._Locations = AssociationList([self])
+            else:
+                self._DimensionsInfo._Locations.add(self)
 
     DimensionsInfo = property(getDimensionsInfo, setDimensionsInfo)
 
@@ -230,21 +253,28 @@ class Location(IdentifiedObject):
         return self._LandProperties
 
     def setLandProperties(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._LandProperties:
-            filtered = [q for q in p.Locations if q != self]
-            self._LandProperties._Locations = filtered
+            p._Locations.discard(self)
         for r in value:
-            if self not in r._Locations:
-                r._Locations.append(self)
+            if r._Locations is EMPTY:
+                r._Locations = AssociationList([self])
+            else:
+                r._Locations.add(self)
         self._LandProperties = value
 
     LandProperties = property(getLandProperties, setLandProperties)
 
     def addLandProperties(self, *LandProperties):
         for obj in LandProperties:
-            if self not in obj._Locations:
-                obj._Locations.append(self)
-            self._LandProperties.append(obj)
+            if obj._Locations is EMPTY:
+                obj._Locations = AssociationList([self])
+            else:
+                obj._Locations.add(self)
+            if self._LandProperties is EMPTY:
+                self._LandProperties = AssociationList([obj])
+            else:
+                self._LandProperties.add(obj)
 
     def removeLandProperties(self, *LandProperties):
         for obj in LandProperties:
@@ -258,6 +288,7 @@ class Location(IdentifiedObject):
         return self._Assets
 
     def setAssets(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Assets:
             x.Location = None
         for y in value:
@@ -279,21 +310,28 @@ class Location(IdentifiedObject):
         return self._Hazards
 
     def setHazards(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Hazards:
-            filtered = [q for q in p.Locations if q != self]
-            self._Hazards._Locations = filtered
+            p._Locations.discard(self)
         for r in value:
-            if self not in r._Locations:
-                r._Locations.append(self)
+            if r._Locations is EMPTY:
+                r._Locations = AssociationList([self])
+            else:
+                r._Locations.add(self)
         self._Hazards = value
 
     Hazards = property(getHazards, setHazards)
 
     def addHazards(self, *Hazards):
         for obj in Hazards:
-            if self not in obj._Locations:
-                obj._Locations.append(self)
-            self._Hazards.append(obj)
+            if obj._Locations is EMPTY:
+                obj._Locations = AssociationList([self])
+            else:
+                obj._Locations.add(self)
+            if self._Hazards is EMPTY:
+                self._Hazards = AssociationList([obj])
+            else:
+                self._Hazards.add(obj)
 
     def removeHazards(self, *Hazards):
         for obj in Hazards:
@@ -309,21 +347,28 @@ class Location(IdentifiedObject):
         return self._Crews
 
     def setCrews(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Crews:
-            filtered = [q for q in p.Locations if q != self]
-            self._Crews._Locations = filtered
+            p._Locations.discard(self)
         for r in value:
-            if self not in r._Locations:
-                r._Locations.append(self)
+            if r._Locations is EMPTY:
+                r._Locations = AssociationList([self])
+            else:
+                r._Locations.add(self)
         self._Crews = value
 
     Crews = property(getCrews, setCrews)
 
     def addCrews(self, *Crews):
         for obj in Crews:
-            if self not in obj._Locations:
-                obj._Locations.append(self)
-            self._Crews.append(obj)
+            if obj._Locations is EMPTY:
+                obj._Locations = AssociationList([self])
+            else:
+                obj._Locations.add(self)
+            if self._Crews is EMPTY:
+                self._Crews = AssociationList([obj])
+            else:
+                self._Crews.add(obj)
 
     def removeCrews(self, *Crews):
         for obj in Crews:
@@ -337,6 +382,7 @@ class Location(IdentifiedObject):
         return self._PositionPoints
 
     def setPositionPoints(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._PositionPoints:
             x.Location = None
         for y in value:
@@ -361,6 +407,7 @@ class Location(IdentifiedObject):
         return self._Directions
 
     def setDirections(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Directions:
             x.Location = None
         for y in value:
@@ -382,21 +429,28 @@ class Location(IdentifiedObject):
         return self._Measurements
 
     def setMeasurements(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Measurements:
-            filtered = [q for q in p.Locations if q != self]
-            self._Measurements._Locations = filtered
+            p._Locations.discard(self)
         for r in value:
-            if self not in r._Locations:
-                r._Locations.append(self)
+            if r._Locations is EMPTY:
+                r._Locations = AssociationList([self])
+            else:
+                r._Locations.add(self)
         self._Measurements = value
 
     Measurements = property(getMeasurements, setMeasurements)
 
     def addMeasurements(self, *Measurements):
         for obj in Measurements:
-            if self not in obj._Locations:
-                obj._Locations.append(self)
-            self._Measurements.append(obj)
+            if obj._Locations is EMPTY:
+                obj._Locations = AssociationList([self])
+            else:
+                obj._Locations.add(self)
+            if self._Measurements is EMPTY:
+                self._Measurements = AssociationList([obj])
+            else:
+                self._Measurements.add(obj)
 
     def removeMeasurements(self, *Measurements):
         for obj in Measurements:
@@ -409,21 +463,28 @@ class Location(IdentifiedObject):
         return self._Routes
 
     def setRoutes(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Routes:
-            filtered = [q for q in p.Locations if q != self]
-            self._Routes._Locations = filtered
+            p._Locations.discard(self)
         for r in value:
-            if self not in r._Locations:
-                r._Locations.append(self)
+            if r._Locations is EMPTY:
+                r._Locations = AssociationList([self])
+            else:
+                r._Locations.add(self)
         self._Routes = value
 
     Routes = property(getRoutes, setRoutes)
 
     def addRoutes(self, *Routes):
         for obj in Routes:
-            if self not in obj._Locations:
-                obj._Locations.append(self)
-            self._Routes.append(obj)
+            if obj._Locations is EMPTY:
+                obj._Locations = AssociationList([self])
+            else:
+                obj._Locations.add(self)
+            if self._Routes is EMPTY:
+                self._Routes = AssociationList([obj])
+            else:
+                self._Routes.add(obj)
 
     def removeRoutes(self, *Routes):
         for obj in Routes:
@@ -438,13 +499,14 @@ class Location(IdentifiedObject):
 
     def setCoordinateSystem(self, value):
         if self._CoordinateSystem is not None:
-            filtered = [x for x in self.CoordinateSystem.Location if x != self]
-            self._CoordinateSystem._Location = filtered
+            self._CoordinateSystem._Location.discard(self)
 
         self._CoordinateSystem = value
         if self._CoordinateSystem is not None:
-            if self not in self._CoordinateSystem._Location:
-                self._CoordinateSystem._Location.append(self)
+            if self._CoordinateSystem._Location is EMPTY:
+                self._CoordinateSystem._Location = AssociationList([self])
+            else:
+                self._CoordinateSystem._Location.add(self)
 
     CoordinateSystem = property(getCoordinateSystem, setCoordinateSystem)
 
@@ -453,21 +515,28 @@ class Location(IdentifiedObject):
         return self._ErpOrganisations
 
     def setErpOrganisations(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ErpOrganisations:
-            filtered = [q for q in p.Locations if q != self]
-            self._ErpOrganisations._Locations = filtered
+            p._Locations.discard(self)
         for r in value:
-            if self not in r._Locations:
-                r._Locations.append(self)
+            if r._Locations is EMPTY:
+                r._Locations = AssociationList([self])
+            else:
+                r._Locations.add(self)
         self._ErpOrganisations = value
 
     ErpOrganisations = property(getErpOrganisations, setErpOrganisations)
 
     def addErpOrganisations(self, *ErpOrganisations):
         for obj in ErpOrganisations:
-            if self not in obj._Locations:
-                obj._Locations.append(self)
-            self._ErpOrganisations.append(obj)
+            if obj._Locations is EMPTY:
+                obj._Locations = AssociationList([self])
+            else:
+                obj._Locations.add(self)
+            if self._ErpOrganisations is EMPTY:
+                self._ErpOrganisations = AssociationList([obj])
+            else:
+                self._ErpOrganisations.add(obj)
 
     def removeErpOrganisations(self, *ErpOrganisations):
         for obj in ErpOrganisations:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class Organisation(IdentifiedObject):
     """Organisation that might have roles as utility, contractor, supplier, manufacturer, customer, etc.Organisation that might have roles as utility, contractor, supplier, manufacturer, customer, etc.
@@ -44,8 +45,9 @@ class Organisation(IdentifiedObject):
 
         self.electronicAddress = electronicAddress
 
-        self._BusinessRoles = []
-        self.BusinessRoles = [] if BusinessRoles is None else BusinessRoles
+        self._BusinessRoles = EMPTY
+        if BusinessRoles is not None:
+            self.BusinessRoles = BusinessRoles
 
         super(Organisation, self).__init__(*args, **kw_args)
 
@@ -76,21 +78,28 @@ class Organisation(IdentifiedObject):
         return self._BusinessRoles
 
     def setBusinessRoles(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._BusinessRoles:
-            filtered = [q for q in p.Organisations if q != self]
-            self._BusinessRoles._Organisations = filtered
+            p._Organisations.discard(self)
         for r in value:
-            if self not in r._Organisations:
-                r._Organisations.append(self)
+            if r._Organisations is EMPTY:
+                r._Organisations = AssociationList([self])
+            else:
+                r._Organisations.add(self)
         self._BusinessRoles = value
 
     BusinessRoles = property(getBusinessRoles, setBusinessRoles)
 
     def addBusinessRoles(self, *BusinessRoles):
         for obj in BusinessRoles:
-            if self not in obj._Organisations:
-                obj._Organisations.append(self)
-            self._BusinessRoles.append(obj)
+            if obj._Organisations is EMPTY:
+                obj._Organisations = AssociationList([self])
+            else:
+                obj._Organisations.add(self)
+            if self._BusinessRoles is EMPTY:
+                self._BusinessRoles = AssociationList([obj])
+            else:
+                self._BusinessRoles.add(obj)
 
     def removeBusinessRoles(self, *BusinessRoles):
         for obj in BusinessRoles:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class TimePoint(IdentifiedObject):
     """A point in time within a sequence of points in time relative to a TimeSchedule.A point in time within a sequence of points in time relative to a TimeSchedule.
@@ -51,8 +52,9 @@ class TimePoint(IdentifiedObject):
         self._TimeSchedule = None
         self.TimeSchedule = TimeSchedule
 
-        self._ScheduledEvents = []
-        self.ScheduledEvents = [] if ScheduledEvents is None else ScheduledEvents
+        self._ScheduledEvents = EMPTY
+        if ScheduledEvents is not None:
+            self.ScheduledEvents = ScheduledEvents
 
         super(TimePoint, self).__init__(*args, **kw_args)
 
@@ -76,13 +78,14 @@ class TimePoint(IdentifiedObject):
 
     def setTimeSchedule(self, value):
         if self._TimeSchedule is not None:
-            filtered = [x for x in self.TimeSchedule.TimePoints if x != self]
-            self._TimeSchedule._TimePoints = filtered
+            self._TimeSchedule._TimePoints.discard(self)
 
         self._TimeSchedule = value
         if self._TimeSchedule is not None:
-            if self not in self._TimeSchedule._TimePoints:
-                self._TimeSchedule._TimePoints.append(self)
+            if self._TimeSchedule._TimePoints is EMPTY:
+                self._TimeSchedule._TimePoints = AssociationList([self])
+            else:
+                self._TimeSchedule._TimePoints.add(self)
 
     TimeSchedule = property(getTimeSchedule, setTimeSchedule)
 
@@ -91,6 +94,7 @@ class TimePoint(IdentifiedObject):
         return self._ScheduledEvents
 
     def setScheduledEvents(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ScheduledEvents:
             x.TimePoint = None
         for y in value:
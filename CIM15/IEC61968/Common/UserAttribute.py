@@ -18,7 +18,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from CIM15.Element import Element
+from CIM15.Element import Element, AssociationList, EMPTY
 
 class UserAttribute(Element):
     """Generic name-value pair class, with optional sequence number and units for value; can be used to model parts of information exchange when concrete types are not known in advance.Generic name-value pair class, with optional sequence number and units for value; can be used to model parts of information exchange when concrete types are not known in advance.
@@ -49,11 +49,13 @@ class UserAttribute(Element):
         #: Sequence number for this attribute in a list of attributes.
         self.sequenceNumber = sequenceNumber
 
-        self._ErpLedgerEntries = []
-        self.ErpLedgerEntries = [] if ErpLedgerEntries is None else ErpLedgerEntries
+        self._ErpLedgerEntries = EMPTY
+        if ErpLedgerEntries is not None:
+            self.ErpLedgerEntries = ErpLedgerEntries
 
-        self._ProcedureDataSets = []
-        self.ProcedureDataSets = [] if ProcedureDataSets is None else ProcedureDataSets
+        self._ProcedureDataSets = EMPTY
+        if ProcedureDataSets is not None:
+            self.ProcedureDataSets = ProcedureDataSets
 
         self._Transaction = None
         self.Transaction = Transaction
@@ -64,17 +66,20 @@ class UserAttribute(Element):
         self._Procedure = None
         self.Procedure = Procedure
 
-        self._PropertyAssets = []
-        self.PropertyAssets = [] if PropertyAssets is None else PropertyAssets
+        self._PropertyAssets = EMPTY
+        if PropertyAssets is not None:
+            self.PropertyAssets = PropertyAssets
 
         self._RatingSpecification = None
         self.RatingSpecification = RatingSpecification
 
-        self._ErpInvoiceLineItems = []
-        self.ErpInvoiceLineItems = [] if ErpInvoiceLineItems is None else ErpInvoiceLineItems
+        self._ErpInvoiceLineItems = EMPTY
+        if ErpInvoiceLineItems is not None:
+            self.ErpInvoiceLineItems = ErpInvoiceLineItems
 
-        self._RatingAssets = []
-        self.RatingAssets = [] if RatingAssets is None else RatingAssets
+        self._RatingAssets = EMPTY
+        if RatingAssets is not None:
+            self.RatingAssets = RatingAssets
 
         super(UserAttribute, self).__init__(*args, **kw_args)
 
@@ -90,21 +95,28 @@ class UserAttribute(Element):
         return self._ErpLedgerEntries
 
     def setErpLedgerEntries(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ErpLedgerEntries:
-            filtered = [q for q in p.UserAttributes if q != self]
-            self._ErpLedgerEntries._UserAttributes = filtered
+            p._UserAttributes.discard(self)
         for r in value:
-            if self not in r._UserAttributes:
-                r._UserAttributes.append(self)
+            if r._UserAttributes is EMPTY:
+                r._UserAttributes = AssociationList([self])
+            else:
+                r._UserAttributes.add(self)
         self._ErpLedgerEntries = value
 
     ErpLedgerEntries = property(getErpLedgerEntries, setErpLedgerEntries)
 
     def addErpLedgerEntries(self, *ErpLedgerEntries):
         for obj in ErpLedgerEntries:
-            if self not in obj._UserAttributes:
-                obj._UserAttributes.append(self)
-            self._ErpLedgerEntries.append(obj)
+            if obj._UserAttributes is EMPTY:
+                obj._UserAttributes = AssociationList([self])
+            else:
+                obj._UserAttributes.add(self)
+            if self._ErpLedgerEntries is EMPTY:
+                self._ErpLedgerEntries = AssociationList([obj])
+            else:
+                self._ErpLedgerEntries.add(obj)
 
     def removeErpLedgerEntries(self, *ErpLedgerEntries):
         for obj in ErpLedgerEntries:
@@ -117,21 +129,28 @@ class UserAttribute(Element):
         return self._ProcedureDataSets
 
     def setProcedureDataSets(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ProcedureDataSets:
-            filtered = [q for q in p.Properties if q != self]
-            self._ProcedureDataSets._Properties = filtered
+            p._Properties.discard(self)
         for r in value:
-            if self not in r._Properties:
-                r._Properties.append(self)
+            if r._Properties is EMPTY:
+                r._Properties = AssociationList([self])
+            else:
+                r._Properties.add(self)
         self._ProcedureDataSets = value
 
     ProcedureDataSets = property(getProcedureDataSets, setProcedureDataSets)
 
     def addProcedureDataSets(self, *ProcedureDataSets):
         for obj in ProcedureDataSets:
-            if self not in obj._Properties:
-                obj._Properties.append(self)
-            self._ProcedureDataSets.append(obj)
+            if obj._Properties is EMPTY:
+                obj._Properties = AssociationList([self])
+            else:
+                obj._Properties.add(self)
+            if self._ProcedureDataSets is EMPTY:
+                self._ProcedureDataSets = AssociationList([obj])
+            else:
+                self._ProcedureDataSets.add(obj)
 
     def removeProcedureDataSets(self, *ProcedureDataSets):
         for obj in ProcedureDataSets:
@@ -146,13 +165,14 @@ class UserAttribute(Element):
 
     def setTransaction(self, value):
         if self._Transaction is not None:
-            filtered = [x for x in self.Transaction.UserAttributes if x != self]
-            self._Transaction._UserAttributes = filtered
+            self._Transaction._UserAttributes.discard(self)
 
         self._Transaction = value
         if self._Transaction is not None:
-            if self not in self._Transaction._UserAttributes:
-                self._Transaction._UserAttributes.append(self)
+            if self._Transaction._UserAttributes is EMPTY:
+                self._Transaction._UserAttributes = AssociationList([self])
+            else:
+                self._Transaction._UserAttributes.add(self)
 
     Transaction = property(getTransaction, setTransaction)
 
@@ -162,13 +182,14 @@ class UserAttribute(Element):
 
     def setPropertySpecification(self, value):
         if self._PropertySpecification is not None:
-            filtered = [x for x in self.PropertySpecification.AssetProperites if x != self]
-            self._PropertySpecification._AssetProperites = filtered
+            self._PropertySpecification._AssetProperites.discard(self)
 
         self._PropertySpecification = value
         if self._PropertySpecification is not None:
-            if self not in self._PropertySpecification._AssetProperites:
-                self._PropertySpecification._AssetProperites.append(self)
+            if self._PropertySpecification._AssetProperites is EMPTY:
+                self._PropertySpecification._AssetProperites = AssociationList([self])
+            else:
+                self._PropertySpecification._AssetProperites.add(self)
 
     PropertySpecification = property(getPropertySpecification, setPropertySpecification)
 
@@ -178,13 +199,14 @@ class UserAttribute(Element):
 
     def setProcedure(self, value):
         if self._Procedure is not None:
-            filtered = [x for x in self.Procedure.ProcedureValues if x != self]
-            self._Procedure._ProcedureValues = filtered
+            self._Procedure._ProcedureValues.discard(self)
 
         self._Procedure = value
         if self._Procedure is not None:
-            if self not in self._Procedure._ProcedureValues:
-                self._Procedure._ProcedureValues.append(self)
+            if self._Procedure._ProcedureValues is EMPTY:
+                self._Procedure._ProcedureValues = AssociationList([self])
+            else:
+                self._Procedure._ProcedureValues.add(self)
 
     Procedure = property(getProcedure, setProcedure)
 
@@ -193,21 +215,28 @@ class UserAttribute(Element):
         return self._PropertyAssets
 
     def setPropertyAssets(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._PropertyAssets:
-            filtered = [q for q in p.Properties if q != self]
-            self._PropertyAssets._Properties = filtered
+            p._Properties.discard(self)
         for r in value:
-            if self not in r._Properties:
-                r._Properties.append(self)
+            if r._Properties is EMPTY:
+                r._Properties = AssociationList([self])
+            else:
+                r._Properties.add(self)
         self._PropertyAssets = value
 
     PropertyAssets = property(getPropertyAssets, setPropertyAssets)
 
     def addPropertyAssets(self, *PropertyAssets):
         for obj in PropertyAssets:
-            if self not in obj._Properties:
-                obj._Properties.append(self)
-            self._PropertyAssets.append(obj)
+            if obj._Properties is EMPTY:
+                obj._Properties = AssociationList([self])
+            else:
+                obj._Properties.add(self)
+            if self._PropertyAssets is EMPTY:
+                self._PropertyAssets = AssociationList([obj])
+            else:
+                self._PropertyAssets.add(obj)
 
     def removePropertyAssets(self, *PropertyAssets):
         for obj in PropertyAssets:
@@ -221,13 +250,14 @@ class UserAttribute(Element):
 
     def setRatingSpecification(self, value):
         if self._RatingSpecification is not None:
-            filtered = [x for x in self.RatingSpecification.Ratings if x != self]
-            self._RatingSpecification._Ratings = filtered
+            self._RatingSpecification._Ratings.discard(self)
 
         self._RatingSpecification = value
         if self._RatingSpecification is not None:
-            if self not in self._RatingSpecification._Ratings:
-                self._RatingSpecification._Ratings.append(self)
+            if self._RatingSpecification._Ratings is EMPTY:
+                self._RatingSpecification._Ratings = AssociationList([self])
+            else:
+                self._RatingSpecification._Ratings.add(self)
 
     RatingSpecification = property(getRatingSpecification, setRatingSpecification)
 
@@ -236,21 +266,28 @@ class UserAttribute(Element):
         return self._ErpInvoiceLineItems
 
     def setErpInvoiceLineItems(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ErpInvoiceLineItems:
-            filtered = [q for q in p.UserAttributes if q != self]
-            self._ErpInvoiceLineItems._UserAttributes = filtered
+            p._UserAttributes.discard(self)
         for r in value:
-            if self not in r._UserAttributes:
-                r._UserAttributes.append(self)
+            if r._UserAttributes is EMPTY:
+                r._UserAttributes = AssociationList([self])
+            else:
+                r._UserAttributes.add(self)
         self._ErpInvoiceLineItems = value
 
     ErpInvoiceLineItems = property(getErpInvoiceLineItems, setErpInvoiceLineItems)
 
     def addErpInvoiceLineItems(self, *ErpInvoiceLineItems):
         for obj in ErpInvoiceLineItems:
-            if self not in obj._UserAttributes:
-                obj._UserAttributes.append(self)
-            self._ErpInvoiceLineItems.append(obj)
+            if obj._UserAttributes is EMPTY:
+                obj._UserAttributes = AssociationList([self])
+            else:
+                obj._UserAttributes.add(self)
+            if self._ErpInvoiceLineItems is EMPTY:
+                self._ErpInvoiceLineItems = AssociationList([obj])
+            else:
+                self._ErpInvoiceLineItems.add(obj)
 
     def removeErpInvoiceLineItems(self, *ErpInvoiceLineItems):
         for obj in ErpInvoiceLineItems:
@@ -263,21 +300,28 @@ class UserAttribute(Element):
         return self._RatingAssets
 
     def setRatingAssets(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._RatingAssets:
-            filtered = [q for q in p.Ratings if q != self]
-            self._RatingAssets._Ratings = filtered
+            p._Ratings.discard(self)
         for r in value:
-            if self not in r._Ratings:
-                r._Ratings.append(self)
+            if r._Ratings is EMPTY:
+                r._Ratings = AssociationList([self])
+            else:
+                r._Ratings.add(self)
         self._RatingAssets = value
 
     RatingAssets = property(getRatingAssets, setRatingAssets)
 
     def addRatingAssets(self, *RatingAssets):
         for obj in RatingAssets:
-            if self not in obj._Ratings:
-                obj._Ratings.append(self)
-            self._RatingAssets.append(obj)
+            if obj._Ratings is EMPTY:
+                obj._Ratings = AssociationList([self])
+            else:
+                obj._Ratings.add(self)
+            if self._RatingAssets is EMPTY:
+                self._RatingAssets = AssociationList([obj])
+            else:
+                self._RatingAssets.add(obj)
 
     def removeRatingAssets(self, *RatingAssets):
         for obj in RatingAssets:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Organisation import Organisation
+from CIM15.Element import AssociationList, EMPTY
 
 class Customer(Organisation):
     """Organisation receiving services from ServiceSupplier.Organisation receiving services from ServiceSupplier.
@@ -52,28 +53,34 @@ class Customer(Organisation):
         #: Kind of customer. Values are: "windMachine", "residentialAndCommercial", "internalUse", "energyServiceScheduler", "residentialAndStreetlight", "residential", "pumpingLoad", "other", "commercialIndustrial", "energyServiceSupplier", "residentialStreetlightOthers", "residentialFarmService"
         self.kind = kind
 
-        self._CustomerAgreements = []
-        self.CustomerAgreements = [] if CustomerAgreements is None else CustomerAgreements
+        self._CustomerAgreements = EMPTY
+        if CustomerAgreements is not None:
+            self.CustomerAgreements = CustomerAgreements
 
-        self._ErpPersons = []
-        self.ErpPersons = [] if ErpPersons is None else ErpPersons
+        self._ErpPersons = EMPTY
+        if ErpPersons is not None:
+            self.ErpPersons = ErpPersons
 
-        self._EndDevices = []
-        self.EndDevices = [] if EndDevices is None else EndDevices
+        self._EndDevices = EMPTY
+        if EndDevices is not None:
+            self.EndDevices = EndDevices
 
-        self._Works = []
-        self.Works = [] if Works is None else Works
+        self._Works = EMPTY
+        if Works is not None:
+            self.Works = Works
 
         self.status = status
 
         self._PlannedOutage = None
         self.PlannedOutage = PlannedOutage
 
-        self._OutageNotifications = []
-        self.OutageNotifications = [] if OutageNotifications is None else OutageNotifications
+        self._OutageNotifications = EMPTY
+        if OutageNotifications is not None:
+            self.OutageNotifications = OutageNotifications
 
-        self._TroubleTickets = []
-        self.TroubleTickets = [] if TroubleTickets is None else TroubleTickets
+        self._TroubleTickets = EMPTY
+        if TroubleTickets is not None:
+            self.TroubleTickets = TroubleTickets
 
         super(Customer, self).__init__(*args, **kw_args)
 
@@ -90,6 +97,7 @@ class Customer(Organisation):
         return self._CustomerAgreements
 
     def setCustomerAgreements(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._CustomerAgreements:
             x.Customer = None
         for y in value:
@@ -111,6 +119,7 @@ class Customer(Organisation):
         return self._ErpPersons
 
     def setErpPersons(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ErpPersons:
             x.CustomerData = None
         for y in value:
@@ -133,6 +142,7 @@ class Customer(Organisation):
         return self._EndDevices
 
     def setEndDevices(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._EndDevices:
             x.Customer = None
         for y in value:
@@ -155,21 +165,28 @@ class Customer(Organisation):
         return self._Works
 
     def setWorks(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Works:
-            filtered = [q for q in p.Customers if q != self]
-            self._Works._Customers = filtered
+            p._Customers.discard(self)
         for r in value:
-            if self not in r._Customers:
-                r._Customers.append(self)
+            if r._Customers is EMPTY:
+                r._Customers = AssociationList([self])
+            else:
+                r._Customers.add(self)
         self._Works = value
 
     Works = property(getWorks, setWorks)
 
     def addWorks(self, *Works):
         for obj in Works:
-            if self not in obj._Customers:
-                obj._Customers.append(self)
-            self._Works.append(obj)
+            if obj._Customers is EMPTY:
+                obj._Customers = AssociationList([self])
+            else:
+                obj._Customers.add(self)
+            if self._Works is EMPTY:
+                self._Works = AssociationList([obj])
+            else:
+                self._Works.add(obj)
 
     def removeWorks(self, *Works):
         for obj in Works:
@@ -186,13 +203,14 @@ class Customer(Organisation):
 
     def setPlannedOutage(self, value):
         if self._PlannedOutage is not None:
-            filtered = [x for x in self.PlannedOutage.CustomerDatas if x != self]
-            self._PlannedOutage._CustomerDatas = filtered
+            self._PlannedOutage._CustomerDatas.discard(self)
 
         self._PlannedOutage = value
         if self._PlannedOutage is not None:
-            if self not in self._PlannedOutage._CustomerDatas:
-                self._PlannedOutage._CustomerDatas.append(self)
+            if self._PlannedOutage._CustomerDatas is EMPTY:
+                self._PlannedOutage._CustomerDatas = AssociationList([self])
+            else:
+                self._PlannedOutage._CustomerDatas.add(self)
 
     PlannedOutage = property(getPlannedOutage, setPlannedOutage)
 
@@ -201,21 +219,28 @@ class Customer(Organisation):
         return self._OutageNotifications
 
     def setOutageNotifications(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._OutageNotifications:
-            filtered = [q for q in p.CustomerDatas if q != self]
-            self._OutageNotifications._CustomerDatas = filtered
+            p._CustomerDatas.discard(self)
         for r in value:
-            if self not in r._CustomerDatas:
-                r._CustomerDatas.append(self)
+            if r._CustomerDatas is EMPTY:
+                r._CustomerDatas = AssociationList([self])
+            else:
+                r._CustomerDatas.add(self)
         self._OutageNotifications = value
 
     OutageNotifications = property(getOutageNotifications, setOutageNotifications)
 
     def addOutageNotifications(self, *OutageNotifications):
         for obj in OutageNotifications:
-            if self not in obj._CustomerDatas:
-                obj._CustomerDatas.append(self)
-            self._OutageNotifications.append(obj)
+            if obj._CustomerDatas is EMPTY:
+                obj._CustomerDatas = AssociationList([self])
+            else:
+                obj._CustomerDatas.add(self)
+            if self._OutageNotifications is EMPTY:
+                self._OutageNotifications = AssociationList([obj])
+            else:
+                self._OutageNotifications.add(obj)
 
     def removeOutageNotifications(self, *OutageNotifications):
         for obj in OutageNotifications:
@@ -228,6 +253,7 @@ class Customer(Organisation):
         return self._TroubleTickets
 
     def setTroubleTickets(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._TroubleTickets:
             x.CustomerData = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import AssociationList, EMPTY
 
 class CustomerAccount(Document):
     """Assignment of a group of products and services purchased by the customer through a customer agreement, used as a mechanism for customer billing and payment. It contains common information from the various types of customer agreements to create billings (invoices) for a customer and receive payment.Assignment of a group of products and services purchased by the customer through a customer agreement, used as a mechanism for customer billing and payment. It contains common information from the various types of customer agreements to create billings (invoices) for a customer and receive payment.
@@ -33,20 +34,25 @@ class CustomerAccount(Document):
         @param PaymentTransactions: All payment transactions for this customer account.
         @param CustomerBillingInfos:
         """
-        self._WorkBillingInfos = []
-        self.WorkBillingInfos = [] if WorkBillingInfos is None else WorkBillingInfos
+        self._WorkBillingInfos = EMPTY
+        if WorkBillingInfos is not None:
+            self.WorkBillingInfos = WorkBillingInfos
 
-        self._CustomerAgreements = []
-        self.CustomerAgreements = [] if CustomerAgreements is None else CustomerAgreements
+        self._CustomerAgreements = EMPTY
+        if CustomerAgreements is not None:
+            self.CustomerAgreements = CustomerAgreements
 
-        self._ErpInvoicees = []
-        self.ErpInvoicees = [] if ErpInvoicees is None else ErpInvoicees
+        self._ErpInvoicees = EMPTY
+        if ErpInvoicees is not None:
+            self.ErpInvoicees = ErpInvoicees
 
-        self._PaymentTransactions = []
-        self.PaymentTransactions = [] if PaymentTransactions is None else PaymentTransactions
+        self._PaymentTransactions = EMPTY
+        if PaymentTransactions is not None:
+            self.PaymentTransactions = PaymentTransactions
 
-        self._CustomerBillingInfos = []
-        self.CustomerBillingInfos = [] if CustomerBillingInfos is None else CustomerBillingInfos
+        self._CustomerBillingInfos = EMPTY
+        if CustomerBillingInfos is not None:
+            self.CustomerBillingInfos = CustomerBillingInfos
 
         super(CustomerAccount, self).__init__(*args, **kw_args)
 
@@ -62,6 +68,7 @@ class CustomerAccount(Document):
         return self._WorkBillingInfos
 
     def setWorkBillingInfos(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._WorkBillingInfos:
             x.CustomerAccount = None
         for y in value:
@@ -84,6 +91,7 @@ class CustomerAccount(Document):
         return self._CustomerAgreements
 
     def setCustomerAgreements(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._CustomerAgreements:
             x.CustomerAccount = None
         for y in value:
@@ -105,6 +113,7 @@ class CustomerAccount(Document):
         return self._ErpInvoicees
 
     def setErpInvoicees(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ErpInvoicees:
             x.CustomerAccount = None
         for y in value:
@@ -127,6 +136,7 @@ class CustomerAccount(Document):
         return self._PaymentTransactions
 
     def setPaymentTransactions(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._PaymentTransactions:
             x.CustomerAccount = None
         for y in value:
@@ -148,6 +158,7 @@ class CustomerAccount(Document):
         return self._CustomerBillingInfos
 
     def setCustomerBillingInfos(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._CustomerBillingInfos:
             x.CustomerAccount = None
         for y in value:
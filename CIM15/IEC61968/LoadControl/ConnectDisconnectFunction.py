@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Metering.EndDeviceFunction import EndDeviceFunction
+from CIM15.Element import AssociationList, EMPTY
 
 class ConnectDisconnectFunction(EndDeviceFunction):
     """A function that will disconnect or reconnect the customer's load under defined conditions.A function that will disconnect or reconnect the customer's load under defined conditions.
@@ -60,8 +61,9 @@ class ConnectDisconnectFunction(EndDeviceFunction):
 
         self.rcdInfo = rcdInfo
 
-        self._Switches = []
-        self.Switches = [] if Switches is None else Switches
+        self._Switches = EMPTY
+        if Switches is not None:
+            self.Switches = Switches
 
         super(ConnectDisconnectFunction, self).__init__(*args, **kw_args)
 
@@ -80,21 +82,28 @@ class ConnectDisconnectFunction(EndDeviceFunction):
         return self._Switches
 
     def setSwitches(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Switches:
-            filtered = [q for q in p.ConnectDisconnectFunctions if q != self]
-            self._Switches._ConnectDisconnectFunctions = filtered
+            p._ConnectDisconnectFunctions.discard(self)
         for r in value:
-            if self not in r._ConnectDisconnectFunctions:
-                r._ConnectDisconnectFunctions.append(self)
+            if r._ConnectDisconnectFunctions is EMPTY:
+                r._ConnectDisconnectFunctions = AssociationList([self])
+            else:
+                r._ConnectDisconnectFunctions.add(self)
         self._Switches = value
 
     Switches = property(getSwitches, setSwitches)
 
     def addSwitches(self, *Switches):
         for obj in Switches:
-            if self not in obj._ConnectDisconnectFunctions:
-                obj._ConnectDisconnectFunctions.append(self)
-            self._Switches.append(obj)
+            if obj._ConnectDisconnectFunctions is EMPTY:
+                obj._ConnectDisconnectFunctions = AssociationList([self])
+            else:
+                obj._ConnectDisconnectFunctions.add(self)
+            if self._Switches is EMPTY:
+                self._Switches = AssociationList([obj])
+            else:
+                self._Switches.add(obj)
 
     def removeSwitches(self, *Switches):
         for obj in Switches:
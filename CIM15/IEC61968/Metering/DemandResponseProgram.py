@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class DemandResponseProgram(IdentifiedObject):
     """Demand response program.Demand response program.
@@ -36,16 +37,19 @@ class DemandResponseProgram(IdentifiedObject):
         #: Type of demand response program; examples are CPP (critical-peak pricing), RTP (real-time pricing), DLC (direct load control), DBP (demand bidding program), BIP (base interruptible program). Note that possible types change a lot and it would be impossible to enumerate them all.
         self.type = type
 
-        self._EndDeviceControls = []
-        self.EndDeviceControls = [] if EndDeviceControls is None else EndDeviceControls
+        self._EndDeviceControls = EMPTY
+        if EndDeviceControls is not None:
+            self.EndDeviceControls = EndDeviceControls
 
         self.validityInterval = validityInterval
 
-        self._CustomerAgreements = []
-        self.CustomerAgreements = [] if CustomerAgreements is None else CustomerAgreements
+        self._CustomerAgreements = EMPTY
+        if CustomerAgreements is not None:
+            self.CustomerAgreements = CustomerAgreements
 
-        self._EndDeviceGroups = []
-        self.EndDeviceGroups = [] if EndDeviceGroups is None else EndDeviceGroups
+        self._EndDeviceGroups = EMPTY
+        if EndDeviceGroups is not None:
+            self.EndDeviceGroups = EndDeviceGroups
 
         super(DemandResponseProgram, self).__init__(*args, **kw_args)
 
@@ -62,6 +66,7 @@ class DemandResponseProgram(IdentifiedObject):
         return self._EndDeviceControls
 
     def setEndDeviceControls(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._EndDeviceControls:
             x.DemandResponseProgram = None
         for y in value:
@@ -87,6 +92,7 @@ class DemandResponseProgram(IdentifiedObject):
         return self._CustomerAgreements
 
     def setCustomerAgreements(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._CustomerAgreements:
             x.DemandResponseProgram = None
         for y in value:
@@ -109,6 +115,7 @@ class DemandResponseProgram(IdentifiedObject):
         return self._EndDeviceGroups
 
     def setEndDeviceGroups(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._EndDeviceGroups:
             x.DemandResponseProgram = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.AssetContainer import AssetContainer
+from CIM15.Element import AssociationList, EMPTY
 
 class EndDevice(AssetContainer):
     """Asset container that performs one or more end device functions. One type of end device is a meter which can perform metering, load management, connect/disconnect, accounting functions, etc. Some end devices, such as ones monitoring and controlling air conditioner, refrigerator, pool pumps may be connected to a meter. All end devices may have communication capability defined by the associated communication function(s). An end device may be owned by a consumer, a service provider, utility or otherwise. There may be a related end device function that identifies a sensor or control point within a metering application or communications systems (e.g., water, gas, electricity). Some devices may use an optical port that conforms to the ANSI C12.18 standard for communications.Asset container that performs one or more end device functions. One type of end device is a meter which can perform metering, load management, connect/disconnect, accounting functions, etc. Some end devices, such as ones monitoring and controlling air conditioner, refrigerator, pool pumps may be connected to a meter. All end devices may have communication capability defined by the associated communication function(s). An end device may be owned by a consumer, a service provider, utility or otherwise. There may be a related end device function that identifies a sensor or control point within a metering application or communications systems (e.g., water, gas, electricity). Some devices may use an optical port that conforms to the ANSI C12.18 standard for communications.
@@ -52,17 +53,20 @@ class EndDevice(AssetContainer):
         self._ServiceLocation = None
         self.ServiceLocation = ServiceLocation
 
-        self._EndDeviceFunctions = []
-        self.EndDeviceFunctions = [] if EndDeviceFunctions is None else EndDeviceFunctions
+        self._EndDeviceFunctions = EMPTY
+        if EndDeviceFunctions is not None:
+            self.EndDeviceFunctions = EndDeviceFunctions
 
-        self._EndDeviceControls = []
-        self.EndDeviceControls = [] if EndDeviceControls is None else EndDeviceControls
+        self._EndDeviceControls = EMPTY
+        if EndDeviceControls is not None:
+            self.EndDeviceControls = EndDeviceControls
 
         self._Customer = None
         self.Customer = Customer
 
-        self._EndDeviceGroups = []
-        self.EndDeviceGroups = [] if EndDeviceGroups is None else EndDeviceGroups
+        self._EndDeviceGroups = EMPTY
+        if EndDeviceGroups is not None:
+            self.EndDeviceGroups = EndDeviceGroups
 
         super(EndDevice, self).__init__(*args, **kw_args)
 
@@ -80,13 +84,14 @@ class EndDevice(AssetContainer):
 
     def setEndDeviceInfo(self, value):
         if self._EndDeviceInfo is not None:
-            filtered = [x for x in self.EndDeviceInfo.EndDevices if x != self]
-            self._EndDeviceInfo._EndDevices = filtered
+            self._EndDeviceInfo._EndDevices.discard(self)
 
         self._EndDeviceInfo = value
         if self._EndDeviceInfo is not None:
-            if self not in self._EndDeviceInfo._EndDevices:
-                self._EndDeviceInfo._EndDevices.append(self)
+            if self._EndDeviceInfo._EndDevices is EMPTY:
+                self._EndDeviceInfo._EndDevices = AssociationList([self])
+            else:
+                self._EndDeviceInfo._EndDevices.add(self)
 
     EndDeviceInfo = property(getEndDeviceInfo, setEndDeviceInfo)
 
@@ -97,13 +102,14 @@ class EndDevice(AssetContainer):
 
     def setServiceDeliveryPoint(self, value):
         if self._ServiceDeliveryPoint is not None:
-            filtered = [x for x in self.ServiceDeliveryPoint.EndDevices if x != self]
-            self._ServiceDeliveryPoint._EndDevices = filtered
+            self._ServiceDeliveryPoint._EndDevices.discard(self)
 
         self._ServiceDeliveryPoint = value
         if self._ServiceDeliveryPoint is not None:
-            if self not in self._ServiceDeliveryPoint._EndDevices:
-                self._ServiceDeliveryPoint._EndDevices.append(self)
+            if self._ServiceDeliveryPoint._EndDevices is EMPTY:
+                self._ServiceDeliveryPoint._EndDevices = AssociationList([self])
+            else:
+                self._ServiceDeliveryPoint._EndDevices.add(self)
 
     ServiceDeliveryPoint = property(getServiceDeliveryPoint, setServiceDeliveryPoint)
 
@@ -114,13 +120,14 @@ class EndDevice(AssetContainer):
 
     def setServiceLocation(self, value):
         if self._ServiceLocation is not None:
-            filtered = [x for x in self.ServiceLocation.EndDevices if x != self]
-            self._ServiceLocation._EndDevices = filtered
+            self._ServiceLocation._EndDevices.discard(self)
 
         self._ServiceLocation = value
         if self._ServiceLocation is not None:
-            if self not in self._ServiceLocation._EndDevices:
-                self._ServiceLocation._EndDevices.append(self)
+            if self._ServiceLocation._EndDevices is EMPTY:
+                self._ServiceLocation._EndDevices = AssociationList([self])
+            else:
+                self._ServiceLocation._EndDevices.add(self)
 
     ServiceLocation = property(getServiceLocation, setServiceLocation)
 
@@ -130,6 +137,7 @@ class EndDevice(AssetContainer):
         return self._EndDeviceFunctions
 
     def setEndDeviceFunctions(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._EndDeviceFunctions:
             x.EndDevice = None
         for y in value:
@@ -152,6 +160,7 @@ class EndDevice(AssetContainer):
         return self._EndDeviceControls
 
     def setEndDeviceControls(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._EndDeviceControls:
             x.EndDevice = None
         for y in value:
@@ -175,13 +184,14 @@ class EndDevice(AssetContainer):
 
     def setCustomer(self, value):
         if self._Customer is not None:
-            filtered = [x for x in self.Customer.EndDevices if x != self]
-            self._Customer._EndDevices = filtered
+            self._Customer._EndDevices.discard(self)
 
         self._Customer = value
         if self._Customer is not None:
-            if self not in self._Customer._EndDevices:
-                self._Customer._EndDevices.append(self)
+            if self._Customer._EndDevices is EMPTY:
+                self._Customer._EndDevices = AssociationList([self])
+            else:
+                self._Customer._EndDevices.add(self)
 
     Customer = property(getCustomer, setCustomer)
 
@@ -191,21 +201,28 @@ class EndDevice(AssetContainer):
         return self._EndDeviceGroups
 
     def setEndDeviceGroups(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._EndDeviceGroups:
-            filtered = [q for q in p.EndDevices if q != self]
-            self._EndDeviceGroups._EndDevices = filtered
+            p._EndDevices.discard(self)
         for r in value:
-            if self not in r._EndDevices:
-                r._EndDevices.append(self)
+            if r._EndDevices is EMPTY:
+                r._EndDevices = AssociationList([self])
+            else:
+                r._EndDevices.add(self)
         self._EndDeviceGroups = value
 
     EndDeviceGroups = property(getEndDeviceGroups, setEndDeviceGroups)
 
     def addEndDeviceGroups(self, *EndDeviceGroups):
         for obj in EndDeviceGroups:
-            if self not in obj._EndDevices:
-                obj._EndDevices.append(self)
-            self._EndDeviceGroups.append(obj)
+            if obj._EndDevices is EMPTY:
+                obj._EndDevices = AssociationList([self])
+            else:
+                obj._EndDevices.add(self)
+            if self._EndDeviceGroups is EMPTY:
+                self._EndDeviceGroups = AssociationList([obj])
+            else:
+                self._EndDeviceGroups.add(obj)
 
     def removeEndDeviceGroups(self, *EndDeviceGroups):
         for obj in EndDeviceGroups:
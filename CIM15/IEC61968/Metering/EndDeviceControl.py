@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class EndDeviceControl(IdentifiedObject):
     """Instructs an end device (or an end device group) to perform a specified action.Instructs an end device (or an end device group) to perform a specified action.
@@ -79,13 +80,14 @@ class EndDeviceControl(IdentifiedObject):
 
     def setDemandResponseProgram(self, value):
         if self._DemandResponseProgram is not None:
-            filtered = [x for x in self.DemandResponseProgram.EndDeviceControls if x != self]
-            self._DemandResponseProgram._EndDeviceControls = filtered
+            self._DemandResponseProgram._EndDeviceControls.discard(self)
 
         self._DemandResponseProgram = value
         if self._DemandResponseProgram is not None:
-            if self not in self._DemandResponseProgram._EndDeviceControls:
-                self._DemandResponseProgram._EndDeviceControls.append(self)
+            if self._DemandResponseProgram._EndDeviceControls is EMPTY:
+                self._DemandResponseProgram._EndDeviceControls = AssociationList([self])
+            else:
+                self._DemandResponseProgram._EndDeviceControls.add(self)
 
     DemandResponseProgram = property(getDemandResponseProgram, setDemandResponseProgram)
 
@@ -96,13 +98,14 @@ class EndDeviceControl(IdentifiedObject):
 
     def setCustomerAgreement(self, value):
         if self._CustomerAgreement is not None:
-            filtered = [x for x in self.CustomerAgreement.EndDeviceControls if x != self]
-            self._CustomerAgreement._EndDeviceControls = filtered
+            self._CustomerAgreement._EndDeviceControls.discard(self)
 
         self._CustomerAgreement = value
         if self._CustomerAgreement is not None:
-            if self not in self._CustomerAgreement._EndDeviceControls:
-                self._CustomerAgreement._EndDeviceControls.append(self)
+            if self._CustomerAgreement._EndDeviceControls is EMPTY:
+                self._CustomerAgreement._EndDeviceControls = AssociationList([self])
+            else:
+                self._CustomerAgreement._EndDeviceControls.add(self)
 
     CustomerAgreement = property(getCustomerAgreement, setCustomerAgreement)
 
@@ -116,13 +119,14 @@ class EndDeviceControl(IdentifiedObject):
 
     def setEndDeviceGroup(self, value):
         if self._EndDeviceGroup is not None:
-            filtered = [x for x in self.EndDeviceGroup.EndDeviceControls if x != self]
-            self._EndDeviceGroup._EndDeviceControls = filtered
+            self._EndDeviceGroup._EndDeviceControls.discard(self)
 
         self._EndDeviceGroup = value
         if self._EndDeviceGroup is not None:
-            if self not in self._EndDeviceGroup._EndDeviceControls:
-                self._EndDeviceGroup._EndDeviceControls.append(self)
+            if self._EndDeviceGroup._EndDeviceControls is EMPTY:
+                self._EndDeviceGroup._EndDeviceControls = AssociationList([self])
+            else:
+                self._EndDeviceGroup._EndDeviceControls.add(self)
 
     EndDeviceGroup = property(getEndDeviceGroup, setEndDeviceGroup)
 
@@ -133,13 +137,14 @@ class EndDeviceControl(IdentifiedObject):
 
     def setEndDevice(self, value):
         if self._EndDevice is not None:
-            filtered = [x for x in self.EndDevice.EndDeviceControls if x != self]
-            self._EndDevice._EndDeviceControls = filtered
+            self._EndDevice._EndDeviceControls.discard(self)
 
         self._EndDevice = value
         if self._EndDevice is not None:
-            if self not in self._EndDevice._EndDeviceControls:
-                self._EndDevice._EndDeviceControls.append(self)
+            if self._EndDevice._EndDeviceControls is EMPTY:
+                self._EndDevice._EndDeviceControls = AssociationList([self])
+            else:
+                self._EndDevice._EndDeviceControls.add(self)
 
     EndDevice = property(getEndDevice, setEndDevice)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.ActivityRecord import ActivityRecord
+from CIM15.Element import AssociationList, EMPTY
 
 class EndDeviceEvent(ActivityRecord):
     """Event detected by a device function associated with end device.Event detected by a device function associated with end device.
@@ -56,13 +57,14 @@ class EndDeviceEvent(ActivityRecord):
 
     def setEndDeviceFunction(self, value):
         if self._EndDeviceFunction is not None:
-            filtered = [x for x in self.EndDeviceFunction.EndDeviceEvents if x != self]
-            self._EndDeviceFunction._EndDeviceEvents = filtered
+            self._EndDeviceFunction._EndDeviceEvents.discard(self)
 
         self._EndDeviceFunction = value
         if self._EndDeviceFunction is not None:
-            if self not in self._EndDeviceFunction._EndDeviceEvents:
-                self._EndDeviceFunction._EndDeviceEvents.append(self)
+            if self._EndDeviceFunction._EndDeviceEvents is EMPTY:
+                self._EndDeviceFunction._EndDeviceEvents = AssociationList([self])
+            else:
+                self._EndDeviceFunction._EndDeviceEvents.add(self)
 
     EndDeviceFunction = property(getEndDeviceFunction, setEndDeviceFunction)
 
@@ -73,13 +75,14 @@ class EndDeviceEvent(ActivityRecord):
 
     def setMeterReading(self, value):
         if self._MeterReading is not None:
-            filtered = [x for x in self.MeterReading.EndDeviceEvents if x != self]
-            self._MeterReading._EndDeviceEvents = filtered
+            self._MeterReading._EndDeviceEvents.discard(self)
 
         self._MeterReading = value
         if self._MeterReading is not None:
-            if self not in self._MeterReading._EndDeviceEvents:
-                self._MeterReading._EndDeviceEvents.append(self)
+            if self._MeterReading._EndDeviceEvents is EMPTY:
+                self._MeterReading._EndDeviceEvents = AssociationList([self])
+            else:
+                self._MeterReading._EndDeviceEvents.add(self)
 
     MeterReading = property(getMeterReading, setMeterReading)
 
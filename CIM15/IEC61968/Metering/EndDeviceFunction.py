@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.AssetFunction import AssetFunction
+from CIM15.Element import AssociationList, EMPTY
 
 class EndDeviceFunction(AssetFunction):
     """Function performed by an end device such as a meter, communication equipment, controllers, etc.Function performed by an end device such as a meter, communication equipment, controllers, etc.
@@ -40,14 +41,16 @@ class EndDeviceFunction(AssetFunction):
         #: True if the function is supported (inherent property of the device).
         self.supported = supported
 
-        self._Registers = []
-        self.Registers = [] if Registers is None else Registers
+        self._Registers = EMPTY
+        if Registers is not None:
+            self.Registers = Registers
 
         self._ComEquipment = None
         self.ComEquipment = ComEquipment
 
-        self._EndDeviceEvents = []
-        self.EndDeviceEvents = [] if EndDeviceEvents is None else EndDeviceEvents
+        self._EndDeviceEvents = EMPTY
+        if EndDeviceEvents is not None:
+            self.EndDeviceEvents = EndDeviceEvents
 
         self._EndDevice = None
         self.EndDevice = EndDevice
@@ -67,6 +70,7 @@ class EndDeviceFunction(AssetFunction):
         return self._Registers
 
     def setRegisters(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Registers:
             x.EndDeviceFunction = None
         for y in value:
@@ -90,13 +94,14 @@ class EndDeviceFunction(AssetFunction):
 
     def setComEquipment(self, value):
         if self._ComEquipment is not None:
-            filtered = [x for x in self.ComEquipment.EndDeviceFunctions if x != self]
-            self._ComEquipment._EndDeviceFunctions = filtered
+            self._ComEquipment._EndDeviceFunctions.discard(self)
 
         self._ComEquipment = value
         if self._ComEquipment is not None:
-            if self not in self._ComEquipment._EndDeviceFunctions:
-                self._ComEquipment._EndDeviceFunctions.append(self)
+            if self._ComEquipment._EndDeviceFunctions is EMPTY:
+                self._ComEquipment._EndDeviceFunctions = AssociationList([self])
+            else:
+                self._ComEquipment._EndDeviceFunctions.add(self)
 
     ComEquipment = property(getComEquipment, setComEquipment)
 
@@ -106,6 +111,7 @@ class EndDeviceFunction(AssetFunction):
         return self._EndDeviceEvents
 
     def setEndDeviceEvents(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._EndDeviceEvents:
             x.EndDeviceFunction = None
         for y in value:
@@ -129,13 +135,14 @@ class EndDeviceFunction(AssetFunction):
 
     def setEndDevice(self, value):
         if self._EndDevice is not None:
-            filtered = [x for x in self.EndDevice.EndDeviceFunctions if x != self]
-            self._EndDevice._EndDeviceFunctions = filtered
+            self._EndDevice._EndDeviceFunctions.discard(self)
 
         self._EndDevice = value
         if self._EndDevice is not None:
-            if self not in self._EndDevice._EndDeviceFunctions:
-                self._EndDevice._EndDeviceFunctions.append(self)
+            if self._EndDevice._EndDeviceFunctions is EMPTY:
+                self._EndDevice._EndDeviceFunctions = AssociationList([self])
+            else:
+                self._EndDevice._EndDeviceFunctions.add(self)
 
     EndDevice = property(getEndDevice, setEndDevice)
 
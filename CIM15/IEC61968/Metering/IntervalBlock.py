@@ -18,7 +18,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from CIM15.Element import Element
+from CIM15.Element import Element, AssociationList, EMPTY
 
 class IntervalBlock(Element):
     """Time sequence of Readings of the same ReadingType. Contained IntervalReadings may need conversion through the application of an offset and a scalar defined in associated Pending.Time sequence of Readings of the same ReadingType. Contained IntervalReadings may need conversion through the application of an offset and a scalar defined in associated Pending.
@@ -35,8 +35,9 @@ class IntervalBlock(Element):
         self._ReadingType = None
         self.ReadingType = ReadingType
 
-        self._IntervalReadings = []
-        self.IntervalReadings = [] if IntervalReadings is None else IntervalReadings
+        self._IntervalReadings = EMPTY
+        if IntervalReadings is not None:
+            self.IntervalReadings = IntervalReadings
 
         self._MeterReading = None
         self.MeterReading = MeterReading
@@ -60,13 +61,14 @@ class IntervalBlock(Element):
 
     def setReadingType(self, value):
         if self._ReadingType is not None:
-            filtered = [x for x in self.ReadingType.IntervalBlocks if x != self]
-            self._ReadingType._IntervalBlocks = filtered
+            self._ReadingType._IntervalBlocks.discard(self)
 
         self._ReadingType = value
         if self._ReadingType is not None:
-            if self not in self._ReadingType._IntervalBlocks:
-                self._ReadingType._IntervalBlocks.append(self)
+            if self._ReadingType._IntervalBlocks is EMPTY:
+                self._ReadingType._IntervalBlocks = AssociationList([self])
+            else:
+                self._ReadingType._IntervalBlocks.add(self)
 
     ReadingType = property(getReadingType, setReadingType)
 
@@ -76,21 +78,28 @@ class IntervalBlock(Element):
         return self._IntervalReadings
 
     def setIntervalReadings(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._IntervalReadings:
-            filtered = [q for q in p.IntervalBlocks if q != self]
-            self._IntervalReadings._IntervalBlocks = filtered
+            p._IntervalBlocks.discard(self)
         for r in value:
-            if self not in r._IntervalBlocks:
-                r._IntervalBlocks.append(self)
+            if r._IntervalBlocks is EMPTY:
+                r._IntervalBlocks = AssociationList([self])
+            else:
+                r._IntervalBlocks.add(self)
         self._IntervalReadings = value
 
     IntervalReadings = property(getIntervalReadings, setIntervalReadings)
 
     def addIntervalReadings(self, *IntervalReadings):
         for obj in IntervalReadings:
-            if self not in obj._IntervalBlocks:
-                obj._IntervalBlocks.append(self)
-            self._IntervalReadings.append(obj)
+            if obj._IntervalBlocks is EMPTY:
+                obj._IntervalBlocks = AssociationList([self])
+            else:
+                obj._IntervalBlocks.add(self)
+            if self._IntervalReadings is EMPTY:
+                self._IntervalReadings = AssociationList([obj])
+            else:
+                self._IntervalReadings.add(obj)
 
     def removeIntervalReadings(self, *IntervalReadings):
         for obj in IntervalReadings:
@@ -105,13 +114,14 @@ class IntervalBlock(Element):
 
     def setMeterReading(self, value):
         if self._MeterReading is not None:
-            filtered = [x for x in self.MeterReading.IntervalBlocks if x != self]
-            self._MeterReading._IntervalBlocks = filtered
+            self._MeterReading._IntervalBlocks.discard(self)
 
         self._MeterReading = value
         if self._MeterReading is not None:
-            if self not in self._MeterReading._IntervalBlocks:
-                self._MeterReading._IntervalBlocks.append(self)
+            if self._MeterReading._IntervalBlocks is EMPTY:
+                self._MeterReading._IntervalBlocks = AssociationList([self])
+            else:
+                self._MeterReading._IntervalBlocks.add(self)
 
     MeterReading = property(getMeterReading, setMeterReading)
 
@@ -122,13 +132,14 @@ class IntervalBlock(Element):
 
     def setPendingCalculation(self, value):
         if self._PendingCalculation is not None:
-            filtered = [x for x in self.PendingCalculation.IntervalBlocks if x != self]
-            self._PendingCalculation._IntervalBlocks = filtered
+            self._PendingCalculation._IntervalBlocks.discard(self)
 
         self._PendingCalculation = value
         if self._PendingCalculation is not None:
-            if self not in self._PendingCalculation._IntervalBlocks:
-                self._PendingCalculation._IntervalBlocks.append(self)
+            if self._PendingCalculation._IntervalBlocks is EMPTY:
+                self._PendingCalculation._IntervalBlocks = AssociationList([self])
+            else:
+                self._PendingCalculation._IntervalBlocks.add(self)
 
     PendingCalculation = property(getPendingCalculation, setPendingCalculation)
 
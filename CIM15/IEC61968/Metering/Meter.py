@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Metering.EndDevice import EndDevice
+from CIM15.Element import AssociationList, EMPTY
 
 class Meter(EndDevice):
     """Physical asset that performs the metering role of the ServiceDeliveryPoint. Used for measuring consumption and detection of events.Physical asset that performs the metering role of the ServiceDeliveryPoint. Used for measuring consumption and detection of events.
@@ -44,17 +45,21 @@ class Meter(EndDevice):
         #: Meter form designation per ANSI C12.10 or other applicable standard. An alphanumeric designation denoting the circuit arrangement for which the meter is applicable and its specific terminal arrangement.
         self.formNumber = formNumber
 
-        self._MeterReplacementWorks = []
-        self.MeterReplacementWorks = [] if MeterReplacementWorks is None else MeterReplacementWorks
+        self._MeterReplacementWorks = EMPTY
+        if MeterReplacementWorks is not None:
+            self.MeterReplacementWorks = MeterReplacementWorks
 
-        self._MeterReadings = []
-        self.MeterReadings = [] if MeterReadings is None else MeterReadings
+        self._MeterReadings = EMPTY
+        if MeterReadings is not None:
+            self.MeterReadings = MeterReadings
 
-        self._MeterServiceWorks = []
-        self.MeterServiceWorks = [] if MeterServiceWorks is None else MeterServiceWorks
+        self._MeterServiceWorks = EMPTY
+        if MeterServiceWorks is not None:
+            self.MeterServiceWorks = MeterServiceWorks
 
-        self._VendingTransactions = []
-        self.VendingTransactions = [] if VendingTransactions is None else VendingTransactions
+        self._VendingTransactions = EMPTY
+        if VendingTransactions is not None:
+            self.VendingTransactions = VendingTransactions
 
         super(Meter, self).__init__(*args, **kw_args)
 
@@ -71,6 +76,7 @@ class Meter(EndDevice):
         return self._MeterReplacementWorks
 
     def setMeterReplacementWorks(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._MeterReplacementWorks:
             x.OldMeter = None
         for y in value:
@@ -93,6 +99,7 @@ class Meter(EndDevice):
         return self._MeterReadings
 
     def setMeterReadings(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._MeterReadings:
             x.Meter = None
         for y in value:
@@ -115,6 +122,7 @@ class Meter(EndDevice):
         return self._MeterServiceWorks
 
     def setMeterServiceWorks(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._MeterServiceWorks:
             x.Meter = None
         for y in value:
@@ -137,6 +145,7 @@ class Meter(EndDevice):
         return self._VendingTransactions
 
     def setVendingTransactions(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._VendingTransactions:
             x.Meter = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class MeterReading(IdentifiedObject):
     """Set of values obtained from the meter.Set of values obtained from the meter.
@@ -40,11 +41,13 @@ class MeterReading(IdentifiedObject):
 
         self.valuesInterval = valuesInterval
 
-        self._EndDeviceEvents = []
-        self.EndDeviceEvents = [] if EndDeviceEvents is None else EndDeviceEvents
+        self._EndDeviceEvents = EMPTY
+        if EndDeviceEvents is not None:
+            self.EndDeviceEvents = EndDeviceEvents
 
-        self._Readings = []
-        self.Readings = [] if Readings is None else Readings
+        self._Readings = EMPTY
+        if Readings is not None:
+            self.Readings = Readings
 
         self._CustomerAgreement = None
         self.CustomerAgreement = CustomerAgreement
@@ -52,8 +55,9 @@ class MeterReading(IdentifiedObject):
         self._Meter = None
         self.Meter = Meter
 
-        self._IntervalBlocks = []
-        self.IntervalBlocks = [] if IntervalBlocks is None else IntervalBlocks
+        self._IntervalBlocks = EMPTY
+        if IntervalBlocks is not None:
+            self.IntervalBlocks = IntervalBlocks
 
         super(MeterReading, self).__init__(*args, **kw_args)
 
@@ -71,13 +75,14 @@ class MeterReading(IdentifiedObject):
 
     def setServiceDeliveryPoint(self, value):
         if self._ServiceDeliveryPoint is not None:
-            filtered = [x for x in self.ServiceDeliveryPoint.MeterReadings if x != self]
-            self._ServiceDeliveryPoint._MeterReadings = filtered
+            self._ServiceDeliveryPoint._MeterReadings.discard(self)
 
         self._ServiceDeliveryPoint = value
         if self._ServiceDeliveryPoint is not None:
-            if self not in self._ServiceDeliveryPoint._MeterReadings:
-                self._ServiceDeliveryPoint._MeterReadings.append(self)
+            if self._ServiceDeliveryPoint._MeterReadings is EMPTY:
+                self._ServiceDeliveryPoint._MeterReadings = AssociationList([self])
+            else:
+                self._ServiceDeliveryPoint._MeterReadings.add(self)
 
     ServiceDeliveryPoint = property(getServiceDeliveryPoint, setServiceDeliveryPoint)
 
@@ -90,6 +95,7 @@ class MeterReading(IdentifiedObject):
         return self._EndDeviceEvents
 
     def setEndDeviceEvents(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._EndDeviceEvents:
             x.MeterReading = None
         for y in value:
@@ -112,21 +118,28 @@ class MeterReading(IdentifiedObject):
         return self._Readings
 
     def setReadings(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Readings:
-            filtered = [q for q in p.MeterReadings if q != self]
-            self._Readings._MeterReadings = filtered
+            p._MeterReadings.discard(self)
         for r in value:
-            if self not in r._MeterReadings:
-                r._MeterReadings.append(self)
+            if r._MeterReadings is EMPTY:
+                r._MeterReadings = AssociationList([self])
+            else:
+                r._MeterReadings.add(self)
         self._Readings = value
 
     Readings = property(getReadings, setReadings)
 
     def addReadings(self, *Readings):
         for obj in Readings:
-            if self not in obj._MeterReadings:
-                obj._MeterReadings.append(self)
-            self._Readings.append(obj)
+            if obj._MeterReadings is EMPTY:
+                obj._MeterReadings = AssociationList([self])
+            else:
+                obj._MeterReadings.add(self)
+            if self._Readings is EMPTY:
+                self._Readings = AssociationList([obj])
+            else:
+                self._Readings.add(obj)
 
     def removeReadings(self, *Readings):
         for obj in Readings:
@@ -141,13 +154,14 @@ class MeterReading(IdentifiedObject):
 
     def setCustomerAgreement(self, value):
         if self._CustomerAgreement is not None:
-            filtered = [x for x in self.CustomerAgreement.MeterReadings if x != self]
-            self._CustomerAgreement._MeterReadings = filtered
+            self._CustomerAgreement._MeterReadings.discard(self)
 
         self._CustomerAgreement = value
         if self._CustomerAgreement is not None:
-            if self not in self._CustomerAgreement._MeterReadings:
-                self._CustomerAgreement._MeterReadings.append(self)
+            if self._CustomerAgreement._MeterReadings is EMPTY:
+                self._CustomerAgreement._MeterReadings = AssociationList([self])
+            else:
+                self._CustomerAgreement._MeterReadings.add(self)
 
     CustomerAgreement = property(getCustomerAgreement, setCustomerAgreement)
 
@@ -158,13 +172,14 @@ class MeterReading(IdentifiedObject):
 
     def setMeter(self, value):
         if self._Meter is not None:
-            filtered = [x for x in self.Meter.MeterReadings if x != self]
-            self._Meter._MeterReadings = filtered
+            self._Meter._MeterReadings.discard(self)
 
         self._Meter = value
         if self._Meter is not None:
-            if self not in self._Meter._MeterReadings:
-                self._Meter._MeterReadings.append(self)
+            if self._Meter._MeterReadings is EMPTY:
+                self._Meter._MeterReadings = AssociationList([self])
+            else:
+                self._Meter._MeterReadings.add(self)
 
     Meter = property(getMeter, setMeter)
 
@@ -174,6 +189,7 @@ class MeterReading(IdentifiedObject):
         return self._IntervalBlocks
 
     def setIntervalBlocks(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._IntervalBlocks:
             x.MeterReading = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Work.Work import Work
+from CIM15.Element import AssociationList, EMPTY
 
 class MeterServiceWork(Work):
     """Work involving meters.Work involving meters.
@@ -52,13 +53,14 @@ class MeterServiceWork(Work):
 
     def setOldMeter(self, value):
         if self._OldMeter is not None:
-            filtered = [x for x in self.OldMeter.MeterReplacementWorks if x != self]
-            self._OldMeter._MeterReplacementWorks = filtered
+            self._OldMeter._MeterReplacementWorks.discard(self)
 
         self._OldMeter = value
         if self._OldMeter is not None:
-            if self not in self._OldMeter._MeterReplacementWorks:
-                self._OldMeter._MeterReplacementWorks.append(self)
+            if self._OldMeter._MeterReplacementWorks is EMPTY:
+                self._OldMeter._MeterReplacementWorks = AssociationList([self])
+            else:
+                self._OldMeter._MeterReplacementWorks.add(self)
 
     OldMeter = property(getOldMeter, setOldMeter)
 
@@ -69,13 +71,14 @@ class MeterServiceWork(Work):
 
     def setMeter(self, value):
         if self._Meter is not None:
-            filtered = [x for x in self.Meter.MeterServiceWorks if x != self]
-            self._Meter._MeterServiceWorks = filtered
+            self._Meter._MeterServiceWorks.discard(self)
 
         self._Meter = value
         if self._Meter is not None:
-            if self not in self._Meter._MeterServiceWorks:
-                self._Meter._MeterServiceWorks.append(self)
+            if self._Meter._MeterServiceWorks is EMPTY:
+                self._Meter._MeterServiceWorks = AssociationList([self])
+            else:
+                self._Meter._MeterServiceWorks.add(self)
 
     Meter = property(getMeter, setMeter)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Meas.MeasurementValue import MeasurementValue
+from CIM15.Element import AssociationList, EMPTY
 
 class Reading(MeasurementValue):
     """Specific value measured by a meter or other asset. Each Reading is associated with a specific ReadingType.Specific value measured by a meter or other asset. Each Reading is associated with a specific ReadingType.
@@ -38,11 +39,13 @@ class Reading(MeasurementValue):
         self._ReadingType = None
         self.ReadingType = ReadingType
 
-        self._MeterReadings = []
-        self.MeterReadings = [] if MeterReadings is None else MeterReadings
+        self._MeterReadings = EMPTY
+        if MeterReadings is not None:
+            self.MeterReadings = MeterReadings
 
-        self._ReadingQualities = []
-        self.ReadingQualities = [] if ReadingQualities is None else ReadingQualities
+        self._ReadingQualities = EMPTY
+        if ReadingQualities is not None:
+            self.ReadingQualities = ReadingQualities
 
         super(Reading, self).__init__(*args, **kw_args)
 
@@ -60,13 +63,14 @@ class Reading(MeasurementValue):
 
     def setReadingType(self, value):
         if self._ReadingType is not None:
-            filtered = [x for x in self.ReadingType.Readings if x != self]
-            self._ReadingType._Readings = filtered
+            self._ReadingType._Readings.discard(self)
 
         self._ReadingType = value
         if self._ReadingType is not None:
-            if self not in self._ReadingType._Readings:
-                self._ReadingType._Readings.append(self)
+            if self._ReadingType._Readings is EMPTY:
+                self._ReadingType._Readings = AssociationList([self])
+            else:
+                self._ReadingType._Readings.add(self)
 
     ReadingType = property(getReadingType, setReadingType)
 
@@ -76,21 +80,28 @@ class Reading(MeasurementValue):
         return self._MeterReadings
 
     def setMeterReadings(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._MeterReadings:
-            filtered = [q for q in p.Readings if q != self]
-            self._MeterReadings._Readings = filtered
+            p._Readings.discard(self)
         for r in value:
-            if self not in r._Readings:
-                r._Readings.append(self)
+            if r._Readings is EMPTY:
+                r._Readings = AssociationList([self])
+            else:
+                r._Readings.add(self)
         self._MeterReadings = value
 
     MeterReadings = property(getMeterReadings, setMeterReadings)
 
     def addMeterReadings(self, *MeterReadings):
         for obj in MeterReadings:
-            if self not in obj._Readings:
-                obj._Readings.append(self)
-            self._MeterReadings.append(obj)
+            if obj._Readings is EMPTY:
+                obj._Readings = AssociationList([self])
+            else:
+                obj._Readings.add(self)
+            if self._MeterReadings is EMPTY:
+                self._MeterReadings = AssociationList([obj])
+            else:
+                self._MeterReadings.add(obj)
 
     def removeMeterReadings(self, *MeterReadings):
         for obj in MeterReadings:
@@ -104,6 +115,7 @@ class Reading(MeasurementValue):
         return self._ReadingQualities
 
     def setReadingQualities(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ReadingQualities:
             x.Reading = None
         for y in value:
@@ -18,7 +18,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from CIM15.Element import Element
+from CIM15.Element import Element, AssociationList, EMPTY
 
 class ReadingQuality(Element):
     """Quality of a specific reading value or interval reading value. Note that more than one quality may be applicable to a given reading. Typically not used unless problems or unusual conditions occur (i.e., quality for each reading is assumed to be 'good' unless stated otherwise in associated reading quality).Quality of a specific reading value or interval reading value. Note that more than one quality may be applicable to a given reading. Typically not used unless problems or unusual conditions occur (i.e., quality for each reading is assumed to be 'good' unless stated otherwise in associated reading quality).
@@ -56,13 +56,14 @@ class ReadingQuality(Element):
 
     def setReading(self, value):
         if self._Reading is not None:
-            filtered = [x for x in self.Reading.ReadingQualities if x != self]
-            self._Reading._ReadingQualities = filtered
+            self._Reading._ReadingQualities.discard(self)
 
         self._Reading = value
         if self._Reading is not None:
-            if self not in self._Reading._ReadingQualities:
-                self._Reading._ReadingQualities.append(self)
+            if self._Reading._ReadingQualities is EMPTY:
+                self._Reading._ReadingQualities = AssociationList([self])
+            else:
+                self._Reading._ReadingQualities.add(self)
 
     Reading = property(getReading, setReading)
 
@@ -73,13 +74,14 @@ class ReadingQuality(Element):
 
     def setIntervalReading(self, value):
         if self._IntervalReading is not None:
-            filtered = [x for x in self.IntervalReading.ReadingQualities if x != self]
-            self._IntervalReading._ReadingQualities = filtered
+            self._IntervalReading._ReadingQualities.discard(self)
 
         self._IntervalReading = value
         if self._IntervalReading is not None:
-            if self not in self._IntervalReading._ReadingQualities:
-                self._IntervalReading._ReadingQualities.append(self)
+            if self._IntervalReading._ReadingQualities is EMPTY:
+                self._IntervalReading._ReadingQualities = AssociationList([self])
+            else:
+                self._IntervalReading._ReadingQualities.add(self)
 
     IntervalReading = property(getIntervalReading, setIntervalReading)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class Register(IdentifiedObject):
     """Display for quantity that is metered on an end device such as a meter.Display for quantity that is metered on an end device such as a meter.
@@ -76,13 +77,14 @@ class Register(IdentifiedObject):
 
     def setEndDeviceFunction(self, value):
         if self._EndDeviceFunction is not None:
-            filtered = [x for x in self.EndDeviceFunction.Registers if x != self]
-            self._EndDeviceFunction._Registers = filtered
+            self._EndDeviceFunction._Registers.discard(self)
 
         self._EndDeviceFunction = value
         if self._EndDeviceFunction is not None:
-            if self not in self._EndDeviceFunction._Registers:
-                self._EndDeviceFunction._Registers.append(self)
+            if self._EndDeviceFunction._Registers is EMPTY:
+                self._EndDeviceFunction._Registers = AssociationList([self])
+            else:
+                self._EndDeviceFunction._Registers.add(self)
 
     EndDeviceFunction = property(getEndDeviceFunction, setEndDeviceFunction)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class ServiceDeliveryPoint(IdentifiedObject):
     """Logical point on the network where the ownership of the service changes hands. It is one of potentially many service points within a service location, delivering service in accordance with a customer agreement. Used at the place where a meter may be installed.Logical point on the network where the ownership of the service changes hands. It is one of potentially many service points within a service location, delivering service in accordance with a customer agreement. Used at the place where a meter may be installed.
@@ -78,23 +79,27 @@ class ServiceDeliveryPoint(IdentifiedObject):
         #: Nominal service voltage.
         self.ratedVoltage = ratedVoltage
 
-        self._SDPLocations = []
-        self.SDPLocations = [] if SDPLocations is None else SDPLocations
+        self._SDPLocations = EMPTY
+        if SDPLocations is not None:
+            self.SDPLocations = SDPLocations
 
         self._ServiceLocation = None
         self.ServiceLocation = ServiceLocation
 
-        self._EndDevices = []
-        self.EndDevices = [] if EndDevices is None else EndDevices
+        self._EndDevices = EMPTY
+        if EndDevices is not None:
+            self.EndDevices = EndDevices
 
-        self._MeterReadings = []
-        self.MeterReadings = [] if MeterReadings is None else MeterReadings
+        self._MeterReadings = EMPTY
+        if MeterReadings is not None:
+            self.MeterReadings = MeterReadings
 
         self._ServiceCategory = None
         self.ServiceCategory = ServiceCategory
 
-        self._PricingStructures = []
-        self.PricingStructures = [] if PricingStructures is None else PricingStructures
+        self._PricingStructures = EMPTY
+        if PricingStructures is not None:
+            self.PricingStructures = PricingStructures
 
         self._EnergyConsumer = None
         self.EnergyConsumer = EnergyConsumer
@@ -123,21 +128,28 @@ class ServiceDeliveryPoint(IdentifiedObject):
         return self._SDPLocations
 
     def setSDPLocations(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._SDPLocations:
-            filtered = [q for q in p.ServiceDeliveryPoints if q != self]
-            self._SDPLocations._ServiceDeliveryPoints = filtered
+            p._ServiceDeliveryPoints.discard(self)
         for r in value:
-            if self not in r._ServiceDeliveryPoints:
-                r._ServiceDeliveryPoints.append(self)
+            if r._ServiceDeliveryPoints is EMPTY:
+                r._ServiceDeliveryPoints = AssociationList([self])
+            else:
+                r._ServiceDeliveryPoints.add(self)
         self._SDPLocations = value
 
     SDPLocations = property(getSDPLocations, setSDPLocations)
 
     def addSDPLocations(self, *SDPLocations):
         for obj in SDPLocations:
-            if self not in obj._ServiceDeliveryPoints:
-                obj._ServiceDeliveryPoints.append(self)
-            self._SDPLocations.append(obj)
+            if obj._ServiceDeliveryPoints is EMPTY:
+                obj._ServiceDeliveryPoints = AssociationList([self])
+            else:
+                obj._ServiceDeliveryPoints.add(self)
+            if self._SDPLocations is EMPTY:
+                self._SDPLocations = AssociationList([obj])
+            else:
+                self._SDPLocations.add(obj)
 
     def removeSDPLocations(self, *SDPLocations):
         for obj in SDPLocations:
@@ -152,13 +164,14 @@ class ServiceDeliveryPoint(IdentifiedObject):
 
     def setServiceLocation(self, value):
         if self._ServiceLocation is not None:
-            filtered = [x for x in self.ServiceLocation.ServiceDeliveryPoints if x != self]
-            self._ServiceLocation._ServiceDeliveryPoints = filtered
+            self._ServiceLocation._ServiceDeliveryPoints.discard(self)
 
         self._ServiceLocation = value
         if self._ServiceLocation is not None:
-            if self not in self._ServiceLocation._ServiceDeliveryPoints:
-                self._ServiceLocation._ServiceDeliveryPoints.append(self)
+            if self._ServiceLocation._ServiceDeliveryPoints is EMPTY:
+                self._ServiceLocation._ServiceDeliveryPoints = AssociationList([self])
+            else:
+                self._ServiceLocation._ServiceDeliveryPoints.add(self)
 
     ServiceLocation = property(getServiceLocation, setServiceLocation)
 
@@ -168,6 +181,7 @@ class ServiceDeliveryPoint(IdentifiedObject):
         return self._EndDevices
 
     def setEndDevices(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._EndDevices:
             x.ServiceDeliveryPoint = None
         for y in value:
@@ -190,6 +204,7 @@ class ServiceDeliveryPoint(IdentifiedObject):
         return self._MeterReadings
 
     def setMeterReadings(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._MeterReadings:
             x.ServiceDeliveryPoint = None
         for y in value:
@@ -213,13 +228,14 @@ class ServiceDeliveryPoint(IdentifiedObject):
 
     def setServiceCategory(self, value):
         if self._ServiceCategory is not None:
-            filtered = [x for x in self.ServiceCategory.ServiceDeliveryPoints if x != self]
-            self._ServiceCategory._ServiceDeliveryPoints = filtered
+            self._ServiceCategory._ServiceDeliveryPoints.discard(self)
 
         self._ServiceCategory = value
         if self._ServiceCategory is not None:
-            if self not in self._ServiceCategory._ServiceDeliveryPoints:
-                self._ServiceCategory._ServiceDeliveryPoints.append(self)
+            if self._ServiceCategory._ServiceDeliveryPoints is EMPTY:
+                self._ServiceCategory._ServiceDeliveryPoints = AssociationList([self])
+            else:
+                self._ServiceCategory._ServiceDeliveryPoints.add(self)
 
     ServiceCategory = property(getServiceCategory, setServiceCategory)
 
@@ -229,21 +245,28 @@ class ServiceDeliveryPoint(IdentifiedObject):
         return self._PricingStructures
 
     def setPricingStructures(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._PricingStructures:
-            filtered = [q for q in p.ServiceDeliveryPoints if q != self]
-            self._PricingStructures._ServiceDeliveryPoints = filtered
+            p._ServiceDeliveryPoints.discard(self)
         for r in value:
-            if self not in r._ServiceDeliveryPoints:
-                r._ServiceDeliveryPoints.append(self)
+            if r._ServiceDeliveryPoints is EMPTY:
+                r._ServiceDeliveryPoints = AssociationList([self])
+            else:
+                r._ServiceDeliveryPoints.add(self)
         self._PricingStructures = value
 
     PricingStructures = property(getPricingStructures, setPricingStructures)
 
     def addPricingStructures(self, *PricingStructures):
         for obj in PricingStructures:
-            if self not in obj._ServiceDeliveryPoints:
-                obj._ServiceDeliveryPoints.append(self)
-            self._PricingStructures.append(obj)
+            if obj._ServiceDeliveryPoints is EMPTY:
+                obj._ServiceDeliveryPoints = AssociationList([self])
+            else:
+                obj._ServiceDeliveryPoints.add(self)
+            if self._PricingStructures is EMPTY:
+                self._PricingStructures = AssociationList([obj])
+            else:
+                self._PricingStructures.add(obj)
 
     def removePricingStructures(self, *PricingStructures):
         for obj in PricingStructures:
@@ -257,13 +280,14 @@ class ServiceDeliveryPoint(IdentifiedObject):
 
     def setEnergyConsumer(self, value):
         if self._EnergyConsumer is not None:
-            filtered = [x for x in self.EnergyConsumer.ServiceDeliveryPoints if x != self]
-            self._EnergyConsumer._ServiceDeliveryPoints = filtered
+            self._EnergyConsumer._ServiceDeliveryPoints.discard(self)
 
         self._EnergyConsumer = value
         if self._EnergyConsumer is not None:
-            if self not in self._EnergyConsumer._ServiceDeliveryPoints:
-                self._EnergyConsumer._ServiceDeliveryPoints.append(self)
+            if self._EnergyConsumer._ServiceDeliveryPoints is EMPTY:
+                self._EnergyConsumer._ServiceDeliveryPoints = AssociationList([self])
+            else:
+                self._EnergyConsumer._ServiceDeliveryPoints.add(self)
 
     EnergyConsumer = property(getEnergyConsumer, setEnergyConsumer)
 
@@ -274,13 +298,14 @@ class ServiceDeliveryPoint(IdentifiedObject):
 
     def setServiceSupplier(self, value):
         if self._ServiceSupplier is not None:
-            filtered = [x for x in self.ServiceSupplier.ServiceDeliveryPoints if x != self]
-            self._ServiceSupplier._ServiceDeliveryPoints = filtered
+            self._ServiceSupplier._ServiceDeliveryPoints.discard(self)
 
         self._ServiceSupplier = value
         if self._ServiceSupplier is not None:
-            if self not in self._ServiceSupplier._ServiceDeliveryPoints:
-                self._ServiceSupplier._ServiceDeliveryPoints.append(self)
+            if self._ServiceSupplier._ServiceDeliveryPoints is EMPTY:
+                self._ServiceSupplier._ServiceDeliveryPoints = AssociationList([self])
+            else:
+                self._ServiceSupplier._ServiceDeliveryPoints.add(self)
 
     ServiceSupplier = property(getServiceSupplier, setServiceSupplier)
 
@@ -291,13 +316,14 @@ class ServiceDeliveryPoint(IdentifiedObject):
 
     def setCustomerAgreement(self, value):
         if self._CustomerAgreement is not None:
-            filtered = [x for x in self.CustomerAgreement.ServiceDeliveryPoints if x != self]
-            self._CustomerAgreement._ServiceDeliveryPoints = filtered
+            self._CustomerAgreement._ServiceDeliveryPoints.discard(self)
 
         self._CustomerAgreement = value
         if self._CustomerAgreement is not None:
-            if self not in self._CustomerAgreement._ServiceDeliveryPoints:
-                self._CustomerAgreement._ServiceDeliveryPoints.append(self)
+            if self._CustomerAgreement._ServiceDeliveryPoints is EMPTY:
+                self._CustomerAgreement._ServiceDeliveryPoints = AssociationList([self])
+            else:
+                self._CustomerAgreement._ServiceDeliveryPoints.add(self)
 
     CustomerAgreement = property(getCustomerAgreement, setCustomerAgreement)
 
@@ -308,13 +334,14 @@ class ServiceDeliveryPoint(IdentifiedObject):
 
     def setTransformerTanks(self, value):
         if self._TransformerTanks is not None:
-            filtered = [x for x in self.TransformerTanks.ServiceDeliveryPoints if x != self]
-            self._TransformerTanks._ServiceDeliveryPoints = filtered
+            self._TransformerTanks._ServiceDeliveryPoints.discard(self)
 
         self._TransformerTanks = value
         if self._TransformerTanks is not None:
-            if self not in self._TransformerTanks._ServiceDeliveryPoints:
-                self._TransformerTanks._ServiceDeliveryPoints.append(self)
+            if self._TransformerTanks._ServiceDeliveryPoints is EMPTY:
+                self._TransformerTanks._ServiceDeliveryPoints = AssociationList([self])
+            else:
+                self._TransformerTanks._ServiceDeliveryPoints.add(self)
 
     TransformerTanks = property(getTransformerTanks, setTransformerTanks)
 
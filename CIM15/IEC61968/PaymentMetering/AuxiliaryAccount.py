@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import AssociationList, EMPTY
 
 class AuxiliaryAccount(Document):
     """Variable and dynamic part of auxiliary agreement, generally representing the current state of the account related to the outstanding balance defined in auxiliary agreement.Variable and dynamic part of auxiliary agreement, generally representing the current state of the account related to the outstanding balance defined in auxiliary agreement.
@@ -44,11 +45,13 @@ class AuxiliaryAccount(Document):
 
         self.lastDebit = lastDebit
 
-        self._PaymentTransactions = []
-        self.PaymentTransactions = [] if PaymentTransactions is None else PaymentTransactions
+        self._PaymentTransactions = EMPTY
+        if PaymentTransactions is not None:
+            self.PaymentTransactions = PaymentTransactions
 
-        self._Charges = []
-        self.Charges = [] if Charges is None else Charges
+        self._Charges = EMPTY
+        if Charges is not None:
+            self.Charges = Charges
 
         self.lastCredit = lastCredit
 
@@ -75,6 +78,7 @@ class AuxiliaryAccount(Document):
         return self._PaymentTransactions
 
     def setPaymentTransactions(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._PaymentTransactions:
             x.AuxiliaryAccount = None
         for y in value:
@@ -97,21 +101,28 @@ class AuxiliaryAccount(Document):
         return self._Charges
 
     def setCharges(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Charges:
-            filtered = [q for q in p.AuxiliaryAccounts if q != self]
-            self._Charges._AuxiliaryAccounts = filtered
+            p._AuxiliaryAccounts.discard(self)
         for r in value:
-            if self not in r._AuxiliaryAccounts:
-                r._AuxiliaryAccounts.append(self)
+            if r._AuxiliaryAccounts is EMPTY:
+                r._AuxiliaryAccounts = AssociationList([self])
+            else:
+                r._AuxiliaryAccounts.add(self)
         self._Charges = value
 
     Charges = property(getCharges, setCharges)
 
     def addCharges(self, *Charges):
         for obj in Charges:
-            if self not in obj._AuxiliaryAccounts:
-                obj._AuxiliaryAccounts.append(self)
-            self._Charges.append(obj)
+            if obj._AuxiliaryAccounts is EMPTY:
+                obj._AuxiliaryAccounts = AssociationList([self])
+            else:
+                obj._AuxiliaryAccounts.add(self)
+            if self._Charges is EMPTY:
+                self._Charges = AssociationList([obj])
+            else:
+                self._Charges.add(obj)
 
     def removeCharges(self, *Charges):
         for obj in Charges:
@@ -129,13 +140,14 @@ class AuxiliaryAccount(Document):
 
     def setAuxiliaryAgreement(self, value):
         if self._AuxiliaryAgreement is not None:
-            filtered = [x for x in self.AuxiliaryAgreement.AuxiliaryAccounts if x != self]
-            self._AuxiliaryAgreement._AuxiliaryAccounts = filtered
+            self._AuxiliaryAgreement._AuxiliaryAccounts.discard(self)
 
         self._AuxiliaryAgreement = value
         if self._AuxiliaryAgreement is not None:
-            if self not in self._AuxiliaryAgreement._AuxiliaryAccounts:
-                self._AuxiliaryAgreement._AuxiliaryAccounts.append(self)
+            if self._AuxiliaryAgreement._AuxiliaryAccounts is EMPTY:
+                self._AuxiliaryAgreement._AuxiliaryAccounts = AssociationList([self])
+            else:
+                self._AuxiliaryAgreement._AuxiliaryAccounts.add(self)
 
     AuxiliaryAgreement = property(getAuxiliaryAgreement, setAuxiliaryAgreement)
 
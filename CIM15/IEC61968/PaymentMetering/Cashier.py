@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class Cashier(IdentifiedObject):
     """The operator of the point of sale for the duration of CashierShift. Cashier is under the exclusive management control of Vendor.The operator of the point of sale for the duration of CashierShift. Cashier is under the exclusive management control of Vendor.
@@ -32,8 +33,9 @@ class Cashier(IdentifiedObject):
         """
         self.electronicAddress = electronicAddress
 
-        self._CashierShifts = []
-        self.CashierShifts = [] if CashierShifts is None else CashierShifts
+        self._CashierShifts = EMPTY
+        if CashierShifts is not None:
+            self.CashierShifts = CashierShifts
 
         super(Cashier, self).__init__(*args, **kw_args)
 
@@ -53,6 +55,7 @@ class Cashier(IdentifiedObject):
         return self._CashierShifts
 
     def setCashierShifts(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._CashierShifts:
             x.Cashier = None
         for y in value:
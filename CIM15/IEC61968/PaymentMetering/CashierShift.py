@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.PaymentMetering.Shift import Shift
+from CIM15.Element import AssociationList, EMPTY
 
 class CashierShift(Shift):
     """The operating shift for a cashier, during which he may transact against the cashier shift, subject to vendor shift being open.The operating shift for a cashier, during which he may transact against the cashier shift, subject to vendor shift being open.
@@ -36,14 +37,16 @@ class CashierShift(Shift):
         #: The amount of cash that the cashier brings with him to start his shift and that he will take away at the end of his shift; i.e. the cash float does not get banked.
         self.cashFloat = cashFloat
 
-        self._Transactions = []
-        self.Transactions = [] if Transactions is None else Transactions
+        self._Transactions = EMPTY
+        if Transactions is not None:
+            self.Transactions = Transactions
 
         self._PointOfSale = None
         self.PointOfSale = PointOfSale
 
-        self._Receipts = []
-        self.Receipts = [] if Receipts is None else Receipts
+        self._Receipts = EMPTY
+        if Receipts is not None:
+            self.Receipts = Receipts
 
         self._Cashier = None
         self.Cashier = Cashier
@@ -62,6 +65,7 @@ class CashierShift(Shift):
         return self._Transactions
 
     def setTransactions(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Transactions:
             x.CashierShift = None
         for y in value:
@@ -85,13 +89,14 @@ class CashierShift(Shift):
 
     def setPointOfSale(self, value):
         if self._PointOfSale is not None:
-            filtered = [x for x in self.PointOfSale.CashierShifts if x != self]
-            self._PointOfSale._CashierShifts = filtered
+            self._PointOfSale._CashierShifts.discard(self)
 
         self._PointOfSale = value
         if self._PointOfSale is not None:
-            if self not in self._PointOfSale._CashierShifts:
-                self._PointOfSale._CashierShifts.append(self)
+            if self._PointOfSale._CashierShifts is EMPTY:
+                self._PointOfSale._CashierShifts = AssociationList([self])
+            else:
+                self._PointOfSale._CashierShifts.add(self)
 
     PointOfSale = property(getPointOfSale, setPointOfSale)
 
@@ -101,6 +106,7 @@ class CashierShift(Shift):
         return self._Receipts
 
     def setReceipts(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Receipts:
             x.CashierShift = None
         for y in value:
@@ -124,13 +130,14 @@ class CashierShift(Shift):
 
     def setCashier(self, value):
         if self._Cashier is not None:
-            filtered = [x for x in self.Cashier.CashierShifts if x != self]
-            self._Cashier._CashierShifts = filtered
+            self._Cashier._CashierShifts.discard(self)
 
         self._Cashier = value
         if self._Cashier is not None:
-            if self not in self._Cashier._CashierShifts:
-                self._Cashier._CashierShifts.append(self)
+            if self._Cashier._CashierShifts is EMPTY:
+                self._Cashier._CashierShifts = AssociationList([self])
+            else:
+                self._Cashier._CashierShifts.add(self)
 
     Cashier = property(getCashier, setCashier)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class Charge(IdentifiedObject):
     """A charge element associated with other entities such as tariff structures, auxiliary agreements or other charge elements. The total charge amount applicable to this instance of charge is the sum of fixed and variable portion.A charge element associated with other entities such as tariff structures, auxiliary agreements or other charge elements. The total charge amount applicable to this instance of charge is the sum of fixed and variable portion.
@@ -42,17 +43,21 @@ class Charge(IdentifiedObject):
         #: The kind of charge to be applied. Values are: "other", "demandCharge", "consumptionCharge", "auxiliaryCharge", "taxCharge"
         self.kind = kind
 
-        self._ConsumptionTariffIntervals = []
-        self.ConsumptionTariffIntervals = [] if ConsumptionTariffIntervals is None else ConsumptionTariffIntervals
+        self._ConsumptionTariffIntervals = EMPTY
+        if ConsumptionTariffIntervals is not None:
+            self.ConsumptionTariffIntervals = ConsumptionTariffIntervals
 
-        self._TimeTariffIntervals = []
-        self.TimeTariffIntervals = [] if TimeTariffIntervals is None else TimeTariffIntervals
+        self._TimeTariffIntervals = EMPTY
+        if TimeTariffIntervals is not None:
+            self.TimeTariffIntervals = TimeTariffIntervals
 
-        self._AuxiliaryAccounts = []
-        self.AuxiliaryAccounts = [] if AuxiliaryAccounts is None else AuxiliaryAccounts
+        self._AuxiliaryAccounts = EMPTY
+        if AuxiliaryAccounts is not None:
+            self.AuxiliaryAccounts = AuxiliaryAccounts
 
-        self._ChildCharges = []
-        self.ChildCharges = [] if ChildCharges is None else ChildCharges
+        self._ChildCharges = EMPTY
+        if ChildCharges is not None:
+            self.ChildCharges = ChildCharges
 
         self.fixedPortion = fixedPortion
 
@@ -74,21 +79,28 @@ class Charge(IdentifiedObject):
         return self._ConsumptionTariffIntervals
 
     def setConsumptionTariffIntervals(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ConsumptionTariffIntervals:
-            filtered = [q for q in p.Charges if q != self]
-            self._ConsumptionTariffIntervals._Charges = filtered
+            p._Charges.discard(self)
         for r in value:
-            if self not in r._Charges:
-                r._Charges.append(self)
+            if r._Charges is EMPTY:
+                r._Charges = AssociationList([self])
+            else:
+                r._Charges.add(self)
         self._ConsumptionTariffIntervals = value
 
     ConsumptionTariffIntervals = property(getConsumptionTariffIntervals, setConsumptionTariffIntervals)
 
     def addConsumptionTariffIntervals(self, *ConsumptionTariffIntervals):
         for obj in ConsumptionTariffIntervals:
-            if self not in obj._Charges:
-                obj._Charges.append(self)
-            self._ConsumptionTariffIntervals.append(obj)
+            if obj._Charges is EMPTY:
+                obj._Charges = AssociationList([self])
+            else:
+                obj._Charges.add(self)
+            if self._ConsumptionTariffIntervals is EMPTY:
+                self._ConsumptionTariffIntervals = AssociationList([obj])
+            else:
+                self._ConsumptionTariffIntervals.add(obj)
 
     def removeConsumptionTariffIntervals(self, *ConsumptionTariffIntervals):
         for obj in ConsumptionTariffIntervals:
@@ -102,21 +114,28 @@ class Charge(IdentifiedObject):
         return self._TimeTariffIntervals
 
     def setTimeTariffIntervals(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._TimeTariffIntervals:
-            filtered = [q for q in p.Charges if q != self]
-            self._TimeTariffIntervals._Charges = filtered
+            p._Charges.discard(self)
         for r in value:
-            if self not in r._Charges:
-                r._Charges.append(self)
+            if r._Charges is EMPTY:
+                r._Charges = AssociationList([self])
+            else:
+                r._Charges.add(self)
         self._TimeTariffIntervals = value
 
     TimeTariffIntervals = property(getTimeTariffIntervals, setTimeTariffIntervals)
 
     def addTimeTariffIntervals(self, *TimeTariffIntervals):
         for obj in TimeTariffIntervals:
-            if self not in obj._Charges:
-                obj._Charges.append(self)
-            self._TimeTariffIntervals.append(obj)
+            if obj._Charges is EMPTY:
+                obj._Charges = AssociationList([self])
+            else:
+                obj._Charges.add(self)
+            if self._TimeTariffIntervals is EMPTY:
+                self._TimeTariffIntervals = AssociationList([obj])
+            else:
+                self._TimeTariffIntervals.add(obj)
 
     def removeTimeTariffIntervals(self, *TimeTariffIntervals):
         for obj in TimeTariffIntervals:
@@ -130,21 +149,28 @@ class Charge(IdentifiedObject):
         return self._AuxiliaryAccounts
 
     def setAuxiliaryAccounts(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._AuxiliaryAccounts:
-            filtered = [q for q in p.Charges if q != self]
-            self._AuxiliaryAccounts._Charges = filtered
+            p._Charges.discard(self)
         for r in value:
-            if self not in r._Charges:
-                r._Charges.append(self)
+            if r._Charges is EMPTY:
+                r._Charges = AssociationList([self])
+            else:
+                r._Charges.add(self)
         self._AuxiliaryAccounts = value
 
     AuxiliaryAccounts = property(getAuxiliaryAccounts, setAuxiliaryAccounts)
 
     def addAuxiliaryAccounts(self, *AuxiliaryAccounts):
         for obj in AuxiliaryAccounts:
-            if self not in obj._Charges:
-                obj._Charges.append(self)
-            self._AuxiliaryAccounts.append(obj)
+            if obj._Charges is EMPTY:
+                obj._Charges = AssociationList([self])
+            else:
+                obj._Charges.add(self)
+            if self._AuxiliaryAccounts is EMPTY:
+                self._AuxiliaryAccounts = AssociationList([obj])
+            else:
+                self._AuxiliaryAccounts.add(obj)
 
     def removeAuxiliaryAccounts(self, *AuxiliaryAccounts):
         for obj in AuxiliaryAccounts:
@@ -158,6 +184,7 @@ class Charge(IdentifiedObject):
         return self._ChildCharges
 
     def setChildCharges(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ChildCharges:
             x.ParentCharge = None
         for y in value:
@@ -184,13 +211,14 @@ class Charge(IdentifiedObject):
 
     def setParentCharge(self, value):
         if self._ParentCharge is not None:
-            filtered = [x for x in self.ParentCharge.ChildCharges if x != self]
-            self._ParentCharge._ChildCharges = filtered
+            self._ParentCharge._ChildCharges.discard(self)
 
         self._ParentCharge = value
         if self._ParentCharge is not None:
-            if self not in self._ParentCharge._ChildCharges:
-                self._ParentCharge._ChildCharges.append(self)
+            if self._ParentCharge._ChildCharges is EMPTY:
+                self._ParentCharge._ChildCharges = AssociationList([self])
+            else:
+                self._ParentCharge._ChildCharges.add(self)
 
     ParentCharge = property(getParentCharge, setParentCharge)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Agreement import Agreement
+from CIM15.Element import AssociationList, EMPTY
 
 class MerchantAgreement(Agreement):
     """A formal controlling contractual agreement between supplier and merchant, in terms of which merchant is authorised to vend tokens and receipt payments on behalf of supplier. Merchant is accountable to supplier for revenue collected at point of sale.A formal controlling contractual agreement between supplier and merchant, in terms of which merchant is authorised to vend tokens and receipt payments on behalf of supplier. Merchant is accountable to supplier for revenue collected at point of sale.
@@ -29,8 +30,9 @@ class MerchantAgreement(Agreement):
 
         @param MerchantAccounts: All merchant accounts instantiated as a result of this merchant agreement.
         """
-        self._MerchantAccounts = []
-        self.MerchantAccounts = [] if MerchantAccounts is None else MerchantAccounts
+        self._MerchantAccounts = EMPTY
+        if MerchantAccounts is not None:
+            self.MerchantAccounts = MerchantAccounts
 
         super(MerchantAgreement, self).__init__(*args, **kw_args)
 
@@ -47,6 +49,7 @@ class MerchantAgreement(Agreement):
         return self._MerchantAccounts
 
     def setMerchantAccounts(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._MerchantAccounts:
             x.MerchantAgreement = None
         for y in value:
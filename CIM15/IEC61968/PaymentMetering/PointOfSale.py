@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class PointOfSale(IdentifiedObject):
     """Logical point where transactions take place with operational interaction between cashier and the payment system; in certain cases point of sale interacts directly with the end customer, in which case cashier might not be a real person: for example a self-service kiosk or over the internet.Logical point where transactions take place with operational interaction between cashier and the payment system; in certain cases point of sale interacts directly with the end customer, in which case cashier might not be a real person: for example a self-service kiosk or over the internet.
@@ -33,8 +34,9 @@ class PointOfSale(IdentifiedObject):
         #: Local description for where this point of sale is physically located.
         self.location = location
 
-        self._CashierShifts = []
-        self.CashierShifts = [] if CashierShifts is None else CashierShifts
+        self._CashierShifts = EMPTY
+        if CashierShifts is not None:
+            self.CashierShifts = CashierShifts
 
         super(PointOfSale, self).__init__(*args, **kw_args)
 
@@ -51,6 +53,7 @@ class PointOfSale(IdentifiedObject):
         return self._CashierShifts
 
     def setCashierShifts(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._CashierShifts:
             x.PointOfSale = None
         for y in value:
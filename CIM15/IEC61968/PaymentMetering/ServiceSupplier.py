@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Organisation import Organisation
+from CIM15.Element import AssociationList, EMPTY
 
 class ServiceSupplier(Organisation):
     """Organisation that provides services to customers.Organisation that provides services to customers.
@@ -39,14 +40,17 @@ class ServiceSupplier(Organisation):
         #: Kind of supplier. Values are: "other", "retailer", "utility"
         self.kind = kind
 
-        self._BankAccounts = []
-        self.BankAccounts = [] if BankAccounts is None else BankAccounts
+        self._BankAccounts = EMPTY
+        if BankAccounts is not None:
+            self.BankAccounts = BankAccounts
 
-        self._ServiceDeliveryPoints = []
-        self.ServiceDeliveryPoints = [] if ServiceDeliveryPoints is None else ServiceDeliveryPoints
+        self._ServiceDeliveryPoints = EMPTY
+        if ServiceDeliveryPoints is not None:
+            self.ServiceDeliveryPoints = ServiceDeliveryPoints
 
-        self._CustomerAgreements = []
-        self.CustomerAgreements = [] if CustomerAgreements is None else CustomerAgreements
+        self._CustomerAgreements = EMPTY
+        if CustomerAgreements is not None:
+            self.CustomerAgreements = CustomerAgreements
 
         super(ServiceSupplier, self).__init__(*args, **kw_args)
 
@@ -63,6 +67,7 @@ class ServiceSupplier(Organisation):
         return self._BankAccounts
 
     def setBankAccounts(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._BankAccounts:
             x.ServiceSupplier = None
         for y in value:
@@ -85,6 +90,7 @@ class ServiceSupplier(Organisation):
         return self._ServiceDeliveryPoints
 
     def setServiceDeliveryPoints(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ServiceDeliveryPoints:
             x.ServiceSupplier = None
         for y in value:
@@ -107,6 +113,7 @@ class ServiceSupplier(Organisation):
         return self._CustomerAgreements
 
     def setCustomerAgreements(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._CustomerAgreements:
             x.ServiceSupplier = None
         for y in value:
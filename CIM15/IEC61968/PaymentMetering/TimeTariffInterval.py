@@ -18,7 +18,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from CIM15.Element import Element
+from CIM15.Element import Element, AssociationList, EMPTY
 
 class TimeTariffInterval(Element):
     """One of a sequence of time intervals defined in terms of real time. It is typically used in association with TariffProfile to define the intervals in a time of use tariff structure, where startDateTime simultaneously determines the starting point of this interval and the ending point of the previous interval.One of a sequence of time intervals defined in terms of real time. It is typically used in association with TariffProfile to define the intervals in a time of use tariff structure, where startDateTime simultaneously determines the starting point of this interval and the ending point of the previous interval.
@@ -39,14 +39,17 @@ class TimeTariffInterval(Element):
         #: A sequential reference that defines the identity of this interval and its relative position with respect to other intervals in a sequence of intervals.
         self.sequenceNumber = sequenceNumber
 
-        self._ConsumptionTariffIntervals = []
-        self.ConsumptionTariffIntervals = [] if ConsumptionTariffIntervals is None else ConsumptionTariffIntervals
+        self._ConsumptionTariffIntervals = EMPTY
+        if ConsumptionTariffIntervals is not None:
+            self.ConsumptionTariffIntervals = ConsumptionTariffIntervals
 
-        self._TariffProfiles = []
-        self.TariffProfiles = [] if TariffProfiles is None else TariffProfiles
+        self._TariffProfiles = EMPTY
+        if TariffProfiles is not None:
+            self.TariffProfiles = TariffProfiles
 
-        self._Charges = []
-        self.Charges = [] if Charges is None else Charges
+        self._Charges = EMPTY
+        if Charges is not None:
+            self.Charges = Charges
 
         super(TimeTariffInterval, self).__init__(*args, **kw_args)
 
@@ -63,21 +66,28 @@ class TimeTariffInterval(Element):
         return self._ConsumptionTariffIntervals
 
     def setConsumptionTariffIntervals(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ConsumptionTariffIntervals:
-            filtered = [q for q in p.TouTariffIntervals if q != self]
-            self._ConsumptionTariffIntervals._TouTariffIntervals = filtered
+            p._TouTariffIntervals.discard(self)
         for r in value:
-            if self not in r._TouTariffIntervals:
-                r._TouTariffIntervals.append(self)
+            if r._TouTariffIntervals is EMPTY:
+                r._TouTariffIntervals = AssociationList([self])
+            else:
+                r._TouTariffIntervals.add(self)
         self._ConsumptionTariffIntervals = value
 
     ConsumptionTariffIntervals = property(getConsumptionTariffIntervals, setConsumptionTariffIntervals)
 
     def addConsumptionTariffIntervals(self, *ConsumptionTariffIntervals):
         for obj in ConsumptionTariffIntervals:
-            if self not in obj._TouTariffIntervals:
-                obj._TouTariffIntervals.append(self)
-            self._ConsumptionTariffIntervals.append(obj)
+            if obj._TouTariffIntervals is EMPTY:
+                obj._TouTariffIntervals = AssociationList([self])
+            else:
+                obj._TouTariffIntervals.add(self)
+            if self._ConsumptionTariffIntervals is EMPTY:
+                self._ConsumptionTariffIntervals = AssociationList([obj])
+            else:
+                self._ConsumptionTariffIntervals.add(obj)
 
     def removeConsumptionTariffIntervals(self, *ConsumptionTariffIntervals):
         for obj in ConsumptionTariffIntervals:
@@ -91,21 +101,28 @@ class TimeTariffInterval(Element):
         return self._TariffProfiles
 
     def setTariffProfiles(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._TariffProfiles:
-            filtered = [q for q in p.TimeTariffIntervals if q != self]
-            self._TariffProfiles._TimeTariffIntervals = filtered
+            p._TimeTariffIntervals.discard(self)
         for r in value:
-            if self not in r._TimeTariffIntervals:
-                r._TimeTariffIntervals.append(self)
+            if r._TimeTariffIntervals is EMPTY:
+                r._TimeTariffIntervals = AssociationList([self])
+            else:
+                r._TimeTariffIntervals.add(self)
         self._TariffProfiles = value
 
     TariffProfiles = property(getTariffProfiles, setTariffProfiles)
 
     def addTariffProfiles(self, *TariffProfiles):
         for obj in TariffProfiles:
-            if self not in obj._TimeTariffIntervals:
-                obj._TimeTariffIntervals.append(self)
-            self._TariffProfiles.append(obj)
+            if obj._TimeTariffIntervals is EMPTY:
+                obj._TimeTariffIntervals = AssociationList([self])
+            else:
+                obj._TimeTariffIntervals.add(self)
+            if self._TariffProfiles is EMPTY:
+                self._TariffProfiles = AssociationList([obj])
+            else:
+                self._TariffProfiles.add(obj)
 
     def removeTariffProfiles(self, *TariffProfiles):
         for obj in TariffProfiles:
@@ -119,21 +136,28 @@ class TimeTariffInterval(Element):
         return self._Charges
 
     def setCharges(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Charges:
-            filtered = [q for q in p.TimeTariffIntervals if q != self]
-            self._Charges._TimeTariffIntervals = filtered
+            p._TimeTariffIntervals.discard(self)
         for r in value:
-            if self not in r._TimeTariffIntervals:
-                r._TimeTariffIntervals.append(self)
+            if r._TimeTariffIntervals is EMPTY:
+                r._TimeTariffIntervals = AssociationList([self])
+            else:
+                r._TimeTariffIntervals.add(self)
         self._Charges = value
 
     Charges = property(getCharges, setCharges)
 
     def addCharges(self, *Charges):
         for obj in Charges:
-            if self not in obj._TimeTariffIntervals:
-                obj._TimeTariffIntervals.append(self)
-            self._Charges.append(obj)
+            if obj._TimeTariffIntervals is EMPTY:
+                obj._TimeTariffIntervals = AssociationList([self])
+            else:
+                obj._TimeTariffIntervals.add(self)
+            if self._Charges is EMPTY:
+                self._Charges = AssociationList([obj])
+            else:
+                self._Charges.add(obj)
 
     def removeCharges(self, *Charges):
         for obj in Charges:
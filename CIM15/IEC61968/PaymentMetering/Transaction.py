@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class Transaction(IdentifiedObject):
     """The record of details of payment for service or token sale.The record of details of payment for service or token sale.
@@ -70,8 +71,9 @@ class Transaction(IdentifiedObject):
 
         self.line = line
 
-        self._UserAttributes = []
-        self.UserAttributes = [] if UserAttributes is None else UserAttributes
+        self._UserAttributes = EMPTY
+        if UserAttributes is not None:
+            self.UserAttributes = UserAttributes
 
         self._AuxiliaryAccount = None
         self.AuxiliaryAccount = AuxiliaryAccount
@@ -107,13 +109,14 @@ class Transaction(IdentifiedObject):
 
     def setPricingStructure(self, value):
         if self._PricingStructure is not None:
-            filtered = [x for x in self.PricingStructure.Transactions if x != self]
-            self._PricingStructure._Transactions = filtered
+            self._PricingStructure._Transactions.discard(self)
 
         self._PricingStructure = value
         if self._PricingStructure is not None:
-            if self not in self._PricingStructure._Transactions:
-                self._PricingStructure._Transactions.append(self)
+            if self._PricingStructure._Transactions is EMPTY:
+                self._PricingStructure._Transactions = AssociationList([self])
+            else:
+                self._PricingStructure._Transactions.add(self)
 
     PricingStructure = property(getPricingStructure, setPricingStructure)
 
@@ -126,6 +129,7 @@ class Transaction(IdentifiedObject):
         return self._UserAttributes
 
     def setUserAttributes(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._UserAttributes:
             x.Transaction = None
         for y in value:
@@ -149,13 +153,14 @@ class Transaction(IdentifiedObject):
 
     def setAuxiliaryAccount(self, value):
         if self._AuxiliaryAccount is not None:
-            filtered = [x for x in self.AuxiliaryAccount.PaymentTransactions if x != self]
-            self._AuxiliaryAccount._PaymentTransactions = filtered
+            self._AuxiliaryAccount._PaymentTransactions.discard(self)
 
         self._AuxiliaryAccount = value
         if self._AuxiliaryAccount is not None:
-            if self not in self._AuxiliaryAccount._PaymentTransactions:
-                self._AuxiliaryAccount._PaymentTransactions.append(self)
+            if self._AuxiliaryAccount._PaymentTransactions is EMPTY:
+                self._AuxiliaryAccount._PaymentTransactions = AssociationList([self])
+            else:
+                self._AuxiliaryAccount._PaymentTransactions.add(self)
 
     AuxiliaryAccount = property(getAuxiliaryAccount, setAuxiliaryAccount)
 
@@ -166,13 +171,14 @@ class Transaction(IdentifiedObject):
 
     def setVendorShift(self, value):
         if self._VendorShift is not None:
-            filtered = [x for x in self.VendorShift.Transactions if x != self]
-            self._VendorShift._Transactions = filtered
+            self._VendorShift._Transactions.discard(self)
 
         self._VendorShift = value
         if self._VendorShift is not None:
-            if self not in self._VendorShift._Transactions:
-                self._VendorShift._Transactions.append(self)
+            if self._VendorShift._Transactions is EMPTY:
+                self._VendorShift._Transactions = AssociationList([self])
+            else:
+                self._VendorShift._Transactions.add(self)
 
     VendorShift = property(getVendorShift, setVendorShift)
 
@@ -183,13 +189,14 @@ class Transaction(IdentifiedObject):
 
     def setReceipt(self, value):
         if self._Receipt is not None:
-            filtered = [x for x in self.Receipt.Transactions if x != self]
-            self._Receipt._Transactions = filtered
+            self._Receipt._Transactions.discard(self)
 
         self._Receipt = value
         if self._Receipt is not None:
-            if self not in self._Receipt._Transactions:
-                self._Receipt._Transactions.append(self)
+            if self._Receipt._Transactions is EMPTY:
+                self._Receipt._Transactions = AssociationList([self])
+            else:
+                self._Receipt._Transactions.add(self)
 
     Receipt = property(getReceipt, setReceipt)
 
@@ -200,13 +207,14 @@ class Transaction(IdentifiedObject):
 
     def setMeter(self, value):
         if self._Meter is not None:
-            filtered = [x for x in self.Meter.VendingTransactions if x != self]
-            self._Meter._VendingTransactions = filtered
+            self._Meter._VendingTransactions.discard(self)
 
         self._Meter = value
         if self._Meter is not None:
-            if self not in self._Meter._VendingTransactions:
-                self._Meter._VendingTransactions.append(self)
+            if self._Meter._VendingTransactions is EMPTY:
+                self._Meter._VendingTransactions = AssociationList([self])
+            else:
+                self._Meter._VendingTransactions.add(self)
 
     Meter = property(getMeter, setMeter)
 
@@ -217,13 +225,14 @@ class Transaction(IdentifiedObject):
 
     def setCustomerAccount(self, value):
         if self._CustomerAccount is not None:
-            filtered = [x for x in self.CustomerAccount.PaymentTransactions if x != self]
-            self._CustomerAccount._PaymentTransactions = filtered
+            self._CustomerAccount._PaymentTransactions.discard(self)
 
         self._CustomerAccount = value
         if self._CustomerAccount is not None:
-            if self not in self._CustomerAccount._PaymentTransactions:
-                self._CustomerAccount._PaymentTransactions.append(self)
+            if self._CustomerAccount._PaymentTransactions is EMPTY:
+                self._CustomerAccount._PaymentTransactions = AssociationList([self])
+            else:
+                self._CustomerAccount._PaymentTransactions.add(self)
 
     CustomerAccount = property(getCustomerAccount, setCustomerAccount)
 
@@ -234,13 +243,14 @@ class Transaction(IdentifiedObject):
 
     def setCashierShift(self, value):
         if self._CashierShift is not None:
-            filtered = [x for x in self.CashierShift.Transactions if x != self]
-            self._CashierShift._Transactions = filtered
+            self._CashierShift._Transactions.discard(self)
 
         self._CashierShift = value
         if self._CashierShift is not None:
-            if self not in self._CashierShift._Transactions:
-                self._CashierShift._Transactions.append(self)
+            if self._CashierShift._Transactions is EMPTY:
+                self._CashierShift._Transactions = AssociationList([self])
+            else:
+                self._CashierShift._Transactions.add(self)
 
     CashierShift = property(getCashierShift, setCashierShift)
 
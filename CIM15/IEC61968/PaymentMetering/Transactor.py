@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class Transactor(IdentifiedObject):
     """The entity that ultimately executes the transaction and who is in control of the process; typically this is embodied in secure software running on a server that may employ secure hardware encryption devices for secure transaction processing.The entity that ultimately executes the transaction and who is in control of the process; typically this is embodied in secure software running on a server that may employ secure hardware encryption devices for secure transaction processing.
@@ -29,8 +30,9 @@ class Transactor(IdentifiedObject):
 
         @param MerchantAccounts: All merchant accounts registered with this transactor.
         """
-        self._MerchantAccounts = []
-        self.MerchantAccounts = [] if MerchantAccounts is None else MerchantAccounts
+        self._MerchantAccounts = EMPTY
+        if MerchantAccounts is not None:
+            self.MerchantAccounts = MerchantAccounts
 
         super(Transactor, self).__init__(*args, **kw_args)
 
@@ -47,21 +49,28 @@ class Transactor(IdentifiedObject):
         return self._MerchantAccounts
 
     def setMerchantAccounts(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._MerchantAccounts:
-            filtered = [q for q in p.Transactors if q != self]
-            self._MerchantAccounts._Transactors = filtered
+            p._Transactors.discard(self)
         for r in value:
-            if self not in r._Transactors:
-                r._Transactors.append(self)
+            if r._Transactors is EMPTY:
+                r._Transactors = AssociationList([self])
+            else:
+                r._Transactors.add(self)
         self._MerchantAccounts = value
 
     MerchantAccounts = property(getMerchantAccounts, setMerchantAccounts)
 
     def addMerchantAccounts(self, *MerchantAccounts):
         for obj in MerchantAccounts:
-            if self not in obj._Transactors:
-                obj._Transactors.append(self)
-            self._MerchantAccounts.append(obj)
+            if obj._Transactors is EMPTY:
+                obj._Transactors = AssociationList([self])
+            else:
+                obj._Transactors.add(self)
+            if self._MerchantAccounts is EMPTY:
+                self._MerchantAccounts = AssociationList([obj])
+            else:
+                self._MerchantAccounts.add(obj)
 
     def removeMerchantAccounts(self, *MerchantAccounts):
         for obj in MerchantAccounts:
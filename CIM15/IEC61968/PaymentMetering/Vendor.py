@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class Vendor(IdentifiedObject):
     """The entity that owns point of sale and contracts with cashier to receipt payments and vend tokens using the payment system. Vendor has a private contract with and is managed by merchant who is a type of organisation. Vendor is accountable to merchant for revenue collected, who is in turn accountable to supplier.The entity that owns point of sale and contracts with cashier to receipt payments and vend tokens using the payment system. Vendor has a private contract with and is managed by merchant who is a type of organisation. Vendor is accountable to merchant for revenue collected, who is in turn accountable to supplier.
@@ -29,8 +30,9 @@ class Vendor(IdentifiedObject):
 
         @param VendorShifts: All vendor shifts opened and owned by this vendor.
         """
-        self._VendorShifts = []
-        self.VendorShifts = [] if VendorShifts is None else VendorShifts
+        self._VendorShifts = EMPTY
+        if VendorShifts is not None:
+            self.VendorShifts = VendorShifts
 
         super(Vendor, self).__init__(*args, **kw_args)
 
@@ -47,6 +49,7 @@ class Vendor(IdentifiedObject):
         return self._VendorShifts
 
     def setVendorShifts(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._VendorShifts:
             x.Vendor = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import AssociationList, EMPTY
 
 class Work(Document):
     """Document used to request, initiate, track and record work. This is synonymous with work breakdown structure (WBS), which is traversed through the (currently informative) recursive association of Work. Note that the work name is equal to the WBS name, which is given in the inherited 'name' attribute.Document used to request, initiate, track and record work. This is synonymous with work breakdown structure (WBS), which is traversed through the (currently informative) recursive association of Work. Note that the work name is equal to the WBS name, which is given in the inherited 'name' attribute.
@@ -50,11 +51,13 @@ class Work(Document):
         #: Date and time work was requested.
         self.requestDateTime = requestDateTime
 
-        self._Designs = []
-        self.Designs = [] if Designs is None else Designs
+        self._Designs = EMPTY
+        if Designs is not None:
+            self.Designs = Designs
 
-        self._WorkCostDetails = []
-        self.WorkCostDetails = [] if WorkCostDetails is None else WorkCostDetails
+        self._WorkCostDetails = EMPTY
+        if WorkCostDetails is not None:
+            self.WorkCostDetails = WorkCostDetails
 
         self._ErpProjectAccounting = None
         self.ErpProjectAccounting = ErpProjectAccounting
@@ -62,11 +65,13 @@ class Work(Document):
         self._Project = None
         self.Project = Project
 
-        self._WorkFlowSteps = []
-        self.WorkFlowSteps = [] if WorkFlowSteps is None else WorkFlowSteps
+        self._WorkFlowSteps = EMPTY
+        if WorkFlowSteps is not None:
+            self.WorkFlowSteps = WorkFlowSteps
 
-        self._WorkTasks = []
-        self.WorkTasks = [] if WorkTasks is None else WorkTasks
+        self._WorkTasks = EMPTY
+        if WorkTasks is not None:
+            self.WorkTasks = WorkTasks
 
         self._BusinessCase = None
         self.BusinessCase = BusinessCase
@@ -77,8 +82,9 @@ class Work(Document):
         self._Request = None
         self.Request = Request
 
-        self._Customers = []
-        self.Customers = [] if Customers is None else Customers
+        self._Customers = EMPTY
+        if Customers is not None:
+            self.Customers = Customers
 
         super(Work, self).__init__(*args, **kw_args)
 
@@ -94,6 +100,7 @@ class Work(Document):
         return self._Designs
 
     def setDesigns(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Designs:
             x.Work = None
         for y in value:
@@ -115,21 +122,28 @@ class Work(Document):
         return self._WorkCostDetails
 
     def setWorkCostDetails(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._WorkCostDetails:
-            filtered = [q for q in p.Works if q != self]
-            self._WorkCostDetails._Works = filtered
+            p._Works.discard(self)
         for r in value:
-            if self not in r._Works:
-                r._Works.append(self)
+            if r._Works is EMPTY:
+                r._Works = AssociationList([self])
+            else:
+                r._Works.add(self)
         self._WorkCostDetails = value
 
     WorkCostDetails = property(getWorkCostDetails, setWorkCostDetails)
 
     def addWorkCostDetails(self, *WorkCostDetails):
         for obj in WorkCostDetails:
-            if self not in obj._Works:
-                obj._Works.append(self)
-            self._WorkCostDetails.append(obj)
+            if obj._Works is EMPTY:
+                obj._Works = AssociationList([self])
+            else:
+                obj._Works.add(self)
+            if self._WorkCostDetails is EMPTY:
+                self._WorkCostDetails = AssociationList([obj])
+            else:
+                self._WorkCostDetails.add(obj)
 
     def removeWorkCostDetails(self, *WorkCostDetails):
         for obj in WorkCostDetails:
@@ -143,13 +157,14 @@ class Work(Document):
 
     def setErpProjectAccounting(self, value):
         if self._ErpProjectAccounting is not None:
-            filtered = [x for x in self.ErpProjectAccounting.Works if x != self]
-            self._ErpProjectAccounting._Works = filtered
+            self._ErpProjectAccounting._Works.discard(self)
 
         self._ErpProjectAccounting = value
         if self._ErpProjectAccounting is not None:
-            if self not in self._ErpProjectAccounting._Works:
-                self._ErpProjectAccounting._Works.append(self)
+            if self._ErpProjectAccounting._Works is EMPTY:
+                self._ErpProjectAccounting._Works = AssociationList([self])
+            else:
+                self._ErpProjectAccounting._Works.add(self)
 
     ErpProjectAccounting = property(getErpProjectAccounting, setErpProjectAccounting)
 
@@ -159,13 +174,14 @@ class Work(Document):
 
     def setProject(self, value):
         if self._Project is not None:
-            filtered = [x for x in self.Project.Works if x != self]
-            self._Project._Works = filtered
+            self._Project._Works.discard(self)
 
         self._Project = value
         if self._Project is not None:
-            if self not in self._Project._Works:
-                self._Project._Works.append(self)
+            if self._Project._Works is EMPTY:
+                self._Project._Works = AssociationList([self])
+            else:
+                self._Project._Works.add(self)
 
     Project = property(getProject, setProject)
 
@@ -174,6 +190,7 @@ class Work(Document):
         return self._WorkFlowSteps
 
     def setWorkFlowSteps(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._WorkFlowSteps:
             x.Work = None
         for y in value:
@@ -195,6 +212,7 @@ class Work(Document):
         return self._WorkTasks
 
     def setWorkTasks(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._WorkTasks:
             x.Work = None
         for y in value:
@@ -217,13 +235,14 @@ class Work(Document):
 
     def setBusinessCase(self, value):
         if self._BusinessCase is not None:
-            filtered = [x for x in self.BusinessCase.Works if x != self]
-            self._BusinessCase._Works = filtered
+            self._BusinessCase._Works.discard(self)
 
         self._BusinessCase = value
         if self._BusinessCase is not None:
-            if self not in self._BusinessCase._Works:
-                self._BusinessCase._Works.append(self)
+            if self._BusinessCase._Works is EMPTY:
+                self._BusinessCase._Works = AssociationList([self])
+            else:
+                self._BusinessCase._Works.add(self)
 
     BusinessCase = property(getBusinessCase, setBusinessCase)
 
@@ -233,13 +252,14 @@ class Work(Document):
 
     def setWorkBillingInfo(self, value):
         if self._WorkBillingInfo is not None:
-            filtered = [x for x in self.WorkBillingInfo.Works if x != self]
-            self._WorkBillingInfo._Works = filtered
+            self._WorkBillingInfo._Works.discard(self)
 
         self._WorkBillingInfo = value
         if self._WorkBillingInfo is not None:
-            if self not in self._WorkBillingInfo._Works:
-                self._WorkBillingInfo._Works.append(self)
+            if self._WorkBillingInfo._Works is EMPTY:
+                self._WorkBillingInfo._Works = AssociationList([self])
+            else:
+                self._WorkBillingInfo._Works.add(self)
 
     WorkBillingInfo = property(getWorkBillingInfo, setWorkBillingInfo)
 
@@ -249,13 +269,14 @@ class Work(Document):
 
     def setRequest(self, value):
         if self._Request is not None:
-            filtered = [x for x in self.Request.Works if x != self]
-            self._Request._Works = filtered
+            self._Request._Works.discard(self)
 
         self._Request = value
         if self._Request is not None:
-            if self not in self._Request._Works:
-                self._Request._Works.append(self)
+            if self._Request._Works is EMPTY:
+                self._Request._Works = AssociationList([self])
+            else:
+                self._Request._Works.add(self)
 
     Request = property(getRequest, setRequest)
 
@@ -265,21 +286,28 @@ class Work(Document):
         return self._Customers
 
     def setCustomers(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Customers:
-            filtered = [q for q in p.Works if q != self]
-            self._Customers._Works = filtered
+            p._Works.discard(self)
         for r in value:
-            if self not in r._Works:
-                r._Works.append(self)
+            if r._Works is EMPTY:
+                r._Works = AssociationList([self])
+            else:
+                r._Works.add(self)
         self._Customers = value
 
     Customers = property(getCustomers, setCustomers)
 
     def addCustomers(self, *Customers):
         for obj in Customers:
-            if self not in obj._Works:
-                obj._Works.append(self)
-            self._Customers.append(obj)
+            if obj._Works is EMPTY:
+                obj._Works = AssociationList([self])
+            else:
+                obj._Works.add(self)
+            if self._Customers is EMPTY:
+                self._Customers = AssociationList([obj])
+            else:
+                self._Customers.add(obj)
 
     def removeCustomers(self, *Customers):
         for obj in Customers:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.Equipment import Equipment
+from CIM15.Element import AssociationList, EMPTY
 
 class AuxiliaryEquipment(Equipment):
     """AuxiliaryEquipment describe equipment that is not performing any primary functions but support for the equipment performing the primary function. AuxiliaryEquipment is attached to primary eqipment via an association with Terminal.AuxiliaryEquipment describe equipment that is not performing any primary functions but support for the equipment performing the primary function. AuxiliaryEquipment is attached to primary eqipment via an association with Terminal.
@@ -48,13 +49,14 @@ class AuxiliaryEquipment(Equipment):
 
     def setTerminal(self, value):
         if self._Terminal is not None:
-            filtered = [x for x in self.Terminal.AuxiliaryEquipment if x != self]
-            self._Terminal._AuxiliaryEquipment = filtered
+            self._Terminal._AuxiliaryEquipment.discard(self)
 
         self._Terminal = value
         if self._Terminal is not None:
-            if self not in self._Terminal._AuxiliaryEquipment:
-                self._Terminal._AuxiliaryEquipment.append(self)
+            if self._Terminal._AuxiliaryEquipment is EMPTY:
+                self._Terminal._AuxiliaryEquipment = AssociationList([self])
+            else:
+                self._Terminal._AuxiliaryEquipment.add(self)
 
     Terminal = property(getTerminal, setTerminal)
 
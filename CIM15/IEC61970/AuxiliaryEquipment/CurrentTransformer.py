@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.AuxiliaryEquipment.Sensor import Sensor
+from CIM15.Element import AssociationList, EMPTY
 
 class CurrentTransformer(Sensor):
     """Instrument transformer used to measure electrical qualities of the circuit that is being protected and/or monitored. Typically used as current transducer for the purpose of metering or protection. A typical secondary current rating would be 5A.Instrument transformer used to measure electrical qualities of the circuit that is being protected and/or monitored. Typically used as current transducer for the purpose of metering or protection. A typical secondary current rating would be 5A.
@@ -72,13 +73,14 @@ class CurrentTransformer(Sensor):
 
     def setCTInfo(self, value):
         if self._CTInfo is not None:
-            filtered = [x for x in self.CTInfo.CTs if x != self]
-            self._CTInfo._CTs = filtered
+            self._CTInfo._CTs.discard(self)
 
         self._CTInfo = value
         if self._CTInfo is not None:
-            if self not in self._CTInfo._CTs:
-                self._CTInfo._CTs.append(self)
+            if self._CTInfo._CTs is EMPTY:
+                self._CTInfo._CTs = AssociationList([self])
+            else:
+                self._CTInfo._CTs.add(self)
 
     CTInfo = property(getCTInfo, setCTInfo)
 
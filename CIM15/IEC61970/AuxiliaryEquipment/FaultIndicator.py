@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.AuxiliaryEquipment.AuxiliaryEquipment import AuxiliaryEquipment
+from CIM15.Element import AssociationList, EMPTY
 
 class FaultIndicator(AuxiliaryEquipment):
     """A FaultIndicator is typically only an indicator (which may or may not be remotely monitored), and not a piece of equipment that actually initiates a protection event. It is used for FLISR (Fault Location, Isolation and Restoration) purposes, assisting with the dispatch of crews to 'most likely' part of the network (i.e. assists with determining circuit section where the fault most likely happened).A FaultIndicator is typically only an indicator (which may or may not be remotely monitored), and not a piece of equipment that actually initiates a protection event. It is used for FLISR (Fault Location, Isolation and Restoration) purposes, assisting with the dispatch of crews to 'most likely' part of the network (i.e. assists with determining circuit section where the fault most likely happened).
@@ -48,13 +49,14 @@ class FaultIndicator(AuxiliaryEquipment):
 
     def setFaultIndicatorInfo(self, value):
         if self._FaultIndicatorInfo is not None:
-            filtered = [x for x in self.FaultIndicatorInfo.FaultIndicators if x != self]
-            self._FaultIndicatorInfo._FaultIndicators = filtered
+            self._FaultIndicatorInfo._FaultIndicators.discard(self)
 
         self._FaultIndicatorInfo = value
         if self._FaultIndicatorInfo is not None:
-            if self not in self._FaultIndicatorInfo._FaultIndicators:
-                self._FaultIndicatorInfo._FaultIndicators.append(self)
+            if self._FaultIndicatorInfo._FaultIndicators is EMPTY:
+                self._FaultIndicatorInfo._FaultIndicators = AssociationList([self])
+            else:
+                self._FaultIndicatorInfo._FaultIndicators.add(self)
 
     FaultIndicatorInfo = property(getFaultIndicatorInfo, setFaultIndicatorInfo)
 
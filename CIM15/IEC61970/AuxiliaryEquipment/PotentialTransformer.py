@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.AuxiliaryEquipment.Sensor import Sensor
+from CIM15.Element import AssociationList, EMPTY
 
 class PotentialTransformer(Sensor):
     """Instrument transformer (also known as Voltage Transformer) used to measure electrical qualities of the circuit that is being protected and/or monitored. Typically used as voltage transducer for the purpose of metering, protection, or sometimes auxiliary substation supply. A typical secondary voltage rating would be 120V.Instrument transformer (also known as Voltage Transformer) used to measure electrical qualities of the circuit that is being protected and/or monitored. Typically used as voltage transducer for the purpose of metering, protection, or sometimes auxiliary substation supply. A typical secondary voltage rating would be 120V.
@@ -60,13 +61,14 @@ class PotentialTransformer(Sensor):
 
     def setPTInfo(self, value):
         if self._PTInfo is not None:
-            filtered = [x for x in self.PTInfo.PTs if x != self]
-            self._PTInfo._PTs = filtered
+            self._PTInfo._PTs.discard(self)
 
         self._PTInfo = value
         if self._PTInfo is not None:
-            if self not in self._PTInfo._PTs:
-                self._PTInfo._PTs.append(self)
+            if self._PTInfo._PTs is EMPTY:
+                self._PTInfo._PTs = AssociationList([self])
+            else:
+                self._PTInfo._PTs.add(self)
 
     PTInfo = property(getPTInfo, setPTInfo)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.AuxiliaryEquipment.AuxiliaryEquipment import AuxiliaryEquipment
+from CIM15.Element import AssociationList, EMPTY
 
 class SurgeProtector(AuxiliaryEquipment):
     """Shunt device, installed on the network, usually in the proximity of electrical equipment in order to protect the said equipment against transient voltage spikes caused by lightning or switching activity.Shunt device, installed on the network, usually in the proximity of electrical equipment in order to protect the said equipment against transient voltage spikes caused by lightning or switching activity.
@@ -48,13 +49,14 @@ class SurgeProtector(AuxiliaryEquipment):
 
     def setSurgeProtectorInfo(self, value):
         if self._SurgeProtectorInfo is not None:
-            filtered = [x for x in self.SurgeProtectorInfo.SurgeProtectors if x != self]
-            self._SurgeProtectorInfo._SurgeProtectors = filtered
+            self._SurgeProtectorInfo._SurgeProtectors.discard(self)
 
         self._SurgeProtectorInfo = value
         if self._SurgeProtectorInfo is not None:
-            if self not in self._SurgeProtectorInfo._SurgeProtectors:
-                self._SurgeProtectorInfo._SurgeProtectors.append(self)
+            if self._SurgeProtectorInfo._SurgeProtectors is EMPTY:
+                self._SurgeProtectorInfo._SurgeProtectors = AssociationList([self])
+            else:
+                self._SurgeProtectorInfo._SurgeProtectors.add(self)
 
     SurgeProtectorInfo = property(getSurgeProtectorInfo, setSurgeProtectorInfo)
 
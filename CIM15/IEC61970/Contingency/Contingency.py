@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class Contingency(IdentifiedObject):
     """An event threatening system reliability, consisting of one or more contingency elements.An event threatening system reliability, consisting of one or more contingency elements.
@@ -33,8 +34,9 @@ class Contingency(IdentifiedObject):
         #: Set true if must study this contingency.
         self.mustStudy = mustStudy
 
-        self._ContingencyElement = []
-        self.ContingencyElement = [] if ContingencyElement is None else ContingencyElement
+        self._ContingencyElement = EMPTY
+        if ContingencyElement is not None:
+            self.ContingencyElement = ContingencyElement
 
         super(Contingency, self).__init__(*args, **kw_args)
 
@@ -51,6 +53,7 @@ class Contingency(IdentifiedObject):
         return self._ContingencyElement
 
     def setContingencyElement(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ContingencyElement:
             x.Contingency = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class ContingencyElement(IdentifiedObject):
     """An element of a system event to be studied by contingency analysis, representing a change in status of a single piece of equipment.An element of a system event to be studied by contingency analysis, representing a change in status of a single piece of equipment.
@@ -48,13 +49,14 @@ class ContingencyElement(IdentifiedObject):
 
     def setContingency(self, value):
         if self._Contingency is not None:
-            filtered = [x for x in self.Contingency.ContingencyElement if x != self]
-            self._Contingency._ContingencyElement = filtered
+            self._Contingency._ContingencyElement.discard(self)
 
         self._Contingency = value
         if self._Contingency is not None:
-            if self not in self._Contingency._ContingencyElement:
-                self._Contingency._ContingencyElement.append(self)
+            if self._Contingency._ContingencyElement is EMPTY:
+                self._Contingency._ContingencyElement = AssociationList([self])
+            else:
+                self._Contingency._ContingencyElement.add(self)
 
     Contingency = property(getContingency, setContingency)
 
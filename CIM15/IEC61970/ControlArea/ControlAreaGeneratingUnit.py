@@ -18,7 +18,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from CIM15.Element import Element
+from CIM15.Element import Element, AssociationList, EMPTY
 
 class ControlAreaGeneratingUnit(Element):
     """A control area generating unit. This class is needed so that alternate control area definitions may include the same generating unit.   Note only one instance within a control area should reference a specific generating unit.A control area generating unit. This class is needed so that alternate control area definitions may include the same generating unit.   Note only one instance within a control area should reference a specific generating unit.
@@ -31,8 +31,9 @@ class ControlAreaGeneratingUnit(Element):
         @param GeneratingUnit: The generating unit specified for this control area.  Note that a control area should include a GeneratingUnit only once.
         @param ControlArea: The parent control area for the generating unit specifications.
         """
-        self._AltGeneratingUnitMeas = []
-        self.AltGeneratingUnitMeas = [] if AltGeneratingUnitMeas is None else AltGeneratingUnitMeas
+        self._AltGeneratingUnitMeas = EMPTY
+        if AltGeneratingUnitMeas is not None:
+            self.AltGeneratingUnitMeas = AltGeneratingUnitMeas
 
         self._GeneratingUnit = None
         self.GeneratingUnit = GeneratingUnit
@@ -55,6 +56,7 @@ class ControlAreaGeneratingUnit(Element):
         return self._AltGeneratingUnitMeas
 
     def setAltGeneratingUnitMeas(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._AltGeneratingUnitMeas:
             x.ControlAreaGeneratingUnit = None
         for y in value:
@@ -78,13 +80,14 @@ class ControlAreaGeneratingUnit(Element):
 
     def setGeneratingUnit(self, value):
         if self._GeneratingUnit is not None:
-            filtered = [x for x in self.GeneratingUnit.ControlAreaGeneratingUnit if x != self]
-            self._GeneratingUnit._ControlAreaGeneratingUnit = filtered
+            self._GeneratingUnit._ControlAreaGeneratingUnit.discard(self)
 
         self._GeneratingUnit = value
         if self._GeneratingUnit is not None:
-            if self not in self._GeneratingUnit._ControlAreaGeneratingUnit:
-                self._GeneratingUnit._ControlAreaGeneratingUnit.append(self)
+            if self._GeneratingUnit._ControlAreaGeneratingUnit is EMPTY:
+                self._GeneratingUnit._ControlAreaGeneratingUnit = AssociationList([self])
+            else:
+                self._GeneratingUnit._ControlAreaGeneratingUnit.add(self)
 
     GeneratingUnit = property(getGeneratingUnit, setGeneratingUnit)
 
@@ -95,13 +98,14 @@ class ControlAreaGeneratingUnit(Element):
 
     def setControlArea(self, value):
         if self._ControlArea is not None:
-            filtered = [x for x in self.ControlArea.ControlAreaGeneratingUnit if x != self]
-            self._ControlArea._ControlAreaGeneratingUnit = filtered
+            self._ControlArea._ControlAreaGeneratingUnit.discard(self)
 
         self._ControlArea = value
         if self._ControlArea is not None:
-            if self not in self._ControlArea._ControlAreaGeneratingUnit:
-                self._ControlArea._ControlAreaGeneratingUnit.append(self)
+            if self._ControlArea._ControlAreaGeneratingUnit is EMPTY:
+                self._ControlArea._ControlAreaGeneratingUnit = AssociationList([self])
+            else:
+                self._ControlArea._ControlAreaGeneratingUnit.add(self)
 
     ControlArea = property(getControlArea, setControlArea)
 
@@ -18,7 +18,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from CIM15.Element import Element
+from CIM15.Element import Element, AssociationList, EMPTY
 
 class TieFlow(Element):
     """A flow specification in terms of location and direction for a control area.A flow specification in terms of location and direction for a control area.
@@ -35,8 +35,9 @@ class TieFlow(Element):
         #: The flow is positive into the terminal.  A flow is positive if it is an import into the control area.
         self.positiveFlowIn = positiveFlowIn
 
-        self._AltTieMeas = []
-        self.AltTieMeas = [] if AltTieMeas is None else AltTieMeas
+        self._AltTieMeas = EMPTY
+        if AltTieMeas is not None:
+            self.AltTieMeas = AltTieMeas
 
         self._Terminal = None
         self.Terminal = Terminal
@@ -59,6 +60,7 @@ class TieFlow(Element):
         return self._AltTieMeas
 
     def setAltTieMeas(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._AltTieMeas:
             x.TieFlow = None
         for y in value:
@@ -82,13 +84,14 @@ class TieFlow(Element):
 
     def setTerminal(self, value):
         if self._Terminal is not None:
-            filtered = [x for x in self.Terminal.TieFlow if x != self]
-            self._Terminal._TieFlow = filtered
+            self._Terminal._TieFlow.discard(self)
 
         self._Terminal = value
         if self._Terminal is not None:
-            if self not in self._Terminal._TieFlow:
-                self._Terminal._TieFlow.append(self)
+            if self._Terminal._TieFlow is EMPTY:
+                self._Terminal._TieFlow = AssociationList([self])
+            else:
+                self._Terminal._TieFlow.add(self)
 
     Terminal = property(getTerminal, setTerminal)
 
@@ -99,13 +102,14 @@ class TieFlow(Element):
 
     def setControlArea(self, value):
         if self._ControlArea is not None:
-            filtered = [x for x in self.ControlArea.TieFlow if x != self]
-            self._ControlArea._TieFlow = filtered
+            self._ControlArea._TieFlow.discard(self)
 
         self._ControlArea = value
         if self._ControlArea is not None:
-            if self not in self._ControlArea._TieFlow:
-                self._ControlArea._TieFlow.append(self)
+            if self._ControlArea._TieFlow is EMPTY:
+                self._ControlArea._TieFlow = AssociationList([self])
+            else:
+                self._ControlArea._TieFlow.add(self)
 
     ControlArea = property(getControlArea, setControlArea)
 
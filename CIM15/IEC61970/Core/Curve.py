@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class Curve(IdentifiedObject):
     """A multi-purpose curve or functional relationship between an independent variable (X-axis) and dependent (Y-axis) variables.A multi-purpose curve or functional relationship between an independent variable (X-axis) and dependent (Y-axis) variables.
@@ -65,8 +66,9 @@ class Curve(IdentifiedObject):
         #: The style or shape of the curve. Values are: "formula", "constantYValue", "straightLineYValues", "rampYValue"
         self.curveStyle = curveStyle
 
-        self._CurveDatas = []
-        self.CurveDatas = [] if CurveDatas is None else CurveDatas
+        self._CurveDatas = EMPTY
+        if CurveDatas is not None:
+            self.CurveDatas = CurveDatas
 
         super(Curve, self).__init__(*args, **kw_args)
 
@@ -83,6 +85,7 @@ class Curve(IdentifiedObject):
         return self._CurveDatas
 
     def setCurveDatas(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._CurveDatas:
             x.Curve = None
         for y in value:
@@ -18,7 +18,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from CIM15.Element import Element
+from CIM15.Element import Element, AssociationList, EMPTY
 
 class IdentifiedObject(Element):
     """This is a root class to provide common identification for all classes needing identification and naming attributesThis is a root class to provide common identification for all classes needing identification and naming attributes
@@ -43,11 +43,13 @@ class IdentifiedObject(Element):
         #: The name is any free human readable and possibly non unique text naming the object.
         self.name = name
 
-        self._Names = []
-        self.Names = [] if Names is None else Names
+        self._Names = EMPTY
+        if Names is not None:
+            self.Names = Names
 
-        self._DiagramObjects = []
-        self.DiagramObjects = [] if DiagramObjects is None else DiagramObjects
+        self._DiagramObjects = EMPTY
+        if DiagramObjects is not None:
+            self.DiagramObjects = DiagramObjects
 
         self._ModelingAuthoritySet = None
         self.ModelingAuthoritySet = ModelingAuthoritySet
@@ -67,6 +69,7 @@ class IdentifiedObject(Element):
         return self._Names
 
     def setNames(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Names:
             x.IdentifiedObject = None
         for y in value:
@@ -89,6 +92,7 @@ class IdentifiedObject(Element):
         return self._DiagramObjects
 
     def setDiagramObjects(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._DiagramObjects:
             x.IdentifiedObject = None
         for y in value:
@@ -112,13 +116,14 @@ class IdentifiedObject(Element):
 
     def setModelingAuthoritySet(self, value):
         if self._ModelingAuthoritySet is not None:
-            filtered = [x for x in self.ModelingAuthoritySet.IdentifiedObjects if x != self]
-            self._ModelingAuthoritySet._IdentifiedObjects = filtered
+            self._ModelingAuthoritySet._IdentifiedObjects.discard(self)
 
         self._ModelingAuthoritySet = value
         if self._ModelingAuthoritySet is not None:
-            if self not in self._ModelingAuthoritySet._IdentifiedObjects:
-                self._ModelingAuthoritySet._IdentifiedObjects.append(self)
+            if self._ModelingAuthoritySet._IdentifiedObjects is EMPTY:
+                self._ModelingAuthoritySet._IdentifiedObjects = AssociationList([self])
+            else:
+                self._ModelingAuthoritySet._IdentifiedObjects.add(self)
 
     ModelingAuthoritySet = property(getModelingAuthoritySet, setModelingAuthoritySet)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.BasicIntervalSchedule import BasicIntervalSchedule
+from CIM15.Element import AssociationList, EMPTY
 
 class IrregularIntervalSchedule(BasicIntervalSchedule):
     """The schedule has TimePoints where the time between them varies.The schedule has TimePoints where the time between them varies.
@@ -29,8 +30,9 @@ class IrregularIntervalSchedule(BasicIntervalSchedule):
 
         @param TimePoints: The point data values that define a curve
         """
-        self._TimePoints = []
-        self.TimePoints = [] if TimePoints is None else TimePoints
+        self._TimePoints = EMPTY
+        if TimePoints is not None:
+            self.TimePoints = TimePoints
 
         super(IrregularIntervalSchedule, self).__init__(*args, **kw_args)
 
@@ -47,6 +49,7 @@ class IrregularIntervalSchedule(BasicIntervalSchedule):
         return self._TimePoints
 
     def setTimePoints(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._TimePoints:
             x.IntervalSchedule = None
         for y in value:
@@ -18,7 +18,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from CIM15.Element import Element
+from CIM15.Element import Element, AssociationList, EMPTY
 
 class OperatingShare(Element):
     """Specifies the contract relationship between a PowerSystemResource and a contract participant.Specifies the contract relationship between a PowerSystemResource and a contract participant.
@@ -56,13 +56,14 @@ class OperatingShare(Element):
 
     def setPowerSystemResource(self, value):
         if self._PowerSystemResource is not None:
-            filtered = [x for x in self.PowerSystemResource.OperatingShare if x != self]
-            self._PowerSystemResource._OperatingShare = filtered
+            self._PowerSystemResource._OperatingShare.discard(self)
 
         self._PowerSystemResource = value
         if self._PowerSystemResource is not None:
-            if self not in self._PowerSystemResource._OperatingShare:
-                self._PowerSystemResource._OperatingShare.append(self)
+            if self._PowerSystemResource._OperatingShare is EMPTY:
+                self._PowerSystemResource._OperatingShare = AssociationList([self])
+            else:
+                self._PowerSystemResource._OperatingShare.add(self)
 
     PowerSystemResource = property(getPowerSystemResource, setPowerSystemResource)
 
@@ -73,13 +74,14 @@ class OperatingShare(Element):
 
     def setOperatingParticipant(self, value):
         if self._OperatingParticipant is not None:
-            filtered = [x for x in self.OperatingParticipant.OperatingShare if x != self]
-            self._OperatingParticipant._OperatingShare = filtered
+            self._OperatingParticipant._OperatingShare.discard(self)
 
         self._OperatingParticipant = value
         if self._OperatingParticipant is not None:
-            if self not in self._OperatingParticipant._OperatingShare:
-                self._OperatingParticipant._OperatingShare.append(self)
+            if self._OperatingParticipant._OperatingShare is EMPTY:
+                self._OperatingParticipant._OperatingShare = AssociationList([self])
+            else:
+                self._OperatingParticipant._OperatingShare.add(self)
 
     OperatingParticipant = property(getOperatingParticipant, setOperatingParticipant)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class PowerSystemResource(IdentifiedObject):
     """A power system resource can be an item of equipment such as a Switch, an EquipmentContainer containing many individual items of equipment such as a  Substation, or an organisational entity such as Company or SubControlArea.  This provides for the nesting of collections of PowerSystemResources within other PowerSystemResources. For example, a Switch could be a member of a Substation and a Substation could be a member of a division of a Company.A power system resource can be an item of equipment such as a Switch, an EquipmentContainer containing many individual items of equipment such as a  Substation, or an organisational entity such as Company or SubControlArea.  This provides for the nesting of collections of PowerSystemResources within other PowerSystemResources. For example, a Switch could be a member of a Substation and a Substation could be a member of a division of a Company.
@@ -43,47 +44,59 @@ class PowerSystemResource(IdentifiedObject):
         @param NetworkDataSets:
         @param OutageSchedule: A power system resource may have an outage schedule
         """
-        self._ChangeItems = []
-        self.ChangeItems = [] if ChangeItems is None else ChangeItems
+        self._ChangeItems = EMPTY
+        if ChangeItems is not None:
+            self.ChangeItems = ChangeItems
 
-        self._ScheduleSteps = []
-        self.ScheduleSteps = [] if ScheduleSteps is None else ScheduleSteps
+        self._ScheduleSteps = EMPTY
+        if ScheduleSteps is not None:
+            self.ScheduleSteps = ScheduleSteps
 
-        self._SafetyDocuments = []
-        self.SafetyDocuments = [] if SafetyDocuments is None else SafetyDocuments
+        self._SafetyDocuments = EMPTY
+        if SafetyDocuments is not None:
+            self.SafetyDocuments = SafetyDocuments
 
-        self._OperatingShare = []
-        self.OperatingShare = [] if OperatingShare is None else OperatingShare
+        self._OperatingShare = EMPTY
+        if OperatingShare is not None:
+            self.OperatingShare = OperatingShare
 
-        self._DocumentRoles = []
-        self.DocumentRoles = [] if DocumentRoles is None else DocumentRoles
+        self._DocumentRoles = EMPTY
+        if DocumentRoles is not None:
+            self.DocumentRoles = DocumentRoles
 
-        self._PsrLists = []
-        self.PsrLists = [] if PsrLists is None else PsrLists
+        self._PsrLists = EMPTY
+        if PsrLists is not None:
+            self.PsrLists = PsrLists
 
-        self._Measurements = []
-        self.Measurements = [] if Measurements is None else Measurements
+        self._Measurements = EMPTY
+        if Measurements is not None:
+            self.Measurements = Measurements
 
-        self._ReportingGroup = []
-        self.ReportingGroup = [] if ReportingGroup is None else ReportingGroup
+        self._ReportingGroup = EMPTY
+        if ReportingGroup is not None:
+            self.ReportingGroup = ReportingGroup
 
         self._PSRType = None
         self.PSRType = PSRType
 
-        self._Assets = []
-        self.Assets = [] if Assets is None else Assets
+        self._Assets = EMPTY
+        if Assets is not None:
+            self.Assets = Assets
 
-        self._ErpOrganisationRoles = []
-        self.ErpOrganisationRoles = [] if ErpOrganisationRoles is None else ErpOrganisationRoles
+        self._ErpOrganisationRoles = EMPTY
+        if ErpOrganisationRoles is not None:
+            self.ErpOrganisationRoles = ErpOrganisationRoles
 
         self._Location = None
         self.Location = Location
 
-        self._PSREvent = []
-        self.PSREvent = [] if PSREvent is None else PSREvent
+        self._PSREvent = EMPTY
+        if PSREvent is not None:
+            self.PSREvent = PSREvent
 
-        self._NetworkDataSets = []
-        self.NetworkDataSets = [] if NetworkDataSets is None else NetworkDataSets
+        self._NetworkDataSets = EMPTY
+        if NetworkDataSets is not None:
+            self.NetworkDataSets = NetworkDataSets
 
         self._OutageSchedule = None
         self.OutageSchedule = OutageSchedule
@@ -102,6 +115,7 @@ class PowerSystemResource(IdentifiedObject):
         return self._ChangeItems
 
     def setChangeItems(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ChangeItems:
             x.PowerSystemResource = None
         for y in value:
@@ -123,21 +137,28 @@ class PowerSystemResource(IdentifiedObject):
         return self._ScheduleSteps
 
     def setScheduleSteps(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ScheduleSteps:
-            filtered = [q for q in p.PowerSystemResources if q != self]
-            self._ScheduleSteps._PowerSystemResources = filtered
+            p._PowerSystemResources.discard(self)
         for r in value:
-            if self not in r._PowerSystemResources:
-                r._PowerSystemResources.append(self)
+            if r._PowerSystemResources is EMPTY:
+                r._PowerSystemResources = AssociationList([self])
+            else:
+                r._PowerSystemResources.add(self)
         self._ScheduleSteps = value
 
     ScheduleSteps = property(getScheduleSteps, setScheduleSteps)
 
     def addScheduleSteps(self, *ScheduleSteps):
         for obj in ScheduleSteps:
-            if self not in obj._PowerSystemResources:
-                obj._PowerSystemResources.append(self)
-            self._ScheduleSteps.append(obj)
+            if obj._PowerSystemResources is EMPTY:
+                obj._PowerSystemResources = AssociationList([self])
+            else:
+                obj._PowerSystemResources.add(self)
+            if self._ScheduleSteps is EMPTY:
+                self._ScheduleSteps = AssociationList([obj])
+            else:
+                self._ScheduleSteps.add(obj)
 
     def removeScheduleSteps(self, *ScheduleSteps):
         for obj in ScheduleSteps:
@@ -150,6 +171,7 @@ class PowerSystemResource(IdentifiedObject):
         return self._SafetyDocuments
 
     def setSafetyDocuments(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._SafetyDocuments:
             x.PowerSystemResource = None
         for y in value:
@@ -172,6 +194,7 @@ class PowerSystemResource(IdentifiedObject):
         return self._OperatingShare
 
     def setOperatingShare(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._OperatingShare:
             x.PowerSystemResource = None
         for y in value:
@@ -193,6 +216,7 @@ class PowerSystemResource(IdentifiedObject):
         return self._DocumentRoles
 
     def setDocumentRoles(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._DocumentRoles:
             x.PowerSystemResource = None
         for y in value:
@@ -214,21 +238,28 @@ class PowerSystemResource(IdentifiedObject):
         return self._PsrLists
 
     def setPsrLists(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._PsrLists:
-            filtered = [q for q in p.PowerSystemResources if q != self]
-            self._PsrLists._PowerSystemResources = filtered
+            p._PowerSystemResources.discard(self)
         for r in value:
-            if self not in r._PowerSystemResources:
-                r._PowerSystemResources.append(self)
+            if r._PowerSystemResources is EMPTY:
+                r._PowerSystemResources = AssociationList([self])
+            else:
+                r._PowerSystemResources.add(self)
         self._PsrLists = value
 
     PsrLists = property(getPsrLists, setPsrLists)
 
     def addPsrLists(self, *PsrLists):
         for obj in PsrLists:
-            if self not in obj._PowerSystemResources:
-                obj._PowerSystemResources.append(self)
-            self._PsrLists.append(obj)
+            if obj._PowerSystemResources is EMPTY:
+                obj._PowerSystemResources = AssociationList([self])
+            else:
+                obj._PowerSystemResources.add(self)
+            if self._PsrLists is EMPTY:
+                self._PsrLists = AssociationList([obj])
+            else:
+                self._PsrLists.add(obj)
 
     def removePsrLists(self, *PsrLists):
         for obj in PsrLists:
@@ -242,6 +273,7 @@ class PowerSystemResource(IdentifiedObject):
         return self._Measurements
 
     def setMeasurements(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Measurements:
             x.PowerSystemResource = None
         for y in value:
@@ -264,21 +296,28 @@ class PowerSystemResource(IdentifiedObject):
         return self._ReportingGroup
 
     def setReportingGroup(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ReportingGroup:
-            filtered = [q for q in p.PowerSystemResource if q != self]
-            self._ReportingGroup._PowerSystemResource = filtered
+            p._PowerSystemResource.discard(self)
         for r in value:
-            if self not in r._PowerSystemResource:
-                r._PowerSystemResource.append(self)
+            if r._PowerSystemResource is EMPTY:
+                r._PowerSystemResource = AssociationList([self])
+            else:
+                r._PowerSystemResource.add(self)
         self._ReportingGroup = value
 
     ReportingGroup = property(getReportingGroup, setReportingGroup)
 
     def addReportingGroup(self, *ReportingGroup):
         for obj in ReportingGroup:
-            if self not in obj._PowerSystemResource:
-                obj._PowerSystemResource.append(self)
-            self._ReportingGroup.append(obj)
+            if obj._PowerSystemResource is EMPTY:
+                obj._PowerSystemResource = AssociationList([self])
+            else:
+                obj._PowerSystemResource.add(self)
+            if self._ReportingGroup is EMPTY:
+                self._ReportingGroup = AssociationList([obj])
+            else:
+                self._ReportingGroup.add(obj)
 
     def removeReportingGroup(self, *ReportingGroup):
         for obj in ReportingGroup:
@@ -293,13 +332,14 @@ class PowerSystemResource(IdentifiedObject):
 
     def setPSRType(self, value):
         if self._PSRType is not None:
-            filtered = [x for x in self.PSRType.PowerSystemResources if x != self]
-            self._PSRType._PowerSystemResources = filtered
+            self._PSRType._PowerSystemResources.discard(self)
 
         self._PSRType = value
         if self._PSRType is not None:
-            if self not in self._PSRType._PowerSystemResources:
-                self._PSRType._PowerSystemResources.append(self)
+            if self._PSRType._PowerSystemResources is EMPTY:
+                self._PSRType._PowerSystemResources = AssociationList([self])
+            else:
+                self._PSRType._PowerSystemResources.add(self)
 
     PSRType = property(getPSRType, setPSRType)
 
@@ -309,21 +349,28 @@ class PowerSystemResource(IdentifiedObject):
         return self._Assets
 
     def setAssets(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Assets:
-            filtered = [q for q in p.PowerSystemResources if q != self]
-            self._Assets._PowerSystemResources = filtered
+            p._PowerSystemResources.discard(self)
         for r in value:
-            if self not in r._PowerSystemResources:
-                r._PowerSystemResources.append(self)
+            if r._PowerSystemResources is EMPTY:
+                r._PowerSystemResources = AssociationList([self])
+            else:
+                r._PowerSystemResources.add(self)
         self._Assets = value
 
     Assets = property(getAssets, setAssets)
 
     def addAssets(self, *Assets):
         for obj in Assets:
-            if self not in obj._PowerSystemResources:
-                obj._PowerSystemResources.append(self)
-            self._Assets.append(obj)
+            if obj._PowerSystemResources is EMPTY:
+                obj._PowerSystemResources = AssociationList([self])
+            else:
+                obj._PowerSystemResources.add(self)
+            if self._Assets is EMPTY:
+                self._Assets = AssociationList([obj])
+            else:
+                self._Assets.add(obj)
 
     def removeAssets(self, *Assets):
         for obj in Assets:
@@ -336,6 +383,7 @@ class PowerSystemResource(IdentifiedObject):
         return self._ErpOrganisationRoles
 
     def setErpOrganisationRoles(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ErpOrganisationRoles:
             x.PowerSystemResource = None
         for y in value:
@@ -359,13 +407,14 @@ class PowerSystemResource(IdentifiedObject):
 
     def setLocation(self, value):
         if self._Location is not None:
-            filtered = [x for x in self.Location.PowerSystemResources if x != self]
-            self._Location._PowerSystemResources = filtered
+            self._Location._PowerSystemResources.discard(self)
 
         self._Location = value
         if self._Location is not None:
-            if self not in self._Location._PowerSystemResources:
-                self._Location._PowerSystemResources.append(self)
+            if self._Location._PowerSystemResources is EMPTY:
+                self._Location._PowerSystemResources = AssociationList([self])
+            else:
+                self._Location._PowerSystemResources.add(self)
 
     Location = property(getLocation, setLocation)
 
@@ -375,6 +424,7 @@ class PowerSystemResource(IdentifiedObject):
         return self._PSREvent
 
     def setPSREvent(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._PSREvent:
             x.PowerSystemResource = None
         for y in value:
@@ -396,21 +446,28 @@ class PowerSystemResource(IdentifiedObject):
         return self._NetworkDataSets
 
     def setNetworkDataSets(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._NetworkDataSets:
-            filtered = [q for q in p.PowerSystemResources if q != self]
-            self._NetworkDataSets._PowerSystemResources = filtered
+            p._PowerSystemResources.discard(self)
         for r in value:
-            if self not in r._PowerSystemResources:
-                r._PowerSystemResources.append(self)
+            if r._PowerSystemResources is EMPTY:
+                r._PowerSystemResources = AssociationList([self])
+            else:
+                r._PowerSystemResources.add(self)
         self._NetworkDataSets = value
 
     NetworkDataSets = property(getNetworkDataSets, setNetworkDataSets)
 
     def addNetworkDataSets(self, *NetworkDataSets):
         for obj in NetworkDataSets:
-            if self not in obj._PowerSystemResources:
-                obj._PowerSystemResources.append(self)
-            self._NetworkDataSets.append(obj)
+            if obj._PowerSystemResources is EMPTY:
+                obj._PowerSystemResources = AssociationList([self])
+            else:
+                obj._PowerSystemResources.add(self)
+            if self._NetworkDataSets is EMPTY:
+                self._NetworkDataSets = AssociationList([obj])
+            else:
+                self._NetworkDataSets.add(obj)
 
     def removeNetworkDataSets(self, *NetworkDataSets):
         for obj in NetworkDataSets:
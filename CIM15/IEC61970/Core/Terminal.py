@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class Terminal(IdentifiedObject):
     """An electrical connection point to a piece of conducting equipment. Terminals are connected at physical connection points called 'connectivity nodes'.An electrical connection point to a piece of conducting equipment. Terminals are connected at physical connection points called 'connectivity nodes'.
@@ -58,38 +59,47 @@ class Terminal(IdentifiedObject):
         self._BushingInfo = None
         self.BushingInfo = BushingInfo
 
-        self._TieFlow = []
-        self.TieFlow = [] if TieFlow is None else TieFlow
+        self._TieFlow = EMPTY
+        if TieFlow is not None:
+            self.TieFlow = TieFlow
 
-        self._HasSecond_MutualCoupling = []
-        self.HasSecond_MutualCoupling = [] if HasSecond_MutualCoupling is None else HasSecond_MutualCoupling
+        self._HasSecond_MutualCoupling = EMPTY
+        if HasSecond_MutualCoupling is not None:
+            self.HasSecond_MutualCoupling = HasSecond_MutualCoupling
 
-        self._OperationalLimitSet = []
-        self.OperationalLimitSet = [] if OperationalLimitSet is None else OperationalLimitSet
+        self._OperationalLimitSet = EMPTY
+        if OperationalLimitSet is not None:
+            self.OperationalLimitSet = OperationalLimitSet
 
-        self._Measurements = []
-        self.Measurements = [] if Measurements is None else Measurements
+        self._Measurements = EMPTY
+        if Measurements is not None:
+            self.Measurements = Measurements
 
         self._ConductingEquipment = None
         self.ConductingEquipment = ConductingEquipment
 
-        self._RegulatingControl = []
-        self.RegulatingControl = [] if RegulatingControl is None else RegulatingControl
+        self._RegulatingControl = EMPTY
+        if RegulatingControl is not None:
+            self.RegulatingControl = RegulatingControl
 
-        self._HasFirst_MutualCoupling = []
-        self.HasFirst_MutualCoupling = [] if HasFirst_MutualCoupling is None else HasFirst_MutualCoupling
+        self._HasFirst_MutualCoupling = EMPTY
+        if HasFirst_MutualCoupling is not None:
+            self.HasFirst_MutualCoupling = HasFirst_MutualCoupling
 
-        self._AuxiliaryEquipment = []
-        self.AuxiliaryEquipment = [] if AuxiliaryEquipment is None else AuxiliaryEquipment
+        self._AuxiliaryEquipment = EMPTY
+        if AuxiliaryEquipment is not None:
+            self.AuxiliaryEquipment = AuxiliaryEquipment
 
-        self._TransformerEnd = []
-        self.TransformerEnd = [] if TransformerEnd is None else TransformerEnd
+        self._TransformerEnd = EMPTY
+        if TransformerEnd is not None:
+            self.TransformerEnd = TransformerEnd
 
         self._ConnectivityNode = None
         self.ConnectivityNode = ConnectivityNode
 
-        self._BranchGroupTerminal = []
-        self.BranchGroupTerminal = [] if BranchGroupTerminal is None else BranchGroupTerminal
+        self._BranchGroupTerminal = EMPTY
+        if BranchGroupTerminal is not None:
+            self.BranchGroupTerminal = BranchGroupTerminal
 
         self._BusNameMarker = None
         self.BusNameMarker = BusNameMarker
@@ -130,6 +140,7 @@ class Terminal(IdentifiedObject):
         return self._TieFlow
 
     def setTieFlow(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._TieFlow:
             x.Terminal = None
         for y in value:
@@ -152,6 +163,7 @@ class Terminal(IdentifiedObject):
         return self._HasSecond_MutualCoupling
 
     def setHasSecond_MutualCoupling(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._HasSecond_MutualCoupling:
             x.Second_Terminal = None
         for y in value:
@@ -174,6 +186,7 @@ class Terminal(IdentifiedObject):
         return self._OperationalLimitSet
 
     def setOperationalLimitSet(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._OperationalLimitSet:
             x.Terminal = None
         for y in value:
@@ -196,6 +209,7 @@ class Terminal(IdentifiedObject):
         return self._Measurements
 
     def setMeasurements(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Measurements:
             x.Terminal = None
         for y in value:
@@ -219,13 +233,14 @@ class Terminal(IdentifiedObject):
 
     def setConductingEquipment(self, value):
         if self._ConductingEquipment is not None:
-            filtered = [x for x in self.ConductingEquipment.Terminals if x != self]
-            self._ConductingEquipment._Terminals = filtered
+            self._ConductingEquipment._Terminals.discard(self)
 
         self._ConductingEquipment = value
         if self._ConductingEquipment is not None:
-            if self not in self._ConductingEquipment._Terminals:
-                self._ConductingEquipment._Terminals.append(self)
+            if self._ConductingEquipment._Terminals is EMPTY:
+                self._ConductingEquipment._Terminals = AssociationList([self])
+            else:
+                self._ConductingEquipment._Terminals.add(self)
 
     ConductingEquipment = property(getConductingEquipment, setConductingEquipment)
 
@@ -235,6 +250,7 @@ class Terminal(IdentifiedObject):
         return self._RegulatingControl
 
     def setRegulatingControl(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._RegulatingControl:
             x.Terminal = None
         for y in value:
@@ -257,6 +273,7 @@ class Terminal(IdentifiedObject):
         return self._HasFirst_MutualCoupling
 
     def setHasFirst_MutualCoupling(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._HasFirst_MutualCoupling:
             x.First_Terminal = None
         for y in value:
@@ -278,6 +295,7 @@ class Terminal(IdentifiedObject):
         return self._AuxiliaryEquipment
 
     def setAuxiliaryEquipment(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._AuxiliaryEquipment:
             x.Terminal = None
         for y in value:
@@ -300,6 +318,7 @@ class Terminal(IdentifiedObject):
         return self._TransformerEnd
 
     def setTransformerEnd(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._TransformerEnd:
             x.Terminal = None
         for y in value:
@@ -323,13 +342,14 @@ class Terminal(IdentifiedObject):
 
     def setConnectivityNode(self, value):
         if self._ConnectivityNode is not None:
-            filtered = [x for x in self.ConnectivityNode.Terminals if x != self]
-            self._ConnectivityNode._Terminals = filtered
+            self._ConnectivityNode._Terminals.discard(self)
 
         self._ConnectivityNode = value
         if self._ConnectivityNode is not None:
-            if self not in self._ConnectivityNode._Terminals:
-                self._ConnectivityNode._Terminals.append(self)
+            if self._ConnectivityNode._Terminals is EMPTY:
+                self._ConnectivityNode._Terminals = AssociationList([self])
+            else:
+                self._ConnectivityNode._Terminals.add(self)
 
     ConnectivityNode = property(getConnectivityNode, setConnectivityNode)
 
@@ -339,6 +359,7 @@ class Terminal(IdentifiedObject):
         return self._BranchGroupTerminal
 
     def setBranchGroupTerminal(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._BranchGroupTerminal:
             x.Terminal = None
         for y in value:
@@ -362,13 +383,14 @@ class Terminal(IdentifiedObject):
 
     def setBusNameMarker(self, value):
         if self._BusNameMarker is not None:
-            filtered = [x for x in self.BusNameMarker.Terminal if x != self]
-            self._BusNameMarker._Terminal = filtered
+            self._BusNameMarker._Terminal.discard(self)
 
         self._BusNameMarker = value
         if self._BusNameMarker is not None:
-            if self not in self._BusNameMarker._Terminal:
-                self._BusNameMarker._Terminal.append(self)
+            if self._BusNameMarker._Terminal is EMPTY:
+                self._BusNameMarker._Terminal = AssociationList([self])
+            else:
+                self._BusNameMarker._Terminal.add(self)
 
     BusNameMarker = property(getBusNameMarker, setBusNameMarker)
 
@@ -395,13 +417,14 @@ class Terminal(IdentifiedObject):
 
     def setTopologicalNode(self, value):
         if self._TopologicalNode is not None:
-            filtered = [x for x in self.TopologicalNode.Terminal if x != self]
-            self._TopologicalNode._Terminal = filtered
+            self._TopologicalNode._Terminal.discard(self)
 
         self._TopologicalNode = value
         if self._TopologicalNode is not None:
-            if self not in self._TopologicalNode._Terminal:
-                self._TopologicalNode._Terminal.append(self)
+            if self._TopologicalNode._Terminal is EMPTY:
+                self._TopologicalNode._Terminal = AssociationList([self])
+            else:
+                self._TopologicalNode._Terminal.add(self)
 
     TopologicalNode = property(getTopologicalNode, setTopologicalNode)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.ConductingEquipment import ConductingEquipment
+from CIM15.Element import AssociationList, EMPTY
 
 class Clamp(ConductingEquipment):
     """A Clamp is a galvanic connection at a line segment where other equipment is connected. A Clamp does not cut the line segment.  A Clamp is ConductingEquipment and has one Terminal with an associated ConnectivityNode. Any other ConductingEquipment can be connected to the Clamp ConnectivityNode.A Clamp is a galvanic connection at a line segment where other equipment is connected. A Clamp does not cut the line segment.  A Clamp is ConductingEquipment and has one Terminal with an associated ConnectivityNode. Any other ConductingEquipment can be connected to the Clamp ConnectivityNode.
@@ -51,13 +52,14 @@ class Clamp(ConductingEquipment):
 
     def setACLineSegment(self, value):
         if self._ACLineSegment is not None:
-            filtered = [x for x in self.ACLineSegment.Clamp if x != self]
-            self._ACLineSegment._Clamp = filtered
+            self._ACLineSegment._Clamp.discard(self)
 
         self._ACLineSegment = value
         if self._ACLineSegment is not None:
-            if self not in self._ACLineSegment._Clamp:
-                self._ACLineSegment._Clamp.append(self)
+            if self._ACLineSegment._Clamp is EMPTY:
+                self._ACLineSegment._Clamp = AssociationList([self])
+            else:
+                self._ACLineSegment._Clamp.add(self)
 
     ACLineSegment = property(getACLineSegment, setACLineSegment)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Wires.Switch import Switch
+from CIM15.Element import AssociationList, EMPTY
 
 class Cut(Switch):
     """A Cut separates a line segment into two parts. The Cut appears as a Switch inserted between these two parts and connects them together. As the Cut is normally &ldquo;open&rdquo; there is no galvanic connection between the two line segment parts. But it is possible to 'close' the Cut to get galvanic connection. The Cut Terminals are oriented towards the line segment Terminals with the same sequenceNumber. Hence the Cut Terminal with sequenceNumber=1 is oriented to the line segment with Terminal.sequenceNumber=1. The Cut Terminals also act as connection points for jumpers and other equipment, e.g. a mobile generator. To enable this ConnectivityNoces are placed at the Cut Terminals. Once the ConnectivityNodes are in place any ConductingEquipment can be connected at them.A Cut separates a line segment into two parts. The Cut appears as a Switch inserted between these two parts and connects them together. As the Cut is normally &ldquo;open&rdquo; there is no galvanic connection between the two line segment parts. But it is possible to 'close' the Cut to get galvanic connection. The Cut Terminals are oriented towards the line segment Terminals with the same sequenceNumber. Hence the Cut Terminal with sequenceNumber=1 is oriented to the line segment with Terminal.sequenceNumber=1. The Cut Terminals also act as connection points for jumpers and other equipment, e.g. a mobile generator. To enable this ConnectivityNoces are placed at the Cut Terminals. Once the ConnectivityNodes are in place any ConductingEquipment can be connected at them.
@@ -51,13 +52,14 @@ class Cut(Switch):
 
     def setACLineSegment(self, value):
         if self._ACLineSegment is not None:
-            filtered = [x for x in self.ACLineSegment.Cut if x != self]
-            self._ACLineSegment._Cut = filtered
+            self._ACLineSegment._Cut.discard(self)
 
         self._ACLineSegment = value
         if self._ACLineSegment is not None:
-            if self not in self._ACLineSegment._Cut:
-                self._ACLineSegment._Cut.append(self)
+            if self._ACLineSegment._Cut is EMPTY:
+                self._ACLineSegment._Cut = AssociationList([self])
+            else:
+                self._ACLineSegment._Cut.add(self)
 
     ACLineSegment = property(getACLineSegment, setACLineSegment)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Generation.GenerationDynamics.FossilSteamSupply import FossilSteamSupply
+from CIM15.Element import AssociationList, EMPTY
 
 class HeatRecoveryBoiler(FossilSteamSupply):
     """The heat recovery system associated with combustion turbines in order to produce steam for combined cycle plantsThe heat recovery system associated with combustion turbines in order to produce steam for combined cycle plants
@@ -33,8 +34,9 @@ class HeatRecoveryBoiler(FossilSteamSupply):
         #: The steam supply rating in kilopounds per hour, if dual pressure boiler
         self.steamSupplyRating2 = steamSupplyRating2
 
-        self._CombustionTurbines = []
-        self.CombustionTurbines = [] if CombustionTurbines is None else CombustionTurbines
+        self._CombustionTurbines = EMPTY
+        if CombustionTurbines is not None:
+            self.CombustionTurbines = CombustionTurbines
 
         super(HeatRecoveryBoiler, self).__init__(*args, **kw_args)
 
@@ -51,6 +53,7 @@ class HeatRecoveryBoiler(FossilSteamSupply):
         return self._CombustionTurbines
 
     def setCombustionTurbines(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._CombustionTurbines:
             x.HeatRecoveryBoiler = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.PowerSystemResource import PowerSystemResource
+from CIM15.Element import AssociationList, EMPTY
 
 class SteamSupply(PowerSystemResource):
     """Steam supply for steam turbineSteam supply for steam turbine
@@ -33,8 +34,9 @@ class SteamSupply(PowerSystemResource):
         #: Rating of steam supply
         self.steamSupplyRating = steamSupplyRating
 
-        self._SteamTurbines = []
-        self.SteamTurbines = [] if SteamTurbines is None else SteamTurbines
+        self._SteamTurbines = EMPTY
+        if SteamTurbines is not None:
+            self.SteamTurbines = SteamTurbines
 
         super(SteamSupply, self).__init__(*args, **kw_args)
 
@@ -51,21 +53,28 @@ class SteamSupply(PowerSystemResource):
         return self._SteamTurbines
 
     def setSteamTurbines(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._SteamTurbines:
-            filtered = [q for q in p.SteamSupplys if q != self]
-            self._SteamTurbines._SteamSupplys = filtered
+            p._SteamSupplys.discard(self)
         for r in value:
-            if self not in r._SteamSupplys:
-                r._SteamSupplys.append(self)
+            if r._SteamSupplys is EMPTY:
+                r._SteamSupplys = AssociationList([self])
+            else:
+                r._SteamSupplys.add(self)
         self._SteamTurbines = value
 
     SteamTurbines = property(getSteamTurbines, setSteamTurbines)
 
     def addSteamTurbines(self, *SteamTurbines):
         for obj in SteamTurbines:
-            if self not in obj._SteamSupplys:
-                obj._SteamSupplys.append(self)
-            self._SteamTurbines.append(obj)
+            if obj._SteamSupplys is EMPTY:
+                obj._SteamSupplys = AssociationList([self])
+            else:
+                obj._SteamSupplys.add(self)
+            if self._SteamTurbines is EMPTY:
+                self._SteamTurbines = AssociationList([obj])
+            else:
+                self._SteamTurbines.add(obj)
 
     def removeSteamTurbines(self, *SteamTurbines):
         for obj in SteamTurbines:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Generation.GenerationDynamics.PrimeMover import PrimeMover
+from CIM15.Element import AssociationList, EMPTY
 
 class SteamTurbine(PrimeMover):
     """Steam turbineSteam turbine
@@ -77,8 +78,9 @@ class SteamTurbine(PrimeMover):
         #: Fraction Of Power From Shaft 2 High Pressure Turbine output
         self.shaft2PowerHP = shaft2PowerHP
 
-        self._SteamSupplys = []
-        self.SteamSupplys = [] if SteamSupplys is None else SteamSupplys
+        self._SteamSupplys = EMPTY
+        if SteamSupplys is not None:
+            self.SteamSupplys = SteamSupplys
 
         super(SteamTurbine, self).__init__(*args, **kw_args)
 
@@ -95,21 +97,28 @@ class SteamTurbine(PrimeMover):
         return self._SteamSupplys
 
     def setSteamSupplys(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._SteamSupplys:
-            filtered = [q for q in p.SteamTurbines if q != self]
-            self._SteamSupplys._SteamTurbines = filtered
+            p._SteamTurbines.discard(self)
         for r in value:
-            if self not in r._SteamTurbines:
-                r._SteamTurbines.append(self)
+            if r._SteamTurbines is EMPTY:
+                r._SteamTurbines = AssociationList([self])
+            else:
+                r._SteamTurbines.add(self)
         self._SteamSupplys = value
 
     SteamSupplys = property(getSteamSupplys, setSteamSupplys)
 
     def addSteamSupplys(self, *SteamSupplys):
         for obj in SteamSupplys:
-            if self not in obj._SteamTurbines:
-                obj._SteamTurbines.append(self)
-            self._SteamSupplys.append(obj)
+            if obj._SteamTurbines is EMPTY:
+                obj._SteamTurbines = AssociationList([self])
+            else:
+                obj._SteamTurbines.add(self)
+            if self._SteamSupplys is EMPTY:
+                self._SteamSupplys = AssociationList([obj])
+            else:
+                self._SteamSupplys.add(obj)
 
     def removeSteamSupplys(self, *SteamSupplys):
         for obj in SteamSupplys:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.Curve import Curve
+from CIM15.Element import AssociationList, EMPTY
 
 class EmissionAccount(Curve):
     """Accounts for tracking emissions usage and credits for thermal generating units. A unit may have zero or more emission accounts, and will typically have one for tracking usage and one for tracking credits.Accounts for tracking emissions usage and credits for thermal generating units. A unit may have zero or more emission accounts, and will typically have one for tracking usage and one for tracking credits.
@@ -56,13 +57,14 @@ class EmissionAccount(Curve):
 
     def setThermalGeneratingUnit(self, value):
         if self._ThermalGeneratingUnit is not None:
-            filtered = [x for x in self.ThermalGeneratingUnit.EmmissionAccounts if x != self]
-            self._ThermalGeneratingUnit._EmmissionAccounts = filtered
+            self._ThermalGeneratingUnit._EmmissionAccounts.discard(self)
 
         self._ThermalGeneratingUnit = value
         if self._ThermalGeneratingUnit is not None:
-            if self not in self._ThermalGeneratingUnit._EmmissionAccounts:
-                self._ThermalGeneratingUnit._EmmissionAccounts.append(self)
+            if self._ThermalGeneratingUnit._EmmissionAccounts is EMPTY:
+                self._ThermalGeneratingUnit._EmmissionAccounts = AssociationList([self])
+            else:
+                self._ThermalGeneratingUnit._EmmissionAccounts.add(self)
 
     ThermalGeneratingUnit = property(getThermalGeneratingUnit, setThermalGeneratingUnit)
 
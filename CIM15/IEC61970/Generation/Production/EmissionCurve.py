@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.Curve import Curve
+from CIM15.Element import AssociationList, EMPTY
 
 class EmissionCurve(Curve):
     """Relationship between the unit's emission rate in units of mass per hour (Y-axis) and output active power (X-axis) for a given type of emission. This curve applies when only one type of fuel is being burned.Relationship between the unit's emission rate in units of mass per hour (Y-axis) and output active power (X-axis) for a given type of emission. This curve applies when only one type of fuel is being burned.
@@ -60,13 +61,14 @@ class EmissionCurve(Curve):
 
     def setThermalGeneratingUnit(self, value):
         if self._ThermalGeneratingUnit is not None:
-            filtered = [x for x in self.ThermalGeneratingUnit.EmissionCurves if x != self]
-            self._ThermalGeneratingUnit._EmissionCurves = filtered
+            self._ThermalGeneratingUnit._EmissionCurves.discard(self)
 
         self._ThermalGeneratingUnit = value
         if self._ThermalGeneratingUnit is not None:
-            if self not in self._ThermalGeneratingUnit._EmissionCurves:
-                self._ThermalGeneratingUnit._EmissionCurves.append(self)
+            if self._ThermalGeneratingUnit._EmissionCurves is EMPTY:
+                self._ThermalGeneratingUnit._EmissionCurves = AssociationList([self])
+            else:
+                self._ThermalGeneratingUnit._EmissionCurves.add(self)
 
     ThermalGeneratingUnit = property(getThermalGeneratingUnit, setThermalGeneratingUnit)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class FossilFuel(IdentifiedObject):
     """The fossil fuel consumed by the non-nuclear thermal generating units, e.g., coal, oil, gasThe fossil fuel consumed by the non-nuclear thermal generating units, e.g., coal, oil, gas
@@ -73,8 +74,9 @@ class FossilFuel(IdentifiedObject):
         self._ThermalGeneratingUnit = None
         self.ThermalGeneratingUnit = ThermalGeneratingUnit
 
-        self._FuelAllocationSchedules = []
-        self.FuelAllocationSchedules = [] if FuelAllocationSchedules is None else FuelAllocationSchedules
+        self._FuelAllocationSchedules = EMPTY
+        if FuelAllocationSchedules is not None:
+            self.FuelAllocationSchedules = FuelAllocationSchedules
 
         super(FossilFuel, self).__init__(*args, **kw_args)
 
@@ -92,13 +94,14 @@ class FossilFuel(IdentifiedObject):
 
     def setThermalGeneratingUnit(self, value):
         if self._ThermalGeneratingUnit is not None:
-            filtered = [x for x in self.ThermalGeneratingUnit.FossilFuels if x != self]
-            self._ThermalGeneratingUnit._FossilFuels = filtered
+            self._ThermalGeneratingUnit._FossilFuels.discard(self)
 
         self._ThermalGeneratingUnit = value
         if self._ThermalGeneratingUnit is not None:
-            if self not in self._ThermalGeneratingUnit._FossilFuels:
-                self._ThermalGeneratingUnit._FossilFuels.append(self)
+            if self._ThermalGeneratingUnit._FossilFuels is EMPTY:
+                self._ThermalGeneratingUnit._FossilFuels = AssociationList([self])
+            else:
+                self._ThermalGeneratingUnit._FossilFuels.add(self)
 
     ThermalGeneratingUnit = property(getThermalGeneratingUnit, setThermalGeneratingUnit)
 
@@ -108,6 +111,7 @@ class FossilFuel(IdentifiedObject):
         return self._FuelAllocationSchedules
 
     def setFuelAllocationSchedules(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._FuelAllocationSchedules:
             x.FossilFuel = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.Curve import Curve
+from CIM15.Element import AssociationList, EMPTY
 
 class GenUnitOpCostCurve(Curve):
     """Relationship between unit operating cost (Y-axis) and unit output active power (X-axis). The operating cost curve for thermal units is derived from heat input and fuel costs. The operating cost curve for hydro units is derived from water flow rates and equivalent water costs.Relationship between unit operating cost (Y-axis) and unit output active power (X-axis). The operating cost curve for thermal units is derived from heat input and fuel costs. The operating cost curve for hydro units is derived from water flow rates and equivalent water costs.
@@ -52,13 +53,14 @@ class GenUnitOpCostCurve(Curve):
 
     def setGeneratingUnit(self, value):
         if self._GeneratingUnit is not None:
-            filtered = [x for x in self.GeneratingUnit.GenUnitOpCostCurves if x != self]
-            self._GeneratingUnit._GenUnitOpCostCurves = filtered
+            self._GeneratingUnit._GenUnitOpCostCurves.discard(self)
 
         self._GeneratingUnit = value
         if self._GeneratingUnit is not None:
-            if self not in self._GeneratingUnit._GenUnitOpCostCurves:
-                self._GeneratingUnit._GenUnitOpCostCurves.append(self)
+            if self._GeneratingUnit._GenUnitOpCostCurves is EMPTY:
+                self._GeneratingUnit._GenUnitOpCostCurves = AssociationList([self])
+            else:
+                self._GeneratingUnit._GenUnitOpCostCurves.add(self)
 
     GeneratingUnit = property(getGeneratingUnit, setGeneratingUnit)
 
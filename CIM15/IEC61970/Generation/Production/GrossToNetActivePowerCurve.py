@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.Curve import Curve
+from CIM15.Element import AssociationList, EMPTY
 
 class GrossToNetActivePowerCurve(Curve):
     """Relationship between the generating unit's gross active power output on the X-axis (measured at the terminals of the machine(s)) and the generating unit's net active power output on the Y-axis (based on utility-defined measurements at the power station). Station service loads, when modeled, should be treated as non-conforming bus loads. There may be more than one curve, depending on the auxiliary equipment that is in service.Relationship between the generating unit's gross active power output on the X-axis (measured at the terminals of the machine(s)) and the generating unit's net active power output on the Y-axis (based on utility-defined measurements at the power station). Station service loads, when modeled, should be treated as non-conforming bus loads. There may be more than one curve, depending on the auxiliary equipment that is in service.
@@ -48,13 +49,14 @@ class GrossToNetActivePowerCurve(Curve):
 
     def setGeneratingUnit(self, value):
         if self._GeneratingUnit is not None:
-            filtered = [x for x in self.GeneratingUnit.GrossToNetActivePowerCurves if x != self]
-            self._GeneratingUnit._GrossToNetActivePowerCurves = filtered
+            self._GeneratingUnit._GrossToNetActivePowerCurves.discard(self)
 
         self._GeneratingUnit = value
         if self._GeneratingUnit is not None:
-            if self not in self._GeneratingUnit._GrossToNetActivePowerCurves:
-                self._GeneratingUnit._GrossToNetActivePowerCurves.append(self)
+            if self._GeneratingUnit._GrossToNetActivePowerCurves is EMPTY:
+                self._GeneratingUnit._GrossToNetActivePowerCurves = AssociationList([self])
+            else:
+                self._GeneratingUnit._GrossToNetActivePowerCurves.add(self)
 
     GeneratingUnit = property(getGeneratingUnit, setGeneratingUnit)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.Curve import Curve
+from CIM15.Element import AssociationList, EMPTY
 
 class HydroGeneratingEfficiencyCurve(Curve):
     """Relationship between unit efficiency in percent and unit output active power for a given net head in meters. The relationship between efficiency, discharge, head, and power output is expressed as follows:   E =KP/HQ Where:  (E=percentage)  (P=active power)  (H=height)  (Q=volume/time unit)  (K=constant) For example, a curve instance for a given net head could relate efficiency (Y-axis) versus active power output (X-axis) or versus discharge on the X-axis.Relationship between unit efficiency in percent and unit output active power for a given net head in meters. The relationship between efficiency, discharge, head, and power output is expressed as follows:   E =KP/HQ Where:  (E=percentage)  (P=active power)  (H=height)  (Q=volume/time unit)  (K=constant) For example, a curve instance for a given net head could relate efficiency (Y-axis) versus active power output (X-axis) or versus discharge on the X-axis.
@@ -48,13 +49,14 @@ class HydroGeneratingEfficiencyCurve(Curve):
 
     def setHydroGeneratingUnit(self, value):
         if self._HydroGeneratingUnit is not None:
-            filtered = [x for x in self.HydroGeneratingUnit.HydroGeneratingEfficiencyCurves if x != self]
-            self._HydroGeneratingUnit._HydroGeneratingEfficiencyCurves = filtered
+            self._HydroGeneratingUnit._HydroGeneratingEfficiencyCurves.discard(self)
 
         self._HydroGeneratingUnit = value
         if self._HydroGeneratingUnit is not None:
-            if self not in self._HydroGeneratingUnit._HydroGeneratingEfficiencyCurves:
-                self._HydroGeneratingUnit._HydroGeneratingEfficiencyCurves.append(self)
+            if self._HydroGeneratingUnit._HydroGeneratingEfficiencyCurves is EMPTY:
+                self._HydroGeneratingUnit._HydroGeneratingEfficiencyCurves = AssociationList([self])
+            else:
+                self._HydroGeneratingUnit._HydroGeneratingEfficiencyCurves.add(self)
 
     HydroGeneratingUnit = property(getHydroGeneratingUnit, setHydroGeneratingUnit)
 
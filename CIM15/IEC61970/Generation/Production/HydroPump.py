@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.PowerSystemResource import PowerSystemResource
+from CIM15.Element import AssociationList, EMPTY
 
 class HydroPump(PowerSystemResource):
     """A synchronous motor-driven pump, typically associated with a pumped storage plantA synchronous motor-driven pump, typically associated with a pumped storage plant
@@ -72,13 +73,14 @@ class HydroPump(PowerSystemResource):
 
     def setHydroPowerPlant(self, value):
         if self._HydroPowerPlant is not None:
-            filtered = [x for x in self.HydroPowerPlant.HydroPumps if x != self]
-            self._HydroPowerPlant._HydroPumps = filtered
+            self._HydroPowerPlant._HydroPumps.discard(self)
 
         self._HydroPowerPlant = value
         if self._HydroPowerPlant is not None:
-            if self not in self._HydroPowerPlant._HydroPumps:
-                self._HydroPowerPlant._HydroPumps.append(self)
+            if self._HydroPowerPlant._HydroPumps is EMPTY:
+                self._HydroPowerPlant._HydroPumps = AssociationList([self])
+            else:
+                self._HydroPowerPlant._HydroPumps.add(self)
 
     HydroPowerPlant = property(getHydroPowerPlant, setHydroPowerPlant)
 
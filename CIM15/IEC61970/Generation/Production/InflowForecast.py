@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.RegularIntervalSchedule import RegularIntervalSchedule
+from CIM15.Element import AssociationList, EMPTY
 
 class InflowForecast(RegularIntervalSchedule):
     """Natural water inflow to a reservoir, usually forecasted from predicted rain and snowmelt. Typically in one hour increments for up to 10 days. The forecast is given in average cubic meters per second over the time increment.Natural water inflow to a reservoir, usually forecasted from predicted rain and snowmelt. Typically in one hour increments for up to 10 days. The forecast is given in average cubic meters per second over the time increment.
@@ -48,13 +49,14 @@ class InflowForecast(RegularIntervalSchedule):
 
     def setReservoir(self, value):
         if self._Reservoir is not None:
-            filtered = [x for x in self.Reservoir.InflowForecasts if x != self]
-            self._Reservoir._InflowForecasts = filtered
+            self._Reservoir._InflowForecasts.discard(self)
 
         self._Reservoir = value
         if self._Reservoir is not None:
-            if self not in self._Reservoir._InflowForecasts:
-                self._Reservoir._InflowForecasts.append(self)
+            if self._Reservoir._InflowForecasts is EMPTY:
+                self._Reservoir._InflowForecasts = AssociationList([self])
+            else:
+                self._Reservoir._InflowForecasts.add(self)
 
     Reservoir = property(getReservoir, setReservoir)
 
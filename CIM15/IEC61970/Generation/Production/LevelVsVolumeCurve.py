@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.Curve import Curve
+from CIM15.Element import AssociationList, EMPTY
 
 class LevelVsVolumeCurve(Curve):
     """Relationship between reservoir volume and reservoir level. The  volume is at the y-axis and the reservoir level at the x-axis.Relationship between reservoir volume and reservoir level. The  volume is at the y-axis and the reservoir level at the x-axis.
@@ -48,13 +49,14 @@ class LevelVsVolumeCurve(Curve):
 
     def setReservoir(self, value):
         if self._Reservoir is not None:
-            filtered = [x for x in self.Reservoir.LevelVsVolumeCurves if x != self]
-            self._Reservoir._LevelVsVolumeCurves = filtered
+            self._Reservoir._LevelVsVolumeCurves.discard(self)
 
         self._Reservoir = value
         if self._Reservoir is not None:
-            if self not in self._Reservoir._LevelVsVolumeCurves:
-                self._Reservoir._LevelVsVolumeCurves.append(self)
+            if self._Reservoir._LevelVsVolumeCurves is EMPTY:
+                self._Reservoir._LevelVsVolumeCurves = AssociationList([self])
+            else:
+                self._Reservoir._LevelVsVolumeCurves.add(self)
 
     Reservoir = property(getReservoir, setReservoir)
 
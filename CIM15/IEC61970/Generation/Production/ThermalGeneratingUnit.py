@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Generation.Production.GeneratingUnit import GeneratingUnit
+from CIM15.Element import AssociationList, EMPTY
 
 class ThermalGeneratingUnit(GeneratingUnit):
     """A generating unit whose prime mover could be a steam turbine, combustion turbine, or diesel engine.A generating unit whose prime mover could be a steam turbine, combustion turbine, or diesel engine.
@@ -53,17 +54,20 @@ class ThermalGeneratingUnit(GeneratingUnit):
         self._ShutdownCurve = None
         self.ShutdownCurve = ShutdownCurve
 
-        self._FossilFuels = []
-        self.FossilFuels = [] if FossilFuels is None else FossilFuels
+        self._FossilFuels = EMPTY
+        if FossilFuels is not None:
+            self.FossilFuels = FossilFuels
 
         self._HeatRateCurve = None
         self.HeatRateCurve = HeatRateCurve
 
-        self._FuelAllocationSchedules = []
-        self.FuelAllocationSchedules = [] if FuelAllocationSchedules is None else FuelAllocationSchedules
+        self._FuelAllocationSchedules = EMPTY
+        if FuelAllocationSchedules is not None:
+            self.FuelAllocationSchedules = FuelAllocationSchedules
 
-        self._EmissionCurves = []
-        self.EmissionCurves = [] if EmissionCurves is None else EmissionCurves
+        self._EmissionCurves = EMPTY
+        if EmissionCurves is not None:
+            self.EmissionCurves = EmissionCurves
 
         self._HeatInputCurve = None
         self.HeatInputCurve = HeatInputCurve
@@ -77,8 +81,9 @@ class ThermalGeneratingUnit(GeneratingUnit):
         self._StartupModel = None
         self.StartupModel = StartupModel
 
-        self._EmmissionAccounts = []
-        self.EmmissionAccounts = [] if EmmissionAccounts is None else EmmissionAccounts
+        self._EmmissionAccounts = EMPTY
+        if EmmissionAccounts is not None:
+            self.EmmissionAccounts = EmmissionAccounts
 
         super(ThermalGeneratingUnit, self).__init__(*args, **kw_args)
 
@@ -112,13 +117,14 @@ class ThermalGeneratingUnit(GeneratingUnit):
 
     def setCogenerationPlant(self, value):
         if self._CogenerationPlant is not None:
-            filtered = [x for x in self.CogenerationPlant.ThermalGeneratingUnits if x != self]
-            self._CogenerationPlant._ThermalGeneratingUnits = filtered
+            self._CogenerationPlant._ThermalGeneratingUnits.discard(self)
 
         self._CogenerationPlant = value
         if self._CogenerationPlant is not None:
-            if self not in self._CogenerationPlant._ThermalGeneratingUnits:
-                self._CogenerationPlant._ThermalGeneratingUnits.append(self)
+            if self._CogenerationPlant._ThermalGeneratingUnits is EMPTY:
+                self._CogenerationPlant._ThermalGeneratingUnits = AssociationList([self])
+            else:
+                self._CogenerationPlant._ThermalGeneratingUnits.add(self)
 
     CogenerationPlant = property(getCogenerationPlant, setCogenerationPlant)
 
@@ -144,6 +150,7 @@ class ThermalGeneratingUnit(GeneratingUnit):
         return self._FossilFuels
 
     def setFossilFuels(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._FossilFuels:
             x.ThermalGeneratingUnit = None
         for y in value:
@@ -182,6 +189,7 @@ class ThermalGeneratingUnit(GeneratingUnit):
         return self._FuelAllocationSchedules
 
     def setFuelAllocationSchedules(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._FuelAllocationSchedules:
             x.ThermalGeneratingUnit = None
         for y in value:
@@ -204,6 +212,7 @@ class ThermalGeneratingUnit(GeneratingUnit):
         return self._EmissionCurves
 
     def setEmissionCurves(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._EmissionCurves:
             x.ThermalGeneratingUnit = None
         for y in value:
@@ -243,13 +252,14 @@ class ThermalGeneratingUnit(GeneratingUnit):
 
     def setCombinedCyclePlant(self, value):
         if self._CombinedCyclePlant is not None:
-            filtered = [x for x in self.CombinedCyclePlant.ThermalGeneratingUnits if x != self]
-            self._CombinedCyclePlant._ThermalGeneratingUnits = filtered
+            self._CombinedCyclePlant._ThermalGeneratingUnits.discard(self)
 
         self._CombinedCyclePlant = value
         if self._CombinedCyclePlant is not None:
-            if self not in self._CombinedCyclePlant._ThermalGeneratingUnits:
-                self._CombinedCyclePlant._ThermalGeneratingUnits.append(self)
+            if self._CombinedCyclePlant._ThermalGeneratingUnits is EMPTY:
+                self._CombinedCyclePlant._ThermalGeneratingUnits = AssociationList([self])
+            else:
+                self._CombinedCyclePlant._ThermalGeneratingUnits.add(self)
 
     CombinedCyclePlant = property(getCombinedCyclePlant, setCombinedCyclePlant)
 
@@ -291,6 +301,7 @@ class ThermalGeneratingUnit(GeneratingUnit):
         return self._EmmissionAccounts
 
     def setEmmissionAccounts(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._EmmissionAccounts:
             x.ThermalGeneratingUnit = None
         for y in value:
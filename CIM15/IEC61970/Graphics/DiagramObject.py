@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class DiagramObject(IdentifiedObject):
     """This class defines an object that defines one or more points in a given space. This object can be associated with anything that subclasses Identified Object in IEC 61970-301This class defines an object that defines one or more points in a given space. This object can be associated with anything that subclasses Identified Object in IEC 61970-301
@@ -53,8 +54,9 @@ class DiagramObject(IdentifiedObject):
         #: The drawing order of this element. The higher the number, the later the element is drawn in sequence. This is used to ensure that elements that overlap are rendered in the correct order.
         self.drawingOrder = drawingOrder
 
-        self._VisibilityLayers = []
-        self.VisibilityLayers = [] if VisibilityLayers is None else VisibilityLayers
+        self._VisibilityLayers = EMPTY
+        if VisibilityLayers is not None:
+            self.VisibilityLayers = VisibilityLayers
 
         self._IdentifiedObject = None
         self.IdentifiedObject = IdentifiedObject
@@ -62,8 +64,9 @@ class DiagramObject(IdentifiedObject):
         self._DiagramObjectStyle = None
         self.DiagramObjectStyle = DiagramObjectStyle
 
-        self._DiagramObjectPoints = []
-        self.DiagramObjectPoints = [] if DiagramObjectPoints is None else DiagramObjectPoints
+        self._DiagramObjectPoints = EMPTY
+        if DiagramObjectPoints is not None:
+            self.DiagramObjectPoints = DiagramObjectPoints
 
         self._Diagram = None
         self.Diagram = Diagram
@@ -83,21 +86,28 @@ class DiagramObject(IdentifiedObject):
         return self._VisibilityLayers
 
     def setVisibilityLayers(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._VisibilityLayers:
-            filtered = [q for q in p.DiagramObjects if q != self]
-            self._VisibilityLayers._DiagramObjects = filtered
+            p._DiagramObjects.discard(self)
         for r in value:
-            if self not in r._DiagramObjects:
-                r._DiagramObjects.append(self)
+            if r._DiagramObjects is EMPTY:
+                r._DiagramObjects = AssociationList([self])
+            else:
+                r._DiagramObjects.add(self)
         self._VisibilityLayers = value
 
     VisibilityLayers = property(getVisibilityLayers, setVisibilityLayers)
 
     def addVisibilityLayers(self, *VisibilityLayers):
         for obj in VisibilityLayers:
-            if self not in obj._DiagramObjects:
-                obj._DiagramObjects.append(self)
-            self._VisibilityLayers.append(obj)
+            if obj._DiagramObjects is EMPTY:
+                obj._DiagramObjects = AssociationList([self])
+            else:
+                obj._DiagramObjects.add(self)
+            if self._VisibilityLayers is EMPTY:
+                self._VisibilityLayers = AssociationList([obj])
+            else:
+                self._VisibilityLayers.add(obj)
 
     def removeVisibilityLayers(self, *VisibilityLayers):
         for obj in VisibilityLayers:
@@ -112,13 +122,14 @@ class DiagramObject(IdentifiedObject):
 
     def setIdentifiedObject(self, value):
         if self._IdentifiedObject is not None:
-            filtered = [x for x in self.IdentifiedObject.DiagramObjects if x != self]
-            self._IdentifiedObject._DiagramObjects = filtered
+            self._IdentifiedObject._DiagramObjects.discard(self)
 
         self._IdentifiedObject = value
         if self._IdentifiedObject is not None:
-            if self not in self._IdentifiedObject._DiagramObjects:
-                self._IdentifiedObject._DiagramObjects.append(self)
+            if self._IdentifiedObject._DiagramObjects is EMPTY:
+                self._IdentifiedObject._DiagramObjects = AssociationList([self])
+            else:
+                self._IdentifiedObject._DiagramObjects.add(self)
 
     IdentifiedObject = property(getIdentifiedObject, setIdentifiedObject)
 
@@ -129,13 +140,14 @@ class DiagramObject(IdentifiedObject):
 
     def setDiagramObjectStyle(self, value):
         if self._DiagramObjectStyle is not None:
-            filtered = [x for x in self.DiagramObjectStyle.DiagramObjects if x != self]
-            self._DiagramObjectStyle._DiagramObjects = filtered
+            self._DiagramObjectStyle._DiagramObjects.discard(self)
 
         self._DiagramObjectStyle = value
         if self._DiagramObjectStyle is not None:
-            if self not in self._DiagramObjectStyle._DiagramObjects:
-                self._DiagramObjectStyle._DiagramObjects.append(self)
+            if self._DiagramObjectStyle._DiagramObjects is EMPTY:
+                self._DiagramObjectStyle._DiagramObjects = AssociationList([self])
+            else:
+                self._DiagramObjectStyle._DiagramObjects.add(self)
 
     DiagramObjectStyle = property(getDiagramObjectStyle, setDiagramObjectStyle)
 
@@ -145,6 +157,7 @@ class DiagramObject(IdentifiedObject):
         return self._DiagramObjectPoints
 
     def setDiagramObjectPoints(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._DiagramObjectPoints:
             x.DiagramObject = None
         for y in value:
@@ -168,13 +181,14 @@ class DiagramObject(IdentifiedObject):
 
     def setDiagram(self, value):
         if self._Diagram is not None:
-            filtered = [x for x in self.Diagram.DiagramObjects if x != self]
-            self._Diagram._DiagramObjects = filtered
+            self._Diagram._DiagramObjects.discard(self)
 
         self._Diagram = value
         if self._Diagram is not None:
-            if self not in self._Diagram._DiagramObjects:
-                self._Diagram._DiagramObjects.append(self)
+            if self._Diagram._DiagramObjects is EMPTY:
+                self._Diagram._DiagramObjects = AssociationList([self])
+            else:
+                self._Diagram._DiagramObjects.add(self)
 
     Diagram = property(getDiagram, setDiagram)
 
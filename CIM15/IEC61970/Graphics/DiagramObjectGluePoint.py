@@ -18,7 +18,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from CIM15.Element import Element
+from CIM15.Element import Element, AssociationList, EMPTY
 
 class DiagramObjectGluePoint(Element):
     """This is used for grouping DiagramObjectPoints from different DiagramObjects that are considered to be &lsquo;glued&rsquo; together in a diagram even if they are not at the exact same coordinates.This is used for grouping DiagramObjectPoints from different DiagramObjects that are considered to be &lsquo;glued&rsquo; together in a diagram even if they are not at the exact same coordinates.
@@ -29,8 +29,9 @@ class DiagramObjectGluePoint(Element):
 
         @param DiagramObjectPoints: A diagram object glue point is associated with 2 or more object points that are considered to be 'glued' together.
         """
-        self._DiagramObjectPoints = []
-        self.DiagramObjectPoints = [] if DiagramObjectPoints is None else DiagramObjectPoints
+        self._DiagramObjectPoints = EMPTY
+        if DiagramObjectPoints is not None:
+            self.DiagramObjectPoints = DiagramObjectPoints
 
         super(DiagramObjectGluePoint, self).__init__(*args, **kw_args)
 
@@ -47,6 +48,7 @@ class DiagramObjectGluePoint(Element):
         return self._DiagramObjectPoints
 
     def setDiagramObjectPoints(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._DiagramObjectPoints:
             x.DiagramObjectGluePoint = None
         for y in value:
@@ -18,7 +18,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from CIM15.Element import Element
+from CIM15.Element import Element, AssociationList, EMPTY
 
 class DiagramObjectPoint(Element):
     """A point in a given space defined by 3 coordinates and associated to a DiagramObject.  The coordinates may be positive or negative as the origin does not have to be in the corner of a diagram.  The sequence attribute is used when a DiagramObject has more than one DiagramObjectPoint in which case this defines the drawing order.  A DiagramObject may represent any CIM object. For single line diagrams such objects typically are &bull; analog values &bull; breaker/disconnector &bull; power transformer &bull; transmission lineA point in a given space defined by 3 coordinates and associated to a DiagramObject.  The coordinates may be positive or negative as the origin does not have to be in the corner of a diagram.  The sequence attribute is used when a DiagramObject has more than one DiagramObjectPoint in which case this defines the drawing order.  A DiagramObject may represent any CIM object. For single line diagrams such objects typically are &bull; analog values &bull; breaker/disconnector &bull; power transformer &bull; transmission line
@@ -68,13 +68,14 @@ class DiagramObjectPoint(Element):
 
     def setDiagramObjectGluePoint(self, value):
         if self._DiagramObjectGluePoint is not None:
-            filtered = [x for x in self.DiagramObjectGluePoint.DiagramObjectPoints if x != self]
-            self._DiagramObjectGluePoint._DiagramObjectPoints = filtered
+            self._DiagramObjectGluePoint._DiagramObjectPoints.discard(self)
 
         self._DiagramObjectGluePoint = value
         if self._DiagramObjectGluePoint is not None:
-            if self not in self._DiagramObjectGluePoint._DiagramObjectPoints:
-                self._DiagramObjectGluePoint._DiagramObjectPoints.append(self)
+            if self._DiagramObjectGluePoint._DiagramObjectPoints is EMPTY:
+                self._DiagramObjectGluePoint._DiagramObjectPoints = AssociationList([self])
+            else:
+                self._DiagramObjectGluePoint._DiagramObjectPoints.add(self)
 
     DiagramObjectGluePoint = property(getDiagramObjectGluePoint, setDiagramObjectGluePoint)
 
@@ -85,13 +86,14 @@ class DiagramObjectPoint(Element):
 
     def setDiagramObject(self, value):
         if self._DiagramObject is not None:
-            filtered = [x for x in self.DiagramObject.DiagramObjectPoints if x != self]
-            self._DiagramObject._DiagramObjectPoints = filtered
+            self._DiagramObject._DiagramObjectPoints.discard(self)
 
         self._DiagramObject = value
         if self._DiagramObject is not None:
-            if self not in self._DiagramObject._DiagramObjectPoints:
-                self._DiagramObject._DiagramObjectPoints.append(self)
+            if self._DiagramObject._DiagramObjectPoints is EMPTY:
+                self._DiagramObject._DiagramObjectPoints = AssociationList([self])
+            else:
+                self._DiagramObject._DiagramObjectPoints.add(self)
 
     DiagramObject = property(getDiagramObject, setDiagramObject)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class DiagramObjectStyle(IdentifiedObject):
     """A reference to a style used by the originating system for a DiagramObject.  A DiagramObjectStyle describes information such as  &bull; line thickness &bull; shape, e.g circle, rectangle ... &bull; colorA reference to a style used by the originating system for a DiagramObject.  A DiagramObjectStyle describes information such as  &bull; line thickness &bull; shape, e.g circle, rectangle ... &bull; color
@@ -29,8 +30,9 @@ class DiagramObjectStyle(IdentifiedObject):
 
         @param DiagramObjects: A style can be assigned to multiple DiagramObjects
         """
-        self._DiagramObjects = []
-        self.DiagramObjects = [] if DiagramObjects is None else DiagramObjects
+        self._DiagramObjects = EMPTY
+        if DiagramObjects is not None:
+            self.DiagramObjects = DiagramObjects
 
         super(DiagramObjectStyle, self).__init__(*args, **kw_args)
 
@@ -47,6 +49,7 @@ class DiagramObjectStyle(IdentifiedObject):
         return self._DiagramObjects
 
     def setDiagramObjects(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._DiagramObjects:
             x.DiagramObjectStyle = None
         for y in value:
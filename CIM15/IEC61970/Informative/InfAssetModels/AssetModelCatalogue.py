@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class AssetModelCatalogue(IdentifiedObject):
     """Catalogue of available types of products and materials that are used to build or install, maintain or operate an Asset. Each catalogue item is for a specific product (AssetModel) available from a specific supplier.Catalogue of available types of products and materials that are used to build or install, maintain or operate an Asset. Each catalogue item is for a specific product (AssetModel) available from a specific supplier.
@@ -30,8 +31,9 @@ class AssetModelCatalogue(IdentifiedObject):
         @param AssetModelCatalogueItems:
         @param status:
         """
-        self._AssetModelCatalogueItems = []
-        self.AssetModelCatalogueItems = [] if AssetModelCatalogueItems is None else AssetModelCatalogueItems
+        self._AssetModelCatalogueItems = EMPTY
+        if AssetModelCatalogueItems is not None:
+            self.AssetModelCatalogueItems = AssetModelCatalogueItems
 
         self.status = status
 
@@ -49,6 +51,7 @@ class AssetModelCatalogue(IdentifiedObject):
         return self._AssetModelCatalogueItems
 
     def setAssetModelCatalogueItems(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._AssetModelCatalogueItems:
             x.AssetModelCatalogue = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import AssociationList, EMPTY
 
 class AssetModelCatalogueItem(Document):
     """Provides pricing and other relevant information about a specific manufacturer's product (i.e., AssetModel), and its price from a given supplier. A single AssetModel may be availble from multiple suppliers. Note that manufacturer and supplier are both types of organisation, which the association is inherited from Document.Provides pricing and other relevant information about a specific manufacturer's product (i.e., AssetModel), and its price from a given supplier. A single AssetModel may be availble from multiple suppliers. Note that manufacturer and supplier are both types of organisation, which the association is inherited from Document.
@@ -36,8 +37,9 @@ class AssetModelCatalogueItem(Document):
         #: Unit cost for an asset model from a specific supplier, either for a unit cost or cost per unit length. Cost is for material or asset only and does not include labor to install/construct or configure it.
         self.unitCost = unitCost
 
-        self._ErpPOLineItems = []
-        self.ErpPOLineItems = [] if ErpPOLineItems is None else ErpPOLineItems
+        self._ErpPOLineItems = EMPTY
+        if ErpPOLineItems is not None:
+            self.ErpPOLineItems = ErpPOLineItems
 
         self._AssetModelCatalogue = None
         self.AssetModelCatalogue = AssetModelCatalogue
@@ -45,8 +47,9 @@ class AssetModelCatalogueItem(Document):
         self._AssetModel = None
         self.AssetModel = AssetModel
 
-        self._ErpQuoteLineItems = []
-        self.ErpQuoteLineItems = [] if ErpQuoteLineItems is None else ErpQuoteLineItems
+        self._ErpQuoteLineItems = EMPTY
+        if ErpQuoteLineItems is not None:
+            self.ErpQuoteLineItems = ErpQuoteLineItems
 
         super(AssetModelCatalogueItem, self).__init__(*args, **kw_args)
 
@@ -62,6 +65,7 @@ class AssetModelCatalogueItem(Document):
         return self._ErpPOLineItems
 
     def setErpPOLineItems(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ErpPOLineItems:
             x.AssetModelCatalogueItem = None
         for y in value:
@@ -84,13 +88,14 @@ class AssetModelCatalogueItem(Document):
 
     def setAssetModelCatalogue(self, value):
         if self._AssetModelCatalogue is not None:
-            filtered = [x for x in self.AssetModelCatalogue.AssetModelCatalogueItems if x != self]
-            self._AssetModelCatalogue._AssetModelCatalogueItems = filtered
+            self._AssetModelCatalogue._AssetModelCatalogueItems.discard(self)
 
         self._AssetModelCatalogue = value
         if self._AssetModelCatalogue is not None:
-            if self not in self._AssetModelCatalogue._AssetModelCatalogueItems:
-                self._AssetModelCatalogue._AssetModelCatalogueItems.append(self)
+            if self._AssetModelCatalogue._AssetModelCatalogueItems is EMPTY:
+                self._AssetModelCatalogue._AssetModelCatalogueItems = AssociationList([self])
+            else:
+                self._AssetModelCatalogue._AssetModelCatalogueItems.add(self)
 
     AssetModelCatalogue = property(getAssetModelCatalogue, setAssetModelCatalogue)
 
@@ -100,13 +105,14 @@ class AssetModelCatalogueItem(Document):
 
     def setAssetModel(self, value):
         if self._AssetModel is not None:
-            filtered = [x for x in self.AssetModel.AssetModelCatalogueItems if x != self]
-            self._AssetModel._AssetModelCatalogueItems = filtered
+            self._AssetModel._AssetModelCatalogueItems.discard(self)
 
         self._AssetModel = value
         if self._AssetModel is not None:
-            if self not in self._AssetModel._AssetModelCatalogueItems:
-                self._AssetModel._AssetModelCatalogueItems.append(self)
+            if self._AssetModel._AssetModelCatalogueItems is EMPTY:
+                self._AssetModel._AssetModelCatalogueItems = AssociationList([self])
+            else:
+                self._AssetModel._AssetModelCatalogueItems.add(self)
 
     AssetModel = property(getAssetModel, setAssetModel)
 
@@ -115,6 +121,7 @@ class AssetModelCatalogueItem(Document):
         return self._ErpQuoteLineItems
 
     def setErpQuoteLineItems(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ErpQuoteLineItems:
             x.AssetModelCatalogueItem = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.ProductAssetModel import ProductAssetModel
+from CIM15.Element import AssociationList, EMPTY
 
 class TransformerAssetModel(ProductAssetModel):
     """Documentation for a type of a transformer of a particular product model made by a manufacturer.Documentation for a type of a transformer of a particular product model made by a manufacturer.
@@ -86,8 +87,9 @@ class TransformerAssetModel(ProductAssetModel):
         #: Weight of solid insultation in transformer.
         self.solidInsulationWeight = solidInsulationWeight
 
-        self._TransformerAssets = []
-        self.TransformerAssets = [] if TransformerAssets is None else TransformerAssets
+        self._TransformerAssets = EMPTY
+        if TransformerAssets is not None:
+            self.TransformerAssets = TransformerAssets
 
         self._TransformerInfo = None
         self.TransformerInfo = TransformerInfo
@@ -106,6 +108,7 @@ class TransformerAssetModel(ProductAssetModel):
         return self._TransformerAssets
 
     def setTransformerAssets(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._TransformerAssets:
             x.TransformerAssetModel = None
         for y in value:
@@ -128,13 +131,14 @@ class TransformerAssetModel(ProductAssetModel):
 
     def setTransformerInfo(self, value):
         if self._TransformerInfo is not None:
-            filtered = [x for x in self.TransformerInfo.TransformerAssetModels if x != self]
-            self._TransformerInfo._TransformerAssetModels = filtered
+            self._TransformerInfo._TransformerAssetModels.discard(self)
 
         self._TransformerInfo = value
         if self._TransformerInfo is not None:
-            if self not in self._TransformerInfo._TransformerAssetModels:
-                self._TransformerInfo._TransformerAssetModels.append(self)
+            if self._TransformerInfo._TransformerAssetModels is EMPTY:
+                self._TransformerInfo._TransformerAssetModels = AssociationList([self])
+            else:
+                self._TransformerInfo._TransformerAssetModels.add(self)
 
     TransformerInfo = property(getTransformerInfo, setTransformerInfo)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Informative.InfCommon.Role import Role
+from CIM15.Element import AssociationList, EMPTY
 
 class AssetAssetRole(Role):
     """Roles played between Assets and other Assets.Roles played between Assets and other Assets.
@@ -51,13 +52,14 @@ class AssetAssetRole(Role):
 
     def setToAsset(self, value):
         if self._ToAsset is not None:
-            filtered = [x for x in self.ToAsset.FromAssetRoles if x != self]
-            self._ToAsset._FromAssetRoles = filtered
+            self._ToAsset._FromAssetRoles.discard(self)
 
         self._ToAsset = value
         if self._ToAsset is not None:
-            if self not in self._ToAsset._FromAssetRoles:
-                self._ToAsset._FromAssetRoles.append(self)
+            if self._ToAsset._FromAssetRoles is EMPTY:
+                self._ToAsset._FromAssetRoles = AssociationList([self])
+            else:
+                self._ToAsset._FromAssetRoles.add(self)
 
     ToAsset = property(getToAsset, setToAsset)
 
@@ -67,13 +69,14 @@ class AssetAssetRole(Role):
 
     def setFromAsset(self, value):
         if self._FromAsset is not None:
-            filtered = [x for x in self.FromAsset.ToAssetRoles if x != self]
-            self._FromAsset._ToAssetRoles = filtered
+            self._FromAsset._ToAssetRoles.discard(self)
 
         self._FromAsset = value
         if self._FromAsset is not None:
-            if self not in self._FromAsset._ToAssetRoles:
-                self._FromAsset._ToAssetRoles.append(self)
+            if self._FromAsset._ToAssetRoles is EMPTY:
+                self._FromAsset._ToAssetRoles = AssociationList([self])
+            else:
+                self._FromAsset._ToAssetRoles.add(self)
 
     FromAsset = property(getFromAsset, setFromAsset)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.Curve import Curve
+from CIM15.Element import AssociationList, EMPTY
 
 class AssetPropertyCurve(Curve):
     """An Asset Property that is described through curves rather than as a data point. The relationship is to be defined between an independent variable (X-axis) and one or two dependent variables (Y1-axis and Y2-axis).An Asset Property that is described through curves rather than as a data point. The relationship is to be defined between an independent variable (X-axis) and one or two dependent variables (Y1-axis and Y2-axis).
@@ -33,8 +34,9 @@ class AssetPropertyCurve(Curve):
         self._Specification = None
         self.Specification = Specification
 
-        self._Assets = []
-        self.Assets = [] if Assets is None else Assets
+        self._Assets = EMPTY
+        if Assets is not None:
+            self.Assets = Assets
 
         super(AssetPropertyCurve, self).__init__(*args, **kw_args)
 
@@ -51,13 +53,14 @@ class AssetPropertyCurve(Curve):
 
     def setSpecification(self, value):
         if self._Specification is not None:
-            filtered = [x for x in self.Specification.AssetPropertyCurves if x != self]
-            self._Specification._AssetPropertyCurves = filtered
+            self._Specification._AssetPropertyCurves.discard(self)
 
         self._Specification = value
         if self._Specification is not None:
-            if self not in self._Specification._AssetPropertyCurves:
-                self._Specification._AssetPropertyCurves.append(self)
+            if self._Specification._AssetPropertyCurves is EMPTY:
+                self._Specification._AssetPropertyCurves = AssociationList([self])
+            else:
+                self._Specification._AssetPropertyCurves.add(self)
 
     Specification = property(getSpecification, setSpecification)
 
@@ -66,21 +69,28 @@ class AssetPropertyCurve(Curve):
         return self._Assets
 
     def setAssets(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Assets:
-            filtered = [q for q in p.AssetPropertyCurves if q != self]
-            self._Assets._AssetPropertyCurves = filtered
+            p._AssetPropertyCurves.discard(self)
         for r in value:
-            if self not in r._AssetPropertyCurves:
-                r._AssetPropertyCurves.append(self)
+            if r._AssetPropertyCurves is EMPTY:
+                r._AssetPropertyCurves = AssociationList([self])
+            else:
+                r._AssetPropertyCurves.add(self)
         self._Assets = value
 
     Assets = property(getAssets, setAssets)
 
     def addAssets(self, *Assets):
         for obj in Assets:
-            if self not in obj._AssetPropertyCurves:
-                obj._AssetPropertyCurves.append(self)
-            self._Assets.append(obj)
+            if obj._AssetPropertyCurves is EMPTY:
+                obj._AssetPropertyCurves = AssociationList([self])
+            else:
+                obj._AssetPropertyCurves.add(self)
+            if self._Assets is EMPTY:
+                self._Assets = AssociationList([obj])
+            else:
+                self._Assets.add(obj)
 
     def removeAssets(self, *Assets):
         for obj in Assets:
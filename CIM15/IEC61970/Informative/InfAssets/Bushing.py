@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.Asset import Asset
+from CIM15.Element import AssociationList, EMPTY
 
 class Bushing(Asset):
     """Bushing asset.Bushing asset.
@@ -53,8 +54,9 @@ class Bushing(Asset):
         self._Terminal = None
         self.Terminal = Terminal
 
-        self._BushingInsulationPFs = []
-        self.BushingInsulationPFs = [] if BushingInsulationPFs is None else BushingInsulationPFs
+        self._BushingInsulationPFs = EMPTY
+        if BushingInsulationPFs is not None:
+            self.BushingInsulationPFs = BushingInsulationPFs
 
         super(Bushing, self).__init__(*args, **kw_args)
 
@@ -85,6 +87,7 @@ class Bushing(Asset):
         return self._BushingInsulationPFs
 
     def setBushingInsulationPFs(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._BushingInsulationPFs:
             x.BushingInfo = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class BushingInsulationPF(IdentifiedObject):
     """Bushing insulation power factor condition as a result of a test. Typical status values are: Acceptable, Minor Deterioration or Moisture Absorption, Major Deterioration or Moisture Absorption, Failed.Bushing insulation power factor condition as a result of a test. Typical status values are: Acceptable, Minor Deterioration or Moisture Absorption, Major Deterioration or Moisture Absorption, Failed.
@@ -60,13 +61,14 @@ class BushingInsulationPF(IdentifiedObject):
 
     def setTransformerObservation(self, value):
         if self._TransformerObservation is not None:
-            filtered = [x for x in self.TransformerObservation.BushingInsultationPFs if x != self]
-            self._TransformerObservation._BushingInsultationPFs = filtered
+            self._TransformerObservation._BushingInsultationPFs.discard(self)
 
         self._TransformerObservation = value
         if self._TransformerObservation is not None:
-            if self not in self._TransformerObservation._BushingInsultationPFs:
-                self._TransformerObservation._BushingInsultationPFs.append(self)
+            if self._TransformerObservation._BushingInsultationPFs is EMPTY:
+                self._TransformerObservation._BushingInsultationPFs = AssociationList([self])
+            else:
+                self._TransformerObservation._BushingInsultationPFs.add(self)
 
     TransformerObservation = property(getTransformerObservation, setTransformerObservation)
 
@@ -76,13 +78,14 @@ class BushingInsulationPF(IdentifiedObject):
 
     def setBushingInfo(self, value):
         if self._BushingInfo is not None:
-            filtered = [x for x in self.BushingInfo.BushingInsulationPFs if x != self]
-            self._BushingInfo._BushingInsulationPFs = filtered
+            self._BushingInfo._BushingInsulationPFs.discard(self)
 
         self._BushingInfo = value
         if self._BushingInfo is not None:
-            if self not in self._BushingInfo._BushingInsulationPFs:
-                self._BushingInfo._BushingInsulationPFs.append(self)
+            if self._BushingInfo._BushingInsulationPFs is EMPTY:
+                self._BushingInfo._BushingInsulationPFs = AssociationList([self])
+            else:
+                self._BushingInfo._BushingInsulationPFs.add(self)
 
     BushingInfo = property(getBushingInfo, setBushingInfo)
 
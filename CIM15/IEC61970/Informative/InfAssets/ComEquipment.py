@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.Asset import Asset
+from CIM15.Element import AssociationList, EMPTY
 
 class ComEquipment(Asset):
     """Communicaiton equipment assets other than media (such as gateways, routers, controllers, etc.).Communicaiton equipment assets other than media (such as gateways, routers, controllers, etc.).
@@ -29,8 +30,9 @@ class ComEquipment(Asset):
 
         @param EndDeviceFunctions: All device functions of this communication equipment.
         """
-        self._EndDeviceFunctions = []
-        self.EndDeviceFunctions = [] if EndDeviceFunctions is None else EndDeviceFunctions
+        self._EndDeviceFunctions = EMPTY
+        if EndDeviceFunctions is not None:
+            self.EndDeviceFunctions = EndDeviceFunctions
 
         super(ComEquipment, self).__init__(*args, **kw_args)
 
@@ -47,6 +49,7 @@ class ComEquipment(Asset):
         return self._EndDeviceFunctions
 
     def setEndDeviceFunctions(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._EndDeviceFunctions:
             x.ComEquipment = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.Asset import Asset
+from CIM15.Element import AssociationList, EMPTY
 
 class ConductorAsset(Asset):
     """Physical asset used to perform the conductor's role.Physical asset used to perform the conductor's role.
@@ -63,13 +64,14 @@ class ConductorAsset(Asset):
 
     def setCircuitSection(self, value):
         if self._CircuitSection is not None:
-            filtered = [x for x in self.CircuitSection.ConductorAssets if x != self]
-            self._CircuitSection._ConductorAssets = filtered
+            self._CircuitSection._ConductorAssets.discard(self)
 
         self._CircuitSection = value
         if self._CircuitSection is not None:
-            if self not in self._CircuitSection._ConductorAssets:
-                self._CircuitSection._ConductorAssets.append(self)
+            if self._CircuitSection._ConductorAssets is EMPTY:
+                self._CircuitSection._ConductorAssets = AssociationList([self])
+            else:
+                self._CircuitSection._ConductorAssets.add(self)
 
     CircuitSection = property(getCircuitSection, setCircuitSection)
 
@@ -79,13 +81,14 @@ class ConductorAsset(Asset):
 
     def setConductorSegment(self, value):
         if self._ConductorSegment is not None:
-            filtered = [x for x in self.ConductorSegment.ConductorAssets if x != self]
-            self._ConductorSegment._ConductorAssets = filtered
+            self._ConductorSegment._ConductorAssets.discard(self)
 
         self._ConductorSegment = value
         if self._ConductorSegment is not None:
-            if self not in self._ConductorSegment._ConductorAssets:
-                self._ConductorSegment._ConductorAssets.append(self)
+            if self._ConductorSegment._ConductorAssets is EMPTY:
+                self._ConductorSegment._ConductorAssets = AssociationList([self])
+            else:
+                self._ConductorSegment._ConductorAssets.add(self)
 
     ConductorSegment = property(getConductorSegment, setConductorSegment)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.AssetInfo import AssetInfo
+from CIM15.Element import AssociationList, EMPTY
 
 class CurrentTransformerInfo(AssetInfo):
     """Properties of current transformer asset.Properties of current transformer asset.
@@ -82,8 +83,9 @@ class CurrentTransformerInfo(AssetInfo):
 
         self.secondaryRatio = secondaryRatio
 
-        self._CTs = []
-        self.CTs = [] if CTs is None else CTs
+        self._CTs = EMPTY
+        if CTs is not None:
+            self.CTs = CTs
 
         self.tertiaryRatio = tertiaryRatio
 
@@ -112,6 +114,7 @@ class CurrentTransformerInfo(AssetInfo):
         return self._CTs
 
     def setCTs(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._CTs:
             x.CTInfo = None
         for y in value:
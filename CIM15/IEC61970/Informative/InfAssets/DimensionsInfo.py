@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class DimensionsInfo(IdentifiedObject):
     """As applicable, the basic linear, area, or volume dimensions of an asset, asset type (AssetModel) or other type of object (such as land area). Units and multipliers are specified per dimension.As applicable, the basic linear, area, or volume dimensions of an asset, asset type (AssetModel) or other type of object (such as land area). Units and multipliers are specified per dimension.
@@ -51,14 +52,17 @@ class DimensionsInfo(IdentifiedObject):
         #: Depth measurement.
         self.sizeDepth = sizeDepth
 
-        self._Locations = []
-        self.Locations = [] if Locations is None else Locations
+        self._Locations = EMPTY
+        if Locations is not None:
+            self.Locations = Locations
 
-        self._AssetInfos = []
-        self.AssetInfos = [] if AssetInfos is None else AssetInfos
+        self._AssetInfos = EMPTY
+        if AssetInfos is not None:
+            self.AssetInfos = AssetInfos
 
-        self._Specifications = []
-        self.Specifications = [] if Specifications is None else Specifications
+        self._Specifications = EMPTY
+        if Specifications is not None:
+            self.Specifications = Specifications
 
         super(DimensionsInfo, self).__init__(*args, **kw_args)
 
@@ -74,6 +78,7 @@ class DimensionsInfo(IdentifiedObject):
         return self._Locations
 
     def setLocations(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Locations:
             x.DimensionsInfo = None
         for y in value:
@@ -95,6 +100,7 @@ class DimensionsInfo(IdentifiedObject):
         return self._AssetInfos
 
     def setAssetInfos(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._AssetInfos:
             x.DimensionsInfo = None
         for y in value:
@@ -116,21 +122,28 @@ class DimensionsInfo(IdentifiedObject):
         return self._Specifications
 
     def setSpecifications(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Specifications:
-            filtered = [q for q in p.DimensionsInfos if q != self]
-            self._Specifications._DimensionsInfos = filtered
+            p._DimensionsInfos.discard(self)
         for r in value:
-            if self not in r._DimensionsInfos:
-                r._DimensionsInfos.append(self)
+            if r._DimensionsInfos is EMPTY:
+                r._DimensionsInfos = AssociationList([self])
+            else:
+                r._DimensionsInfos.add(self)
         self._Specifications = value
 
     Specifications = property(getSpecifications, setSpecifications)
 
     def addSpecifications(self, *Specifications):
         for obj in Specifications:
-            if self not in obj._DimensionsInfos:
-                obj._DimensionsInfos.append(self)
-            self._Specifications.append(obj)
+            if obj._DimensionsInfos is EMPTY:
+                obj._DimensionsInfos = AssociationList([self])
+            else:
+                obj._DimensionsInfos.add(self)
+            if self._Specifications is EMPTY:
+                self._Specifications = AssociationList([obj])
+            else:
+                self._Specifications.add(obj)
 
     def removeSpecifications(self, *Specifications):
         for obj in Specifications:
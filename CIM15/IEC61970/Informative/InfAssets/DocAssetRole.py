@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Informative.InfCommon.Role import Role
+from CIM15.Element import AssociationList, EMPTY
 
 class DocAssetRole(Role):
     """Roles played between Documents and Assets.Roles played between Documents and Assets.
@@ -51,13 +52,14 @@ class DocAssetRole(Role):
 
     def setDocument(self, value):
         if self._Document is not None:
-            filtered = [x for x in self.Document.AssetRoles if x != self]
-            self._Document._AssetRoles = filtered
+            self._Document._AssetRoles.discard(self)
 
         self._Document = value
         if self._Document is not None:
-            if self not in self._Document._AssetRoles:
-                self._Document._AssetRoles.append(self)
+            if self._Document._AssetRoles is EMPTY:
+                self._Document._AssetRoles = AssociationList([self])
+            else:
+                self._Document._AssetRoles.add(self)
 
     Document = property(getDocument, setDocument)
 
@@ -67,13 +69,14 @@ class DocAssetRole(Role):
 
     def setAsset(self, value):
         if self._Asset is not None:
-            filtered = [x for x in self.Asset.DocumentRoles if x != self]
-            self._Asset._DocumentRoles = filtered
+            self._Asset._DocumentRoles.discard(self)
 
         self._Asset = value
         if self._Asset is not None:
-            if self not in self._Asset._DocumentRoles:
-                self._Asset._DocumentRoles.append(self)
+            if self._Asset._DocumentRoles is EMPTY:
+                self._Asset._DocumentRoles = AssociationList([self])
+            else:
+                self._Asset._DocumentRoles.add(self)
 
     Asset = property(getAsset, setAsset)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.AssetContainer import AssetContainer
+from CIM15.Element import AssociationList, EMPTY
 
 class Duct(AssetContainer):
     """A Duct contains underground cables and is contained within a duct bank. The xCoord and yCoord attributes define its positioning within the DuctBank.A Duct contains underground cables and is contained within a duct bank. The xCoord and yCoord attributes define its positioning within the DuctBank.
@@ -41,8 +42,9 @@ class Duct(AssetContainer):
         self._DuctBankInfo = None
         self.DuctBankInfo = DuctBankInfo
 
-        self._CableInfos = []
-        self.CableInfos = [] if CableInfos is None else CableInfos
+        self._CableInfos = EMPTY
+        if CableInfos is not None:
+            self.CableInfos = CableInfos
 
         super(Duct, self).__init__(*args, **kw_args)
 
@@ -59,13 +61,14 @@ class Duct(AssetContainer):
 
     def setDuctBankInfo(self, value):
         if self._DuctBankInfo is not None:
-            filtered = [x for x in self.DuctBankInfo.DuctInfos if x != self]
-            self._DuctBankInfo._DuctInfos = filtered
+            self._DuctBankInfo._DuctInfos.discard(self)
 
         self._DuctBankInfo = value
         if self._DuctBankInfo is not None:
-            if self not in self._DuctBankInfo._DuctInfos:
-                self._DuctBankInfo._DuctInfos.append(self)
+            if self._DuctBankInfo._DuctInfos is EMPTY:
+                self._DuctBankInfo._DuctInfos = AssociationList([self])
+            else:
+                self._DuctBankInfo._DuctInfos.add(self)
 
     DuctBankInfo = property(getDuctBankInfo, setDuctBankInfo)
 
@@ -74,6 +77,7 @@ class Duct(AssetContainer):
         return self._CableInfos
 
     def setCableInfos(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._CableInfos:
             x.DuctBankInfo = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.AssetInfo import AssetInfo
+from CIM15.Element import AssociationList, EMPTY
 
 class FaultIndicatorInfo(AssetInfo):
     """Parameters of fault indicator asset.Parameters of fault indicator asset.
@@ -33,8 +34,9 @@ class FaultIndicatorInfo(AssetInfo):
         #: Kind of reset mechanisim of this fault indicator. Values are: "automatic", "other", "remote", "manual"
         self.resetKind = resetKind
 
-        self._FaultIndicators = []
-        self.FaultIndicators = [] if FaultIndicators is None else FaultIndicators
+        self._FaultIndicators = EMPTY
+        if FaultIndicators is not None:
+            self.FaultIndicators = FaultIndicators
 
         super(FaultIndicatorInfo, self).__init__(*args, **kw_args)
 
@@ -51,6 +53,7 @@ class FaultIndicatorInfo(AssetInfo):
         return self._FaultIndicators
 
     def setFaultIndicators(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._FaultIndicators:
             x.FaultIndicatorInfo = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.AssetModel import AssetModel
+from CIM15.Element import AssociationList, EMPTY
 
 class GenericAssetModelOrMaterial(AssetModel):
     """Generic asset or material item that may be used for planning, work or design purposes.Generic asset or material item that may be used for planning, work or design purposes.
@@ -47,14 +48,17 @@ class GenericAssetModelOrMaterial(AssetModel):
         #: The value, unit of measure, and multiplier for the quantity.
         self.quantity = quantity
 
-        self._ErpReqLineItems = []
-        self.ErpReqLineItems = [] if ErpReqLineItems is None else ErpReqLineItems
+        self._ErpReqLineItems = EMPTY
+        if ErpReqLineItems is not None:
+            self.ErpReqLineItems = ErpReqLineItems
 
-        self._ProductAssetModels = []
-        self.ProductAssetModels = [] if ProductAssetModels is None else ProductAssetModels
+        self._ProductAssetModels = EMPTY
+        if ProductAssetModels is not None:
+            self.ProductAssetModels = ProductAssetModels
 
-        self._ErpInventoryIssues = []
-        self.ErpInventoryIssues = [] if ErpInventoryIssues is None else ErpInventoryIssues
+        self._ErpInventoryIssues = EMPTY
+        if ErpInventoryIssues is not None:
+            self.ErpInventoryIssues = ErpInventoryIssues
 
         self._CUWorkEquipmentAsset = None
         self.CUWorkEquipmentAsset = CUWorkEquipmentAsset
@@ -65,8 +69,9 @@ class GenericAssetModelOrMaterial(AssetModel):
         self._CUAsset = None
         self.CUAsset = CUAsset
 
-        self._ErpBomItemDatas = []
-        self.ErpBomItemDatas = [] if ErpBomItemDatas is None else ErpBomItemDatas
+        self._ErpBomItemDatas = EMPTY
+        if ErpBomItemDatas is not None:
+            self.ErpBomItemDatas = ErpBomItemDatas
 
         super(GenericAssetModelOrMaterial, self).__init__(*args, **kw_args)
 
@@ -82,6 +87,7 @@ class GenericAssetModelOrMaterial(AssetModel):
         return self._ErpReqLineItems
 
     def setErpReqLineItems(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ErpReqLineItems:
             x.TypeAsset = None
         for y in value:
@@ -104,6 +110,7 @@ class GenericAssetModelOrMaterial(AssetModel):
         return self._ProductAssetModels
 
     def setProductAssetModels(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ProductAssetModels:
             x.GenericAssetModelOrMaterial = None
         for y in value:
@@ -125,6 +132,7 @@ class GenericAssetModelOrMaterial(AssetModel):
         return self._ErpInventoryIssues
 
     def setErpInventoryIssues(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ErpInventoryIssues:
             x.TypeAsset = None
         for y in value:
@@ -162,13 +170,14 @@ class GenericAssetModelOrMaterial(AssetModel):
 
     def setTypeAssetCatalogue(self, value):
         if self._TypeAssetCatalogue is not None:
-            filtered = [x for x in self.TypeAssetCatalogue.TypeAssets if x != self]
-            self._TypeAssetCatalogue._TypeAssets = filtered
+            self._TypeAssetCatalogue._TypeAssets.discard(self)
 
         self._TypeAssetCatalogue = value
         if self._TypeAssetCatalogue is not None:
-            if self not in self._TypeAssetCatalogue._TypeAssets:
-                self._TypeAssetCatalogue._TypeAssets.append(self)
+            if self._TypeAssetCatalogue._TypeAssets is EMPTY:
+                self._TypeAssetCatalogue._TypeAssets = AssociationList([self])
+            else:
+                self._TypeAssetCatalogue._TypeAssets.add(self)
 
     TypeAssetCatalogue = property(getTypeAssetCatalogue, setTypeAssetCatalogue)
 
@@ -192,6 +201,7 @@ class GenericAssetModelOrMaterial(AssetModel):
         return self._ErpBomItemDatas
 
     def setErpBomItemDatas(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ErpBomItemDatas:
             x.TypeAsset = None
         for y in value:
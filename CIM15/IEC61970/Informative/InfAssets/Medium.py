@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class Medium(IdentifiedObject):
     """A substance that either (1) provides the means of transmission of a force or effect, such as hydraulic fluid, or (2) is used for a surrounding or enveloping substance, such as oil in a transformer or circuit breaker.A substance that either (1) provides the means of transmission of a force or effect, such as hydraulic fluid, or (2) is used for a surrounding or enveloping substance, such as oil in a transformer or circuit breaker.
@@ -41,8 +42,9 @@ class Medium(IdentifiedObject):
         self._Specification = None
         self.Specification = Specification
 
-        self._Assets = []
-        self.Assets = [] if Assets is None else Assets
+        self._Assets = EMPTY
+        if Assets is not None:
+            self.Assets = Assets
 
         super(Medium, self).__init__(*args, **kw_args)
 
@@ -59,13 +61,14 @@ class Medium(IdentifiedObject):
 
     def setSpecification(self, value):
         if self._Specification is not None:
-            filtered = [x for x in self.Specification.Mediums if x != self]
-            self._Specification._Mediums = filtered
+            self._Specification._Mediums.discard(self)
 
         self._Specification = value
         if self._Specification is not None:
-            if self not in self._Specification._Mediums:
-                self._Specification._Mediums.append(self)
+            if self._Specification._Mediums is EMPTY:
+                self._Specification._Mediums = AssociationList([self])
+            else:
+                self._Specification._Mediums.add(self)
 
     Specification = property(getSpecification, setSpecification)
 
@@ -74,21 +77,28 @@ class Medium(IdentifiedObject):
         return self._Assets
 
     def setAssets(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Assets:
-            filtered = [q for q in p.Mediums if q != self]
-            self._Assets._Mediums = filtered
+            p._Mediums.discard(self)
         for r in value:
-            if self not in r._Mediums:
-                r._Mediums.append(self)
+            if r._Mediums is EMPTY:
+                r._Mediums = AssociationList([self])
+            else:
+                r._Mediums.add(self)
         self._Assets = value
 
     Assets = property(getAssets, setAssets)
 
     def addAssets(self, *Assets):
         for obj in Assets:
-            if self not in obj._Mediums:
-                obj._Mediums.append(self)
-            self._Assets.append(obj)
+            if obj._Mediums is EMPTY:
+                obj._Mediums = AssociationList([self])
+            else:
+                obj._Mediums.add(self)
+            if self._Assets is EMPTY:
+                self._Assets = AssociationList([obj])
+            else:
+                self._Assets.add(obj)
 
     def removeAssets(self, *Assets):
         for obj in Assets:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class MountingConnection(IdentifiedObject):
     """A structure can have multiple connection points for electrical connections (e.g. line) each with multiple mounting points, one for each phase. e.g. a Tower may have three Connections, two with three mounting points, one for each phase and a third with a single mounting point for the neutral line. A pole, on the other hand, may have a single Connection with one, two or three mounting points depending on whether it is carrying 1,2 or 3 phases.A structure can have multiple connection points for electrical connections (e.g. line) each with multiple mounting points, one for each phase. e.g. a Tower may have three Connections, two with three mounting points, one for each phase and a third with a single mounting point for the neutral line. A pole, on the other hand, may have a single Connection with one, two or three mounting points depending on whether it is carrying 1,2 or 3 phases.
@@ -30,11 +31,13 @@ class MountingConnection(IdentifiedObject):
         @param StructureInfos:
         @param MountingPoints:
         """
-        self._StructureInfos = []
-        self.StructureInfos = [] if StructureInfos is None else StructureInfos
+        self._StructureInfos = EMPTY
+        if StructureInfos is not None:
+            self.StructureInfos = StructureInfos
 
-        self._MountingPoints = []
-        self.MountingPoints = [] if MountingPoints is None else MountingPoints
+        self._MountingPoints = EMPTY
+        if MountingPoints is not None:
+            self.MountingPoints = MountingPoints
 
         super(MountingConnection, self).__init__(*args, **kw_args)
 
@@ -50,21 +53,28 @@ class MountingConnection(IdentifiedObject):
         return self._StructureInfos
 
     def setStructureInfos(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._StructureInfos:
-            filtered = [q for q in p.MountingConnections if q != self]
-            self._StructureInfos._MountingConnections = filtered
+            p._MountingConnections.discard(self)
         for r in value:
-            if self not in r._MountingConnections:
-                r._MountingConnections.append(self)
+            if r._MountingConnections is EMPTY:
+                r._MountingConnections = AssociationList([self])
+            else:
+                r._MountingConnections.add(self)
         self._StructureInfos = value
 
     StructureInfos = property(getStructureInfos, setStructureInfos)
 
     def addStructureInfos(self, *StructureInfos):
         for obj in StructureInfos:
-            if self not in obj._MountingConnections:
-                obj._MountingConnections.append(self)
-            self._StructureInfos.append(obj)
+            if obj._MountingConnections is EMPTY:
+                obj._MountingConnections = AssociationList([self])
+            else:
+                obj._MountingConnections.add(self)
+            if self._StructureInfos is EMPTY:
+                self._StructureInfos = AssociationList([obj])
+            else:
+                self._StructureInfos.add(obj)
 
     def removeStructureInfos(self, *StructureInfos):
         for obj in StructureInfos:
@@ -77,21 +87,28 @@ class MountingConnection(IdentifiedObject):
         return self._MountingPoints
 
     def setMountingPoints(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._MountingPoints:
-            filtered = [q for q in p.Connections if q != self]
-            self._MountingPoints._Connections = filtered
+            p._Connections.discard(self)
         for r in value:
-            if self not in r._Connections:
-                r._Connections.append(self)
+            if r._Connections is EMPTY:
+                r._Connections = AssociationList([self])
+            else:
+                r._Connections.add(self)
         self._MountingPoints = value
 
     MountingPoints = property(getMountingPoints, setMountingPoints)
 
     def addMountingPoints(self, *MountingPoints):
         for obj in MountingPoints:
-            if self not in obj._Connections:
-                obj._Connections.append(self)
-            self._MountingPoints.append(obj)
+            if obj._Connections is EMPTY:
+                obj._Connections = AssociationList([self])
+            else:
+                obj._Connections.add(self)
+            if self._MountingPoints is EMPTY:
+                self._MountingPoints = AssociationList([obj])
+            else:
+                self._MountingPoints.add(obj)
 
     def removeMountingPoints(self, *MountingPoints):
         for obj in MountingPoints:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class MountingPoint(IdentifiedObject):
     """Point on a structure that a connection may have a conductor connected to. Defined with an x and y coordinate plus a phase. A connection may have multiple mounting points, one for each phase.Point on a structure that a connection may have a conductor connected to. Defined with an x and y coordinate plus a phase. A connection may have multiple mounting points, one for each phase.
@@ -42,11 +43,13 @@ class MountingPoint(IdentifiedObject):
 
         self.yCoord = yCoord
 
-        self._Connections = []
-        self.Connections = [] if Connections is None else Connections
+        self._Connections = EMPTY
+        if Connections is not None:
+            self.Connections = Connections
 
-        self._OverheadConductors = []
-        self.OverheadConductors = [] if OverheadConductors is None else OverheadConductors
+        self._OverheadConductors = EMPTY
+        if OverheadConductors is not None:
+            self.OverheadConductors = OverheadConductors
 
         super(MountingPoint, self).__init__(*args, **kw_args)
 
@@ -62,21 +65,28 @@ class MountingPoint(IdentifiedObject):
         return self._Connections
 
     def setConnections(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Connections:
-            filtered = [q for q in p.MountingPoints if q != self]
-            self._Connections._MountingPoints = filtered
+            p._MountingPoints.discard(self)
         for r in value:
-            if self not in r._MountingPoints:
-                r._MountingPoints.append(self)
+            if r._MountingPoints is EMPTY:
+                r._MountingPoints = AssociationList([self])
+            else:
+                r._MountingPoints.add(self)
         self._Connections = value
 
     Connections = property(getConnections, setConnections)
 
     def addConnections(self, *Connections):
         for obj in Connections:
-            if self not in obj._MountingPoints:
-                obj._MountingPoints.append(self)
-            self._Connections.append(obj)
+            if obj._MountingPoints is EMPTY:
+                obj._MountingPoints = AssociationList([self])
+            else:
+                obj._MountingPoints.add(self)
+            if self._Connections is EMPTY:
+                self._Connections = AssociationList([obj])
+            else:
+                self._Connections.add(obj)
 
     def removeConnections(self, *Connections):
         for obj in Connections:
@@ -89,6 +99,7 @@ class MountingPoint(IdentifiedObject):
         return self._OverheadConductors
 
     def setOverheadConductors(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._OverheadConductors:
             x.MountingPoint = None
         for y in value:
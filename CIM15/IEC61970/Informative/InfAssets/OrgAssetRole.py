@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Informative.InfCommon.Role import Role
+from CIM15.Element import AssociationList, EMPTY
 
 class OrgAssetRole(Role):
     """The roles played between an Organisations and an Asset.The roles played between an Organisations and an Asset.
@@ -55,13 +56,14 @@ class OrgAssetRole(Role):
 
     def setErpOrganisation(self, value):
         if self._ErpOrganisation is not None:
-            filtered = [x for x in self.ErpOrganisation.AssetRoles if x != self]
-            self._ErpOrganisation._AssetRoles = filtered
+            self._ErpOrganisation._AssetRoles.discard(self)
 
         self._ErpOrganisation = value
         if self._ErpOrganisation is not None:
-            if self not in self._ErpOrganisation._AssetRoles:
-                self._ErpOrganisation._AssetRoles.append(self)
+            if self._ErpOrganisation._AssetRoles is EMPTY:
+                self._ErpOrganisation._AssetRoles = AssociationList([self])
+            else:
+                self._ErpOrganisation._AssetRoles.add(self)
 
     ErpOrganisation = property(getErpOrganisation, setErpOrganisation)
 
@@ -71,13 +73,14 @@ class OrgAssetRole(Role):
 
     def setAsset(self, value):
         if self._Asset is not None:
-            filtered = [x for x in self.Asset.ErpOrganisationRoles if x != self]
-            self._Asset._ErpOrganisationRoles = filtered
+            self._Asset._ErpOrganisationRoles.discard(self)
 
         self._Asset = value
         if self._Asset is not None:
-            if self not in self._Asset._ErpOrganisationRoles:
-                self._Asset._ErpOrganisationRoles.append(self)
+            if self._Asset._ErpOrganisationRoles is EMPTY:
+                self._Asset._ErpOrganisationRoles = AssociationList([self])
+            else:
+                self._Asset._ErpOrganisationRoles.add(self)
 
     Asset = property(getAsset, setAsset)
 
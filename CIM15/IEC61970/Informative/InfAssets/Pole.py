@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Informative.InfAssets.Structure import Structure
+from CIM15.Element import AssociationList, EMPTY
 
 class Pole(Structure):
     """Pole asset.Pole asset.
@@ -73,8 +74,9 @@ class Pole(Structure):
         #: Date and time pole was last treated with preservative.
         self.treatedDateTime = treatedDateTime
 
-        self._Streetlights = []
-        self.Streetlights = [] if Streetlights is None else Streetlights
+        self._Streetlights = EMPTY
+        if Streetlights is not None:
+            self.Streetlights = Streetlights
 
         super(Pole, self).__init__(*args, **kw_args)
 
@@ -91,6 +93,7 @@ class Pole(Structure):
         return self._Streetlights
 
     def setStreetlights(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Streetlights:
             x.Pole = None
         for y in value:
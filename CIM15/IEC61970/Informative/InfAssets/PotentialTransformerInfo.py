@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.AssetInfo import AssetInfo
+from CIM15.Element import AssociationList, EMPTY
 
 class PotentialTransformerInfo(AssetInfo):
     """Properties of potential transformer asset.Properties of potential transformer asset.
@@ -47,8 +48,9 @@ class PotentialTransformerInfo(AssetInfo):
 
         self.tertiaryRatio = tertiaryRatio
 
-        self._PTs = []
-        self.PTs = [] if PTs is None else PTs
+        self._PTs = EMPTY
+        if PTs is not None:
+            self.PTs = PTs
 
         self.secondaryRatio = secondaryRatio
 
@@ -75,6 +77,7 @@ class PotentialTransformerInfo(AssetInfo):
         return self._PTs
 
     def setPTs(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._PTs:
             x.PTInfo = None
         for y in value:
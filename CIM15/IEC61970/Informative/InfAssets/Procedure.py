@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import AssociationList, EMPTY
 
 class Procedure(Document):
     """A documented procedure for various types of Work or Work Tasks. One or more procedures guide a compatible unit, a standard way of performing a unit of work. The type of procedure is defined in Procedure.type. For example, when type=Inspection, this procedure coupled with Schedule and other information provides the key items of an inspection plan. Another type of Procedure is a Diagnosis. Note that each specific values and settings to be used in a procedure is intended to be described in an instance of ProcedureValue. A maintenance ticket, a type of Work, is generated whenever maintenance is determined to be needed as a result of an inspection or diagnosis.A documented procedure for various types of Work or Work Tasks. One or more procedures guide a compatible unit, a standard way of performing a unit of work. The type of procedure is defined in Procedure.type. For example, when type=Inspection, this procedure coupled with Schedule and other information provides the key items of an inspection plan. Another type of Procedure is a Diagnosis. Note that each specific values and settings to be used in a procedure is intended to be described in an instance of ProcedureValue. A maintenance ticket, a type of Work, is generated whenever maintenance is determined to be needed as a result of an inspection or diagnosis.
@@ -48,17 +49,21 @@ class Procedure(Document):
         #: The textual description of the procedure, which references instances of ProcedureValue as appropriate.
         self.instruction = instruction
 
-        self._ProcedureValues = []
-        self.ProcedureValues = [] if ProcedureValues is None else ProcedureValues
+        self._ProcedureValues = EMPTY
+        if ProcedureValues is not None:
+            self.ProcedureValues = ProcedureValues
 
-        self._ProcedureDataSets = []
-        self.ProcedureDataSets = [] if ProcedureDataSets is None else ProcedureDataSets
+        self._ProcedureDataSets = EMPTY
+        if ProcedureDataSets is not None:
+            self.ProcedureDataSets = ProcedureDataSets
 
-        self._CompatibleUnits = []
-        self.CompatibleUnits = [] if CompatibleUnits is None else CompatibleUnits
+        self._CompatibleUnits = EMPTY
+        if CompatibleUnits is not None:
+            self.CompatibleUnits = CompatibleUnits
 
-        self._Limits = []
-        self.Limits = [] if Limits is None else Limits
+        self._Limits = EMPTY
+        if Limits is not None:
+            self.Limits = Limits
 
         super(Procedure, self).__init__(*args, **kw_args)
 
@@ -75,6 +80,7 @@ class Procedure(Document):
         return self._ProcedureValues
 
     def setProcedureValues(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ProcedureValues:
             x.Procedure = None
         for y in value:
@@ -96,6 +102,7 @@ class Procedure(Document):
         return self._ProcedureDataSets
 
     def setProcedureDataSets(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ProcedureDataSets:
             x.Procedure = None
         for y in value:
@@ -117,21 +124,28 @@ class Procedure(Document):
         return self._CompatibleUnits
 
     def setCompatibleUnits(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._CompatibleUnits:
-            filtered = [q for q in p.Procedures if q != self]
-            self._CompatibleUnits._Procedures = filtered
+            p._Procedures.discard(self)
         for r in value:
-            if self not in r._Procedures:
-                r._Procedures.append(self)
+            if r._Procedures is EMPTY:
+                r._Procedures = AssociationList([self])
+            else:
+                r._Procedures.add(self)
         self._CompatibleUnits = value
 
     CompatibleUnits = property(getCompatibleUnits, setCompatibleUnits)
 
     def addCompatibleUnits(self, *CompatibleUnits):
         for obj in CompatibleUnits:
-            if self not in obj._Procedures:
-                obj._Procedures.append(self)
-            self._CompatibleUnits.append(obj)
+            if obj._Procedures is EMPTY:
+                obj._Procedures = AssociationList([self])
+            else:
+                obj._Procedures.add(self)
+            if self._CompatibleUnits is EMPTY:
+                self._CompatibleUnits = AssociationList([obj])
+            else:
+                self._CompatibleUnits.add(obj)
 
     def removeCompatibleUnits(self, *CompatibleUnits):
         for obj in CompatibleUnits:
@@ -144,21 +158,28 @@ class Procedure(Document):
         return self._Limits
 
     def setLimits(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Limits:
-            filtered = [q for q in p.Procedures if q != self]
-            self._Limits._Procedures = filtered
+            p._Procedures.discard(self)
         for r in value:
-            if self not in r._Procedures:
-                r._Procedures.append(self)
+            if r._Procedures is EMPTY:
+                r._Procedures = AssociationList([self])
+            else:
+                r._Procedures.add(self)
         self._Limits = value
 
     Limits = property(getLimits, setLimits)
 
     def addLimits(self, *Limits):
         for obj in Limits:
-            if self not in obj._Procedures:
-                obj._Procedures.append(self)
-            self._Limits.append(obj)
+            if obj._Procedures is EMPTY:
+                obj._Procedures = AssociationList([self])
+            else:
+                obj._Procedures.add(self)
+            if self._Limits is EMPTY:
+                self._Limits = AssociationList([obj])
+            else:
+                self._Limits.add(obj)
 
     def removeLimits(self, *Limits):
         for obj in Limits:
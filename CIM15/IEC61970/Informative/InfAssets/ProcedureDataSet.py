@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import AssociationList, EMPTY
 
 class ProcedureDataSet(Document):
     """A data set recorded each time a procedure is executed. Observed results are captured in associated measurement values and/or values for properties relevant to the type of procedure performed.A data set recorded each time a procedure is executed. Observed results are captured in associated measurement values and/or values for properties relevant to the type of procedure performed.
@@ -36,17 +37,20 @@ class ProcedureDataSet(Document):
         #: Date and time procedure was completed.
         self.completedDateTime = completedDateTime
 
-        self._Properties = []
-        self.Properties = [] if Properties is None else Properties
+        self._Properties = EMPTY
+        if Properties is not None:
+            self.Properties = Properties
 
-        self._TransformerObservations = []
-        self.TransformerObservations = [] if TransformerObservations is None else TransformerObservations
+        self._TransformerObservations = EMPTY
+        if TransformerObservations is not None:
+            self.TransformerObservations = TransformerObservations
 
         self._Procedure = None
         self.Procedure = Procedure
 
-        self._MeasurementValues = []
-        self.MeasurementValues = [] if MeasurementValues is None else MeasurementValues
+        self._MeasurementValues = EMPTY
+        if MeasurementValues is not None:
+            self.MeasurementValues = MeasurementValues
 
         super(ProcedureDataSet, self).__init__(*args, **kw_args)
 
@@ -63,21 +67,28 @@ class ProcedureDataSet(Document):
         return self._Properties
 
     def setProperties(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Properties:
-            filtered = [q for q in p.ProcedureDataSets if q != self]
-            self._Properties._ProcedureDataSets = filtered
+            p._ProcedureDataSets.discard(self)
         for r in value:
-            if self not in r._ProcedureDataSets:
-                r._ProcedureDataSets.append(self)
+            if r._ProcedureDataSets is EMPTY:
+                r._ProcedureDataSets = AssociationList([self])
+            else:
+                r._ProcedureDataSets.add(self)
         self._Properties = value
 
     Properties = property(getProperties, setProperties)
 
     def addProperties(self, *Properties):
         for obj in Properties:
-            if self not in obj._ProcedureDataSets:
-                obj._ProcedureDataSets.append(self)
-            self._Properties.append(obj)
+            if obj._ProcedureDataSets is EMPTY:
+                obj._ProcedureDataSets = AssociationList([self])
+            else:
+                obj._ProcedureDataSets.add(self)
+            if self._Properties is EMPTY:
+                self._Properties = AssociationList([obj])
+            else:
+                self._Properties.add(obj)
 
     def removeProperties(self, *Properties):
         for obj in Properties:
@@ -90,21 +101,28 @@ class ProcedureDataSet(Document):
         return self._TransformerObservations
 
     def setTransformerObservations(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._TransformerObservations:
-            filtered = [q for q in p.ProcedureDataSets if q != self]
-            self._TransformerObservations._ProcedureDataSets = filtered
+            p._ProcedureDataSets.discard(self)
         for r in value:
-            if self not in r._ProcedureDataSets:
-                r._ProcedureDataSets.append(self)
+            if r._ProcedureDataSets is EMPTY:
+                r._ProcedureDataSets = AssociationList([self])
+            else:
+                r._ProcedureDataSets.add(self)
         self._TransformerObservations = value
 
     TransformerObservations = property(getTransformerObservations, setTransformerObservations)
 
     def addTransformerObservations(self, *TransformerObservations):
         for obj in TransformerObservations:
-            if self not in obj._ProcedureDataSets:
-                obj._ProcedureDataSets.append(self)
-            self._TransformerObservations.append(obj)
+            if obj._ProcedureDataSets is EMPTY:
+                obj._ProcedureDataSets = AssociationList([self])
+            else:
+                obj._ProcedureDataSets.add(self)
+            if self._TransformerObservations is EMPTY:
+                self._TransformerObservations = AssociationList([obj])
+            else:
+                self._TransformerObservations.add(obj)
 
     def removeTransformerObservations(self, *TransformerObservations):
         for obj in TransformerObservations:
@@ -118,13 +136,14 @@ class ProcedureDataSet(Document):
 
     def setProcedure(self, value):
         if self._Procedure is not None:
-            filtered = [x for x in self.Procedure.ProcedureDataSets if x != self]
-            self._Procedure._ProcedureDataSets = filtered
+            self._Procedure._ProcedureDataSets.discard(self)
 
         self._Procedure = value
         if self._Procedure is not None:
-            if self not in self._Procedure._ProcedureDataSets:
-                self._Procedure._ProcedureDataSets.append(self)
+            if self._Procedure._ProcedureDataSets is EMPTY:
+                self._Procedure._ProcedureDataSets = AssociationList([self])
+            else:
+                self._Procedure._ProcedureDataSets.add(self)
 
     Procedure = property(getProcedure, setProcedure)
 
@@ -133,21 +152,28 @@ class ProcedureDataSet(Document):
         return self._MeasurementValues
 
     def setMeasurementValues(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._MeasurementValues:
-            filtered = [q for q in p.ProcedureDataSets if q != self]
-            self._MeasurementValues._ProcedureDataSets = filtered
+            p._ProcedureDataSets.discard(self)
         for r in value:
-            if self not in r._ProcedureDataSets:
-                r._ProcedureDataSets.append(self)
+            if r._ProcedureDataSets is EMPTY:
+                r._ProcedureDataSets = AssociationList([self])
+            else:
+                r._ProcedureDataSets.add(self)
         self._MeasurementValues = value
 
     MeasurementValues = property(getMeasurementValues, setMeasurementValues)
 
     def addMeasurementValues(self, *MeasurementValues):
         for obj in MeasurementValues:
-            if self not in obj._ProcedureDataSets:
-                obj._ProcedureDataSets.append(self)
-            self._MeasurementValues.append(obj)
+            if obj._ProcedureDataSets is EMPTY:
+                obj._ProcedureDataSets = AssociationList([self])
+            else:
+                obj._ProcedureDataSets.add(self)
+            if self._MeasurementValues is EMPTY:
+                self._MeasurementValues = AssociationList([obj])
+            else:
+                self._MeasurementValues.add(obj)
 
     def removeMeasurementValues(self, *MeasurementValues):
         for obj in MeasurementValues:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class ReliabilityInfo(IdentifiedObject):
     """Information regarding the experienced and expected reliability of a specific asset, type of asset, or asset model.Information regarding the experienced and expected reliability of a specific asset, type of asset, or asset model.
@@ -41,8 +42,9 @@ class ReliabilityInfo(IdentifiedObject):
         self._Specification = None
         self.Specification = Specification
 
-        self._Assets = []
-        self.Assets = [] if Assets is None else Assets
+        self._Assets = EMPTY
+        if Assets is not None:
+            self.Assets = Assets
 
         super(ReliabilityInfo, self).__init__(*args, **kw_args)
 
@@ -59,13 +61,14 @@ class ReliabilityInfo(IdentifiedObject):
 
     def setSpecification(self, value):
         if self._Specification is not None:
-            filtered = [x for x in self.Specification.ReliabilityInfos if x != self]
-            self._Specification._ReliabilityInfos = filtered
+            self._Specification._ReliabilityInfos.discard(self)
 
         self._Specification = value
         if self._Specification is not None:
-            if self not in self._Specification._ReliabilityInfos:
-                self._Specification._ReliabilityInfos.append(self)
+            if self._Specification._ReliabilityInfos is EMPTY:
+                self._Specification._ReliabilityInfos = AssociationList([self])
+            else:
+                self._Specification._ReliabilityInfos.add(self)
 
     Specification = property(getSpecification, setSpecification)
 
@@ -74,21 +77,28 @@ class ReliabilityInfo(IdentifiedObject):
         return self._Assets
 
     def setAssets(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Assets:
-            filtered = [q for q in p.ReliabilityInfos if q != self]
-            self._Assets._ReliabilityInfos = filtered
+            p._ReliabilityInfos.discard(self)
         for r in value:
-            if self not in r._ReliabilityInfos:
-                r._ReliabilityInfos.append(self)
+            if r._ReliabilityInfos is EMPTY:
+                r._ReliabilityInfos = AssociationList([self])
+            else:
+                r._ReliabilityInfos.add(self)
         self._Assets = value
 
     Assets = property(getAssets, setAssets)
 
     def addAssets(self, *Assets):
         for obj in Assets:
-            if self not in obj._ReliabilityInfos:
-                obj._ReliabilityInfos.append(self)
-            self._Assets.append(obj)
+            if obj._ReliabilityInfos is EMPTY:
+                obj._ReliabilityInfos = AssociationList([self])
+            else:
+                obj._ReliabilityInfos.add(self)
+            if self._Assets is EMPTY:
+                self._Assets = AssociationList([obj])
+            else:
+                self._Assets.add(obj)
 
     def removeAssets(self, *Assets):
         for obj in Assets:
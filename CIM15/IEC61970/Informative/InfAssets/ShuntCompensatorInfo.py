@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.AssetInfo import AssetInfo
+from CIM15.Element import AssociationList, EMPTY
 
 class ShuntCompensatorInfo(AssetInfo):
     """Properties of shunt capacitor, shunt reactor or switchable bank of shunt capacitor or reactor assets.Properties of shunt capacitor, shunt reactor or switchable bank of shunt capacitor or reactor assets.
@@ -51,13 +52,14 @@ class ShuntCompensatorInfo(AssetInfo):
 
     def setShuntImpedanceInfo(self, value):
         if self._ShuntImpedanceInfo is not None:
-            filtered = [x for x in self.ShuntImpedanceInfo.ShuntCompensatorInfos if x != self]
-            self._ShuntImpedanceInfo._ShuntCompensatorInfos = filtered
+            self._ShuntImpedanceInfo._ShuntCompensatorInfos.discard(self)
 
         self._ShuntImpedanceInfo = value
         if self._ShuntImpedanceInfo is not None:
-            if self not in self._ShuntImpedanceInfo._ShuntCompensatorInfos:
-                self._ShuntImpedanceInfo._ShuntCompensatorInfos.append(self)
+            if self._ShuntImpedanceInfo._ShuntCompensatorInfos is EMPTY:
+                self._ShuntImpedanceInfo._ShuntCompensatorInfos = AssociationList([self])
+            else:
+                self._ShuntImpedanceInfo._ShuntCompensatorInfos.add(self)
 
     ShuntImpedanceInfo = property(getShuntImpedanceInfo, setShuntImpedanceInfo)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.AssetInfo import AssetInfo
+from CIM15.Element import AssociationList, EMPTY
 
 class ShuntImpedanceInfo(AssetInfo):
     """Properties of a shunt impedance.Properties of a shunt impedance.
@@ -97,8 +98,9 @@ class ShuntImpedanceInfo(AssetInfo):
         #: True if the locally controlled capacitor has voltage override capability.
         self.localOverride = localOverride
 
-        self._ShuntCompensatorInfos = []
-        self.ShuntCompensatorInfos = [] if ShuntCompensatorInfos is None else ShuntCompensatorInfos
+        self._ShuntCompensatorInfos = EMPTY
+        if ShuntCompensatorInfos is not None:
+            self.ShuntCompensatorInfos = ShuntCompensatorInfos
 
         super(ShuntImpedanceInfo, self).__init__(*args, **kw_args)
 
@@ -114,6 +116,7 @@ class ShuntImpedanceInfo(AssetInfo):
         return self._ShuntCompensatorInfos
 
     def setShuntCompensatorInfos(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ShuntCompensatorInfos:
             x.ShuntImpedanceInfo = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import AssociationList, EMPTY
 
 class Specification(Document):
     """Specification can be used for various purposes relative to an asset, a logical device (PowerSystemResource), location, etc. Examples include documents supplied by manufacturers such as asset installation instructions, asset maintenance instructions, etc.Specification can be used for various purposes relative to an asset, a logical device (PowerSystemResource), location, etc. Examples include documents supplied by manufacturers such as asset installation instructions, asset maintenance instructions, etc.
@@ -35,26 +36,33 @@ class Specification(Document):
         @param Ratings: UserAttributes used to specify ratings of the asset covered by this specification. Ratings also can be used to set the initial value of operational measurement limits. Use 'name' to specify what kind of rating it is (e.g., voltage, current), and 'value' attribute for the actual value and unit information of the rating.
         @param QualificationRequirements:
         """
-        self._AssetPropertyCurves = []
-        self.AssetPropertyCurves = [] if AssetPropertyCurves is None else AssetPropertyCurves
+        self._AssetPropertyCurves = EMPTY
+        if AssetPropertyCurves is not None:
+            self.AssetPropertyCurves = AssetPropertyCurves
 
-        self._Mediums = []
-        self.Mediums = [] if Mediums is None else Mediums
+        self._Mediums = EMPTY
+        if Mediums is not None:
+            self.Mediums = Mediums
 
-        self._AssetProperites = []
-        self.AssetProperites = [] if AssetProperites is None else AssetProperites
+        self._AssetProperites = EMPTY
+        if AssetProperites is not None:
+            self.AssetProperites = AssetProperites
 
-        self._ReliabilityInfos = []
-        self.ReliabilityInfos = [] if ReliabilityInfos is None else ReliabilityInfos
+        self._ReliabilityInfos = EMPTY
+        if ReliabilityInfos is not None:
+            self.ReliabilityInfos = ReliabilityInfos
 
-        self._DimensionsInfos = []
-        self.DimensionsInfos = [] if DimensionsInfos is None else DimensionsInfos
+        self._DimensionsInfos = EMPTY
+        if DimensionsInfos is not None:
+            self.DimensionsInfos = DimensionsInfos
 
-        self._Ratings = []
-        self.Ratings = [] if Ratings is None else Ratings
+        self._Ratings = EMPTY
+        if Ratings is not None:
+            self.Ratings = Ratings
 
-        self._QualificationRequirements = []
-        self.QualificationRequirements = [] if QualificationRequirements is None else QualificationRequirements
+        self._QualificationRequirements = EMPTY
+        if QualificationRequirements is not None:
+            self.QualificationRequirements = QualificationRequirements
 
         super(Specification, self).__init__(*args, **kw_args)
 
@@ -70,6 +78,7 @@ class Specification(Document):
         return self._AssetPropertyCurves
 
     def setAssetPropertyCurves(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._AssetPropertyCurves:
             x.Specification = None
         for y in value:
@@ -91,6 +100,7 @@ class Specification(Document):
         return self._Mediums
 
     def setMediums(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Mediums:
             x.Specification = None
         for y in value:
@@ -113,6 +123,7 @@ class Specification(Document):
         return self._AssetProperites
 
     def setAssetProperites(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._AssetProperites:
             x.PropertySpecification = None
         for y in value:
@@ -134,6 +145,7 @@ class Specification(Document):
         return self._ReliabilityInfos
 
     def setReliabilityInfos(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ReliabilityInfos:
             x.Specification = None
         for y in value:
@@ -155,21 +167,28 @@ class Specification(Document):
         return self._DimensionsInfos
 
     def setDimensionsInfos(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._DimensionsInfos:
-            filtered = [q for q in p.Specifications if q != self]
-            self._DimensionsInfos._Specifications = filtered
+            p._Specifications.discard(self)
         for r in value:
-            if self not in r._Specifications:
-                r._Specifications.append(self)
+            if r._Specifications is EMPTY:
+                r._Specifications = AssociationList([self])
+            else:
+                r._Specifications.add(self)
         self._DimensionsInfos = value
 
     DimensionsInfos = property(getDimensionsInfos, setDimensionsInfos)
 
     def addDimensionsInfos(self, *DimensionsInfos):
         for obj in DimensionsInfos:
-            if self not in obj._Specifications:
-                obj._Specifications.append(self)
-            self._DimensionsInfos.append(obj)
+            if obj._Specifications is EMPTY:
+                obj._Specifications = AssociationList([self])
+            else:
+                obj._Specifications.add(self)
+            if self._DimensionsInfos is EMPTY:
+                self._DimensionsInfos = AssociationList([obj])
+            else:
+                self._DimensionsInfos.add(obj)
 
     def removeDimensionsInfos(self, *DimensionsInfos):
         for obj in DimensionsInfos:
@@ -183,6 +202,7 @@ class Specification(Document):
         return self._Ratings
 
     def setRatings(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Ratings:
             x.RatingSpecification = None
         for y in value:
@@ -204,21 +224,28 @@ class Specification(Document):
         return self._QualificationRequirements
 
     def setQualificationRequirements(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._QualificationRequirements:
-            filtered = [q for q in p.Specifications if q != self]
-            self._QualificationRequirements._Specifications = filtered
+            p._Specifications.discard(self)
         for r in value:
-            if self not in r._Specifications:
-                r._Specifications.append(self)
+            if r._Specifications is EMPTY:
+                r._Specifications = AssociationList([self])
+            else:
+                r._Specifications.add(self)
         self._QualificationRequirements = value
 
     QualificationRequirements = property(getQualificationRequirements, setQualificationRequirements)
 
     def addQualificationRequirements(self, *QualificationRequirements):
         for obj in QualificationRequirements:
-            if self not in obj._Specifications:
-                obj._Specifications.append(self)
-            self._QualificationRequirements.append(obj)
+            if obj._Specifications is EMPTY:
+                obj._Specifications = AssociationList([self])
+            else:
+                obj._Specifications.add(self)
+            if self._QualificationRequirements is EMPTY:
+                self._QualificationRequirements = AssociationList([obj])
+            else:
+                self._QualificationRequirements.add(obj)
 
     def removeQualificationRequirements(self, *QualificationRequirements):
         for obj in QualificationRequirements:
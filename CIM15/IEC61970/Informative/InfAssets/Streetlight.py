@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.Asset import Asset
+from CIM15.Element import AssociationList, EMPTY
 
 class Streetlight(Asset):
     """Streetlight asset.Streetlight asset.
@@ -60,13 +61,14 @@ class Streetlight(Asset):
 
     def setPole(self, value):
         if self._Pole is not None:
-            filtered = [x for x in self.Pole.Streetlights if x != self]
-            self._Pole._Streetlights = filtered
+            self._Pole._Streetlights.discard(self)
 
         self._Pole = value
         if self._Pole is not None:
-            if self not in self._Pole._Streetlights:
-                self._Pole._Streetlights.append(self)
+            if self._Pole._Streetlights is EMPTY:
+                self._Pole._Streetlights = AssociationList([self])
+            else:
+                self._Pole._Streetlights.add(self)
 
     Pole = property(getPole, setPole)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.AssetContainer import AssetContainer
+from CIM15.Element import AssociationList, EMPTY
 
 class Structure(AssetContainer):
     """Construction holding assets such as conductors, transformers, switchgear, etc.Construction holding assets such as conductors, transformers, switchgear, etc.
@@ -58,11 +59,13 @@ class Structure(AssetContainer):
         #: Material this structure is made of. Values are: "wood", "concrete", "steel", "other"
         self.materialKind = materialKind
 
-        self._StructureSupportInfos = []
-        self.StructureSupportInfos = [] if StructureSupportInfos is None else StructureSupportInfos
+        self._StructureSupportInfos = EMPTY
+        if StructureSupportInfos is not None:
+            self.StructureSupportInfos = StructureSupportInfos
 
-        self._MountingConnections = []
-        self.MountingConnections = [] if MountingConnections is None else MountingConnections
+        self._MountingConnections = EMPTY
+        if MountingConnections is not None:
+            self.MountingConnections = MountingConnections
 
         super(Structure, self).__init__(*args, **kw_args)
 
@@ -78,6 +81,7 @@ class Structure(AssetContainer):
         return self._StructureSupportInfos
 
     def setStructureSupportInfos(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._StructureSupportInfos:
             x.SecuredStructure = None
         for y in value:
@@ -99,21 +103,28 @@ class Structure(AssetContainer):
         return self._MountingConnections
 
     def setMountingConnections(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._MountingConnections:
-            filtered = [q for q in p.StructureInfos if q != self]
-            self._MountingConnections._StructureInfos = filtered
+            p._StructureInfos.discard(self)
         for r in value:
-            if self not in r._StructureInfos:
-                r._StructureInfos.append(self)
+            if r._StructureInfos is EMPTY:
+                r._StructureInfos = AssociationList([self])
+            else:
+                r._StructureInfos.add(self)
         self._MountingConnections = value
 
     MountingConnections = property(getMountingConnections, setMountingConnections)
 
     def addMountingConnections(self, *MountingConnections):
         for obj in MountingConnections:
-            if self not in obj._StructureInfos:
-                obj._StructureInfos.append(self)
-            self._MountingConnections.append(obj)
+            if obj._StructureInfos is EMPTY:
+                obj._StructureInfos = AssociationList([self])
+            else:
+                obj._StructureInfos.add(self)
+            if self._MountingConnections is EMPTY:
+                self._MountingConnections = AssociationList([obj])
+            else:
+                self._MountingConnections.add(obj)
 
     def removeMountingConnections(self, *MountingConnections):
         for obj in MountingConnections:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.Asset import Asset
+from CIM15.Element import AssociationList, EMPTY
 
 class StructureSupport(Asset):
     """Support for structure assets.Support for structure assets.
@@ -75,13 +76,14 @@ class StructureSupport(Asset):
 
     def setSecuredStructure(self, value):
         if self._SecuredStructure is not None:
-            filtered = [x for x in self.SecuredStructure.StructureSupportInfos if x != self]
-            self._SecuredStructure._StructureSupportInfos = filtered
+            self._SecuredStructure._StructureSupportInfos.discard(self)
 
         self._SecuredStructure = value
         if self._SecuredStructure is not None:
-            if self not in self._SecuredStructure._StructureSupportInfos:
-                self._SecuredStructure._StructureSupportInfos.append(self)
+            if self._SecuredStructure._StructureSupportInfos is EMPTY:
+                self._SecuredStructure._StructureSupportInfos = AssociationList([self])
+            else:
+                self._SecuredStructure._StructureSupportInfos.add(self)
 
     SecuredStructure = property(getSecuredStructure, setSecuredStructure)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.AssetInfo import AssetInfo
+from CIM15.Element import AssociationList, EMPTY
 
 class SurgeProtectorInfo(AssetInfo):
     """Properties of surge protector asset.Properties of surge protector asset.
@@ -45,8 +46,9 @@ class SurgeProtectorInfo(AssetInfo):
 
         self.maxEnergyAbsorption = maxEnergyAbsorption
 
-        self._SurgeProtectors = []
-        self.SurgeProtectors = [] if SurgeProtectors is None else SurgeProtectors
+        self._SurgeProtectors = EMPTY
+        if SurgeProtectors is not None:
+            self.SurgeProtectors = SurgeProtectors
 
         super(SurgeProtectorInfo, self).__init__(*args, **kw_args)
 
@@ -63,6 +65,7 @@ class SurgeProtectorInfo(AssetInfo):
         return self._SurgeProtectors
 
     def setSurgeProtectors(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._SurgeProtectors:
             x.SurgeProtectorInfo = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.Asset import Asset
+from CIM15.Element import AssociationList, EMPTY
 
 class Tool(Asset):
     """Tool asset.Tool asset.
@@ -51,13 +52,14 @@ class Tool(Asset):
 
     def setCrew(self, value):
         if self._Crew is not None:
-            filtered = [x for x in self.Crew.Tools if x != self]
-            self._Crew._Tools = filtered
+            self._Crew._Tools.discard(self)
 
         self._Crew = value
         if self._Crew is not None:
-            if self not in self._Crew._Tools:
-                self._Crew._Tools.append(self)
+            if self._Crew._Tools is EMPTY:
+                self._Crew._Tools = AssociationList([self])
+            else:
+                self._Crew._Tools.add(self)
 
     Crew = property(getCrew, setCrew)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.Asset import Asset
+from CIM15.Element import AssociationList, EMPTY
 
 class TransformerAsset(Asset):
     """A specific physical (vs. logical) transformer.A specific physical (vs. logical) transformer.
@@ -36,11 +37,13 @@ class TransformerAsset(Asset):
         #: Date and time this asset was last reconditioned or had a major overhaul.
         self.reconditionedDateTime = reconditionedDateTime
 
-        self._PowerRatings = []
-        self.PowerRatings = [] if PowerRatings is None else PowerRatings
+        self._PowerRatings = EMPTY
+        if PowerRatings is not None:
+            self.PowerRatings = PowerRatings
 
-        self._TransformerObservations = []
-        self.TransformerObservations = [] if TransformerObservations is None else TransformerObservations
+        self._TransformerObservations = EMPTY
+        if TransformerObservations is not None:
+            self.TransformerObservations = TransformerObservations
 
         self._TransformerInfo = None
         self.TransformerInfo = TransformerInfo
@@ -62,21 +65,28 @@ class TransformerAsset(Asset):
         return self._PowerRatings
 
     def setPowerRatings(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._PowerRatings:
-            filtered = [q for q in p.TransformerAssets if q != self]
-            self._PowerRatings._TransformerAssets = filtered
+            p._TransformerAssets.discard(self)
         for r in value:
-            if self not in r._TransformerAssets:
-                r._TransformerAssets.append(self)
+            if r._TransformerAssets is EMPTY:
+                r._TransformerAssets = AssociationList([self])
+            else:
+                r._TransformerAssets.add(self)
         self._PowerRatings = value
 
     PowerRatings = property(getPowerRatings, setPowerRatings)
 
     def addPowerRatings(self, *PowerRatings):
         for obj in PowerRatings:
-            if self not in obj._TransformerAssets:
-                obj._TransformerAssets.append(self)
-            self._PowerRatings.append(obj)
+            if obj._TransformerAssets is EMPTY:
+                obj._TransformerAssets = AssociationList([self])
+            else:
+                obj._TransformerAssets.add(self)
+            if self._PowerRatings is EMPTY:
+                self._PowerRatings = AssociationList([obj])
+            else:
+                self._PowerRatings.add(obj)
 
     def removePowerRatings(self, *PowerRatings):
         for obj in PowerRatings:
@@ -89,6 +99,7 @@ class TransformerAsset(Asset):
         return self._TransformerObservations
 
     def setTransformerObservations(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._TransformerObservations:
             x.TransformerAsset = None
         for y in value:
@@ -111,13 +122,14 @@ class TransformerAsset(Asset):
 
     def setTransformerInfo(self, value):
         if self._TransformerInfo is not None:
-            filtered = [x for x in self.TransformerInfo.TransformerAssets if x != self]
-            self._TransformerInfo._TransformerAssets = filtered
+            self._TransformerInfo._TransformerAssets.discard(self)
 
         self._TransformerInfo = value
         if self._TransformerInfo is not None:
-            if self not in self._TransformerInfo._TransformerAssets:
-                self._TransformerInfo._TransformerAssets.append(self)
+            if self._TransformerInfo._TransformerAssets is EMPTY:
+                self._TransformerInfo._TransformerAssets = AssociationList([self])
+            else:
+                self._TransformerInfo._TransformerAssets.add(self)
 
     TransformerInfo = property(getTransformerInfo, setTransformerInfo)
 
@@ -127,13 +139,14 @@ class TransformerAsset(Asset):
 
     def setTransformerAssetModel(self, value):
         if self._TransformerAssetModel is not None:
-            filtered = [x for x in self.TransformerAssetModel.TransformerAssets if x != self]
-            self._TransformerAssetModel._TransformerAssets = filtered
+            self._TransformerAssetModel._TransformerAssets.discard(self)
 
         self._TransformerAssetModel = value
         if self._TransformerAssetModel is not None:
-            if self not in self._TransformerAssetModel._TransformerAssets:
-                self._TransformerAssetModel._TransformerAssets.append(self)
+            if self._TransformerAssetModel._TransformerAssets is EMPTY:
+                self._TransformerAssetModel._TransformerAssets = AssociationList([self])
+            else:
+                self._TransformerAssetModel._TransformerAssets.add(self)
 
     TransformerAssetModel = property(getTransformerAssetModel, setTransformerAssetModel)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class TransformerObservation(IdentifiedObject):
     """Common information captured during transformer inspections and/or diagnostics. Note that some properties may be measured through other means and therefore have measurement values in addition to the observed values recorded here.Common information captured during transformer inspections and/or diagnostics. Note that some properties may be measured through other means and therefore have measurement values in addition to the observed values recorded here.
@@ -86,19 +87,22 @@ class TransformerObservation(IdentifiedObject):
         #: Pump vibration, with typical values being: nominal, high.
         self.pumpVibration = pumpVibration
 
-        self._BushingInsultationPFs = []
-        self.BushingInsultationPFs = [] if BushingInsultationPFs is None else BushingInsultationPFs
+        self._BushingInsultationPFs = EMPTY
+        if BushingInsultationPFs is not None:
+            self.BushingInsultationPFs = BushingInsultationPFs
 
-        self._ProcedureDataSets = []
-        self.ProcedureDataSets = [] if ProcedureDataSets is None else ProcedureDataSets
+        self._ProcedureDataSets = EMPTY
+        if ProcedureDataSets is not None:
+            self.ProcedureDataSets = ProcedureDataSets
 
         self._Transformer = None
         self.Transformer = Transformer
 
         self.status = status
 
-        self._WindingInsulationPFs = []
-        self.WindingInsulationPFs = [] if WindingInsulationPFs is None else WindingInsulationPFs
+        self._WindingInsulationPFs = EMPTY
+        if WindingInsulationPFs is not None:
+            self.WindingInsulationPFs = WindingInsulationPFs
 
         self._TransformerAsset = None
         self.TransformerAsset = TransformerAsset
@@ -117,6 +121,7 @@ class TransformerObservation(IdentifiedObject):
         return self._BushingInsultationPFs
 
     def setBushingInsultationPFs(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._BushingInsultationPFs:
             x.TransformerObservation = None
         for y in value:
@@ -138,21 +143,28 @@ class TransformerObservation(IdentifiedObject):
         return self._ProcedureDataSets
 
     def setProcedureDataSets(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ProcedureDataSets:
-            filtered = [q for q in p.TransformerObservations if q != self]
-            self._ProcedureDataSets._TransformerObservations = filtered
+            p._TransformerObservations.discard(self)
         for r in value:
-            if self not in r._TransformerObservations:
-                r._TransformerObservations.append(self)
+            if r._TransformerObservations is EMPTY:
+                r._TransformerObservations = AssociationList([self])
+            else:
+                r._TransformerObservations.add(self)
         self._ProcedureDataSets = value
 
     ProcedureDataSets = property(getProcedureDataSets, setProcedureDataSets)
 
     def addProcedureDataSets(self, *ProcedureDataSets):
         for obj in ProcedureDataSets:
-            if self not in obj._TransformerObservations:
-                obj._TransformerObservations.append(self)
-            self._ProcedureDataSets.append(obj)
+            if obj._TransformerObservations is EMPTY:
+                obj._TransformerObservations = AssociationList([self])
+            else:
+                obj._TransformerObservations.add(self)
+            if self._ProcedureDataSets is EMPTY:
+                self._ProcedureDataSets = AssociationList([obj])
+            else:
+                self._ProcedureDataSets.add(obj)
 
     def removeProcedureDataSets(self, *ProcedureDataSets):
         for obj in ProcedureDataSets:
@@ -166,13 +178,14 @@ class TransformerObservation(IdentifiedObject):
 
     def setTransformer(self, value):
         if self._Transformer is not None:
-            filtered = [x for x in self.Transformer.TransformerObservations if x != self]
-            self._Transformer._TransformerObservations = filtered
+            self._Transformer._TransformerObservations.discard(self)
 
         self._Transformer = value
         if self._Transformer is not None:
-            if self not in self._Transformer._TransformerObservations:
-                self._Transformer._TransformerObservations.append(self)
+            if self._Transformer._TransformerObservations is EMPTY:
+                self._Transformer._TransformerObservations = AssociationList([self])
+            else:
+                self._Transformer._TransformerObservations.add(self)
 
     Transformer = property(getTransformer, setTransformer)
 
@@ -183,6 +196,7 @@ class TransformerObservation(IdentifiedObject):
         return self._WindingInsulationPFs
 
     def setWindingInsulationPFs(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._WindingInsulationPFs:
             x.TransformerObservation = None
         for y in value:
@@ -205,13 +219,14 @@ class TransformerObservation(IdentifiedObject):
 
     def setTransformerAsset(self, value):
         if self._TransformerAsset is not None:
-            filtered = [x for x in self.TransformerAsset.TransformerObservations if x != self]
-            self._TransformerAsset._TransformerObservations = filtered
+            self._TransformerAsset._TransformerObservations.discard(self)
 
         self._TransformerAsset = value
         if self._TransformerAsset is not None:
-            if self not in self._TransformerAsset._TransformerObservations:
-                self._TransformerAsset._TransformerObservations.append(self)
+            if self._TransformerAsset._TransformerObservations is EMPTY:
+                self._TransformerAsset._TransformerObservations = AssociationList([self])
+            else:
+                self._TransformerAsset._TransformerObservations.add(self)
 
     TransformerAsset = property(getTransformerAsset, setTransformerAsset)
 
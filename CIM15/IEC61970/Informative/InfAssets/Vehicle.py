@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.Asset import Asset
+from CIM15.Element import AssociationList, EMPTY
 
 class Vehicle(Asset):
     """Vehicle asset.Vehicle asset.
@@ -59,13 +60,14 @@ class Vehicle(Asset):
 
     def setCrew(self, value):
         if self._Crew is not None:
-            filtered = [x for x in self.Crew.Vehicles if x != self]
-            self._Crew._Vehicles = filtered
+            self._Crew._Vehicles.discard(self)
 
         self._Crew = value
         if self._Crew is not None:
-            if self not in self._Crew._Vehicles:
-                self._Crew._Vehicles.append(self)
+            if self._Crew._Vehicles is EMPTY:
+                self._Crew._Vehicles = AssociationList([self])
+            else:
+                self._Crew._Vehicles.add(self)
 
     Crew = property(getCrew, setCrew)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class WindingInsulation(IdentifiedObject):
     """Winding insulation condition as a result of a test.Winding insulation condition as a result of a test.
@@ -74,13 +75,14 @@ class WindingInsulation(IdentifiedObject):
 
     def setGround(self, value):
         if self._Ground is not None:
-            filtered = [x for x in self.Ground.WindingInsulations if x != self]
-            self._Ground._WindingInsulations = filtered
+            self._Ground._WindingInsulations.discard(self)
 
         self._Ground = value
         if self._Ground is not None:
-            if self not in self._Ground._WindingInsulations:
-                self._Ground._WindingInsulations.append(self)
+            if self._Ground._WindingInsulations is EMPTY:
+                self._Ground._WindingInsulations = AssociationList([self])
+            else:
+                self._Ground._WindingInsulations.add(self)
 
     Ground = property(getGround, setGround)
 
@@ -90,13 +92,14 @@ class WindingInsulation(IdentifiedObject):
 
     def setTransformerObservation(self, value):
         if self._TransformerObservation is not None:
-            filtered = [x for x in self.TransformerObservation.WindingInsulationPFs if x != self]
-            self._TransformerObservation._WindingInsulationPFs = filtered
+            self._TransformerObservation._WindingInsulationPFs.discard(self)
 
         self._TransformerObservation = value
         if self._TransformerObservation is not None:
-            if self not in self._TransformerObservation._WindingInsulationPFs:
-                self._TransformerObservation._WindingInsulationPFs.append(self)
+            if self._TransformerObservation._WindingInsulationPFs is EMPTY:
+                self._TransformerObservation._WindingInsulationPFs = AssociationList([self])
+            else:
+                self._TransformerObservation._WindingInsulationPFs.add(self)
 
     TransformerObservation = property(getTransformerObservation, setTransformerObservation)
 
@@ -106,13 +109,14 @@ class WindingInsulation(IdentifiedObject):
 
     def setToWinding(self, value):
         if self._ToWinding is not None:
-            filtered = [x for x in self.ToWinding.ToWindingInsulations if x != self]
-            self._ToWinding._ToWindingInsulations = filtered
+            self._ToWinding._ToWindingInsulations.discard(self)
 
         self._ToWinding = value
         if self._ToWinding is not None:
-            if self not in self._ToWinding._ToWindingInsulations:
-                self._ToWinding._ToWindingInsulations.append(self)
+            if self._ToWinding._ToWindingInsulations is EMPTY:
+                self._ToWinding._ToWindingInsulations = AssociationList([self])
+            else:
+                self._ToWinding._ToWindingInsulations.add(self)
 
     ToWinding = property(getToWinding, setToWinding)
 
@@ -122,13 +126,14 @@ class WindingInsulation(IdentifiedObject):
 
     def setFromWinding(self, value):
         if self._FromWinding is not None:
-            filtered = [x for x in self.FromWinding.FromWindingInsulations if x != self]
-            self._FromWinding._FromWindingInsulations = filtered
+            self._FromWinding._FromWindingInsulations.discard(self)
 
         self._FromWinding = value
         if self._FromWinding is not None:
-            if self not in self._FromWinding._FromWindingInsulations:
-                self._FromWinding._FromWindingInsulations.append(self)
+            if self._FromWinding._FromWindingInsulations is EMPTY:
+                self._FromWinding._FromWindingInsulations = AssociationList([self])
+            else:
+                self._FromWinding._FromWindingInsulations.add(self)
 
     FromWinding = property(getFromWinding, setFromWinding)
 
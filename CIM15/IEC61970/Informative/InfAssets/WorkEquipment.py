@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.Asset import Asset
+from CIM15.Element import AssociationList, EMPTY
 
 class WorkEquipment(Asset):
     """Equipment used to perform units of work by crews, office staff, etc.Equipment used to perform units of work by crews, office staff, etc.
@@ -33,8 +34,9 @@ class WorkEquipment(Asset):
         self._Crew = None
         self.Crew = Crew
 
-        self._Usages = []
-        self.Usages = [] if Usages is None else Usages
+        self._Usages = EMPTY
+        if Usages is not None:
+            self.Usages = Usages
 
         super(WorkEquipment, self).__init__(*args, **kw_args)
 
@@ -51,13 +53,14 @@ class WorkEquipment(Asset):
 
     def setCrew(self, value):
         if self._Crew is not None:
-            filtered = [x for x in self.Crew.WorkEquipmentAssets if x != self]
-            self._Crew._WorkEquipmentAssets = filtered
+            self._Crew._WorkEquipmentAssets.discard(self)
 
         self._Crew = value
         if self._Crew is not None:
-            if self not in self._Crew._WorkEquipmentAssets:
-                self._Crew._WorkEquipmentAssets.append(self)
+            if self._Crew._WorkEquipmentAssets is EMPTY:
+                self._Crew._WorkEquipmentAssets = AssociationList([self])
+            else:
+                self._Crew._WorkEquipmentAssets.add(self)
 
     Crew = property(getCrew, setCrew)
 
@@ -66,6 +69,7 @@ class WorkEquipment(Asset):
         return self._Usages
 
     def setUsages(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Usages:
             x.WorkEquipmentAsset = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Organisation import Organisation
+from CIM15.Element import AssociationList, EMPTY
 
 class Bank(Organisation):
     """Organisation that is a commercial bank, agency, or other institution that offers a similar service.Organisation that is a commercial bank, agency, or other institution that offers a similar service.
@@ -41,8 +42,9 @@ class Bank(Organisation):
         #: Codified reference to the particular branch of the bank where BankAccount is held.
         self.branchCode = branchCode
 
-        self._BankAccounts = []
-        self.BankAccounts = [] if BankAccounts is None else BankAccounts
+        self._BankAccounts = EMPTY
+        if BankAccounts is not None:
+            self.BankAccounts = BankAccounts
 
         super(Bank, self).__init__(*args, **kw_args)
 
@@ -59,6 +61,7 @@ class Bank(Organisation):
         return self._BankAccounts
 
     def setBankAccounts(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._BankAccounts:
             x.Bank = None
         for y in value:
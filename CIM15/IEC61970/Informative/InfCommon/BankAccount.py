@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import AssociationList, EMPTY
 
 class BankAccount(Document):
     """Bank account.Bank account.
@@ -56,13 +57,14 @@ class BankAccount(Document):
 
     def setServiceSupplier(self, value):
         if self._ServiceSupplier is not None:
-            filtered = [x for x in self.ServiceSupplier.BankAccounts if x != self]
-            self._ServiceSupplier._BankAccounts = filtered
+            self._ServiceSupplier._BankAccounts.discard(self)
 
         self._ServiceSupplier = value
         if self._ServiceSupplier is not None:
-            if self not in self._ServiceSupplier._BankAccounts:
-                self._ServiceSupplier._BankAccounts.append(self)
+            if self._ServiceSupplier._BankAccounts is EMPTY:
+                self._ServiceSupplier._BankAccounts = AssociationList([self])
+            else:
+                self._ServiceSupplier._BankAccounts.add(self)
 
     ServiceSupplier = property(getServiceSupplier, setServiceSupplier)
 
@@ -73,13 +75,14 @@ class BankAccount(Document):
 
     def setBank(self, value):
         if self._Bank is not None:
-            filtered = [x for x in self.Bank.BankAccounts if x != self]
-            self._Bank._BankAccounts = filtered
+            self._Bank._BankAccounts.discard(self)
 
         self._Bank = value
         if self._Bank is not None:
-            if self not in self._Bank._BankAccounts:
-                self._Bank._BankAccounts.append(self)
+            if self._Bank._BankAccounts is EMPTY:
+                self._Bank._BankAccounts = AssociationList([self])
+            else:
+                self._Bank._BankAccounts.add(self)
 
     Bank = property(getBank, setBank)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class BusinessRole(IdentifiedObject):
     """A business role that this organisation plays. A single organisation typically performs many functions, each one described as a role.A business role that this organisation plays. A single organisation typically performs many functions, each one described as a role.
@@ -34,8 +35,9 @@ class BusinessRole(IdentifiedObject):
         #: Category by utility's corporate standards and practices.
         self.category = category
 
-        self._Organisations = []
-        self.Organisations = [] if Organisations is None else Organisations
+        self._Organisations = EMPTY
+        if Organisations is not None:
+            self.Organisations = Organisations
 
         self.status = status
 
@@ -53,21 +55,28 @@ class BusinessRole(IdentifiedObject):
         return self._Organisations
 
     def setOrganisations(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Organisations:
-            filtered = [q for q in p.BusinessRoles if q != self]
-            self._Organisations._BusinessRoles = filtered
+            p._BusinessRoles.discard(self)
         for r in value:
-            if self not in r._BusinessRoles:
-                r._BusinessRoles.append(self)
+            if r._BusinessRoles is EMPTY:
+                r._BusinessRoles = AssociationList([self])
+            else:
+                r._BusinessRoles.add(self)
         self._Organisations = value
 
     Organisations = property(getOrganisations, setOrganisations)
 
     def addOrganisations(self, *Organisations):
         for obj in Organisations:
-            if self not in obj._BusinessRoles:
-                obj._BusinessRoles.append(self)
-            self._Organisations.append(obj)
+            if obj._BusinessRoles is EMPTY:
+                obj._BusinessRoles = AssociationList([self])
+            else:
+                obj._BusinessRoles.add(self)
+            if self._Organisations is EMPTY:
+                self._Organisations = AssociationList([obj])
+            else:
+                self._Organisations.add(obj)
 
     def removeOrganisations(self, *Organisations):
         for obj in Organisations:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class Craft(IdentifiedObject):
     """Craft of a person or a crew. Examples include overhead electric, underground electric, high pressure gas, etc. This ensures necessary knowledge and skills before being allowed to perform certain types of work.Craft of a person or a crew. Examples include overhead electric, underground electric, high pressure gas, etc. This ensures necessary knowledge and skills before being allowed to perform certain types of work.
@@ -36,16 +37,19 @@ class Craft(IdentifiedObject):
         #: Category by utility's work mangement standards and practices.
         self.category = category
 
-        self._Skills = []
-        self.Skills = [] if Skills is None else Skills
+        self._Skills = EMPTY
+        if Skills is not None:
+            self.Skills = Skills
 
-        self._ErpPersons = []
-        self.ErpPersons = [] if ErpPersons is None else ErpPersons
+        self._ErpPersons = EMPTY
+        if ErpPersons is not None:
+            self.ErpPersons = ErpPersons
 
         self.status = status
 
-        self._Capabilities = []
-        self.Capabilities = [] if Capabilities is None else Capabilities
+        self._Capabilities = EMPTY
+        if Capabilities is not None:
+            self.Capabilities = Capabilities
 
         super(Craft, self).__init__(*args, **kw_args)
 
@@ -61,21 +65,28 @@ class Craft(IdentifiedObject):
         return self._Skills
 
     def setSkills(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Skills:
-            filtered = [q for q in p.Crafts if q != self]
-            self._Skills._Crafts = filtered
+            p._Crafts.discard(self)
         for r in value:
-            if self not in r._Crafts:
-                r._Crafts.append(self)
+            if r._Crafts is EMPTY:
+                r._Crafts = AssociationList([self])
+            else:
+                r._Crafts.add(self)
         self._Skills = value
 
     Skills = property(getSkills, setSkills)
 
     def addSkills(self, *Skills):
         for obj in Skills:
-            if self not in obj._Crafts:
-                obj._Crafts.append(self)
-            self._Skills.append(obj)
+            if obj._Crafts is EMPTY:
+                obj._Crafts = AssociationList([self])
+            else:
+                obj._Crafts.add(self)
+            if self._Skills is EMPTY:
+                self._Skills = AssociationList([obj])
+            else:
+                self._Skills.add(obj)
 
     def removeSkills(self, *Skills):
         for obj in Skills:
@@ -88,21 +99,28 @@ class Craft(IdentifiedObject):
         return self._ErpPersons
 
     def setErpPersons(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ErpPersons:
-            filtered = [q for q in p.Crafts if q != self]
-            self._ErpPersons._Crafts = filtered
+            p._Crafts.discard(self)
         for r in value:
-            if self not in r._Crafts:
-                r._Crafts.append(self)
+            if r._Crafts is EMPTY:
+                r._Crafts = AssociationList([self])
+            else:
+                r._Crafts.add(self)
         self._ErpPersons = value
 
     ErpPersons = property(getErpPersons, setErpPersons)
 
     def addErpPersons(self, *ErpPersons):
         for obj in ErpPersons:
-            if self not in obj._Crafts:
-                obj._Crafts.append(self)
-            self._ErpPersons.append(obj)
+            if obj._Crafts is EMPTY:
+                obj._Crafts = AssociationList([self])
+            else:
+                obj._Crafts.add(self)
+            if self._ErpPersons is EMPTY:
+                self._ErpPersons = AssociationList([obj])
+            else:
+                self._ErpPersons.add(obj)
 
     def removeErpPersons(self, *ErpPersons):
         for obj in ErpPersons:
@@ -117,21 +135,28 @@ class Craft(IdentifiedObject):
         return self._Capabilities
 
     def setCapabilities(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Capabilities:
-            filtered = [q for q in p.Crafts if q != self]
-            self._Capabilities._Crafts = filtered
+            p._Crafts.discard(self)
         for r in value:
-            if self not in r._Crafts:
-                r._Crafts.append(self)
+            if r._Crafts is EMPTY:
+                r._Crafts = AssociationList([self])
+            else:
+                r._Crafts.add(self)
         self._Capabilities = value
 
     Capabilities = property(getCapabilities, setCapabilities)
 
     def addCapabilities(self, *Capabilities):
         for obj in Capabilities:
-            if self not in obj._Crafts:
-                obj._Crafts.append(self)
-            self._Capabilities.append(obj)
+            if obj._Crafts is EMPTY:
+                obj._Crafts = AssociationList([self])
+            else:
+                obj._Crafts.add(self)
+            if self._Capabilities is EMPTY:
+                self._Capabilities = AssociationList([obj])
+            else:
+                self._Capabilities.add(obj)
 
     def removeCapabilities(self, *Capabilities):
         for obj in Capabilities:
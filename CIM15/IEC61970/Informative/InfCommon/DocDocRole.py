@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Informative.InfCommon.Role import Role
+from CIM15.Element import AssociationList, EMPTY
 
 class DocDocRole(Role):
     """Roles played between Documents and other Documents.Roles played between Documents and other Documents.
@@ -51,13 +52,14 @@ class DocDocRole(Role):
 
     def setToDocument(self, value):
         if self._ToDocument is not None:
-            filtered = [x for x in self.ToDocument.FromDocumentRoles if x != self]
-            self._ToDocument._FromDocumentRoles = filtered
+            self._ToDocument._FromDocumentRoles.discard(self)
 
         self._ToDocument = value
         if self._ToDocument is not None:
-            if self not in self._ToDocument._FromDocumentRoles:
-                self._ToDocument._FromDocumentRoles.append(self)
+            if self._ToDocument._FromDocumentRoles is EMPTY:
+                self._ToDocument._FromDocumentRoles = AssociationList([self])
+            else:
+                self._ToDocument._FromDocumentRoles.add(self)
 
     ToDocument = property(getToDocument, setToDocument)
 
@@ -67,13 +69,14 @@ class DocDocRole(Role):
 
     def setFromDocument(self, value):
         if self._FromDocument is not None:
-            filtered = [x for x in self.FromDocument.ToDocumentRoles if x != self]
-            self._FromDocument._ToDocumentRoles = filtered
+            self._FromDocument._ToDocumentRoles.discard(self)
 
         self._FromDocument = value
         if self._FromDocument is not None:
-            if self not in self._FromDocument._ToDocumentRoles:
-                self._FromDocument._ToDocumentRoles.append(self)
+            if self._FromDocument._ToDocumentRoles is EMPTY:
+                self._FromDocument._ToDocumentRoles = AssociationList([self])
+            else:
+                self._FromDocument._ToDocumentRoles.add(self)
 
     FromDocument = property(getFromDocument, setFromDocument)
 
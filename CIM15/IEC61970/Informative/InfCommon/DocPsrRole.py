@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Informative.InfCommon.Role import Role
+from CIM15.Element import AssociationList, EMPTY
 
 class DocPsrRole(Role):
     """Potential roles that might played by a document relative to a type of PowerSystemResource.Potential roles that might played by a document relative to a type of PowerSystemResource.
@@ -51,13 +52,14 @@ class DocPsrRole(Role):
 
     def setDocument(self, value):
         if self._Document is not None:
-            filtered = [x for x in self.Document.PowerSystemResourceRoles if x != self]
-            self._Document._PowerSystemResourceRoles = filtered
+            self._Document._PowerSystemResourceRoles.discard(self)
 
         self._Document = value
         if self._Document is not None:
-            if self not in self._Document._PowerSystemResourceRoles:
-                self._Document._PowerSystemResourceRoles.append(self)
+            if self._Document._PowerSystemResourceRoles is EMPTY:
+                self._Document._PowerSystemResourceRoles = AssociationList([self])
+            else:
+                self._Document._PowerSystemResourceRoles.add(self)
 
     Document = property(getDocument, setDocument)
 
@@ -67,13 +69,14 @@ class DocPsrRole(Role):
 
     def setPowerSystemResource(self, value):
         if self._PowerSystemResource is not None:
-            filtered = [x for x in self.PowerSystemResource.DocumentRoles if x != self]
-            self._PowerSystemResource._DocumentRoles = filtered
+            self._PowerSystemResource._DocumentRoles.discard(self)
 
         self._PowerSystemResource = value
         if self._PowerSystemResource is not None:
-            if self not in self._PowerSystemResource._DocumentRoles:
-                self._PowerSystemResource._DocumentRoles.append(self)
+            if self._PowerSystemResource._DocumentRoles is EMPTY:
+                self._PowerSystemResource._DocumentRoles = AssociationList([self])
+            else:
+                self._PowerSystemResource._DocumentRoles.add(self)
 
     PowerSystemResource = property(getPowerSystemResource, setPowerSystemResource)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class ScheduleParameterInfo(IdentifiedObject):
     """Schedule parameters for an activity that is to occur, is occurring, or has completed.Schedule parameters for an activity that is to occur, is occurring, or has completed.
@@ -39,13 +40,15 @@ class ScheduleParameterInfo(IdentifiedObject):
 
         self.requestedWindow = requestedWindow
 
-        self._Documents = []
-        self.Documents = [] if Documents is None else Documents
+        self._Documents = EMPTY
+        if Documents is not None:
+            self.Documents = Documents
 
         self.estimatedWindow = estimatedWindow
 
-        self._ScheduledEvents = []
-        self.ScheduledEvents = [] if ScheduledEvents is None else ScheduledEvents
+        self._ScheduledEvents = EMPTY
+        if ScheduledEvents is not None:
+            self.ScheduledEvents = ScheduledEvents
 
         self.status = status
 
@@ -64,13 +67,14 @@ class ScheduleParameterInfo(IdentifiedObject):
 
     def setForInspectionDataSet(self, value):
         if self._ForInspectionDataSet is not None:
-            filtered = [x for x in self.ForInspectionDataSet.AccordingToSchedules if x != self]
-            self._ForInspectionDataSet._AccordingToSchedules = filtered
+            self._ForInspectionDataSet._AccordingToSchedules.discard(self)
 
         self._ForInspectionDataSet = value
         if self._ForInspectionDataSet is not None:
-            if self not in self._ForInspectionDataSet._AccordingToSchedules:
-                self._ForInspectionDataSet._AccordingToSchedules.append(self)
+            if self._ForInspectionDataSet._AccordingToSchedules is EMPTY:
+                self._ForInspectionDataSet._AccordingToSchedules = AssociationList([self])
+            else:
+                self._ForInspectionDataSet._AccordingToSchedules.add(self)
 
     ForInspectionDataSet = property(getForInspectionDataSet, setForInspectionDataSet)
 
@@ -82,21 +86,28 @@ class ScheduleParameterInfo(IdentifiedObject):
         return self._Documents
 
     def setDocuments(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Documents:
-            filtered = [q for q in p.ScheduleParameterInfos if q != self]
-            self._Documents._ScheduleParameterInfos = filtered
+            p._ScheduleParameterInfos.discard(self)
         for r in value:
-            if self not in r._ScheduleParameterInfos:
-                r._ScheduleParameterInfos.append(self)
+            if r._ScheduleParameterInfos is EMPTY:
+                r._ScheduleParameterInfos = AssociationList([self])
+            else:
+                r._ScheduleParameterInfos.add(self)
         self._Documents = value
 
     Documents = property(getDocuments, setDocuments)
 
     def addDocuments(self, *Documents):
         for obj in Documents:
-            if self not in obj._ScheduleParameterInfos:
-                obj._ScheduleParameterInfos.append(self)
-            self._Documents.append(obj)
+            if obj._ScheduleParameterInfos is EMPTY:
+                obj._ScheduleParameterInfos = AssociationList([self])
+            else:
+                obj._ScheduleParameterInfos.add(self)
+            if self._Documents is EMPTY:
+                self._Documents = AssociationList([obj])
+            else:
+                self._Documents.add(obj)
 
     def removeDocuments(self, *Documents):
         for obj in Documents:
@@ -112,6 +123,7 @@ class ScheduleParameterInfo(IdentifiedObject):
         return self._ScheduledEvents
 
     def setScheduledEvents(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ScheduledEvents:
             x.ScheduleParameterInfo = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import AssociationList, EMPTY
 
 class Skill(Document):
     """Proficiency level of a craft, which is required to operate or maintain a particular type of asset and/or perform certain types of work.Proficiency level of a craft, which is required to operate or maintain a particular type of asset and/or perform certain types of work.
@@ -40,14 +41,16 @@ class Skill(Document):
         #: Level of skill for a Craft. Values are: "apprentice", "other", "master", "standard"
         self.level = level
 
-        self._Crafts = []
-        self.Crafts = [] if Crafts is None else Crafts
+        self._Crafts = EMPTY
+        if Crafts is not None:
+            self.Crafts = Crafts
 
         self._ErpPerson = None
         self.ErpPerson = ErpPerson
 
-        self._QualificationRequirements = []
-        self.QualificationRequirements = [] if QualificationRequirements is None else QualificationRequirements
+        self._QualificationRequirements = EMPTY
+        if QualificationRequirements is not None:
+            self.QualificationRequirements = QualificationRequirements
 
         self.certificationPeriod = certificationPeriod
 
@@ -65,21 +68,28 @@ class Skill(Document):
         return self._Crafts
 
     def setCrafts(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Crafts:
-            filtered = [q for q in p.Skills if q != self]
-            self._Crafts._Skills = filtered
+            p._Skills.discard(self)
         for r in value:
-            if self not in r._Skills:
-                r._Skills.append(self)
+            if r._Skills is EMPTY:
+                r._Skills = AssociationList([self])
+            else:
+                r._Skills.add(self)
         self._Crafts = value
 
     Crafts = property(getCrafts, setCrafts)
 
     def addCrafts(self, *Crafts):
         for obj in Crafts:
-            if self not in obj._Skills:
-                obj._Skills.append(self)
-            self._Crafts.append(obj)
+            if obj._Skills is EMPTY:
+                obj._Skills = AssociationList([self])
+            else:
+                obj._Skills.add(self)
+            if self._Crafts is EMPTY:
+                self._Crafts = AssociationList([obj])
+            else:
+                self._Crafts.add(obj)
 
     def removeCrafts(self, *Crafts):
         for obj in Crafts:
@@ -93,13 +103,14 @@ class Skill(Document):
 
     def setErpPerson(self, value):
         if self._ErpPerson is not None:
-            filtered = [x for x in self.ErpPerson.Skills if x != self]
-            self._ErpPerson._Skills = filtered
+            self._ErpPerson._Skills.discard(self)
 
         self._ErpPerson = value
         if self._ErpPerson is not None:
-            if self not in self._ErpPerson._Skills:
-                self._ErpPerson._Skills.append(self)
+            if self._ErpPerson._Skills is EMPTY:
+                self._ErpPerson._Skills = AssociationList([self])
+            else:
+                self._ErpPerson._Skills.add(self)
 
     ErpPerson = property(getErpPerson, setErpPerson)
 
@@ -108,21 +119,28 @@ class Skill(Document):
         return self._QualificationRequirements
 
     def setQualificationRequirements(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._QualificationRequirements:
-            filtered = [q for q in p.Skills if q != self]
-            self._QualificationRequirements._Skills = filtered
+            p._Skills.discard(self)
         for r in value:
-            if self not in r._Skills:
-                r._Skills.append(self)
+            if r._Skills is EMPTY:
+                r._Skills = AssociationList([self])
+            else:
+                r._Skills.add(self)
         self._QualificationRequirements = value
 
     QualificationRequirements = property(getQualificationRequirements, setQualificationRequirements)
 
     def addQualificationRequirements(self, *QualificationRequirements):
         for obj in QualificationRequirements:
-            if self not in obj._Skills:
-                obj._Skills.append(self)
-            self._QualificationRequirements.append(obj)
+            if obj._Skills is EMPTY:
+                obj._Skills = AssociationList([self])
+            else:
+                obj._Skills.add(self)
+            if self._QualificationRequirements is EMPTY:
+                self._QualificationRequirements = AssociationList([obj])
+            else:
+                self._QualificationRequirements.add(obj)
 
     def removeQualificationRequirements(self, *QualificationRequirements):
         for obj in QualificationRequirements:
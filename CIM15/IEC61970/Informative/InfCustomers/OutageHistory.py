@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import AssociationList, EMPTY
 
 class OutageHistory(Document):
     """A document collecting OutageReports, that allows utilities to examine the number of outages suffered by a customer. Also provides data to calculate the total supply interruption to any customer over a given period.A document collecting OutageReports, that allows utilities to examine the number of outages suffered by a customer. Also provides data to calculate the total supply interruption to any customer over a given period.
@@ -29,8 +30,9 @@ class OutageHistory(Document):
 
         @param OutageReports: OutageReports per customer for which this OutageHistory is created.
         """
-        self._OutageReports = []
-        self.OutageReports = [] if OutageReports is None else OutageReports
+        self._OutageReports = EMPTY
+        if OutageReports is not None:
+            self.OutageReports = OutageReports
 
         super(OutageHistory, self).__init__(*args, **kw_args)
 
@@ -47,6 +49,7 @@ class OutageHistory(Document):
         return self._OutageReports
 
     def setOutageReports(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._OutageReports:
             x.OutageHistory = None
         for y in value:
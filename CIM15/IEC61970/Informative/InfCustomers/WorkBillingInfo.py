@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import AssociationList, EMPTY
 
 class WorkBillingInfo(Document):
     """Billing information for work performed for the customer. The history of Work Billing Info, Invoices, and Payments is to be maintained in associated ActivityRecords.Billing information for work performed for the customer. The history of Work Billing Info, Invoices, and Payments is to be maintained in associated ActivityRecords.
@@ -59,14 +60,16 @@ class WorkBillingInfo(Document):
         #: Amount of bill.
         self.workPrice = workPrice
 
-        self._Works = []
-        self.Works = [] if Works is None else Works
+        self._Works = EMPTY
+        if Works is not None:
+            self.Works = Works
 
         self._CustomerAccount = None
         self.CustomerAccount = CustomerAccount
 
-        self._ErpLineItems = []
-        self.ErpLineItems = [] if ErpLineItems is None else ErpLineItems
+        self._ErpLineItems = EMPTY
+        if ErpLineItems is not None:
+            self.ErpLineItems = ErpLineItems
 
         super(WorkBillingInfo, self).__init__(*args, **kw_args)
 
@@ -82,6 +85,7 @@ class WorkBillingInfo(Document):
         return self._Works
 
     def setWorks(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Works:
             x.WorkBillingInfo = None
         for y in value:
@@ -104,13 +108,14 @@ class WorkBillingInfo(Document):
 
     def setCustomerAccount(self, value):
         if self._CustomerAccount is not None:
-            filtered = [x for x in self.CustomerAccount.WorkBillingInfos if x != self]
-            self._CustomerAccount._WorkBillingInfos = filtered
+            self._CustomerAccount._WorkBillingInfos.discard(self)
 
         self._CustomerAccount = value
         if self._CustomerAccount is not None:
-            if self not in self._CustomerAccount._WorkBillingInfos:
-                self._CustomerAccount._WorkBillingInfos.append(self)
+            if self._CustomerAccount._WorkBillingInfos is EMPTY:
+                self._CustomerAccount._WorkBillingInfos = AssociationList([self])
+            else:
+                self._CustomerAccount._WorkBillingInfos.add(self)
 
     CustomerAccount = property(getCustomerAccount, setCustomerAccount)
 
@@ -119,21 +124,28 @@ class WorkBillingInfo(Document):
         return self._ErpLineItems
 
     def setErpLineItems(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ErpLineItems:
-            filtered = [q for q in p.WorkBillingInfos if q != self]
-            self._ErpLineItems._WorkBillingInfos = filtered
+            p._WorkBillingInfos.discard(self)
         for r in value:
-            if self not in r._WorkBillingInfos:
-                r._WorkBillingInfos.append(self)
+            if r._WorkBillingInfos is EMPTY:
+                r._WorkBillingInfos = AssociationList([self])
+            else:
+                r._WorkBillingInfos.add(self)
         self._ErpLineItems = value
 
     ErpLineItems = property(getErpLineItems, setErpLineItems)
 
     def addErpLineItems(self, *ErpLineItems):
         for obj in ErpLineItems:
-            if self not in obj._WorkBillingInfos:
-                obj._WorkBillingInfos.append(self)
-            self._ErpLineItems.append(obj)
+            if obj._WorkBillingInfos is EMPTY:
+                obj._WorkBillingInfos = AssociationList([self])
+            else:
+                obj._WorkBillingInfos.add(self)
+            if self._ErpLineItems is EMPTY:
+                self._ErpLineItems = AssociationList([obj])
+            else:
+                self._ErpLineItems.add(obj)
 
     def removeErpLineItems(self, *ErpLineItems):
         for obj in ErpLineItems:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Informative.InfCommon.Role import Role
+from CIM15.Element import AssociationList, EMPTY
 
 class DocErpPersonRole(Role):
     """Roles played between Persons and Documents.Roles played between Persons and Documents.
@@ -51,13 +52,14 @@ class DocErpPersonRole(Role):
 
     def setDocument(self, value):
         if self._Document is not None:
-            filtered = [x for x in self.Document.ErpPersonRoles if x != self]
-            self._Document._ErpPersonRoles = filtered
+            self._Document._ErpPersonRoles.discard(self)
 
         self._Document = value
         if self._Document is not None:
-            if self not in self._Document._ErpPersonRoles:
-                self._Document._ErpPersonRoles.append(self)
+            if self._Document._ErpPersonRoles is EMPTY:
+                self._Document._ErpPersonRoles = AssociationList([self])
+            else:
+                self._Document._ErpPersonRoles.add(self)
 
     Document = property(getDocument, setDocument)
 
@@ -67,13 +69,14 @@ class DocErpPersonRole(Role):
 
     def setErpPerson(self, value):
         if self._ErpPerson is not None:
-            filtered = [x for x in self.ErpPerson.DocumentRoles if x != self]
-            self._ErpPerson._DocumentRoles = filtered
+            self._ErpPerson._DocumentRoles.discard(self)
 
         self._ErpPerson = value
         if self._ErpPerson is not None:
-            if self not in self._ErpPerson._DocumentRoles:
-                self._ErpPerson._DocumentRoles.append(self)
+            if self._ErpPerson._DocumentRoles is EMPTY:
+                self._ErpPerson._DocumentRoles = AssociationList([self])
+            else:
+                self._ErpPerson._DocumentRoles.add(self)
 
     ErpPerson = property(getErpPerson, setErpPerson)
 
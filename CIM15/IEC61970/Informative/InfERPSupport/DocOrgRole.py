@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Informative.InfCommon.Role import Role
+from CIM15.Element import AssociationList, EMPTY
 
 class DocOrgRole(Role):
     """Roles played between Organisations and Documents.Roles played between Organisations and Documents.
@@ -51,13 +52,14 @@ class DocOrgRole(Role):
 
     def setDocument(self, value):
         if self._Document is not None:
-            filtered = [x for x in self.Document.ErpOrganisationRoles if x != self]
-            self._Document._ErpOrganisationRoles = filtered
+            self._Document._ErpOrganisationRoles.discard(self)
 
         self._Document = value
         if self._Document is not None:
-            if self not in self._Document._ErpOrganisationRoles:
-                self._Document._ErpOrganisationRoles.append(self)
+            if self._Document._ErpOrganisationRoles is EMPTY:
+                self._Document._ErpOrganisationRoles = AssociationList([self])
+            else:
+                self._Document._ErpOrganisationRoles.add(self)
 
     Document = property(getDocument, setDocument)
 
@@ -67,13 +69,14 @@ class DocOrgRole(Role):
 
     def setErpOrganisation(self, value):
         if self._ErpOrganisation is not None:
-            filtered = [x for x in self.ErpOrganisation.DocumentRoles if x != self]
-            self._ErpOrganisation._DocumentRoles = filtered
+            self._ErpOrganisation._DocumentRoles.discard(self)
 
         self._ErpOrganisation = value
         if self._ErpOrganisation is not None:
-            if self not in self._ErpOrganisation._DocumentRoles:
-                self._ErpOrganisation._DocumentRoles.append(self)
+            if self._ErpOrganisation._DocumentRoles is EMPTY:
+                self._ErpOrganisation._DocumentRoles = AssociationList([self])
+            else:
+                self._ErpOrganisation._DocumentRoles.add(self)
 
     ErpOrganisation = property(getErpOrganisation, setErpOrganisation)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import AssociationList, EMPTY
 
 class ErpBOM(Document):
     """Information that generally describes the Bill of Material Structure and its contents for a utility.  This is used by ERP systems to transfer Bill of Material information between two business applications.Information that generally describes the Bill of Material Structure and its contents for a utility.  This is used by ERP systems to transfer Bill of Material information between two business applications.
@@ -33,8 +34,9 @@ class ErpBOM(Document):
         self._Design = None
         self.Design = Design
 
-        self._ErpBomItemDatas = []
-        self.ErpBomItemDatas = [] if ErpBomItemDatas is None else ErpBomItemDatas
+        self._ErpBomItemDatas = EMPTY
+        if ErpBomItemDatas is not None:
+            self.ErpBomItemDatas = ErpBomItemDatas
 
         super(ErpBOM, self).__init__(*args, **kw_args)
 
@@ -51,13 +53,14 @@ class ErpBOM(Document):
 
     def setDesign(self, value):
         if self._Design is not None:
-            filtered = [x for x in self.Design.ErpBOMs if x != self]
-            self._Design._ErpBOMs = filtered
+            self._Design._ErpBOMs.discard(self)
 
         self._Design = value
         if self._Design is not None:
-            if self not in self._Design._ErpBOMs:
-                self._Design._ErpBOMs.append(self)
+            if self._Design._ErpBOMs is EMPTY:
+                self._Design._ErpBOMs = AssociationList([self])
+            else:
+                self._Design._ErpBOMs.add(self)
 
     Design = property(getDesign, setDesign)
 
@@ -66,6 +69,7 @@ class ErpBOM(Document):
         return self._ErpBomItemDatas
 
     def setErpBomItemDatas(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ErpBomItemDatas:
             x.ErpBOM = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class ErpBomItemData(IdentifiedObject):
     """An individual item on a bill of materials.An individual item on a bill of materials.
@@ -55,13 +56,14 @@ class ErpBomItemData(IdentifiedObject):
 
     def setTypeAsset(self, value):
         if self._TypeAsset is not None:
-            filtered = [x for x in self.TypeAsset.ErpBomItemDatas if x != self]
-            self._TypeAsset._ErpBomItemDatas = filtered
+            self._TypeAsset._ErpBomItemDatas.discard(self)
 
         self._TypeAsset = value
         if self._TypeAsset is not None:
-            if self not in self._TypeAsset._ErpBomItemDatas:
-                self._TypeAsset._ErpBomItemDatas.append(self)
+            if self._TypeAsset._ErpBomItemDatas is EMPTY:
+                self._TypeAsset._ErpBomItemDatas = AssociationList([self])
+            else:
+                self._TypeAsset._ErpBomItemDatas.add(self)
 
     TypeAsset = property(getTypeAsset, setTypeAsset)
 
@@ -71,13 +73,14 @@ class ErpBomItemData(IdentifiedObject):
 
     def setErpBOM(self, value):
         if self._ErpBOM is not None:
-            filtered = [x for x in self.ErpBOM.ErpBomItemDatas if x != self]
-            self._ErpBOM._ErpBomItemDatas = filtered
+            self._ErpBOM._ErpBomItemDatas.discard(self)
 
         self._ErpBOM = value
         if self._ErpBOM is not None:
-            if self not in self._ErpBOM._ErpBomItemDatas:
-                self._ErpBOM._ErpBomItemDatas.append(self)
+            if self._ErpBOM._ErpBomItemDatas is EMPTY:
+                self._ErpBOM._ErpBomItemDatas = AssociationList([self])
+            else:
+                self._ErpBOM._ErpBomItemDatas.add(self)
 
     ErpBOM = property(getErpBOM, setErpBOM)
 
@@ -87,13 +90,14 @@ class ErpBomItemData(IdentifiedObject):
 
     def setDesignLocation(self, value):
         if self._DesignLocation is not None:
-            filtered = [x for x in self.DesignLocation.ErpBomItemDatas if x != self]
-            self._DesignLocation._ErpBomItemDatas = filtered
+            self._DesignLocation._ErpBomItemDatas.discard(self)
 
         self._DesignLocation = value
         if self._DesignLocation is not None:
-            if self not in self._DesignLocation._ErpBomItemDatas:
-                self._DesignLocation._ErpBomItemDatas.append(self)
+            if self._DesignLocation._ErpBomItemDatas is EMPTY:
+                self._DesignLocation._ErpBomItemDatas = AssociationList([self])
+            else:
+                self._DesignLocation._ErpBomItemDatas.add(self)
 
     DesignLocation = property(getDesignLocation, setDesignLocation)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class ErpCompetency(IdentifiedObject):
     """Information that describes aptitudes of a utility employee. Unlike Skills that an ErpPerson must be certified to perform before undertaking certain type of assignments (to be able to perfrom a Craft), ErpCompetency has more to do with typical Human Resource (HR) matters such as schooling, training, etc.Information that describes aptitudes of a utility employee. Unlike Skills that an ErpPerson must be certified to perform before undertaking certain type of assignments (to be able to perfrom a Craft), ErpCompetency has more to do with typical Human Resource (HR) matters such as schooling, training, etc.
@@ -29,8 +30,9 @@ class ErpCompetency(IdentifiedObject):
 
         @param ErpPersons:
         """
-        self._ErpPersons = []
-        self.ErpPersons = [] if ErpPersons is None else ErpPersons
+        self._ErpPersons = EMPTY
+        if ErpPersons is not None:
+            self.ErpPersons = ErpPersons
 
         super(ErpCompetency, self).__init__(*args, **kw_args)
 
@@ -46,6 +48,7 @@ class ErpCompetency(IdentifiedObject):
         return self._ErpPersons
 
     def setErpPersons(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ErpPersons:
             x.ErpCompetency = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class ErpInventoryCount(IdentifiedObject):
     """This is related to Inventory physical counts organized by AssetModel. Note that a count of a type of asset can be accomplished by the association inherited by AssetModel (from Document) to Asset. It enables ERP applications to transfer an inventory count between ERP and the actual physical inventory location. This count may be a cycle count or a physical count.This is related to Inventory physical counts organized by AssetModel. Note that a count of a type of asset can be accomplished by the association inherited by AssetModel (from Document) to Asset. It enables ERP applications to transfer an inventory count between ERP and the actual physical inventory location. This count may be a cycle count or a physical count.
@@ -56,13 +57,14 @@ class ErpInventoryCount(IdentifiedObject):
 
     def setMaterialItem(self, value):
         if self._MaterialItem is not None:
-            filtered = [x for x in self.MaterialItem.ErpInventoryCounts if x != self]
-            self._MaterialItem._ErpInventoryCounts = filtered
+            self._MaterialItem._ErpInventoryCounts.discard(self)
 
         self._MaterialItem = value
         if self._MaterialItem is not None:
-            if self not in self._MaterialItem._ErpInventoryCounts:
-                self._MaterialItem._ErpInventoryCounts.append(self)
+            if self._MaterialItem._ErpInventoryCounts is EMPTY:
+                self._MaterialItem._ErpInventoryCounts = AssociationList([self])
+            else:
+                self._MaterialItem._ErpInventoryCounts.add(self)
 
     MaterialItem = property(getMaterialItem, setMaterialItem)
 
@@ -72,13 +74,14 @@ class ErpInventoryCount(IdentifiedObject):
 
     def setAssetModel(self, value):
         if self._AssetModel is not None:
-            filtered = [x for x in self.AssetModel.ErpInventoryCounts if x != self]
-            self._AssetModel._ErpInventoryCounts = filtered
+            self._AssetModel._ErpInventoryCounts.discard(self)
 
         self._AssetModel = value
         if self._AssetModel is not None:
-            if self not in self._AssetModel._ErpInventoryCounts:
-                self._AssetModel._ErpInventoryCounts.append(self)
+            if self._AssetModel._ErpInventoryCounts is EMPTY:
+                self._AssetModel._ErpInventoryCounts = AssociationList([self])
+            else:
+                self._AssetModel._ErpInventoryCounts.add(self)
 
     AssetModel = property(getAssetModel, setAssetModel)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import AssociationList, EMPTY
 
 class ErpInvoice(Document):
     """A roll up of invoice line items. The whole invoice has a due date and amount to be paid, with information such as customer, banks etc. being obtained through associations. The invoice roll up is based on individual line items that each contain amounts and descriptions for specific services or products.A roll up of invoice line items. The whole invoice has a due date and amount to be paid, with information such as customer, banks etc. being obtained through associations. The invoice roll up is based on individual line items that each contain amounts and descriptions for specific services or products.
@@ -66,8 +67,9 @@ class ErpInvoice(Document):
         #: True if payment is to be paid by a Customer to accept a particular ErpQuote (with associated Design) and have work initiated, at which time an associated ErpInvoice should automatically be generated. EprPayment.subjectStatus satisfies terms specificed in the ErpQuote.
         self.proForma = proForma
 
-        self._ErpInvoiceLineItems = []
-        self.ErpInvoiceLineItems = [] if ErpInvoiceLineItems is None else ErpInvoiceLineItems
+        self._ErpInvoiceLineItems = EMPTY
+        if ErpInvoiceLineItems is not None:
+            self.ErpInvoiceLineItems = ErpInvoiceLineItems
 
         self._CustomerAccount = None
         self.CustomerAccount = CustomerAccount
@@ -86,6 +88,7 @@ class ErpInvoice(Document):
         return self._ErpInvoiceLineItems
 
     def setErpInvoiceLineItems(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ErpInvoiceLineItems:
             x.ErpInvoice = None
         for y in value:
@@ -108,13 +111,14 @@ class ErpInvoice(Document):
 
     def setCustomerAccount(self, value):
         if self._CustomerAccount is not None:
-            filtered = [x for x in self.CustomerAccount.ErpInvoicees if x != self]
-            self._CustomerAccount._ErpInvoicees = filtered
+            self._CustomerAccount._ErpInvoicees.discard(self)
 
         self._CustomerAccount = value
         if self._CustomerAccount is not None:
-            if self not in self._CustomerAccount._ErpInvoicees:
-                self._CustomerAccount._ErpInvoicees.append(self)
+            if self._CustomerAccount._ErpInvoicees is EMPTY:
+                self._CustomerAccount._ErpInvoicees = AssociationList([self])
+            else:
+                self._CustomerAccount._ErpInvoicees.add(self)
 
     CustomerAccount = property(getCustomerAccount, setCustomerAccount)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import AssociationList, EMPTY
 
 class ErpInvoiceLineItem(Document):
     """An individual line item on an invoice.An individual line item on an invoice.
@@ -73,20 +74,23 @@ class ErpInvoiceLineItem(Document):
         #: Previous line item charge amount.
         self.previousAmount = previousAmount
 
-        self._ErpPayments = []
-        self.ErpPayments = [] if ErpPayments is None else ErpPayments
+        self._ErpPayments = EMPTY
+        if ErpPayments is not None:
+            self.ErpPayments = ErpPayments
 
         self._ContainerErpInvoiceLineItem = None
         self.ContainerErpInvoiceLineItem = ContainerErpInvoiceLineItem
 
-        self._WorkBillingInfos = []
-        self.WorkBillingInfos = [] if WorkBillingInfos is None else WorkBillingInfos
+        self._WorkBillingInfos = EMPTY
+        if WorkBillingInfos is not None:
+            self.WorkBillingInfos = WorkBillingInfos
 
         self._ErpQuoteLineItem = None
         self.ErpQuoteLineItem = ErpQuoteLineItem
 
-        self._UserAttributes = []
-        self.UserAttributes = [] if UserAttributes is None else UserAttributes
+        self._UserAttributes = EMPTY
+        if UserAttributes is not None:
+            self.UserAttributes = UserAttributes
 
         self._ErpRecDelvLineItem = None
         self.ErpRecDelvLineItem = ErpRecDelvLineItem
@@ -94,22 +98,25 @@ class ErpInvoiceLineItem(Document):
         self._ErpPayableLineItem = None
         self.ErpPayableLineItem = ErpPayableLineItem
 
-        self._ComponentErpInvoiceLineItems = []
-        self.ComponentErpInvoiceLineItems = [] if ComponentErpInvoiceLineItems is None else ComponentErpInvoiceLineItems
+        self._ComponentErpInvoiceLineItems = EMPTY
+        if ComponentErpInvoiceLineItems is not None:
+            self.ComponentErpInvoiceLineItems = ComponentErpInvoiceLineItems
 
         self.billPeriod = billPeriod
 
         self._ErpInvoice = None
         self.ErpInvoice = ErpInvoice
 
-        self._CustomerBillingInfos = []
-        self.CustomerBillingInfos = [] if CustomerBillingInfos is None else CustomerBillingInfos
+        self._CustomerBillingInfos = EMPTY
+        if CustomerBillingInfos is not None:
+            self.CustomerBillingInfos = CustomerBillingInfos
 
         self._ErpRecLineItem = None
         self.ErpRecLineItem = ErpRecLineItem
 
-        self._ErpJournalEntries = []
-        self.ErpJournalEntries = [] if ErpJournalEntries is None else ErpJournalEntries
+        self._ErpJournalEntries = EMPTY
+        if ErpJournalEntries is not None:
+            self.ErpJournalEntries = ErpJournalEntries
 
         super(ErpInvoiceLineItem, self).__init__(*args, **kw_args)
 
@@ -125,21 +132,28 @@ class ErpInvoiceLineItem(Document):
         return self._ErpPayments
 
     def setErpPayments(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ErpPayments:
-            filtered = [q for q in p.ErpInvoiceLineItems if q != self]
-            self._ErpPayments._ErpInvoiceLineItems = filtered
+            p._ErpInvoiceLineItems.discard(self)
         for r in value:
-            if self not in r._ErpInvoiceLineItems:
-                r._ErpInvoiceLineItems.append(self)
+            if r._ErpInvoiceLineItems is EMPTY:
+                r._ErpInvoiceLineItems = AssociationList([self])
+            else:
+                r._ErpInvoiceLineItems.add(self)
         self._ErpPayments = value
 
     ErpPayments = property(getErpPayments, setErpPayments)
 
     def addErpPayments(self, *ErpPayments):
         for obj in ErpPayments:
-            if self not in obj._ErpInvoiceLineItems:
-                obj._ErpInvoiceLineItems.append(self)
-            self._ErpPayments.append(obj)
+            if obj._ErpInvoiceLineItems is EMPTY:
+                obj._ErpInvoiceLineItems = AssociationList([self])
+            else:
+                obj._ErpInvoiceLineItems.add(self)
+            if self._ErpPayments is EMPTY:
+                self._ErpPayments = AssociationList([obj])
+            else:
+                self._ErpPayments.add(obj)
 
     def removeErpPayments(self, *ErpPayments):
         for obj in ErpPayments:
@@ -153,13 +167,14 @@ class ErpInvoiceLineItem(Document):
 
     def setContainerErpInvoiceLineItem(self, value):
         if self._ContainerErpInvoiceLineItem is not None:
-            filtered = [x for x in self.ContainerErpInvoiceLineItem.ComponentErpInvoiceLineItems if x != self]
-            self._ContainerErpInvoiceLineItem._ComponentErpInvoiceLineItems = filtered
+            self._ContainerErpInvoiceLineItem._ComponentErpInvoiceLineItems.discard(self)
 
         self._ContainerErpInvoiceLineItem = value
         if self._ContainerErpInvoiceLineItem is not None:
-            if self not in self._ContainerErpInvoiceLineItem._ComponentErpInvoiceLineItems:
-                self._ContainerErpInvoiceLineItem._ComponentErpInvoiceLineItems.append(self)
+            if self._ContainerErpInvoiceLineItem._ComponentErpInvoiceLineItems is EMPTY:
+                self._ContainerErpInvoiceLineItem._ComponentErpInvoiceLineItems = AssociationList([self])
+            else:
+                self._ContainerErpInvoiceLineItem._ComponentErpInvoiceLineItems.add(self)
 
     ContainerErpInvoiceLineItem = property(getContainerErpInvoiceLineItem, setContainerErpInvoiceLineItem)
 
@@ -168,21 +183,28 @@ class ErpInvoiceLineItem(Document):
         return self._WorkBillingInfos
 
     def setWorkBillingInfos(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._WorkBillingInfos:
-            filtered = [q for q in p.ErpLineItems if q != self]
-            self._WorkBillingInfos._ErpLineItems = filtered
+            p._ErpLineItems.discard(self)
         for r in value:
-            if self not in r._ErpLineItems:
-                r._ErpLineItems.append(self)
+            if r._ErpLineItems is EMPTY:
+                r._ErpLineItems = AssociationList([self])
+            else:
+                r._ErpLineItems.add(self)
         self._WorkBillingInfos = value
 
     WorkBillingInfos = property(getWorkBillingInfos, setWorkBillingInfos)
 
     def addWorkBillingInfos(self, *WorkBillingInfos):
         for obj in WorkBillingInfos:
-            if self not in obj._ErpLineItems:
-                obj._ErpLineItems.append(self)
-            self._WorkBillingInfos.append(obj)
+            if obj._ErpLineItems is EMPTY:
+                obj._ErpLineItems = AssociationList([self])
+            else:
+                obj._ErpLineItems.add(self)
+            if self._WorkBillingInfos is EMPTY:
+                self._WorkBillingInfos = AssociationList([obj])
+            else:
+                self._WorkBillingInfos.add(obj)
 
     def removeWorkBillingInfos(self, *WorkBillingInfos):
         for obj in WorkBillingInfos:
@@ -210,21 +232,28 @@ class ErpInvoiceLineItem(Document):
         return self._UserAttributes
 
     def setUserAttributes(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._UserAttributes:
-            filtered = [q for q in p.ErpInvoiceLineItems if q != self]
-            self._UserAttributes._ErpInvoiceLineItems = filtered
+            p._ErpInvoiceLineItems.discard(self)
         for r in value:
-            if self not in r._ErpInvoiceLineItems:
-                r._ErpInvoiceLineItems.append(self)
+            if r._ErpInvoiceLineItems is EMPTY:
+                r._ErpInvoiceLineItems = AssociationList([self])
+            else:
+                r._ErpInvoiceLineItems.add(self)
         self._UserAttributes = value
 
     UserAttributes = property(getUserAttributes, setUserAttributes)
 
     def addUserAttributes(self, *UserAttributes):
         for obj in UserAttributes:
-            if self not in obj._ErpInvoiceLineItems:
-                obj._ErpInvoiceLineItems.append(self)
-            self._UserAttributes.append(obj)
+            if obj._ErpInvoiceLineItems is EMPTY:
+                obj._ErpInvoiceLineItems = AssociationList([self])
+            else:
+                obj._ErpInvoiceLineItems.add(self)
+            if self._UserAttributes is EMPTY:
+                self._UserAttributes = AssociationList([obj])
+            else:
+                self._UserAttributes.add(obj)
 
     def removeUserAttributes(self, *UserAttributes):
         for obj in UserAttributes:
@@ -267,6 +296,7 @@ class ErpInvoiceLineItem(Document):
         return self._ComponentErpInvoiceLineItems
 
     def setComponentErpInvoiceLineItems(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ComponentErpInvoiceLineItems:
             x.ContainerErpInvoiceLineItem = None
         for y in value:
@@ -292,13 +322,14 @@ class ErpInvoiceLineItem(Document):
 
     def setErpInvoice(self, value):
         if self._ErpInvoice is not None:
-            filtered = [x for x in self.ErpInvoice.ErpInvoiceLineItems if x != self]
-            self._ErpInvoice._ErpInvoiceLineItems = filtered
+            self._ErpInvoice._ErpInvoiceLineItems.discard(self)
 
         self._ErpInvoice = value
         if self._ErpInvoice is not None:
-            if self not in self._ErpInvoice._ErpInvoiceLineItems:
-                self._ErpInvoice._ErpInvoiceLineItems.append(self)
+            if self._ErpInvoice._ErpInvoiceLineItems is EMPTY:
+                self._ErpInvoice._ErpInvoiceLineItems = AssociationList([self])
+            else:
+                self._ErpInvoice._ErpInvoiceLineItems.add(self)
 
     ErpInvoice = property(getErpInvoice, setErpInvoice)
 
@@ -308,21 +339,28 @@ class ErpInvoiceLineItem(Document):
         return self._CustomerBillingInfos
 
     def setCustomerBillingInfos(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._CustomerBillingInfos:
-            filtered = [q for q in p.ErpInvoiceLineItems if q != self]
-            self._CustomerBillingInfos._ErpInvoiceLineItems = filtered
+            p._ErpInvoiceLineItems.discard(self)
         for r in value:
-            if self not in r._ErpInvoiceLineItems:
-                r._ErpInvoiceLineItems.append(self)
+            if r._ErpInvoiceLineItems is EMPTY:
+                r._ErpInvoiceLineItems = AssociationList([self])
+            else:
+                r._ErpInvoiceLineItems.add(self)
         self._CustomerBillingInfos = value
 
     CustomerBillingInfos = property(getCustomerBillingInfos, setCustomerBillingInfos)
 
     def addCustomerBillingInfos(self, *CustomerBillingInfos):
         for obj in CustomerBillingInfos:
-            if self not in obj._ErpInvoiceLineItems:
-                obj._ErpInvoiceLineItems.append(self)
-            self._CustomerBillingInfos.append(obj)
+            if obj._ErpInvoiceLineItems is EMPTY:
+                obj._ErpInvoiceLineItems = AssociationList([self])
+            else:
+                obj._ErpInvoiceLineItems.add(self)
+            if self._CustomerBillingInfos is EMPTY:
+                self._CustomerBillingInfos = AssociationList([obj])
+            else:
+                self._CustomerBillingInfos.add(obj)
 
     def removeCustomerBillingInfos(self, *CustomerBillingInfos):
         for obj in CustomerBillingInfos:
@@ -350,6 +388,7 @@ class ErpInvoiceLineItem(Document):
         return self._ErpJournalEntries
 
     def setErpJournalEntries(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ErpJournalEntries:
             x.ErpInvoiceLineItem = None
         for y in value:
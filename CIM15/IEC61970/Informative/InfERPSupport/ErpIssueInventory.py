@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class ErpIssueInventory(IdentifiedObject):
     """Can be used to request an application to process an issue or request information about an issue.Can be used to request an application to process an issue or request information about an issue.
@@ -54,13 +55,14 @@ class ErpIssueInventory(IdentifiedObject):
 
     def setTypeAsset(self, value):
         if self._TypeAsset is not None:
-            filtered = [x for x in self.TypeAsset.ErpInventoryIssues if x != self]
-            self._TypeAsset._ErpInventoryIssues = filtered
+            self._TypeAsset._ErpInventoryIssues.discard(self)
 
         self._TypeAsset = value
         if self._TypeAsset is not None:
-            if self not in self._TypeAsset._ErpInventoryIssues:
-                self._TypeAsset._ErpInventoryIssues.append(self)
+            if self._TypeAsset._ErpInventoryIssues is EMPTY:
+                self._TypeAsset._ErpInventoryIssues = AssociationList([self])
+            else:
+                self._TypeAsset._ErpInventoryIssues.add(self)
 
     TypeAsset = property(getTypeAsset, setTypeAsset)
 
@@ -72,13 +74,14 @@ class ErpIssueInventory(IdentifiedObject):
 
     def setTypeMaterial(self, value):
         if self._TypeMaterial is not None:
-            filtered = [x for x in self.TypeMaterial.ErpIssueInventories if x != self]
-            self._TypeMaterial._ErpIssueInventories = filtered
+            self._TypeMaterial._ErpIssueInventories.discard(self)
 
         self._TypeMaterial = value
         if self._TypeMaterial is not None:
-            if self not in self._TypeMaterial._ErpIssueInventories:
-                self._TypeMaterial._ErpIssueInventories.append(self)
+            if self._TypeMaterial._ErpIssueInventories is EMPTY:
+                self._TypeMaterial._ErpIssueInventories = AssociationList([self])
+            else:
+                self._TypeMaterial._ErpIssueInventories.add(self)
 
     TypeMaterial = property(getTypeMaterial, setTypeMaterial)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class ErpJournalEntry(IdentifiedObject):
     """Details of an individual entry in a journal, which is to be posted to a ledger on the posting date.Details of an individual entry in a journal, which is to be posted to a ledger on the posting date.
@@ -57,20 +58,23 @@ class ErpJournalEntry(IdentifiedObject):
 
         self.status = status
 
-        self._ErpPayableLineItems = []
-        self.ErpPayableLineItems = [] if ErpPayableLineItems is None else ErpPayableLineItems
+        self._ErpPayableLineItems = EMPTY
+        if ErpPayableLineItems is not None:
+            self.ErpPayableLineItems = ErpPayableLineItems
 
         self._ErpInvoiceLineItem = None
         self.ErpInvoiceLineItem = ErpInvoiceLineItem
 
-        self._ErpRecLineItems = []
-        self.ErpRecLineItems = [] if ErpRecLineItems is None else ErpRecLineItems
+        self._ErpRecLineItems = EMPTY
+        if ErpRecLineItems is not None:
+            self.ErpRecLineItems = ErpRecLineItems
 
         self._ErpLedgerEntry = None
         self.ErpLedgerEntry = ErpLedgerEntry
 
-        self._CostTypes = []
-        self.CostTypes = [] if CostTypes is None else CostTypes
+        self._CostTypes = EMPTY
+        if CostTypes is not None:
+            self.CostTypes = CostTypes
 
         self._ErpJournal = None
         self.ErpJournal = ErpJournal
@@ -91,21 +95,28 @@ class ErpJournalEntry(IdentifiedObject):
         return self._ErpPayableLineItems
 
     def setErpPayableLineItems(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ErpPayableLineItems:
-            filtered = [q for q in p.ErpJournalEntries if q != self]
-            self._ErpPayableLineItems._ErpJournalEntries = filtered
+            p._ErpJournalEntries.discard(self)
         for r in value:
-            if self not in r._ErpJournalEntries:
-                r._ErpJournalEntries.append(self)
+            if r._ErpJournalEntries is EMPTY:
+                r._ErpJournalEntries = AssociationList([self])
+            else:
+                r._ErpJournalEntries.add(self)
         self._ErpPayableLineItems = value
 
     ErpPayableLineItems = property(getErpPayableLineItems, setErpPayableLineItems)
 
     def addErpPayableLineItems(self, *ErpPayableLineItems):
         for obj in ErpPayableLineItems:
-            if self not in obj._ErpJournalEntries:
-                obj._ErpJournalEntries.append(self)
-            self._ErpPayableLineItems.append(obj)
+            if obj._ErpJournalEntries is EMPTY:
+                obj._ErpJournalEntries = AssociationList([self])
+            else:
+                obj._ErpJournalEntries.add(self)
+            if self._ErpPayableLineItems is EMPTY:
+                self._ErpPayableLineItems = AssociationList([obj])
+            else:
+                self._ErpPayableLineItems.add(obj)
 
     def removeErpPayableLineItems(self, *ErpPayableLineItems):
         for obj in ErpPayableLineItems:
@@ -119,13 +130,14 @@ class ErpJournalEntry(IdentifiedObject):
 
     def setErpInvoiceLineItem(self, value):
         if self._ErpInvoiceLineItem is not None:
-            filtered = [x for x in self.ErpInvoiceLineItem.ErpJournalEntries if x != self]
-            self._ErpInvoiceLineItem._ErpJournalEntries = filtered
+            self._ErpInvoiceLineItem._ErpJournalEntries.discard(self)
 
         self._ErpInvoiceLineItem = value
         if self._ErpInvoiceLineItem is not None:
-            if self not in self._ErpInvoiceLineItem._ErpJournalEntries:
-                self._ErpInvoiceLineItem._ErpJournalEntries.append(self)
+            if self._ErpInvoiceLineItem._ErpJournalEntries is EMPTY:
+                self._ErpInvoiceLineItem._ErpJournalEntries = AssociationList([self])
+            else:
+                self._ErpInvoiceLineItem._ErpJournalEntries.add(self)
 
     ErpInvoiceLineItem = property(getErpInvoiceLineItem, setErpInvoiceLineItem)
 
@@ -134,21 +146,28 @@ class ErpJournalEntry(IdentifiedObject):
         return self._ErpRecLineItems
 
     def setErpRecLineItems(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ErpRecLineItems:
-            filtered = [q for q in p.ErpJournalEntries if q != self]
-            self._ErpRecLineItems._ErpJournalEntries = filtered
+            p._ErpJournalEntries.discard(self)
         for r in value:
-            if self not in r._ErpJournalEntries:
-                r._ErpJournalEntries.append(self)
+            if r._ErpJournalEntries is EMPTY:
+                r._ErpJournalEntries = AssociationList([self])
+            else:
+                r._ErpJournalEntries.add(self)
         self._ErpRecLineItems = value
 
     ErpRecLineItems = property(getErpRecLineItems, setErpRecLineItems)
 
     def addErpRecLineItems(self, *ErpRecLineItems):
         for obj in ErpRecLineItems:
-            if self not in obj._ErpJournalEntries:
-                obj._ErpJournalEntries.append(self)
-            self._ErpRecLineItems.append(obj)
+            if obj._ErpJournalEntries is EMPTY:
+                obj._ErpJournalEntries = AssociationList([self])
+            else:
+                obj._ErpJournalEntries.add(self)
+            if self._ErpRecLineItems is EMPTY:
+                self._ErpRecLineItems = AssociationList([obj])
+            else:
+                self._ErpRecLineItems.add(obj)
 
     def removeErpRecLineItems(self, *ErpRecLineItems):
         for obj in ErpRecLineItems:
@@ -176,21 +195,28 @@ class ErpJournalEntry(IdentifiedObject):
         return self._CostTypes
 
     def setCostTypes(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._CostTypes:
-            filtered = [q for q in p.ErpJournalEntries if q != self]
-            self._CostTypes._ErpJournalEntries = filtered
+            p._ErpJournalEntries.discard(self)
         for r in value:
-            if self not in r._ErpJournalEntries:
-                r._ErpJournalEntries.append(self)
+            if r._ErpJournalEntries is EMPTY:
+                r._ErpJournalEntries = AssociationList([self])
+            else:
+                r._ErpJournalEntries.add(self)
         self._CostTypes = value
 
     CostTypes = property(getCostTypes, setCostTypes)
 
     def addCostTypes(self, *CostTypes):
         for obj in CostTypes:
-            if self not in obj._ErpJournalEntries:
-                obj._ErpJournalEntries.append(self)
-            self._CostTypes.append(obj)
+            if obj._ErpJournalEntries is EMPTY:
+                obj._ErpJournalEntries = AssociationList([self])
+            else:
+                obj._ErpJournalEntries.add(self)
+            if self._CostTypes is EMPTY:
+                self._CostTypes = AssociationList([obj])
+            else:
+                self._CostTypes.add(obj)
 
     def removeCostTypes(self, *CostTypes):
         for obj in CostTypes:
@@ -204,13 +230,14 @@ class ErpJournalEntry(IdentifiedObject):
 
     def setErpJournal(self, value):
         if self._ErpJournal is not None:
-            filtered = [x for x in self.ErpJournal.ErpJournalEntries if x != self]
-            self._ErpJournal._ErpJournalEntries = filtered
+            self._ErpJournal._ErpJournalEntries.discard(self)
 
         self._ErpJournal = value
         if self._ErpJournal is not None:
-            if self not in self._ErpJournal._ErpJournalEntries:
-                self._ErpJournal._ErpJournalEntries.append(self)
+            if self._ErpJournal._ErpJournalEntries is EMPTY:
+                self._ErpJournal._ErpJournalEntries = AssociationList([self])
+            else:
+                self._ErpJournal._ErpJournalEntries.add(self)
 
     ErpJournal = property(getErpJournal, setErpJournal)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class ErpLedBudLineItem(IdentifiedObject):
     """Individual entry of a given Ledger Budget, typically containing information such as amount, accounting date, accounting period, and is associated with the applicable general ledger account.Individual entry of a given Ledger Budget, typically containing information such as amount, accounting date, accounting period, and is associated with the applicable general ledger account.
@@ -69,13 +70,14 @@ class ErpLedBudLineItem(IdentifiedObject):
 
     def setErpLedgerBudget(self, value):
         if self._ErpLedgerBudget is not None:
-            filtered = [x for x in self.ErpLedgerBudget.ErpLedBudLineItems if x != self]
-            self._ErpLedgerBudget._ErpLedBudLineItems = filtered
+            self._ErpLedgerBudget._ErpLedBudLineItems.discard(self)
 
         self._ErpLedgerBudget = value
         if self._ErpLedgerBudget is not None:
-            if self not in self._ErpLedgerBudget._ErpLedBudLineItems:
-                self._ErpLedgerBudget._ErpLedBudLineItems.append(self)
+            if self._ErpLedgerBudget._ErpLedBudLineItems is EMPTY:
+                self._ErpLedgerBudget._ErpLedBudLineItems = AssociationList([self])
+            else:
+                self._ErpLedgerBudget._ErpLedBudLineItems.add(self)
 
     ErpLedgerBudget = property(getErpLedgerBudget, setErpLedgerBudget)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import AssociationList, EMPTY
 
 class ErpLedger(Document):
     """In accounting transactions, a ledger is a book containing accounts to which debits and credits are posted from journals, where transactions are initially recorded. Journal entries are periodically posted to the ledger. Ledger Actual represents actual amounts by account within ledger within company or business area. Actual amounts may be generated in a source application and then loaded to a specific ledger within the enterprise general ledger or budget application.In accounting transactions, a ledger is a book containing accounts to which debits and credits are posted from journals, where transactions are initially recorded. Journal entries are periodically posted to the ledger. Ledger Actual represents actual amounts by account within ledger within company or business area. Actual amounts may be generated in a source application and then loaded to a specific ledger within the enterprise general ledger or budget application.
@@ -29,8 +30,9 @@ class ErpLedger(Document):
 
         @param ErpLedgerEntries:
         """
-        self._ErpLedgerEntries = []
-        self.ErpLedgerEntries = [] if ErpLedgerEntries is None else ErpLedgerEntries
+        self._ErpLedgerEntries = EMPTY
+        if ErpLedgerEntries is not None:
+            self.ErpLedgerEntries = ErpLedgerEntries
 
         super(ErpLedger, self).__init__(*args, **kw_args)
 
@@ -46,6 +48,7 @@ class ErpLedger(Document):
         return self._ErpLedgerEntries
 
     def setErpLedgerEntries(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ErpLedgerEntries:
             x.ErpLedger = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import AssociationList, EMPTY
 
 class ErpLedgerBudget(Document):
     """Information for utility Ledger Budgets. They support the transfer budget amounts between all possible source applications throughout an enterprise and a general ledger or budget application.Information for utility Ledger Budgets. They support the transfer budget amounts between all possible source applications throughout an enterprise and a general ledger or budget application.
@@ -29,8 +30,9 @@ class ErpLedgerBudget(Document):
 
         @param ErpLedBudLineItems:
         """
-        self._ErpLedBudLineItems = []
-        self.ErpLedBudLineItems = [] if ErpLedBudLineItems is None else ErpLedBudLineItems
+        self._ErpLedBudLineItems = EMPTY
+        if ErpLedBudLineItems is not None:
+            self.ErpLedBudLineItems = ErpLedBudLineItems
 
         super(ErpLedgerBudget, self).__init__(*args, **kw_args)
 
@@ -46,6 +48,7 @@ class ErpLedgerBudget(Document):
         return self._ErpLedBudLineItems
 
     def setErpLedBudLineItems(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ErpLedBudLineItems:
             x.ErpLedgerBudget = None
         for y in value:
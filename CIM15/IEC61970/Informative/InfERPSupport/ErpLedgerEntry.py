@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class ErpLedgerEntry(IdentifiedObject):
     """Details of an individual entry in a ledger, which was posted from a journal on the posted date.Details of an individual entry in a ledger, which was posted from a journal on the posted date.
@@ -61,8 +62,9 @@ class ErpLedgerEntry(IdentifiedObject):
         self._ErpLedgerEntry = None
         self.ErpLedgerEntry = ErpLedgerEntry
 
-        self._UserAttributes = []
-        self.UserAttributes = [] if UserAttributes is None else UserAttributes
+        self._UserAttributes = EMPTY
+        if UserAttributes is not None:
+            self.UserAttributes = UserAttributes
 
         self._ErpJounalEntry = None
         self.ErpJounalEntry = ErpJounalEntry
@@ -82,13 +84,14 @@ class ErpLedgerEntry(IdentifiedObject):
 
     def setErpLedger(self, value):
         if self._ErpLedger is not None:
-            filtered = [x for x in self.ErpLedger.ErpLedgerEntries if x != self]
-            self._ErpLedger._ErpLedgerEntries = filtered
+            self._ErpLedger._ErpLedgerEntries.discard(self)
 
         self._ErpLedger = value
         if self._ErpLedger is not None:
-            if self not in self._ErpLedger._ErpLedgerEntries:
-                self._ErpLedger._ErpLedgerEntries.append(self)
+            if self._ErpLedger._ErpLedgerEntries is EMPTY:
+                self._ErpLedger._ErpLedgerEntries = AssociationList([self])
+            else:
+                self._ErpLedger._ErpLedgerEntries.add(self)
 
     ErpLedger = property(getErpLedger, setErpLedger)
 
@@ -114,21 +117,28 @@ class ErpLedgerEntry(IdentifiedObject):
         return self._UserAttributes
 
     def setUserAttributes(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._UserAttributes:
-            filtered = [q for q in p.ErpLedgerEntries if q != self]
-            self._UserAttributes._ErpLedgerEntries = filtered
+            p._ErpLedgerEntries.discard(self)
         for r in value:
-            if self not in r._ErpLedgerEntries:
-                r._ErpLedgerEntries.append(self)
+            if r._ErpLedgerEntries is EMPTY:
+                r._ErpLedgerEntries = AssociationList([self])
+            else:
+                r._ErpLedgerEntries.add(self)
         self._UserAttributes = value
 
     UserAttributes = property(getUserAttributes, setUserAttributes)
 
     def addUserAttributes(self, *UserAttributes):
         for obj in UserAttributes:
-            if self not in obj._ErpLedgerEntries:
-                obj._ErpLedgerEntries.append(self)
-            self._UserAttributes.append(obj)
+            if obj._ErpLedgerEntries is EMPTY:
+                obj._ErpLedgerEntries = AssociationList([self])
+            else:
+                obj._ErpLedgerEntries.add(self)
+            if self._UserAttributes is EMPTY:
+                self._UserAttributes = AssociationList([obj])
+            else:
+                self._UserAttributes.add(obj)
 
     def removeUserAttributes(self, *UserAttributes):
         for obj in UserAttributes:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Organisation import Organisation
+from CIM15.Element import AssociationList, EMPTY
 
 class ErpOrganisation(Organisation):
     """Identifies organisations that might have roles as utilities, contractors, suppliers, manufacturers, customers, etc. Organisations may also have parent-child relationships to identify departments within an organisation, or parent company relationships. The organization may be internal (e.g., departments) or external to the utility. There may be multiple organizations of a given 'category', each with a unique 'code'.Identifies organisations that might have roles as utilities, contractors, suppliers, manufacturers, customers, etc. Organisations may also have parent-child relationships to identify departments within an organisation, or parent company relationships. The organization may be internal (e.g., departments) or external to the utility. There may be multiple organizations of a given 'category', each with a unique 'code'.
@@ -72,41 +73,53 @@ class ErpOrganisation(Organisation):
         #: Operational mode of the organisation, often required for outage reporting purposes. Some utilities use text to describe various modes (like nominal, emergency, storm, other), while others use severity ratings (for example, 0 is a nominal condition and 5 is the most severe condition).
         self.mode = mode
 
-        self._AssetRoles = []
-        self.AssetRoles = [] if AssetRoles is None else AssetRoles
+        self._AssetRoles = EMPTY
+        if AssetRoles is not None:
+            self.AssetRoles = AssetRoles
 
-        self._Requests = []
-        self.Requests = [] if Requests is None else Requests
+        self._Requests = EMPTY
+        if Requests is not None:
+            self.Requests = Requests
 
-        self._Crews = []
-        self.Crews = [] if Crews is None else Crews
+        self._Crews = EMPTY
+        if Crews is not None:
+            self.Crews = Crews
 
-        self._ChangeItems = []
-        self.ChangeItems = [] if ChangeItems is None else ChangeItems
+        self._ChangeItems = EMPTY
+        if ChangeItems is not None:
+            self.ChangeItems = ChangeItems
 
-        self._ErpPersonRoles = []
-        self.ErpPersonRoles = [] if ErpPersonRoles is None else ErpPersonRoles
+        self._ErpPersonRoles = EMPTY
+        if ErpPersonRoles is not None:
+            self.ErpPersonRoles = ErpPersonRoles
 
-        self._ActivityRecords = []
-        self.ActivityRecords = [] if ActivityRecords is None else ActivityRecords
+        self._ActivityRecords = EMPTY
+        if ActivityRecords is not None:
+            self.ActivityRecords = ActivityRecords
 
-        self._ParentOrganisationRoles = []
-        self.ParentOrganisationRoles = [] if ParentOrganisationRoles is None else ParentOrganisationRoles
+        self._ParentOrganisationRoles = EMPTY
+        if ParentOrganisationRoles is not None:
+            self.ParentOrganisationRoles = ParentOrganisationRoles
 
-        self._Locations = []
-        self.Locations = [] if Locations is None else Locations
+        self._Locations = EMPTY
+        if Locations is not None:
+            self.Locations = Locations
 
-        self._ChildOrganisationRoles = []
-        self.ChildOrganisationRoles = [] if ChildOrganisationRoles is None else ChildOrganisationRoles
+        self._ChildOrganisationRoles = EMPTY
+        if ChildOrganisationRoles is not None:
+            self.ChildOrganisationRoles = ChildOrganisationRoles
 
-        self._PowerSystemResourceRoles = []
-        self.PowerSystemResourceRoles = [] if PowerSystemResourceRoles is None else PowerSystemResourceRoles
+        self._PowerSystemResourceRoles = EMPTY
+        if PowerSystemResourceRoles is not None:
+            self.PowerSystemResourceRoles = PowerSystemResourceRoles
 
-        self._LandPropertyRoles = []
-        self.LandPropertyRoles = [] if LandPropertyRoles is None else LandPropertyRoles
+        self._LandPropertyRoles = EMPTY
+        if LandPropertyRoles is not None:
+            self.LandPropertyRoles = LandPropertyRoles
 
-        self._DocumentRoles = []
-        self.DocumentRoles = [] if DocumentRoles is None else DocumentRoles
+        self._DocumentRoles = EMPTY
+        if DocumentRoles is not None:
+            self.DocumentRoles = DocumentRoles
 
         super(ErpOrganisation, self).__init__(*args, **kw_args)
 
@@ -122,6 +135,7 @@ class ErpOrganisation(Organisation):
         return self._AssetRoles
 
     def setAssetRoles(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._AssetRoles:
             x.ErpOrganisation = None
         for y in value:
@@ -143,6 +157,7 @@ class ErpOrganisation(Organisation):
         return self._Requests
 
     def setRequests(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Requests:
             x.Organisation = None
         for y in value:
@@ -164,21 +179,28 @@ class ErpOrganisation(Organisation):
         return self._Crews
 
     def setCrews(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Crews:
-            filtered = [q for q in p.Organisations if q != self]
-            self._Crews._Organisations = filtered
+            p._Organisations.discard(self)
         for r in value:
-            if self not in r._Organisations:
-                r._Organisations.append(self)
+            if r._Organisations is EMPTY:
+                r._Organisations = AssociationList([self])
+            else:
+                r._Organisations.add(self)
         self._Crews = value
 
     Crews = property(getCrews, setCrews)
 
     def addCrews(self, *Crews):
         for obj in Crews:
-            if self not in obj._Organisations:
-                obj._Organisations.append(self)
-            self._Crews.append(obj)
+            if obj._Organisations is EMPTY:
+                obj._Organisations = AssociationList([self])
+            else:
+                obj._Organisations.add(self)
+            if self._Crews is EMPTY:
+                self._Crews = AssociationList([obj])
+            else:
+                self._Crews.add(obj)
 
     def removeCrews(self, *Crews):
         for obj in Crews:
@@ -191,6 +213,7 @@ class ErpOrganisation(Organisation):
         return self._ChangeItems
 
     def setChangeItems(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ChangeItems:
             x.Organisation = None
         for y in value:
@@ -212,6 +235,7 @@ class ErpOrganisation(Organisation):
         return self._ErpPersonRoles
 
     def setErpPersonRoles(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ErpPersonRoles:
             x.ErpOrganisation = None
         for y in value:
@@ -233,21 +257,28 @@ class ErpOrganisation(Organisation):
         return self._ActivityRecords
 
     def setActivityRecords(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ActivityRecords:
-            filtered = [q for q in p.Organisations if q != self]
-            self._ActivityRecords._Organisations = filtered
+            p._Organisations.discard(self)
         for r in value:
-            if self not in r._Organisations:
-                r._Organisations.append(self)
+            if r._Organisations is EMPTY:
+                r._Organisations = AssociationList([self])
+            else:
+                r._Organisations.add(self)
         self._ActivityRecords = value
 
     ActivityRecords = property(getActivityRecords, setActivityRecords)
 
     def addActivityRecords(self, *ActivityRecords):
         for obj in ActivityRecords:
-            if self not in obj._Organisations:
-                obj._Organisations.append(self)
-            self._ActivityRecords.append(obj)
+            if obj._Organisations is EMPTY:
+                obj._Organisations = AssociationList([self])
+            else:
+                obj._Organisations.add(self)
+            if self._ActivityRecords is EMPTY:
+                self._ActivityRecords = AssociationList([obj])
+            else:
+                self._ActivityRecords.add(obj)
 
     def removeActivityRecords(self, *ActivityRecords):
         for obj in ActivityRecords:
@@ -260,6 +291,7 @@ class ErpOrganisation(Organisation):
         return self._ParentOrganisationRoles
 
     def setParentOrganisationRoles(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ParentOrganisationRoles:
             x.ChildOrganisation = None
         for y in value:
@@ -281,21 +313,28 @@ class ErpOrganisation(Organisation):
         return self._Locations
 
     def setLocations(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Locations:
-            filtered = [q for q in p.ErpOrganisations if q != self]
-            self._Locations._ErpOrganisations = filtered
+            p._ErpOrganisations.discard(self)
         for r in value:
-            if self not in r._ErpOrganisations:
-                r._ErpOrganisations.append(self)
+            if r._ErpOrganisations is EMPTY:
+                r._ErpOrganisations = AssociationList([self])
+            else:
+                r._ErpOrganisations.add(self)
         self._Locations = value
 
     Locations = property(getLocations, setLocations)
 
     def addLocations(self, *Locations):
         for obj in Locations:
-            if self not in obj._ErpOrganisations:
-                obj._ErpOrganisations.append(self)
-            self._Locations.append(obj)
+            if obj._ErpOrganisations is EMPTY:
+                obj._ErpOrganisations = AssociationList([self])
+            else:
+                obj._ErpOrganisations.add(self)
+            if self._Locations is EMPTY:
+                self._Locations = AssociationList([obj])
+            else:
+                self._Locations.add(obj)
 
     def removeLocations(self, *Locations):
         for obj in Locations:
@@ -308,6 +347,7 @@ class ErpOrganisation(Organisation):
         return self._ChildOrganisationRoles
 
     def setChildOrganisationRoles(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ChildOrganisationRoles:
             x.ParentOrganisation = None
         for y in value:
@@ -329,6 +369,7 @@ class ErpOrganisation(Organisation):
         return self._PowerSystemResourceRoles
 
     def setPowerSystemResourceRoles(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._PowerSystemResourceRoles:
             x.ErpOrganisation = None
         for y in value:
@@ -350,6 +391,7 @@ class ErpOrganisation(Organisation):
         return self._LandPropertyRoles
 
     def setLandPropertyRoles(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._LandPropertyRoles:
             x.ErpOrganisation = None
         for y in value:
@@ -371,6 +413,7 @@ class ErpOrganisation(Organisation):
         return self._DocumentRoles
 
     def setDocumentRoles(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._DocumentRoles:
             x.ErpOrganisation = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import AssociationList, EMPTY
 
 class ErpPOLineItem(Document):
     """Of an ErpPurchaseOrder, this is an individually ordered item or product along with the quantity, price and other descriptive information.Of an ErpPurchaseOrder, this is an individually ordered item or product along with the quantity, price and other descriptive information.
@@ -63,13 +64,14 @@ class ErpPOLineItem(Document):
 
     def setErpPurchaseOrder(self, value):
         if self._ErpPurchaseOrder is not None:
-            filtered = [x for x in self.ErpPurchaseOrder.ErpPOLineItems if x != self]
-            self._ErpPurchaseOrder._ErpPOLineItems = filtered
+            self._ErpPurchaseOrder._ErpPOLineItems.discard(self)
 
         self._ErpPurchaseOrder = value
         if self._ErpPurchaseOrder is not None:
-            if self not in self._ErpPurchaseOrder._ErpPOLineItems:
-                self._ErpPurchaseOrder._ErpPOLineItems.append(self)
+            if self._ErpPurchaseOrder._ErpPOLineItems is EMPTY:
+                self._ErpPurchaseOrder._ErpPOLineItems = AssociationList([self])
+            else:
+                self._ErpPurchaseOrder._ErpPOLineItems.add(self)
 
     ErpPurchaseOrder = property(getErpPurchaseOrder, setErpPurchaseOrder)
 
@@ -94,13 +96,14 @@ class ErpPOLineItem(Document):
 
     def setAssetModelCatalogueItem(self, value):
         if self._AssetModelCatalogueItem is not None:
-            filtered = [x for x in self.AssetModelCatalogueItem.ErpPOLineItems if x != self]
-            self._AssetModelCatalogueItem._ErpPOLineItems = filtered
+            self._AssetModelCatalogueItem._ErpPOLineItems.discard(self)
 
         self._AssetModelCatalogueItem = value
         if self._AssetModelCatalogueItem is not None:
-            if self not in self._AssetModelCatalogueItem._ErpPOLineItems:
-                self._AssetModelCatalogueItem._ErpPOLineItems.append(self)
+            if self._AssetModelCatalogueItem._ErpPOLineItems is EMPTY:
+                self._AssetModelCatalogueItem._ErpPOLineItems = AssociationList([self])
+            else:
+                self._AssetModelCatalogueItem._ErpPOLineItems.add(self)
 
     AssetModelCatalogueItem = property(getAssetModelCatalogueItem, setAssetModelCatalogueItem)
 
@@ -110,13 +113,14 @@ class ErpPOLineItem(Document):
 
     def setMaterialItem(self, value):
         if self._MaterialItem is not None:
-            filtered = [x for x in self.MaterialItem.ErpPOLineItems if x != self]
-            self._MaterialItem._ErpPOLineItems = filtered
+            self._MaterialItem._ErpPOLineItems.discard(self)
 
         self._MaterialItem = value
         if self._MaterialItem is not None:
-            if self not in self._MaterialItem._ErpPOLineItems:
-                self._MaterialItem._ErpPOLineItems.append(self)
+            if self._MaterialItem._ErpPOLineItems is EMPTY:
+                self._MaterialItem._ErpPOLineItems = AssociationList([self])
+            else:
+                self._MaterialItem._ErpPOLineItems.add(self)
 
     MaterialItem = property(getMaterialItem, setMaterialItem)
 
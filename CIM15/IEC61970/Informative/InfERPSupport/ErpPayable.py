@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import AssociationList, EMPTY
 
 class ErpPayable(Document):
     """A transaction that represents an invoice from a supplier. A payable (or voucher) is an open item, approved and ready for payment, in the Accounts Payable ledger.A transaction that represents an invoice from a supplier. A payable (or voucher) is an open item, approved and ready for payment, in the Accounts Payable ledger.
@@ -30,11 +31,13 @@ class ErpPayable(Document):
         @param ContractorItems:
         @param ErpPayableLineItems:
         """
-        self._ContractorItems = []
-        self.ContractorItems = [] if ContractorItems is None else ContractorItems
+        self._ContractorItems = EMPTY
+        if ContractorItems is not None:
+            self.ContractorItems = ContractorItems
 
-        self._ErpPayableLineItems = []
-        self.ErpPayableLineItems = [] if ErpPayableLineItems is None else ErpPayableLineItems
+        self._ErpPayableLineItems = EMPTY
+        if ErpPayableLineItems is not None:
+            self.ErpPayableLineItems = ErpPayableLineItems
 
         super(ErpPayable, self).__init__(*args, **kw_args)
 
@@ -50,21 +53,28 @@ class ErpPayable(Document):
         return self._ContractorItems
 
     def setContractorItems(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ContractorItems:
-            filtered = [q for q in p.ErpPayables if q != self]
-            self._ContractorItems._ErpPayables = filtered
+            p._ErpPayables.discard(self)
         for r in value:
-            if self not in r._ErpPayables:
-                r._ErpPayables.append(self)
+            if r._ErpPayables is EMPTY:
+                r._ErpPayables = AssociationList([self])
+            else:
+                r._ErpPayables.add(self)
         self._ContractorItems = value
 
     ContractorItems = property(getContractorItems, setContractorItems)
 
     def addContractorItems(self, *ContractorItems):
         for obj in ContractorItems:
-            if self not in obj._ErpPayables:
-                obj._ErpPayables.append(self)
-            self._ContractorItems.append(obj)
+            if obj._ErpPayables is EMPTY:
+                obj._ErpPayables = AssociationList([self])
+            else:
+                obj._ErpPayables.add(self)
+            if self._ContractorItems is EMPTY:
+                self._ContractorItems = AssociationList([obj])
+            else:
+                self._ContractorItems.add(obj)
 
     def removeContractorItems(self, *ContractorItems):
         for obj in ContractorItems:
@@ -77,6 +87,7 @@ class ErpPayable(Document):
         return self._ErpPayableLineItems
 
     def setErpPayableLineItems(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ErpPayableLineItems:
             x.ErpPayable = None
         for y in value:
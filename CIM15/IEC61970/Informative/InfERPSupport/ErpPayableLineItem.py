@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class ErpPayableLineItem(IdentifiedObject):
     """Of an ErpPayable, a line item references an ErpInvoiceLineitem or other source such as credit memos.Of an ErpPayable, a line item references an ErpInvoiceLineitem or other source such as credit memos.
@@ -33,11 +34,13 @@ class ErpPayableLineItem(IdentifiedObject):
         @param ErpPayable:
         @param status:
         """
-        self._ErpPayments = []
-        self.ErpPayments = [] if ErpPayments is None else ErpPayments
+        self._ErpPayments = EMPTY
+        if ErpPayments is not None:
+            self.ErpPayments = ErpPayments
 
-        self._ErpJournalEntries = []
-        self.ErpJournalEntries = [] if ErpJournalEntries is None else ErpJournalEntries
+        self._ErpJournalEntries = EMPTY
+        if ErpJournalEntries is not None:
+            self.ErpJournalEntries = ErpJournalEntries
 
         self._ErpInvoiceLineItem = None
         self.ErpInvoiceLineItem = ErpInvoiceLineItem
@@ -61,21 +64,28 @@ class ErpPayableLineItem(IdentifiedObject):
         return self._ErpPayments
 
     def setErpPayments(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ErpPayments:
-            filtered = [q for q in p.ErpPayableLineItems if q != self]
-            self._ErpPayments._ErpPayableLineItems = filtered
+            p._ErpPayableLineItems.discard(self)
         for r in value:
-            if self not in r._ErpPayableLineItems:
-                r._ErpPayableLineItems.append(self)
+            if r._ErpPayableLineItems is EMPTY:
+                r._ErpPayableLineItems = AssociationList([self])
+            else:
+                r._ErpPayableLineItems.add(self)
         self._ErpPayments = value
 
     ErpPayments = property(getErpPayments, setErpPayments)
 
     def addErpPayments(self, *ErpPayments):
         for obj in ErpPayments:
-            if self not in obj._ErpPayableLineItems:
-                obj._ErpPayableLineItems.append(self)
-            self._ErpPayments.append(obj)
+            if obj._ErpPayableLineItems is EMPTY:
+                obj._ErpPayableLineItems = AssociationList([self])
+            else:
+                obj._ErpPayableLineItems.add(self)
+            if self._ErpPayments is EMPTY:
+                self._ErpPayments = AssociationList([obj])
+            else:
+                self._ErpPayments.add(obj)
 
     def removeErpPayments(self, *ErpPayments):
         for obj in ErpPayments:
@@ -88,21 +98,28 @@ class ErpPayableLineItem(IdentifiedObject):
         return self._ErpJournalEntries
 
     def setErpJournalEntries(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ErpJournalEntries:
-            filtered = [q for q in p.ErpPayableLineItems if q != self]
-            self._ErpJournalEntries._ErpPayableLineItems = filtered
+            p._ErpPayableLineItems.discard(self)
         for r in value:
-            if self not in r._ErpPayableLineItems:
-                r._ErpPayableLineItems.append(self)
+            if r._ErpPayableLineItems is EMPTY:
+                r._ErpPayableLineItems = AssociationList([self])
+            else:
+                r._ErpPayableLineItems.add(self)
         self._ErpJournalEntries = value
 
     ErpJournalEntries = property(getErpJournalEntries, setErpJournalEntries)
 
     def addErpJournalEntries(self, *ErpJournalEntries):
         for obj in ErpJournalEntries:
-            if self not in obj._ErpPayableLineItems:
-                obj._ErpPayableLineItems.append(self)
-            self._ErpJournalEntries.append(obj)
+            if obj._ErpPayableLineItems is EMPTY:
+                obj._ErpPayableLineItems = AssociationList([self])
+            else:
+                obj._ErpPayableLineItems.add(self)
+            if self._ErpJournalEntries is EMPTY:
+                self._ErpJournalEntries = AssociationList([obj])
+            else:
+                self._ErpJournalEntries.add(obj)
 
     def removeErpJournalEntries(self, *ErpJournalEntries):
         for obj in ErpJournalEntries:
@@ -131,13 +148,14 @@ class ErpPayableLineItem(IdentifiedObject):
 
     def setErpPayable(self, value):
         if self._ErpPayable is not None:
-            filtered = [x for x in self.ErpPayable.ErpPayableLineItems if x != self]
-            self._ErpPayable._ErpPayableLineItems = filtered
+            self._ErpPayable._ErpPayableLineItems.discard(self)
 
         self._ErpPayable = value
         if self._ErpPayable is not None:
-            if self not in self._ErpPayable._ErpPayableLineItems:
-                self._ErpPayable._ErpPayableLineItems.append(self)
+            if self._ErpPayable._ErpPayableLineItems is EMPTY:
+                self._ErpPayable._ErpPayableLineItems = AssociationList([self])
+            else:
+                self._ErpPayable._ErpPayableLineItems.add(self)
 
     ErpPayable = property(getErpPayable, setErpPayable)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import AssociationList, EMPTY
 
 class ErpPayment(Document):
     """Payment infromation and status for any individual line item of an ErpInvoice (e.g., when payment is from a customer). ErpPayable is also updated when payment is to a supplier and ErpReceivable is updated when payment is from a customer. Multiple payments can be made against a single line item and an individual payment can apply to more that one line item.Payment infromation and status for any individual line item of an ErpInvoice (e.g., when payment is from a customer). ErpPayable is also updated when payment is to a supplier and ErpReceivable is updated when payment is from a customer. Multiple payments can be made against a single line item and an individual payment can apply to more that one line item.
@@ -35,14 +36,17 @@ class ErpPayment(Document):
         #: Payment terms (e.g., net 30).
         self.termsPayment = termsPayment
 
-        self._ErpRecLineItems = []
-        self.ErpRecLineItems = [] if ErpRecLineItems is None else ErpRecLineItems
+        self._ErpRecLineItems = EMPTY
+        if ErpRecLineItems is not None:
+            self.ErpRecLineItems = ErpRecLineItems
 
-        self._ErpPayableLineItems = []
-        self.ErpPayableLineItems = [] if ErpPayableLineItems is None else ErpPayableLineItems
+        self._ErpPayableLineItems = EMPTY
+        if ErpPayableLineItems is not None:
+            self.ErpPayableLineItems = ErpPayableLineItems
 
-        self._ErpInvoiceLineItems = []
-        self.ErpInvoiceLineItems = [] if ErpInvoiceLineItems is None else ErpInvoiceLineItems
+        self._ErpInvoiceLineItems = EMPTY
+        if ErpInvoiceLineItems is not None:
+            self.ErpInvoiceLineItems = ErpInvoiceLineItems
 
         super(ErpPayment, self).__init__(*args, **kw_args)
 
@@ -58,21 +62,28 @@ class ErpPayment(Document):
         return self._ErpRecLineItems
 
     def setErpRecLineItems(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ErpRecLineItems:
-            filtered = [q for q in p.ErpPayments if q != self]
-            self._ErpRecLineItems._ErpPayments = filtered
+            p._ErpPayments.discard(self)
         for r in value:
-            if self not in r._ErpPayments:
-                r._ErpPayments.append(self)
+            if r._ErpPayments is EMPTY:
+                r._ErpPayments = AssociationList([self])
+            else:
+                r._ErpPayments.add(self)
         self._ErpRecLineItems = value
 
     ErpRecLineItems = property(getErpRecLineItems, setErpRecLineItems)
 
     def addErpRecLineItems(self, *ErpRecLineItems):
         for obj in ErpRecLineItems:
-            if self not in obj._ErpPayments:
-                obj._ErpPayments.append(self)
-            self._ErpRecLineItems.append(obj)
+            if obj._ErpPayments is EMPTY:
+                obj._ErpPayments = AssociationList([self])
+            else:
+                obj._ErpPayments.add(self)
+            if self._ErpRecLineItems is EMPTY:
+                self._ErpRecLineItems = AssociationList([obj])
+            else:
+                self._ErpRecLineItems.add(obj)
 
     def removeErpRecLineItems(self, *ErpRecLineItems):
         for obj in ErpRecLineItems:
@@ -85,21 +96,28 @@ class ErpPayment(Document):
         return self._ErpPayableLineItems
 
     def setErpPayableLineItems(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ErpPayableLineItems:
-            filtered = [q for q in p.ErpPayments if q != self]
-            self._ErpPayableLineItems._ErpPayments = filtered
+            p._ErpPayments.discard(self)
         for r in value:
-            if self not in r._ErpPayments:
-                r._ErpPayments.append(self)
+            if r._ErpPayments is EMPTY:
+                r._ErpPayments = AssociationList([self])
+            else:
+                r._ErpPayments.add(self)
         self._ErpPayableLineItems = value
 
     ErpPayableLineItems = property(getErpPayableLineItems, setErpPayableLineItems)
 
     def addErpPayableLineItems(self, *ErpPayableLineItems):
         for obj in ErpPayableLineItems:
-            if self not in obj._ErpPayments:
-                obj._ErpPayments.append(self)
-            self._ErpPayableLineItems.append(obj)
+            if obj._ErpPayments is EMPTY:
+                obj._ErpPayments = AssociationList([self])
+            else:
+                obj._ErpPayments.add(self)
+            if self._ErpPayableLineItems is EMPTY:
+                self._ErpPayableLineItems = AssociationList([obj])
+            else:
+                self._ErpPayableLineItems.add(obj)
 
     def removeErpPayableLineItems(self, *ErpPayableLineItems):
         for obj in ErpPayableLineItems:
@@ -112,21 +130,28 @@ class ErpPayment(Document):
         return self._ErpInvoiceLineItems
 
     def setErpInvoiceLineItems(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ErpInvoiceLineItems:
-            filtered = [q for q in p.ErpPayments if q != self]
-            self._ErpInvoiceLineItems._ErpPayments = filtered
+            p._ErpPayments.discard(self)
         for r in value:
-            if self not in r._ErpPayments:
-                r._ErpPayments.append(self)
+            if r._ErpPayments is EMPTY:
+                r._ErpPayments = AssociationList([self])
+            else:
+                r._ErpPayments.add(self)
         self._ErpInvoiceLineItems = value
 
     ErpInvoiceLineItems = property(getErpInvoiceLineItems, setErpInvoiceLineItems)
 
     def addErpInvoiceLineItems(self, *ErpInvoiceLineItems):
         for obj in ErpInvoiceLineItems:
-            if self not in obj._ErpPayments:
-                obj._ErpPayments.append(self)
-            self._ErpInvoiceLineItems.append(obj)
+            if obj._ErpPayments is EMPTY:
+                obj._ErpPayments = AssociationList([self])
+            else:
+                obj._ErpPayments.add(self)
+            if self._ErpInvoiceLineItems is EMPTY:
+                self._ErpInvoiceLineItems = AssociationList([obj])
+            else:
+                self._ErpInvoiceLineItems.add(obj)
 
     def removeErpInvoiceLineItems(self, *ErpInvoiceLineItems):
         for obj in ErpInvoiceLineItems:
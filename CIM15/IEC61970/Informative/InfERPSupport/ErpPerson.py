@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class ErpPerson(IdentifiedObject):
     """General purpose information for name and other information to contact people.General purpose information for name and other information to contact people.
@@ -84,56 +85,69 @@ class ErpPerson(IdentifiedObject):
         self._ServiceLocation = None
         self.ServiceLocation = ServiceLocation
 
-        self._ErpOrganisationRoles = []
-        self.ErpOrganisationRoles = [] if ErpOrganisationRoles is None else ErpOrganisationRoles
+        self._ErpOrganisationRoles = EMPTY
+        if ErpOrganisationRoles is not None:
+            self.ErpOrganisationRoles = ErpOrganisationRoles
 
-        self._Appointments = []
-        self.Appointments = [] if Appointments is None else Appointments
+        self._Appointments = EMPTY
+        if Appointments is not None:
+            self.Appointments = Appointments
 
-        self._Crews = []
-        self.Crews = [] if Crews is None else Crews
+        self._Crews = EMPTY
+        if Crews is not None:
+            self.Crews = Crews
 
-        self._LaborItems = []
-        self.LaborItems = [] if LaborItems is None else LaborItems
+        self._LaborItems = EMPTY
+        if LaborItems is not None:
+            self.LaborItems = LaborItems
 
-        self._LandPropertyRoles = []
-        self.LandPropertyRoles = [] if LandPropertyRoles is None else LandPropertyRoles
+        self._LandPropertyRoles = EMPTY
+        if LandPropertyRoles is not None:
+            self.LandPropertyRoles = LandPropertyRoles
 
-        self._ActivityRecords = []
-        self.ActivityRecords = [] if ActivityRecords is None else ActivityRecords
+        self._ActivityRecords = EMPTY
+        if ActivityRecords is not None:
+            self.ActivityRecords = ActivityRecords
 
-        self._MeasurementValues = []
-        self.MeasurementValues = [] if MeasurementValues is None else MeasurementValues
+        self._MeasurementValues = EMPTY
+        if MeasurementValues is not None:
+            self.MeasurementValues = MeasurementValues
 
-        self._Skills = []
-        self.Skills = [] if Skills is None else Skills
+        self._Skills = EMPTY
+        if Skills is not None:
+            self.Skills = Skills
 
         self.landlinePhone = landlinePhone
 
         self.mobilePhone = mobilePhone
 
-        self._ChangeItems = []
-        self.ChangeItems = [] if ChangeItems is None else ChangeItems
+        self._ChangeItems = EMPTY
+        if ChangeItems is not None:
+            self.ChangeItems = ChangeItems
 
         self.status = status
 
-        self._DocumentRoles = []
-        self.DocumentRoles = [] if DocumentRoles is None else DocumentRoles
+        self._DocumentRoles = EMPTY
+        if DocumentRoles is not None:
+            self.DocumentRoles = DocumentRoles
 
         self._ErpPersonnel = None
         self.ErpPersonnel = ErpPersonnel
 
-        self._Crafts = []
-        self.Crafts = [] if Crafts is None else Crafts
+        self._Crafts = EMPTY
+        if Crafts is not None:
+            self.Crafts = Crafts
 
         self._CustomerData = None
         self.CustomerData = CustomerData
 
-        self._CallBacks = []
-        self.CallBacks = [] if CallBacks is None else CallBacks
+        self._CallBacks = EMPTY
+        if CallBacks is not None:
+            self.CallBacks = CallBacks
 
-        self._SwitchingStepRoles = []
-        self.SwitchingStepRoles = [] if SwitchingStepRoles is None else SwitchingStepRoles
+        self._SwitchingStepRoles = EMPTY
+        if SwitchingStepRoles is not None:
+            self.SwitchingStepRoles = SwitchingStepRoles
 
         self.electronicAddress = electronicAddress
 
@@ -155,13 +169,14 @@ class ErpPerson(IdentifiedObject):
 
     def setServiceLocation(self, value):
         if self._ServiceLocation is not None:
-            filtered = [x for x in self.ServiceLocation.ErpPersons if x != self]
-            self._ServiceLocation._ErpPersons = filtered
+            self._ServiceLocation._ErpPersons.discard(self)
 
         self._ServiceLocation = value
         if self._ServiceLocation is not None:
-            if self not in self._ServiceLocation._ErpPersons:
-                self._ServiceLocation._ErpPersons.append(self)
+            if self._ServiceLocation._ErpPersons is EMPTY:
+                self._ServiceLocation._ErpPersons = AssociationList([self])
+            else:
+                self._ServiceLocation._ErpPersons.add(self)
 
     ServiceLocation = property(getServiceLocation, setServiceLocation)
 
@@ -170,6 +185,7 @@ class ErpPerson(IdentifiedObject):
         return self._ErpOrganisationRoles
 
     def setErpOrganisationRoles(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ErpOrganisationRoles:
             x.ErpPerson = None
         for y in value:
@@ -191,21 +207,28 @@ class ErpPerson(IdentifiedObject):
         return self._Appointments
 
     def setAppointments(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Appointments:
-            filtered = [q for q in p.ErpPersons if q != self]
-            self._Appointments._ErpPersons = filtered
+            p._ErpPersons.discard(self)
         for r in value:
-            if self not in r._ErpPersons:
-                r._ErpPersons.append(self)
+            if r._ErpPersons is EMPTY:
+                r._ErpPersons = AssociationList([self])
+            else:
+                r._ErpPersons.add(self)
         self._Appointments = value
 
     Appointments = property(getAppointments, setAppointments)
 
     def addAppointments(self, *Appointments):
         for obj in Appointments:
-            if self not in obj._ErpPersons:
-                obj._ErpPersons.append(self)
-            self._Appointments.append(obj)
+            if obj._ErpPersons is EMPTY:
+                obj._ErpPersons = AssociationList([self])
+            else:
+                obj._ErpPersons.add(self)
+            if self._Appointments is EMPTY:
+                self._Appointments = AssociationList([obj])
+            else:
+                self._Appointments.add(obj)
 
     def removeAppointments(self, *Appointments):
         for obj in Appointments:
@@ -219,21 +242,28 @@ class ErpPerson(IdentifiedObject):
         return self._Crews
 
     def setCrews(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Crews:
-            filtered = [q for q in p.CrewMembers if q != self]
-            self._Crews._CrewMembers = filtered
+            p._CrewMembers.discard(self)
         for r in value:
-            if self not in r._CrewMembers:
-                r._CrewMembers.append(self)
+            if r._CrewMembers is EMPTY:
+                r._CrewMembers = AssociationList([self])
+            else:
+                r._CrewMembers.add(self)
         self._Crews = value
 
     Crews = property(getCrews, setCrews)
 
     def addCrews(self, *Crews):
         for obj in Crews:
-            if self not in obj._CrewMembers:
-                obj._CrewMembers.append(self)
-            self._Crews.append(obj)
+            if obj._CrewMembers is EMPTY:
+                obj._CrewMembers = AssociationList([self])
+            else:
+                obj._CrewMembers.add(self)
+            if self._Crews is EMPTY:
+                self._Crews = AssociationList([obj])
+            else:
+                self._Crews.add(obj)
 
     def removeCrews(self, *Crews):
         for obj in Crews:
@@ -246,21 +276,28 @@ class ErpPerson(IdentifiedObject):
         return self._LaborItems
 
     def setLaborItems(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._LaborItems:
-            filtered = [q for q in p.ErpPersons if q != self]
-            self._LaborItems._ErpPersons = filtered
+            p._ErpPersons.discard(self)
         for r in value:
-            if self not in r._ErpPersons:
-                r._ErpPersons.append(self)
+            if r._ErpPersons is EMPTY:
+                r._ErpPersons = AssociationList([self])
+            else:
+                r._ErpPersons.add(self)
         self._LaborItems = value
 
     LaborItems = property(getLaborItems, setLaborItems)
 
     def addLaborItems(self, *LaborItems):
         for obj in LaborItems:
-            if self not in obj._ErpPersons:
-                obj._ErpPersons.append(self)
-            self._LaborItems.append(obj)
+            if obj._ErpPersons is EMPTY:
+                obj._ErpPersons = AssociationList([self])
+            else:
+                obj._ErpPersons.add(self)
+            if self._LaborItems is EMPTY:
+                self._LaborItems = AssociationList([obj])
+            else:
+                self._LaborItems.add(obj)
 
     def removeLaborItems(self, *LaborItems):
         for obj in LaborItems:
@@ -273,6 +310,7 @@ class ErpPerson(IdentifiedObject):
         return self._LandPropertyRoles
 
     def setLandPropertyRoles(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._LandPropertyRoles:
             x.ErpPerson = None
         for y in value:
@@ -294,21 +332,28 @@ class ErpPerson(IdentifiedObject):
         return self._ActivityRecords
 
     def setActivityRecords(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ActivityRecords:
-            filtered = [q for q in p.ErpPersons if q != self]
-            self._ActivityRecords._ErpPersons = filtered
+            p._ErpPersons.discard(self)
         for r in value:
-            if self not in r._ErpPersons:
-                r._ErpPersons.append(self)
+            if r._ErpPersons is EMPTY:
+                r._ErpPersons = AssociationList([self])
+            else:
+                r._ErpPersons.add(self)
         self._ActivityRecords = value
 
     ActivityRecords = property(getActivityRecords, setActivityRecords)
 
     def addActivityRecords(self, *ActivityRecords):
         for obj in ActivityRecords:
-            if self not in obj._ErpPersons:
-                obj._ErpPersons.append(self)
-            self._ActivityRecords.append(obj)
+            if obj._ErpPersons is EMPTY:
+                obj._ErpPersons = AssociationList([self])
+            else:
+                obj._ErpPersons.add(self)
+            if self._ActivityRecords is EMPTY:
+                self._ActivityRecords = AssociationList([obj])
+            else:
+                self._ActivityRecords.add(obj)
 
     def removeActivityRecords(self, *ActivityRecords):
         for obj in ActivityRecords:
@@ -321,6 +366,7 @@ class ErpPerson(IdentifiedObject):
         return self._MeasurementValues
 
     def setMeasurementValues(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._MeasurementValues:
             x.ErpPerson = None
         for y in value:
@@ -342,6 +388,7 @@ class ErpPerson(IdentifiedObject):
         return self._Skills
 
     def setSkills(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Skills:
             x.ErpPerson = None
         for y in value:
@@ -369,6 +416,7 @@ class ErpPerson(IdentifiedObject):
         return self._ChangeItems
 
     def setChangeItems(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ChangeItems:
             x.ErpPerson = None
         for y in value:
@@ -392,6 +440,7 @@ class ErpPerson(IdentifiedObject):
         return self._DocumentRoles
 
     def setDocumentRoles(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._DocumentRoles:
             x.ErpPerson = None
         for y in value:
@@ -414,13 +463,14 @@ class ErpPerson(IdentifiedObject):
 
     def setErpPersonnel(self, value):
         if self._ErpPersonnel is not None:
-            filtered = [x for x in self.ErpPersonnel.ErpPersons if x != self]
-            self._ErpPersonnel._ErpPersons = filtered
+            self._ErpPersonnel._ErpPersons.discard(self)
 
         self._ErpPersonnel = value
         if self._ErpPersonnel is not None:
-            if self not in self._ErpPersonnel._ErpPersons:
-                self._ErpPersonnel._ErpPersons.append(self)
+            if self._ErpPersonnel._ErpPersons is EMPTY:
+                self._ErpPersonnel._ErpPersons = AssociationList([self])
+            else:
+                self._ErpPersonnel._ErpPersons.add(self)
 
     ErpPersonnel = property(getErpPersonnel, setErpPersonnel)
 
@@ -429,21 +479,28 @@ class ErpPerson(IdentifiedObject):
         return self._Crafts
 
     def setCrafts(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Crafts:
-            filtered = [q for q in p.ErpPersons if q != self]
-            self._Crafts._ErpPersons = filtered
+            p._ErpPersons.discard(self)
         for r in value:
-            if self not in r._ErpPersons:
-                r._ErpPersons.append(self)
+            if r._ErpPersons is EMPTY:
+                r._ErpPersons = AssociationList([self])
+            else:
+                r._ErpPersons.add(self)
         self._Crafts = value
 
     Crafts = property(getCrafts, setCrafts)
 
     def addCrafts(self, *Crafts):
         for obj in Crafts:
-            if self not in obj._ErpPersons:
-                obj._ErpPersons.append(self)
-            self._Crafts.append(obj)
+            if obj._ErpPersons is EMPTY:
+                obj._ErpPersons = AssociationList([self])
+            else:
+                obj._ErpPersons.add(self)
+            if self._Crafts is EMPTY:
+                self._Crafts = AssociationList([obj])
+            else:
+                self._Crafts.add(obj)
 
     def removeCrafts(self, *Crafts):
         for obj in Crafts:
@@ -457,13 +514,14 @@ class ErpPerson(IdentifiedObject):
 
     def setCustomerData(self, value):
         if self._CustomerData is not None:
-            filtered = [x for x in self.CustomerData.ErpPersons if x != self]
-            self._CustomerData._ErpPersons = filtered
+            self._CustomerData._ErpPersons.discard(self)
 
         self._CustomerData = value
         if self._CustomerData is not None:
-            if self not in self._CustomerData._ErpPersons:
-                self._CustomerData._ErpPersons.append(self)
+            if self._CustomerData._ErpPersons is EMPTY:
+                self._CustomerData._ErpPersons = AssociationList([self])
+            else:
+                self._CustomerData._ErpPersons.add(self)
 
     CustomerData = property(getCustomerData, setCustomerData)
 
@@ -472,21 +530,28 @@ class ErpPerson(IdentifiedObject):
         return self._CallBacks
 
     def setCallBacks(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._CallBacks:
-            filtered = [q for q in p.ErpPersons if q != self]
-            self._CallBacks._ErpPersons = filtered
+            p._ErpPersons.discard(self)
         for r in value:
-            if self not in r._ErpPersons:
-                r._ErpPersons.append(self)
+            if r._ErpPersons is EMPTY:
+                r._ErpPersons = AssociationList([self])
+            else:
+                r._ErpPersons.add(self)
         self._CallBacks = value
 
     CallBacks = property(getCallBacks, setCallBacks)
 
     def addCallBacks(self, *CallBacks):
         for obj in CallBacks:
-            if self not in obj._ErpPersons:
-                obj._ErpPersons.append(self)
-            self._CallBacks.append(obj)
+            if obj._ErpPersons is EMPTY:
+                obj._ErpPersons = AssociationList([self])
+            else:
+                obj._ErpPersons.add(self)
+            if self._CallBacks is EMPTY:
+                self._CallBacks = AssociationList([obj])
+            else:
+                self._CallBacks.add(obj)
 
     def removeCallBacks(self, *CallBacks):
         for obj in CallBacks:
@@ -499,6 +564,7 @@ class ErpPerson(IdentifiedObject):
         return self._SwitchingStepRoles
 
     def setSwitchingStepRoles(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._SwitchingStepRoles:
             x.ErpPerson = None
         for y in value:
@@ -524,13 +590,14 @@ class ErpPerson(IdentifiedObject):
 
     def setErpCompetency(self, value):
         if self._ErpCompetency is not None:
-            filtered = [x for x in self.ErpCompetency.ErpPersons if x != self]
-            self._ErpCompetency._ErpPersons = filtered
+            self._ErpCompetency._ErpPersons.discard(self)
 
         self._ErpCompetency = value
         if self._ErpCompetency is not None:
-            if self not in self._ErpCompetency._ErpPersons:
-                self._ErpCompetency._ErpPersons.append(self)
+            if self._ErpCompetency._ErpPersons is EMPTY:
+                self._ErpCompetency._ErpPersons = AssociationList([self])
+            else:
+                self._ErpCompetency._ErpPersons.add(self)
 
     ErpCompetency = property(getErpCompetency, setErpCompetency)
 
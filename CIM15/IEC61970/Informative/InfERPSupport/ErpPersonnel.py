@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class ErpPersonnel(IdentifiedObject):
     """Information that applies to the basic data about a utility person, used by ERP applications to transfer Personnel data for a worker.Information that applies to the basic data about a utility person, used by ERP applications to transfer Personnel data for a worker.
@@ -32,8 +33,9 @@ class ErpPersonnel(IdentifiedObject):
         """
         self.status = status
 
-        self._ErpPersons = []
-        self.ErpPersons = [] if ErpPersons is None else ErpPersons
+        self._ErpPersons = EMPTY
+        if ErpPersons is not None:
+            self.ErpPersons = ErpPersons
 
         super(ErpPersonnel, self).__init__(*args, **kw_args)
 
@@ -51,6 +53,7 @@ class ErpPersonnel(IdentifiedObject):
         return self._ErpPersons
 
     def setErpPersons(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ErpPersons:
             x.ErpPersonnel = None
         for y in value:
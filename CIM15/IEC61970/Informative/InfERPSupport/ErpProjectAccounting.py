@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import AssociationList, EMPTY
 
 class ErpProjectAccounting(Document):
     """Utility Project Accounting information, used by ERP applications to enable all relevant sub-systems that submit single sided transactions to transfer information with a Project Accounting Application. This would include, but not necessarily be limited to: Accounts Payable, Accounts Receivable, Budget, Order Management, Purchasing, Time and Labor, Travel and Expense.Utility Project Accounting information, used by ERP applications to enable all relevant sub-systems that submit single sided transactions to transfer information with a Project Accounting Application. This would include, but not necessarily be limited to: Accounts Payable, Accounts Receivable, Budget, Order Management, Purchasing, Time and Labor, Travel and Expense.
@@ -32,17 +33,21 @@ class ErpProjectAccounting(Document):
         @param ErpTimeEntries:
         @param WorkCostDetails:
         """
-        self._Works = []
-        self.Works = [] if Works is None else Works
+        self._Works = EMPTY
+        if Works is not None:
+            self.Works = Works
 
-        self._Projects = []
-        self.Projects = [] if Projects is None else Projects
+        self._Projects = EMPTY
+        if Projects is not None:
+            self.Projects = Projects
 
-        self._ErpTimeEntries = []
-        self.ErpTimeEntries = [] if ErpTimeEntries is None else ErpTimeEntries
+        self._ErpTimeEntries = EMPTY
+        if ErpTimeEntries is not None:
+            self.ErpTimeEntries = ErpTimeEntries
 
-        self._WorkCostDetails = []
-        self.WorkCostDetails = [] if WorkCostDetails is None else WorkCostDetails
+        self._WorkCostDetails = EMPTY
+        if WorkCostDetails is not None:
+            self.WorkCostDetails = WorkCostDetails
 
         super(ErpProjectAccounting, self).__init__(*args, **kw_args)
 
@@ -58,6 +63,7 @@ class ErpProjectAccounting(Document):
         return self._Works
 
     def setWorks(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Works:
             x.ErpProjectAccounting = None
         for y in value:
@@ -79,6 +85,7 @@ class ErpProjectAccounting(Document):
         return self._Projects
 
     def setProjects(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Projects:
             x.ErpProjectAccounting = None
         for y in value:
@@ -100,6 +107,7 @@ class ErpProjectAccounting(Document):
         return self._ErpTimeEntries
 
     def setErpTimeEntries(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ErpTimeEntries:
             x.ErpProjectAccounting = None
         for y in value:
@@ -121,6 +129,7 @@ class ErpProjectAccounting(Document):
         return self._WorkCostDetails
 
     def setWorkCostDetails(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._WorkCostDetails:
             x.ErpProjectAccounting = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import AssociationList, EMPTY
 
 class ErpPurchaseOrder(Document):
     """A document that communicates an order to purchase goods from a buyer to a supplier. The PurchaseOrder carries information to and from the buyer and supplier. It is a legally binding document once both Parties agree to the contents and the specified terms and conditions of the order.A document that communicates an order to purchase goods from a buyer to a supplier. The PurchaseOrder carries information to and from the buyer and supplier. It is a legally binding document once both Parties agree to the contents and the specified terms and conditions of the order.
@@ -29,8 +30,9 @@ class ErpPurchaseOrder(Document):
 
         @param ErpPOLineItems:
         """
-        self._ErpPOLineItems = []
-        self.ErpPOLineItems = [] if ErpPOLineItems is None else ErpPOLineItems
+        self._ErpPOLineItems = EMPTY
+        if ErpPOLineItems is not None:
+            self.ErpPOLineItems = ErpPOLineItems
 
         super(ErpPurchaseOrder, self).__init__(*args, **kw_args)
 
@@ -46,6 +48,7 @@ class ErpPurchaseOrder(Document):
         return self._ErpPOLineItems
 
     def setErpPOLineItems(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ErpPOLineItems:
             x.ErpPurchaseOrder = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import AssociationList, EMPTY
 
 class ErpQuote(Document):
     """Document describing the prices of goods or services provided by a supplier. It includes the terms of the purchase, delivery proposals, identification of goods or services ordered, as well as their quantities.Document describing the prices of goods or services provided by a supplier. It includes the terms of the purchase, delivery proposals, identification of goods or services ordered, as well as their quantities.
@@ -29,8 +30,9 @@ class ErpQuote(Document):
 
         @param ErpQuoteLineItems:
         """
-        self._ErpQuoteLineItems = []
-        self.ErpQuoteLineItems = [] if ErpQuoteLineItems is None else ErpQuoteLineItems
+        self._ErpQuoteLineItems = EMPTY
+        if ErpQuoteLineItems is not None:
+            self.ErpQuoteLineItems = ErpQuoteLineItems
 
         super(ErpQuote, self).__init__(*args, **kw_args)
 
@@ -46,6 +48,7 @@ class ErpQuote(Document):
         return self._ErpQuoteLineItems
 
     def setErpQuoteLineItems(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ErpQuoteLineItems:
             x.ErpQuote = None
         for y in value:
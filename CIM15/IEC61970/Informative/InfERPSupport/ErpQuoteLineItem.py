@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class ErpQuoteLineItem(IdentifiedObject):
     """Of an ErpQuote, the item or product quoted along with quantity, price and other descriptive information.Of an ErpQuote, the item or product quoted along with quantity, price and other descriptive information.
@@ -70,13 +71,14 @@ class ErpQuoteLineItem(IdentifiedObject):
 
     def setErpQuote(self, value):
         if self._ErpQuote is not None:
-            filtered = [x for x in self.ErpQuote.ErpQuoteLineItems if x != self]
-            self._ErpQuote._ErpQuoteLineItems = filtered
+            self._ErpQuote._ErpQuoteLineItems.discard(self)
 
         self._ErpQuote = value
         if self._ErpQuote is not None:
-            if self not in self._ErpQuote._ErpQuoteLineItems:
-                self._ErpQuote._ErpQuoteLineItems.append(self)
+            if self._ErpQuote._ErpQuoteLineItems is EMPTY:
+                self._ErpQuote._ErpQuoteLineItems = AssociationList([self])
+            else:
+                self._ErpQuote._ErpQuoteLineItems.add(self)
 
     ErpQuote = property(getErpQuote, setErpQuote)
 
@@ -86,13 +88,14 @@ class ErpQuoteLineItem(IdentifiedObject):
 
     def setAssetModelCatalogueItem(self, value):
         if self._AssetModelCatalogueItem is not None:
-            filtered = [x for x in self.AssetModelCatalogueItem.ErpQuoteLineItems if x != self]
-            self._AssetModelCatalogueItem._ErpQuoteLineItems = filtered
+            self._AssetModelCatalogueItem._ErpQuoteLineItems.discard(self)
 
         self._AssetModelCatalogueItem = value
         if self._AssetModelCatalogueItem is not None:
-            if self not in self._AssetModelCatalogueItem._ErpQuoteLineItems:
-                self._AssetModelCatalogueItem._ErpQuoteLineItems.append(self)
+            if self._AssetModelCatalogueItem._ErpQuoteLineItems is EMPTY:
+                self._AssetModelCatalogueItem._ErpQuoteLineItems = AssociationList([self])
+            else:
+                self._AssetModelCatalogueItem._ErpQuoteLineItems.add(self)
 
     AssetModelCatalogueItem = property(getAssetModelCatalogueItem, setAssetModelCatalogueItem)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class ErpRecDelvLineItem(IdentifiedObject):
     """Of an ErpReceiveDelivery, this is an individually received good or service by the Organisation receiving goods or services. It may be used to indicate receipt of goods in conjunction with a purchase order line item.Of an ErpReceiveDelivery, this is an individually received good or service by the Organisation receiving goods or services. It may be used to indicate receipt of goods in conjunction with a purchase order line item.
@@ -34,8 +35,9 @@ class ErpRecDelvLineItem(IdentifiedObject):
         @param MaterialItems:
         @param ErpPOLineItem:
         """
-        self._Assets = []
-        self.Assets = [] if Assets is None else Assets
+        self._Assets = EMPTY
+        if Assets is not None:
+            self.Assets = Assets
 
         self._ErpInvoiceLineItem = None
         self.ErpInvoiceLineItem = ErpInvoiceLineItem
@@ -45,8 +47,9 @@ class ErpRecDelvLineItem(IdentifiedObject):
         self._ErpReceiveDelivery = None
         self.ErpReceiveDelivery = ErpReceiveDelivery
 
-        self._MaterialItems = []
-        self.MaterialItems = [] if MaterialItems is None else MaterialItems
+        self._MaterialItems = EMPTY
+        if MaterialItems is not None:
+            self.MaterialItems = MaterialItems
 
         self._ErpPOLineItem = None
         self.ErpPOLineItem = ErpPOLineItem
@@ -65,21 +68,28 @@ class ErpRecDelvLineItem(IdentifiedObject):
         return self._Assets
 
     def setAssets(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Assets:
-            filtered = [q for q in p.ErpRecDeliveryItems if q != self]
-            self._Assets._ErpRecDeliveryItems = filtered
+            p._ErpRecDeliveryItems.discard(self)
         for r in value:
-            if self not in r._ErpRecDeliveryItems:
-                r._ErpRecDeliveryItems.append(self)
+            if r._ErpRecDeliveryItems is EMPTY:
+                r._ErpRecDeliveryItems = AssociationList([self])
+            else:
+                r._ErpRecDeliveryItems.add(self)
         self._Assets = value
 
     Assets = property(getAssets, setAssets)
 
     def addAssets(self, *Assets):
         for obj in Assets:
-            if self not in obj._ErpRecDeliveryItems:
-                obj._ErpRecDeliveryItems.append(self)
-            self._Assets.append(obj)
+            if obj._ErpRecDeliveryItems is EMPTY:
+                obj._ErpRecDeliveryItems = AssociationList([self])
+            else:
+                obj._ErpRecDeliveryItems.add(self)
+            if self._Assets is EMPTY:
+                self._Assets = AssociationList([obj])
+            else:
+                self._Assets.add(obj)
 
     def removeAssets(self, *Assets):
         for obj in Assets:
@@ -110,13 +120,14 @@ class ErpRecDelvLineItem(IdentifiedObject):
 
     def setErpReceiveDelivery(self, value):
         if self._ErpReceiveDelivery is not None:
-            filtered = [x for x in self.ErpReceiveDelivery.ErpRecDelvLineItems if x != self]
-            self._ErpReceiveDelivery._ErpRecDelvLineItems = filtered
+            self._ErpReceiveDelivery._ErpRecDelvLineItems.discard(self)
 
         self._ErpReceiveDelivery = value
         if self._ErpReceiveDelivery is not None:
-            if self not in self._ErpReceiveDelivery._ErpRecDelvLineItems:
-                self._ErpReceiveDelivery._ErpRecDelvLineItems.append(self)
+            if self._ErpReceiveDelivery._ErpRecDelvLineItems is EMPTY:
+                self._ErpReceiveDelivery._ErpRecDelvLineItems = AssociationList([self])
+            else:
+                self._ErpReceiveDelivery._ErpRecDelvLineItems.add(self)
 
     ErpReceiveDelivery = property(getErpReceiveDelivery, setErpReceiveDelivery)
 
@@ -125,21 +136,28 @@ class ErpRecDelvLineItem(IdentifiedObject):
         return self._MaterialItems
 
     def setMaterialItems(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._MaterialItems:
-            filtered = [q for q in p.ErpRecDelvLineItems if q != self]
-            self._MaterialItems._ErpRecDelvLineItems = filtered
+            p._ErpRecDelvLineItems.discard(self)
         for r in value:
-            if self not in r._ErpRecDelvLineItems:
-                r._ErpRecDelvLineItems.append(self)
+            if r._ErpRecDelvLineItems is EMPTY:
+                r._ErpRecDelvLineItems = AssociationList([self])
+            else:
+                r._ErpRecDelvLineItems.add(self)
         self._MaterialItems = value
 
     MaterialItems = property(getMaterialItems, setMaterialItems)
 
     def addMaterialItems(self, *MaterialItems):
         for obj in MaterialItems:
-            if self not in obj._ErpRecDelvLineItems:
-                obj._ErpRecDelvLineItems.append(self)
-            self._MaterialItems.append(obj)
+            if obj._ErpRecDelvLineItems is EMPTY:
+                obj._ErpRecDelvLineItems = AssociationList([self])
+            else:
+                obj._ErpRecDelvLineItems.add(self)
+            if self._MaterialItems is EMPTY:
+                self._MaterialItems = AssociationList([obj])
+            else:
+                self._MaterialItems.add(obj)
 
     def removeMaterialItems(self, *MaterialItems):
         for obj in MaterialItems:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class ErpRecLineItem(IdentifiedObject):
     """Individual entry of an ErpReceivable, it is a particular transaction representing an invoice, credit memo or debit memo to a customer.Individual entry of an ErpReceivable, it is a particular transaction representing an invoice, credit memo or debit memo to a customer.
@@ -41,11 +42,13 @@ class ErpRecLineItem(IdentifiedObject):
         self._ErpInvoiceLineItem = None
         self.ErpInvoiceLineItem = ErpInvoiceLineItem
 
-        self._ErpPayments = []
-        self.ErpPayments = [] if ErpPayments is None else ErpPayments
+        self._ErpPayments = EMPTY
+        if ErpPayments is not None:
+            self.ErpPayments = ErpPayments
 
-        self._ErpJournalEntries = []
-        self.ErpJournalEntries = [] if ErpJournalEntries is None else ErpJournalEntries
+        self._ErpJournalEntries = EMPTY
+        if ErpJournalEntries is not None:
+            self.ErpJournalEntries = ErpJournalEntries
 
         super(ErpRecLineItem, self).__init__(*args, **kw_args)
 
@@ -62,13 +65,14 @@ class ErpRecLineItem(IdentifiedObject):
 
     def setErpReceivable(self, value):
         if self._ErpReceivable is not None:
-            filtered = [x for x in self.ErpReceivable.ErpRecLineItems if x != self]
-            self._ErpReceivable._ErpRecLineItems = filtered
+            self._ErpReceivable._ErpRecLineItems.discard(self)
 
         self._ErpReceivable = value
         if self._ErpReceivable is not None:
-            if self not in self._ErpReceivable._ErpRecLineItems:
-                self._ErpReceivable._ErpRecLineItems.append(self)
+            if self._ErpReceivable._ErpRecLineItems is EMPTY:
+                self._ErpReceivable._ErpRecLineItems = AssociationList([self])
+            else:
+                self._ErpReceivable._ErpRecLineItems.add(self)
 
     ErpReceivable = property(getErpReceivable, setErpReceivable)
 
@@ -94,21 +98,28 @@ class ErpRecLineItem(IdentifiedObject):
         return self._ErpPayments
 
     def setErpPayments(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ErpPayments:
-            filtered = [q for q in p.ErpRecLineItems if q != self]
-            self._ErpPayments._ErpRecLineItems = filtered
+            p._ErpRecLineItems.discard(self)
         for r in value:
-            if self not in r._ErpRecLineItems:
-                r._ErpRecLineItems.append(self)
+            if r._ErpRecLineItems is EMPTY:
+                r._ErpRecLineItems = AssociationList([self])
+            else:
+                r._ErpRecLineItems.add(self)
         self._ErpPayments = value
 
     ErpPayments = property(getErpPayments, setErpPayments)
 
     def addErpPayments(self, *ErpPayments):
         for obj in ErpPayments:
-            if self not in obj._ErpRecLineItems:
-                obj._ErpRecLineItems.append(self)
-            self._ErpPayments.append(obj)
+            if obj._ErpRecLineItems is EMPTY:
+                obj._ErpRecLineItems = AssociationList([self])
+            else:
+                obj._ErpRecLineItems.add(self)
+            if self._ErpPayments is EMPTY:
+                self._ErpPayments = AssociationList([obj])
+            else:
+                self._ErpPayments.add(obj)
 
     def removeErpPayments(self, *ErpPayments):
         for obj in ErpPayments:
@@ -121,21 +132,28 @@ class ErpRecLineItem(IdentifiedObject):
         return self._ErpJournalEntries
 
     def setErpJournalEntries(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ErpJournalEntries:
-            filtered = [q for q in p.ErpRecLineItems if q != self]
-            self._ErpJournalEntries._ErpRecLineItems = filtered
+            p._ErpRecLineItems.discard(self)
         for r in value:
-            if self not in r._ErpRecLineItems:
-                r._ErpRecLineItems.append(self)
+            if r._ErpRecLineItems is EMPTY:
+                r._ErpRecLineItems = AssociationList([self])
+            else:
+                r._ErpRecLineItems.add(self)
         self._ErpJournalEntries = value
 
     ErpJournalEntries = property(getErpJournalEntries, setErpJournalEntries)
 
     def addErpJournalEntries(self, *ErpJournalEntries):
         for obj in ErpJournalEntries:
-            if self not in obj._ErpRecLineItems:
-                obj._ErpRecLineItems.append(self)
-            self._ErpJournalEntries.append(obj)
+            if obj._ErpRecLineItems is EMPTY:
+                obj._ErpRecLineItems = AssociationList([self])
+            else:
+                obj._ErpRecLineItems.add(self)
+            if self._ErpJournalEntries is EMPTY:
+                self._ErpJournalEntries = AssociationList([obj])
+            else:
+                self._ErpJournalEntries.add(obj)
 
     def removeErpJournalEntries(self, *ErpJournalEntries):
         for obj in ErpJournalEntries:
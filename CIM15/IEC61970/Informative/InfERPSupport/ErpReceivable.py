@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import AssociationList, EMPTY
 
 class ErpReceivable(Document):
     """Transaction representing an invoice, credit memo or debit memo to a customer. It is an open (unpaid) item in the Accounts Receivable ledger.Transaction representing an invoice, credit memo or debit memo to a customer. It is an open (unpaid) item in the Accounts Receivable ledger.
@@ -29,8 +30,9 @@ class ErpReceivable(Document):
 
         @param ErpRecLineItems:
         """
-        self._ErpRecLineItems = []
-        self.ErpRecLineItems = [] if ErpRecLineItems is None else ErpRecLineItems
+        self._ErpRecLineItems = EMPTY
+        if ErpRecLineItems is not None:
+            self.ErpRecLineItems = ErpRecLineItems
 
         super(ErpReceivable, self).__init__(*args, **kw_args)
 
@@ -46,6 +48,7 @@ class ErpReceivable(Document):
         return self._ErpRecLineItems
 
     def setErpRecLineItems(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ErpRecLineItems:
             x.ErpReceivable = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import AssociationList, EMPTY
 
 class ErpReceiveDelivery(Document):
     """Transaction for an Organisation receiving goods or services that may be used to indicate receipt of goods in conjunction with a purchase order. A receivable is an open (unpaid) item in the Accounts Receivable ledger.Transaction for an Organisation receiving goods or services that may be used to indicate receipt of goods in conjunction with a purchase order. A receivable is an open (unpaid) item in the Accounts Receivable ledger.
@@ -29,8 +30,9 @@ class ErpReceiveDelivery(Document):
 
         @param ErpRecDelvLineItems:
         """
-        self._ErpRecDelvLineItems = []
-        self.ErpRecDelvLineItems = [] if ErpRecDelvLineItems is None else ErpRecDelvLineItems
+        self._ErpRecDelvLineItems = EMPTY
+        if ErpRecDelvLineItems is not None:
+            self.ErpRecDelvLineItems = ErpRecDelvLineItems
 
         super(ErpReceiveDelivery, self).__init__(*args, **kw_args)
 
@@ -46,6 +48,7 @@ class ErpReceiveDelivery(Document):
         return self._ErpRecDelvLineItems
 
     def setErpRecDelvLineItems(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ErpRecDelvLineItems:
             x.ErpReceiveDelivery = None
         for y in value:
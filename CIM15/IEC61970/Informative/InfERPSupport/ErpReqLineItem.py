@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class ErpReqLineItem(IdentifiedObject):
     """Information that describes a requested item and its attributes.Information that describes a requested item and its attributes.
@@ -99,13 +100,14 @@ class ErpReqLineItem(IdentifiedObject):
 
     def setErpRequisition(self, value):
         if self._ErpRequisition is not None:
-            filtered = [x for x in self.ErpRequisition.ErpReqLineItems if x != self]
-            self._ErpRequisition._ErpReqLineItems = filtered
+            self._ErpRequisition._ErpReqLineItems.discard(self)
 
         self._ErpRequisition = value
         if self._ErpRequisition is not None:
-            if self not in self._ErpRequisition._ErpReqLineItems:
-                self._ErpRequisition._ErpReqLineItems.append(self)
+            if self._ErpRequisition._ErpReqLineItems is EMPTY:
+                self._ErpRequisition._ErpReqLineItems = AssociationList([self])
+            else:
+                self._ErpRequisition._ErpReqLineItems.add(self)
 
     ErpRequisition = property(getErpRequisition, setErpRequisition)
 
@@ -115,13 +117,14 @@ class ErpReqLineItem(IdentifiedObject):
 
     def setTypeMaterial(self, value):
         if self._TypeMaterial is not None:
-            filtered = [x for x in self.TypeMaterial.ErpReqLineItems if x != self]
-            self._TypeMaterial._ErpReqLineItems = filtered
+            self._TypeMaterial._ErpReqLineItems.discard(self)
 
         self._TypeMaterial = value
         if self._TypeMaterial is not None:
-            if self not in self._TypeMaterial._ErpReqLineItems:
-                self._TypeMaterial._ErpReqLineItems.append(self)
+            if self._TypeMaterial._ErpReqLineItems is EMPTY:
+                self._TypeMaterial._ErpReqLineItems = AssociationList([self])
+            else:
+                self._TypeMaterial._ErpReqLineItems.add(self)
 
     TypeMaterial = property(getTypeMaterial, setTypeMaterial)
 
@@ -146,13 +149,14 @@ class ErpReqLineItem(IdentifiedObject):
 
     def setTypeAsset(self, value):
         if self._TypeAsset is not None:
-            filtered = [x for x in self.TypeAsset.ErpReqLineItems if x != self]
-            self._TypeAsset._ErpReqLineItems = filtered
+            self._TypeAsset._ErpReqLineItems.discard(self)
 
         self._TypeAsset = value
         if self._TypeAsset is not None:
-            if self not in self._TypeAsset._ErpReqLineItems:
-                self._TypeAsset._ErpReqLineItems.append(self)
+            if self._TypeAsset._ErpReqLineItems is EMPTY:
+                self._TypeAsset._ErpReqLineItems = AssociationList([self])
+            else:
+                self._TypeAsset._ErpReqLineItems.add(self)
 
     TypeAsset = property(getTypeAsset, setTypeAsset)
 
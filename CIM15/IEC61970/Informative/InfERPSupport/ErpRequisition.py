@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import AssociationList, EMPTY
 
 class ErpRequisition(Document):
     """General information that applies to a utility requisition that is a request for the purchase of goods or services. Typically, a requisition leads to the creation of a purchase order to a specific supplier.General information that applies to a utility requisition that is a request for the purchase of goods or services. Typically, a requisition leads to the creation of a purchase order to a specific supplier.
@@ -29,8 +30,9 @@ class ErpRequisition(Document):
 
         @param ErpReqLineItems:
         """
-        self._ErpReqLineItems = []
-        self.ErpReqLineItems = [] if ErpReqLineItems is None else ErpReqLineItems
+        self._ErpReqLineItems = EMPTY
+        if ErpReqLineItems is not None:
+            self.ErpReqLineItems = ErpReqLineItems
 
         super(ErpRequisition, self).__init__(*args, **kw_args)
 
@@ -46,6 +48,7 @@ class ErpRequisition(Document):
         return self._ErpReqLineItems
 
     def setErpReqLineItems(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ErpReqLineItems:
             x.ErpRequisition = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class ErpSiteLevelData(IdentifiedObject):
     """For a utility, general information that describes physical locations of organizations or the location codes and their meanings. This enables ERP applications to ensure that the physical location identifiers are synchronized between the business applications.For a utility, general information that describes physical locations of organizations or the location codes and their meanings. This enables ERP applications to ensure that the physical location identifiers are synchronized between the business applications.
@@ -52,13 +53,14 @@ class ErpSiteLevelData(IdentifiedObject):
 
     def setLandProperty(self, value):
         if self._LandProperty is not None:
-            filtered = [x for x in self.LandProperty.ErpSiteLevelDatas if x != self]
-            self._LandProperty._ErpSiteLevelDatas = filtered
+            self._LandProperty._ErpSiteLevelDatas.discard(self)
 
         self._LandProperty = value
         if self._LandProperty is not None:
-            if self not in self._LandProperty._ErpSiteLevelDatas:
-                self._LandProperty._ErpSiteLevelDatas.append(self)
+            if self._LandProperty._ErpSiteLevelDatas is EMPTY:
+                self._LandProperty._ErpSiteLevelDatas = AssociationList([self])
+            else:
+                self._LandProperty._ErpSiteLevelDatas.add(self)
 
     LandProperty = property(getLandProperty, setLandProperty)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class ErpTimeEntry(IdentifiedObject):
     """An individual entry on an ErpTimeSheet.An individual entry on an ErpTimeSheet.
@@ -54,13 +55,14 @@ class ErpTimeEntry(IdentifiedObject):
 
     def setErpProjectAccounting(self, value):
         if self._ErpProjectAccounting is not None:
-            filtered = [x for x in self.ErpProjectAccounting.ErpTimeEntries if x != self]
-            self._ErpProjectAccounting._ErpTimeEntries = filtered
+            self._ErpProjectAccounting._ErpTimeEntries.discard(self)
 
         self._ErpProjectAccounting = value
         if self._ErpProjectAccounting is not None:
-            if self not in self._ErpProjectAccounting._ErpTimeEntries:
-                self._ErpProjectAccounting._ErpTimeEntries.append(self)
+            if self._ErpProjectAccounting._ErpTimeEntries is EMPTY:
+                self._ErpProjectAccounting._ErpTimeEntries = AssociationList([self])
+            else:
+                self._ErpProjectAccounting._ErpTimeEntries.add(self)
 
     ErpProjectAccounting = property(getErpProjectAccounting, setErpProjectAccounting)
 
@@ -72,13 +74,14 @@ class ErpTimeEntry(IdentifiedObject):
 
     def setErpTimeSheet(self, value):
         if self._ErpTimeSheet is not None:
-            filtered = [x for x in self.ErpTimeSheet.ErpTimeEntries if x != self]
-            self._ErpTimeSheet._ErpTimeEntries = filtered
+            self._ErpTimeSheet._ErpTimeEntries.discard(self)
 
         self._ErpTimeSheet = value
         if self._ErpTimeSheet is not None:
-            if self not in self._ErpTimeSheet._ErpTimeEntries:
-                self._ErpTimeSheet._ErpTimeEntries.append(self)
+            if self._ErpTimeSheet._ErpTimeEntries is EMPTY:
+                self._ErpTimeSheet._ErpTimeEntries = AssociationList([self])
+            else:
+                self._ErpTimeSheet._ErpTimeEntries.add(self)
 
     ErpTimeSheet = property(getErpTimeSheet, setErpTimeSheet)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import AssociationList, EMPTY
 
 class ErpTimeSheet(Document):
     """Time sheet for employees and contractors. Note that ErpTimeSheet inherits the relationship to ErpPerson from Document.Time sheet for employees and contractors. Note that ErpTimeSheet inherits the relationship to ErpPerson from Document.
@@ -29,8 +30,9 @@ class ErpTimeSheet(Document):
 
         @param ErpTimeEntries:
         """
-        self._ErpTimeEntries = []
-        self.ErpTimeEntries = [] if ErpTimeEntries is None else ErpTimeEntries
+        self._ErpTimeEntries = EMPTY
+        if ErpTimeEntries is not None:
+            self.ErpTimeEntries = ErpTimeEntries
 
         super(ErpTimeSheet, self).__init__(*args, **kw_args)
 
@@ -46,6 +48,7 @@ class ErpTimeSheet(Document):
         return self._ErpTimeEntries
 
     def setErpTimeEntries(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ErpTimeEntries:
             x.ErpTimeSheet = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Informative.InfCommon.Role import Role
+from CIM15.Element import AssociationList, EMPTY
 
 class OrgErpPersonRole(Role):
     """Roles played between Persons and Organisations.Roles played between Persons and Organisations.
@@ -55,13 +56,14 @@ class OrgErpPersonRole(Role):
 
     def setErpPerson(self, value):
         if self._ErpPerson is not None:
-            filtered = [x for x in self.ErpPerson.ErpOrganisationRoles if x != self]
-            self._ErpPerson._ErpOrganisationRoles = filtered
+            self._ErpPerson._ErpOrganisationRoles.discard(self)
 
         self._ErpPerson = value
         if self._ErpPerson is not None:
-            if self not in self._ErpPerson._ErpOrganisationRoles:
-                self._ErpPerson._ErpOrganisationRoles.append(self)
+            if self._ErpPerson._ErpOrganisationRoles is EMPTY:
+                self._ErpPerson._ErpOrganisationRoles = AssociationList([self])
+            else:
+                self._ErpPerson._ErpOrganisationRoles.add(self)
 
     ErpPerson = property(getErpPerson, setErpPerson)
 
@@ -71,13 +73,14 @@ class OrgErpPersonRole(Role):
 
     def setErpOrganisation(self, value):
         if self._ErpOrganisation is not None:
-            filtered = [x for x in self.ErpOrganisation.ErpPersonRoles if x != self]
-            self._ErpOrganisation._ErpPersonRoles = filtered
+            self._ErpOrganisation._ErpPersonRoles.discard(self)
 
         self._ErpOrganisation = value
         if self._ErpOrganisation is not None:
-            if self not in self._ErpOrganisation._ErpPersonRoles:
-                self._ErpOrganisation._ErpPersonRoles.append(self)
+            if self._ErpOrganisation._ErpPersonRoles is EMPTY:
+                self._ErpOrganisation._ErpPersonRoles = AssociationList([self])
+            else:
+                self._ErpOrganisation._ErpPersonRoles.add(self)
 
     ErpOrganisation = property(getErpOrganisation, setErpOrganisation)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Informative.InfCommon.Role import Role
+from CIM15.Element import AssociationList, EMPTY
 
 class OrgOrgRole(Role):
     """Roles played between Organisations and other Organisations. This includes role ups for ogranisations, cost centers, profit centers, regulatory reporting, etc. Note that the parent and child relationship is indicated by the name on each end of the association.Roles played between Organisations and other Organisations. This includes role ups for ogranisations, cost centers, profit centers, regulatory reporting, etc. Note that the parent and child relationship is indicated by the name on each end of the association.
@@ -55,13 +56,14 @@ class OrgOrgRole(Role):
 
     def setParentOrganisation(self, value):
         if self._ParentOrganisation is not None:
-            filtered = [x for x in self.ParentOrganisation.ChildOrganisationRoles if x != self]
-            self._ParentOrganisation._ChildOrganisationRoles = filtered
+            self._ParentOrganisation._ChildOrganisationRoles.discard(self)
 
         self._ParentOrganisation = value
         if self._ParentOrganisation is not None:
-            if self not in self._ParentOrganisation._ChildOrganisationRoles:
-                self._ParentOrganisation._ChildOrganisationRoles.append(self)
+            if self._ParentOrganisation._ChildOrganisationRoles is EMPTY:
+                self._ParentOrganisation._ChildOrganisationRoles = AssociationList([self])
+            else:
+                self._ParentOrganisation._ChildOrganisationRoles.add(self)
 
     ParentOrganisation = property(getParentOrganisation, setParentOrganisation)
 
@@ -71,13 +73,14 @@ class OrgOrgRole(Role):
 
     def setChildOrganisation(self, value):
         if self._ChildOrganisation is not None:
-            filtered = [x for x in self.ChildOrganisation.ParentOrganisationRoles if x != self]
-            self._ChildOrganisation._ParentOrganisationRoles = filtered
+            self._ChildOrganisation._ParentOrganisationRoles.discard(self)
 
         self._ChildOrganisation = value
         if self._ChildOrganisation is not None:
-            if self not in self._ChildOrganisation._ParentOrganisationRoles:
-                self._ChildOrganisation._ParentOrganisationRoles.append(self)
+            if self._ChildOrganisation._ParentOrganisationRoles is EMPTY:
+                self._ChildOrganisation._ParentOrganisationRoles = AssociationList([self])
+            else:
+                self._ChildOrganisation._ParentOrganisationRoles.add(self)
 
     ChildOrganisation = property(getChildOrganisation, setChildOrganisation)
 
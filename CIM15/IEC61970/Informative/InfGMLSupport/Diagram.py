@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import AssociationList, EMPTY
 
 class Diagram(Document):
     """The Diagram represents the diagram being exchanged. The initialView attributes can be used to specify an initial view with the x,y coordinates of the diagonal points. The coordinate system is a standard Cartesian coordinate system and the orientation attribute defines a positive or negative orientation.  A positive orientation gives standard &lsquo;right-hand&rsquo; orientation, with negative orientation indicating a &lsquo;left-hand&rsquo; orientation.  For 2D diagrams, a positive orientation will result in X values increasing from left to right and Y values increasing from bottom to top.  A negative orientation gives the &lsquo;left-hand&rsquo; orientation (favoured by computer graphics displays) with X values increasing from left to right and Y values increasing from top to bottom.The Diagram represents the diagram being exchanged. The initialView attributes can be used to specify an initial view with the x,y coordinates of the diagonal points. The coordinate system is a standard Cartesian coordinate system and the orientation attribute defines a positive or negative orientation.  A positive orientation gives standard &lsquo;right-hand&rsquo; orientation, with negative orientation indicating a &lsquo;left-hand&rsquo; orientation.  For 2D diagrams, a positive orientation will result in X values increasing from left to right and Y values increasing from bottom to top.  A negative orientation gives the &lsquo;left-hand&rsquo; orientation (favoured by computer graphics displays) with X values increasing from left to right and Y values increasing from top to bottom.
@@ -56,17 +57,20 @@ class Diagram(Document):
         #: Y coordinate of the second corner of the initial view
         self.y2InitialView = y2InitialView
 
-        self._DiagramObjects = []
-        self.DiagramObjects = [] if DiagramObjects is None else DiagramObjects
+        self._DiagramObjects = EMPTY
+        if DiagramObjects is not None:
+            self.DiagramObjects = DiagramObjects
 
         self._CoordinateSystem = None
         self.CoordinateSystem = CoordinateSystem
 
-        self._GmlDiagramObjects = []
-        self.GmlDiagramObjects = [] if GmlDiagramObjects is None else GmlDiagramObjects
+        self._GmlDiagramObjects = EMPTY
+        if GmlDiagramObjects is not None:
+            self.GmlDiagramObjects = GmlDiagramObjects
 
-        self._DesignLocations = []
-        self.DesignLocations = [] if DesignLocations is None else DesignLocations
+        self._DesignLocations = EMPTY
+        if DesignLocations is not None:
+            self.DesignLocations = DesignLocations
 
         super(Diagram, self).__init__(*args, **kw_args)
 
@@ -83,6 +87,7 @@ class Diagram(Document):
         return self._DiagramObjects
 
     def setDiagramObjects(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._DiagramObjects:
             x.Diagram = None
         for y in value:
@@ -105,13 +110,14 @@ class Diagram(Document):
 
     def setCoordinateSystem(self, value):
         if self._CoordinateSystem is not None:
-            filtered = [x for x in self.CoordinateSystem.Diagrams if x != self]
-            self._CoordinateSystem._Diagrams = filtered
+            self._CoordinateSystem._Diagrams.discard(self)
 
         self._CoordinateSystem = value
         if self._CoordinateSystem is not None:
-            if self not in self._CoordinateSystem._Diagrams:
-                self._CoordinateSystem._Diagrams.append(self)
+            if self._CoordinateSystem._Diagrams is EMPTY:
+                self._CoordinateSystem._Diagrams = AssociationList([self])
+            else:
+                self._CoordinateSystem._Diagrams.add(self)
 
     CoordinateSystem = property(getCoordinateSystem, setCoordinateSystem)
 
@@ -120,21 +126,28 @@ class Diagram(Document):
         return self._GmlDiagramObjects
 
     def setGmlDiagramObjects(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._GmlDiagramObjects:
-            filtered = [q for q in p.Diagrams if q != self]
-            self._GmlDiagramObjects._Diagrams = filtered
+            p._Diagrams.discard(self)
         for r in value:
-            if self not in r._Diagrams:
-                r._Diagrams.append(self)
+            if r._Diagrams is EMPTY:
+                r._Diagrams = AssociationList([self])
+            else:
+                r._Diagrams.add(self)
         self._GmlDiagramObjects = value
 
     GmlDiagramObjects = property(getGmlDiagramObjects, setGmlDiagramObjects)
 
     def addGmlDiagramObjects(self, *GmlDiagramObjects):
         for obj in GmlDiagramObjects:
-            if self not in obj._Diagrams:
-                obj._Diagrams.append(self)
-            self._GmlDiagramObjects.append(obj)
+            if obj._Diagrams is EMPTY:
+                obj._Diagrams = AssociationList([self])
+            else:
+                obj._Diagrams.add(self)
+            if self._GmlDiagramObjects is EMPTY:
+                self._GmlDiagramObjects = AssociationList([obj])
+            else:
+                self._GmlDiagramObjects.add(obj)
 
     def removeGmlDiagramObjects(self, *GmlDiagramObjects):
         for obj in GmlDiagramObjects:
@@ -147,21 +160,28 @@ class Diagram(Document):
         return self._DesignLocations
 
     def setDesignLocations(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._DesignLocations:
-            filtered = [q for q in p.Diagrams if q != self]
-            self._DesignLocations._Diagrams = filtered
+            p._Diagrams.discard(self)
         for r in value:
-            if self not in r._Diagrams:
-                r._Diagrams.append(self)
+            if r._Diagrams is EMPTY:
+                r._Diagrams = AssociationList([self])
+            else:
+                r._Diagrams.add(self)
         self._DesignLocations = value
 
     DesignLocations = property(getDesignLocations, setDesignLocations)
 
     def addDesignLocations(self, *DesignLocations):
         for obj in DesignLocations:
-            if self not in obj._Diagrams:
-                obj._Diagrams.append(self)
-            self._DesignLocations.append(obj)
+            if obj._Diagrams is EMPTY:
+                obj._Diagrams = AssociationList([self])
+            else:
+                obj._Diagrams.add(self)
+            if self._DesignLocations is EMPTY:
+                self._DesignLocations = AssociationList([obj])
+            else:
+                self._DesignLocations.add(obj)
 
     def removeDesignLocations(self, *DesignLocations):
         for obj in DesignLocations:
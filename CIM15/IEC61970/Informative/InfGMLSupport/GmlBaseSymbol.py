@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class GmlBaseSymbol(IdentifiedObject):
     """Allows referencing and extension of external symbols, which may be stored in a symbol repository. The graphical properties from a referenced external symbol override the ones read in from the base symbol.Allows referencing and extension of external symbols, which may be stored in a symbol repository. The graphical properties from a referenced external symbol override the ones read in from the base symbol.
@@ -29,8 +30,9 @@ class GmlBaseSymbol(IdentifiedObject):
 
         @param GmlSymbols:
         """
-        self._GmlSymbols = []
-        self.GmlSymbols = [] if GmlSymbols is None else GmlSymbols
+        self._GmlSymbols = EMPTY
+        if GmlSymbols is not None:
+            self.GmlSymbols = GmlSymbols
 
         super(GmlBaseSymbol, self).__init__(*args, **kw_args)
 
@@ -46,6 +48,7 @@ class GmlBaseSymbol(IdentifiedObject):
         return self._GmlSymbols
 
     def setGmlSymbols(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._GmlSymbols:
             x.GmlBaseSymbol = None
         for y in value:
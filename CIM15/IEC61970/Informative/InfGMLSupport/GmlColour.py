@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class GmlColour(IdentifiedObject):
     """The solid color that will be used. The color value is RGB-encoded using two hexadecimal digits per primary-color component, in the order Red, Green, Blue, prefixed with a hash (#) sign. The hexadecimal digits between A and F may be in either uppercase or lowercase. For example, full red is encoded as '#ff0000' (with no quotation marks). If the Stroke cssParameter element is absent, the default color is defined to be black ('#000000').The solid color that will be used. The color value is RGB-encoded using two hexadecimal digits per primary-color component, in the order Red, Green, Blue, prefixed with a hash (#) sign. The hexadecimal digits between A and F may be in either uppercase or lowercase. For example, full red is encoded as '#ff0000' (with no quotation marks). If the Stroke cssParameter element is absent, the default color is defined to be black ('#000000').
@@ -43,14 +44,17 @@ class GmlColour(IdentifiedObject):
         #: The color value for BLUE (RGB-encoded using two hexadecimal digits per primary-color component, in the order Red, Green, Blue, prefixed with a hash (#) sign.).
         self.blue = blue
 
-        self._GmlFills = []
-        self.GmlFills = [] if GmlFills is None else GmlFills
+        self._GmlFills = EMPTY
+        if GmlFills is not None:
+            self.GmlFills = GmlFills
 
-        self._GmlFonts = []
-        self.GmlFonts = [] if GmlFonts is None else GmlFonts
+        self._GmlFonts = EMPTY
+        if GmlFonts is not None:
+            self.GmlFonts = GmlFonts
 
-        self._GmlStrokes = []
-        self.GmlStrokes = [] if GmlStrokes is None else GmlStrokes
+        self._GmlStrokes = EMPTY
+        if GmlStrokes is not None:
+            self.GmlStrokes = GmlStrokes
 
         super(GmlColour, self).__init__(*args, **kw_args)
 
@@ -66,6 +70,7 @@ class GmlColour(IdentifiedObject):
         return self._GmlFills
 
     def setGmlFills(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._GmlFills:
             x.GmlColour = None
         for y in value:
@@ -87,6 +92,7 @@ class GmlColour(IdentifiedObject):
         return self._GmlFonts
 
     def setGmlFonts(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._GmlFonts:
             x.GmlColour = None
         for y in value:
@@ -108,6 +114,7 @@ class GmlColour(IdentifiedObject):
         return self._GmlStrokes
 
     def setGmlStrokes(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._GmlStrokes:
             x.GmlColour = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class GmlDiagramObject(IdentifiedObject):
     """Any of the magnitudes that serve to define the position of a point by reference to a fixed figure, system of lines, etc.Any of the magnitudes that serve to define the position of a point by reference to a fixed figure, system of lines, etc.
@@ -37,32 +38,41 @@ class GmlDiagramObject(IdentifiedObject):
         @param GmlTextSymbols:
         @param GmlPolygonSymbols:
         """
-        self._GmlSelectors = []
-        self.GmlSelectors = [] if GmlSelectors is None else GmlSelectors
+        self._GmlSelectors = EMPTY
+        if GmlSelectors is not None:
+            self.GmlSelectors = GmlSelectors
 
-        self._Diagrams = []
-        self.Diagrams = [] if Diagrams is None else Diagrams
+        self._Diagrams = EMPTY
+        if Diagrams is not None:
+            self.Diagrams = Diagrams
 
-        self._CoordinateSystems = []
-        self.CoordinateSystems = [] if CoordinateSystems is None else CoordinateSystems
+        self._CoordinateSystems = EMPTY
+        if CoordinateSystems is not None:
+            self.CoordinateSystems = CoordinateSystems
 
-        self._GmlPointSymbols = []
-        self.GmlPointSymbols = [] if GmlPointSymbols is None else GmlPointSymbols
+        self._GmlPointSymbols = EMPTY
+        if GmlPointSymbols is not None:
+            self.GmlPointSymbols = GmlPointSymbols
 
-        self._GmlLineSymbols = []
-        self.GmlLineSymbols = [] if GmlLineSymbols is None else GmlLineSymbols
+        self._GmlLineSymbols = EMPTY
+        if GmlLineSymbols is not None:
+            self.GmlLineSymbols = GmlLineSymbols
 
-        self._GmlRasterSymbols = []
-        self.GmlRasterSymbols = [] if GmlRasterSymbols is None else GmlRasterSymbols
+        self._GmlRasterSymbols = EMPTY
+        if GmlRasterSymbols is not None:
+            self.GmlRasterSymbols = GmlRasterSymbols
 
-        self._GmlObservatins = []
-        self.GmlObservatins = [] if GmlObservatins is None else GmlObservatins
+        self._GmlObservatins = EMPTY
+        if GmlObservatins is not None:
+            self.GmlObservatins = GmlObservatins
 
-        self._GmlTextSymbols = []
-        self.GmlTextSymbols = [] if GmlTextSymbols is None else GmlTextSymbols
+        self._GmlTextSymbols = EMPTY
+        if GmlTextSymbols is not None:
+            self.GmlTextSymbols = GmlTextSymbols
 
-        self._GmlPolygonSymbols = []
-        self.GmlPolygonSymbols = [] if GmlPolygonSymbols is None else GmlPolygonSymbols
+        self._GmlPolygonSymbols = EMPTY
+        if GmlPolygonSymbols is not None:
+            self.GmlPolygonSymbols = GmlPolygonSymbols
 
         super(GmlDiagramObject, self).__init__(*args, **kw_args)
 
@@ -78,21 +88,28 @@ class GmlDiagramObject(IdentifiedObject):
         return self._GmlSelectors
 
     def setGmlSelectors(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._GmlSelectors:
-            filtered = [q for q in p.GmlDiagramObjects if q != self]
-            self._GmlSelectors._GmlDiagramObjects = filtered
+            p._GmlDiagramObjects.discard(self)
         for r in value:
-            if self not in r._GmlDiagramObjects:
-                r._GmlDiagramObjects.append(self)
+            if r._GmlDiagramObjects is EMPTY:
+                r._GmlDiagramObjects = AssociationList([self])
+            else:
+                r._GmlDiagramObjects.add(self)
         self._GmlSelectors = value
 
     GmlSelectors = property(getGmlSelectors, setGmlSelectors)
 
     def addGmlSelectors(self, *GmlSelectors):
         for obj in GmlSelectors:
-            if self not in obj._GmlDiagramObjects:
-                obj._GmlDiagramObjects.append(self)
-            self._GmlSelectors.append(obj)
+            if obj._GmlDiagramObjects is EMPTY:
+                obj._GmlDiagramObjects = AssociationList([self])
+            else:
+                obj._GmlDiagramObjects.add(self)
+            if self._GmlSelectors is EMPTY:
+                self._GmlSelectors = AssociationList([obj])
+            else:
+                self._GmlSelectors.add(obj)
 
     def removeGmlSelectors(self, *GmlSelectors):
         for obj in GmlSelectors:
@@ -105,21 +122,28 @@ class GmlDiagramObject(IdentifiedObject):
         return self._Diagrams
 
     def setDiagrams(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Diagrams:
-            filtered = [q for q in p.GmlDiagramObjects if q != self]
-            self._Diagrams._GmlDiagramObjects = filtered
+            p._GmlDiagramObjects.discard(self)
         for r in value:
-            if self not in r._GmlDiagramObjects:
-                r._GmlDiagramObjects.append(self)
+            if r._GmlDiagramObjects is EMPTY:
+                r._GmlDiagramObjects = AssociationList([self])
+            else:
+                r._GmlDiagramObjects.add(self)
         self._Diagrams = value
 
     Diagrams = property(getDiagrams, setDiagrams)
 
     def addDiagrams(self, *Diagrams):
         for obj in Diagrams:
-            if self not in obj._GmlDiagramObjects:
-                obj._GmlDiagramObjects.append(self)
-            self._Diagrams.append(obj)
+            if obj._GmlDiagramObjects is EMPTY:
+                obj._GmlDiagramObjects = AssociationList([self])
+            else:
+                obj._GmlDiagramObjects.add(self)
+            if self._Diagrams is EMPTY:
+                self._Diagrams = AssociationList([obj])
+            else:
+                self._Diagrams.add(obj)
 
     def removeDiagrams(self, *Diagrams):
         for obj in Diagrams:
@@ -132,21 +156,28 @@ class GmlDiagramObject(IdentifiedObject):
         return self._CoordinateSystems
 
     def setCoordinateSystems(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._CoordinateSystems:
-            filtered = [q for q in p.GmlDiagramObjects if q != self]
-            self._CoordinateSystems._GmlDiagramObjects = filtered
+            p._GmlDiagramObjects.discard(self)
         for r in value:
-            if self not in r._GmlDiagramObjects:
-                r._GmlDiagramObjects.append(self)
+            if r._GmlDiagramObjects is EMPTY:
+                r._GmlDiagramObjects = AssociationList([self])
+            else:
+                r._GmlDiagramObjects.add(self)
         self._CoordinateSystems = value
 
     CoordinateSystems = property(getCoordinateSystems, setCoordinateSystems)
 
     def addCoordinateSystems(self, *CoordinateSystems):
         for obj in CoordinateSystems:
-            if self not in obj._GmlDiagramObjects:
-                obj._GmlDiagramObjects.append(self)
-            self._CoordinateSystems.append(obj)
+            if obj._GmlDiagramObjects is EMPTY:
+                obj._GmlDiagramObjects = AssociationList([self])
+            else:
+                obj._GmlDiagramObjects.add(self)
+            if self._CoordinateSystems is EMPTY:
+                self._CoordinateSystems = AssociationList([obj])
+            else:
+                self._CoordinateSystems.add(obj)
 
     def removeCoordinateSystems(self, *CoordinateSystems):
         for obj in CoordinateSystems:
@@ -159,6 +190,7 @@ class GmlDiagramObject(IdentifiedObject):
         return self._GmlPointSymbols
 
     def setGmlPointSymbols(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._GmlPointSymbols:
             x.GmlDiagramObject = None
         for y in value:
@@ -180,6 +212,7 @@ class GmlDiagramObject(IdentifiedObject):
         return self._GmlLineSymbols
 
     def setGmlLineSymbols(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._GmlLineSymbols:
             x.GmlDiagramObject = None
         for y in value:
@@ -201,6 +234,7 @@ class GmlDiagramObject(IdentifiedObject):
         return self._GmlRasterSymbols
 
     def setGmlRasterSymbols(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._GmlRasterSymbols:
             x.GmlDiagramObject = None
         for y in value:
@@ -222,21 +256,28 @@ class GmlDiagramObject(IdentifiedObject):
         return self._GmlObservatins
 
     def setGmlObservatins(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._GmlObservatins:
-            filtered = [q for q in p.GmlDiagramObjects if q != self]
-            self._GmlObservatins._GmlDiagramObjects = filtered
+            p._GmlDiagramObjects.discard(self)
         for r in value:
-            if self not in r._GmlDiagramObjects:
-                r._GmlDiagramObjects.append(self)
+            if r._GmlDiagramObjects is EMPTY:
+                r._GmlDiagramObjects = AssociationList([self])
+            else:
+                r._GmlDiagramObjects.add(self)
         self._GmlObservatins = value
 
     GmlObservatins = property(getGmlObservatins, setGmlObservatins)
 
     def addGmlObservatins(self, *GmlObservatins):
         for obj in GmlObservatins:
-            if self not in obj._GmlDiagramObjects:
-                obj._GmlDiagramObjects.append(self)
-            self._GmlObservatins.append(obj)
+            if obj._GmlDiagramObjects is EMPTY:
+                obj._GmlDiagramObjects = AssociationList([self])
+            else:
+                obj._GmlDiagramObjects.add(self)
+            if self._GmlObservatins is EMPTY:
+                self._GmlObservatins = AssociationList([obj])
+            else:
+                self._GmlObservatins.add(obj)
 
     def removeGmlObservatins(self, *GmlObservatins):
         for obj in GmlObservatins:
@@ -249,6 +290,7 @@ class GmlDiagramObject(IdentifiedObject):
         return self._GmlTextSymbols
 
     def setGmlTextSymbols(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._GmlTextSymbols:
             x.GmlDiagramObject = None
         for y in value:
@@ -270,6 +312,7 @@ class GmlDiagramObject(IdentifiedObject):
         return self._GmlPolygonSymbols
 
     def setGmlPolygonSymbols(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._GmlPolygonSymbols:
             x.GmlDiagramObject = None
         for y in value:
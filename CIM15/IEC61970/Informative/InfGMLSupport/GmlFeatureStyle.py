@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class GmlFeatureStyle(IdentifiedObject):
     """Used for styling a particular aspect or aspects of a feature, such as geometry, topology or arbitrary text string.Used for styling a particular aspect or aspects of a feature, such as geometry, topology or arbitrary text string.
@@ -61,20 +62,25 @@ class GmlFeatureStyle(IdentifiedObject):
         #: Grammar used in the content of the gml:featureConstraint element. Values are: "other", "xpath", "xquery"
         self.queryGrammar = queryGrammar
 
-        self._GmlGeometryStyles = []
-        self.GmlGeometryStyles = [] if GmlGeometryStyles is None else GmlGeometryStyles
+        self._GmlGeometryStyles = EMPTY
+        if GmlGeometryStyles is not None:
+            self.GmlGeometryStyles = GmlGeometryStyles
 
-        self._GmlSymbols = []
-        self.GmlSymbols = [] if GmlSymbols is None else GmlSymbols
+        self._GmlSymbols = EMPTY
+        if GmlSymbols is not None:
+            self.GmlSymbols = GmlSymbols
 
-        self._GmlTobologyStyles = []
-        self.GmlTobologyStyles = [] if GmlTobologyStyles is None else GmlTobologyStyles
+        self._GmlTobologyStyles = EMPTY
+        if GmlTobologyStyles is not None:
+            self.GmlTobologyStyles = GmlTobologyStyles
 
-        self._GmlLabelStyles = []
-        self.GmlLabelStyles = [] if GmlLabelStyles is None else GmlLabelStyles
+        self._GmlLabelStyles = EMPTY
+        if GmlLabelStyles is not None:
+            self.GmlLabelStyles = GmlLabelStyles
 
-        self._GmlFeatureTypes = []
-        self.GmlFeatureTypes = [] if GmlFeatureTypes is None else GmlFeatureTypes
+        self._GmlFeatureTypes = EMPTY
+        if GmlFeatureTypes is not None:
+            self.GmlFeatureTypes = GmlFeatureTypes
 
         super(GmlFeatureStyle, self).__init__(*args, **kw_args)
 
@@ -90,6 +96,7 @@ class GmlFeatureStyle(IdentifiedObject):
         return self._GmlGeometryStyles
 
     def setGmlGeometryStyles(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._GmlGeometryStyles:
             x.GmlFeatureStyle = None
         for y in value:
@@ -111,21 +118,28 @@ class GmlFeatureStyle(IdentifiedObject):
         return self._GmlSymbols
 
     def setGmlSymbols(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._GmlSymbols:
-            filtered = [q for q in p.GmlFeatureStyles if q != self]
-            self._GmlSymbols._GmlFeatureStyles = filtered
+            p._GmlFeatureStyles.discard(self)
         for r in value:
-            if self not in r._GmlFeatureStyles:
-                r._GmlFeatureStyles.append(self)
+            if r._GmlFeatureStyles is EMPTY:
+                r._GmlFeatureStyles = AssociationList([self])
+            else:
+                r._GmlFeatureStyles.add(self)
         self._GmlSymbols = value
 
     GmlSymbols = property(getGmlSymbols, setGmlSymbols)
 
     def addGmlSymbols(self, *GmlSymbols):
         for obj in GmlSymbols:
-            if self not in obj._GmlFeatureStyles:
-                obj._GmlFeatureStyles.append(self)
-            self._GmlSymbols.append(obj)
+            if obj._GmlFeatureStyles is EMPTY:
+                obj._GmlFeatureStyles = AssociationList([self])
+            else:
+                obj._GmlFeatureStyles.add(self)
+            if self._GmlSymbols is EMPTY:
+                self._GmlSymbols = AssociationList([obj])
+            else:
+                self._GmlSymbols.add(obj)
 
     def removeGmlSymbols(self, *GmlSymbols):
         for obj in GmlSymbols:
@@ -138,6 +152,7 @@ class GmlFeatureStyle(IdentifiedObject):
         return self._GmlTobologyStyles
 
     def setGmlTobologyStyles(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._GmlTobologyStyles:
             x.GmlFeatureStyle = None
         for y in value:
@@ -159,6 +174,7 @@ class GmlFeatureStyle(IdentifiedObject):
         return self._GmlLabelStyles
 
     def setGmlLabelStyles(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._GmlLabelStyles:
             x.GmlFeatureStyle = None
         for y in value:
@@ -180,21 +196,28 @@ class GmlFeatureStyle(IdentifiedObject):
         return self._GmlFeatureTypes
 
     def setGmlFeatureTypes(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._GmlFeatureTypes:
-            filtered = [q for q in p.GmlFeatureStyles if q != self]
-            self._GmlFeatureTypes._GmlFeatureStyles = filtered
+            p._GmlFeatureStyles.discard(self)
         for r in value:
-            if self not in r._GmlFeatureStyles:
-                r._GmlFeatureStyles.append(self)
+            if r._GmlFeatureStyles is EMPTY:
+                r._GmlFeatureStyles = AssociationList([self])
+            else:
+                r._GmlFeatureStyles.add(self)
         self._GmlFeatureTypes = value
 
     GmlFeatureTypes = property(getGmlFeatureTypes, setGmlFeatureTypes)
 
     def addGmlFeatureTypes(self, *GmlFeatureTypes):
         for obj in GmlFeatureTypes:
-            if self not in obj._GmlFeatureStyles:
-                obj._GmlFeatureStyles.append(self)
-            self._GmlFeatureTypes.append(obj)
+            if obj._GmlFeatureStyles is EMPTY:
+                obj._GmlFeatureStyles = AssociationList([self])
+            else:
+                obj._GmlFeatureStyles.add(self)
+            if self._GmlFeatureTypes is EMPTY:
+                self._GmlFeatureTypes = AssociationList([obj])
+            else:
+                self._GmlFeatureTypes.add(obj)
 
     def removeGmlFeatureTypes(self, *GmlFeatureTypes):
         for obj in GmlFeatureTypes:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class GmlFeatureType(IdentifiedObject):
     """Type classification of feature.Type classification of feature.
@@ -29,8 +30,9 @@ class GmlFeatureType(IdentifiedObject):
 
         @param GmlFeatureStyles:
         """
-        self._GmlFeatureStyles = []
-        self.GmlFeatureStyles = [] if GmlFeatureStyles is None else GmlFeatureStyles
+        self._GmlFeatureStyles = EMPTY
+        if GmlFeatureStyles is not None:
+            self.GmlFeatureStyles = GmlFeatureStyles
 
         super(GmlFeatureType, self).__init__(*args, **kw_args)
 
@@ -46,21 +48,28 @@ class GmlFeatureType(IdentifiedObject):
         return self._GmlFeatureStyles
 
     def setGmlFeatureStyles(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._GmlFeatureStyles:
-            filtered = [q for q in p.GmlFeatureTypes if q != self]
-            self._GmlFeatureStyles._GmlFeatureTypes = filtered
+            p._GmlFeatureTypes.discard(self)
         for r in value:
-            if self not in r._GmlFeatureTypes:
-                r._GmlFeatureTypes.append(self)
+            if r._GmlFeatureTypes is EMPTY:
+                r._GmlFeatureTypes = AssociationList([self])
+            else:
+                r._GmlFeatureTypes.add(self)
         self._GmlFeatureStyles = value
 
     GmlFeatureStyles = property(getGmlFeatureStyles, setGmlFeatureStyles)
 
     def addGmlFeatureStyles(self, *GmlFeatureStyles):
         for obj in GmlFeatureStyles:
-            if self not in obj._GmlFeatureTypes:
-                obj._GmlFeatureTypes.append(self)
-            self._GmlFeatureStyles.append(obj)
+            if obj._GmlFeatureTypes is EMPTY:
+                obj._GmlFeatureTypes = AssociationList([self])
+            else:
+                obj._GmlFeatureTypes.add(self)
+            if self._GmlFeatureStyles is EMPTY:
+                self._GmlFeatureStyles = AssociationList([obj])
+            else:
+                self._GmlFeatureStyles.add(obj)
 
     def removeGmlFeatureStyles(self, *GmlFeatureStyles):
         for obj in GmlFeatureStyles:
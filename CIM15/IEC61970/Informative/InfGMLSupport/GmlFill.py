@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class GmlFill(IdentifiedObject):
     """Specifies how the area of the geometry will be filled.Specifies how the area of the geometry will be filled.
@@ -40,17 +41,21 @@ class GmlFill(IdentifiedObject):
         self._GmlColour = None
         self.GmlColour = GmlColour
 
-        self._GmlMarks = []
-        self.GmlMarks = [] if GmlMarks is None else GmlMarks
+        self._GmlMarks = EMPTY
+        if GmlMarks is not None:
+            self.GmlMarks = GmlMarks
 
-        self._GmlTextSymbols = []
-        self.GmlTextSymbols = [] if GmlTextSymbols is None else GmlTextSymbols
+        self._GmlTextSymbols = EMPTY
+        if GmlTextSymbols is not None:
+            self.GmlTextSymbols = GmlTextSymbols
 
-        self._GmlSvgParameters = []
-        self.GmlSvgParameters = [] if GmlSvgParameters is None else GmlSvgParameters
+        self._GmlSvgParameters = EMPTY
+        if GmlSvgParameters is not None:
+            self.GmlSvgParameters = GmlSvgParameters
 
-        self._GmlPolygonSymbols = []
-        self.GmlPolygonSymbols = [] if GmlPolygonSymbols is None else GmlPolygonSymbols
+        self._GmlPolygonSymbols = EMPTY
+        if GmlPolygonSymbols is not None:
+            self.GmlPolygonSymbols = GmlPolygonSymbols
 
         super(GmlFill, self).__init__(*args, **kw_args)
 
@@ -67,13 +72,14 @@ class GmlFill(IdentifiedObject):
 
     def setGmlColour(self, value):
         if self._GmlColour is not None:
-            filtered = [x for x in self.GmlColour.GmlFills if x != self]
-            self._GmlColour._GmlFills = filtered
+            self._GmlColour._GmlFills.discard(self)
 
         self._GmlColour = value
         if self._GmlColour is not None:
-            if self not in self._GmlColour._GmlFills:
-                self._GmlColour._GmlFills.append(self)
+            if self._GmlColour._GmlFills is EMPTY:
+                self._GmlColour._GmlFills = AssociationList([self])
+            else:
+                self._GmlColour._GmlFills.add(self)
 
     GmlColour = property(getGmlColour, setGmlColour)
 
@@ -82,21 +88,28 @@ class GmlFill(IdentifiedObject):
         return self._GmlMarks
 
     def setGmlMarks(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._GmlMarks:
-            filtered = [q for q in p.GmlFIlls if q != self]
-            self._GmlMarks._GmlFIlls = filtered
+            p._GmlFIlls.discard(self)
         for r in value:
-            if self not in r._GmlFIlls:
-                r._GmlFIlls.append(self)
+            if r._GmlFIlls is EMPTY:
+                r._GmlFIlls = AssociationList([self])
+            else:
+                r._GmlFIlls.add(self)
         self._GmlMarks = value
 
     GmlMarks = property(getGmlMarks, setGmlMarks)
 
     def addGmlMarks(self, *GmlMarks):
         for obj in GmlMarks:
-            if self not in obj._GmlFIlls:
-                obj._GmlFIlls.append(self)
-            self._GmlMarks.append(obj)
+            if obj._GmlFIlls is EMPTY:
+                obj._GmlFIlls = AssociationList([self])
+            else:
+                obj._GmlFIlls.add(self)
+            if self._GmlMarks is EMPTY:
+                self._GmlMarks = AssociationList([obj])
+            else:
+                self._GmlMarks.add(obj)
 
     def removeGmlMarks(self, *GmlMarks):
         for obj in GmlMarks:
@@ -109,6 +122,7 @@ class GmlFill(IdentifiedObject):
         return self._GmlTextSymbols
 
     def setGmlTextSymbols(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._GmlTextSymbols:
             x.GmlFill = None
         for y in value:
@@ -130,21 +144,28 @@ class GmlFill(IdentifiedObject):
         return self._GmlSvgParameters
 
     def setGmlSvgParameters(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._GmlSvgParameters:
-            filtered = [q for q in p.GmlFills if q != self]
-            self._GmlSvgParameters._GmlFills = filtered
+            p._GmlFills.discard(self)
         for r in value:
-            if self not in r._GmlFills:
-                r._GmlFills.append(self)
+            if r._GmlFills is EMPTY:
+                r._GmlFills = AssociationList([self])
+            else:
+                r._GmlFills.add(self)
         self._GmlSvgParameters = value
 
     GmlSvgParameters = property(getGmlSvgParameters, setGmlSvgParameters)
 
     def addGmlSvgParameters(self, *GmlSvgParameters):
         for obj in GmlSvgParameters:
-            if self not in obj._GmlFills:
-                obj._GmlFills.append(self)
-            self._GmlSvgParameters.append(obj)
+            if obj._GmlFills is EMPTY:
+                obj._GmlFills = AssociationList([self])
+            else:
+                obj._GmlFills.add(self)
+            if self._GmlSvgParameters is EMPTY:
+                self._GmlSvgParameters = AssociationList([obj])
+            else:
+                self._GmlSvgParameters.add(obj)
 
     def removeGmlSvgParameters(self, *GmlSvgParameters):
         for obj in GmlSvgParameters:
@@ -157,6 +178,7 @@ class GmlFill(IdentifiedObject):
         return self._GmlPolygonSymbols
 
     def setGmlPolygonSymbols(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._GmlPolygonSymbols:
             x.GmlFill = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class GmlFont(IdentifiedObject):
     """Identifies a font of a certain family, style, and size.Identifies a font of a certain family, style, and size.
@@ -51,11 +52,13 @@ class GmlFont(IdentifiedObject):
         #: The amount of weight or boldness to use for a font. Allowed values are 'normal' and 'bold'.
         self.weight = weight
 
-        self._GmlTextSymbols = []
-        self.GmlTextSymbols = [] if GmlTextSymbols is None else GmlTextSymbols
+        self._GmlTextSymbols = EMPTY
+        if GmlTextSymbols is not None:
+            self.GmlTextSymbols = GmlTextSymbols
 
-        self._GmlSvgParameters = []
-        self.GmlSvgParameters = [] if GmlSvgParameters is None else GmlSvgParameters
+        self._GmlSvgParameters = EMPTY
+        if GmlSvgParameters is not None:
+            self.GmlSvgParameters = GmlSvgParameters
 
         self._GmlColour = None
         self.GmlColour = GmlColour
@@ -74,6 +77,7 @@ class GmlFont(IdentifiedObject):
         return self._GmlTextSymbols
 
     def setGmlTextSymbols(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._GmlTextSymbols:
             x.GmlFont = None
         for y in value:
@@ -95,21 +99,28 @@ class GmlFont(IdentifiedObject):
         return self._GmlSvgParameters
 
     def setGmlSvgParameters(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._GmlSvgParameters:
-            filtered = [q for q in p.GmlFonts if q != self]
-            self._GmlSvgParameters._GmlFonts = filtered
+            p._GmlFonts.discard(self)
         for r in value:
-            if self not in r._GmlFonts:
-                r._GmlFonts.append(self)
+            if r._GmlFonts is EMPTY:
+                r._GmlFonts = AssociationList([self])
+            else:
+                r._GmlFonts.add(self)
         self._GmlSvgParameters = value
 
     GmlSvgParameters = property(getGmlSvgParameters, setGmlSvgParameters)
 
     def addGmlSvgParameters(self, *GmlSvgParameters):
         for obj in GmlSvgParameters:
-            if self not in obj._GmlFonts:
-                obj._GmlFonts.append(self)
-            self._GmlSvgParameters.append(obj)
+            if obj._GmlFonts is EMPTY:
+                obj._GmlFonts = AssociationList([self])
+            else:
+                obj._GmlFonts.add(self)
+            if self._GmlSvgParameters is EMPTY:
+                self._GmlSvgParameters = AssociationList([obj])
+            else:
+                self._GmlSvgParameters.add(obj)
 
     def removeGmlSvgParameters(self, *GmlSvgParameters):
         for obj in GmlSvgParameters:
@@ -123,13 +134,14 @@ class GmlFont(IdentifiedObject):
 
     def setGmlColour(self, value):
         if self._GmlColour is not None:
-            filtered = [x for x in self.GmlColour.GmlFonts if x != self]
-            self._GmlColour._GmlFonts = filtered
+            self._GmlColour._GmlFonts.discard(self)
 
         self._GmlColour = value
         if self._GmlColour is not None:
-            if self not in self._GmlColour._GmlFonts:
-                self._GmlColour._GmlFonts.append(self)
+            if self._GmlColour._GmlFonts is EMPTY:
+                self._GmlColour._GmlFonts = AssociationList([self])
+            else:
+                self._GmlColour._GmlFonts.add(self)
 
     GmlColour = property(getGmlColour, setGmlColour)
 
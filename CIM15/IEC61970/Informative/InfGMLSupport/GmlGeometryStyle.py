@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class GmlGeometryStyle(IdentifiedObject):
     """The style for one geometry of a feature. Any number of geometry style descriptors can be assigned to one feature style. This is usually required for features with multiple geometry properties.The style for one geometry of a feature. Any number of geometry style descriptors can be assigned to one feature style. This is usually required for features with multiple geometry properties.
@@ -63,13 +64,14 @@ class GmlGeometryStyle(IdentifiedObject):
 
     def setGmlFeatureStyle(self, value):
         if self._GmlFeatureStyle is not None:
-            filtered = [x for x in self.GmlFeatureStyle.GmlGeometryStyles if x != self]
-            self._GmlFeatureStyle._GmlGeometryStyles = filtered
+            self._GmlFeatureStyle._GmlGeometryStyles.discard(self)
 
         self._GmlFeatureStyle = value
         if self._GmlFeatureStyle is not None:
-            if self not in self._GmlFeatureStyle._GmlGeometryStyles:
-                self._GmlFeatureStyle._GmlGeometryStyles.append(self)
+            if self._GmlFeatureStyle._GmlGeometryStyles is EMPTY:
+                self._GmlFeatureStyle._GmlGeometryStyles = AssociationList([self])
+            else:
+                self._GmlFeatureStyle._GmlGeometryStyles.add(self)
 
     GmlFeatureStyle = property(getGmlFeatureStyle, setGmlFeatureStyle)
 
@@ -79,13 +81,14 @@ class GmlGeometryStyle(IdentifiedObject):
 
     def setGmlLabelStyle(self, value):
         if self._GmlLabelStyle is not None:
-            filtered = [x for x in self.GmlLabelStyle.GmlGeometryStyles if x != self]
-            self._GmlLabelStyle._GmlGeometryStyles = filtered
+            self._GmlLabelStyle._GmlGeometryStyles.discard(self)
 
         self._GmlLabelStyle = value
         if self._GmlLabelStyle is not None:
-            if self not in self._GmlLabelStyle._GmlGeometryStyles:
-                self._GmlLabelStyle._GmlGeometryStyles.append(self)
+            if self._GmlLabelStyle._GmlGeometryStyles is EMPTY:
+                self._GmlLabelStyle._GmlGeometryStyles = AssociationList([self])
+            else:
+                self._GmlLabelStyle._GmlGeometryStyles.add(self)
 
     GmlLabelStyle = property(getGmlLabelStyle, setGmlLabelStyle)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class GmlGraphic(IdentifiedObject):
     """A 'graphic symbol' with an inherent shape, color(s), and possibly size. A 'graphic' can be very informally defined as 'a little picture' and can be of either a raster or vector-graphic source type.A 'graphic symbol' with an inherent shape, color(s), and possibly size. A 'graphic' can be very informally defined as 'a little picture' and can be of either a raster or vector-graphic source type.
@@ -58,11 +59,13 @@ class GmlGraphic(IdentifiedObject):
         #: Vertical scaling factor of normal symbol - particularly applicable to busbars if not described through a sequence of gmlPositions (e.g., Busbars).
         self.yScale = yScale
 
-        self._GmlMarks = []
-        self.GmlMarks = [] if GmlMarks is None else GmlMarks
+        self._GmlMarks = EMPTY
+        if GmlMarks is not None:
+            self.GmlMarks = GmlMarks
 
-        self._GmlPointSymbols = []
-        self.GmlPointSymbols = [] if GmlPointSymbols is None else GmlPointSymbols
+        self._GmlPointSymbols = EMPTY
+        if GmlPointSymbols is not None:
+            self.GmlPointSymbols = GmlPointSymbols
 
         super(GmlGraphic, self).__init__(*args, **kw_args)
 
@@ -78,21 +81,28 @@ class GmlGraphic(IdentifiedObject):
         return self._GmlMarks
 
     def setGmlMarks(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._GmlMarks:
-            filtered = [q for q in p.GmlGraphics if q != self]
-            self._GmlMarks._GmlGraphics = filtered
+            p._GmlGraphics.discard(self)
         for r in value:
-            if self not in r._GmlGraphics:
-                r._GmlGraphics.append(self)
+            if r._GmlGraphics is EMPTY:
+                r._GmlGraphics = AssociationList([self])
+            else:
+                r._GmlGraphics.add(self)
         self._GmlMarks = value
 
     GmlMarks = property(getGmlMarks, setGmlMarks)
 
     def addGmlMarks(self, *GmlMarks):
         for obj in GmlMarks:
-            if self not in obj._GmlGraphics:
-                obj._GmlGraphics.append(self)
-            self._GmlMarks.append(obj)
+            if obj._GmlGraphics is EMPTY:
+                obj._GmlGraphics = AssociationList([self])
+            else:
+                obj._GmlGraphics.add(self)
+            if self._GmlMarks is EMPTY:
+                self._GmlMarks = AssociationList([obj])
+            else:
+                self._GmlMarks.add(obj)
 
     def removeGmlMarks(self, *GmlMarks):
         for obj in GmlMarks:
@@ -105,6 +115,7 @@ class GmlGraphic(IdentifiedObject):
         return self._GmlPointSymbols
 
     def setGmlPointSymbols(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._GmlPointSymbols:
             x.GmlGraphic = None
         for y in value:
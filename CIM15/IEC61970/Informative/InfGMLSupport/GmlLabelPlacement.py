@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class GmlLabelPlacement(IdentifiedObject):
     """Used to position a label relative to a point or a line.Used to position a label relative to a point or a line.
@@ -57,8 +58,9 @@ class GmlLabelPlacement(IdentifiedObject):
         #: Perpendicular distance away from a line to draw a label. The distance is in pixels and is positive to the left-hand side of the line string. Negative numbers mean right. The default offset is 0.
         self.offset = offset
 
-        self._GmlTextSymbols = []
-        self.GmlTextSymbols = [] if GmlTextSymbols is None else GmlTextSymbols
+        self._GmlTextSymbols = EMPTY
+        if GmlTextSymbols is not None:
+            self.GmlTextSymbols = GmlTextSymbols
 
         super(GmlLabelPlacement, self).__init__(*args, **kw_args)
 
@@ -74,6 +76,7 @@ class GmlLabelPlacement(IdentifiedObject):
         return self._GmlTextSymbols
 
     def setGmlTextSymbols(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._GmlTextSymbols:
             x.GmlLabelPlacement = None
         for y in value:
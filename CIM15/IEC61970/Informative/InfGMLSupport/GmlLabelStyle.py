@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class GmlLabelStyle(IdentifiedObject):
     """The style for the text that is to be displayed along with the graphical representation of a feature. The content of the label is not necessarily defined in the GML data set. More precisely, the content can be static text specified in the style itself and the text from the GML data set. Label style has two elements: gml:style that specifies the style and gml:label that is used to compose the label content.The style for the text that is to be displayed along with the graphical representation of a feature. The content of the label is not necessarily defined in the GML data set. More precisely, the content can be static text specified in the style itself and the text from the GML data set. Label style has two elements: gml:style that specifies the style and gml:label that is used to compose the label content.
@@ -43,11 +44,13 @@ class GmlLabelStyle(IdentifiedObject):
         #: Used to specify the style of the rendered text. The CSS2 styling expressions grammar should be used to express graphic properties.
         self.style = style
 
-        self._GmlTopologyStyles = []
-        self.GmlTopologyStyles = [] if GmlTopologyStyles is None else GmlTopologyStyles
+        self._GmlTopologyStyles = EMPTY
+        if GmlTopologyStyles is not None:
+            self.GmlTopologyStyles = GmlTopologyStyles
 
-        self._GmlGeometryStyles = []
-        self.GmlGeometryStyles = [] if GmlGeometryStyles is None else GmlGeometryStyles
+        self._GmlGeometryStyles = EMPTY
+        if GmlGeometryStyles is not None:
+            self.GmlGeometryStyles = GmlGeometryStyles
 
         self._GmlFeatureStyle = None
         self.GmlFeatureStyle = GmlFeatureStyle
@@ -66,6 +69,7 @@ class GmlLabelStyle(IdentifiedObject):
         return self._GmlTopologyStyles
 
     def setGmlTopologyStyles(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._GmlTopologyStyles:
             x.GmlLableStyle = None
         for y in value:
@@ -87,6 +91,7 @@ class GmlLabelStyle(IdentifiedObject):
         return self._GmlGeometryStyles
 
     def setGmlGeometryStyles(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._GmlGeometryStyles:
             x.GmlLabelStyle = None
         for y in value:
@@ -109,13 +114,14 @@ class GmlLabelStyle(IdentifiedObject):
 
     def setGmlFeatureStyle(self, value):
         if self._GmlFeatureStyle is not None:
-            filtered = [x for x in self.GmlFeatureStyle.GmlLabelStyles if x != self]
-            self._GmlFeatureStyle._GmlLabelStyles = filtered
+            self._GmlFeatureStyle._GmlLabelStyles.discard(self)
 
         self._GmlFeatureStyle = value
         if self._GmlFeatureStyle is not None:
-            if self not in self._GmlFeatureStyle._GmlLabelStyles:
-                self._GmlFeatureStyle._GmlLabelStyles.append(self)
+            if self._GmlFeatureStyle._GmlLabelStyles is EMPTY:
+                self._GmlFeatureStyle._GmlLabelStyles = AssociationList([self])
+            else:
+                self._GmlFeatureStyle._GmlLabelStyles.add(self)
 
     GmlFeatureStyle = property(getGmlFeatureStyle, setGmlFeatureStyle)
 
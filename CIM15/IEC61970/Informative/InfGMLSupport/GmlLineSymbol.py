@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Informative.InfGMLSupport.GmlSymbol import GmlSymbol
+from CIM15.Element import AssociationList, EMPTY
 
 class GmlLineSymbol(GmlSymbol):
     """Used to style a 'stroke' along a linear geometry type, such as a string of line segments.Used to style a 'stroke' along a linear geometry type, such as a string of line segments.
@@ -55,13 +56,14 @@ class GmlLineSymbol(GmlSymbol):
 
     def setGmlStroke(self, value):
         if self._GmlStroke is not None:
-            filtered = [x for x in self.GmlStroke.GmlLineSymbols if x != self]
-            self._GmlStroke._GmlLineSymbols = filtered
+            self._GmlStroke._GmlLineSymbols.discard(self)
 
         self._GmlStroke = value
         if self._GmlStroke is not None:
-            if self not in self._GmlStroke._GmlLineSymbols:
-                self._GmlStroke._GmlLineSymbols.append(self)
+            if self._GmlStroke._GmlLineSymbols is EMPTY:
+                self._GmlStroke._GmlLineSymbols = AssociationList([self])
+            else:
+                self._GmlStroke._GmlLineSymbols.add(self)
 
     GmlStroke = property(getGmlStroke, setGmlStroke)
 
@@ -71,13 +73,14 @@ class GmlLineSymbol(GmlSymbol):
 
     def setGmlDiagramObject(self, value):
         if self._GmlDiagramObject is not None:
-            filtered = [x for x in self.GmlDiagramObject.GmlLineSymbols if x != self]
-            self._GmlDiagramObject._GmlLineSymbols = filtered
+            self._GmlDiagramObject._GmlLineSymbols.discard(self)
 
         self._GmlDiagramObject = value
         if self._GmlDiagramObject is not None:
-            if self not in self._GmlDiagramObject._GmlLineSymbols:
-                self._GmlDiagramObject._GmlLineSymbols.append(self)
+            if self._GmlDiagramObject._GmlLineSymbols is EMPTY:
+                self._GmlDiagramObject._GmlLineSymbols = AssociationList([self])
+            else:
+                self._GmlDiagramObject._GmlLineSymbols.add(self)
 
     GmlDiagramObject = property(getGmlDiagramObject, setGmlDiagramObject)
 
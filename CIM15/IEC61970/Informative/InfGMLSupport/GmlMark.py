@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class GmlMark(IdentifiedObject):
     """Defines a 'shape' which has coloring applied to it (i.e. square, circle, triangle, star, ...).Defines a 'shape' which has coloring applied to it (i.e. square, circle, triangle, star, ...).
@@ -35,14 +36,17 @@ class GmlMark(IdentifiedObject):
         #: Gives the well-known name of the shape of the mark. Allowed values include at least square, circle, triangle, star, cross, and x.
         self.wellKnownName = wellKnownName
 
-        self._GmlGraphics = []
-        self.GmlGraphics = [] if GmlGraphics is None else GmlGraphics
+        self._GmlGraphics = EMPTY
+        if GmlGraphics is not None:
+            self.GmlGraphics = GmlGraphics
 
-        self._GmlStrokes = []
-        self.GmlStrokes = [] if GmlStrokes is None else GmlStrokes
+        self._GmlStrokes = EMPTY
+        if GmlStrokes is not None:
+            self.GmlStrokes = GmlStrokes
 
-        self._GmlFIlls = []
-        self.GmlFIlls = [] if GmlFIlls is None else GmlFIlls
+        self._GmlFIlls = EMPTY
+        if GmlFIlls is not None:
+            self.GmlFIlls = GmlFIlls
 
         super(GmlMark, self).__init__(*args, **kw_args)
 
@@ -58,21 +62,28 @@ class GmlMark(IdentifiedObject):
         return self._GmlGraphics
 
     def setGmlGraphics(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._GmlGraphics:
-            filtered = [q for q in p.GmlMarks if q != self]
-            self._GmlGraphics._GmlMarks = filtered
+            p._GmlMarks.discard(self)
         for r in value:
-            if self not in r._GmlMarks:
-                r._GmlMarks.append(self)
+            if r._GmlMarks is EMPTY:
+                r._GmlMarks = AssociationList([self])
+            else:
+                r._GmlMarks.add(self)
         self._GmlGraphics = value
 
     GmlGraphics = property(getGmlGraphics, setGmlGraphics)
 
     def addGmlGraphics(self, *GmlGraphics):
         for obj in GmlGraphics:
-            if self not in obj._GmlMarks:
-                obj._GmlMarks.append(self)
-            self._GmlGraphics.append(obj)
+            if obj._GmlMarks is EMPTY:
+                obj._GmlMarks = AssociationList([self])
+            else:
+                obj._GmlMarks.add(self)
+            if self._GmlGraphics is EMPTY:
+                self._GmlGraphics = AssociationList([obj])
+            else:
+                self._GmlGraphics.add(obj)
 
     def removeGmlGraphics(self, *GmlGraphics):
         for obj in GmlGraphics:
@@ -85,21 +96,28 @@ class GmlMark(IdentifiedObject):
         return self._GmlStrokes
 
     def setGmlStrokes(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._GmlStrokes:
-            filtered = [q for q in p.GmlMarks if q != self]
-            self._GmlStrokes._GmlMarks = filtered
+            p._GmlMarks.discard(self)
         for r in value:
-            if self not in r._GmlMarks:
-                r._GmlMarks.append(self)
+            if r._GmlMarks is EMPTY:
+                r._GmlMarks = AssociationList([self])
+            else:
+                r._GmlMarks.add(self)
         self._GmlStrokes = value
 
     GmlStrokes = property(getGmlStrokes, setGmlStrokes)
 
     def addGmlStrokes(self, *GmlStrokes):
         for obj in GmlStrokes:
-            if self not in obj._GmlMarks:
-                obj._GmlMarks.append(self)
-            self._GmlStrokes.append(obj)
+            if obj._GmlMarks is EMPTY:
+                obj._GmlMarks = AssociationList([self])
+            else:
+                obj._GmlMarks.add(self)
+            if self._GmlStrokes is EMPTY:
+                self._GmlStrokes = AssociationList([obj])
+            else:
+                self._GmlStrokes.add(obj)
 
     def removeGmlStrokes(self, *GmlStrokes):
         for obj in GmlStrokes:
@@ -112,21 +130,28 @@ class GmlMark(IdentifiedObject):
         return self._GmlFIlls
 
     def setGmlFIlls(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._GmlFIlls:
-            filtered = [q for q in p.GmlMarks if q != self]
-            self._GmlFIlls._GmlMarks = filtered
+            p._GmlMarks.discard(self)
         for r in value:
-            if self not in r._GmlMarks:
-                r._GmlMarks.append(self)
+            if r._GmlMarks is EMPTY:
+                r._GmlMarks = AssociationList([self])
+            else:
+                r._GmlMarks.add(self)
         self._GmlFIlls = value
 
     GmlFIlls = property(getGmlFIlls, setGmlFIlls)
 
     def addGmlFIlls(self, *GmlFIlls):
         for obj in GmlFIlls:
-            if self not in obj._GmlMarks:
-                obj._GmlMarks.append(self)
-            self._GmlFIlls.append(obj)
+            if obj._GmlMarks is EMPTY:
+                obj._GmlMarks = AssociationList([self])
+            else:
+                obj._GmlMarks.add(self)
+            if self._GmlFIlls is EMPTY:
+                self._GmlFIlls = AssociationList([obj])
+            else:
+                self._GmlFIlls.add(obj)
 
     def removeGmlFIlls(self, *GmlFIlls):
         for obj in GmlFIlls:
@@ -18,7 +18,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from CIM15.Element import Element
+from CIM15.Element import Element, AssociationList, EMPTY
 
 class GmlObservation(Element):
     """A GML observation models the act of observing, often with a camera, a person or some form of instrument. An observation feature describes the 'metadata' associated with an information capture event, together with a value for the result of the observation. The basic structures introduced in this class are intended to serve as the foundation for more comprehensive schemas for scientific, technical and engineering measurement schemas.A GML observation models the act of observing, often with a camera, a person or some form of instrument. An observation feature describes the 'metadata' associated with an information capture event, together with a value for the result of the observation. The basic structures introduced in this class are intended to serve as the foundation for more comprehensive schemas for scientific, technical and engineering measurement schemas.
@@ -47,14 +47,17 @@ class GmlObservation(Element):
 
         self.dateTime = dateTime
 
-        self._GmlDiagramObjects = []
-        self.GmlDiagramObjects = [] if GmlDiagramObjects is None else GmlDiagramObjects
+        self._GmlDiagramObjects = EMPTY
+        if GmlDiagramObjects is not None:
+            self.GmlDiagramObjects = GmlDiagramObjects
 
-        self._ChangeItems = []
-        self.ChangeItems = [] if ChangeItems is None else ChangeItems
+        self._ChangeItems = EMPTY
+        if ChangeItems is not None:
+            self.ChangeItems = ChangeItems
 
-        self._GmlValues = []
-        self.GmlValues = [] if GmlValues is None else GmlValues
+        self._GmlValues = EMPTY
+        if GmlValues is not None:
+            self.GmlValues = GmlValues
 
         super(GmlObservation, self).__init__(*args, **kw_args)
 
@@ -70,21 +73,28 @@ class GmlObservation(Element):
         return self._GmlDiagramObjects
 
     def setGmlDiagramObjects(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._GmlDiagramObjects:
-            filtered = [q for q in p.GmlObservatins if q != self]
-            self._GmlDiagramObjects._GmlObservatins = filtered
+            p._GmlObservatins.discard(self)
         for r in value:
-            if self not in r._GmlObservatins:
-                r._GmlObservatins.append(self)
+            if r._GmlObservatins is EMPTY:
+                r._GmlObservatins = AssociationList([self])
+            else:
+                r._GmlObservatins.add(self)
         self._GmlDiagramObjects = value
 
     GmlDiagramObjects = property(getGmlDiagramObjects, setGmlDiagramObjects)
 
     def addGmlDiagramObjects(self, *GmlDiagramObjects):
         for obj in GmlDiagramObjects:
-            if self not in obj._GmlObservatins:
-                obj._GmlObservatins.append(self)
-            self._GmlDiagramObjects.append(obj)
+            if obj._GmlObservatins is EMPTY:
+                obj._GmlObservatins = AssociationList([self])
+            else:
+                obj._GmlObservatins.add(self)
+            if self._GmlDiagramObjects is EMPTY:
+                self._GmlDiagramObjects = AssociationList([obj])
+            else:
+                self._GmlDiagramObjects.add(obj)
 
     def removeGmlDiagramObjects(self, *GmlDiagramObjects):
         for obj in GmlDiagramObjects:
@@ -97,6 +107,7 @@ class GmlObservation(Element):
         return self._ChangeItems
 
     def setChangeItems(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ChangeItems:
             x.GmlObservation = None
         for y in value:
@@ -118,6 +129,7 @@ class GmlObservation(Element):
         return self._GmlValues
 
     def setGmlValues(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._GmlValues:
             x.GmlObservation = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Informative.InfGMLSupport.GmlSymbol import GmlSymbol
+from CIM15.Element import AssociationList, EMPTY
 
 class GmlPointSymbol(GmlSymbol):
     """Used to draw a 'graphic' at a point.Used to draw a 'graphic' at a point.
@@ -51,13 +52,14 @@ class GmlPointSymbol(GmlSymbol):
 
     def setGmlGraphic(self, value):
         if self._GmlGraphic is not None:
-            filtered = [x for x in self.GmlGraphic.GmlPointSymbols if x != self]
-            self._GmlGraphic._GmlPointSymbols = filtered
+            self._GmlGraphic._GmlPointSymbols.discard(self)
 
         self._GmlGraphic = value
         if self._GmlGraphic is not None:
-            if self not in self._GmlGraphic._GmlPointSymbols:
-                self._GmlGraphic._GmlPointSymbols.append(self)
+            if self._GmlGraphic._GmlPointSymbols is EMPTY:
+                self._GmlGraphic._GmlPointSymbols = AssociationList([self])
+            else:
+                self._GmlGraphic._GmlPointSymbols.add(self)
 
     GmlGraphic = property(getGmlGraphic, setGmlGraphic)
 
@@ -67,13 +69,14 @@ class GmlPointSymbol(GmlSymbol):
 
     def setGmlDiagramObject(self, value):
         if self._GmlDiagramObject is not None:
-            filtered = [x for x in self.GmlDiagramObject.GmlPointSymbols if x != self]
-            self._GmlDiagramObject._GmlPointSymbols = filtered
+            self._GmlDiagramObject._GmlPointSymbols.discard(self)
 
         self._GmlDiagramObject = value
         if self._GmlDiagramObject is not None:
-            if self not in self._GmlDiagramObject._GmlPointSymbols:
-                self._GmlDiagramObject._GmlPointSymbols.append(self)
+            if self._GmlDiagramObject._GmlPointSymbols is EMPTY:
+                self._GmlDiagramObject._GmlPointSymbols = AssociationList([self])
+            else:
+                self._GmlDiagramObject._GmlPointSymbols.add(self)
 
     GmlDiagramObject = property(getGmlDiagramObject, setGmlDiagramObject)
 
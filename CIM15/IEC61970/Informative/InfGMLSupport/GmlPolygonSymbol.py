@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Informative.InfGMLSupport.GmlSymbol import GmlSymbol
+from CIM15.Element import AssociationList, EMPTY
 
 class GmlPolygonSymbol(GmlSymbol):
     """Used to draw a polygon (or other area-type geometries), including filling its interior and stroking its border (outline).Used to draw a polygon (or other area-type geometries), including filling its interior and stroking its border (outline).
@@ -55,13 +56,14 @@ class GmlPolygonSymbol(GmlSymbol):
 
     def setGmlDiagramObject(self, value):
         if self._GmlDiagramObject is not None:
-            filtered = [x for x in self.GmlDiagramObject.GmlPolygonSymbols if x != self]
-            self._GmlDiagramObject._GmlPolygonSymbols = filtered
+            self._GmlDiagramObject._GmlPolygonSymbols.discard(self)
 
         self._GmlDiagramObject = value
         if self._GmlDiagramObject is not None:
-            if self not in self._GmlDiagramObject._GmlPolygonSymbols:
-                self._GmlDiagramObject._GmlPolygonSymbols.append(self)
+            if self._GmlDiagramObject._GmlPolygonSymbols is EMPTY:
+                self._GmlDiagramObject._GmlPolygonSymbols = AssociationList([self])
+            else:
+                self._GmlDiagramObject._GmlPolygonSymbols.add(self)
 
     GmlDiagramObject = property(getGmlDiagramObject, setGmlDiagramObject)
 
@@ -71,13 +73,14 @@ class GmlPolygonSymbol(GmlSymbol):
 
     def setGmlFill(self, value):
         if self._GmlFill is not None:
-            filtered = [x for x in self.GmlFill.GmlPolygonSymbols if x != self]
-            self._GmlFill._GmlPolygonSymbols = filtered
+            self._GmlFill._GmlPolygonSymbols.discard(self)
 
         self._GmlFill = value
         if self._GmlFill is not None:
-            if self not in self._GmlFill._GmlPolygonSymbols:
-                self._GmlFill._GmlPolygonSymbols.append(self)
+            if self._GmlFill._GmlPolygonSymbols is EMPTY:
+                self._GmlFill._GmlPolygonSymbols = AssociationList([self])
+            else:
+                self._GmlFill._GmlPolygonSymbols.add(self)
 
     GmlFill = property(getGmlFill, setGmlFill)
 
@@ -87,13 +90,14 @@ class GmlPolygonSymbol(GmlSymbol):
 
     def setGmlStroke(self, value):
         if self._GmlStroke is not None:
-            filtered = [x for x in self.GmlStroke.GmlPolygonSymbols if x != self]
-            self._GmlStroke._GmlPolygonSymbols = filtered
+            self._GmlStroke._GmlPolygonSymbols.discard(self)
 
         self._GmlStroke = value
         if self._GmlStroke is not None:
-            if self not in self._GmlStroke._GmlPolygonSymbols:
-                self._GmlStroke._GmlPolygonSymbols.append(self)
+            if self._GmlStroke._GmlPolygonSymbols is EMPTY:
+                self._GmlStroke._GmlPolygonSymbols = AssociationList([self])
+            else:
+                self._GmlStroke._GmlPolygonSymbols.add(self)
 
     GmlStroke = property(getGmlStroke, setGmlStroke)
 
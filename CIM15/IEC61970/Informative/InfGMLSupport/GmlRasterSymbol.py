@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Informative.InfGMLSupport.GmlSymbol import GmlSymbol
+from CIM15.Element import AssociationList, EMPTY
 
 class GmlRasterSymbol(GmlSymbol):
     """Describes how to render raster/matrix-coverage data (e.g., satellite photos, DEMs).Describes how to render raster/matrix-coverage data (e.g., satellite photos, DEMs).
@@ -79,13 +80,14 @@ class GmlRasterSymbol(GmlSymbol):
 
     def setGmlDiagramObject(self, value):
         if self._GmlDiagramObject is not None:
-            filtered = [x for x in self.GmlDiagramObject.GmlRasterSymbols if x != self]
-            self._GmlDiagramObject._GmlRasterSymbols = filtered
+            self._GmlDiagramObject._GmlRasterSymbols.discard(self)
 
         self._GmlDiagramObject = value
         if self._GmlDiagramObject is not None:
-            if self not in self._GmlDiagramObject._GmlRasterSymbols:
-                self._GmlDiagramObject._GmlRasterSymbols.append(self)
+            if self._GmlDiagramObject._GmlRasterSymbols is EMPTY:
+                self._GmlDiagramObject._GmlRasterSymbols = AssociationList([self])
+            else:
+                self._GmlDiagramObject._GmlRasterSymbols.add(self)
 
     GmlDiagramObject = property(getGmlDiagramObject, setGmlDiagramObject)
 
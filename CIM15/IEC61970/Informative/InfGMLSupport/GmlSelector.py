@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class GmlSelector(IdentifiedObject):
     """A diagram element that allows selection by a user, i.e. as 'hyperNode' for navigating between diagrams, or as composite object representing multiple grouped objects.A diagram element that allows selection by a user, i.e. as 'hyperNode' for navigating between diagrams, or as composite object representing multiple grouped objects.
@@ -30,11 +31,13 @@ class GmlSelector(IdentifiedObject):
         @param ChangeItems:
         @param GmlDiagramObjects:
         """
-        self._ChangeItems = []
-        self.ChangeItems = [] if ChangeItems is None else ChangeItems
+        self._ChangeItems = EMPTY
+        if ChangeItems is not None:
+            self.ChangeItems = ChangeItems
 
-        self._GmlDiagramObjects = []
-        self.GmlDiagramObjects = [] if GmlDiagramObjects is None else GmlDiagramObjects
+        self._GmlDiagramObjects = EMPTY
+        if GmlDiagramObjects is not None:
+            self.GmlDiagramObjects = GmlDiagramObjects
 
         super(GmlSelector, self).__init__(*args, **kw_args)
 
@@ -50,6 +53,7 @@ class GmlSelector(IdentifiedObject):
         return self._ChangeItems
 
     def setChangeItems(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ChangeItems:
             x.GmlSelector = None
         for y in value:
@@ -71,21 +75,28 @@ class GmlSelector(IdentifiedObject):
         return self._GmlDiagramObjects
 
     def setGmlDiagramObjects(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._GmlDiagramObjects:
-            filtered = [q for q in p.GmlSelectors if q != self]
-            self._GmlDiagramObjects._GmlSelectors = filtered
+            p._GmlSelectors.discard(self)
         for r in value:
-            if self not in r._GmlSelectors:
-                r._GmlSelectors.append(self)
+            if r._GmlSelectors is EMPTY:
+                r._GmlSelectors = AssociationList([self])
+            else:
+                r._GmlSelectors.add(self)
         self._GmlDiagramObjects = value
 
     GmlDiagramObjects = property(getGmlDiagramObjects, setGmlDiagramObjects)
 
     def addGmlDiagramObjects(self, *GmlDiagramObjects):
         for obj in GmlDiagramObjects:
-            if self not in obj._GmlSelectors:
-                obj._GmlSelectors.append(self)
-            self._GmlDiagramObjects.append(obj)
+            if obj._GmlSelectors is EMPTY:
+                obj._GmlSelectors = AssociationList([self])
+            else:
+                obj._GmlSelectors.add(self)
+            if self._GmlDiagramObjects is EMPTY:
+                self._GmlDiagramObjects = AssociationList([obj])
+            else:
+                self._GmlDiagramObjects.add(obj)
 
     def removeGmlDiagramObjects(self, *GmlDiagramObjects):
         for obj in GmlDiagramObjects:
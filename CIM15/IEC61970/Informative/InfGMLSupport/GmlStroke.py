@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class GmlStroke(IdentifiedObject):
     """The element encapsulating the graphical symbolization parameters for linear geometries.The element encapsulating the graphical symbolization parameters for linear geometries.
@@ -64,17 +65,21 @@ class GmlStroke(IdentifiedObject):
         self._GmlColour = None
         self.GmlColour = GmlColour
 
-        self._GmlPolygonSymbols = []
-        self.GmlPolygonSymbols = [] if GmlPolygonSymbols is None else GmlPolygonSymbols
+        self._GmlPolygonSymbols = EMPTY
+        if GmlPolygonSymbols is not None:
+            self.GmlPolygonSymbols = GmlPolygonSymbols
 
-        self._GmlMarks = []
-        self.GmlMarks = [] if GmlMarks is None else GmlMarks
+        self._GmlMarks = EMPTY
+        if GmlMarks is not None:
+            self.GmlMarks = GmlMarks
 
-        self._GmlSvgParameters = []
-        self.GmlSvgParameters = [] if GmlSvgParameters is None else GmlSvgParameters
+        self._GmlSvgParameters = EMPTY
+        if GmlSvgParameters is not None:
+            self.GmlSvgParameters = GmlSvgParameters
 
-        self._GmlLineSymbols = []
-        self.GmlLineSymbols = [] if GmlLineSymbols is None else GmlLineSymbols
+        self._GmlLineSymbols = EMPTY
+        if GmlLineSymbols is not None:
+            self.GmlLineSymbols = GmlLineSymbols
 
         super(GmlStroke, self).__init__(*args, **kw_args)
 
@@ -91,13 +96,14 @@ class GmlStroke(IdentifiedObject):
 
     def setGmlColour(self, value):
         if self._GmlColour is not None:
-            filtered = [x for x in self.GmlColour.GmlStrokes if x != self]
-            self._GmlColour._GmlStrokes = filtered
+            self._GmlColour._GmlStrokes.discard(self)
 
         self._GmlColour = value
         if self._GmlColour is not None:
-            if self not in self._GmlColour._GmlStrokes:
-                self._GmlColour._GmlStrokes.append(self)
+            if self._GmlColour._GmlStrokes is EMPTY:
+                self._GmlColour._GmlStrokes = AssociationList([self])
+            else:
+                self._GmlColour._GmlStrokes.add(self)
 
     GmlColour = property(getGmlColour, setGmlColour)
 
@@ -106,6 +112,7 @@ class GmlStroke(IdentifiedObject):
         return self._GmlPolygonSymbols
 
     def setGmlPolygonSymbols(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._GmlPolygonSymbols:
             x.GmlStroke = None
         for y in value:
@@ -127,21 +134,28 @@ class GmlStroke(IdentifiedObject):
         return self._GmlMarks
 
     def setGmlMarks(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._GmlMarks:
-            filtered = [q for q in p.GmlStrokes if q != self]
-            self._GmlMarks._GmlStrokes = filtered
+            p._GmlStrokes.discard(self)
         for r in value:
-            if self not in r._GmlStrokes:
-                r._GmlStrokes.append(self)
+            if r._GmlStrokes is EMPTY:
+                r._GmlStrokes = AssociationList([self])
+            else:
+                r._GmlStrokes.add(self)
         self._GmlMarks = value
 
     GmlMarks = property(getGmlMarks, setGmlMarks)
 
     def addGmlMarks(self, *GmlMarks):
         for obj in GmlMarks:
-            if self not in obj._GmlStrokes:
-                obj._GmlStrokes.append(self)
-            self._GmlMarks.append(obj)
+            if obj._GmlStrokes is EMPTY:
+                obj._GmlStrokes = AssociationList([self])
+            else:
+                obj._GmlStrokes.add(self)
+            if self._GmlMarks is EMPTY:
+                self._GmlMarks = AssociationList([obj])
+            else:
+                self._GmlMarks.add(obj)
 
     def removeGmlMarks(self, *GmlMarks):
         for obj in GmlMarks:
@@ -154,21 +168,28 @@ class GmlStroke(IdentifiedObject):
         return self._GmlSvgParameters
 
     def setGmlSvgParameters(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._GmlSvgParameters:
-            filtered = [q for q in p.GmlStokes if q != self]
-            self._GmlSvgParameters._GmlStokes = filtered
+            p._GmlStokes.discard(self)
         for r in value:
-            if self not in r._GmlStokes:
-                r._GmlStokes.append(self)
+            if r._GmlStokes is EMPTY:
+                r._GmlStokes = AssociationList([self])
+            else:
+                r._GmlStokes.add(self)
         self._GmlSvgParameters = value
 
     GmlSvgParameters = property(getGmlSvgParameters, setGmlSvgParameters)
 
     def addGmlSvgParameters(self, *GmlSvgParameters):
         for obj in GmlSvgParameters:
-            if self not in obj._GmlStokes:
-                obj._GmlStokes.append(self)
-            self._GmlSvgParameters.append(obj)
+            if obj._GmlStokes is EMPTY:
+                obj._GmlStokes = AssociationList([self])
+            else:
+                obj._GmlStokes.add(self)
+            if self._GmlSvgParameters is EMPTY:
+                self._GmlSvgParameters = AssociationList([obj])
+            else:
+                self._GmlSvgParameters.add(obj)
 
     def removeGmlSvgParameters(self, *GmlSvgParameters):
         for obj in GmlSvgParameters:
@@ -181,6 +202,7 @@ class GmlStroke(IdentifiedObject):
         return self._GmlLineSymbols
 
     def setGmlLineSymbols(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._GmlLineSymbols:
             x.GmlStroke = None
         for y in value:
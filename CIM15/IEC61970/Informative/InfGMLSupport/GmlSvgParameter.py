@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class GmlSvgParameter(IdentifiedObject):
     """Refers to an SVG/CSS graphical-formatting parameter. The parameter is identified using the 'name' attribute and the content of the element gives the SVG/CSS-coded value.Refers to an SVG/CSS graphical-formatting parameter. The parameter is identified using the 'name' attribute and the content of the element gives the SVG/CSS-coded value.
@@ -39,14 +40,17 @@ class GmlSvgParameter(IdentifiedObject):
         #: The SVG/CSS-coded value of the associated SvgAttribute.
         self.value = value
 
-        self._GmlStokes = []
-        self.GmlStokes = [] if GmlStokes is None else GmlStokes
+        self._GmlStokes = EMPTY
+        if GmlStokes is not None:
+            self.GmlStokes = GmlStokes
 
-        self._GmlFonts = []
-        self.GmlFonts = [] if GmlFonts is None else GmlFonts
+        self._GmlFonts = EMPTY
+        if GmlFonts is not None:
+            self.GmlFonts = GmlFonts
 
-        self._GmlFills = []
-        self.GmlFills = [] if GmlFills is None else GmlFills
+        self._GmlFills = EMPTY
+        if GmlFills is not None:
+            self.GmlFills = GmlFills
 
         super(GmlSvgParameter, self).__init__(*args, **kw_args)
 
@@ -62,21 +66,28 @@ class GmlSvgParameter(IdentifiedObject):
         return self._GmlStokes
 
     def setGmlStokes(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._GmlStokes:
-            filtered = [q for q in p.GmlSvgParameters if q != self]
-            self._GmlStokes._GmlSvgParameters = filtered
+            p._GmlSvgParameters.discard(self)
         for r in value:
-            if self not in r._GmlSvgParameters:
-                r._GmlSvgParameters.append(self)
+            if r._GmlSvgParameters is EMPTY:
+                r._GmlSvgParameters = AssociationList([self])
+            else:
+                r._GmlSvgParameters.add(self)
         self._GmlStokes = value
 
     GmlStokes = property(getGmlStokes, setGmlStokes)
 
     def addGmlStokes(self, *GmlStokes):
         for obj in GmlStokes:
-            if self not in obj._GmlSvgParameters:
-                obj._GmlSvgParameters.append(self)
-            self._GmlStokes.append(obj)
+            if obj._GmlSvgParameters is EMPTY:
+                obj._GmlSvgParameters = AssociationList([self])
+            else:
+                obj._GmlSvgParameters.add(self)
+            if self._GmlStokes is EMPTY:
+                self._GmlStokes = AssociationList([obj])
+            else:
+                self._GmlStokes.add(obj)
 
     def removeGmlStokes(self, *GmlStokes):
         for obj in GmlStokes:
@@ -89,21 +100,28 @@ class GmlSvgParameter(IdentifiedObject):
         return self._GmlFonts
 
     def setGmlFonts(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._GmlFonts:
-            filtered = [q for q in p.GmlSvgParameters if q != self]
-            self._GmlFonts._GmlSvgParameters = filtered
+            p._GmlSvgParameters.discard(self)
         for r in value:
-            if self not in r._GmlSvgParameters:
-                r._GmlSvgParameters.append(self)
+            if r._GmlSvgParameters is EMPTY:
+                r._GmlSvgParameters = AssociationList([self])
+            else:
+                r._GmlSvgParameters.add(self)
         self._GmlFonts = value
 
     GmlFonts = property(getGmlFonts, setGmlFonts)
 
     def addGmlFonts(self, *GmlFonts):
         for obj in GmlFonts:
-            if self not in obj._GmlSvgParameters:
-                obj._GmlSvgParameters.append(self)
-            self._GmlFonts.append(obj)
+            if obj._GmlSvgParameters is EMPTY:
+                obj._GmlSvgParameters = AssociationList([self])
+            else:
+                obj._GmlSvgParameters.add(self)
+            if self._GmlFonts is EMPTY:
+                self._GmlFonts = AssociationList([obj])
+            else:
+                self._GmlFonts.add(obj)
 
     def removeGmlFonts(self, *GmlFonts):
         for obj in GmlFonts:
@@ -116,21 +134,28 @@ class GmlSvgParameter(IdentifiedObject):
         return self._GmlFills
 
     def setGmlFills(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._GmlFills:
-            filtered = [q for q in p.GmlSvgParameters if q != self]
-            self._GmlFills._GmlSvgParameters = filtered
+            p._GmlSvgParameters.discard(self)
         for r in value:
-            if self not in r._GmlSvgParameters:
-                r._GmlSvgParameters.append(self)
+            if r._GmlSvgParameters is EMPTY:
+                r._GmlSvgParameters = AssociationList([self])
+            else:
+                r._GmlSvgParameters.add(self)
         self._GmlFills = value
 
     GmlFills = property(getGmlFills, setGmlFills)
 
     def addGmlFills(self, *GmlFills):
         for obj in GmlFills:
-            if self not in obj._GmlSvgParameters:
-                obj._GmlSvgParameters.append(self)
-            self._GmlFills.append(obj)
+            if obj._GmlSvgParameters is EMPTY:
+                obj._GmlSvgParameters = AssociationList([self])
+            else:
+                obj._GmlSvgParameters.add(self)
+            if self._GmlFills is EMPTY:
+                self._GmlFills = AssociationList([obj])
+            else:
+                self._GmlFills.add(obj)
 
     def removeGmlFills(self, *GmlFills):
         for obj in GmlFills:
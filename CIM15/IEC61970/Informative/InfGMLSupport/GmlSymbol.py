@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class GmlSymbol(IdentifiedObject):
     """Describes how a feature is to appear on a map or display. The symbol describes not just the shape that should appear but also such graphical properties as color and opacity.Describes how a feature is to appear on a map or display. The symbol describes not just the shape that should appear but also such graphical properties as color and opacity.
@@ -42,8 +43,9 @@ class GmlSymbol(IdentifiedObject):
         #: The Symbol type.
         self.type = type
 
-        self._GmlFeatureStyles = []
-        self.GmlFeatureStyles = [] if GmlFeatureStyles is None else GmlFeatureStyles
+        self._GmlFeatureStyles = EMPTY
+        if GmlFeatureStyles is not None:
+            self.GmlFeatureStyles = GmlFeatureStyles
 
         self._GmlBaseSymbol = None
         self.GmlBaseSymbol = GmlBaseSymbol
@@ -62,21 +64,28 @@ class GmlSymbol(IdentifiedObject):
         return self._GmlFeatureStyles
 
     def setGmlFeatureStyles(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._GmlFeatureStyles:
-            filtered = [q for q in p.GmlSymbols if q != self]
-            self._GmlFeatureStyles._GmlSymbols = filtered
+            p._GmlSymbols.discard(self)
         for r in value:
-            if self not in r._GmlSymbols:
-                r._GmlSymbols.append(self)
+            if r._GmlSymbols is EMPTY:
+                r._GmlSymbols = AssociationList([self])
+            else:
+                r._GmlSymbols.add(self)
         self._GmlFeatureStyles = value
 
     GmlFeatureStyles = property(getGmlFeatureStyles, setGmlFeatureStyles)
 
     def addGmlFeatureStyles(self, *GmlFeatureStyles):
         for obj in GmlFeatureStyles:
-            if self not in obj._GmlSymbols:
-                obj._GmlSymbols.append(self)
-            self._GmlFeatureStyles.append(obj)
+            if obj._GmlSymbols is EMPTY:
+                obj._GmlSymbols = AssociationList([self])
+            else:
+                obj._GmlSymbols.add(self)
+            if self._GmlFeatureStyles is EMPTY:
+                self._GmlFeatureStyles = AssociationList([obj])
+            else:
+                self._GmlFeatureStyles.add(obj)
 
     def removeGmlFeatureStyles(self, *GmlFeatureStyles):
         for obj in GmlFeatureStyles:
@@ -90,13 +99,14 @@ class GmlSymbol(IdentifiedObject):
 
     def setGmlBaseSymbol(self, value):
         if self._GmlBaseSymbol is not None:
-            filtered = [x for x in self.GmlBaseSymbol.GmlSymbols if x != self]
-            self._GmlBaseSymbol._GmlSymbols = filtered
+            self._GmlBaseSymbol._GmlSymbols.discard(self)
 
         self._GmlBaseSymbol = value
         if self._GmlBaseSymbol is not None:
-            if self not in self._GmlBaseSymbol._GmlSymbols:
-                self._GmlBaseSymbol._GmlSymbols.append(self)
+            if self._GmlBaseSymbol._GmlSymbols is EMPTY:
+                self._GmlBaseSymbol._GmlSymbols = AssociationList([self])
+            else:
+                self._GmlBaseSymbol._GmlSymbols.add(self)
 
     GmlBaseSymbol = property(getGmlBaseSymbol, setGmlBaseSymbol)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Informative.InfGMLSupport.GmlSymbol import GmlSymbol
+from CIM15.Element import AssociationList, EMPTY
 
 class GmlTextSymbol(GmlSymbol):
     """Used for styling text labels, i.e., for rendering them according to various graphical parameters.Used for styling text labels, i.e., for rendering them according to various graphical parameters.
@@ -83,13 +84,14 @@ class GmlTextSymbol(GmlSymbol):
 
     def setGmlFill(self, value):
         if self._GmlFill is not None:
-            filtered = [x for x in self.GmlFill.GmlTextSymbols if x != self]
-            self._GmlFill._GmlTextSymbols = filtered
+            self._GmlFill._GmlTextSymbols.discard(self)
 
         self._GmlFill = value
         if self._GmlFill is not None:
-            if self not in self._GmlFill._GmlTextSymbols:
-                self._GmlFill._GmlTextSymbols.append(self)
+            if self._GmlFill._GmlTextSymbols is EMPTY:
+                self._GmlFill._GmlTextSymbols = AssociationList([self])
+            else:
+                self._GmlFill._GmlTextSymbols.add(self)
 
     GmlFill = property(getGmlFill, setGmlFill)
 
@@ -99,13 +101,14 @@ class GmlTextSymbol(GmlSymbol):
 
     def setGmlLabelPlacement(self, value):
         if self._GmlLabelPlacement is not None:
-            filtered = [x for x in self.GmlLabelPlacement.GmlTextSymbols if x != self]
-            self._GmlLabelPlacement._GmlTextSymbols = filtered
+            self._GmlLabelPlacement._GmlTextSymbols.discard(self)
 
         self._GmlLabelPlacement = value
         if self._GmlLabelPlacement is not None:
-            if self not in self._GmlLabelPlacement._GmlTextSymbols:
-                self._GmlLabelPlacement._GmlTextSymbols.append(self)
+            if self._GmlLabelPlacement._GmlTextSymbols is EMPTY:
+                self._GmlLabelPlacement._GmlTextSymbols = AssociationList([self])
+            else:
+                self._GmlLabelPlacement._GmlTextSymbols.add(self)
 
     GmlLabelPlacement = property(getGmlLabelPlacement, setGmlLabelPlacement)
 
@@ -115,13 +118,14 @@ class GmlTextSymbol(GmlSymbol):
 
     def setGmlHalo(self, value):
         if self._GmlHalo is not None:
-            filtered = [x for x in self.GmlHalo.GmlTextSymbols if x != self]
-            self._GmlHalo._GmlTextSymbols = filtered
+            self._GmlHalo._GmlTextSymbols.discard(self)
 
         self._GmlHalo = value
         if self._GmlHalo is not None:
-            if self not in self._GmlHalo._GmlTextSymbols:
-                self._GmlHalo._GmlTextSymbols.append(self)
+            if self._GmlHalo._GmlTextSymbols is EMPTY:
+                self._GmlHalo._GmlTextSymbols = AssociationList([self])
+            else:
+                self._GmlHalo._GmlTextSymbols.add(self)
 
     GmlHalo = property(getGmlHalo, setGmlHalo)
 
@@ -131,13 +135,14 @@ class GmlTextSymbol(GmlSymbol):
 
     def setGmlFont(self, value):
         if self._GmlFont is not None:
-            filtered = [x for x in self.GmlFont.GmlTextSymbols if x != self]
-            self._GmlFont._GmlTextSymbols = filtered
+            self._GmlFont._GmlTextSymbols.discard(self)
 
         self._GmlFont = value
         if self._GmlFont is not None:
-            if self not in self._GmlFont._GmlTextSymbols:
-                self._GmlFont._GmlTextSymbols.append(self)
+            if self._GmlFont._GmlTextSymbols is EMPTY:
+                self._GmlFont._GmlTextSymbols = AssociationList([self])
+            else:
+                self._GmlFont._GmlTextSymbols.add(self)
 
     GmlFont = property(getGmlFont, setGmlFont)
 
@@ -147,13 +152,14 @@ class GmlTextSymbol(GmlSymbol):
 
     def setGmlDiagramObject(self, value):
         if self._GmlDiagramObject is not None:
-            filtered = [x for x in self.GmlDiagramObject.GmlTextSymbols if x != self]
-            self._GmlDiagramObject._GmlTextSymbols = filtered
+            self._GmlDiagramObject._GmlTextSymbols.discard(self)
 
         self._GmlDiagramObject = value
         if self._GmlDiagramObject is not None:
-            if self not in self._GmlDiagramObject._GmlTextSymbols:
-                self._GmlDiagramObject._GmlTextSymbols.append(self)
+            if self._GmlDiagramObject._GmlTextSymbols is EMPTY:
+                self._GmlDiagramObject._GmlTextSymbols = AssociationList([self])
+            else:
+                self._GmlDiagramObject._GmlTextSymbols.add(self)
 
     GmlDiagramObject = property(getGmlDiagramObject, setGmlDiagramObject)
 
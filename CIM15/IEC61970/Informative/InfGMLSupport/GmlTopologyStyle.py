@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class GmlTopologyStyle(IdentifiedObject):
     """The style for one topology property. Similarly to the Geometry style, a feature can have multiple topology properties, thus multiple topology style descriptors can be specified within one feature style.The style for one topology property. Similarly to the Geometry style, a feature can have multiple topology properties, thus multiple topology style descriptors can be specified within one feature style.
@@ -51,13 +52,14 @@ class GmlTopologyStyle(IdentifiedObject):
 
     def setGmlLableStyle(self, value):
         if self._GmlLableStyle is not None:
-            filtered = [x for x in self.GmlLableStyle.GmlTopologyStyles if x != self]
-            self._GmlLableStyle._GmlTopologyStyles = filtered
+            self._GmlLableStyle._GmlTopologyStyles.discard(self)
 
         self._GmlLableStyle = value
         if self._GmlLableStyle is not None:
-            if self not in self._GmlLableStyle._GmlTopologyStyles:
-                self._GmlLableStyle._GmlTopologyStyles.append(self)
+            if self._GmlLableStyle._GmlTopologyStyles is EMPTY:
+                self._GmlLableStyle._GmlTopologyStyles = AssociationList([self])
+            else:
+                self._GmlLableStyle._GmlTopologyStyles.add(self)
 
     GmlLableStyle = property(getGmlLableStyle, setGmlLableStyle)
 
@@ -67,13 +69,14 @@ class GmlTopologyStyle(IdentifiedObject):
 
     def setGmlFeatureStyle(self, value):
         if self._GmlFeatureStyle is not None:
-            filtered = [x for x in self.GmlFeatureStyle.GmlTobologyStyles if x != self]
-            self._GmlFeatureStyle._GmlTobologyStyles = filtered
+            self._GmlFeatureStyle._GmlTobologyStyles.discard(self)
 
         self._GmlFeatureStyle = value
         if self._GmlFeatureStyle is not None:
-            if self not in self._GmlFeatureStyle._GmlTobologyStyles:
-                self._GmlFeatureStyle._GmlTobologyStyles.append(self)
+            if self._GmlFeatureStyle._GmlTobologyStyles is EMPTY:
+                self._GmlFeatureStyle._GmlTobologyStyles = AssociationList([self])
+            else:
+                self._GmlFeatureStyle._GmlTobologyStyles.add(self)
 
     GmlFeatureStyle = property(getGmlFeatureStyle, setGmlFeatureStyle)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class GmlValue(IdentifiedObject):
     """Used for direct representation of values.Used for direct representation of values.
@@ -63,13 +64,14 @@ class GmlValue(IdentifiedObject):
 
     def setGmlObservation(self, value):
         if self._GmlObservation is not None:
-            filtered = [x for x in self.GmlObservation.GmlValues if x != self]
-            self._GmlObservation._GmlValues = filtered
+            self._GmlObservation._GmlValues.discard(self)
 
         self._GmlObservation = value
         if self._GmlObservation is not None:
-            if self not in self._GmlObservation._GmlValues:
-                self._GmlObservation._GmlValues.append(self)
+            if self._GmlObservation._GmlValues is EMPTY:
+                self._GmlObservation._GmlValues = AssociationList([self])
+            else:
+                self._GmlObservation._GmlValues.add(self)
 
     GmlObservation = property(getGmlObservation, setGmlObservation)
 
@@ -79,13 +81,14 @@ class GmlValue(IdentifiedObject):
 
     def setMeasurementValue(self, value):
         if self._MeasurementValue is not None:
-            filtered = [x for x in self.MeasurementValue.GmlValues if x != self]
-            self._MeasurementValue._GmlValues = filtered
+            self._MeasurementValue._GmlValues.discard(self)
 
         self._MeasurementValue = value
         if self._MeasurementValue is not None:
-            if self not in self._MeasurementValue._GmlValues:
-                self._MeasurementValue._GmlValues.append(self)
+            if self._MeasurementValue._GmlValues is EMPTY:
+                self._MeasurementValue._GmlValues = AssociationList([self])
+            else:
+                self._MeasurementValue._GmlValues.add(self)
 
     MeasurementValue = property(getMeasurementValue, setMeasurementValue)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Metering.EndDeviceFunction import EndDeviceFunction
+from CIM15.Element import AssociationList, EMPTY
 
 class LoadMgmtFunction(EndDeviceFunction):
     """A collective function at an end device that manages the customer load.A collective function at an end device that manages the customer load.
@@ -54,11 +55,13 @@ class LoadMgmtFunction(EndDeviceFunction):
         #: After a command had been received to activate the mannualOverRide state or remoteOverRideState, the normal (halted) schedule will resume after this specified time duration had elapsed.
         self.overRideTimeOut = overRideTimeOut
 
-        self._Switches = []
-        self.Switches = [] if Switches is None else Switches
+        self._Switches = EMPTY
+        if Switches is not None:
+            self.Switches = Switches
 
-        self._LoadMgmtRecords = []
-        self.LoadMgmtRecords = [] if LoadMgmtRecords is None else LoadMgmtRecords
+        self._LoadMgmtRecords = EMPTY
+        if LoadMgmtRecords is not None:
+            self.LoadMgmtRecords = LoadMgmtRecords
 
         super(LoadMgmtFunction, self).__init__(*args, **kw_args)
 
@@ -74,21 +77,28 @@ class LoadMgmtFunction(EndDeviceFunction):
         return self._Switches
 
     def setSwitches(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Switches:
-            filtered = [q for q in p.LoadMgmtFunctions if q != self]
-            self._Switches._LoadMgmtFunctions = filtered
+            p._LoadMgmtFunctions.discard(self)
         for r in value:
-            if self not in r._LoadMgmtFunctions:
-                r._LoadMgmtFunctions.append(self)
+            if r._LoadMgmtFunctions is EMPTY:
+                r._LoadMgmtFunctions = AssociationList([self])
+            else:
+                r._LoadMgmtFunctions.add(self)
         self._Switches = value
 
     Switches = property(getSwitches, setSwitches)
 
     def addSwitches(self, *Switches):
         for obj in Switches:
-            if self not in obj._LoadMgmtFunctions:
-                obj._LoadMgmtFunctions.append(self)
-            self._Switches.append(obj)
+            if obj._LoadMgmtFunctions is EMPTY:
+                obj._LoadMgmtFunctions = AssociationList([self])
+            else:
+                obj._LoadMgmtFunctions.add(self)
+            if self._Switches is EMPTY:
+                self._Switches = AssociationList([obj])
+            else:
+                self._Switches.add(obj)
 
     def removeSwitches(self, *Switches):
         for obj in Switches:
@@ -101,6 +111,7 @@ class LoadMgmtFunction(EndDeviceFunction):
         return self._LoadMgmtRecords
 
     def setLoadMgmtRecords(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._LoadMgmtRecords:
             x.LoadMgmtFunction = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.ActivityRecord import ActivityRecord
+from CIM15.Element import AssociationList, EMPTY
 
 class LoadMgmtRecord(ActivityRecord):
     """A log of actual measured load reductions as a result of load shed operations.A log of actual measured load reductions as a result of load shed operations.
@@ -51,13 +52,14 @@ class LoadMgmtRecord(ActivityRecord):
 
     def setLoadMgmtFunction(self, value):
         if self._LoadMgmtFunction is not None:
-            filtered = [x for x in self.LoadMgmtFunction.LoadMgmtRecords if x != self]
-            self._LoadMgmtFunction._LoadMgmtRecords = filtered
+            self._LoadMgmtFunction._LoadMgmtRecords.discard(self)
 
         self._LoadMgmtFunction = value
         if self._LoadMgmtFunction is not None:
-            if self not in self._LoadMgmtFunction._LoadMgmtRecords:
-                self._LoadMgmtFunction._LoadMgmtRecords.append(self)
+            if self._LoadMgmtFunction._LoadMgmtRecords is EMPTY:
+                self._LoadMgmtFunction._LoadMgmtRecords = AssociationList([self])
+            else:
+                self._LoadMgmtFunction._LoadMgmtRecords.add(self)
 
     LoadMgmtFunction = property(getLoadMgmtFunction, setLoadMgmtFunction)
 
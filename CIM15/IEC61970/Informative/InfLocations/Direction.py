@@ -18,7 +18,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from CIM15.Element import Element
+from CIM15.Element import Element, AssociationList, EMPTY
 
 class Direction(Element):
     """Used for navigating from one location to another location.Used for navigating from one location to another location.
@@ -51,13 +51,14 @@ class Direction(Element):
 
     def setLocation(self, value):
         if self._Location is not None:
-            filtered = [x for x in self.Location.Directions if x != self]
-            self._Location._Directions = filtered
+            self._Location._Directions.discard(self)
 
         self._Location = value
         if self._Location is not None:
-            if self not in self._Location._Directions:
-                self._Location._Directions.append(self)
+            if self._Location._Directions is EMPTY:
+                self._Location._Directions = AssociationList([self])
+            else:
+                self._Location._Directions.add(self)
 
     Location = property(getLocation, setLocation)
 
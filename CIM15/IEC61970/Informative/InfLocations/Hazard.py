@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class Hazard(IdentifiedObject):
     """A hazard is any object or condition that is a danger for causing loss or perils to an asset and/or people. Examples of hazards are trees growing under overhead power lines, a park being located by a substation (i.e., children climb fence to recover a ball), a lake near an overhead distribution line (fishing pole/line contacting power lines), etc.A hazard is any object or condition that is a danger for causing loss or perils to an asset and/or people. Examples of hazards are trees growing under overhead power lines, a park being located by a substation (i.e., children climb fence to recover a ball), a lake near an overhead distribution line (fishing pole/line contacting power lines), etc.
@@ -34,8 +35,9 @@ class Hazard(IdentifiedObject):
         #: Category by utility's corporate standards and practices.
         self.category = category
 
-        self._Locations = []
-        self.Locations = [] if Locations is None else Locations
+        self._Locations = EMPTY
+        if Locations is not None:
+            self.Locations = Locations
 
         self.status = status
 
@@ -54,21 +56,28 @@ class Hazard(IdentifiedObject):
         return self._Locations
 
     def setLocations(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Locations:
-            filtered = [q for q in p.Hazards if q != self]
-            self._Locations._Hazards = filtered
+            p._Hazards.discard(self)
         for r in value:
-            if self not in r._Hazards:
-                r._Hazards.append(self)
+            if r._Hazards is EMPTY:
+                r._Hazards = AssociationList([self])
+            else:
+                r._Hazards.add(self)
         self._Locations = value
 
     Locations = property(getLocations, setLocations)
 
     def addLocations(self, *Locations):
         for obj in Locations:
-            if self not in obj._Hazards:
-                obj._Hazards.append(self)
-            self._Locations.append(obj)
+            if obj._Hazards is EMPTY:
+                obj._Hazards = AssociationList([self])
+            else:
+                obj._Hazards.add(self)
+            if self._Locations is EMPTY:
+                self._Locations = AssociationList([obj])
+            else:
+                self._Locations.add(obj)
 
     def removeLocations(self, *Locations):
         for obj in Locations:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class LandProperty(IdentifiedObject):
     """Information about a particular piece of (land) property such as its use. Ownership of the property may be determined through associations to Organisations and/or ErpPersons.Information about a particular piece of (land) property such as its use. Ownership of the property may be determined through associations to Organisations and/or ErpPersons.
@@ -50,26 +51,33 @@ class LandProperty(IdentifiedObject):
 
         self.status = status
 
-        self._LocationGrants = []
-        self.LocationGrants = [] if LocationGrants is None else LocationGrants
+        self._LocationGrants = EMPTY
+        if LocationGrants is not None:
+            self.LocationGrants = LocationGrants
 
-        self._ErpSiteLevelDatas = []
-        self.ErpSiteLevelDatas = [] if ErpSiteLevelDatas is None else ErpSiteLevelDatas
+        self._ErpSiteLevelDatas = EMPTY
+        if ErpSiteLevelDatas is not None:
+            self.ErpSiteLevelDatas = ErpSiteLevelDatas
 
-        self._ErpPersonRoles = []
-        self.ErpPersonRoles = [] if ErpPersonRoles is None else ErpPersonRoles
+        self._ErpPersonRoles = EMPTY
+        if ErpPersonRoles is not None:
+            self.ErpPersonRoles = ErpPersonRoles
 
-        self._ErpOrganisationRoles = []
-        self.ErpOrganisationRoles = [] if ErpOrganisationRoles is None else ErpOrganisationRoles
+        self._ErpOrganisationRoles = EMPTY
+        if ErpOrganisationRoles is not None:
+            self.ErpOrganisationRoles = ErpOrganisationRoles
 
-        self._AssetContainers = []
-        self.AssetContainers = [] if AssetContainers is None else AssetContainers
+        self._AssetContainers = EMPTY
+        if AssetContainers is not None:
+            self.AssetContainers = AssetContainers
 
-        self._Locations = []
-        self.Locations = [] if Locations is None else Locations
+        self._Locations = EMPTY
+        if Locations is not None:
+            self.Locations = Locations
 
-        self._RightOfWays = []
-        self.RightOfWays = [] if RightOfWays is None else RightOfWays
+        self._RightOfWays = EMPTY
+        if RightOfWays is not None:
+            self.RightOfWays = RightOfWays
 
         super(LandProperty, self).__init__(*args, **kw_args)
 
@@ -88,6 +96,7 @@ class LandProperty(IdentifiedObject):
         return self._LocationGrants
 
     def setLocationGrants(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._LocationGrants:
             x.LandProperty = None
         for y in value:
@@ -109,6 +118,7 @@ class LandProperty(IdentifiedObject):
         return self._ErpSiteLevelDatas
 
     def setErpSiteLevelDatas(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ErpSiteLevelDatas:
             x.LandProperty = None
         for y in value:
@@ -130,6 +140,7 @@ class LandProperty(IdentifiedObject):
         return self._ErpPersonRoles
 
     def setErpPersonRoles(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ErpPersonRoles:
             x.LandProperty = None
         for y in value:
@@ -151,21 +162,28 @@ class LandProperty(IdentifiedObject):
         return self._ErpOrganisationRoles
 
     def setErpOrganisationRoles(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ErpOrganisationRoles:
-            filtered = [q for q in p.LandProperty if q != self]
-            self._ErpOrganisationRoles._LandProperty = filtered
+            p._LandProperty.discard(self)
         for r in value:
-            if self not in r._LandProperty:
-                r._LandProperty.append(self)
+            if r._LandProperty is EMPTY:
+                r._LandProperty = AssociationList([self])
+            else:
+                r._LandProperty.add(self)
         self._ErpOrganisationRoles = value
 
     ErpOrganisationRoles = property(getErpOrganisationRoles, setErpOrganisationRoles)
 
     def addErpOrganisationRoles(self, *ErpOrganisationRoles):
         for obj in ErpOrganisationRoles:
-            if self not in obj._LandProperty:
-                obj._LandProperty.append(self)
-            self._ErpOrganisationRoles.append(obj)
+            if obj._LandProperty is EMPTY:
+                obj._LandProperty = AssociationList([self])
+            else:
+                obj._LandProperty.add(self)
+            if self._ErpOrganisationRoles is EMPTY:
+                self._ErpOrganisationRoles = AssociationList([obj])
+            else:
+                self._ErpOrganisationRoles.add(obj)
 
     def removeErpOrganisationRoles(self, *ErpOrganisationRoles):
         for obj in ErpOrganisationRoles:
@@ -178,21 +196,28 @@ class LandProperty(IdentifiedObject):
         return self._AssetContainers
 
     def setAssetContainers(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._AssetContainers:
-            filtered = [q for q in p.LandProperties if q != self]
-            self._AssetContainers._LandProperties = filtered
+            p._LandProperties.discard(self)
         for r in value:
-            if self not in r._LandProperties:
-                r._LandProperties.append(self)
+            if r._LandProperties is EMPTY:
+                r._LandProperties = AssociationList([self])
+            else:
+                r._LandProperties.add(self)
         self._AssetContainers = value
 
     AssetContainers = property(getAssetContainers, setAssetContainers)
 
     def addAssetContainers(self, *AssetContainers):
         for obj in AssetContainers:
-            if self not in obj._LandProperties:
-                obj._LandProperties.append(self)
-            self._AssetContainers.append(obj)
+            if obj._LandProperties is EMPTY:
+                obj._LandProperties = AssociationList([self])
+            else:
+                obj._LandProperties.add(self)
+            if self._AssetContainers is EMPTY:
+                self._AssetContainers = AssociationList([obj])
+            else:
+                self._AssetContainers.add(obj)
 
     def removeAssetContainers(self, *AssetContainers):
         for obj in AssetContainers:
@@ -206,21 +231,28 @@ class LandProperty(IdentifiedObject):
         return self._Locations
 
     def setLocations(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Locations:
-            filtered = [q for q in p.LandProperties if q != self]
-            self._Locations._LandProperties = filtered
+            p._LandProperties.discard(self)
         for r in value:
-            if self not in r._LandProperties:
-                r._LandProperties.append(self)
+            if r._LandProperties is EMPTY:
+                r._LandProperties = AssociationList([self])
+            else:
+                r._LandProperties.add(self)
         self._Locations = value
 
     Locations = property(getLocations, setLocations)
 
     def addLocations(self, *Locations):
         for obj in Locations:
-            if self not in obj._LandProperties:
-                obj._LandProperties.append(self)
-            self._Locations.append(obj)
+            if obj._LandProperties is EMPTY:
+                obj._LandProperties = AssociationList([self])
+            else:
+                obj._LandProperties.add(self)
+            if self._Locations is EMPTY:
+                self._Locations = AssociationList([obj])
+            else:
+                self._Locations.add(obj)
 
     def removeLocations(self, *Locations):
         for obj in Locations:
@@ -234,21 +266,28 @@ class LandProperty(IdentifiedObject):
         return self._RightOfWays
 
     def setRightOfWays(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._RightOfWays:
-            filtered = [q for q in p.LandProperties if q != self]
-            self._RightOfWays._LandProperties = filtered
+            p._LandProperties.discard(self)
         for r in value:
-            if self not in r._LandProperties:
-                r._LandProperties.append(self)
+            if r._LandProperties is EMPTY:
+                r._LandProperties = AssociationList([self])
+            else:
+                r._LandProperties.add(self)
         self._RightOfWays = value
 
     RightOfWays = property(getRightOfWays, setRightOfWays)
 
     def addRightOfWays(self, *RightOfWays):
         for obj in RightOfWays:
-            if self not in obj._LandProperties:
-                obj._LandProperties.append(self)
-            self._RightOfWays.append(obj)
+            if obj._LandProperties is EMPTY:
+                obj._LandProperties = AssociationList([self])
+            else:
+                obj._LandProperties.add(self)
+            if self._RightOfWays is EMPTY:
+                self._RightOfWays = AssociationList([obj])
+            else:
+                self._RightOfWays.add(obj)
 
     def removeRightOfWays(self, *RightOfWays):
         for obj in RightOfWays:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Agreement import Agreement
+from CIM15.Element import AssociationList, EMPTY
 
 class LocationGrant(Agreement):
     """A grant provides a right, as defined by type, for a parcel of land. Note that the association to Location, Asset, Organisation, etc. for the Grant is inherited from Agreement, a type of Document.A grant provides a right, as defined by type, for a parcel of land. Note that the association to Location, Asset, Organisation, etc. for the Grant is inherited from Agreement, a type of Document.
@@ -52,13 +53,14 @@ class LocationGrant(Agreement):
 
     def setLandProperty(self, value):
         if self._LandProperty is not None:
-            filtered = [x for x in self.LandProperty.LocationGrants if x != self]
-            self._LandProperty._LocationGrants = filtered
+            self._LandProperty._LocationGrants.discard(self)
 
         self._LandProperty = value
         if self._LandProperty is not None:
-            if self not in self._LandProperty._LocationGrants:
-                self._LandProperty._LocationGrants.append(self)
+            if self._LandProperty._LocationGrants is EMPTY:
+                self._LandProperty._LocationGrants = AssociationList([self])
+            else:
+                self._LandProperty._LocationGrants.add(self)
 
     LandProperty = property(getLandProperty, setLandProperty)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Informative.InfCommon.Role import Role
+from CIM15.Element import AssociationList, EMPTY
 
 class OrgPropertyRole(Role):
     """Roles played between Organisations and a given piece of property. For example, the Organisation may be the owner, renter, occupier, taxiing authority, etc.Roles played between Organisations and a given piece of property. For example, the Organisation may be the owner, renter, occupier, taxiing authority, etc.
@@ -30,8 +31,9 @@ class OrgPropertyRole(Role):
         @param LandProperty:
         @param ErpOrganisation:
         """
-        self._LandProperty = []
-        self.LandProperty = [] if LandProperty is None else LandProperty
+        self._LandProperty = EMPTY
+        if LandProperty is not None:
+            self.LandProperty = LandProperty
 
         self._ErpOrganisation = None
         self.ErpOrganisation = ErpOrganisation
@@ -50,21 +52,28 @@ class OrgPropertyRole(Role):
         return self._LandProperty
 
     def setLandProperty(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._LandProperty:
-            filtered = [q for q in p.ErpOrganisationRoles if q != self]
-            self._LandProperty._ErpOrganisationRoles = filtered
+            p._ErpOrganisationRoles.discard(self)
         for r in value:
-            if self not in r._ErpOrganisationRoles:
-                r._ErpOrganisationRoles.append(self)
+            if r._ErpOrganisationRoles is EMPTY:
+                r._ErpOrganisationRoles = AssociationList([self])
+            else:
+                r._ErpOrganisationRoles.add(self)
         self._LandProperty = value
 
     LandProperty = property(getLandProperty, setLandProperty)
 
     def addLandProperty(self, *LandProperty):
         for obj in LandProperty:
-            if self not in obj._ErpOrganisationRoles:
-                obj._ErpOrganisationRoles.append(self)
-            self._LandProperty.append(obj)
+            if obj._ErpOrganisationRoles is EMPTY:
+                obj._ErpOrganisationRoles = AssociationList([self])
+            else:
+                obj._ErpOrganisationRoles.add(self)
+            if self._LandProperty is EMPTY:
+                self._LandProperty = AssociationList([obj])
+            else:
+                self._LandProperty.add(obj)
 
     def removeLandProperty(self, *LandProperty):
         for obj in LandProperty:
@@ -78,13 +87,14 @@ class OrgPropertyRole(Role):
 
     def setErpOrganisation(self, value):
         if self._ErpOrganisation is not None:
-            filtered = [x for x in self.ErpOrganisation.LandPropertyRoles if x != self]
-            self._ErpOrganisation._LandPropertyRoles = filtered
+            self._ErpOrganisation._LandPropertyRoles.discard(self)
 
         self._ErpOrganisation = value
         if self._ErpOrganisation is not None:
-            if self not in self._ErpOrganisation._LandPropertyRoles:
-                self._ErpOrganisation._LandPropertyRoles.append(self)
+            if self._ErpOrganisation._LandPropertyRoles is EMPTY:
+                self._ErpOrganisation._LandPropertyRoles = AssociationList([self])
+            else:
+                self._ErpOrganisation._LandPropertyRoles.add(self)
 
     ErpOrganisation = property(getErpOrganisation, setErpOrganisation)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Informative.InfCommon.Role import Role
+from CIM15.Element import AssociationList, EMPTY
 
 class PersonPropertyRole(Role):
     """The role of a person relative to a given piece of property. Examples of roles include: owner, renter, contractor, etc.The role of a person relative to a given piece of property. Examples of roles include: owner, renter, contractor, etc.
@@ -51,13 +52,14 @@ class PersonPropertyRole(Role):
 
     def setErpPerson(self, value):
         if self._ErpPerson is not None:
-            filtered = [x for x in self.ErpPerson.LandPropertyRoles if x != self]
-            self._ErpPerson._LandPropertyRoles = filtered
+            self._ErpPerson._LandPropertyRoles.discard(self)
 
         self._ErpPerson = value
         if self._ErpPerson is not None:
-            if self not in self._ErpPerson._LandPropertyRoles:
-                self._ErpPerson._LandPropertyRoles.append(self)
+            if self._ErpPerson._LandPropertyRoles is EMPTY:
+                self._ErpPerson._LandPropertyRoles = AssociationList([self])
+            else:
+                self._ErpPerson._LandPropertyRoles.add(self)
 
     ErpPerson = property(getErpPerson, setErpPerson)
 
@@ -67,13 +69,14 @@ class PersonPropertyRole(Role):
 
     def setLandProperty(self, value):
         if self._LandProperty is not None:
-            filtered = [x for x in self.LandProperty.ErpPersonRoles if x != self]
-            self._LandProperty._ErpPersonRoles = filtered
+            self._LandProperty._ErpPersonRoles.discard(self)
 
         self._LandProperty = value
         if self._LandProperty is not None:
-            if self not in self._LandProperty._ErpPersonRoles:
-                self._LandProperty._ErpPersonRoles.append(self)
+            if self._LandProperty._ErpPersonRoles is EMPTY:
+                self._LandProperty._ErpPersonRoles = AssociationList([self])
+            else:
+                self._LandProperty._ErpPersonRoles.add(self)
 
     LandProperty = property(getLandProperty, setLandProperty)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class RedLine(IdentifiedObject):
     """This class is used for handling the accompanying annotations, time stamp, author, etc. of designs, drawings and maps. A red line can be associated with any Location object.This class is used for handling the accompanying annotations, time stamp, author, etc. of designs, drawings and maps. A red line can be associated with any Location object.
@@ -30,8 +31,9 @@ class RedLine(IdentifiedObject):
         @param Locations:
         @param status:
         """
-        self._Locations = []
-        self.Locations = [] if Locations is None else Locations
+        self._Locations = EMPTY
+        if Locations is not None:
+            self.Locations = Locations
 
         self.status = status
 
@@ -49,21 +51,28 @@ class RedLine(IdentifiedObject):
         return self._Locations
 
     def setLocations(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Locations:
-            filtered = [q for q in p.RedLines if q != self]
-            self._Locations._RedLines = filtered
+            p._RedLines.discard(self)
         for r in value:
-            if self not in r._RedLines:
-                r._RedLines.append(self)
+            if r._RedLines is EMPTY:
+                r._RedLines = AssociationList([self])
+            else:
+                r._RedLines.add(self)
         self._Locations = value
 
     Locations = property(getLocations, setLocations)
 
     def addLocations(self, *Locations):
         for obj in Locations:
-            if self not in obj._RedLines:
-                obj._RedLines.append(self)
-            self._Locations.append(obj)
+            if obj._RedLines is EMPTY:
+                obj._RedLines = AssociationList([self])
+            else:
+                obj._RedLines.add(self)
+            if self._Locations is EMPTY:
+                self._Locations = AssociationList([obj])
+            else:
+                self._Locations.add(obj)
 
     def removeLocations(self, *Locations):
         for obj in Locations:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Agreement import Agreement
+from CIM15.Element import AssociationList, EMPTY
 
 class RightOfWay(Agreement):
     """A right-of-way (ROW) is for land where it is lawful to use for a public road, an electric power line, etc. Note that the association to Location, Asset, Organisation, etc. for the Grant is inherited from Agreement, a type of Document.A right-of-way (ROW) is for land where it is lawful to use for a public road, an electric power line, etc. Note that the association to Location, Asset, Organisation, etc. for the Grant is inherited from Agreement, a type of Document.
@@ -33,8 +34,9 @@ class RightOfWay(Agreement):
         #: Property related information that describes the ROW's land parcel. For example, it may be a deed book number, deed book page number, and parcel number.
         self.propertyData = propertyData
 
-        self._LandProperties = []
-        self.LandProperties = [] if LandProperties is None else LandProperties
+        self._LandProperties = EMPTY
+        if LandProperties is not None:
+            self.LandProperties = LandProperties
 
         super(RightOfWay, self).__init__(*args, **kw_args)
 
@@ -51,21 +53,28 @@ class RightOfWay(Agreement):
         return self._LandProperties
 
     def setLandProperties(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._LandProperties:
-            filtered = [q for q in p.RightOfWays if q != self]
-            self._LandProperties._RightOfWays = filtered
+            p._RightOfWays.discard(self)
         for r in value:
-            if self not in r._RightOfWays:
-                r._RightOfWays.append(self)
+            if r._RightOfWays is EMPTY:
+                r._RightOfWays = AssociationList([self])
+            else:
+                r._RightOfWays.add(self)
         self._LandProperties = value
 
     LandProperties = property(getLandProperties, setLandProperties)
 
     def addLandProperties(self, *LandProperties):
         for obj in LandProperties:
-            if self not in obj._RightOfWays:
-                obj._RightOfWays.append(self)
-            self._LandProperties.append(obj)
+            if obj._RightOfWays is EMPTY:
+                obj._RightOfWays = AssociationList([self])
+            else:
+                obj._RightOfWays.add(self)
+            if self._LandProperties is EMPTY:
+                self._LandProperties = AssociationList([obj])
+            else:
+                self._LandProperties.add(obj)
 
     def removeLandProperties(self, *LandProperties):
         for obj in LandProperties:
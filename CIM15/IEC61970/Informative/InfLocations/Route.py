@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class Route(IdentifiedObject):
     """Route that is followed, for example by service crews.Route that is followed, for example by service crews.
@@ -35,13 +36,15 @@ class Route(IdentifiedObject):
         #: Category by utility's work management standards and practices.
         self.category = category
 
-        self._Crews = []
-        self.Crews = [] if Crews is None else Crews
+        self._Crews = EMPTY
+        if Crews is not None:
+            self.Crews = Crews
 
         self.status = status
 
-        self._Locations = []
-        self.Locations = [] if Locations is None else Locations
+        self._Locations = EMPTY
+        if Locations is not None:
+            self.Locations = Locations
 
         super(Route, self).__init__(*args, **kw_args)
 
@@ -57,6 +60,7 @@ class Route(IdentifiedObject):
         return self._Crews
 
     def setCrews(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Crews:
             x.Route = None
         for y in value:
@@ -80,21 +84,28 @@ class Route(IdentifiedObject):
         return self._Locations
 
     def setLocations(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Locations:
-            filtered = [q for q in p.Routes if q != self]
-            self._Locations._Routes = filtered
+            p._Routes.discard(self)
         for r in value:
-            if self not in r._Routes:
-                r._Routes.append(self)
+            if r._Routes is EMPTY:
+                r._Routes = AssociationList([self])
+            else:
+                r._Routes.add(self)
         self._Locations = value
 
     Locations = property(getLocations, setLocations)
 
     def addLocations(self, *Locations):
         for obj in Locations:
-            if self not in obj._Routes:
-                obj._Routes.append(self)
-            self._Locations.append(obj)
+            if obj._Routes is EMPTY:
+                obj._Routes = AssociationList([self])
+            else:
+                obj._Routes.add(self)
+            if self._Locations is EMPTY:
+                self._Locations = AssociationList([obj])
+            else:
+                self._Locations.add(obj)
 
     def removeLocations(self, *Locations):
         for obj in Locations:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class CallBack(IdentifiedObject):
     """Information about a planned CallBack or a CallBack that has occurred, from the utility to a customer regarding the status and plans about resolving trouble, performing work, etc.Information about a planned CallBack or a CallBack that has occurred, from the utility to a customer regarding the status and plans about resolving trouble, performing work, etc.
@@ -52,14 +53,17 @@ class CallBack(IdentifiedObject):
         #: Descriptiion of the problem reported during this call back.
         self.problemInfo = problemInfo
 
-        self._Appointments = []
-        self.Appointments = [] if Appointments is None else Appointments
+        self._Appointments = EMPTY
+        if Appointments is not None:
+            self.Appointments = Appointments
 
-        self._ErpPersons = []
-        self.ErpPersons = [] if ErpPersons is None else ErpPersons
+        self._ErpPersons = EMPTY
+        if ErpPersons is not None:
+            self.ErpPersons = ErpPersons
 
-        self._TroubleTickets = []
-        self.TroubleTickets = [] if TroubleTickets is None else TroubleTickets
+        self._TroubleTickets = EMPTY
+        if TroubleTickets is not None:
+            self.TroubleTickets = TroubleTickets
 
         self.status = status
 
@@ -77,6 +81,7 @@ class CallBack(IdentifiedObject):
         return self._Appointments
 
     def setAppointments(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Appointments:
             x.CallBack = None
         for y in value:
@@ -98,21 +103,28 @@ class CallBack(IdentifiedObject):
         return self._ErpPersons
 
     def setErpPersons(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ErpPersons:
-            filtered = [q for q in p.CallBacks if q != self]
-            self._ErpPersons._CallBacks = filtered
+            p._CallBacks.discard(self)
         for r in value:
-            if self not in r._CallBacks:
-                r._CallBacks.append(self)
+            if r._CallBacks is EMPTY:
+                r._CallBacks = AssociationList([self])
+            else:
+                r._CallBacks.add(self)
         self._ErpPersons = value
 
     ErpPersons = property(getErpPersons, setErpPersons)
 
     def addErpPersons(self, *ErpPersons):
         for obj in ErpPersons:
-            if self not in obj._CallBacks:
-                obj._CallBacks.append(self)
-            self._ErpPersons.append(obj)
+            if obj._CallBacks is EMPTY:
+                obj._CallBacks = AssociationList([self])
+            else:
+                obj._CallBacks.add(self)
+            if self._ErpPersons is EMPTY:
+                self._ErpPersons = AssociationList([obj])
+            else:
+                self._ErpPersons.add(obj)
 
     def removeErpPersons(self, *ErpPersons):
         for obj in ErpPersons:
@@ -125,21 +137,28 @@ class CallBack(IdentifiedObject):
         return self._TroubleTickets
 
     def setTroubleTickets(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._TroubleTickets:
-            filtered = [q for q in p.CallBacks if q != self]
-            self._TroubleTickets._CallBacks = filtered
+            p._CallBacks.discard(self)
         for r in value:
-            if self not in r._CallBacks:
-                r._CallBacks.append(self)
+            if r._CallBacks is EMPTY:
+                r._CallBacks = AssociationList([self])
+            else:
+                r._CallBacks.add(self)
         self._TroubleTickets = value
 
     TroubleTickets = property(getTroubleTickets, setTroubleTickets)
 
     def addTroubleTickets(self, *TroubleTickets):
         for obj in TroubleTickets:
-            if self not in obj._CallBacks:
-                obj._CallBacks.append(self)
-            self._TroubleTickets.append(obj)
+            if obj._CallBacks is EMPTY:
+                obj._CallBacks = AssociationList([self])
+            else:
+                obj._CallBacks.add(self)
+            if self._TroubleTickets is EMPTY:
+                self._TroubleTickets = AssociationList([obj])
+            else:
+                self._TroubleTickets.add(obj)
 
     def removeTroubleTickets(self, *TroubleTickets):
         for obj in TroubleTickets:
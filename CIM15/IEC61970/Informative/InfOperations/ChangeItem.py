@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class ChangeItem(IdentifiedObject):
     """Description for a single change within an ordered list of changes.Description for a single change within an ordered list of changes.
@@ -94,13 +95,14 @@ class ChangeItem(IdentifiedObject):
 
     def setGmlSelector(self, value):
         if self._GmlSelector is not None:
-            filtered = [x for x in self.GmlSelector.ChangeItems if x != self]
-            self._GmlSelector._ChangeItems = filtered
+            self._GmlSelector._ChangeItems.discard(self)
 
         self._GmlSelector = value
         if self._GmlSelector is not None:
-            if self not in self._GmlSelector._ChangeItems:
-                self._GmlSelector._ChangeItems.append(self)
+            if self._GmlSelector._ChangeItems is EMPTY:
+                self._GmlSelector._ChangeItems = AssociationList([self])
+            else:
+                self._GmlSelector._ChangeItems.add(self)
 
     GmlSelector = property(getGmlSelector, setGmlSelector)
 
@@ -110,13 +112,14 @@ class ChangeItem(IdentifiedObject):
 
     def setOrganisation(self, value):
         if self._Organisation is not None:
-            filtered = [x for x in self.Organisation.ChangeItems if x != self]
-            self._Organisation._ChangeItems = filtered
+            self._Organisation._ChangeItems.discard(self)
 
         self._Organisation = value
         if self._Organisation is not None:
-            if self not in self._Organisation._ChangeItems:
-                self._Organisation._ChangeItems.append(self)
+            if self._Organisation._ChangeItems is EMPTY:
+                self._Organisation._ChangeItems = AssociationList([self])
+            else:
+                self._Organisation._ChangeItems.add(self)
 
     Organisation = property(getOrganisation, setOrganisation)
 
@@ -126,13 +129,14 @@ class ChangeItem(IdentifiedObject):
 
     def setDocument(self, value):
         if self._Document is not None:
-            filtered = [x for x in self.Document.ChangeItems if x != self]
-            self._Document._ChangeItems = filtered
+            self._Document._ChangeItems.discard(self)
 
         self._Document = value
         if self._Document is not None:
-            if self not in self._Document._ChangeItems:
-                self._Document._ChangeItems.append(self)
+            if self._Document._ChangeItems is EMPTY:
+                self._Document._ChangeItems = AssociationList([self])
+            else:
+                self._Document._ChangeItems.add(self)
 
     Document = property(getDocument, setDocument)
 
@@ -142,13 +146,14 @@ class ChangeItem(IdentifiedObject):
 
     def setAsset(self, value):
         if self._Asset is not None:
-            filtered = [x for x in self.Asset.ChangeItems if x != self]
-            self._Asset._ChangeItems = filtered
+            self._Asset._ChangeItems.discard(self)
 
         self._Asset = value
         if self._Asset is not None:
-            if self not in self._Asset._ChangeItems:
-                self._Asset._ChangeItems.append(self)
+            if self._Asset._ChangeItems is EMPTY:
+                self._Asset._ChangeItems = AssociationList([self])
+            else:
+                self._Asset._ChangeItems.add(self)
 
     Asset = property(getAsset, setAsset)
 
@@ -160,13 +165,14 @@ class ChangeItem(IdentifiedObject):
 
     def setGmlObservation(self, value):
         if self._GmlObservation is not None:
-            filtered = [x for x in self.GmlObservation.ChangeItems if x != self]
-            self._GmlObservation._ChangeItems = filtered
+            self._GmlObservation._ChangeItems.discard(self)
 
         self._GmlObservation = value
         if self._GmlObservation is not None:
-            if self not in self._GmlObservation._ChangeItems:
-                self._GmlObservation._ChangeItems.append(self)
+            if self._GmlObservation._ChangeItems is EMPTY:
+                self._GmlObservation._ChangeItems = AssociationList([self])
+            else:
+                self._GmlObservation._ChangeItems.add(self)
 
     GmlObservation = property(getGmlObservation, setGmlObservation)
 
@@ -176,13 +182,14 @@ class ChangeItem(IdentifiedObject):
 
     def setErpPerson(self, value):
         if self._ErpPerson is not None:
-            filtered = [x for x in self.ErpPerson.ChangeItems if x != self]
-            self._ErpPerson._ChangeItems = filtered
+            self._ErpPerson._ChangeItems.discard(self)
 
         self._ErpPerson = value
         if self._ErpPerson is not None:
-            if self not in self._ErpPerson._ChangeItems:
-                self._ErpPerson._ChangeItems.append(self)
+            if self._ErpPerson._ChangeItems is EMPTY:
+                self._ErpPerson._ChangeItems = AssociationList([self])
+            else:
+                self._ErpPerson._ChangeItems.add(self)
 
     ErpPerson = property(getErpPerson, setErpPerson)
 
@@ -192,13 +199,14 @@ class ChangeItem(IdentifiedObject):
 
     def setPowerSystemResource(self, value):
         if self._PowerSystemResource is not None:
-            filtered = [x for x in self.PowerSystemResource.ChangeItems if x != self]
-            self._PowerSystemResource._ChangeItems = filtered
+            self._PowerSystemResource._ChangeItems.discard(self)
 
         self._PowerSystemResource = value
         if self._PowerSystemResource is not None:
-            if self not in self._PowerSystemResource._ChangeItems:
-                self._PowerSystemResource._ChangeItems.append(self)
+            if self._PowerSystemResource._ChangeItems is EMPTY:
+                self._PowerSystemResource._ChangeItems = AssociationList([self])
+            else:
+                self._PowerSystemResource._ChangeItems.add(self)
 
     PowerSystemResource = property(getPowerSystemResource, setPowerSystemResource)
 
@@ -208,13 +216,14 @@ class ChangeItem(IdentifiedObject):
 
     def setChangeSet(self, value):
         if self._ChangeSet is not None:
-            filtered = [x for x in self.ChangeSet.ChangeItems if x != self]
-            self._ChangeSet._ChangeItems = filtered
+            self._ChangeSet._ChangeItems.discard(self)
 
         self._ChangeSet = value
         if self._ChangeSet is not None:
-            if self not in self._ChangeSet._ChangeItems:
-                self._ChangeSet._ChangeItems.append(self)
+            if self._ChangeSet._ChangeItems is EMPTY:
+                self._ChangeSet._ChangeItems = AssociationList([self])
+            else:
+                self._ChangeSet._ChangeItems.add(self)
 
     ChangeSet = property(getChangeSet, setChangeSet)
 
@@ -224,13 +233,14 @@ class ChangeItem(IdentifiedObject):
 
     def setLocation(self, value):
         if self._Location is not None:
-            filtered = [x for x in self.Location.ChangeItems if x != self]
-            self._Location._ChangeItems = filtered
+            self._Location._ChangeItems.discard(self)
 
         self._Location = value
         if self._Location is not None:
-            if self not in self._Location._ChangeItems:
-                self._Location._ChangeItems.append(self)
+            if self._Location._ChangeItems is EMPTY:
+                self._Location._ChangeItems = AssociationList([self])
+            else:
+                self._Location._ChangeItems.add(self)
 
     Location = property(getLocation, setLocation)
 
@@ -240,13 +250,14 @@ class ChangeItem(IdentifiedObject):
 
     def setNetworkDataSet(self, value):
         if self._NetworkDataSet is not None:
-            filtered = [x for x in self.NetworkDataSet.ChangeItems if x != self]
-            self._NetworkDataSet._ChangeItems = filtered
+            self._NetworkDataSet._ChangeItems.discard(self)
 
         self._NetworkDataSet = value
         if self._NetworkDataSet is not None:
-            if self not in self._NetworkDataSet._ChangeItems:
-                self._NetworkDataSet._ChangeItems.append(self)
+            if self._NetworkDataSet._ChangeItems is EMPTY:
+                self._NetworkDataSet._ChangeItems = AssociationList([self])
+            else:
+                self._NetworkDataSet._ChangeItems.add(self)
 
     NetworkDataSet = property(getNetworkDataSet, setNetworkDataSet)
 
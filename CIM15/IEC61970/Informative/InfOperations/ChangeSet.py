@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class ChangeSet(IdentifiedObject):
     """The updates required in a transaction for an existing data set are grouped into a single ChangeSet. In data sets (e.g., NetworkDataSet), each major step in the ChangeSet is described through a separate ChangeItem associated with the data set. Within each data set, each inidividual object change is described with a seperate ChangeItem associated with the object.The updates required in a transaction for an existing data set are grouped into a single ChangeSet. In data sets (e.g., NetworkDataSet), each major step in the ChangeSet is described through a separate ChangeItem associated with the data set. Within each data set, each inidividual object change is described with a seperate ChangeItem associated with the object.
@@ -32,16 +33,19 @@ class ChangeSet(IdentifiedObject):
         @param status:
         @param Documents:
         """
-        self._NetworkDataSets = []
-        self.NetworkDataSets = [] if NetworkDataSets is None else NetworkDataSets
+        self._NetworkDataSets = EMPTY
+        if NetworkDataSets is not None:
+            self.NetworkDataSets = NetworkDataSets
 
-        self._ChangeItems = []
-        self.ChangeItems = [] if ChangeItems is None else ChangeItems
+        self._ChangeItems = EMPTY
+        if ChangeItems is not None:
+            self.ChangeItems = ChangeItems
 
         self.status = status
 
-        self._Documents = []
-        self.Documents = [] if Documents is None else Documents
+        self._Documents = EMPTY
+        if Documents is not None:
+            self.Documents = Documents
 
         super(ChangeSet, self).__init__(*args, **kw_args)
 
@@ -57,21 +61,28 @@ class ChangeSet(IdentifiedObject):
         return self._NetworkDataSets
 
     def setNetworkDataSets(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._NetworkDataSets:
-            filtered = [q for q in p.ChangeSets if q != self]
-            self._NetworkDataSets._ChangeSets = filtered
+            p._ChangeSets.discard(self)
         for r in value:
-            if self not in r._ChangeSets:
-                r._ChangeSets.append(self)
+            if r._ChangeSets is EMPTY:
+                r._ChangeSets = AssociationList([self])
+            else:
+                r._ChangeSets.add(self)
         self._NetworkDataSets = value
 
     NetworkDataSets = property(getNetworkDataSets, setNetworkDataSets)
 
     def addNetworkDataSets(self, *NetworkDataSets):
         for obj in NetworkDataSets:
-            if self not in obj._ChangeSets:
-                obj._ChangeSets.append(self)
-            self._NetworkDataSets.append(obj)
+            if obj._ChangeSets is EMPTY:
+                obj._ChangeSets = AssociationList([self])
+            else:
+                obj._ChangeSets.add(self)
+            if self._NetworkDataSets is EMPTY:
+                self._NetworkDataSets = AssociationList([obj])
+            else:
+                self._NetworkDataSets.add(obj)
 
     def removeNetworkDataSets(self, *NetworkDataSets):
         for obj in NetworkDataSets:
@@ -84,6 +95,7 @@ class ChangeSet(IdentifiedObject):
         return self._ChangeItems
 
     def setChangeItems(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ChangeItems:
             x.ChangeSet = None
         for y in value:
@@ -107,21 +119,28 @@ class ChangeSet(IdentifiedObject):
         return self._Documents
 
     def setDocuments(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Documents:
-            filtered = [q for q in p.ChangeSets if q != self]
-            self._Documents._ChangeSets = filtered
+            p._ChangeSets.discard(self)
         for r in value:
-            if self not in r._ChangeSets:
-                r._ChangeSets.append(self)
+            if r._ChangeSets is EMPTY:
+                r._ChangeSets = AssociationList([self])
+            else:
+                r._ChangeSets.add(self)
         self._Documents = value
 
     Documents = property(getDocuments, setDocuments)
 
     def addDocuments(self, *Documents):
         for obj in Documents:
-            if self not in obj._ChangeSets:
-                obj._ChangeSets.append(self)
-            self._Documents.append(obj)
+            if obj._ChangeSets is EMPTY:
+                obj._ChangeSets = AssociationList([self])
+            else:
+                obj._ChangeSets.add(self)
+            if self._Documents is EMPTY:
+                self._Documents = AssociationList([obj])
+            else:
+                self._Documents.add(obj)
 
     def removeDocuments(self, *Documents):
         for obj in Documents:
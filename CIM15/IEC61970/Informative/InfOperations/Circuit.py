@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.EquipmentContainer import EquipmentContainer
+from CIM15.Element import AssociationList, EMPTY
 
 class Circuit(EquipmentContainer):
     """EquipmentContainer that will typically include conductors, energy consumers, transformers and transformer windings, switches, shunt compensators, etc., likely at different voltages. Circuit extends from a substation to a set of open points (radial circuit), or to a second substation (looped circuit). It generally starts with a switching device, located in a substation. Membership in a Circuit is based on the nominal or design system configuration, but the electrical connectivity will change during switching operations.EquipmentContainer that will typically include conductors, energy consumers, transformers and transformer windings, switches, shunt compensators, etc., likely at different voltages. Circuit extends from a substation to a set of open points (radial circuit), or to a second substation (looped circuit). It generally starts with a switching device, located in a substation. Membership in a Circuit is based on the nominal or design system configuration, but the electrical connectivity will change during switching operations.
@@ -29,8 +30,9 @@ class Circuit(EquipmentContainer):
 
         @param CircuitSections:
         """
-        self._CircuitSections = []
-        self.CircuitSections = [] if CircuitSections is None else CircuitSections
+        self._CircuitSections = EMPTY
+        if CircuitSections is not None:
+            self.CircuitSections = CircuitSections
 
         super(Circuit, self).__init__(*args, **kw_args)
 
@@ -46,21 +48,28 @@ class Circuit(EquipmentContainer):
         return self._CircuitSections
 
     def setCircuitSections(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._CircuitSections:
-            filtered = [q for q in p.Circuits if q != self]
-            self._CircuitSections._Circuits = filtered
+            p._Circuits.discard(self)
         for r in value:
-            if self not in r._Circuits:
-                r._Circuits.append(self)
+            if r._Circuits is EMPTY:
+                r._Circuits = AssociationList([self])
+            else:
+                r._Circuits.add(self)
         self._CircuitSections = value
 
     CircuitSections = property(getCircuitSections, setCircuitSections)
 
     def addCircuitSections(self, *CircuitSections):
         for obj in CircuitSections:
-            if self not in obj._Circuits:
-                obj._Circuits.append(self)
-            self._CircuitSections.append(obj)
+            if obj._Circuits is EMPTY:
+                obj._Circuits = AssociationList([self])
+            else:
+                obj._Circuits.add(self)
+            if self._CircuitSections is EMPTY:
+                self._CircuitSections = AssociationList([obj])
+            else:
+                self._CircuitSections.add(obj)
 
     def removeCircuitSections(self, *CircuitSections):
         for obj in CircuitSections:
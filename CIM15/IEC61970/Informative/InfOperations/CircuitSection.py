@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class CircuitSection(IdentifiedObject):
     """Section of circuit located between two sectionalizing devices. It may contain other circuit sections, for example, a lateral tapped off a primary.Section of circuit located between two sectionalizing devices. It may contain other circuit sections, for example, a lateral tapped off a primary.
@@ -34,11 +35,13 @@ class CircuitSection(IdentifiedObject):
         #: Kind of this circuit section. Values are: "electricallyConnected", "nominallyConnected", "asBuilt", "other"
         self.connectionKind = connectionKind
 
-        self._ConductorAssets = []
-        self.ConductorAssets = [] if ConductorAssets is None else ConductorAssets
+        self._ConductorAssets = EMPTY
+        if ConductorAssets is not None:
+            self.ConductorAssets = ConductorAssets
 
-        self._Circuits = []
-        self.Circuits = [] if Circuits is None else Circuits
+        self._Circuits = EMPTY
+        if Circuits is not None:
+            self.Circuits = Circuits
 
         super(CircuitSection, self).__init__(*args, **kw_args)
 
@@ -54,6 +57,7 @@ class CircuitSection(IdentifiedObject):
         return self._ConductorAssets
 
     def setConductorAssets(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ConductorAssets:
             x.CircuitSection = None
         for y in value:
@@ -75,21 +79,28 @@ class CircuitSection(IdentifiedObject):
         return self._Circuits
 
     def setCircuits(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Circuits:
-            filtered = [q for q in p.CircuitSections if q != self]
-            self._Circuits._CircuitSections = filtered
+            p._CircuitSections.discard(self)
         for r in value:
-            if self not in r._CircuitSections:
-                r._CircuitSections.append(self)
+            if r._CircuitSections is EMPTY:
+                r._CircuitSections = AssociationList([self])
+            else:
+                r._CircuitSections.add(self)
         self._Circuits = value
 
     Circuits = property(getCircuits, setCircuits)
 
     def addCircuits(self, *Circuits):
         for obj in Circuits:
-            if self not in obj._CircuitSections:
-                obj._CircuitSections.append(self)
-            self._Circuits.append(obj)
+            if obj._CircuitSections is EMPTY:
+                obj._CircuitSections = AssociationList([self])
+            else:
+                obj._CircuitSections.add(self)
+            if self._Circuits is EMPTY:
+                self._Circuits = AssociationList([obj])
+            else:
+                self._Circuits.add(obj)
 
     def removeCircuits(self, *Circuits):
         for obj in Circuits:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Informative.InfCommon.Role import Role
+from CIM15.Element import AssociationList, EMPTY
 
 class ErpPersonScheduleStepRole(Role):
     """Roles played between Persons and Schedule Steps.Roles played between Persons and Schedule Steps.
@@ -51,13 +52,14 @@ class ErpPersonScheduleStepRole(Role):
 
     def setErpPerson(self, value):
         if self._ErpPerson is not None:
-            filtered = [x for x in self.ErpPerson.SwitchingStepRoles if x != self]
-            self._ErpPerson._SwitchingStepRoles = filtered
+            self._ErpPerson._SwitchingStepRoles.discard(self)
 
         self._ErpPerson = value
         if self._ErpPerson is not None:
-            if self not in self._ErpPerson._SwitchingStepRoles:
-                self._ErpPerson._SwitchingStepRoles.append(self)
+            if self._ErpPerson._SwitchingStepRoles is EMPTY:
+                self._ErpPerson._SwitchingStepRoles = AssociationList([self])
+            else:
+                self._ErpPerson._SwitchingStepRoles.add(self)
 
     ErpPerson = property(getErpPerson, setErpPerson)
 
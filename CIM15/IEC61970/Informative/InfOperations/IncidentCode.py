@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class IncidentCode(IdentifiedObject):
     """Classification of incident types. Multiple incident codes may apply to a given incident. The primary overall incident cause is recorded in 'IncidentRecord.category', and the main code in association end 'Names'.Classification of incident types. Multiple incident codes may apply to a given incident. The primary overall incident cause is recorded in 'IncidentRecord.category', and the main code in association end 'Names'.
@@ -33,8 +34,9 @@ class IncidentCode(IdentifiedObject):
         #: Additional level of classification detail (as extension to the main code found in association to Name).
         self.subCode = subCode
 
-        self._IncidentRecords = []
-        self.IncidentRecords = [] if IncidentRecords is None else IncidentRecords
+        self._IncidentRecords = EMPTY
+        if IncidentRecords is not None:
+            self.IncidentRecords = IncidentRecords
 
         super(IncidentCode, self).__init__(*args, **kw_args)
 
@@ -50,21 +52,28 @@ class IncidentCode(IdentifiedObject):
         return self._IncidentRecords
 
     def setIncidentRecords(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._IncidentRecords:
-            filtered = [q for q in p.IncidentCodes if q != self]
-            self._IncidentRecords._IncidentCodes = filtered
+            p._IncidentCodes.discard(self)
         for r in value:
-            if self not in r._IncidentCodes:
-                r._IncidentCodes.append(self)
+            if r._IncidentCodes is EMPTY:
+                r._IncidentCodes = AssociationList([self])
+            else:
+                r._IncidentCodes.add(self)
         self._IncidentRecords = value
 
     IncidentRecords = property(getIncidentRecords, setIncidentRecords)
 
     def addIncidentRecords(self, *IncidentRecords):
         for obj in IncidentRecords:
-            if self not in obj._IncidentCodes:
-                obj._IncidentCodes.append(self)
-            self._IncidentRecords.append(obj)
+            if obj._IncidentCodes is EMPTY:
+                obj._IncidentCodes = AssociationList([self])
+            else:
+                obj._IncidentCodes.add(self)
+            if self._IncidentRecords is EMPTY:
+                self._IncidentRecords = AssociationList([obj])
+            else:
+                self._IncidentRecords.add(obj)
 
     def removeIncidentRecords(self, *IncidentRecords):
         for obj in IncidentRecords:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import AssociationList, EMPTY
 
 class IncidentRecord(Document):
     """Document describing the incident reported in a TroubleTicket. If the incident has to do with an outage, this will be associated with an OutageRecord. Primary cause of the incident is captured in 'category'.Document describing the incident reported in a TroubleTicket. If the incident has to do with an outage, this will be associated with an OutageRecord. Primary cause of the incident is captured in 'category'.
@@ -31,13 +32,15 @@ class IncidentRecord(Document):
         @param period: Period between the first customer impacted by the incident and the incident resolution for all customers impacted.
         @param IncidentCodes:
         """
-        self._TroubleTickets = []
-        self.TroubleTickets = [] if TroubleTickets is None else TroubleTickets
+        self._TroubleTickets = EMPTY
+        if TroubleTickets is not None:
+            self.TroubleTickets = TroubleTickets
 
         self.period = period
 
-        self._IncidentCodes = []
-        self.IncidentCodes = [] if IncidentCodes is None else IncidentCodes
+        self._IncidentCodes = EMPTY
+        if IncidentCodes is not None:
+            self.IncidentCodes = IncidentCodes
 
         super(IncidentRecord, self).__init__(*args, **kw_args)
 
@@ -53,6 +56,7 @@ class IncidentRecord(Document):
         return self._TroubleTickets
 
     def setTroubleTickets(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._TroubleTickets:
             x.IncidentRecord = None
         for y in value:
@@ -77,21 +81,28 @@ class IncidentRecord(Document):
         return self._IncidentCodes
 
     def setIncidentCodes(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._IncidentCodes:
-            filtered = [q for q in p.IncidentRecords if q != self]
-            self._IncidentCodes._IncidentRecords = filtered
+            p._IncidentRecords.discard(self)
         for r in value:
-            if self not in r._IncidentRecords:
-                r._IncidentRecords.append(self)
+            if r._IncidentRecords is EMPTY:
+                r._IncidentRecords = AssociationList([self])
+            else:
+                r._IncidentRecords.add(self)
         self._IncidentCodes = value
 
     IncidentCodes = property(getIncidentCodes, setIncidentCodes)
 
     def addIncidentCodes(self, *IncidentCodes):
         for obj in IncidentCodes:
-            if self not in obj._IncidentRecords:
-                obj._IncidentRecords.append(self)
-            self._IncidentCodes.append(obj)
+            if obj._IncidentRecords is EMPTY:
+                obj._IncidentRecords = AssociationList([self])
+            else:
+                obj._IncidentRecords.add(self)
+            if self._IncidentCodes is EMPTY:
+                self._IncidentCodes = AssociationList([obj])
+            else:
+                self._IncidentCodes.add(obj)
 
     def removeIncidentCodes(self, *IncidentCodes):
         for obj in IncidentCodes:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class NetworkDataSet(IdentifiedObject):
     """Categorized as a type of document, model of a portion of the electrical network that includes a list of the equipment, along with relevant connectivity, electrical characteristics, geographical location, and various parameters associated with the equipment.Categorized as a type of document, model of a portion of the electrical network that includes a list of the equipment, along with relevant connectivity, electrical characteristics, geographical location, and various parameters associated with the equipment.
@@ -39,17 +40,21 @@ class NetworkDataSet(IdentifiedObject):
 
         self.status = status
 
-        self._Documents = []
-        self.Documents = [] if Documents is None else Documents
+        self._Documents = EMPTY
+        if Documents is not None:
+            self.Documents = Documents
 
-        self._ChangeItems = []
-        self.ChangeItems = [] if ChangeItems is None else ChangeItems
+        self._ChangeItems = EMPTY
+        if ChangeItems is not None:
+            self.ChangeItems = ChangeItems
 
-        self._ChangeSets = []
-        self.ChangeSets = [] if ChangeSets is None else ChangeSets
+        self._ChangeSets = EMPTY
+        if ChangeSets is not None:
+            self.ChangeSets = ChangeSets
 
-        self._PowerSystemResources = []
-        self.PowerSystemResources = [] if PowerSystemResources is None else PowerSystemResources
+        self._PowerSystemResources = EMPTY
+        if PowerSystemResources is not None:
+            self.PowerSystemResources = PowerSystemResources
 
         super(NetworkDataSet, self).__init__(*args, **kw_args)
 
@@ -67,21 +72,28 @@ class NetworkDataSet(IdentifiedObject):
         return self._Documents
 
     def setDocuments(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Documents:
-            filtered = [q for q in p.NetworkDataSets if q != self]
-            self._Documents._NetworkDataSets = filtered
+            p._NetworkDataSets.discard(self)
         for r in value:
-            if self not in r._NetworkDataSets:
-                r._NetworkDataSets.append(self)
+            if r._NetworkDataSets is EMPTY:
+                r._NetworkDataSets = AssociationList([self])
+            else:
+                r._NetworkDataSets.add(self)
         self._Documents = value
 
     Documents = property(getDocuments, setDocuments)
 
     def addDocuments(self, *Documents):
         for obj in Documents:
-            if self not in obj._NetworkDataSets:
-                obj._NetworkDataSets.append(self)
-            self._Documents.append(obj)
+            if obj._NetworkDataSets is EMPTY:
+                obj._NetworkDataSets = AssociationList([self])
+            else:
+                obj._NetworkDataSets.add(self)
+            if self._Documents is EMPTY:
+                self._Documents = AssociationList([obj])
+            else:
+                self._Documents.add(obj)
 
     def removeDocuments(self, *Documents):
         for obj in Documents:
@@ -94,6 +106,7 @@ class NetworkDataSet(IdentifiedObject):
         return self._ChangeItems
 
     def setChangeItems(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ChangeItems:
             x.NetworkDataSet = None
         for y in value:
@@ -115,21 +128,28 @@ class NetworkDataSet(IdentifiedObject):
         return self._ChangeSets
 
     def setChangeSets(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ChangeSets:
-            filtered = [q for q in p.NetworkDataSets if q != self]
-            self._ChangeSets._NetworkDataSets = filtered
+            p._NetworkDataSets.discard(self)
         for r in value:
-            if self not in r._NetworkDataSets:
-                r._NetworkDataSets.append(self)
+            if r._NetworkDataSets is EMPTY:
+                r._NetworkDataSets = AssociationList([self])
+            else:
+                r._NetworkDataSets.add(self)
         self._ChangeSets = value
 
     ChangeSets = property(getChangeSets, setChangeSets)
 
     def addChangeSets(self, *ChangeSets):
         for obj in ChangeSets:
-            if self not in obj._NetworkDataSets:
-                obj._NetworkDataSets.append(self)
-            self._ChangeSets.append(obj)
+            if obj._NetworkDataSets is EMPTY:
+                obj._NetworkDataSets = AssociationList([self])
+            else:
+                obj._NetworkDataSets.add(self)
+            if self._ChangeSets is EMPTY:
+                self._ChangeSets = AssociationList([obj])
+            else:
+                self._ChangeSets.add(obj)
 
     def removeChangeSets(self, *ChangeSets):
         for obj in ChangeSets:
@@ -142,21 +162,28 @@ class NetworkDataSet(IdentifiedObject):
         return self._PowerSystemResources
 
     def setPowerSystemResources(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._PowerSystemResources:
-            filtered = [q for q in p.NetworkDataSets if q != self]
-            self._PowerSystemResources._NetworkDataSets = filtered
+            p._NetworkDataSets.discard(self)
         for r in value:
-            if self not in r._NetworkDataSets:
-                r._NetworkDataSets.append(self)
+            if r._NetworkDataSets is EMPTY:
+                r._NetworkDataSets = AssociationList([self])
+            else:
+                r._NetworkDataSets.add(self)
         self._PowerSystemResources = value
 
     PowerSystemResources = property(getPowerSystemResources, setPowerSystemResources)
 
     def addPowerSystemResources(self, *PowerSystemResources):
         for obj in PowerSystemResources:
-            if self not in obj._NetworkDataSets:
-                obj._NetworkDataSets.append(self)
-            self._PowerSystemResources.append(obj)
+            if obj._NetworkDataSets is EMPTY:
+                obj._NetworkDataSets = AssociationList([self])
+            else:
+                obj._NetworkDataSets.add(self)
+            if self._PowerSystemResources is EMPTY:
+                self._PowerSystemResources = AssociationList([obj])
+            else:
+                self._PowerSystemResources.add(obj)
 
     def removePowerSystemResources(self, *PowerSystemResources):
         for obj in PowerSystemResources:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Informative.InfCommon.Role import Role
+from CIM15.Element import AssociationList, EMPTY
 
 class OrgPsrRole(Role):
     """Roles played between Organisations and Power System Resources.Roles played between Organisations and Power System Resources.
@@ -51,13 +52,14 @@ class OrgPsrRole(Role):
 
     def setErpOrganisation(self, value):
         if self._ErpOrganisation is not None:
-            filtered = [x for x in self.ErpOrganisation.PowerSystemResourceRoles if x != self]
-            self._ErpOrganisation._PowerSystemResourceRoles = filtered
+            self._ErpOrganisation._PowerSystemResourceRoles.discard(self)
 
         self._ErpOrganisation = value
         if self._ErpOrganisation is not None:
-            if self not in self._ErpOrganisation._PowerSystemResourceRoles:
-                self._ErpOrganisation._PowerSystemResourceRoles.append(self)
+            if self._ErpOrganisation._PowerSystemResourceRoles is EMPTY:
+                self._ErpOrganisation._PowerSystemResourceRoles = AssociationList([self])
+            else:
+                self._ErpOrganisation._PowerSystemResourceRoles.add(self)
 
     ErpOrganisation = property(getErpOrganisation, setErpOrganisation)
 
@@ -67,13 +69,14 @@ class OrgPsrRole(Role):
 
     def setPowerSystemResource(self, value):
         if self._PowerSystemResource is not None:
-            filtered = [x for x in self.PowerSystemResource.ErpOrganisationRoles if x != self]
-            self._PowerSystemResource._ErpOrganisationRoles = filtered
+            self._PowerSystemResource._ErpOrganisationRoles.discard(self)
 
         self._PowerSystemResource = value
         if self._PowerSystemResource is not None:
-            if self not in self._PowerSystemResource._ErpOrganisationRoles:
-                self._PowerSystemResource._ErpOrganisationRoles.append(self)
+            if self._PowerSystemResource._ErpOrganisationRoles is EMPTY:
+                self._PowerSystemResource._ErpOrganisationRoles = AssociationList([self])
+            else:
+                self._PowerSystemResource._ErpOrganisationRoles.add(self)
 
     PowerSystemResource = property(getPowerSystemResource, setPowerSystemResource)
 
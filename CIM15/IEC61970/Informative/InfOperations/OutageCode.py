@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class OutageCode(IdentifiedObject):
     """Classification of outage types. Multiple outage codes may apply to a given outage or outage step.The primary overall outage type is recorded in 'OutageRecord.outageType'. There may be more than one classification per outage step and/or per outage record. Example codes/subcodes include: weather/ice, weather/lightning, wildlife/squirrel, wildlife/bird, burned/overload, burned/weather, wire down/accident, wire down/tree, wire down/vandalism, etc. The typical outage code is in the inherited association to Name. The code is described in the inherited 'description' attribute.Classification of outage types. Multiple outage codes may apply to a given outage or outage step.The primary overall outage type is recorded in 'OutageRecord.outageType'. There may be more than one classification per outage step and/or per outage record. Example codes/subcodes include: weather/ice, weather/lightning, wildlife/squirrel, wildlife/bird, burned/overload, burned/weather, wire down/accident, wire down/tree, wire down/vandalism, etc. The typical outage code is in the inherited association to Name. The code is described in the inherited 'description' attribute.
@@ -34,11 +35,13 @@ class OutageCode(IdentifiedObject):
         #: The main code is stored in the inherited association to Name. This sub-code provides an additional level of classification detail.
         self.subCode = subCode
 
-        self._OutageRecords = []
-        self.OutageRecords = [] if OutageRecords is None else OutageRecords
+        self._OutageRecords = EMPTY
+        if OutageRecords is not None:
+            self.OutageRecords = OutageRecords
 
-        self._OutageSteps = []
-        self.OutageSteps = [] if OutageSteps is None else OutageSteps
+        self._OutageSteps = EMPTY
+        if OutageSteps is not None:
+            self.OutageSteps = OutageSteps
 
         super(OutageCode, self).__init__(*args, **kw_args)
 
@@ -54,21 +57,28 @@ class OutageCode(IdentifiedObject):
         return self._OutageRecords
 
     def setOutageRecords(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._OutageRecords:
-            filtered = [q for q in p.OutageCodes if q != self]
-            self._OutageRecords._OutageCodes = filtered
+            p._OutageCodes.discard(self)
         for r in value:
-            if self not in r._OutageCodes:
-                r._OutageCodes.append(self)
+            if r._OutageCodes is EMPTY:
+                r._OutageCodes = AssociationList([self])
+            else:
+                r._OutageCodes.add(self)
         self._OutageRecords = value
 
     OutageRecords = property(getOutageRecords, setOutageRecords)
 
     def addOutageRecords(self, *OutageRecords):
         for obj in OutageRecords:
-            if self not in obj._OutageCodes:
-                obj._OutageCodes.append(self)
-            self._OutageRecords.append(obj)
+            if obj._OutageCodes is EMPTY:
+                obj._OutageCodes = AssociationList([self])
+            else:
+                obj._OutageCodes.add(self)
+            if self._OutageRecords is EMPTY:
+                self._OutageRecords = AssociationList([obj])
+            else:
+                self._OutageRecords.add(obj)
 
     def removeOutageRecords(self, *OutageRecords):
         for obj in OutageRecords:
@@ -81,21 +91,28 @@ class OutageCode(IdentifiedObject):
         return self._OutageSteps
 
     def setOutageSteps(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._OutageSteps:
-            filtered = [q for q in p.OutageCodes if q != self]
-            self._OutageSteps._OutageCodes = filtered
+            p._OutageCodes.discard(self)
         for r in value:
-            if self not in r._OutageCodes:
-                r._OutageCodes.append(self)
+            if r._OutageCodes is EMPTY:
+                r._OutageCodes = AssociationList([self])
+            else:
+                r._OutageCodes.add(self)
         self._OutageSteps = value
 
     OutageSteps = property(getOutageSteps, setOutageSteps)
 
     def addOutageSteps(self, *OutageSteps):
         for obj in OutageSteps:
-            if self not in obj._OutageCodes:
-                obj._OutageCodes.append(self)
-            self._OutageSteps.append(obj)
+            if obj._OutageCodes is EMPTY:
+                obj._OutageCodes = AssociationList([self])
+            else:
+                obj._OutageCodes.add(self)
+            if self._OutageSteps is EMPTY:
+                self._OutageSteps = AssociationList([obj])
+            else:
+                self._OutageSteps.add(obj)
 
     def removeOutageSteps(self, *OutageSteps):
         for obj in OutageSteps:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import AssociationList, EMPTY
 
 class OutageNotification(Document):
     """A document containing information to be sent to customers notifying that an outage will take place. This is used to generate mailing lists for customers.A document containing information to be sent to customers notifying that an outage will take place. This is used to generate mailing lists for customers.
@@ -41,8 +42,9 @@ class OutageNotification(Document):
         #: Details of the outage 'reason'.
         self.reason = reason
 
-        self._CustomerDatas = []
-        self.CustomerDatas = [] if CustomerDatas is None else CustomerDatas
+        self._CustomerDatas = EMPTY
+        if CustomerDatas is not None:
+            self.CustomerDatas = CustomerDatas
 
         super(OutageNotification, self).__init__(*args, **kw_args)
 
@@ -58,21 +60,28 @@ class OutageNotification(Document):
         return self._CustomerDatas
 
     def setCustomerDatas(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._CustomerDatas:
-            filtered = [q for q in p.OutageNotifications if q != self]
-            self._CustomerDatas._OutageNotifications = filtered
+            p._OutageNotifications.discard(self)
         for r in value:
-            if self not in r._OutageNotifications:
-                r._OutageNotifications.append(self)
+            if r._OutageNotifications is EMPTY:
+                r._OutageNotifications = AssociationList([self])
+            else:
+                r._OutageNotifications.add(self)
         self._CustomerDatas = value
 
     CustomerDatas = property(getCustomerDatas, setCustomerDatas)
 
     def addCustomerDatas(self, *CustomerDatas):
         for obj in CustomerDatas:
-            if self not in obj._OutageNotifications:
-                obj._OutageNotifications.append(self)
-            self._CustomerDatas.append(obj)
+            if obj._OutageNotifications is EMPTY:
+                obj._OutageNotifications = AssociationList([self])
+            else:
+                obj._OutageNotifications.add(self)
+            if self._CustomerDatas is EMPTY:
+                self._CustomerDatas = AssociationList([obj])
+            else:
+                self._CustomerDatas.add(obj)
 
     def removeCustomerDatas(self, *CustomerDatas):
         for obj in CustomerDatas:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import AssociationList, EMPTY
 
 class OutageRecord(Document):
     """A document describing details of an outage in part of the electrical network, typically produced by a SCADA system following a breaker trip, or within a trouble call system by grouping customer calls. This has an associated outage step for each supply point. Primary cause of the outage is captured in 'category'. In some countries all outage restoration is performed using a switching schedule which complements the outage record and records the crew and any planned work. In other systems, it may be acceptable to manage outages including new work tasks without switching schedules. Note: The relationship between OutageRecord and ErpPerson and Crew is inherited as each is a type of Document.A document describing details of an outage in part of the electrical network, typically produced by a SCADA system following a breaker trip, or within a trouble call system by grouping customer calls. This has an associated outage step for each supply point. Primary cause of the outage is captured in 'category'. In some countries all outage restoration is performed using a switching schedule which complements the outage record and records the crew and any planned work. In other systems, it may be acceptable to manage outages including new work tasks without switching schedules. Note: The relationship between OutageRecord and ErpPerson and Crew is inherited as each is a type of Document.
@@ -51,14 +52,16 @@ class OutageRecord(Document):
         #: Value of ErpOrganisation.mode at the time of OutageRecord.startDateTime.
         self.mode = mode
 
-        self._OutageCodes = []
-        self.OutageCodes = [] if OutageCodes is None else OutageCodes
+        self._OutageCodes = EMPTY
+        if OutageCodes is not None:
+            self.OutageCodes = OutageCodes
 
         self._OutageReport = None
         self.OutageReport = OutageReport
 
-        self._OutageSteps = []
-        self.OutageSteps = [] if OutageSteps is None else OutageSteps
+        self._OutageSteps = EMPTY
+        if OutageSteps is not None:
+            self.OutageSteps = OutageSteps
 
         super(OutageRecord, self).__init__(*args, **kw_args)
 
@@ -75,21 +78,28 @@ class OutageRecord(Document):
         return self._OutageCodes
 
     def setOutageCodes(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._OutageCodes:
-            filtered = [q for q in p.OutageRecords if q != self]
-            self._OutageCodes._OutageRecords = filtered
+            p._OutageRecords.discard(self)
         for r in value:
-            if self not in r._OutageRecords:
-                r._OutageRecords.append(self)
+            if r._OutageRecords is EMPTY:
+                r._OutageRecords = AssociationList([self])
+            else:
+                r._OutageRecords.add(self)
         self._OutageCodes = value
 
     OutageCodes = property(getOutageCodes, setOutageCodes)
 
     def addOutageCodes(self, *OutageCodes):
         for obj in OutageCodes:
-            if self not in obj._OutageRecords:
-                obj._OutageRecords.append(self)
-            self._OutageCodes.append(obj)
+            if obj._OutageRecords is EMPTY:
+                obj._OutageRecords = AssociationList([self])
+            else:
+                obj._OutageRecords.add(self)
+            if self._OutageCodes is EMPTY:
+                self._OutageCodes = AssociationList([obj])
+            else:
+                self._OutageCodes.add(obj)
 
     def removeOutageCodes(self, *OutageCodes):
         for obj in OutageCodes:
@@ -117,6 +127,7 @@ class OutageRecord(Document):
         return self._OutageSteps
 
     def setOutageSteps(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._OutageSteps:
             x.OutageRecord = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import AssociationList, EMPTY
 
 class OutageReport(Document):
     """Document with statistics of an outage.Document with statistics of an outage.
@@ -84,13 +85,14 @@ class OutageReport(Document):
 
     def setOutageHistory(self, value):
         if self._OutageHistory is not None:
-            filtered = [x for x in self.OutageHistory.OutageReports if x != self]
-            self._OutageHistory._OutageReports = filtered
+            self._OutageHistory._OutageReports.discard(self)
 
         self._OutageHistory = value
         if self._OutageHistory is not None:
-            if self not in self._OutageHistory._OutageReports:
-                self._OutageHistory._OutageReports.append(self)
+            if self._OutageHistory._OutageReports is EMPTY:
+                self._OutageHistory._OutageReports = AssociationList([self])
+            else:
+                self._OutageHistory._OutageReports.add(self)
 
     OutageHistory = property(getOutageHistory, setOutageHistory)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class OutageStep(IdentifiedObject):
     """Holds an outage start and end time for each supply point of an outage record. The supply point for a given step is the associated PowerSystemResource instance.Holds an outage start and end time for each supply point of an outage record. The supply point for a given step is the associated PowerSystemResource instance.
@@ -82,21 +83,24 @@ class OutageStep(IdentifiedObject):
         #: Total Customer Minutes Lost (CML) for this supply point for this outage.
         self.totalCml = totalCml
 
-        self._Crews = []
-        self.Crews = [] if Crews is None else Crews
+        self._Crews = EMPTY
+        if Crews is not None:
+            self.Crews = Crews
 
         self.noPowerInterval = noPowerInterval
 
-        self._ConductingEquipmentRoles = []
-        self.ConductingEquipmentRoles = [] if ConductingEquipmentRoles is None else ConductingEquipmentRoles
+        self._ConductingEquipmentRoles = EMPTY
+        if ConductingEquipmentRoles is not None:
+            self.ConductingEquipmentRoles = ConductingEquipmentRoles
 
         self.status = status
 
         self._OutageRecord = None
         self.OutageRecord = OutageRecord
 
-        self._OutageCodes = []
-        self.OutageCodes = [] if OutageCodes is None else OutageCodes
+        self._OutageCodes = EMPTY
+        if OutageCodes is not None:
+            self.OutageCodes = OutageCodes
 
         super(OutageStep, self).__init__(*args, **kw_args)
 
@@ -112,21 +116,28 @@ class OutageStep(IdentifiedObject):
         return self._Crews
 
     def setCrews(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Crews:
-            filtered = [q for q in p.OutageSteps if q != self]
-            self._Crews._OutageSteps = filtered
+            p._OutageSteps.discard(self)
         for r in value:
-            if self not in r._OutageSteps:
-                r._OutageSteps.append(self)
+            if r._OutageSteps is EMPTY:
+                r._OutageSteps = AssociationList([self])
+            else:
+                r._OutageSteps.add(self)
         self._Crews = value
 
     Crews = property(getCrews, setCrews)
 
     def addCrews(self, *Crews):
         for obj in Crews:
-            if self not in obj._OutageSteps:
-                obj._OutageSteps.append(self)
-            self._Crews.append(obj)
+            if obj._OutageSteps is EMPTY:
+                obj._OutageSteps = AssociationList([self])
+            else:
+                obj._OutageSteps.add(self)
+            if self._Crews is EMPTY:
+                self._Crews = AssociationList([obj])
+            else:
+                self._Crews.add(obj)
 
     def removeCrews(self, *Crews):
         for obj in Crews:
@@ -142,6 +153,7 @@ class OutageStep(IdentifiedObject):
         return self._ConductingEquipmentRoles
 
     def setConductingEquipmentRoles(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ConductingEquipmentRoles:
             x.OutageStep = None
         for y in value:
@@ -166,13 +178,14 @@ class OutageStep(IdentifiedObject):
 
     def setOutageRecord(self, value):
         if self._OutageRecord is not None:
-            filtered = [x for x in self.OutageRecord.OutageSteps if x != self]
-            self._OutageRecord._OutageSteps = filtered
+            self._OutageRecord._OutageSteps.discard(self)
 
         self._OutageRecord = value
         if self._OutageRecord is not None:
-            if self not in self._OutageRecord._OutageSteps:
-                self._OutageRecord._OutageSteps.append(self)
+            if self._OutageRecord._OutageSteps is EMPTY:
+                self._OutageRecord._OutageSteps = AssociationList([self])
+            else:
+                self._OutageRecord._OutageSteps.add(self)
 
     OutageRecord = property(getOutageRecord, setOutageRecord)
 
@@ -182,21 +195,28 @@ class OutageStep(IdentifiedObject):
         return self._OutageCodes
 
     def setOutageCodes(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._OutageCodes:
-            filtered = [q for q in p.OutageSteps if q != self]
-            self._OutageCodes._OutageSteps = filtered
+            p._OutageSteps.discard(self)
         for r in value:
-            if self not in r._OutageSteps:
-                r._OutageSteps.append(self)
+            if r._OutageSteps is EMPTY:
+                r._OutageSteps = AssociationList([self])
+            else:
+                r._OutageSteps.add(self)
         self._OutageCodes = value
 
     OutageCodes = property(getOutageCodes, setOutageCodes)
 
     def addOutageCodes(self, *OutageCodes):
         for obj in OutageCodes:
-            if self not in obj._OutageSteps:
-                obj._OutageSteps.append(self)
-            self._OutageCodes.append(obj)
+            if obj._OutageSteps is EMPTY:
+                obj._OutageSteps = AssociationList([self])
+            else:
+                obj._OutageSteps.add(self)
+            if self._OutageCodes is EMPTY:
+                self._OutageCodes = AssociationList([obj])
+            else:
+                self._OutageCodes.add(obj)
 
     def removeOutageCodes(self, *OutageCodes):
         for obj in OutageCodes:
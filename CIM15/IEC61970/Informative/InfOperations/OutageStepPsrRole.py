@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Informative.InfCommon.Role import Role
+from CIM15.Element import AssociationList, EMPTY
 
 class OutageStepPsrRole(Role):
     """Roles played between Power System Resources and Outage Steps. Examples roles include: normal supply, actual supply, interrupting device, restoration device.Roles played between Power System Resources and Outage Steps. Examples roles include: normal supply, actual supply, interrupting device, restoration device.
@@ -51,13 +52,14 @@ class OutageStepPsrRole(Role):
 
     def setOutageStep(self, value):
         if self._OutageStep is not None:
-            filtered = [x for x in self.OutageStep.ConductingEquipmentRoles if x != self]
-            self._OutageStep._ConductingEquipmentRoles = filtered
+            self._OutageStep._ConductingEquipmentRoles.discard(self)
 
         self._OutageStep = value
         if self._OutageStep is not None:
-            if self not in self._OutageStep._ConductingEquipmentRoles:
-                self._OutageStep._ConductingEquipmentRoles.append(self)
+            if self._OutageStep._ConductingEquipmentRoles is EMPTY:
+                self._OutageStep._ConductingEquipmentRoles = AssociationList([self])
+            else:
+                self._OutageStep._ConductingEquipmentRoles.add(self)
 
     OutageStep = property(getOutageStep, setOutageStep)
 
@@ -67,13 +69,14 @@ class OutageStepPsrRole(Role):
 
     def setConductingEquipment(self, value):
         if self._ConductingEquipment is not None:
-            filtered = [x for x in self.ConductingEquipment.OutageStepRoles if x != self]
-            self._ConductingEquipment._OutageStepRoles = filtered
+            self._ConductingEquipment._OutageStepRoles.discard(self)
 
         self._ConductingEquipment = value
         if self._ConductingEquipment is not None:
-            if self not in self._ConductingEquipment._OutageStepRoles:
-                self._ConductingEquipment._OutageStepRoles.append(self)
+            if self._ConductingEquipment._OutageStepRoles is EMPTY:
+                self._ConductingEquipment._OutageStepRoles = AssociationList([self])
+            else:
+                self._ConductingEquipment._OutageStepRoles.add(self)
 
     ConductingEquipment = property(getConductingEquipment, setConductingEquipment)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.ActivityRecord import ActivityRecord
+from CIM15.Element import AssociationList, EMPTY
 
 class PSREvent(ActivityRecord):
     """Event recording the change in operational status of a PowerSystemResource.Event recording the change in operational status of a PowerSystemResource.
@@ -52,13 +53,14 @@ class PSREvent(ActivityRecord):
 
     def setPowerSystemResource(self, value):
         if self._PowerSystemResource is not None:
-            filtered = [x for x in self.PowerSystemResource.PSREvent if x != self]
-            self._PowerSystemResource._PSREvent = filtered
+            self._PowerSystemResource._PSREvent.discard(self)
 
         self._PowerSystemResource = value
         if self._PowerSystemResource is not None:
-            if self not in self._PowerSystemResource._PSREvent:
-                self._PowerSystemResource._PSREvent.append(self)
+            if self._PowerSystemResource._PSREvent is EMPTY:
+                self._PowerSystemResource._PSREvent = AssociationList([self])
+            else:
+                self._PowerSystemResource._PSREvent.add(self)
 
     PowerSystemResource = property(getPowerSystemResource, setPowerSystemResource)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import AssociationList, EMPTY
 
 class PlannedOutage(Document):
     """Planned outage involves network operations which will affect the supply of power to customers. Note that the list of Power System Resources for the PlannedOutage may be the same or a superset of the ones per OutageStep.Planned outage involves network operations which will affect the supply of power to customers. Note that the list of Power System Resources for the PlannedOutage may be the same or a superset of the ones per OutageStep.
@@ -34,11 +35,13 @@ class PlannedOutage(Document):
         #: Kind of outage. Values are: "fixed", "flexible", "forced"
         self.kind = kind
 
-        self._CustomerDatas = []
-        self.CustomerDatas = [] if CustomerDatas is None else CustomerDatas
+        self._CustomerDatas = EMPTY
+        if CustomerDatas is not None:
+            self.CustomerDatas = CustomerDatas
 
-        self._OutageSchedules = []
-        self.OutageSchedules = [] if OutageSchedules is None else OutageSchedules
+        self._OutageSchedules = EMPTY
+        if OutageSchedules is not None:
+            self.OutageSchedules = OutageSchedules
 
         super(PlannedOutage, self).__init__(*args, **kw_args)
 
@@ -55,6 +58,7 @@ class PlannedOutage(Document):
         return self._CustomerDatas
 
     def setCustomerDatas(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._CustomerDatas:
             x.PlannedOutage = None
         for y in value:
@@ -76,6 +80,7 @@ class PlannedOutage(Document):
         return self._OutageSchedules
 
     def setOutageSchedules(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._OutageSchedules:
             x.PlannedOutage = None
         for y in value:
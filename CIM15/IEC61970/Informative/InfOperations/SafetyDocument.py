@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import AssociationList, EMPTY
 
 class SafetyDocument(Document):
     """A document restricting or authorising works on electrical equipment (for example a permit to work, sanction for test, limitation of access, or certificate of isolation), defined based upon organisational practices. Note: SafetyDocument may refer to ClearanceTag-s associated with ConductingEquipment for which the SafetyDocument is issued.A document restricting or authorising works on electrical equipment (for example a permit to work, sanction for test, limitation of access, or certificate of isolation), defined based upon organisational practices. Note: SafetyDocument may refer to ClearanceTag-s associated with ConductingEquipment for which the SafetyDocument is issued.
@@ -31,11 +32,13 @@ class SafetyDocument(Document):
         @param ScheduleSteps:
         @param PowerSystemResource:
         """
-        self._ClearanceTags = []
-        self.ClearanceTags = [] if ClearanceTags is None else ClearanceTags
+        self._ClearanceTags = EMPTY
+        if ClearanceTags is not None:
+            self.ClearanceTags = ClearanceTags
 
-        self._ScheduleSteps = []
-        self.ScheduleSteps = [] if ScheduleSteps is None else ScheduleSteps
+        self._ScheduleSteps = EMPTY
+        if ScheduleSteps is not None:
+            self.ScheduleSteps = ScheduleSteps
 
         self._PowerSystemResource = None
         self.PowerSystemResource = PowerSystemResource
@@ -54,6 +57,7 @@ class SafetyDocument(Document):
         return self._ClearanceTags
 
     def setClearanceTags(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ClearanceTags:
             x.SafetyDocument = None
         for y in value:
@@ -75,6 +79,7 @@ class SafetyDocument(Document):
         return self._ScheduleSteps
 
     def setScheduleSteps(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ScheduleSteps:
             x.SafetyDocument = None
         for y in value:
@@ -97,13 +102,14 @@ class SafetyDocument(Document):
 
     def setPowerSystemResource(self, value):
         if self._PowerSystemResource is not None:
-            filtered = [x for x in self.PowerSystemResource.SafetyDocuments if x != self]
-            self._PowerSystemResource._SafetyDocuments = filtered
+            self._PowerSystemResource._SafetyDocuments.discard(self)
 
         self._PowerSystemResource = value
         if self._PowerSystemResource is not None:
-            if self not in self._PowerSystemResource._SafetyDocuments:
-                self._PowerSystemResource._SafetyDocuments.append(self)
+            if self._PowerSystemResource._SafetyDocuments is EMPTY:
+                self._PowerSystemResource._SafetyDocuments = AssociationList([self])
+            else:
+                self._PowerSystemResource._SafetyDocuments.add(self)
 
     PowerSystemResource = property(getPowerSystemResource, setPowerSystemResource)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class SwitchingStep(IdentifiedObject):
     """A single step within a SwitchingSchedule. Could be a switching operation (applying a network alteration), or issuing a safety document. Note: Inherited attribute IdentifiedObject.name is used to hold the sequence number.A single step within a SwitchingSchedule. Could be a switching operation (applying a network alteration), or issuing a safety document. Note: Inherited attribute IdentifiedObject.name is used to hold the sequence number.
@@ -57,8 +58,9 @@ class SwitchingStep(IdentifiedObject):
         self._SwitchingSchedule = None
         self.SwitchingSchedule = SwitchingSchedule
 
-        self._PowerSystemResources = []
-        self.PowerSystemResources = [] if PowerSystemResources is None else PowerSystemResources
+        self._PowerSystemResources = EMPTY
+        if PowerSystemResources is not None:
+            self.PowerSystemResources = PowerSystemResources
 
         self._ErpPersonRole = None
         self.ErpPersonRole = ErpPersonRole
@@ -78,13 +80,14 @@ class SwitchingStep(IdentifiedObject):
 
     def setSafetyDocument(self, value):
         if self._SafetyDocument is not None:
-            filtered = [x for x in self.SafetyDocument.ScheduleSteps if x != self]
-            self._SafetyDocument._ScheduleSteps = filtered
+            self._SafetyDocument._ScheduleSteps.discard(self)
 
         self._SafetyDocument = value
         if self._SafetyDocument is not None:
-            if self not in self._SafetyDocument._ScheduleSteps:
-                self._SafetyDocument._ScheduleSteps.append(self)
+            if self._SafetyDocument._ScheduleSteps is EMPTY:
+                self._SafetyDocument._ScheduleSteps = AssociationList([self])
+            else:
+                self._SafetyDocument._ScheduleSteps.add(self)
 
     SafetyDocument = property(getSafetyDocument, setSafetyDocument)
 
@@ -97,13 +100,14 @@ class SwitchingStep(IdentifiedObject):
 
     def setSwitchingSchedule(self, value):
         if self._SwitchingSchedule is not None:
-            filtered = [x for x in self.SwitchingSchedule.ScheduleSteps if x != self]
-            self._SwitchingSchedule._ScheduleSteps = filtered
+            self._SwitchingSchedule._ScheduleSteps.discard(self)
 
         self._SwitchingSchedule = value
         if self._SwitchingSchedule is not None:
-            if self not in self._SwitchingSchedule._ScheduleSteps:
-                self._SwitchingSchedule._ScheduleSteps.append(self)
+            if self._SwitchingSchedule._ScheduleSteps is EMPTY:
+                self._SwitchingSchedule._ScheduleSteps = AssociationList([self])
+            else:
+                self._SwitchingSchedule._ScheduleSteps.add(self)
 
     SwitchingSchedule = property(getSwitchingSchedule, setSwitchingSchedule)
 
@@ -112,21 +116,28 @@ class SwitchingStep(IdentifiedObject):
         return self._PowerSystemResources
 
     def setPowerSystemResources(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._PowerSystemResources:
-            filtered = [q for q in p.ScheduleSteps if q != self]
-            self._PowerSystemResources._ScheduleSteps = filtered
+            p._ScheduleSteps.discard(self)
         for r in value:
-            if self not in r._ScheduleSteps:
-                r._ScheduleSteps.append(self)
+            if r._ScheduleSteps is EMPTY:
+                r._ScheduleSteps = AssociationList([self])
+            else:
+                r._ScheduleSteps.add(self)
         self._PowerSystemResources = value
 
     PowerSystemResources = property(getPowerSystemResources, setPowerSystemResources)
 
     def addPowerSystemResources(self, *PowerSystemResources):
         for obj in PowerSystemResources:
-            if self not in obj._ScheduleSteps:
-                obj._ScheduleSteps.append(self)
-            self._PowerSystemResources.append(obj)
+            if obj._ScheduleSteps is EMPTY:
+                obj._ScheduleSteps = AssociationList([self])
+            else:
+                obj._ScheduleSteps.add(self)
+            if self._PowerSystemResources is EMPTY:
+                self._PowerSystemResources = AssociationList([obj])
+            else:
+                self._PowerSystemResources.add(obj)
 
     def removePowerSystemResources(self, *PowerSystemResources):
         for obj in PowerSystemResources:
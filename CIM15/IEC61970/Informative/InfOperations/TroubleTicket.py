@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import AssociationList, EMPTY
 
 class TroubleTicket(Document):
     """A document used to report electrical trouble. The trouble may either be an outage or non-outage problem, such as power quality. It must always be associated with an incident record. Note that a separate activity record is created for each call associated with an instance of trouble ticket. The time of a call is stored in 'ActivityRecord.createdOn' and comments are recorded in 'ActivityRecord.remarks'.A document used to report electrical trouble. The trouble may either be an outage or non-outage problem, such as power quality. It must always be associated with an incident record. Note that a separate activity record is created for each call associated with an instance of trouble ticket. The time of a call is stored in 'ActivityRecord.createdOn' and comments are recorded in 'ActivityRecord.remarks'.
@@ -68,8 +69,9 @@ class TroubleTicket(Document):
         #: True if requested to customer when someone is about to arrive at their premises.
         self.callBack = callBack
 
-        self._CallBacks = []
-        self.CallBacks = [] if CallBacks is None else CallBacks
+        self._CallBacks = EMPTY
+        if CallBacks is not None:
+            self.CallBacks = CallBacks
 
         self.troublePeriod = troublePeriod
 
@@ -93,21 +95,28 @@ class TroubleTicket(Document):
         return self._CallBacks
 
     def setCallBacks(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._CallBacks:
-            filtered = [q for q in p.TroubleTickets if q != self]
-            self._CallBacks._TroubleTickets = filtered
+            p._TroubleTickets.discard(self)
         for r in value:
-            if self not in r._TroubleTickets:
-                r._TroubleTickets.append(self)
+            if r._TroubleTickets is EMPTY:
+                r._TroubleTickets = AssociationList([self])
+            else:
+                r._TroubleTickets.add(self)
         self._CallBacks = value
 
     CallBacks = property(getCallBacks, setCallBacks)
 
     def addCallBacks(self, *CallBacks):
         for obj in CallBacks:
-            if self not in obj._TroubleTickets:
-                obj._TroubleTickets.append(self)
-            self._CallBacks.append(obj)
+            if obj._TroubleTickets is EMPTY:
+                obj._TroubleTickets = AssociationList([self])
+            else:
+                obj._TroubleTickets.add(self)
+            if self._CallBacks is EMPTY:
+                self._CallBacks = AssociationList([obj])
+            else:
+                self._CallBacks.add(obj)
 
     def removeCallBacks(self, *CallBacks):
         for obj in CallBacks:
@@ -124,13 +133,14 @@ class TroubleTicket(Document):
 
     def setCustomerData(self, value):
         if self._CustomerData is not None:
-            filtered = [x for x in self.CustomerData.TroubleTickets if x != self]
-            self._CustomerData._TroubleTickets = filtered
+            self._CustomerData._TroubleTickets.discard(self)
 
         self._CustomerData = value
         if self._CustomerData is not None:
-            if self not in self._CustomerData._TroubleTickets:
-                self._CustomerData._TroubleTickets.append(self)
+            if self._CustomerData._TroubleTickets is EMPTY:
+                self._CustomerData._TroubleTickets = AssociationList([self])
+            else:
+                self._CustomerData._TroubleTickets.add(self)
 
     CustomerData = property(getCustomerData, setCustomerData)
 
@@ -140,13 +150,14 @@ class TroubleTicket(Document):
 
     def setIncidentRecord(self, value):
         if self._IncidentRecord is not None:
-            filtered = [x for x in self.IncidentRecord.TroubleTickets if x != self]
-            self._IncidentRecord._TroubleTickets = filtered
+            self._IncidentRecord._TroubleTickets.discard(self)
 
         self._IncidentRecord = value
         if self._IncidentRecord is not None:
-            if self not in self._IncidentRecord._TroubleTickets:
-                self._IncidentRecord._TroubleTickets.append(self)
+            if self._IncidentRecord._TroubleTickets is EMPTY:
+                self._IncidentRecord._TroubleTickets = AssociationList([self])
+            else:
+                self._IncidentRecord._TroubleTickets.add(self)
 
     IncidentRecord = property(getIncidentRecord, setIncidentRecord)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class TypeAssetCatalogue(IdentifiedObject):
     """Catalogue of generic types of assets (TypeAsset) that may be used for design purposes. It is not associated with a particular manufacturer.Catalogue of generic types of assets (TypeAsset) that may be used for design purposes. It is not associated with a particular manufacturer.
@@ -30,8 +31,9 @@ class TypeAssetCatalogue(IdentifiedObject):
         @param TypeAssets:
         @param status:
         """
-        self._TypeAssets = []
-        self.TypeAssets = [] if TypeAssets is None else TypeAssets
+        self._TypeAssets = EMPTY
+        if TypeAssets is not None:
+            self.TypeAssets = TypeAssets
 
         self.status = status
 
@@ -49,6 +51,7 @@ class TypeAssetCatalogue(IdentifiedObject):
         return self._TypeAssets
 
     def setTypeAssets(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._TypeAssets:
             x.TypeAssetCatalogue = None
         for y in value:
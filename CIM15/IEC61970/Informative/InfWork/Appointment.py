@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Informative.InfCommon.ScheduledEvent import ScheduledEvent
+from CIM15.Element import AssociationList, EMPTY
 
 class Appointment(ScheduledEvent):
     """Meeting time and location.Meeting time and location.
@@ -42,8 +43,9 @@ class Appointment(ScheduledEvent):
 
         self.address = address
 
-        self._ErpPersons = []
-        self.ErpPersons = [] if ErpPersons is None else ErpPersons
+        self._ErpPersons = EMPTY
+        if ErpPersons is not None:
+            self.ErpPersons = ErpPersons
 
         self.meetingInterval = meetingInterval
 
@@ -67,21 +69,28 @@ class Appointment(ScheduledEvent):
         return self._ErpPersons
 
     def setErpPersons(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ErpPersons:
-            filtered = [q for q in p.Appointments if q != self]
-            self._ErpPersons._Appointments = filtered
+            p._Appointments.discard(self)
         for r in value:
-            if self not in r._Appointments:
-                r._Appointments.append(self)
+            if r._Appointments is EMPTY:
+                r._Appointments = AssociationList([self])
+            else:
+                r._Appointments.add(self)
         self._ErpPersons = value
 
     ErpPersons = property(getErpPersons, setErpPersons)
 
     def addErpPersons(self, *ErpPersons):
         for obj in ErpPersons:
-            if self not in obj._Appointments:
-                obj._Appointments.append(self)
-            self._ErpPersons.append(obj)
+            if obj._Appointments is EMPTY:
+                obj._Appointments = AssociationList([self])
+            else:
+                obj._Appointments.add(self)
+            if self._ErpPersons is EMPTY:
+                self._ErpPersons = AssociationList([obj])
+            else:
+                self._ErpPersons.add(obj)
 
     def removeErpPersons(self, *ErpPersons):
         for obj in ErpPersons:
@@ -98,13 +107,14 @@ class Appointment(ScheduledEvent):
 
     def setCallBack(self, value):
         if self._CallBack is not None:
-            filtered = [x for x in self.CallBack.Appointments if x != self]
-            self._CallBack._Appointments = filtered
+            self._CallBack._Appointments.discard(self)
 
         self._CallBack = value
         if self._CallBack is not None:
-            if self not in self._CallBack._Appointments:
-                self._CallBack._Appointments.append(self)
+            if self._CallBack._Appointments is EMPTY:
+                self._CallBack._Appointments = AssociationList([self])
+            else:
+                self._CallBack._Appointments.add(self)
 
     CallBack = property(getCallBack, setCallBack)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import AssociationList, EMPTY
 
 class Assignment(Document):
     """An assignment is given to an ErpPerson, Crew, Organisation, Equipment Item, Tool, etc. and may be used to perform Work, WorkTasks, Procedures, etc. TimeSchedules may be set up directly for Assignments or indirectly via the associated WorkTask. Note that these associations are all inherited through the recursive relationship on Document.An assignment is given to an ErpPerson, Crew, Organisation, Equipment Item, Tool, etc. and may be used to perform Work, WorkTasks, Procedures, etc. TimeSchedules may be set up directly for Assignments or indirectly via the associated WorkTask. Note that these associations are all inherited through the recursive relationship on Document.
@@ -30,8 +31,9 @@ class Assignment(Document):
         @param Crews: All Crews having this Assignment.
         @param effectivePeriod: Period between the assignment becoming effective and its expiration.
         """
-        self._Crews = []
-        self.Crews = [] if Crews is None else Crews
+        self._Crews = EMPTY
+        if Crews is not None:
+            self.Crews = Crews
 
         self.effectivePeriod = effectivePeriod
 
@@ -50,21 +52,28 @@ class Assignment(Document):
         return self._Crews
 
     def setCrews(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Crews:
-            filtered = [q for q in p.Assignments if q != self]
-            self._Crews._Assignments = filtered
+            p._Assignments.discard(self)
         for r in value:
-            if self not in r._Assignments:
-                r._Assignments.append(self)
+            if r._Assignments is EMPTY:
+                r._Assignments = AssociationList([self])
+            else:
+                r._Assignments.add(self)
         self._Crews = value
 
     Crews = property(getCrews, setCrews)
 
     def addCrews(self, *Crews):
         for obj in Crews:
-            if self not in obj._Assignments:
-                obj._Assignments.append(self)
-            self._Crews.append(obj)
+            if obj._Assignments is EMPTY:
+                obj._Assignments = AssociationList([self])
+            else:
+                obj._Assignments.add(self)
+            if self._Crews is EMPTY:
+                self._Crews = AssociationList([obj])
+            else:
+                self._Crews.add(obj)
 
     def removeCrews(self, *Crews):
         for obj in Crews:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import AssociationList, EMPTY
 
 class BusinessCase(Document):
     """Business justification for capital expenditures, usually addressing operations and maintenance costs as well.Business justification for capital expenditures, usually addressing operations and maintenance costs as well.
@@ -34,11 +35,13 @@ class BusinessCase(Document):
         #: A codified representation of the business case (i.e., codes for highway relocation, replace substation transformers, etc.).
         self.corporateCode = corporateCode
 
-        self._Projects = []
-        self.Projects = [] if Projects is None else Projects
+        self._Projects = EMPTY
+        if Projects is not None:
+            self.Projects = Projects
 
-        self._Works = []
-        self.Works = [] if Works is None else Works
+        self._Works = EMPTY
+        if Works is not None:
+            self.Works = Works
 
         super(BusinessCase, self).__init__(*args, **kw_args)
 
@@ -54,6 +57,7 @@ class BusinessCase(Document):
         return self._Projects
 
     def setProjects(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Projects:
             x.BusinessCase = None
         for y in value:
@@ -75,6 +79,7 @@ class BusinessCase(Document):
         return self._Works
 
     def setWorks(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Works:
             x.BusinessCase = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class CUAllowableAction(IdentifiedObject):
     """Allowed actions: Install, Remove, Transfer, Abandon, etc.Allowed actions: Install, Remove, Transfer, Abandon, etc.
@@ -30,8 +31,9 @@ class CUAllowableAction(IdentifiedObject):
         @param CompatibleUnits:
         @param status:
         """
-        self._CompatibleUnits = []
-        self.CompatibleUnits = [] if CompatibleUnits is None else CompatibleUnits
+        self._CompatibleUnits = EMPTY
+        if CompatibleUnits is not None:
+            self.CompatibleUnits = CompatibleUnits
 
         self.status = status
 
@@ -49,6 +51,7 @@ class CUAllowableAction(IdentifiedObject):
         return self._CompatibleUnits
 
     def setCompatibleUnits(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._CompatibleUnits:
             x.CUAllowableAction = None
         for y in value:
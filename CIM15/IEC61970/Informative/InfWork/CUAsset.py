@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class CUAsset(IdentifiedObject):
     """Compatible unit for various types of assets such as transformers switches, substation fences, poles, etc..Compatible unit for various types of assets such as transformers switches, substation fences, poles, etc..
@@ -39,8 +40,9 @@ class CUAsset(IdentifiedObject):
         #: The code for this type of asset.
         self.typeAssetCode = typeAssetCode
 
-        self._CompatibleUnits = []
-        self.CompatibleUnits = [] if CompatibleUnits is None else CompatibleUnits
+        self._CompatibleUnits = EMPTY
+        if CompatibleUnits is not None:
+            self.CompatibleUnits = CompatibleUnits
 
         self._TypeAsset = None
         self.TypeAsset = TypeAsset
@@ -61,21 +63,28 @@ class CUAsset(IdentifiedObject):
         return self._CompatibleUnits
 
     def setCompatibleUnits(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._CompatibleUnits:
-            filtered = [q for q in p.CUAssets if q != self]
-            self._CompatibleUnits._CUAssets = filtered
+            p._CUAssets.discard(self)
         for r in value:
-            if self not in r._CUAssets:
-                r._CUAssets.append(self)
+            if r._CUAssets is EMPTY:
+                r._CUAssets = AssociationList([self])
+            else:
+                r._CUAssets.add(self)
         self._CompatibleUnits = value
 
     CompatibleUnits = property(getCompatibleUnits, setCompatibleUnits)
 
     def addCompatibleUnits(self, *CompatibleUnits):
         for obj in CompatibleUnits:
-            if self not in obj._CUAssets:
-                obj._CUAssets.append(self)
-            self._CompatibleUnits.append(obj)
+            if obj._CUAssets is EMPTY:
+                obj._CUAssets = AssociationList([self])
+            else:
+                obj._CUAssets.add(self)
+            if self._CompatibleUnits is EMPTY:
+                self._CompatibleUnits = AssociationList([obj])
+            else:
+                self._CompatibleUnits.add(obj)
 
     def removeCompatibleUnits(self, *CompatibleUnits):
         for obj in CompatibleUnits:
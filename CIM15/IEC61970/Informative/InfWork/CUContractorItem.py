@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class CUContractorItem(IdentifiedObject):
     """Compatible unit contractor item.Compatible unit contractor item.
@@ -38,8 +39,9 @@ class CUContractorItem(IdentifiedObject):
         #: Activity code identifies a specific and distinguishable unit of work.
         self.activityCode = activityCode
 
-        self._CompatibleUnits = []
-        self.CompatibleUnits = [] if CompatibleUnits is None else CompatibleUnits
+        self._CompatibleUnits = EMPTY
+        if CompatibleUnits is not None:
+            self.CompatibleUnits = CompatibleUnits
 
         self.status = status
 
@@ -57,21 +59,28 @@ class CUContractorItem(IdentifiedObject):
         return self._CompatibleUnits
 
     def setCompatibleUnits(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._CompatibleUnits:
-            filtered = [q for q in p.CUContractorItems if q != self]
-            self._CompatibleUnits._CUContractorItems = filtered
+            p._CUContractorItems.discard(self)
         for r in value:
-            if self not in r._CUContractorItems:
-                r._CUContractorItems.append(self)
+            if r._CUContractorItems is EMPTY:
+                r._CUContractorItems = AssociationList([self])
+            else:
+                r._CUContractorItems.add(self)
         self._CompatibleUnits = value
 
     CompatibleUnits = property(getCompatibleUnits, setCompatibleUnits)
 
     def addCompatibleUnits(self, *CompatibleUnits):
         for obj in CompatibleUnits:
-            if self not in obj._CUContractorItems:
-                obj._CUContractorItems.append(self)
-            self._CompatibleUnits.append(obj)
+            if obj._CUContractorItems is EMPTY:
+                obj._CUContractorItems = AssociationList([self])
+            else:
+                obj._CUContractorItems.add(self)
+            if self._CompatibleUnits is EMPTY:
+                self._CompatibleUnits = AssociationList([obj])
+            else:
+                self._CompatibleUnits.add(obj)
 
     def removeCompatibleUnits(self, *CompatibleUnits):
         for obj in CompatibleUnits:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class CUGroup(IdentifiedObject):
     """A Compatible Unit Group identifies a set of compatible units which may be jointly utilized for estimating and designating jobs.A Compatible Unit Group identifies a set of compatible units which may be jointly utilized for estimating and designating jobs.
@@ -33,19 +34,23 @@ class CUGroup(IdentifiedObject):
         @param status:
         @param DesignLocationCUs:
         """
-        self._CompatibleUnits = []
-        self.CompatibleUnits = [] if CompatibleUnits is None else CompatibleUnits
+        self._CompatibleUnits = EMPTY
+        if CompatibleUnits is not None:
+            self.CompatibleUnits = CompatibleUnits
 
-        self._ParentCUGroups = []
-        self.ParentCUGroups = [] if ParentCUGroups is None else ParentCUGroups
+        self._ParentCUGroups = EMPTY
+        if ParentCUGroups is not None:
+            self.ParentCUGroups = ParentCUGroups
 
-        self._ChildCUGroups = []
-        self.ChildCUGroups = [] if ChildCUGroups is None else ChildCUGroups
+        self._ChildCUGroups = EMPTY
+        if ChildCUGroups is not None:
+            self.ChildCUGroups = ChildCUGroups
 
         self.status = status
 
-        self._DesignLocationCUs = []
-        self.DesignLocationCUs = [] if DesignLocationCUs is None else DesignLocationCUs
+        self._DesignLocationCUs = EMPTY
+        if DesignLocationCUs is not None:
+            self.DesignLocationCUs = DesignLocationCUs
 
         super(CUGroup, self).__init__(*args, **kw_args)
 
@@ -61,6 +66,7 @@ class CUGroup(IdentifiedObject):
         return self._CompatibleUnits
 
     def setCompatibleUnits(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._CompatibleUnits:
             x.CUGroup = None
         for y in value:
@@ -82,21 +88,28 @@ class CUGroup(IdentifiedObject):
         return self._ParentCUGroups
 
     def setParentCUGroups(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ParentCUGroups:
-            filtered = [q for q in p.ChildCUGroups if q != self]
-            self._ParentCUGroups._ChildCUGroups = filtered
+            p._ChildCUGroups.discard(self)
         for r in value:
-            if self not in r._ChildCUGroups:
-                r._ChildCUGroups.append(self)
+            if r._ChildCUGroups is EMPTY:
+                r._ChildCUGroups = AssociationList([self])
+            else:
+                r._ChildCUGroups.add(self)
         self._ParentCUGroups = value
 
     ParentCUGroups = property(getParentCUGroups, setParentCUGroups)
 
     def addParentCUGroups(self, *ParentCUGroups):
         for obj in ParentCUGroups:
-            if self not in obj._ChildCUGroups:
-                obj._ChildCUGroups.append(self)
-            self._ParentCUGroups.append(obj)
+            if obj._ChildCUGroups is EMPTY:
+                obj._ChildCUGroups = AssociationList([self])
+            else:
+                obj._ChildCUGroups.add(self)
+            if self._ParentCUGroups is EMPTY:
+                self._ParentCUGroups = AssociationList([obj])
+            else:
+                self._ParentCUGroups.add(obj)
 
     def removeParentCUGroups(self, *ParentCUGroups):
         for obj in ParentCUGroups:
@@ -109,21 +122,28 @@ class CUGroup(IdentifiedObject):
         return self._ChildCUGroups
 
     def setChildCUGroups(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ChildCUGroups:
-            filtered = [q for q in p.ParentCUGroups if q != self]
-            self._ChildCUGroups._ParentCUGroups = filtered
+            p._ParentCUGroups.discard(self)
         for r in value:
-            if self not in r._ParentCUGroups:
-                r._ParentCUGroups.append(self)
+            if r._ParentCUGroups is EMPTY:
+                r._ParentCUGroups = AssociationList([self])
+            else:
+                r._ParentCUGroups.add(self)
         self._ChildCUGroups = value
 
     ChildCUGroups = property(getChildCUGroups, setChildCUGroups)
 
     def addChildCUGroups(self, *ChildCUGroups):
         for obj in ChildCUGroups:
-            if self not in obj._ParentCUGroups:
-                obj._ParentCUGroups.append(self)
-            self._ChildCUGroups.append(obj)
+            if obj._ParentCUGroups is EMPTY:
+                obj._ParentCUGroups = AssociationList([self])
+            else:
+                obj._ParentCUGroups.add(self)
+            if self._ChildCUGroups is EMPTY:
+                self._ChildCUGroups = AssociationList([obj])
+            else:
+                self._ChildCUGroups.add(obj)
 
     def removeChildCUGroups(self, *ChildCUGroups):
         for obj in ChildCUGroups:
@@ -138,21 +158,28 @@ class CUGroup(IdentifiedObject):
         return self._DesignLocationCUs
 
     def setDesignLocationCUs(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._DesignLocationCUs:
-            filtered = [q for q in p.CUGroups if q != self]
-            self._DesignLocationCUs._CUGroups = filtered
+            p._CUGroups.discard(self)
         for r in value:
-            if self not in r._CUGroups:
-                r._CUGroups.append(self)
+            if r._CUGroups is EMPTY:
+                r._CUGroups = AssociationList([self])
+            else:
+                r._CUGroups.add(self)
         self._DesignLocationCUs = value
 
     DesignLocationCUs = property(getDesignLocationCUs, setDesignLocationCUs)
 
     def addDesignLocationCUs(self, *DesignLocationCUs):
         for obj in DesignLocationCUs:
-            if self not in obj._CUGroups:
-                obj._CUGroups.append(self)
-            self._DesignLocationCUs.append(obj)
+            if obj._CUGroups is EMPTY:
+                obj._CUGroups = AssociationList([self])
+            else:
+                obj._CUGroups.add(self)
+            if self._DesignLocationCUs is EMPTY:
+                self._DesignLocationCUs = AssociationList([obj])
+            else:
+                self._DesignLocationCUs.add(obj)
 
     def removeDesignLocationCUs(self, *DesignLocationCUs):
         for obj in DesignLocationCUs:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class CULaborCode(IdentifiedObject):
     """Labor code associated with various compatible unit labor items.Labor code associated with various compatible unit labor items.
@@ -34,8 +35,9 @@ class CULaborCode(IdentifiedObject):
         #: Labor code.
         self.code = code
 
-        self._CULaborItems = []
-        self.CULaborItems = [] if CULaborItems is None else CULaborItems
+        self._CULaborItems = EMPTY
+        if CULaborItems is not None:
+            self.CULaborItems = CULaborItems
 
         self.status = status
 
@@ -53,6 +55,7 @@ class CULaborCode(IdentifiedObject):
         return self._CULaborItems
 
     def setCULaborItems(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._CULaborItems:
             x.CULaborCode = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class CULaborItem(IdentifiedObject):
     """Compatible unit labor item.Compatible unit labor item.
@@ -44,16 +45,18 @@ class CULaborItem(IdentifiedObject):
         #: Activity code identifies a specific and distinguishable unit of work.
         self.activityCode = activityCode
 
-        self._CompatibleUnits = []
-        self.CompatibleUnits = [] if CompatibleUnits is None else CompatibleUnits
+        self._CompatibleUnits = EMPTY
+        if CompatibleUnits is not None:
+            self.CompatibleUnits = CompatibleUnits
 
         self._CULaborCode = None
         self.CULaborCode = CULaborCode
 
         self.status = status
 
-        self._QualificationRequirements = []
-        self.QualificationRequirements = [] if QualificationRequirements is None else QualificationRequirements
+        self._QualificationRequirements = EMPTY
+        if QualificationRequirements is not None:
+            self.QualificationRequirements = QualificationRequirements
 
         super(CULaborItem, self).__init__(*args, **kw_args)
 
@@ -69,21 +72,28 @@ class CULaborItem(IdentifiedObject):
         return self._CompatibleUnits
 
     def setCompatibleUnits(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._CompatibleUnits:
-            filtered = [q for q in p.CULaborItems if q != self]
-            self._CompatibleUnits._CULaborItems = filtered
+            p._CULaborItems.discard(self)
         for r in value:
-            if self not in r._CULaborItems:
-                r._CULaborItems.append(self)
+            if r._CULaborItems is EMPTY:
+                r._CULaborItems = AssociationList([self])
+            else:
+                r._CULaborItems.add(self)
         self._CompatibleUnits = value
 
     CompatibleUnits = property(getCompatibleUnits, setCompatibleUnits)
 
     def addCompatibleUnits(self, *CompatibleUnits):
         for obj in CompatibleUnits:
-            if self not in obj._CULaborItems:
-                obj._CULaborItems.append(self)
-            self._CompatibleUnits.append(obj)
+            if obj._CULaborItems is EMPTY:
+                obj._CULaborItems = AssociationList([self])
+            else:
+                obj._CULaborItems.add(self)
+            if self._CompatibleUnits is EMPTY:
+                self._CompatibleUnits = AssociationList([obj])
+            else:
+                self._CompatibleUnits.add(obj)
 
     def removeCompatibleUnits(self, *CompatibleUnits):
         for obj in CompatibleUnits:
@@ -97,13 +107,14 @@ class CULaborItem(IdentifiedObject):
 
     def setCULaborCode(self, value):
         if self._CULaborCode is not None:
-            filtered = [x for x in self.CULaborCode.CULaborItems if x != self]
-            self._CULaborCode._CULaborItems = filtered
+            self._CULaborCode._CULaborItems.discard(self)
 
         self._CULaborCode = value
         if self._CULaborCode is not None:
-            if self not in self._CULaborCode._CULaborItems:
-                self._CULaborCode._CULaborItems.append(self)
+            if self._CULaborCode._CULaborItems is EMPTY:
+                self._CULaborCode._CULaborItems = AssociationList([self])
+            else:
+                self._CULaborCode._CULaborItems.add(self)
 
     CULaborCode = property(getCULaborCode, setCULaborCode)
 
@@ -114,21 +125,28 @@ class CULaborItem(IdentifiedObject):
         return self._QualificationRequirements
 
     def setQualificationRequirements(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._QualificationRequirements:
-            filtered = [q for q in p.CULaborItems if q != self]
-            self._QualificationRequirements._CULaborItems = filtered
+            p._CULaborItems.discard(self)
         for r in value:
-            if self not in r._CULaborItems:
-                r._CULaborItems.append(self)
+            if r._CULaborItems is EMPTY:
+                r._CULaborItems = AssociationList([self])
+            else:
+                r._CULaborItems.add(self)
         self._QualificationRequirements = value
 
     QualificationRequirements = property(getQualificationRequirements, setQualificationRequirements)
 
     def addQualificationRequirements(self, *QualificationRequirements):
         for obj in QualificationRequirements:
-            if self not in obj._CULaborItems:
-                obj._CULaborItems.append(self)
-            self._QualificationRequirements.append(obj)
+            if obj._CULaborItems is EMPTY:
+                obj._CULaborItems = AssociationList([self])
+            else:
+                obj._CULaborItems.add(self)
+            if self._QualificationRequirements is EMPTY:
+                self._QualificationRequirements = AssociationList([obj])
+            else:
+                self._QualificationRequirements.add(obj)
 
     def removeQualificationRequirements(self, *QualificationRequirements):
         for obj in QualificationRequirements:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class CUMaterialItem(IdentifiedObject):
     """Compatible unit of a consumable supply item. For example, nuts, bolts, brackets, glue, etc.Compatible unit of a consumable supply item. For example, nuts, bolts, brackets, glue, etc.
@@ -42,11 +43,13 @@ class CUMaterialItem(IdentifiedObject):
 
         self.status = status
 
-        self._PropertyUnits = []
-        self.PropertyUnits = [] if PropertyUnits is None else PropertyUnits
+        self._PropertyUnits = EMPTY
+        if PropertyUnits is not None:
+            self.PropertyUnits = PropertyUnits
 
-        self._CompatibleUnits = []
-        self.CompatibleUnits = [] if CompatibleUnits is None else CompatibleUnits
+        self._CompatibleUnits = EMPTY
+        if CompatibleUnits is not None:
+            self.CompatibleUnits = CompatibleUnits
 
         self._TypeMaterial = None
         self.TypeMaterial = TypeMaterial
@@ -67,21 +70,28 @@ class CUMaterialItem(IdentifiedObject):
         return self._PropertyUnits
 
     def setPropertyUnits(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._PropertyUnits:
-            filtered = [q for q in p.CUMaterialItems if q != self]
-            self._PropertyUnits._CUMaterialItems = filtered
+            p._CUMaterialItems.discard(self)
         for r in value:
-            if self not in r._CUMaterialItems:
-                r._CUMaterialItems.append(self)
+            if r._CUMaterialItems is EMPTY:
+                r._CUMaterialItems = AssociationList([self])
+            else:
+                r._CUMaterialItems.add(self)
         self._PropertyUnits = value
 
     PropertyUnits = property(getPropertyUnits, setPropertyUnits)
 
     def addPropertyUnits(self, *PropertyUnits):
         for obj in PropertyUnits:
-            if self not in obj._CUMaterialItems:
-                obj._CUMaterialItems.append(self)
-            self._PropertyUnits.append(obj)
+            if obj._CUMaterialItems is EMPTY:
+                obj._CUMaterialItems = AssociationList([self])
+            else:
+                obj._CUMaterialItems.add(self)
+            if self._PropertyUnits is EMPTY:
+                self._PropertyUnits = AssociationList([obj])
+            else:
+                self._PropertyUnits.add(obj)
 
     def removePropertyUnits(self, *PropertyUnits):
         for obj in PropertyUnits:
@@ -94,21 +104,28 @@ class CUMaterialItem(IdentifiedObject):
         return self._CompatibleUnits
 
     def setCompatibleUnits(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._CompatibleUnits:
-            filtered = [q for q in p.CUMaterialItems if q != self]
-            self._CompatibleUnits._CUMaterialItems = filtered
+            p._CUMaterialItems.discard(self)
         for r in value:
-            if self not in r._CUMaterialItems:
-                r._CUMaterialItems.append(self)
+            if r._CUMaterialItems is EMPTY:
+                r._CUMaterialItems = AssociationList([self])
+            else:
+                r._CUMaterialItems.add(self)
         self._CompatibleUnits = value
 
     CompatibleUnits = property(getCompatibleUnits, setCompatibleUnits)
 
     def addCompatibleUnits(self, *CompatibleUnits):
         for obj in CompatibleUnits:
-            if self not in obj._CUMaterialItems:
-                obj._CUMaterialItems.append(self)
-            self._CompatibleUnits.append(obj)
+            if obj._CUMaterialItems is EMPTY:
+                obj._CUMaterialItems = AssociationList([self])
+            else:
+                obj._CUMaterialItems.add(self)
+            if self._CompatibleUnits is EMPTY:
+                self._CompatibleUnits = AssociationList([obj])
+            else:
+                self._CompatibleUnits.add(obj)
 
     def removeCompatibleUnits(self, *CompatibleUnits):
         for obj in CompatibleUnits:
@@ -122,13 +139,14 @@ class CUMaterialItem(IdentifiedObject):
 
     def setTypeMaterial(self, value):
         if self._TypeMaterial is not None:
-            filtered = [x for x in self.TypeMaterial.CUMaterialItems if x != self]
-            self._TypeMaterial._CUMaterialItems = filtered
+            self._TypeMaterial._CUMaterialItems.discard(self)
 
         self._TypeMaterial = value
         if self._TypeMaterial is not None:
-            if self not in self._TypeMaterial._CUMaterialItems:
-                self._TypeMaterial._CUMaterialItems.append(self)
+            if self._TypeMaterial._CUMaterialItems is EMPTY:
+                self._TypeMaterial._CUMaterialItems = AssociationList([self])
+            else:
+                self._TypeMaterial._CUMaterialItems.add(self)
 
     TypeMaterial = property(getTypeMaterial, setTypeMaterial)
 
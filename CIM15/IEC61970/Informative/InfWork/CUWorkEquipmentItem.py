@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class CUWorkEquipmentItem(IdentifiedObject):
     """Compatible unit for various types of WorkEquipmentAssets, including vehicles.Compatible unit for various types of WorkEquipmentAssets, including vehicles.
@@ -44,8 +45,9 @@ class CUWorkEquipmentItem(IdentifiedObject):
 
         self.status = status
 
-        self._CompatibleUnits = []
-        self.CompatibleUnits = [] if CompatibleUnits is None else CompatibleUnits
+        self._CompatibleUnits = EMPTY
+        if CompatibleUnits is not None:
+            self.CompatibleUnits = CompatibleUnits
 
         super(CUWorkEquipmentItem, self).__init__(*args, **kw_args)
 
@@ -78,21 +80,28 @@ class CUWorkEquipmentItem(IdentifiedObject):
         return self._CompatibleUnits
 
     def setCompatibleUnits(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._CompatibleUnits:
-            filtered = [q for q in p.CUWorkEquipmentItems if q != self]
-            self._CompatibleUnits._CUWorkEquipmentItems = filtered
+            p._CUWorkEquipmentItems.discard(self)
         for r in value:
-            if self not in r._CUWorkEquipmentItems:
-                r._CUWorkEquipmentItems.append(self)
+            if r._CUWorkEquipmentItems is EMPTY:
+                r._CUWorkEquipmentItems = AssociationList([self])
+            else:
+                r._CUWorkEquipmentItems.add(self)
         self._CompatibleUnits = value
 
     CompatibleUnits = property(getCompatibleUnits, setCompatibleUnits)
 
     def addCompatibleUnits(self, *CompatibleUnits):
         for obj in CompatibleUnits:
-            if self not in obj._CUWorkEquipmentItems:
-                obj._CUWorkEquipmentItems.append(self)
-            self._CompatibleUnits.append(obj)
+            if obj._CUWorkEquipmentItems is EMPTY:
+                obj._CUWorkEquipmentItems = AssociationList([self])
+            else:
+                obj._CUWorkEquipmentItems.add(self)
+            if self._CompatibleUnits is EMPTY:
+                self._CompatibleUnits = AssociationList([obj])
+            else:
+                self._CompatibleUnits.add(obj)
 
     def removeCompatibleUnits(self, *CompatibleUnits):
         for obj in CompatibleUnits:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class Capability(IdentifiedObject):
     """Capabilities of a crew.Capabilities of a crew.
@@ -44,13 +45,15 @@ class Capability(IdentifiedObject):
         self._Crew = None
         self.Crew = Crew
 
-        self._WorkTasks = []
-        self.WorkTasks = [] if WorkTasks is None else WorkTasks
+        self._WorkTasks = EMPTY
+        if WorkTasks is not None:
+            self.WorkTasks = WorkTasks
 
         self.status = status
 
-        self._Crafts = []
-        self.Crafts = [] if Crafts is None else Crafts
+        self._Crafts = EMPTY
+        if Crafts is not None:
+            self.Crafts = Crafts
 
         self.validityInterval = validityInterval
 
@@ -69,13 +72,14 @@ class Capability(IdentifiedObject):
 
     def setCrew(self, value):
         if self._Crew is not None:
-            filtered = [x for x in self.Crew.Capabilities if x != self]
-            self._Crew._Capabilities = filtered
+            self._Crew._Capabilities.discard(self)
 
         self._Crew = value
         if self._Crew is not None:
-            if self not in self._Crew._Capabilities:
-                self._Crew._Capabilities.append(self)
+            if self._Crew._Capabilities is EMPTY:
+                self._Crew._Capabilities = AssociationList([self])
+            else:
+                self._Crew._Capabilities.add(self)
 
     Crew = property(getCrew, setCrew)
 
@@ -84,21 +88,28 @@ class Capability(IdentifiedObject):
         return self._WorkTasks
 
     def setWorkTasks(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._WorkTasks:
-            filtered = [q for q in p.Capabilities if q != self]
-            self._WorkTasks._Capabilities = filtered
+            p._Capabilities.discard(self)
         for r in value:
-            if self not in r._Capabilities:
-                r._Capabilities.append(self)
+            if r._Capabilities is EMPTY:
+                r._Capabilities = AssociationList([self])
+            else:
+                r._Capabilities.add(self)
         self._WorkTasks = value
 
     WorkTasks = property(getWorkTasks, setWorkTasks)
 
     def addWorkTasks(self, *WorkTasks):
         for obj in WorkTasks:
-            if self not in obj._Capabilities:
-                obj._Capabilities.append(self)
-            self._WorkTasks.append(obj)
+            if obj._Capabilities is EMPTY:
+                obj._Capabilities = AssociationList([self])
+            else:
+                obj._Capabilities.add(self)
+            if self._WorkTasks is EMPTY:
+                self._WorkTasks = AssociationList([obj])
+            else:
+                self._WorkTasks.add(obj)
 
     def removeWorkTasks(self, *WorkTasks):
         for obj in WorkTasks:
@@ -113,21 +124,28 @@ class Capability(IdentifiedObject):
         return self._Crafts
 
     def setCrafts(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Crafts:
-            filtered = [q for q in p.Capabilities if q != self]
-            self._Crafts._Capabilities = filtered
+            p._Capabilities.discard(self)
         for r in value:
-            if self not in r._Capabilities:
-                r._Capabilities.append(self)
+            if r._Capabilities is EMPTY:
+                r._Capabilities = AssociationList([self])
+            else:
+                r._Capabilities.add(self)
         self._Crafts = value
 
     Crafts = property(getCrafts, setCrafts)
 
     def addCrafts(self, *Crafts):
         for obj in Crafts:
-            if self not in obj._Capabilities:
-                obj._Capabilities.append(self)
-            self._Crafts.append(obj)
+            if obj._Capabilities is EMPTY:
+                obj._Capabilities = AssociationList([self])
+            else:
+                obj._Capabilities.add(self)
+            if self._Crafts is EMPTY:
+                self._Crafts = AssociationList([obj])
+            else:
+                self._Crafts.add(obj)
 
     def removeCrafts(self, *Crafts):
         for obj in Crafts:
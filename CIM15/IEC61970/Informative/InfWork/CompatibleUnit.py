@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import AssociationList, EMPTY
 
 class CompatibleUnit(Document):
     """A pre-planned job model containing labor, material, and accounting requirements for standardized job planning.A pre-planned job model containing labor, material, and accounting requirements for standardized job planning.
@@ -47,17 +48,20 @@ class CompatibleUnit(Document):
         #: Estimated total cost for perfoming CU.
         self.estCost = estCost
 
-        self._CUWorkEquipmentItems = []
-        self.CUWorkEquipmentItems = [] if CUWorkEquipmentItems is None else CUWorkEquipmentItems
+        self._CUWorkEquipmentItems = EMPTY
+        if CUWorkEquipmentItems is not None:
+            self.CUWorkEquipmentItems = CUWorkEquipmentItems
 
-        self._DesignLocationCUs = []
-        self.DesignLocationCUs = [] if DesignLocationCUs is None else DesignLocationCUs
+        self._DesignLocationCUs = EMPTY
+        if DesignLocationCUs is not None:
+            self.DesignLocationCUs = DesignLocationCUs
 
         self._CUGroup = None
         self.CUGroup = CUGroup
 
-        self._CUAssets = []
-        self.CUAssets = [] if CUAssets is None else CUAssets
+        self._CUAssets = EMPTY
+        if CUAssets is not None:
+            self.CUAssets = CUAssets
 
         self._PropertyUnit = None
         self.PropertyUnit = PropertyUnit
@@ -68,17 +72,21 @@ class CompatibleUnit(Document):
         self._CUAllowableAction = None
         self.CUAllowableAction = CUAllowableAction
 
-        self._Procedures = []
-        self.Procedures = [] if Procedures is None else Procedures
+        self._Procedures = EMPTY
+        if Procedures is not None:
+            self.Procedures = Procedures
 
-        self._CUContractorItems = []
-        self.CUContractorItems = [] if CUContractorItems is None else CUContractorItems
+        self._CUContractorItems = EMPTY
+        if CUContractorItems is not None:
+            self.CUContractorItems = CUContractorItems
 
-        self._CUMaterialItems = []
-        self.CUMaterialItems = [] if CUMaterialItems is None else CUMaterialItems
+        self._CUMaterialItems = EMPTY
+        if CUMaterialItems is not None:
+            self.CUMaterialItems = CUMaterialItems
 
-        self._CULaborItems = []
-        self.CULaborItems = [] if CULaborItems is None else CULaborItems
+        self._CULaborItems = EMPTY
+        if CULaborItems is not None:
+            self.CULaborItems = CULaborItems
 
         super(CompatibleUnit, self).__init__(*args, **kw_args)
 
@@ -94,21 +102,28 @@ class CompatibleUnit(Document):
         return self._CUWorkEquipmentItems
 
     def setCUWorkEquipmentItems(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._CUWorkEquipmentItems:
-            filtered = [q for q in p.CompatibleUnits if q != self]
-            self._CUWorkEquipmentItems._CompatibleUnits = filtered
+            p._CompatibleUnits.discard(self)
         for r in value:
-            if self not in r._CompatibleUnits:
-                r._CompatibleUnits.append(self)
+            if r._CompatibleUnits is EMPTY:
+                r._CompatibleUnits = AssociationList([self])
+            else:
+                r._CompatibleUnits.add(self)
         self._CUWorkEquipmentItems = value
 
     CUWorkEquipmentItems = property(getCUWorkEquipmentItems, setCUWorkEquipmentItems)
 
     def addCUWorkEquipmentItems(self, *CUWorkEquipmentItems):
         for obj in CUWorkEquipmentItems:
-            if self not in obj._CompatibleUnits:
-                obj._CompatibleUnits.append(self)
-            self._CUWorkEquipmentItems.append(obj)
+            if obj._CompatibleUnits is EMPTY:
+                obj._CompatibleUnits = AssociationList([self])
+            else:
+                obj._CompatibleUnits.add(self)
+            if self._CUWorkEquipmentItems is EMPTY:
+                self._CUWorkEquipmentItems = AssociationList([obj])
+            else:
+                self._CUWorkEquipmentItems.add(obj)
 
     def removeCUWorkEquipmentItems(self, *CUWorkEquipmentItems):
         for obj in CUWorkEquipmentItems:
@@ -121,21 +136,28 @@ class CompatibleUnit(Document):
         return self._DesignLocationCUs
 
     def setDesignLocationCUs(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._DesignLocationCUs:
-            filtered = [q for q in p.CompatibleUnits if q != self]
-            self._DesignLocationCUs._CompatibleUnits = filtered
+            p._CompatibleUnits.discard(self)
         for r in value:
-            if self not in r._CompatibleUnits:
-                r._CompatibleUnits.append(self)
+            if r._CompatibleUnits is EMPTY:
+                r._CompatibleUnits = AssociationList([self])
+            else:
+                r._CompatibleUnits.add(self)
         self._DesignLocationCUs = value
 
     DesignLocationCUs = property(getDesignLocationCUs, setDesignLocationCUs)
 
     def addDesignLocationCUs(self, *DesignLocationCUs):
         for obj in DesignLocationCUs:
-            if self not in obj._CompatibleUnits:
-                obj._CompatibleUnits.append(self)
-            self._DesignLocationCUs.append(obj)
+            if obj._CompatibleUnits is EMPTY:
+                obj._CompatibleUnits = AssociationList([self])
+            else:
+                obj._CompatibleUnits.add(self)
+            if self._DesignLocationCUs is EMPTY:
+                self._DesignLocationCUs = AssociationList([obj])
+            else:
+                self._DesignLocationCUs.add(obj)
 
     def removeDesignLocationCUs(self, *DesignLocationCUs):
         for obj in DesignLocationCUs:
@@ -149,13 +171,14 @@ class CompatibleUnit(Document):
 
     def setCUGroup(self, value):
         if self._CUGroup is not None:
-            filtered = [x for x in self.CUGroup.CompatibleUnits if x != self]
-            self._CUGroup._CompatibleUnits = filtered
+            self._CUGroup._CompatibleUnits.discard(self)
 
         self._CUGroup = value
         if self._CUGroup is not None:
-            if self not in self._CUGroup._CompatibleUnits:
-                self._CUGroup._CompatibleUnits.append(self)
+            if self._CUGroup._CompatibleUnits is EMPTY:
+                self._CUGroup._CompatibleUnits = AssociationList([self])
+            else:
+                self._CUGroup._CompatibleUnits.add(self)
 
     CUGroup = property(getCUGroup, setCUGroup)
 
@@ -164,21 +187,28 @@ class CompatibleUnit(Document):
         return self._CUAssets
 
     def setCUAssets(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._CUAssets:
-            filtered = [q for q in p.CompatibleUnits if q != self]
-            self._CUAssets._CompatibleUnits = filtered
+            p._CompatibleUnits.discard(self)
         for r in value:
-            if self not in r._CompatibleUnits:
-                r._CompatibleUnits.append(self)
+            if r._CompatibleUnits is EMPTY:
+                r._CompatibleUnits = AssociationList([self])
+            else:
+                r._CompatibleUnits.add(self)
         self._CUAssets = value
 
     CUAssets = property(getCUAssets, setCUAssets)
 
     def addCUAssets(self, *CUAssets):
         for obj in CUAssets:
-            if self not in obj._CompatibleUnits:
-                obj._CompatibleUnits.append(self)
-            self._CUAssets.append(obj)
+            if obj._CompatibleUnits is EMPTY:
+                obj._CompatibleUnits = AssociationList([self])
+            else:
+                obj._CompatibleUnits.add(self)
+            if self._CUAssets is EMPTY:
+                self._CUAssets = AssociationList([obj])
+            else:
+                self._CUAssets.add(obj)
 
     def removeCUAssets(self, *CUAssets):
         for obj in CUAssets:
@@ -192,13 +222,14 @@ class CompatibleUnit(Document):
 
     def setPropertyUnit(self, value):
         if self._PropertyUnit is not None:
-            filtered = [x for x in self.PropertyUnit.CompatibleUnits if x != self]
-            self._PropertyUnit._CompatibleUnits = filtered
+            self._PropertyUnit._CompatibleUnits.discard(self)
 
         self._PropertyUnit = value
         if self._PropertyUnit is not None:
-            if self not in self._PropertyUnit._CompatibleUnits:
-                self._PropertyUnit._CompatibleUnits.append(self)
+            if self._PropertyUnit._CompatibleUnits is EMPTY:
+                self._PropertyUnit._CompatibleUnits = AssociationList([self])
+            else:
+                self._PropertyUnit._CompatibleUnits.add(self)
 
     PropertyUnit = property(getPropertyUnit, setPropertyUnit)
 
@@ -208,13 +239,14 @@ class CompatibleUnit(Document):
 
     def setCostType(self, value):
         if self._CostType is not None:
-            filtered = [x for x in self.CostType.CompatibleUnits if x != self]
-            self._CostType._CompatibleUnits = filtered
+            self._CostType._CompatibleUnits.discard(self)
 
         self._CostType = value
         if self._CostType is not None:
-            if self not in self._CostType._CompatibleUnits:
-                self._CostType._CompatibleUnits.append(self)
+            if self._CostType._CompatibleUnits is EMPTY:
+                self._CostType._CompatibleUnits = AssociationList([self])
+            else:
+                self._CostType._CompatibleUnits.add(self)
 
     CostType = property(getCostType, setCostType)
 
@@ -224,13 +256,14 @@ class CompatibleUnit(Document):
 
     def setCUAllowableAction(self, value):
         if self._CUAllowableAction is not None:
-            filtered = [x for x in self.CUAllowableAction.CompatibleUnits if x != self]
-            self._CUAllowableAction._CompatibleUnits = filtered
+            self._CUAllowableAction._CompatibleUnits.discard(self)
 
         self._CUAllowableAction = value
         if self._CUAllowableAction is not None:
-            if self not in self._CUAllowableAction._CompatibleUnits:
-                self._CUAllowableAction._CompatibleUnits.append(self)
+            if self._CUAllowableAction._CompatibleUnits is EMPTY:
+                self._CUAllowableAction._CompatibleUnits = AssociationList([self])
+            else:
+                self._CUAllowableAction._CompatibleUnits.add(self)
 
     CUAllowableAction = property(getCUAllowableAction, setCUAllowableAction)
 
@@ -239,21 +272,28 @@ class CompatibleUnit(Document):
         return self._Procedures
 
     def setProcedures(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Procedures:
-            filtered = [q for q in p.CompatibleUnits if q != self]
-            self._Procedures._CompatibleUnits = filtered
+            p._CompatibleUnits.discard(self)
         for r in value:
-            if self not in r._CompatibleUnits:
-                r._CompatibleUnits.append(self)
+            if r._CompatibleUnits is EMPTY:
+                r._CompatibleUnits = AssociationList([self])
+            else:
+                r._CompatibleUnits.add(self)
         self._Procedures = value
 
     Procedures = property(getProcedures, setProcedures)
 
     def addProcedures(self, *Procedures):
         for obj in Procedures:
-            if self not in obj._CompatibleUnits:
-                obj._CompatibleUnits.append(self)
-            self._Procedures.append(obj)
+            if obj._CompatibleUnits is EMPTY:
+                obj._CompatibleUnits = AssociationList([self])
+            else:
+                obj._CompatibleUnits.add(self)
+            if self._Procedures is EMPTY:
+                self._Procedures = AssociationList([obj])
+            else:
+                self._Procedures.add(obj)
 
     def removeProcedures(self, *Procedures):
         for obj in Procedures:
@@ -266,21 +306,28 @@ class CompatibleUnit(Document):
         return self._CUContractorItems
 
     def setCUContractorItems(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._CUContractorItems:
-            filtered = [q for q in p.CompatibleUnits if q != self]
-            self._CUContractorItems._CompatibleUnits = filtered
+            p._CompatibleUnits.discard(self)
         for r in value:
-            if self not in r._CompatibleUnits:
-                r._CompatibleUnits.append(self)
+            if r._CompatibleUnits is EMPTY:
+                r._CompatibleUnits = AssociationList([self])
+            else:
+                r._CompatibleUnits.add(self)
         self._CUContractorItems = value
 
     CUContractorItems = property(getCUContractorItems, setCUContractorItems)
 
     def addCUContractorItems(self, *CUContractorItems):
         for obj in CUContractorItems:
-            if self not in obj._CompatibleUnits:
-                obj._CompatibleUnits.append(self)
-            self._CUContractorItems.append(obj)
+            if obj._CompatibleUnits is EMPTY:
+                obj._CompatibleUnits = AssociationList([self])
+            else:
+                obj._CompatibleUnits.add(self)
+            if self._CUContractorItems is EMPTY:
+                self._CUContractorItems = AssociationList([obj])
+            else:
+                self._CUContractorItems.add(obj)
 
     def removeCUContractorItems(self, *CUContractorItems):
         for obj in CUContractorItems:
@@ -293,21 +340,28 @@ class CompatibleUnit(Document):
         return self._CUMaterialItems
 
     def setCUMaterialItems(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._CUMaterialItems:
-            filtered = [q for q in p.CompatibleUnits if q != self]
-            self._CUMaterialItems._CompatibleUnits = filtered
+            p._CompatibleUnits.discard(self)
         for r in value:
-            if self not in r._CompatibleUnits:
-                r._CompatibleUnits.append(self)
+            if r._CompatibleUnits is EMPTY:
+                r._CompatibleUnits = AssociationList([self])
+            else:
+                r._CompatibleUnits.add(self)
         self._CUMaterialItems = value
 
     CUMaterialItems = property(getCUMaterialItems, setCUMaterialItems)
 
     def addCUMaterialItems(self, *CUMaterialItems):
         for obj in CUMaterialItems:
-            if self not in obj._CompatibleUnits:
-                obj._CompatibleUnits.append(self)
-            self._CUMaterialItems.append(obj)
+            if obj._CompatibleUnits is EMPTY:
+                obj._CompatibleUnits = AssociationList([self])
+            else:
+                obj._CompatibleUnits.add(self)
+            if self._CUMaterialItems is EMPTY:
+                self._CUMaterialItems = AssociationList([obj])
+            else:
+                self._CUMaterialItems.add(obj)
 
     def removeCUMaterialItems(self, *CUMaterialItems):
         for obj in CUMaterialItems:
@@ -320,21 +374,28 @@ class CompatibleUnit(Document):
         return self._CULaborItems
 
     def setCULaborItems(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._CULaborItems:
-            filtered = [q for q in p.CompatibleUnits if q != self]
-            self._CULaborItems._CompatibleUnits = filtered
+            p._CompatibleUnits.discard(self)
         for r in value:
-            if self not in r._CompatibleUnits:
-                r._CompatibleUnits.append(self)
+            if r._CompatibleUnits is EMPTY:
+                r._CompatibleUnits = AssociationList([self])
+            else:
+                r._CompatibleUnits.add(self)
         self._CULaborItems = value
 
     CULaborItems = property(getCULaborItems, setCULaborItems)
 
     def addCULaborItems(self, *CULaborItems):
         for obj in CULaborItems:
-            if self not in obj._CompatibleUnits:
-                obj._CompatibleUnits.append(self)
-            self._CULaborItems.append(obj)
+            if obj._CompatibleUnits is EMPTY:
+                obj._CompatibleUnits = AssociationList([self])
+            else:
+                obj._CompatibleUnits.add(self)
+            if self._CULaborItems is EMPTY:
+                self._CULaborItems = AssociationList([obj])
+            else:
+                self._CULaborItems.add(obj)
 
     def removeCULaborItems(self, *CULaborItems):
         for obj in CULaborItems:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class ConditionFactor(IdentifiedObject):
     """This is to specify the various condition factors for a design that may alter the cost estimate or the allocation.This is to specify the various condition factors for a design that may alter the cost estimate or the allocation.
@@ -40,16 +41,19 @@ class ConditionFactor(IdentifiedObject):
         #: The actual value of the condition factor, such as labor flat fee or percentage.
         self.cfValue = cfValue
 
-        self._Designs = []
-        self.Designs = [] if Designs is None else Designs
+        self._Designs = EMPTY
+        if Designs is not None:
+            self.Designs = Designs
 
-        self._DesignLocations = []
-        self.DesignLocations = [] if DesignLocations is None else DesignLocations
+        self._DesignLocations = EMPTY
+        if DesignLocations is not None:
+            self.DesignLocations = DesignLocations
 
         self.status = status
 
-        self._DesignLocationCUs = []
-        self.DesignLocationCUs = [] if DesignLocationCUs is None else DesignLocationCUs
+        self._DesignLocationCUs = EMPTY
+        if DesignLocationCUs is not None:
+            self.DesignLocationCUs = DesignLocationCUs
 
         super(ConditionFactor, self).__init__(*args, **kw_args)
 
@@ -65,21 +69,28 @@ class ConditionFactor(IdentifiedObject):
         return self._Designs
 
     def setDesigns(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Designs:
-            filtered = [q for q in p.ConditionFactors if q != self]
-            self._Designs._ConditionFactors = filtered
+            p._ConditionFactors.discard(self)
         for r in value:
-            if self not in r._ConditionFactors:
-                r._ConditionFactors.append(self)
+            if r._ConditionFactors is EMPTY:
+                r._ConditionFactors = AssociationList([self])
+            else:
+                r._ConditionFactors.add(self)
         self._Designs = value
 
     Designs = property(getDesigns, setDesigns)
 
     def addDesigns(self, *Designs):
         for obj in Designs:
-            if self not in obj._ConditionFactors:
-                obj._ConditionFactors.append(self)
-            self._Designs.append(obj)
+            if obj._ConditionFactors is EMPTY:
+                obj._ConditionFactors = AssociationList([self])
+            else:
+                obj._ConditionFactors.add(self)
+            if self._Designs is EMPTY:
+                self._Designs = AssociationList([obj])
+            else:
+                self._Designs.add(obj)
 
     def removeDesigns(self, *Designs):
         for obj in Designs:
@@ -92,21 +103,28 @@ class ConditionFactor(IdentifiedObject):
         return self._DesignLocations
 
     def setDesignLocations(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._DesignLocations:
-            filtered = [q for q in p.ConditionFactors if q != self]
-            self._DesignLocations._ConditionFactors = filtered
+            p._ConditionFactors.discard(self)
         for r in value:
-            if self not in r._ConditionFactors:
-                r._ConditionFactors.append(self)
+            if r._ConditionFactors is EMPTY:
+                r._ConditionFactors = AssociationList([self])
+            else:
+                r._ConditionFactors.add(self)
         self._DesignLocations = value
 
     DesignLocations = property(getDesignLocations, setDesignLocations)
 
     def addDesignLocations(self, *DesignLocations):
         for obj in DesignLocations:
-            if self not in obj._ConditionFactors:
-                obj._ConditionFactors.append(self)
-            self._DesignLocations.append(obj)
+            if obj._ConditionFactors is EMPTY:
+                obj._ConditionFactors = AssociationList([self])
+            else:
+                obj._ConditionFactors.add(self)
+            if self._DesignLocations is EMPTY:
+                self._DesignLocations = AssociationList([obj])
+            else:
+                self._DesignLocations.add(obj)
 
     def removeDesignLocations(self, *DesignLocations):
         for obj in DesignLocations:
@@ -121,21 +139,28 @@ class ConditionFactor(IdentifiedObject):
         return self._DesignLocationCUs
 
     def setDesignLocationCUs(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._DesignLocationCUs:
-            filtered = [q for q in p.ConditionFactors if q != self]
-            self._DesignLocationCUs._ConditionFactors = filtered
+            p._ConditionFactors.discard(self)
         for r in value:
-            if self not in r._ConditionFactors:
-                r._ConditionFactors.append(self)
+            if r._ConditionFactors is EMPTY:
+                r._ConditionFactors = AssociationList([self])
+            else:
+                r._ConditionFactors.add(self)
         self._DesignLocationCUs = value
 
     DesignLocationCUs = property(getDesignLocationCUs, setDesignLocationCUs)
 
     def addDesignLocationCUs(self, *DesignLocationCUs):
         for obj in DesignLocationCUs:
-            if self not in obj._ConditionFactors:
-                obj._ConditionFactors.append(self)
-            self._DesignLocationCUs.append(obj)
+            if obj._ConditionFactors is EMPTY:
+                obj._ConditionFactors = AssociationList([self])
+            else:
+                obj._ConditionFactors.add(self)
+            if self._DesignLocationCUs is EMPTY:
+                self._DesignLocationCUs = AssociationList([obj])
+            else:
+                self._DesignLocationCUs.add(obj)
 
     def removeDesignLocationCUs(self, *DesignLocationCUs):
         for obj in DesignLocationCUs:
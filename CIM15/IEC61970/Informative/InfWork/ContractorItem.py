@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class ContractorItem(IdentifiedObject):
     """Contractor information for work task.Contractor information for work task.
@@ -47,8 +48,9 @@ class ContractorItem(IdentifiedObject):
         self._WorkTask = None
         self.WorkTask = WorkTask
 
-        self._ErpPayables = []
-        self.ErpPayables = [] if ErpPayables is None else ErpPayables
+        self._ErpPayables = EMPTY
+        if ErpPayables is not None:
+            self.ErpPayables = ErpPayables
 
         self.status = status
 
@@ -70,13 +72,14 @@ class ContractorItem(IdentifiedObject):
 
     def setWorkTask(self, value):
         if self._WorkTask is not None:
-            filtered = [x for x in self.WorkTask.ContractorItems if x != self]
-            self._WorkTask._ContractorItems = filtered
+            self._WorkTask._ContractorItems.discard(self)
 
         self._WorkTask = value
         if self._WorkTask is not None:
-            if self not in self._WorkTask._ContractorItems:
-                self._WorkTask._ContractorItems.append(self)
+            if self._WorkTask._ContractorItems is EMPTY:
+                self._WorkTask._ContractorItems = AssociationList([self])
+            else:
+                self._WorkTask._ContractorItems.add(self)
 
     WorkTask = property(getWorkTask, setWorkTask)
 
@@ -85,21 +88,28 @@ class ContractorItem(IdentifiedObject):
         return self._ErpPayables
 
     def setErpPayables(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ErpPayables:
-            filtered = [q for q in p.ContractorItems if q != self]
-            self._ErpPayables._ContractorItems = filtered
+            p._ContractorItems.discard(self)
         for r in value:
-            if self not in r._ContractorItems:
-                r._ContractorItems.append(self)
+            if r._ContractorItems is EMPTY:
+                r._ContractorItems = AssociationList([self])
+            else:
+                r._ContractorItems.add(self)
         self._ErpPayables = value
 
     ErpPayables = property(getErpPayables, setErpPayables)
 
     def addErpPayables(self, *ErpPayables):
         for obj in ErpPayables:
-            if self not in obj._ContractorItems:
-                obj._ContractorItems.append(self)
-            self._ErpPayables.append(obj)
+            if obj._ContractorItems is EMPTY:
+                obj._ContractorItems = AssociationList([self])
+            else:
+                obj._ContractorItems.add(self)
+            if self._ErpPayables is EMPTY:
+                self._ErpPayables = AssociationList([obj])
+            else:
+                self._ErpPayables.add(obj)
 
     def removeErpPayables(self, *ErpPayables):
         for obj in ErpPayables:
@@ -115,13 +125,14 @@ class ContractorItem(IdentifiedObject):
 
     def setWorkCostDetail(self, value):
         if self._WorkCostDetail is not None:
-            filtered = [x for x in self.WorkCostDetail.ContractorItems if x != self]
-            self._WorkCostDetail._ContractorItems = filtered
+            self._WorkCostDetail._ContractorItems.discard(self)
 
         self._WorkCostDetail = value
         if self._WorkCostDetail is not None:
-            if self not in self._WorkCostDetail._ContractorItems:
-                self._WorkCostDetail._ContractorItems.append(self)
+            if self._WorkCostDetail._ContractorItems is EMPTY:
+                self._WorkCostDetail._ContractorItems = AssociationList([self])
+            else:
+                self._WorkCostDetail._ContractorItems.add(self)
 
     WorkCostDetail = property(getWorkCostDetail, setWorkCostDetail)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class CostType(IdentifiedObject):
     """A categorization for resources, often costs, in accounting transactions. Examples include: material components, building in service, coal sales, overhead, etc.A categorization for resources, often costs, in accounting transactions. Examples include: material components, building in service, coal sales, overhead, etc.
@@ -50,20 +51,24 @@ class CostType(IdentifiedObject):
         #: True if an amount can be assigned to the resource element (e.g., building in service, transmission plant, software development capital); false otherwise (e.g., internal labor, material components).
         self.amountAssignable = amountAssignable
 
-        self._ErpJournalEntries = []
-        self.ErpJournalEntries = [] if ErpJournalEntries is None else ErpJournalEntries
+        self._ErpJournalEntries = EMPTY
+        if ErpJournalEntries is not None:
+            self.ErpJournalEntries = ErpJournalEntries
 
         self._ParentCostType = None
         self.ParentCostType = ParentCostType
 
-        self._ChildCostTypes = []
-        self.ChildCostTypes = [] if ChildCostTypes is None else ChildCostTypes
+        self._ChildCostTypes = EMPTY
+        if ChildCostTypes is not None:
+            self.ChildCostTypes = ChildCostTypes
 
-        self._WorkCostDetails = []
-        self.WorkCostDetails = [] if WorkCostDetails is None else WorkCostDetails
+        self._WorkCostDetails = EMPTY
+        if WorkCostDetails is not None:
+            self.WorkCostDetails = WorkCostDetails
 
-        self._CompatibleUnits = []
-        self.CompatibleUnits = [] if CompatibleUnits is None else CompatibleUnits
+        self._CompatibleUnits = EMPTY
+        if CompatibleUnits is not None:
+            self.CompatibleUnits = CompatibleUnits
 
         self.status = status
 
@@ -81,21 +86,28 @@ class CostType(IdentifiedObject):
         return self._ErpJournalEntries
 
     def setErpJournalEntries(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ErpJournalEntries:
-            filtered = [q for q in p.CostTypes if q != self]
-            self._ErpJournalEntries._CostTypes = filtered
+            p._CostTypes.discard(self)
         for r in value:
-            if self not in r._CostTypes:
-                r._CostTypes.append(self)
+            if r._CostTypes is EMPTY:
+                r._CostTypes = AssociationList([self])
+            else:
+                r._CostTypes.add(self)
         self._ErpJournalEntries = value
 
     ErpJournalEntries = property(getErpJournalEntries, setErpJournalEntries)
 
     def addErpJournalEntries(self, *ErpJournalEntries):
         for obj in ErpJournalEntries:
-            if self not in obj._CostTypes:
-                obj._CostTypes.append(self)
-            self._ErpJournalEntries.append(obj)
+            if obj._CostTypes is EMPTY:
+                obj._CostTypes = AssociationList([self])
+            else:
+                obj._CostTypes.add(self)
+            if self._ErpJournalEntries is EMPTY:
+                self._ErpJournalEntries = AssociationList([obj])
+            else:
+                self._ErpJournalEntries.add(obj)
 
     def removeErpJournalEntries(self, *ErpJournalEntries):
         for obj in ErpJournalEntries:
@@ -109,13 +121,14 @@ class CostType(IdentifiedObject):
 
     def setParentCostType(self, value):
         if self._ParentCostType is not None:
-            filtered = [x for x in self.ParentCostType.ChildCostTypes if x != self]
-            self._ParentCostType._ChildCostTypes = filtered
+            self._ParentCostType._ChildCostTypes.discard(self)
 
         self._ParentCostType = value
         if self._ParentCostType is not None:
-            if self not in self._ParentCostType._ChildCostTypes:
-                self._ParentCostType._ChildCostTypes.append(self)
+            if self._ParentCostType._ChildCostTypes is EMPTY:
+                self._ParentCostType._ChildCostTypes = AssociationList([self])
+            else:
+                self._ParentCostType._ChildCostTypes.add(self)
 
     ParentCostType = property(getParentCostType, setParentCostType)
 
@@ -124,6 +137,7 @@ class CostType(IdentifiedObject):
         return self._ChildCostTypes
 
     def setChildCostTypes(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ChildCostTypes:
             x.ParentCostType = None
         for y in value:
@@ -145,6 +159,7 @@ class CostType(IdentifiedObject):
         return self._WorkCostDetails
 
     def setWorkCostDetails(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._WorkCostDetails:
             x.CostType = None
         for y in value:
@@ -166,6 +181,7 @@ class CostType(IdentifiedObject):
         return self._CompatibleUnits
 
     def setCompatibleUnits(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._CompatibleUnits:
             x.CostType = None
         for y in value:
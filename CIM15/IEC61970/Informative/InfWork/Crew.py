@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class Crew(IdentifiedObject):
     """A crew is a group of people with specific skills, tools, and vehicles.A crew is a group of people with specific skills, tools, and vehicles.
@@ -45,44 +46,56 @@ class Crew(IdentifiedObject):
         #: Category by utility's work management standards and practices.
         self.category = category
 
-        self._Tools = []
-        self.Tools = [] if Tools is None else Tools
+        self._Tools = EMPTY
+        if Tools is not None:
+            self.Tools = Tools
 
-        self._SwitchingSchedules = []
-        self.SwitchingSchedules = [] if SwitchingSchedules is None else SwitchingSchedules
+        self._SwitchingSchedules = EMPTY
+        if SwitchingSchedules is not None:
+            self.SwitchingSchedules = SwitchingSchedules
 
         self._Route = None
         self.Route = Route
 
-        self._Capabilities = []
-        self.Capabilities = [] if Capabilities is None else Capabilities
+        self._Capabilities = EMPTY
+        if Capabilities is not None:
+            self.Capabilities = Capabilities
 
-        self._CrewMembers = []
-        self.CrewMembers = [] if CrewMembers is None else CrewMembers
+        self._CrewMembers = EMPTY
+        if CrewMembers is not None:
+            self.CrewMembers = CrewMembers
 
-        self._OutageSteps = []
-        self.OutageSteps = [] if OutageSteps is None else OutageSteps
+        self._OutageSteps = EMPTY
+        if OutageSteps is not None:
+            self.OutageSteps = OutageSteps
 
-        self._WorkEquipmentAssets = []
-        self.WorkEquipmentAssets = [] if WorkEquipmentAssets is None else WorkEquipmentAssets
+        self._WorkEquipmentAssets = EMPTY
+        if WorkEquipmentAssets is not None:
+            self.WorkEquipmentAssets = WorkEquipmentAssets
 
-        self._Assignments = []
-        self.Assignments = [] if Assignments is None else Assignments
+        self._Assignments = EMPTY
+        if Assignments is not None:
+            self.Assignments = Assignments
 
-        self._Locations = []
-        self.Locations = [] if Locations is None else Locations
+        self._Locations = EMPTY
+        if Locations is not None:
+            self.Locations = Locations
 
-        self._WorkTasks = []
-        self.WorkTasks = [] if WorkTasks is None else WorkTasks
+        self._WorkTasks = EMPTY
+        if WorkTasks is not None:
+            self.WorkTasks = WorkTasks
 
-        self._Organisations = []
-        self.Organisations = [] if Organisations is None else Organisations
+        self._Organisations = EMPTY
+        if Organisations is not None:
+            self.Organisations = Organisations
 
-        self._ShiftPatterns = []
-        self.ShiftPatterns = [] if ShiftPatterns is None else ShiftPatterns
+        self._ShiftPatterns = EMPTY
+        if ShiftPatterns is not None:
+            self.ShiftPatterns = ShiftPatterns
 
-        self._Vehicles = []
-        self.Vehicles = [] if Vehicles is None else Vehicles
+        self._Vehicles = EMPTY
+        if Vehicles is not None:
+            self.Vehicles = Vehicles
 
         super(Crew, self).__init__(*args, **kw_args)
 
@@ -98,6 +111,7 @@ class Crew(IdentifiedObject):
         return self._Tools
 
     def setTools(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Tools:
             x.Crew = None
         for y in value:
@@ -120,21 +134,28 @@ class Crew(IdentifiedObject):
         return self._SwitchingSchedules
 
     def setSwitchingSchedules(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._SwitchingSchedules:
-            filtered = [q for q in p.Crews if q != self]
-            self._SwitchingSchedules._Crews = filtered
+            p._Crews.discard(self)
         for r in value:
-            if self not in r._Crews:
-                r._Crews.append(self)
+            if r._Crews is EMPTY:
+                r._Crews = AssociationList([self])
+            else:
+                r._Crews.add(self)
         self._SwitchingSchedules = value
 
     SwitchingSchedules = property(getSwitchingSchedules, setSwitchingSchedules)
 
     def addSwitchingSchedules(self, *SwitchingSchedules):
         for obj in SwitchingSchedules:
-            if self not in obj._Crews:
-                obj._Crews.append(self)
-            self._SwitchingSchedules.append(obj)
+            if obj._Crews is EMPTY:
+                obj._Crews = AssociationList([self])
+            else:
+                obj._Crews.add(self)
+            if self._SwitchingSchedules is EMPTY:
+                self._SwitchingSchedules = AssociationList([obj])
+            else:
+                self._SwitchingSchedules.add(obj)
 
     def removeSwitchingSchedules(self, *SwitchingSchedules):
         for obj in SwitchingSchedules:
@@ -148,13 +169,14 @@ class Crew(IdentifiedObject):
 
     def setRoute(self, value):
         if self._Route is not None:
-            filtered = [x for x in self.Route.Crews if x != self]
-            self._Route._Crews = filtered
+            self._Route._Crews.discard(self)
 
         self._Route = value
         if self._Route is not None:
-            if self not in self._Route._Crews:
-                self._Route._Crews.append(self)
+            if self._Route._Crews is EMPTY:
+                self._Route._Crews = AssociationList([self])
+            else:
+                self._Route._Crews.add(self)
 
     Route = property(getRoute, setRoute)
 
@@ -163,6 +185,7 @@ class Crew(IdentifiedObject):
         return self._Capabilities
 
     def setCapabilities(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Capabilities:
             x.Crew = None
         for y in value:
@@ -185,21 +208,28 @@ class Crew(IdentifiedObject):
         return self._CrewMembers
 
     def setCrewMembers(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._CrewMembers:
-            filtered = [q for q in p.Crews if q != self]
-            self._CrewMembers._Crews = filtered
+            p._Crews.discard(self)
         for r in value:
-            if self not in r._Crews:
-                r._Crews.append(self)
+            if r._Crews is EMPTY:
+                r._Crews = AssociationList([self])
+            else:
+                r._Crews.add(self)
         self._CrewMembers = value
 
     CrewMembers = property(getCrewMembers, setCrewMembers)
 
     def addCrewMembers(self, *CrewMembers):
         for obj in CrewMembers:
-            if self not in obj._Crews:
-                obj._Crews.append(self)
-            self._CrewMembers.append(obj)
+            if obj._Crews is EMPTY:
+                obj._Crews = AssociationList([self])
+            else:
+                obj._Crews.add(self)
+            if self._CrewMembers is EMPTY:
+                self._CrewMembers = AssociationList([obj])
+            else:
+                self._CrewMembers.add(obj)
 
     def removeCrewMembers(self, *CrewMembers):
         for obj in CrewMembers:
@@ -212,21 +242,28 @@ class Crew(IdentifiedObject):
         return self._OutageSteps
 
     def setOutageSteps(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._OutageSteps:
-            filtered = [q for q in p.Crews if q != self]
-            self._OutageSteps._Crews = filtered
+            p._Crews.discard(self)
         for r in value:
-            if self not in r._Crews:
-                r._Crews.append(self)
+            if r._Crews is EMPTY:
+                r._Crews = AssociationList([self])
+            else:
+                r._Crews.add(self)
         self._OutageSteps = value
 
     OutageSteps = property(getOutageSteps, setOutageSteps)
 
     def addOutageSteps(self, *OutageSteps):
         for obj in OutageSteps:
-            if self not in obj._Crews:
-                obj._Crews.append(self)
-            self._OutageSteps.append(obj)
+            if obj._Crews is EMPTY:
+                obj._Crews = AssociationList([self])
+            else:
+                obj._Crews.add(self)
+            if self._OutageSteps is EMPTY:
+                self._OutageSteps = AssociationList([obj])
+            else:
+                self._OutageSteps.add(obj)
 
     def removeOutageSteps(self, *OutageSteps):
         for obj in OutageSteps:
@@ -239,6 +276,7 @@ class Crew(IdentifiedObject):
         return self._WorkEquipmentAssets
 
     def setWorkEquipmentAssets(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._WorkEquipmentAssets:
             x.Crew = None
         for y in value:
@@ -261,21 +299,28 @@ class Crew(IdentifiedObject):
         return self._Assignments
 
     def setAssignments(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Assignments:
-            filtered = [q for q in p.Crews if q != self]
-            self._Assignments._Crews = filtered
+            p._Crews.discard(self)
         for r in value:
-            if self not in r._Crews:
-                r._Crews.append(self)
+            if r._Crews is EMPTY:
+                r._Crews = AssociationList([self])
+            else:
+                r._Crews.add(self)
         self._Assignments = value
 
     Assignments = property(getAssignments, setAssignments)
 
     def addAssignments(self, *Assignments):
         for obj in Assignments:
-            if self not in obj._Crews:
-                obj._Crews.append(self)
-            self._Assignments.append(obj)
+            if obj._Crews is EMPTY:
+                obj._Crews = AssociationList([self])
+            else:
+                obj._Crews.add(self)
+            if self._Assignments is EMPTY:
+                self._Assignments = AssociationList([obj])
+            else:
+                self._Assignments.add(obj)
 
     def removeAssignments(self, *Assignments):
         for obj in Assignments:
@@ -288,21 +333,28 @@ class Crew(IdentifiedObject):
         return self._Locations
 
     def setLocations(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Locations:
-            filtered = [q for q in p.Crews if q != self]
-            self._Locations._Crews = filtered
+            p._Crews.discard(self)
         for r in value:
-            if self not in r._Crews:
-                r._Crews.append(self)
+            if r._Crews is EMPTY:
+                r._Crews = AssociationList([self])
+            else:
+                r._Crews.add(self)
         self._Locations = value
 
     Locations = property(getLocations, setLocations)
 
     def addLocations(self, *Locations):
         for obj in Locations:
-            if self not in obj._Crews:
-                obj._Crews.append(self)
-            self._Locations.append(obj)
+            if obj._Crews is EMPTY:
+                obj._Crews = AssociationList([self])
+            else:
+                obj._Crews.add(self)
+            if self._Locations is EMPTY:
+                self._Locations = AssociationList([obj])
+            else:
+                self._Locations.add(obj)
 
     def removeLocations(self, *Locations):
         for obj in Locations:
@@ -316,21 +368,28 @@ class Crew(IdentifiedObject):
         return self._WorkTasks
 
     def setWorkTasks(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._WorkTasks:
-            filtered = [q for q in p.Crews if q != self]
-            self._WorkTasks._Crews = filtered
+            p._Crews.discard(self)
         for r in value:
-            if self not in r._Crews:
-                r._Crews.append(self)
+            if r._Crews is EMPTY:
+                r._Crews = AssociationList([self])
+            else:
+                r._Crews.add(self)
         self._WorkTasks = value
 
     WorkTasks = property(getWorkTasks, setWorkTasks)
 
     def addWorkTasks(self, *WorkTasks):
         for obj in WorkTasks:
-            if self not in obj._Crews:
-                obj._Crews.append(self)
-            self._WorkTasks.append(obj)
+            if obj._Crews is EMPTY:
+                obj._Crews = AssociationList([self])
+            else:
+                obj._Crews.add(self)
+            if self._WorkTasks is EMPTY:
+                self._WorkTasks = AssociationList([obj])
+            else:
+                self._WorkTasks.add(obj)
 
     def removeWorkTasks(self, *WorkTasks):
         for obj in WorkTasks:
@@ -343,21 +402,28 @@ class Crew(IdentifiedObject):
         return self._Organisations
 
     def setOrganisations(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Organisations:
-            filtered = [q for q in p.Crews if q != self]
-            self._Organisations._Crews = filtered
+            p._Crews.discard(self)
         for r in value:
-            if self not in r._Crews:
-                r._Crews.append(self)
+            if r._Crews is EMPTY:
+                r._Crews = AssociationList([self])
+            else:
+                r._Crews.add(self)
         self._Organisations = value
 
     Organisations = property(getOrganisations, setOrganisations)
 
     def addOrganisations(self, *Organisations):
         for obj in Organisations:
-            if self not in obj._Crews:
-                obj._Crews.append(self)
-            self._Organisations.append(obj)
+            if obj._Crews is EMPTY:
+                obj._Crews = AssociationList([self])
+            else:
+                obj._Crews.add(self)
+            if self._Organisations is EMPTY:
+                self._Organisations = AssociationList([obj])
+            else:
+                self._Organisations.add(obj)
 
     def removeOrganisations(self, *Organisations):
         for obj in Organisations:
@@ -370,21 +436,28 @@ class Crew(IdentifiedObject):
         return self._ShiftPatterns
 
     def setShiftPatterns(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ShiftPatterns:
-            filtered = [q for q in p.Crews if q != self]
-            self._ShiftPatterns._Crews = filtered
+            p._Crews.discard(self)
         for r in value:
-            if self not in r._Crews:
-                r._Crews.append(self)
+            if r._Crews is EMPTY:
+                r._Crews = AssociationList([self])
+            else:
+                r._Crews.add(self)
         self._ShiftPatterns = value
 
     ShiftPatterns = property(getShiftPatterns, setShiftPatterns)
 
     def addShiftPatterns(self, *ShiftPatterns):
         for obj in ShiftPatterns:
-            if self not in obj._Crews:
-                obj._Crews.append(self)
-            self._ShiftPatterns.append(obj)
+            if obj._Crews is EMPTY:
+                obj._Crews = AssociationList([self])
+            else:
+                obj._Crews.add(self)
+            if self._ShiftPatterns is EMPTY:
+                self._ShiftPatterns = AssociationList([obj])
+            else:
+                self._ShiftPatterns.add(obj)
 
     def removeShiftPatterns(self, *ShiftPatterns):
         for obj in ShiftPatterns:
@@ -397,6 +470,7 @@ class Crew(IdentifiedObject):
         return self._Vehicles
 
     def setVehicles(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Vehicles:
             x.Crew = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import AssociationList, EMPTY
 
 class Design(Document):
     """A design for consideration by customers, potential customers, or internal work. Note that the Version of design is the revision attribute that is inherited from Document.A design for consideration by customers, potential customers, or internal work. Note that the Version of design is the revision attribute that is inherited from Document.
@@ -48,26 +49,32 @@ class Design(Document):
         #: Price to customer for implementing design.
         self.price = price
 
-        self._DesignLocations = []
-        self.DesignLocations = [] if DesignLocations is None else DesignLocations
+        self._DesignLocations = EMPTY
+        if DesignLocations is not None:
+            self.DesignLocations = DesignLocations
 
-        self._WorkCostDetails = []
-        self.WorkCostDetails = [] if WorkCostDetails is None else WorkCostDetails
+        self._WorkCostDetails = EMPTY
+        if WorkCostDetails is not None:
+            self.WorkCostDetails = WorkCostDetails
 
-        self._ConditionFactors = []
-        self.ConditionFactors = [] if ConditionFactors is None else ConditionFactors
+        self._ConditionFactors = EMPTY
+        if ConditionFactors is not None:
+            self.ConditionFactors = ConditionFactors
 
-        self._WorkTasks = []
-        self.WorkTasks = [] if WorkTasks is None else WorkTasks
+        self._WorkTasks = EMPTY
+        if WorkTasks is not None:
+            self.WorkTasks = WorkTasks
 
-        self._ErpBOMs = []
-        self.ErpBOMs = [] if ErpBOMs is None else ErpBOMs
+        self._ErpBOMs = EMPTY
+        if ErpBOMs is not None:
+            self.ErpBOMs = ErpBOMs
 
         self._Work = None
         self.Work = Work
 
-        self._DesignLocationsCUs = []
-        self.DesignLocationsCUs = [] if DesignLocationsCUs is None else DesignLocationsCUs
+        self._DesignLocationsCUs = EMPTY
+        if DesignLocationsCUs is not None:
+            self.DesignLocationsCUs = DesignLocationsCUs
 
         self._ErpQuoteLineItem = None
         self.ErpQuoteLineItem = ErpQuoteLineItem
@@ -86,21 +93,28 @@ class Design(Document):
         return self._DesignLocations
 
     def setDesignLocations(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._DesignLocations:
-            filtered = [q for q in p.Designs if q != self]
-            self._DesignLocations._Designs = filtered
+            p._Designs.discard(self)
         for r in value:
-            if self not in r._Designs:
-                r._Designs.append(self)
+            if r._Designs is EMPTY:
+                r._Designs = AssociationList([self])
+            else:
+                r._Designs.add(self)
         self._DesignLocations = value
 
     DesignLocations = property(getDesignLocations, setDesignLocations)
 
     def addDesignLocations(self, *DesignLocations):
         for obj in DesignLocations:
-            if self not in obj._Designs:
-                obj._Designs.append(self)
-            self._DesignLocations.append(obj)
+            if obj._Designs is EMPTY:
+                obj._Designs = AssociationList([self])
+            else:
+                obj._Designs.add(self)
+            if self._DesignLocations is EMPTY:
+                self._DesignLocations = AssociationList([obj])
+            else:
+                self._DesignLocations.add(obj)
 
     def removeDesignLocations(self, *DesignLocations):
         for obj in DesignLocations:
@@ -113,6 +127,7 @@ class Design(Document):
         return self._WorkCostDetails
 
     def setWorkCostDetails(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._WorkCostDetails:
             x.Design = None
         for y in value:
@@ -134,21 +149,28 @@ class Design(Document):
         return self._ConditionFactors
 
     def setConditionFactors(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ConditionFactors:
-            filtered = [q for q in p.Designs if q != self]
-            self._ConditionFactors._Designs = filtered
+            p._Designs.discard(self)
         for r in value:
-            if self not in r._Designs:
-                r._Designs.append(self)
+            if r._Designs is EMPTY:
+                r._Designs = AssociationList([self])
+            else:
+                r._Designs.add(self)
         self._ConditionFactors = value
 
     ConditionFactors = property(getConditionFactors, setConditionFactors)
 
     def addConditionFactors(self, *ConditionFactors):
         for obj in ConditionFactors:
-            if self not in obj._Designs:
-                obj._Designs.append(self)
-            self._ConditionFactors.append(obj)
+            if obj._Designs is EMPTY:
+                obj._Designs = AssociationList([self])
+            else:
+                obj._Designs.add(self)
+            if self._ConditionFactors is EMPTY:
+                self._ConditionFactors = AssociationList([obj])
+            else:
+                self._ConditionFactors.add(obj)
 
     def removeConditionFactors(self, *ConditionFactors):
         for obj in ConditionFactors:
@@ -161,6 +183,7 @@ class Design(Document):
         return self._WorkTasks
 
     def setWorkTasks(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._WorkTasks:
             x.Design = None
         for y in value:
@@ -182,6 +205,7 @@ class Design(Document):
         return self._ErpBOMs
 
     def setErpBOMs(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ErpBOMs:
             x.Design = None
         for y in value:
@@ -204,13 +228,14 @@ class Design(Document):
 
     def setWork(self, value):
         if self._Work is not None:
-            filtered = [x for x in self.Work.Designs if x != self]
-            self._Work._Designs = filtered
+            self._Work._Designs.discard(self)
 
         self._Work = value
         if self._Work is not None:
-            if self not in self._Work._Designs:
-                self._Work._Designs.append(self)
+            if self._Work._Designs is EMPTY:
+                self._Work._Designs = AssociationList([self])
+            else:
+                self._Work._Designs.add(self)
 
     Work = property(getWork, setWork)
 
@@ -219,21 +244,28 @@ class Design(Document):
         return self._DesignLocationsCUs
 
     def setDesignLocationsCUs(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._DesignLocationsCUs:
-            filtered = [q for q in p.Designs if q != self]
-            self._DesignLocationsCUs._Designs = filtered
+            p._Designs.discard(self)
         for r in value:
-            if self not in r._Designs:
-                r._Designs.append(self)
+            if r._Designs is EMPTY:
+                r._Designs = AssociationList([self])
+            else:
+                r._Designs.add(self)
         self._DesignLocationsCUs = value
 
     DesignLocationsCUs = property(getDesignLocationsCUs, setDesignLocationsCUs)
 
     def addDesignLocationsCUs(self, *DesignLocationsCUs):
         for obj in DesignLocationsCUs:
-            if self not in obj._Designs:
-                obj._Designs.append(self)
-            self._DesignLocationsCUs.append(obj)
+            if obj._Designs is EMPTY:
+                obj._Designs = AssociationList([self])
+            else:
+                obj._Designs.add(self)
+            if self._DesignLocationsCUs is EMPTY:
+                self._DesignLocationsCUs = AssociationList([obj])
+            else:
+                self._DesignLocationsCUs.add(obj)
 
     def removeDesignLocationsCUs(self, *DesignLocationsCUs):
         for obj in DesignLocationsCUs:
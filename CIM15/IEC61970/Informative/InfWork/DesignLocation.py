@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class DesignLocation(IdentifiedObject):
     """A logical part of the design (e.g., pole and all equipment on a pole). This includes points and spans.A logical part of the design (e.g., pole and all equipment on a pole). This includes points and spans.
@@ -43,29 +44,37 @@ class DesignLocation(IdentifiedObject):
 
         self.status = status
 
-        self._MaterialItems = []
-        self.MaterialItems = [] if MaterialItems is None else MaterialItems
+        self._MaterialItems = EMPTY
+        if MaterialItems is not None:
+            self.MaterialItems = MaterialItems
 
-        self._Designs = []
-        self.Designs = [] if Designs is None else Designs
+        self._Designs = EMPTY
+        if Designs is not None:
+            self.Designs = Designs
 
-        self._DesignLocationCUs = []
-        self.DesignLocationCUs = [] if DesignLocationCUs is None else DesignLocationCUs
+        self._DesignLocationCUs = EMPTY
+        if DesignLocationCUs is not None:
+            self.DesignLocationCUs = DesignLocationCUs
 
-        self._WorkLocations = []
-        self.WorkLocations = [] if WorkLocations is None else WorkLocations
+        self._WorkLocations = EMPTY
+        if WorkLocations is not None:
+            self.WorkLocations = WorkLocations
 
-        self._Diagrams = []
-        self.Diagrams = [] if Diagrams is None else Diagrams
+        self._Diagrams = EMPTY
+        if Diagrams is not None:
+            self.Diagrams = Diagrams
 
-        self._MiscCostItems = []
-        self.MiscCostItems = [] if MiscCostItems is None else MiscCostItems
+        self._MiscCostItems = EMPTY
+        if MiscCostItems is not None:
+            self.MiscCostItems = MiscCostItems
 
-        self._ErpBomItemDatas = []
-        self.ErpBomItemDatas = [] if ErpBomItemDatas is None else ErpBomItemDatas
+        self._ErpBomItemDatas = EMPTY
+        if ErpBomItemDatas is not None:
+            self.ErpBomItemDatas = ErpBomItemDatas
 
-        self._ConditionFactors = []
-        self.ConditionFactors = [] if ConditionFactors is None else ConditionFactors
+        self._ConditionFactors = EMPTY
+        if ConditionFactors is not None:
+            self.ConditionFactors = ConditionFactors
 
         super(DesignLocation, self).__init__(*args, **kw_args)
 
@@ -83,6 +92,7 @@ class DesignLocation(IdentifiedObject):
         return self._MaterialItems
 
     def setMaterialItems(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._MaterialItems:
             x.DesignLocation = None
         for y in value:
@@ -104,21 +114,28 @@ class DesignLocation(IdentifiedObject):
         return self._Designs
 
     def setDesigns(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Designs:
-            filtered = [q for q in p.DesignLocations if q != self]
-            self._Designs._DesignLocations = filtered
+            p._DesignLocations.discard(self)
         for r in value:
-            if self not in r._DesignLocations:
-                r._DesignLocations.append(self)
+            if r._DesignLocations is EMPTY:
+                r._DesignLocations = AssociationList([self])
+            else:
+                r._DesignLocations.add(self)
         self._Designs = value
 
     Designs = property(getDesigns, setDesigns)
 
     def addDesigns(self, *Designs):
         for obj in Designs:
-            if self not in obj._DesignLocations:
-                obj._DesignLocations.append(self)
-            self._Designs.append(obj)
+            if obj._DesignLocations is EMPTY:
+                obj._DesignLocations = AssociationList([self])
+            else:
+                obj._DesignLocations.add(self)
+            if self._Designs is EMPTY:
+                self._Designs = AssociationList([obj])
+            else:
+                self._Designs.add(obj)
 
     def removeDesigns(self, *Designs):
         for obj in Designs:
@@ -131,6 +148,7 @@ class DesignLocation(IdentifiedObject):
         return self._DesignLocationCUs
 
     def setDesignLocationCUs(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._DesignLocationCUs:
             x.DesignLocation = None
         for y in value:
@@ -152,21 +170,28 @@ class DesignLocation(IdentifiedObject):
         return self._WorkLocations
 
     def setWorkLocations(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._WorkLocations:
-            filtered = [q for q in p.DesignLocations if q != self]
-            self._WorkLocations._DesignLocations = filtered
+            p._DesignLocations.discard(self)
         for r in value:
-            if self not in r._DesignLocations:
-                r._DesignLocations.append(self)
+            if r._DesignLocations is EMPTY:
+                r._DesignLocations = AssociationList([self])
+            else:
+                r._DesignLocations.add(self)
         self._WorkLocations = value
 
     WorkLocations = property(getWorkLocations, setWorkLocations)
 
     def addWorkLocations(self, *WorkLocations):
         for obj in WorkLocations:
-            if self not in obj._DesignLocations:
-                obj._DesignLocations.append(self)
-            self._WorkLocations.append(obj)
+            if obj._DesignLocations is EMPTY:
+                obj._DesignLocations = AssociationList([self])
+            else:
+                obj._DesignLocations.add(self)
+            if self._WorkLocations is EMPTY:
+                self._WorkLocations = AssociationList([obj])
+            else:
+                self._WorkLocations.add(obj)
 
     def removeWorkLocations(self, *WorkLocations):
         for obj in WorkLocations:
@@ -179,21 +204,28 @@ class DesignLocation(IdentifiedObject):
         return self._Diagrams
 
     def setDiagrams(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Diagrams:
-            filtered = [q for q in p.DesignLocations if q != self]
-            self._Diagrams._DesignLocations = filtered
+            p._DesignLocations.discard(self)
         for r in value:
-            if self not in r._DesignLocations:
-                r._DesignLocations.append(self)
+            if r._DesignLocations is EMPTY:
+                r._DesignLocations = AssociationList([self])
+            else:
+                r._DesignLocations.add(self)
         self._Diagrams = value
 
     Diagrams = property(getDiagrams, setDiagrams)
 
     def addDiagrams(self, *Diagrams):
         for obj in Diagrams:
-            if self not in obj._DesignLocations:
-                obj._DesignLocations.append(self)
-            self._Diagrams.append(obj)
+            if obj._DesignLocations is EMPTY:
+                obj._DesignLocations = AssociationList([self])
+            else:
+                obj._DesignLocations.add(self)
+            if self._Diagrams is EMPTY:
+                self._Diagrams = AssociationList([obj])
+            else:
+                self._Diagrams.add(obj)
 
     def removeDiagrams(self, *Diagrams):
         for obj in Diagrams:
@@ -206,6 +238,7 @@ class DesignLocation(IdentifiedObject):
         return self._MiscCostItems
 
     def setMiscCostItems(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._MiscCostItems:
             x.DesignLocation = None
         for y in value:
@@ -227,6 +260,7 @@ class DesignLocation(IdentifiedObject):
         return self._ErpBomItemDatas
 
     def setErpBomItemDatas(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ErpBomItemDatas:
             x.DesignLocation = None
         for y in value:
@@ -248,21 +282,28 @@ class DesignLocation(IdentifiedObject):
         return self._ConditionFactors
 
     def setConditionFactors(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ConditionFactors:
-            filtered = [q for q in p.DesignLocations if q != self]
-            self._ConditionFactors._DesignLocations = filtered
+            p._DesignLocations.discard(self)
         for r in value:
-            if self not in r._DesignLocations:
-                r._DesignLocations.append(self)
+            if r._DesignLocations is EMPTY:
+                r._DesignLocations = AssociationList([self])
+            else:
+                r._DesignLocations.add(self)
         self._ConditionFactors = value
 
     ConditionFactors = property(getConditionFactors, setConditionFactors)
 
     def addConditionFactors(self, *ConditionFactors):
         for obj in ConditionFactors:
-            if self not in obj._DesignLocations:
-                obj._DesignLocations.append(self)
-            self._ConditionFactors.append(obj)
+            if obj._DesignLocations is EMPTY:
+                obj._DesignLocations = AssociationList([self])
+            else:
+                obj._DesignLocations.add(self)
+            if self._ConditionFactors is EMPTY:
+                self._ConditionFactors = AssociationList([obj])
+            else:
+                self._ConditionFactors.add(obj)
 
     def removeConditionFactors(self, *ConditionFactors):
         for obj in ConditionFactors:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class DesignLocationCU(IdentifiedObject):
     """Compatible unit at a given design location.Compatible unit at a given design location.
@@ -59,20 +60,25 @@ class DesignLocationCU(IdentifiedObject):
         #: The quantity of the CU being assigned to this location.
         self.cuQuantity = cuQuantity
 
-        self._ConditionFactors = []
-        self.ConditionFactors = [] if ConditionFactors is None else ConditionFactors
+        self._ConditionFactors = EMPTY
+        if ConditionFactors is not None:
+            self.ConditionFactors = ConditionFactors
 
-        self._CompatibleUnits = []
-        self.CompatibleUnits = [] if CompatibleUnits is None else CompatibleUnits
+        self._CompatibleUnits = EMPTY
+        if CompatibleUnits is not None:
+            self.CompatibleUnits = CompatibleUnits
 
-        self._WorkTasks = []
-        self.WorkTasks = [] if WorkTasks is None else WorkTasks
+        self._WorkTasks = EMPTY
+        if WorkTasks is not None:
+            self.WorkTasks = WorkTasks
 
-        self._Designs = []
-        self.Designs = [] if Designs is None else Designs
+        self._Designs = EMPTY
+        if Designs is not None:
+            self.Designs = Designs
 
-        self._CUGroups = []
-        self.CUGroups = [] if CUGroups is None else CUGroups
+        self._CUGroups = EMPTY
+        if CUGroups is not None:
+            self.CUGroups = CUGroups
 
         self._DesignLocation = None
         self.DesignLocation = DesignLocation
@@ -93,21 +99,28 @@ class DesignLocationCU(IdentifiedObject):
         return self._ConditionFactors
 
     def setConditionFactors(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ConditionFactors:
-            filtered = [q for q in p.DesignLocationCUs if q != self]
-            self._ConditionFactors._DesignLocationCUs = filtered
+            p._DesignLocationCUs.discard(self)
         for r in value:
-            if self not in r._DesignLocationCUs:
-                r._DesignLocationCUs.append(self)
+            if r._DesignLocationCUs is EMPTY:
+                r._DesignLocationCUs = AssociationList([self])
+            else:
+                r._DesignLocationCUs.add(self)
         self._ConditionFactors = value
 
     ConditionFactors = property(getConditionFactors, setConditionFactors)
 
     def addConditionFactors(self, *ConditionFactors):
         for obj in ConditionFactors:
-            if self not in obj._DesignLocationCUs:
-                obj._DesignLocationCUs.append(self)
-            self._ConditionFactors.append(obj)
+            if obj._DesignLocationCUs is EMPTY:
+                obj._DesignLocationCUs = AssociationList([self])
+            else:
+                obj._DesignLocationCUs.add(self)
+            if self._ConditionFactors is EMPTY:
+                self._ConditionFactors = AssociationList([obj])
+            else:
+                self._ConditionFactors.add(obj)
 
     def removeConditionFactors(self, *ConditionFactors):
         for obj in ConditionFactors:
@@ -120,21 +133,28 @@ class DesignLocationCU(IdentifiedObject):
         return self._CompatibleUnits
 
     def setCompatibleUnits(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._CompatibleUnits:
-            filtered = [q for q in p.DesignLocationCUs if q != self]
-            self._CompatibleUnits._DesignLocationCUs = filtered
+            p._DesignLocationCUs.discard(self)
         for r in value:
-            if self not in r._DesignLocationCUs:
-                r._DesignLocationCUs.append(self)
+            if r._DesignLocationCUs is EMPTY:
+                r._DesignLocationCUs = AssociationList([self])
+            else:
+                r._DesignLocationCUs.add(self)
         self._CompatibleUnits = value
 
     CompatibleUnits = property(getCompatibleUnits, setCompatibleUnits)
 
     def addCompatibleUnits(self, *CompatibleUnits):
         for obj in CompatibleUnits:
-            if self not in obj._DesignLocationCUs:
-                obj._DesignLocationCUs.append(self)
-            self._CompatibleUnits.append(obj)
+            if obj._DesignLocationCUs is EMPTY:
+                obj._DesignLocationCUs = AssociationList([self])
+            else:
+                obj._DesignLocationCUs.add(self)
+            if self._CompatibleUnits is EMPTY:
+                self._CompatibleUnits = AssociationList([obj])
+            else:
+                self._CompatibleUnits.add(obj)
 
     def removeCompatibleUnits(self, *CompatibleUnits):
         for obj in CompatibleUnits:
@@ -147,21 +167,28 @@ class DesignLocationCU(IdentifiedObject):
         return self._WorkTasks
 
     def setWorkTasks(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._WorkTasks:
-            filtered = [q for q in p.DesignLocationCUs if q != self]
-            self._WorkTasks._DesignLocationCUs = filtered
+            p._DesignLocationCUs.discard(self)
         for r in value:
-            if self not in r._DesignLocationCUs:
-                r._DesignLocationCUs.append(self)
+            if r._DesignLocationCUs is EMPTY:
+                r._DesignLocationCUs = AssociationList([self])
+            else:
+                r._DesignLocationCUs.add(self)
         self._WorkTasks = value
 
     WorkTasks = property(getWorkTasks, setWorkTasks)
 
     def addWorkTasks(self, *WorkTasks):
         for obj in WorkTasks:
-            if self not in obj._DesignLocationCUs:
-                obj._DesignLocationCUs.append(self)
-            self._WorkTasks.append(obj)
+            if obj._DesignLocationCUs is EMPTY:
+                obj._DesignLocationCUs = AssociationList([self])
+            else:
+                obj._DesignLocationCUs.add(self)
+            if self._WorkTasks is EMPTY:
+                self._WorkTasks = AssociationList([obj])
+            else:
+                self._WorkTasks.add(obj)
 
     def removeWorkTasks(self, *WorkTasks):
         for obj in WorkTasks:
@@ -174,21 +201,28 @@ class DesignLocationCU(IdentifiedObject):
         return self._Designs
 
     def setDesigns(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Designs:
-            filtered = [q for q in p.DesignLocationsCUs if q != self]
-            self._Designs._DesignLocationsCUs = filtered
+            p._DesignLocationsCUs.discard(self)
         for r in value:
-            if self not in r._DesignLocationsCUs:
-                r._DesignLocationsCUs.append(self)
+            if r._DesignLocationsCUs is EMPTY:
+                r._DesignLocationsCUs = AssociationList([self])
+            else:
+                r._DesignLocationsCUs.add(self)
         self._Designs = value
 
     Designs = property(getDesigns, setDesigns)
 
     def addDesigns(self, *Designs):
         for obj in Designs:
-            if self not in obj._DesignLocationsCUs:
-                obj._DesignLocationsCUs.append(self)
-            self._Designs.append(obj)
+            if obj._DesignLocationsCUs is EMPTY:
+                obj._DesignLocationsCUs = AssociationList([self])
+            else:
+                obj._DesignLocationsCUs.add(self)
+            if self._Designs is EMPTY:
+                self._Designs = AssociationList([obj])
+            else:
+                self._Designs.add(obj)
 
     def removeDesigns(self, *Designs):
         for obj in Designs:
@@ -201,21 +235,28 @@ class DesignLocationCU(IdentifiedObject):
         return self._CUGroups
 
     def setCUGroups(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._CUGroups:
-            filtered = [q for q in p.DesignLocationCUs if q != self]
-            self._CUGroups._DesignLocationCUs = filtered
+            p._DesignLocationCUs.discard(self)
         for r in value:
-            if self not in r._DesignLocationCUs:
-                r._DesignLocationCUs.append(self)
+            if r._DesignLocationCUs is EMPTY:
+                r._DesignLocationCUs = AssociationList([self])
+            else:
+                r._DesignLocationCUs.add(self)
         self._CUGroups = value
 
     CUGroups = property(getCUGroups, setCUGroups)
 
     def addCUGroups(self, *CUGroups):
         for obj in CUGroups:
-            if self not in obj._DesignLocationCUs:
-                obj._DesignLocationCUs.append(self)
-            self._CUGroups.append(obj)
+            if obj._DesignLocationCUs is EMPTY:
+                obj._DesignLocationCUs = AssociationList([self])
+            else:
+                obj._DesignLocationCUs.add(self)
+            if self._CUGroups is EMPTY:
+                self._CUGroups = AssociationList([obj])
+            else:
+                self._CUGroups.add(obj)
 
     def removeCUGroups(self, *CUGroups):
         for obj in CUGroups:
@@ -229,13 +270,14 @@ class DesignLocationCU(IdentifiedObject):
 
     def setDesignLocation(self, value):
         if self._DesignLocation is not None:
-            filtered = [x for x in self.DesignLocation.DesignLocationCUs if x != self]
-            self._DesignLocation._DesignLocationCUs = filtered
+            self._DesignLocation._DesignLocationCUs.discard(self)
 
         self._DesignLocation = value
         if self._DesignLocation is not None:
-            if self not in self._DesignLocation._DesignLocationCUs:
-                self._DesignLocation._DesignLocationCUs.append(self)
+            if self._DesignLocation._DesignLocationCUs is EMPTY:
+                self._DesignLocation._DesignLocationCUs = AssociationList([self])
+            else:
+                self._DesignLocation._DesignLocationCUs.add(self)
 
     DesignLocation = property(getDesignLocation, setDesignLocation)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class EquipmentItem(IdentifiedObject):
     """An equipment item, such as a vehicle, used for a work order.An equipment item, such as a vehicle, used for a work order.
@@ -62,13 +63,14 @@ class EquipmentItem(IdentifiedObject):
 
     def setWorkTask(self, value):
         if self._WorkTask is not None:
-            filtered = [x for x in self.WorkTask.EquipmentItems if x != self]
-            self._WorkTask._EquipmentItems = filtered
+            self._WorkTask._EquipmentItems.discard(self)
 
         self._WorkTask = value
         if self._WorkTask is not None:
-            if self not in self._WorkTask._EquipmentItems:
-                self._WorkTask._EquipmentItems.append(self)
+            if self._WorkTask._EquipmentItems is EMPTY:
+                self._WorkTask._EquipmentItems = AssociationList([self])
+            else:
+                self._WorkTask._EquipmentItems.add(self)
 
     WorkTask = property(getWorkTask, setWorkTask)
 
@@ -78,13 +80,14 @@ class EquipmentItem(IdentifiedObject):
 
     def setWorkCostDetail(self, value):
         if self._WorkCostDetail is not None:
-            filtered = [x for x in self.WorkCostDetail.EquipmentItems if x != self]
-            self._WorkCostDetail._EquipmentItems = filtered
+            self._WorkCostDetail._EquipmentItems.discard(self)
 
         self._WorkCostDetail = value
         if self._WorkCostDetail is not None:
-            if self not in self._WorkCostDetail._EquipmentItems:
-                self._WorkCostDetail._EquipmentItems.append(self)
+            if self._WorkCostDetail._EquipmentItems is EMPTY:
+                self._WorkCostDetail._EquipmentItems = AssociationList([self])
+            else:
+                self._WorkCostDetail._EquipmentItems.add(self)
 
     WorkCostDetail = property(getWorkCostDetail, setWorkCostDetail)
 
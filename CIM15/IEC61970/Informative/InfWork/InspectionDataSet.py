@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Informative.InfAssets.ProcedureDataSet import ProcedureDataSet
+from CIM15.Element import AssociationList, EMPTY
 
 class InspectionDataSet(ProcedureDataSet):
     """Documents the result of one inspection, a type of Procedure, for a given attribute of an asset.Documents the result of one inspection, a type of Procedure, for a given attribute of an asset.
@@ -33,8 +34,9 @@ class InspectionDataSet(ProcedureDataSet):
         #: Description of the conditions of the location where the asset resides.
         self.locationCondition = locationCondition
 
-        self._AccordingToSchedules = []
-        self.AccordingToSchedules = [] if AccordingToSchedules is None else AccordingToSchedules
+        self._AccordingToSchedules = EMPTY
+        if AccordingToSchedules is not None:
+            self.AccordingToSchedules = AccordingToSchedules
 
         super(InspectionDataSet, self).__init__(*args, **kw_args)
 
@@ -50,6 +52,7 @@ class InspectionDataSet(ProcedureDataSet):
         return self._AccordingToSchedules
 
     def setAccordingToSchedules(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._AccordingToSchedules:
             x.ForInspectionDataSet = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class LaborItem(IdentifiedObject):
     """Labor used for work order.Labor used for work order.
@@ -48,8 +49,9 @@ class LaborItem(IdentifiedObject):
         #: Activity code identifies a specific and distinguishable unit of work.
         self.activityCode = activityCode
 
-        self._ErpPersons = []
-        self.ErpPersons = [] if ErpPersons is None else ErpPersons
+        self._ErpPersons = EMPTY
+        if ErpPersons is not None:
+            self.ErpPersons = ErpPersons
 
         self._WorkTask = None
         self.WorkTask = WorkTask
@@ -73,21 +75,28 @@ class LaborItem(IdentifiedObject):
         return self._ErpPersons
 
     def setErpPersons(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ErpPersons:
-            filtered = [q for q in p.LaborItems if q != self]
-            self._ErpPersons._LaborItems = filtered
+            p._LaborItems.discard(self)
         for r in value:
-            if self not in r._LaborItems:
-                r._LaborItems.append(self)
+            if r._LaborItems is EMPTY:
+                r._LaborItems = AssociationList([self])
+            else:
+                r._LaborItems.add(self)
         self._ErpPersons = value
 
     ErpPersons = property(getErpPersons, setErpPersons)
 
     def addErpPersons(self, *ErpPersons):
         for obj in ErpPersons:
-            if self not in obj._LaborItems:
-                obj._LaborItems.append(self)
-            self._ErpPersons.append(obj)
+            if obj._LaborItems is EMPTY:
+                obj._LaborItems = AssociationList([self])
+            else:
+                obj._LaborItems.add(self)
+            if self._ErpPersons is EMPTY:
+                self._ErpPersons = AssociationList([obj])
+            else:
+                self._ErpPersons.add(obj)
 
     def removeErpPersons(self, *ErpPersons):
         for obj in ErpPersons:
@@ -101,13 +110,14 @@ class LaborItem(IdentifiedObject):
 
     def setWorkTask(self, value):
         if self._WorkTask is not None:
-            filtered = [x for x in self.WorkTask.LaborItems if x != self]
-            self._WorkTask._LaborItems = filtered
+            self._WorkTask._LaborItems.discard(self)
 
         self._WorkTask = value
         if self._WorkTask is not None:
-            if self not in self._WorkTask._LaborItems:
-                self._WorkTask._LaborItems.append(self)
+            if self._WorkTask._LaborItems is EMPTY:
+                self._WorkTask._LaborItems = AssociationList([self])
+            else:
+                self._WorkTask._LaborItems.add(self)
 
     WorkTask = property(getWorkTask, setWorkTask)
 
@@ -119,13 +129,14 @@ class LaborItem(IdentifiedObject):
 
     def setWorkCostDetail(self, value):
         if self._WorkCostDetail is not None:
-            filtered = [x for x in self.WorkCostDetail.LaborItems if x != self]
-            self._WorkCostDetail._LaborItems = filtered
+            self._WorkCostDetail._LaborItems.discard(self)
 
         self._WorkCostDetail = value
         if self._WorkCostDetail is not None:
-            if self not in self._WorkCostDetail._LaborItems:
-                self._WorkCostDetail._LaborItems.append(self)
+            if self._WorkCostDetail._LaborItems is EMPTY:
+                self._WorkCostDetail._LaborItems = AssociationList([self])
+            else:
+                self._WorkCostDetail._LaborItems.add(self)
 
     WorkCostDetail = property(getWorkCostDetail, setWorkCostDetail)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class MaterialItem(IdentifiedObject):
     """The physical consumable supply used for work and other purposes. It includes items such as nuts, bolts, brackets, glue, etc.The physical consumable supply used for work and other purposes. It includes items such as nuts, bolts, brackets, glue, etc.
@@ -65,17 +66,21 @@ class MaterialItem(IdentifiedObject):
         #: The actual cost of this particular material in this particular quantity.
         self.actualCost = actualCost
 
-        self._ErpInventoryCounts = []
-        self.ErpInventoryCounts = [] if ErpInventoryCounts is None else ErpInventoryCounts
+        self._ErpInventoryCounts = EMPTY
+        if ErpInventoryCounts is not None:
+            self.ErpInventoryCounts = ErpInventoryCounts
 
-        self._Usages = []
-        self.Usages = [] if Usages is None else Usages
+        self._Usages = EMPTY
+        if Usages is not None:
+            self.Usages = Usages
 
-        self._ErpPOLineItems = []
-        self.ErpPOLineItems = [] if ErpPOLineItems is None else ErpPOLineItems
+        self._ErpPOLineItems = EMPTY
+        if ErpPOLineItems is not None:
+            self.ErpPOLineItems = ErpPOLineItems
 
-        self._ErpRecDelvLineItems = []
-        self.ErpRecDelvLineItems = [] if ErpRecDelvLineItems is None else ErpRecDelvLineItems
+        self._ErpRecDelvLineItems = EMPTY
+        if ErpRecDelvLineItems is not None:
+            self.ErpRecDelvLineItems = ErpRecDelvLineItems
 
         self._DesignLocation = None
         self.DesignLocation = DesignLocation
@@ -105,6 +110,7 @@ class MaterialItem(IdentifiedObject):
         return self._ErpInventoryCounts
 
     def setErpInventoryCounts(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ErpInventoryCounts:
             x.MaterialItem = None
         for y in value:
@@ -126,6 +132,7 @@ class MaterialItem(IdentifiedObject):
         return self._Usages
 
     def setUsages(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Usages:
             x.MaterialItem = None
         for y in value:
@@ -147,6 +154,7 @@ class MaterialItem(IdentifiedObject):
         return self._ErpPOLineItems
 
     def setErpPOLineItems(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ErpPOLineItems:
             x.MaterialItem = None
         for y in value:
@@ -168,21 +176,28 @@ class MaterialItem(IdentifiedObject):
         return self._ErpRecDelvLineItems
 
     def setErpRecDelvLineItems(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ErpRecDelvLineItems:
-            filtered = [q for q in p.MaterialItems if q != self]
-            self._ErpRecDelvLineItems._MaterialItems = filtered
+            p._MaterialItems.discard(self)
         for r in value:
-            if self not in r._MaterialItems:
-                r._MaterialItems.append(self)
+            if r._MaterialItems is EMPTY:
+                r._MaterialItems = AssociationList([self])
+            else:
+                r._MaterialItems.add(self)
         self._ErpRecDelvLineItems = value
 
     ErpRecDelvLineItems = property(getErpRecDelvLineItems, setErpRecDelvLineItems)
 
     def addErpRecDelvLineItems(self, *ErpRecDelvLineItems):
         for obj in ErpRecDelvLineItems:
-            if self not in obj._MaterialItems:
-                obj._MaterialItems.append(self)
-            self._ErpRecDelvLineItems.append(obj)
+            if obj._MaterialItems is EMPTY:
+                obj._MaterialItems = AssociationList([self])
+            else:
+                obj._MaterialItems.add(self)
+            if self._ErpRecDelvLineItems is EMPTY:
+                self._ErpRecDelvLineItems = AssociationList([obj])
+            else:
+                self._ErpRecDelvLineItems.add(obj)
 
     def removeErpRecDelvLineItems(self, *ErpRecDelvLineItems):
         for obj in ErpRecDelvLineItems:
@@ -196,13 +211,14 @@ class MaterialItem(IdentifiedObject):
 
     def setDesignLocation(self, value):
         if self._DesignLocation is not None:
-            filtered = [x for x in self.DesignLocation.MaterialItems if x != self]
-            self._DesignLocation._MaterialItems = filtered
+            self._DesignLocation._MaterialItems.discard(self)
 
         self._DesignLocation = value
         if self._DesignLocation is not None:
-            if self not in self._DesignLocation._MaterialItems:
-                self._DesignLocation._MaterialItems.append(self)
+            if self._DesignLocation._MaterialItems is EMPTY:
+                self._DesignLocation._MaterialItems = AssociationList([self])
+            else:
+                self._DesignLocation._MaterialItems.add(self)
 
     DesignLocation = property(getDesignLocation, setDesignLocation)
 
@@ -214,13 +230,14 @@ class MaterialItem(IdentifiedObject):
 
     def setTypeMaterial(self, value):
         if self._TypeMaterial is not None:
-            filtered = [x for x in self.TypeMaterial.MaterialItems if x != self]
-            self._TypeMaterial._MaterialItems = filtered
+            self._TypeMaterial._MaterialItems.discard(self)
 
         self._TypeMaterial = value
         if self._TypeMaterial is not None:
-            if self not in self._TypeMaterial._MaterialItems:
-                self._TypeMaterial._MaterialItems.append(self)
+            if self._TypeMaterial._MaterialItems is EMPTY:
+                self._TypeMaterial._MaterialItems = AssociationList([self])
+            else:
+                self._TypeMaterial._MaterialItems.add(self)
 
     TypeMaterial = property(getTypeMaterial, setTypeMaterial)
 
@@ -230,13 +247,14 @@ class MaterialItem(IdentifiedObject):
 
     def setWorkCostDetail(self, value):
         if self._WorkCostDetail is not None:
-            filtered = [x for x in self.WorkCostDetail.MaterialItems if x != self]
-            self._WorkCostDetail._MaterialItems = filtered
+            self._WorkCostDetail._MaterialItems.discard(self)
 
         self._WorkCostDetail = value
         if self._WorkCostDetail is not None:
-            if self not in self._WorkCostDetail._MaterialItems:
-                self._WorkCostDetail._MaterialItems.append(self)
+            if self._WorkCostDetail._MaterialItems is EMPTY:
+                self._WorkCostDetail._MaterialItems = AssociationList([self])
+            else:
+                self._WorkCostDetail._MaterialItems.add(self)
 
     WorkCostDetail = property(getWorkCostDetail, setWorkCostDetail)
 
@@ -246,13 +264,14 @@ class MaterialItem(IdentifiedObject):
 
     def setWorkTask(self, value):
         if self._WorkTask is not None:
-            filtered = [x for x in self.WorkTask.MaterialItems if x != self]
-            self._WorkTask._MaterialItems = filtered
+            self._WorkTask._MaterialItems.discard(self)
 
         self._WorkTask = value
         if self._WorkTask is not None:
-            if self not in self._WorkTask._MaterialItems:
-                self._WorkTask._MaterialItems.append(self)
+            if self._WorkTask._MaterialItems is EMPTY:
+                self._WorkTask._MaterialItems = AssociationList([self])
+            else:
+                self._WorkTask._MaterialItems.add(self)
 
     WorkTask = property(getWorkTask, setWorkTask)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class MiscCostItem(IdentifiedObject):
     """Various cost items that are not associated with compatible units. Examples include rental equipment, labor, materials, contractor costs, permits - anything not covered in a CU.Various cost items that are not associated with compatible units. Examples include rental equipment, labor, materials, contractor costs, permits - anything not covered in a CU.
@@ -78,13 +79,14 @@ class MiscCostItem(IdentifiedObject):
 
     def setDesignLocation(self, value):
         if self._DesignLocation is not None:
-            filtered = [x for x in self.DesignLocation.MiscCostItems if x != self]
-            self._DesignLocation._MiscCostItems = filtered
+            self._DesignLocation._MiscCostItems.discard(self)
 
         self._DesignLocation = value
         if self._DesignLocation is not None:
-            if self not in self._DesignLocation._MiscCostItems:
-                self._DesignLocation._MiscCostItems.append(self)
+            if self._DesignLocation._MiscCostItems is EMPTY:
+                self._DesignLocation._MiscCostItems = AssociationList([self])
+            else:
+                self._DesignLocation._MiscCostItems.add(self)
 
     DesignLocation = property(getDesignLocation, setDesignLocation)
 
@@ -96,13 +98,14 @@ class MiscCostItem(IdentifiedObject):
 
     def setWorkTask(self, value):
         if self._WorkTask is not None:
-            filtered = [x for x in self.WorkTask.MiscCostItems if x != self]
-            self._WorkTask._MiscCostItems = filtered
+            self._WorkTask._MiscCostItems.discard(self)
 
         self._WorkTask = value
         if self._WorkTask is not None:
-            if self not in self._WorkTask._MiscCostItems:
-                self._WorkTask._MiscCostItems.append(self)
+            if self._WorkTask._MiscCostItems is EMPTY:
+                self._WorkTask._MiscCostItems = AssociationList([self])
+            else:
+                self._WorkTask._MiscCostItems.add(self)
 
     WorkTask = property(getWorkTask, setWorkTask)
 
@@ -112,13 +115,14 @@ class MiscCostItem(IdentifiedObject):
 
     def setWorkCostDetail(self, value):
         if self._WorkCostDetail is not None:
-            filtered = [x for x in self.WorkCostDetail.MiscCostItems if x != self]
-            self._WorkCostDetail._MiscCostItems = filtered
+            self._WorkCostDetail._MiscCostItems.discard(self)
 
         self._WorkCostDetail = value
         if self._WorkCostDetail is not None:
-            if self not in self._WorkCostDetail._MiscCostItems:
-                self._WorkCostDetail._MiscCostItems.append(self)
+            if self._WorkCostDetail._MiscCostItems is EMPTY:
+                self._WorkCostDetail._MiscCostItems = AssociationList([self])
+            else:
+                self._WorkCostDetail._MiscCostItems.add(self)
 
     WorkCostDetail = property(getWorkCostDetail, setWorkCostDetail)
 
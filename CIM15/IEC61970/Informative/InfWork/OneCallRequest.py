@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import AssociationList, EMPTY
 
 class OneCallRequest(Document):
     """A request for other utilities to mark their underground facilities prior to commencement of construction and/or maintenance.A request for other utilities to mark their underground facilities prior to commencement of construction and/or maintenance.
@@ -41,8 +42,9 @@ class OneCallRequest(Document):
         #: Instructions for marking a dig area, if applicable.
         self.markingInstruction = markingInstruction
 
-        self._WorkLocations = []
-        self.WorkLocations = [] if WorkLocations is None else WorkLocations
+        self._WorkLocations = EMPTY
+        if WorkLocations is not None:
+            self.WorkLocations = WorkLocations
 
         super(OneCallRequest, self).__init__(*args, **kw_args)
 
@@ -58,6 +60,7 @@ class OneCallRequest(Document):
         return self._WorkLocations
 
     def setWorkLocations(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._WorkLocations:
             x.OneCallRequest = None
         for y in value:
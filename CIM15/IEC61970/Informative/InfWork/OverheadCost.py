@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class OverheadCost(IdentifiedObject):
     """Overhead cost applied to work order.Overhead cost applied to work order.
@@ -41,11 +42,13 @@ class OverheadCost(IdentifiedObject):
 
         self.status = status
 
-        self._WorkCostDetails = []
-        self.WorkCostDetails = [] if WorkCostDetails is None else WorkCostDetails
+        self._WorkCostDetails = EMPTY
+        if WorkCostDetails is not None:
+            self.WorkCostDetails = WorkCostDetails
 
-        self._WorkTasks = []
-        self.WorkTasks = [] if WorkTasks is None else WorkTasks
+        self._WorkTasks = EMPTY
+        if WorkTasks is not None:
+            self.WorkTasks = WorkTasks
 
         super(OverheadCost, self).__init__(*args, **kw_args)
 
@@ -63,6 +66,7 @@ class OverheadCost(IdentifiedObject):
         return self._WorkCostDetails
 
     def setWorkCostDetails(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._WorkCostDetails:
             x.OverheadCost = None
         for y in value:
@@ -84,6 +88,7 @@ class OverheadCost(IdentifiedObject):
         return self._WorkTasks
 
     def setWorkTasks(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._WorkTasks:
             x.OverheadCost = None
         for y in value:
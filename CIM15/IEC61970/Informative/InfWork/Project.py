@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import AssociationList, EMPTY
 
 class Project(Document):
     """A collection of related work. For construction projects and maintenance projects, multiple phases may be performed.A collection of related work. For construction projects and maintenance projects, multiple phases may be performed.
@@ -41,17 +42,20 @@ class Project(Document):
         self._BusinessCase = None
         self.BusinessCase = BusinessCase
 
-        self._SubProjects = []
-        self.SubProjects = [] if SubProjects is None else SubProjects
+        self._SubProjects = EMPTY
+        if SubProjects is not None:
+            self.SubProjects = SubProjects
 
         self._ErpProjectAccounting = None
         self.ErpProjectAccounting = ErpProjectAccounting
 
-        self._Requests = []
-        self.Requests = [] if Requests is None else Requests
+        self._Requests = EMPTY
+        if Requests is not None:
+            self.Requests = Requests
 
-        self._Works = []
-        self.Works = [] if Works is None else Works
+        self._Works = EMPTY
+        if Works is not None:
+            self.Works = Works
 
         self._ParentProject = None
         self.ParentProject = ParentProject
@@ -71,13 +75,14 @@ class Project(Document):
 
     def setBusinessCase(self, value):
         if self._BusinessCase is not None:
-            filtered = [x for x in self.BusinessCase.Projects if x != self]
-            self._BusinessCase._Projects = filtered
+            self._BusinessCase._Projects.discard(self)
 
         self._BusinessCase = value
         if self._BusinessCase is not None:
-            if self not in self._BusinessCase._Projects:
-                self._BusinessCase._Projects.append(self)
+            if self._BusinessCase._Projects is EMPTY:
+                self._BusinessCase._Projects = AssociationList([self])
+            else:
+                self._BusinessCase._Projects.add(self)
 
     BusinessCase = property(getBusinessCase, setBusinessCase)
 
@@ -86,6 +91,7 @@ class Project(Document):
         return self._SubProjects
 
     def setSubProjects(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._SubProjects:
             x.ParentProject = None
         for y in value:
@@ -108,13 +114,14 @@ class Project(Document):
 
     def setErpProjectAccounting(self, value):
         if self._ErpProjectAccounting is not None:
-            filtered = [x for x in self.ErpProjectAccounting.Projects if x != self]
-            self._ErpProjectAccounting._Projects = filtered
+            self._ErpProjectAccounting._Projects.discard(self)
 
         self._ErpProjectAccounting = value
         if self._ErpProjectAccounting is not None:
-            if self not in self._ErpProjectAccounting._Projects:
-                self._ErpProjectAccounting._Projects.append(self)
+            if self._ErpProjectAccounting._Projects is EMPTY:
+                self._ErpProjectAccounting._Projects = AssociationList([self])
+            else:
+                self._ErpProjectAccounting._Projects.add(self)
 
     ErpProjectAccounting = property(getErpProjectAccounting, setErpProjectAccounting)
 
@@ -123,21 +130,28 @@ class Project(Document):
         return self._Requests
 
     def setRequests(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Requests:
-            filtered = [q for q in p.Projects if q != self]
-            self._Requests._Projects = filtered
+            p._Projects.discard(self)
         for r in value:
-            if self not in r._Projects:
-                r._Projects.append(self)
+            if r._Projects is EMPTY:
+                r._Projects = AssociationList([self])
+            else:
+                r._Projects.add(self)
         self._Requests = value
 
     Requests = property(getRequests, setRequests)
 
     def addRequests(self, *Requests):
         for obj in Requests:
-            if self not in obj._Projects:
-                obj._Projects.append(self)
-            self._Requests.append(obj)
+            if obj._Projects is EMPTY:
+                obj._Projects = AssociationList([self])
+            else:
+                obj._Projects.add(self)
+            if self._Requests is EMPTY:
+                self._Requests = AssociationList([obj])
+            else:
+                self._Requests.add(obj)
 
     def removeRequests(self, *Requests):
         for obj in Requests:
@@ -150,6 +164,7 @@ class Project(Document):
         return self._Works
 
     def setWorks(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Works:
             x.Project = None
         for y in value:
@@ -172,13 +187,14 @@ class Project(Document):
 
     def setParentProject(self, value):
         if self._ParentProject is not None:
-            filtered = [x for x in self.ParentProject.SubProjects if x != self]
-            self._ParentProject._SubProjects = filtered
+            self._ParentProject._SubProjects.discard(self)
 
         self._ParentProject = value
         if self._ParentProject is not None:
-            if self not in self._ParentProject._SubProjects:
-                self._ParentProject._SubProjects.append(self)
+            if self._ParentProject._SubProjects is EMPTY:
+                self._ParentProject._SubProjects = AssociationList([self])
+            else:
+                self._ParentProject._SubProjects.add(self)
 
     ParentProject = property(getParentProject, setParentProject)
 
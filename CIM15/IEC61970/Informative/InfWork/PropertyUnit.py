@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class PropertyUnit(IdentifiedObject):
     """Unit of property for reporting purposes.Unit of property for reporting purposes.
@@ -46,14 +47,17 @@ class PropertyUnit(IdentifiedObject):
 
         self.status = status
 
-        self._CompatibleUnits = []
-        self.CompatibleUnits = [] if CompatibleUnits is None else CompatibleUnits
+        self._CompatibleUnits = EMPTY
+        if CompatibleUnits is not None:
+            self.CompatibleUnits = CompatibleUnits
 
-        self._CUMaterialItems = []
-        self.CUMaterialItems = [] if CUMaterialItems is None else CUMaterialItems
+        self._CUMaterialItems = EMPTY
+        if CUMaterialItems is not None:
+            self.CUMaterialItems = CUMaterialItems
 
-        self._WorkCostDetails = []
-        self.WorkCostDetails = [] if WorkCostDetails is None else WorkCostDetails
+        self._WorkCostDetails = EMPTY
+        if WorkCostDetails is not None:
+            self.WorkCostDetails = WorkCostDetails
 
         super(PropertyUnit, self).__init__(*args, **kw_args)
 
@@ -71,6 +75,7 @@ class PropertyUnit(IdentifiedObject):
         return self._CompatibleUnits
 
     def setCompatibleUnits(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._CompatibleUnits:
             x.PropertyUnit = None
         for y in value:
@@ -92,21 +97,28 @@ class PropertyUnit(IdentifiedObject):
         return self._CUMaterialItems
 
     def setCUMaterialItems(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._CUMaterialItems:
-            filtered = [q for q in p.PropertyUnits if q != self]
-            self._CUMaterialItems._PropertyUnits = filtered
+            p._PropertyUnits.discard(self)
         for r in value:
-            if self not in r._PropertyUnits:
-                r._PropertyUnits.append(self)
+            if r._PropertyUnits is EMPTY:
+                r._PropertyUnits = AssociationList([self])
+            else:
+                r._PropertyUnits.add(self)
         self._CUMaterialItems = value
 
     CUMaterialItems = property(getCUMaterialItems, setCUMaterialItems)
 
     def addCUMaterialItems(self, *CUMaterialItems):
         for obj in CUMaterialItems:
-            if self not in obj._PropertyUnits:
-                obj._PropertyUnits.append(self)
-            self._CUMaterialItems.append(obj)
+            if obj._PropertyUnits is EMPTY:
+                obj._PropertyUnits = AssociationList([self])
+            else:
+                obj._PropertyUnits.add(self)
+            if self._CUMaterialItems is EMPTY:
+                self._CUMaterialItems = AssociationList([obj])
+            else:
+                self._CUMaterialItems.add(obj)
 
     def removeCUMaterialItems(self, *CUMaterialItems):
         for obj in CUMaterialItems:
@@ -119,21 +131,28 @@ class PropertyUnit(IdentifiedObject):
         return self._WorkCostDetails
 
     def setWorkCostDetails(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._WorkCostDetails:
-            filtered = [q for q in p.PropertyUnits if q != self]
-            self._WorkCostDetails._PropertyUnits = filtered
+            p._PropertyUnits.discard(self)
         for r in value:
-            if self not in r._PropertyUnits:
-                r._PropertyUnits.append(self)
+            if r._PropertyUnits is EMPTY:
+                r._PropertyUnits = AssociationList([self])
+            else:
+                r._PropertyUnits.add(self)
         self._WorkCostDetails = value
 
     WorkCostDetails = property(getWorkCostDetails, setWorkCostDetails)
 
     def addWorkCostDetails(self, *WorkCostDetails):
         for obj in WorkCostDetails:
-            if self not in obj._PropertyUnits:
-                obj._PropertyUnits.append(self)
-            self._WorkCostDetails.append(obj)
+            if obj._PropertyUnits is EMPTY:
+                obj._PropertyUnits = AssociationList([self])
+            else:
+                obj._PropertyUnits.add(self)
+            if self._WorkCostDetails is EMPTY:
+                self._WorkCostDetails = AssociationList([obj])
+            else:
+                self._WorkCostDetails.add(obj)
 
     def removeWorkCostDetails(self, *WorkCostDetails):
         for obj in WorkCostDetails:
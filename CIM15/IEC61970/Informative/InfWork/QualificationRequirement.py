@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class QualificationRequirement(IdentifiedObject):
     """Certain skills are required and must be certified in order for a person (typically a member of a crew) to be qualified to work on types of equipment.Certain skills are required and must be certified in order for a person (typically a member of a crew) to be qualified to work on types of equipment.
@@ -36,17 +37,21 @@ class QualificationRequirement(IdentifiedObject):
         #: Qualification identifier.
         self.qualificationID = qualificationID
 
-        self._WorkTasks = []
-        self.WorkTasks = [] if WorkTasks is None else WorkTasks
+        self._WorkTasks = EMPTY
+        if WorkTasks is not None:
+            self.WorkTasks = WorkTasks
 
-        self._Skills = []
-        self.Skills = [] if Skills is None else Skills
+        self._Skills = EMPTY
+        if Skills is not None:
+            self.Skills = Skills
 
-        self._CULaborItems = []
-        self.CULaborItems = [] if CULaborItems is None else CULaborItems
+        self._CULaborItems = EMPTY
+        if CULaborItems is not None:
+            self.CULaborItems = CULaborItems
 
-        self._Specifications = []
-        self.Specifications = [] if Specifications is None else Specifications
+        self._Specifications = EMPTY
+        if Specifications is not None:
+            self.Specifications = Specifications
 
         super(QualificationRequirement, self).__init__(*args, **kw_args)
 
@@ -62,21 +67,28 @@ class QualificationRequirement(IdentifiedObject):
         return self._WorkTasks
 
     def setWorkTasks(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._WorkTasks:
-            filtered = [q for q in p.QualificationRequirements if q != self]
-            self._WorkTasks._QualificationRequirements = filtered
+            p._QualificationRequirements.discard(self)
         for r in value:
-            if self not in r._QualificationRequirements:
-                r._QualificationRequirements.append(self)
+            if r._QualificationRequirements is EMPTY:
+                r._QualificationRequirements = AssociationList([self])
+            else:
+                r._QualificationRequirements.add(self)
         self._WorkTasks = value
 
     WorkTasks = property(getWorkTasks, setWorkTasks)
 
     def addWorkTasks(self, *WorkTasks):
         for obj in WorkTasks:
-            if self not in obj._QualificationRequirements:
-                obj._QualificationRequirements.append(self)
-            self._WorkTasks.append(obj)
+            if obj._QualificationRequirements is EMPTY:
+                obj._QualificationRequirements = AssociationList([self])
+            else:
+                obj._QualificationRequirements.add(self)
+            if self._WorkTasks is EMPTY:
+                self._WorkTasks = AssociationList([obj])
+            else:
+                self._WorkTasks.add(obj)
 
     def removeWorkTasks(self, *WorkTasks):
         for obj in WorkTasks:
@@ -89,21 +101,28 @@ class QualificationRequirement(IdentifiedObject):
         return self._Skills
 
     def setSkills(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Skills:
-            filtered = [q for q in p.QualificationRequirements if q != self]
-            self._Skills._QualificationRequirements = filtered
+            p._QualificationRequirements.discard(self)
         for r in value:
-            if self not in r._QualificationRequirements:
-                r._QualificationRequirements.append(self)
+            if r._QualificationRequirements is EMPTY:
+                r._QualificationRequirements = AssociationList([self])
+            else:
+                r._QualificationRequirements.add(self)
         self._Skills = value
 
     Skills = property(getSkills, setSkills)
 
     def addSkills(self, *Skills):
         for obj in Skills:
-            if self not in obj._QualificationRequirements:
-                obj._QualificationRequirements.append(self)
-            self._Skills.append(obj)
+            if obj._QualificationRequirements is EMPTY:
+                obj._QualificationRequirements = AssociationList([self])
+            else:
+                obj._QualificationRequirements.add(self)
+            if self._Skills is EMPTY:
+                self._Skills = AssociationList([obj])
+            else:
+                self._Skills.add(obj)
 
     def removeSkills(self, *Skills):
         for obj in Skills:
@@ -116,21 +135,28 @@ class QualificationRequirement(IdentifiedObject):
         return self._CULaborItems
 
     def setCULaborItems(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._CULaborItems:
-            filtered = [q for q in p.QualificationRequirements if q != self]
-            self._CULaborItems._QualificationRequirements = filtered
+            p._QualificationRequirements.discard(self)
         for r in value:
-            if self not in r._QualificationRequirements:
-                r._QualificationRequirements.append(self)
+            if r._QualificationRequirements is EMPTY:
+                r._QualificationRequirements = AssociationList([self])
+            else:
+                r._QualificationRequirements.add(self)
         self._CULaborItems = value
 
     CULaborItems = property(getCULaborItems, setCULaborItems)
 
     def addCULaborItems(self, *CULaborItems):
         for obj in CULaborItems:
-            if self not in obj._QualificationRequirements:
-                obj._QualificationRequirements.append(self)
-            self._CULaborItems.append(obj)
+            if obj._QualificationRequirements is EMPTY:
+                obj._QualificationRequirements = AssociationList([self])
+            else:
+                obj._QualificationRequirements.add(self)
+            if self._CULaborItems is EMPTY:
+                self._CULaborItems = AssociationList([obj])
+            else:
+                self._CULaborItems.add(obj)
 
     def removeCULaborItems(self, *CULaborItems):
         for obj in CULaborItems:
@@ -143,21 +169,28 @@ class QualificationRequirement(IdentifiedObject):
         return self._Specifications
 
     def setSpecifications(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Specifications:
-            filtered = [q for q in p.QualificationRequirements if q != self]
-            self._Specifications._QualificationRequirements = filtered
+            p._QualificationRequirements.discard(self)
         for r in value:
-            if self not in r._QualificationRequirements:
-                r._QualificationRequirements.append(self)
+            if r._QualificationRequirements is EMPTY:
+                r._QualificationRequirements = AssociationList([self])
+            else:
+                r._QualificationRequirements.add(self)
         self._Specifications = value
 
     Specifications = property(getSpecifications, setSpecifications)
 
     def addSpecifications(self, *Specifications):
         for obj in Specifications:
-            if self not in obj._QualificationRequirements:
-                obj._QualificationRequirements.append(self)
-            self._Specifications.append(obj)
+            if obj._QualificationRequirements is EMPTY:
+                obj._QualificationRequirements = AssociationList([self])
+            else:
+                obj._QualificationRequirements.add(self)
+            if self._Specifications is EMPTY:
+                self._Specifications = AssociationList([obj])
+            else:
+                self._Specifications.add(obj)
 
     def removeSpecifications(self, *Specifications):
         for obj in Specifications:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import AssociationList, EMPTY
 
 class Request(Document):
     """A request for work, service or project.A request for work, service or project.
@@ -47,14 +48,16 @@ class Request(Document):
         self._ErpQuoteLineItem = None
         self.ErpQuoteLineItem = ErpQuoteLineItem
 
-        self._Projects = []
-        self.Projects = [] if Projects is None else Projects
+        self._Projects = EMPTY
+        if Projects is not None:
+            self.Projects = Projects
 
         self._Organisation = None
         self.Organisation = Organisation
 
-        self._Works = []
-        self.Works = [] if Works is None else Works
+        self._Works = EMPTY
+        if Works is not None:
+            self.Works = Works
 
         super(Request, self).__init__(*args, **kw_args)
 
@@ -85,21 +88,28 @@ class Request(Document):
         return self._Projects
 
     def setProjects(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Projects:
-            filtered = [q for q in p.Requests if q != self]
-            self._Projects._Requests = filtered
+            p._Requests.discard(self)
         for r in value:
-            if self not in r._Requests:
-                r._Requests.append(self)
+            if r._Requests is EMPTY:
+                r._Requests = AssociationList([self])
+            else:
+                r._Requests.add(self)
         self._Projects = value
 
     Projects = property(getProjects, setProjects)
 
     def addProjects(self, *Projects):
         for obj in Projects:
-            if self not in obj._Requests:
-                obj._Requests.append(self)
-            self._Projects.append(obj)
+            if obj._Requests is EMPTY:
+                obj._Requests = AssociationList([self])
+            else:
+                obj._Requests.add(self)
+            if self._Projects is EMPTY:
+                self._Projects = AssociationList([obj])
+            else:
+                self._Projects.add(obj)
 
     def removeProjects(self, *Projects):
         for obj in Projects:
@@ -113,13 +123,14 @@ class Request(Document):
 
     def setOrganisation(self, value):
         if self._Organisation is not None:
-            filtered = [x for x in self.Organisation.Requests if x != self]
-            self._Organisation._Requests = filtered
+            self._Organisation._Requests.discard(self)
 
         self._Organisation = value
         if self._Organisation is not None:
-            if self not in self._Organisation._Requests:
-                self._Organisation._Requests.append(self)
+            if self._Organisation._Requests is EMPTY:
+                self._Organisation._Requests = AssociationList([self])
+            else:
+                self._Organisation._Requests.add(self)
 
     Organisation = property(getOrganisation, setOrganisation)
 
@@ -128,6 +139,7 @@ class Request(Document):
         return self._Works
 
     def setWorks(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Works:
             x.Request = None
         for y in value:
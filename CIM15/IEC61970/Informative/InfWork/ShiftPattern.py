@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class ShiftPattern(IdentifiedObject):
     """The patterns of shifts worked by people or crews.The patterns of shifts worked by people or crews.
@@ -39,8 +40,9 @@ class ShiftPattern(IdentifiedObject):
         #: Type of assignement intended to be worked on this shift, for example, temporary, standard, etc.
         self.assignmentType = assignmentType
 
-        self._Crews = []
-        self.Crews = [] if Crews is None else Crews
+        self._Crews = EMPTY
+        if Crews is not None:
+            self.Crews = Crews
 
         self.status = status
 
@@ -60,21 +62,28 @@ class ShiftPattern(IdentifiedObject):
         return self._Crews
 
     def setCrews(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Crews:
-            filtered = [q for q in p.ShiftPatterns if q != self]
-            self._Crews._ShiftPatterns = filtered
+            p._ShiftPatterns.discard(self)
         for r in value:
-            if self not in r._ShiftPatterns:
-                r._ShiftPatterns.append(self)
+            if r._ShiftPatterns is EMPTY:
+                r._ShiftPatterns = AssociationList([self])
+            else:
+                r._ShiftPatterns.add(self)
         self._Crews = value
 
     Crews = property(getCrews, setCrews)
 
     def addCrews(self, *Crews):
         for obj in Crews:
-            if self not in obj._ShiftPatterns:
-                obj._ShiftPatterns.append(self)
-            self._Crews.append(obj)
+            if obj._ShiftPatterns is EMPTY:
+                obj._ShiftPatterns = AssociationList([self])
+            else:
+                obj._ShiftPatterns.add(self)
+            if self._Crews is EMPTY:
+                self._Crews = AssociationList([obj])
+            else:
+                self._Crews.add(obj)
 
     def removeCrews(self, *Crews):
         for obj in Crews:
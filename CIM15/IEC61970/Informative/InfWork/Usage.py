@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class Usage(IdentifiedObject):
     """The way material and assets are used to perform a certain type of work task. The way is described in text in the inheritied description attribute.The way material and assets are used to perform a certain type of work task. The way is described in text in the inheritied description attribute.
@@ -58,13 +59,14 @@ class Usage(IdentifiedObject):
 
     def setWorkTask(self, value):
         if self._WorkTask is not None:
-            filtered = [x for x in self.WorkTask.Usages if x != self]
-            self._WorkTask._Usages = filtered
+            self._WorkTask._Usages.discard(self)
 
         self._WorkTask = value
         if self._WorkTask is not None:
-            if self not in self._WorkTask._Usages:
-                self._WorkTask._Usages.append(self)
+            if self._WorkTask._Usages is EMPTY:
+                self._WorkTask._Usages = AssociationList([self])
+            else:
+                self._WorkTask._Usages.add(self)
 
     WorkTask = property(getWorkTask, setWorkTask)
 
@@ -74,13 +76,14 @@ class Usage(IdentifiedObject):
 
     def setWorkEquipmentAsset(self, value):
         if self._WorkEquipmentAsset is not None:
-            filtered = [x for x in self.WorkEquipmentAsset.Usages if x != self]
-            self._WorkEquipmentAsset._Usages = filtered
+            self._WorkEquipmentAsset._Usages.discard(self)
 
         self._WorkEquipmentAsset = value
         if self._WorkEquipmentAsset is not None:
-            if self not in self._WorkEquipmentAsset._Usages:
-                self._WorkEquipmentAsset._Usages.append(self)
+            if self._WorkEquipmentAsset._Usages is EMPTY:
+                self._WorkEquipmentAsset._Usages = AssociationList([self])
+            else:
+                self._WorkEquipmentAsset._Usages.add(self)
 
     WorkEquipmentAsset = property(getWorkEquipmentAsset, setWorkEquipmentAsset)
 
@@ -92,13 +95,14 @@ class Usage(IdentifiedObject):
 
     def setMaterialItem(self, value):
         if self._MaterialItem is not None:
-            filtered = [x for x in self.MaterialItem.Usages if x != self]
-            self._MaterialItem._Usages = filtered
+            self._MaterialItem._Usages.discard(self)
 
         self._MaterialItem = value
         if self._MaterialItem is not None:
-            if self not in self._MaterialItem._Usages:
-                self._MaterialItem._Usages.append(self)
+            if self._MaterialItem._Usages is EMPTY:
+                self._MaterialItem._Usages = AssociationList([self])
+            else:
+                self._MaterialItem._Usages.add(self)
 
     MaterialItem = property(getMaterialItem, setMaterialItem)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import AssociationList, EMPTY
 
 class WorkCostDetail(Document):
     """A collection of all of the individual cost items collected from multiple sources.A collection of all of the individual cost items collected from multiple sources.
@@ -60,35 +61,42 @@ class WorkCostDetail(Document):
         self._WorkTask = None
         self.WorkTask = WorkTask
 
-        self._Works = []
-        self.Works = [] if Works is None else Works
+        self._Works = EMPTY
+        if Works is not None:
+            self.Works = Works
 
         self._Design = None
         self.Design = Design
 
-        self._MiscCostItems = []
-        self.MiscCostItems = [] if MiscCostItems is None else MiscCostItems
+        self._MiscCostItems = EMPTY
+        if MiscCostItems is not None:
+            self.MiscCostItems = MiscCostItems
 
         self._WorkCostSummary = None
         self.WorkCostSummary = WorkCostSummary
 
-        self._PropertyUnits = []
-        self.PropertyUnits = [] if PropertyUnits is None else PropertyUnits
+        self._PropertyUnits = EMPTY
+        if PropertyUnits is not None:
+            self.PropertyUnits = PropertyUnits
 
         self._ErpProjectAccounting = None
         self.ErpProjectAccounting = ErpProjectAccounting
 
-        self._LaborItems = []
-        self.LaborItems = [] if LaborItems is None else LaborItems
+        self._LaborItems = EMPTY
+        if LaborItems is not None:
+            self.LaborItems = LaborItems
 
-        self._MaterialItems = []
-        self.MaterialItems = [] if MaterialItems is None else MaterialItems
+        self._MaterialItems = EMPTY
+        if MaterialItems is not None:
+            self.MaterialItems = MaterialItems
 
-        self._EquipmentItems = []
-        self.EquipmentItems = [] if EquipmentItems is None else EquipmentItems
+        self._EquipmentItems = EMPTY
+        if EquipmentItems is not None:
+            self.EquipmentItems = EquipmentItems
 
-        self._ContractorItems = []
-        self.ContractorItems = [] if ContractorItems is None else ContractorItems
+        self._ContractorItems = EMPTY
+        if ContractorItems is not None:
+            self.ContractorItems = ContractorItems
 
         self._OverheadCost = None
         self.OverheadCost = OverheadCost
@@ -111,13 +119,14 @@ class WorkCostDetail(Document):
 
     def setWorkTask(self, value):
         if self._WorkTask is not None:
-            filtered = [x for x in self.WorkTask.WorkCostDetails if x != self]
-            self._WorkTask._WorkCostDetails = filtered
+            self._WorkTask._WorkCostDetails.discard(self)
 
         self._WorkTask = value
         if self._WorkTask is not None:
-            if self not in self._WorkTask._WorkCostDetails:
-                self._WorkTask._WorkCostDetails.append(self)
+            if self._WorkTask._WorkCostDetails is EMPTY:
+                self._WorkTask._WorkCostDetails = AssociationList([self])
+            else:
+                self._WorkTask._WorkCostDetails.add(self)
 
     WorkTask = property(getWorkTask, setWorkTask)
 
@@ -126,21 +135,28 @@ class WorkCostDetail(Document):
         return self._Works
 
     def setWorks(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Works:
-            filtered = [q for q in p.WorkCostDetails if q != self]
-            self._Works._WorkCostDetails = filtered
+            p._WorkCostDetails.discard(self)
         for r in value:
-            if self not in r._WorkCostDetails:
-                r._WorkCostDetails.append(self)
+            if r._WorkCostDetails is EMPTY:
+                r._WorkCostDetails = AssociationList([self])
+            else:
+                r._WorkCostDetails.add(self)
         self._Works = value
 
     Works = property(getWorks, setWorks)
 
     def addWorks(self, *Works):
         for obj in Works:
-            if self not in obj._WorkCostDetails:
-                obj._WorkCostDetails.append(self)
-            self._Works.append(obj)
+            if obj._WorkCostDetails is EMPTY:
+                obj._WorkCostDetails = AssociationList([self])
+            else:
+                obj._WorkCostDetails.add(self)
+            if self._Works is EMPTY:
+                self._Works = AssociationList([obj])
+            else:
+                self._Works.add(obj)
 
     def removeWorks(self, *Works):
         for obj in Works:
@@ -154,13 +170,14 @@ class WorkCostDetail(Document):
 
     def setDesign(self, value):
         if self._Design is not None:
-            filtered = [x for x in self.Design.WorkCostDetails if x != self]
-            self._Design._WorkCostDetails = filtered
+            self._Design._WorkCostDetails.discard(self)
 
         self._Design = value
         if self._Design is not None:
-            if self not in self._Design._WorkCostDetails:
-                self._Design._WorkCostDetails.append(self)
+            if self._Design._WorkCostDetails is EMPTY:
+                self._Design._WorkCostDetails = AssociationList([self])
+            else:
+                self._Design._WorkCostDetails.add(self)
 
     Design = property(getDesign, setDesign)
 
@@ -169,6 +186,7 @@ class WorkCostDetail(Document):
         return self._MiscCostItems
 
     def setMiscCostItems(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._MiscCostItems:
             x.WorkCostDetail = None
         for y in value:
@@ -205,21 +223,28 @@ class WorkCostDetail(Document):
         return self._PropertyUnits
 
     def setPropertyUnits(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._PropertyUnits:
-            filtered = [q for q in p.WorkCostDetails if q != self]
-            self._PropertyUnits._WorkCostDetails = filtered
+            p._WorkCostDetails.discard(self)
         for r in value:
-            if self not in r._WorkCostDetails:
-                r._WorkCostDetails.append(self)
+            if r._WorkCostDetails is EMPTY:
+                r._WorkCostDetails = AssociationList([self])
+            else:
+                r._WorkCostDetails.add(self)
         self._PropertyUnits = value
 
     PropertyUnits = property(getPropertyUnits, setPropertyUnits)
 
     def addPropertyUnits(self, *PropertyUnits):
         for obj in PropertyUnits:
-            if self not in obj._WorkCostDetails:
-                obj._WorkCostDetails.append(self)
-            self._PropertyUnits.append(obj)
+            if obj._WorkCostDetails is EMPTY:
+                obj._WorkCostDetails = AssociationList([self])
+            else:
+                obj._WorkCostDetails.add(self)
+            if self._PropertyUnits is EMPTY:
+                self._PropertyUnits = AssociationList([obj])
+            else:
+                self._PropertyUnits.add(obj)
 
     def removePropertyUnits(self, *PropertyUnits):
         for obj in PropertyUnits:
@@ -233,13 +258,14 @@ class WorkCostDetail(Document):
 
     def setErpProjectAccounting(self, value):
         if self._ErpProjectAccounting is not None:
-            filtered = [x for x in self.ErpProjectAccounting.WorkCostDetails if x != self]
-            self._ErpProjectAccounting._WorkCostDetails = filtered
+            self._ErpProjectAccounting._WorkCostDetails.discard(self)
 
         self._ErpProjectAccounting = value
         if self._ErpProjectAccounting is not None:
-            if self not in self._ErpProjectAccounting._WorkCostDetails:
-                self._ErpProjectAccounting._WorkCostDetails.append(self)
+            if self._ErpProjectAccounting._WorkCostDetails is EMPTY:
+                self._ErpProjectAccounting._WorkCostDetails = AssociationList([self])
+            else:
+                self._ErpProjectAccounting._WorkCostDetails.add(self)
 
     ErpProjectAccounting = property(getErpProjectAccounting, setErpProjectAccounting)
 
@@ -248,6 +274,7 @@ class WorkCostDetail(Document):
         return self._LaborItems
 
     def setLaborItems(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._LaborItems:
             x.WorkCostDetail = None
         for y in value:
@@ -269,6 +296,7 @@ class WorkCostDetail(Document):
         return self._MaterialItems
 
     def setMaterialItems(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._MaterialItems:
             x.WorkCostDetail = None
         for y in value:
@@ -290,6 +318,7 @@ class WorkCostDetail(Document):
         return self._EquipmentItems
 
     def setEquipmentItems(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._EquipmentItems:
             x.WorkCostDetail = None
         for y in value:
@@ -311,6 +340,7 @@ class WorkCostDetail(Document):
         return self._ContractorItems
 
     def setContractorItems(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ContractorItems:
             x.WorkCostDetail = None
         for y in value:
@@ -333,13 +363,14 @@ class WorkCostDetail(Document):
 
     def setOverheadCost(self, value):
         if self._OverheadCost is not None:
-            filtered = [x for x in self.OverheadCost.WorkCostDetails if x != self]
-            self._OverheadCost._WorkCostDetails = filtered
+            self._OverheadCost._WorkCostDetails.discard(self)
 
         self._OverheadCost = value
         if self._OverheadCost is not None:
-            if self not in self._OverheadCost._WorkCostDetails:
-                self._OverheadCost._WorkCostDetails.append(self)
+            if self._OverheadCost._WorkCostDetails is EMPTY:
+                self._OverheadCost._WorkCostDetails = AssociationList([self])
+            else:
+                self._OverheadCost._WorkCostDetails.add(self)
 
     OverheadCost = property(getOverheadCost, setOverheadCost)
 
@@ -349,13 +380,14 @@ class WorkCostDetail(Document):
 
     def setCostType(self, value):
         if self._CostType is not None:
-            filtered = [x for x in self.CostType.WorkCostDetails if x != self]
-            self._CostType._WorkCostDetails = filtered
+            self._CostType._WorkCostDetails.discard(self)
 
         self._CostType = value
         if self._CostType is not None:
-            if self not in self._CostType._WorkCostDetails:
-                self._CostType._WorkCostDetails.append(self)
+            if self._CostType._WorkCostDetails is EMPTY:
+                self._CostType._WorkCostDetails = AssociationList([self])
+            else:
+                self._CostType._WorkCostDetails.add(self)
 
     CostType = property(getCostType, setCostType)
 
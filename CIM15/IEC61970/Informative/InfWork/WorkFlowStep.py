@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class WorkFlowStep(IdentifiedObject):
     """A pre-defined set of work steps for a given type of work.A pre-defined set of work steps for a given type of work.
@@ -35,8 +36,9 @@ class WorkFlowStep(IdentifiedObject):
         #: Used to define dependencies of each work flow step, which is for the instance of WorkTask associated with a given instance of WorkFlow.
         self.sequenceNumber = sequenceNumber
 
-        self._WorkTasks = []
-        self.WorkTasks = [] if WorkTasks is None else WorkTasks
+        self._WorkTasks = EMPTY
+        if WorkTasks is not None:
+            self.WorkTasks = WorkTasks
 
         self.status = status
 
@@ -57,6 +59,7 @@ class WorkFlowStep(IdentifiedObject):
         return self._WorkTasks
 
     def setWorkTasks(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._WorkTasks:
             x.WorkFlowStep = None
         for y in value:
@@ -81,13 +84,14 @@ class WorkFlowStep(IdentifiedObject):
 
     def setWork(self, value):
         if self._Work is not None:
-            filtered = [x for x in self.Work.WorkFlowSteps if x != self]
-            self._Work._WorkFlowSteps = filtered
+            self._Work._WorkFlowSteps.discard(self)
 
         self._Work = value
         if self._Work is not None:
-            if self not in self._Work._WorkFlowSteps:
-                self._Work._WorkFlowSteps.append(self)
+            if self._Work._WorkFlowSteps is EMPTY:
+                self._Work._WorkFlowSteps = AssociationList([self])
+            else:
+                self._Work._WorkFlowSteps.add(self)
 
     Work = property(getWork, setWork)
 
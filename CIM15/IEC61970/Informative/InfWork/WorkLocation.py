@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Location import Location
+from CIM15.Element import AssociationList, EMPTY
 
 class WorkLocation(Location):
     """Information about a particular location for various forms of work such as a one call request.Information about a particular location for various forms of work such as a one call request.
@@ -49,8 +50,9 @@ class WorkLocation(Location):
         self._OneCallRequest = None
         self.OneCallRequest = OneCallRequest
 
-        self._DesignLocations = []
-        self.DesignLocations = [] if DesignLocations is None else DesignLocations
+        self._DesignLocations = EMPTY
+        if DesignLocations is not None:
+            self.DesignLocations = DesignLocations
 
         super(WorkLocation, self).__init__(*args, **kw_args)
 
@@ -67,13 +69,14 @@ class WorkLocation(Location):
 
     def setOneCallRequest(self, value):
         if self._OneCallRequest is not None:
-            filtered = [x for x in self.OneCallRequest.WorkLocations if x != self]
-            self._OneCallRequest._WorkLocations = filtered
+            self._OneCallRequest._WorkLocations.discard(self)
 
         self._OneCallRequest = value
         if self._OneCallRequest is not None:
-            if self not in self._OneCallRequest._WorkLocations:
-                self._OneCallRequest._WorkLocations.append(self)
+            if self._OneCallRequest._WorkLocations is EMPTY:
+                self._OneCallRequest._WorkLocations = AssociationList([self])
+            else:
+                self._OneCallRequest._WorkLocations.add(self)
 
     OneCallRequest = property(getOneCallRequest, setOneCallRequest)
 
@@ -82,21 +85,28 @@ class WorkLocation(Location):
         return self._DesignLocations
 
     def setDesignLocations(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._DesignLocations:
-            filtered = [q for q in p.WorkLocations if q != self]
-            self._DesignLocations._WorkLocations = filtered
+            p._WorkLocations.discard(self)
         for r in value:
-            if self not in r._WorkLocations:
-                r._WorkLocations.append(self)
+            if r._WorkLocations is EMPTY:
+                r._WorkLocations = AssociationList([self])
+            else:
+                r._WorkLocations.add(self)
         self._DesignLocations = value
 
     DesignLocations = property(getDesignLocations, setDesignLocations)
 
     def addDesignLocations(self, *DesignLocations):
         for obj in DesignLocations:
-            if self not in obj._WorkLocations:
-                obj._WorkLocations.append(self)
-            self._DesignLocations.append(obj)
+            if obj._WorkLocations is EMPTY:
+                obj._WorkLocations = AssociationList([self])
+            else:
+                obj._WorkLocations.add(self)
+            if self._DesignLocations is EMPTY:
+                self._DesignLocations = AssociationList([obj])
+            else:
+                self._DesignLocations.add(obj)
 
     def removeDesignLocations(self, *DesignLocations):
         for obj in DesignLocations:
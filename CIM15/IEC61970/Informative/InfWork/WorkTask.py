@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import AssociationList, EMPTY
 
 class WorkTask(Document):
     """A set of tasks is required to implement a design.A set of tasks is required to implement a design.
@@ -53,17 +54,21 @@ class WorkTask(Document):
         #: If specified, override schedule and perform this task in accordance with instructions specified here.
         self.schedOverride = schedOverride
 
-        self._EquipmentItems = []
-        self.EquipmentItems = [] if EquipmentItems is None else EquipmentItems
+        self._EquipmentItems = EMPTY
+        if EquipmentItems is not None:
+            self.EquipmentItems = EquipmentItems
 
-        self._Usages = []
-        self.Usages = [] if Usages is None else Usages
+        self._Usages = EMPTY
+        if Usages is not None:
+            self.Usages = Usages
 
-        self._MiscCostItems = []
-        self.MiscCostItems = [] if MiscCostItems is None else MiscCostItems
+        self._MiscCostItems = EMPTY
+        if MiscCostItems is not None:
+            self.MiscCostItems = MiscCostItems
 
-        self._Crews = []
-        self.Crews = [] if Crews is None else Crews
+        self._Crews = EMPTY
+        if Crews is not None:
+            self.Crews = Crews
 
         self._Work = None
         self.Work = Work
@@ -71,14 +76,17 @@ class WorkTask(Document):
         self._OverheadCost = None
         self.OverheadCost = OverheadCost
 
-        self._DesignLocationCUs = []
-        self.DesignLocationCUs = [] if DesignLocationCUs is None else DesignLocationCUs
+        self._DesignLocationCUs = EMPTY
+        if DesignLocationCUs is not None:
+            self.DesignLocationCUs = DesignLocationCUs
 
-        self._ContractorItems = []
-        self.ContractorItems = [] if ContractorItems is None else ContractorItems
+        self._ContractorItems = EMPTY
+        if ContractorItems is not None:
+            self.ContractorItems = ContractorItems
 
-        self._SwitchingSchedules = []
-        self.SwitchingSchedules = [] if SwitchingSchedules is None else SwitchingSchedules
+        self._SwitchingSchedules = EMPTY
+        if SwitchingSchedules is not None:
+            self.SwitchingSchedules = SwitchingSchedules
 
         self._WorkFlowStep = None
         self.WorkFlowStep = WorkFlowStep
@@ -86,23 +94,29 @@ class WorkTask(Document):
         self._Design = None
         self.Design = Design
 
-        self._QualificationRequirements = []
-        self.QualificationRequirements = [] if QualificationRequirements is None else QualificationRequirements
+        self._QualificationRequirements = EMPTY
+        if QualificationRequirements is not None:
+            self.QualificationRequirements = QualificationRequirements
 
-        self._Capabilities = []
-        self.Capabilities = [] if Capabilities is None else Capabilities
+        self._Capabilities = EMPTY
+        if Capabilities is not None:
+            self.Capabilities = Capabilities
 
-        self._WorkCostDetails = []
-        self.WorkCostDetails = [] if WorkCostDetails is None else WorkCostDetails
+        self._WorkCostDetails = EMPTY
+        if WorkCostDetails is not None:
+            self.WorkCostDetails = WorkCostDetails
 
-        self._Assets = []
-        self.Assets = [] if Assets is None else Assets
+        self._Assets = EMPTY
+        if Assets is not None:
+            self.Assets = Assets
 
-        self._LaborItems = []
-        self.LaborItems = [] if LaborItems is None else LaborItems
+        self._LaborItems = EMPTY
+        if LaborItems is not None:
+            self.LaborItems = LaborItems
 
-        self._MaterialItems = []
-        self.MaterialItems = [] if MaterialItems is None else MaterialItems
+        self._MaterialItems = EMPTY
+        if MaterialItems is not None:
+            self.MaterialItems = MaterialItems
 
         super(WorkTask, self).__init__(*args, **kw_args)
 
@@ -118,6 +132,7 @@ class WorkTask(Document):
         return self._EquipmentItems
 
     def setEquipmentItems(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._EquipmentItems:
             x.WorkTask = None
         for y in value:
@@ -139,6 +154,7 @@ class WorkTask(Document):
         return self._Usages
 
     def setUsages(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Usages:
             x.WorkTask = None
         for y in value:
@@ -160,6 +176,7 @@ class WorkTask(Document):
         return self._MiscCostItems
 
     def setMiscCostItems(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._MiscCostItems:
             x.WorkTask = None
         for y in value:
@@ -182,21 +199,28 @@ class WorkTask(Document):
         return self._Crews
 
     def setCrews(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Crews:
-            filtered = [q for q in p.WorkTasks if q != self]
-            self._Crews._WorkTasks = filtered
+            p._WorkTasks.discard(self)
         for r in value:
-            if self not in r._WorkTasks:
-                r._WorkTasks.append(self)
+            if r._WorkTasks is EMPTY:
+                r._WorkTasks = AssociationList([self])
+            else:
+                r._WorkTasks.add(self)
         self._Crews = value
 
     Crews = property(getCrews, setCrews)
 
     def addCrews(self, *Crews):
         for obj in Crews:
-            if self not in obj._WorkTasks:
-                obj._WorkTasks.append(self)
-            self._Crews.append(obj)
+            if obj._WorkTasks is EMPTY:
+                obj._WorkTasks = AssociationList([self])
+            else:
+                obj._WorkTasks.add(self)
+            if self._Crews is EMPTY:
+                self._Crews = AssociationList([obj])
+            else:
+                self._Crews.add(obj)
 
     def removeCrews(self, *Crews):
         for obj in Crews:
@@ -210,13 +234,14 @@ class WorkTask(Document):
 
     def setWork(self, value):
         if self._Work is not None:
-            filtered = [x for x in self.Work.WorkTasks if x != self]
-            self._Work._WorkTasks = filtered
+            self._Work._WorkTasks.discard(self)
 
         self._Work = value
         if self._Work is not None:
-            if self not in self._Work._WorkTasks:
-                self._Work._WorkTasks.append(self)
+            if self._Work._WorkTasks is EMPTY:
+                self._Work._WorkTasks = AssociationList([self])
+            else:
+                self._Work._WorkTasks.add(self)
 
     Work = property(getWork, setWork)
 
@@ -226,13 +251,14 @@ class WorkTask(Document):
 
     def setOverheadCost(self, value):
         if self._OverheadCost is not None:
-            filtered = [x for x in self.OverheadCost.WorkTasks if x != self]
-            self._OverheadCost._WorkTasks = filtered
+            self._OverheadCost._WorkTasks.discard(self)
 
         self._OverheadCost = value
         if self._OverheadCost is not None:
-            if self not in self._OverheadCost._WorkTasks:
-                self._OverheadCost._WorkTasks.append(self)
+            if self._OverheadCost._WorkTasks is EMPTY:
+                self._OverheadCost._WorkTasks = AssociationList([self])
+            else:
+                self._OverheadCost._WorkTasks.add(self)
 
     OverheadCost = property(getOverheadCost, setOverheadCost)
 
@@ -241,21 +267,28 @@ class WorkTask(Document):
         return self._DesignLocationCUs
 
     def setDesignLocationCUs(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._DesignLocationCUs:
-            filtered = [q for q in p.WorkTasks if q != self]
-            self._DesignLocationCUs._WorkTasks = filtered
+            p._WorkTasks.discard(self)
         for r in value:
-            if self not in r._WorkTasks:
-                r._WorkTasks.append(self)
+            if r._WorkTasks is EMPTY:
+                r._WorkTasks = AssociationList([self])
+            else:
+                r._WorkTasks.add(self)
         self._DesignLocationCUs = value
 
     DesignLocationCUs = property(getDesignLocationCUs, setDesignLocationCUs)
 
     def addDesignLocationCUs(self, *DesignLocationCUs):
         for obj in DesignLocationCUs:
-            if self not in obj._WorkTasks:
-                obj._WorkTasks.append(self)
-            self._DesignLocationCUs.append(obj)
+            if obj._WorkTasks is EMPTY:
+                obj._WorkTasks = AssociationList([self])
+            else:
+                obj._WorkTasks.add(self)
+            if self._DesignLocationCUs is EMPTY:
+                self._DesignLocationCUs = AssociationList([obj])
+            else:
+                self._DesignLocationCUs.add(obj)
 
     def removeDesignLocationCUs(self, *DesignLocationCUs):
         for obj in DesignLocationCUs:
@@ -268,6 +301,7 @@ class WorkTask(Document):
         return self._ContractorItems
 
     def setContractorItems(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ContractorItems:
             x.WorkTask = None
         for y in value:
@@ -289,6 +323,7 @@ class WorkTask(Document):
         return self._SwitchingSchedules
 
     def setSwitchingSchedules(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._SwitchingSchedules:
             x.WorkTask = None
         for y in value:
@@ -311,13 +346,14 @@ class WorkTask(Document):
 
     def setWorkFlowStep(self, value):
         if self._WorkFlowStep is not None:
-            filtered = [x for x in self.WorkFlowStep.WorkTasks if x != self]
-            self._WorkFlowStep._WorkTasks = filtered
+            self._WorkFlowStep._WorkTasks.discard(self)
 
         self._WorkFlowStep = value
         if self._WorkFlowStep is not None:
-            if self not in self._WorkFlowStep._WorkTasks:
-                self._WorkFlowStep._WorkTasks.append(self)
+            if self._WorkFlowStep._WorkTasks is EMPTY:
+                self._WorkFlowStep._WorkTasks = AssociationList([self])
+            else:
+                self._WorkFlowStep._WorkTasks.add(self)
 
     WorkFlowStep = property(getWorkFlowStep, setWorkFlowStep)
 
@@ -327,13 +363,14 @@ class WorkTask(Document):
 
     def setDesign(self, value):
         if self._Design is not None:
-            filtered = [x for x in self.Design.WorkTasks if x != self]
-            self._Design._WorkTasks = filtered
+            self._Design._WorkTasks.discard(self)
 
         self._Design = value
         if self._Design is not None:
-            if self not in self._Design._WorkTasks:
-                self._Design._WorkTasks.append(self)
+            if self._Design._WorkTasks is EMPTY:
+                self._Design._WorkTasks = AssociationList([self])
+            else:
+                self._Design._WorkTasks.add(self)
 
     Design = property(getDesign, setDesign)
 
@@ -342,21 +379,28 @@ class WorkTask(Document):
         return self._QualificationRequirements
 
     def setQualificationRequirements(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._QualificationRequirements:
-            filtered = [q for q in p.WorkTasks if q != self]
-            self._QualificationRequirements._WorkTasks = filtered
+            p._WorkTasks.discard(self)
         for r in value:
-            if self not in r._WorkTasks:
-                r._WorkTasks.append(self)
+            if r._WorkTasks is EMPTY:
+                r._WorkTasks = AssociationList([self])
+            else:
+                r._WorkTasks.add(self)
         self._QualificationRequirements = value
 
     QualificationRequirements = property(getQualificationRequirements, setQualificationRequirements)
 
     def addQualificationRequirements(self, *QualificationRequirements):
         for obj in QualificationRequirements:
-            if self not in obj._WorkTasks:
-                obj._WorkTasks.append(self)
-            self._QualificationRequirements.append(obj)
+            if obj._WorkTasks is EMPTY:
+                obj._WorkTasks = AssociationList([self])
+            else:
+                obj._WorkTasks.add(self)
+            if self._QualificationRequirements is EMPTY:
+                self._QualificationRequirements = AssociationList([obj])
+            else:
+                self._QualificationRequirements.add(obj)
 
     def removeQualificationRequirements(self, *QualificationRequirements):
         for obj in QualificationRequirements:
@@ -369,21 +413,28 @@ class WorkTask(Document):
         return self._Capabilities
 
     def setCapabilities(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Capabilities:
-            filtered = [q for q in p.WorkTasks if q != self]
-            self._Capabilities._WorkTasks = filtered
+            p._WorkTasks.discard(self)
         for r in value:
-            if self not in r._WorkTasks:
-                r._WorkTasks.append(self)
+            if r._WorkTasks is EMPTY:
+                r._WorkTasks = AssociationList([self])
+            else:
+                r._WorkTasks.add(self)
         self._Capabilities = value
 
     Capabilities = property(getCapabilities, setCapabilities)
 
     def addCapabilities(self, *Capabilities):
         for obj in Capabilities:
-            if self not in obj._WorkTasks:
-                obj._WorkTasks.append(self)
-            self._Capabilities.append(obj)
+            if obj._WorkTasks is EMPTY:
+                obj._WorkTasks = AssociationList([self])
+            else:
+                obj._WorkTasks.add(self)
+            if self._Capabilities is EMPTY:
+                self._Capabilities = AssociationList([obj])
+            else:
+                self._Capabilities.add(obj)
 
     def removeCapabilities(self, *Capabilities):
         for obj in Capabilities:
@@ -396,6 +447,7 @@ class WorkTask(Document):
         return self._WorkCostDetails
 
     def setWorkCostDetails(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._WorkCostDetails:
             x.WorkTask = None
         for y in value:
@@ -417,6 +469,7 @@ class WorkTask(Document):
         return self._Assets
 
     def setAssets(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Assets:
             x.WorkTask = None
         for y in value:
@@ -438,6 +491,7 @@ class WorkTask(Document):
         return self._LaborItems
 
     def setLaborItems(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._LaborItems:
             x.WorkTask = None
         for y in value:
@@ -459,6 +513,7 @@ class WorkTask(Document):
         return self._MaterialItems
 
     def setMaterialItems(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._MaterialItems:
             x.WorkTask = None
         for y in value:
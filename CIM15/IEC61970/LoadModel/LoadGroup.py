@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class LoadGroup(IdentifiedObject):
     """The class is the third level in a hierarchical structure for grouping of loads for the purpose of load flow load scaling.The class is the third level in a hierarchical structure for grouping of loads for the purpose of load flow load scaling.
@@ -48,13 +49,14 @@ class LoadGroup(IdentifiedObject):
 
     def setSubLoadArea(self, value):
         if self._SubLoadArea is not None:
-            filtered = [x for x in self.SubLoadArea.LoadGroups if x != self]
-            self._SubLoadArea._LoadGroups = filtered
+            self._SubLoadArea._LoadGroups.discard(self)
 
         self._SubLoadArea = value
         if self._SubLoadArea is not None:
-            if self not in self._SubLoadArea._LoadGroups:
-                self._SubLoadArea._LoadGroups.append(self)
+            if self._SubLoadArea._LoadGroups is EMPTY:
+                self._SubLoadArea._LoadGroups = AssociationList([self])
+            else:
+                self._SubLoadArea._LoadGroups.add(self)
 
     SubLoadArea = property(getSubLoadArea, setSubLoadArea)
 
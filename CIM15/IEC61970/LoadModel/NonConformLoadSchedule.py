@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.LoadModel.SeasonDayTypeSchedule import SeasonDayTypeSchedule
+from CIM15.Element import AssociationList, EMPTY
 
 class NonConformLoadSchedule(SeasonDayTypeSchedule):
     """An active power (Y1-axis) and reactive power (Y2-axis) schedule (curves) versus time (X-axis) for non-conforming loads, e.g., large industrial load or power station service (where modeled)An active power (Y1-axis) and reactive power (Y2-axis) schedule (curves) versus time (X-axis) for non-conforming loads, e.g., large industrial load or power station service (where modeled)
@@ -48,13 +49,14 @@ class NonConformLoadSchedule(SeasonDayTypeSchedule):
 
     def setNonConformLoadGroup(self, value):
         if self._NonConformLoadGroup is not None:
-            filtered = [x for x in self.NonConformLoadGroup.NonConformLoadSchedules if x != self]
-            self._NonConformLoadGroup._NonConformLoadSchedules = filtered
+            self._NonConformLoadGroup._NonConformLoadSchedules.discard(self)
 
         self._NonConformLoadGroup = value
         if self._NonConformLoadGroup is not None:
-            if self not in self._NonConformLoadGroup._NonConformLoadSchedules:
-                self._NonConformLoadGroup._NonConformLoadSchedules.append(self)
+            if self._NonConformLoadGroup._NonConformLoadSchedules is EMPTY:
+                self._NonConformLoadGroup._NonConformLoadSchedules = AssociationList([self])
+            else:
+                self._NonConformLoadGroup._NonConformLoadSchedules.add(self)
 
     NonConformLoadGroup = property(getNonConformLoadGroup, setNonConformLoadGroup)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.PowerSystemResource import PowerSystemResource
+from CIM15.Element import AssociationList, EMPTY
 
 class PowerCutZone(PowerSystemResource):
     """An area or zone of the power system which is used for load shedding purposes.An area or zone of the power system which is used for load shedding purposes.
@@ -37,8 +38,9 @@ class PowerCutZone(PowerSystemResource):
         #: First level (amount) of load to cut as a percentage of total zone load
         self.cutLevel1 = cutLevel1
 
-        self._EnergyConsumers = []
-        self.EnergyConsumers = [] if EnergyConsumers is None else EnergyConsumers
+        self._EnergyConsumers = EMPTY
+        if EnergyConsumers is not None:
+            self.EnergyConsumers = EnergyConsumers
 
         super(PowerCutZone, self).__init__(*args, **kw_args)
 
@@ -55,6 +57,7 @@ class PowerCutZone(PowerSystemResource):
         return self._EnergyConsumers
 
     def setEnergyConsumers(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._EnergyConsumers:
             x.PowerCutZone = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Meas.Limit import Limit
+from CIM15.Element import AssociationList, EMPTY
 
 class AccumulatorLimit(Limit):
     """Limit values for Accumulator measurementsLimit values for Accumulator measurements
@@ -52,13 +53,14 @@ class AccumulatorLimit(Limit):
 
     def setLimitSet(self, value):
         if self._LimitSet is not None:
-            filtered = [x for x in self.LimitSet.Limits if x != self]
-            self._LimitSet._Limits = filtered
+            self._LimitSet._Limits.discard(self)
 
         self._LimitSet = value
         if self._LimitSet is not None:
-            if self not in self._LimitSet._Limits:
-                self._LimitSet._Limits.append(self)
+            if self._LimitSet._Limits is EMPTY:
+                self._LimitSet._Limits = AssociationList([self])
+            else:
+                self._LimitSet._Limits.add(self)
 
     LimitSet = property(getLimitSet, setLimitSet)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Meas.LimitSet import LimitSet
+from CIM15.Element import AssociationList, EMPTY
 
 class AnalogLimitSet(LimitSet):
     """An AnalogLimitSet specifies a set of Limits that are associated with an Analog measurement.An AnalogLimitSet specifies a set of Limits that are associated with an Analog measurement.
@@ -30,11 +31,13 @@ class AnalogLimitSet(LimitSet):
         @param Limits: The limit values used for supervision of Measurements.
         @param Measurements: The Measurements using the LimitSet.
         """
-        self._Limits = []
-        self.Limits = [] if Limits is None else Limits
+        self._Limits = EMPTY
+        if Limits is not None:
+            self.Limits = Limits
 
-        self._Measurements = []
-        self.Measurements = [] if Measurements is None else Measurements
+        self._Measurements = EMPTY
+        if Measurements is not None:
+            self.Measurements = Measurements
 
         super(AnalogLimitSet, self).__init__(*args, **kw_args)
 
@@ -51,6 +54,7 @@ class AnalogLimitSet(LimitSet):
         return self._Limits
 
     def setLimits(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Limits:
             x.LimitSet = None
         for y in value:
@@ -73,21 +77,28 @@ class AnalogLimitSet(LimitSet):
         return self._Measurements
 
     def setMeasurements(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Measurements:
-            filtered = [q for q in p.LimitSets if q != self]
-            self._Measurements._LimitSets = filtered
+            p._LimitSets.discard(self)
         for r in value:
-            if self not in r._LimitSets:
-                r._LimitSets.append(self)
+            if r._LimitSets is EMPTY:
+                r._LimitSets = AssociationList([self])
+            else:
+                r._LimitSets.add(self)
         self._Measurements = value
 
     Measurements = property(getMeasurements, setMeasurements)
 
     def addMeasurements(self, *Measurements):
         for obj in Measurements:
-            if self not in obj._LimitSets:
-                obj._LimitSets.append(self)
-            self._Measurements.append(obj)
+            if obj._LimitSets is EMPTY:
+                obj._LimitSets = AssociationList([self])
+            else:
+                obj._LimitSets.add(self)
+            if self._Measurements is EMPTY:
+                self._Measurements = AssociationList([obj])
+            else:
+                self._Measurements.add(obj)
 
     def removeMeasurements(self, *Measurements):
         for obj in Measurements:
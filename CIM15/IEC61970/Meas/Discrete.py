@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Meas.Measurement import Measurement
+from CIM15.Element import AssociationList, EMPTY
 
 class Discrete(Measurement):
     """Discrete represents a discrete Measurement, i.e. a Measurement reprsenting discrete values, e.g. a Breaker position.Discrete represents a discrete Measurement, i.e. a Measurement reprsenting discrete values, e.g. a Breaker position.
@@ -46,8 +47,9 @@ class Discrete(Measurement):
         self._Command = None
         self.Command = Command
 
-        self._DiscreteValues = []
-        self.DiscreteValues = [] if DiscreteValues is None else DiscreteValues
+        self._DiscreteValues = EMPTY
+        if DiscreteValues is not None:
+            self.DiscreteValues = DiscreteValues
 
         self._ValueAliasSet = None
         self.ValueAliasSet = ValueAliasSet
@@ -83,6 +85,7 @@ class Discrete(Measurement):
         return self._DiscreteValues
 
     def setDiscreteValues(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._DiscreteValues:
             x.Discrete = None
         for y in value:
@@ -106,13 +109,14 @@ class Discrete(Measurement):
 
     def setValueAliasSet(self, value):
         if self._ValueAliasSet is not None:
-            filtered = [x for x in self.ValueAliasSet.Discretes if x != self]
-            self._ValueAliasSet._Discretes = filtered
+            self._ValueAliasSet._Discretes.discard(self)
 
         self._ValueAliasSet = value
         if self._ValueAliasSet is not None:
-            if self not in self._ValueAliasSet._Discretes:
-                self._ValueAliasSet._Discretes.append(self)
+            if self._ValueAliasSet._Discretes is EMPTY:
+                self._ValueAliasSet._Discretes = AssociationList([self])
+            else:
+                self._ValueAliasSet._Discretes.add(self)
 
     ValueAliasSet = property(getValueAliasSet, setValueAliasSet)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Meas.MeasurementValue import MeasurementValue
+from CIM15.Element import AssociationList, EMPTY
 
 class DiscreteValue(MeasurementValue):
     """DiscreteValue represents a discrete MeasurementValue.DiscreteValue represents a discrete MeasurementValue.
@@ -52,13 +53,14 @@ class DiscreteValue(MeasurementValue):
 
     def setDiscrete(self, value):
         if self._Discrete is not None:
-            filtered = [x for x in self.Discrete.DiscreteValues if x != self]
-            self._Discrete._DiscreteValues = filtered
+            self._Discrete._DiscreteValues.discard(self)
 
         self._Discrete = value
         if self._Discrete is not None:
-            if self not in self._Discrete._DiscreteValues:
-                self._Discrete._DiscreteValues.append(self)
+            if self._Discrete._DiscreteValues is EMPTY:
+                self._Discrete._DiscreteValues = AssociationList([self])
+            else:
+                self._Discrete._DiscreteValues.add(self)
 
     Discrete = property(getDiscrete, setDiscrete)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class Limit(IdentifiedObject):
     """Specifies one limit value for a Measurement. A Measurement typically has several limits that are kept together by the LimitSet class. The actual meaning and use of a Limit instance (i.e., if it is an alarm or warning limit or if it is a high or low limit) is not captured in the Limit class. However the name of a Limit instance may indicate both meaning and use.Specifies one limit value for a Measurement. A Measurement typically has several limits that are kept together by the LimitSet class. The actual meaning and use of a Limit instance (i.e., if it is an alarm or warning limit or if it is a high or low limit) is not captured in the Limit class. However the name of a Limit instance may indicate both meaning and use.
@@ -29,8 +30,9 @@ class Limit(IdentifiedObject):
 
         @param Procedures:
         """
-        self._Procedures = []
-        self.Procedures = [] if Procedures is None else Procedures
+        self._Procedures = EMPTY
+        if Procedures is not None:
+            self.Procedures = Procedures
 
         super(Limit, self).__init__(*args, **kw_args)
 
@@ -46,21 +48,28 @@ class Limit(IdentifiedObject):
         return self._Procedures
 
     def setProcedures(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Procedures:
-            filtered = [q for q in p.Limits if q != self]
-            self._Procedures._Limits = filtered
+            p._Limits.discard(self)
         for r in value:
-            if self not in r._Limits:
-                r._Limits.append(self)
+            if r._Limits is EMPTY:
+                r._Limits = AssociationList([self])
+            else:
+                r._Limits.add(self)
         self._Procedures = value
 
     Procedures = property(getProcedures, setProcedures)
 
     def addProcedures(self, *Procedures):
         for obj in Procedures:
-            if self not in obj._Limits:
-                obj._Limits.append(self)
-            self._Procedures.append(obj)
+            if obj._Limits is EMPTY:
+                obj._Limits = AssociationList([self])
+            else:
+                obj._Limits.add(self)
+            if self._Procedures is EMPTY:
+                self._Procedures = AssociationList([obj])
+            else:
+                self._Procedures.add(obj)
 
     def removeProcedures(self, *Procedures):
         for obj in Procedures:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class MeasurementValue(IdentifiedObject):
     """The current state for a measurement. A state value is an instance of a measurement from a specific source. Measurements can be associated with many state values, each representing a different source for the measurement.The current state for a measurement. A state value is an instance of a measurement from a specific source. Measurements can be associated with many state values, each representing a different source for the measurement.
@@ -42,14 +43,16 @@ class MeasurementValue(IdentifiedObject):
         #: The time when the value was last updated
         self.timeStamp = timeStamp
 
-        self._GmlValues = []
-        self.GmlValues = [] if GmlValues is None else GmlValues
+        self._GmlValues = EMPTY
+        if GmlValues is not None:
+            self.GmlValues = GmlValues
 
         self._MeasurementValueQuality = None
         self.MeasurementValueQuality = MeasurementValueQuality
 
-        self._ProcedureDataSets = []
-        self.ProcedureDataSets = [] if ProcedureDataSets is None else ProcedureDataSets
+        self._ProcedureDataSets = EMPTY
+        if ProcedureDataSets is not None:
+            self.ProcedureDataSets = ProcedureDataSets
 
         self._MeasurementValueSource = None
         self.MeasurementValueSource = MeasurementValueSource
@@ -74,6 +77,7 @@ class MeasurementValue(IdentifiedObject):
         return self._GmlValues
 
     def setGmlValues(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._GmlValues:
             x.MeasurementValue = None
         for y in value:
@@ -111,21 +115,28 @@ class MeasurementValue(IdentifiedObject):
         return self._ProcedureDataSets
 
     def setProcedureDataSets(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ProcedureDataSets:
-            filtered = [q for q in p.MeasurementValues if q != self]
-            self._ProcedureDataSets._MeasurementValues = filtered
+            p._MeasurementValues.discard(self)
         for r in value:
-            if self not in r._MeasurementValues:
-                r._MeasurementValues.append(self)
+            if r._MeasurementValues is EMPTY:
+                r._MeasurementValues = AssociationList([self])
+            else:
+                r._MeasurementValues.add(self)
         self._ProcedureDataSets = value
 
     ProcedureDataSets = property(getProcedureDataSets, setProcedureDataSets)
 
     def addProcedureDataSets(self, *ProcedureDataSets):
         for obj in ProcedureDataSets:
-            if self not in obj._MeasurementValues:
-                obj._MeasurementValues.append(self)
-            self._ProcedureDataSets.append(obj)
+            if obj._MeasurementValues is EMPTY:
+                obj._MeasurementValues = AssociationList([self])
+            else:
+                obj._MeasurementValues.add(self)
+            if self._ProcedureDataSets is EMPTY:
+                self._ProcedureDataSets = AssociationList([obj])
+            else:
+                self._ProcedureDataSets.add(obj)
 
     def removeProcedureDataSets(self, *ProcedureDataSets):
         for obj in ProcedureDataSets:
@@ -140,13 +151,14 @@ class MeasurementValue(IdentifiedObject):
 
     def setMeasurementValueSource(self, value):
         if self._MeasurementValueSource is not None:
-            filtered = [x for x in self.MeasurementValueSource.MeasurementValues if x != self]
-            self._MeasurementValueSource._MeasurementValues = filtered
+            self._MeasurementValueSource._MeasurementValues.discard(self)
 
         self._MeasurementValueSource = value
         if self._MeasurementValueSource is not None:
-            if self not in self._MeasurementValueSource._MeasurementValues:
-                self._MeasurementValueSource._MeasurementValues.append(self)
+            if self._MeasurementValueSource._MeasurementValues is EMPTY:
+                self._MeasurementValueSource._MeasurementValues = AssociationList([self])
+            else:
+                self._MeasurementValueSource._MeasurementValues.add(self)
 
     MeasurementValueSource = property(getMeasurementValueSource, setMeasurementValueSource)
 
@@ -156,13 +168,14 @@ class MeasurementValue(IdentifiedObject):
 
     def setErpPerson(self, value):
         if self._ErpPerson is not None:
-            filtered = [x for x in self.ErpPerson.MeasurementValues if x != self]
-            self._ErpPerson._MeasurementValues = filtered
+            self._ErpPerson._MeasurementValues.discard(self)
 
         self._ErpPerson = value
         if self._ErpPerson is not None:
-            if self not in self._ErpPerson._MeasurementValues:
-                self._ErpPerson._MeasurementValues.append(self)
+            if self._ErpPerson._MeasurementValues is EMPTY:
+                self._ErpPerson._MeasurementValues = AssociationList([self])
+            else:
+                self._ErpPerson._MeasurementValues.add(self)
 
     ErpPerson = property(getErpPerson, setErpPerson)
 
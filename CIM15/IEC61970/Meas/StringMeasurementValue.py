@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Meas.MeasurementValue import MeasurementValue
+from CIM15.Element import AssociationList, EMPTY
 
 class StringMeasurementValue(MeasurementValue):
     """StringMeasurementValue represents a measurement value of type string.StringMeasurementValue represents a measurement value of type string.
@@ -52,13 +53,14 @@ class StringMeasurementValue(MeasurementValue):
 
     def setStringMeasurement(self, value):
         if self._StringMeasurement is not None:
-            filtered = [x for x in self.StringMeasurement.StringMeasurementValues if x != self]
-            self._StringMeasurement._StringMeasurementValues = filtered
+            self._StringMeasurement._StringMeasurementValues.discard(self)
 
         self._StringMeasurement = value
         if self._StringMeasurement is not None:
-            if self not in self._StringMeasurement._StringMeasurementValues:
-                self._StringMeasurement._StringMeasurementValues.append(self)
+            if self._StringMeasurement._StringMeasurementValues is EMPTY:
+                self._StringMeasurement._StringMeasurementValues = AssociationList([self])
+            else:
+                self._StringMeasurement._StringMeasurementValues.add(self)
 
     StringMeasurement = property(getStringMeasurement, setStringMeasurement)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class ValueAliasSet(IdentifiedObject):
     """Describes the translation of a set of values into a name and is intendend to facilitate cusom translations. Each ValueAliasSet has a name, description etc. A specific Measurement may represent a discrete state like Open, Closed, Intermediate etc. This requires a translation from the MeasurementValue.value number to a string, e.g. 0->'Invalid', 1->'Open', 2->'Closed', 3->'Intermediate'. Each ValueToAlias member in ValueAliasSet.Value describe a mapping for one particular value to a name.Describes the translation of a set of values into a name and is intendend to facilitate cusom translations. Each ValueAliasSet has a name, description etc. A specific Measurement may represent a discrete state like Open, Closed, Intermediate etc. This requires a translation from the MeasurementValue.value number to a string, e.g. 0->'Invalid', 1->'Open', 2->'Closed', 3->'Intermediate'. Each ValueToAlias member in ValueAliasSet.Value describe a mapping for one particular value to a name.
@@ -31,14 +32,17 @@ class ValueAliasSet(IdentifiedObject):
         @param Commands: The ValueAliasSet used for translation of a Control value to a name.
         @param Values: The ValueToAlias mappings included in the set
         """
-        self._Discretes = []
-        self.Discretes = [] if Discretes is None else Discretes
+        self._Discretes = EMPTY
+        if Discretes is not None:
+            self.Discretes = Discretes
 
-        self._Commands = []
-        self.Commands = [] if Commands is None else Commands
+        self._Commands = EMPTY
+        if Commands is not None:
+            self.Commands = Commands
 
-        self._Values = []
-        self.Values = [] if Values is None else Values
+        self._Values = EMPTY
+        if Values is not None:
+            self.Values = Values
 
         super(ValueAliasSet, self).__init__(*args, **kw_args)
 
@@ -55,6 +59,7 @@ class ValueAliasSet(IdentifiedObject):
         return self._Discretes
 
     def setDiscretes(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Discretes:
             x.ValueAliasSet = None
         for y in value:
@@ -77,6 +82,7 @@ class ValueAliasSet(IdentifiedObject):
         return self._Commands
 
     def setCommands(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Commands:
             x.ValueAliasSet = None
         for y in value:
@@ -99,6 +105,7 @@ class ValueAliasSet(IdentifiedObject):
         return self._Values
 
     def setValues(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Values:
             x.ValueAliasSet = None
         for y in value:
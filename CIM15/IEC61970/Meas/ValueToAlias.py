@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class ValueToAlias(IdentifiedObject):
     """Describes the translation of one particular value into a name, e.g. 1->'Open'Describes the translation of one particular value into a name, e.g. 1->'Open'
@@ -52,13 +53,14 @@ class ValueToAlias(IdentifiedObject):
 
     def setValueAliasSet(self, value):
         if self._ValueAliasSet is not None:
-            filtered = [x for x in self.ValueAliasSet.Values if x != self]
-            self._ValueAliasSet._Values = filtered
+            self._ValueAliasSet._Values.discard(self)
 
         self._ValueAliasSet = value
         if self._ValueAliasSet is not None:
-            if self not in self._ValueAliasSet._Values:
-                self._ValueAliasSet._Values.append(self)
+            if self._ValueAliasSet._Values is EMPTY:
+                self._ValueAliasSet._Values = AssociationList([self])
+            else:
+                self._ValueAliasSet._Values.add(self)
 
     ValueAliasSet = property(getValueAliasSet, setValueAliasSet)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.OperationalLimits.OperationalLimit import OperationalLimit
+from CIM15.Element import AssociationList, EMPTY
 
 class ActivePowerLimit(OperationalLimit):
     """Limit on active power flow.Limit on active power flow.
@@ -51,13 +52,14 @@ class ActivePowerLimit(OperationalLimit):
 
     def setActivePowerLimitSet(self, value):
         if self._ActivePowerLimitSet is not None:
-            filtered = [x for x in self.ActivePowerLimitSet.ActivePowerLimits if x != self]
-            self._ActivePowerLimitSet._ActivePowerLimits = filtered
+            self._ActivePowerLimitSet._ActivePowerLimits.discard(self)
 
         self._ActivePowerLimitSet = value
         if self._ActivePowerLimitSet is not None:
-            if self not in self._ActivePowerLimitSet._ActivePowerLimits:
-                self._ActivePowerLimitSet._ActivePowerLimits.append(self)
+            if self._ActivePowerLimitSet._ActivePowerLimits is EMPTY:
+                self._ActivePowerLimitSet._ActivePowerLimits = AssociationList([self])
+            else:
+                self._ActivePowerLimitSet._ActivePowerLimits.add(self)
 
     ActivePowerLimitSet = property(getActivePowerLimitSet, setActivePowerLimitSet)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.OperationalLimits.OperationalLimitSet import OperationalLimitSet
+from CIM15.Element import AssociationList, EMPTY
 
 class ActivePowerLimitSet(OperationalLimitSet):
 
@@ -27,8 +28,9 @@ class ActivePowerLimitSet(OperationalLimitSet):
 
         @param ActivePowerLimits:
         """
-        self._ActivePowerLimits = []
-        self.ActivePowerLimits = [] if ActivePowerLimits is None else ActivePowerLimits
+        self._ActivePowerLimits = EMPTY
+        if ActivePowerLimits is not None:
+            self.ActivePowerLimits = ActivePowerLimits
 
         super(ActivePowerLimitSet, self).__init__(*args, **kw_args)
 
@@ -44,6 +46,7 @@ class ActivePowerLimitSet(OperationalLimitSet):
         return self._ActivePowerLimits
 
     def setActivePowerLimits(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ActivePowerLimits:
             x.ActivePowerLimitSet = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.OperationalLimits.OperationalLimit import OperationalLimit
+from CIM15.Element import AssociationList, EMPTY
 
 class ApparentPowerLimit(OperationalLimit):
     """Apparent power limit.Apparent power limit.
@@ -51,13 +52,14 @@ class ApparentPowerLimit(OperationalLimit):
 
     def setApparentPowerLimitSet(self, value):
         if self._ApparentPowerLimitSet is not None:
-            filtered = [x for x in self.ApparentPowerLimitSet.ApparentPowerLimits if x != self]
-            self._ApparentPowerLimitSet._ApparentPowerLimits = filtered
+            self._ApparentPowerLimitSet._ApparentPowerLimits.discard(self)
 
         self._ApparentPowerLimitSet = value
         if self._ApparentPowerLimitSet is not None:
-            if self not in self._ApparentPowerLimitSet._ApparentPowerLimits:
-                self._ApparentPowerLimitSet._ApparentPowerLimits.append(self)
+            if self._ApparentPowerLimitSet._ApparentPowerLimits is EMPTY:
+                self._ApparentPowerLimitSet._ApparentPowerLimits = AssociationList([self])
+            else:
+                self._ApparentPowerLimitSet._ApparentPowerLimits.add(self)
 
     ApparentPowerLimitSet = property(getApparentPowerLimitSet, setApparentPowerLimitSet)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.OperationalLimits.OperationalLimitSet import OperationalLimitSet
+from CIM15.Element import AssociationList, EMPTY
 
 class ApparentPowerLimitSet(OperationalLimitSet):
 
@@ -27,8 +28,9 @@ class ApparentPowerLimitSet(OperationalLimitSet):
 
         @param ApparentPowerLimits:
         """
-        self._ApparentPowerLimits = []
-        self.ApparentPowerLimits = [] if ApparentPowerLimits is None else ApparentPowerLimits
+        self._ApparentPowerLimits = EMPTY
+        if ApparentPowerLimits is not None:
+            self.ApparentPowerLimits = ApparentPowerLimits
 
         super(ApparentPowerLimitSet, self).__init__(*args, **kw_args)
 
@@ -44,6 +46,7 @@ class ApparentPowerLimitSet(OperationalLimitSet):
         return self._ApparentPowerLimits
 
     def setApparentPowerLimits(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ApparentPowerLimits:
             x.ApparentPowerLimitSet = None
         for y in value:
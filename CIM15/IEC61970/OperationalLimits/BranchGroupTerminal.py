@@ -18,7 +18,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from CIM15.Element import Element
+from CIM15.Element import Element, AssociationList, EMPTY
 
 class BranchGroupTerminal(Element):
     """A specific directed terminal flow for a branch group.A specific directed terminal flow for a branch group.
@@ -56,13 +56,14 @@ class BranchGroupTerminal(Element):
 
     def setBranchGroup(self, value):
         if self._BranchGroup is not None:
-            filtered = [x for x in self.BranchGroup.BranchGroupTerminal if x != self]
-            self._BranchGroup._BranchGroupTerminal = filtered
+            self._BranchGroup._BranchGroupTerminal.discard(self)
 
         self._BranchGroup = value
         if self._BranchGroup is not None:
-            if self not in self._BranchGroup._BranchGroupTerminal:
-                self._BranchGroup._BranchGroupTerminal.append(self)
+            if self._BranchGroup._BranchGroupTerminal is EMPTY:
+                self._BranchGroup._BranchGroupTerminal = AssociationList([self])
+            else:
+                self._BranchGroup._BranchGroupTerminal.add(self)
 
     BranchGroup = property(getBranchGroup, setBranchGroup)
 
@@ -73,13 +74,14 @@ class BranchGroupTerminal(Element):
 
     def setTerminal(self, value):
         if self._Terminal is not None:
-            filtered = [x for x in self.Terminal.BranchGroupTerminal if x != self]
-            self._Terminal._BranchGroupTerminal = filtered
+            self._Terminal._BranchGroupTerminal.discard(self)
 
         self._Terminal = value
         if self._Terminal is not None:
-            if self not in self._Terminal._BranchGroupTerminal:
-                self._Terminal._BranchGroupTerminal.append(self)
+            if self._Terminal._BranchGroupTerminal is EMPTY:
+                self._Terminal._BranchGroupTerminal = AssociationList([self])
+            else:
+                self._Terminal._BranchGroupTerminal.add(self)
 
     Terminal = property(getTerminal, setTerminal)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.OperationalLimits.OperationalLimit import OperationalLimit
+from CIM15.Element import AssociationList, EMPTY
 
 class CurrentLimit(OperationalLimit):
     """Operational limit on current.Operational limit on current.
@@ -51,13 +52,14 @@ class CurrentLimit(OperationalLimit):
 
     def setCurrentLimitSet(self, value):
         if self._CurrentLimitSet is not None:
-            filtered = [x for x in self.CurrentLimitSet.CurrentLimits if x != self]
-            self._CurrentLimitSet._CurrentLimits = filtered
+            self._CurrentLimitSet._CurrentLimits.discard(self)
 
         self._CurrentLimitSet = value
         if self._CurrentLimitSet is not None:
-            if self not in self._CurrentLimitSet._CurrentLimits:
-                self._CurrentLimitSet._CurrentLimits.append(self)
+            if self._CurrentLimitSet._CurrentLimits is EMPTY:
+                self._CurrentLimitSet._CurrentLimits = AssociationList([self])
+            else:
+                self._CurrentLimitSet._CurrentLimits.add(self)
 
     CurrentLimitSet = property(getCurrentLimitSet, setCurrentLimitSet)
 
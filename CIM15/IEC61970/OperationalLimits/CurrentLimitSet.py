@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.OperationalLimits.OperationalLimitSet import OperationalLimitSet
+from CIM15.Element import AssociationList, EMPTY
 
 class CurrentLimitSet(OperationalLimitSet):
 
@@ -27,8 +28,9 @@ class CurrentLimitSet(OperationalLimitSet):
 
         @param CurrentLimits:
         """
-        self._CurrentLimits = []
-        self.CurrentLimits = [] if CurrentLimits is None else CurrentLimits
+        self._CurrentLimits = EMPTY
+        if CurrentLimits is not None:
+            self.CurrentLimits = CurrentLimits
 
         super(CurrentLimitSet, self).__init__(*args, **kw_args)
 
@@ -44,6 +46,7 @@ class CurrentLimitSet(OperationalLimitSet):
         return self._CurrentLimits
 
     def setCurrentLimits(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._CurrentLimits:
             x.CurrentLimitSet = None
         for y in value:
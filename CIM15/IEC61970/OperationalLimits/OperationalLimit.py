@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class OperationalLimit(IdentifiedObject):
     """A value associated with a specific kind of limit.A value associated with a specific kind of limit.
@@ -52,13 +53,14 @@ class OperationalLimit(IdentifiedObject):
 
     def setOperationalLimitType(self, value):
         if self._OperationalLimitType is not None:
-            filtered = [x for x in self.OperationalLimitType.OperationalLimit if x != self]
-            self._OperationalLimitType._OperationalLimit = filtered
+            self._OperationalLimitType._OperationalLimit.discard(self)
 
         self._OperationalLimitType = value
         if self._OperationalLimitType is not None:
-            if self not in self._OperationalLimitType._OperationalLimit:
-                self._OperationalLimitType._OperationalLimit.append(self)
+            if self._OperationalLimitType._OperationalLimit is EMPTY:
+                self._OperationalLimitType._OperationalLimit = AssociationList([self])
+            else:
+                self._OperationalLimitType._OperationalLimit.add(self)
 
     OperationalLimitType = property(getOperationalLimitType, setOperationalLimitType)
 
@@ -69,13 +71,14 @@ class OperationalLimit(IdentifiedObject):
 
     def setOperationalLimitSet(self, value):
         if self._OperationalLimitSet is not None:
-            filtered = [x for x in self.OperationalLimitSet.OperationalLimitValue if x != self]
-            self._OperationalLimitSet._OperationalLimitValue = filtered
+            self._OperationalLimitSet._OperationalLimitValue.discard(self)
 
         self._OperationalLimitSet = value
         if self._OperationalLimitSet is not None:
-            if self not in self._OperationalLimitSet._OperationalLimitValue:
-                self._OperationalLimitSet._OperationalLimitValue.append(self)
+            if self._OperationalLimitSet._OperationalLimitValue is EMPTY:
+                self._OperationalLimitSet._OperationalLimitValue = AssociationList([self])
+            else:
+                self._OperationalLimitSet._OperationalLimitValue.add(self)
 
     OperationalLimitSet = property(getOperationalLimitSet, setOperationalLimitSet)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.OperationalLimits.OperationalLimit import OperationalLimit
+from CIM15.Element import AssociationList, EMPTY
 
 class VoltageLimit(OperationalLimit):
     """Operational limit applied to voltage.Operational limit applied to voltage.
@@ -51,13 +52,14 @@ class VoltageLimit(OperationalLimit):
 
     def setVoltageLimitSet(self, value):
         if self._VoltageLimitSet is not None:
-            filtered = [x for x in self.VoltageLimitSet.VoltageLimits if x != self]
-            self._VoltageLimitSet._VoltageLimits = filtered
+            self._VoltageLimitSet._VoltageLimits.discard(self)
 
         self._VoltageLimitSet = value
         if self._VoltageLimitSet is not None:
-            if self not in self._VoltageLimitSet._VoltageLimits:
-                self._VoltageLimitSet._VoltageLimits.append(self)
+            if self._VoltageLimitSet._VoltageLimits is EMPTY:
+                self._VoltageLimitSet._VoltageLimits = AssociationList([self])
+            else:
+                self._VoltageLimitSet._VoltageLimits.add(self)
 
     VoltageLimitSet = property(getVoltageLimitSet, setVoltageLimitSet)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.OperationalLimits.OperationalLimitSet import OperationalLimitSet
+from CIM15.Element import AssociationList, EMPTY
 
 class VoltageLimitSet(OperationalLimitSet):
 
@@ -27,8 +28,9 @@ class VoltageLimitSet(OperationalLimitSet):
 
         @param VoltageLimits:
         """
-        self._VoltageLimits = []
-        self.VoltageLimits = [] if VoltageLimits is None else VoltageLimits
+        self._VoltageLimits = EMPTY
+        if VoltageLimits is not None:
+            self.VoltageLimits = VoltageLimits
 
         super(VoltageLimitSet, self).__init__(*args, **kw_args)
 
@@ -44,6 +46,7 @@ class VoltageLimitSet(OperationalLimitSet):
         return self._VoltageLimits
 
     def setVoltageLimits(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._VoltageLimits:
             x.VoltageLimitSet = None
         for y in value:
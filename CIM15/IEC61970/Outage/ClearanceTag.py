@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class ClearanceTag(IdentifiedObject):
     """A clearance tag that is used to authorize and schedule work on conducting equipment in the field. Tagged equipment is not available for commercial service.A clearance tag that is used to authorize and schedule work on conducting equipment in the field. Tagged equipment is not available for commercial service.
@@ -88,13 +89,14 @@ class ClearanceTag(IdentifiedObject):
 
     def setConductingEquipment(self, value):
         if self._ConductingEquipment is not None:
-            filtered = [x for x in self.ConductingEquipment.ClearanceTags if x != self]
-            self._ConductingEquipment._ClearanceTags = filtered
+            self._ConductingEquipment._ClearanceTags.discard(self)
 
         self._ConductingEquipment = value
         if self._ConductingEquipment is not None:
-            if self not in self._ConductingEquipment._ClearanceTags:
-                self._ConductingEquipment._ClearanceTags.append(self)
+            if self._ConductingEquipment._ClearanceTags is EMPTY:
+                self._ConductingEquipment._ClearanceTags = AssociationList([self])
+            else:
+                self._ConductingEquipment._ClearanceTags.add(self)
 
     ConductingEquipment = property(getConductingEquipment, setConductingEquipment)
 
@@ -104,13 +106,14 @@ class ClearanceTag(IdentifiedObject):
 
     def setSafetyDocument(self, value):
         if self._SafetyDocument is not None:
-            filtered = [x for x in self.SafetyDocument.ClearanceTags if x != self]
-            self._SafetyDocument._ClearanceTags = filtered
+            self._SafetyDocument._ClearanceTags.discard(self)
 
         self._SafetyDocument = value
         if self._SafetyDocument is not None:
-            if self not in self._SafetyDocument._ClearanceTags:
-                self._SafetyDocument._ClearanceTags.append(self)
+            if self._SafetyDocument._ClearanceTags is EMPTY:
+                self._SafetyDocument._ClearanceTags = AssociationList([self])
+            else:
+                self._SafetyDocument._ClearanceTags.add(self)
 
     SafetyDocument = property(getSafetyDocument, setSafetyDocument)
 
@@ -121,13 +124,14 @@ class ClearanceTag(IdentifiedObject):
 
     def setClearanceTagType(self, value):
         if self._ClearanceTagType is not None:
-            filtered = [x for x in self.ClearanceTagType.ClearanceTags if x != self]
-            self._ClearanceTagType._ClearanceTags = filtered
+            self._ClearanceTagType._ClearanceTags.discard(self)
 
         self._ClearanceTagType = value
         if self._ClearanceTagType is not None:
-            if self not in self._ClearanceTagType._ClearanceTags:
-                self._ClearanceTagType._ClearanceTags.append(self)
+            if self._ClearanceTagType._ClearanceTags is EMPTY:
+                self._ClearanceTagType._ClearanceTags = AssociationList([self])
+            else:
+                self._ClearanceTagType._ClearanceTags.add(self)
 
     ClearanceTagType = property(getClearanceTagType, setClearanceTagType)
 
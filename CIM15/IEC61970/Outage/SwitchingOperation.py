@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class SwitchingOperation(IdentifiedObject):
     """A SwitchingOperation is used to define individual switch operations for an OutageSchedule. This OutageSchedule may be associated with another item of Substation such as a Transformer, Line, or Generator; or with the Switch itself as a PowerSystemResource. A Switch may be referenced by many OutageSchedules.A SwitchingOperation is used to define individual switch operations for an OutageSchedule. This OutageSchedule may be associated with another item of Substation such as a Transformer, Line, or Generator; or with the Switch itself as a PowerSystemResource. A Switch may be referenced by many OutageSchedules.
@@ -41,8 +42,9 @@ class SwitchingOperation(IdentifiedObject):
         self._OutageSchedule = None
         self.OutageSchedule = OutageSchedule
 
-        self._Switches = []
-        self.Switches = [] if Switches is None else Switches
+        self._Switches = EMPTY
+        if Switches is not None:
+            self.Switches = Switches
 
         super(SwitchingOperation, self).__init__(*args, **kw_args)
 
@@ -60,13 +62,14 @@ class SwitchingOperation(IdentifiedObject):
 
     def setOutageSchedule(self, value):
         if self._OutageSchedule is not None:
-            filtered = [x for x in self.OutageSchedule.SwitchingOperations if x != self]
-            self._OutageSchedule._SwitchingOperations = filtered
+            self._OutageSchedule._SwitchingOperations.discard(self)
 
         self._OutageSchedule = value
         if self._OutageSchedule is not None:
-            if self not in self._OutageSchedule._SwitchingOperations:
-                self._OutageSchedule._SwitchingOperations.append(self)
+            if self._OutageSchedule._SwitchingOperations is EMPTY:
+                self._OutageSchedule._SwitchingOperations = AssociationList([self])
+            else:
+                self._OutageSchedule._SwitchingOperations.add(self)
 
     OutageSchedule = property(getOutageSchedule, setOutageSchedule)
 
@@ -76,21 +79,28 @@ class SwitchingOperation(IdentifiedObject):
         return self._Switches
 
     def setSwitches(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._Switches:
-            filtered = [q for q in p.SwitchingOperations if q != self]
-            self._Switches._SwitchingOperations = filtered
+            p._SwitchingOperations.discard(self)
         for r in value:
-            if self not in r._SwitchingOperations:
-                r._SwitchingOperations.append(self)
+            if r._SwitchingOperations is EMPTY:
+                r._SwitchingOperations = AssociationList([self])
+            else:
+                r._SwitchingOperations.add(self)
         self._Switches = value
 
     Switches = property(getSwitches, setSwitches)
 
     def addSwitches(self, *Switches):
         for obj in Switches:
-            if self not in obj._SwitchingOperations:
-                obj._SwitchingOperations.append(self)
-            self._Switches.append(obj)
+            if obj._SwitchingOperations is EMPTY:
+                obj._SwitchingOperations = AssociationList([self])
+            else:
+                obj._SwitchingOperations.add(self)
+            if self._Switches is EMPTY:
+                self._Switches = AssociationList([obj])
+            else:
+                self._Switches.add(obj)
 
     def removeSwitches(self, *Switches):
         for obj in Switches:
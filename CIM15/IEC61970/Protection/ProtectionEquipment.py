@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.Equipment import Equipment
+from CIM15.Element import AssociationList, EMPTY
 
 class ProtectionEquipment(Equipment):
     """An electrical device designed to respond to input conditions in a prescribed manner and after specified conditions are met to cause contact operation or similar abrupt change in associated electric control circuits, or simply to display the detected condition. Protection equipment are associated with conducting equipment and usually operate circuit breakers.An electrical device designed to respond to input conditions in a prescribed manner and after specified conditions are met to cause contact operation or similar abrupt change in associated electric control circuits, or simply to display the detected condition. Protection equipment are associated with conducting equipment and usually operate circuit breakers.
@@ -54,11 +55,13 @@ class ProtectionEquipment(Equipment):
         #: The unit multiplier of the value. Values are: "M", "G", "d", "micro", "c", "p", "n", "T", "k", "m", "none"
         self.unitMultiplier = unitMultiplier
 
-        self._ConductingEquipments = []
-        self.ConductingEquipments = [] if ConductingEquipments is None else ConductingEquipments
+        self._ConductingEquipments = EMPTY
+        if ConductingEquipments is not None:
+            self.ConductingEquipments = ConductingEquipments
 
-        self._ProtectedSwitches = []
-        self.ProtectedSwitches = [] if ProtectedSwitches is None else ProtectedSwitches
+        self._ProtectedSwitches = EMPTY
+        if ProtectedSwitches is not None:
+            self.ProtectedSwitches = ProtectedSwitches
 
         super(ProtectionEquipment, self).__init__(*args, **kw_args)
 
@@ -75,21 +78,28 @@ class ProtectionEquipment(Equipment):
         return self._ConductingEquipments
 
     def setConductingEquipments(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ConductingEquipments:
-            filtered = [q for q in p.ProtectionEquipments if q != self]
-            self._ConductingEquipments._ProtectionEquipments = filtered
+            p._ProtectionEquipments.discard(self)
         for r in value:
-            if self not in r._ProtectionEquipments:
-                r._ProtectionEquipments.append(self)
+            if r._ProtectionEquipments is EMPTY:
+                r._ProtectionEquipments = AssociationList([self])
+            else:
+                r._ProtectionEquipments.add(self)
         self._ConductingEquipments = value
 
     ConductingEquipments = property(getConductingEquipments, setConductingEquipments)
 
     def addConductingEquipments(self, *ConductingEquipments):
         for obj in ConductingEquipments:
-            if self not in obj._ProtectionEquipments:
-                obj._ProtectionEquipments.append(self)
-            self._ConductingEquipments.append(obj)
+            if obj._ProtectionEquipments is EMPTY:
+                obj._ProtectionEquipments = AssociationList([self])
+            else:
+                obj._ProtectionEquipments.add(self)
+            if self._ConductingEquipments is EMPTY:
+                self._ConductingEquipments = AssociationList([obj])
+            else:
+                self._ConductingEquipments.add(obj)
 
     def removeConductingEquipments(self, *ConductingEquipments):
         for obj in ConductingEquipments:
@@ -103,21 +113,28 @@ class ProtectionEquipment(Equipment):
         return self._ProtectedSwitches
 
     def setProtectedSwitches(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ProtectedSwitches:
-            filtered = [q for q in p.ProtectionEquipments if q != self]
-            self._ProtectedSwitches._ProtectionEquipments = filtered
+            p._ProtectionEquipments.discard(self)
         for r in value:
-            if self not in r._ProtectionEquipments:
-                r._ProtectionEquipments.append(self)
+            if r._ProtectionEquipments is EMPTY:
+                r._ProtectionEquipments = AssociationList([self])
+            else:
+                r._ProtectionEquipments.add(self)
         self._ProtectedSwitches = value
 
     ProtectedSwitches = property(getProtectedSwitches, setProtectedSwitches)
 
     def addProtectedSwitches(self, *ProtectedSwitches):
         for obj in ProtectedSwitches:
-            if self not in obj._ProtectionEquipments:
-                obj._ProtectionEquipments.append(self)
-            self._ProtectedSwitches.append(obj)
+            if obj._ProtectionEquipments is EMPTY:
+                obj._ProtectionEquipments = AssociationList([self])
+            else:
+                obj._ProtectionEquipments.add(self)
+            if self._ProtectedSwitches is EMPTY:
+                self._ProtectedSwitches = AssociationList([obj])
+            else:
+                self._ProtectedSwitches.add(obj)
 
     def removeProtectedSwitches(self, *ProtectedSwitches):
         for obj in ProtectedSwitches:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.PowerSystemResource import PowerSystemResource
+from CIM15.Element import AssociationList, EMPTY
 
 class CommunicationLink(PowerSystemResource):
     """The connection to remote units is through one or more communication links. Reduntant links may exist. The CommunicationLink class inherit PowerSystemResource. The intention is to allow CommunicationLinks to have Measurements. These Measurements can be used to model link status as operational, out of service, unit failure etc.The connection to remote units is through one or more communication links. Reduntant links may exist. The CommunicationLink class inherit PowerSystemResource. The intention is to allow CommunicationLinks to have Measurements. These Measurements can be used to model link status as operational, out of service, unit failure etc.
@@ -29,8 +30,9 @@ class CommunicationLink(PowerSystemResource):
 
         @param RemoteUnits: RTUs may be attached to communication links.
         """
-        self._RemoteUnits = []
-        self.RemoteUnits = [] if RemoteUnits is None else RemoteUnits
+        self._RemoteUnits = EMPTY
+        if RemoteUnits is not None:
+            self.RemoteUnits = RemoteUnits
 
         super(CommunicationLink, self).__init__(*args, **kw_args)
 
@@ -47,21 +49,28 @@ class CommunicationLink(PowerSystemResource):
         return self._RemoteUnits
 
     def setRemoteUnits(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._RemoteUnits:
-            filtered = [q for q in p.CommunicationLinks if q != self]
-            self._RemoteUnits._CommunicationLinks = filtered
+            p._CommunicationLinks.discard(self)
         for r in value:
-            if self not in r._CommunicationLinks:
-                r._CommunicationLinks.append(self)
+            if r._CommunicationLinks is EMPTY:
+                r._CommunicationLinks = AssociationList([self])
+            else:
+                r._CommunicationLinks.add(self)
         self._RemoteUnits = value
 
     RemoteUnits = property(getRemoteUnits, setRemoteUnits)
 
     def addRemoteUnits(self, *RemoteUnits):
         for obj in RemoteUnits:
-            if self not in obj._CommunicationLinks:
-                obj._CommunicationLinks.append(self)
-            self._RemoteUnits.append(obj)
+            if obj._CommunicationLinks is EMPTY:
+                obj._CommunicationLinks = AssociationList([self])
+            else:
+                obj._CommunicationLinks.add(self)
+            if self._RemoteUnits is EMPTY:
+                self._RemoteUnits = AssociationList([obj])
+            else:
+                self._RemoteUnits.add(obj)
 
     def removeRemoteUnits(self, *RemoteUnits):
         for obj in RemoteUnits:
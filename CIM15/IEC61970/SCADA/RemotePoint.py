@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class RemotePoint(IdentifiedObject):
     """For a RTU remote points correspond to telemetered values or control outputs. Other units (e.g. control centers) usually also contain calculated values.For a RTU remote points correspond to telemetered values or control outputs. Other units (e.g. control centers) usually also contain calculated values.
@@ -48,13 +49,14 @@ class RemotePoint(IdentifiedObject):
 
     def setRemoteUnit(self, value):
         if self._RemoteUnit is not None:
-            filtered = [x for x in self.RemoteUnit.RemotePoints if x != self]
-            self._RemoteUnit._RemotePoints = filtered
+            self._RemoteUnit._RemotePoints.discard(self)
 
         self._RemoteUnit = value
         if self._RemoteUnit is not None:
-            if self not in self._RemoteUnit._RemotePoints:
-                self._RemoteUnit._RemotePoints.append(self)
+            if self._RemoteUnit._RemotePoints is EMPTY:
+                self._RemoteUnit._RemotePoints = AssociationList([self])
+            else:
+                self._RemoteUnit._RemotePoints.add(self)
 
     RemoteUnit = property(getRemoteUnit, setRemoteUnit)
 
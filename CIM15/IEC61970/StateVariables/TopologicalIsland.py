@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class TopologicalIsland(IdentifiedObject):
     """An electrically connected subset of the network. Topological islands can change as the current network state changes: e.g. due to  - disconnect switches or breakers change state in a SCADA/EMS - manual creation, change or deletion of TopologicalNodes in a planning tool.An electrically connected subset of the network. Topological islands can change as the current network state changes: e.g. due to  - disconnect switches or breakers change state in a SCADA/EMS - manual creation, change or deletion of TopologicalNodes in a planning tool.
@@ -33,8 +34,9 @@ class TopologicalIsland(IdentifiedObject):
         self._AngleRef_TopologicalNode = None
         self.AngleRef_TopologicalNode = AngleRef_TopologicalNode
 
-        self._TopologicalNodes = []
-        self.TopologicalNodes = [] if TopologicalNodes is None else TopologicalNodes
+        self._TopologicalNodes = EMPTY
+        if TopologicalNodes is not None:
+            self.TopologicalNodes = TopologicalNodes
 
         super(TopologicalIsland, self).__init__(*args, **kw_args)
 
@@ -67,6 +69,7 @@ class TopologicalIsland(IdentifiedObject):
         return self._TopologicalNodes
 
     def setTopologicalNodes(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._TopologicalNodes:
             x.TopologicalIsland = None
         for y in value:
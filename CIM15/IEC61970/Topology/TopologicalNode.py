@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class TopologicalNode(IdentifiedObject):
     """For a detailed substation model a TopologicalNode is a set of connectivity nodes that, in the current network state, are connected together through any type of closed switches, including  jumpers. Topological nodes changes as the current network state changes (i.e., switches, breakers, etc. change state). For a planning model switch statuses are not used to form TopologicalNodes. Instead they are manually created or deleted in a model builder tool. TopologialNodes maintained this way are also called 'busses'.For a detailed substation model a TopologicalNode is a set of connectivity nodes that, in the current network state, are connected together through any type of closed switches, including  jumpers. Topological nodes changes as the current network state changes (i.e., switches, breakers, etc. change state). For a planning model switch statuses are not used to form TopologicalNodes. Instead they are manually created or deleted in a model builder tool. TopologialNodes maintained this way are also called 'busses'.
@@ -47,8 +48,9 @@ class TopologicalNode(IdentifiedObject):
         self._SvInjection = None
         self.SvInjection = SvInjection
 
-        self._ConnectivityNodes = []
-        self.ConnectivityNodes = [] if ConnectivityNodes is None else ConnectivityNodes
+        self._ConnectivityNodes = EMPTY
+        if ConnectivityNodes is not None:
+            self.ConnectivityNodes = ConnectivityNodes
 
         self._SvVoltage = None
         self.SvVoltage = SvVoltage
@@ -62,8 +64,9 @@ class TopologicalNode(IdentifiedObject):
         self._ReportingGroup = None
         self.ReportingGroup = ReportingGroup
 
-        self._Terminal = []
-        self.Terminal = [] if Terminal is None else Terminal
+        self._Terminal = EMPTY
+        if Terminal is not None:
+            self.Terminal = Terminal
 
         self._AngleRef_TopologicalIsland = None
         self.AngleRef_TopologicalIsland = AngleRef_TopologicalIsland
@@ -100,13 +103,14 @@ class TopologicalNode(IdentifiedObject):
 
     def setConnectivityNodeContainer(self, value):
         if self._ConnectivityNodeContainer is not None:
-            filtered = [x for x in self.ConnectivityNodeContainer.TopologicalNode if x != self]
-            self._ConnectivityNodeContainer._TopologicalNode = filtered
+            self._ConnectivityNodeContainer._TopologicalNode.discard(self)
 
         self._ConnectivityNodeContainer = value
         if self._ConnectivityNodeContainer is not None:
-            if self not in self._ConnectivityNodeContainer._TopologicalNode:
-                self._ConnectivityNodeContainer._TopologicalNode.append(self)
+            if self._ConnectivityNodeContainer._TopologicalNode is EMPTY:
+                self._ConnectivityNodeContainer._TopologicalNode = AssociationList([self])
+            else:
+                self._ConnectivityNodeContainer._TopologicalNode.add(self)
 
     ConnectivityNodeContainer = property(getConnectivityNodeContainer, setConnectivityNodeContainer)
 
@@ -132,6 +136,7 @@ class TopologicalNode(IdentifiedObject):
         return self._ConnectivityNodes
 
     def setConnectivityNodes(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ConnectivityNodes:
             x.TopologicalNode = None
         for y in value:
@@ -171,13 +176,14 @@ class TopologicalNode(IdentifiedObject):
 
     def setBaseVoltage(self, value):
         if self._BaseVoltage is not None:
-            filtered = [x for x in self.BaseVoltage.TopologicalNode if x != self]
-            self._BaseVoltage._TopologicalNode = filtered
+            self._BaseVoltage._TopologicalNode.discard(self)
 
         self._BaseVoltage = value
         if self._BaseVoltage is not None:
-            if self not in self._BaseVoltage._TopologicalNode:
-                self._BaseVoltage._TopologicalNode.append(self)
+            if self._BaseVoltage._TopologicalNode is EMPTY:
+                self._BaseVoltage._TopologicalNode = AssociationList([self])
+            else:
+                self._BaseVoltage._TopologicalNode.add(self)
 
     BaseVoltage = property(getBaseVoltage, setBaseVoltage)
 
@@ -188,13 +194,14 @@ class TopologicalNode(IdentifiedObject):
 
     def setTopologicalIsland(self, value):
         if self._TopologicalIsland is not None:
-            filtered = [x for x in self.TopologicalIsland.TopologicalNodes if x != self]
-            self._TopologicalIsland._TopologicalNodes = filtered
+            self._TopologicalIsland._TopologicalNodes.discard(self)
 
         self._TopologicalIsland = value
         if self._TopologicalIsland is not None:
-            if self not in self._TopologicalIsland._TopologicalNodes:
-                self._TopologicalIsland._TopologicalNodes.append(self)
+            if self._TopologicalIsland._TopologicalNodes is EMPTY:
+                self._TopologicalIsland._TopologicalNodes = AssociationList([self])
+            else:
+                self._TopologicalIsland._TopologicalNodes.add(self)
 
     TopologicalIsland = property(getTopologicalIsland, setTopologicalIsland)
 
@@ -205,13 +212,14 @@ class TopologicalNode(IdentifiedObject):
 
     def setReportingGroup(self, value):
         if self._ReportingGroup is not None:
-            filtered = [x for x in self.ReportingGroup.TopologicalNode if x != self]
-            self._ReportingGroup._TopologicalNode = filtered
+            self._ReportingGroup._TopologicalNode.discard(self)
 
         self._ReportingGroup = value
         if self._ReportingGroup is not None:
-            if self not in self._ReportingGroup._TopologicalNode:
-                self._ReportingGroup._TopologicalNode.append(self)
+            if self._ReportingGroup._TopologicalNode is EMPTY:
+                self._ReportingGroup._TopologicalNode = AssociationList([self])
+            else:
+                self._ReportingGroup._TopologicalNode.add(self)
 
     ReportingGroup = property(getReportingGroup, setReportingGroup)
 
@@ -221,6 +229,7 @@ class TopologicalNode(IdentifiedObject):
         return self._Terminal
 
     def setTerminal(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Terminal:
             x.TopologicalNode = None
         for y in value:
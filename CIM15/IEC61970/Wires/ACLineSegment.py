@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Wires.Conductor import Conductor
+from CIM15.Element import AssociationList, EMPTY
 from CIM15.IEC61970.Wires.PerLengthPhaseImpedance import PerLengthPhaseImpedance
 from CIM15.IEC61970.Wires.PerLengthSequenceImpedance import PerLengthSequenceImpedance
 
@@ -85,20 +86,24 @@ class ACLineSegment(Conductor):
         elif PerLengthImpedance is not None:
             self.PerLengthImpedance = PerLengthImpedance
 
-        self._ConductorAssets = []
-        self.ConductorAssets = [] if ConductorAssets is None else ConductorAssets
+        self._ConductorAssets = EMPTY
+        if ConductorAssets is not None:
+            self.ConductorAssets = ConductorAssets
 
         self._ConductorInfo = None
         self.ConductorInfo = ConductorInfo
 
-        self._Cut = []
-        self.Cut = [] if Cut is None else Cut
+        self._Cut = EMPTY
+        if Cut is not None:
+            self.Cut = Cut
 
-        self._Clamp = []
-        self.Clamp = [] if Clamp is None else Clamp
+        self._Clamp = EMPTY
+        if Clamp is not None:
+            self.Clamp = Clamp
 
-        self._ACLineSegmentPhases = []
-        self.ACLineSegmentPhases = [] if ACLineSegmentPhases is None else ACLineSegmentPhases
+        self._ACLineSegmentPhases = EMPTY
+        if ACLineSegmentPhases is not None:
+            self.ACLineSegmentPhases = ACLineSegmentPhases
 
         super(ACLineSegment, self).__init__(*args, **kw_args)
 
@@ -127,13 +132,14 @@ class ACLineSegment(Conductor):
 
     def setPerLengthImpedance(self, value):
         if self._PerLengthImpedance is not None:
-            filtered = [x for x in self.PerLengthImpedance.LineSegments if x != self]
-            self._PerLengthImpedance._LineSegments = filtered
+            self._PerLengthImpedance._LineSegments.discard(self)
 
         self._PerLengthImpedance = value
         if self._PerLengthImpedance is not None:
-            if self not in self._PerLengthImpedance._LineSegments:
-                self._PerLengthImpedance._LineSegments.append(self)
+            if self._PerLengthImpedance._LineSegments is EMPTY:
+                self._PerLengthImpedance._LineSegments = AssociationList([self])
+            else:
+                self._PerLengthImpedance._LineSegments.add(self)
 
     PerLengthImpedance = property(getPerLengthImpedance, setPerLengthImpedance)
 
@@ -141,6 +147,7 @@ class ACLineSegment(Conductor):
         return self._ConductorAssets
 
     def setConductorAssets(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ConductorAssets:
             x.ConductorSegment = None
         for y in value:
@@ -164,13 +171,14 @@ class ACLineSegment(Conductor):
 
     def setConductorInfo(self, value):
         if self._ConductorInfo is not None:
-            filtered = [x for x in self.ConductorInfo.LineSegments if x != self]
-            self._ConductorInfo._LineSegments = filtered
+            self._ConductorInfo._LineSegments.discard(self)
 
         self._ConductorInfo = value
         if self._ConductorInfo is not None:
-            if self not in self._ConductorInfo._LineSegments:
-                self._ConductorInfo._LineSegments.append(self)
+            if self._ConductorInfo._LineSegments is EMPTY:
+                self._ConductorInfo._LineSegments = AssociationList([self])
+            else:
+                self._ConductorInfo._LineSegments.add(self)
 
     ConductorInfo = property(getConductorInfo, setConductorInfo)
 
@@ -179,6 +187,7 @@ class ACLineSegment(Conductor):
         return self._Cut
 
     def setCut(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Cut:
             x.ACLineSegment = None
         for y in value:
@@ -213,6 +222,7 @@ class ACLineSegment(Conductor):
         return self._Clamp
 
     def setClamp(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._Clamp:
             x.ACLineSegment = None
         for y in value:
@@ -233,6 +243,7 @@ class ACLineSegment(Conductor):
         return self._ACLineSegmentPhases
 
     def setACLineSegmentPhases(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ACLineSegmentPhases:
             x.ACLineSegment = None
         for y in value:
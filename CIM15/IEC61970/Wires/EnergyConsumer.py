@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.ConductingEquipment import ConductingEquipment
+from CIM15.Element import AssociationList, EMPTY
 
 class EnergyConsumer(ConductingEquipment):
     """Generic user of energy - a  point of consumption on the power system modelGeneric user of energy - a  point of consumption on the power system model
@@ -52,8 +53,9 @@ class EnergyConsumer(ConductingEquipment):
         #: Reactive power of the load that is a fixed quantity. Load sign convention is used, i.e. positive sign means flow out from a node.
         self.qfixed = qfixed
 
-        self._ServiceDeliveryPoints = []
-        self.ServiceDeliveryPoints = [] if ServiceDeliveryPoints is None else ServiceDeliveryPoints
+        self._ServiceDeliveryPoints = EMPTY
+        if ServiceDeliveryPoints is not None:
+            self.ServiceDeliveryPoints = ServiceDeliveryPoints
 
         self._LoadResponse = None
         self.LoadResponse = LoadResponse
@@ -61,8 +63,9 @@ class EnergyConsumer(ConductingEquipment):
         self._PowerCutZone = None
         self.PowerCutZone = PowerCutZone
 
-        self._EnergyConsumerPhases = []
-        self.EnergyConsumerPhases = [] if EnergyConsumerPhases is None else EnergyConsumerPhases
+        self._EnergyConsumerPhases = EMPTY
+        if EnergyConsumerPhases is not None:
+            self.EnergyConsumerPhases = EnergyConsumerPhases
 
         super(EnergyConsumer, self).__init__(*args, **kw_args)
 
@@ -78,6 +81,7 @@ class EnergyConsumer(ConductingEquipment):
         return self._ServiceDeliveryPoints
 
     def setServiceDeliveryPoints(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ServiceDeliveryPoints:
             x.EnergyConsumer = None
         for y in value:
@@ -101,13 +105,14 @@ class EnergyConsumer(ConductingEquipment):
 
     def setLoadResponse(self, value):
         if self._LoadResponse is not None:
-            filtered = [x for x in self.LoadResponse.EnergyConsumer if x != self]
-            self._LoadResponse._EnergyConsumer = filtered
+            self._LoadResponse._EnergyConsumer.discard(self)
 
         self._LoadResponse = value
         if self._LoadResponse is not None:
-            if self not in self._LoadResponse._EnergyConsumer:
-                self._LoadResponse._EnergyConsumer.append(self)
+            if self._LoadResponse._EnergyConsumer is EMPTY:
+                self._LoadResponse._EnergyConsumer = AssociationList([self])
+            else:
+                self._LoadResponse._EnergyConsumer.add(self)
 
     LoadResponse = property(getLoadResponse, setLoadResponse)
 
@@ -118,13 +123,14 @@ class EnergyConsumer(ConductingEquipment):
 
     def setPowerCutZone(self, value):
         if self._PowerCutZone is not None:
-            filtered = [x for x in self.PowerCutZone.EnergyConsumers if x != self]
-            self._PowerCutZone._EnergyConsumers = filtered
+            self._PowerCutZone._EnergyConsumers.discard(self)
 
         self._PowerCutZone = value
         if self._PowerCutZone is not None:
-            if self not in self._PowerCutZone._EnergyConsumers:
-                self._PowerCutZone._EnergyConsumers.append(self)
+            if self._PowerCutZone._EnergyConsumers is EMPTY:
+                self._PowerCutZone._EnergyConsumers = AssociationList([self])
+            else:
+                self._PowerCutZone._EnergyConsumers.add(self)
 
     PowerCutZone = property(getPowerCutZone, setPowerCutZone)
 
@@ -133,6 +139,7 @@ class EnergyConsumer(ConductingEquipment):
         return self._EnergyConsumerPhases
 
     def setEnergyConsumerPhases(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._EnergyConsumerPhases:
             x.EnergyConsumer = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.ConductingEquipment import ConductingEquipment
+from CIM15.Element import AssociationList, EMPTY
 
 class Ground(ConductingEquipment):
     """A common point for connecting grounded conducting equipment such as shunt capacitors. The power system model can have more than one ground.A common point for connecting grounded conducting equipment such as shunt capacitors. The power system model can have more than one ground.
@@ -29,8 +30,9 @@ class Ground(ConductingEquipment):
 
         @param WindingInsulations:
         """
-        self._WindingInsulations = []
-        self.WindingInsulations = [] if WindingInsulations is None else WindingInsulations
+        self._WindingInsulations = EMPTY
+        if WindingInsulations is not None:
+            self.WindingInsulations = WindingInsulations
 
         super(Ground, self).__init__(*args, **kw_args)
 
@@ -46,6 +48,7 @@ class Ground(ConductingEquipment):
         return self._WindingInsulations
 
     def setWindingInsulations(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._WindingInsulations:
             x.Ground = None
         for y in value:
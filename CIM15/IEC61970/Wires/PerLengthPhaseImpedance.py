@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class PerLengthPhaseImpedance(IdentifiedObject):
     """Impedance and admittance parameters per unit length for n-wire unbalanced lines, in matrix form.Impedance and admittance parameters per unit length for n-wire unbalanced lines, in matrix form.
@@ -34,11 +35,13 @@ class PerLengthPhaseImpedance(IdentifiedObject):
         #: Number of phase, neutral, and other wires retained. Constrains the number of matrix elements and the phase codes that can be used with this matrix.
         self.conductorCount = conductorCount
 
-        self._LineSegments = []
-        self.LineSegments = [] if LineSegments is None else LineSegments
+        self._LineSegments = EMPTY
+        if LineSegments is not None:
+            self.LineSegments = LineSegments
 
-        self._PhaseImpedanceData = []
-        self.PhaseImpedanceData = [] if PhaseImpedanceData is None else PhaseImpedanceData
+        self._PhaseImpedanceData = EMPTY
+        if PhaseImpedanceData is not None:
+            self.PhaseImpedanceData = PhaseImpedanceData
 
         super(PerLengthPhaseImpedance, self).__init__(*args, **kw_args)
 
@@ -55,6 +58,7 @@ class PerLengthPhaseImpedance(IdentifiedObject):
         return self._LineSegments
 
     def setLineSegments(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._LineSegments:
             x.PhaseImpedance = None
         for y in value:
@@ -77,6 +81,7 @@ class PerLengthPhaseImpedance(IdentifiedObject):
         return self._PhaseImpedanceData
 
     def setPhaseImpedanceData(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._PhaseImpedanceData:
             x.PhaseImpedance = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Wires.TapChanger import TapChanger
+from CIM15.Element import AssociationList, EMPTY
 
 class PhaseTapChanger(TapChanger):
     """A PhaseTapChanger controls the phase angle difference across the power transformer and hence the activer power flow through it. A PhaseTapChanger may also impact the voltage magnitude.A PhaseTapChanger controls the phase angle difference across the power transformer and hence the activer power flow through it. A PhaseTapChanger may also impact the voltage magnitude.
@@ -51,13 +52,14 @@ class PhaseTapChanger(TapChanger):
 
     def setPhaseTapChangerTabular(self, value):
         if self._PhaseTapChangerTabular is not None:
-            filtered = [x for x in self.PhaseTapChangerTabular.PhaseTapChanger if x != self]
-            self._PhaseTapChangerTabular._PhaseTapChanger = filtered
+            self._PhaseTapChangerTabular._PhaseTapChanger.discard(self)
 
         self._PhaseTapChangerTabular = value
         if self._PhaseTapChangerTabular is not None:
-            if self not in self._PhaseTapChangerTabular._PhaseTapChanger:
-                self._PhaseTapChangerTabular._PhaseTapChanger.append(self)
+            if self._PhaseTapChangerTabular._PhaseTapChanger is EMPTY:
+                self._PhaseTapChangerTabular._PhaseTapChanger = AssociationList([self])
+            else:
+                self._PhaseTapChangerTabular._PhaseTapChanger.add(self)
 
     PhaseTapChangerTabular = property(getPhaseTapChangerTabular, setPhaseTapChangerTabular)
 
@@ -18,7 +18,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from CIM15.Element import Element
+from CIM15.Element import Element, AssociationList, EMPTY
 
 class PhaseTapChangerTabular(Element):
     """With PhaseTapChangerTabular it is possible to describe curve how the the phase angle difference and reactance varies with the tap step.With PhaseTapChangerTabular it is possible to describe curve how the the phase angle difference and reactance varies with the tap step.
@@ -30,11 +30,13 @@ class PhaseTapChangerTabular(Element):
         @param PhaseTapChangerTabularPoint:
         @param PhaseTapChanger:
         """
-        self._PhaseTapChangerTabularPoint = []
-        self.PhaseTapChangerTabularPoint = [] if PhaseTapChangerTabularPoint is None else PhaseTapChangerTabularPoint
+        self._PhaseTapChangerTabularPoint = EMPTY
+        if PhaseTapChangerTabularPoint is not None:
+            self.PhaseTapChangerTabularPoint = PhaseTapChangerTabularPoint
 
-        self._PhaseTapChanger = []
-        self.PhaseTapChanger = [] if PhaseTapChanger is None else PhaseTapChanger
+        self._PhaseTapChanger = EMPTY
+        if PhaseTapChanger is not None:
+            self.PhaseTapChanger = PhaseTapChanger
 
         super(PhaseTapChangerTabular, self).__init__(*args, **kw_args)
 
@@ -50,6 +52,7 @@ class PhaseTapChangerTabular(Element):
         return self._PhaseTapChangerTabularPoint
 
     def setPhaseTapChangerTabularPoint(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._PhaseTapChangerTabularPoint:
             x.PhaseTapChangerTabular = None
         for y in value:
@@ -71,6 +74,7 @@ class PhaseTapChangerTabular(Element):
         return self._PhaseTapChanger
 
     def setPhaseTapChanger(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._PhaseTapChanger:
             x.PhaseTapChangerTabular = None
         for y in value:
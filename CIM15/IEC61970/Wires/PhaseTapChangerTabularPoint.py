@@ -18,7 +18,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from CIM15.Element import Element
+from CIM15.Element import Element, AssociationList, EMPTY
 
 class PhaseTapChangerTabularPoint(Element):
     """PhaseTapChangerTabularPoint describe each tap step in the curve.PhaseTapChangerTabularPoint describe each tap step in the curve.
@@ -59,13 +59,14 @@ class PhaseTapChangerTabularPoint(Element):
 
     def setPhaseTapChangerTabular(self, value):
         if self._PhaseTapChangerTabular is not None:
-            filtered = [x for x in self.PhaseTapChangerTabular.PhaseTapChangerTabularPoint if x != self]
-            self._PhaseTapChangerTabular._PhaseTapChangerTabularPoint = filtered
+            self._PhaseTapChangerTabular._PhaseTapChangerTabularPoint.discard(self)
 
         self._PhaseTapChangerTabular = value
         if self._PhaseTapChangerTabular is not None:
-            if self not in self._PhaseTapChangerTabular._PhaseTapChangerTabularPoint:
-                self._PhaseTapChangerTabular._PhaseTapChangerTabularPoint.append(self)
+            if self._PhaseTapChangerTabular._PhaseTapChangerTabularPoint is EMPTY:
+                self._PhaseTapChangerTabular._PhaseTapChangerTabularPoint = AssociationList([self])
+            else:
+                self._PhaseTapChangerTabular._PhaseTapChangerTabularPoint.add(self)
 
     PhaseTapChangerTabular = property(getPhaseTapChangerTabular, setPhaseTapChangerTabular)
 
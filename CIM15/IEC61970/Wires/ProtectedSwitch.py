@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Wires.Switch import Switch
+from CIM15.Element import AssociationList, EMPTY
 
 class ProtectedSwitch(Switch):
     """A ProtectedSwitch is a switching device that can be operated by ProtectionEquipment.A ProtectedSwitch is a switching device that can be operated by ProtectionEquipment.
@@ -34,11 +35,13 @@ class ProtectedSwitch(Switch):
         #: The maximum fault current a breaking device can break safely under prescribed conditions of use.
         self.breakingCapacity = breakingCapacity
 
-        self._ProtectionEquipments = []
-        self.ProtectionEquipments = [] if ProtectionEquipments is None else ProtectionEquipments
+        self._ProtectionEquipments = EMPTY
+        if ProtectionEquipments is not None:
+            self.ProtectionEquipments = ProtectionEquipments
 
-        self._RecloseSequences = []
-        self.RecloseSequences = [] if RecloseSequences is None else RecloseSequences
+        self._RecloseSequences = EMPTY
+        if RecloseSequences is not None:
+            self.RecloseSequences = RecloseSequences
 
         super(ProtectedSwitch, self).__init__(*args, **kw_args)
 
@@ -55,21 +58,28 @@ class ProtectedSwitch(Switch):
         return self._ProtectionEquipments
 
     def setProtectionEquipments(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ProtectionEquipments:
-            filtered = [q for q in p.ProtectedSwitches if q != self]
-            self._ProtectionEquipments._ProtectedSwitches = filtered
+            p._ProtectedSwitches.discard(self)
         for r in value:
-            if self not in r._ProtectedSwitches:
-                r._ProtectedSwitches.append(self)
+            if r._ProtectedSwitches is EMPTY:
+                r._ProtectedSwitches = AssociationList([self])
+            else:
+                r._ProtectedSwitches.add(self)
         self._ProtectionEquipments = value
 
     ProtectionEquipments = property(getProtectionEquipments, setProtectionEquipments)
 
     def addProtectionEquipments(self, *ProtectionEquipments):
         for obj in ProtectionEquipments:
-            if self not in obj._ProtectedSwitches:
-                obj._ProtectedSwitches.append(self)
-            self._ProtectionEquipments.append(obj)
+            if obj._ProtectedSwitches is EMPTY:
+                obj._ProtectedSwitches = AssociationList([self])
+            else:
+                obj._ProtectedSwitches.add(self)
+            if self._ProtectionEquipments is EMPTY:
+                self._ProtectionEquipments = AssociationList([obj])
+            else:
+                self._ProtectionEquipments.add(obj)
 
     def removeProtectionEquipments(self, *ProtectionEquipments):
         for obj in ProtectionEquipments:
@@ -83,6 +93,7 @@ class ProtectedSwitch(Switch):
         return self._RecloseSequences
 
     def setRecloseSequences(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._RecloseSequences:
             x.ProtectedSwitch = None
         for y in value:
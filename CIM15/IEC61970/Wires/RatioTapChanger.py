@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Wires.TapChanger import TapChanger
+from CIM15.Element import AssociationList, EMPTY
 
 class RatioTapChanger(TapChanger):
     """A tap changer that changes the voltage ratio impacting the voltage magnitude but not the phase angle across the transformer.A tap changer that changes the voltage ratio impacting the voltage magnitude but not the phase angle across the transformer.
@@ -59,13 +60,14 @@ class RatioTapChanger(TapChanger):
 
     def setRatioTapChangerTabular(self, value):
         if self._RatioTapChangerTabular is not None:
-            filtered = [x for x in self.RatioTapChangerTabular.RatioTapChanger if x != self]
-            self._RatioTapChangerTabular._RatioTapChanger = filtered
+            self._RatioTapChangerTabular._RatioTapChanger.discard(self)
 
         self._RatioTapChangerTabular = value
         if self._RatioTapChangerTabular is not None:
-            if self not in self._RatioTapChangerTabular._RatioTapChanger:
-                self._RatioTapChangerTabular._RatioTapChanger.append(self)
+            if self._RatioTapChangerTabular._RatioTapChanger is EMPTY:
+                self._RatioTapChangerTabular._RatioTapChanger = AssociationList([self])
+            else:
+                self._RatioTapChangerTabular._RatioTapChanger.add(self)
 
     RatioTapChangerTabular = property(getRatioTapChangerTabular, setRatioTapChangerTabular)
 
@@ -18,7 +18,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from CIM15.Element import Element
+from CIM15.Element import Element, AssociationList, EMPTY
 
 class RatioTapChangerTabular(Element):
     """With RatioTapChangerTabular it is possible to describe curve how the voltage magnitude and reactance varies with the tap step.With RatioTapChangerTabular it is possible to describe curve how the voltage magnitude and reactance varies with the tap step.
@@ -30,11 +30,13 @@ class RatioTapChangerTabular(Element):
         @param RatioTapChangerTabularPoint:
         @param RatioTapChanger:
         """
-        self._RatioTapChangerTabularPoint = []
-        self.RatioTapChangerTabularPoint = [] if RatioTapChangerTabularPoint is None else RatioTapChangerTabularPoint
+        self._RatioTapChangerTabularPoint = EMPTY
+        if RatioTapChangerTabularPoint is not None:
+            self.RatioTapChangerTabularPoint = RatioTapChangerTabularPoint
 
-        self._RatioTapChanger = []
-        self.RatioTapChanger = [] if RatioTapChanger is None else RatioTapChanger
+        self._RatioTapChanger = EMPTY
+        if RatioTapChanger is not None:
+            self.RatioTapChanger = RatioTapChanger
 
         super(RatioTapChangerTabular, self).__init__(*args, **kw_args)
 
@@ -50,6 +52,7 @@ class RatioTapChangerTabular(Element):
         return self._RatioTapChangerTabularPoint
 
     def setRatioTapChangerTabularPoint(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._RatioTapChangerTabularPoint:
             x.RatioTapChangerTabular = None
         for y in value:
@@ -71,6 +74,7 @@ class RatioTapChangerTabular(Element):
         return self._RatioTapChanger
 
     def setRatioTapChanger(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._RatioTapChanger:
             x.RatioTapChangerTabular = None
         for y in value:
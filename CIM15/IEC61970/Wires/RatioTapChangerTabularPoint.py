@@ -18,7 +18,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from CIM15.Element import Element
+from CIM15.Element import Element, AssociationList, EMPTY
 
 class RatioTapChangerTabularPoint(Element):
     """RatioTapChangerTabularPoint describe each tap step in the curve.RatioTapChangerTabularPoint describe each tap step in the curve.
@@ -59,13 +59,14 @@ class RatioTapChangerTabularPoint(Element):
 
     def setRatioTapChangerTabular(self, value):
         if self._RatioTapChangerTabular is not None:
-            filtered = [x for x in self.RatioTapChangerTabular.RatioTapChangerTabularPoint if x != self]
-            self._RatioTapChangerTabular._RatioTapChangerTabularPoint = filtered
+            self._RatioTapChangerTabular._RatioTapChangerTabularPoint.discard(self)
 
         self._RatioTapChangerTabular = value
         if self._RatioTapChangerTabular is not None:
-            if self not in self._RatioTapChangerTabular._RatioTapChangerTabularPoint:
-                self._RatioTapChangerTabular._RatioTapChangerTabularPoint.append(self)
+            if self._RatioTapChangerTabular._RatioTapChangerTabularPoint is EMPTY:
+                self._RatioTapChangerTabular._RatioTapChangerTabularPoint = AssociationList([self])
+            else:
+                self._RatioTapChangerTabular._RatioTapChangerTabularPoint.add(self)
 
     RatioTapChangerTabular = property(getRatioTapChangerTabular, setRatioTapChangerTabular)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.PowerSystemResource import PowerSystemResource
+from CIM15.Element import AssociationList, EMPTY
 
 class RegulatingControl(PowerSystemResource):
     """Specifies a set of equipment that works together to control a power system quantity such as voltage or flow.Specifies a set of equipment that works together to control a power system quantity such as voltage or flow.
@@ -51,14 +52,16 @@ class RegulatingControl(PowerSystemResource):
         #: Phase voltage controlling this regulator, measured at regulator location. Values are: "s12N", "BN", "BC", "ABN", "s2N", "N", "ACN", "BCN", "ABCN", "AC", "s1N", "AN", "B", "AB", "C", "A", "CN", "ABC"
         self.monitoredPhase = monitoredPhase
 
-        self._RegulatingCondEq = []
-        self.RegulatingCondEq = [] if RegulatingCondEq is None else RegulatingCondEq
+        self._RegulatingCondEq = EMPTY
+        if RegulatingCondEq is not None:
+            self.RegulatingCondEq = RegulatingCondEq
 
         self._Terminal = None
         self.Terminal = Terminal
 
-        self._RegulationSchedule = []
-        self.RegulationSchedule = [] if RegulationSchedule is None else RegulationSchedule
+        self._RegulationSchedule = EMPTY
+        if RegulationSchedule is not None:
+            self.RegulationSchedule = RegulationSchedule
 
         super(RegulatingControl, self).__init__(*args, **kw_args)
 
@@ -75,6 +78,7 @@ class RegulatingControl(PowerSystemResource):
         return self._RegulatingCondEq
 
     def setRegulatingCondEq(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._RegulatingCondEq:
             x.RegulatingControl = None
         for y in value:
@@ -98,13 +102,14 @@ class RegulatingControl(PowerSystemResource):
 
     def setTerminal(self, value):
         if self._Terminal is not None:
-            filtered = [x for x in self.Terminal.RegulatingControl if x != self]
-            self._Terminal._RegulatingControl = filtered
+            self._Terminal._RegulatingControl.discard(self)
 
         self._Terminal = value
         if self._Terminal is not None:
-            if self not in self._Terminal._RegulatingControl:
-                self._Terminal._RegulatingControl.append(self)
+            if self._Terminal._RegulatingControl is EMPTY:
+                self._Terminal._RegulatingControl = AssociationList([self])
+            else:
+                self._Terminal._RegulatingControl.add(self)
 
     Terminal = property(getTerminal, setTerminal)
 
@@ -114,6 +119,7 @@ class RegulatingControl(PowerSystemResource):
         return self._RegulationSchedule
 
     def setRegulationSchedule(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._RegulationSchedule:
             x.RegulatingControl = None
         for y in value:
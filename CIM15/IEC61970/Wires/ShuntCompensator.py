@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Wires.RegulatingCondEq import RegulatingCondEq
+from CIM15.Element import AssociationList, EMPTY
 
 class ShuntCompensator(RegulatingCondEq):
     """A shunt capacitor or reactor or switchable bank of shunt capacitors or reactors. A section of a shunt compensator is an individual capacitor or reactor.  A negative value for reactivePerSection indicates that the compensator is a reactor. ShuntCompensator is a single terminal device.  Ground is implied.A shunt capacitor or reactor or switchable bank of shunt capacitors or reactors. A section of a shunt compensator is an individual capacitor or reactor.  A negative value for reactivePerSection indicates that the compensator is a reactor. ShuntCompensator is a single terminal device.  Ground is implied.
@@ -93,8 +94,9 @@ class ShuntCompensator(RegulatingCondEq):
         self._SvShuntCompensatorSections = None
         self.SvShuntCompensatorSections = SvShuntCompensatorSections
 
-        self._ShuntCompensatorPhases = []
-        self.ShuntCompensatorPhases = [] if ShuntCompensatorPhases is None else ShuntCompensatorPhases
+        self._ShuntCompensatorPhases = EMPTY
+        if ShuntCompensatorPhases is not None:
+            self.ShuntCompensatorPhases = ShuntCompensatorPhases
 
         super(ShuntCompensator, self).__init__(*args, **kw_args)
 
@@ -126,6 +128,7 @@ class ShuntCompensator(RegulatingCondEq):
         return self._ShuntCompensatorPhases
 
     def setShuntCompensatorPhases(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ShuntCompensatorPhases:
             x.ShuntCompensator = None
         for y in value:
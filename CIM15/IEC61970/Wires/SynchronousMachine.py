@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Wires.RegulatingCondEq import RegulatingCondEq
+from CIM15.Element import AssociationList, EMPTY
 
 class SynchronousMachine(RegulatingCondEq):
     """An electromechanical device that operates synchronously with the network. It is a single machine operating either as a generator or synchronous condenser or pump.An electromechanical device that operates synchronously with the network. It is a single machine operating either as a generator or synchronous condenser or pump.
@@ -153,14 +154,16 @@ class SynchronousMachine(RegulatingCondEq):
         #: Positive sequence reactance of the synchronous machine.
         self.x = x
 
-        self._PrimeMovers = []
-        self.PrimeMovers = [] if PrimeMovers is None else PrimeMovers
+        self._PrimeMovers = EMPTY
+        if PrimeMovers is not None:
+            self.PrimeMovers = PrimeMovers
 
         self._GeneratingUnit = None
         self.GeneratingUnit = GeneratingUnit
 
-        self._ReactiveCapabilityCurves = []
-        self.ReactiveCapabilityCurves = [] if ReactiveCapabilityCurves is None else ReactiveCapabilityCurves
+        self._ReactiveCapabilityCurves = EMPTY
+        if ReactiveCapabilityCurves is not None:
+            self.ReactiveCapabilityCurves = ReactiveCapabilityCurves
 
         self._HydroPump = None
         self.HydroPump = HydroPump
@@ -183,21 +186,28 @@ class SynchronousMachine(RegulatingCondEq):
         return self._PrimeMovers
 
     def setPrimeMovers(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._PrimeMovers:
-            filtered = [q for q in p.SynchronousMachines if q != self]
-            self._PrimeMovers._SynchronousMachines = filtered
+            p._SynchronousMachines.discard(self)
         for r in value:
-            if self not in r._SynchronousMachines:
-                r._SynchronousMachines.append(self)
+            if r._SynchronousMachines is EMPTY:
+                r._SynchronousMachines = AssociationList([self])
+            else:
+                r._SynchronousMachines.add(self)
         self._PrimeMovers = value
 
     PrimeMovers = property(getPrimeMovers, setPrimeMovers)
 
     def addPrimeMovers(self, *PrimeMovers):
         for obj in PrimeMovers:
-            if self not in obj._SynchronousMachines:
-                obj._SynchronousMachines.append(self)
-            self._PrimeMovers.append(obj)
+            if obj._SynchronousMachines is EMPTY:
+                obj._SynchronousMachines = AssociationList([self])
+            else:
+                obj._SynchronousMachines.add(self)
+            if self._PrimeMovers is EMPTY:
+                self._PrimeMovers = AssociationList([obj])
+            else:
+                self._PrimeMovers.add(obj)
 
     def removePrimeMovers(self, *PrimeMovers):
         for obj in PrimeMovers:
@@ -212,13 +222,14 @@ class SynchronousMachine(RegulatingCondEq):
 
     def setGeneratingUnit(self, value):
         if self._GeneratingUnit is not None:
-            filtered = [x for x in self.GeneratingUnit.SynchronousMachines if x != self]
-            self._GeneratingUnit._SynchronousMachines = filtered
+            self._GeneratingUnit._SynchronousMachines.discard(self)
 
         self._GeneratingUnit = value
         if self._GeneratingUnit is not None:
-            if self not in self._GeneratingUnit._SynchronousMachines:
-                self._GeneratingUnit._SynchronousMachines.append(self)
+            if self._GeneratingUnit._SynchronousMachines is EMPTY:
+                self._GeneratingUnit._SynchronousMachines = AssociationList([self])
+            else:
+                self._GeneratingUnit._SynchronousMachines.add(self)
 
     GeneratingUnit = property(getGeneratingUnit, setGeneratingUnit)
 
@@ -228,21 +239,28 @@ class SynchronousMachine(RegulatingCondEq):
         return self._ReactiveCapabilityCurves
 
     def setReactiveCapabilityCurves(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ReactiveCapabilityCurves:
-            filtered = [q for q in p.SynchronousMachines if q != self]
-            self._ReactiveCapabilityCurves._SynchronousMachines = filtered
+            p._SynchronousMachines.discard(self)
         for r in value:
-            if self not in r._SynchronousMachines:
-                r._SynchronousMachines.append(self)
+            if r._SynchronousMachines is EMPTY:
+                r._SynchronousMachines = AssociationList([self])
+            else:
+                r._SynchronousMachines.add(self)
         self._ReactiveCapabilityCurves = value
 
     ReactiveCapabilityCurves = property(getReactiveCapabilityCurves, setReactiveCapabilityCurves)
 
     def addReactiveCapabilityCurves(self, *ReactiveCapabilityCurves):
         for obj in ReactiveCapabilityCurves:
-            if self not in obj._SynchronousMachines:
-                obj._SynchronousMachines.append(self)
-            self._ReactiveCapabilityCurves.append(obj)
+            if obj._SynchronousMachines is EMPTY:
+                obj._SynchronousMachines = AssociationList([self])
+            else:
+                obj._SynchronousMachines.add(self)
+            if self._ReactiveCapabilityCurves is EMPTY:
+                self._ReactiveCapabilityCurves = AssociationList([obj])
+            else:
+                self._ReactiveCapabilityCurves.add(obj)
 
     def removeReactiveCapabilityCurves(self, *ReactiveCapabilityCurves):
         for obj in ReactiveCapabilityCurves:
@@ -273,13 +291,14 @@ class SynchronousMachine(RegulatingCondEq):
 
     def setInitialReactiveCapabilityCurve(self, value):
         if self._InitialReactiveCapabilityCurve is not None:
-            filtered = [x for x in self.InitialReactiveCapabilityCurve.InitiallyUsedBySynchronousMachines if x != self]
-            self._InitialReactiveCapabilityCurve._InitiallyUsedBySynchronousMachines = filtered
+            self._InitialReactiveCapabilityCurve._InitiallyUsedBySynchronousMachines.discard(self)
 
         self._InitialReactiveCapabilityCurve = value
         if self._InitialReactiveCapabilityCurve is not None:
-            if self not in self._InitialReactiveCapabilityCurve._InitiallyUsedBySynchronousMachines:
-                self._InitialReactiveCapabilityCurve._InitiallyUsedBySynchronousMachines.append(self)
+            if self._InitialReactiveCapabilityCurve._InitiallyUsedBySynchronousMachines is EMPTY:
+                self._InitialReactiveCapabilityCurve._InitiallyUsedBySynchronousMachines = AssociationList([self])
+            else:
+                self._InitialReactiveCapabilityCurve._InitiallyUsedBySynchronousMachines.add(self)
 
     InitialReactiveCapabilityCurve = property(getInitialReactiveCapabilityCurve, setInitialReactiveCapabilityCurve)
 
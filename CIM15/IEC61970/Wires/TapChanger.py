@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.PowerSystemResource import PowerSystemResource
+from CIM15.Element import AssociationList, EMPTY
 
 class TapChanger(PowerSystemResource):
     """Mechanism for changing transformer winding tap positions.Mechanism for changing transformer winding tap positions.
@@ -71,8 +72,9 @@ class TapChanger(PowerSystemResource):
         self._TapChangerInfo = None
         self.TapChangerInfo = TapChangerInfo
 
-        self._TapSchedules = []
-        self.TapSchedules = [] if TapSchedules is None else TapSchedules
+        self._TapSchedules = EMPTY
+        if TapSchedules is not None:
+            self.TapSchedules = TapSchedules
 
         self._TapChangerControl = None
         self.TapChangerControl = TapChangerControl
@@ -96,13 +98,14 @@ class TapChanger(PowerSystemResource):
 
     def setTapChangerInfo(self, value):
         if self._TapChangerInfo is not None:
-            filtered = [x for x in self.TapChangerInfo.TapChangers if x != self]
-            self._TapChangerInfo._TapChangers = filtered
+            self._TapChangerInfo._TapChangers.discard(self)
 
         self._TapChangerInfo = value
         if self._TapChangerInfo is not None:
-            if self not in self._TapChangerInfo._TapChangers:
-                self._TapChangerInfo._TapChangers.append(self)
+            if self._TapChangerInfo._TapChangers is EMPTY:
+                self._TapChangerInfo._TapChangers = AssociationList([self])
+            else:
+                self._TapChangerInfo._TapChangers.add(self)
 
     TapChangerInfo = property(getTapChangerInfo, setTapChangerInfo)
 
@@ -112,6 +115,7 @@ class TapChanger(PowerSystemResource):
         return self._TapSchedules
 
     def setTapSchedules(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._TapSchedules:
             x.TapChanger = None
         for y in value:
@@ -134,13 +138,14 @@ class TapChanger(PowerSystemResource):
 
     def setTapChangerControl(self, value):
         if self._TapChangerControl is not None:
-            filtered = [x for x in self.TapChangerControl.TapChanger if x != self]
-            self._TapChangerControl._TapChanger = filtered
+            self._TapChangerControl._TapChanger.discard(self)
 
         self._TapChangerControl = value
         if self._TapChangerControl is not None:
-            if self not in self._TapChangerControl._TapChanger:
-                self._TapChangerControl._TapChanger.append(self)
+            if self._TapChangerControl._TapChanger is EMPTY:
+                self._TapChangerControl._TapChanger = AssociationList([self])
+            else:
+                self._TapChangerControl._TapChanger.add(self)
 
     TapChangerControl = property(getTapChangerControl, setTapChangerControl)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Wires.RegulatingControl import RegulatingControl
+from CIM15.Element import AssociationList, EMPTY
 
 class TapChangerControl(RegulatingControl):
     """TapChangerControl discribe behaviour specific to tap changers, e.g. how the voltage at the end of a line varies with the load level and compensation of the voltage drop by tap adjustment.TapChangerControl discribe behaviour specific to tap changers, e.g. how the voltage at the end of a line varies with the load level and compensation of the voltage drop by tap adjustment.
@@ -53,8 +54,9 @@ class TapChangerControl(RegulatingControl):
         #: Maximum allowed regulated voltage on the PT secondary base, regardless of line drop compensation. Sometimes referred to as first-house protection.
         self.limitVoltage = limitVoltage
 
-        self._TapChanger = []
-        self.TapChanger = [] if TapChanger is None else TapChanger
+        self._TapChanger = EMPTY
+        if TapChanger is not None:
+            self.TapChanger = TapChanger
 
         super(TapChangerControl, self).__init__(*args, **kw_args)
 
@@ -71,6 +73,7 @@ class TapChangerControl(RegulatingControl):
         return self._TapChanger
 
     def setTapChanger(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._TapChanger:
             x.TapChangerControl = None
         for y in value:
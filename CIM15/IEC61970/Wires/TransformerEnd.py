@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class TransformerEnd(IdentifiedObject):
     """TransformerEnd is a conducting connection point of a power transformer. It corresponds to a physical transformer winding terminal.  In earlier CIM versions, the TransformerWinding class served a similar purpose. This successor TransformerEnd class is more flexible and has important differences with TransformerWinding.TransformerEnd is a conducting connection point of a power transformer. It corresponds to a physical transformer winding terminal.  In earlier CIM versions, the TransformerWinding class served a similar purpose. This successor TransformerEnd class is more flexible and has important differences with TransformerWinding.
@@ -69,8 +70,9 @@ class TransformerEnd(IdentifiedObject):
         self._Terminal = None
         self.Terminal = Terminal
 
-        self._FromWindingInsulations = []
-        self.FromWindingInsulations = [] if FromWindingInsulations is None else FromWindingInsulations
+        self._FromWindingInsulations = EMPTY
+        if FromWindingInsulations is not None:
+            self.FromWindingInsulations = FromWindingInsulations
 
         self._CoreAdmittance = None
         self.CoreAdmittance = CoreAdmittance
@@ -84,14 +86,17 @@ class TransformerEnd(IdentifiedObject):
         self._RatioTapChanger = None
         self.RatioTapChanger = RatioTapChanger
 
-        self._FromMeshImpedance = []
-        self.FromMeshImpedance = [] if FromMeshImpedance is None else FromMeshImpedance
+        self._FromMeshImpedance = EMPTY
+        if FromMeshImpedance is not None:
+            self.FromMeshImpedance = FromMeshImpedance
 
-        self._ToWindingInsulations = []
-        self.ToWindingInsulations = [] if ToWindingInsulations is None else ToWindingInsulations
+        self._ToWindingInsulations = EMPTY
+        if ToWindingInsulations is not None:
+            self.ToWindingInsulations = ToWindingInsulations
 
-        self._ToMeshImpedance = []
-        self.ToMeshImpedance = [] if ToMeshImpedance is None else ToMeshImpedance
+        self._ToMeshImpedance = EMPTY
+        if ToMeshImpedance is not None:
+            self.ToMeshImpedance = ToMeshImpedance
 
         self._StarImpedance = None
         self.StarImpedance = StarImpedance
@@ -113,13 +118,14 @@ class TransformerEnd(IdentifiedObject):
 
     def setBaseVoltage(self, value):
         if self._BaseVoltage is not None:
-            filtered = [x for x in self.BaseVoltage.TransformerEnd if x != self]
-            self._BaseVoltage._TransformerEnd = filtered
+            self._BaseVoltage._TransformerEnd.discard(self)
 
         self._BaseVoltage = value
         if self._BaseVoltage is not None:
-            if self not in self._BaseVoltage._TransformerEnd:
-                self._BaseVoltage._TransformerEnd.append(self)
+            if self._BaseVoltage._TransformerEnd is EMPTY:
+                self._BaseVoltage._TransformerEnd = AssociationList([self])
+            else:
+                self._BaseVoltage._TransformerEnd.add(self)
 
     BaseVoltage = property(getBaseVoltage, setBaseVoltage)
 
@@ -130,13 +136,14 @@ class TransformerEnd(IdentifiedObject):
 
     def setTerminal(self, value):
         if self._Terminal is not None:
-            filtered = [x for x in self.Terminal.TransformerEnd if x != self]
-            self._Terminal._TransformerEnd = filtered
+            self._Terminal._TransformerEnd.discard(self)
 
         self._Terminal = value
         if self._Terminal is not None:
-            if self not in self._Terminal._TransformerEnd:
-                self._Terminal._TransformerEnd.append(self)
+            if self._Terminal._TransformerEnd is EMPTY:
+                self._Terminal._TransformerEnd = AssociationList([self])
+            else:
+                self._Terminal._TransformerEnd.add(self)
 
     Terminal = property(getTerminal, setTerminal)
 
@@ -145,6 +152,7 @@ class TransformerEnd(IdentifiedObject):
         return self._FromWindingInsulations
 
     def setFromWindingInsulations(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._FromWindingInsulations:
             x.FromWinding = None
         for y in value:
@@ -168,13 +176,14 @@ class TransformerEnd(IdentifiedObject):
 
     def setCoreAdmittance(self, value):
         if self._CoreAdmittance is not None:
-            filtered = [x for x in self.CoreAdmittance.TransformerEnd if x != self]
-            self._CoreAdmittance._TransformerEnd = filtered
+            self._CoreAdmittance._TransformerEnd.discard(self)
 
         self._CoreAdmittance = value
         if self._CoreAdmittance is not None:
-            if self not in self._CoreAdmittance._TransformerEnd:
-                self._CoreAdmittance._TransformerEnd.append(self)
+            if self._CoreAdmittance._TransformerEnd is EMPTY:
+                self._CoreAdmittance._TransformerEnd = AssociationList([self])
+            else:
+                self._CoreAdmittance._TransformerEnd.add(self)
 
     CoreAdmittance = property(getCoreAdmittance, setCoreAdmittance)
 
@@ -185,13 +194,14 @@ class TransformerEnd(IdentifiedObject):
 
     def setTransformerEndInfo(self, value):
         if self._TransformerEndInfo is not None:
-            filtered = [x for x in self.TransformerEndInfo.TransformerEnd if x != self]
-            self._TransformerEndInfo._TransformerEnd = filtered
+            self._TransformerEndInfo._TransformerEnd.discard(self)
 
         self._TransformerEndInfo = value
         if self._TransformerEndInfo is not None:
-            if self not in self._TransformerEndInfo._TransformerEnd:
-                self._TransformerEndInfo._TransformerEnd.append(self)
+            if self._TransformerEndInfo._TransformerEnd is EMPTY:
+                self._TransformerEndInfo._TransformerEnd = AssociationList([self])
+            else:
+                self._TransformerEndInfo._TransformerEnd.add(self)
 
     TransformerEndInfo = property(getTransformerEndInfo, setTransformerEndInfo)
 
@@ -233,6 +243,7 @@ class TransformerEnd(IdentifiedObject):
         return self._FromMeshImpedance
 
     def setFromMeshImpedance(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._FromMeshImpedance:
             x.FromTransformerEnd = None
         for y in value:
@@ -254,6 +265,7 @@ class TransformerEnd(IdentifiedObject):
         return self._ToWindingInsulations
 
     def setToWindingInsulations(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ToWindingInsulations:
             x.ToWinding = None
         for y in value:
@@ -276,21 +288,28 @@ class TransformerEnd(IdentifiedObject):
         return self._ToMeshImpedance
 
     def setToMeshImpedance(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ToMeshImpedance:
-            filtered = [q for q in p.ToTransformerEnd if q != self]
-            self._ToMeshImpedance._ToTransformerEnd = filtered
+            p._ToTransformerEnd.discard(self)
         for r in value:
-            if self not in r._ToTransformerEnd:
-                r._ToTransformerEnd.append(self)
+            if r._ToTransformerEnd is EMPTY:
+                r._ToTransformerEnd = AssociationList([self])
+            else:
+                r._ToTransformerEnd.add(self)
         self._ToMeshImpedance = value
 
     ToMeshImpedance = property(getToMeshImpedance, setToMeshImpedance)
 
     def addToMeshImpedance(self, *ToMeshImpedance):
         for obj in ToMeshImpedance:
-            if self not in obj._ToTransformerEnd:
-                obj._ToTransformerEnd.append(self)
-            self._ToMeshImpedance.append(obj)
+            if obj._ToTransformerEnd is EMPTY:
+                obj._ToTransformerEnd = AssociationList([self])
+            else:
+                obj._ToTransformerEnd.add(self)
+            if self._ToMeshImpedance is EMPTY:
+                self._ToMeshImpedance = AssociationList([obj])
+            else:
+                self._ToMeshImpedance.add(obj)
 
     def removeToMeshImpedance(self, *ToMeshImpedance):
         for obj in ToMeshImpedance:
@@ -305,13 +324,14 @@ class TransformerEnd(IdentifiedObject):
 
     def setStarImpedance(self, value):
         if self._StarImpedance is not None:
-            filtered = [x for x in self.StarImpedance.TransformerEnd if x != self]
-            self._StarImpedance._TransformerEnd = filtered
+            self._StarImpedance._TransformerEnd.discard(self)
 
         self._StarImpedance = value
         if self._StarImpedance is not None:
-            if self not in self._StarImpedance._TransformerEnd:
-                self._StarImpedance._TransformerEnd.append(self)
+            if self._StarImpedance._TransformerEnd is EMPTY:
+                self._StarImpedance._TransformerEnd = AssociationList([self])
+            else:
+                self._StarImpedance._TransformerEnd.add(self)
 
     StarImpedance = property(getStarImpedance, setStarImpedance)
 
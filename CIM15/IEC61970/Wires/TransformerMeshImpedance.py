@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class TransformerMeshImpedance(IdentifiedObject):
     """Transformer mesh impedance (Delta-model) between transformer ends. The typical case is that TransformerMeshImpedance describe the impedance between two TransformerEnds pare wise, i.e. the cardinalities at both TranformerEnd associations are 1. But in cases where two or more TransformerEnds are operated connected together the cardinality at the ToTransfomerEnd role is larger than 1.Transformer mesh impedance (Delta-model) between transformer ends. The typical case is that TransformerMeshImpedance describe the impedance between two TransformerEnds pare wise, i.e. the cardinalities at both TranformerEnd associations are 1. But in cases where two or more TransformerEnds are operated connected together the cardinality at the ToTransfomerEnd role is larger than 1.
@@ -51,11 +52,13 @@ class TransformerMeshImpedance(IdentifiedObject):
         self._FromTransformerEndInfo = None
         self.FromTransformerEndInfo = FromTransformerEndInfo
 
-        self._ToTransformerEnd = []
-        self.ToTransformerEnd = [] if ToTransformerEnd is None else ToTransformerEnd
+        self._ToTransformerEnd = EMPTY
+        if ToTransformerEnd is not None:
+            self.ToTransformerEnd = ToTransformerEnd
 
-        self._ToTransformerEndInfo = []
-        self.ToTransformerEndInfo = [] if ToTransformerEndInfo is None else ToTransformerEndInfo
+        self._ToTransformerEndInfo = EMPTY
+        if ToTransformerEndInfo is not None:
+            self.ToTransformerEndInfo = ToTransformerEndInfo
 
         self._FromTransformerEnd = None
         self.FromTransformerEnd = FromTransformerEnd
@@ -76,13 +79,14 @@ class TransformerMeshImpedance(IdentifiedObject):
 
     def setFromTransformerEndInfo(self, value):
         if self._FromTransformerEndInfo is not None:
-            filtered = [x for x in self.FromTransformerEndInfo.FromMeshImpedance if x != self]
-            self._FromTransformerEndInfo._FromMeshImpedance = filtered
+            self._FromTransformerEndInfo._FromMeshImpedance.discard(self)
 
         self._FromTransformerEndInfo = value
         if self._FromTransformerEndInfo is not None:
-            if self not in self._FromTransformerEndInfo._FromMeshImpedance:
-                self._FromTransformerEndInfo._FromMeshImpedance.append(self)
+            if self._FromTransformerEndInfo._FromMeshImpedance is EMPTY:
+                self._FromTransformerEndInfo._FromMeshImpedance = AssociationList([self])
+            else:
+                self._FromTransformerEndInfo._FromMeshImpedance.add(self)
 
     FromTransformerEndInfo = property(getFromTransformerEndInfo, setFromTransformerEndInfo)
 
@@ -92,21 +96,28 @@ class TransformerMeshImpedance(IdentifiedObject):
         return self._ToTransformerEnd
 
     def setToTransformerEnd(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ToTransformerEnd:
-            filtered = [q for q in p.ToMeshImpedance if q != self]
-            self._ToTransformerEnd._ToMeshImpedance = filtered
+            p._ToMeshImpedance.discard(self)
         for r in value:
-            if self not in r._ToMeshImpedance:
-                r._ToMeshImpedance.append(self)
+            if r._ToMeshImpedance is EMPTY:
+                r._ToMeshImpedance = AssociationList([self])
+            else:
+                r._ToMeshImpedance.add(self)
         self._ToTransformerEnd = value
 
     ToTransformerEnd = property(getToTransformerEnd, setToTransformerEnd)
 
     def addToTransformerEnd(self, *ToTransformerEnd):
         for obj in ToTransformerEnd:
-            if self not in obj._ToMeshImpedance:
-                obj._ToMeshImpedance.append(self)
-            self._ToTransformerEnd.append(obj)
+            if obj._ToMeshImpedance is EMPTY:
+                obj._ToMeshImpedance = AssociationList([self])
+            else:
+                obj._ToMeshImpedance.add(self)
+            if self._ToTransformerEnd is EMPTY:
+                self._ToTransformerEnd = AssociationList([obj])
+            else:
+                self._ToTransformerEnd.add(obj)
 
     def removeToTransformerEnd(self, *ToTransformerEnd):
         for obj in ToTransformerEnd:
@@ -120,21 +131,28 @@ class TransformerMeshImpedance(IdentifiedObject):
         return self._ToTransformerEndInfo
 
     def setToTransformerEndInfo(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._ToTransformerEndInfo:
-            filtered = [q for q in p.ToMeshImpedance if q != self]
-            self._ToTransformerEndInfo._ToMeshImpedance = filtered
+            p._ToMeshImpedance.discard(self)
         for r in value:
-            if self not in r._ToMeshImpedance:
-                r._ToMeshImpedance.append(self)
+            if r._ToMeshImpedance is EMPTY:
+                r._ToMeshImpedance = AssociationList([self])
+            else:
+                r._ToMeshImpedance.add(self)
         self._ToTransformerEndInfo = value
 
     ToTransformerEndInfo = property(getToTransformerEndInfo, setToTransformerEndInfo)
 
     def addToTransformerEndInfo(self, *ToTransformerEndInfo):
         for obj in ToTransformerEndInfo:
-            if self not in obj._ToMeshImpedance:
-                obj._ToMeshImpedance.append(self)
-            self._ToTransformerEndInfo.append(obj)
+            if obj._ToMeshImpedance is EMPTY:
+                obj._ToMeshImpedance = AssociationList([self])
+            else:
+                obj._ToMeshImpedance.add(self)
+            if self._ToTransformerEndInfo is EMPTY:
+                self._ToTransformerEndInfo = AssociationList([obj])
+            else:
+                self._ToTransformerEndInfo.add(obj)
 
     def removeToTransformerEndInfo(self, *ToTransformerEndInfo):
         for obj in ToTransformerEndInfo:
@@ -149,13 +167,14 @@ class TransformerMeshImpedance(IdentifiedObject):
 
     def setFromTransformerEnd(self, value):
         if self._FromTransformerEnd is not None:
-            filtered = [x for x in self.FromTransformerEnd.FromMeshImpedance if x != self]
-            self._FromTransformerEnd._FromMeshImpedance = filtered
+            self._FromTransformerEnd._FromMeshImpedance.discard(self)
 
         self._FromTransformerEnd = value
         if self._FromTransformerEnd is not None:
-            if self not in self._FromTransformerEnd._FromMeshImpedance:
-                self._FromTransformerEnd._FromMeshImpedance.append(self)
+            if self._FromTransformerEnd._FromMeshImpedance is EMPTY:
+                self._FromTransformerEnd._FromMeshImpedance = AssociationList([self])
+            else:
+                self._FromTransformerEnd._FromMeshImpedance.add(self)
 
     FromTransformerEnd = property(getFromTransformerEnd, setFromTransformerEnd)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.Equipment import Equipment
+from CIM15.Element import AssociationList, EMPTY
 
 class TransformerTank(Equipment):
     """An assembly of two or more coupled windings that transform electrical power between voltage levels. These windings are bound on a common core and place in the same tank. Transformer tank can be used to model both single-phase and 3-phase transformers.An assembly of two or more coupled windings that transform electrical power between voltage levels. These windings are bound on a common core and place in the same tank. Transformer tank can be used to model both single-phase and 3-phase transformers.
@@ -33,11 +34,13 @@ class TransformerTank(Equipment):
         @param TransformerTankInfo: Transformer tank data.
         @param TransformerObservations:
         """
-        self._ServiceDeliveryPoints = []
-        self.ServiceDeliveryPoints = [] if ServiceDeliveryPoints is None else ServiceDeliveryPoints
+        self._ServiceDeliveryPoints = EMPTY
+        if ServiceDeliveryPoints is not None:
+            self.ServiceDeliveryPoints = ServiceDeliveryPoints
 
-        self._TransformerTankEnds = []
-        self.TransformerTankEnds = [] if TransformerTankEnds is None else TransformerTankEnds
+        self._TransformerTankEnds = EMPTY
+        if TransformerTankEnds is not None:
+            self.TransformerTankEnds = TransformerTankEnds
 
         self._PowerTransformer = None
         self.PowerTransformer = PowerTransformer
@@ -45,8 +48,9 @@ class TransformerTank(Equipment):
         self._TransformerTankInfo = None
         self.TransformerTankInfo = TransformerTankInfo
 
-        self._TransformerObservations = []
-        self.TransformerObservations = [] if TransformerObservations is None else TransformerObservations
+        self._TransformerObservations = EMPTY
+        if TransformerObservations is not None:
+            self.TransformerObservations = TransformerObservations
 
         super(TransformerTank, self).__init__(*args, **kw_args)
 
@@ -63,6 +67,7 @@ class TransformerTank(Equipment):
         return self._ServiceDeliveryPoints
 
     def setServiceDeliveryPoints(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._ServiceDeliveryPoints:
             x.TransformerTanks = None
         for y in value:
@@ -85,6 +90,7 @@ class TransformerTank(Equipment):
         return self._TransformerTankEnds
 
     def setTransformerTankEnds(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._TransformerTankEnds:
             x.TransformerTank = None
         for y in value:
@@ -108,13 +114,14 @@ class TransformerTank(Equipment):
 
     def setPowerTransformer(self, value):
         if self._PowerTransformer is not None:
-            filtered = [x for x in self.PowerTransformer.TransformerTanks if x != self]
-            self._PowerTransformer._TransformerTanks = filtered
+            self._PowerTransformer._TransformerTanks.discard(self)
 
         self._PowerTransformer = value
         if self._PowerTransformer is not None:
-            if self not in self._PowerTransformer._TransformerTanks:
-                self._PowerTransformer._TransformerTanks.append(self)
+            if self._PowerTransformer._TransformerTanks is EMPTY:
+                self._PowerTransformer._TransformerTanks = AssociationList([self])
+            else:
+                self._PowerTransformer._TransformerTanks.add(self)
 
     PowerTransformer = property(getPowerTransformer, setPowerTransformer)
 
@@ -125,13 +132,14 @@ class TransformerTank(Equipment):
 
     def setTransformerTankInfo(self, value):
         if self._TransformerTankInfo is not None:
-            filtered = [x for x in self.TransformerTankInfo.TransformerTanks if x != self]
-            self._TransformerTankInfo._TransformerTanks = filtered
+            self._TransformerTankInfo._TransformerTanks.discard(self)
 
         self._TransformerTankInfo = value
         if self._TransformerTankInfo is not None:
-            if self not in self._TransformerTankInfo._TransformerTanks:
-                self._TransformerTankInfo._TransformerTanks.append(self)
+            if self._TransformerTankInfo._TransformerTanks is EMPTY:
+                self._TransformerTankInfo._TransformerTanks = AssociationList([self])
+            else:
+                self._TransformerTankInfo._TransformerTanks.add(self)
 
     TransformerTankInfo = property(getTransformerTankInfo, setTransformerTankInfo)
 
@@ -140,6 +148,7 @@ class TransformerTank(Equipment):
         return self._TransformerObservations
 
     def setTransformerObservations(self, value):
+        value = AssociationList(value) or EMPTY
         for x in self._TransformerObservations:
             x.Transformer = None
         for y in value:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.PowerSystemResource import PowerSystemResource
+from CIM15.Element import AssociationList, EMPTY
 
 
 class ACLineSegmentPhase(PowerSystemResource):
@@ -48,12 +49,13 @@ class ACLineSegmentPhase(PowerSystemResource):
 
     def setACLineSegment(self, value):
         if self._ACLineSegment is not None:
-            filtered = [x for x in self.ACLineSegment.ACLineSegmentPhases if x != self]
-            self._ACLineSegment._ACLineSegmentPhases = filtered
+            self._ACLineSegment._ACLineSegmentPhases.discard(self)
 
         self._ACLineSegment = value
         if self._ACLineSegment is not None:
-            if self not in self._ACLineSegment._ACLineSegmentPhases:
-                self._ACLineSegment._ACLineSegmentPhases.append(self)
+            if self._ACLineSegment._ACLineSegmentPhases is EMPTY:
+                self._ACLineSegment._ACLineSegmentPhases = AssociationList([self])
+            else:
+                self._ACLineSegment._ACLineSegmentPhases.add(self)
 
     ACLineSegment = property(getACLineSegment, setACLineSegment)
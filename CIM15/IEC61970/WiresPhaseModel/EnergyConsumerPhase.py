@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.PowerSystemResource import PowerSystemResource
+from CIM15.Element import AssociationList, EMPTY
 
 class EnergyConsumerPhase(PowerSystemResource):
 
@@ -50,12 +51,13 @@ class EnergyConsumerPhase(PowerSystemResource):
 
     def setEnergyConsumer(self, value):
         if self._EnergyConsumer is not None:
-            filtered = [x for x in self.EnergyConsumer.EnergyConsumerPhases if x != self]
-            self._EnergyConsumer._EnergyConsumerPhases = filtered
+            self._EnergyConsumer._EnergyConsumerPhases.discard(self)
 
         self._EnergyConsumer = value
         if self._EnergyConsumer is not None:
-            if self not in self._EnergyConsumer._EnergyConsumerPhases:
-                self._EnergyConsumer._EnergyConsumerPhases.append(self)
+            if self._EnergyConsumer._EnergyConsumerPhases is EMPTY:
+                self._EnergyConsumer._EnergyConsumerPhases = AssociationList([self])
+            else:
+                self._EnergyConsumer._EnergyConsumerPhases.add(self)
 
     EnergyConsumer = property(getEnergyConsumer, setEnergyConsumer)
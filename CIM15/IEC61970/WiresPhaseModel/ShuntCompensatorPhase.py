@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.PowerSystemResource import PowerSystemResource
+from CIM15.Element import AssociationList, EMPTY
 
 class ShuntCompensatorPhase(PowerSystemResource):
     """Single phase of a multi-phase shunt compensator when its attributes might be different per phase.Single phase of a multi-phase shunt compensator when its attributes might be different per phase.
@@ -47,13 +48,14 @@ class ShuntCompensatorPhase(PowerSystemResource):
 
     def setShuntCompensator(self, value):
         if self._ShuntCompensator is not None:
-            filtered = [x for x in self.ShuntCompensator.ShuntCompensatorPhases if x != self]
-            self._ShuntCompensator._ShuntCompensatorPhases = filtered
+            self._ShuntCompensator._ShuntCompensatorPhases.discard(self)
 
         self._ShuntCompensator = value
         if self._ShuntCompensator is not None:
-            if self not in self._ShuntCompensator._ShuntCompensatorPhases:
-                self._ShuntCompensator._ShuntCompensatorPhases.append(self)
+            if self._ShuntCompensator._ShuntCompensatorPhases is EMPTY:
+                self._ShuntCompensator._ShuntCompensatorPhases = AssociationList([self])
+            else:
+                self._ShuntCompensator._ShuntCompensatorPhases.add(self)
 
     ShuntCompensator = property(getShuntCompensator, setShuntCompensator)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.PowerSystemResource import PowerSystemResource
+from CIM15.Element import AssociationList, EMPTY
 
 class SwitchPhase(PowerSystemResource):
     """Single phase of a multi-phase switch when its attributes might be different per phase.Single phase of a multi-phase switch when its attributes might be different per phase.
@@ -59,13 +60,14 @@ class SwitchPhase(PowerSystemResource):
 
     def setSwitch(self, value):
         if self._Switch is not None:
-            filtered = [x for x in self.Switch.SwitchPhases if x != self]
-            self._Switch._SwitchPhases = filtered
+            self._Switch._SwitchPhases.discard(self)
 
         self._Switch = value
         if self._Switch is not None:
-            if self not in self._Switch._SwitchPhases:
-                self._Switch._SwitchPhases.append(self)
+            if self._Switch._SwitchPhases is EMPTY:
+                self._Switch._SwitchPhases = AssociationList([self])
+            else:
+                self._Switch._SwitchPhases.add(self)
 
     Switch = property(getSwitch, setSwitch)
 
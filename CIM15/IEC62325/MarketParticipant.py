@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Organisation import Organisation
+from CIM15.Element import AssociationList, EMPTY
 
 class MarketParticipant(Organisation):
 
@@ -27,8 +28,9 @@ class MarketParticipant(Organisation):
 
         @param MarketRoles: All roles of this market participant.
         """
-        self._MarketRoles = []
-        self.MarketRoles = [] if MarketRoles is None else MarketRoles
+        self._MarketRoles = EMPTY
+        if MarketRoles is not None:
+            self.MarketRoles = MarketRoles
 
         super(MarketParticipant, self).__init__(*args, **kw_args)
 
@@ -45,21 +47,28 @@ class MarketParticipant(Organisation):
         return self._MarketRoles
 
     def setMarketRoles(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._MarketRoles:
-            filtered = [q for q in p.MarketParticipants if q != self]
-            self._MarketRoles._MarketParticipants = filtered
+            p._MarketParticipants.discard(self)
         for r in value:
-            if self not in r._MarketParticipants:
-                r._MarketParticipants.append(self)
+            if r._MarketParticipants is EMPTY:
+                r._MarketParticipants = AssociationList([self])
+            else:
+                r._MarketParticipants.add(self)
         self._MarketRoles = value
 
     MarketRoles = property(getMarketRoles, setMarketRoles)
 
     def addMarketRoles(self, *MarketRoles):
         for obj in MarketRoles:
-            if self not in obj._MarketParticipants:
-                obj._MarketParticipants.append(self)
-            self._MarketRoles.append(obj)
+            if obj._MarketParticipants is EMPTY:
+                obj._MarketParticipants = AssociationList([self])
+            else:
+                obj._MarketParticipants.add(self)
+            if self._MarketRoles is EMPTY:
+                self._MarketRoles = AssociationList([obj])
+            else:
+                self._MarketRoles.add(obj)
 
     def removeMarketRoles(self, *MarketRoles):
         for obj in MarketRoles:
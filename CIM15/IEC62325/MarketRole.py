@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import AssociationList, EMPTY
 
 class MarketRole(IdentifiedObject):
     """Role of a market player.Role of a market player.
@@ -36,8 +37,9 @@ class MarketRole(IdentifiedObject):
 
         self.status = status
 
-        self._MarketParticipants = []
-        self.MarketParticipants = [] if MarketParticipants is None else MarketParticipants
+        self._MarketParticipants = EMPTY
+        if MarketParticipants is not None:
+            self.MarketParticipants = MarketParticipants
 
         super(MarketRole, self).__init__(*args, **kw_args)
 
@@ -56,21 +58,28 @@ class MarketRole(IdentifiedObject):
         return self._MarketParticipants
 
     def setMarketParticipants(self, value):
+        value = AssociationList(value) or EMPTY
         for p in self._MarketParticipants:
-            filtered = [q for q in p.MarketRoles if q != self]
-            self._MarketParticipants._MarketRoles = filtered
+            p._MarketRoles.discard(self)
         for r in value:
-            if self not in r._MarketRoles:
-                r._MarketRoles.append(self)
+            if r._MarketRoles is EMPTY:
+                r._MarketRoles = AssociationList([self])
+            else:
+                r._MarketRoles.add(self)
         self._MarketParticipants = value
 
     MarketParticipants = property(getMarketParticipants, setMarketParticipants)
 
     def addMarketParticipants(self, *MarketParticipants):
         for obj in MarketParticipants:
-            if self not in obj._MarketRoles:
-                obj._MarketRoles.append(self)
-            self._MarketParticipants.append(obj)
+            if obj._MarketRoles is EMPTY:
+                obj._MarketRoles = AssociationList([self])
+            else:
+                obj._MarketRoles.add(self)
+            if self._MarketParticipants is EMPTY:
+                self._MarketParticipants = AssociationList([obj])
+            else:
+                self._MarketParticipants.add(obj)
 
     def removeMarketParticipants(self, *MarketParticipants):
         for obj in MarketParticipants:
@@ -0,0 +1,212 @@
+# Copyright (C) 2010-2011 Richard Lincoln
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+"""Collections holding the objects of the many-associations of the CIM
+classes.  They are shared by the CIM packages and their profiles, so objects
+of different packages may be linked.
+"""
+
+from collections.abc import MutableSequence
+from itertools import chain
+
+#: Number of objects above which the objects of an association are indexed
+#: by identity. Smaller associations are searched.
+INDEX_THRESHOLD = 8
+
+
+class AssociationList(object):
+    """Objects of a many-association, in the order in which they were
+    added. The objects of large associations are keyed by identity, so
+    testing for, adding and removing an object take constant time, while
+    iteration, indexing and comparison are those of a list. Each object is
+    held once. Iteration is over the objects held when it starts.
+    """
+
+    __slots__ = ("_objects", "_items")
+
+    def __init__(self, objects=()):
+        #: Objects keyed by identity, or None while the association is
+        #: small.
+        self._objects = None
+        #: Objects in order: all of them while the association is small and
+        #: otherwise kept for indexing until the next change.
+        self._items = []
+        self._reset(objects)
+
+    def add(self, obj):
+        """Adds the given object, if it is not held already.
+        """
+        objects = self._objects
+        if objects is None:
+            items = self._items
+            if obj not in items:
+                items.append(obj)
+                if len(items) > INDEX_THRESHOLD:
+                    self._index()
+        else:
+            objects[id(obj)] = obj
+            self._items = None
+
+    append = add
+
+    def extend(self, objects):
+        for obj in objects:
+            self.add(obj)
+
+    def discard(self, obj):
+        """Removes the given object, if it is held.
+        """
+        if obj in self:
+            self.remove(obj)
+
+    def remove(self, obj):
+        objects = self._objects
+        if objects is None:
+            try:
+                self._items.remove(obj)
+                return
+            except ValueError:
+                pass
+        elif objects.pop(id(obj), None) is not None:
+            self._items = None
+            return
+        raise ValueError("Object not in the association: %r" % (obj,))
+
+    def clear(self):
+        self._reset(())
+
+    def insert(self, index, obj):
+        items = [x for x in self._list() if x is not obj]
+        items.insert(index, obj)
+        self._reset(items)
+
+    def sort(self, key=None, reverse=False):
+        self._reset(sorted(self._list(), key=key, reverse=reverse))
+
+    def index(self, obj):
+        if obj not in self:
+            raise ValueError("Object not in the association: %r" % (obj,))
+        return self._list().index(obj)
+
+    def count(self, obj):
+        return 1 if obj in self else 0
+
+    def _reset(self, objects):
+        self._objects = None
+        self._items = []
+        for obj in objects:
+            self.add(obj)
+
+    def _index(self):
+        self._objects = dict([(id(obj), obj) for obj in self._items])
+        self._items = None
+
+    def _list(self):
+        items = self._items
+        if items is None:
+            items = self._items = list(self._objects.values())
+        return items
+
+    def __contains__(self, obj):
+        objects = self._objects
+        if objects is None:
+            return obj in self._items
+        return id(obj) in objects
+
+    def __len__(self):
+        objects = self._objects
+        return len(self._items if objects is None else objects)
+
+    def __iter__(self):
+        if self._objects is None:
+            return iter(self._items[:])
+        return iter(self._list())
+
+    def __reversed__(self):
+        return reversed(self._list()[:])
+
+    def __getitem__(self, index):
+        return self._list()[index]
+
+    def __setitem__(self, index, value):
+        items = list(self._list())
+        items[index] = value
+        self._reset(items)
+
+    def __delitem__(self, index):
+        items = list(self._list())
+        del items[index]
+        self._reset(items)
+
+    def __eq__(self, other):
+        if isinstance(other, (AssociationList, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __add__(self, other):
+        return AssociationList(chain(self, other))
+
+    def __radd__(self, other):
+        return list(other) + list(self)
+
+    def __iadd__(self, other):
+        self.extend(other)
+        return self
+
+    def __repr__(self):
+        return "%s(%r)" % (self.__class__.__name__, list(self))
+
+    def __reduce__(self):
+        return (AssociationList, (list(self),))
+
+
+MutableSequence.register(AssociationList)
+
+
+class EmptyList(AssociationList):
+    """Empty association shared by the objects that have none. It cannot be
+    added to, so setters, adders and readers replace it with a new
+    L{AssociationList} on the first addition.
+    """
+
+    __slots__ = ()
+
+    def _immutable(self, *args):
+        raise TypeError("The empty list of a many-association is shared; "
+                        "use the setter or adder of the association.")
+
+    add = append = extend = insert = sort = __setitem__ = _immutable
+
+    def _reset(self, objects):
+        if objects:
+            self._immutable()
+        AssociationList._reset(self, ())
+
+    def __iadd__(self, other):
+        # The result is assigned to the property, so a new list is returned.
+        return AssociationList(other)
+
+    def __reduce__(self):
+        return "EMPTY"
+
+
+EMPTY = EmptyList()
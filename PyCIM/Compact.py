@@ -0,0 +1,277 @@
+# Copyright (C) 2010-2011 Richard Lincoln
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+"""Compact variants of the CIM classes, whose instances hold their
+attributes in C{__slots__} rather than in a C{__dict__}.
+
+The variants of the classes of each CIM version are generated on import
+in a package named 'Compact', which mirrors the modules of the version:
+C{CIM15.Compact.IEC61970.Core.Terminal} is the compact variant of
+C{CIM15.IEC61970.Core.Terminal}.  The packages, including those of the
+profiles, have a C{packageMap} naming the compact modules, so models are
+read as compact objects with::
+
+    import PyCIM
+    import CIM15.Compact
+
+    d = PyCIM.cimread(source, CIM15.Compact.packageMap, CIM15.nsURI)
+
+The variants have the same names, methods, properties and metadata as the
+classes from which they are generated, but are not subclasses of them.
+The packages are importable once PyCIM has been imported.
+"""
+
+import dis
+import importlib
+import importlib.abc
+import importlib.util
+import sys
+import types
+
+#: Name of the package of compact variants in each CIM version.
+COMPACT = "Compact"
+
+#: CIM versions with compact variants.
+VERSIONS = ("CIM14", "CIM15")
+
+# Compact variants, keyed by the classes from which they are generated.
+_classes = {}
+
+# Classes from which compact variants are generated, keyed by the variants.
+_sources = {}
+
+# Descriptors of the slots of each class, with those of its bases.
+_descriptors = {}
+
+# Globals of the methods of compact variants, keyed by module name.
+_globals = {}
+
+# Entries of class dicts not copied to compact variants: those describing
+# the layout of instances and those cached on first use (e.g. copyreg caches
+# '__slotnames__' when an instance is first pickled).
+_EXCLUDED = frozenset(["__dict__", "__weakref__", "__slots__", "__module__",
+                       "__slotnames__"])
+
+
+def compact_name(name):
+    """Returns the name of the compact variant of the given module (e.g.
+    'CIM15.Compact.IEC61970.Core' for 'CIM15.IEC61970.Core').
+    """
+    version, _, rest = name.partition(".")
+    return "%s.%s.%s" % (version, COMPACT, rest) if rest else \
+            "%s.%s" % (version, COMPACT)
+
+
+def is_compact(klass):
+    """Returns true if the given class is a compact variant.
+    """
+    return klass in _sources
+
+
+def source_class(klass):
+    """Returns the CIM class from which the given compact variant is
+    generated, or the given class if not a compact variant.
+    """
+    return _sources.get(klass, klass)
+
+
+def compact_class(klass):
+    """Returns the compact variant of the given CIM class.
+    """
+    try:
+        return _classes[klass]
+    except KeyError:
+        pass
+    if klass is object or klass in _sources:
+        return klass
+
+    bases = tuple([compact_class(base) for base in klass.__bases__])
+    g = _module_globals(klass.__module__)
+
+    slots = _slot_names(klass, bases)
+    if bases == (object,):
+        slots.append("__weakref__")
+
+    namespace = {"__slots__": tuple(slots),
+                 "__module__": compact_name(klass.__module__)}
+    for key, value in klass.__dict__.items():
+        # Class attributes giving defaults of slots are dropped.
+        if key in _EXCLUDED or key in slots:
+            continue
+        namespace[key] = _rebind(value, g)
+
+    compact = type(klass)(klass.__name__, bases, namespace)
+    compact.__qualname__ = klass.__qualname__
+    _classes[klass] = compact
+    _sources[compact] = klass
+
+    # Names of CIM classes in the module refer to their compact variants
+    # (e.g. the class named in calls to super()).
+    for key, value in list(g.items()):
+        if _is_cim_class(value):
+            g[key] = compact_class(value)
+
+    return compact
+
+
+def state(obj):
+    """Returns a dict of the instance attributes of the given object, of a
+    CIM class or a compact variant.
+    """
+    try:
+        return obj.__dict__
+    except AttributeError:
+        pass
+    d = {}
+    for slot in _slot_descriptors(obj.__class__):
+        try:
+            d[slot.__name__] = slot.__get__(obj)
+        except AttributeError:
+            pass
+    return d
+
+
+def _slot_descriptors(klass):
+    """Returns the descriptors of the slots of the given class and its
+    bases.
+    """
+    try:
+        return _descriptors[klass]
+    except KeyError:
+        pass
+    descriptors = []
+    for k in reversed(klass.__mro__):
+        for name in k.__dict__.get("__slots__", ()):
+            if name != "__weakref__":
+                descriptors.append(k.__dict__[name])
+    _descriptors[klass] = descriptors
+    return descriptors
+
+
+def _is_cim_class(value):
+    return isinstance(value, type) and hasattr(value, "_many_refs") and \
+            value.__module__.partition(".")[0] in VERSIONS and \
+            value not in _sources
+
+
+def _module_globals(name):
+    """Returns the globals of the methods of the compact variants of the
+    classes in the given module.
+    """
+    try:
+        return _globals[name]
+    except KeyError:
+        g = _globals[name] = dict(vars(sys.modules[name]))
+        g["__name__"] = compact_name(name)
+        return g
+
+
+def _slot_names(klass, bases):
+    """Returns the names of the instance attributes of the given class
+    that are not those of its bases: its attributes, the attributes
+    underlying the properties of its references and any other attributes
+    assigned by its constructor.
+    """
+    names = list(klass.__dict__.get("_attrs", ()))
+    for ref in klass.__dict__.get("_refs", ()):
+        if isinstance(klass.__dict__.get(ref), property):
+            names.append("_" + ref)
+        else:
+            names.append(ref)
+    init = klass.__dict__.get("__init__")
+    if isinstance(init, types.FunctionType):
+        names.extend([i.argval for i in dis.get_instructions(init)
+                      if i.opname == "STORE_ATTR"])
+
+    inherited = set()
+    for base in bases:
+        for k in base.__mro__:
+            inherited.update(k.__dict__.get("__slots__", ()))
+
+    slots = []
+    for name in names:
+        if name in inherited or name in slots or \
+                isinstance(getattr(klass, name, None), property):
+            continue
+        slots.append(name)
+    return slots
+
+
+def _rebind(value, g):
+    """Returns the given class attribute with its functions using the
+    given globals.
+    """
+    if isinstance(value, types.FunctionType):
+        f = types.FunctionType(value.__code__, g, value.__name__,
+                               value.__defaults__, value.__closure__)
+        f.__kwdefaults__ = value.__kwdefaults__
+        f.__doc__ = value.__doc__
+        f.__qualname__ = value.__qualname__
+        f.__dict__.update(value.__dict__)
+        return f
+    elif isinstance(value, property):
+        return property(*[_rebind(f, g) if f is not None else None
+                          for f in (value.fget, value.fset, value.fdel)],
+                        doc=value.__doc__)
+    elif isinstance(value, (staticmethod, classmethod)):
+        return type(value)(_rebind(value.__func__, g))
+    return value
+
+
+class _CompactFinder(importlib.abc.MetaPathFinder, importlib.abc.Loader):
+    """Finds and creates the modules of compact variants.
+    """
+
+    def find_spec(self, fullname, path=None, target=None):
+        parts = fullname.split(".")
+        if len(parts) > 1 and parts[0] in VERSIONS and parts[1] == COMPACT:
+            return importlib.util.spec_from_loader(fullname, self,
+                                                   is_package=True)
+        return None
+
+    def create_module(self, spec):
+        return None
+
+    def exec_module(self, module):
+        parts = module.__name__.split(".")
+        original = importlib.import_module(".".join(parts[:1] + parts[2:]))
+        for key, value in list(vars(original).items()):
+            if key.startswith("__") or isinstance(value, types.ModuleType):
+                continue
+            if _is_cim_class(value):
+                value = compact_class(value)
+            elif key == "packageMap":
+                value = dict([(name, compact_name(m))
+                              for name, m in value.items()])
+            setattr(module, key, value)
+        module.__doc__ = "Compact variants of the classes of %s." % \
+                original.__name__
+
+
+def install():
+    """Makes the packages of compact variants importable.
+    """
+    for finder in sys.meta_path:
+        if isinstance(finder, _CompactFinder):
+            return
+    sys.meta_path.insert(0, _CompactFinder())
+
+
+install()
@@ -0,0 +1,190 @@
+# Copyright (C) 2010-2011 Richard Lincoln
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+"""Reading and writing of gzip, bz2 and xz compressed files and of zip
+archives.
+"""
+
+import bz2
+import gzip
+import lzma
+import threading
+import zipfile
+
+from queue import Queue, Empty
+
+#: Size of the blocks read ahead by the decompression thread.
+BLOCK_SIZE = 1 << 16
+
+#: Number of blocks that may be read ahead.
+DEPTH = 16
+
+# Leading bytes of each format.
+_magic = [(b"\x1f\x8b", "gzip"), (b"BZh", "bz2"),
+          (b"\xfd7zXZ\x00", "xz"), (b"PK\x03\x04", "zip")]
+
+# Compression formats, keyed by file name extension.
+_extensions = {".gz": "gzip", ".bz2": "bz2", ".xz": "xz", ".zip": "zip"}
+
+# Functions opening a compressed stream, keyed by format.
+_openers = {"gzip": gzip.open, "bz2": bz2.open, "xz": lzma.open}
+
+
+def sniff(path):
+    """Returns the compression format ('gzip', 'bz2', 'xz' or 'zip') of the
+    file at the given path, identified by its leading bytes, or C{None} if
+    the file is not compressed.
+    """
+    with open(path, "rb") as fd:
+        head = fd.read(6)
+    for magic, fmt in _magic:
+        if head.startswith(magic):
+            return fmt
+    return None
+
+
+def format_of(path):
+    """Returns the compression format implied by the extension of the given
+    file name, or C{None}.
+    """
+    for ext, fmt in _extensions.items():
+        if path.endswith(ext):
+            return fmt
+    return None
+
+
+def open_sources(source):
+    """Yields a source for each document in the given file.  Compressed
+    files yield a L{ReadAhead} stream of their decompressed content and zip
+    archives yield one for each member.  Other sources are yielded as they
+    are.
+
+    @type source: File-like object or a path to a file.
+    @param source: Possibly compressed CIM RDF/XML file or zip archive.
+    """
+    if not isinstance(source, str):
+        yield source
+        return
+
+    fmt = sniff(source)
+    if fmt is None:
+        yield source
+    elif fmt == "zip":
+        with zipfile.ZipFile(source) as archive:
+            for info in archive.infolist():
+                if info.is_dir():
+                    continue
+                with ReadAhead(archive.open(info)) as fd:
+                    yield fd
+    else:
+        with ReadAhead(_openers[fmt](source, "rb")) as fd:
+            yield fd
+
+
+def open_output(path, compression=None):
+    """Returns a binary stream writing to the given path, compressed in the
+    given format ('gzip', 'bz2' or 'xz') or the format implied by the file
+    name extension.
+    """
+    fmt = compression or format_of(path)
+    if fmt is None:
+        return open(path, "wb")
+    if fmt not in _openers:
+        raise ValueError("Unsupported output compression: %s" % fmt)
+    return _openers[fmt](path, "wb")
+
+
+class ReadAhead(object):
+    """Binary stream of the content of another stream, read in blocks by a
+    background thread so that decompression overlaps with parsing.  Any
+    error raised reading the stream is raised by L{read}.
+    """
+
+    def __init__(self, fd, block_size=BLOCK_SIZE, depth=DEPTH):
+        #: Stream read by the thread.
+        self.fd = fd
+        #: Blocks read ahead, followed by b"" at the end of the stream.
+        self.queue = Queue(depth)
+        #: Remainder of the last block taken from the queue.
+        self.buffer = b""
+        self.eof = False
+        self.closed = False
+
+        self.thread = threading.Thread(target=self._run, args=(block_size,))
+        self.thread.daemon = True
+        self.thread.start()
+
+    def _run(self, block_size):
+        try:
+            while not self.closed:
+                block = self.fd.read(block_size)
+                self.queue.put(block)
+                if not block:
+                    break
+        except Exception as e:
+            self.queue.put(e)
+
+    def _next(self):
+        if self.eof:
+            return b""
+        block = self.queue.get()
+        if isinstance(block, Exception):
+            self.eof = True
+            raise block
+        if not block:
+            self.eof = True
+        return block
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            blocks = [self.buffer]
+            block = self._next()
+            while block:
+                blocks.append(block)
+                block = self._next()
+            self.buffer = b""
+            return b"".join(blocks)
+
+        if not self.buffer:
+            self.buffer = self._next()
+        data = self.buffer[:size]
+        self.buffer = self.buffer[size:]
+        return data
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        # Unblock the thread if it is waiting for room in the queue.
+        while self.thread.is_alive():
+            try:
+                self.queue.get(timeout=0.01)
+            except Empty:
+                pass
+        self.fd.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
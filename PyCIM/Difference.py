@@ -0,0 +1,231 @@
+# Copyright (C) 2010-2011 Richard Lincoln
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+"""Differences between CIM models, written as CIM difference models.
+
+Each object is summarised by a hash of the values of the properties that
+L{PyCIM.RDFXMLWriter.cimwrite} would write for it, with references given by
+the UUIDs of the objects referenced.  Objects of the two models are matched
+by UUID and only those whose hashes differ are compared property by
+property, so the work done is linear in the size of the models.
+"""
+
+import uuid as uuidlib
+
+from collections import namedtuple
+from time import time
+
+from PyCIM.Compression import open_output
+from PyCIM.RDFXMLEmitter import RDFXMLEmitter
+from PyCIM.RDFXMLWriter import get_cim_ns, get_write_plan, is_written, \
+    nsPrefixRDF, nsRDF, _write_object, _written
+
+import logging
+logger = logging.getLogger(__name__)
+
+nsPrefixDM = "dm"
+nsDM = "http://iec.ch/TC57/61970-552/DifferenceModel/1#"
+
+#: UUIDs of the objects added, deleted and changed.
+Difference = namedtuple("Difference", "added deleted changed")
+
+
+def cimdiff(old, new, source, encoding="utf-8", compression=None,
+            nsURI=None, nsPrefix=None, uuid=None):
+    """Writes the difference between two CIM models as a CIM difference
+    model, which changes the old model into the new one when applied with
+    L{PyCIM.RDFXMLReader.cimapply}.
+
+    Objects added are written in the forward differences and objects
+    deleted in the reverse differences, with all their properties.  For
+    objects changed, the properties of the new object that differ are
+    written in the forward differences and those of the old object in the
+    reverse differences.  Objects whose class has changed are deleted and
+    added.
+
+    @type old: dict
+    @param old: Map of UUID to CIM object of the old model.
+    @type new: dict
+    @param new: Map of UUID to CIM object of the new model.
+    @type source: File, file-like object or a path to a file.
+    @param source: Stream or path to which the difference model is
+    written (see L{PyCIM.RDFXMLWriter.cimwrite}).
+    @type encoding: string
+    @param encoding: Character encoding of the document.
+    @type compression: string
+    @param compression: Compression ('gzip', 'bz2' or 'xz') of the file at
+    the given path, regardless of its extension.
+    @type nsURI: string
+    @param nsURI: CIM namespace URI. Defaults to that of the CIM version
+    of the objects.
+    @type nsPrefix: string
+    @param nsPrefix: CIM namespace prefix.
+    @type uuid: string
+    @param uuid: UUID of the DifferenceModel. Defaults to a random UUID.
+    @rtype: L{Difference}
+    @return: UUIDs of the objects added, deleted and changed.
+    """
+    if isinstance(source, str):
+        with open_output(source, compression) as fd:
+            return cimdiff(old, new, fd, encoding, None, nsURI, nsPrefix,
+                           uuid)
+
+    t0 = time()
+
+    if nsURI is None or nsPrefix is None:
+        detected = get_cim_ns(new or old)
+        nsURI = nsURI or detected[0]
+        nsPrefix = nsPrefix or detected[1]
+    nsCIM = nsURI if nsURI[-1] == "#" else nsURI + "#"
+
+    def plan(obj):
+        return get_write_plan(obj.__class__, nsPrefix, nsCIM)
+
+    # Hashes of the objects of the old model.
+    hashes = {}
+    for key, obj in old.items():
+        hashes[key] = (obj.__class__, _hash(_content(plan(obj), obj)))
+
+    added = []
+    changed = []
+
+    w = RDFXMLEmitter(source, encoding)
+    w.declaration()
+    w.start_root("%s:RDF" % nsPrefixRDF,
+                 {"xmlns:%s" % nsPrefixRDF: nsRDF,
+                  "xmlns:%s" % nsPrefix: nsCIM,
+                  "xmlns:%s" % nsPrefixDM: nsDM})
+    w.markup("<%s:DifferenceModel %s:about=\"#%s\">" %
+             (nsPrefixDM, nsPrefixRDF, uuid or "_" + str(uuidlib.uuid4())))
+
+    w.markup("<%s:forwardDifferences %s:parseType=\"Statements\">" %
+             (nsPrefixDM, nsPrefixRDF))
+    for key, obj in new.items():
+        p = plan(obj)
+        previous = hashes.get(key)
+        if previous is None or previous[0] is not obj.__class__:
+            added.append(key)
+            _write_object(w, p, obj, True)
+            continue
+        values = _content(p, obj)
+        if _hash(values) != previous[1]:
+            changed.append(key)
+            _write_statements(w, p, obj.UUID, values,
+                              _content(p, old[key]))
+    w.markup("</%s:forwardDifferences>" % nsPrefixDM)
+
+    w.markup("<%s:reverseDifferences %s:parseType=\"Statements\">" %
+             (nsPrefixDM, nsPrefixRDF))
+    for key in changed:
+        obj = old[key]
+        p = plan(obj)
+        _write_statements(w, p, obj.UUID, _content(p, obj),
+                          _content(p, new[key]))
+    deleted = []
+    for key, obj in old.items():
+        current = new.get(key)
+        if current is None or current.__class__ is not obj.__class__:
+            deleted.append(key)
+            _write_object(w, plan(obj), obj, True)
+    w.markup("</%s:reverseDifferences>" % nsPrefixDM)
+
+    w.markup("</%s:DifferenceModel>" % nsPrefixDM)
+    w.end_root()
+
+    logger.info("%d CIM objects added, %d deleted and %d changed in %.2fs.",
+                len(added), len(deleted), len(changed), time() - t0)
+
+    return Difference(added, deleted, changed)
+
+
+def _content(plan, obj):
+    """Returns the values of the properties of the given object that are
+    written following the given plan, with the UUIDs of the objects
+    referenced.
+    """
+    klass = obj.__class__
+    values = [getattr(obj, a[0]) for a in plan.attributes]
+    values.extend([getattr(obj, a[0]) for a in plan.enums])
+
+    for role, attr, _ in plan.refs:
+        val = getattr(obj, attr)
+        if val is not None:
+            written = _written.get((klass, role, val.__class__))
+            if written is None:
+                written = is_written(klass, role, val.__class__)
+            if not written:
+                val = None
+        values.append(val.UUID if val is not None else None)
+
+    none = plan.empty
+    for role, attr, _ in plan.many_refs:
+        vals = getattr(obj, attr)
+        if vals is none or not vals:
+            values.append(())
+            continue
+        uuids = []
+        for val in vals:
+            written = _written.get((klass, role, val.__class__))
+            if written is None:
+                written = is_written(klass, role, val.__class__)
+            if written:
+                uuids.append(val.UUID)
+        uuids.sort()
+        values.append(tuple(uuids))
+
+    return values
+
+
+def _hash(values):
+    try:
+        return hash(tuple(values))
+    except TypeError: # unhashable attribute values
+        return hash(repr(values))
+
+
+def _write_statements(w, plan, uuid, values, other):
+    """Writes an rdf:Description of the object with the given UUID, with
+    the given property values that differ from the other values.
+    """
+    w.start_object("<%s:Description %s:about=\"#" % (nsPrefixRDF,
+                                                     nsPrefixRDF), uuid)
+    i = 0
+    for attr, start, end, default, convert in plan.attributes:
+        val = values[i]
+        if val != other[i] and val != default:
+            w.literal(start, convert(val), end)
+        i += 1
+    for attr, start in plan.enums:
+        if values[i] != other[i]:
+            w.empty(start, str(values[i]))
+        i += 1
+    for role, attr, start in plan.refs:
+        val = values[i]
+        if val is not None and val != other[i]:
+            w.empty(start, val)
+        i += 1
+    for role, attr, start in plan.many_refs:
+        if values[i] != other[i]:
+            others = set(other[i])
+            for val in values[i]:
+                if val not in others:
+                    w.empty(start, val)
+        i += 1
+    w.end_object("</%s:Description>" % nsPrefixRDF, False)
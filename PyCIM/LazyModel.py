@@ -0,0 +1,377 @@
+# Copyright (C) 2010-2011 Richard Lincoln
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+"""Lazily loaded model over a memory-mapped CIM RDF/XML file.
+"""
+
+import io
+import mmap
+import os
+import pickle
+import re
+
+from collections import OrderedDict
+from time import time
+from weakref import WeakSet, WeakValueDictionary
+
+from PyCIM.RDFXMLReader import _Loader, _parse, _root_start, get_class_table
+
+import logging
+logger = logging.getLogger(__name__)
+
+#: Version of the index file format.
+INDEX_VERSION = 2
+
+# Start tag of a top-level object element, with its qualified name and the
+# value of its rdf:ID or rdf:about attribute.
+_object_start = re.compile(
+        br"<([\w-]+(?::[\w-]+)?)\s[^<>]*?\b[\w-]+:(ID|about)\s*=\s*"
+        br"([\"'])(.*?)\3")
+
+# rdf:resource attribute of a reference, with the referenced URI.
+_resource = re.compile(br":resource\s*=\s*[\"']([^\"']*)")
+
+
+class LazyModel(object):
+    """Map of UUID to CIM object over a memory-mapped CIM RDF/XML file, in
+    which objects are parsed when they are first accessed.
+
+    The byte offsets of the elements of each object and the UUIDs of the
+    objects of each class are held in an index, which is written beside
+    the file (with the suffix '.index') and reused while the file is
+    unchanged.
+
+    An object is materialized with the objects it references, directly
+    or transitively, so that its references as written in the file are
+    bound.  The objects that reference an object looked up in the model
+    are materialized with it, so that its inverse roles (e.g. the
+    Terminals of an ACLineSegment) are complete.  The inverse roles of the
+    other objects materialized hold only the objects materialized; looking
+    them up in the model (e.g. C{model[terminal.ConnectivityNode.UUID]})
+    completes them.  The most recently used objects are held in a cache of
+    the given size; other objects remain available while referenced
+    elsewhere and are parsed again otherwise.
+    """
+
+    def __init__(self, source, packageMap=None, nsURI=None, index=None,
+                 cache_size=10000):
+        """Opens a lazy model.
+
+        @type source: string
+        @param source: Path to a CIM RDF/XML file.
+        @type packageMap: dict
+        @param packageMap: Map of class name to PyCIM package name (see
+        L{PyCIM.RDFXMLReader.cimread}).
+        @type nsURI: string
+        @param nsURI: CIM namespace URI used in the RDF/XML file.
+        @type index: string
+        @param index: Path of the index file. Defaults to the source path
+        with the suffix '.index'. If C{False}, the index is not written.
+        The index is a pickle, so loading it may run any code it contains:
+        it must not be in a location others can write to.
+        @type cache_size: int
+        @param cache_size: Number of recently used objects to be kept.
+        """
+        if bool(nsURI) != bool(packageMap):
+            raise ValueError(
+                    'Either pass "packageMap" AND "nsURI" or none of them.')
+
+        self.source = source
+        self.cache_size = cache_size
+
+        self._fd = open(source, "rb")
+        try:
+            self._buf = mmap.mmap(self._fd.fileno(), 0,
+                                  access=mmap.ACCESS_READ)
+        except BaseException:
+            self._fd.close()
+            raise
+        try:
+            self._open(index, nsURI, packageMap)
+        except BaseException:
+            self.close()
+            raise
+
+        #: Objects materialized and still referenced.
+        self._objects = WeakValueDictionary()
+        #: Most recently used objects.
+        self._lru = OrderedDict()
+
+    def _open(self, index, nsURI, packageMap):
+        source = self.source
+        if index is None:
+            index = source + ".index"
+        self._index = _read_index(index, source) if index else None
+        if self._index is None:
+            self._index = _build_index(self._buf, source)
+            if index:
+                _write_index(index, self._index)
+
+        #: Byte ranges of the elements of each object, keyed by UUID.
+        self._offsets = self._index["offsets"]
+        #: UUIDs of the objects defined (rdf:ID), keyed by class name.
+        self._classes = self._index["classes"]
+        #: UUIDs of the objects referencing each object, keyed by UUID.
+        self._referrers = self._index["referrers"]
+        self._header = self._index["header"]
+        self._footer = self._index["footer"]
+
+        # The namespaces are declared on the root element.
+        self.nsURI, self.packageMap, _ = _parse(
+                io.BytesIO(self._header + self._footer), nsURI, packageMap)
+        self._class_table = get_class_table(self.packageMap, self.nsURI)
+
+        # Objects only described (rdf:about) or of classes not in the
+        # package map cannot be materialized, so are not in the model.
+        defined = set()
+        for name, uuids in self._classes.items():
+            if name in self.packageMap:
+                defined.update(uuids)
+        #: UUIDs of the objects in the model, in the order of the file.
+        self._uuids = dict.fromkeys(u for u in self._offsets if u in defined)
+
+        #: Objects materialized and still referenced.
+        self._objects = WeakValueDictionary()
+        #: Objects materialized with all the objects referencing them.
+        self._complete = WeakSet()
+        #: Most recently used objects.
+        self._lru = OrderedDict()
+
+    def __getitem__(self, uuid):
+        if uuid not in self._uuids:
+            raise KeyError(uuid)
+        obj = self._objects.get(uuid)
+        if obj is None or obj not in self._complete:
+            # Objects referencing the object complete its inverse roles.
+            uuids = [u for u in self._referrers.get(uuid, ())
+                     if u in self._uuids and u not in self._objects]
+            if obj is None:
+                uuids.append(uuid)
+            self._materialize(uuids)
+            obj = self._objects[uuid]
+            self._complete.add(obj)
+        self._touch(uuid, obj)
+        return obj
+
+    def get(self, uuid, default=None):
+        try:
+            return self[uuid]
+        except KeyError:
+            return default
+
+    def __contains__(self, uuid):
+        return uuid in self._uuids
+
+    def __iter__(self):
+        return iter(self._uuids)
+
+    def __len__(self):
+        return len(self._uuids)
+
+    def keys(self):
+        return self._uuids.keys()
+
+    def class_names(self):
+        """Returns the names of the classes of the objects in the file.
+        """
+        return list(self._classes)
+
+    def uuids(self, class_name):
+        """Returns the UUIDs of the objects of the given class.
+        """
+        return list(self._classes.get(class_name, ()))
+
+    def objects(self, class_name):
+        """Yields the objects of the given class, materializing them.
+        """
+        for uuid in self._classes.get(class_name, ()):
+            yield self[uuid]
+
+    def referrers(self, uuid):
+        """Returns the UUIDs of the objects referencing the given object.
+        """
+        return list(self._referrers.get(uuid, ()))
+
+    def materialized(self):
+        """Returns the number of objects materialized and still referenced.
+        """
+        return len(self._objects)
+
+    def close(self):
+        if getattr(self, "_buf", None) is not None:
+            self._buf.close()
+        self._fd.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _touch(self, uuid, obj):
+        lru = self._lru
+        lru[uuid] = obj
+        lru.move_to_end(uuid)
+        while len(lru) > self.cache_size:
+            lru.popitem(last=False)
+
+    def _materialize(self, uuids):
+        """Parses the objects with the given UUIDs and the objects that they
+        reference, that are not materialized, and binds their references.
+        """
+        objects = self._objects
+        offsets = self._offsets
+        buf = self._buf
+
+        d = {}
+        loader = _Loader(d)
+        frontier = list(uuids)
+        seen = set(frontier)
+        while frontier:
+            data = [self._header]
+            for u in frontier:
+                for start, end in offsets[u]:
+                    data.append(buf[start:end])
+            data.append(self._footer)
+            _, _, records = _parse(io.BytesIO(b"".join(data)), self.nsURI,
+                                   self.packageMap)
+
+            # References appended by the loader are followed in turn.
+            n = len(loader.pending)
+            loader.load(records, self._class_table)
+            frontier = []
+            for _, _, u in loader.pending[n:]:
+                if u in seen:
+                    continue
+                seen.add(u)
+                target = objects.get(u)
+                if target is not None:
+                    d[u] = target
+                elif u in offsets:
+                    frontier.append(u)
+
+        loader.finish()
+
+        for u, obj in d.items():
+            if u not in objects:
+                objects[u] = obj
+                self._touch(u, obj)
+
+
+def _build_index(buf, source):
+    """Scans the given file contents for the elements of objects and
+    returns the index of their byte ranges.
+    """
+    t0 = time()
+
+    match = _root_start.search(buf)
+    if match is None:
+        raise ValueError("No rdf:RDF element in: %s" % source)
+    header = buf[:match.end()]
+    footer = b"</" + match.group(1) + b">"
+
+    offsets = {}
+    classes = {}
+    references = []
+    pos = match.end()
+    search = _object_start.search
+    resources = _resource.findall
+    find = buf.find
+    while True:
+        match = search(buf, pos)
+        if match is None:
+            break
+        qname, kind, _, value = match.groups()
+        start = match.start()
+        gt = find(b">", match.end())
+        if buf[gt - 1:gt] == b"/":
+            end = gt + 1
+        else:
+            close = b"</" + qname + b">"
+            end = find(close, gt)
+            if end < 0:
+                raise ValueError("Unclosed %s element at %d in: %s" %
+                                 (qname.decode(), start, source))
+            end += len(close)
+        pos = end
+
+        uuid = value.decode("utf-8")
+        if kind == b"about":
+            uuid = uuid[uuid.find("#") + 1:]
+        else:
+            name = qname[qname.find(b":") + 1:].decode("utf-8")
+            try:
+                classes[name].append(uuid)
+            except KeyError:
+                classes[name] = [uuid]
+        try:
+            offsets[uuid].append((start, end))
+        except KeyError:
+            offsets[uuid] = [(start, end)]
+
+        for uri in resources(buf, gt, end):
+            references.append((uri, uuid))
+
+    # Enumeration literals are resources that are not objects of the file.
+    referrers = {}
+    for uri, uuid in references:
+        target = uri[uri.find(b"#") + 1:].decode("utf-8")
+        if target in offsets:
+            try:
+                referrers[target].append(uuid)
+            except KeyError:
+                referrers[target] = [uuid]
+
+    logger.info("Indexed %d objects in %.2fs.", len(offsets), time() - t0)
+
+    return {"version": INDEX_VERSION, "stat": _stat(source),
+            "header": header, "footer": footer, "offsets": offsets,
+            "classes": classes, "referrers": referrers}
+
+
+def _stat(source):
+    st = os.stat(source)
+    return (st.st_size, st.st_mtime)
+
+
+def _read_index(path, source):
+    """Returns the index in the given file, if it was built for the source
+    as it is now, or C{None}.
+    """
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "rb") as fd:
+            index = pickle.load(fd)
+    except Exception:
+        logger.warning("Unable to read index: %s", path)
+        return None
+    if index.get("version") != INDEX_VERSION or \
+            index.get("stat") != _stat(source):
+        return None
+    return index
+
+
+def _write_index(path, index):
+    try:
+        with open(path, "wb") as fd:
+            pickle.dump(index, fd, pickle.HIGHEST_PROTOCOL)
+    except (IOError, OSError):
+        logger.warning("Unable to write index: %s", path)
@@ -18,24 +18,149 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from xml.etree.cElementTree import parse, tostring
-
-def xmlpp(source):
-    root = parse(source).getroot()
-    indent(root)
-    return tostring(root)
-
-def indent(elem, level=0):
-    i = "\n" + level*"  "
-    if len(elem):
-        if not elem.text or not elem.text.strip():
-            elem.text = i + "  "
-        if not elem.tail or not elem.tail.strip():
-            elem.tail = i
-        for elem in elem:
-            indent(elem, level+1)
-        if not elem.tail or not elem.tail.strip():
-            elem.tail = i
-    else:
-        if level and (not elem.tail or not elem.tail.strip()):
-            elem.tail = i
\ No newline at end of file
+"""Indentation of XML documents.
+"""
+
+import io
+
+from xml.parsers.expat import ParserCreate
+
+from PyCIM.RDFXMLEmitter import RDFXMLEmitter, escape_attrib, escape_cdata
+
+#: Size of the blocks in which documents are read.
+BLOCK_SIZE = 1 << 16
+
+#: Number of fragments collected before they are written.
+BUFFER_FRAGMENTS = 8192
+
+
+def xmlpp(source, out=None, indent="  ", encoding="utf-8"):
+    """Indents the given XML document.  The document is read and written
+    incrementally, so memory use does not grow with its size.
+
+    @type source: File-like object or a path to a file.
+    @param source: XML document.
+    @type out: File-like object or a path to a file.
+    @param out: Text or binary stream, or the path of a file, to which the
+    indented document is written. If C{None}, the document is returned.
+    @type indent: string
+    @param indent: Indentation of each level of nesting.
+    @type encoding: string
+    @param encoding: Character encoding of the output.
+    @rtype: bytes
+    @return: Indented document, if no output is given.
+    """
+    if out is None:
+        out = io.BytesIO()
+        xmlpp(source, out, indent, encoding)
+        return out.getvalue()
+    if isinstance(source, str):
+        with open(source, "rb") as fd:
+            return xmlpp(fd, out, indent, encoding)
+    if isinstance(out, str):
+        with open(out, "wb") as fd:
+            return xmlpp(source, fd, indent, encoding)
+
+    printer = _Printer(out, indent, encoding)
+
+    parser = ParserCreate()
+    parser.ordered_attributes = True
+    parser.buffer_text = True
+    parser.StartElementHandler = printer.start
+    parser.EndElementHandler = printer.end
+    parser.CharacterDataHandler = printer.data
+    parser.CommentHandler = printer.comment
+    parser.ProcessingInstructionHandler = printer.pi
+
+    data = source.read(BLOCK_SIZE)
+    while data:
+        parser.Parse(data, False)
+        data = source.read(BLOCK_SIZE)
+    parser.Parse(b"", True)
+
+    printer.close()
+
+
+class _Printer(object):
+    """Writes the events of a parser as indented markup.
+    """
+
+    def __init__(self, out, indent, encoding):
+        self.indent = indent
+        self.emitter = RDFXMLEmitter(out, encoding)
+        self.emitter.declaration()
+        self.parts = []
+        # Whether each element being written has child elements.
+        self.stack = []
+        # Whether the start tag of the current element is still open.
+        self.open = False
+        # Character data since the last tag.
+        self.text = []
+        # Whether anything follows the declaration.
+        self.started = False
+
+    def _newline(self):
+        """Writes the character data before a child node and starts a new
+        line at the current depth.
+        """
+        parts = self.parts
+        if self.open:
+            parts.append(">")
+            self.open = False
+        if self.stack:
+            self.stack[-1] = True
+        text = "".join(self.text)
+        self.text = []
+        if text.strip():
+            parts.append(escape_cdata(text))
+        if self.started:
+            parts.append("\n" + self.indent * len(self.stack))
+        self.started = True
+
+    def start(self, name, attrs):
+        self._newline()
+        parts = self.parts
+        parts.append("<" + name)
+        for i in range(0, len(attrs), 2):
+            parts.append(" %s=\"%s\"" % (attrs[i],
+                                         escape_attrib(attrs[i + 1])))
+        self.stack.append(False)
+        self.open = True
+
+    def end(self, name):
+        parts = self.parts
+        text = "".join(self.text)
+        self.text = []
+        children = self.stack.pop()
+        if not children:
+            if text:
+                parts.append(">%s</%s>" % (escape_cdata(text), name))
+            else:
+                parts.append(" />")
+        else:
+            if text.strip():
+                parts.append(escape_cdata(text))
+            parts.append("\n%s</%s>" % (self.indent * len(self.stack), name))
+        self.open = False
+        if len(parts) > BUFFER_FRAGMENTS:
+            self._drain()
+
+    def data(self, text):
+        self.text.append(text)
+
+    def comment(self, text):
+        self._newline()
+        self.parts.append("<!--%s-->" % text)
+
+    def pi(self, target, data):
+        self._newline()
+        self.parts.append("<?%s %s?>" % (target, data) if data else
+                          "<?%s?>" % target)
+
+    def _drain(self):
+        self.emitter.markup("".join(self.parts))
+        del self.parts[:]
+
+    def close(self):
+        self._drain()
+        self.emitter.flush()
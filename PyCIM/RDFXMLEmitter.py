@@ -0,0 +1,230 @@
+# Copyright (C) 2010-2011 Richard Lincoln
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+"""Buffered emitter of CIM RDF/XML.
+
+The emitter writes the flat structure of CIM RDF/XML (a root element
+holding object elements holding property elements) from fragments of
+markup prepared by the caller, such as the start tags of the properties
+of a class.  Only the values are escaped as they are written.  Output is
+collected in a buffer and written to the file in large chunks.
+"""
+
+import codecs
+import io
+
+#: Number of fragments collected before the buffer is written.
+BUFFER_FRAGMENTS = 8192
+
+
+def escape_cdata(s):
+    """Escapes the given character data.
+    """
+    if "&" in s:
+        s = s.replace("&", "&amp;")
+    if "<" in s:
+        s = s.replace("<", "&lt;")
+    if ">" in s:
+        s = s.replace(">", "&gt;")
+    return s
+
+
+def escape_attrib(s):
+    """Escapes the given attribute value.
+    """
+    if "&" in s:
+        s = s.replace("&", "&amp;")
+    if "'" in s:
+        s = s.replace("'", "&apos;")
+    if "\"" in s:
+        s = s.replace("\"", "&quot;")
+    if "<" in s:
+        s = s.replace("<", "&lt;")
+    if ">" in s:
+        s = s.replace(">", "&gt;")
+    return s
+
+
+def is_text(file):
+    """Returns true if the given file takes strings rather than bytes.
+    """
+    if isinstance(file, io.TextIOBase):
+        return True
+    mode = getattr(file, "mode", None)
+    return isinstance(mode, str) and "b" not in mode
+
+
+class RDFXMLEmitter(object):
+    """Writes CIM RDF/XML to a file through a buffer.
+
+    Characters that cannot be represented in the encoding are written as
+    character references.
+    """
+
+    def __init__(self, file, encoding="utf-8", indent=None):
+        """Initialises a new emitter.
+
+        @type file: File or file-like object.
+        @param file: Text or binary stream to which the document is
+        written.
+        @type encoding: string
+        @param encoding: Character encoding of the document.
+        @type indent: string
+        @param indent: Indentation of each level of nesting, which the
+        caller includes in the markup of objects and properties. If given,
+        the root end tag is written on a new line.
+        """
+        self.encoding = encoding
+        self.indent = indent
+        self._file = file
+        self._write = file.write
+        self._text = is_text(file)
+        # Text needs checking for characters that cannot be encoded,
+        # unless the encoding is a Unicode transformation format.
+        self._check = not codecs.lookup(encoding).name.startswith("utf")
+        # A single encoder writes any byte order mark once, at the start.
+        self._encode = codecs.getincrementalencoder(encoding)(
+                "xmlcharrefreplace").encode
+        self._buffer = []
+        self._append = self._buffer.append
+        # Object element whose start tag is still open.
+        self._open = False
+
+    def declaration(self):
+        """Writes the XML declaration.
+        """
+        encoding = self.encoding
+        if encoding == "us-ascii" or encoding == "utf-8":
+            self._append("<?xml version='1.0'?>\n")
+        else:
+            self._append("<?xml version='1.0' encoding='%s'?>\n" % encoding)
+
+    def start_root(self, tag, attrib):
+        """Starts the root element with the given tag and attributes (such
+        as the namespace declarations).
+        """
+        self._root = tag
+        self._append("<%s" % tag)
+        for k, v in sorted(attrib.items()):
+            self._append(" %s=\"%s\"" % (k, escape_attrib(v)))
+        self._open = True
+
+    def end_root(self):
+        """Ends the root element and writes the buffer.
+        """
+        if self._open:
+            self._append(" />")
+            self._open = False
+        elif self.indent is None:
+            self._append("</%s>" % self._root)
+        else:
+            self._append("\n</%s>" % self._root)
+        self._drain(True)
+        if hasattr(self._file, "flush"):
+            self._file.flush()
+
+    def start_object(self, start, value):
+        """Starts an object element.  The given start (e.g.
+        '<cim:Terminal rdf:ID="') is followed by the given attribute value.
+        """
+        append = self._append
+        if self._open:
+            append(">")
+        append(start)
+        append(escape_attrib(value))
+        append("\"")
+        self._open = True
+
+    def end_object(self, end, keep=True):
+        """Ends the current object element with the given end tag (e.g.
+        '</cim:Terminal>').
+
+        @type keep: bool
+        @param keep: If false, the element is removed if it has no
+        properties.
+        """
+        if self._open:
+            if keep:
+                self._append(" />")
+            else:
+                del self._buffer[-3:]
+            self._open = False
+        else:
+            self._append(end)
+        if len(self._buffer) > BUFFER_FRAGMENTS:
+            self._drain()
+
+    def literal(self, start, text, end):
+        """Writes an element with the given start tag, text and end tag.
+        """
+        append = self._append
+        if self._open:
+            append(">")
+            self._open = False
+        if text:
+            append(start)
+            append(escape_cdata(text))
+            append(end)
+        else:
+            append(start[:-1] + " />")
+
+    def empty(self, start, value):
+        """Writes an empty element with the given start (e.g.
+        '<cim:Terminal.ConnectivityNode rdf:resource="#') followed by the
+        given attribute value.
+        """
+        append = self._append
+        if self._open:
+            append(">")
+            self._open = False
+        append(start)
+        append(escape_attrib(value))
+        append("\" />")
+
+    def markup(self, data):
+        """Writes the given markup of whole object elements, such as that
+        collected by another emitter.
+        """
+        if data:
+            if self._open:
+                self._append(">")
+                self._open = False
+            self._append(data)
+            self._drain()
+
+    def _drain(self, final=False):
+        data = "".join(self._buffer)
+        del self._buffer[:]
+        if self._text:
+            if self._check:
+                data = data.encode(self.encoding, "xmlcharrefreplace"
+                                   ).decode(self.encoding)
+            self._write(data)
+        else:
+            data = self._encode(data, final)
+            if data:
+                self._write(data)
+
+    def flush(self):
+        """Writes the buffer and flushes the file.
+        """
+        self._drain()
+        if hasattr(self._file, "flush"):
+            self._file.flush()
@@ -21,16 +21,44 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
+import io
+import mmap
+import multiprocessing
+import os
+import re
+import sys
+
+from collections import namedtuple
+from collections.abc import MutableSequence
 from xml.etree.cElementTree import iterparse
 from time import time
 
+from PyCIM.Compact import state as instance_state
+from PyCIM.Compression import open_sources, sniff
+from PyCIM.Snapshot import cimload, cache_path, save_cached
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
 import logging
 logger = logging.getLogger(__name__)
 
 
-def cimread(source, packageMap=None, nsURI=None, start_dict=None):
+def cimread(source, packageMap=None, nsURI=None, start_dict=None,
+            bulk=False, processes=1, include=None, exclude=None,
+            closure=False, stats=None, progress=None, cache=None):
     """ CIM RDF/XML parser.
 
+    The source is read in a single pass, so it need not support C{seek}
+    (pipes, sockets and decompressing streams may be used).  Paths to gzip,
+    bz2 and xz compressed files are decompressed as they are read, and every
+    member of a zip archive is read into the one model.  Objects are
+    instantiated and their attributes set as they are parsed.  References
+    are collected in a table of pending references and bound, in document
+    order, once the end of the stream has been reached.
+
     @type source: File-like object or a path to a file.
     @param source: CIM RDF/XML file.
     @type profile: dict
@@ -42,6 +70,48 @@ def cimread(source, packageMap=None, nsURI=None, start_dict=None):
     @type profile: string
     @param nsURI: CIM namespace URI used in the RDF/XML file. For example:
     http://iec.ch/TC57/2010/CIM-schema-cim15
+    @type start_dict: dict
+    @param start_dict: Map of UUID to CIM object to which the objects read
+    are added. References may be made to the objects it contains.
+    @type bulk: bool
+    @param bulk: Bind references by writing both ends of each association
+    directly to the private C{_X} attributes, rather than through the
+    property setters and 'add*' methods.
+    @type processes: int
+    @param processes: Number of worker processes among which the source is
+    divided. The source must then be a path to a file, which is split into
+    chunks at the boundaries of its top-level elements and the chunks
+    parsed in parallel (see L{cimread_many} regarding C{multiprocessing}).
+    C{None} for the number of CPUs. Defaults to parsing in this process.
+    @type include: list
+    @param include: Class names (e.g. 'ACLineSegment') or package prefixes
+    (e.g. 'CIM15.IEC61970.Wires') of the objects to be read. Elements of
+    other classes are skipped as they are parsed and references to them are
+    dropped. Defaults to all classes.
+    @type exclude: list
+    @param exclude: Class names or package prefixes of the objects not to
+    be read.
+    @type closure: bool
+    @param closure: Also read the objects referenced, directly or
+    transitively, by the objects included. The elements of excluded objects
+    are then kept until the end of the source.
+    @type stats: L{ParseStats}
+    @param stats: Statistics object to be filled in.
+    @type progress: callable
+    @param progress: Function called with the L{ParseStats} of the parse
+    every L{PROGRESS_INTERVAL} objects. L{ParseCancelled} is raised if it
+    returns C{False}.
+    @type cache: string
+    @param cache: Directory of snapshots (see L{PyCIM.Snapshot}) of the
+    files read. If the source is a path to a file that has been read
+    before, with the same namespace and packageMap, the model is loaded
+    from its snapshot. Otherwise a snapshot is written once it has been
+    read. Ignored if a start_dict or classes are given. The C{stats} of a
+    model loaded from a snapshot count the bytes of the snapshot, and
+    C{progress} is called once it has been loaded. C{bulk} has no effect
+    on a snapshot, whose references are restored directly in any case.
+    Snapshots are pickles, so the cache must not be a directory others can
+    write to: loading a snapshot may run any code it contains.
     @rtype: dict
     @return: Map of UUID to CIM object.
 
@@ -52,175 +122,1544 @@ def cimread(source, packageMap=None, nsURI=None, start_dict=None):
 
     #logger.info('##########################################################################')
     logger.info('START of parsing file \"%s\"', source)
-    logger_errors_grouped = {}
 
     # A map of uuids to CIM objects to be returned.
     d = start_dict if start_dict is not None else {}
 
-    # Obtain the namespaces from the input file
-    namespaces = xmlns(source)
+    if bool(nsURI) != bool(packageMap):
+        raise ValueError(
+                'Either pass "packageMap" AND "nsURI" or none of them.')
+
+    if cache is not None and isinstance(source, str) and not d and \
+            include is None and exclude is None:
+        snapshot = cache_path(cache, source, packageMap, nsURI)
+        if os.path.exists(snapshot):
+            d.update(cimload(snapshot))
+            if stats is None and progress is not None:
+                stats = ParseStats()
+            if stats is not None:
+                _count_snapshot(stats, d, snapshot, progress, t0)
+            logger.info('Loaded %d CIM objects from snapshot \"%s\" in %.2fs.',
+                        len(d), snapshot, time() - t0)
+            return d
+    else:
+        snapshot = None
+
+    if include is not None or exclude is not None:
+        class_filter = ClassFilter(include, exclude)
+    else:
+        class_filter = None
+    # Excluded elements are skipped by the parser, unless they may be
+    # referenced by the objects included.
+    skip = class_filter if not closure else None
+
+    if stats is None and progress is not None:
+        stats = ParseStats()
+    if stats is not None:
+        existing = set(d)
+
+    loader = _Loader(d, class_filter, closure)
+    if processes == 1:
+        for member in open_sources(source):
+            if stats is None:
+                ns, pm, records = _parse(member, nsURI, packageMap, skip)
+                loader.load(records, get_class_table(pm, ns))
+            else:
+                _load_counted(loader, member, packageMap, nsURI, skip,
+                              stats, progress)
+    else:
+        t1 = time()
+        _load_chunks(loader, source, packageMap, nsURI, processes, skip,
+                     stats, progress)
+        if stats is not None:
+            stats.times["instantiate"] += time() - t1
+            stats.bytes += os.path.getsize(source)
+
+    t1 = time()
+    loader.finish(bulk)
+
+    if stats is not None:
+        stats.times["bind"] += time() - t1
+        stats.elapsed += time() - t0
+        stats.unresolved += loader.unresolved
+        for error, count in loader.errors.items():
+            stats.errors[error] = stats.errors.get(error, 0) + count
+        _count_objects(stats, d, existing)
+        stats.peak_memory = _peak_memory()
+
+    if snapshot is not None:
+        save_cached(d, snapshot)
+
+    # logging_message = 'Created totally %d CIM objects in %.2fs.' %(len(d), time() - t0)
+    logger.info('Created totally %d CIM objects in %.2fs.' %(len(d), time() - t0))
+    # logging_message = 'END of parsing file \"%s\"\n' % source
+    logger.info('END of parsing file \"%s\"\n' % source)
+
+    return d
+
+
+#: Number of objects between calls to the progress function of L{cimread}.
+PROGRESS_INTERVAL = 10000
+
+
+class ParseCancelled(Exception):
+    """
+    Raised by L{cimread} when its progress function returns C{False}.
+
+    """
+
+
+class ParseStats(object):
+    """
+    Statistics of a call to L{cimread}.
+
+    """
+
+    def __init__(self):
+        #: Seconds spent in each phase: reading the namespaces of the
+        #: source ('sniff'), parsing the source and instantiating the
+        #: objects ('instantiate') and binding references ('bind').
+        self.times = {"sniff": 0.0, "instantiate": 0.0, "bind": 0.0}
+        #: Total seconds.
+        self.elapsed = 0.0
+        #: Bytes read from the source (after any decompression), or from
+        #: its snapshot.
+        self.bytes = 0
+        #: Object elements parsed.
+        self.records = 0
+        #: Number of objects created, keyed by class name.
+        self.objects = {}
+        #: Number of references to objects that were not found.
+        self.unresolved = 0
+        #: Number of each error message, such as unknown attributes.
+        self.errors = {}
+        #: Peak resident memory of the process in bytes, if known.
+        self.peak_memory = None
+
+    @property
+    def bytes_per_second(self):
+        """Bytes read per second of the parse.
+        """
+        elapsed = self.elapsed or sum(self.times.values())
+        return self.bytes / elapsed if elapsed else 0.0
+
+    def __repr__(self):
+        return "<ParseStats %d objects, %d bytes in %.2fs>" % \
+                (sum(self.objects.values()), self.bytes, self.elapsed)
+
+
+def _peak_memory():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on Mac OS X.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _count_objects(stats, d, existing):
+    """
+    Counts the objects of the given map that are not among the existing
+    UUIDs by class name.
+
+    """
+    objects = stats.objects
+    for uuid, obj in d.items():
+        if uuid not in existing:
+            name = obj.__class__.__name__
+            objects[name] = objects.get(name, 0) + 1
+
+
+def _count_snapshot(stats, d, snapshot, progress, t0):
+    """
+    Records the statistics of a model loaded from the given snapshot, which
+    has no references left to bind, and reports its progress once.
+
+    """
+    elapsed = time() - t0
+    stats.times["instantiate"] += elapsed
+    stats.elapsed += elapsed
+    stats.bytes += os.path.getsize(snapshot)
+    stats.records += len(d)
+    _count_objects(stats, d, ())
+    stats.peak_memory = _peak_memory()
+    if progress is not None and progress(stats) is False:
+        raise ParseCancelled("Cancelled after %d objects." % len(d))
+
+
+def _load_counted(loader, source, packageMap, nsURI, class_filter, stats,
+                  progress):
+    """
+    Loads the given source, recording statistics and reporting progress.
+
+    """
+    if isinstance(source, str):
+        fd = open(source, "rb")
+    else:
+        fd = None
+
+    try:
+        t0 = time()
+        counter = _CountingReader(fd or source, stats)
+        ns, pm, records = _parse(counter, nsURI, packageMap, class_filter)
+        t1 = time()
+        stats.times["sniff"] += t1 - t0
+
+        loader.load(_monitor(records, stats, progress),
+                    get_class_table(pm, ns))
+        stats.times["instantiate"] += time() - t1
+    finally:
+        if fd is not None:
+            fd.close()
+
+
+def _monitor(records, stats, progress):
+    """
+    Yields the given records, counting them and calling the progress
+    function periodically.
+
+    """
+    n = stats.records
+    for record in records:
+        yield record
+        n += 1
+        if n % PROGRESS_INTERVAL == 0:
+            stats.records = n
+            if progress is not None and progress(stats) is False:
+                raise ParseCancelled("Cancelled after %d objects." % n)
+    stats.records = n
+
+
+class _CountingReader(object):
+    """
+    Binary stream counting the bytes read from another stream.
+
+    """
+
+    def __init__(self, fd, stats):
+        self.fd = fd
+        self.stats = stats
+
+    def read(self, size=-1):
+        data = self.fd.read(size)
+        self.stats.bytes += len(data)
+        return data
+
+
+def cimread_many(sources, packageMaps=None, nsURI=None, start_dict=None,
+                 bulk=False, processes=None):
+    """ Parses several CIM RDF/XML files into one model.
+
+    Each file is parsed in a pool of worker processes, which return the
+    object elements as lists of (tag, uuid, defined, properties) records.
+    The records are loaded into one map of objects, in the order of the
+    given sources, and references between the files are bound once all of
+    them have been loaded.  As with other uses of C{multiprocessing}, the
+    main module of a program calling this function must be importable
+    without side effects (use an C{if __name__ == "__main__":} guard).
+
+    @type sources: list
+    @param sources: Paths to CIM RDF/XML files.
+    @type packageMaps: list
+    @param packageMaps: Map of class name to PyCIM package name for each
+    file (e.g. the CDPSM profile maps). Defaults to the map for the CIM
+    version of each file.
+    @type nsURI: string
+    @param nsURI: CIM namespace URI used in the RDF/XML files.
+    @type start_dict: dict
+    @param start_dict: Map of UUID to CIM object to which the objects read
+    are added.
+    @type bulk: bool
+    @param bulk: Bind references directly (see L{cimread}).
+    @type processes: int
+    @param processes: Number of worker processes. Defaults to the number of
+    CPUs. Files are parsed in this process if one.
+    @rtype: dict
+    @return: Map of UUID to CIM object.
+    """
+    t0 = time()
+
+    d = start_dict if start_dict is not None else {}
+
+    if bool(nsURI) != bool(packageMaps):
+        raise ValueError(
+                'Either pass "packageMaps" AND "nsURI" or none of them.')
+
+    args = [(source, nsURI) for source in sources]
+    if processes == 1 or len(sources) < 2:
+        pool = None
+        results = map(_read_records, args)
+    else:
+        pool = multiprocessing.Pool(processes)
+        results = pool.imap(_read_records, args)
+
+    loader = _Loader(d)
+    try:
+        for i, members in enumerate(results):
+            for ns, records in members:
+                if packageMaps is None:
+                    packageMap = get_cim_ns({"cim": ns})[1]
+                else:
+                    packageMap = packageMaps[i]
+                loader.load(records, get_class_table(packageMap, ns))
+    except BaseException:
+        if pool is not None:
+            # Discard the work queued rather than waiting for it.
+            pool.terminate()
+        raise
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    loader.finish(bulk)
+
+    logger.info('Created totally %d CIM objects from %d files in %.2fs.',
+                len(d), len(sources), time() - t0)
+
+    return d
+
+
+def cimapply(source, d, packageMap=None, nsURI=None, bulk=False):
+    """ Applies a CIM difference model to a map of CIM objects in place.
+
+    The source is an RDF/XML document with a DifferenceModel element
+    holding forwardDifferences and reverseDifferences.  Objects typed in
+    the reverse differences are deleted and those typed in the forward
+    differences are added.  rdf:Description elements change the properties
+    of existing objects: reverse statements are removed (attributes reset
+    to their defaults, references unset) before forward statements are
+    set.  Deleted objects are unlinked from the objects they reference
+    through their property setters and 'remove*' methods, so the work done
+    depends on the size of the change and not that of the model.
+
+    @type source: File-like object or a path to a file.
+    @param source: CIM RDF/XML difference model.
+    @type d: dict
+    @param d: Map of UUID to CIM object to be changed.
+    @type packageMap: dict
+    @param packageMap: Map of class name to PyCIM package name (see
+    L{cimread}).
+    @type nsURI: string
+    @param nsURI: CIM namespace URI used in the RDF/XML file.
+    @type bulk: bool
+    @param bulk: Bind added references directly (see L{cimread}).
+    @rtype: dict
+    @return: The given map of UUID to CIM object.
+    """
+    t0 = time()
+
+    if bool(nsURI) != bool(packageMap):
+        raise ValueError(
+                'Either pass "packageMap" AND "nsURI" or none of them.')
+
+    nsURI, packageMap, differences = _parse_differences(source, nsURI,
+                                                        packageMap)
+    classes = get_class_table(packageMap, nsURI)
+
+    forward = []
+    reverse = []
+    deleted = []
+    for is_forward, tag, uuid, typed, properties in differences:
+        if is_forward:
+            forward.append((tag, uuid, typed, properties))
+        elif typed:
+            deleted.append(uuid)
+        else:
+            reverse.append((uuid, properties))
+
+    loader = _Loader(d)
+    logger_errors_grouped = loader.errors
+
+    # Remove the statements of the reverse differences.
+    for uuid, properties in reverse:
+        obj = d.get(uuid)
+        if obj is None:
+            logger.error("Missing object with uuid: %s", uuid)
+            continue
+        _unset_properties(obj, properties, d, logger_errors_grouped)
+
+    for uuid in deleted:
+        obj = d.pop(uuid, None)
+        if obj is None:
+            logger.error("Missing object with uuid: %s", uuid)
+            continue
+        _unlink(obj)
+
+    # Add the statements of the forward differences.  Typed elements of
+    # objects that exist are treated as descriptions.
+    loader.load([(tag, uuid, typed and uuid not in d, properties)
+                 for tag, uuid, typed, properties in forward], classes)
+    loader.finish(bulk)
+
+    logger.info("Applied %d additions/changes and %d deletions in %.2fs.",
+                len(forward), len(deleted), time() - t0)
+
+    return d
+
+
+def _parse_differences(source, nsURI=None, packageMap=None):
+    """
+    Starts parsing the given CIM RDF/XML difference model.  Returns the CIM
+    namespace URI, the packageMap and an iterator over the differences
+    (see L{_iterdifferences}).
+
+    """
+    context = iter( iterparse(source, ("start-ns", "start", "end")) )
+
+    namespaces, root = _sniff(context)
     ns_rdf = get_rdf_ns(namespaces)
+    if nsURI is None:
+        nsURI, detected = get_cim_ns(namespaces)
+        if packageMap is None:
+            packageMap = detected
+
+    base = "{%s#}" % nsURI
+
+    return nsURI, packageMap, _iterdifferences(context, base, ns_rdf)
+
+
+def _read_records(args):
+    """
+    Parses a CIM RDF/XML file and returns a list of the CIM namespace URI
+    and a list of the records of the objects of each document in the file.
+
+    """
+    source, nsURI = args
+    members = []
+    for member in open_sources(source):
+        ns, _, records = _parse(member, nsURI)
+        members.append((ns, list(records)))
+    return members
+
+
+#: Record of a CIM object element yielded by L{cimiter}.  Attributes maps
+#: attribute name to value (the name of the literal for enumerations) and
+#: references maps role name to UUID, or to a list of UUIDs for roles of
+#: multiplicity many.  Defined is false for rdf:about descriptions of
+#: objects.
+CIMRecord = namedtuple("CIMRecord",
+                       "cls uuid defined attributes references")
+
+
+def cimiter(source, packageMap=None, nsURI=None, instances=False):
+    """ Iterates over the objects in a CIM RDF/XML file as they are parsed.
+
+    Unlike L{cimread}, no map of objects is built and references are not
+    bound, so the memory used does not grow with the size of the source.
+
+    @type source: File-like object or a path to a file.
+    @param source: CIM RDF/XML file.
+    @type packageMap: dict
+    @param packageMap: Map of class name to PyCIM package name (see
+    L{cimread}).
+    @type nsURI: string
+    @param nsURI: CIM namespace URI used in the RDF/XML file.
+    @type instances: bool
+    @param instances: Yield CIM objects with their attributes set, but
+    their references unbound, rather than records.
+    @rtype: generator
+    @return: L{CIMRecord} or CIM object for each element.
+    """
     if bool(nsURI) != bool(packageMap):
         raise ValueError(
                 'Either pass "packageMap" AND "nsURI" or none of them.')
-    elif (nsURI is None) and (packageMap is None):
-        nsURI, packageMap = get_cim_ns(namespaces)
+
+    logger_errors_grouped = {}
+    # References of the current object, which are discarded.
+    pending = []
+
+    for member in open_sources(source):
+        for record in _iter_member(member, packageMap, nsURI, instances,
+                                   pending, logger_errors_grouped):
+            yield record
+
+    for error, count in list(logger_errors_grouped.items()):
+        logger.warn('%s : %d times' % (error, count))
+
+
+def _iter_member(source, packageMap, nsURI, instances, pending,
+                 logger_errors_grouped):
+    nsURI, packageMap, records = _parse(source, nsURI, packageMap)
+    classes = get_class_table(packageMap, nsURI)
+
+    for tag, uuid, defined, properties in records:
+        klass = classes[tag]
+        if klass is None:
+            logger.error("Unable to locate module for: %s (%s)",
+                         _name(tag), uuid)
+            continue
+
+        if instances:
+            obj = klass(UUID=uuid)
+            _set_properties(obj, properties, pending, logger_errors_grouped)
+            del pending[:]
+            yield obj
+        else:
+            attributes, references = _get_properties(klass, properties,
+                                                     logger_errors_grouped)
+            yield CIMRecord(klass, uuid, defined, attributes, references)
+
+
+def _load_chunks(loader, source, packageMap, nsURI, processes,
+                 class_filter=None, stats=None, progress=None):
+    """
+    Splits the given file into chunks, parses them in a pool of worker
+    processes and loads the records with the given loader in document
+    order.
+
+    """
+    if not isinstance(source, str):
+        raise ValueError("A path is required to parse a file in parallel.")
+    if sniff(source) is not None:
+        raise ValueError("Compressed files cannot be parsed in parallel.")
+
+    if processes is None:
+        processes = multiprocessing.cpu_count()
+
+    header, footer, chunks = split_rdfxml(source, processes * CHUNKS_PER_PROCESS)
+
+    # The namespaces are declared on the root element.
+    nsURI, packageMap, _ = _parse(io.BytesIO(header + footer), nsURI,
+                                  packageMap)
+    classes = get_class_table(packageMap, nsURI)
+
+    args = [(source, start, end, header, footer, nsURI, packageMap,
+             class_filter) for start, end in chunks]
+    if processes == 1 or len(args) < 2:
+        pool = None
+        results = map(_read_chunk, args)
+    else:
+        pool = multiprocessing.Pool(processes)
+        results = pool.imap(_read_chunk, args)
+
+    try:
+        for records in results:
+            if stats is not None:
+                records = _monitor(records, stats, progress)
+            loader.load(records, classes)
+    except BaseException:
+        if pool is not None:
+            # Discard the work queued rather than waiting for it.
+            pool.terminate()
+        raise
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+
+def _read_chunk(args):
+    """
+    Parses the given byte range of a CIM RDF/XML file, enclosed by the
+    header and footer of the file, and returns a list of the records of its
+    objects.
+
+    """
+    source, start, end, header, footer, nsURI, packageMap, class_filter = args
+    with open(source, "rb") as fd:
+        fd.seek(start)
+        data = fd.read(end - start)
+    _, _, records = _parse(io.BytesIO(header + data + footer), nsURI,
+                           packageMap, class_filter)
+    return list(records)
+
+
+#: Number of chunks into which a file is split for each worker process, so
+#: that the work is balanced when chunks take differing times to parse.
+CHUNKS_PER_PROCESS = 4
+
+# Start tag of the root element, up to the end of the tag.
+_root_start = re.compile(br"<((?:[\w.-]+:)?RDF)\b[^>]*>")
+
+# Start tag of a top-level object element (e.g. <cim:Terminal rdf:ID="...">).
+# Property elements are distinguished by the "." in their names and have
+# no rdf:ID or rdf:about attribute.
+_object_start = re.compile(
+        br"<[\w-]+(?::[\w-]+)?\s[^<>]*?\b[\w-]+:(?:ID|about)\s*=")
+
+
+def split_rdfxml(source, n):
+    """
+    Splits the CIM RDF/XML file at the given path into about C{n} chunks
+    of similar size, without parsing it.  The file is scanned from evenly
+    spaced offsets for the start tag of the next top-level element.
+
+    Returns the header of the file (everything up to and including the
+    start tag of the root element), the footer (the end tag of the root
+    element) and a list of the (start, end) byte offsets of the chunks.
+    Each chunk enclosed by the header and footer is a well-formed document.
+
+    @type source: string
+    @param source: Path to a CIM RDF/XML file.
+    @type n: int
+    @param n: Number of chunks.
+    """
+    with open(source, "rb") as fd:
+        buf = mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            match = _root_start.search(buf)
+            if match is None:
+                raise ValueError("No rdf:RDF element in: %s" % source)
+            header = buf[:match.end()]
+            footer = b"</" + match.group(1) + b">"
+
+            first = match.end()
+            last = buf.rfind(footer)
+            if last < first:
+                raise ValueError("Unclosed rdf:RDF element in: %s" % source)
+
+            bounds = [first]
+            size = (last - first) // max(n, 1)
+            for i in range(1, n):
+                offset = max(first + i * size, bounds[-1] + 1)
+                match = _object_start.search(buf, offset, last)
+                if match is None:
+                    break
+                if match.start() > bounds[-1]:
+                    bounds.append(match.start())
+            bounds.append(last)
+        finally:
+            buf.close()
+
+    return header, footer, list(zip(bounds[:-1], bounds[1:]))
+
+
+def _parse(source, nsURI=None, packageMap=None, class_filter=None):
+    """
+    Starts parsing the given CIM RDF/XML source.  Returns the CIM namespace
+    URI and packageMap, obtained from the source if the namespace is not
+    specified, and an iterator over the records of the objects in the
+    source (see L{_iterrecords}).  The properties of objects excluded by
+    the given L{ClassFilter} are not collected.
+
+    """
+    context = iter( iterparse(source, ("start-ns", "start", "end")) )
+
+    # Obtain the namespaces and the root element
+    # ({http://www.w3.org/1999/02/22-rdf-syntax-ns#}RDF) from the input file.
+    namespaces, root = _sniff(context)
+    ns_rdf = get_rdf_ns(namespaces)
+    if nsURI is None:
+        nsURI, detected = get_cim_ns(namespaces)
+        if packageMap is None:
+            packageMap = detected
 
     # CIM element tag base (e.g. {http://iec.ch/TC57/2009/CIM-schema-cim14#}).
     base = "{%s#}" % nsURI
-    # Length of element tag base.
-    m = len(base)
 
-    # First pass instantiates the classes.
-    context = iterparse(source, ("start", "end"))
+    if class_filter is not None:
+        skipped = SkipTable(get_class_table(packageMap, nsURI), class_filter)
+    else:
+        skipped = None
 
-    # Turn it into an iterator (required for cElementTree).
-    context = iter(context)
+    return nsURI, packageMap, _iterrecords(context, root, base, ns_rdf,
+                                           skipped)
 
-    # Get the root element ({http://www.w3.org/1999/02/22-rdf-syntax-ns#}RDF).
-    _, root = next(context)
 
-    for event, elem in context:
-        # Process 'end' elements in the CIM namespace.
-        if event == "end" and elem.tag[:m] == base:
-
-            # Unique resource identifier for the CIM object.
-            uuid = elem.get("{%s}ID" % ns_rdf)
-            if uuid is not None: # class
-                # Element tag without namespace (e.g. VoltageLevel).
-                tag = elem.tag[m:]
+class ClassFilter(object):
+    """
+    Selects CIM classes by name (e.g. 'ACLineSegment') or by package prefix
+    (e.g. 'CIM15.IEC61970.Wires').  A class is accepted if it is matched by
+    one of the included names, or no names are included, and not matched by
+    any of the excluded names.
+
+    """
+
+    def __init__(self, include=None, exclude=None):
+        #: Names of the classes and packages to be accepted.
+        self.include = _names(include)
+        #: Names of the classes and packages to be rejected.
+        self.exclude = _names(exclude)
+
+    def __call__(self, klass):
+        if self.include is not None and not _matches(klass, self.include):
+            return False
+        if self.exclude is not None and _matches(klass, self.exclude):
+            return False
+        return True
+
+
+def _names(names):
+    if names is None:
+        return None
+    if isinstance(names, str):
+        names = [names]
+    return frozenset(names)
+
+
+def _matches(klass, names):
+    if klass.__name__ in names:
+        return True
+    module = klass.__module__
+    i = module.rfind(".")
+    while i > 0:
+        module = module[:i]
+        if module in names:
+            return True
+        i = module.rfind(".")
+    return False
+
+
+class SkipTable(dict):
+    """
+    Map of object element tag to C{True} if the class of the element is
+    rejected by a L{ClassFilter}.  Tags that cannot be resolved to a class
+    are not skipped, so that they are reported when loaded.
+
+    """
+
+    def __init__(self, classes, class_filter):
+        super(SkipTable, self).__init__()
+        #: Map of element tag to CIM class.
+        self.classes = classes
+        #: Filter applied to the classes.
+        self.class_filter = class_filter
+
+    def __missing__(self, tag):
+        klass = self.classes[tag]
+        skip = self[tag] = klass is not None and not self.class_filter(klass)
+        return skip
+
+
+class _Loader(object):
+    """
+    Instantiates CIM objects from parsed records, sets their attributes and
+    binds their references.
+
+    """
+
+    def __init__(self, d, class_filter=None, closure=False):
+        #: Map of uuid to CIM object.
+        self.d = d
+        #: Filter applied to the classes of the objects loaded.
+        self.class_filter = class_filter
+        #: Load the objects excluded by the filter that are referenced by
+        #: the objects loaded.
+        self.closure = closure
+        #: Records of the objects excluded by the filter, with their class
+        #: table, keyed by uuid.
+        self.excluded = {}
+        #: Skip tables of the filter, keyed by class table identity.
+        self.skipped = {}
+        #: References of (object, plan entry, uuid) to be bound once all
+        #: objects have been instantiated.
+        self.pending = []
+        #: (tag, properties) of objects that are described (rdf:about)
+        #: before they are defined (rdf:ID), keyed by uuid.
+        self.deferred = {}
+        #: Count of each grouped error message.
+        self.errors = {}
+        #: Number of references to objects that were not found.
+        self.unresolved = 0
+
+    def load(self, records, classes):
+        """
+        Instantiates the objects defined by the given records and sets
+        their attributes.  The classes are looked up in the given map of
+        element tag to class.
+
+        """
+        if self.class_filter is not None:
+            records = self._filter(records, classes)
+        self._load(records, classes)
+
+    def _filter(self, records, classes):
+        """
+        Yields the given records of objects accepted by the filter and
+        keeps the others.
+
+        """
+        try:
+            skipped = self.skipped[id(classes)]
+        except KeyError:
+            skipped = self.skipped[id(classes)] = \
+                    SkipTable(classes, self.class_filter)
+        excluded = self.excluded
+
+        for record in records:
+            if skipped[record[0]]:
+                uuid = record[1]
                 try:
-                    mname = packageMap[tag]
+                    excluded[uuid][1].append(record)
                 except KeyError:
+                    excluded[uuid] = (classes, [record])
+            else:
+                yield record
+
+    def _load(self, records, classes):
+        d = self.d
+        pending = self.pending
+        deferred = self.deferred
+        logger_errors_grouped = self.errors
+
+        for tag, uuid, defined, properties in records:
+            if defined: # class
+                klass = classes[tag]
+                if klass is None:
                     logger.error("Unable to locate module for: %s (%s)",
-                                 tag, uuid)
-                    root.clear()
+                                 _name(tag), uuid)
                     continue
+
+                # Instantiate the class and map it to the uuid.
+                d[uuid] = obj = klass(UUID=uuid)
+
+                # Apply any descriptions that preceded the definition.
+                for _, props in deferred.pop(uuid, ()):
+                    _set_properties(obj, props, pending, logger_errors_grouped)
+            else:
+                # Locate the CIM object using the uuid.
+                try:
+                    obj = d[uuid]
+                except KeyError:
+                    deferred.setdefault(uuid, []).append((tag, properties))
+                    continue
+
+            _set_properties(obj, properties, pending, logger_errors_grouped)
+
+    def finish(self, bulk=False):
+        """
+        Binds the pending references and logs any errors.
+
+        """
+        if self.excluded:
+            self._resolve_excluded()
+
+        for uuid, descriptions in self.deferred.items():
+            logger.error("Missing '%s' object with uuid: %s",
+                         _name(descriptions[0][0]), uuid)
+
+        # Bind references now that all objects have been instantiated.
+        if bulk:
+            self.unresolved = _bind_bulk(self.d, self.pending, self.errors)
+        else:
+            self.unresolved = _bind(self.d, self.pending, self.errors)
+
+        if self.errors:
+            for error, count in list(self.errors.items()):
+                logging_message = '%s : %d times' %(error, count)
+                logger.warn(logging_message)
+
+
+    def _resolve_excluded(self):
+        """
+        Loads the excluded objects referenced by the objects loaded, if the
+        closure is required, and drops references to the other excluded
+        objects.
+
+        """
+        excluded = self.excluded
+        pending = self.pending
+
+        if self.closure:
+            # References appended while loading are visited in turn.
+            i = 0
+            while i < len(pending):
+                uuid = pending[i][2]
+                i += 1
+                if uuid in excluded:
+                    classes, records = excluded.pop(uuid)
+                    self._load(records, classes)
+
+        self.pending = [p for p in pending if p[2] not in excluded]
+        self.excluded = {}
+
+
+def _name(tag):
+    """
+    Returns the given element tag without its namespace.
+
+    """
+    return tag[tag.find("}") + 1:]
+
+
+# Tag to class tables, keyed by packageMap identity and CIM namespace URI.
+_class_tables = {}
+
+
+def get_class_table(packageMap, nsURI):
+    """
+    Returns the map of element tag to CIM class for the given packageMap and
+    namespace.  One table is kept per packageMap and namespace, so that the
+    classes are resolved once and reused by subsequent calls.
+
+    """
+    key = (id(packageMap), nsURI)
+    try:
+        return _class_tables[key]
+    except KeyError:
+        table = _class_tables[key] = ClassTable(packageMap, nsURI)
+        return table
+
+
+class ClassTable(dict):
+    """
+    Map of fully-qualified element tag (e.g.
+    {http://iec.ch/TC57/2010/CIM-schema-cim15#}Terminal) to CIM class.
+    The class for a tag is imported from its package when the tag is first
+    looked up and cached thereafter.  Tags that cannot be resolved map to
+    C{None}.
+
+    """
+
+    def __init__(self, packageMap, nsURI):
+        super(ClassTable, self).__init__()
+        #: Map of class name to PyCIM package name.
+        self.packageMap = packageMap
+        #: CIM element tag base (e.g. {http://iec.ch/TC57/2010/CIM-schema-cim15#}).
+        self.base = "{%s#}" % nsURI
+
+    def __missing__(self, tag):
+        klass = None
+        if tag.startswith(self.base):
+            name = tag[len(self.base):]
+            mname = self.packageMap.get(name)
+            if mname is not None:
                 # Import the module for the CIM object.
-                module = __import__(mname, globals(), locals(), [tag], 0)
+                module = __import__(mname, globals(), locals(), [name], 0)
                 # Get the CIM class from the module.
-                klass = getattr(module, tag)
+                klass = getattr(module, name)
+        self[tag] = klass
+        return klass
 
-                # Instantiate the class and map it to the uuid.
-                d[uuid] = klass(UUID=uuid)
 
-        # Clear children of the root element to minimise memory usage.
-        root.clear()
+def _bind(d, pending, logger_errors_grouped):
+    """
+    Binds the given (object, plan entry, uuid) references in order.
+    Returns the number of references to objects not found.
 
-    # Reset stream
-    if hasattr(source, "seek"):
-        source.seek(0)
+    """
+    missing = 0
+    for obj, (kind, attr, bind), uuid2 in pending:
+        try:
+            val = d[uuid2]
+        except KeyError:
+            logger.error("Referenced '%s' [%s] object missing.",
+                         obj.__class__.__name__, uuid2)
+            missing += 1
+            continue
+
+        linkable = _linkable.get((obj.__class__, attr, val.__class__))
+        if linkable is None:
+            linkable = is_linkable(obj.__class__, attr, val.__class__)
+        if not linkable:
+            _link_one_end(obj, kind, attr, val, logger_errors_grouped)
+            continue
+
+        # Rely on properties and 'add*' methods to set any bi-directional
+        # references.
+        bind(obj, val)
+
+    return missing
+
+
+def _bind_bulk(d, pending, logger_errors_grouped):
+    """
+    Binds the given (object, plan entry, uuid) references in one linear
+    pass.  Both ends of each association are written directly to the
+    private attributes of the objects.  Associations that are already set
+    to another object, or whose setters do more than link the two ends,
+    are bound using the property setters and 'add*' methods.  Returns the
+    number of references to objects not found.
+
+    """
+    # Many-to-many links made, as (id(obj), role, id(target)).
+    linked = set()
+    missing = 0
+
+    for obj, (kind, attr, bind), uuid2 in pending:
+        try:
+            target = d[uuid2]
+        except KeyError:
+            logger.error("Referenced '%s' [%s] object missing.",
+                         obj.__class__.__name__, uuid2)
+            missing += 1
+            continue
+
+        linkable = _linkable.get((obj.__class__, attr, target.__class__))
+        if linkable is None:
+            linkable = is_linkable(obj.__class__, attr, target.__class__)
+        if not linkable:
+            _link_one_end(obj, kind, attr, target, logger_errors_grouped)
+            continue
+
+        inverse = get_inverse_role(obj.__class__, attr, target.__class__)
+        if inverse is None:
+            bind(obj, target)
+            continue
+        inverse, inverse_many = inverse
+        own = "_" + attr
+        other = "_" + inverse
+
+        if kind == REFERENCE:
+            current = getattr(obj, own)
+            if current is target:
+                continue
+            if current is not None or \
+                    (not inverse_many and getattr(target, other) is not None):
+                bind(obj, target)
+                continue
+            setattr(obj, own, target)
+            if inverse_many:
+                _append(target, other, obj)
+            else:
+                setattr(target, other, obj)
+        elif not inverse_many: # one-to-many
+            current = getattr(target, other)
+            if current is obj:
+                continue
+            if current is not None:
+                bind(obj, target)
+                continue
+            setattr(target, other, obj)
+            _append(obj, own, target)
+        else: # many-to-many
+            key = (id(obj), attr, id(target))
+            if key in linked:
+                continue
+            linked.add(key)
+            linked.add((id(target), inverse, id(obj)))
+            _append(obj, own, target)
+            _append(target, other, obj)
+
+    return missing
+
+
+def _link_one_end(obj, kind, attr, target, logger_errors_grouped):
+    """
+    Sets the given reference of the given object alone, the class of the
+    target lacking the inverse role.
+
+    """
+    klass = obj.__class__
+    own = "_" + attr if isinstance(getattr(klass, attr, None), property) \
+            else attr
+    if kind == REFERENCE:
+        setattr(obj, own, target)
+    else:
+        _append(obj, own, target)
+
+    error_msg = "'%s' cannot hold the inverse of '%s.%s'" % \
+            (target.__class__.__name__, klass.__name__, attr)
+    try:
+        logger_errors_grouped[error_msg] += 1
+    except KeyError:
+        logger_errors_grouped[error_msg] = 1
+
+
+def _append(obj, attr, value):
+    """
+    Appends the given value to the list of the given attribute.  A new
+    list is made when the attribute holds the shared empty list of objects
+    with none, which cannot be added to.
+
+    """
+    values = getattr(obj, attr)
+    if values:
+        values.append(value)
+    else:
+        setattr(obj, attr, values + [value])
+
+
+def _unset_properties(obj, properties, d, logger_errors_grouped):
+    """
+    Removes the given statements from the given object.  Attributes are
+    reset to their defaults and references to the given objects unset.
+
+    """
+    plan = get_property_plan(obj.__class__)
+
+    for tag, text, uuid2 in properties:
+        entry = plan[tag]
+
+        if entry is None:
+            error_msg = "'%s' has not attribute '%s'" % \
+                    (obj.__class__.__name__, tag.rsplit(".", 1)[-1])
+            try:
+                logger_errors_grouped[error_msg] += 1
+            except KeyError:
+                logger_errors_grouped[error_msg] = 1
+            continue
+
+        kind, attr, func = entry
+
+        if kind < REFERENCE:
+            setattr(obj, attr, _default(obj.__class__, attr))
+            continue
+
+        target = d.get(uuid2[uuid2.find("#") + 1:]) if uuid2 else None
+        if target is None:
+            continue
+        if kind == REFERENCE:
+            if getattr(obj, attr) is target:
+                func(obj, None)
+        elif target in getattr(obj, attr):
+            _remover(obj, attr)(target)
+
+
+def _default(klass, attr):
+    """
+    Returns the default value of the given attribute of the given class.
+
+    """
+    for k in klass.__mro__:
+        defaults = k.__dict__.get("_defaults")
+        if defaults is not None and attr in defaults:
+            return defaults[attr]
+    return None
+
+
+def _remover(obj, ref):
+    """
+    Returns a function removing objects from the given role of the given
+    object.
+
+    """
+    remove = getattr(obj, "remove%s" % ref, None)
+    if remove is not None:
+        return remove
+    def remove(*objs):
+        values = getattr(obj, ref)
+        for o in objs:
+            values.remove(o)
+    return remove
+
+
+def _unlink(obj):
+    """
+    Removes the given object from all of its associations.
+
+    """
+    for klass in obj.__class__.__mro__:
+        if "_refs" not in klass.__dict__:
+            continue
+        for ref in klass._refs:
+            val = getattr(obj, ref)
+            if ref in klass._many_refs:
+                if val:
+                    _remover(obj, ref)(*list(val))
+            elif val is not None:
+                setattr(obj, ref, None)
+
+
+# Whether objects can be linked, keyed by (class, role, target class).
+_linkable = {}
+
+
+def is_linkable(klass, role, target_klass):
+    """
+    Returns false if the objects of the target class lack the inverse of
+    the given role of the given class, so that linking them fails.  This is
+    the case of objects of different profiles (e.g. a Terminal of the
+    Connectivity profile referencing an ACLineSegment defined by the Asset
+    profile, whose class has no Terminals).
+
+    """
+    key = (klass, role, target_klass)
+    try:
+        return _linkable[key]
+    except KeyError:
+        pass
 
-    ## Second pass sets attributes and references.
-    context = iter( iterparse(source, ("start", "end")) )
+    obj, target = klass(), target_klass()
+    if role in _many_refs(klass):
+        link = getattr(obj, "add%s" % role, None)
+    else:
+        link = lambda target: setattr(obj, role, target)
+    try:
+        # Roles with no 'add' method are plain lists.
+        if link is not None:
+            link(target)
+        linkable = True
+    except AttributeError:
+        linkable = False
+
+    _linkable[key] = linkable
+    return linkable
+
+
+# Inverse roles, keyed by (class, role, target class).
+_inverse_roles = {}
+
+
+def get_inverse_role(klass, role, target_klass):
+    """
+    Returns a (role, many) tuple for the role of the target class that is
+    the inverse of the given role, where C{many} is true if the inverse role
+    is a 'many' reference.  Returns C{None} if the reference has no inverse
+    or if setting it does more than link the private attributes of both
+    ends.  The roles are found by linking a pair of new instances once per
+    class, role and target class.
+
+    """
+    key = (klass, role, target_klass)
+    try:
+        return _inverse_roles[key]
+    except KeyError:
+        pass
+
+    if not is_linkable(klass, role, target_klass):
+        _inverse_roles[key] = None
+        return None
+
+    obj, target = klass(), target_klass()
+    before = _state(obj), _state(target)
+    if role in _many_refs(klass):
+        add = getattr(obj, "add%s" % role, None)
+        if add is None:
+            # Plain list attributes (e.g. with 'add_' methods) have no
+            # inverse.
+            _inverse_roles[key] = None
+            return None
+        add(target)
+    else:
+        setattr(obj, role, target)
+    changed = _changed(obj, before[0]), _changed(target, before[1])
+
+    inverse = None
+    if changed[0] == set(["_" + role]) and len(changed[1]) == 1:
+        other = changed[1].pop()
+        name = other[1:]
+        if name in _refs(target_klass):
+            value = getattr(target, other)
+            if value is obj:
+                inverse = (name, False)
+            elif isinstance(value, MutableSequence) and value == [obj]:
+                inverse = (name, True)
+
+    _inverse_roles[key] = inverse
+    return inverse
+
+
+def _refs(klass):
+    return [r for k in klass.__mro__ for r in k.__dict__.get("_refs", ())]
+
+
+def _many_refs(klass):
+    return [r for k in klass.__mro__ for r in k.__dict__.get("_many_refs", ())]
+
+
+def _state(obj):
+    return dict((k, (v, list(v) if isinstance(v, MutableSequence) else None))
+                for k, v in instance_state(obj).items())
+
+
+def _changed(obj, state):
+    changed = set()
+    for k, v in instance_state(obj).items():
+        if k not in state:
+            changed.add(k)
+        else:
+            u, items = state[k]
+            if v is not u or (items is not None and v != items):
+                changed.add(k)
+    return changed
+
+
+def _sniff(context):
+    """
+    Consumes namespace events from the given iterparse context up to and
+    including the start of the root element.  Returns the map of prefix to
+    namespace and the root element.
+
+    """
+    namespaces = {}
+    for event, elem in context:
+        if event == "start-ns":
+            prefix, ns = elem
+            namespaces[prefix] = ns
+        elif event == "start":
+            return namespaces, elem
+
+
+def _iterrecords(context, root, base, ns_rdf, skipped=None):
+    """
+    Yields a (tag, uuid, defined, properties) tuple for each CIM object
+    element in the given iterparse context.  The C{defined} flag is true for
+    rdf:ID elements and false for rdf:about elements.  Properties is a list
+    of (tag, text, resource) tuples, one for each attribute, enumeration or
+    reference element of the object, or C{None} if the tag maps to C{True}
+    in the given L{SkipTable}.
+
+    """
+    m = len(base)
+    ID = "{%s}ID" % ns_rdf
+    about = "{%s}about" % ns_rdf
+    resource = "{%s}resource" % ns_rdf
 
-    # Get the root element ({http://www.w3.org/1999/02/22-rdf-syntax-ns#}RDF).
-    _, root = next(context)
+    # The element of the object currently being described.
+    current = None
 
     for event, elem in context:
-        # Process 'start' elements in the CIM namespace.
-        if event == "start" and elem.tag[:m] == base:
-            uuid = elem.get("{%s}ID" % ns_rdf)
-            if uuid is None:
-                uuid = elem.get("{%s}about" % ns_rdf)
+        if event == "start-ns":
+            # Namespaces declared below the root element.
+            continue
+        if event == "start":
+            if current is None and elem.tag[:m] == base:
+                # Unique resource identifier for the CIM object.
+                uuid = elem.get(ID)
+                defined = uuid is not None
+                if not defined:
+                    uuid = elem.get(about)
+                    if uuid is not None:
+                        uuid = uuid[1:]
                 if uuid is not None:
-                    uuid = uuid[1:]
+                    current = elem
+                    if skipped is not None and skipped[elem.tag]:
+                        properties = None
+                    else:
+                        properties = []
+        elif current is None:
+            # Clear children of the root element to minimise memory usage.
+            root.clear()
+        elif elem is current:
+            # Finished reading the object.
+            yield current.tag, uuid, defined, properties
+            current = None
+            root.clear()
+        elif properties is not None and elem.tag[:m] == base and \
+                elem.get(ID) is None and elem.get(about) is None:
+            # Attribute or reference (e.g. <cim:Terminal.connected>).
+            properties.append((elem.tag, elem.text, elem.get(resource)))
+
+
+def _iterdifferences(context, base, ns_rdf):
+    """
+    Yields a (forward, tag, uuid, typed, properties) tuple for each element
+    of the forwardDifferences and reverseDifferences of a difference model
+    in the given iterparse context.  The C{typed} flag is false for
+    rdf:Description elements.  Properties are as for L{_iterrecords}.
+
+    """
+    m = len(base)
+    ID = "{%s}ID" % ns_rdf
+    about = "{%s}about" % ns_rdf
+    resource = "{%s}resource" % ns_rdf
+    description = "{%s}Description" % ns_rdf
+
+    # The forward or reverse differences element being read.
+    section = None
+    forward = False
+    # The element of the object currently being described.
+    current = None
+
+    for event, elem in context:
+        if event == "start-ns":
+            # Namespaces declared below the root element.
+            continue
+        if event == "start":
+            if section is None:
+                name = _name(elem.tag)
+                if name in ("forwardDifferences", "reverseDifferences"):
+                    section = elem
+                    forward = name == "forwardDifferences"
+            elif current is None:
+                uuid = elem.get(about)
+                if uuid is not None:
+                    uuid = uuid[uuid.find("#") + 1:]
+                else:
+                    uuid = elem.get(ID)
+                current = elem
+                properties = []
+        elif elem is current:
             if uuid is not None:
-                # Locate the CIM object using the uuid.
+                yield (forward, elem.tag, uuid, elem.tag != description,
+                       properties)
+            current = None
+            section.clear()
+        elif elem is section:
+            section = None
+        elif current is not None and elem.tag[:m] == base:
+            properties.append((elem.tag, elem.text, elem.get(resource)))
+
+
+# Kinds of property plan entry.
+ATTRIBUTE = 0
+ENUMERATION = 1
+REFERENCE = 2
+MANY_REFERENCE = 3
+
+
+def _boolean(text):
+    # NB: bool("false") returns True, because it is called upon a non-empty
+    # string.  Empty elements are false.
+    if text is None:
+        return False
+    return text.strip().lower() in ("true", "1")
+
+
+def _string(text):
+    return text if text is not None else ""
+
+
+# Converters from element text, keyed by attribute type.
+_converters = {bool: _boolean, str: _string}
+
+# Property plans, keyed by CIM class.
+_property_plans = {}
+
+
+def get_property_plan(klass):
+    """
+    Returns the property plan for the given CIM class.  Plans are compiled
+    once per class and reused by subsequent calls.
+
+    """
+    try:
+        return _property_plans[klass]
+    except KeyError:
+        plan = _property_plans[klass] = PropertyPlan(klass)
+        return plan
+
+
+class PropertyPlan(dict):
+    """
+    Map of property element tag (e.g.
+    {http://iec.ch/TC57/2010/CIM-schema-cim15#}Terminal.connected) to a
+    (kind, attribute, function) entry for a CIM class.  The function
+    converts element text for attributes and enumerations, and binds
+    a target object (C{function(obj, target)}) for references.  Entries are
+    compiled from the C{_attrs}, C{_attr_types}, C{_enums}, C{_refs} and
+    C{_many_refs} metadata of the class and its bases, and tags are mapped
+    to entries on first lookup.  Unknown properties map to C{None}.
+
+    """
+
+    def __init__(self, klass):
+        super(PropertyPlan, self).__init__()
+        #: Map of attribute name to plan entry.
+        self.entries = entries = {}
+
+        for k in reversed(klass.__mro__):
+            if "_attrs" not in k.__dict__:
+                continue
+            for attr in k._attrs:
+                if attr in k._enums:
+                    entries[attr] = (ENUMERATION, attr, _string)
+                else:
+                    typ = k._attr_types[attr]
+                    entries[attr] = (ATTRIBUTE, attr,
+                                     _converters.get(typ, typ))
+            for ref in k._refs:
+                if ref in k._many_refs:
+                    entries[ref] = (MANY_REFERENCE, ref, _adder(klass, ref))
+                else:
+                    entries[ref] = (REFERENCE, ref, _setter(klass, ref))
+
+    def __missing__(self, tag):
+        # Get the attribute/reference name.
+        entry = self.entries.get(tag.rsplit(".", 1)[-1])
+        self[tag] = entry
+        return entry
+
+
+def _setter(klass, ref):
+    prop = getattr(klass, ref, None)
+    if isinstance(prop, property) and prop.fset is not None:
+        return prop.fset
+    def setter(obj, val):
+        setattr(obj, ref, val)
+    return setter
+
+
+def _adder(klass, ref):
+    add = getattr(klass, "add%s" % ref, None)
+    if add is not None:
+        return add
+    def adder(obj, val):
+        _append(obj, ref, val)
+    return adder
+
+
+def _set_properties(obj, properties, pending, logger_errors_grouped):
+    """
+    Sets the attributes and enumerations of the given object.  References
+    are appended to the pending list.
+
+    """
+    plan = get_property_plan(obj.__class__)
+
+    for tag, text, uuid2 in properties:
+        entry = plan[tag]
+
+        if entry is None:
+            error_msg = "'%s' has not attribute '%s'" % \
+                    (obj.__class__.__name__, tag.rsplit(".", 1)[-1])
+            try:
+                logger_errors_grouped[error_msg] += 1
+            except KeyError:
+                logger_errors_grouped[error_msg] = 1
+            continue
+
+        kind, attr, func = entry
+
+        # Use the rdf:resource attribute to distinguish
+        # between attributes and references/enums.
+        if uuid2 is None: # attribute
+            if kind < REFERENCE:
                 try:
-                    obj = d[uuid]
-                except KeyError:
-                    logger.error("Missing '%s' object with uuid: %s",
-                                 elem.tag[m:], uuid)
-                    root.clear()
+                    setattr(obj, attr, func(text))
                     continue
+                except (TypeError, ValueError):
+                    pass
+            error_msg = "'%s' has invalid value for '%s'" % \
+                    (obj.__class__.__name__, attr)
+            try:
+                logger_errors_grouped[error_msg] += 1
+            except KeyError:
+                logger_errors_grouped[error_msg] = 1
+        elif kind >= REFERENCE:
+            pending.append((obj, entry, uuid2[uuid2.find("#") + 1:]))
+        else: # enum
+            setattr(obj, attr, uuid2.rsplit(".", 1)[-1])
 
-                # Iterate over attributes/references.
-                for event, elem in context:
-                    # Process end events with elements in the CIM namespace.
-                    if event == "end" and elem.tag[:m] == base:
-                        # Break if class closing element (e.g. </cim:Terminal>).
-                        if elem.get("{%s}ID" % ns_rdf) is None and \
-                                elem.get("{%s}about" % ns_rdf) is None:
-                            # Get the attribute/reference name.
-                            attr = elem.tag[m:].rsplit(".")[-1]
-
-                            if not hasattr(obj, attr):
-                                error_msg = "'%s' has not attribute '%s'" %(obj.__class__.__name__, attr)
-                                try:
-                                    logger_errors_grouped[error_msg] += 1
-                                except KeyError:
-                                    logger_errors_grouped[error_msg] = 1
-                                # logger.error("'%s' has not attribute '%s'",
-                                #              obj.__class__.__name__, attr)
-                                continue
-
-                            # Use the rdf:resource attribute to distinguish
-                            # between attributes and references/enums.
-                            uuid2 = elem.get("{%s}resource" % ns_rdf)
-
-                            if uuid2 is None: # attribute
-                                # Convert value type using the default value.
-                                try:
-                                    typ = type( getattr(obj, attr) )
-                                    if typ == type(True): # KKG: Test if it is boolean value
-                                        # KKG: NB: The function bool("false") returns True, because it is called upon non-empty string!
-                                        # This means that it wrongly reads "false" value as boolean True and this is why this special case testing is necessary
-                                        if str.title(elem.text) == 'True':
-                                            setattr(obj, attr, True)
-                                        else:
-                                            setattr(obj, attr, False)
-                                    else:
-                                        setattr(obj, attr, typ(elem.text))
-                                except TypeError:
-                                    pass
-                            else:  # reference or enum
-                                # Use the '#' prefix to distinguish between
-                                # references and enumerations.
-                                if uuid2[0] == "#": # reference
-                                    try:
-                                        val = d[uuid2[1:]] # remove '#' prefix
-                                    except KeyError:
-                                        logger.error("Referenced '%s' [%s] "
-                                                     "object missing.",
-                                                     obj.__class__.__name__,
-                                                     uuid2[1:])
-                                        continue
-
-                                    default = getattr(obj, attr)
-                                    if default == None: # 1..1 or 1..n
-                                        # Rely on properties to set any
-                                        # bi-directional references.
-                                        setattr(obj, attr, val)
-                                    elif isinstance(default, list): # many
-                                        # Use 'add*' method to set reference.
-                                        getattr(obj, ("add%s" % attr))(val)
-#                                    else:
-#                                        logger.error("Reference error [%s].",
-#                                                     default)
-
-                                else: # enum
-                                    val = uuid2.rsplit(".", 1)[1]
-                                    setattr(obj, attr, val)
-
-                        else:
-                            # Finished setting object attributes.
-                            break
-
-        # Clear children of the root element to minimise memory usage.
-        root.clear()
-
-    if logger_errors_grouped:
-        for error, count in list(logger_errors_grouped.items()):
-            logging_message = '%s : %d times' %(error, count)
-            logger.warn(logging_message)
 
-    # logging_message = 'Created totally %d CIM objects in %.2fs.' %(len(d), time() - t0)
-    logger.info('Created totally %d CIM objects in %.2fs.' %(len(d), time() - t0))
-    # logging_message = 'END of parsing file \"%s\"\n' % source
-    logger.info('END of parsing file \"%s\"\n' % source)
+def _get_properties(klass, properties, logger_errors_grouped):
+    """
+    Returns a map of attribute name to converted value and a map of role
+    name to referenced uuid (or list of uuids) for the given properties of
+    an object of the given class.
 
-    return d
+    """
+    plan = get_property_plan(klass)
+    attributes = {}
+    references = {}
+
+    for tag, text, uuid2 in properties:
+        entry = plan[tag]
+
+        if entry is None:
+            error_msg = "'%s' has not attribute '%s'" % \
+                    (klass.__name__, tag.rsplit(".", 1)[-1])
+            try:
+                logger_errors_grouped[error_msg] += 1
+            except KeyError:
+                logger_errors_grouped[error_msg] = 1
+            continue
+
+        kind, attr, func = entry
+
+        if uuid2 is None: # attribute
+            if kind < REFERENCE:
+                try:
+                    attributes[attr] = func(text)
+                    continue
+                except (TypeError, ValueError):
+                    pass
+            error_msg = "'%s' has invalid value for '%s'" % \
+                    (klass.__name__, attr)
+            try:
+                logger_errors_grouped[error_msg] += 1
+            except KeyError:
+                logger_errors_grouped[error_msg] = 1
+        elif kind == MANY_REFERENCE:
+            references.setdefault(attr, []).append(
+                    uuid2[uuid2.find("#") + 1:])
+        elif kind == REFERENCE:
+            references[attr] = uuid2[uuid2.find("#") + 1:]
+        else: # enum
+            attributes[attr] = uuid2.rsplit(".", 1)[-1]
+
+    return attributes, references
 
 
 def xmlns(source):
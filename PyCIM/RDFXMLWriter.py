@@ -18,100 +18,620 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
+import io
 import logging
+import multiprocessing
+import sys
 
 from time import time
 
-from CIM15 import nsURI, nsPrefix
-
-from PyCIM.SimpleXMLWriter import XMLWriter
+from PyCIM.Compact import source_class
+from PyCIM.RDFXMLEmitter import RDFXMLEmitter, escape_attrib
+from PyCIM.Compression import open_output
+from PyCIM.RDFXMLReader import get_inverse_role, _many_refs
 
 nsPrefixRDF = "rdf"
 nsRDF = "http://www.w3.org/1999/02/22-rdf-syntax-ns#"
 
 logger = logging.getLogger(__name__)
 
-def cimwrite(d, source, encoding="utf-8"):
+#: Number of shards of the objects written by each worker process.
+SHARDS_PER_PROCESS = 4
+
+def cimwrite(d, source, encoding="utf-8", compression=None, nsURI=None,
+             nsPrefix=None, packageMap=None, processes=1, indent=None):
     """CIM RDF/XML serializer.
 
     @type d: dict
-    @param d: Map of URIs to CIM objects.
-    @type source: File or file-like object.
-    @param source: This object must implement a C{write} method
-    that takes an 8-bit string.
+    @param d: Map of URIs to CIM objects, or any iterable of CIM objects
+    (see L{CIMWriter}).
+    @type source: File, file-like object or a path to a file.
+    @param source: Text or binary stream, or the path of a file to be
+    written. Paths ending in '.gz', '.bz2' or '.xz' are written
+    compressed.
     @type encoding: string
     @param encoding: Character encoding defaults to "utf-8", but can also
     be set to "us-ascii".
+    @type compression: string
+    @param compression: Compression ('gzip', 'bz2' or 'xz') of the file at
+    the given path, regardless of its extension.
+    @type nsURI: string
+    @param nsURI: CIM namespace URI to be written. Defaults to the
+    namespace of the CIM version (e.g. CIM14 or CIM15) of the package
+    of the objects.
+    @type nsPrefix: string
+    @param nsPrefix: CIM namespace prefix. Defaults to that of the CIM
+    version.
+    @type packageMap: dict
+    @param packageMap: Map of class name to PyCIM package name (e.g.
+    C{CIM14.ENTSOE.Equipment.packageMap}). If given, only objects of the
+    classes in the map are written.
+    @type processes: int
+    @param processes: Number of worker processes serialising contiguous
+    shards of the objects, or C{None} for the number of CPUs.  The output
+    is identical to that of a single process.
+    @type indent: string
+    @param indent: Indentation of each level of nesting (e.g. two
+    spaces). If C{None}, elements are not separated by white space.
     @rtype: bool
     @return: Write success.
     """
-    # Start the clock
-    t0 = time()
+    if isinstance(d, dict):
+        # The versions of all the objects are checked before writing.
+        if nsURI is None or nsPrefix is None:
+            detected = get_cim_ns(d)
+            nsURI = nsURI or detected[0]
+            nsPrefix = nsPrefix or detected[1]
+        objects = d.values()
+    else:
+        objects = d
 
-    w = XMLWriter(source, encoding)
+    with CIMWriter(source, encoding, compression, nsURI, nsPrefix,
+                   packageMap, indent) as w:
+        w.write_all(objects, processes)
 
-    # Write the XML declaration.
-    w.declaration()
 
-    # Add a '#' suffix to the CIM namespace URI if not present.
-    nsCIM = nsURI if nsURI[-1] == "#" else nsURI + "#"
+class CIMWriter(object):
+    """Streaming CIM RDF/XML serializer.  Each object is serialised as it
+    is written, so objects may be produced on the fly and need not be held
+    in memory::
 
-    # Start the root RDF element and declare namespaces.
-    xmlns = {"xmlns:%s" % nsPrefixRDF: nsRDF, "xmlns:%s" % nsPrefix: nsCIM}
-    rdf = w.start("%s:RDF" % nsPrefixRDF, xmlns)
+        with CIMWriter("model.xml") as w:
+            for obj in query():
+                w.write(obj)
 
-    # Iterate over all UUID, CIM object pairs in the given dictionary.
-    for uuid, obj in list(d.items()):
-        w.start("%s:%s" % (nsPrefix, obj.__class__.__name__),
-                {"%s:ID" % nsPrefixRDF: obj.UUID})
+    The objects are written as they are: references are written by the
+    UUIDs of the objects referenced, whether or not they are written too.
+    """
 
-        mro = obj.__class__.mro()
-        mro.reverse()
+    def __init__(self, source, encoding="utf-8", compression=None,
+                 nsURI=None, nsPrefix=None, packageMap=None, indent=None):
+        """Opens a new writer.
+
+        @type source: File, file-like object or a path to a file.
+        @param source: Stream or path to which the document is written
+        (see L{cimwrite}).
+        @type encoding: string
+        @param encoding: Character encoding of the document.
+        @type compression: string
+        @param compression: Compression ('gzip', 'bz2' or 'xz') of the
+        file at the given path, regardless of its extension.
+        @type nsURI: string
+        @param nsURI: CIM namespace URI to be written. Defaults to the
+        namespace of the CIM version of the first object written.
+        @type nsPrefix: string
+        @param nsPrefix: CIM namespace prefix.
+        @type packageMap: dict
+        @param packageMap: Map of class name to PyCIM package name. If
+        given, only objects of the classes in the map are written.
+        @type indent: string
+        @param indent: Indentation of each level of nesting.
+        """
+        self.t0 = time()
+
+        self.nsURI = nsURI
+        self.nsPrefix = nsPrefix
+        self.packageMap = packageMap
+        self.indent = indent
+        #: Number of objects written.
+        self.count = 0
+        #: Number of objects not written, as their classes are not in the
+        #: package map.
+        self.skipped = 0
+
+        if isinstance(source, str):
+            self._file = open_output(source, compression)
+            source = self._file
+        else:
+            self._file = None
+
+        self._emitter = RDFXMLEmitter(source, encoding, indent)
+        # CIM version package of the namespace detected.
+        self._package = None
+        # Plans for this namespace keyed by class, or None for classes not
+        # in the package map.
+        self._plans = {}
+        self._started = False
+        self.closed = False
+
+        if nsURI is not None and nsPrefix is not None:
+            self._start()
+
+    def _start(self):
+        if self.nsURI is None or self.nsPrefix is None:
+            cim = __import__(self._package or "CIM15", globals(), locals(),
+                             ["nsURI", "nsPrefix"], 0)
+            self.nsURI = self.nsURI or cim.nsURI
+            self.nsPrefix = self.nsPrefix or cim.nsPrefix
+
+        w = self._emitter
+
+        # Write the XML declaration.
+        w.declaration()
+
+        # Add a '#' suffix to the CIM namespace URI if not present.
+        nsURI = self.nsURI
+        self._nsCIM = nsURI if nsURI[-1] == "#" else nsURI + "#"
+
+        # Start the root RDF element and declare namespaces.
+        xmlns = {"xmlns:%s" % nsPrefixRDF: nsRDF,
+                 "xmlns:%s" % self.nsPrefix: self._nsCIM}
+        w.start_root("%s:RDF" % nsPrefixRDF, xmlns)
+
+        self._started = True
+
+    def _plan(self, klass):
+        """Returns the plan of the given class, or C{None} if the class is
+        not in the package map.
+        """
+        if not self._started:
+            self._package = klass.__module__.split(".", 1)[0]
+            self._start()
+        elif self._package is not None and \
+                klass.__module__.split(".", 1)[0] != self._package:
+            raise ValueError("Objects of more than one CIM version: %s, %s" %
+                             (self._package, klass.__module__))
+
+        packageMap = self.packageMap
+        if packageMap is None or klass.__name__ in packageMap:
+            plan = get_write_plan(klass, self.nsPrefix, self._nsCIM,
+                                  self.indent)
+        else:
+            plan = None
+        self._plans[klass] = plan
+        return plan
+
+    def write(self, obj):
+        """Serialises the given CIM object.
+        """
+        try:
+            plan = self._plans[obj.__class__]
+        except KeyError:
+            plan = self._plan(obj.__class__)
+        if plan is None:
+            self.skipped += 1
+        else:
+            _write_object(self._emitter, plan, obj)
+            self.count += 1
+
+    def write_all(self, objects, processes=1):
+        """Serialises each CIM object of the given iterable.
+
+        @type processes: int
+        @param processes: Number of worker processes serialising
+        contiguous shards of the objects, or C{None} for the number of
+        CPUs.  The objects are shared with the workers by forking, so the
+        objects are written in this process where that is not available.
+        """
+        if processes is None:
+            processes = multiprocessing.cpu_count()
+        if processes > 1:
+            if "fork" in multiprocessing.get_all_start_methods():
+                return self._write_shards(list(objects), processes)
+            logger.warning("Objects cannot be written in parallel without "
+                           "the 'fork' start method.")
 
-        # Serialise attributes.
-        for klass in mro[2:]: # skip 'object' and 'Element'
-            attrs = [a for a in klass._attrs if a not in klass._enums]
-            for attr in attrs:
-                val = getattr(obj, attr)
-                if val != klass._defaults[attr]:
-                    w.element("%s:%s.%s" % (nsPrefix, klass.__name__, attr),
-                              str(val))
-
-        # Serialise enumeration data-types.
-        for klass in mro[2:]: # skip 'object' and 'Element'
-            enums = [a for a in klass._attrs if a in klass._enums]
-            for enum in enums:
-                val = getattr(obj, enum)
-                dt = klass._enums[enum]
-                w.element("%s:%s.%s" % (nsPrefix, klass.__name__, enum),
-                          attrib={"%s:resource" % nsPrefixRDF:
-                                  "%s%s.%s" % (nsCIM, dt, val)})
-
-        # Serialise references.
-        for klass in mro[2:]: # skip 'object' and 'Element'
-            # FIXME: serialise 'many' references.
-            refs = [r for r in klass._refs if r not in klass._many_refs]
-            for ref in refs:
-                val = getattr(obj, ref)
-                if val is not None:
-                    w.element("%s:%s.%s" % (nsPrefix, klass.__name__, ref),
-                          attrib={"%s:resource" % nsPrefixRDF:
-                                  "#%s" % val.UUID})
-
-        w.end()
-
-    # Close the root RDF element.
-    w.close(rdf)
-
-    # Flush the output stream.
+        plans = self._plans
+        w = self._emitter
+        count = 0
+        try:
+            for obj in objects:
+                klass = obj.__class__
+                try:
+                    plan = plans[klass]
+                except KeyError:
+                    plan = self._plan(klass)
+                if plan is None:
+                    self.skipped += 1
+                    continue
+                _write_object(w, plan, obj)
+                count += 1
+        finally:
+            self.count += count
+
+    def _write_shards(self, objects, processes):
+        """Serialises contiguous shards of the given list of objects in a
+        pool of worker processes and writes them in order.
+        """
+        global _shared
+
+        # Plans are compiled, and CIM versions checked, before forking.
+        plans = self._plans
+        for obj in objects:
+            if obj.__class__ not in plans:
+                self._plan(obj.__class__)
+
+        n = min(processes * SHARDS_PER_PROCESS, len(objects))
+        shards = [(len(objects) * i // n, len(objects) * (i + 1) // n)
+                  for i in range(n)]
+
+        written = 0
+        _shared = (objects, plans)
+        pool = multiprocessing.get_context("fork").Pool(processes)
+        try:
+            for markup, count in pool.imap(_write_shard, shards):
+                self._emitter.markup(markup)
+                written += count
+        except BaseException:
+            # Discard the shards queued rather than waiting for them.
+            pool.terminate()
+            raise
+        finally:
+            _shared = None
+            pool.close()
+            pool.join()
+        self.count += written
+        self.skipped += len(objects) - written
+
+    def close(self):
+        """Ends the document and flushes the output stream.  Files opened
+        from a path are closed.
+        """
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            if not self._started:
+                self._start()
+            # Close the root RDF element and flush the output stream.
+            self._emitter.end_root()
+        finally:
+            if self._file is not None:
+                self._file.close()
+
+        if self.skipped:
+            logger.info("%d CIM objects of classes not in the package map "
+                        "skipped.", self.skipped)
+
+        logger.info("%d CIM objects serialised in %.2fs.", self.count,
+                    time() - self.t0)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+# Objects and plans shared with the worker processes by forking.
+_shared = None
+
+
+def _write_shard(shard):
+    """Returns the markup of the objects in the given range of those
+    shared, and the number of objects written.
+    """
+    objects, plans = _shared
+    start, end = shard
+    fd = io.StringIO()
+    w = RDFXMLEmitter(fd)
+    count = 0
+    for obj in objects[start:end]:
+        plan = plans[obj.__class__]
+        if plan is not None:
+            _write_object(w, plan, obj)
+            count += 1
     w.flush()
+    return fd.getvalue(), count
+
+
+def cimwrite_profiles(d, sources, packageMaps, encoding="utf-8",
+                      compression=None, nsURI=None, nsPrefix=None,
+                      indent=None):
+    """Writes the given model split into profiles (e.g. the CDPSM Asset,
+    Connectivity, Balanced and Geographical profiles) in a single pass over
+    the objects.
+
+    Each file holds the objects of the classes in the package map of its
+    profile, with only the properties that the profile defines.  An object
+    is defined (rdf:ID) in the first profile that includes its class and is
+    described (rdf:about) in the other profiles in which it has
+    properties.
+
+    @type d: dict
+    @param d: Map of URIs to CIM objects.
+    @type sources: list
+    @param sources: Stream or path to which each profile is written.
+    @type packageMaps: list
+    @param packageMaps: Package map of each profile (e.g.
+    C{CIM15.CDPSM.Connectivity.packageMap}).
+    @type encoding: string
+    @param encoding: Character encoding of the files.
+    @type compression: string
+    @param compression: Compression ('gzip', 'bz2' or 'xz') of the files
+    at the given paths, regardless of their extensions.
+    @type nsURI: string
+    @param nsURI: CIM namespace URI. Defaults to that of the CIM version
+    of the objects (see L{cimwrite}).
+    @type nsPrefix: string
+    @param nsPrefix: CIM namespace prefix.
+    @type indent: string
+    @param indent: Indentation of each level of nesting.
+    """
+    t0 = time()
+
+    if len(sources) != len(packageMaps):
+        raise ValueError("A package map is required for each profile.")
+
+    if nsURI is None or nsPrefix is None:
+        detected = get_cim_ns(d)
+        nsURI = nsURI or detected[0]
+        nsPrefix = nsPrefix or detected[1]
+    nsCIM = nsURI if nsURI[-1] == "#" else nsURI + "#"
+    xmlns = {"xmlns:%s" % nsPrefixRDF: nsRDF, "xmlns:%s" % nsPrefix: nsCIM}
+
+    files = []
+    try:
+        writers = []
+        for source in sources:
+            if isinstance(source, str):
+                source = open_output(source, compression)
+                files.append(source)
+            w = RDFXMLEmitter(source, encoding, indent)
+            w.declaration()
+            w.start_root("%s:RDF" % nsPrefixRDF, xmlns)
+            writers.append(w)
+
+        # (emitter, plan, defined) of each profile including a class.
+        profiles = {}
+        counts = [0] * len(sources)
+
+        for uuid, obj in list(d.items()):
+            klass = obj.__class__
+            try:
+                targets = profiles[klass]
+            except KeyError:
+                targets = profiles[klass] = _profile_plans(klass, writers,
+                        packageMaps, nsPrefix, nsCIM, indent)
+            for i, w, plan, defined in targets:
+                _write_object(w, plan, obj, not defined, defined)
+                counts[i] += 1
+
+        for w in writers:
+            w.end_root()
+    finally:
+        for fd in files:
+            fd.close()
+
+    logger.info("%d CIM objects serialised in %d profiles (%s) in %.2fs.",
+                len(d), len(sources), ", ".join([str(n) for n in counts]),
+                time() - t0)
+
+
+def _profile_plans(klass, writers, packageMaps, prefix, ns, indent):
+    """Returns the index, emitter, plan and whether the object is defined,
+    for each profile including the given class.
+    """
+    name = klass.__name__
+    targets = []
+    for i, (w, packageMap) in enumerate(zip(writers, packageMaps)):
+        if name not in packageMap:
+            continue
+        module = __import__(packageMap[name], globals(), locals(), [name], 0)
+        plan = get_write_plan(getattr(module, name), prefix, ns, indent)
+        targets.append((i, w, plan, not targets))
+    return targets
+
+
+def _write_object(w, plan, obj, about=False, keep=True):
+    """Writes the element of the given object following the given plan,
+    identified by rdf:about rather than rdf:ID if C{about} is true.  If
+    C{keep} is false, the element is omitted if it has no properties.
+    """
+    literal = w.literal
+    empty = w.empty
+
+    w.start_object(plan.about if about else plan.start, obj.UUID)
+
+    # Serialise attributes.
+    for attr, start, end, default, convert in plan.attributes:
+        val = getattr(obj, attr)
+        if val != default:
+            literal(start, convert(val), end)
+
+    # Serialise enumeration data-types.
+    for attr, start in plan.enums:
+        empty(start, str(getattr(obj, attr)))
+
+    # Serialise references from the side on which each association is
+    # written.
+    klass = obj.__class__
+    for role, attr, start in plan.refs:
+        val = getattr(obj, attr)
+        if val is not None:
+            written = _written.get((klass, role, val.__class__))
+            if written is None:
+                written = is_written(klass, role, val.__class__)
+            if written:
+                empty(start, val.UUID)
+
+    none = plan.empty
+    for role, attr, start in plan.many_refs:
+        vals = getattr(obj, attr)
+        if vals is none or not vals:
+            continue
+        for val in vals:
+            written = _written.get((klass, role, val.__class__))
+            if written is None:
+                written = is_written(klass, role, val.__class__)
+            if written:
+                empty(start, val.UUID)
+
+    w.end_object(plan.end, keep)
+
+
+# Whether references are written, keyed by (class, role, target class).
+_written = {}
+
+
+def is_written(klass, role, target_klass):
+    """Returns true if references of the given role of the given class to
+    objects of the given target class are written.  Each association is
+    written once, from one side: one-to-many associations from the side of
+    multiplicity one and other associations from the role whose qualified
+    name (e.g. 'IntervalBlock.IntervalReadings') sorts first.  Roles with
+    no inverse are written.
+    """
+    key = (klass, role, target_klass)
+    try:
+        return _written[key]
+    except KeyError:
+        pass
+
+    inverse = get_inverse_role(klass, role, target_klass)
+    if inverse is None:
+        written = True
+    else:
+        name, inverse_many = inverse
+        many = role in _many_refs(klass)
+        if many != inverse_many:
+            written = not many
+        else:
+            written = "%s.%s" % (_declaring(klass, role), role) <= \
+                    "%s.%s" % (_declaring(target_klass, name), name)
+
+    _written[key] = written
+    return written
+
+
+def _declaring(klass, role):
+    """Returns the name of the class declaring the given role.
+    """
+    for k in klass.__mro__:
+        if role in k.__dict__.get("_refs", ()):
+            return k.__name__
+    return klass.__name__
+
+
+def get_cim_ns(d):
+    """Returns the namespace URI and prefix of the CIM version of the
+    package (e.g. C{CIM14} for C{CIM14.ENTSOE.Equipment.Wires}) of the
+    objects in the given map.  Maps of no objects are written with the
+    CIM15 namespace.
+    """
+    packages = set([klass.__module__.split(".", 1)[0]
+                    for klass in set([obj.__class__ for obj in d.values()])])
+    if len(packages) > 1:
+        raise ValueError("Objects of more than one CIM version: %s" %
+                         ", ".join(sorted(packages)))
+    package = packages.pop() if packages else "CIM15"
+    cim = __import__(package, globals(), locals(), ["nsURI", "nsPrefix"], 0)
+    return cim.nsURI, cim.nsPrefix
+
+
+# Serialisation plans, keyed by (class, CIM namespace prefix, CIM namespace,
+# indentation).
+_write_plans = {}
+
+
+def get_write_plan(klass, prefix, ns, indent=None):
+    """Returns the serialisation plan for the given CIM class, namespace
+    prefix, namespace URI (with a '#' suffix) and indentation.  Plans are
+    compiled once and reused by subsequent calls.
+    """
+    key = (klass, prefix, ns, indent)
+    try:
+        return _write_plans[key]
+    except KeyError:
+        plan = _write_plans[key] = WritePlan(klass, prefix, ns, indent)
+        return plan
+
+
+class WritePlan(object):
+    """Markup, defaults and converters for the properties of a CIM class,
+    in the order in which they are serialised: attributes, then
+    enumerations, then references, of each class from the most general.
+    The markup is escaped and is followed by the values of the properties
+    of each object.  Indentation is included at the start of the markup of
+    each line.
+    """
+
+    def __init__(self, klass, prefix, ns, indent=None):
+        # Line breaks and indentation of objects and of properties.
+        if indent is None:
+            o = p = ""
+        else:
+            o, p = "\n" + indent, "\n" + indent * 2
+
+        tag = "%s:%s" % (prefix, klass.__name__)
+        #: Object element start, up to its rdf:ID value.
+        self.start = "%s<%s %s:ID=\"" % (o, tag, nsPrefixRDF)
+        #: Start of an element describing an object defined elsewhere, up
+        #: to the UUID of its rdf:about value.
+        self.about = "%s<%s %s:about=\"#" % (o, tag, nsPrefixRDF)
+        #: Object element end tag.
+        self.end = "%s</%s>" % (o, tag)
+        #: (attribute, start tag, end tag, default, converter) of the
+        #: attributes.
+        self.attributes = []
+        #: (attribute, element start up to the enumeration literal) of the
+        #: enumerations.
+        self.enums = []
+        #: (role, attribute, element start up to the referenced UUID) of
+        #: the references of multiplicity one.  The attribute is that
+        #: underlying the property of the role, if any.
+        self.refs = []
+        #: (role, attribute, element start up to the referenced UUID) of
+        #: the references of multiplicity many.
+        self.many_refs = []
+        #: Empty collection shared by the objects of the class with no
+        #: references of a role of multiplicity many, if any.
+        root = source_class(klass).__mro__[-2]
+        self.empty = getattr(sys.modules.get(root.__module__), "EMPTY", None)
+
+        resource = "%s:resource" % nsPrefixRDF
+
+        mro = klass.mro()
+        mro.reverse()
 
-    logger.info("%d CIM objects serialised in %.2fs.", len(d), time() - t0)
+        for k in mro[2:]: # skip 'object' and 'Element'
+            for attr in k._attrs:
+                tag = "%s:%s.%s" % (prefix, k.__name__, attr)
+                if attr in k._enums:
+                    self.enums.append((attr, "%s<%s %s=\"%s" % (p, tag,
+                            resource, escape_attrib("%s%s." %
+                                                    (ns, k._enums[attr])))))
+                else:
+                    self.attributes.append((attr, "%s<%s>" % (p, tag),
+                            "</%s>" % tag, k._defaults[attr], str))
+        for k in mro[2:]:
+            for ref in k._refs:
+                start = "%s<%s:%s.%s %s=\"#" % (p, prefix, k.__name__, ref,
+                                                resource)
+                if isinstance(k.__dict__.get(ref), property):
+                    attr = "_" + ref
+                else:
+                    attr = ref
+                if ref in k._many_refs:
+                    self.many_refs.append((ref, attr, start))
+                else:
+                    self.refs.append((ref, attr, start))
 
 
 if __name__ == "__main__":
     from .RDFXMLReader import cimread
     from .PrettyPrintXML import xmlpp
+    import sys
 
     logging.basicConfig(level=logging.INFO)
 
@@ -120,4 +640,4 @@ if __name__ == "__main__":
     tmp = "/tmp/cimwrite.xml"
     cimwrite(d, tmp)
 
-    print((xmlpp(tmp)))
+    xmlpp(tmp, sys.stdout)
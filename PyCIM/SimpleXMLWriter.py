@@ -98,7 +98,11 @@ except NameError:
     _escape = re.compile(r"[&<>\"\x80-\xff]+") # 1.5.2
 else:
     def encode(s, encoding):
-        return s.encode(encoding)
+        # The output stream is text, so check that the string can be
+        # represented in the encoding (to fall back to character
+        # references if not) but return it unencoded.
+        s.encode(encoding)
+        return s
     _escape = re.compile(eval(r'u"[&<>\"\u0080-\uffff]+"'))
 
 def encode_entity(text, pattern=_escape):
@@ -151,7 +155,7 @@ class XMLWriter:
 
     def __init__(self, file, encoding="us-ascii"):
         if not hasattr(file, "write"):
-            file = open(file, "w")
+            file = open(file, "w", encoding=encoding)
         self.__write = file.write
         if hasattr(file, "flush"):
             self.flush = file.flush
@@ -0,0 +1,349 @@
+# Copyright (C) 2010-2011 Richard Lincoln
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+"""Binary snapshots of CIM models.
+
+A snapshot holds a table of the classes of the objects, the objects of
+each class with their attributes packed in columns, and their references
+as arrays of integer object indexes (offsets and indexes for references
+of multiplicity many).  Objects are restored by writing their instance
+attributes directly, so no setters are called and, unlike pickling the
+linked objects, the depth of the model is not limited by the recursion
+limit.
+
+The table and columns are pickled, so loading a snapshot may run any code
+it contains: only load snapshots from trusted locations.
+"""
+
+import gc
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+
+from array import array
+from collections.abc import MutableSequence
+from time import time
+
+from PyCIM.Compact import is_compact, source_class, state
+
+import logging
+logger = logging.getLogger(__name__)
+
+#: Leading bytes of a snapshot file.
+MAGIC = b"PyCIMsnapshot"
+
+#: Version of the snapshot format.
+FORMAT_VERSION = 1
+
+# Kinds of column.
+LITERAL = 0
+PACKED = 1
+REFERENCE = 2
+MANY_REFERENCE = 3
+
+# Array type codes of the attribute types packed in arrays.
+_typecodes = {float: "d", int: "q", bool: "b"}
+
+
+def cimsave(d, dest):
+    """Writes a snapshot of the given map of UUID to CIM object.
+
+    @type d: dict
+    @param d: Map of UUID to CIM object.
+    @type dest: File-like object or a path to a file.
+    @param dest: Binary file to which the snapshot is written.
+    """
+    t0 = time()
+
+    # Objects grouped by class and instance attribute names.
+    groups = {}
+    for key, obj in d.items():
+        attrs = state(obj)
+        layout = (obj.__class__, tuple(attrs))
+        try:
+            groups[layout].append((key, attrs))
+        except KeyError:
+            groups[layout] = [(key, attrs)]
+
+    # Number the objects by group.
+    index = {}
+    for members in groups.values():
+        for key, _ in members:
+            index[id(d[key])] = len(index)
+    order = array("q", [index[id(obj)] for obj in d.values()])
+
+    classes = []
+    class_index = {}
+    tables = []
+    missing = [0]
+    for (klass, names), members in groups.items():
+        if klass not in class_index:
+            class_index[klass] = len(classes)
+            classes.append((klass.__module__, klass.__name__))
+        columns = [_pack([attrs[name] for _, attrs in members], index,
+                         missing) for name in names]
+        tables.append((class_index[klass], [key for key, _ in members],
+                       names, columns))
+
+    if missing[0]:
+        logger.warning("%d references to objects not in the model dropped.",
+                       missing[0])
+
+    snapshot = {"version": FORMAT_VERSION, "classes": classes,
+                "tables": tables, "order": order.tobytes()}
+
+    if isinstance(dest, str):
+        with open(dest, "wb") as fd:
+            _dump(snapshot, fd)
+    else:
+        _dump(snapshot, dest)
+
+    logger.info("%d CIM objects saved in %.2fs.", len(d), time() - t0)
+
+
+def cimload(source):
+    """Reads a snapshot written by L{cimsave}.  Snapshots are pickles, so
+    untrusted snapshots must not be read.
+
+    @type source: File-like object or a path to a file.
+    @param source: Binary snapshot file.
+    @rtype: dict
+    @return: Map of UUID to CIM object.
+    """
+    t0 = time()
+
+    # The objects are all reachable from the map returned, so the cyclic
+    # garbage collector need not scan them as they are created.
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        if isinstance(source, str):
+            with open(source, "rb") as fd:
+                d = _restore(_load(fd))
+        else:
+            d = _restore(_load(source))
+    finally:
+        if enabled:
+            gc.enable()
+
+    logger.info("%d CIM objects loaded in %.2fs.", len(d), time() - t0)
+
+    return d
+
+
+def _restore(snapshot):
+    """Returns the map of UUID to CIM object of the given snapshot.
+    """
+    classes = []
+    for module, name in snapshot["classes"]:
+        classes.append(getattr(__import__(module, globals(), locals(),
+                                          [name], 0), name))
+
+    # Create every object before restoring references.
+    objs = []
+    keys = []
+    for ci, table_keys, _, _ in snapshot["tables"]:
+        klass = classes[ci]
+        new = klass.__new__
+        objs.extend([new(klass) for _ in table_keys])
+        keys.extend(table_keys)
+
+    start = 0
+    for ci, table_keys, names, columns in snapshot["tables"]:
+        end = start + len(table_keys)
+        association, empty = _association_types(classes[ci])
+        values = [_unpack(column, objs, association, empty)
+                  for column in columns]
+        if is_compact(classes[ci]):
+            # Compact objects hold their attributes in slots.
+            for obj, row in zip(objs[start:end], zip(*values)):
+                for name, value in zip(names, row):
+                    setattr(obj, name, value)
+        elif values:
+            for obj, row in zip(objs[start:end], zip(*values)):
+                obj.__dict__ = dict(zip(names, row))
+        else:
+            for obj in objs[start:end]:
+                obj.__dict__ = {}
+        start = end
+
+    order = array("q")
+    order.frombytes(snapshot["order"])
+    return dict([(keys[i], objs[i]) for i in order])
+
+
+def _dump(snapshot, fd):
+    fd.write(MAGIC)
+    pickle.dump(snapshot, fd, pickle.HIGHEST_PROTOCOL)
+
+
+def _load(fd):
+    if fd.read(len(MAGIC)) != MAGIC:
+        raise ValueError("Not a PyCIM snapshot.")
+    snapshot = pickle.load(fd)
+    if snapshot.get("version") != FORMAT_VERSION:
+        raise ValueError("Unsupported snapshot version: %s" %
+                         snapshot.get("version"))
+    return snapshot
+
+
+def _is_cim(value):
+    return hasattr(value.__class__, "_many_refs")
+
+
+def _pack(values, index, missing):
+    """Returns a column of the given values of an attribute.
+    """
+    kinds = set()
+    for v in values:
+        if v is None:
+            continue
+        elif isinstance(v, MutableSequence):
+            if all([_is_cim(x) for x in v]):
+                kinds.add(MANY_REFERENCE)
+            else:
+                kinds.add(LITERAL)
+        elif _is_cim(v):
+            kinds.add(REFERENCE)
+        else:
+            kinds.add(v.__class__)
+
+    if kinds == set([REFERENCE]):
+        indexes = array("q")
+        for v in values:
+            i = index.get(id(v), -1) if v is not None else -1
+            if i < 0 and v is not None:
+                missing[0] += 1
+            indexes.append(i)
+        return (REFERENCE, indexes.tobytes())
+
+    if kinds == set([MANY_REFERENCE]) and None not in values:
+        offsets = array("q", [0])
+        indexes = array("q")
+        for v in values:
+            for x in v:
+                i = index.get(id(x))
+                if i is None:
+                    missing[0] += 1
+                else:
+                    indexes.append(i)
+            offsets.append(len(indexes))
+        return (MANY_REFERENCE, (offsets.tobytes(), indexes.tobytes()))
+
+    if len(kinds) == 1 and None not in values:
+        typecode = _typecodes.get(kinds.pop())
+        if typecode is not None:
+            try:
+                return (PACKED, (typecode, array(typecode, values).tobytes()))
+            except OverflowError:
+                pass
+
+    if kinds & set([REFERENCE, MANY_REFERENCE]):
+        raise ValueError("Attribute with mixed CIM object and literal "
+                         "values: %r" % values[:10])
+
+    return (LITERAL, values)
+
+
+def _association_types(klass):
+    """Returns the collection of the objects of many-associations of the
+    given class and the shared empty collection, defined in the module of
+    its root class, or C{None} for each if not defined.  Those of compact
+    variants are the types of the classes from which they are generated.
+    """
+    root = source_class(klass).__mro__[-2]
+    module = sys.modules.get(root.__module__)
+    return getattr(module, "AssociationList", None), \
+            getattr(module, "EMPTY", None)
+
+
+def _unpack(column, objs, association=None, empty=None):
+    """Returns the values of the given column, resolving object indexes in
+    the given list of objects.  References of multiplicity many are held in
+    the given collection type (a list by default) and empty ones are the
+    given shared empty collection, if any.
+    """
+    kind, payload = column
+    if kind == LITERAL:
+        return payload
+    elif kind == PACKED:
+        typecode, data = payload
+        values = array(typecode)
+        values.frombytes(data)
+        if typecode == "b":
+            return [bool(v) for v in values]
+        return values.tolist()
+    elif kind == REFERENCE:
+        indexes = array("q")
+        indexes.frombytes(payload)
+        return [objs[i] if i >= 0 else None for i in indexes]
+    else:
+        offsets = array("q")
+        offsets.frombytes(payload[0])
+        indexes = array("q")
+        indexes.frombytes(payload[1])
+        targets = [objs[i] for i in indexes]
+        values = [targets[offsets[j]:offsets[j + 1]]
+                  for j in range(len(offsets) - 1)]
+        if association is not None:
+            values = [association(v) if v or empty is None else empty
+                      for v in values]
+        elif empty is not None:
+            values = [v if v else empty for v in values]
+        return values
+
+
+def cache_path(cache, source, packageMap=None, nsURI=None):
+    """Returns the path of the snapshot of the given CIM RDF/XML file in
+    the given cache directory.  The name of the snapshot is a hash of the
+    content of the file, the CIM namespace and package map with which it is
+    read and the versions of PyCIM and of the snapshot format.
+    """
+    from PyCIM import __version__
+
+    h = hashlib.sha1()
+    with open(source, "rb") as fd:
+        block = fd.read(1 << 20)
+        while block:
+            h.update(block)
+            block = fd.read(1 << 20)
+    h.update(repr((__version__, FORMAT_VERSION, nsURI)).encode())
+    if packageMap is not None:
+        h.update(repr(sorted(packageMap.items())).encode())
+    return os.path.join(cache, h.hexdigest() + ".snapshot")
+
+
+def save_cached(d, path):
+    """Writes a snapshot of the given model to the given cache path,
+    replacing any existing file atomically.
+    """
+    dirname = os.path.dirname(path)
+    if not os.path.isdir(dirname):
+        os.makedirs(dirname)
+    fd, tmp = tempfile.mkstemp(dir=dirname, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            cimsave(d, f)
+        os.replace(tmp, path)
+    except Exception:
+        os.remove(tmp)
+        raise
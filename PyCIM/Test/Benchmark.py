@@ -0,0 +1,332 @@
+# Copyright (C) 2010-2011 Richard Lincoln
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+"""Reader and writer benchmarks.  Run with:
+
+    python -m PyCIM.Test.Benchmark
+"""
+
+import gc
+import io
+import os
+import re
+import tempfile
+import tracemalloc
+
+from os.path import dirname, join
+from timeit import repeat
+from xml.etree.cElementTree import iterparse
+
+from PyCIM import cimsave, cimload, cimwrite, cimwrite_profiles
+from PyCIM.RDFXMLReader import cimread, cimread_many, get_class_table, \
+    split_rdfxml
+
+from CIM15 import nsURI as nsURICIM15, packageMap as packageMapCIM15
+from CIM15.Compact import packageMap as compactMapCIM15
+from CIM15.CDPSM.Asset import packageMap as assetMap
+from CIM15.CDPSM.Connectivity import packageMap as connMap
+from CIM15.CDPSM.Balanced import packageMap as equipMap
+from CIM15.CDPSM.Geographical import packageMap as geoMap
+
+
+RDFXML_FILE = join(dirname(__file__), "Data", "EDF_AIGUE_v9_COMBINED.xml")
+
+PROFILE_FILES = [join(dirname(__file__), "Data", "EDF_AIGUE_v9_%s.xml" % p)
+                 for p in ("ASSET", "CONN", "EQUIP", "GEO")]
+PROFILE_MAPS = [assetMap, connMap, equipMap, geoMap]
+
+#: Best of three seconds taken to read the combined file enlarged 20 times
+#: by the original two-pass reader (iterparse for the objects, then again
+#: for their references) and, on the same machine, by the single-pass
+#: reader.  The two-pass reader is no longer in the tree to be measured.
+TWO_PASS_SECONDS = 6.7
+SINGLE_PASS_SECONDS = 3.3
+
+
+def bench(label, func, number=1, times=5):
+    """Prints the best time per call of C{func} over C{times} runs.
+    """
+    t = min(repeat(func, number=number, repeat=times)) / number
+    print("%-50s %9.4fs" % (label, t))
+    return t
+
+
+def bench_class_resolution(source=RDFXML_FILE):
+    """Compares per-element class import with the cached class table.
+    """
+    base = "{%s#}" % nsURICIM15
+    m = len(base)
+    tags = [elem.tag for _, elem in iterparse(source)
+            if elem.tag[:m] == base and "." not in elem.tag[m:]]
+    packageMap = packageMapCIM15
+
+    def imported():
+        for tag in tags:
+            name = tag[m:]
+            if name in packageMap:
+                module = __import__(packageMap[name], globals(), locals(),
+                                    [name], 0)
+                getattr(module, name)
+
+    def table():
+        classes = get_class_table(packageMap, nsURICIM15)
+        for tag in tags:
+            classes[tag]
+
+    print("Class resolution (%d elements):" % len(tags))
+    t1 = bench("  __import__ per element", imported)
+    t2 = bench("  class table", table)
+    print("  speedup: %.1fx" % (t1 / t2))
+
+
+def bench_cimread(source=RDFXML_FILE):
+    """Times reading the given file.
+    """
+    print("cimread:")
+    bench("  %s" % source.rsplit("/", 1)[-1], lambda: cimread(source))
+    bench("  %s (bulk)" % source.rsplit("/", 1)[-1],
+          lambda: cimread(source, bulk=True))
+
+
+def bench_cimwrite(source=RDFXML_FILE):
+    """Times writing the model read from the given file.
+    """
+    d = cimread(source)
+    print("cimwrite:")
+    bench("  %s (%d objects)" % (source.rsplit("/", 1)[-1], len(d)),
+          lambda: cimwrite(d, io.BytesIO()))
+
+
+def bench_bulk_binding(n=20000):
+    """Times reading a ConnectivityNode with C{n} Terminals.
+    """
+    lines = ["<?xml version='1.0'?>",
+             '<rdf:RDF xmlns:cim="%s#" xmlns:rdf="%s">' %
+             (nsURICIM15, "http://www.w3.org/1999/02/22-rdf-syntax-ns#"),
+             '<cim:ConnectivityNode rdf:ID="CN"/>']
+    for i in range(n):
+        lines.append('<cim:Terminal rdf:ID="T%d"><cim:Terminal.'
+                     'ConnectivityNode rdf:resource="#CN"/></cim:Terminal>' % i)
+    lines.append("</rdf:RDF>")
+    data = "\n".join(lines)
+
+    print("Binding %d Terminals to one ConnectivityNode:" % n)
+    t1 = bench("  property setters", lambda: cimread(io.StringIO(data)),
+               times=1)
+    t2 = bench("  bulk", lambda: cimread(io.StringIO(data), bulk=True),
+               times=1)
+    print("  speedup: %.1fx" % (t1 / t2))
+
+
+def bench_cimread_many(sources=PROFILE_FILES, packageMaps=PROFILE_MAPS):
+    """Compares reading profile files in turn with reading them in parallel.
+    """
+    def sequential():
+        d = {}
+        for source, packageMap in zip(sources, packageMaps):
+            d.update(cimread(source, packageMap, nsURICIM15))
+
+    print("Reading %d profile files:" % len(sources))
+    t1 = bench("  cimread in turn", sequential)
+    t2 = bench("  cimread_many", lambda: cimread_many(sources, packageMaps,
+                                                      nsURICIM15))
+    print("  speedup: %.1fx" % (t1 / t2))
+
+
+def bench_cimwrite_profiles(source=RDFXML_FILE, packageMaps=PROFILE_MAPS):
+    """Compares writing each profile in turn with writing them in a single
+    pass.
+    """
+    d = cimread(source)
+
+    def sequential():
+        for packageMap in packageMaps:
+            cimwrite(d, io.BytesIO(), packageMap=packageMap)
+
+    print("Writing %d profile files:" % len(packageMaps))
+    t1 = bench("  cimwrite in turn", sequential)
+    t2 = bench("  cimwrite_profiles", lambda: cimwrite_profiles(d,
+            [io.BytesIO() for _ in packageMaps], packageMaps))
+    print("  speedup: %.1fx" % (t1 / t2))
+
+
+def enlarge(source, n, dest):
+    """Writes C{n} copies of the objects in C{source} to C{dest}, with the
+    UUIDs of each copy given a different suffix.
+    """
+    header, footer, [(start, end)] = split_rdfxml(source, 1)
+    with open(source, "rb") as fd:
+        fd.seek(start)
+        body = fd.read(end - start)
+    uuid = re.compile(br'(rdf:(?:ID|about|resource)="#?)([^"]+)"')
+    with open(dest, "wb") as fd:
+        fd.write(header)
+        for i in range(n):
+            suffix = ("-%d\"" % i).encode()
+            fd.write(uuid.sub(lambda m: m.group(1) + m.group(2) + suffix
+                              if not m.group(2).startswith(b"http")
+                              else m.group(0), body))
+        fd.write(footer)
+
+
+def bench_chunks(source=RDFXML_FILE, n=20, processes=None):
+    """Compares reading a file enlarged C{n} times in this process with
+    reading it in chunks in parallel.  Both use the current single-pass
+    reader, so the speedup is that of the parallel chunks alone.  The time
+    of the original two-pass reader is estimated from the ratio of the
+    timings recorded in L{TWO_PASS_SECONDS} and L{SINGLE_PASS_SECONDS}.
+    """
+    processes = processes or os.cpu_count()
+    fd, path = tempfile.mkstemp(suffix=".xml")
+    os.close(fd)
+    try:
+        enlarge(source, n, path)
+        print("Reading %s enlarged %d times (%.1f MB) with %d processes:" %
+              (source.rsplit("/", 1)[-1], n, os.path.getsize(path) / 1e6,
+               processes))
+        t1 = bench("  cimread in one process (single pass)",
+                   lambda: cimread(path), times=1)
+        t2 = bench("  cimread in chunks (%d processes)" % processes,
+                   lambda: cimread(path, processes=processes), times=1)
+        print("  speedup over one process: %.1fx" % (t1 / t2))
+        t0 = t1 * TWO_PASS_SECONDS / SINGLE_PASS_SECONDS
+        print("%-50s %9.4fs" % ("  two-pass reader (estimated, not run)", t0))
+        print("  speedup over the two-pass reader: %.1fx (recorded %.1fs "
+              "two-pass and %.1fs single-pass at n=20)" %
+              (t0 / t2, TWO_PASS_SECONDS, SINGLE_PASS_SECONDS))
+    finally:
+        os.remove(path)
+
+
+def bench_parallel_cimwrite(source=RDFXML_FILE, n=20, processes=None):
+    """Compares writing a model enlarged C{n} times in this process with
+    writing it in shards in parallel.
+    """
+    processes = processes or os.cpu_count()
+    fd, path = tempfile.mkstemp(suffix=".xml")
+    os.close(fd)
+    try:
+        enlarge(source, n, path)
+        d = cimread(path)
+    finally:
+        os.remove(path)
+    print("Writing %d objects with %d processes:" % (len(d), processes))
+    t1 = bench("  cimwrite", lambda: cimwrite(d, io.BytesIO()), times=3)
+    t2 = bench("  cimwrite in shards", lambda: cimwrite(d, io.BytesIO(),
+               processes=processes), times=3)
+    print("  speedup: %.1fx" % (t1 / t2))
+
+
+def bench_snapshot(source=RDFXML_FILE, n=20):
+    """Compares reading a file, and the file enlarged C{n} times, with
+    loading their snapshots.
+    """
+    fd, path = tempfile.mkstemp(suffix=".xml")
+    os.close(fd)
+    try:
+        enlarge(source, n, path)
+        for label, xml in ((source.rsplit("/", 1)[-1], source),
+                           ("enlarged %d times" % n, path)):
+            snapshot = io.BytesIO()
+            cimsave(cimread(xml), snapshot)
+
+            def load():
+                snapshot.seek(0)
+                cimload(snapshot)
+
+            print("Snapshot of %s (%.1f MB):" %
+                  (label, len(snapshot.getvalue()) / 1e6))
+            t1 = bench("  cimread", lambda: cimread(xml), times=3)
+            t2 = bench("  cimload", load, times=3)
+            print("  speedup: %.1fx" % (t1 / t2))
+    finally:
+        os.remove(path)
+
+
+def bench_construction(n=20000):
+    """Times constructing C{n} Terminals and ConnectivityNodes.
+    """
+    from CIM15.IEC61970.Core import ConnectivityNode, Terminal
+    print("Constructing %d objects:" % n)
+    bench("  Terminal", lambda: [Terminal() for _ in range(n)])
+    bench("  ConnectivityNode", lambda: [ConnectivityNode() for _ in range(n)])
+
+
+def bench_rehoming(n=20000):
+    """Times moving C{n} Terminals from one ConnectivityNode to another.
+    """
+    from CIM15.IEC61970.Core import ConnectivityNode, Terminal
+    terminals = [Terminal() for _ in range(n)]
+    nodes = [ConnectivityNode(Terminals=terminals), ConnectivityNode()]
+
+    def move():
+        node = nodes[0] if terminals[0].ConnectivityNode is nodes[1] \
+                else nodes[1]
+        for t in terminals:
+            t.ConnectivityNode = node
+
+    print("Moving %d Terminals to another ConnectivityNode:" % n)
+    bench("  property setters", move, times=3)
+
+
+def bench_memory(source=RDFXML_FILE, n=20):
+    """Compares the memory held by the model read from a file enlarged
+    C{n} times with the CIM classes and with their compact variants.
+    """
+    fd, path = tempfile.mkstemp(suffix=".xml")
+    os.close(fd)
+    try:
+        enlarge(source, n, path)
+        print("Memory of %s enlarged %d times:" % (source.rsplit("/", 1)[-1],
+                                                   n))
+        sizes = []
+        for label, packageMap in (("CIM15", packageMapCIM15),
+                                  ("CIM15.Compact", compactMapCIM15)):
+            # Read once so that the classes are imported beforehand.
+            cimread(source, packageMap, nsURICIM15)
+            gc.collect()
+            tracemalloc.start()
+            try:
+                d = cimread(path, packageMap, nsURICIM15)
+                size = tracemalloc.get_traced_memory()[0]
+            finally:
+                tracemalloc.stop()
+            sizes.append(size)
+            print("  %-48s %7.1f MB (%d bytes/object)" %
+                  (label, size / 1e6, size // len(d)))
+            del d
+        print("  saving: %.0f%%" % (100.0 * (1 - sizes[1] / sizes[0])))
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    bench_class_resolution()
+    bench_cimread()
+    bench_cimwrite()
+    bench_bulk_binding()
+    bench_cimread_many()
+    bench_cimwrite_profiles()
+    bench_chunks()
+    bench_parallel_cimwrite()
+    bench_snapshot()
+    bench_construction()
+    bench_rehoming()
+    bench_memory()
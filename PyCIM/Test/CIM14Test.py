@@ -20,6 +20,8 @@
 
 import unittest
 
+from CIM14.Element import AssociationList
+
 from CIM14.IEC61970.Core import \
     ConnectivityNode, Terminal
 
@@ -30,7 +32,7 @@ from CIM14.IEC61970.Meas import \
     AnalogLimit, AnalogValue, Analog
 
 from CIM14.IEC61970.Protection import \
-    SurgeProtector, CurrentRelay
+    SurgeProtector, CurrentRelay, ProtectionEquipment
 
 from CIM14.IEC61970.Topology import \
     TopologicalNode
@@ -159,5 +161,28 @@ class CIMTestCase(unittest.TestCase):
         self.assertEqual(tw3.PowerTransformer, None)
 
 
+    def testUnidirectional(self):
+        """Test many references with no inverse.
+        """
+        pe1 = ProtectionEquipment()
+        pe2 = ProtectionEquipment()
+        self.assertEqual(pe1.ProtectedSwitches, [])
+        self.assertTrue(pe1.ProtectedSwitches is pe2.ProtectedSwitches)
+        self.assertTrue(ProtectionEquipment(ProtectedSwitches=[])
+                        .ProtectedSwitches is pe1.ProtectedSwitches)
+
+        b1 = Breaker()
+        b2 = Breaker()
+        pe1.add_ProtectedSwitches(b1, b2, b1)
+
+        self.assertTrue(isinstance(pe1.ProtectedSwitches, AssociationList))
+        self.assertEqual(pe1.ProtectedSwitches, [b1, b2])
+        self.assertEqual(pe2.ProtectedSwitches, [])
+
+        pe1.remove_ProtectedSwitches(b1)
+
+        self.assertEqual(pe1.ProtectedSwitches, [b2])
+
+
 if __name__ == "__main__":
     unittest.main()
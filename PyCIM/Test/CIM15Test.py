@@ -22,6 +22,10 @@ import unittest
 
 import pytest
 
+from CIM15.Element import AssociationList
+
+from CIM15.IEC61968.Metering import IntervalBlock, IntervalReading
+
 from CIM15.IEC61970.Core import \
     ConnectivityNode, Terminal, BaseVoltage
 
@@ -222,6 +226,132 @@ class CIMTestCase(unittest.TestCase):
         self.assertEqual(te3.PowerTransformer, None)
 
 
+    def testEmptyMany(self):
+        """Test the shared empty list of many-associations.
+        """
+        cn1 = ConnectivityNode()
+        cn2 = ConnectivityNode()
+
+        self.assertEqual(cn1.Terminals, [])
+        self.assertTrue(cn1.Terminals is cn2.Terminals)
+        self.assertRaises(TypeError, cn1.Terminals.append, Terminal())
+        self.assertRaises(AttributeError, setattr, cn1.Terminals, "x", 1)
+
+        t1 = Terminal(ConnectivityNode=cn1)
+        self.assertEqual(cn1.Terminals, [t1])
+        self.assertEqual(cn2.Terminals, [])
+
+        t2 = Terminal()
+        cn2.addTerminals(t2)
+        cn2.removeTerminals(t2)
+        self.assertEqual(cn2.Terminals, [])
+        self.assertEqual(t2.ConnectivityNode, None)
+
+        cn4 = ConnectivityNode()
+        cn4.Terminals += [t2]
+        self.assertEqual(cn4.Terminals, [t2])
+        self.assertEqual(t2.ConnectivityNode, cn4)
+        self.assertEqual(cn2.Terminals, [])
+
+        # Lists given are copied.
+        terminals = []
+        cn3 = ConnectivityNode(Terminals=terminals)
+        t3 = Terminal(ConnectivityNode=cn3)
+        self.assertEqual(cn3.Terminals, [t3])
+        self.assertEqual(terminals, [])
+
+        # Setting no objects keeps the shared list.
+        empty = ConnectivityNode().Terminals
+        cn3.Terminals = []
+        self.assertTrue(cn3.Terminals is empty)
+        self.assertEqual(t3.ConnectivityNode, None)
+        self.assertTrue(ConnectivityNode(Terminals=[]).Terminals is empty)
+
+
+    def testEmptyManyProfiles(self):
+        """Test links between objects of the combined model and a profile.
+        """
+        from CIM15.CDPSM.Connectivity.IEC61970.Core import \
+            ConnectivityNode as ProfileConnectivityNode, \
+            Terminal as ProfileTerminal
+
+        cn = ProfileConnectivityNode()
+        self.assertTrue(cn.Terminals is ConnectivityNode().Terminals)
+        t1 = Terminal(ConnectivityNode=cn)
+        self.assertEqual(cn.Terminals, [t1])
+
+        cn = ConnectivityNode()
+        t2 = ProfileTerminal()
+        cn.addTerminals(t2)
+        self.assertEqual(cn.Terminals, [t2])
+        self.assertTrue(t2.ConnectivityNode is cn)
+        self.assertTrue(isinstance(cn.Terminals, AssociationList))
+        self.assertTrue(isinstance(ProfileConnectivityNode(Terminals=[t1])
+                                   .Terminals, AssociationList))
+
+
+    def testAssociationList(self):
+        """Test the collections of many-associations.
+        """
+        cn = ConnectivityNode()
+        terminals = [Terminal(UUID="T%d" % i) for i in range(5)]
+        cn.Terminals = terminals
+        self.assertTrue(isinstance(cn.Terminals, AssociationList))
+        self.assertEqual(cn.Terminals, terminals)
+        self.assertEqual(cn.Terminals[1], terminals[1])
+        self.assertEqual(cn.Terminals[-2:], terminals[-2:])
+        self.assertEqual(list(reversed(cn.Terminals)), terminals[::-1])
+        self.assertEqual(cn.Terminals.index(terminals[3]), 3)
+        self.assertTrue(terminals[2] in cn.Terminals)
+
+        cn.removeTerminals(terminals[2])
+        self.assertFalse(terminals[2] in cn.Terminals)
+        self.assertEqual(cn.Terminals, terminals[:2] + terminals[3:])
+        self.assertRaises(ValueError, cn.Terminals.remove, terminals[2])
+
+        # Objects are held once, in the order last added.
+        cn.addTerminals(terminals[2], terminals[0])
+        self.assertEqual([t.UUID for t in cn.Terminals],
+                         ["T1", "T3", "T4", "T2", "T0"])
+        cn.Terminals.add(terminals[1])
+        self.assertEqual(len(cn.Terminals), 5)
+
+        # Objects may be removed while iterating.
+        for t in cn.Terminals:
+            t.ConnectivityNode = None
+        self.assertEqual(cn.Terminals, [])
+        self.assertEqual(terminals[0].ConnectivityNode, None)
+
+        # Setting the collection held keeps its objects.
+        cn.Terminals = terminals
+        cn.Terminals = cn.Terminals
+        self.assertEqual(cn.Terminals, terminals)
+        self.assertTrue(terminals[4].ConnectivityNode is cn)
+
+        # Large associations are indexed.
+        terminals = [Terminal(UUID="T%d" % i) for i in range(20)]
+        cn.Terminals = terminals
+        for t in terminals[::2]:
+            t.ConnectivityNode = None
+        self.assertEqual(cn.Terminals, terminals[1::2])
+        self.assertEqual(cn.Terminals[3], terminals[7])
+        self.assertFalse(terminals[0] in cn.Terminals)
+        self.assertTrue(terminals[1] in cn.Terminals)
+        cn.Terminals.sort(key=lambda t: t.UUID)
+        self.assertEqual(cn.Terminals.index(terminals[11]), 1)
+
+        # Many-to-many associations.
+        block = IntervalBlock()
+        readings = [IntervalReading(), IntervalReading()]
+        block.IntervalReadings = readings
+        self.assertEqual(readings[0].IntervalBlocks, [block])
+        block.IntervalReadings = readings[1:]
+        self.assertEqual(readings[0].IntervalBlocks, [])
+        block.removeIntervalReadings(readings[1])
+        self.assertEqual(block.IntervalReadings, [])
+        self.assertEqual(readings[1].IntervalBlocks, [])
+
+
 #    def testManyToMany(self):
 #        """Test many-to-many bidirectional references.
 #        """
@@ -0,0 +1,157 @@
+# Copyright (C) 2010-2011 Richard Lincoln
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+import pickle
+import subprocess
+import sys
+import unittest
+
+from io import BytesIO
+from os.path import dirname, join
+
+from PyCIM import cimread, cimwrite, cimsave, cimload
+from PyCIM.LazyModel import LazyModel
+from PyCIM.RDFXMLWriter import get_write_plan
+
+import CIM14
+import CIM15
+import CIM14.Compact
+import CIM15.Compact
+
+from CIM15.Element import EMPTY
+from CIM15.Compact.IEC61970.Core import ConnectivityNode, Terminal
+from CIM15.Compact.IEC61970.Wires import ACLineSegment
+
+
+RDFXML_FILE = join(dirname(__file__), "Data", "EDF_AIGUE_v9_COMBINED.xml")
+
+CIM14_FILE = join(dirname(__file__), "Data", "EDF_AIGUE_v9.xml")
+
+# Pickles an instance of a CIM class before its compact variant is generated.
+PICKLE_ORDER = """
+import pickle
+import PyCIM
+from CIM15.IEC61970.Wires import Breaker
+pickle.dumps(Breaker(UUID="B1"))
+from CIM15.Compact.IEC61970.Wires import Breaker
+print(pickle.loads(pickle.dumps(Breaker(UUID="B2"))).UUID)
+"""
+
+
+class CompactTestCase(unittest.TestCase):
+    """Test the compact variants of the CIM classes.
+    """
+
+    def testClasses(self):
+        t = Terminal(UUID="T", name="T", connected=True)
+        self.assertFalse(hasattr(t, "__dict__"))
+        self.assertEqual(t.__module__, "CIM15.Compact.IEC61970.Core.Terminal")
+        self.assertEqual(Terminal._attrs, CIM15.IEC61970.Core.Terminal._attrs)
+        self.assertEqual(t.sequenceNumber, 0)
+        self.assertTrue(t.connected)
+
+        n = ConnectivityNode(UUID="CN")
+        t.ConnectivityNode = n
+        self.assertEqual(n.Terminals, [t])
+        line = ACLineSegment(UUID="L", Terminals=[t])
+        self.assertTrue(t.ConductingEquipment is line)
+        n.removeTerminals(t)
+        self.assertTrue(t.ConnectivityNode is None)
+
+        self.assertRaises(AttributeError, setattr, t, "undefined", 1)
+
+    def testPickle(self):
+        n = ConnectivityNode(UUID="CN")
+        t = Terminal(UUID="T", ConnectivityNode=n)
+        loaded = pickle.loads(pickle.dumps(t))
+        self.assertEqual(loaded.UUID, "T")
+        self.assertEqual(loaded.ConnectivityNode.Terminals, [loaded])
+
+        # Slot names cached on a class by copyreg are not copied to its
+        # compact variant.
+        root = dirname(dirname(dirname(__file__)))
+        output = subprocess.check_output([sys.executable, "-c", PICKLE_ORDER],
+                                         cwd=root)
+        self.assertEqual(output.strip(), b"B2")
+
+    def testReadWrite(self):
+        d = cimread(RDFXML_FILE)
+        compact = cimread(RDFXML_FILE, CIM15.Compact.packageMap, CIM15.nsURI)
+        self.assertEqual(len(compact), len(d))
+        for obj in compact.values():
+            self.assertFalse(hasattr(obj, "__dict__"))
+
+        expected = BytesIO()
+        cimwrite(d, expected)
+        output = BytesIO()
+        cimwrite(compact, output)
+        self.assertEqual(output.getvalue(), expected.getvalue())
+        plan = get_write_plan(Terminal, "cim", CIM15.nsURI + "#")
+        self.assertTrue(plan.empty is EMPTY)
+
+        output.seek(0)
+        d = cimread(output, CIM15.Compact.packageMap, CIM15.nsURI)
+        self.assertEqual(len(d), len(compact))
+
+    def testCIM14(self):
+        d = cimread(CIM14_FILE)
+        compact = cimread(CIM14_FILE, CIM14.Compact.packageMap, CIM14.nsURI)
+        expected = BytesIO()
+        cimwrite(d, expected)
+        output = BytesIO()
+        cimwrite(compact, output)
+        self.assertEqual(output.getvalue(), expected.getvalue())
+
+    def testSnapshot(self):
+        d = cimread(RDFXML_FILE, CIM15.Compact.packageMap, CIM15.nsURI)
+        snapshot = BytesIO()
+        cimsave(d, snapshot)
+        snapshot.seek(0)
+        loaded = cimload(snapshot)
+
+        expected = BytesIO()
+        cimwrite(d, expected)
+        output = BytesIO()
+        cimwrite(loaded, output)
+        self.assertEqual(output.getvalue(), expected.getvalue())
+
+        # Associations of the objects loaded can be changed.
+        t = [o for o in loaded.values() if isinstance(o, Terminal) and
+             o.ConnectivityNode is not None][0]
+        n = t.ConnectivityNode
+        t.ConnectivityNode = None
+        self.assertFalse(t in n.Terminals)
+        t.ConnectivityNode = n
+        self.assertTrue(t in n.Terminals)
+        line = ACLineSegment(UUID="L")
+        line.addTerminals(t)
+        self.assertTrue(t.ConductingEquipment is line)
+        self.assertEqual(line.Terminals, [t])
+
+    def testLazyModel(self):
+        d = cimread(RDFXML_FILE)
+        with LazyModel(RDFXML_FILE, CIM15.Compact.packageMap, CIM15.nsURI,
+                       index=False) as m:
+            for uuid in list(d)[:100]:
+                self.assertEqual(m[uuid].__class__.__name__,
+                                 d[uuid].__class__.__name__)
+
+
+if __name__ == "__main__":
+    unittest.main()
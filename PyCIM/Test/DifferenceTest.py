@@ -0,0 +1,92 @@
+# Copyright (C) 2010-2011 Richard Lincoln
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+import unittest
+
+from io import BytesIO
+from os.path import dirname, join
+
+from PyCIM import cimread, cimdiff, cimapply
+
+from CIM15.IEC61970.Core import ConnectivityNode
+from CIM15.IEC61968.Metering import IntervalBlock, IntervalReading
+
+
+RDFXML_FILE = join(dirname(__file__), "Data", "EDF_AIGUE_v9_COMBINED.xml")
+
+
+class DifferenceTestCase(unittest.TestCase):
+    """Test CIM difference model writing.
+    """
+
+    def testDiff(self):
+        old = cimread(RDFXML_FILE)
+        new = cimread(RDFXML_FILE)
+
+        output = BytesIO()
+        self.assertEqual(cimdiff(old, new, output), ([], [], []))
+
+        # Change an attribute, move a terminal to a new node, delete a
+        # terminal and add objects linked many-to-many.
+        switch = new["_6f94a32bd824316b7bdcdec1eac845"]
+        switch.normalOpen = not switch.normalOpen
+        node = ConnectivityNode(UUID="CN_NEW", name="New")
+        new[node.UUID] = node
+        terminal = new["_231f6ae8cc734032ba442db6ee09333"]
+        terminal.ConnectivityNode = node
+        deleted = new.pop("_b3c32d09e5ed43d88697187ba8e13983")
+        deleted.ConductingEquipment = None
+        deleted.ConnectivityNode = None
+        block = IntervalBlock(UUID="IB")
+        reading = IntervalReading(UUID="IR", value=1.5)
+        block.addIntervalReadings(reading)
+        new[block.UUID] = block
+        new[reading.UUID] = reading
+
+        output = BytesIO()
+        diff = cimdiff(old, new, output, uuid="DM")
+        self.assertEqual(sorted(diff.added), ["CN_NEW", "IB", "IR"])
+        self.assertEqual(diff.deleted, ["_b3c32d09e5ed43d88697187ba8e13983"])
+        self.assertEqual(sorted(diff.changed),
+                         ["_231f6ae8cc734032ba442db6ee09333",
+                          "_6f94a32bd824316b7bdcdec1eac845"])
+        self.assertTrue(b'<dm:DifferenceModel rdf:about="#DM">' in
+                        output.getvalue())
+
+        output.seek(0)
+        cimapply(output, old)
+
+        self.assertEqual(len(old), len(new))
+        self.assertEqual(cimdiff(old, new, BytesIO()), ([], [], []))
+        self.assertTrue(old[terminal.UUID].ConnectivityNode is old["CN_NEW"])
+        self.assertEqual(old["IB"].IntervalReadings, [old["IR"]])
+        self.assertEqual(old["IR"].value, 1.5)
+
+        # The difference back to the original model restores it.
+        previous = cimread(RDFXML_FILE)
+        output = BytesIO()
+        cimdiff(new, previous, output)
+        output.seek(0)
+        cimapply(output, new)
+        self.assertEqual(cimdiff(new, previous, BytesIO()), ([], [], []))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,144 @@
+# Copyright (C) 2010-2011 Richard Lincoln
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+import gc
+import os
+import shutil
+import tempfile
+import unittest
+import warnings
+
+from os.path import dirname, join
+
+from PyCIM import cimread
+from PyCIM.LazyModel import LazyModel
+
+
+RDFXML_FILE = join(dirname(__file__), "Data", "EDF_AIGUE_v9_COMBINED.xml")
+
+# An object defined and one only described.
+DESCRIBED = """<?xml version='1.0'?>
+<rdf:RDF xmlns:cim="http://iec.ch/TC57/2010/CIM-schema-cim15#"
+    xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#">
+  <cim:ConnectivityNode rdf:ID="CN">
+    <cim:IdentifiedObject.name>node</cim:IdentifiedObject.name>
+  </cim:ConnectivityNode>
+  <cim:Terminal rdf:about="#T">
+    <cim:Terminal.ConnectivityNode rdf:resource="#CN"/>
+  </cim:Terminal>
+</rdf:RDF>
+"""
+
+
+class LazyModelTestCase(unittest.TestCase):
+    """Test lazily loaded models.
+    """
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.source = join(self.tmpdir, "model.xml")
+        shutil.copy(RDFXML_FILE, self.source)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def testIndex(self):
+        with LazyModel(self.source) as m:
+            self.assertEqual(len(m), 5894)
+            self.assertEqual(len(m.uuids("Terminal")), 975)
+            self.assertEqual(m.materialized(), 0)
+        index = self.source + ".index"
+        self.assertTrue(os.path.exists(index))
+        mtime = os.path.getmtime(index)
+
+        # The index is reused.
+        with LazyModel(self.source) as m:
+            self.assertEqual(len(m), 5894)
+        self.assertEqual(os.path.getmtime(index), mtime)
+
+    def testMaterialize(self):
+        d = cimread(RDFXML_FILE)
+
+        with LazyModel(self.source, index=False) as m:
+            uuid = m.uuids("ACLineSegment")[0]
+            line = m[uuid]
+            expected = d[uuid]
+
+            self.assertTrue(type(line) is type(expected))
+            self.assertEqual(line.name, expected.name)
+            self.assertEqual(line.length, expected.length)
+            # Outgoing references are bound.
+            self.assertEqual(line.EquipmentContainer.UUID,
+                             expected.EquipmentContainer.UUID)
+            self.assertTrue(m[line.EquipmentContainer.UUID] is
+                            line.EquipmentContainer)
+            self.assertTrue(m[uuid] is line)
+            # Inverse roles are complete.
+            self.assertEqual(sorted([t.UUID for t in line.Terminals]),
+                             sorted([t.UUID for t in expected.Terminals]))
+            self.assertEqual(sorted(m.referrers(uuid)),
+                             sorted([t.UUID for t in expected.Terminals]))
+            terminal = m[expected.Terminals[0].UUID]
+            self.assertTrue(terminal in line.Terminals)
+
+            # Looking up an object materialized as a reference completes
+            # its inverse roles.
+            container = m[line.EquipmentContainer.UUID]
+            self.assertEqual(len(container.Equipments),
+                             len(expected.EquipmentContainer.Equipments))
+
+            self.assertRaises(KeyError, m.__getitem__, "missing")
+
+    def testDescriptions(self):
+        with open(self.source, "w") as fd:
+            fd.write(DESCRIBED)
+        with LazyModel(self.source, index=False) as m:
+            self.assertEqual(list(m), ["CN"])
+            self.assertEqual(len(m), 1)
+            self.assertFalse("T" in m)
+            self.assertRaises(KeyError, m.__getitem__, "T")
+            self.assertEqual(m["CN"].name, "node")
+
+    def testInvalid(self):
+        with open(self.source, "w") as fd:
+            fd.write("<?xml version='1.0'?><cim/>")
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            self.assertRaises(ValueError, LazyModel, self.source)
+            gc.collect()
+        self.assertEqual([w for w in caught
+                          if issubclass(w.category, ResourceWarning)], [])
+
+    def testEviction(self):
+        with LazyModel(self.source, index=False, cache_size=0) as m:
+            uuids = m.uuids("Terminal")
+            self.assertEqual(len(list(m.objects("Terminal"))), 975)
+            gc.collect()
+            self.assertEqual(m.materialized(), 0)
+
+            terminal = m[uuids[0]]
+            gc.collect()
+            self.assertTrue(m[uuids[0]] is terminal)
+
+
+if __name__ == "__main__":
+    import logging
+    logging.basicConfig(level=logging.INFO)
+    unittest.main()
@@ -0,0 +1,109 @@
+# Copyright (C) 2010-2011 Richard Lincoln
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+import unittest
+
+from io import BytesIO, StringIO
+from os.path import dirname, join
+
+from PyCIM import cimread, cimwrite
+from PyCIM.PrettyPrintXML import xmlpp
+
+
+RDFXML_FILE = join(dirname(__file__), "Data", "EDF_AIGUE_v9_COMBINED.xml")
+
+
+class PrettyPrintXMLTestCase(unittest.TestCase):
+    """Test XML indentation.
+    """
+
+    def testIndent(self):
+        source = b"""<?xml version="1.0" encoding="iso-8859-1"?><!-- c -->
+<a x="1&amp;"><b>t &lt;\xe9</b><c/><d><e>  </e></d></a>"""
+
+        self.assertEqual(xmlpp(BytesIO(source)).decode("utf-8"),
+                         "<?xml version='1.0'?>\n"
+                         "<!-- c -->\n"
+                         "<a x=\"1&amp;\">\n"
+                         "  <b>t &lt;\xe9</b>\n"
+                         "  <c />\n"
+                         "  <d>\n"
+                         "    <e>  </e>\n"
+                         "  </d>\n"
+                         "</a>")
+
+        output = StringIO()
+        xmlpp(BytesIO(source), output, indent="\t", encoding="us-ascii")
+        self.assertTrue("\n\t<b>t &lt;&#233;</b>" in output.getvalue())
+
+    def testWriter(self):
+        d = cimread(RDFXML_FILE)
+
+        output = BytesIO()
+        cimwrite(d, output)
+        output.seek(0)
+
+        indented = BytesIO()
+        cimwrite(d, indented, indent="  ")
+
+        self.assertEqual(xmlpp(output), indented.getvalue())
+
+        indented.seek(0)
+        self.assertEqual(len(cimread(indented)), len(d))
+
+    def testStream(self):
+        import tracemalloc
+
+        class Source(object):
+            """Document of many elements, read in blocks."""
+
+            def __init__(self, n):
+                self.n = n
+                self.i = -1
+
+            def read(self, size):
+                self.i += 1
+                if self.i == 0:
+                    return b"<a>"
+                elif self.i <= self.n:
+                    return b"<b><c>%d</c></b>" % self.i
+                elif self.i == self.n + 1:
+                    return b"</a>"
+                return b""
+
+        class Sink(object):
+            size = 0
+
+            def write(self, data):
+                self.size += len(data)
+
+        sink = Sink()
+        tracemalloc.start()
+        try:
+            xmlpp(Source(50000), sink)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        self.assertTrue(sink.size > 1000000)
+        self.assertTrue(peak < 1000000, peak)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -19,12 +19,22 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
+import bz2
+import gzip
 import io
+import lzma
+import os
+import shutil
+import tempfile
 import unittest
+import zipfile
 
+from collections.abc import MutableSequence
 from os.path import dirname, join
 
-from PyCIM import cimread, RDFXMLReader
+from PyCIM import cimread, cimapply, RDFXMLReader
+from PyCIM.RDFXMLReader import cimread_many, cimiter, ParseStats, \
+    ParseCancelled
 
 from CIM15 import nsURI as nsURICIM15, packageMap as packageMapCIM15
 from CIM15.CDPSM.Asset import packageMap as assetMap
@@ -44,6 +54,101 @@ EMPTY_CIM = '''<?xml version=\'1.0\'?>
 <rdf:RDF xmlns:cim="http://iec.ch/TC57/2010/CIM-schema-cim15#"
 xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#" />'''
 
+FORWARD_CIM = b'''<?xml version='1.0'?>
+<rdf:RDF xmlns:cim="http://iec.ch/TC57/2010/CIM-schema-cim15#"
+xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#">
+<cim:Terminal rdf:ID="T1">
+  <cim:Terminal.connected>true</cim:Terminal.connected>
+  <cim:Terminal.ConnectivityNode rdf:resource="#CN1"/>
+</cim:Terminal>
+<cim:ConnectivityNode rdf:about="#CN1">
+  <cim:IdentifiedObject.name>Node 1</cim:IdentifiedObject.name>
+</cim:ConnectivityNode>
+<cim:ConnectivityNode rdf:ID="CN1"/>
+</rdf:RDF>'''
+
+TYPED_CIM = '''<?xml version='1.0'?>
+<rdf:RDF xmlns:cim="http://iec.ch/TC57/2010/CIM-schema-cim15#"
+xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#">
+<cim:Terminal rdf:about="#T1">
+  <cim:Terminal.connected>false</cim:Terminal.connected>
+  <cim:Terminal.sequenceNumber>2</cim:Terminal.sequenceNumber>
+  <cim:Terminal.phases rdf:resource="http://iec.ch/TC57/2010/CIM-schema-cim15#PhaseCode.ABC"/>
+</cim:Terminal>
+<cim:ACLineSegment rdf:ID="L1">
+  <cim:ACLineSegment.r>0.5</cim:ACLineSegment.r>
+  <cim:Conductor.length>10</cim:Conductor.length>
+</cim:ACLineSegment>
+</rdf:RDF>'''
+
+NESTED_NS_CIM = '''<?xml version='1.0'?>
+<rdf:RDF xmlns:cim="http://iec.ch/TC57/2010/CIM-schema-cim15#"
+xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#">
+<cim:Terminal rdf:ID="T1" xmlns:ext="http://example.com/ext#">
+  <cim:Terminal.connected>true</cim:Terminal.connected>
+  <ext:Terminal.note>Extension</ext:Terminal.note>
+</cim:Terminal>
+<cim:ConnectivityNode rdf:ID="CN1">
+  <cim:IdentifiedObject.name xmlns:x="http://example.com/x#">Node 1</cim:IdentifiedObject.name>
+</cim:ConnectivityNode>
+</rdf:RDF>'''
+
+DIFF_CIM = '''<?xml version='1.0'?>
+<rdf:RDF xmlns:cim="http://iec.ch/TC57/2010/CIM-schema-cim15#"
+xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+xmlns:dm="http://iec.ch/TC57/61970-552/DifferenceModel/1#">
+<dm:DifferenceModel rdf:about="#DM1">
+ <dm:forwardDifferences rdf:parseType="Statements">
+  <rdf:Description rdf:about="#_6f94a32bd824316b7bdcdec1eac845">
+   <cim:Switch.normalOpen>true</cim:Switch.normalOpen>
+  </rdf:Description>
+  <cim:ConnectivityNode rdf:about="#CN_NEW">
+   <cim:IdentifiedObject.name>New</cim:IdentifiedObject.name>
+  </cim:ConnectivityNode>
+  <rdf:Description rdf:about="#_231f6ae8cc734032ba442db6ee09333">
+   <cim:Terminal.ConnectivityNode rdf:resource="#CN_NEW"/>
+  </rdf:Description>
+ </dm:forwardDifferences>
+ <dm:reverseDifferences rdf:parseType="Statements">
+  <rdf:Description rdf:about="#_6f94a32bd824316b7bdcdec1eac845">
+   <cim:Switch.normalOpen>false</cim:Switch.normalOpen>
+  </rdf:Description>
+  <rdf:Description rdf:about="#_231f6ae8cc734032ba442db6ee09333">
+   <cim:Terminal.ConnectivityNode rdf:resource="#_9367b437717d4b37aed0c39744b7e02c"/>
+  </rdf:Description>
+  <cim:Terminal rdf:about="#_b3c32d09e5ed43d88697187ba8e13983">
+   <cim:Terminal.ConductingEquipment rdf:resource="#_6f94a32bd824316b7bdcdec1eac845"/>
+   <cim:Terminal.ConnectivityNode rdf:resource="#_1e9b414354d74ae28b825943727bac20"/>
+  </cim:Terminal>
+ </dm:reverseDifferences>
+</dm:DifferenceModel>
+</rdf:RDF>'''
+
+
+class Pipe(object):
+    """Read-only stream that does not support seek().
+    """
+
+    def __init__(self, data):
+        self._stream = io.BytesIO(data)
+
+    def read(self, size=-1):
+        return self._stream.read(size)
+
+
+def references(obj):
+    """Returns the UUIDs referenced by each role of the given object.
+    """
+    refs = {}
+    for klass in obj.__class__.__mro__:
+        for ref in klass.__dict__.get("_refs", ()):
+            val = getattr(obj, ref)
+            if isinstance(val, MutableSequence):
+                refs[ref] = [o.UUID for o in val]
+            else:
+                refs[ref] = val.UUID if val is not None else None
+    return refs
+
 
 class RDFXMLReaderTestCase(unittest.TestCase):
     """Test CIM RDF/XML parsing.
@@ -62,6 +167,196 @@ class RDFXMLReaderTestCase(unittest.TestCase):
         empty_cim_dict = cimread(sio)
         self.assertEqual(empty_cim_dict, {})
 
+    def testForwardReferences(self):
+        d = cimread(Pipe(FORWARD_CIM))
+
+        self.assertEqual(len(d), 2)
+        self.assertTrue(d["T1"].connected)
+        self.assertEqual(d["CN1"].name, "Node 1")
+        self.assertEqual(d["T1"].ConnectivityNode, d["CN1"])
+        self.assertEqual(d["CN1"].Terminals, [d["T1"]])
+
+    def testNestedNamespaces(self):
+        d = cimread(io.StringIO(NESTED_NS_CIM))
+
+        self.assertEqual(len(d), 2)
+        self.assertTrue(d["T1"].connected)
+        self.assertEqual(d["CN1"].name, "Node 1")
+
+    def testAttributeTypes(self):
+        from CIM15.IEC61970.Core import Terminal
+
+        t = Terminal(UUID="T1", connected=None, sequenceNumber=None)
+        d = cimread(io.StringIO(TYPED_CIM), start_dict={"T1": t})
+
+        self.assertTrue(d["T1"] is t)
+        self.assertTrue(t.connected is False)
+        self.assertEqual(t.sequenceNumber, 2)
+        self.assertTrue(isinstance(t.sequenceNumber, int))
+        self.assertEqual(t.phases, "ABC")
+        self.assertEqual(d["L1"].r, 0.5)
+        self.assertTrue(isinstance(d["L1"].length, float))
+
+        # Empty boolean elements are false.
+        t.connected = True
+        cimread(io.StringIO(TYPED_CIM.replace(
+                "<cim:Terminal.connected>false</cim:Terminal.connected>",
+                "<cim:Terminal.connected/>")), start_dict={"T1": t})
+        self.assertTrue(t.connected is False)
+
+    def testBulk(self):
+        d = cimread(RDFXML_FILE)
+        dd = cimread(RDFXML_FILE, bulk=True)
+
+        self.assertEqual(len(dd), 5894)
+        for uuid, obj in d.items():
+            self.assertEqual(references(obj), references(dd[uuid]))
+
+        d = cimread(Pipe(FORWARD_CIM), bulk=True)
+        self.assertEqual(d["T1"].ConnectivityNode, d["CN1"])
+        self.assertEqual(d["CN1"].Terminals, [d["T1"]])
+
+    def testChunks(self):
+        header, footer, chunks = RDFXMLReader.split_rdfxml(RDFXML_FILE, 8)
+        self.assertEqual(len(chunks), 8)
+        self.assertTrue(header.endswith(b'CIM-schema-cim15#">'))
+        self.assertEqual(footer, b"</rdf:RDF>")
+
+        d = cimread(RDFXML_FILE)
+        dd = cimread(RDFXML_FILE, processes=2)
+
+        self.assertEqual(len(dd), 5894)
+        for uuid, obj in d.items():
+            self.assertEqual(references(obj), references(dd[uuid]))
+
+    def testFilter(self):
+        d = cimread(RDFXML_FILE, include=["CIM15.IEC61970.Wires"])
+        self.assertEqual(len(d), 812)
+        self.assertTrue(all(type(o).__module__.startswith(
+                "CIM15.IEC61970.Wires.") for o in d.values()))
+        # References to excluded objects are dropped.
+        line = [o for o in d.values() if type(o).__name__ == "Line"][0]
+        self.assertEqual(line.Region, None)
+
+        d = cimread(RDFXML_FILE, exclude=["CIM15.IEC61968", "Terminal"])
+        self.assertEqual(len(d), 2013)
+        self.assertFalse(any(type(o).__name__ == "Terminal"
+                             for o in d.values()))
+
+        d = cimread(RDFXML_FILE, include=["ACLineSegment"], closure=True)
+        self.assertEqual(len(d), 1011)
+        for obj in d.values():
+            if type(obj).__name__ == "ACLineSegment":
+                self.assertTrue(obj.ConductorInfo is not None)
+                self.assertTrue(obj.EquipmentContainer is not None)
+
+    def testIter(self):
+        from CIM15.IEC61970.Core import Terminal
+
+        records = list(cimiter(RDFXML_FILE))
+        self.assertEqual(len(records), 5894)
+
+        records = list(cimiter(Pipe(FORWARD_CIM)))
+        self.assertEqual([(r.cls.__name__, r.uuid, r.defined)
+                          for r in records],
+                         [("Terminal", "T1", True),
+                          ("ConnectivityNode", "CN1", False),
+                          ("ConnectivityNode", "CN1", True)])
+        self.assertEqual(records[0].attributes, {"connected": True})
+        self.assertEqual(records[0].references, {"ConnectivityNode": "CN1"})
+        self.assertEqual(records[1].attributes, {"name": "Node 1"})
+
+        terminal = next(cimiter(io.StringIO(TYPED_CIM), instances=True))
+        self.assertTrue(isinstance(terminal, Terminal))
+        self.assertTrue(terminal.connected is False)
+        self.assertEqual(terminal.phases, "ABC")
+        self.assertEqual(terminal.ConnectivityNode, None)
+
+    def testCompressed(self):
+        tmpdir = tempfile.mkdtemp()
+        try:
+            for ext, opener in ((".gz", gzip.open), (".bz2", bz2.open),
+                                (".xz", lzma.open)):
+                path = join(tmpdir, "model.xml" + ext)
+                with open(RDFXML_FILE, "rb") as src:
+                    with opener(path, "wb") as dst:
+                        shutil.copyfileobj(src, dst)
+                self.assertEqual(len(cimread(path)), 5894)
+
+            # Every member of an archive is read into one model.
+            path = join(tmpdir, "model.zip")
+            with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+                for member in (ASSET_FILE, CONN_FILE, EQUIP_FILE, GEO_FILE):
+                    archive.write(member, os.path.basename(member))
+            d = cimread(path)
+            self.assertEqual(len(d), 5893)
+            self.assertTrue(d["_c3588d10-236e-11e0-8cca-005056c00008"].NameType
+                            is d["_c35558c0-236e-11e0-8cca-005056c00008"])
+            self.assertEqual(sum(r.defined for r in cimiter(path)), 5893)
+        finally:
+            shutil.rmtree(tmpdir)
+
+    def testStats(self):
+        stats = ParseStats()
+        cimread(RDFXML_FILE, stats=stats)
+
+        self.assertEqual(stats.records, 5894)
+        self.assertEqual(sum(stats.objects.values()), 5894)
+        self.assertEqual(stats.objects["Terminal"], 975)
+        self.assertEqual(stats.bytes, os.path.getsize(RDFXML_FILE))
+        self.assertTrue(stats.bytes_per_second > 0)
+        self.assertEqual(set(stats.times), set(["sniff", "instantiate",
+                                                "bind"]))
+        self.assertEqual(stats.unresolved, 0)
+
+        stats = ParseStats()
+        cimread(io.StringIO(TYPED_CIM.replace("r>0.5", "r>x")), stats=stats)
+        self.assertEqual(stats.errors,
+                         {"'ACLineSegment' has invalid value for 'r'": 1})
+
+        calls = []
+        def progress(stats):
+            calls.append(stats.records)
+            return False
+        cimread(RDFXML_FILE, progress=progress)
+        self.assertEqual(calls, [])
+
+        RDFXMLReader.PROGRESS_INTERVAL = 1000
+        try:
+            self.assertRaises(ParseCancelled, cimread, RDFXML_FILE,
+                              progress=progress)
+        finally:
+            RDFXMLReader.PROGRESS_INTERVAL = 10000
+        self.assertEqual(calls, [1000])
+
+    def testApply(self):
+        d = cimread(RDFXML_FILE)
+        switch = d["_6f94a32bd824316b7bdcdec1eac845"]
+        terminal = d["_231f6ae8cc734032ba442db6ee09333"]
+        deleted = d["_b3c32d09e5ed43d88697187ba8e13983"]
+        old_node = d["_9367b437717d4b37aed0c39744b7e02c"]
+
+        # Namespaces may be declared on the elements of the differences.
+        diff = DIFF_CIM.replace('<rdf:Description rdf:about="#_6f94a32bd824316b7bdcdec1eac845">',
+                '<rdf:Description rdf:about="#_6f94a32bd824316b7bdcdec1eac845" '
+                'xmlns:ext="http://example.com/ext#">', 1)
+        self.assertTrue(cimapply(io.StringIO(diff), d) is d)
+
+        self.assertEqual(len(d), 5894)
+        self.assertTrue(switch.normalOpen)
+        # Deleted objects are unlinked.
+        self.assertFalse("_b3c32d09e5ed43d88697187ba8e13983" in d)
+        self.assertEqual(switch.Terminals, [terminal])
+        self.assertEqual(deleted.ConnectivityNode, None)
+        self.assertEqual(
+                d["_1e9b414354d74ae28b825943727bac20"].Terminals.count(deleted),
+                0)
+        # Added objects are bound.
+        self.assertEqual(d["CN_NEW"].name, "New")
+        self.assertTrue(terminal.ConnectivityNode is d["CN_NEW"])
+        self.assertEqual(d["CN_NEW"].Terminals, [terminal])
+        self.assertFalse(terminal in old_node.Terminals)
+
     def testProfile(self):
         d = {}
 
@@ -72,6 +367,16 @@ class RDFXMLReaderTestCase(unittest.TestCase):
 
         self.assertEqual(len(d), 5893)
 
+    def testProfileMany(self):
+        d = cimread_many([ASSET_FILE, CONN_FILE, EQUIP_FILE, GEO_FILE],
+                         [assetMap, connMap, equipMap, geoMap], nsURICIM15,
+                         processes=2)
+
+        self.assertEqual(len(d), 5893)
+        # Name (GEO) to NameType (CONN) reference between files.
+        self.assertTrue(d["_c3588d10-236e-11e0-8cca-005056c00008"].NameType
+                        is d["_c35558c0-236e-11e0-8cca-005056c00008"])
+
     def testGetNamespaces(self):
         ns = RDFXMLReader.xmlns(RDFXML_FILE)
         self.assertEqual(ns, {
@@ -85,6 +390,15 @@ class RDFXMLReaderTestCase(unittest.TestCase):
         self.assertEqual(RDFXMLReader.get_cim_ns(ns),
                 (nsURICIM15, packageMapCIM15))
 
+    def testClassTable(self):
+        from CIM15.IEC61970.Core import Terminal
+
+        classes = RDFXMLReader.get_class_table(packageMapCIM15, nsURICIM15)
+        self.assertTrue(classes is
+                RDFXMLReader.get_class_table(packageMapCIM15, nsURICIM15))
+        self.assertTrue(classes["{%s#}Terminal" % nsURICIM15] is Terminal)
+        self.assertEqual(classes["{%s#}Unknown" % nsURICIM15], None)
+
 
 if __name__ == "__main__":
     import logging
@@ -18,19 +18,26 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
+import codecs
+import os
+import tempfile
 import unittest
 try:
     from io import StringIO
 except ImportError:
     from io import StringIO
+from io import BytesIO
 
-from PyCIM import cimread, cimwrite
+from PyCIM import cimread, cimread_many, cimwrite, cimwrite_profiles, \
+    CIMWriter
 
 from os.path import dirname, join
 
 
 RDFXML_FILE = join(dirname(__file__), "Data", "EDF_AIGUE_v9_COMBINED.xml")
 
+CIM14_FILE = join(dirname(__file__), "Data", "EDF_AIGUE_v9.xml")
+
 
 class RDFXMLWriterTestCase(unittest.TestCase):
     """Test CIM RDF/XML serialisation.
@@ -51,6 +58,243 @@ class RDFXMLWriterTestCase(unittest.TestCase):
 
         self.assertEqual(len(dd), 5894)
 
+    def testCompressed(self):
+        d = cimread(RDFXML_FILE)
+
+        fd, path = tempfile.mkstemp(suffix=".xml.gz")
+        os.close(fd)
+        try:
+            cimwrite(d, path)
+            with open(path, "rb") as f:
+                self.assertEqual(f.read(2), b"\x1f\x8b")
+            self.assertEqual(len(cimread(path)), 5894)
+        finally:
+            os.remove(path)
+
+    def testEncoding(self):
+        from CIM15.IEC61970.Core import Terminal
+
+        t = Terminal(name="T\u00e9 <1> & \u4e2d")
+        t.UUID = "_1"
+        d = {t.UUID: t}
+
+        for encoding in ("utf-8", "iso-8859-1", "us-ascii"):
+            output = BytesIO()
+            cimwrite(d, output, encoding)
+            data = output.getvalue()
+            data.decode(encoding)
+            self.assertTrue(b"&lt;1&gt; &amp;" in data)
+
+            output.seek(0)
+            dd = cimread(output)
+            self.assertEqual(dd["_1"].name, t.name)
+
+        output = StringIO()
+        cimwrite(d, output, "us-ascii")
+        self.assertTrue("T&#233; " in output.getvalue())
+
+        # Documents written in several chunks have a single byte order mark.
+        d = cimread(RDFXML_FILE)
+        for encoding, bom in (("utf-16", codecs.BOM_UTF16),
+                              ("utf-8-sig", codecs.BOM_UTF8)):
+            output = BytesIO()
+            cimwrite(d, output, encoding)
+            data = output.getvalue()
+            self.assertTrue(data.startswith(bom))
+            self.assertEqual(data.count(bom), 1)
+            output.seek(0)
+            self.assertEqual(len(cimread(output)), len(d))
+
+    def testNamespace(self):
+        import CIM14
+        from CIM15.CDPSM.Connectivity import packageMap
+
+        d = cimread(CIM14_FILE)
+        output = StringIO()
+        cimwrite(d, output)
+        self.assertTrue('xmlns:cim="%s#"' % CIM14.nsURI in output.getvalue())
+        output.seek(0)
+        dd = cimread(output)
+        self.assertEqual(len(dd), len(d))
+        self.assertEqual(type(list(dd.values())[0]).__module__[:5], "CIM14")
+
+        from CIM15.IEC61970.Core import Terminal
+        d["_cim15"] = Terminal()
+        self.assertRaises(ValueError, cimwrite, d, StringIO())
+
+        d = cimread(RDFXML_FILE)
+        output = StringIO()
+        cimwrite(d, output, packageMap=packageMap)
+        output.seek(0)
+        dd = cimread(output)
+        self.assertTrue(0 < len(dd) < len(d))
+        for obj in dd.values():
+            self.assertTrue(obj.__class__.__name__ in packageMap)
+
+    def testProfiles(self):
+        import CIM15
+        from CIM15.CDPSM.Asset import packageMap as assetMap
+        from CIM15.CDPSM.Connectivity import packageMap as connMap
+        from CIM15.CDPSM.Balanced import packageMap as equipMap
+        from CIM15.CDPSM.Geographical import packageMap as geoMap
+
+        d = cimread(RDFXML_FILE)
+        outputs = [BytesIO() for _ in range(4)]
+        cimwrite_profiles(d, outputs, [connMap, equipMap, assetMap, geoMap])
+
+        conn, equip = outputs[0].getvalue(), outputs[1].getvalue()
+        self.assertEqual(conn.count(b"<cim:Terminal rdf:ID="), 975)
+        self.assertEqual(equip.count(b"<cim:ACLineSegment rdf:about="), 280)
+        self.assertFalse(b"<cim:ACLineSegment.r>" in conn)
+        self.assertFalse(b"<cim:Terminal " in equip)
+
+        for output in outputs:
+            output.seek(0)
+        dd = cimread_many(outputs)
+        self.assertEqual(len(dd), 5893)
+        for uuid, obj in dd.items():
+            if obj.__class__.__name__ == "ACLineSegment":
+                self.assertEqual(obj.r, d[uuid].r)
+                self.assertEqual(obj.ConductorInfo.UUID,
+                                 d[uuid].ConductorInfo.UUID)
+            elif obj.__class__.__name__ == "PositionPoint":
+                self.assertEqual(obj.xPosition, d[uuid].xPosition)
+                self.assertEqual(obj.Location.UUID, d[uuid].Location.UUID)
+
+        # Read into the classes of each profile.  ACLineSegments are then
+        # defined by the Asset profile, whose class has no Terminals.
+        maps = [assetMap, connMap, equipMap, geoMap]
+        outputs = [BytesIO() for _ in range(4)]
+        cimwrite_profiles(d, outputs, maps)
+        for bulk in (False, True):
+            for output in outputs:
+                output.seek(0)
+            dd = cimread_many(outputs, maps, CIM15.nsURI, bulk=bulk)
+            self.assertEqual(len(dd), 5893)
+            for uuid, obj in dd.items():
+                if obj.__class__.__name__ == "Terminal":
+                    self.assertEqual(obj.ConductingEquipment.UUID,
+                                     d[uuid].ConductingEquipment.UUID)
+                elif obj.__class__.__name__ == "ConnectivityNode":
+                    self.assertEqual(len(obj.Terminals),
+                                     len(d[uuid].Terminals))
+
+    def testStream(self):
+        import tracemalloc
+        from CIM15.IEC61970.Core import ConnectivityNode, Terminal
+
+        class Sink(object):
+            size = 0
+
+            def write(self, data):
+                self.size += len(data)
+
+        node = ConnectivityNode(UUID="CN")
+
+        def terminals(n):
+            for i in range(n):
+                t = Terminal(UUID="T%d" % i, name="Terminal %d" % i)
+                t._ConnectivityNode = node
+                yield t
+
+        sink = Sink()
+        tracemalloc.start()
+        try:
+            with CIMWriter(sink) as w:
+                w.write(node)
+                w.write_all(terminals(20000))
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        self.assertEqual(w.count, 20001)
+        self.assertTrue(sink.size > 2000000)
+        self.assertTrue(peak < 1000000, peak)
+
+        output = BytesIO()
+        cimwrite(terminals(10), output)
+        output.seek(0)
+        d = cimread(output)
+        self.assertEqual(len(d), 10)
+        self.assertEqual(d["T3"].name, "Terminal 3")
+
+    def testParallel(self):
+        from CIM15.CDPSM.Connectivity import packageMap
+
+        d = cimread(RDFXML_FILE)
+        for kw_args in ({}, {"packageMap": packageMap}):
+            serial = BytesIO()
+            cimwrite(d, serial, **kw_args)
+            parallel = BytesIO()
+            cimwrite(d, parallel, processes=3, **kw_args)
+            self.assertEqual(parallel.getvalue(), serial.getvalue())
+
+            with CIMWriter(StringIO(), **kw_args) as w:
+                w.write_all(d.values(), processes=2)
+            self.assertEqual(w.count, serial.getvalue().count(b' rdf:ID="'))
+            self.assertEqual(w.count + w.skipped, len(d))
+
+    def testParallelError(self):
+        import multiprocessing
+
+        def markup(data):
+            raise IOError("disk full")
+
+        d = cimread(RDFXML_FILE)
+        w = CIMWriter(BytesIO())
+        w._emitter.markup = markup
+        self.assertRaises(IOError, w.write_all, list(d.values()), processes=2)
+        # The pool is torn down rather than left writing the other shards.
+        self.assertEqual(multiprocessing.active_children(), [])
+        self.assertEqual(w.count, 0)
+
+    def testManyToMany(self):
+        from CIM15.IEC61968.Metering import IntervalBlock, IntervalReading
+
+        blocks = [IntervalBlock(UUID="B%d" % i) for i in range(2)]
+        readings = [IntervalReading(UUID="R%d" % i, value=float(i))
+                    for i in range(3)]
+        blocks[0].addIntervalReadings(readings[0], readings[1])
+        blocks[1].addIntervalReadings(readings[1], readings[2])
+        d = dict([(obj.UUID, obj) for obj in blocks + readings])
+
+        output = BytesIO()
+        cimwrite(d, output)
+        data = output.getvalue()
+        self.assertEqual(data.count(b"IntervalBlock.IntervalReadings"), 4)
+        self.assertFalse(b"IntervalReading.IntervalBlocks" in data)
+
+        for bulk in (False, True):
+            output.seek(0)
+            dd = cimread(output, bulk=bulk)
+            for uuid, obj in d.items():
+                if uuid.startswith("B"):
+                    roles = dd[uuid].IntervalReadings, obj.IntervalReadings
+                else:
+                    roles = dd[uuid].IntervalBlocks, obj.IntervalBlocks
+                self.assertEqual(sorted([x.UUID for x in roles[0]]),
+                                 sorted([x.UUID for x in roles[1]]))
+
+    def testUnidirectional(self):
+        import CIM14
+        from CIM14.IEC61970.Protection import ProtectionEquipment
+        from CIM14.IEC61970.Wires import Breaker
+
+        breakers = [Breaker(UUID="B%d" % i) for i in range(2)]
+        pe = ProtectionEquipment(UUID="P", ProtectedSwitches=breakers)
+        d = dict([(obj.UUID, obj) for obj in breakers + [pe]])
+
+        output = BytesIO()
+        cimwrite(d, output, nsURI=CIM14.nsURI, packageMap=CIM14.packageMap)
+        data = output.getvalue()
+        self.assertEqual(data.count(b"ProtectionEquipment.ProtectedSwitches"),
+                         2)
+
+        for bulk in (False, True):
+            output.seek(0)
+            dd = cimread(output, CIM14.packageMap, CIM14.nsURI, bulk=bulk)
+            self.assertEqual([x.UUID for x in dd["P"].ProtectedSwitches],
+                             ["B0", "B1"])
+
 
 if __name__ == "__main__":
     import logging
@@ -0,0 +1,135 @@
+# Copyright (C) 2010-2011 Richard Lincoln
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+import io
+import os
+import pickle
+import shutil
+import tempfile
+import unittest
+
+from os.path import dirname, join
+
+from PyCIM import cimread, cimsave, cimload
+from PyCIM.RDFXMLReader import ParseStats, ParseCancelled
+from PyCIM.Snapshot import cache_path
+
+from PyCIM.Test.RDFXMLReaderTest import references
+
+
+RDFXML_FILE = join(dirname(__file__), "Data", "EDF_AIGUE_v9_COMBINED.xml")
+
+
+class SnapshotTestCase(unittest.TestCase):
+    """Test CIM model snapshots.
+    """
+
+    def testRoundTrip(self):
+        d = cimread(RDFXML_FILE)
+
+        output = io.BytesIO()
+        cimsave(d, output)
+        output.seek(0)
+        dd = cimload(output)
+
+        self.assertEqual(list(dd), list(d))
+        for uuid, obj in d.items():
+            other = dd[uuid]
+            self.assertTrue(type(other) is type(obj))
+            self.assertEqual(references(other), references(obj))
+            self.assertEqual(sorted(other.__dict__), sorted(obj.__dict__))
+            for klass in type(obj).__mro__:
+                for attr in klass.__dict__.get("_attrs", ()):
+                    self.assertEqual(getattr(other, attr),
+                                     getattr(obj, attr))
+
+    def testDeepModel(self):
+        from CIM15.IEC61970.Core import ConnectivityNode, Terminal
+        from CIM15.IEC61970.Wires import ACLineSegment
+
+        # A chain of lines too deep to be pickled as linked objects.
+        d = {}
+        node = ConnectivityNode(UUID="CN0")
+        d[node.UUID] = node
+        for i in range(5000):
+            line = ACLineSegment(UUID="L%d" % i)
+            Terminal(UUID="T%da" % i, ConductingEquipment=line,
+                     ConnectivityNode=node)
+            node = ConnectivityNode(UUID="CN%d" % (i + 1))
+            Terminal(UUID="T%db" % i, ConductingEquipment=line,
+                     ConnectivityNode=node)
+            d[line.UUID] = line
+            d[node.UUID] = node
+            for t in line.Terminals:
+                d[t.UUID] = t
+        self.assertRaises(RecursionError, pickle.dumps, d)
+
+        output = io.BytesIO()
+        cimsave(d, output)
+        output.seek(0)
+        dd = cimload(output)
+
+        self.assertEqual(len(dd), len(d))
+        self.assertTrue(dd["L4999"].Terminals[1].ConnectivityNode
+                        is dd["CN5000"])
+        self.assertEqual(dd["CN2500"].Terminals,
+                         [dd["T2499b"], dd["T2500a"]])
+
+    def testCache(self):
+        cache = tempfile.mkdtemp()
+        try:
+            d = cimread(RDFXML_FILE, cache=cache)
+            path = cache_path(cache, RDFXML_FILE)
+            self.assertEqual(os.listdir(cache), [os.path.basename(path)])
+
+            dd = cimread(RDFXML_FILE, cache=cache)
+            self.assertEqual(list(dd), list(d))
+            for uuid, obj in d.items():
+                self.assertEqual(references(dd[uuid]), references(obj))
+        finally:
+            shutil.rmtree(cache)
+
+    def testCacheStats(self):
+        cache = tempfile.mkdtemp()
+        try:
+            parsed = ParseStats()
+            cimread(RDFXML_FILE, cache=cache, stats=parsed)
+
+            # Statistics and progress are reported for a snapshot too.
+            reports = []
+            d = cimread(RDFXML_FILE, cache=cache, progress=reports.append)
+            self.assertEqual(len(reports), 1)
+            loaded = reports[0]
+            self.assertEqual(loaded.objects, parsed.objects)
+            self.assertEqual(loaded.records, len(d))
+            self.assertEqual(loaded.bytes, os.path.getsize(
+                    cache_path(cache, RDFXML_FILE)))
+            self.assertTrue(loaded.elapsed > 0)
+
+            self.assertRaises(ParseCancelled, cimread, RDFXML_FILE,
+                              cache=cache, progress=lambda stats: False)
+        finally:
+            shutil.rmtree(cache)
+
+
+if __name__ == "__main__":
+    import logging
+    logging.basicConfig(level=logging.INFO)
+    unittest.main()
@@ -18,7 +18,9 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from PyCIM.RDFXMLReader import cimread
-from PyCIM.RDFXMLWriter import cimwrite
+from PyCIM.RDFXMLReader import cimread, cimread_many, cimiter, cimapply
+from PyCIM.RDFXMLWriter import cimwrite, cimwrite_profiles, CIMWriter
+from PyCIM.Snapshot import cimsave, cimload
+from PyCIM.Difference import cimdiff
 
 __version__ = "15.15.0"